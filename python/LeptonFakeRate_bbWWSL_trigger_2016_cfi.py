@@ -0,0 +1,2080 @@
+import FWCore.ParameterSet.Config as cms
+
+leptonFR_triggers = {
+  'mu' : cms.VPSet( ## mu VPSet BEGINS
+    ##---------HLT_IsoMu22----------##   
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu22"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(22.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_IsoMu22_v2, 50.239/pb                                                                                                                                         
+            '273302-273302', # HLT_IsoMu22_v2, 16.319/pb                                                                                                                                         
+            '273402-273406', # HLT_IsoMu22_v2, 13.589/pb                                                                                                                                         
+            '273408-273411', # HLT_IsoMu22_v2, 13.087/pb                                                                                                                                         
+            '273425-273425', # HLT_IsoMu22_v2-26.717/pb                                                                                                                                         
+            '273446-273450', # HLT_IsoMu22_v2, 94.292/pb                                                                                                                                         
+            '273492-273494', # HLT_IsoMu22_v2, 30.924/pb                                                                                                                                         
+            '273502-273503', # HLT_IsoMu22_v2, 72.147/pb                                                                                                                                         
+            '273554-273555', # HLT_IsoMu22_v2, 38.827/pb                                                                                                                                         
+            '273725-273725', # HLT_IsoMu22_v2, 154.653/pb                                                                                                                                        
+            '273728-273728', # HLT_IsoMu22_v2, 4.897/pb                                                                                                                                          
+            '273730-273730', # HLT_IsoMu22_v2, 86.49/pb                                                                                                                                          
+            '274094-274094', # HLT_IsoMu22_v2, 9.735/pb                                                                                                                                          
+            '274146-274146', # HLT_IsoMu22_v2, 5.12/pb                                                                                                                                           
+            '274157-274157', # HLT_IsoMu22_v2, 38.994/pb                                                                                                                                         
+            '274159-274161', # HLT_IsoMu22_v2, 62.883/pb                                                                                                                                         
+            '274172-274172', # HLT_IsoMu22_v2, 5.249/pb                                                                                                                                          
+            '274198-274200', # HLT_IsoMu22_v2, 135.972/pb                                                                                                                                        
+            '274240-274241', # HLT_IsoMu22_v2, 134.472/pb                                                                                                                                        
+            '274244-274244', # HLT_IsoMu22_v2, 56.348/pb                                                                                                                                         
+            '274250-274251', # HLT_IsoMu22_v2, 159.993/pb                                                                                                                                        
+            '274283-274284', # HLT_IsoMu22_v2, 30.266/pb                                                                                                                                         
+            '274286-274286', # HLT_IsoMu22_v2-21.668/pb                                                                                                                                         
+            '274314-274317', # HLT_IsoMu22_v2-206.7/pb                                                                                                                                          
+            '274319-274319', # HLT_IsoMu22_v2-27.302/pb                                                                                                                                         
+            '274335-274339', # HLT_IsoMu22_v2-246.003/pb                                                                                                                                        
+            '274344-274345', # HLT_IsoMu22_v2, 87.68/pb                                                                                                                                          
+            '274382-274382', # HLT_IsoMu22_v2, 7.428/pb                                                                                                                                          
+            '274387-274388', # HLT_IsoMu22_v2, 312.374/pb                                                                                                                                        
+            '274420-274422', # HLT_IsoMu22_v2, 359.125/pb                                                                                                                                        
+            '274440-274442', # HLT_IsoMu22_v2-226.466/pb     
+            '274954-274955', # HLT_IsoMu22_v3, 5.735/pb                                                                                                                                          
+            '274968-274971', # HLT_IsoMu22_v3, 422.272/pb                                                                                                                                        
+            '274998-275001', # HLT_IsoMu22_v3, 489.252/pb                                                                                                                                        
+            '275059-275059', # HLT_IsoMu22_v3, 6.094/pb                                                                                                                                          
+            '275066-275068', # HLT_IsoMu22_v3-231.774/pb                                                                                                                                        
+            '275073-275074', # HLT_IsoMu22_v3, 144.124/pb                                                                                                                                        
+            '275124-275125', # HLT_IsoMu22_v3-205.394/pb                                                                                                                                        
+            '275282-275284', # HLT_IsoMu22_v3, 49.295/pb                                                                                                                                         
+            '275290-275293', # HLT_IsoMu22_v3, 94.338/pb                                                                                                                                         
+            '275309-275311', # HLT_IsoMu22_v3, 411.084/pb                                                                                                                                        
+            '275319-275319', # HLT_IsoMu22_v3-24.399/pb                                                                                                                                         
+            '275337-275338', # HLT_IsoMu22_v3, 143.358/pb                                                                                                                                        
+            '275344-275345', # HLT_IsoMu22_v3, 109.524/pb                                                                                                                                        
+            '275370-275371', # HLT_IsoMu22_v3, 145.599/pb                                                                                                                                        
+            '275375-275376', # HLT_IsoMu22_v3, 528.636/pb                                                                                                                                        
+            '275657-275659', # HLT_IsoMu22_v3, 80.874/pb                                                                                                                                         
+            '275761-275761', # HLT_IsoMu22_v3, 1.667/pb                                                                                                                                          
+            '275767-275767', # HLT_IsoMu22_v3, 0.714/pb                                                                                                                                          
+            '275772-275774', # HLT_IsoMu22_v3, 66.444/pb                                                                                                                                         
+            '275776-275778', # HLT_IsoMu22_v3, 116.898/pb                                                                                                                                        
+            '275782-275782', # HLT_IsoMu22_v3, 99.533/pb                                                                                                                                         
+            '275832-275837', # HLT_IsoMu22_v3, 441.03/pb                                                                                                                                         
+            '275847-275847', # HLT_IsoMu22_v3, 198.947/pb                                                                                                                                        
+            '275886-275886', # HLT_IsoMu22_v3, 7.581/pb                                                                                                                                          
+            '275890-275890', # HLT_IsoMu22_v3-235.22/pb    
+            '275911-275913', # HLT_IsoMu22_v3-201.741/pb                                                                                                                                        
+            '275918-275918', # HLT_IsoMu22_v3, 49.71/pb                                                                                                                                          
+            '275920-275921', # HLT_IsoMu22_v3, 62.257/pb                                                                                                                                         
+            '275923-275923', # HLT_IsoMu22_v3, 14.5/pb                                                                                                                                           
+            '275931-275931', # HLT_IsoMu22_v3, 10.418/pb                                                                                                                                         
+            '275963-275963', # HLT_IsoMu22_v3, 19.553/pb                                                                                                                                         
+            '276092-276092', # HLT_IsoMu22_v3, 14.768/pb                                                                                                                                         
+            '276097-276097', # HLT_IsoMu22_v3, 99.405/pb                                                                                                                                         
+            '276242-276244', # HLT_IsoMu22_v3, 479.052/pb                                                                                                                                        
+            '276282-276283', # HLT_IsoMu22_v3, 372.59/pb                                                                                                                                         
+            '276315-276315', # HLT_IsoMu22_v3, 34.051/pb                                                                                                                                         
+            '276317-276318', # HLT_IsoMu22_v3, 124.306/pb                                                                                                                                        
+            '276355-276355', # HLT_IsoMu22_v3, 6.205/pb                                                                                                                                          
+            '276361-276361', # HLT_IsoMu22_v3, 149.465/pb                                                                                                                                        
+            '276363-276363', # HLT_IsoMu22_v3-206.376/pb                                                                                                                                        
+            '276384-276384', # HLT_IsoMu22_v3, 121.517/pb                                                                                                                                        
+            '276437-276437', # HLT_IsoMu22_v3, 355.688/pb                                                                                                                                        
+            '276454-276454', # HLT_IsoMu22_v3, 63.924/pb                                                                                                                                         
+            '276458-276458', # HLT_IsoMu22_v3, 33.169/pb                                                                                                                                         
+            '276495-276495', # HLT_IsoMu22_v3, 38.062/pb                                                                                                                                         
+            '276501-276502', # HLT_IsoMu22_v3, 486.891/pb                                                                                                                                        
+            '276525-276525', # HLT_IsoMu22_v3, 402.663/pb                                                                                                                                        
+            '276527-276528', # HLT_IsoMu22_v3, 60.758/pb                                                                                                                                         
+            '276542-276545', # HLT_IsoMu22_v3, 345.204/pb                                                                                                                                        
+            '276581-276587', # HLT_IsoMu22_v3, 471.493/pb
+            '276653-276653', # HLT_IsoMu22_v3, 86.12/pb                                                                                                                                          
+            '276655-276655', # HLT_IsoMu22_v3, 160.843/pb                                                                                                                                        
+            '276659-276659', # HLT_IsoMu22_v3-29.939/pb                                                                                                                                         
+            '276775-276776', # HLT_IsoMu22_v3, 443.702/pb                                                                                                                                        
+            '276794-276794', # HLT_IsoMu22_v3, 87.206/pb                                                                                                                                         
+            '276807-276808', # HLT_IsoMu22_v3, 188.301/pb                                                                                                                                        
+            '276810-276811', # HLT_IsoMu22_v3, 346.409/pb                                                                                                                                        
+            '276831-276831', # HLT_IsoMu22_v3, 400.298/pb                                                                                                                                        
+            '276834-276834', # HLT_IsoMu22_v3, 72.6/pb                                                                                                                                           
+            '276870-276870', # HLT_IsoMu22_v3, 513.042/pb                                                                                                                                        
+            '276935-276935', # HLT_IsoMu22_v3, 128.487/pb                                                                                                                                        
+            '276940-276940', # HLT_IsoMu22_v3, 16.262/pb                                                                                                                                         
+            '276946-276948', # HLT_IsoMu22_v3, 113.478/pb                                                                                                                                        
+            '276950-276950', # HLT_IsoMu22_v3, 323.179/pb                                                                                                                                        
+            '277070-277073', # HLT_IsoMu22_v3, 303.149/pb                                                                                                                                        
+            '277076-277076', # HLT_IsoMu22_v3, 125.929/pb                                                                                                                                        
+            '277087-277087', # HLT_IsoMu22_v3, 86.357/pb                                                                                                                                         
+            '277094-277094', # HLT_IsoMu22_v3, 71.944/pb                                                                                                                                         
+            '277096-277096', # HLT_IsoMu22_v3, 320.668/pb                                                                                                                                        
+            '277112-277112', # HLT_IsoMu22_v3, 12.913/pb                                                                                                                                         
+            '277127-277127', # HLT_IsoMu22_v3, 181.81/pb                                                                                                                                         
+            '277148-277148', # HLT_IsoMu22_v3, 128.17/pb                                                                                                                                         
+            '277166-277166', # HLT_IsoMu22_v3, 66.646/pb                                                                                                                                         
+            '277168-277168', # HLT_IsoMu22_v3, 317.531/pb                                                                                                                                        
+            '277180-277180', # HLT_IsoMu22_v3, 18.477/pb
+            '277194-277194', # HLT_IsoMu22_v3, 314.183/pb                                                                                                                                        
+            '277305-277305', # HLT_IsoMu22_v3, 93.106/pb                                                                                                                                         
+            '277420-277420', # HLT_IsoMu22_v3-25.075/pb                                                                                                                                         
+            '277981-277981', # HLT_IsoMu22_v3, 4.601/pb                                                                                                                                          
+            '277991-277992', # HLT_IsoMu22_v3-21.386/pb                                                                                                                                         
+            '278017-278018', # HLT_IsoMu22_v3-244.899/pb                                                                                                                                        
+            '278167-278167', # HLT_IsoMu22_v3, 314.532/pb                                                                                                                                        
+            '278175-278175', # HLT_IsoMu22_v3, 8.712/pb                                                                                                                                          
+            '278193-278193', # HLT_IsoMu22_v3-25.283/pb                                                                                                                                         
+            '278239-278240', # HLT_IsoMu22_v3, 329.574/pb                                                                                                                                        
+            '278273-278274', # HLT_IsoMu22_v3-22.542/pb                                                                                                                                         
+            '278288-278290', # HLT_IsoMu22_v3, 13.31/pb                                                                                                                                          
+            '278308-278308', # HLT_IsoMu22_v3-260.311/pb                                                                                                                                        
+            '278310-278310', # HLT_IsoMu22_v3, 88.422/pb                                                                                                                                         
+            '278315-278315', # HLT_IsoMu22_v3, 104.138/pb                                                                                                                                        
+            '278345-278346', # HLT_IsoMu22_v3, 122.945/pb                                                                                                                                        
+            '278349-278349', # HLT_IsoMu22_v3, 94.737/pb                                                                                                                                         
+            '278366-278366', # HLT_IsoMu22_v3, 59.423/pb                                                                                                                                         
+            '278406-278406', # HLT_IsoMu22_v3-210.055/pb                                                                                                                                        
+            '278509-278509', # HLT_IsoMu22_v3, 180.065/pb                                                                                                                                        
+            '278770-278770', # HLT_IsoMu22_v3, 66.171/pb                                                                                                                                         
+            '278804-278805', # HLT_IsoMu22_v3, 38.466/pb                                                                                                                                         
+            '278808-278808', # HLT_IsoMu22_v3-269.634/pb                                                                                                                                        
+            '278820-278820', # HLT_IsoMu22_v3, 198.291/pb                                                                                                                                        
+            '278822-278822', # HLT_IsoMu22_v3, 191.158/pb 
+            '278873-278875', # HLT_IsoMu22_v3, 198.446/pb                                                                                                                                        
+            '278963-278963', # HLT_IsoMu22_v3, 14.235/pb                                                                                                                                         
+            '278969-278969', # HLT_IsoMu22_v3, 149.94/pb                                                                                                                                         
+            '278975-278976', # HLT_IsoMu22_v3, 122.556/pb                                                                                                                                        
+            '279024-279024', # HLT_IsoMu22_v3, 49.039/pb                                                                                                                                         
+            '279029-279029', # HLT_IsoMu22_v3, 38.088/pb                                                                                                                                         
+            '279071-279071', # HLT_IsoMu22_v3-22.581/pb                                                                                                                                         
+            '279080-279080', # HLT_IsoMu22_v3, 11.815/pb                                                                                                                                         
+            '279115-279116', # HLT_IsoMu22_v3, 94.0/pb                                                                                                                                           
+            '279479-279479', # HLT_IsoMu22_v3, 5.927/pb                                                                                                                                          
+            '279588-279588', # HLT_IsoMu22_v3, 146.246/pb                                                                                                                                        
+            '279654-279654', # HLT_IsoMu22_v3, 171.798/pb                                                                                                                                        
+            '279656-279656', # HLT_IsoMu22_v3, 5.684/pb                                                                                                                                          
+            '279658-279658', # HLT_IsoMu22_v3, 93.394/pb                                                                                                                                         
+            '279667-279667', # HLT_IsoMu22_v3, 88.595/pb                                                                                                                                         
+            '279694-279694', # HLT_IsoMu22_v3-281.611/pb                                                                                                                                        
+            '279715-279716', # HLT_IsoMu22_v3-288.748/pb                                                                                                                                        
+            '279760-279760', # HLT_IsoMu22_v3-25.559/pb                                                                                                                                         
+            '279766-279767', # HLT_IsoMu22_v3, 358.144/pb                                                                                                                                        
+            '279794-279794', # HLT_IsoMu22_v3, 93.563/pb                                                                                                                                         
+            '279841-279841', # HLT_IsoMu22_v3-233.357/pb                                                                                                                                        
+            '279931-279931', # HLT_IsoMu22_v3, 374.292/pb                                                                                                                                        
+            '279975-279975', # HLT_IsoMu22_v3, 76.5/pb                                                                                                                                           
+            '280015-280018', # HLT_IsoMu22_v3, 380.44/pb                                                                                                                                         
+            '280020-280020', # HLT_IsoMu22_v3, 4.614/pb
+            '280024-280024', # HLT_IsoMu22_v3, 41.841/pb                                                                                                                                         
+            '280191-280191', # HLT_IsoMu22_v3, 132.815/pb                                                                                                                                        
+            '280194-280194', # HLT_IsoMu22_v3, 34.566/pb                                                                                                                                         
+            '280242-280242', # HLT_IsoMu22_v3-25.015/pb                                                                                                                                         
+            '280249-280249', # HLT_IsoMu22_v3-239.16/pb                                                                                                                                         
+            '280251-280251', # HLT_IsoMu22_v3, 47.176/pb                                                                                                                                         
+            '280330-280330', # HLT_IsoMu22_v3, 76.827/pb                                                                                                                                         
+            '280349-280349', # HLT_IsoMu22_v3, 104.129/pb                                                                                                                                        
+            '280363-280364', # HLT_IsoMu22_v3-204.989/pb                                                                                                                                        
+            '280385-280385', # HLT_IsoMu22_v3-257.401/pb                                                                                                                                        
+            '281613-281613', # HLT_IsoMu22_v5, 9.154/pb                                                                                                                                          
+            '281641-281641', # HLT_IsoMu22_v5, 36.171/pb                                                                                                                                         
+            '281693-281693', # HLT_IsoMu22_v5-278.604/pb                                                                                                                                        
+            '281707-281707', # HLT_IsoMu22_v5, 71.66/pb                                                                                                                                          
+            '281726-281727', # HLT_IsoMu22_v5-251.373/pb                                                                                                                                        
+            '281797-281797', # HLT_IsoMu22_v5-235.896/pb                                                                                                                                        
+            '281976-281976', # HLT_IsoMu22_v5-270.062/pb                                                                                                                                        
+            '282035-282035', # HLT_IsoMu22_v5, 1.267/pb                                                                                                                                          
+            '282037-282037', # HLT_IsoMu22_v5-232.526/pb                                                                                                                                        
+            '282092-282092', # HLT_IsoMu22_v5-262.782/pb                                                                                                                                        
+            '282734-282735', # HLT_IsoMu22_v5-294.148/pb                                                                                                                                        
+            '282807-282807', # HLT_IsoMu22_v5, 15.962/pb                                                                                                                                         
+            '282814-282814', # HLT_IsoMu22_v5-276.224/pb                                                                                                                                        
+            '282922-282923', # HLT_IsoMu22_v5, 66.001/pb                                                                                                                                         
+            '283042-283043', # HLT_IsoMu22_v5, 18.326/pb 
+            '283059-283059', # HLT_IsoMu22_v5, 32.079/pb                                                                                                                                         
+            '283270-283270', # HLT_IsoMu22_v5, 172.582/pb                                                                                                                                        
+            '283283-283283', # HLT_IsoMu22_v5, 197.444/pb                                                                                                                                        
+            '283307-283308', # HLT_IsoMu22_v5, 193.364/pb                                                                                                                                        
+            '283358-283359', # HLT_IsoMu22_v5-221.154/pb                                                                                                                                        
+            '283408-283408', # HLT_IsoMu22_v5-235.64/pb                                                                                                                                         
+            '283416-283416', # HLT_IsoMu22_v5-21.628/pb                                                                                                                                         
+            '283478-283478', # HLT_IsoMu22_v5-26.887/pb                                                                                                                                         
+            '283548-283548', # HLT_IsoMu22_v5-25.693/pb                                                                                                                                         
+            '283682-283682', # HLT_IsoMu22_v5, 41.97/pb                                                                                                                                          
+            '283685-283685', # HLT_IsoMu22_v5-20.432/pb                                                                                                                                         
+            '283820-283820', # HLT_IsoMu22_v5-259.058/pb                                                                                                                                        
+            '283830-283830', # HLT_IsoMu22_v5, 102.255/pb                                                                                                                                        
+            '283834-283835', # HLT_IsoMu22_v5-20.323/pb                                                                                                                                         
+            '283865-283865', # HLT_IsoMu22_v5, 87.196/pb                                                                                                                                         
+            '283877-283877', # HLT_IsoMu22_v5-232.287/pb                                                                                                                                        
+            '283885-283885', # HLT_IsoMu22_v5-235.827/pb                                                                                                                                        
+            '283934-283934', # HLT_IsoMu22_v5, 102.456/pb                                                                                                                                        
+            '283946-283946', # HLT_IsoMu22_v5, 115.801/pb                                                                                                                                        
+            '283964-283964', # HLT_IsoMu22_v5, 58.366/pb                                                                                                                                         
+            '284006-284006', # HLT_IsoMu22_v5, 51.487/pb                                                                                                                                         
+            '284014-284014', # HLT_IsoMu22_v5, 47.826/pb                                                                                                                                         
+            '284036-284044', # HLT_IsoMu22_v5, 185.383/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoTkMu22----------##   
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoTkMu22"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(22.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_IsoTkMu22_v2, 50.239/pb                                                                                                                                       
+            '273302-273302', # HLT_IsoTkMu22_v2, 16.319/pb                                                                                                                                       
+            '273402-273406', # HLT_IsoTkMu22_v2, 13.589/pb                                                                                                                                       
+            '273408-273411', # HLT_IsoTkMu22_v2, 13.087/pb                                                                                                                                       
+            '273425-273425', # HLT_IsoTkMu22_v2-26.717/pb                                                                                                                                       
+            '273446-273450', # HLT_IsoTkMu22_v2, 94.292/pb                                                                                                                                       
+            '273492-273494', # HLT_IsoTkMu22_v2, 30.924/pb                                                                                                                                       
+            '273502-273503', # HLT_IsoTkMu22_v2, 72.147/pb                                                                                                                                       
+            '273554-273555', # HLT_IsoTkMu22_v2, 38.827/pb                                                                                                                                       
+            '273725-273725', # HLT_IsoTkMu22_v2, 154.653/pb                                                                                                                                      
+            '273728-273728', # HLT_IsoTkMu22_v2, 4.897/pb                                                                                                                                        
+            '273730-273730', # HLT_IsoTkMu22_v2, 86.49/pb                                                                                                                                        
+            '274094-274094', # HLT_IsoTkMu22_v2, 9.735/pb                                                                                                                                        
+            '274146-274146', # HLT_IsoTkMu22_v2, 5.12/pb                                                                                                                                         
+            '274157-274157', # HLT_IsoTkMu22_v2, 38.994/pb                                                                                                                                       
+            '274159-274161', # HLT_IsoTkMu22_v2, 62.883/pb                                                                                                                                       
+            '274172-274172', # HLT_IsoTkMu22_v2, 5.249/pb                                                                                                                                        
+            '274198-274200', # HLT_IsoTkMu22_v2, 135.972/pb                                                                                                                                      
+            '274240-274241', # HLT_IsoTkMu22_v2, 134.472/pb                                                                                                                                      
+            '274244-274244', # HLT_IsoTkMu22_v2, 56.348/pb                                                                                                                                       
+            '274250-274251', # HLT_IsoTkMu22_v2, 159.993/pb                                                                                                                                      
+            '274283-274284', # HLT_IsoTkMu22_v2, 30.266/pb                                                                                                                                       
+            '274286-274286', # HLT_IsoTkMu22_v2-21.668/pb                                                                                                                                       
+            '274314-274317', # HLT_IsoTkMu22_v2-206.7/pb                                                                                                                                        
+            '274319-274319', # HLT_IsoTkMu22_v2-27.302/pb                                                                                                                                       
+            '274335-274339', # HLT_IsoTkMu22_v2-246.003/pb                                                                                                                                      
+            '274344-274345', # HLT_IsoTkMu22_v2, 87.68/pb                                                                                                                                        
+            '274382-274382', # HLT_IsoTkMu22_v2, 7.428/pb                                                                                                                                        
+            '274387-274388', # HLT_IsoTkMu22_v2, 312.374/pb                                                                                                                                      
+            '274420-274422', # HLT_IsoTkMu22_v2, 359.125/pb                                                                                                                                      
+            '274440-274442', # HLT_IsoTkMu22_v2-226.466/pb                                                                                                                                      
+            '274954-274955', # HLT_IsoTkMu22_v3, 5.735/pb                                                                                                                                        
+            '274968-274971', # HLT_IsoTkMu22_v3, 422.272/pb                                                                                                                                      
+            '274998-275001', # HLT_IsoTkMu22_v3, 489.252/pb                                                                                                                                      
+            '275059-275059', # HLT_IsoTkMu22_v3, 6.094/pb                                                                                                                                        
+            '275066-275068', # HLT_IsoTkMu22_v3-231.774/pb                                                                                                                                      
+            '275073-275074', # HLT_IsoTkMu22_v3, 144.124/pb                                                                                                                                      
+            '275124-275125', # HLT_IsoTkMu22_v3-205.394/pb                                                                                                                                      
+            '275282-275284', # HLT_IsoTkMu22_v3, 49.295/pb                                                                                                                                       
+            '275290-275293', # HLT_IsoTkMu22_v3, 94.338/pb                                                                                                                                       
+            '275309-275311', # HLT_IsoTkMu22_v3, 411.084/pb                                                                                                                                      
+            '275319-275319', # HLT_IsoTkMu22_v3-24.399/pb                                                                                                                                       
+            '275337-275338', # HLT_IsoTkMu22_v3, 143.358/pb                                                                                                                                      
+            '275344-275345', # HLT_IsoTkMu22_v3, 109.524/pb                                                                                                                                      
+            '275370-275371', # HLT_IsoTkMu22_v3, 145.599/pb                                                                                                                                      
+            '275375-275376', # HLT_IsoTkMu22_v3, 528.636/pb                                                                                                                                      
+            '275657-275659', # HLT_IsoTkMu22_v4, 80.874/pb     
+            '275761-275761', # HLT_IsoTkMu22_v4, 1.667/pb                                                                                                                                        
+            '275767-275767', # HLT_IsoTkMu22_v4, 0.714/pb                                                                                                                                        
+            '275772-275774', # HLT_IsoTkMu22_v4, 66.444/pb                                                                                                                                       
+            '275776-275778', # HLT_IsoTkMu22_v4, 116.898/pb                                                                                                                                      
+            '275782-275782', # HLT_IsoTkMu22_v4, 99.533/pb                                                                                                                                       
+            '275832-275837', # HLT_IsoTkMu22_v4, 441.03/pb                                                                                                                                       
+            '275847-275847', # HLT_IsoTkMu22_v4, 198.947/pb                                                                                                                                      
+            '275886-275886', # HLT_IsoTkMu22_v4, 7.581/pb                                                                                                                                        
+            '275890-275890', # HLT_IsoTkMu22_v4-235.22/pb                                                                                                                                       
+            '275911-275913', # HLT_IsoTkMu22_v4-201.741/pb                                                                                                                                      
+            '275918-275918', # HLT_IsoTkMu22_v4, 49.71/pb                                                                                                                                        
+            '275920-275921', # HLT_IsoTkMu22_v4, 62.257/pb                                                                                                                                       
+            '275923-275923', # HLT_IsoTkMu22_v4, 14.5/pb                                                                                                                                         
+            '275931-275931', # HLT_IsoTkMu22_v4, 10.418/pb                                                                                                                                       
+            '275963-275963', # HLT_IsoTkMu22_v4, 19.553/pb                                                                                                                                       
+            '276092-276092', # HLT_IsoTkMu22_v4, 14.768/pb                                                                                                                                       
+            '276097-276097', # HLT_IsoTkMu22_v4, 99.405/pb                                                                                                                                       
+            '276242-276244', # HLT_IsoTkMu22_v4, 479.052/pb                                                                                                                                      
+            '276282-276283', # HLT_IsoTkMu22_v4, 372.59/pb                                                                                                                                       
+            '276315-276315', # HLT_IsoTkMu22_v4, 34.051/pb                                                                                                                                       
+            '276317-276318', # HLT_IsoTkMu22_v4, 124.306/pb                                                                                                                                      
+            '276355-276355', # HLT_IsoTkMu22_v4, 6.205/pb                                                                                                                                        
+            '276361-276361', # HLT_IsoTkMu22_v4, 149.465/pb                                                                                                                                      
+            '276363-276363', # HLT_IsoTkMu22_v4-206.376/pb                                                                                                                                      
+            '276384-276384', # HLT_IsoTkMu22_v4, 121.517/pb     
+            '276437-276437', # HLT_IsoTkMu22_v4, 355.688/pb                                                                                                                                      
+            '276454-276454', # HLT_IsoTkMu22_v4, 63.924/pb                                                                                                                                       
+            '276458-276458', # HLT_IsoTkMu22_v4, 33.169/pb                                                                                                                                       
+            '276495-276495', # HLT_IsoTkMu22_v4, 38.062/pb                                                                                                                                       
+            '276501-276502', # HLT_IsoTkMu22_v4, 486.891/pb                                                                                                                                      
+            '276525-276525', # HLT_IsoTkMu22_v4, 402.663/pb                                                                                                                                      
+            '276527-276528', # HLT_IsoTkMu22_v4, 60.758/pb                                                                                                                                       
+            '276542-276545', # HLT_IsoTkMu22_v4, 345.204/pb                                                                                                                                      
+            '276581-276587', # HLT_IsoTkMu22_v4, 471.493/pb                                                                                                                                      
+            '276653-276653', # HLT_IsoTkMu22_v4, 86.12/pb                                                                                                                                        
+            '276655-276655', # HLT_IsoTkMu22_v4, 160.843/pb                                                                                                                                      
+            '276659-276659', # HLT_IsoTkMu22_v4-29.939/pb                                                                                                                                       
+            '276775-276776', # HLT_IsoTkMu22_v4, 443.702/pb                                                                                                                                      
+            '276794-276794', # HLT_IsoTkMu22_v4, 87.206/pb                                                                                                                                       
+            '276807-276808', # HLT_IsoTkMu22_v4, 188.301/pb                                                                                                                                      
+            '276810-276811', # HLT_IsoTkMu22_v4, 346.409/pb                                                                                                                                      
+            '276831-276831', # HLT_IsoTkMu22_v4, 400.298/pb                                                                                                                                      
+            '276834-276834', # HLT_IsoTkMu22_v4, 72.6/pb                                                                                                                                         
+            '276870-276870', # HLT_IsoTkMu22_v4, 513.042/pb                                                                                                                                      
+            '276935-276935', # HLT_IsoTkMu22_v4, 128.487/pb                                                                                                                                      
+            '276940-276940', # HLT_IsoTkMu22_v4, 16.262/pb                                                                                                                                       
+            '276946-276948', # HLT_IsoTkMu22_v4, 113.478/pb                                                                                                                                      
+            '276950-276950', # HLT_IsoTkMu22_v4, 323.179/pb                                                                                                                                      
+            '277070-277073', # HLT_IsoTkMu22_v4, 303.149/pb                                                                                                                                      
+            '277076-277076', # HLT_IsoTkMu22_v4, 125.929/pb
+            '277087-277087', # HLT_IsoTkMu22_v4, 86.357/pb                                                                                                                                       
+            '277094-277094', # HLT_IsoTkMu22_v4, 71.944/pb                                                                                                                                       
+            '277096-277096', # HLT_IsoTkMu22_v4, 320.668/pb                                                                                                                                      
+            '277112-277112', # HLT_IsoTkMu22_v4, 12.913/pb                                                                                                                                       
+            '277127-277127', # HLT_IsoTkMu22_v4, 181.81/pb                                                                                                                                       
+            '277148-277148', # HLT_IsoTkMu22_v4, 128.17/pb                                                                                                                                       
+            '277166-277166', # HLT_IsoTkMu22_v4, 66.646/pb                                                                                                                                       
+            '277168-277168', # HLT_IsoTkMu22_v4, 317.531/pb                                                                                                                                      
+            '277180-277180', # HLT_IsoTkMu22_v4, 18.477/pb                                                                                                                                       
+            '277194-277194', # HLT_IsoTkMu22_v4, 314.183/pb                                                                                                                                      
+            '277305-277305', # HLT_IsoTkMu22_v4, 93.106/pb                                                                                                                                       
+            '277420-277420', # HLT_IsoTkMu22_v4-25.075/pb                                                                                                                                       
+            '277981-277981', # HLT_IsoTkMu22_v4, 4.601/pb                                                                                                                                        
+            '277991-277992', # HLT_IsoTkMu22_v4-21.386/pb                                                                                                                                       
+            '278017-278018', # HLT_IsoTkMu22_v4-244.899/pb                                                                                                                                      
+            '278167-278167', # HLT_IsoTkMu22_v4, 314.532/pb                                                                                                                                      
+            '278175-278175', # HLT_IsoTkMu22_v4, 8.712/pb                                                                                                                                        
+            '278193-278193', # HLT_IsoTkMu22_v4-25.283/pb                                                                                                                                       
+            '278239-278240', # HLT_IsoTkMu22_v4, 329.574/pb                                                                                                                                      
+            '278273-278274', # HLT_IsoTkMu22_v4-22.542/pb                                                                                                                                       
+            '278288-278290', # HLT_IsoTkMu22_v4, 13.31/pb                                                                                                                                        
+            '278308-278308', # HLT_IsoTkMu22_v4-260.311/pb                                                                                                                                      
+            '278310-278310', # HLT_IsoTkMu22_v4, 88.422/pb                                                                                                                                       
+            '278315-278315', # HLT_IsoTkMu22_v4, 104.138/pb                                                                                                                                      
+            '278345-278346', # HLT_IsoTkMu22_v4, 122.945/pb       
+            '278349-278349', # HLT_IsoTkMu22_v4, 94.737/pb                                                                                                                                       
+            '278366-278366', # HLT_IsoTkMu22_v4, 59.423/pb                                                                                                                                       
+            '278406-278406', # HLT_IsoTkMu22_v4-210.055/pb                                                                                                                                      
+            '278509-278509', # HLT_IsoTkMu22_v4, 180.065/pb                                                                                                                                      
+            '278770-278770', # HLT_IsoTkMu22_v4, 66.171/pb                                                                                                                                       
+            '278804-278805', # HLT_IsoTkMu22_v4, 38.466/pb                                                                                                                                       
+            '278808-278808', # HLT_IsoTkMu22_v4-269.634/pb                                                                                                                                      
+            '278820-278820', # HLT_IsoTkMu22_v4, 198.291/pb                                                                                                                                      
+            '278822-278822', # HLT_IsoTkMu22_v4, 191.158/pb                                                                                                                                      
+            '278873-278875', # HLT_IsoTkMu22_v4, 198.446/pb                                                                                                                                      
+            '278963-278963', # HLT_IsoTkMu22_v4, 14.235/pb                                                                                                                                       
+            '278969-278969', # HLT_IsoTkMu22_v4, 149.94/pb                                                                                                                                       
+            '278975-278976', # HLT_IsoTkMu22_v4, 122.556/pb                                                                                                                                      
+            '279024-279024', # HLT_IsoTkMu22_v4, 49.039/pb                                                                                                                                       
+            '279029-279029', # HLT_IsoTkMu22_v4, 38.088/pb                                                                                                                                       
+            '279071-279071', # HLT_IsoTkMu22_v4-22.581/pb                                                                                                                                       
+            '279080-279080', # HLT_IsoTkMu22_v4, 11.815/pb                                                                                                                                       
+            '279115-279116', # HLT_IsoTkMu22_v4, 94.0/pb                                                                                                                                         
+            '279479-279479', # HLT_IsoTkMu22_v4, 5.927/pb                                                                                                                                        
+            '279588-279588', # HLT_IsoTkMu22_v4, 146.246/pb                                                                                                                                      
+            '279654-279654', # HLT_IsoTkMu22_v4, 171.798/pb                                                                                                                                      
+            '279656-279656', # HLT_IsoTkMu22_v4, 5.684/pb                                                                                                                                        
+            '279658-279658', # HLT_IsoTkMu22_v4, 93.394/pb                                                                                                                                       
+            '279667-279667', # HLT_IsoTkMu22_v4, 88.595/pb                                                                                                                                       
+            '279694-279694', # HLT_IsoTkMu22_v4-281.611/pb     
+            '279715-279716', # HLT_IsoTkMu22_v4-288.748/pb                                                                                                                                      
+            '279760-279760', # HLT_IsoTkMu22_v4-25.559/pb                                                                                                                                       
+            '279766-279767', # HLT_IsoTkMu22_v4, 358.144/pb                                                                                                                                      
+            '279794-279794', # HLT_IsoTkMu22_v4, 93.563/pb                                                                                                                                       
+            '279841-279841', # HLT_IsoTkMu22_v4-233.357/pb                                                                                                                                      
+            '279931-279931', # HLT_IsoTkMu22_v4, 374.292/pb                                                                                                                                      
+            '279975-279975', # HLT_IsoTkMu22_v4, 76.5/pb                                                                                                                                         
+            '280015-280018', # HLT_IsoTkMu22_v4, 380.44/pb                                                                                                                                       
+            '280020-280020', # HLT_IsoTkMu22_v4, 4.614/pb                                                                                                                                        
+            '280024-280024', # HLT_IsoTkMu22_v4, 41.841/pb                                                                                                                                       
+            '280191-280191', # HLT_IsoTkMu22_v4, 132.815/pb                                                                                                                                      
+            '280194-280194', # HLT_IsoTkMu22_v4, 34.566/pb                                                                                                                                       
+            '280242-280242', # HLT_IsoTkMu22_v4-25.015/pb                                                                                                                                       
+            '280249-280249', # HLT_IsoTkMu22_v4-239.16/pb                                                                                                                                       
+            '280251-280251', # HLT_IsoTkMu22_v4, 47.176/pb                                                                                                                                       
+            '280330-280330', # HLT_IsoTkMu22_v4, 76.827/pb                                                                                                                                       
+            '280349-280349', # HLT_IsoTkMu22_v4, 104.129/pb                                                                                                                                      
+            '280363-280364', # HLT_IsoTkMu22_v4-204.989/pb                                                                                                                                      
+            '280385-280385', # HLT_IsoTkMu22_v4-257.401/pb                                                                                                                                      
+            '281613-281613', # HLT_IsoTkMu22_v5, 9.154/pb                                                                                                                                        
+            '281641-281641', # HLT_IsoTkMu22_v5, 36.171/pb                                                                                                                                       
+            '281693-281693', # HLT_IsoTkMu22_v5-278.604/pb                                                                                                                                      
+            '281707-281707', # HLT_IsoTkMu22_v5, 71.66/pb                                                                                                                                        
+            '281726-281727', # HLT_IsoTkMu22_v5-251.373/pb                                                                                                                                      
+            '281797-281797', # HLT_IsoTkMu22_v5-235.896/pb
+            '281976-281976', # HLT_IsoTkMu22_v5-270.062/pb                                                                                                                                      
+            '282035-282035', # HLT_IsoTkMu22_v5, 1.267/pb                                                                                                                                        
+            '282037-282037', # HLT_IsoTkMu22_v5-232.526/pb                                                                                                                                      
+            '282092-282092', # HLT_IsoTkMu22_v5-262.782/pb                                                                                                                                      
+            '282734-282735', # HLT_IsoTkMu22_v5-294.148/pb                                                                                                                                      
+            '282807-282807', # HLT_IsoTkMu22_v5, 15.962/pb                                                                                                                                       
+            '282814-282814', # HLT_IsoTkMu22_v5-276.224/pb                                                                                                                                      
+            '282922-282923', # HLT_IsoTkMu22_v5, 66.001/pb                                                                                                                                       
+            '283042-283043', # HLT_IsoTkMu22_v5, 18.326/pb                                                                                                                                       
+            '283059-283059', # HLT_IsoTkMu22_v5, 32.079/pb                                                                                                                                       
+            '283270-283270', # HLT_IsoTkMu22_v5, 172.582/pb                                                                                                                                      
+            '283283-283283', # HLT_IsoTkMu22_v5, 197.444/pb                                                                                                                                      
+            '283307-283308', # HLT_IsoTkMu22_v5, 193.364/pb                                                                                                                                      
+            '283358-283359', # HLT_IsoTkMu22_v5-221.154/pb                                                                                                                                      
+            '283408-283408', # HLT_IsoTkMu22_v5-235.64/pb                                                                                                                                       
+            '283416-283416', # HLT_IsoTkMu22_v5-21.628/pb                                                                                                                                       
+            '283478-283478', # HLT_IsoTkMu22_v5-26.887/pb                                                                                                                                       
+            '283548-283548', # HLT_IsoTkMu22_v5-25.693/pb                                                                                                                                       
+            '283682-283682', # HLT_IsoTkMu22_v5, 41.97/pb                                                                                                                                        
+            '283685-283685', # HLT_IsoTkMu22_v5-20.432/pb                                                                                                                                       
+            '283820-283820', # HLT_IsoTkMu22_v5-259.058/pb                                                                                                                                      
+            '283830-283830', # HLT_IsoTkMu22_v5, 102.255/pb                                                                                                                                      
+            '283834-283835', # HLT_IsoTkMu22_v5-20.323/pb                                                                                                                                       
+            '283865-283865', # HLT_IsoTkMu22_v5, 87.196/pb                                                                                                                                       
+            '283877-283877', # HLT_IsoTkMu22_v5-232.287/pb 
+            '283885-283885', # HLT_IsoTkMu22_v5-235.827/pb                                                                                                                                      
+            '283934-283934', # HLT_IsoTkMu22_v5, 102.456/pb                                                                                                                                      
+            '283946-283946', # HLT_IsoTkMu22_v5, 115.801/pb                                                                                                                                      
+            '283964-283964', # HLT_IsoTkMu22_v5, 58.366/pb                                                                                                                                       
+            '284006-284006', # HLT_IsoTkMu22_v5, 51.487/pb                                                                                                                                       
+            '284014-284014', # HLT_IsoTkMu22_v5, 47.826/pb                                                                                                                                       
+            '284036-284044', # HLT_IsoTkMu22_v5, 185.383/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoMu22_eta2p1----------##   
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu22_eta2p1"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(22.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '274954-274955', # HLT_IsoMu22_eta2p1_v2, 5.735/pb                                                                                                                                   
+            '274968-274971', # HLT_IsoMu22_eta2p1_v2, 422.272/pb                                                                                                                                 
+            '274998-275001', # HLT_IsoMu22_eta2p1_v2, 489.252/pb                                                                                                                                 
+            '275059-275059', # HLT_IsoMu22_eta2p1_v2, 6.094/pb                                                                                                                                   
+            '275066-275068', # HLT_IsoMu22_eta2p1_v2-231.774/pb                                                                                                                                 
+            '275073-275074', # HLT_IsoMu22_eta2p1_v2, 144.124/pb                                                                                                                                 
+            '275124-275125', # HLT_IsoMu22_eta2p1_v2-205.394/pb                                                                                                                                 
+            '275282-275284', # HLT_IsoMu22_eta2p1_v2, 49.295/pb                                                                                                                                  
+            '275290-275293', # HLT_IsoMu22_eta2p1_v2, 94.338/pb                                                                                                                                  
+            '275309-275311', # HLT_IsoMu22_eta2p1_v2, 411.084/pb                                                                                                                                 
+            '275319-275319', # HLT_IsoMu22_eta2p1_v2-24.399/pb                                                                                                                                  
+            '275337-275338', # HLT_IsoMu22_eta2p1_v2, 143.358/pb                                                                                                                                 
+            '275344-275345', # HLT_IsoMu22_eta2p1_v2, 109.524/pb                                                                                                                                 
+            '275370-275371', # HLT_IsoMu22_eta2p1_v2, 145.599/pb                                                                                                                                 
+            '275375-275376', # HLT_IsoMu22_eta2p1_v2, 528.636/pb                                                                                                                                 
+            '275657-275659', # HLT_IsoMu22_eta2p1_v2, 80.874/pb                                                                                                                                  
+            '275761-275761', # HLT_IsoMu22_eta2p1_v2, 1.667/pb                                                                                                                                   
+            '275767-275767', # HLT_IsoMu22_eta2p1_v2, 0.714/pb                                                                                                                                   
+            '275772-275774', # HLT_IsoMu22_eta2p1_v2, 66.444/pb                                                                                                                                  
+            '275776-275778', # HLT_IsoMu22_eta2p1_v2, 116.898/pb                                                                                                                                 
+            '275782-275782', # HLT_IsoMu22_eta2p1_v2, 99.533/pb                                                                                                                                  
+            '275832-275837', # HLT_IsoMu22_eta2p1_v2, 441.03/pb                                                                                                                                  
+            '275847-275847', # HLT_IsoMu22_eta2p1_v2, 198.947/pb                                                                                                                                 
+            '275886-275886', # HLT_IsoMu22_eta2p1_v2, 7.581/pb                                                                                                                                   
+            '275890-275890', # HLT_IsoMu22_eta2p1_v2-235.22/pb                                                                                                                                  
+            '275911-275913', # HLT_IsoMu22_eta2p1_v2-201.741/pb                                                                                                                                 
+            '275918-275918', # HLT_IsoMu22_eta2p1_v2, 49.71/pb                                                                                                                                   
+            '275920-275921', # HLT_IsoMu22_eta2p1_v2, 62.257/pb                                                                                                                                  
+            '275923-275923', # HLT_IsoMu22_eta2p1_v2, 14.5/pb                                                                                                                                    
+            '275931-275931', # HLT_IsoMu22_eta2p1_v2, 10.418/pb                                                                                                                                  
+            '275963-275963', # HLT_IsoMu22_eta2p1_v2, 19.553/pb                                                                                                                                  
+            '276092-276092', # HLT_IsoMu22_eta2p1_v2, 14.768/pb                                                                                                                                  
+            '276097-276097', # HLT_IsoMu22_eta2p1_v2, 99.405/pb                                                                                                                                  
+            '276242-276244', # HLT_IsoMu22_eta2p1_v2, 479.052/pb                                                                                                                                 
+            '276282-276283', # HLT_IsoMu22_eta2p1_v2, 372.59/pb                                                                                                                                  
+            '276315-276315', # HLT_IsoMu22_eta2p1_v2, 34.051/pb 
+            '276317-276318', # HLT_IsoMu22_eta2p1_v2, 124.306/pb                                                                                                                                 
+            '276355-276355', # HLT_IsoMu22_eta2p1_v2, 6.205/pb                                                                                                                                   
+            '276361-276361', # HLT_IsoMu22_eta2p1_v2, 149.465/pb                                                                                                                                 
+            '276363-276363', # HLT_IsoMu22_eta2p1_v2-206.376/pb                                                                                                                                 
+            '276384-276384', # HLT_IsoMu22_eta2p1_v2, 121.517/pb                                                                                                                                 
+            '276437-276437', # HLT_IsoMu22_eta2p1_v2, 355.688/pb                                                                                                                                 
+            '276454-276454', # HLT_IsoMu22_eta2p1_v2, 63.924/pb                                                                                                                                  
+            '276458-276458', # HLT_IsoMu22_eta2p1_v2, 33.169/pb                                                                                                                                  
+            '276495-276495', # HLT_IsoMu22_eta2p1_v2, 38.062/pb                                                                                                                                  
+            '276501-276502', # HLT_IsoMu22_eta2p1_v2, 486.891/pb                                                                                                                                 
+            '276525-276525', # HLT_IsoMu22_eta2p1_v2, 402.663/pb                                                                                                                                 
+            '276527-276528', # HLT_IsoMu22_eta2p1_v2, 60.758/pb                                                                                                                                  
+            '276542-276545', # HLT_IsoMu22_eta2p1_v2, 345.204/pb                                                                                                                                 
+            '276581-276587', # HLT_IsoMu22_eta2p1_v2, 471.493/pb                                                                                                                                 
+            '276653-276653', # HLT_IsoMu22_eta2p1_v2, 86.12/pb                                                                                                                                   
+            '276655-276655', # HLT_IsoMu22_eta2p1_v2, 160.843/pb                                                                                                                                 
+            '276659-276659', # HLT_IsoMu22_eta2p1_v2-29.939/pb                                                                                                                                  
+            '276775-276776', # HLT_IsoMu22_eta2p1_v2, 443.702/pb                                                                                                                                 
+            '276794-276794', # HLT_IsoMu22_eta2p1_v2, 87.206/pb                                                                                                                                  
+            '276807-276808', # HLT_IsoMu22_eta2p1_v2, 188.301/pb                                                                                                                                 
+            '276810-276811', # HLT_IsoMu22_eta2p1_v2, 346.409/pb                                                                                                                                 
+            '276831-276831', # HLT_IsoMu22_eta2p1_v2, 400.298/pb                                                                                                                                 
+            '276834-276834', # HLT_IsoMu22_eta2p1_v2, 72.6/pb                                                                                                                                    
+            '276870-276870', # HLT_IsoMu22_eta2p1_v2, 526.587/pb                                                                                                                                 
+            '276935-276935', # HLT_IsoMu22_eta2p1_v2, 169.998/pb    
+            '276940-276940', # HLT_IsoMu22_eta2p1_v2-28.701/pb                                                                                                                                  
+            '276946-276948', # HLT_IsoMu22_eta2p1_v2, 114.81/pb                                                                                                                                  
+            '276950-276950', # HLT_IsoMu22_eta2p1_v2, 323.179/pb                                                                                                                                 
+            '277069-277073', # HLT_IsoMu22_eta2p1_v2, 390.296/pb                                                                                                                                 
+            '277076-277076', # HLT_IsoMu22_eta2p1_v2, 125.929/pb                                                                                                                                 
+            '277087-277087', # HLT_IsoMu22_eta2p1_v2, 86.357/pb                                                                                                                                  
+            '277094-277094', # HLT_IsoMu22_eta2p1_v2, 131.103/pb                                                                                                                                 
+            '277096-277096', # HLT_IsoMu22_eta2p1_v2, 320.668/pb                                                                                                                                 
+            '277112-277112', # HLT_IsoMu22_eta2p1_v2, 17.339/pb                                                                                                                                  
+            '277126-277127', # HLT_IsoMu22_eta2p1_v2, 185.976/pb                                                                                                                                 
+            '277148-277148', # HLT_IsoMu22_eta2p1_v2, 128.192/pb                                                                                                                                 
+            '277166-277166', # HLT_IsoMu22_eta2p1_v2, 70.666/pb                                                                                                                                  
+            '277168-277168', # HLT_IsoMu22_eta2p1_v2, 318.998/pb                                                                                                                                 
+            '277180-277180', # HLT_IsoMu22_eta2p1_v2, 31.25/pb                                                                                                                                   
+            '277194-277194', # HLT_IsoMu22_eta2p1_v2, 367.175/pb                                                                                                                                 
+            '277305-277305', # HLT_IsoMu22_eta2p1_v2, 154.262/pb                                                                                                                                 
+            '277420-277420', # HLT_IsoMu22_eta2p1_v2, 60.844/pb                                                                                                                                  
+            '277981-277981', # HLT_IsoMu22_eta2p1_v2, 4.601/pb                                                                                                                                   
+            '277991-277992', # HLT_IsoMu22_eta2p1_v2-21.692/pb                                                                                                                                  
+            '278017-278018', # HLT_IsoMu22_eta2p1_v2, 338.894/pb                                                                                                                                 
+            '278167-278167', # HLT_IsoMu22_eta2p1_v2, 314.532/pb                                                                                                                                 
+            '278175-278175', # HLT_IsoMu22_eta2p1_v2, 9.045/pb                                                                                                                                   
+            '278193-278193', # HLT_IsoMu22_eta2p1_v2, 34.581/pb                                                                                                                                  
+            '278239-278240', # HLT_IsoMu22_eta2p1_v2, 330.009/pb                                                                                                                                 
+            '278273-278274', # HLT_IsoMu22_eta2p1_v2-23.87/pb 
+            '278288-278290', # HLT_IsoMu22_eta2p1_v2, 14.747/pb                                                                                                                                  
+            '278308-278308', # HLT_IsoMu22_eta2p1_v2, 313.102/pb                                                                                                                                 
+            '278310-278310', # HLT_IsoMu22_eta2p1_v2, 88.422/pb                                                                                                                                  
+            '278315-278315', # HLT_IsoMu22_eta2p1_v2, 137.45/pb                                                                                                                                  
+            '278345-278346', # HLT_IsoMu22_eta2p1_v2, 171.231/pb                                                                                                                                 
+            '278349-278349', # HLT_IsoMu22_eta2p1_v2, 94.737/pb                                                                                                                                  
+            '278366-278366', # HLT_IsoMu22_eta2p1_v2, 59.423/pb                                                                                                                                  
+            '278406-278406', # HLT_IsoMu22_eta2p1_v2-296.962/pb                                                                                                                                 
+            '278509-278509', # HLT_IsoMu22_eta2p1_v2-273.442/pb                                                                                                                                 
+            '278769-278770', # HLT_IsoMu22_eta2p1_v2, 170.993/pb                                                                                                                                 
+            '278801-278805', # HLT_IsoMu22_eta2p1_v2, 137.142/pb                                                                                                                                 
+            '278808-278808', # HLT_IsoMu22_eta2p1_v2-269.634/pb                                                                                                                                 
+            '278820-278820', # HLT_IsoMu22_eta2p1_v2-286.511/pb                                                                                                                                 
+            '278822-278822', # HLT_IsoMu22_eta2p1_v2, 191.158/pb                                                                                                                                 
+            '278873-278875', # HLT_IsoMu22_eta2p1_v2, 198.657/pb                                                                                                                                 
+            '278923-278923', # HLT_IsoMu22_eta2p1_v2, 98.543/pb                                                                                                                                  
+            '278957-278957', # HLT_IsoMu22_eta2p1_v2, 36.164/pb                                                                                                                                  
+            '278962-278963', # HLT_IsoMu22_eta2p1_v2, 113.024/pb                                                                                                                                 
+            '278969-278969', # HLT_IsoMu22_eta2p1_v2-282.492/pb                                                                                                                                 
+            '278975-278976', # HLT_IsoMu22_eta2p1_v2, 122.556/pb                                                                                                                                 
+            '278986-278986', # HLT_IsoMu22_eta2p1_v2, 31.548/pb                                                                                                                                  
+            '279024-279024', # HLT_IsoMu22_eta2p1_v2, 49.596/pb                                                                                                                                  
+            '279029-279029', # HLT_IsoMu22_eta2p1_v2, 38.088/pb                                                                                                                                  
+            '279071-279071', # HLT_IsoMu22_eta2p1_v2-22.581/pb                                                                                                                                  
+            '279080-279080', # HLT_IsoMu22_eta2p1_v2, 12.773/pb
+            '279115-279116', # HLT_IsoMu22_eta2p1_v2, 174.938/pb                                                                                                                                 
+            '279479-279479', # HLT_IsoMu22_eta2p1_v2, 5.927/pb                                                                                                                                   
+            '279588-279588', # HLT_IsoMu22_eta2p1_v2-228.517/pb                                                                                                                                 
+            '279653-279654', # HLT_IsoMu22_eta2p1_v2-283.775/pb                                                                                                                                 
+            '279656-279656', # HLT_IsoMu22_eta2p1_v2, 5.684/pb                                                                                                                                   
+            '279658-279658', # HLT_IsoMu22_eta2p1_v2, 93.394/pb                                                                                                                                  
+            '279667-279667', # HLT_IsoMu22_eta2p1_v2-208.732/pb                                                                                                                                 
+            '279681-279685', # HLT_IsoMu22_eta2p1_v2, 74.528/pb                                                                                                                                  
+            '279691-279691', # HLT_IsoMu22_eta2p1_v2, 9.656/pb                                                                                                                                   
+            '279694-279694', # HLT_IsoMu22_eta2p1_v2, 406.418/pb                                                                                                                                 
+            '279715-279716', # HLT_IsoMu22_eta2p1_v2, 383.763/pb                                                                                                                                 
+            '279760-279760', # HLT_IsoMu22_eta2p1_v2, 153.502/pb                                                                                                                                 
+            '279766-279767', # HLT_IsoMu22_eta2p1_v2, 358.144/pb                                                                                                                                 
+            '279794-279794', # HLT_IsoMu22_eta2p1_v2-223.093/pb                                                                                                                                 
+            '279823-279823', # HLT_IsoMu22_eta2p1_v2, 81.828/pb                                                                                                                                  
+            '279841-279841', # HLT_IsoMu22_eta2p1_v2, 380.359/pb                                                                                                                                 
+            '279844-279844', # HLT_IsoMu22_eta2p1_v2, 56.588/pb                                                                                                                                  
+            '279887-279887', # HLT_IsoMu22_eta2p1_v2, 73.316/pb                                                                                                                                  
+            '279931-279931', # HLT_IsoMu22_eta2p1_v2, 475.316/pb                                                                                                                                 
+            '279966-279966', # HLT_IsoMu22_eta2p1_v2, 93.011/pb                                                                                                                                  
+            '279975-279975', # HLT_IsoMu22_eta2p1_v2-239.011/pb                                                                                                                                 
+            '279993-279994', # HLT_IsoMu22_eta2p1_v2, 30.455/pb                                                                                                                                  
+            '280013-280013', # HLT_IsoMu22_eta2p1_v2, 5.636/pb                                                                                                                                   
+            '280015-280018', # HLT_IsoMu22_eta2p1_v2, 398.79/pb                                                                                                                                  
+            '280020-280020', # HLT_IsoMu22_eta2p1_v2, 4.614/pb
+            '280024-280024', # HLT_IsoMu22_eta2p1_v2, 41.841/pb                                                                                                                                  
+            '280187-280188', # HLT_IsoMu22_eta2p1_v2, 74.778/pb                                                                                                                                  
+            '280191-280191', # HLT_IsoMu22_eta2p1_v2, 178.951/pb                                                                                                                                 
+            '280194-280194', # HLT_IsoMu22_eta2p1_v2, 36.665/pb                                                                                                                                  
+            '280242-280242', # HLT_IsoMu22_eta2p1_v2, 147.69/pb                                                                                                                                  
+            '280249-280249', # HLT_IsoMu22_eta2p1_v2-239.16/pb                                                                                                                                  
+            '280251-280251', # HLT_IsoMu22_eta2p1_v2, 47.176/pb                                                                                                                                  
+            '280327-280327', # HLT_IsoMu22_eta2p1_v2, 8.719/pb                                                                                                                                   
+            '280330-280330', # HLT_IsoMu22_eta2p1_v2, 185.776/pb                                                                                                                                 
+            '280349-280349', # HLT_IsoMu22_eta2p1_v2, 104.129/pb                                                                                                                                 
+            '280363-280364', # HLT_IsoMu22_eta2p1_v2-205.282/pb                                                                                                                                 
+            '280383-280385', # HLT_IsoMu22_eta2p1_v2, 372.972/pb                                                                                                                                 
+            '281613-281613', # HLT_IsoMu22_eta2p1_v4, 9.764/pb                                                                                                                                   
+            '281639-281639', # HLT_IsoMu22_eta2p1_v4, 18.977/pb                                                                                                                                  
+            '281641-281641', # HLT_IsoMu22_eta2p1_v4, 39.268/pb                                                                                                                                  
+            '281693-281693', # HLT_IsoMu22_eta2p1_v4, 376.118/pb                                                                                                                                 
+            '281707-281707', # HLT_IsoMu22_eta2p1_v4-214.55/pb                                                                                                                                  
+            '281726-281727', # HLT_IsoMu22_eta2p1_v4-251.373/pb                                                                                                                                 
+            '281797-281797', # HLT_IsoMu22_eta2p1_v4, 397.836/pb                                                                                                                                 
+            '281975-281976', # HLT_IsoMu22_eta2p1_v4, 393.967/pb                                                                                                                                 
+            '282033-282035', # HLT_IsoMu22_eta2p1_v4-26.293/pb                                                                                                                                  
+            '282037-282037', # HLT_IsoMu22_eta2p1_v4, 331.413/pb                                                                                                                                 
+            '282092-282092', # HLT_IsoMu22_eta2p1_v4-296.762/pb                                                                                                                                 
+            '282708-282708', # HLT_IsoMu22_eta2p1_v4-2.118/pb                                                                                                                                   
+            '282710-282710', # HLT_IsoMu22_eta2p1_v4, 0.346/pb 
+            '282712-282712', # HLT_IsoMu22_eta2p1_v4, 16.683/pb                                                                                                                                  
+            '282730-282735', # HLT_IsoMu22_eta2p1_v4, 469.07/pb                                                                                                                                  
+            '282800-282800', # HLT_IsoMu22_eta2p1_v4, 93.58/pb                                                                                                                                   
+            '282807-282807', # HLT_IsoMu22_eta2p1_v4, 70.563/pb                                                                                                                                  
+            '282814-282814', # HLT_IsoMu22_eta2p1_v4-276.224/pb                                                                                                                                 
+            '282842-282842', # HLT_IsoMu22_eta2p1_v4-23.509/pb                                                                                                                                  
+            '282917-282919', # HLT_IsoMu22_eta2p1_v4, 88.074/pb                                                                                                                                  
+            '282922-282923', # HLT_IsoMu22_eta2p1_v4, 66.001/pb                                                                                                                                  
+            '283042-283043', # HLT_IsoMu22_eta2p1_v4, 118.119/pb                                                                                                                                 
+            '283049-283050', # HLT_IsoMu22_eta2p1_v4, 61.072/pb                                                                                                                                  
+            '283052-283052', # HLT_IsoMu22_eta2p1_v4-28.777/pb                                                                                                                                  
+            '283059-283059', # HLT_IsoMu22_eta2p1_v4, 98.778/pb                                                                                                                                  
+            '283270-283270', # HLT_IsoMu22_eta2p1_v4, 381.444/pb                                                                                                                                 
+            '283283-283283', # HLT_IsoMu22_eta2p1_v4, 197.444/pb                                                                                                                                 
+            '283305-283308', # HLT_IsoMu22_eta2p1_v4, 338.86/pb                                                                                                                                  
+            '283353-283353', # HLT_IsoMu22_eta2p1_v4, 191.088/pb                                                                                                                                 
+            '283358-283359', # HLT_IsoMu22_eta2p1_v4-233.089/pb                                                                                                                                 
+            '283407-283408', # HLT_IsoMu22_eta2p1_v4, 466.833/pb                                                                                                                                 
+            '283416-283416', # HLT_IsoMu22_eta2p1_v4-21.628/pb                                                                                                                                  
+            '283453-283453', # HLT_IsoMu22_eta2p1_v4, 123.278/pb                                                                                                                                 
+            '283469-283469', # HLT_IsoMu22_eta2p1_v4, 0.031/pb                                                                                                                                   
+            '283478-283478', # HLT_IsoMu22_eta2p1_v4-210.23/pb                                                                                                                                  
+            '283548-283548', # HLT_IsoMu22_eta2p1_v4-26.451/pb                                                                                                                                  
+            '283680-283682', # HLT_IsoMu22_eta2p1_v4, 102.814/pb                                                                                                                                 
+            '283685-283685', # HLT_IsoMu22_eta2p1_v4-20.432/pb 
+            '283820-283820', # HLT_IsoMu22_eta2p1_v4-259.058/pb                                                                                                                                 
+            '283830-283830', # HLT_IsoMu22_eta2p1_v4, 102.255/pb                                                                                                                                 
+            '283834-283835', # HLT_IsoMu22_eta2p1_v4-20.323/pb                                                                                                                                  
+            '283865-283865', # HLT_IsoMu22_eta2p1_v4-264.403/pb                                                                                                                                 
+            '283876-283877', # HLT_IsoMu22_eta2p1_v4, 409.447/pb                                                                                                                                 
+            '283884-283885', # HLT_IsoMu22_eta2p1_v4, 392.377/pb                                                                                                                                 
+            '283933-283934', # HLT_IsoMu22_eta2p1_v4, 309.793/pb                                                                                                                                 
+            '283946-283946', # HLT_IsoMu22_eta2p1_v4, 300.188/pb                                                                                                                                 
+            '283964-283964', # HLT_IsoMu22_eta2p1_v4, 58.698/pb                                                                                                                                  
+            '284006-284006', # HLT_IsoMu22_eta2p1_v4, 57.69/pb                                                                                                                                   
+            '284014-284014', # HLT_IsoMu22_eta2p1_v4, 47.826/pb                                                                                                                                  
+            '284025-284025', # HLT_IsoMu22_eta2p1_v4, 12.193/pb                                                                                                                                  
+            '284029-284029', # HLT_IsoMu22_eta2p1_v4-29.941/pb                                                                                                                                  
+            '284035-284044', # HLT_IsoMu22_eta2p1_v4, 303.58/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoTkMu22_eta2p1----------##   
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoTkMu22_eta2p1"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(22.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '274954-274955', # HLT_IsoTkMu22_eta2p1_v2, 5.735/pb                                                                                                                                 
+            '274968-274971', # HLT_IsoTkMu22_eta2p1_v2, 422.272/pb                                                                                                                               
+            '274998-275001', # HLT_IsoTkMu22_eta2p1_v2, 489.252/pb                                                                                                                               
+            '275059-275059', # HLT_IsoTkMu22_eta2p1_v2, 6.094/pb                                                                                                                                 
+            '275066-275068', # HLT_IsoTkMu22_eta2p1_v2-231.774/pb                                                                                                                               
+            '275073-275074', # HLT_IsoTkMu22_eta2p1_v2, 144.124/pb                                                                                                                               
+            '275124-275125', # HLT_IsoTkMu22_eta2p1_v2-205.394/pb                                                                                                                               
+            '275282-275284', # HLT_IsoTkMu22_eta2p1_v2, 49.295/pb                                                                                                                                
+            '275290-275293', # HLT_IsoTkMu22_eta2p1_v2, 94.338/pb                                                                                                                                
+            '275309-275311', # HLT_IsoTkMu22_eta2p1_v2, 411.084/pb                                                                                                                               
+            '275319-275319', # HLT_IsoTkMu22_eta2p1_v2-24.399/pb                                                                                                                                
+            '275337-275338', # HLT_IsoTkMu22_eta2p1_v2, 143.358/pb                                                                                                                               
+            '275344-275345', # HLT_IsoTkMu22_eta2p1_v2, 109.524/pb                                                                                                                               
+            '275370-275371', # HLT_IsoTkMu22_eta2p1_v2, 145.599/pb                                                                                                                               
+            '275375-275376', # HLT_IsoTkMu22_eta2p1_v2, 528.636/pb                                                                                                                               
+            '275657-275659', # HLT_IsoTkMu22_eta2p1_v3, 80.874/pb                                                                                                                                
+            '275761-275761', # HLT_IsoTkMu22_eta2p1_v3, 1.667/pb                                                                                                                                 
+            '275767-275767', # HLT_IsoTkMu22_eta2p1_v3, 0.714/pb                                                                                                                                 
+            '275772-275774', # HLT_IsoTkMu22_eta2p1_v3, 66.444/pb                                                                                                                                
+            '275776-275778', # HLT_IsoTkMu22_eta2p1_v3, 116.898/pb                                                                                                                               
+            '275782-275782', # HLT_IsoTkMu22_eta2p1_v3, 99.533/pb                                                                                                                                
+            '275832-275837', # HLT_IsoTkMu22_eta2p1_v3, 441.03/pb                                                                                                                                
+            '275847-275847', # HLT_IsoTkMu22_eta2p1_v3, 198.947/pb                                                                                                                               
+            '275886-275886', # HLT_IsoTkMu22_eta2p1_v3, 7.581/pb                                                                                                                                 
+            '275890-275890', # HLT_IsoTkMu22_eta2p1_v3-235.22/pb                                                                                                                                
+            '275911-275913', # HLT_IsoTkMu22_eta2p1_v3-201.741/pb                                                                                                                               
+            '275918-275918', # HLT_IsoTkMu22_eta2p1_v3, 49.71/pb                                                                                                                                 
+            '275920-275921', # HLT_IsoTkMu22_eta2p1_v3, 62.257/pb      
+            '275923-275923', # HLT_IsoTkMu22_eta2p1_v3, 14.5/pb                                                                                                                                  
+            '275931-275931', # HLT_IsoTkMu22_eta2p1_v3, 10.418/pb                                                                                                                                
+            '275963-275963', # HLT_IsoTkMu22_eta2p1_v3, 19.553/pb                                                                                                                                
+            '276092-276092', # HLT_IsoTkMu22_eta2p1_v3, 14.768/pb                                                                                                                                
+            '276097-276097', # HLT_IsoTkMu22_eta2p1_v3, 99.405/pb                                                                                                                                
+            '276242-276244', # HLT_IsoTkMu22_eta2p1_v3, 479.052/pb                                                                                                                               
+            '276282-276283', # HLT_IsoTkMu22_eta2p1_v3, 372.59/pb                                                                                                                                
+            '276315-276315', # HLT_IsoTkMu22_eta2p1_v3, 34.051/pb                                                                                                                                
+            '276317-276318', # HLT_IsoTkMu22_eta2p1_v3, 124.306/pb                                                                                                                               
+            '276355-276355', # HLT_IsoTkMu22_eta2p1_v3, 6.205/pb                                                                                                                                 
+            '276361-276361', # HLT_IsoTkMu22_eta2p1_v3, 149.465/pb                                                                                                                               
+            '276363-276363', # HLT_IsoTkMu22_eta2p1_v3-206.376/pb                                                                                                                               
+            '276384-276384', # HLT_IsoTkMu22_eta2p1_v3, 121.517/pb                                                                                                                               
+            '276437-276437', # HLT_IsoTkMu22_eta2p1_v3, 355.688/pb                                                                                                                               
+            '276454-276454', # HLT_IsoTkMu22_eta2p1_v3, 63.924/pb                                                                                                                                
+            '276458-276458', # HLT_IsoTkMu22_eta2p1_v3, 33.169/pb                                                                                                                                
+            '276495-276495', # HLT_IsoTkMu22_eta2p1_v3, 38.062/pb                                                                                                                                
+            '276501-276502', # HLT_IsoTkMu22_eta2p1_v3, 486.891/pb                                                                                                                               
+            '276525-276525', # HLT_IsoTkMu22_eta2p1_v3, 402.663/pb                                                                                                                               
+            '276527-276528', # HLT_IsoTkMu22_eta2p1_v3, 60.758/pb                                                                                                                                
+            '276542-276545', # HLT_IsoTkMu22_eta2p1_v3, 345.204/pb                                                                                                                               
+            '276581-276587', # HLT_IsoTkMu22_eta2p1_v3, 471.493/pb                                                                                                                               
+            '276653-276653', # HLT_IsoTkMu22_eta2p1_v3, 86.12/pb                                                                                                                                 
+            '276655-276655', # HLT_IsoTkMu22_eta2p1_v3, 160.843/pb                                                                                                                               
+            '276659-276659', # HLT_IsoTkMu22_eta2p1_v3-29.939/pb
+            '276775-276776', # HLT_IsoTkMu22_eta2p1_v3, 443.702/pb                                                                                                                               
+            '276794-276794', # HLT_IsoTkMu22_eta2p1_v3, 87.206/pb                                                                                                                                
+            '276807-276808', # HLT_IsoTkMu22_eta2p1_v3, 188.301/pb                                                                                                                               
+            '276810-276811', # HLT_IsoTkMu22_eta2p1_v3, 346.409/pb                                                                                                                               
+            '276831-276831', # HLT_IsoTkMu22_eta2p1_v3, 400.298/pb                                                                                                                               
+            '276834-276834', # HLT_IsoTkMu22_eta2p1_v3, 72.6/pb                                                                                                                                  
+            '276870-276870', # HLT_IsoTkMu22_eta2p1_v3, 526.587/pb                                                                                                                               
+            '276935-276935', # HLT_IsoTkMu22_eta2p1_v3, 169.998/pb                                                                                                                               
+            '276940-276940', # HLT_IsoTkMu22_eta2p1_v3-28.701/pb                                                                                                                                
+            '276946-276948', # HLT_IsoTkMu22_eta2p1_v3, 114.81/pb                                                                                                                                
+            '276950-276950', # HLT_IsoTkMu22_eta2p1_v3, 323.179/pb                                                                                                                               
+            '277069-277073', # HLT_IsoTkMu22_eta2p1_v3, 390.296/pb                                                                                                                               
+            '277076-277076', # HLT_IsoTkMu22_eta2p1_v3, 125.929/pb                                                                                                                               
+            '277087-277087', # HLT_IsoTkMu22_eta2p1_v3, 86.357/pb                                                                                                                                
+            '277094-277094', # HLT_IsoTkMu22_eta2p1_v3, 131.103/pb                                                                                                                               
+            '277096-277096', # HLT_IsoTkMu22_eta2p1_v3, 320.668/pb                                                                                                                               
+            '277112-277112', # HLT_IsoTkMu22_eta2p1_v3, 17.339/pb                                                                                                                                
+            '277126-277127', # HLT_IsoTkMu22_eta2p1_v3, 185.976/pb                                                                                                                               
+            '277148-277148', # HLT_IsoTkMu22_eta2p1_v3, 128.192/pb                                                                                                                               
+            '277166-277166', # HLT_IsoTkMu22_eta2p1_v3, 70.666/pb                                                                                                                                
+            '277168-277168', # HLT_IsoTkMu22_eta2p1_v3, 318.998/pb                                                                                                                               
+            '277180-277180', # HLT_IsoTkMu22_eta2p1_v3, 31.25/pb                                                                                                                                 
+            '277194-277194', # HLT_IsoTkMu22_eta2p1_v3, 367.175/pb                                                                                                                               
+            '277305-277305', # HLT_IsoTkMu22_eta2p1_v3, 154.262/pb                                                                                                                               
+            '277420-277420', # HLT_IsoTkMu22_eta2p1_v3, 60.844/pb
+            '277981-277981', # HLT_IsoTkMu22_eta2p1_v3, 4.601/pb                                                                                                                                 
+            '277991-277992', # HLT_IsoTkMu22_eta2p1_v3-21.692/pb                                                                                                                                
+            '278017-278018', # HLT_IsoTkMu22_eta2p1_v3, 338.894/pb                                                                                                                               
+            '278167-278167', # HLT_IsoTkMu22_eta2p1_v3, 314.532/pb                                                                                                                               
+            '278175-278175', # HLT_IsoTkMu22_eta2p1_v3, 9.045/pb                                                                                                                                 
+            '278193-278193', # HLT_IsoTkMu22_eta2p1_v3, 34.581/pb                                                                                                                                
+            '278239-278240', # HLT_IsoTkMu22_eta2p1_v3, 330.009/pb                                                                                                                               
+            '278273-278274', # HLT_IsoTkMu22_eta2p1_v3-23.87/pb                                                                                                                                 
+            '278288-278290', # HLT_IsoTkMu22_eta2p1_v3, 14.747/pb                                                                                                                                
+            '278308-278308', # HLT_IsoTkMu22_eta2p1_v3, 313.102/pb                                                                                                                               
+            '278310-278310', # HLT_IsoTkMu22_eta2p1_v3, 88.422/pb                                                                                                                                
+            '278315-278315', # HLT_IsoTkMu22_eta2p1_v3, 137.45/pb                                                                                                                                
+            '278345-278346', # HLT_IsoTkMu22_eta2p1_v3, 171.231/pb                                                                                                                               
+            '278349-278349', # HLT_IsoTkMu22_eta2p1_v3, 94.737/pb                                                                                                                                
+            '278366-278366', # HLT_IsoTkMu22_eta2p1_v3, 59.423/pb                                                                                                                                
+            '278406-278406', # HLT_IsoTkMu22_eta2p1_v3-296.962/pb                                                                                                                               
+            '278509-278509', # HLT_IsoTkMu22_eta2p1_v3-273.442/pb                                                                                                                               
+            '278769-278770', # HLT_IsoTkMu22_eta2p1_v3, 170.993/pb                                                                                                                               
+            '278801-278805', # HLT_IsoTkMu22_eta2p1_v3, 137.142/pb                                                                                                                               
+            '278808-278808', # HLT_IsoTkMu22_eta2p1_v3-269.634/pb                                                                                                                               
+            '278820-278820', # HLT_IsoTkMu22_eta2p1_v3-286.511/pb                                                                                                                               
+            '278822-278822', # HLT_IsoTkMu22_eta2p1_v3, 191.158/pb                                                                                                                               
+            '278873-278875', # HLT_IsoTkMu22_eta2p1_v3, 198.657/pb                                                                                                                               
+            '278923-278923', # HLT_IsoTkMu22_eta2p1_v3, 98.543/pb                                                                                                                                
+            '278957-278957', # HLT_IsoTkMu22_eta2p1_v3, 36.164/pb  
+            '278962-278963', # HLT_IsoTkMu22_eta2p1_v3, 113.024/pb                                                                                                                               
+            '278969-278969', # HLT_IsoTkMu22_eta2p1_v3-282.492/pb                                                                                                                               
+            '278975-278976', # HLT_IsoTkMu22_eta2p1_v3, 122.556/pb                                                                                                                               
+            '278986-278986', # HLT_IsoTkMu22_eta2p1_v3, 31.548/pb                                                                                                                                
+            '279024-279024', # HLT_IsoTkMu22_eta2p1_v3, 49.596/pb                                                                                                                                
+            '279029-279029', # HLT_IsoTkMu22_eta2p1_v3, 38.088/pb                                                                                                                                
+            '279071-279071', # HLT_IsoTkMu22_eta2p1_v3-22.581/pb                                                                                                                                
+            '279080-279080', # HLT_IsoTkMu22_eta2p1_v3, 12.773/pb                                                                                                                                
+            '279115-279116', # HLT_IsoTkMu22_eta2p1_v3, 174.938/pb                                                                                                                               
+            '279479-279479', # HLT_IsoTkMu22_eta2p1_v3, 5.927/pb                                                                                                                                 
+            '279588-279588', # HLT_IsoTkMu22_eta2p1_v3-228.517/pb                                                                                                                               
+            '279653-279654', # HLT_IsoTkMu22_eta2p1_v3-283.775/pb                                                                                                                               
+            '279656-279656', # HLT_IsoTkMu22_eta2p1_v3, 5.684/pb                                                                                                                                 
+            '279658-279658', # HLT_IsoTkMu22_eta2p1_v3, 93.394/pb                                                                                                                                
+            '279667-279667', # HLT_IsoTkMu22_eta2p1_v3-208.732/pb                                                                                                                               
+            '279681-279685', # HLT_IsoTkMu22_eta2p1_v3, 74.528/pb                                                                                                                                
+            '279691-279691', # HLT_IsoTkMu22_eta2p1_v3, 9.656/pb                                                                                                                                 
+            '279694-279694', # HLT_IsoTkMu22_eta2p1_v3, 406.418/pb                                                                                                                               
+            '279715-279716', # HLT_IsoTkMu22_eta2p1_v3, 383.763/pb                                                                                                                               
+            '279760-279760', # HLT_IsoTkMu22_eta2p1_v3, 153.502/pb                                                                                                                               
+            '279766-279767', # HLT_IsoTkMu22_eta2p1_v3, 358.144/pb                                                                                                                               
+            '279794-279794', # HLT_IsoTkMu22_eta2p1_v3-223.093/pb                                                                                                                               
+            '279823-279823', # HLT_IsoTkMu22_eta2p1_v3, 81.828/pb                                                                                                                                
+            '279841-279841', # HLT_IsoTkMu22_eta2p1_v3, 380.359/pb                                                                                                                               
+            '279844-279844', # HLT_IsoTkMu22_eta2p1_v3, 56.588/pb 
+            '279887-279887', # HLT_IsoTkMu22_eta2p1_v3, 73.316/pb                                                                                                                                
+            '279931-279931', # HLT_IsoTkMu22_eta2p1_v3, 475.316/pb                                                                                                                               
+            '279966-279966', # HLT_IsoTkMu22_eta2p1_v3, 93.011/pb                                                                                                                                
+            '279975-279975', # HLT_IsoTkMu22_eta2p1_v3-239.011/pb                                                                                                                               
+            '279993-279994', # HLT_IsoTkMu22_eta2p1_v3, 30.455/pb                                                                                                                                
+            '280013-280013', # HLT_IsoTkMu22_eta2p1_v3, 5.636/pb                                                                                                                                 
+            '280015-280018', # HLT_IsoTkMu22_eta2p1_v3, 398.79/pb                                                                                                                                
+            '280020-280020', # HLT_IsoTkMu22_eta2p1_v3, 4.614/pb                                                                                                                                 
+            '280024-280024', # HLT_IsoTkMu22_eta2p1_v3, 41.841/pb                                                                                                                                
+            '280187-280188', # HLT_IsoTkMu22_eta2p1_v3, 74.778/pb                                                                                                                                
+            '280191-280191', # HLT_IsoTkMu22_eta2p1_v3, 178.951/pb                                                                                                                               
+            '280194-280194', # HLT_IsoTkMu22_eta2p1_v3, 36.665/pb                                                                                                                                
+            '280242-280242', # HLT_IsoTkMu22_eta2p1_v3, 147.69/pb                                                                                                                                
+            '280249-280249', # HLT_IsoTkMu22_eta2p1_v3-239.16/pb                                                                                                                                
+            '280251-280251', # HLT_IsoTkMu22_eta2p1_v3, 47.176/pb                                                                                                                                
+            '280327-280327', # HLT_IsoTkMu22_eta2p1_v3, 8.719/pb                                                                                                                                 
+            '280330-280330', # HLT_IsoTkMu22_eta2p1_v3, 185.776/pb                                                                                                                               
+            '280349-280349', # HLT_IsoTkMu22_eta2p1_v3, 104.129/pb                                                                                                                               
+            '280363-280364', # HLT_IsoTkMu22_eta2p1_v3-205.282/pb                                                                                                                               
+            '280383-280385', # HLT_IsoTkMu22_eta2p1_v3, 372.972/pb                                                                                                                               
+            '281613-281613', # HLT_IsoTkMu22_eta2p1_v4, 9.764/pb                                                                                                                                 
+            '281639-281639', # HLT_IsoTkMu22_eta2p1_v4, 18.977/pb                                                                                                                                
+            '281641-281641', # HLT_IsoTkMu22_eta2p1_v4, 39.268/pb                                                                                                                                
+            '281693-281693', # HLT_IsoTkMu22_eta2p1_v4, 376.118/pb                                                                                                                               
+            '281707-281707', # HLT_IsoTkMu22_eta2p1_v4-214.55/pb 
+            '281726-281727', # HLT_IsoTkMu22_eta2p1_v4-251.373/pb                                                                                                                               
+            '281797-281797', # HLT_IsoTkMu22_eta2p1_v4, 397.836/pb                                                                                                                               
+            '281975-281976', # HLT_IsoTkMu22_eta2p1_v4, 393.967/pb                                                                                                                               
+            '282033-282035', # HLT_IsoTkMu22_eta2p1_v4-26.293/pb                                                                                                                                
+            '282037-282037', # HLT_IsoTkMu22_eta2p1_v4, 331.413/pb                                                                                                                               
+            '282092-282092', # HLT_IsoTkMu22_eta2p1_v4-296.762/pb                                                                                                                               
+            '282708-282708', # HLT_IsoTkMu22_eta2p1_v4-2.118/pb                                                                                                                                 
+            '282710-282710', # HLT_IsoTkMu22_eta2p1_v4, 0.346/pb                                                                                                                                 
+            '282712-282712', # HLT_IsoTkMu22_eta2p1_v4, 16.683/pb                                                                                                                                
+            '282730-282735', # HLT_IsoTkMu22_eta2p1_v4, 469.07/pb                                                                                                                                
+            '282800-282800', # HLT_IsoTkMu22_eta2p1_v4, 93.58/pb                                                                                                                                 
+            '282807-282807', # HLT_IsoTkMu22_eta2p1_v4, 70.563/pb                                                                                                                                
+            '282814-282814', # HLT_IsoTkMu22_eta2p1_v4-276.224/pb                                                                                                                               
+            '282842-282842', # HLT_IsoTkMu22_eta2p1_v4-23.509/pb                                                                                                                                
+            '282917-282919', # HLT_IsoTkMu22_eta2p1_v4, 88.074/pb                                                                                                                                
+            '282922-282923', # HLT_IsoTkMu22_eta2p1_v4, 66.001/pb                                                                                                                                
+            '283042-283043', # HLT_IsoTkMu22_eta2p1_v4, 118.119/pb                                                                                                                               
+            '283049-283050', # HLT_IsoTkMu22_eta2p1_v4, 61.072/pb                                                                                                                                
+            '283052-283052', # HLT_IsoTkMu22_eta2p1_v4-28.777/pb                                                                                                                                
+            '283059-283059', # HLT_IsoTkMu22_eta2p1_v4, 98.778/pb                                                                                                                                
+            '283270-283270', # HLT_IsoTkMu22_eta2p1_v4, 381.444/pb                                                                                                                               
+            '283283-283283', # HLT_IsoTkMu22_eta2p1_v4, 197.444/pb                                                                                                                               
+            '283305-283308', # HLT_IsoTkMu22_eta2p1_v4, 338.86/pb                                                                                                                                
+            '283353-283353', # HLT_IsoTkMu22_eta2p1_v4, 191.088/pb                                                                                                                               
+            '283358-283359', # HLT_IsoTkMu22_eta2p1_v4-233.089/pb                                                                                                                               
+            '283407-283408', # HLT_IsoTkMu22_eta2p1_v4, 466.833/pb                                                                                                                               
+            '283416-283416', # HLT_IsoTkMu22_eta2p1_v4-21.628/pb                                                                                                                                
+            '283453-283453', # HLT_IsoTkMu22_eta2p1_v4, 123.278/pb                                                                                                                               
+            '283469-283469', # HLT_IsoTkMu22_eta2p1_v4, 0.031/pb   
+            '283478-283478', # HLT_IsoTkMu22_eta2p1_v4-210.23/pb                                                                                                                                
+            '283548-283548', # HLT_IsoTkMu22_eta2p1_v4-26.451/pb                                                                                                                                
+            '283680-283682', # HLT_IsoTkMu22_eta2p1_v4, 102.814/pb                                                                                                                               
+            '283685-283685', # HLT_IsoTkMu22_eta2p1_v4-20.432/pb                                                                                                                                
+            '283820-283820', # HLT_IsoTkMu22_eta2p1_v4-259.058/pb                                                                                                                               
+            '283830-283830', # HLT_IsoTkMu22_eta2p1_v4, 102.255/pb                                                                                                                               
+            '283834-283835', # HLT_IsoTkMu22_eta2p1_v4-20.323/pb                                                                                                                                
+            '283865-283865', # HLT_IsoTkMu22_eta2p1_v4-264.403/pb                                                                                                                               
+            '283876-283877', # HLT_IsoTkMu22_eta2p1_v4, 409.447/pb                                                                                                                               
+            '283884-283885', # HLT_IsoTkMu22_eta2p1_v4, 392.377/pb                                                                                                                               
+            '283933-283934', # HLT_IsoTkMu22_eta2p1_v4, 309.793/pb                                                                                                                               
+            '283946-283946', # HLT_IsoTkMu22_eta2p1_v4, 300.188/pb                                                                                                                               
+            '283964-283964', # HLT_IsoTkMu22_eta2p1_v4, 58.698/pb                                                                                                                                
+            '284006-284006', # HLT_IsoTkMu22_eta2p1_v4, 57.69/pb                                                                                                                                 
+            '284014-284014', # HLT_IsoTkMu22_eta2p1_v4, 47.826/pb                                                                                                                                
+            '284025-284025', # HLT_IsoTkMu22_eta2p1_v4, 12.193/pb                                                                                                                                
+            '284029-284029', # HLT_IsoTkMu22_eta2p1_v4-29.941/pb                                                                                                                                
+            '284035-284044', # HLT_IsoTkMu22_eta2p1_v4, 303.58/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoMu24----------##   
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu24"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(24.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_IsoMu24_v1, 50.239/pb                                                                                                                                         
+            '273302-273302', # HLT_IsoMu24_v1, 16.319/pb                                                                                                                                         
+            '273402-273406', # HLT_IsoMu24_v1, 13.589/pb                                                                                                                                         
+            '273408-273411', # HLT_IsoMu24_v1, 13.087/pb                                                                                                                                         
+            '273425-273425', # HLT_IsoMu24_v1-26.717/pb                                                                                                                                         
+            '273446-273450', # HLT_IsoMu24_v1, 94.292/pb                                                                                                                                         
+            '273492-273494', # HLT_IsoMu24_v1, 30.924/pb                                                                                                                                         
+            '273502-273503', # HLT_IsoMu24_v1, 72.147/pb                                                                                                                                         
+            '273554-273555', # HLT_IsoMu24_v1, 38.827/pb                                                                                                                                         
+            '273725-273725', # HLT_IsoMu24_v1, 154.653/pb                                                                                                                                        
+            '273728-273728', # HLT_IsoMu24_v1, 4.897/pb                                                                                                                                          
+            '273730-273730', # HLT_IsoMu24_v1, 86.49/pb                                                                                                                                          
+            '274094-274094', # HLT_IsoMu24_v1, 9.735/pb                                                                                                                                          
+            '274146-274146', # HLT_IsoMu24_v1, 5.12/pb                                                                                                                                           
+            '274157-274157', # HLT_IsoMu24_v1, 38.994/pb                                                                                                                                         
+            '274159-274161', # HLT_IsoMu24_v1, 62.883/pb                                                                                                                                         
+            '274172-274172', # HLT_IsoMu24_v1, 5.249/pb                                                                                                                                          
+            '274198-274200', # HLT_IsoMu24_v1, 135.972/pb                                                                                                                                        
+            '274240-274241', # HLT_IsoMu24_v1, 134.472/pb                                                                                                                                        
+            '274244-274244', # HLT_IsoMu24_v1, 56.348/pb                                                                                                                                         
+            '274250-274251', # HLT_IsoMu24_v1, 159.993/pb                                                                                                                                        
+            '274283-274284', # HLT_IsoMu24_v1, 30.266/pb                                                                                                                                         
+            '274286-274286', # HLT_IsoMu24_v1-21.668/pb                                                                                                                                         
+            '274314-274317', # HLT_IsoMu24_v1-206.7/pb                                                                                                                                          
+            '274319-274319', # HLT_IsoMu24_v1-27.302/pb                                                                                                                                         
+            '274335-274339', # HLT_IsoMu24_v1-246.003/pb                                                                                                                                        
+            '274344-274345', # HLT_IsoMu24_v1, 87.68/pb                                                                                                                                          
+            '274382-274382', # HLT_IsoMu24_v1, 7.428/pb                                                                                                                                          
+            '274387-274388', # HLT_IsoMu24_v1, 312.374/pb   
+            '274420-274422', # HLT_IsoMu24_v1, 359.125/pb                                                                                                                                        
+            '274440-274442', # HLT_IsoMu24_v1-226.466/pb                                                                                                                                        
+            '274954-274955', # HLT_IsoMu24_v2, 5.735/pb                                                                                                                                          
+            '274968-274971', # HLT_IsoMu24_v2, 422.272/pb                                                                                                                                        
+            '274998-275001', # HLT_IsoMu24_v2, 489.252/pb                                                                                                                                        
+            '275059-275059', # HLT_IsoMu24_v2, 6.094/pb                                                                                                                                          
+            '275066-275068', # HLT_IsoMu24_v2-231.774/pb                                                                                                                                        
+            '275073-275074', # HLT_IsoMu24_v2, 144.124/pb                                                                                                                                        
+            '275124-275125', # HLT_IsoMu24_v2-205.394/pb                                                                                                                                        
+            '275282-275284', # HLT_IsoMu24_v2, 49.295/pb                                                                                                                                         
+            '275290-275293', # HLT_IsoMu24_v2, 94.338/pb                                                                                                                                         
+            '275309-275311', # HLT_IsoMu24_v2, 411.084/pb                                                                                                                                        
+            '275319-275319', # HLT_IsoMu24_v2-24.399/pb                                                                                                                                         
+            '275337-275338', # HLT_IsoMu24_v2, 143.358/pb                                                                                                                                        
+            '275344-275345', # HLT_IsoMu24_v2, 109.524/pb                                                                                                                                        
+            '275370-275371', # HLT_IsoMu24_v2, 145.599/pb                                                                                                                                        
+            '275375-275376', # HLT_IsoMu24_v2, 528.636/pb                                                                                                                                        
+            '275657-275659', # HLT_IsoMu24_v2, 80.874/pb                                                                                                                                         
+            '275761-275761', # HLT_IsoMu24_v2, 1.667/pb                                                                                                                                          
+            '275767-275767', # HLT_IsoMu24_v2, 0.714/pb                                                                                                                                          
+            '275772-275774', # HLT_IsoMu24_v2, 66.444/pb                                                                                                                                         
+            '275776-275778', # HLT_IsoMu24_v2, 116.898/pb                                                                                                                                        
+            '275782-275782', # HLT_IsoMu24_v2, 99.533/pb                                                                                                                                         
+            '275832-275837', # HLT_IsoMu24_v2, 441.03/pb                                                                                                                                         
+            '275847-275847', # HLT_IsoMu24_v2, 198.947/pb  
+            '275886-275886', # HLT_IsoMu24_v2, 7.581/pb                                                                                                                                          
+            '275890-275890', # HLT_IsoMu24_v2-235.22/pb                                                                                                                                         
+            '275911-275913', # HLT_IsoMu24_v2-201.741/pb                                                                                                                                        
+            '275918-275918', # HLT_IsoMu24_v2, 49.71/pb                                                                                                                                          
+            '275920-275921', # HLT_IsoMu24_v2, 62.257/pb                                                                                                                                         
+            '275923-275923', # HLT_IsoMu24_v2, 14.5/pb                                                                                                                                           
+            '275931-275931', # HLT_IsoMu24_v2, 10.418/pb                                                                                                                                         
+            '275963-275963', # HLT_IsoMu24_v2, 19.553/pb                                                                                                                                         
+            '276092-276092', # HLT_IsoMu24_v2, 14.768/pb                                                                                                                                         
+            '276097-276097', # HLT_IsoMu24_v2, 99.405/pb                                                                                                                                         
+            '276242-276244', # HLT_IsoMu24_v2, 479.052/pb                                                                                                                                        
+            '276282-276283', # HLT_IsoMu24_v2, 372.59/pb                                                                                                                                         
+            '276315-276315', # HLT_IsoMu24_v2, 34.051/pb                                                                                                                                         
+            '276317-276318', # HLT_IsoMu24_v2, 124.306/pb                                                                                                                                        
+            '276355-276355', # HLT_IsoMu24_v2, 6.205/pb                                                                                                                                          
+            '276361-276361', # HLT_IsoMu24_v2, 149.465/pb                                                                                                                                        
+            '276363-276363', # HLT_IsoMu24_v2-206.376/pb                                                                                                                                        
+            '276384-276384', # HLT_IsoMu24_v2, 121.517/pb                                                                                                                                        
+            '276437-276437', # HLT_IsoMu24_v2, 355.688/pb                                                                                                                                        
+            '276454-276454', # HLT_IsoMu24_v2, 63.924/pb                                                                                                                                         
+            '276458-276458', # HLT_IsoMu24_v2, 33.169/pb                                                                                                                                         
+            '276495-276495', # HLT_IsoMu24_v2, 38.062/pb                                                                                                                                         
+            '276501-276502', # HLT_IsoMu24_v2, 486.891/pb                                                                                                                                        
+            '276525-276525', # HLT_IsoMu24_v2, 402.663/pb                                                                                                                                        
+            '276527-276528', # HLT_IsoMu24_v2, 60.758/pb
+            '276542-276545', # HLT_IsoMu24_v2, 345.204/pb                                                                                                                                        
+            '276581-276587', # HLT_IsoMu24_v2, 471.493/pb                                                                                                                                        
+            '276653-276653', # HLT_IsoMu24_v2, 86.12/pb                                                                                                                                          
+            '276655-276655', # HLT_IsoMu24_v2, 160.843/pb                                                                                                                                        
+            '276659-276659', # HLT_IsoMu24_v2-29.939/pb                                                                                                                                         
+            '276775-276776', # HLT_IsoMu24_v2, 443.702/pb                                                                                                                                        
+            '276794-276794', # HLT_IsoMu24_v2, 87.206/pb                                                                                                                                         
+            '276807-276808', # HLT_IsoMu24_v2, 188.301/pb                                                                                                                                        
+            '276810-276811', # HLT_IsoMu24_v2, 346.409/pb                                                                                                                                        
+            '276831-276831', # HLT_IsoMu24_v2, 400.298/pb                                                                                                                                        
+            '276834-276834', # HLT_IsoMu24_v2, 72.6/pb                                                                                                                                           
+            '276870-276870', # HLT_IsoMu24_v2, 526.587/pb                                                                                                                                        
+            '276935-276935', # HLT_IsoMu24_v2, 169.998/pb                                                                                                                                        
+            '276940-276940', # HLT_IsoMu24_v2-28.701/pb                                                                                                                                         
+            '276946-276948', # HLT_IsoMu24_v2, 114.81/pb                                                                                                                                         
+            '276950-276950', # HLT_IsoMu24_v2, 323.179/pb                                                                                                                                        
+            '277069-277073', # HLT_IsoMu24_v2, 390.296/pb                                                                                                                                        
+            '277076-277076', # HLT_IsoMu24_v2, 125.929/pb                                                                                                                                        
+            '277087-277087', # HLT_IsoMu24_v2, 86.357/pb                                                                                                                                         
+            '277094-277094', # HLT_IsoMu24_v2, 131.103/pb                                                                                                                                        
+            '277096-277096', # HLT_IsoMu24_v2, 320.668/pb                                                                                                                                        
+            '277112-277112', # HLT_IsoMu24_v2, 17.339/pb                                                                                                                                         
+            '277126-277127', # HLT_IsoMu24_v2, 185.976/pb                                                                                                                                        
+            '277148-277148', # HLT_IsoMu24_v2, 128.192/pb                                                                                                                                        
+            '277166-277166', # HLT_IsoMu24_v2, 70.666/pb
+            '277168-277168', # HLT_IsoMu24_v2, 318.998/pb                                                                                                                                        
+            '277180-277180', # HLT_IsoMu24_v2, 31.25/pb                                                                                                                                          
+            '277194-277194', # HLT_IsoMu24_v2, 367.175/pb                                                                                                                                        
+            '277305-277305', # HLT_IsoMu24_v2, 154.262/pb                                                                                                                                        
+            '277420-277420', # HLT_IsoMu24_v2, 60.844/pb                                                                                                                                         
+            '277981-277981', # HLT_IsoMu24_v2, 4.601/pb                                                                                                                                          
+            '277991-277992', # HLT_IsoMu24_v2-21.692/pb                                                                                                                                         
+            '278017-278018', # HLT_IsoMu24_v2, 338.894/pb                                                                                                                                        
+            '278167-278167', # HLT_IsoMu24_v2, 314.532/pb                                                                                                                                        
+            '278175-278175', # HLT_IsoMu24_v2, 9.045/pb                                                                                                                                          
+            '278193-278193', # HLT_IsoMu24_v2, 34.581/pb                                                                                                                                         
+            '278239-278240', # HLT_IsoMu24_v2, 330.009/pb                                                                                                                                        
+            '278273-278274', # HLT_IsoMu24_v2-23.87/pb                                                                                                                                          
+            '278288-278290', # HLT_IsoMu24_v2, 14.747/pb                                                                                                                                         
+            '278308-278308', # HLT_IsoMu24_v2, 313.102/pb                                                                                                                                        
+            '278310-278310', # HLT_IsoMu24_v2, 88.422/pb                                                                                                                                         
+            '278315-278315', # HLT_IsoMu24_v2, 137.45/pb                                                                                                                                         
+            '278345-278346', # HLT_IsoMu24_v2, 171.231/pb                                                                                                                                        
+            '278349-278349', # HLT_IsoMu24_v2, 94.737/pb                                                                                                                                         
+            '278366-278366', # HLT_IsoMu24_v2, 59.423/pb                                                                                                                                         
+            '278406-278406', # HLT_IsoMu24_v2-296.962/pb                                                                                                                                        
+            '278509-278509', # HLT_IsoMu24_v2-273.442/pb                                                                                                                                        
+            '278769-278770', # HLT_IsoMu24_v2, 170.993/pb                                                                                                                                        
+            '278801-278805', # HLT_IsoMu24_v2, 137.142/pb                                                                                                                                        
+            '278808-278808', # HLT_IsoMu24_v2-269.634/pb
+            '278820-278820', # HLT_IsoMu24_v2-286.511/pb                                                                                                                                        
+            '278822-278822', # HLT_IsoMu24_v2, 191.158/pb                                                                                                                                        
+            '278873-278875', # HLT_IsoMu24_v2, 198.657/pb                                                                                                                                        
+            '278923-278923', # HLT_IsoMu24_v2, 98.543/pb                                                                                                                                         
+            '278957-278957', # HLT_IsoMu24_v2, 36.164/pb                                                                                                                                         
+            '278962-278963', # HLT_IsoMu24_v2, 113.024/pb                                                                                                                                        
+            '278969-278969', # HLT_IsoMu24_v2-282.492/pb                                                                                                                                        
+            '278975-278976', # HLT_IsoMu24_v2, 122.556/pb                                                                                                                                        
+            '278986-278986', # HLT_IsoMu24_v2, 31.548/pb                                                                                                                                         
+            '279024-279024', # HLT_IsoMu24_v2, 49.596/pb                                                                                                                                         
+            '279029-279029', # HLT_IsoMu24_v2, 38.088/pb                                                                                                                                         
+            '279071-279071', # HLT_IsoMu24_v2-22.581/pb                                                                                                                                         
+            '279080-279080', # HLT_IsoMu24_v2, 12.773/pb                                                                                                                                         
+            '279115-279116', # HLT_IsoMu24_v2, 174.938/pb                                                                                                                                        
+            '279479-279479', # HLT_IsoMu24_v2, 5.927/pb                                                                                                                                          
+            '279588-279588', # HLT_IsoMu24_v2-228.517/pb                                                                                                                                        
+            '279653-279654', # HLT_IsoMu24_v2-283.775/pb                                                                                                                                        
+            '279656-279656', # HLT_IsoMu24_v2, 5.684/pb                                                                                                                                          
+            '279658-279658', # HLT_IsoMu24_v2, 93.394/pb                                                                                                                                         
+            '279667-279667', # HLT_IsoMu24_v2-208.732/pb                                                                                                                                        
+            '279681-279685', # HLT_IsoMu24_v2, 74.528/pb                                                                                                                                         
+            '279691-279691', # HLT_IsoMu24_v2, 9.656/pb                                                                                                                                          
+            '279694-279694', # HLT_IsoMu24_v2, 406.418/pb                                                                                                                                        
+            '279715-279716', # HLT_IsoMu24_v2, 383.763/pb                                                                                                                                        
+            '279760-279760', # HLT_IsoMu24_v2, 153.502/pb
+            '279766-279767', # HLT_IsoMu24_v2, 358.144/pb                                                                                                                                        
+            '279794-279794', # HLT_IsoMu24_v2-223.093/pb                                                                                                                                        
+            '279823-279823', # HLT_IsoMu24_v2, 81.828/pb                                                                                                                                         
+            '279841-279841', # HLT_IsoMu24_v2, 380.359/pb                                                                                                                                        
+            '279844-279844', # HLT_IsoMu24_v2, 56.588/pb                                                                                                                                         
+            '279887-279887', # HLT_IsoMu24_v2, 73.316/pb                                                                                                                                         
+            '279931-279931', # HLT_IsoMu24_v2, 475.316/pb                                                                                                                                        
+            '279966-279966', # HLT_IsoMu24_v2, 93.011/pb                                                                                                                                         
+            '279975-279975', # HLT_IsoMu24_v2-239.011/pb                                                                                                                                        
+            '279993-279994', # HLT_IsoMu24_v2, 30.455/pb                                                                                                                                         
+            '280013-280013', # HLT_IsoMu24_v2, 5.636/pb                                                                                                                                          
+            '280015-280018', # HLT_IsoMu24_v2, 398.79/pb                                                                                                                                         
+            '280020-280020', # HLT_IsoMu24_v2, 4.614/pb                                                                                                                                          
+            '280024-280024', # HLT_IsoMu24_v2, 41.841/pb                                                                                                                                         
+            '280187-280188', # HLT_IsoMu24_v2, 74.778/pb                                                                                                                                         
+            '280191-280191', # HLT_IsoMu24_v2, 178.951/pb                                                                                                                                        
+            '280194-280194', # HLT_IsoMu24_v2, 36.665/pb                                                                                                                                         
+            '280242-280242', # HLT_IsoMu24_v2, 147.69/pb                                                                                                                                         
+            '280249-280249', # HLT_IsoMu24_v2-239.16/pb                                                                                                                                         
+            '280251-280251', # HLT_IsoMu24_v2, 47.176/pb                                                                                                                                         
+            '280327-280327', # HLT_IsoMu24_v2, 8.719/pb                                                                                                                                          
+            '280330-280330', # HLT_IsoMu24_v2, 185.776/pb                                                                                                                                        
+            '280349-280349', # HLT_IsoMu24_v2, 104.129/pb                                                                                                                                        
+            '280363-280364', # HLT_IsoMu24_v2-205.282/pb                                                                                                                                        
+            '280383-280385', # HLT_IsoMu24_v2, 372.972/pb
+            '281613-281613', # HLT_IsoMu24_v4, 9.764/pb                                                                                                                                          
+            '281639-281639', # HLT_IsoMu24_v4, 18.977/pb                                                                                                                                         
+            '281641-281641', # HLT_IsoMu24_v4, 39.268/pb                                                                                                                                         
+            '281693-281693', # HLT_IsoMu24_v4, 376.118/pb                                                                                                                                        
+            '281707-281707', # HLT_IsoMu24_v4-214.55/pb                                                                                                                                         
+            '281726-281727', # HLT_IsoMu24_v4-251.373/pb                                                                                                                                        
+            '281797-281797', # HLT_IsoMu24_v4, 397.836/pb                                                                                                                                        
+            '281975-281976', # HLT_IsoMu24_v4, 393.967/pb                                                                                                                                        
+            '282033-282035', # HLT_IsoMu24_v4-26.293/pb                                                                                                                                         
+            '282037-282037', # HLT_IsoMu24_v4, 331.413/pb                                                                                                                                        
+            '282092-282092', # HLT_IsoMu24_v4-296.762/pb                                                                                                                                        
+            '282708-282708', # HLT_IsoMu24_v4-2.118/pb                                                                                                                                          
+            '282710-282710', # HLT_IsoMu24_v4, 0.346/pb                                                                                                                                          
+            '282712-282712', # HLT_IsoMu24_v4, 16.683/pb                                                                                                                                         
+            '282730-282735', # HLT_IsoMu24_v4, 469.07/pb                                                                                                                                         
+            '282800-282800', # HLT_IsoMu24_v4, 93.58/pb                                                                                                                                          
+            '282807-282807', # HLT_IsoMu24_v4, 70.563/pb                                                                                                                                         
+            '282814-282814', # HLT_IsoMu24_v4-276.224/pb                                                                                                                                        
+            '282842-282842', # HLT_IsoMu24_v4-23.509/pb                                                                                                                                         
+            '282917-282919', # HLT_IsoMu24_v4, 88.074/pb                                                                                                                                         
+            '282922-282923', # HLT_IsoMu24_v4, 66.001/pb                                                                                                                                         
+            '283042-283043', # HLT_IsoMu24_v4, 118.119/pb                                                                                                                                        
+            '283049-283050', # HLT_IsoMu24_v4, 61.072/pb                                                                                                                                         
+            '283052-283052', # HLT_IsoMu24_v4-28.777/pb                                                                                                                                         
+            '283059-283059', # HLT_IsoMu24_v4, 98.778/pb
+            '283270-283270', # HLT_IsoMu24_v4, 381.444/pb                                                                                                                                        
+            '283283-283283', # HLT_IsoMu24_v4, 197.444/pb                                                                                                                                        
+            '283305-283308', # HLT_IsoMu24_v4, 338.86/pb                                                                                                                                         
+            '283353-283353', # HLT_IsoMu24_v4, 191.088/pb                                                                                                                                        
+            '283358-283359', # HLT_IsoMu24_v4-233.089/pb                                                                                                                                        
+            '283407-283408', # HLT_IsoMu24_v4, 466.833/pb                                                                                                                                        
+            '283416-283416', # HLT_IsoMu24_v4-21.628/pb                                                                                                                                         
+            '283453-283453', # HLT_IsoMu24_v4, 123.278/pb                                                                                                                                        
+            '283469-283469', # HLT_IsoMu24_v4, 0.031/pb                                                                                                                                          
+            '283478-283478', # HLT_IsoMu24_v4-210.23/pb                                                                                                                                         
+            '283548-283548', # HLT_IsoMu24_v4-26.451/pb                                                                                                                                         
+            '283680-283682', # HLT_IsoMu24_v4, 102.814/pb                                                                                                                                        
+            '283685-283685', # HLT_IsoMu24_v4-20.432/pb                                                                                                                                         
+            '283820-283820', # HLT_IsoMu24_v4-259.058/pb                                                                                                                                        
+            '283830-283830', # HLT_IsoMu24_v4, 102.255/pb                                                                                                                                        
+            '283834-283835', # HLT_IsoMu24_v4-20.323/pb                                                                                                                                         
+            '283865-283865', # HLT_IsoMu24_v4-264.403/pb                                                                                                                                        
+            '283876-283877', # HLT_IsoMu24_v4, 409.447/pb                                                                                                                                        
+            '283884-283885', # HLT_IsoMu24_v4, 392.377/pb                                                                                                                                        
+            '283933-283934', # HLT_IsoMu24_v4, 309.793/pb                                                                                                                                        
+            '283946-283946', # HLT_IsoMu24_v4, 300.188/pb                                                                                                                                        
+            '283964-283964', # HLT_IsoMu24_v4, 58.698/pb                                                                                                                                         
+            '284006-284006', # HLT_IsoMu24_v4, 57.69/pb                                                                                                                                          
+            '284014-284014', # HLT_IsoMu24_v4, 47.826/pb                                                                                                                                         
+            '284025-284025', # HLT_IsoMu24_v4, 12.193/pb  
+            '284029-284029', # HLT_IsoMu24_v4-29.941/pb                                                                                                                                         
+            '284035-284044', # HLT_IsoMu24_v4, 303.58/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoTkMu24----------##   
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoTkMu24"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(24.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_IsoTkMu24_v1, 50.239/pb                                                                                                                                       
+            '273302-273302', # HLT_IsoTkMu24_v1, 16.319/pb                                                                                                                                       
+            '273402-273406', # HLT_IsoTkMu24_v1, 13.589/pb                                                                                                                                       
+            '273408-273411', # HLT_IsoTkMu24_v1, 13.087/pb                                                                                                                                       
+            '273425-273425', # HLT_IsoTkMu24_v1-26.717/pb                                                                                                                                       
+            '273446-273450', # HLT_IsoTkMu24_v1, 94.292/pb                                                                                                                                       
+            '273492-273494', # HLT_IsoTkMu24_v1, 30.924/pb                                                                                                                                       
+            '273502-273503', # HLT_IsoTkMu24_v1, 72.147/pb                                                                                                                                       
+            '273554-273555', # HLT_IsoTkMu24_v1, 38.827/pb                                                                                                                                       
+            '273725-273725', # HLT_IsoTkMu24_v1, 154.653/pb                                                                                                                                      
+            '273728-273728', # HLT_IsoTkMu24_v1, 4.897/pb                                                                                                                                        
+            '273730-273730', # HLT_IsoTkMu24_v1, 86.49/pb                                                                                                                                        
+            '274094-274094', # HLT_IsoTkMu24_v1, 9.735/pb                                                                                                                                        
+            '274146-274146', # HLT_IsoTkMu24_v1, 5.12/pb                                                                                                                                         
+            '274157-274157', # HLT_IsoTkMu24_v1, 38.994/pb                                                                                                                                       
+            '274159-274161', # HLT_IsoTkMu24_v1, 62.883/pb                                                                                                                                       
+            '274172-274172', # HLT_IsoTkMu24_v1, 5.249/pb                                                                                                                                        
+            '274198-274200', # HLT_IsoTkMu24_v1, 135.972/pb                                                                                                                                      
+            '274240-274241', # HLT_IsoTkMu24_v1, 134.472/pb                                                                                                                                      
+            '274244-274244', # HLT_IsoTkMu24_v1, 56.348/pb                                                                                                                                       
+            '274250-274251', # HLT_IsoTkMu24_v1, 159.993/pb                                                                                                                                      
+            '274283-274284', # HLT_IsoTkMu24_v1, 30.266/pb                                                                                                                                       
+            '274286-274286', # HLT_IsoTkMu24_v1-21.668/pb                                                                                                                                       
+            '274314-274317', # HLT_IsoTkMu24_v1-206.7/pb                                                                                                                                        
+            '274319-274319', # HLT_IsoTkMu24_v1-27.302/pb                                                                                                                                       
+            '274335-274339', # HLT_IsoTkMu24_v1-246.003/pb                                                                                                                                      
+            '274344-274345', # HLT_IsoTkMu24_v1, 87.68/pb                                                                                                                                        
+            '274382-274382', # HLT_IsoTkMu24_v1, 7.428/pb                                                                                                                                        
+            '274387-274388', # HLT_IsoTkMu24_v1, 312.374/pb                                                                                                                                      
+            '274420-274422', # HLT_IsoTkMu24_v1, 359.125/pb                                                                                                                                      
+            '274440-274442', # HLT_IsoTkMu24_v1-226.466/pb                                                                                                                                      
+            '274954-274955', # HLT_IsoTkMu24_v2, 5.735/pb                                                                                                                                        
+            '274968-274971', # HLT_IsoTkMu24_v2, 422.272/pb                                                                                                                                      
+            '274998-275001', # HLT_IsoTkMu24_v2, 489.252/pb                                                                                                                                      
+            '275059-275059', # HLT_IsoTkMu24_v2, 6.094/pb                                                                                                                                        
+            '275066-275068', # HLT_IsoTkMu24_v2-231.774/pb                                                                                                                                      
+            '275073-275074', # HLT_IsoTkMu24_v2, 144.124/pb                                                                                                                                      
+            '275124-275125', # HLT_IsoTkMu24_v2-205.394/pb                                                                                                                                      
+            '275282-275284', # HLT_IsoTkMu24_v2, 49.295/pb                                                                                                                                       
+            '275290-275293', # HLT_IsoTkMu24_v2, 94.338/pb                                                                                                                                       
+            '275309-275311', # HLT_IsoTkMu24_v2, 411.084/pb   
+            '275319-275319', # HLT_IsoTkMu24_v2-24.399/pb                                                                                                                                       
+            '275337-275338', # HLT_IsoTkMu24_v2, 143.358/pb                                                                                                                                      
+            '275344-275345', # HLT_IsoTkMu24_v2, 109.524/pb                                                                                                                                      
+            '275370-275371', # HLT_IsoTkMu24_v2, 145.599/pb                                                                                                                                      
+            '275375-275376', # HLT_IsoTkMu24_v2, 528.636/pb                                                                                                                                      
+            '275657-275659', # HLT_IsoTkMu24_v3, 80.874/pb                                                                                                                                       
+            '275761-275761', # HLT_IsoTkMu24_v3, 1.667/pb                                                                                                                                        
+            '275767-275767', # HLT_IsoTkMu24_v3, 0.714/pb                                                                                                                                        
+            '275772-275774', # HLT_IsoTkMu24_v3, 66.444/pb                                                                                                                                       
+            '275776-275778', # HLT_IsoTkMu24_v3, 116.898/pb                                                                                                                                      
+            '275782-275782', # HLT_IsoTkMu24_v3, 99.533/pb                                                                                                                                       
+            '275832-275837', # HLT_IsoTkMu24_v3, 441.03/pb                                                                                                                                       
+            '275847-275847', # HLT_IsoTkMu24_v3, 198.947/pb                                                                                                                                      
+            '275886-275886', # HLT_IsoTkMu24_v3, 7.581/pb                                                                                                                                        
+            '275890-275890', # HLT_IsoTkMu24_v3-235.22/pb                                                                                                                                       
+            '275911-275913', # HLT_IsoTkMu24_v3-201.741/pb                                                                                                                                      
+            '275918-275918', # HLT_IsoTkMu24_v3, 49.71/pb                                                                                                                                        
+            '275920-275921', # HLT_IsoTkMu24_v3, 62.257/pb                                                                                                                                       
+            '275923-275923', # HLT_IsoTkMu24_v3, 14.5/pb                                                                                                                                         
+            '275931-275931', # HLT_IsoTkMu24_v3, 10.418/pb                                                                                                                                       
+            '275963-275963', # HLT_IsoTkMu24_v3, 19.553/pb                                                                                                                                       
+            '276092-276092', # HLT_IsoTkMu24_v3, 14.768/pb                                                                                                                                       
+            '276097-276097', # HLT_IsoTkMu24_v3, 99.405/pb                                                                                                                                       
+            '276242-276244', # HLT_IsoTkMu24_v3, 479.052/pb                                                                                                                                      
+            '276282-276283', # HLT_IsoTkMu24_v3, 372.59/pb   
+            '276315-276315', # HLT_IsoTkMu24_v3, 34.051/pb                                                                                                                                       
+            '276317-276318', # HLT_IsoTkMu24_v3, 124.306/pb                                                                                                                                      
+            '276355-276355', # HLT_IsoTkMu24_v3, 6.205/pb                                                                                                                                        
+            '276361-276361', # HLT_IsoTkMu24_v3, 149.465/pb                                                                                                                                      
+            '276363-276363', # HLT_IsoTkMu24_v3-206.376/pb                                                                                                                                      
+            '276384-276384', # HLT_IsoTkMu24_v3, 121.517/pb                                                                                                                                      
+            '276437-276437', # HLT_IsoTkMu24_v3, 355.688/pb                                                                                                                                      
+            '276454-276454', # HLT_IsoTkMu24_v3, 63.924/pb                                                                                                                                       
+            '276458-276458', # HLT_IsoTkMu24_v3, 33.169/pb                                                                                                                                       
+            '276495-276495', # HLT_IsoTkMu24_v3, 38.062/pb                                                                                                                                       
+            '276501-276502', # HLT_IsoTkMu24_v3, 486.891/pb                                                                                                                                      
+            '276525-276525', # HLT_IsoTkMu24_v3, 402.663/pb                                                                                                                                      
+            '276527-276528', # HLT_IsoTkMu24_v3, 60.758/pb                                                                                                                                       
+            '276542-276545', # HLT_IsoTkMu24_v3, 345.204/pb                                                                                                                                      
+            '276581-276587', # HLT_IsoTkMu24_v3, 471.493/pb                                                                                                                                      
+            '276653-276653', # HLT_IsoTkMu24_v3, 86.12/pb                                                                                                                                        
+            '276655-276655', # HLT_IsoTkMu24_v3, 160.843/pb                                                                                                                                      
+            '276659-276659', # HLT_IsoTkMu24_v3-29.939/pb                                                                                                                                       
+            '276775-276776', # HLT_IsoTkMu24_v3, 443.702/pb                                                                                                                                      
+            '276794-276794', # HLT_IsoTkMu24_v3, 87.206/pb                                                                                                                                       
+            '276807-276808', # HLT_IsoTkMu24_v3, 188.301/pb                                                                                                                                      
+            '276810-276811', # HLT_IsoTkMu24_v3, 346.409/pb                                                                                                                                      
+            '276831-276831', # HLT_IsoTkMu24_v3, 400.298/pb                                                                                                                                      
+            '276834-276834', # HLT_IsoTkMu24_v3, 72.6/pb                                                                                                                                         
+            '276870-276870', # HLT_IsoTkMu24_v3, 526.587/pb  
+            '276935-276935', # HLT_IsoTkMu24_v3, 169.998/pb                                                                                                                                      
+            '276940-276940', # HLT_IsoTkMu24_v3-28.701/pb                                                                                                                                       
+            '276946-276948', # HLT_IsoTkMu24_v3, 114.81/pb                                                                                                                                       
+            '276950-276950', # HLT_IsoTkMu24_v3, 323.179/pb                                                                                                                                      
+            '277069-277073', # HLT_IsoTkMu24_v3, 390.296/pb                                                                                                                                      
+            '277076-277076', # HLT_IsoTkMu24_v3, 125.929/pb                                                                                                                                      
+            '277087-277087', # HLT_IsoTkMu24_v3, 86.357/pb                                                                                                                                       
+            '277094-277094', # HLT_IsoTkMu24_v3, 131.103/pb                                                                                                                                      
+            '277096-277096', # HLT_IsoTkMu24_v3, 320.668/pb                                                                                                                                      
+            '277112-277112', # HLT_IsoTkMu24_v3, 17.339/pb                                                                                                                                       
+            '277126-277127', # HLT_IsoTkMu24_v3, 185.976/pb                                                                                                                                      
+            '277148-277148', # HLT_IsoTkMu24_v3, 128.192/pb                                                                                                                                      
+            '277166-277166', # HLT_IsoTkMu24_v3, 70.666/pb                                                                                                                                       
+            '277168-277168', # HLT_IsoTkMu24_v3, 318.998/pb                                                                                                                                      
+            '277180-277180', # HLT_IsoTkMu24_v3, 31.25/pb                                                                                                                                        
+            '277194-277194', # HLT_IsoTkMu24_v3, 367.175/pb                                                                                                                                      
+            '277305-277305', # HLT_IsoTkMu24_v3, 154.262/pb                                                                                                                                      
+            '277420-277420', # HLT_IsoTkMu24_v3, 60.844/pb                                                                                                                                       
+            '277981-277981', # HLT_IsoTkMu24_v3, 4.601/pb                                                                                                                                        
+            '277991-277992', # HLT_IsoTkMu24_v3-21.692/pb                                                                                                                                       
+            '278017-278018', # HLT_IsoTkMu24_v3, 338.894/pb                                                                                                                                      
+            '278167-278167', # HLT_IsoTkMu24_v3, 314.532/pb                                                                                                                                      
+            '278175-278175', # HLT_IsoTkMu24_v3, 9.045/pb                                                                                                                                        
+            '278193-278193', # HLT_IsoTkMu24_v3, 34.581/pb                                                                                                                                       
+            '278239-278240', # HLT_IsoTkMu24_v3, 330.009/pb 
+            '278273-278274', # HLT_IsoTkMu24_v3-23.87/pb                                                                                                                                        
+            '278288-278290', # HLT_IsoTkMu24_v3, 14.747/pb                                                                                                                                       
+            '278308-278308', # HLT_IsoTkMu24_v3, 313.102/pb                                                                                                                                      
+            '278310-278310', # HLT_IsoTkMu24_v3, 88.422/pb                                                                                                                                       
+            '278315-278315', # HLT_IsoTkMu24_v3, 137.45/pb                                                                                                                                       
+            '278345-278346', # HLT_IsoTkMu24_v3, 171.231/pb                                                                                                                                      
+            '278349-278349', # HLT_IsoTkMu24_v3, 94.737/pb                                                                                                                                       
+            '278366-278366', # HLT_IsoTkMu24_v3, 59.423/pb                                                                                                                                       
+            '278406-278406', # HLT_IsoTkMu24_v3-296.962/pb                                                                                                                                      
+            '278509-278509', # HLT_IsoTkMu24_v3-273.442/pb                                                                                                                                      
+            '278769-278770', # HLT_IsoTkMu24_v3, 170.993/pb                                                                                                                                      
+            '278801-278805', # HLT_IsoTkMu24_v3, 137.142/pb                                                                                                                                      
+            '278808-278808', # HLT_IsoTkMu24_v3-269.634/pb                                                                                                                                      
+            '278820-278820', # HLT_IsoTkMu24_v3-286.511/pb                                                                                                                                      
+            '278822-278822', # HLT_IsoTkMu24_v3, 191.158/pb                                                                                                                                      
+            '278873-278875', # HLT_IsoTkMu24_v3, 198.657/pb                                                                                                                                      
+            '278923-278923', # HLT_IsoTkMu24_v3, 98.543/pb                                                                                                                                       
+            '278957-278957', # HLT_IsoTkMu24_v3, 36.164/pb                                                                                                                                       
+            '278962-278963', # HLT_IsoTkMu24_v3, 113.024/pb                                                                                                                                      
+            '278969-278969', # HLT_IsoTkMu24_v3-282.492/pb                                                                                                                                      
+            '278975-278976', # HLT_IsoTkMu24_v3, 122.556/pb                                                                                                                                      
+            '278986-278986', # HLT_IsoTkMu24_v3, 31.548/pb                                                                                                                                       
+            '279024-279024', # HLT_IsoTkMu24_v3, 49.596/pb                                                                                                                                       
+            '279029-279029', # HLT_IsoTkMu24_v3, 38.088/pb                                                                                                                                       
+            '279071-279071', # HLT_IsoTkMu24_v3-22.581/pb
+            '279080-279080', # HLT_IsoTkMu24_v3, 12.773/pb                                                                                                                                       
+            '279115-279116', # HLT_IsoTkMu24_v3, 174.938/pb                                                                                                                                      
+            '279479-279479', # HLT_IsoTkMu24_v3, 5.927/pb                                                                                                                                        
+            '279588-279588', # HLT_IsoTkMu24_v3-228.517/pb                                                                                                                                      
+            '279653-279654', # HLT_IsoTkMu24_v3-283.775/pb                                                                                                                                      
+            '279656-279656', # HLT_IsoTkMu24_v3, 5.684/pb                                                                                                                                        
+            '279658-279658', # HLT_IsoTkMu24_v3, 93.394/pb                                                                                                                                       
+            '279667-279667', # HLT_IsoTkMu24_v3-208.732/pb                                                                                                                                      
+            '279681-279685', # HLT_IsoTkMu24_v3, 74.528/pb                                                                                                                                       
+            '279691-279691', # HLT_IsoTkMu24_v3, 9.656/pb                                                                                                                                        
+            '279694-279694', # HLT_IsoTkMu24_v3, 406.418/pb                                                                                                                                      
+            '279715-279716', # HLT_IsoTkMu24_v3, 383.763/pb                                                                                                                                      
+            '279760-279760', # HLT_IsoTkMu24_v3, 153.502/pb                                                                                                                                      
+            '279766-279767', # HLT_IsoTkMu24_v3, 358.144/pb                                                                                                                                      
+            '279794-279794', # HLT_IsoTkMu24_v3-223.093/pb                                                                                                                                      
+            '279823-279823', # HLT_IsoTkMu24_v3, 81.828/pb                                                                                                                                       
+            '279841-279841', # HLT_IsoTkMu24_v3, 380.359/pb                                                                                                                                      
+            '279844-279844', # HLT_IsoTkMu24_v3, 56.588/pb                                                                                                                                       
+            '279887-279887', # HLT_IsoTkMu24_v3, 73.316/pb                                                                                                                                       
+            '279931-279931', # HLT_IsoTkMu24_v3, 475.316/pb                                                                                                                                      
+            '279966-279966', # HLT_IsoTkMu24_v3, 93.011/pb                                                                                                                                       
+            '279975-279975', # HLT_IsoTkMu24_v3-239.011/pb                                                                                                                                      
+            '279993-279994', # HLT_IsoTkMu24_v3, 30.455/pb                                                                                                                                       
+            '280013-280013', # HLT_IsoTkMu24_v3, 5.636/pb                                                                                                                                        
+            '280015-280018', # HLT_IsoTkMu24_v3, 398.79/pb
+            '280020-280020', # HLT_IsoTkMu24_v3, 4.614/pb                                                                                                                                        
+            '280024-280024', # HLT_IsoTkMu24_v3, 41.841/pb                                                                                                                                       
+            '280187-280188', # HLT_IsoTkMu24_v3, 74.778/pb                                                                                                                                       
+            '280191-280191', # HLT_IsoTkMu24_v3, 178.951/pb                                                                                                                                      
+            '280194-280194', # HLT_IsoTkMu24_v3, 36.665/pb                                                                                                                                       
+            '280242-280242', # HLT_IsoTkMu24_v3, 147.69/pb                                                                                                                                       
+            '280249-280249', # HLT_IsoTkMu24_v3-239.16/pb                                                                                                                                       
+            '280251-280251', # HLT_IsoTkMu24_v3, 47.176/pb                                                                                                                                       
+            '280327-280327', # HLT_IsoTkMu24_v3, 8.719/pb                                                                                                                                        
+            '280330-280330', # HLT_IsoTkMu24_v3, 185.776/pb                                                                                                                                      
+            '280349-280349', # HLT_IsoTkMu24_v3, 104.129/pb                                                                                                                                      
+            '280363-280364', # HLT_IsoTkMu24_v3-205.282/pb                                                                                                                                      
+            '280383-280385', # HLT_IsoTkMu24_v3, 372.972/pb                                                                                                                                      
+            '281613-281613', # HLT_IsoTkMu24_v4, 9.764/pb                                                                                                                                        
+            '281639-281639', # HLT_IsoTkMu24_v4, 18.977/pb                                                                                                                                       
+            '281641-281641', # HLT_IsoTkMu24_v4, 39.268/pb                                                                                                                                       
+            '281693-281693', # HLT_IsoTkMu24_v4, 376.118/pb                                                                                                                                      
+            '281707-281707', # HLT_IsoTkMu24_v4-214.55/pb                                                                                                                                       
+            '281726-281727', # HLT_IsoTkMu24_v4-251.373/pb                                                                                                                                      
+            '281797-281797', # HLT_IsoTkMu24_v4, 397.836/pb                                                                                                                                      
+            '281975-281976', # HLT_IsoTkMu24_v4, 393.967/pb                                                                                                                                      
+            '282033-282035', # HLT_IsoTkMu24_v4-26.293/pb                                                                                                                                       
+            '282037-282037', # HLT_IsoTkMu24_v4, 331.413/pb                                                                                                                                      
+            '282092-282092', # HLT_IsoTkMu24_v4-296.762/pb                                                                                                                                      
+            '282708-282708', # HLT_IsoTkMu24_v4-2.118/pb 
+            '282710-282710', # HLT_IsoTkMu24_v4, 0.346/pb                                                                                                                                        
+            '282712-282712', # HLT_IsoTkMu24_v4, 16.683/pb                                                                                                                                       
+            '282730-282735', # HLT_IsoTkMu24_v4, 469.07/pb                                                                                                                                       
+            '282800-282800', # HLT_IsoTkMu24_v4, 93.58/pb                                                                                                                                        
+            '282807-282807', # HLT_IsoTkMu24_v4, 70.563/pb                                                                                                                                       
+            '282814-282814', # HLT_IsoTkMu24_v4-276.224/pb                                                                                                                                      
+            '282842-282842', # HLT_IsoTkMu24_v4-23.509/pb                                                                                                                                       
+            '282917-282919', # HLT_IsoTkMu24_v4, 88.074/pb                                                                                                                                       
+            '282922-282923', # HLT_IsoTkMu24_v4, 66.001/pb                                                                                                                                       
+            '283042-283043', # HLT_IsoTkMu24_v4, 118.119/pb                                                                                                                                      
+            '283049-283050', # HLT_IsoTkMu24_v4, 61.072/pb                                                                                                                                       
+            '283052-283052', # HLT_IsoTkMu24_v4-28.777/pb                                                                                                                                       
+            '283059-283059', # HLT_IsoTkMu24_v4, 98.778/pb                                                                                                                                       
+            '283270-283270', # HLT_IsoTkMu24_v4, 381.444/pb                                                                                                                                      
+            '283283-283283', # HLT_IsoTkMu24_v4, 197.444/pb                                                                                                                                      
+            '283305-283308', # HLT_IsoTkMu24_v4, 338.86/pb                                                                                                                                       
+            '283353-283353', # HLT_IsoTkMu24_v4, 191.088/pb                                                                                                                                      
+            '283358-283359', # HLT_IsoTkMu24_v4-233.089/pb                                                                                                                                      
+            '283407-283408', # HLT_IsoTkMu24_v4, 466.833/pb                                                                                                                                      
+            '283416-283416', # HLT_IsoTkMu24_v4-21.628/pb                                                                                                                                       
+            '283453-283453', # HLT_IsoTkMu24_v4, 123.278/pb                                                                                                                                      
+            '283469-283469', # HLT_IsoTkMu24_v4, 0.031/pb                                                                                                                                        
+            '283478-283478', # HLT_IsoTkMu24_v4-210.23/pb                                                                                                                                       
+            '283548-283548', # HLT_IsoTkMu24_v4-26.451/pb                                                                                                                                       
+            '283680-283682', # HLT_IsoTkMu24_v4, 102.814/pb
+            '283685-283685', # HLT_IsoTkMu24_v4-20.432/pb                                                                                                                                       
+            '283820-283820', # HLT_IsoTkMu24_v4-259.058/pb                                                                                                                                      
+            '283830-283830', # HLT_IsoTkMu24_v4, 102.255/pb                                                                                                                                      
+            '283834-283835', # HLT_IsoTkMu24_v4-20.323/pb                                                                                                                                       
+            '283865-283865', # HLT_IsoTkMu24_v4-264.403/pb                                                                                                                                      
+            '283876-283877', # HLT_IsoTkMu24_v4, 409.447/pb                                                                                                                                      
+            '283884-283885', # HLT_IsoTkMu24_v4, 392.377/pb                                                                                                                                      
+            '283933-283934', # HLT_IsoTkMu24_v4, 309.793/pb                                                                                                                                      
+            '283946-283946', # HLT_IsoTkMu24_v4, 300.188/pb                                                                                                                                      
+            '283964-283964', # HLT_IsoTkMu24_v4, 58.698/pb                                                                                                                                       
+            '284006-284006', # HLT_IsoTkMu24_v4, 57.69/pb                                                                                                                                        
+            '284014-284014', # HLT_IsoTkMu24_v4, 47.826/pb                                                                                                                                       
+            '284025-284025', # HLT_IsoTkMu24_v4, 12.193/pb                                                                                                                                       
+            '284029-284029', # HLT_IsoTkMu24_v4-29.941/pb                                                                                                                                       
+            '284035-284044', # HLT_IsoTkMu24_v4, 303.58/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ), ## mu VPSet ENDS
+
+  'e' : cms.VPSet(
+    ##---------HLT_Ele27_WPTight_Gsf----------##
+    cms.PSet( # 1e PSet 32-100 BEGINS
+      path = cms.string("Ele27_WPTight_Gsf"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(27.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_Ele27_WPTight_Gsf_v1, 50.239/pb                                                                                                                               
+            '273302-273302', # HLT_Ele27_WPTight_Gsf_v1, 16.319/pb                                                                                                                               
+            '273402-273406', # HLT_Ele27_WPTight_Gsf_v1, 13.589/pb                                                                                                                               
+            '273408-273411', # HLT_Ele27_WPTight_Gsf_v1, 13.087/pb                                                                                                                               
+            '273425-273425', # HLT_Ele27_WPTight_Gsf_v1-26.717/pb                                                                                                                               
+            '273446-273450', # HLT_Ele27_WPTight_Gsf_v1, 94.292/pb                                                                                                                               
+            '273492-273494', # HLT_Ele27_WPTight_Gsf_v1, 30.924/pb                                                                                                                               
+            '273502-273503', # HLT_Ele27_WPTight_Gsf_v1, 72.147/pb                                                                                                                               
+            '273554-273555', # HLT_Ele27_WPTight_Gsf_v1, 38.827/pb                                                                                                                               
+            '273725-273725', # HLT_Ele27_WPTight_Gsf_v1, 154.653/pb                                                                                                                              
+            '273728-273728', # HLT_Ele27_WPTight_Gsf_v1, 4.897/pb                                                                                                                                
+            '273730-273730', # HLT_Ele27_WPTight_Gsf_v1, 86.49/pb                                                                                                                                
+            '274094-274094', # HLT_Ele27_WPTight_Gsf_v1, 9.735/pb                                                                                                                                
+            '274146-274146', # HLT_Ele27_WPTight_Gsf_v1, 5.12/pb                                                                                                                                 
+            '274157-274157', # HLT_Ele27_WPTight_Gsf_v1, 38.994/pb                                                                                                                               
+            '274159-274161', # HLT_Ele27_WPTight_Gsf_v1, 62.883/pb                                                                                                                               
+            '274172-274172', # HLT_Ele27_WPTight_Gsf_v1, 5.249/pb                                                                                                                                
+            '274198-274200', # HLT_Ele27_WPTight_Gsf_v1, 135.972/pb                                                                                                                              
+            '274240-274241', # HLT_Ele27_WPTight_Gsf_v1, 134.472/pb                                                                                                                              
+            '274244-274244', # HLT_Ele27_WPTight_Gsf_v1, 56.348/pb                                                                                                                               
+            '274250-274251', # HLT_Ele27_WPTight_Gsf_v1, 159.993/pb                                                                                                                              
+            '274283-274284', # HLT_Ele27_WPTight_Gsf_v1, 30.266/pb                                                                                                                               
+            '274286-274286', # HLT_Ele27_WPTight_Gsf_v1-21.668/pb                                                                                                                               
+            '274314-274317', # HLT_Ele27_WPTight_Gsf_v1-206.7/pb                                                                                                                                
+            '274319-274319', # HLT_Ele27_WPTight_Gsf_v1-27.302/pb                                                                                                                               
+            '274335-274339', # HLT_Ele27_WPTight_Gsf_v1-246.003/pb                                                                                                                              
+            '274344-274345', # HLT_Ele27_WPTight_Gsf_v1, 87.68/pb                                                                                                                                
+            '274382-274382', # HLT_Ele27_WPTight_Gsf_v1, 7.428/pb                                                                                                                                
+            '274387-274388', # HLT_Ele27_WPTight_Gsf_v1, 312.374/pb                                                                                                                              
+            '274420-274422', # HLT_Ele27_WPTight_Gsf_v1, 359.125/pb                                                                                                                              
+            '274440-274442', # HLT_Ele27_WPTight_Gsf_v1-226.466/pb                                                                                                                              
+            '274954-274955', # HLT_Ele27_WPTight_Gsf_v2, 5.735/pb                                                                                                                                
+            '274968-274971', # HLT_Ele27_WPTight_Gsf_v2, 422.272/pb                                                                                                                              
+            '274998-275001', # HLT_Ele27_WPTight_Gsf_v2, 489.252/pb                                                                                                                              
+            '275059-275059', # HLT_Ele27_WPTight_Gsf_v2, 6.094/pb                                                                                                                                
+            '275066-275068', # HLT_Ele27_WPTight_Gsf_v2/HLT_Ele27_WPTight_Gsf_v3-231.774/pb                                                                                                     
+            '275073-275074', # HLT_Ele27_WPTight_Gsf_v3, 144.124/pb                                                                                                                              
+            '275124-275125', # HLT_Ele27_WPTight_Gsf_v3-205.394/pb                                                                                                                              
+            '275282-275284', # HLT_Ele27_WPTight_Gsf_v3, 49.295/pb                                                                                                                               
+            '275290-275293', # HLT_Ele27_WPTight_Gsf_v3, 94.338/pb                                                                                                                               
+            '275309-275311', # HLT_Ele27_WPTight_Gsf_v3, 411.084/pb                                                                                                                              
+            '275319-275319', # HLT_Ele27_WPTight_Gsf_v4-24.399/pb                                                                                                                               
+            '275337-275338', # HLT_Ele27_WPTight_Gsf_v4, 143.358/pb                                                                                                                              
+            '275344-275345', # HLT_Ele27_WPTight_Gsf_v4, 109.524/pb                                                                                                                              
+            '275370-275371', # HLT_Ele27_WPTight_Gsf_v4, 145.599/pb  
+            '275375-275376', # HLT_Ele27_WPTight_Gsf_v4, 528.636/pb                                                                                                                              
+            '275657-275659', # HLT_Ele27_WPTight_Gsf_v4, 80.874/pb                                                                                                                               
+            '275761-275761', # HLT_Ele27_WPTight_Gsf_v4, 1.667/pb                                                                                                                                
+            '275767-275767', # HLT_Ele27_WPTight_Gsf_v4, 0.714/pb                                                                                                                                
+            '275772-275774', # HLT_Ele27_WPTight_Gsf_v4, 66.444/pb                                                                                                                               
+            '275776-275778', # HLT_Ele27_WPTight_Gsf_v4, 116.898/pb                                                                                                                              
+            '275782-275782', # HLT_Ele27_WPTight_Gsf_v4, 99.533/pb                                                                                                                               
+            '275832-275837', # HLT_Ele27_WPTight_Gsf_v4, 441.03/pb                                                                                                                               
+            '275847-275847', # HLT_Ele27_WPTight_Gsf_v4, 198.947/pb                                                                                                                              
+            '275886-275886', # HLT_Ele27_WPTight_Gsf_v4, 7.581/pb                                                                                                                                
+            '275890-275890', # HLT_Ele27_WPTight_Gsf_v4-235.22/pb                                                                                                                               
+            '275911-275913', # HLT_Ele27_WPTight_Gsf_v4-201.741/pb                                                                                                                              
+            '275918-275918', # HLT_Ele27_WPTight_Gsf_v4, 49.71/pb                                                                                                                                
+            '275920-275921', # HLT_Ele27_WPTight_Gsf_v4, 62.257/pb                                                                                                                               
+            '275923-275923', # HLT_Ele27_WPTight_Gsf_v4, 14.5/pb                                                                                                                                 
+            '275931-275931', # HLT_Ele27_WPTight_Gsf_v4, 10.418/pb                                                                                                                               
+            '275963-275963', # HLT_Ele27_WPTight_Gsf_v4, 19.553/pb                                                                                                                               
+            '276092-276092', # HLT_Ele27_WPTight_Gsf_v4, 14.768/pb                                                                                                                               
+            '276097-276097', # HLT_Ele27_WPTight_Gsf_v4, 99.405/pb                                                                                                                               
+            '276242-276244', # HLT_Ele27_WPTight_Gsf_v4, 479.052/pb                                                                                                                              
+            '276282-276283', # HLT_Ele27_WPTight_Gsf_v4, 372.59/pb                                                                                                                               
+            '276315-276315', # HLT_Ele27_WPTight_Gsf_v4, 34.051/pb                                                                                                                               
+            '276317-276318', # HLT_Ele27_WPTight_Gsf_v4, 124.306/pb                                                                                                                              
+            '276355-276355', # HLT_Ele27_WPTight_Gsf_v4, 6.205/pb                                                                                                                                
+            '276361-276361', # HLT_Ele27_WPTight_Gsf_v4, 149.465/pb
+            '276363-276363', # HLT_Ele27_WPTight_Gsf_v4-206.376/pb                                                                                                                              
+            '276384-276384', # HLT_Ele27_WPTight_Gsf_v4, 121.517/pb                                                                                                                              
+            '276437-276437', # HLT_Ele27_WPTight_Gsf_v4, 355.688/pb                                                                                                                              
+            '276454-276454', # HLT_Ele27_WPTight_Gsf_v4, 63.924/pb                                                                                                                               
+            '276458-276458', # HLT_Ele27_WPTight_Gsf_v4, 33.169/pb                                                                                                                               
+            '276495-276495', # HLT_Ele27_WPTight_Gsf_v4, 38.062/pb                                                                                                                               
+            '276501-276502', # HLT_Ele27_WPTight_Gsf_v4, 486.891/pb                                                                                                                              
+            '276525-276525', # HLT_Ele27_WPTight_Gsf_v4, 402.663/pb                                                                                                                              
+            '276527-276528', # HLT_Ele27_WPTight_Gsf_v4, 60.758/pb                                                                                                                               
+            '276542-276545', # HLT_Ele27_WPTight_Gsf_v4, 345.204/pb                                                                                                                              
+            '276581-276587', # HLT_Ele27_WPTight_Gsf_v4, 471.493/pb                                                                                                                              
+            '276653-276653', # HLT_Ele27_WPTight_Gsf_v4, 86.12/pb                                                                                                                                
+            '276655-276655', # HLT_Ele27_WPTight_Gsf_v4, 160.843/pb                                                                                                                              
+            '276659-276659', # HLT_Ele27_WPTight_Gsf_v4-29.939/pb                                                                                                                               
+            '276775-276776', # HLT_Ele27_WPTight_Gsf_v4, 443.702/pb                                                                                                                              
+            '276794-276794', # HLT_Ele27_WPTight_Gsf_v4, 87.206/pb                                                                                                                               
+            '276807-276808', # HLT_Ele27_WPTight_Gsf_v4, 188.301/pb                                                                                                                              
+            '276810-276811', # HLT_Ele27_WPTight_Gsf_v4, 346.409/pb                                                                                                                              
+            '276831-276831', # HLT_Ele27_WPTight_Gsf_v4, 400.298/pb                                                                                                                              
+            '276834-276834', # HLT_Ele27_WPTight_Gsf_v4, 72.6/pb                                                                                                                                 
+            '276870-276870', # HLT_Ele27_WPTight_Gsf_v5, 526.587/pb                                                                                                                              
+            '276935-276935', # HLT_Ele27_WPTight_Gsf_v5, 169.998/pb                                                                                                                              
+            '276940-276940', # HLT_Ele27_WPTight_Gsf_v5-28.701/pb                                                                                                                               
+            '276946-276948', # HLT_Ele27_WPTight_Gsf_v5, 114.81/pb                                                                                                                               
+            '276950-276950', # HLT_Ele27_WPTight_Gsf_v5, 323.179/pb
+            '277069-277073', # HLT_Ele27_WPTight_Gsf_v5, 390.296/pb                                                                                                                              
+            '277076-277076', # HLT_Ele27_WPTight_Gsf_v5, 125.929/pb                                                                                                                              
+            '277087-277087', # HLT_Ele27_WPTight_Gsf_v5, 86.357/pb                                                                                                                               
+            '277094-277094', # HLT_Ele27_WPTight_Gsf_v5, 131.103/pb                                                                                                                              
+            '277096-277096', # HLT_Ele27_WPTight_Gsf_v5, 320.668/pb                                                                                                                              
+            '277112-277112', # HLT_Ele27_WPTight_Gsf_v5, 17.339/pb                                                                                                                               
+            '277126-277127', # HLT_Ele27_WPTight_Gsf_v5, 185.976/pb                                                                                                                              
+            '277148-277148', # HLT_Ele27_WPTight_Gsf_v5, 128.192/pb                                                                                                                              
+            '277166-277166', # HLT_Ele27_WPTight_Gsf_v5, 70.666/pb                                                                                                                               
+            '277168-277168', # HLT_Ele27_WPTight_Gsf_v5, 318.998/pb                                                                                                                              
+            '277180-277180', # HLT_Ele27_WPTight_Gsf_v5, 31.25/pb                                                                                                                                
+            '277194-277194', # HLT_Ele27_WPTight_Gsf_v5, 367.175/pb                                                                                                                              
+            '277305-277305', # HLT_Ele27_WPTight_Gsf_v5, 154.262/pb                                                                                                                              
+            '277420-277420', # HLT_Ele27_WPTight_Gsf_v5, 60.844/pb                                                                                                                               
+            '277981-277981', # HLT_Ele27_WPTight_Gsf_v5, 4.601/pb                                                                                                                                
+            '277991-277992', # HLT_Ele27_WPTight_Gsf_v5-21.692/pb                                                                                                                               
+            '278017-278018', # HLT_Ele27_WPTight_Gsf_v5, 338.894/pb                                                                                                                              
+            '278167-278167', # HLT_Ele27_WPTight_Gsf_v5, 314.532/pb                                                                                                                              
+            '278175-278175', # HLT_Ele27_WPTight_Gsf_v5, 9.045/pb                                                                                                                                
+            '278193-278193', # HLT_Ele27_WPTight_Gsf_v5, 34.581/pb                                                                                                                               
+            '278239-278240', # HLT_Ele27_WPTight_Gsf_v5, 330.009/pb                                                                                                                              
+            '278273-278274', # HLT_Ele27_WPTight_Gsf_v6-23.87/pb                                                                                                                                
+            '278288-278290', # HLT_Ele27_WPTight_Gsf_v6, 14.747/pb                                                                                                                               
+            '278308-278308', # HLT_Ele27_WPTight_Gsf_v6, 313.102/pb                                                                                                                              
+            '278310-278310', # HLT_Ele27_WPTight_Gsf_v6, 88.422/pb
+            '278315-278315', # HLT_Ele27_WPTight_Gsf_v6, 137.45/pb                                                                                                                               
+            '278345-278346', # HLT_Ele27_WPTight_Gsf_v6, 171.231/pb                                                                                                                              
+            '278349-278349', # HLT_Ele27_WPTight_Gsf_v6, 94.737/pb                                                                                                                               
+            '278366-278366', # HLT_Ele27_WPTight_Gsf_v6, 59.423/pb                                                                                                                               
+            '278406-278406', # HLT_Ele27_WPTight_Gsf_v6-296.962/pb                                                                                                                              
+            '278509-278509', # HLT_Ele27_WPTight_Gsf_v6-273.442/pb                                                                                                                              
+            '278769-278770', # HLT_Ele27_WPTight_Gsf_v6, 170.993/pb                                                                                                                              
+            '278801-278805', # HLT_Ele27_WPTight_Gsf_v6, 137.142/pb                                                                                                                              
+            '278808-278808', # HLT_Ele27_WPTight_Gsf_v6-269.634/pb                                                                                                                              
+            '278820-278820', # HLT_Ele27_WPTight_Gsf_v6-286.511/pb                                                                                                                              
+            '278822-278822', # HLT_Ele27_WPTight_Gsf_v6, 191.158/pb                                                                                                                              
+            '278873-278875', # HLT_Ele27_WPTight_Gsf_v6, 198.657/pb                                                                                                                              
+            '278923-278923', # HLT_Ele27_WPTight_Gsf_v6, 98.543/pb                                                                                                                               
+            '278957-278957', # HLT_Ele27_WPTight_Gsf_v6, 36.164/pb                                                                                                                               
+            '278962-278963', # HLT_Ele27_WPTight_Gsf_v6, 113.024/pb                                                                                                                              
+            '278969-278969', # HLT_Ele27_WPTight_Gsf_v6-282.492/pb                                                                                                                              
+            '278975-278976', # HLT_Ele27_WPTight_Gsf_v6, 122.556/pb                                                                                                                              
+            '278986-278986', # HLT_Ele27_WPTight_Gsf_v6, 31.548/pb                                                                                                                               
+            '279024-279024', # HLT_Ele27_WPTight_Gsf_v6, 49.596/pb                                                                                                                               
+            '279029-279029', # HLT_Ele27_WPTight_Gsf_v6, 38.088/pb                                                                                                                               
+            '279071-279071', # HLT_Ele27_WPTight_Gsf_v6-22.581/pb                                                                                                                               
+            '279080-279080', # HLT_Ele27_WPTight_Gsf_v6, 12.773/pb                                                                                                                               
+            '279115-279116', # HLT_Ele27_WPTight_Gsf_v6, 174.938/pb                                                                                                                              
+            '279479-279479', # HLT_Ele27_WPTight_Gsf_v6, 5.927/pb                                                                                                                                
+            '279588-279588', # HLT_Ele27_WPTight_Gsf_v6-228.517/pb
+            '279653-279654', # HLT_Ele27_WPTight_Gsf_v6-283.775/pb                                                                                                                              
+            '279656-279656', # HLT_Ele27_WPTight_Gsf_v6, 5.684/pb                                                                                                                                
+            '279658-279658', # HLT_Ele27_WPTight_Gsf_v6, 93.394/pb                                                                                                                               
+            '279667-279667', # HLT_Ele27_WPTight_Gsf_v6-208.732/pb                                                                                                                              
+            '279681-279685', # HLT_Ele27_WPTight_Gsf_v6, 74.528/pb                                                                                                                               
+            '279691-279691', # HLT_Ele27_WPTight_Gsf_v6, 9.656/pb                                                                                                                                
+            '279694-279694', # HLT_Ele27_WPTight_Gsf_v6, 406.418/pb                                                                                                                              
+            '279715-279716', # HLT_Ele27_WPTight_Gsf_v6, 383.763/pb                                                                                                                              
+            '279760-279760', # HLT_Ele27_WPTight_Gsf_v6, 153.502/pb                                                                                                                              
+            '279766-279767', # HLT_Ele27_WPTight_Gsf_v6, 358.144/pb                                                                                                                              
+            '279794-279794', # HLT_Ele27_WPTight_Gsf_v6-223.093/pb                                                                                                                              
+            '279823-279823', # HLT_Ele27_WPTight_Gsf_v6, 81.828/pb                                                                                                                               
+            '279841-279841', # HLT_Ele27_WPTight_Gsf_v6, 380.359/pb                                                                                                                              
+            '279844-279844', # HLT_Ele27_WPTight_Gsf_v6, 56.588/pb                                                                                                                               
+            '279887-279887', # HLT_Ele27_WPTight_Gsf_v6, 73.316/pb                                                                                                                               
+            '279931-279931', # HLT_Ele27_WPTight_Gsf_v6, 475.316/pb                                                                                                                              
+            '279966-279966', # HLT_Ele27_WPTight_Gsf_v6, 93.011/pb                                                                                                                               
+            '279975-279975', # HLT_Ele27_WPTight_Gsf_v6-239.011/pb                                                                                                                              
+            '279993-279994', # HLT_Ele27_WPTight_Gsf_v6, 30.455/pb                                                                                                                               
+            '280013-280013', # HLT_Ele27_WPTight_Gsf_v6, 5.636/pb                                                                                                                                
+            '280015-280018', # HLT_Ele27_WPTight_Gsf_v6, 398.79/pb                                                                                                                               
+            '280020-280020', # HLT_Ele27_WPTight_Gsf_v6, 4.614/pb                                                                                                                                
+            '280024-280024', # HLT_Ele27_WPTight_Gsf_v6, 41.841/pb                                                                                                                               
+            '280187-280188', # HLT_Ele27_WPTight_Gsf_v6, 74.778/pb                                                                                                                               
+            '280191-280191', # HLT_Ele27_WPTight_Gsf_v6, 178.951/pb
+            '280194-280194', # HLT_Ele27_WPTight_Gsf_v6, 36.665/pb                                                                                                                               
+            '280242-280242', # HLT_Ele27_WPTight_Gsf_v6, 147.69/pb                                                                                                                               
+            '280249-280249', # HLT_Ele27_WPTight_Gsf_v6-239.16/pb                                                                                                                               
+            '280251-280251', # HLT_Ele27_WPTight_Gsf_v6, 47.176/pb                                                                                                                               
+            '280327-280327', # HLT_Ele27_WPTight_Gsf_v6, 8.719/pb                                                                                                                                
+            '280330-280330', # HLT_Ele27_WPTight_Gsf_v6, 185.776/pb                                                                                                                              
+            '280349-280349', # HLT_Ele27_WPTight_Gsf_v6, 104.129/pb                                                                                                                              
+            '280363-280364', # HLT_Ele27_WPTight_Gsf_v6-205.282/pb                                                                                                                              
+            '280383-280385', # HLT_Ele27_WPTight_Gsf_v6, 372.972/pb                                                                                                                              
+            '281613-281613', # HLT_Ele27_WPTight_Gsf_v7, 9.764/pb                                                                                                                                
+            '281639-281639', # HLT_Ele27_WPTight_Gsf_v7, 18.977/pb                                                                                                                               
+            '281641-281641', # HLT_Ele27_WPTight_Gsf_v7, 39.268/pb                                                                                                                               
+            '281693-281693', # HLT_Ele27_WPTight_Gsf_v7, 376.118/pb                                                                                                                              
+            '281707-281707', # HLT_Ele27_WPTight_Gsf_v7-214.55/pb                                                                                                                               
+            '281726-281727', # HLT_Ele27_WPTight_Gsf_v7-251.373/pb                                                                                                                              
+            '281797-281797', # HLT_Ele27_WPTight_Gsf_v7, 397.836/pb                                                                                                                              
+            '281975-281976', # HLT_Ele27_WPTight_Gsf_v7, 393.967/pb                                                                                                                              
+            '282033-282035', # HLT_Ele27_WPTight_Gsf_v7-26.293/pb                                                                                                                               
+            '282037-282037', # HLT_Ele27_WPTight_Gsf_v7, 331.413/pb                                                                                                                              
+            '282092-282092', # HLT_Ele27_WPTight_Gsf_v7-296.762/pb                                                                                                                              
+            '282708-282708', # HLT_Ele27_WPTight_Gsf_v7-2.118/pb                                                                                                                                
+            '282710-282710', # HLT_Ele27_WPTight_Gsf_v7, 0.346/pb                                                                                                                                
+            '282712-282712', # HLT_Ele27_WPTight_Gsf_v7, 16.683/pb                                                                                                                               
+            '282730-282735', # HLT_Ele27_WPTight_Gsf_v7, 469.07/pb                                                                                                                               
+            '282800-282800', # HLT_Ele27_WPTight_Gsf_v7, 93.58/pb 
+            '282807-282807', # HLT_Ele27_WPTight_Gsf_v7, 70.563/pb                                                                                                                               
+            '282814-282814', # HLT_Ele27_WPTight_Gsf_v7-276.224/pb                                                                                                                              
+            '282842-282842', # HLT_Ele27_WPTight_Gsf_v7-23.509/pb                                                                                                                               
+            '282917-282919', # HLT_Ele27_WPTight_Gsf_v7, 88.074/pb                                                                                                                               
+            '282922-282923', # HLT_Ele27_WPTight_Gsf_v7, 66.001/pb                                                                                                                               
+            '283042-283043', # HLT_Ele27_WPTight_Gsf_v7, 118.119/pb                                                                                                                              
+            '283049-283050', # HLT_Ele27_WPTight_Gsf_v7, 61.072/pb                                                                                                                               
+            '283052-283052', # HLT_Ele27_WPTight_Gsf_v7-28.777/pb                                                                                                                               
+            '283059-283059', # HLT_Ele27_WPTight_Gsf_v7, 98.778/pb                                                                                                                               
+            '283270-283270', # HLT_Ele27_WPTight_Gsf_v7, 381.444/pb                                                                                                                              
+            '283283-283283', # HLT_Ele27_WPTight_Gsf_v7, 197.444/pb                                                                                                                              
+            '283305-283308', # HLT_Ele27_WPTight_Gsf_v7, 338.86/pb                                                                                                                               
+            '283353-283353', # HLT_Ele27_WPTight_Gsf_v7, 191.088/pb                                                                                                                              
+            '283358-283359', # HLT_Ele27_WPTight_Gsf_v7-233.089/pb                                                                                                                              
+            '283407-283408', # HLT_Ele27_WPTight_Gsf_v7, 466.833/pb                                                                                                                              
+            '283416-283416', # HLT_Ele27_WPTight_Gsf_v7-21.628/pb                                                                                                                               
+            '283453-283453', # HLT_Ele27_WPTight_Gsf_v7, 123.278/pb                                                                                                                              
+            '283469-283469', # HLT_Ele27_WPTight_Gsf_v7, 0.031/pb                                                                                                                                
+            '283478-283478', # HLT_Ele27_WPTight_Gsf_v7-210.23/pb                                                                                                                               
+            '283548-283548', # HLT_Ele27_WPTight_Gsf_v7-26.451/pb                                                                                                                               
+            '283680-283682', # HLT_Ele27_WPTight_Gsf_v7, 102.814/pb                                                                                                                              
+            '283685-283685', # HLT_Ele27_WPTight_Gsf_v7-20.432/pb                                                                                                                               
+            '283820-283820', # HLT_Ele27_WPTight_Gsf_v7-259.058/pb                                                                                                                              
+            '283830-283830', # HLT_Ele27_WPTight_Gsf_v7, 102.255/pb                                                                                                                              
+            '283834-283835', # HLT_Ele27_WPTight_Gsf_v7-20.323/pb 
+            '283865-283865', # HLT_Ele27_WPTight_Gsf_v7-264.403/pb                                                                                                                              
+            '283876-283877', # HLT_Ele27_WPTight_Gsf_v7, 409.447/pb                                                                                                                              
+            '283884-283885', # HLT_Ele27_WPTight_Gsf_v7, 392.377/pb                                                                                                                              
+            '283933-283934', # HLT_Ele27_WPTight_Gsf_v7, 309.793/pb                                                                                                                              
+            '283946-283946', # HLT_Ele27_WPTight_Gsf_v7, 300.188/pb                                                                                                                              
+            '283964-283964', # HLT_Ele27_WPTight_Gsf_v7, 58.698/pb                                                                                                                               
+            '284006-284006', # HLT_Ele27_WPTight_Gsf_v7, 57.69/pb                                                                                                                                
+            '284014-284014', # HLT_Ele27_WPTight_Gsf_v7, 47.826/pb                                                                                                                               
+            '284025-284025', # HLT_Ele27_WPTight_Gsf_v7, 12.193/pb                                                                                                                               
+            '284029-284029', # HLT_Ele27_WPTight_Gsf_v7-29.941/pb                                                                                                                               
+            '284035-284044', # HLT_Ele27_WPTight_Gsf_v7, 303.58/pb
+        )),
+      ), # 1e PSet 32-100 ENDS
+    ##---------HLT_Ele25_eta2p1_WPTight_Gsf----------##
+    cms.PSet( # 1e PSet 32-100 BEGINS
+      path = cms.string("HLT_Ele25_eta2p1_WPTight_Gsf"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(25.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 50.239/pb                                                                                                                        
+            '273302-273302', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 16.319/pb                                                                                                                        
+            '273402-273406', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 13.589/pb                                                                                                                        
+            '273408-273411', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 13.087/pb                                                                                                                        
+            '273425-273425', # HLT_Ele25_eta2p1_WPTight_Gsf_v1-26.717/pb                                                                                                                        
+            '273446-273450', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 94.292/pb                                                                                                                        
+            '273492-273494', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 30.924/pb                                                                                                                        
+            '273502-273503', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 72.147/pb                                                                                                                        
+            '273554-273555', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 38.827/pb                                                                                                                        
+            '273725-273725', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 154.653/pb                                                                                                                       
+            '273728-273728', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 4.897/pb                                                                                                                         
+            '273730-273730', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 86.49/pb                                                                                                                         
+            '274094-274094', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 9.735/pb                                                                                                                         
+            '274146-274146', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 5.12/pb                                                                                                                          
+            '274157-274157', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 38.994/pb                                                                                                                        
+            '274159-274161', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 62.883/pb                                                                                                                        
+            '274172-274172', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 5.249/pb                                                                                                                         
+            '274198-274200', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 135.972/pb                                                                                                                       
+            '274240-274241', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 134.472/pb                                                                                                                       
+            '274244-274244', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 56.348/pb                                                                                                                        
+            '274250-274251', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 159.993/pb                                                                                                                       
+            '274283-274284', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 30.266/pb                                                                                                                        
+            '274286-274286', # HLT_Ele25_eta2p1_WPTight_Gsf_v1-21.668/pb                                                                                                                        
+            '274314-274317', # HLT_Ele25_eta2p1_WPTight_Gsf_v1-206.7/pb                                                                                                                         
+            '274319-274319', # HLT_Ele25_eta2p1_WPTight_Gsf_v1-27.302/pb                                                                                                                        
+            '274335-274339', # HLT_Ele25_eta2p1_WPTight_Gsf_v1-246.003/pb                                                                                                                       
+            '274344-274345', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 87.68/pb                                                                                                                         
+            '274382-274382', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 7.428/pb                                                                                                                         
+            '274387-274388', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 312.374/pb                                                                                                                       
+            '274420-274422', # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 359.125/pb                                                                                                                       
+            '274440-274442', # HLT_Ele25_eta2p1_WPTight_Gsf_v1-226.466/pb                                                                                                                       
+            '274954-274955', # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 5.735/pb
+            '274968-274971', # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 422.272/pb                                                                                                                       
+            '274998-275001', # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 489.252/pb                                                                                                                       
+            '275059-275059', # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 6.094/pb                                                                                                                         
+            '275066-275068', # HLT_Ele25_eta2p1_WPTight_Gsf_v2/HLT_Ele25_eta2p1_WPTight_Gsf_v3-231.774/pb                                                                                       
+            '275073-275074', # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 144.124/pb                                                                                                                       
+            '275124-275125', # HLT_Ele25_eta2p1_WPTight_Gsf_v3-205.394/pb                                                                                                                       
+            '275282-275284', # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 49.295/pb                                                                                                                        
+            '275290-275293', # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 94.338/pb                                                                                                                        
+            '275309-275311', # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 411.084/pb                                                                                                                       
+            '275319-275319', # HLT_Ele25_eta2p1_WPTight_Gsf_v4-24.399/pb                                                                                                                        
+            '275337-275338', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 143.358/pb                                                                                                                       
+            '275344-275345', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 109.524/pb                                                                                                                       
+            '275370-275371', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 145.599/pb                                                                                                                       
+            '275375-275376', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 528.636/pb                                                                                                                       
+            '275657-275659', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 80.874/pb                                                                                                                        
+            '275761-275761', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 1.667/pb                                                                                                                         
+            '275767-275767', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 0.714/pb                                                                                                                         
+            '275772-275774', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 66.444/pb                                                                                                                        
+            '275776-275778', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 116.898/pb                                                                                                                       
+            '275782-275782', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 99.533/pb                                                                                                                        
+            '275832-275837', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 441.03/pb                                                                                                                        
+            '275847-275847', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 198.947/pb                                                                                                                       
+            '275886-275886', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 7.581/pb                                                                                                                         
+            '275890-275890', # HLT_Ele25_eta2p1_WPTight_Gsf_v4-235.22/pb                                                                                                                        
+            '275911-275913', # HLT_Ele25_eta2p1_WPTight_Gsf_v4-201.741/pb
+            '275918-275918', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 49.71/pb                                                                                                                         
+            '275920-275921', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 62.257/pb                                                                                                                        
+            '275923-275923', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 14.5/pb                                                                                                                          
+            '275931-275931', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 10.418/pb                                                                                                                        
+            '275963-275963', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 19.553/pb                                                                                                                        
+            '276092-276092', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 14.768/pb                                                                                                                        
+            '276097-276097', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 99.405/pb                                                                                                                        
+            '276242-276244', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 479.052/pb                                                                                                                       
+            '276282-276283', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 372.59/pb                                                                                                                        
+            '276315-276315', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 34.051/pb                                                                                                                        
+            '276317-276318', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 124.306/pb                                                                                                                       
+            '276355-276355', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 6.205/pb                                                                                                                         
+            '276361-276361', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 149.465/pb                                                                                                                       
+            '276363-276363', # HLT_Ele25_eta2p1_WPTight_Gsf_v4-206.376/pb                                                                                                                       
+            '276384-276384', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 121.517/pb                                                                                                                       
+            '276437-276437', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 355.688/pb                                                                                                                       
+            '276454-276454', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 63.924/pb                                                                                                                        
+            '276458-276458', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 33.169/pb                                                                                                                        
+            '276495-276495', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 38.062/pb                                                                                                                        
+            '276501-276502', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 486.891/pb                                                                                                                       
+            '276525-276525', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 402.663/pb                                                                                                                       
+            '276527-276528', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 60.758/pb                                                                                                                        
+            '276542-276545', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 345.204/pb                                                                                                                       
+            '276581-276587', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 471.493/pb                                                                                                                       
+            '276653-276653', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 86.12/pb
+            '276655-276655', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 160.843/pb                                                                                                                       
+            '276659-276659', # HLT_Ele25_eta2p1_WPTight_Gsf_v4-29.939/pb                                                                                                                        
+            '276775-276776', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 443.702/pb                                                                                                                       
+            '276794-276794', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 87.206/pb                                                                                                                        
+            '276807-276808', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 188.301/pb                                                                                                                       
+            '276810-276811', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 346.409/pb                                                                                                                       
+            '276831-276831', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 400.298/pb                                                                                                                       
+            '276834-276834', # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 72.6/pb                                                                                                                          
+            '276870-276870', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 526.587/pb                                                                                                                       
+            '276935-276935', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 169.998/pb                                                                                                                       
+            '276940-276940', # HLT_Ele25_eta2p1_WPTight_Gsf_v5-28.701/pb                                                                                                                        
+            '276946-276948', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 114.81/pb                                                                                                                        
+            '276950-276950', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 323.179/pb                                                                                                                       
+            '277069-277073', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 390.296/pb                                                                                                                       
+            '277076-277076', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 125.929/pb                                                                                                                       
+            '277087-277087', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 86.357/pb                                                                                                                        
+            '277094-277094', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 131.103/pb                                                                                                                       
+            '277096-277096', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 320.668/pb                                                                                                                       
+            '277112-277112', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 17.339/pb                                                                                                                        
+            '277126-277127', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 185.976/pb                                                                                                                       
+            '277148-277148', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 128.192/pb                                                                                                                       
+            '277166-277166', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 70.666/pb                                                                                                                        
+            '277168-277168', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 318.998/pb                                                                                                                       
+            '277180-277180', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 31.25/pb                                                                                                                         
+            '277194-277194', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 367.175/pb
+            '277305-277305', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 154.262/pb                                                                                                                       
+            '277420-277420', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 60.844/pb                                                                                                                        
+            '277981-277981', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 4.601/pb                                                                                                                         
+            '277991-277992', # HLT_Ele25_eta2p1_WPTight_Gsf_v5-21.692/pb                                                                                                                        
+            '278017-278018', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 338.894/pb                                                                                                                       
+            '278167-278167', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 314.532/pb                                                                                                                       
+            '278175-278175', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 9.045/pb                                                                                                                         
+            '278193-278193', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 34.581/pb                                                                                                                        
+            '278239-278240', # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 330.009/pb                                                                                                                       
+            '278273-278274', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-23.87/pb                                                                                                                         
+            '278288-278290', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 14.747/pb                                                                                                                        
+            '278308-278308', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 313.102/pb                                                                                                                       
+            '278310-278310', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 88.422/pb                                                                                                                        
+            '278315-278315', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 137.45/pb                                                                                                                        
+            '278345-278346', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 171.231/pb                                                                                                                       
+            '278349-278349', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 94.737/pb                                                                                                                        
+            '278366-278366', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 59.423/pb                                                                                                                        
+            '278406-278406', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-296.962/pb                                                                                                                       
+            '278509-278509', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-273.442/pb                                                                                                                       
+            '278769-278770', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 170.993/pb                                                                                                                       
+            '278801-278805', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 137.142/pb                                                                                                                       
+            '278808-278808', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-269.634/pb                                                                                                                       
+            '278820-278820', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-286.511/pb                                                                                                                       
+            '278822-278822', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 191.158/pb                                                                                                                       
+            '278873-278875', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 198.657/pb
+            '278923-278923', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 98.543/pb                                                                                                                        
+            '278957-278957', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 36.164/pb                                                                                                                        
+            '278962-278963', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 113.024/pb                                                                                                                       
+            '278969-278969', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-282.492/pb                                                                                                                       
+            '278975-278976', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 122.556/pb                                                                                                                       
+            '278986-278986', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 31.548/pb                                                                                                                        
+            '279024-279024', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 49.596/pb                                                                                                                        
+            '279029-279029', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 38.088/pb                                                                                                                        
+            '279071-279071', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-22.581/pb                                                                                                                        
+            '279080-279080', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 12.773/pb                                                                                                                        
+            '279115-279116', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 174.938/pb                                                                                                                       
+            '279479-279479', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 5.927/pb                                                                                                                         
+            '279588-279588', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-228.517/pb                                                                                                                       
+            '279653-279654', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-283.775/pb                                                                                                                       
+            '279656-279656', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 5.684/pb                                                                                                                         
+            '279658-279658', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 93.394/pb                                                                                                                        
+            '279667-279667', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-208.732/pb                                                                                                                       
+            '279681-279685', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 74.528/pb                                                                                                                        
+            '279691-279691', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 9.656/pb                                                                                                                         
+            '279694-279694', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 406.418/pb                                                                                                                       
+            '279715-279716', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 383.763/pb                                                                                                                       
+            '279760-279760', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 153.502/pb                                                                                                                       
+            '279766-279767', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 358.144/pb                                                                                                                       
+            '279794-279794', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-223.093/pb                                                                                                                       
+            '279823-279823', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 81.828/pb
+            '279841-279841', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 380.359/pb                                                                                                                       
+            '279844-279844', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 56.588/pb                                                                                                                        
+            '279887-279887', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 73.316/pb                                                                                                                        
+            '279931-279931', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 475.316/pb                                                                                                                       
+            '279966-279966', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 93.011/pb                                                                                                                        
+            '279975-279975', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-239.011/pb                                                                                                                       
+            '279993-279994', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 30.455/pb                                                                                                                        
+            '280013-280013', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 5.636/pb                                                                                                                         
+            '280015-280018', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 398.79/pb                                                                                                                        
+            '280020-280020', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 4.614/pb                                                                                                                         
+            '280024-280024', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 41.841/pb                                                                                                                        
+            '280187-280188', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 74.778/pb                                                                                                                        
+            '280191-280191', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 178.951/pb                                                                                                                       
+            '280194-280194', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 36.665/pb                                                                                                                        
+            '280242-280242', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 147.69/pb                                                                                                                        
+            '280249-280249', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-239.16/pb                                                                                                                        
+            '280251-280251', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 47.176/pb                                                                                                                        
+            '280327-280327', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 8.719/pb                                                                                                                         
+            '280330-280330', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 185.776/pb                                                                                                                       
+            '280349-280349', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 104.129/pb                                                                                                                       
+            '280363-280364', # HLT_Ele25_eta2p1_WPTight_Gsf_v6-205.282/pb                                                                                                                       
+            '280383-280385', # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 372.972/pb                                                                                                                       
+            '281613-281613', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 9.764/pb                                                                                                                         
+            '281639-281639', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 18.977/pb                                                                                                                        
+            '281641-281641', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 39.268/pb 
+            '281693-281693', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 376.118/pb                                                                                                                       
+            '281707-281707', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-214.55/pb                                                                                                                        
+            '281726-281727', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-251.373/pb                                                                                                                       
+            '281797-281797', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 397.836/pb                                                                                                                       
+            '281975-281976', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 393.967/pb                                                                                                                       
+            '282033-282035', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-26.293/pb                                                                                                                        
+            '282037-282037', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 331.413/pb                                                                                                                       
+            '282092-282092', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-296.762/pb                                                                                                                       
+            '282708-282708', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-2.118/pb                                                                                                                         
+            '282710-282710', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 0.346/pb                                                                                                                         
+            '282712-282712', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 16.683/pb                                                                                                                        
+            '282730-282735', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 469.07/pb                                                                                                                        
+            '282800-282800', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 93.58/pb                                                                                                                         
+            '282807-282807', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 70.563/pb                                                                                                                        
+            '282814-282814', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-276.224/pb                                                                                                                       
+            '282842-282842', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-23.509/pb                                                                                                                        
+            '282917-282919', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 88.074/pb                                                                                                                        
+            '282922-282923', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 66.001/pb                                                                                                                        
+            '283042-283043', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 118.119/pb                                                                                                                       
+            '283049-283050', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 61.072/pb                                                                                                                        
+            '283052-283052', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-28.777/pb                                                                                                                        
+            '283059-283059', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 98.778/pb                                                                                                                        
+            '283270-283270', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 381.444/pb                                                                                                                       
+            '283283-283283', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 197.444/pb                                                                                                                       
+            '283305-283308', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 338.86/pb
+            '283353-283353', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 191.088/pb                                                                                                                       
+            '283358-283359', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-233.089/pb                                                                                                                       
+            '283407-283408', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 466.833/pb                                                                                                                       
+            '283416-283416', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-21.628/pb                                                                                                                        
+            '283453-283453', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 123.278/pb                                                                                                                       
+            '283469-283469', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 0.031/pb                                                                                                                         
+            '283478-283478', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-210.23/pb                                                                                                                        
+            '283548-283548', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-26.451/pb                                                                                                                        
+            '283680-283682', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 102.814/pb                                                                                                                       
+            '283685-283685', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-20.432/pb                                                                                                                        
+            '283820-283820', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-259.058/pb                                                                                                                       
+            '283830-283830', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 102.255/pb                                                                                                                       
+            '283834-283835', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-20.323/pb                                                                                                                        
+            '283865-283865', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-264.403/pb                                                                                                                       
+            '283876-283877', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 409.447/pb                                                                                                                       
+            '283884-283885', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 392.377/pb                                                                                                                       
+            '283933-283934', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 309.793/pb                                                                                                                       
+            '283946-283946', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 300.188/pb                                                                                                                       
+            '283964-283964', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 58.698/pb                                                                                                                        
+            '284006-284006', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 57.69/pb                                                                                                                         
+            '284014-284014', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 47.826/pb                                                                                                                        
+            '284025-284025', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 12.193/pb                                                                                                                        
+            '284029-284029', # HLT_Ele25_eta2p1_WPTight_Gsf_v7-29.941/pb                                                                                                                        
+            '284035-284044', # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 303.58/pb
+        )),
+      ), # 1e PSet 32-100 ENDS
+    ##---------HLT_Ele27_eta2p1_WPLoose_Gsf----------##
+    cms.PSet( # 1e PSet 32-100 BEGINS
+      path = cms.string("HLT_Ele27_eta2p1_WPLoose_Gsf"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(27.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+            '273158-273158', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 50.239/pb                                                                                                                        
+            '273302-273302', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 16.319/pb                                                                                                                        
+            '273402-273406', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 13.589/pb                                                                                                                        
+            '273408-273411', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 13.087/pb                                                                                                                        
+            '273425-273425', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2-26.717/pb                                                                                                                        
+            '273446-273450', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 94.292/pb                                                                                                                        
+            '273492-273494', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 30.924/pb                                                                                                                        
+            '273502-273503', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 72.147/pb                                                                                                                        
+            '273554-273555', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 38.827/pb                                                                                                                        
+            '273725-273725', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 154.653/pb                                                                                                                       
+            '273728-273728', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 4.897/pb                                                                                                                         
+            '273730-273730', # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 86.49/pb                                                                                                                         
+            '274094-274094', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 9.735/pb                                                                                                                         
+            '274146-274146', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 5.12/pb                                                                                                                          
+            '274157-274157', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 38.994/pb                                                                                                                        
+            '274159-274161', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 62.883/pb                                                                                                                        
+            '274172-274172', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 5.249/pb                                                                                                                         
+            '274198-274200', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 135.972/pb                                                                                                                       
+            '274240-274241', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 134.472/pb                                                                                                                       
+            '274244-274244', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 56.348/pb                                                                                                                        
+            '274250-274251', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 159.993/pb                                                                                                                       
+            '274283-274284', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 30.266/pb                                                                                                                        
+            '274286-274286', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3-21.668/pb                                                                                                                        
+            '274314-274317', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3-206.7/pb                                                                                                                         
+            '274319-274319', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3-27.302/pb                                                                                                                        
+            '274335-274339', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3-246.003/pb                                                                                                                       
+            '274344-274345', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 87.68/pb                                                                                                                         
+            '274382-274382', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 7.428/pb                                                                                                                         
+            '274387-274388', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 312.374/pb                                                                                                                       
+            '274420-274422', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 359.125/pb                                                                                                                       
+            '274440-274442', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3-226.466/pb                                                                                                                       
+            '274954-274955', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 5.735/pb                                                                                                                         
+            '274968-274971', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 422.272/pb                                                                                                                       
+            '274998-275001', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 489.252/pb                                                                                                                       
+            '275059-275059', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 6.094/pb                                                                                                                         
+            '275066-275068', # HLT_Ele27_eta2p1_WPLoose_Gsf_v3/HLT_Ele27_eta2p1_WPLoose_Gsf_v4-231.774/pb                                                                                       
+            '275073-275074', # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 144.124/pb                                                                                                                       
+            '275124-275125', # HLT_Ele27_eta2p1_WPLoose_Gsf_v4-205.394/pb                                                                                                                       
+            '275282-275284', # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 49.295/pb                                                                                                                        
+            '275290-275293', # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 94.338/pb                                                                                                                        
+            '275309-275311', # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 411.084/pb                                                                                                                       
+            '275319-275319', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5-24.399/pb                                                                                                                        
+            '275337-275338', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 143.358/pb                                                                                                                       
+            '275344-275345', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 109.524/pb  
+            '275370-275371', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 145.599/pb                                                                                                                       
+            '275375-275376', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 528.636/pb                                                                                                                       
+            '275657-275659', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 80.874/pb                                                                                                                        
+            '275761-275761', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 1.667/pb                                                                                                                         
+            '275767-275767', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 0.714/pb                                                                                                                         
+            '275772-275774', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 66.444/pb                                                                                                                        
+            '275776-275778', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 116.898/pb                                                                                                                       
+            '275782-275782', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 99.533/pb                                                                                                                        
+            '275832-275837', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 441.03/pb                                                                                                                        
+            '275847-275847', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 198.947/pb                                                                                                                       
+            '275886-275886', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 7.581/pb                                                                                                                         
+            '275890-275890', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5-235.22/pb                                                                                                                        
+            '275911-275913', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5-201.741/pb                                                                                                                       
+            '275918-275918', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 49.71/pb                                                                                                                         
+            '275920-275921', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 62.257/pb                                                                                                                        
+            '275923-275923', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 14.5/pb                                                                                                                          
+            '275931-275931', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 10.418/pb                                                                                                                        
+            '275963-275963', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 19.553/pb                                                                                                                        
+            '276092-276092', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 14.768/pb                                                                                                                        
+            '276097-276097', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 99.405/pb                                                                                                                        
+            '276242-276244', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 479.052/pb                                                                                                                       
+            '276282-276283', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 372.59/pb                                                                                                                        
+            '276315-276315', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 34.051/pb                                                                                                                        
+            '276317-276318', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 124.306/pb                                                                                                                       
+            '276355-276355', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 6.205/pb   
+            '276361-276361', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 149.465/pb                                                                                                                       
+            '276363-276363', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5-206.376/pb                                                                                                                       
+            '276384-276384', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 121.517/pb                                                                                                                       
+            '276437-276437', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 355.688/pb                                                                                                                       
+            '276454-276454', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 63.924/pb                                                                                                                        
+            '276458-276458', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 33.169/pb                                                                                                                        
+            '276495-276495', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 38.062/pb                                                                                                                        
+            '276501-276502', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 486.891/pb                                                                                                                       
+            '276525-276525', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 402.663/pb                                                                                                                       
+            '276527-276528', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 60.758/pb                                                                                                                        
+            '276542-276545', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 345.204/pb                                                                                                                       
+            '276581-276587', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 471.493/pb                                                                                                                       
+            '276653-276653', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 86.12/pb                                                                                                                         
+            '276655-276655', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 160.843/pb                                                                                                                       
+            '276659-276659', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5-29.939/pb                                                                                                                        
+            '276775-276776', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 443.702/pb                                                                                                                       
+            '276794-276794', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 87.206/pb                                                                                                                        
+            '276807-276808', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 188.301/pb                                                                                                                       
+            '276810-276811', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 346.409/pb                                                                                                                       
+            '276831-276831', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 400.298/pb                                                                                                                       
+            '276834-276834', # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 72.6/pb                                                                                                                          
+            '276870-276870', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 526.587/pb                                                                                                                       
+            '276935-276935', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 169.998/pb                                                                                                                       
+            '276940-276940', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6-28.701/pb                                                                                                                        
+            '276946-276948', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 114.81/pb 
+            '276950-276950', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 323.179/pb                                                                                                                       
+            '277069-277073', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 390.296/pb                                                                                                                       
+            '277076-277076', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 125.929/pb                                                                                                                       
+            '277087-277087', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 86.357/pb                                                                                                                        
+            '277094-277094', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 131.103/pb                                                                                                                       
+            '277096-277096', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 320.668/pb                                                                                                                       
+            '277112-277112', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 17.339/pb                                                                                                                        
+            '277126-277127', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 185.976/pb                                                                                                                       
+            '277148-277148', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 128.192/pb                                                                                                                       
+            '277166-277166', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 70.666/pb                                                                                                                        
+            '277168-277168', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 318.998/pb                                                                                                                       
+            '277180-277180', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 31.25/pb                                                                                                                         
+            '277194-277194', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 367.175/pb                                                                                                                       
+            '277305-277305', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 154.262/pb                                                                                                                       
+            '277420-277420', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 60.844/pb                                                                                                                        
+            '277981-277981', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 4.601/pb                                                                                                                         
+            '277991-277992', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6-21.692/pb                                                                                                                        
+            '278017-278018', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 338.894/pb                                                                                                                       
+            '278167-278167', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 314.532/pb                                                                                                                       
+            '278175-278175', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 9.045/pb                                                                                                                         
+            '278193-278193', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 34.581/pb                                                                                                                        
+            '278239-278240', # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 330.009/pb                                                                                                                       
+            '278273-278274', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-23.87/pb                                                                                                                         
+            '278288-278290', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 14.747/pb                                                                                                                        
+            '278308-278308', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 313.102/pb       
+            '278310-278310', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 88.422/pb                                                                                                                        
+            '278315-278315', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 137.45/pb                                                                                                                        
+            '278345-278346', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 171.231/pb                                                                                                                       
+            '278349-278349', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 94.737/pb                                                                                                                        
+            '278366-278366', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 59.423/pb                                                                                                                        
+            '278406-278406', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-296.962/pb                                                                                                                       
+            '278509-278509', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-273.442/pb                                                                                                                       
+            '278769-278770', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 170.993/pb                                                                                                                       
+            '278801-278805', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 137.142/pb                                                                                                                       
+            '278808-278808', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-269.634/pb                                                                                                                       
+            '278820-278820', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-286.511/pb                                                                                                                       
+            '278822-278822', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 191.158/pb                                                                                                                       
+            '278873-278875', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 198.657/pb                                                                                                                       
+            '278923-278923', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 98.543/pb                                                                                                                        
+            '278957-278957', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 36.164/pb                                                                                                                        
+            '278962-278963', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 113.024/pb                                                                                                                       
+            '278969-278969', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-282.492/pb                                                                                                                       
+            '278975-278976', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 122.556/pb                                                                                                                       
+            '278986-278986', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 31.548/pb                                                                                                                        
+            '279024-279024', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 49.596/pb                                                                                                                        
+            '279029-279029', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 38.088/pb                                                                                                                        
+            '279071-279071', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-22.581/pb                                                                                                                        
+            '279080-279080', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 12.773/pb                                                                                                                        
+            '279115-279116', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 174.938/pb                                                                                                                       
+            '279479-279479', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 5.927/pb  
+            '279588-279588', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-228.517/pb                                                                                                                       
+            '279653-279654', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-283.775/pb                                                                                                                       
+            '279656-279656', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 5.684/pb                                                                                                                         
+            '279658-279658', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 93.394/pb                                                                                                                        
+            '279667-279667', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-208.732/pb                                                                                                                       
+            '279681-279685', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 74.528/pb                                                                                                                        
+            '279691-279691', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 9.656/pb                                                                                                                         
+            '279694-279694', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 406.418/pb                                                                                                                       
+            '279715-279716', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 383.763/pb                                                                                                                       
+            '279760-279760', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 153.502/pb                                                                                                                       
+            '279766-279767', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 358.144/pb                                                                                                                       
+            '279794-279794', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-223.093/pb                                                                                                                       
+            '279823-279823', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 81.828/pb                                                                                                                        
+            '279841-279841', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 380.359/pb                                                                                                                       
+            '279844-279844', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 56.588/pb                                                                                                                        
+            '279887-279887', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 73.316/pb                                                                                                                        
+            '279931-279931', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 475.316/pb                                                                                                                       
+            '279966-279966', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 93.011/pb                                                                                                                        
+            '279975-279975', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-239.011/pb                                                                                                                       
+            '279993-279994', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 30.455/pb                                                                                                                        
+            '280013-280013', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 5.636/pb                                                                                                                         
+            '280015-280018', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 398.79/pb                                                                                                                        
+            '280020-280020', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 4.614/pb                                                                                                                         
+            '280024-280024', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 41.841/pb                                                                                                                        
+            '280187-280188', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 74.778/pb
+            '280191-280191', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 178.951/pb                                                                                                                       
+            '280194-280194', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 36.665/pb                                                                                                                        
+            '280242-280242', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 147.69/pb                                                                                                                        
+            '280249-280249', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-239.16/pb                                                                                                                        
+            '280251-280251', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 47.176/pb                                                                                                                        
+            '280327-280327', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 8.719/pb                                                                                                                         
+            '280330-280330', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 185.776/pb                                                                                                                       
+            '280349-280349', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 104.129/pb                                                                                                                       
+            '280363-280364', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7-205.282/pb                                                                                                                       
+            '280383-280385', # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 372.972/pb                                                                                                                       
+            '281613-281613', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.039/pb                                                                                                                         
+            '281639-281639', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.076/pb                                                                                                                         
+            '281641-281641', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.157/pb                                                                                                                         
+            '281693-281693', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.504/pb                                                                                                                         
+            '281707-281707', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.858/pb                                                                                                                         
+            '281726-281727', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.005/pb                                                                                                                         
+            '281797-281797', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.591/pb                                                                                                                         
+            '281975-281976', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.576/pb                                                                                                                         
+            '282033-282035', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.105/pb                                                                                                                         
+            '282037-282037', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.326/pb                                                                                                                         
+            '282092-282092', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.187/pb                                                                                                                         
+            '282708-282708', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.008/pb                                                                                                                         
+            '282710-282710', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.346/pb                                                                                                                         
+            '282712-282712', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.067/pb                                                                                                                         
+            '282730-282735', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.876/pb 
+            '282800-282800', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.374/pb                                                                                                                         
+            '282807-282807', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.282/pb                                                                                                                         
+            '282814-282814', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.105/pb                                                                                                                         
+            '282842-282842', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.094/pb                                                                                                                         
+            '282917-282919', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.352/pb                                                                                                                         
+            '282922-282923', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.264/pb                                                                                                                         
+            '283042-283043', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.886/pb                                                                                                                         
+            '283049-283050', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.244/pb                                                                                                                         
+            '283052-283052', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.115/pb                                                                                                                         
+            '283059-283059', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.395/pb                                                                                                                         
+            '283270-283270', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.526/pb                                                                                                                         
+            '283283-283283', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.79/pb                                                                                                                          
+            '283305-283308', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.355/pb                                                                                                                         
+            '283353-283353', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.764/pb                                                                                                                         
+            '283358-283359', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.932/pb                                                                                                                         
+            '283407-283408', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.867/pb                                                                                                                         
+            '283416-283416', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.087/pb                                                                                                                         
+            '283453-283453', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.493/pb                                                                                                                         
+            '283469-283469', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.0/pb                                                                                                                           
+            '283478-283478', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.841/pb                                                                                                                         
+            '283548-283548', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.106/pb                                                                                                                         
+            '283680-283682', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.411/pb                                                                                                                         
+            '283685-283685', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.082/pb                                                                                                                         
+            '283820-283820', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.036/pb                                                                                                                         
+            '283830-283830', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.409/pb
+            '283834-283835', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.081/pb                                                                                                                         
+            '283865-283865', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.058/pb                                                                                                                         
+            '283876-283877', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.638/pb                                                                                                                         
+            '283884-283885', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.57/pb                                                                                                                          
+            '283933-283934', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.239/pb                                                                                                                         
+            '283946-283946', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.201/pb                                                                                                                         
+            '283964-283964', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.235/pb                                                                                                                         
+            '284006-284006', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.231/pb                                                                                                                         
+            '284014-284014', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.191/pb                                                                                                                         
+            '284025-284025', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.049/pb                                                                                                                         
+            '284029-284029', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.12/pb                                                                                                                          
+            '284035-284044', # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.214/pb
+        )),
+      ), # 1e PSet 32-100 ENDS
+    ), ## e VPSet ENDS
+}
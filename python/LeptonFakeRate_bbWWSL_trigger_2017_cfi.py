@@ -0,0 +1,922 @@
+import FWCore.ParameterSet.Config as cms
+
+leptonFR_triggers = {
+  'mu' : cms.VPSet( ## mu VPSet BEGINS
+    ##---------HLT_IsoMu24 ----------##
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu24"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(24.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '297050-297050', # HLT_IsoMu24_v5, 94.725/pb                                                                                                                                         
+            '297056-297057', # HLT_IsoMu24_v5, 143.741/pb                                                                                                                                        
+            '297099-297101', # HLT_IsoMu24_v6-231.302/pb                                                                                                                                        
+            '297113-297114', # HLT_IsoMu24_v6, 85.001/pb                                                                                                                                         
+            '297175-297178', # HLT_IsoMu24_v6-280.582/pb                                                                                                                                        
+            '297218-297219', # HLT_IsoMu24_v6, 423.357/pb                                                                                                                                        
+            '297224-297225', # HLT_IsoMu24_v6, 13.81/pb                                                                                                                                          
+            '297227-297227', # HLT_IsoMu24_v6, 15.669/pb                                                                                                                                         
+            '297292-297293', # HLT_IsoMu24_v6, 198.677/pb                                                                                                                                        
+            '297296-297296', # HLT_IsoMu24_v6, 84.207/pb                                                                                                                                         
+            '297308-297308', # HLT_IsoMu24_v6, 6.298/pb                                                                                                                                          
+            '297411-297411', # HLT_IsoMu24_v6-201.578/pb                                                                                                                                        
+            '297424-297426', # HLT_IsoMu24_v6, 97.376/pb                                                                                                                                         
+            '297429-297435', # HLT_IsoMu24_v6, 199.191/pb                                                                                                                                        
+            '297467-297469', # HLT_IsoMu24_v6, 68.567/pb                                                                                                                                         
+            '297483-297488', # HLT_IsoMu24_v6, 471.448/pb                                                                                                                                        
+            '297503-297505', # HLT_IsoMu24_v6-268.446/pb                                                                                                                                        
+            '297557-297558', # HLT_IsoMu24_v7, 158.712/pb                                                                                                                                        
+            '297562-297563', # HLT_IsoMu24_v7, 106.785/pb                                                                                                                                        
+            '297598-297599', # HLT_IsoMu24_v7, 93.85/pb                                                                                                                                          
+            '297603-297606', # HLT_IsoMu24_v7-276.775/pb                                                                                                                                        
+            '297620-297620', # HLT_IsoMu24_v7, 82.127/pb                                                                                                                                         
+            '297656-297656', # HLT_IsoMu24_v7, 93.083/pb                                                                                                                                         
+            '297665-297666', # HLT_IsoMu24_v7, 78.347/pb                                                                                                                                         
+            '297670-297670', # HLT_IsoMu24_v7-2.132/pb                                                                                                                                          
+            '297674-297675', # HLT_IsoMu24_v7, 170.78/pb                                                                                                                                         
+            '297722-297723', # HLT_IsoMu24_v7, 142.686/pb                                                                                                                                        
+            '298996-298997', # HLT_IsoMu24_v7-22.867/pb                                                                                                                                         
+            '299000-299000', # HLT_IsoMu24_v7, 8.038/pb                                                                                                                                          
+            '299042-299042', # HLT_IsoMu24_v7-2.02/pb                                                                                                                                           
+            '299061-299062', # HLT_IsoMu24_v7, 123.32/pb                                                                                                                                         
+            '299064-299065', # HLT_IsoMu24_v7, 73.04/pb                                                                                                                                          
+            '299067-299067', # HLT_IsoMu24_v7, 68.807/pb                                                                                                                                         
+            '299096-299096', # HLT_IsoMu24_v7-24.067/pb                                                                                                                                         
+            '299149-299149', # HLT_IsoMu24_v7, 108.249/pb                                                                                                                                        
+            '299178-299178', # HLT_IsoMu24_v7, 15.791/pb                                                                                                                                         
+            '299180-299180', # HLT_IsoMu24_v7, 15.575/pb                                                                                                                                         
+            '299184-299185', # HLT_IsoMu24_v7, 146.717/pb                                                                                                                                        
+            '299327-299327', # HLT_IsoMu24_v7, 15.178/pb                                                                                                                                         
+            '299329-299329', # HLT_IsoMu24_v7-37.487/pb                                                                                                                                         
+            '299368-299370', # HLT_IsoMu24_v8-253.498/pb                                                                                                                                        
+            '299380-299380', # HLT_IsoMu24_v8-29.231/pb                                                                                                                                         
+            '299395-299396', # HLT_IsoMu24_v8, 48.62/pb                                                                                                                                          
+            '299420-299420', # HLT_IsoMu24_v8, 13.23/pb                     
+            '299443-299443', # HLT_IsoMu24_v8, 5.608/pb                                                                                                                                          
+            '299450-299450', # HLT_IsoMu24_v8, 12.395/pb                                                                                                                                         
+            '299477-299481', # HLT_IsoMu24_v8, 431.547/pb                                                                                                                                        
+            '299593-299595', # HLT_IsoMu24_v8-268.091/pb                                                                                                                                        
+            '299597-299597', # HLT_IsoMu24_v8, 85.37/pb                                                                                                                                          
+            '299649-299649', # HLT_IsoMu24_v8-21.775/pb                                                                                                                                         
+            '300087-300087', # HLT_IsoMu24_v9, 12.856/pb                                                                                                                                         
+            '300105-300107', # HLT_IsoMu24_v9-34.169/pb                                                                                                                                         
+            '300117-300117', # HLT_IsoMu24_v9, 6.067/pb                                                                                                                                          
+            '300122-300123', # HLT_IsoMu24_v9-393.9/pb                                                                                                                                          
+            '300155-300157', # HLT_IsoMu24_v9, 461.282/pb                                                                                                                                        
+            '300226-300226', # HLT_IsoMu24_v9, 90.334/pb                                                                                                                                         
+            '300233-300240', # HLT_IsoMu24_v9, 435.357/pb                                                                                                                                        
+            '300280-300284', # HLT_IsoMu24_v9-311.422/pb                                                                                                                                        
+            '300364-300375', # HLT_IsoMu24_v9, 59.002/pb                                                                                                                                         
+            '300389-300401', # HLT_IsoMu24_v9-339.844/pb                                                                                                                                        
+            '300459-300459', # HLT_IsoMu24_v9, 81.507/pb                                                                                                                                         
+            '300461-300464', # HLT_IsoMu24_v9, 132.112/pb                                                                                                                                        
+            '300466-300467', # HLT_IsoMu24_v9-202.273/pb                                                                                                                                        
+            '300514-300517', # HLT_IsoMu24_v9-356.652/pb                                                                                                                                        
+            '300558-300558', # HLT_IsoMu24_v9, 119.182/pb                                                                                                                                        
+            '300560-300560', # HLT_IsoMu24_v9, 140.271/pb                                                                                                                                        
+            '300574-300576', # HLT_IsoMu24_v9-315.299/pb                                                                                                                                        
+            '300631-300633', # HLT_IsoMu24_v9, 167.565/pb                                                                                                                                        
+            '300635-300636', # HLT_IsoMu24_v9-312.071/pb        
+            '300673-300676', # HLT_IsoMu24_v9-23.1/pb                                                                                                                                           
+            '300742-300742', # HLT_IsoMu24_v9, 83.984/pb                                                                                                                                         
+            '300777-300777', # HLT_IsoMu24_v9, 130.415/pb                                                                                                                                        
+            '300780-300780', # HLT_IsoMu24_v9, 79.072/pb                                                                                                                                         
+            '300785-300785', # HLT_IsoMu24_v9-212.774/pb                                                                                                                                        
+            '300811-300812', # HLT_IsoMu24_v9, 123.469/pb                                                                                                                                        
+            '300816-300817', # HLT_IsoMu24_v9, 134.15/pb                                                                                                                                         
+            '301046-301046', # HLT_IsoMu24_v9, 4.222/pb                                                                                                                                          
+            '301141-301142', # HLT_IsoMu24_v9, 97.203/pb                                                                                                                                         
+            '301161-301161', # HLT_IsoMu24_v9, 98.077/pb                                                                                                                                         
+            '301165-301165', # HLT_IsoMu24_v9, 15.465/pb                                                                                                                                         
+            '301179-301180', # HLT_IsoMu24_v9, 16.878/pb                                                                                                                                         
+            '301183-301183', # HLT_IsoMu24_v9, 45.299/pb                                                                                                                                         
+            '301281-301281', # HLT_IsoMu24_v9, 18.542/pb                                                                                                                                         
+            '301283-301283', # HLT_IsoMu24_v9, 120.005/pb                                                                                                                                        
+            '301298-301298', # HLT_IsoMu24_v9, 153.993/pb                                                                                                                                        
+            '301323-301323', # HLT_IsoMu24_v9, 165.06/pb                                                                                                                                         
+            '301330-301330', # HLT_IsoMu24_v9, 64.443/pb                                                                                                                                         
+            '301359-301359', # HLT_IsoMu24_v9, 57.278/pb                                                                                                                                         
+            '301384-301384', # HLT_IsoMu24_v9, 94.354/pb                                                                                                                                         
+            '301391-301393', # HLT_IsoMu24_v9, 147.405/pb                                                                                                                                        
+            '301396-301399', # HLT_IsoMu24_v9, 110.63/pb                                                                                                                                         
+            '301417-301417', # HLT_IsoMu24_v9, 67.689/pb                                                                                                                                         
+            '301447-301450', # HLT_IsoMu24_v9, 188.658/pb                                                                                                                                        
+            '301461-301461', # HLT_IsoMu24_v9, 98.122/pb          
+            '301472-301472', # HLT_IsoMu24_v9, 138.033/pb                                                                                                                                        
+            '301475-301476', # HLT_IsoMu24_v9, 109.336/pb                                                                                                                                        
+            '301519-301519', # HLT_IsoMu24_v9-33.367/pb                                                                                                                                         
+            '301524-301524', # HLT_IsoMu24_v9, 41.078/pb                                                                                                                                         
+            '301529-301532', # HLT_IsoMu24_v9, 131.943/pb                                                                                                                                        
+            '301567-301567', # HLT_IsoMu24_v9, 63.339/pb                                                                                                                                         
+            '301627-301627', # HLT_IsoMu24_v9, 131.459/pb                                                                                                                                        
+            '301664-301665', # HLT_IsoMu24_v9, 138.42/pb                                                                                                                                         
+            '301694-301694', # HLT_IsoMu24_v9, 5.787/pb                                                                                                                                          
+            '301912-301914', # HLT_IsoMu24_v9, 79.784/pb                                                                                                                                         
+            '301941-301941', # HLT_IsoMu24_v9, 74.507/pb                                                                                                                                         
+            '301959-301960', # HLT_IsoMu24_v9-290.104/pb                                                                                                                                        
+            '301970-301970', # HLT_IsoMu24_v9-22.349/pb                                                                                                                                         
+            '301984-301987', # HLT_IsoMu24_v9-292.622/pb                                                                                                                                        
+            '301997-301998', # HLT_IsoMu24_v9-282.538/pb                                                                                                                                        
+            '302019-302019', # HLT_IsoMu24_v9, 9.113/pb                                                                                                                                          
+            '302026-302026', # HLT_IsoMu24_v10, 4.652/pb                                                                                                                                         
+            '302029-302029', # HLT_IsoMu24_v10, 15.282/pb                                                                                                                                        
+            '302031-302031', # HLT_IsoMu24_v10, 128.522/pb                                                                                                                                       
+            '302033-302034', # HLT_IsoMu24_v10, 5.657/pb                                                                                                                                         
+            '302037-302038', # HLT_IsoMu24_v10, 0.069/pb                                                                                                                                         
+            '302040-302043', # HLT_IsoMu24_v10, 104.438/pb                                                                                                                                       
+            '302131-302131', # HLT_IsoMu24_v10, 111.635/pb                                                                                                                                       
+            '302159-302159', # HLT_IsoMu24_v10, 16.077/pb                                                                                                                                        
+            '302163-302163', # HLT_IsoMu24_v10, 146.312/pb          
+            '302165-302166', # HLT_IsoMu24_v10, 8.409/pb                                                                                                                                         
+            '302225-302225', # HLT_IsoMu24_v10, 114.788/pb                                                                                                                                       
+            '302228-302229', # HLT_IsoMu24_v10, 105.812/pb                                                                                                                                       
+            '302240-302240', # HLT_IsoMu24_v10, 138.868/pb                                                                                                                                       
+            '302262-302263', # HLT_IsoMu24_v10-241.353/pb                                                                                                                                       
+            '302277-302277', # HLT_IsoMu24_v10, 53.761/pb                                                                                                                                        
+            '302279-302280', # HLT_IsoMu24_v10, 18.474/pb                                                                                                                                        
+            '302322-302322', # HLT_IsoMu24_v10, 96.87/pb                                                                                                                                         
+            '302328-302328', # HLT_IsoMu24_v10, 93.45/pb                                                                                                                                         
+            '302337-302337', # HLT_IsoMu24_v10-20.377/pb                                                                                                                                        
+            '302342-302344', # HLT_IsoMu24_v10, 91.05/pb                                                                                                                                         
+            '302350-302350', # HLT_IsoMu24_v10, 16.493/pb                                                                                                                                        
+            '302388-302388', # HLT_IsoMu24_v10, 126.264/pb                                                                                                                                       
+            '302392-302393', # HLT_IsoMu24_v10-232.234/pb                                                                                                                                       
+            '302448-302448', # HLT_IsoMu24_v10-307.867/pb                                                                                                                                       
+            '302472-302476', # HLT_IsoMu24_v10-292.111/pb                                                                                                                                       
+            '302479-302479', # HLT_IsoMu24_v10, 68.381/pb                                                                                                                                        
+            '302484-302485', # HLT_IsoMu24_v10-209.762/pb                                                                                                                                       
+            '302492-302494', # HLT_IsoMu24_v10, 93.282/pb                                                                                                                                        
+            '302509-302509', # HLT_IsoMu24_v10, 4.987/pb                                                                                                                                         
+            '302513-302513', # HLT_IsoMu24_v10, 12.203/pb                                                                                                                                        
+            '302522-302523', # HLT_IsoMu24_v10, 11.257/pb                                                                                                                                        
+            '302525-302526', # HLT_IsoMu24_v10-223.119/pb                                                                                                                                       
+            '302548-302548', # HLT_IsoMu24_v10, 15.74/pb                                                                                                                                         
+            '302551-302551', # HLT_IsoMu24_v10, 0.104/pb     
+            '302553-302555', # HLT_IsoMu24_v10-39.038/pb                                                                                                                                        
+            '302563-302563', # HLT_IsoMu24_v10, 0.32/pb                                                                                                                                          
+            '302565-302565', # HLT_IsoMu24_v10, 0.149/pb                                                                                                                                         
+            '302572-302573', # HLT_IsoMu24_v10-241.684/pb                                                                                                                                       
+            '302596-302597', # HLT_IsoMu24_v10-318.295/pb                                                                                                                                       
+            '302634-302635', # HLT_IsoMu24_v10-300.859/pb                                                                                                                                       
+            '302651-302651', # HLT_IsoMu24_v10-30.035/pb                                                                                                                                        
+            '302654-302654', # HLT_IsoMu24_v10, 63.967/pb                                                                                                                                        
+            '302661-302661', # HLT_IsoMu24_v10, 9.465/pb                                                                                                                                         
+            '302663-302663', # HLT_IsoMu24_v10, 134.254/pb                                                                                                                                       
+            '303825-303825', # HLT_IsoMu24_v10-22.834/pb                                                                                                                                        
+            '303832-303832', # HLT_IsoMu24_v10-319.146/pb                                                                                                                                       
+            '303838-303838', # HLT_IsoMu24_v10-380.035/pb                                                                                                                                       
+            '303885-303885', # HLT_IsoMu24_v10-376.414/pb                                                                                                                                       
+            '303948-303948', # HLT_IsoMu24_v10-351.61/pb                                                                                                                                        
+            '303998-304000', # HLT_IsoMu24_v10-256.409/pb                                                                                                                                       
+            '304062-304062', # HLT_IsoMu24_v10-382.105/pb                                                                                                                                       
+            '304119-304120', # HLT_IsoMu24_v10, 93.285/pb                                                                                                                                        
+            '304125-304125', # HLT_IsoMu24_v10-338.101/pb                                                                                                                                       
+            '304144-304144', # HLT_IsoMu24_v10, 515.153/pb                                                                                                                                       
+            '304158-304158', # HLT_IsoMu24_v10-370.885/pb                                                                                                                                       
+            '304169-304170', # HLT_IsoMu24_v10, 414.145/pb                                                                                                                                       
+            '304199-304200', # HLT_IsoMu24_v10, 88.201/pb                                                                                                                                        
+            '304204-304204', # HLT_IsoMu24_v10, 146.532/pb                                                                                                                                       
+            '304209-304209', # HLT_IsoMu24_v10, 116.174/pb      
+            '304291-304292', # HLT_IsoMu24_v10-327.839/pb                                                                                                                                       
+            '304333-304333', # HLT_IsoMu24_v10-265.074/pb                                                                                                                                       
+            '304366-304366', # HLT_IsoMu24_v10-316.608/pb                                                                                                                                       
+            '304447-304447', # HLT_IsoMu24_v10-297.037/pb                                                                                                                                       
+            '304451-304451', # HLT_IsoMu24_v10, 7.416/pb                                                                                                                                         
+            '304507-304508', # HLT_IsoMu24_v10-287.408/pb                                                                                                                                       
+            '304562-304562', # HLT_IsoMu24_v10, 154.568/pb                                                                                                                                       
+            '304616-304616', # HLT_IsoMu24_v10, 181.339/pb                                                                                                                                       
+            '304625-304626', # HLT_IsoMu24_v10, 45.136/pb                                                                                                                                        
+            '304654-304655', # HLT_IsoMu24_v10-309.562/pb                                                                                                                                       
+            '304662-304663', # HLT_IsoMu24_v10, 187.704/pb                                                                                                                                       
+            '304671-304672', # HLT_IsoMu24_v10, 199.478/pb                                                                                                                                       
+            '304737-304740', # HLT_IsoMu24_v10-337.971/pb                                                                                                                                       
+            '304778-304778', # HLT_IsoMu24_v10-266.217/pb                                                                                                                                       
+            '304797-304797', # HLT_IsoMu24_v10, 435.186/pb                                                                                                                                       
+            '305044-305046', # HLT_IsoMu24_v10-361.031/pb                                                                                                                                       
+            '305059-305059', # HLT_IsoMu24_v10, 1.621/pb                                                                                                                                         
+            '305063-305064', # HLT_IsoMu24_v10-381.37/pb                                                                                                                                        
+            '305081-305081', # HLT_IsoMu24_v10-310.486/pb                                                                                                                                       
+            '305112-305114', # HLT_IsoMu24_v10, 470.526/pb                                                                                                                                       
+            '305186-305186', # HLT_IsoMu24_v10, 12.849/pb                                                                                                                                        
+            '305188-305188', # HLT_IsoMu24_v10, 198.33/pb                                                                                                                                        
+            '305202-305202', # HLT_IsoMu24_v10, 51.016/pb                                                                                                                                        
+            '305204-305204', # HLT_IsoMu24_v10-254.513/pb                                                                                                                                       
+            '305207-305208', # HLT_IsoMu24_v10, 198.447/pb
+            '305234-305234', # HLT_IsoMu24_v10, 8.952/pb                                                                                                                                         
+            '305236-305237', # HLT_IsoMu24_v10-344.353/pb                                                                                                                                       
+            '305247-305248', # HLT_IsoMu24_v10-380.204/pb                                                                                                                                       
+            '305252-305252', # HLT_IsoMu24_v10, 95.04/pb                                                                                                                                         
+            '305282-305282', # HLT_IsoMu24_v10, 40.353/pb                                                                                                                                        
+            '305310-305314', # HLT_IsoMu24_v10, 479.975/pb                                                                                                                                       
+            '305341-305341', # HLT_IsoMu24_v10, 67.358/pb                                                                                                                                        
+            '305349-305351', # HLT_IsoMu24_v10, 186.042/pb                                                                                                                                       
+            '305365-305366', # HLT_IsoMu24_v10-333.13/pb                                                                                                                                        
+            '305377-305377', # HLT_IsoMu24_v10-316.862/pb                                                                                                                                       
+            '305406-305406', # HLT_IsoMu24_v10-244.656/pb                                                                                                                                       
+            '305440-305441', # HLT_IsoMu24_v10, 119.869/pb                                                                                                                                       
+            '305516-305518', # HLT_IsoMu24_v10, 432.701/pb                                                                                                                                       
+            '305586-305586', # HLT_IsoMu24_v10, 170.417/pb                                                                                                                                       
+            '305589-305590', # HLT_IsoMu24_v10-314.815/pb                                                                                                                                       
+            '305636-305636', # HLT_IsoMu24_v10, 525.22/pb                                                                                                                                        
+            '305766-305766', # HLT_IsoMu24_v10-263.689/pb                                                                                                                                       
+            '305809-305809', # HLT_IsoMu24_v10, 45.952/pb                                                                                                                                        
+            '305814-305814', # HLT_IsoMu24_v10, 446.804/pb                                                                                                                                       
+            '305821-305821', # HLT_IsoMu24_v10-240.463/pb                                                                                                                                       
+            '305832-305832', # HLT_IsoMu24_v10, 58.021/pb                                                                                                                                        
+            '305840-305840', # HLT_IsoMu24_v10-251.347/pb                                                                                                                                       
+            '305842-305842', # HLT_IsoMu24_v10, 114.87/pb                                                                                                                                        
+            '305862-305862', # HLT_IsoMu24_v10-202.189/pb                                                                                                                                       
+            '305898-305898', # HLT_IsoMu24_v10-230.935/pb 
+            '305902-305902', # HLT_IsoMu24_v10, 154.345/pb                                                                                                                                       
+            '305967-305967', # HLT_IsoMu24_v10, 10.508/pb                                                                                                                                        
+            '306029-306029', # HLT_IsoMu24_v10-3.145/pb                                                                                                                                         
+            '306036-306038', # HLT_IsoMu24_v10-23.374/pb                                                                                                                                        
+            '306041-306042', # HLT_IsoMu24_v10-200.189/pb                                                                                                                                       
+            '306048-306049', # HLT_IsoMu24_v10, 107.334/pb                                                                                                                                       
+            '306051-306051', # HLT_IsoMu24_v10, 70.67/pb                                                                                                                                         
+            '306091-306092', # HLT_IsoMu24_v10-275.647/pb                                                                                                                                       
+            '306095-306095', # HLT_IsoMu24_v10, 49.131/pb                                                                                                                                        
+            '306121-306122', # HLT_IsoMu24_v10, 69.307/pb                                                                                                                                        
+            '306125-306126', # HLT_IsoMu24_v10, 590.489/pb                                                                                                                                       
+            '306134-306135', # HLT_IsoMu24_v10-336.473/pb                                                                                                                                       
+            '306138-306139', # HLT_IsoMu24_v10-312.896/pb                                                                                                                                       
+            '306153-306155', # HLT_IsoMu24_v10, 580.683/pb                                                                                                                                       
+            '306169-306171', # HLT_IsoMu24_v10, 103.163/pb                                                                                                                                       
+            '306418-306420', # HLT_IsoMu24_v11, 73.423/pb                                                                                                                                        
+            '306422-306423', # HLT_IsoMu24_v11, 120.463/pb                                                                                                                                       
+            '306432-306432', # HLT_IsoMu24_v11-33.338/pb                                                                                                                                        
+            '306454-306460', # HLT_IsoMu24_v11, 635.031/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoMu27 ----------##
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu27"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(27.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '297050-297050', # HLT_IsoMu27_v8, 94.725/pb                                                                                                                                         
+            '297056-297057', # HLT_IsoMu27_v8, 143.741/pb                                                                                                                                        
+            '297099-297101', # HLT_IsoMu27_v9-241.495/pb                                                                                                                                        
+            '297113-297114', # HLT_IsoMu27_v9, 85.001/pb                                                                                                                                         
+            '297175-297178', # HLT_IsoMu27_v9-280.582/pb                                                                                                                                        
+            '297215-297215', # HLT_IsoMu27_v9, 12.287/pb                                                                                                                                         
+            '297218-297219', # HLT_IsoMu27_v9, 425.447/pb                                                                                                                                        
+            '297224-297225', # HLT_IsoMu27_v9, 13.81/pb                                                                                                                                          
+            '297227-297227', # HLT_IsoMu27_v9, 15.669/pb                                                                                                                                         
+            '297292-297293', # HLT_IsoMu27_v9, 198.677/pb                                                                                                                                        
+            '297296-297296', # HLT_IsoMu27_v9, 84.207/pb                                                                                                                                         
+            '297308-297308', # HLT_IsoMu27_v9, 6.298/pb                                                                                                                                          
+            '297359-297359', # HLT_IsoMu27_v9, 13.795/pb                                                                                                                                         
+            '297411-297411', # HLT_IsoMu27_v9-201.578/pb                                                                                                                                        
+            '297424-297426', # HLT_IsoMu27_v9, 97.376/pb                                                                                                                                         
+            '297429-297435', # HLT_IsoMu27_v9, 199.191/pb                                                                                                                                        
+            '297467-297469', # HLT_IsoMu27_v9, 69.859/pb                                                                                                                                         
+            '297483-297488', # HLT_IsoMu27_v9, 471.448/pb                                                                                                                                        
+            '297503-297505', # HLT_IsoMu27_v9-268.446/pb                                                                                                                                        
+            '297557-297558', # HLT_IsoMu27_v10, 158.712/pb                                                                                                                                       
+            '297562-297563', # HLT_IsoMu27_v10, 106.785/pb                                                                                                                                       
+            '297598-297599', # HLT_IsoMu27_v10, 93.85/pb                                                                                                                                         
+            '297603-297606', # HLT_IsoMu27_v10-276.775/pb                                                                                                                                       
+            '297620-297620', # HLT_IsoMu27_v10, 82.127/pb                                                                                                                                        
+            '297656-297656', # HLT_IsoMu27_v10, 93.083/pb                                                                                                                                        
+            '297665-297666', # HLT_IsoMu27_v10, 78.347/pb                                                                                                                                        
+            '297670-297670', # HLT_IsoMu27_v10-2.132/pb                                                                                                                                         
+            '297674-297675', # HLT_IsoMu27_v10, 170.78/pb                                                                                                                                        
+            '297722-297723', # HLT_IsoMu27_v10, 142.686/pb                                                                                                                                       
+            '298996-298997', # HLT_IsoMu27_v10-26.765/pb                                                                                                                                        
+            '299000-299000', # HLT_IsoMu27_v10, 8.038/pb                                                                                                                                         
+            '299042-299042', # HLT_IsoMu27_v10-2.02/pb                                                                                                                                          
+            '299061-299062', # HLT_IsoMu27_v10, 123.32/pb                                                                                                                                        
+            '299064-299065', # HLT_IsoMu27_v10, 73.04/pb                                                                                                                                         
+            '299067-299067', # HLT_IsoMu27_v10, 68.807/pb                                                                                                                                        
+            '299096-299096', # HLT_IsoMu27_v10-24.067/pb                                                                                                                                        
+            '299149-299149', # HLT_IsoMu27_v10, 108.249/pb                                                                                                                                       
+            '299178-299178', # HLT_IsoMu27_v10, 15.791/pb                                                                                                                                        
+            '299180-299180', # HLT_IsoMu27_v10, 15.575/pb     
+            '299184-299185', # HLT_IsoMu27_v10, 146.717/pb                                                                                                                                       
+            '299327-299327', # HLT_IsoMu27_v10, 15.178/pb                                                                                                                                        
+            '299329-299329', # HLT_IsoMu27_v10-37.487/pb                                                                                                                                        
+            '299368-299370', # HLT_IsoMu27_v11-253.498/pb                                                                                                                                       
+            '299380-299381', # HLT_IsoMu27_v11, 66.094/pb                                                                                                                                        
+            '299394-299396', # HLT_IsoMu27_v11, 61.673/pb                                                                                                                                        
+            '299420-299420', # HLT_IsoMu27_v11, 13.23/pb                                                                                                                                         
+            '299443-299443', # HLT_IsoMu27_v11, 5.608/pb                                                                                                                                         
+            '299450-299450', # HLT_IsoMu27_v11, 12.395/pb                                                                                                                                        
+            '299477-299481', # HLT_IsoMu27_v11, 431.547/pb                                                                                                                                       
+            '299593-299595', # HLT_IsoMu27_v11-268.091/pb                                                                                                                                       
+            '299597-299597', # HLT_IsoMu27_v11, 85.37/pb                                                                                                                                         
+            '299649-299649', # HLT_IsoMu27_v11, 56.768/pb                                                                                                                                        
+            '300087-300087', # HLT_IsoMu27_v12, 12.856/pb                                                                                                                                        
+            '300105-300107', # HLT_IsoMu27_v12-34.169/pb                                                                                                                                        
+            '300117-300117', # HLT_IsoMu27_v12, 6.067/pb                                                                                                                                         
+            '300122-300123', # HLT_IsoMu27_v12-394.771/pb                                                                                                                                       
+            '300155-300157', # HLT_IsoMu27_v12, 461.282/pb                                                                                                                                       
+            '300226-300226', # HLT_IsoMu27_v12, 115.963/pb                                                                                                                                       
+            '300233-300240', # HLT_IsoMu27_v12, 435.357/pb                                                                                                                                       
+            '300280-300284', # HLT_IsoMu27_v12-311.422/pb                                                                                                                                       
+            '300364-300375', # HLT_IsoMu27_v12, 59.002/pb                                                                                                                                        
+            '300389-300401', # HLT_IsoMu27_v12-339.844/pb                                                                                                                                       
+            '300459-300459', # HLT_IsoMu27_v12, 81.507/pb                                                                                                                                        
+            '300461-300464', # HLT_IsoMu27_v12, 132.112/pb
+            '300466-300467', # HLT_IsoMu27_v12-202.273/pb                                                                                                                                       
+            '300497-300497', # HLT_IsoMu27_v12, 40.035/pb                                                                                                                                        
+            '300514-300517', # HLT_IsoMu27_v12-379.864/pb                                                                                                                                       
+            '300558-300558', # HLT_IsoMu27_v12, 119.182/pb                                                                                                                                       
+            '300560-300560', # HLT_IsoMu27_v12, 140.271/pb                                                                                                                                       
+            '300574-300576', # HLT_IsoMu27_v12-315.299/pb                                                                                                                                       
+            '300631-300633', # HLT_IsoMu27_v12, 167.565/pb                                                                                                                                       
+            '300635-300636', # HLT_IsoMu27_v12-312.071/pb                                                                                                                                       
+            '300673-300676', # HLT_IsoMu27_v12-23.1/pb                                                                                                                                          
+            '300742-300742', # HLT_IsoMu27_v12, 83.984/pb                                                                                                                                        
+            '300777-300777', # HLT_IsoMu27_v12, 130.415/pb                                                                                                                                       
+            '300780-300780', # HLT_IsoMu27_v12, 79.072/pb                                                                                                                                        
+            '300785-300785', # HLT_IsoMu27_v12-212.774/pb                                                                                                                                       
+            '300806-300806', # HLT_IsoMu27_v12, 54.218/pb                                                                                                                                        
+            '300811-300812', # HLT_IsoMu27_v12, 159.497/pb                                                                                                                                       
+            '300816-300817', # HLT_IsoMu27_v12, 134.15/pb                                                                                                                                        
+            '301046-301046', # HLT_IsoMu27_v12, 4.222/pb                                                                                                                                         
+            '301141-301142', # HLT_IsoMu27_v12, 97.203/pb                                                                                                                                        
+            '301161-301161', # HLT_IsoMu27_v12, 98.077/pb                                                                                                                                        
+            '301165-301165', # HLT_IsoMu27_v12, 15.465/pb                                                                                                                                        
+            '301179-301180', # HLT_IsoMu27_v12, 16.878/pb                                                                                                                                        
+            '301183-301183', # HLT_IsoMu27_v12, 45.299/pb                                                                                                                                        
+            '301281-301281', # HLT_IsoMu27_v12, 18.542/pb                                                                                                                                        
+            '301283-301283', # HLT_IsoMu27_v12, 120.005/pb                                                                                                                                       
+            '301298-301298', # HLT_IsoMu27_v12, 153.993/pb
+            '301323-301323', # HLT_IsoMu27_v12, 165.06/pb                                                                                                                                        
+            '301330-301330', # HLT_IsoMu27_v12, 64.443/pb                                                                                                                                        
+            '301359-301359', # HLT_IsoMu27_v12, 57.278/pb                                                                                                                                        
+            '301384-301384', # HLT_IsoMu27_v12, 94.354/pb                                                                                                                                        
+            '301391-301393', # HLT_IsoMu27_v12, 147.405/pb                                                                                                                                       
+            '301396-301399', # HLT_IsoMu27_v12, 110.63/pb                                                                                                                                        
+            '301417-301417', # HLT_IsoMu27_v12, 67.689/pb                                                                                                                                        
+            '301447-301450', # HLT_IsoMu27_v12, 188.658/pb                                                                                                                                       
+            '301461-301461', # HLT_IsoMu27_v12, 98.122/pb                                                                                                                                        
+            '301472-301472', # HLT_IsoMu27_v12, 138.033/pb                                                                                                                                       
+            '301475-301476', # HLT_IsoMu27_v12, 109.336/pb                                                                                                                                       
+            '301519-301519', # HLT_IsoMu27_v12-33.367/pb                                                                                                                                        
+            '301524-301524', # HLT_IsoMu27_v12, 41.078/pb                                                                                                                                        
+            '301529-301532', # HLT_IsoMu27_v12, 131.943/pb                                                                                                                                       
+            '301567-301567', # HLT_IsoMu27_v12, 63.339/pb                                                                                                                                        
+            '301627-301627', # HLT_IsoMu27_v12, 131.459/pb                                                                                                                                       
+            '301664-301665', # HLT_IsoMu27_v12, 138.42/pb                                                                                                                                        
+            '301694-301694', # HLT_IsoMu27_v12, 17.576/pb                                                                                                                                        
+            '301912-301914', # HLT_IsoMu27_v12, 79.784/pb                                                                                                                                        
+            '301941-301941', # HLT_IsoMu27_v12, 74.507/pb                                                                                                                                        
+            '301959-301960', # HLT_IsoMu27_v12-290.104/pb                                                                                                                                       
+            '301970-301970', # HLT_IsoMu27_v12-22.349/pb                                                                                                                                        
+            '301984-301987', # HLT_IsoMu27_v12-292.622/pb                                                                                                                                       
+            '301997-301998', # HLT_IsoMu27_v12-282.538/pb                                                                                                                                       
+            '302019-302019', # HLT_IsoMu27_v12, 9.113/pb
+            '302026-302026', # HLT_IsoMu27_v13, 4.652/pb                                                                                                                                         
+            '302029-302029', # HLT_IsoMu27_v13, 15.282/pb                                                                                                                                        
+            '302031-302031', # HLT_IsoMu27_v13, 128.522/pb                                                                                                                                       
+            '302033-302034', # HLT_IsoMu27_v13, 5.657/pb                                                                                                                                         
+            '302037-302038', # HLT_IsoMu27_v13, 0.069/pb                                                                                                                                         
+            '302040-302043', # HLT_IsoMu27_v13, 104.438/pb                                                                                                                                       
+            '302131-302131', # HLT_IsoMu27_v13, 111.635/pb                                                                                                                                       
+            '302159-302159', # HLT_IsoMu27_v13, 16.077/pb                                                                                                                                        
+            '302163-302163', # HLT_IsoMu27_v13, 146.312/pb                                                                                                                                       
+            '302165-302166', # HLT_IsoMu27_v13, 8.409/pb                                                                                                                                         
+            '302225-302225', # HLT_IsoMu27_v13, 114.788/pb                                                                                                                                       
+            '302228-302229', # HLT_IsoMu27_v13, 105.812/pb                                                                                                                                       
+            '302240-302240', # HLT_IsoMu27_v13, 138.868/pb                                                                                                                                       
+            '302262-302263', # HLT_IsoMu27_v13-241.353/pb                                                                                                                                       
+            '302277-302277', # HLT_IsoMu27_v13, 53.761/pb                                                                                                                                        
+            '302279-302280', # HLT_IsoMu27_v13, 18.474/pb                                                                                                                                        
+            '302322-302322', # HLT_IsoMu27_v13, 96.87/pb                                                                                                                                         
+            '302328-302328', # HLT_IsoMu27_v13, 93.45/pb                                                                                                                                         
+            '302337-302337', # HLT_IsoMu27_v13-20.377/pb                                                                                                                                        
+            '302342-302344', # HLT_IsoMu27_v13, 91.05/pb                                                                                                                                         
+            '302350-302350', # HLT_IsoMu27_v13, 16.493/pb                                                                                                                                        
+            '302388-302388', # HLT_IsoMu27_v13, 126.264/pb                                                                                                                                       
+            '302392-302393', # HLT_IsoMu27_v13-232.234/pb                                                                                                                                       
+            '302448-302448', # HLT_IsoMu27_v13-307.867/pb                                                                                                                                       
+            '302472-302476', # HLT_IsoMu27_v13-292.111/pb
+            '302479-302479', # HLT_IsoMu27_v13, 68.381/pb                                                                                                                                        
+            '302484-302485', # HLT_IsoMu27_v13-209.762/pb                                                                                                                                       
+            '302492-302494', # HLT_IsoMu27_v13, 93.282/pb                                                                                                                                        
+            '302509-302509', # HLT_IsoMu27_v13, 4.987/pb                                                                                                                                         
+            '302513-302513', # HLT_IsoMu27_v13, 12.203/pb                                                                                                                                        
+            '302522-302523', # HLT_IsoMu27_v13, 11.257/pb                                                                                                                                        
+            '302525-302526', # HLT_IsoMu27_v13-223.119/pb                                                                                                                                       
+            '302548-302548', # HLT_IsoMu27_v13, 15.74/pb                                                                                                                                         
+            '302551-302551', # HLT_IsoMu27_v13, 0.104/pb                                                                                                                                         
+            '302553-302555', # HLT_IsoMu27_v13-39.038/pb                                                                                                                                        
+            '302563-302563', # HLT_IsoMu27_v13, 0.32/pb                                                                                                                                          
+            '302565-302565', # HLT_IsoMu27_v13, 0.149/pb                                                                                                                                         
+            '302572-302573', # HLT_IsoMu27_v13-241.684/pb                                                                                                                                       
+            '302596-302597', # HLT_IsoMu27_v13-318.295/pb                                                                                                                                       
+            '302634-302635', # HLT_IsoMu27_v13-300.859/pb                                                                                                                                       
+            '302651-302651', # HLT_IsoMu27_v13-30.035/pb                                                                                                                                        
+            '302654-302654', # HLT_IsoMu27_v13, 63.967/pb                                                                                                                                        
+            '302661-302661', # HLT_IsoMu27_v13, 9.465/pb                                                                                                                                         
+            '302663-302663', # HLT_IsoMu27_v13, 134.254/pb                                                                                                                                       
+            '303825-303825', # HLT_IsoMu27_v13-22.834/pb                                                                                                                                        
+            '303832-303832', # HLT_IsoMu27_v13-321.326/pb                                                                                                                                       
+            '303838-303838', # HLT_IsoMu27_v13-380.035/pb                                                                                                                                       
+            '303885-303885', # HLT_IsoMu27_v13, 400.159/pb                                                                                                                                       
+            '303948-303948', # HLT_IsoMu27_v13-351.61/pb                                                                                                                                        
+            '303998-304000', # HLT_IsoMu27_v13-256.409/pb 
+            '304062-304062', # HLT_IsoMu27_v13-382.105/pb                                                                                                                                       
+            '304119-304120', # HLT_IsoMu27_v13, 93.285/pb                                                                                                                                        
+            '304125-304125', # HLT_IsoMu27_v13-338.101/pb                                                                                                                                       
+            '304144-304144', # HLT_IsoMu27_v13, 533.881/pb                                                                                                                                       
+            '304158-304158', # HLT_IsoMu27_v13-370.885/pb                                                                                                                                       
+            '304169-304170', # HLT_IsoMu27_v13, 414.145/pb                                                                                                                                       
+            '304199-304200', # HLT_IsoMu27_v13, 88.201/pb                                                                                                                                        
+            '304204-304204', # HLT_IsoMu27_v13, 153.182/pb                                                                                                                                       
+            '304209-304209', # HLT_IsoMu27_v13, 116.174/pb                                                                                                                                       
+            '304291-304292', # HLT_IsoMu27_v13-350.613/pb                                                                                                                                       
+            '304333-304333', # HLT_IsoMu27_v13-366.646/pb                                                                                                                                       
+            '304354-304354', # HLT_IsoMu27_v13, 68.255/pb                                                                                                                                        
+            '304366-304366', # HLT_IsoMu27_v13, 419.018/pb                                                                                                                                       
+            '304446-304447', # HLT_IsoMu27_v13-385.306/pb                                                                                                                                       
+            '304451-304451', # HLT_IsoMu27_v13, 7.416/pb                                                                                                                                         
+            '304505-304508', # HLT_IsoMu27_v13, 425.864/pb                                                                                                                                       
+            '304562-304562', # HLT_IsoMu27_v13-221.934/pb                                                                                                                                       
+            '304616-304616', # HLT_IsoMu27_v13-253.369/pb                                                                                                                                       
+            '304625-304626', # HLT_IsoMu27_v13, 138.626/pb                                                                                                                                       
+            '304654-304655', # HLT_IsoMu27_v13, 403.545/pb                                                                                                                                       
+            '304661-304663', # HLT_IsoMu27_v13-266.757/pb                                                                                                                                       
+            '304671-304672', # HLT_IsoMu27_v13-320.532/pb                                                                                                                                       
+            '304737-304740', # HLT_IsoMu27_v13, 474.819/pb                                                                                                                                       
+            '304776-304778', # HLT_IsoMu27_v13, 432.15/pb                                                                                                                                        
+            '304797-304797', # HLT_IsoMu27_v13, 557.403/pb
+            '305044-305046', # HLT_IsoMu27_v13-378.033/pb                                                                                                                                       
+            '305059-305059', # HLT_IsoMu27_v13, 157.786/pb                                                                                                                                       
+            '305062-305064', # HLT_IsoMu27_v13-390.89/pb                                                                                                                                        
+            '305081-305081', # HLT_IsoMu27_v13-315.14/pb                                                                                                                                        
+            '305112-305114', # HLT_IsoMu27_v13, 497.055/pb                                                                                                                                       
+            '305178-305184', # HLT_IsoMu27_v13, 100.554/pb                                                                                                                                       
+            '305186-305186', # HLT_IsoMu27_v13, 122.05/pb                                                                                                                                        
+            '305188-305188', # HLT_IsoMu27_v13, 198.33/pb                                                                                                                                        
+            '305202-305202', # HLT_IsoMu27_v13-207.76/pb                                                                                                                                        
+            '305204-305204', # HLT_IsoMu27_v13-254.513/pb                                                                                                                                       
+            '305207-305208', # HLT_IsoMu27_v13, 401.157/pb                                                                                                                                       
+            '305234-305234', # HLT_IsoMu27_v13, 12.655/pb                                                                                                                                        
+            '305236-305237', # HLT_IsoMu27_v13-344.353/pb                                                                                                                                       
+            '305247-305248', # HLT_IsoMu27_v13-380.308/pb                                                                                                                                       
+            '305252-305252', # HLT_IsoMu27_v13, 95.04/pb                                                                                                                                         
+            '305282-305282', # HLT_IsoMu27_v13, 44.345/pb                                                                                                                                        
+            '305310-305314', # HLT_IsoMu27_v13, 481.671/pb                                                                                                                                       
+            '305336-305336', # HLT_IsoMu27_v13, 66.203/pb                                                                                                                                        
+            '305338-305338', # HLT_IsoMu27_v13-33.112/pb                                                                                                                                        
+            '305341-305341', # HLT_IsoMu27_v13, 151.78/pb                                                                                                                                        
+            '305349-305351', # HLT_IsoMu27_v13, 186.042/pb                                                                                                                                       
+            '305358-305358', # HLT_IsoMu27_v13, 49.594/pb                                                                                                                                        
+            '305364-305366', # HLT_IsoMu27_v13, 511.673/pb                                                                                                                                       
+            '305376-305377', # HLT_IsoMu27_v13, 431.522/pb                                                                                                                                       
+            '305405-305406', # HLT_IsoMu27_v13, 475.515/pb 
+            '305440-305441', # HLT_IsoMu27_v13, 119.869/pb                                                                                                                                       
+            '305516-305518', # HLT_IsoMu27_v13, 438.593/pb                                                                                                                                       
+            '305586-305586', # HLT_IsoMu27_v13, 171.033/pb                                                                                                                                       
+            '305589-305590', # HLT_IsoMu27_v13-314.815/pb                                                                                                                                       
+            '305636-305636', # HLT_IsoMu27_v13, 525.22/pb                                                                                                                                        
+            '305766-305766', # HLT_IsoMu27_v13-263.689/pb                                                                                                                                       
+            '305809-305809', # HLT_IsoMu27_v13, 45.952/pb                                                                                                                                        
+            '305814-305814', # HLT_IsoMu27_v13, 446.804/pb                                                                                                                                       
+            '305821-305821', # HLT_IsoMu27_v13-240.463/pb                                                                                                                                       
+            '305832-305832', # HLT_IsoMu27_v13, 58.021/pb                                                                                                                                        
+            '305840-305840', # HLT_IsoMu27_v13-251.347/pb                                                                                                                                       
+            '305842-305842', # HLT_IsoMu27_v13, 114.87/pb                                                                                                                                        
+            '305862-305862', # HLT_IsoMu27_v13-202.189/pb                                                                                                                                       
+            '305898-305898', # HLT_IsoMu27_v13-230.935/pb                                                                                                                                       
+            '305902-305902', # HLT_IsoMu27_v13, 154.345/pb                                                                                                                                       
+            '305967-305967', # HLT_IsoMu27_v13, 10.508/pb                                                                                                                                        
+            '306029-306030', # HLT_IsoMu27_v13, 44.125/pb                                                                                                                                        
+            '306036-306038', # HLT_IsoMu27_v13, 56.442/pb                                                                                                                                        
+            '306041-306042', # HLT_IsoMu27_v13-200.189/pb                                                                                                                                       
+            '306048-306049', # HLT_IsoMu27_v13, 107.334/pb                                                                                                                                       
+            '306051-306051', # HLT_IsoMu27_v13, 70.67/pb                                                                                                                                         
+            '306091-306092', # HLT_IsoMu27_v13-280.74/pb                                                                                                                                        
+            '306095-306095', # HLT_IsoMu27_v13, 49.131/pb                                                                                                                                        
+            '306121-306122', # HLT_IsoMu27_v13, 69.307/pb                                                                                                                                        
+            '306125-306126', # HLT_IsoMu27_v13, 590.489/pb 
+            '306134-306135', # HLT_IsoMu27_v13-336.473/pb                                                                                                                                       
+            '306138-306139', # HLT_IsoMu27_v13-312.896/pb                                                                                                                                       
+            '306153-306155', # HLT_IsoMu27_v13, 580.683/pb                                                                                                                                       
+            '306169-306171', # HLT_IsoMu27_v13, 103.163/pb                                                                                                                                       
+            '306418-306420', # HLT_IsoMu27_v14, 73.423/pb                                                                                                                                        
+            '306422-306423', # HLT_IsoMu27_v14, 120.463/pb                                                                                                                                       
+            '306432-306432', # HLT_IsoMu27_v14-33.338/pb                                                                                                                                        
+            '306454-306460', # HLT_IsoMu27_v14, 635.031/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ), ## mu VPSet ENDS
+
+  'e' : cms.VPSet(
+    ##---------HLT_Ele32_WPTight_Gsf ----------##
+    cms.PSet( # 1e PSet 32-100 BEGINS
+      path = cms.string("HLT_Ele32_WPTight_Gsf"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(32.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+            '302026-302026', # HLT_Ele32_WPTight_Gsf_v13, 4.652/pb                                                                                                                               
+            '302029-302029', # HLT_Ele32_WPTight_Gsf_v13, 15.282/pb                                                                                                                              
+            '302031-302031', # HLT_Ele32_WPTight_Gsf_v13, 128.522/pb                                                                                                                             
+            '302033-302034', # HLT_Ele32_WPTight_Gsf_v13, 5.657/pb                                                                                                                               
+            '302037-302038', # HLT_Ele32_WPTight_Gsf_v13, 0.069/pb                                                                                                                               
+            '302040-302043', # HLT_Ele32_WPTight_Gsf_v13, 104.438/pb                                                                                                                             
+            '302131-302131', # HLT_Ele32_WPTight_Gsf_v13, 111.635/pb                                                                                                                             
+            '302159-302159', # HLT_Ele32_WPTight_Gsf_v13, 16.077/pb                                                                                                                              
+            '302163-302163', # HLT_Ele32_WPTight_Gsf_v13, 146.312/pb                                                                                                                             
+            '302165-302166', # HLT_Ele32_WPTight_Gsf_v13, 8.409/pb                                                                                                                               
+            '302225-302225', # HLT_Ele32_WPTight_Gsf_v13, 114.788/pb                                                                                                                             
+            '302228-302229', # HLT_Ele32_WPTight_Gsf_v13, 105.812/pb                                                                                                                             
+            '302240-302240', # HLT_Ele32_WPTight_Gsf_v13, 138.868/pb                                                                                                                             
+            '302262-302263', # HLT_Ele32_WPTight_Gsf_v13-241.353/pb                                                                                                                             
+            '302277-302277', # HLT_Ele32_WPTight_Gsf_v13, 53.761/pb                                                                                                                              
+            '302279-302280', # HLT_Ele32_WPTight_Gsf_v13, 18.474/pb                                                                                                                              
+            '302322-302322', # HLT_Ele32_WPTight_Gsf_v13, 96.87/pb                                                                                                                               
+            '302328-302328', # HLT_Ele32_WPTight_Gsf_v13, 93.45/pb                                                                                                                               
+            '302337-302337', # HLT_Ele32_WPTight_Gsf_v13-20.377/pb                                                                                                                              
+            '302342-302344', # HLT_Ele32_WPTight_Gsf_v13, 91.05/pb                                                                                                                               
+            '302350-302350', # HLT_Ele32_WPTight_Gsf_v13, 16.493/pb                                                                                                                              
+            '302388-302388', # HLT_Ele32_WPTight_Gsf_v13, 126.264/pb                                                                                                                             
+            '302392-302393', # HLT_Ele32_WPTight_Gsf_v13-232.234/pb                                                                                                                             
+            '302448-302448', # HLT_Ele32_WPTight_Gsf_v13-307.867/pb                                                                                                                             
+            '302472-302476', # HLT_Ele32_WPTight_Gsf_v13-292.111/pb                                                                                                                             
+            '302479-302479', # HLT_Ele32_WPTight_Gsf_v13, 68.381/pb                                                                                                                              
+            '302484-302485', # HLT_Ele32_WPTight_Gsf_v13-209.762/pb                                                                                                                             
+            '302492-302494', # HLT_Ele32_WPTight_Gsf_v13, 93.282/pb                                                                                                                              
+            '302509-302509', # HLT_Ele32_WPTight_Gsf_v13, 4.987/pb                                                                                                                               
+            '302513-302513', # HLT_Ele32_WPTight_Gsf_v13, 12.203/pb                                                                                                                              
+            '302522-302523', # HLT_Ele32_WPTight_Gsf_v13, 11.257/pb                                                                                                                              
+            '302525-302526', # HLT_Ele32_WPTight_Gsf_v13-223.119/pb                                                                                                                             
+            '302548-302548', # HLT_Ele32_WPTight_Gsf_v13, 15.74/pb                                                                                                                               
+            '302551-302551', # HLT_Ele32_WPTight_Gsf_v13, 0.104/pb                                                                                                                               
+            '302553-302555', # HLT_Ele32_WPTight_Gsf_v13-39.038/pb                                                                                                                              
+            '302563-302563', # HLT_Ele32_WPTight_Gsf_v13, 0.32/pb                                                                                                                                
+            '302565-302565', # HLT_Ele32_WPTight_Gsf_v13, 0.149/pb                                                                                                                               
+            '302572-302573', # HLT_Ele32_WPTight_Gsf_v13-241.684/pb                                                                                                                             
+            '302596-302597', # HLT_Ele32_WPTight_Gsf_v13-318.295/pb                                                                                                                             
+            '302634-302635', # HLT_Ele32_WPTight_Gsf_v13-300.859/pb                                                                                                                             
+            '302651-302651', # HLT_Ele32_WPTight_Gsf_v13-30.035/pb                                                                                                                              
+            '302654-302654', # HLT_Ele32_WPTight_Gsf_v13, 63.967/pb  
+            '302661-302661', # HLT_Ele32_WPTight_Gsf_v13, 9.465/pb                                                                                                                               
+            '302663-302663', # HLT_Ele32_WPTight_Gsf_v13, 134.254/pb                                                                                                                             
+            '303825-303825', # HLT_Ele32_WPTight_Gsf_v13-22.834/pb                                                                                                                              
+            '303832-303832', # HLT_Ele32_WPTight_Gsf_v13-321.326/pb                                                                                                                             
+            '303838-303838', # HLT_Ele32_WPTight_Gsf_v13-380.035/pb                                                                                                                             
+            '303885-303885', # HLT_Ele32_WPTight_Gsf_v13, 400.159/pb                                                                                                                             
+            '303948-303948', # HLT_Ele32_WPTight_Gsf_v13-351.61/pb                                                                                                                              
+            '303998-304000', # HLT_Ele32_WPTight_Gsf_v13-256.409/pb                                                                                                                             
+            '304062-304062', # HLT_Ele32_WPTight_Gsf_v13-382.105/pb                                                                                                                             
+            '304119-304120', # HLT_Ele32_WPTight_Gsf_v13, 93.285/pb                                                                                                                              
+            '304125-304125', # HLT_Ele32_WPTight_Gsf_v13-338.101/pb                                                                                                                             
+            '304144-304144', # HLT_Ele32_WPTight_Gsf_v13, 533.881/pb                                                                                                                             
+            '304158-304158', # HLT_Ele32_WPTight_Gsf_v13-370.885/pb                                                                                                                             
+            '304169-304170', # HLT_Ele32_WPTight_Gsf_v13, 414.145/pb                                                                                                                             
+            '304199-304200', # HLT_Ele32_WPTight_Gsf_v13, 88.201/pb                                                                                                                              
+            '304204-304204', # HLT_Ele32_WPTight_Gsf_v13, 153.182/pb                                                                                                                             
+            '304209-304209', # HLT_Ele32_WPTight_Gsf_v13, 116.174/pb                                                                                                                             
+            '304291-304292', # HLT_Ele32_WPTight_Gsf_v13-350.613/pb                                                                                                                             
+            '304333-304333', # HLT_Ele32_WPTight_Gsf_v13-366.646/pb                                                                                                                             
+            '304354-304354', # HLT_Ele32_WPTight_Gsf_v13, 68.255/pb                                                                                                                              
+            '304366-304366', # HLT_Ele32_WPTight_Gsf_v13, 419.018/pb                                                                                                                             
+            '304446-304447', # HLT_Ele32_WPTight_Gsf_v13-385.306/pb                                                                                                                             
+            '304451-304451', # HLT_Ele32_WPTight_Gsf_v13, 7.416/pb                                                                                                                               
+            '304505-304508', # HLT_Ele32_WPTight_Gsf_v13, 425.864/pb                                                                                                                             
+            '304562-304562', # HLT_Ele32_WPTight_Gsf_v13-221.934/pb
+            '304616-304616', # HLT_Ele32_WPTight_Gsf_v13-253.369/pb                                                                                                                             
+            '304625-304626', # HLT_Ele32_WPTight_Gsf_v13, 138.626/pb                                                                                                                             
+            '304654-304655', # HLT_Ele32_WPTight_Gsf_v13, 403.545/pb                                                                                                                             
+            '304661-304663', # HLT_Ele32_WPTight_Gsf_v13-266.757/pb                                                                                                                             
+            '304671-304672', # HLT_Ele32_WPTight_Gsf_v13-320.532/pb                                                                                                                             
+            '304737-304740', # HLT_Ele32_WPTight_Gsf_v13, 474.819/pb                                                                                                                             
+            '304776-304778', # HLT_Ele32_WPTight_Gsf_v13, 432.15/pb                                                                                                                              
+            '304797-304797', # HLT_Ele32_WPTight_Gsf_v13, 557.403/pb                                                                                                                             
+            '305044-305046', # HLT_Ele32_WPTight_Gsf_v13-378.033/pb                                                                                                                             
+            '305059-305059', # HLT_Ele32_WPTight_Gsf_v13, 157.786/pb                                                                                                                             
+            '305062-305064', # HLT_Ele32_WPTight_Gsf_v13-390.89/pb                                                                                                                              
+            '305081-305081', # HLT_Ele32_WPTight_Gsf_v13-315.14/pb                                                                                                                              
+            '305112-305114', # HLT_Ele32_WPTight_Gsf_v13, 497.055/pb                                                                                                                             
+            '305178-305184', # HLT_Ele32_WPTight_Gsf_v13, 100.554/pb                                                                                                                             
+            '305186-305186', # HLT_Ele32_WPTight_Gsf_v13, 122.05/pb                                                                                                                              
+            '305188-305188', # HLT_Ele32_WPTight_Gsf_v13, 198.33/pb                                                                                                                              
+            '305202-305202', # HLT_Ele32_WPTight_Gsf_v13-207.76/pb                                                                                                                              
+            '305204-305204', # HLT_Ele32_WPTight_Gsf_v13-254.513/pb                                                                                                                             
+            '305207-305208', # HLT_Ele32_WPTight_Gsf_v13, 401.157/pb                                                                                                                             
+            '305234-305234', # HLT_Ele32_WPTight_Gsf_v13, 12.655/pb                                                                                                                              
+            '305236-305237', # HLT_Ele32_WPTight_Gsf_v13-344.353/pb                                                                                                                             
+            '305247-305248', # HLT_Ele32_WPTight_Gsf_v13-380.308/pb                                                                                                                             
+            '305252-305252', # HLT_Ele32_WPTight_Gsf_v13, 95.04/pb                                                                                                                               
+            '305282-305282', # HLT_Ele32_WPTight_Gsf_v13, 44.345/pb                                                                                                                              
+            '305310-305314', # HLT_Ele32_WPTight_Gsf_v13, 481.671/pb     
+            '305336-305336', # HLT_Ele32_WPTight_Gsf_v13, 66.203/pb                                                                                                                              
+            '305338-305338', # HLT_Ele32_WPTight_Gsf_v13-33.112/pb                                                                                                                              
+            '305341-305341', # HLT_Ele32_WPTight_Gsf_v13, 151.78/pb                                                                                                                              
+            '305349-305351', # HLT_Ele32_WPTight_Gsf_v13, 186.042/pb                                                                                                                             
+            '305358-305358', # HLT_Ele32_WPTight_Gsf_v13, 49.594/pb                                                                                                                              
+            '305364-305366', # HLT_Ele32_WPTight_Gsf_v13, 511.673/pb                                                                                                                             
+            '305376-305377', # HLT_Ele32_WPTight_Gsf_v13, 431.522/pb                                                                                                                             
+            '305405-305406', # HLT_Ele32_WPTight_Gsf_v13, 475.515/pb                                                                                                                             
+            '305440-305441', # HLT_Ele32_WPTight_Gsf_v13, 119.869/pb                                                                                                                             
+            '305516-305518', # HLT_Ele32_WPTight_Gsf_v13, 438.593/pb                                                                                                                             
+            '305586-305586', # HLT_Ele32_WPTight_Gsf_v13, 171.033/pb                                                                                                                             
+            '305589-305590', # HLT_Ele32_WPTight_Gsf_v13-314.815/pb                                                                                                                             
+            '305636-305636', # HLT_Ele32_WPTight_Gsf_v13, 525.22/pb                                                                                                                              
+            '305766-305766', # HLT_Ele32_WPTight_Gsf_v13-263.689/pb                                                                                                                             
+            '305809-305809', # HLT_Ele32_WPTight_Gsf_v13, 45.952/pb                                                                                                                              
+            '305814-305814', # HLT_Ele32_WPTight_Gsf_v13, 446.804/pb                                                                                                                             
+            '305821-305821', # HLT_Ele32_WPTight_Gsf_v13-240.463/pb                                                                                                                             
+            '305832-305832', # HLT_Ele32_WPTight_Gsf_v13, 58.021/pb                                                                                                                              
+            '305840-305840', # HLT_Ele32_WPTight_Gsf_v13-251.347/pb                                                                                                                             
+            '305842-305842', # HLT_Ele32_WPTight_Gsf_v13, 114.87/pb                                                                                                                              
+            '305862-305862', # HLT_Ele32_WPTight_Gsf_v13-202.189/pb                                                                                                                             
+            '305898-305898', # HLT_Ele32_WPTight_Gsf_v13-230.935/pb                                                                                                                             
+            '305902-305902', # HLT_Ele32_WPTight_Gsf_v13, 154.345/pb                                                                                                                             
+            '305967-305967', # HLT_Ele32_WPTight_Gsf_v13, 10.508/pb                                                                                                                              
+            '306029-306030', # HLT_Ele32_WPTight_Gsf_v13, 44.125/pb      
+            '306036-306038', # HLT_Ele32_WPTight_Gsf_v13, 56.442/pb                                                                                                                              
+            '306041-306042', # HLT_Ele32_WPTight_Gsf_v13-200.189/pb                                                                                                                             
+            '306048-306049', # HLT_Ele32_WPTight_Gsf_v13, 107.334/pb                                                                                                                             
+            '306051-306051', # HLT_Ele32_WPTight_Gsf_v13, 70.67/pb                                                                                                                               
+            '306091-306092', # HLT_Ele32_WPTight_Gsf_v13-280.74/pb                                                                                                                              
+            '306095-306095', # HLT_Ele32_WPTight_Gsf_v13, 49.131/pb                                                                                                                              
+            '306121-306122', # HLT_Ele32_WPTight_Gsf_v13, 69.307/pb                                                                                                                              
+            '306125-306126', # HLT_Ele32_WPTight_Gsf_v13, 590.489/pb                                                                                                                             
+            '306134-306135', # HLT_Ele32_WPTight_Gsf_v13-336.473/pb                                                                                                                             
+            '306138-306139', # HLT_Ele32_WPTight_Gsf_v13-312.896/pb                                                                                                                             
+            '306153-306155', # HLT_Ele32_WPTight_Gsf_v13, 580.683/pb                                                                                                                             
+            '306169-306171', # HLT_Ele32_WPTight_Gsf_v13, 103.163/pb                                                                                                                             
+            '306418-306420', # HLT_Ele32_WPTight_Gsf_v13, 73.423/pb                                                                                                                              
+            '306422-306423', # HLT_Ele32_WPTight_Gsf_v13, 120.463/pb                                                                                                                             
+            '306432-306432', # HLT_Ele32_WPTight_Gsf_v13-33.338/pb                                                                                                                              
+            '306454-306460', # HLT_Ele32_WPTight_Gsf_v13, 635.031/pb
+        )),
+      ), # 1e PSet 32-100 ENDS
+    ##---------HLT_Ele35_WPTight_Gsf ----------##
+    cms.PSet( # 1e PSet 32-100 BEGINS
+      path = cms.string("HLT_Ele35_WPTight_Gsf"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(35.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+            '297050-297050', # HLT_Ele35_WPTight_Gsf_v1, 94.725/pb                                                                                                                               
+            '297056-297057', # HLT_Ele35_WPTight_Gsf_v1, 143.741/pb                                                                                                                              
+            '297099-297101', # HLT_Ele35_WPTight_Gsf_v2-241.495/pb                                                                                                                              
+            '297113-297114', # HLT_Ele35_WPTight_Gsf_v2, 85.001/pb                                                                                                                               
+            '297175-297178', # HLT_Ele35_WPTight_Gsf_v2-280.582/pb                                                                                                                              
+            '297215-297215', # HLT_Ele35_WPTight_Gsf_v2, 12.287/pb                                                                                                                               
+            '297218-297219', # HLT_Ele35_WPTight_Gsf_v2, 425.447/pb                                                                                                                              
+            '297224-297225', # HLT_Ele35_WPTight_Gsf_v2, 13.81/pb                                                                                                                                
+            '297227-297227', # HLT_Ele35_WPTight_Gsf_v2, 15.669/pb                                                                                                                               
+            '297292-297293', # HLT_Ele35_WPTight_Gsf_v2, 198.677/pb                                                                                                                              
+            '297296-297296', # HLT_Ele35_WPTight_Gsf_v2, 84.207/pb                                                                                                                               
+            '297308-297308', # HLT_Ele35_WPTight_Gsf_v2, 6.298/pb                                                                                                                                
+            '297359-297359', # HLT_Ele35_WPTight_Gsf_v2, 13.795/pb                                                                                                                               
+            '297411-297411', # HLT_Ele35_WPTight_Gsf_v2-201.578/pb                                                                                                                              
+            '297424-297426', # HLT_Ele35_WPTight_Gsf_v2, 97.376/pb                                                                                                                               
+            '297429-297435', # HLT_Ele35_WPTight_Gsf_v2, 199.191/pb                                                                                                                              
+            '297467-297469', # HLT_Ele35_WPTight_Gsf_v2, 69.859/pb                                                                                                                               
+            '297483-297488', # HLT_Ele35_WPTight_Gsf_v2, 471.448/pb                                                                                                                              
+            '297503-297505', # HLT_Ele35_WPTight_Gsf_v2-268.446/pb                                                                                                                              
+            '297557-297558', # HLT_Ele35_WPTight_Gsf_v3, 158.712/pb                                                                                                                              
+            '297562-297563', # HLT_Ele35_WPTight_Gsf_v3, 106.785/pb                                                                                                                              
+            '297598-297599', # HLT_Ele35_WPTight_Gsf_v3, 93.85/pb                                                                                                                                
+            '297603-297606', # HLT_Ele35_WPTight_Gsf_v3-276.775/pb                                                                                                                              
+            '297620-297620', # HLT_Ele35_WPTight_Gsf_v3, 82.127/pb                                                                                                                               
+            '297656-297656', # HLT_Ele35_WPTight_Gsf_v3, 93.083/pb                                                                                                                               
+            '297665-297666', # HLT_Ele35_WPTight_Gsf_v3, 78.347/pb                                                                                                                               
+            '297670-297670', # HLT_Ele35_WPTight_Gsf_v3-2.132/pb                                                                                                                                
+            '297674-297675', # HLT_Ele35_WPTight_Gsf_v3, 170.78/pb                                                                                                                               
+            '297722-297723', # HLT_Ele35_WPTight_Gsf_v3, 142.686/pb                                                                                                                              
+            '298996-298997', # HLT_Ele35_WPTight_Gsf_v3-26.765/pb                                                                                                                               
+            '299000-299000', # HLT_Ele35_WPTight_Gsf_v3, 8.038/pb                                                                                                                                
+            '299042-299042', # HLT_Ele35_WPTight_Gsf_v3-2.02/pb                                                                                                                                 
+            '299061-299062', # HLT_Ele35_WPTight_Gsf_v3, 123.32/pb                                                                                                                               
+            '299064-299065', # HLT_Ele35_WPTight_Gsf_v3, 73.04/pb                                                                                                                                
+            '299067-299067', # HLT_Ele35_WPTight_Gsf_v3, 68.807/pb                                                                                                                               
+            '299096-299096', # HLT_Ele35_WPTight_Gsf_v3-24.067/pb                                                                                                                               
+            '299149-299149', # HLT_Ele35_WPTight_Gsf_v3, 108.249/pb                                                                                                                              
+            '299178-299178', # HLT_Ele35_WPTight_Gsf_v3, 15.791/pb                                                                                                                               
+            '299180-299180', # HLT_Ele35_WPTight_Gsf_v3, 15.575/pb                                                                                                                               
+            '299184-299185', # HLT_Ele35_WPTight_Gsf_v3, 146.717/pb                                                                                                                              
+            '299327-299327', # HLT_Ele35_WPTight_Gsf_v3, 15.178/pb                                                                                                                               
+            '299329-299329', # HLT_Ele35_WPTight_Gsf_v3-37.487/pb                                                                                                                               
+            '299368-299370', # HLT_Ele35_WPTight_Gsf_v4-253.498/pb                                                                                                                              
+            '299380-299381', # HLT_Ele35_WPTight_Gsf_v4, 66.094/pb                                                                                                                               
+            '299394-299396', # HLT_Ele35_WPTight_Gsf_v4, 61.673/pb                                                                                                                               
+            '299420-299420', # HLT_Ele35_WPTight_Gsf_v4, 13.23/pb       
+            '299443-299443', # HLT_Ele35_WPTight_Gsf_v4, 5.608/pb                                                                                                                                
+            '299450-299450', # HLT_Ele35_WPTight_Gsf_v4, 12.395/pb                                                                                                                               
+            '299477-299481', # HLT_Ele35_WPTight_Gsf_v4, 431.547/pb                                                                                                                              
+            '299593-299595', # HLT_Ele35_WPTight_Gsf_v4-268.091/pb                                                                                                                              
+            '299597-299597', # HLT_Ele35_WPTight_Gsf_v4, 85.37/pb                                                                                                                                
+            '299649-299649', # HLT_Ele35_WPTight_Gsf_v4, 56.768/pb                                                                                                                               
+            '300087-300087', # HLT_Ele35_WPTight_Gsf_v5, 12.856/pb                                                                                                                               
+            '300105-300107', # HLT_Ele35_WPTight_Gsf_v5-34.169/pb                                                                                                                               
+            '300117-300117', # HLT_Ele35_WPTight_Gsf_v5, 6.067/pb                                                                                                                                
+            '300122-300123', # HLT_Ele35_WPTight_Gsf_v5-394.771/pb                                                                                                                              
+            '300155-300157', # HLT_Ele35_WPTight_Gsf_v5, 461.282/pb                                                                                                                              
+            '300226-300226', # HLT_Ele35_WPTight_Gsf_v5, 115.963/pb                                                                                                                              
+            '300233-300240', # HLT_Ele35_WPTight_Gsf_v5, 435.357/pb                                                                                                                              
+            '300280-300284', # HLT_Ele35_WPTight_Gsf_v5-311.422/pb                                                                                                                              
+            '300364-300375', # HLT_Ele35_WPTight_Gsf_v5, 59.002/pb                                                                                                                               
+            '300389-300401', # HLT_Ele35_WPTight_Gsf_v5-339.844/pb                                                                                                                              
+            '300459-300459', # HLT_Ele35_WPTight_Gsf_v5, 81.507/pb                                                                                                                               
+            '300461-300464', # HLT_Ele35_WPTight_Gsf_v5, 132.112/pb                                                                                                                              
+            '300466-300467', # HLT_Ele35_WPTight_Gsf_v5-202.273/pb                                                                                                                              
+            '300497-300497', # HLT_Ele35_WPTight_Gsf_v5, 40.035/pb                                                                                                                               
+            '300514-300517', # HLT_Ele35_WPTight_Gsf_v5-379.864/pb                                                                                                                              
+            '300558-300558', # HLT_Ele35_WPTight_Gsf_v5, 119.182/pb                                                                                                                              
+            '300560-300560', # HLT_Ele35_WPTight_Gsf_v5, 140.271/pb                                                                                                                              
+            '300574-300576', # HLT_Ele35_WPTight_Gsf_v5-315.299/pb                                                                                                                              
+            '300631-300633', # HLT_Ele35_WPTight_Gsf_v5, 167.565/pb
+            '300635-300636', # HLT_Ele35_WPTight_Gsf_v5-312.071/pb                                                                                                                              
+            '300673-300676', # HLT_Ele35_WPTight_Gsf_v5-23.1/pb                                                                                                                                 
+            '300742-300742', # HLT_Ele35_WPTight_Gsf_v5, 83.984/pb                                                                                                                               
+            '300777-300777', # HLT_Ele35_WPTight_Gsf_v5, 130.415/pb                                                                                                                              
+            '300780-300780', # HLT_Ele35_WPTight_Gsf_v5, 79.072/pb                                                                                                                               
+            '300785-300785', # HLT_Ele35_WPTight_Gsf_v5-212.774/pb                                                                                                                              
+            '300806-300806', # HLT_Ele35_WPTight_Gsf_v5, 54.218/pb                                                                                                                               
+            '300811-300812', # HLT_Ele35_WPTight_Gsf_v5, 159.497/pb                                                                                                                              
+            '300816-300817', # HLT_Ele35_WPTight_Gsf_v5, 134.15/pb                                                                                                                               
+            '301046-301046', # HLT_Ele35_WPTight_Gsf_v6, 4.222/pb                                                                                                                                
+            '301141-301142', # HLT_Ele35_WPTight_Gsf_v6, 97.203/pb                                                                                                                               
+            '301161-301161', # HLT_Ele35_WPTight_Gsf_v6, 98.077/pb                                                                                                                               
+            '301165-301165', # HLT_Ele35_WPTight_Gsf_v6, 15.465/pb                                                                                                                               
+            '301179-301180', # HLT_Ele35_WPTight_Gsf_v6, 16.878/pb                                                                                                                               
+            '301183-301183', # HLT_Ele35_WPTight_Gsf_v6, 45.299/pb                                                                                                                               
+            '301281-301281', # HLT_Ele35_WPTight_Gsf_v6, 18.542/pb                                                                                                                               
+            '301283-301283', # HLT_Ele35_WPTight_Gsf_v6, 120.005/pb                                                                                                                              
+            '301298-301298', # HLT_Ele35_WPTight_Gsf_v6, 153.993/pb                                                                                                                              
+            '301323-301323', # HLT_Ele35_WPTight_Gsf_v6, 165.06/pb                                                                                                                               
+            '301330-301330', # HLT_Ele35_WPTight_Gsf_v6, 64.443/pb                                                                                                                               
+            '301359-301359', # HLT_Ele35_WPTight_Gsf_v6, 57.278/pb                                                                                                                               
+            '301384-301384', # HLT_Ele35_WPTight_Gsf_v6, 94.354/pb                                                                                                                               
+            '301391-301393', # HLT_Ele35_WPTight_Gsf_v6, 147.405/pb                                                                                                                              
+            '301396-301399', # HLT_Ele35_WPTight_Gsf_v6, 110.63/pb                                                                                                                               
+            '301417-301417', # HLT_Ele35_WPTight_Gsf_v6, 67.689/pb
+            '301447-301450', # HLT_Ele35_WPTight_Gsf_v6, 188.658/pb                                                                                                                              
+            '301461-301461', # HLT_Ele35_WPTight_Gsf_v6, 98.122/pb                                                                                                                               
+            '301472-301472', # HLT_Ele35_WPTight_Gsf_v6, 138.033/pb                                                                                                                              
+            '301475-301476', # HLT_Ele35_WPTight_Gsf_v6, 109.336/pb                                                                                                                              
+            '301519-301519', # HLT_Ele35_WPTight_Gsf_v6-33.367/pb                                                                                                                               
+            '301524-301524', # HLT_Ele35_WPTight_Gsf_v6, 41.078/pb                                                                                                                               
+            '301529-301532', # HLT_Ele35_WPTight_Gsf_v6, 131.943/pb                                                                                                                              
+            '301567-301567', # HLT_Ele35_WPTight_Gsf_v6, 63.339/pb                                                                                                                               
+            '301627-301627', # HLT_Ele35_WPTight_Gsf_v6, 131.459/pb                                                                                                                              
+            '301664-301665', # HLT_Ele35_WPTight_Gsf_v6, 138.42/pb                                                                                                                               
+            '301694-301694', # HLT_Ele35_WPTight_Gsf_v6, 17.576/pb                                                                                                                               
+            '301912-301914', # HLT_Ele35_WPTight_Gsf_v6, 79.784/pb                                                                                                                               
+            '301941-301941', # HLT_Ele35_WPTight_Gsf_v6, 74.507/pb                                                                                                                               
+            '301959-301960', # HLT_Ele35_WPTight_Gsf_v6-290.104/pb                                                                                                                              
+            '301970-301970', # HLT_Ele35_WPTight_Gsf_v6-22.349/pb                                                                                                                               
+            '301984-301987', # HLT_Ele35_WPTight_Gsf_v6-292.622/pb                                                                                                                              
+            '301997-301998', # HLT_Ele35_WPTight_Gsf_v6-282.538/pb                                                                                                                              
+            '302019-302019', # HLT_Ele35_WPTight_Gsf_v6, 9.113/pb                                                                                                                                
+            '302026-302026', # HLT_Ele35_WPTight_Gsf_v7, 4.652/pb                                                                                                                                
+            '302029-302029', # HLT_Ele35_WPTight_Gsf_v7, 15.282/pb                                                                                                                               
+            '302031-302031', # HLT_Ele35_WPTight_Gsf_v7, 128.522/pb                                                                                                                              
+            '302033-302034', # HLT_Ele35_WPTight_Gsf_v7, 5.657/pb                                                                                                                                
+            '302037-302038', # HLT_Ele35_WPTight_Gsf_v7, 0.069/pb                                                                                                                                
+            '302040-302043', # HLT_Ele35_WPTight_Gsf_v7, 104.438/pb                                                                                                                              
+            '302131-302131', # HLT_Ele35_WPTight_Gsf_v7, 111.635/pb 
+            '302159-302159', # HLT_Ele35_WPTight_Gsf_v7, 16.077/pb                                                                                                                               
+            '302163-302163', # HLT_Ele35_WPTight_Gsf_v7, 146.312/pb                                                                                                                              
+            '302165-302166', # HLT_Ele35_WPTight_Gsf_v7, 8.409/pb                                                                                                                                
+            '302225-302225', # HLT_Ele35_WPTight_Gsf_v7, 114.788/pb                                                                                                                              
+            '302228-302229', # HLT_Ele35_WPTight_Gsf_v7, 105.812/pb                                                                                                                              
+            '302240-302240', # HLT_Ele35_WPTight_Gsf_v7, 138.868/pb                                                                                                                              
+            '302262-302263', # HLT_Ele35_WPTight_Gsf_v7-241.353/pb                                                                                                                              
+            '302277-302277', # HLT_Ele35_WPTight_Gsf_v7, 53.761/pb                                                                                                                               
+            '302279-302280', # HLT_Ele35_WPTight_Gsf_v7, 18.474/pb                                                                                                                               
+            '302322-302322', # HLT_Ele35_WPTight_Gsf_v7, 96.87/pb                                                                                                                                
+            '302328-302328', # HLT_Ele35_WPTight_Gsf_v7, 93.45/pb                                                                                                                                
+            '302337-302337', # HLT_Ele35_WPTight_Gsf_v7-20.377/pb                                                                                                                               
+            '302342-302344', # HLT_Ele35_WPTight_Gsf_v7, 91.05/pb                                                                                                                                
+            '302350-302350', # HLT_Ele35_WPTight_Gsf_v7, 16.493/pb                                                                                                                               
+            '302388-302388', # HLT_Ele35_WPTight_Gsf_v7, 126.264/pb                                                                                                                              
+            '302392-302393', # HLT_Ele35_WPTight_Gsf_v7-232.234/pb                                                                                                                              
+            '302448-302448', # HLT_Ele35_WPTight_Gsf_v7-307.867/pb                                                                                                                              
+            '302472-302476', # HLT_Ele35_WPTight_Gsf_v7-292.111/pb                                                                                                                              
+            '302479-302479', # HLT_Ele35_WPTight_Gsf_v7, 68.381/pb                                                                                                                               
+            '302484-302485', # HLT_Ele35_WPTight_Gsf_v7-209.762/pb                                                                                                                              
+            '302492-302494', # HLT_Ele35_WPTight_Gsf_v7, 93.282/pb                                                                                                                               
+            '302509-302509', # HLT_Ele35_WPTight_Gsf_v7, 4.987/pb                                                                                                                                
+            '302513-302513', # HLT_Ele35_WPTight_Gsf_v7, 12.203/pb                                                                                                                               
+            '302522-302523', # HLT_Ele35_WPTight_Gsf_v7, 11.257/pb                                                                                                                               
+            '302525-302526', # HLT_Ele35_WPTight_Gsf_v7-223.119/pb      
+            '302548-302548', # HLT_Ele35_WPTight_Gsf_v7, 15.74/pb                                                                                                                                
+            '302551-302551', # HLT_Ele35_WPTight_Gsf_v7, 0.104/pb                                                                                                                                
+            '302553-302555', # HLT_Ele35_WPTight_Gsf_v7-39.038/pb                                                                                                                               
+            '302563-302563', # HLT_Ele35_WPTight_Gsf_v7, 0.32/pb                                                                                                                                 
+            '302565-302565', # HLT_Ele35_WPTight_Gsf_v7, 0.149/pb                                                                                                                                
+            '302572-302573', # HLT_Ele35_WPTight_Gsf_v7-241.684/pb                                                                                                                              
+            '302596-302597', # HLT_Ele35_WPTight_Gsf_v7-318.295/pb                                                                                                                              
+            '302634-302635', # HLT_Ele35_WPTight_Gsf_v7-300.859/pb                                                                                                                              
+            '302651-302651', # HLT_Ele35_WPTight_Gsf_v7-30.035/pb                                                                                                                               
+            '302654-302654', # HLT_Ele35_WPTight_Gsf_v7, 63.967/pb                                                                                                                               
+            '302661-302661', # HLT_Ele35_WPTight_Gsf_v7, 9.465/pb                                                                                                                                
+            '302663-302663', # HLT_Ele35_WPTight_Gsf_v7, 134.254/pb                                                                                                                              
+            '303825-303825', # HLT_Ele35_WPTight_Gsf_v7-22.834/pb                                                                                                                               
+            '303832-303832', # HLT_Ele35_WPTight_Gsf_v7-321.326/pb                                                                                                                              
+            '303838-303838', # HLT_Ele35_WPTight_Gsf_v7-380.035/pb                                                                                                                              
+            '303885-303885', # HLT_Ele35_WPTight_Gsf_v7, 400.159/pb                                                                                                                              
+            '303948-303948', # HLT_Ele35_WPTight_Gsf_v7-351.61/pb                                                                                                                               
+            '303998-304000', # HLT_Ele35_WPTight_Gsf_v7-256.409/pb                                                                                                                              
+            '304062-304062', # HLT_Ele35_WPTight_Gsf_v7-382.105/pb                                                                                                                              
+            '304119-304120', # HLT_Ele35_WPTight_Gsf_v7, 93.285/pb                                                                                                                               
+            '304125-304125', # HLT_Ele35_WPTight_Gsf_v7-338.101/pb                                                                                                                              
+            '304144-304144', # HLT_Ele35_WPTight_Gsf_v7, 533.881/pb                                                                                                                              
+            '304158-304158', # HLT_Ele35_WPTight_Gsf_v7-370.885/pb                                                                                                                              
+            '304169-304170', # HLT_Ele35_WPTight_Gsf_v7, 414.145/pb                                                                                                                              
+            '304199-304200', # HLT_Ele35_WPTight_Gsf_v7, 88.201/pb    
+            '304204-304204', # HLT_Ele35_WPTight_Gsf_v7, 153.182/pb                                                                                                                              
+            '304209-304209', # HLT_Ele35_WPTight_Gsf_v7, 116.174/pb                                                                                                                              
+            '304291-304292', # HLT_Ele35_WPTight_Gsf_v7-350.613/pb                                                                                                                              
+            '304333-304333', # HLT_Ele35_WPTight_Gsf_v7-366.646/pb                                                                                                                              
+            '304354-304354', # HLT_Ele35_WPTight_Gsf_v7, 68.255/pb                                                                                                                               
+            '304366-304366', # HLT_Ele35_WPTight_Gsf_v7, 419.018/pb                                                                                                                              
+            '304446-304447', # HLT_Ele35_WPTight_Gsf_v7-385.306/pb                                                                                                                              
+            '304451-304451', # HLT_Ele35_WPTight_Gsf_v7, 7.416/pb                                                                                                                                
+            '304505-304508', # HLT_Ele35_WPTight_Gsf_v7, 425.864/pb                                                                                                                              
+            '304562-304562', # HLT_Ele35_WPTight_Gsf_v7-221.934/pb                                                                                                                              
+            '304616-304616', # HLT_Ele35_WPTight_Gsf_v7-253.369/pb                                                                                                                              
+            '304625-304626', # HLT_Ele35_WPTight_Gsf_v7, 138.626/pb                                                                                                                              
+            '304654-304655', # HLT_Ele35_WPTight_Gsf_v7, 403.545/pb                                                                                                                              
+            '304661-304663', # HLT_Ele35_WPTight_Gsf_v7-266.757/pb                                                                                                                              
+            '304671-304672', # HLT_Ele35_WPTight_Gsf_v7-320.532/pb                                                                                                                              
+            '304737-304740', # HLT_Ele35_WPTight_Gsf_v7, 474.819/pb                                                                                                                              
+            '304776-304778', # HLT_Ele35_WPTight_Gsf_v7, 432.15/pb                                                                                                                               
+            '304797-304797', # HLT_Ele35_WPTight_Gsf_v7, 557.403/pb                                                                                                                              
+            '305044-305046', # HLT_Ele35_WPTight_Gsf_v7-378.033/pb                                                                                                                              
+            '305059-305059', # HLT_Ele35_WPTight_Gsf_v7, 157.786/pb                                                                                                                              
+            '305062-305064', # HLT_Ele35_WPTight_Gsf_v7-390.89/pb                                                                                                                               
+            '305081-305081', # HLT_Ele35_WPTight_Gsf_v7-315.14/pb                                                                                                                               
+            '305112-305114', # HLT_Ele35_WPTight_Gsf_v7, 497.055/pb                                                                                                                              
+            '305178-305184', # HLT_Ele35_WPTight_Gsf_v7, 100.554/pb                                                                                                                              
+            '305186-305186', # HLT_Ele35_WPTight_Gsf_v7, 122.05/pb   
+            '305188-305188', # HLT_Ele35_WPTight_Gsf_v7, 198.33/pb                                                                                                                               
+            '305202-305202', # HLT_Ele35_WPTight_Gsf_v7-207.76/pb                                                                                                                               
+            '305204-305204', # HLT_Ele35_WPTight_Gsf_v7-254.513/pb                                                                                                                              
+            '305207-305208', # HLT_Ele35_WPTight_Gsf_v7, 401.157/pb                                                                                                                              
+            '305234-305234', # HLT_Ele35_WPTight_Gsf_v7, 12.655/pb                                                                                                                               
+            '305236-305237', # HLT_Ele35_WPTight_Gsf_v7-344.353/pb                                                                                                                              
+            '305247-305248', # HLT_Ele35_WPTight_Gsf_v7-380.308/pb                                                                                                                              
+            '305252-305252', # HLT_Ele35_WPTight_Gsf_v7, 95.04/pb                                                                                                                                
+            '305282-305282', # HLT_Ele35_WPTight_Gsf_v7, 44.345/pb                                                                                                                               
+            '305310-305314', # HLT_Ele35_WPTight_Gsf_v7, 481.671/pb                                                                                                                              
+            '305336-305336', # HLT_Ele35_WPTight_Gsf_v7, 66.203/pb                                                                                                                               
+            '305338-305338', # HLT_Ele35_WPTight_Gsf_v7-33.112/pb                                                                                                                               
+            '305341-305341', # HLT_Ele35_WPTight_Gsf_v7, 151.78/pb                                                                                                                               
+            '305349-305351', # HLT_Ele35_WPTight_Gsf_v7, 186.042/pb                                                                                                                              
+            '305358-305358', # HLT_Ele35_WPTight_Gsf_v7, 49.594/pb                                                                                                                               
+            '305364-305366', # HLT_Ele35_WPTight_Gsf_v7, 511.673/pb                                                                                                                              
+            '305376-305377', # HLT_Ele35_WPTight_Gsf_v7, 431.522/pb                                                                                                                              
+            '305405-305406', # HLT_Ele35_WPTight_Gsf_v7, 475.515/pb                                                                                                                              
+            '305440-305441', # HLT_Ele35_WPTight_Gsf_v7, 119.869/pb                                                                                                                              
+            '305516-305518', # HLT_Ele35_WPTight_Gsf_v7, 438.593/pb                                                                                                                              
+            '305586-305586', # HLT_Ele35_WPTight_Gsf_v7, 171.033/pb                                                                                                                              
+            '305589-305590', # HLT_Ele35_WPTight_Gsf_v7-314.815/pb                                                                                                                              
+            '305636-305636', # HLT_Ele35_WPTight_Gsf_v7, 525.22/pb                                                                                                                               
+            '305766-305766', # HLT_Ele35_WPTight_Gsf_v7-263.689/pb                                                                                                                              
+            '305809-305809', # HLT_Ele35_WPTight_Gsf_v7, 45.952/pb   
+            '305814-305814', # HLT_Ele35_WPTight_Gsf_v7, 446.804/pb                                                                                                                              
+            '305821-305821', # HLT_Ele35_WPTight_Gsf_v7-240.463/pb                                                                                                                              
+            '305832-305832', # HLT_Ele35_WPTight_Gsf_v7, 58.021/pb                                                                                                                               
+            '305840-305840', # HLT_Ele35_WPTight_Gsf_v7-251.347/pb                                                                                                                              
+            '305842-305842', # HLT_Ele35_WPTight_Gsf_v7, 114.87/pb                                                                                                                               
+            '305862-305862', # HLT_Ele35_WPTight_Gsf_v7-202.189/pb                                                                                                                              
+            '305898-305898', # HLT_Ele35_WPTight_Gsf_v7-230.935/pb                                                                                                                              
+            '305902-305902', # HLT_Ele35_WPTight_Gsf_v7, 154.345/pb                                                                                                                              
+            '305967-305967', # HLT_Ele35_WPTight_Gsf_v7, 10.508/pb                                                                                                                               
+            '306029-306030', # HLT_Ele35_WPTight_Gsf_v7, 44.125/pb                                                                                                                               
+            '306036-306038', # HLT_Ele35_WPTight_Gsf_v7, 56.442/pb                                                                                                                               
+            '306041-306042', # HLT_Ele35_WPTight_Gsf_v7-200.189/pb                                                                                                                              
+            '306048-306049', # HLT_Ele35_WPTight_Gsf_v7, 107.334/pb                                                                                                                              
+            '306051-306051', # HLT_Ele35_WPTight_Gsf_v7, 70.67/pb                                                                                                                                
+            '306091-306092', # HLT_Ele35_WPTight_Gsf_v7-280.74/pb                                                                                                                               
+            '306095-306095', # HLT_Ele35_WPTight_Gsf_v7, 49.131/pb                                                                                                                               
+            '306121-306122', # HLT_Ele35_WPTight_Gsf_v7, 69.307/pb                                                                                                                               
+            '306125-306126', # HLT_Ele35_WPTight_Gsf_v7, 590.489/pb                                                                                                                              
+            '306134-306135', # HLT_Ele35_WPTight_Gsf_v7-336.473/pb                                                                                                                              
+            '306138-306139', # HLT_Ele35_WPTight_Gsf_v7-312.896/pb                                                                                                                              
+            '306153-306155', # HLT_Ele35_WPTight_Gsf_v7, 580.683/pb                                                                                                                              
+            '306169-306171', # HLT_Ele35_WPTight_Gsf_v7, 103.163/pb                                                                                                                              
+            '306418-306420', # HLT_Ele35_WPTight_Gsf_v7, 73.423/pb                                                                                                                               
+            '306422-306423', # HLT_Ele35_WPTight_Gsf_v7, 120.463/pb                                                                                                                              
+            '306432-306432', # HLT_Ele35_WPTight_Gsf_v7-33.338/pb        
+            '306454-306460', # HLT_Ele35_WPTight_Gsf_v7, 635.031/pb
+        )),
+      ), # 1e PSet 32-100 ENDS
+    ), ## e VPSet ENDS
+}
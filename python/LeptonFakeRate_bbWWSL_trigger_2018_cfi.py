@@ -0,0 +1,935 @@
+import FWCore.ParameterSet.Config as cms
+
+leptonFR_triggers = {
+  'mu' : cms.VPSet( ## mu VPSet BEGINS
+    ##---------HLT_IsoMu24----------##
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu24"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(24.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '315257-315257', # HLT_IsoMu24_v11, 7.929/pb                                                                                                                                         
+            '315259-315259', # HLT_IsoMu24_v11, 13.919/pb                                                                                                                                        
+            '315264-315265', # HLT_IsoMu24_v11, 46.158/pb                                                                                                                                        
+            '315267-315267', # HLT_IsoMu24_v11-37.143/pb                                                                                                                                        
+            '315270-315270', # HLT_IsoMu24_v11, 78.981/pb                                                                                                                                        
+            '315322-315322', # HLT_IsoMu24_v11, 180.063/pb                                                                                                                                       
+            '315339-315339', # HLT_IsoMu24_v11, 93.349/pb                                                                                                                                        
+            '315357-315357', # HLT_IsoMu24_v11, 151.931/pb                                                                                                                                       
+            '315361-315361', # HLT_IsoMu24_v11, 118.532/pb                                                                                                                                       
+            '315363-315363', # HLT_IsoMu24_v11, 14.489/pb                                                                                                                                        
+            '315366-315366', # HLT_IsoMu24_v11, 100.183/pb                                                                                                                                       
+            '315420-315420', # HLT_IsoMu24_v11, 258.566/pb                                                                                                                                       
+            '315488-315490', # HLT_IsoMu24_v11, 296.522/pb                                                                                                                                       
+            '315506-315506', # HLT_IsoMu24_v11, 27.983/pb                                                                                                                                        
+            '315510-315510', # HLT_IsoMu24_v11, 103.172/pb                                                                                                                                       
+            '315512-315512', # HLT_IsoMu24_v11, 236.871/pb                                                                                                                                       
+            '315543-315543', # HLT_IsoMu24_v11-36.886/pb                                                                                                                                        
+            '315555-315557', # HLT_IsoMu24_v11, 114.498/pb                                                                                                                                       
+            '315640-315642', # HLT_IsoMu24_v11, 43.181/pb                                                                                                                                        
+            '315644-315648', # HLT_IsoMu24_v11, 439.459/pb                                                                                                                                       
+            '315689-315690', # HLT_IsoMu24_v11, 448.961/pb                                                                                                                                       
+            '315702-315705', # HLT_IsoMu24_v11-328.569/pb                                                                                                                                       
+            '315713-315713', # HLT_IsoMu24_v11-353.735/pb                                                                                                                                       
+            '315721-315721', # HLT_IsoMu24_v11, 210.579/pb                                                                                                                                       
+            '315741-315741', # HLT_IsoMu24_v11, 23.717/pb                                                                                                                                        
+            '315764-315764', # HLT_IsoMu24_v11, 114.011/pb                                                                                                                                       
+            '315770-315770', # HLT_IsoMu24_v11, 121.796/pb                                                                                                                                       
+            '315784-315786', # HLT_IsoMu24_v11, 179.651/pb                                                                                                                                       
+            '315790-315790', # HLT_IsoMu24_v11, 173.124/pb                                                                                                                                       
+            '315800-315801', # HLT_IsoMu24_v11-304.75/pb                                                                                                                                        
+            '315840-315840', # HLT_IsoMu24_v11-354.111/pb                                                                                                                                       
+            '315973-315974', # HLT_IsoMu24_v11/HLT_IsoMu24_v12, 297.118/pb                                                                                                                       
+            '316058-316062', # HLT_IsoMu24_v12, 512.949/pb                                                                                                                                       
+            '316082-316082', # HLT_IsoMu24_v12, 141.36/pb                                                                                                                                        
+            '316110-316111', # HLT_IsoMu24_v12, 97.131/pb                                                                                                                                        
+            '316113-316114', # HLT_IsoMu24_v12-388.486/pb                                                                                                                                       
+            '316153-316153', # HLT_IsoMu24_v12, 256.24/pb                                                                                                                                        
+            '316186-316187', # HLT_IsoMu24_v12, 519.417/pb                                                                                                                                       
+            '316199-316202', # HLT_IsoMu24_v12, 589.387/pb                                                                                                                                       
+            '316216-316219', # HLT_IsoMu24_v12, 551.849/pb                                                                                                                                       
+            '316239-316241', # HLT_IsoMu24_v12, 546.196/pb                                                                                                                                       
+            '316271-316271', # HLT_IsoMu24_v12, 29.698/pb                                                                                                                                        
+            '316361-316363', # HLT_IsoMu24_v13, 84.941/pb                                                                                                                                        
+            '316377-316380', # HLT_IsoMu24_v13, 188.825/pb                                                                                                                                       
+            '316455-316455', # HLT_IsoMu24_v13, 9.607/pb       
+            '316457-316457', # HLT_IsoMu24_v13-326.273/pb                                                                                                                                       
+            '316469-316470', # HLT_IsoMu24_v13, 265.747/pb                                                                                                                                       
+            '316472-316472', # HLT_IsoMu24_v13, 66.237/pb                                                                                                                                        
+            '316505-316505', # HLT_IsoMu24_v13, 401.22/pb                                                                                                                                        
+            '316569-316569', # HLT_IsoMu24_v13, 485.569/pb                                                                                                                                       
+            '316590-316590', # HLT_IsoMu24_v13, 189.247/pb                                                                                                                                       
+            '316613-316613', # HLT_IsoMu24_v13-31.466/pb                                                                                                                                        
+            '316615-316615', # HLT_IsoMu24_v13, 49.127/pb                                                                                                                                        
+            '316666-316667', # HLT_IsoMu24_v13-321.521/pb                                                                                                                                       
+            '316700-316702', # HLT_IsoMu24_v13-353.699/pb                                                                                                                                       
+            '316715-316723', # HLT_IsoMu24_v13, 440.225/pb                                                                                                                                       
+            '316758-316758', # HLT_IsoMu24_v13, 455.683/pb                                                                                                                                       
+            '316766-316766', # HLT_IsoMu24_v13, 561.053/pb                                                                                                                                       
+            '316876-316877', # HLT_IsoMu24_v13-327.431/pb                                                                                                                                       
+            '316879-316879', # HLT_IsoMu24_v13-36.513/pb                                                                                                                                        
+            '316928-316928', # HLT_IsoMu24_v13, 44.417/pb                                                                                                                                        
+            '316985-316985', # HLT_IsoMu24_v13, 172.546/pb                                                                                                                                       
+            '316993-316995', # HLT_IsoMu24_v13, 265.445/pb                                                                                                                                       
+            '317080-317080', # HLT_IsoMu24_v13, 7.844/pb                                                                                                                                         
+            '317087-317087', # HLT_IsoMu24_v13, 243.2/pb                                                                                                                                         
+            '317089-317089', # HLT_IsoMu24_v13, 212.905/pb                                                                                                                                       
+            '317182-317182', # HLT_IsoMu24_v13, 406.207/pb                                                                                                                                       
+            '317212-317213', # HLT_IsoMu24_v13, 176.661/pb                                                                                                                                       
+            '317279-317279', # HLT_IsoMu24_v13, 65.892/pb                                                                                                                                        
+            '317291-317292', # HLT_IsoMu24_v13-359.036/pb                                                                                                                                       
+            '317297-317297', # HLT_IsoMu24_v13, 123.799/pb           
+            '317319-317320', # HLT_IsoMu24_v13, 514.282/pb                                                                                                                                       
+            '317338-317340', # HLT_IsoMu24_v13, 219.977/pb                                                                                                                                       
+            '317382-317383', # HLT_IsoMu24_v13, 46.591/pb                                                                                                                                        
+            '317391-317392', # HLT_IsoMu24_v13, 493.374/pb                                                                                                                                       
+            '317435-317435', # HLT_IsoMu24_v13-360.613/pb                                                                                                                                       
+            '317438-317438', # HLT_IsoMu24_v13, 49.71/pb                                                                                                                                         
+            '317475-317475', # HLT_IsoMu24_v13, 25.761/pb                                                                                                                                        
+            '317478-317478', # HLT_IsoMu24_v13, 7.937/pb                                                                                                                                         
+            '317484-317484', # HLT_IsoMu24_v13, 160.356/pb                                                                                                                                       
+            '317488-317488', # HLT_IsoMu24_v13, 181.128/pb                                                                                                                                       
+            '317527-317527', # HLT_IsoMu24_v13, 452.099/pb                                                                                                                                       
+            '317591-317591', # HLT_IsoMu24_v13, 111.117/pb                                                                                                                                       
+            '317626-317626', # HLT_IsoMu24_v13, 528.94/pb                                                                                                                                        
+            '317640-317641', # HLT_IsoMu24_v13, 529.494/pb                                                                                                                                       
+            '317648-317650', # HLT_IsoMu24_v13, 483.09/pb                                                                                                                                        
+            '317661-317661', # HLT_IsoMu24_v13-375.651/pb                                                                                                                                       
+            '317663-317663', # HLT_IsoMu24_v13, 153.301/pb                                                                                                                                       
+            '317683-317683', # HLT_IsoMu24_v13, 117.852/pb                                                                                                                                       
+            '317696-317696', # HLT_IsoMu24_v13, 228.787/pb                                                                                                                                       
+            '318733-318733', # HLT_IsoMu24_v13, 2.792/pb                                                                                                                                         
+            '318828-318828', # HLT_IsoMu24_v13, 13.229/pb                                                                                                                                        
+            '318872-318872', # HLT_IsoMu24_v13, 91.855/pb                                                                                                                                        
+            '318874-318874', # HLT_IsoMu24_v13, 99.565/pb                                                                                                                                        
+            '318876-318877', # HLT_IsoMu24_v13, 207.136/pb                                                                                                                                       
+            '319077-319077', # HLT_IsoMu24_v13, 16.372/pb                                                                                                                                        
+            '319337-319337', # HLT_IsoMu24_v13, 232.389/pb            
+            '319347-319349', # HLT_IsoMu24_v13, 256.706/pb                                                                                                                                       
+            '319449-319450', # HLT_IsoMu24_v13, 456.219/pb                                                                                                                                       
+            '319456-319456', # HLT_IsoMu24_v13, 52.016/pb                                                                                                                                        
+            '319459-319459', # HLT_IsoMu24_v13, 17.212/pb                                                                                                                                        
+            '319486-319486', # HLT_IsoMu24_v13, 20.315/pb                                                                                                                                        
+            '319503-319503', # HLT_IsoMu24_v13, 90.959/pb                                                                                                                                        
+            '319524-319524', # HLT_IsoMu24_v13, 456.701/pb                                                                                                                                       
+            '319526-319526', # HLT_IsoMu24_v13, 69.66/pb                                                                                                                                         
+            '319528-319528', # HLT_IsoMu24_v13, 58.411/pb                                                                                                                                        
+            '319579-319579', # HLT_IsoMu24_v13, 818.49/pb                                                                                                                                        
+            '319625-319625', # HLT_IsoMu24_v13, 70.596/pb                                                                                                                                        
+            '319639-319639', # HLT_IsoMu24_v13, 409.34/pb                                                                                                                                        
+            '319656-319659', # HLT_IsoMu24_v13, 221.8/pb                                                                                                                                         
+            '319678-319678', # HLT_IsoMu24_v13, 95.425/pb                                                                                                                                        
+            '319687-319687', # HLT_IsoMu24_v13, 16.053/pb                                                                                                                                        
+            '319697-319698', # HLT_IsoMu24_v13, 96.857/pb                                                                                                                                        
+            '319756-319756', # HLT_IsoMu24_v13, 490.205/pb                                                                                                                                       
+            '319840-319841', # HLT_IsoMu24_v13, 69.999/pb                                                                                                                                        
+            '319847-319849', # HLT_IsoMu24_v13, 193.537/pb                                                                                                                                       
+            '319851-319851', # HLT_IsoMu24_v13, 1.137/pb                                                                                                                                         
+            '319853-319854', # HLT_IsoMu24_v13, 124.92/pb                                                                                                                                        
+            '319908-319910', # HLT_IsoMu24_v13-324.281/pb                                                                                                                                       
+            '319912-319915', # HLT_IsoMu24_v13, 119.686/pb                                                                                                                                       
+            '319941-319942', # HLT_IsoMu24_v13, 111.886/pb                                                                                                                                       
+            '319950-319950', # HLT_IsoMu24_v13, 65.936/pb                                                                                                                                        
+            '319991-319993', # HLT_IsoMu24_v13, 530.374/pb    
+            '320002-320002', # HLT_IsoMu24_v13, 50.203/pb                                                                                                                                        
+            '320006-320006', # HLT_IsoMu24_v13, 114.14/pb                                                                                                                                        
+            '320010-320012', # HLT_IsoMu24_v13, 153.875/pb                                                                                                                                       
+            '320023-320026', # HLT_IsoMu24_v13-305.475/pb                                                                                                                                       
+            '320038-320040', # HLT_IsoMu24_v13, 404.341/pb                                                                                                                                       
+            '320059-320065', # HLT_IsoMu24_v13-395.979/pb                                                                                                                                       
+            '320673-320674', # HLT_IsoMu24_v13, 98.341/pb                                                                                                                                        
+            '320688-320688', # HLT_IsoMu24_v13, 130.855/pb                                                                                                                                       
+            '320712-320712', # HLT_IsoMu24_v13, 69.58/pb                                                                                                                                         
+            '320757-320757', # HLT_IsoMu24_v13, 116.684/pb                                                                                                                                       
+            '320804-320804', # HLT_IsoMu24_v13-319.033/pb                                                                                                                                       
+            '320807-320807', # HLT_IsoMu24_v13, 0.348/pb                                                                                                                                         
+            '320809-320809', # HLT_IsoMu24_v13, 106.231/pb                                                                                                                                       
+            '320821-320824', # HLT_IsoMu24_v13, 454.293/pb                                                                                                                                       
+            '320838-320838', # HLT_IsoMu24_v13, 92.366/pb                                                                                                                                        
+            '320840-320841', # HLT_IsoMu24_v13, 191.511/pb                                                                                                                                       
+            '320853-320859', # HLT_IsoMu24_v13, 433.068/pb                                                                                                                                       
+            '320887-320888', # HLT_IsoMu24_v13, 113.862/pb                                                                                                                                       
+            '320916-320917', # HLT_IsoMu24_v13, 484.437/pb                                                                                                                                       
+            '320920-320920', # HLT_IsoMu24_v13, 24.013/pb                                                                                                                                        
+            '320933-320934', # HLT_IsoMu24_v13, 262.426/pb                                                                                                                                       
+            '320936-320936', # HLT_IsoMu24_v13, 78.32/pb                                                                                                                                         
+            '320941-320941', # HLT_IsoMu24_v13, 15.638/pb                                                                                                                                        
+            '320980-320980', # HLT_IsoMu24_v13-38.408/pb                                                                                                                                        
+            '320995-320996', # HLT_IsoMu24_v13, 74.084/pb                                                                                                                                        
+            '321004-321007', # HLT_IsoMu24_v13-320.57/pb       
+            '321009-321012', # HLT_IsoMu24_v13, 105.863/pb                                                                                                                                       
+            '321051-321051', # HLT_IsoMu24_v13-311.577/pb                                                                                                                                       
+            '321055-321055', # HLT_IsoMu24_v13, 125.495/pb                                                                                                                                       
+            '321067-321069', # HLT_IsoMu24_v13-369.401/pb                                                                                                                                       
+            '321119-321119', # HLT_IsoMu24_v13, 58.668/pb                                                                                                                                        
+            '321121-321122', # HLT_IsoMu24_v13, 136.178/pb                                                                                                                                       
+            '321124-321124', # HLT_IsoMu24_v13, 185.308/pb                                                                                                                                       
+            '321126-321126', # HLT_IsoMu24_v13, 78.957/pb                                                                                                                                        
+            '321134-321134', # HLT_IsoMu24_v13, 8.164/pb                                                                                                                                         
+            '321138-321138', # HLT_IsoMu24_v13, 141.977/pb                                                                                                                                       
+            '321140-321140', # HLT_IsoMu24_v13, 116.949/pb                                                                                                                                       
+            '321149-321149', # HLT_IsoMu24_v13, 434.675/pb                                                                                                                                       
+            '321165-321167', # HLT_IsoMu24_v13, 277.898/pb                                                                                                                                       
+            '321177-321178', # HLT_IsoMu24_v13, 174.709/pb                                                                                                                                       
+            '321218-321219', # HLT_IsoMu24_v13, 463.69/pb                                                                                                                                        
+            '321221-321221', # HLT_IsoMu24_v13, 5.906/pb                                                                                                                                         
+            '321230-321233', # HLT_IsoMu24_v13, 275.104/pb                                                                                                                                       
+            '321262-321262', # HLT_IsoMu24_v13, 1.669/pb                                                                                                                                         
+            '321283-321283', # HLT_IsoMu24_v13, 119.781/pb                                                                                                                                       
+            '321294-321296', # HLT_IsoMu24_v13, 233.977/pb                                                                                                                                       
+            '321305-321305', # HLT_IsoMu24_v13, 601.905/pb                                                                                                                                       
+            '321311-321313', # HLT_IsoMu24_v13, 87.325/pb                                                                                                                                        
+            '321393-321393', # HLT_IsoMu24_v13, 49.689/pb                                                                                                                                        
+            '321396-321397', # HLT_IsoMu24_v13, 417.281/pb                                                                                                                                       
+            '321414-321415', # HLT_IsoMu24_v13, 523.015/pb                                                                                                                                       
+            '321431-321434', # HLT_IsoMu24_v13, 296.1/pb     
+            '321436-321436', # HLT_IsoMu24_v13, 138.442/pb                                                                                                                                       
+            '321457-321457', # HLT_IsoMu24_v13, 482.762/pb                                                                                                                                       
+            '321461-321461', # HLT_IsoMu24_v13, 21.013/pb                                                                                                                                        
+            '321475-321475', # HLT_IsoMu24_v13, 471.913/pb                                                                                                                                       
+            '321710-321710', # HLT_IsoMu24_v13, 17.235/pb                                                                                                                                        
+            '321712-321712', # HLT_IsoMu24_v13, 84.378/pb                                                                                                                                        
+            '321730-321730', # HLT_IsoMu24_v13, 102.671/pb                                                                                                                                       
+            '321732-321732', # HLT_IsoMu24_v13-344.692/pb                                                                                                                                       
+            '321735-321735', # HLT_IsoMu24_v13, 23.661/pb                                                                                                                                        
+            '321755-321755', # HLT_IsoMu24_v13, 213.438/pb                                                                                                                                       
+            '321758-321758', # HLT_IsoMu24_v13-37.518/pb                                                                                                                                        
+            '321760-321760', # HLT_IsoMu24_v13, 146.153/pb                                                                                                                                       
+            '321773-321778', # HLT_IsoMu24_v13, 174.569/pb                                                                                                                                       
+            '321780-321781', # HLT_IsoMu24_v13, 181.684/pb                                                                                                                                       
+            '321813-321813', # HLT_IsoMu24_v13, 120.244/pb                                                                                                                                       
+            '321815-321815', # HLT_IsoMu24_v13, 5.12/pb                                                                                                                                          
+            '321817-321818', # HLT_IsoMu24_v13, 286.489/pb                                                                                                                                       
+            '321820-321820', # HLT_IsoMu24_v13-32.069/pb                                                                                                                                        
+            '321831-321834', # HLT_IsoMu24_v13, 488.005/pb                                                                                                                                       
+            '321879-321880', # HLT_IsoMu24_v13, 131.546/pb                                                                                                                                       
+            '321887-321887', # HLT_IsoMu24_v13, 276.941/pb                                                                                                                                       
+            '321908-321909', # HLT_IsoMu24_v13, 485.884/pb                                                                                                                                       
+            '321917-321917', # HLT_IsoMu24_v13, 261.22/pb                                                                                                                                        
+            '321919-321919', # HLT_IsoMu24_v13, 1.489/pb                                                                                                                                         
+            '321933-321933', # HLT_IsoMu24_v13, 101.007/pb                                                                                                                                       
+            '321960-321961', # HLT_IsoMu24_v13, 139.431/pb      
+            '321973-321973', # HLT_IsoMu24_v13-358.667/pb                                                                                                                                       
+            '321975-321975', # HLT_IsoMu24_v13, 145.784/pb                                                                                                                                       
+            '321988-321988', # HLT_IsoMu24_v13-384.022/pb                                                                                                                                       
+            '321990-321990', # HLT_IsoMu24_v13, 81.032/pb                                                                                                                                        
+            '322013-322014', # HLT_IsoMu24_v13, 7.816/pb                                                                                                                                         
+            '322022-322022', # HLT_IsoMu24_v13, 452.969/pb                                                                                                                                       
+            '322040-322040', # HLT_IsoMu24_v13, 13.692/pb                                                                                                                                        
+            '322057-322057', # HLT_IsoMu24_v13, 8.235/pb                                                                                                                                         
+            '322068-322068', # HLT_IsoMu24_v13, 232.599/pb                                                                                                                                       
+            '322079-322079', # HLT_IsoMu24_v13, 140.245/pb                                                                                                                                       
+            '322106-322106', # HLT_IsoMu24_v13, 281.859/pb                                                                                                                                       
+            '322113-322113', # HLT_IsoMu24_v13, 40.79/pb                                                                                                                                         
+            '322118-322118', # HLT_IsoMu24_v13, 268.229/pb                                                                                                                                       
+            '322179-322179', # HLT_IsoMu24_v13, 469.75/pb                                                                                                                                        
+            '322201-322201', # HLT_IsoMu24_v13, 84.335/pb                                                                                                                                        
+            '322204-322204', # HLT_IsoMu24_v13-311.166/pb                                                                                                                                       
+            '322222-322222', # HLT_IsoMu24_v13, 92.744/pb                                                                                                                                        
+            '322252-322252', # HLT_IsoMu24_v13, 420.358/pb                                                                                                                                       
+            '322317-322317', # HLT_IsoMu24_v13, 19.246/pb                                                                                                                                        
+            '322319-322319', # HLT_IsoMu24_v13, 55.502/pb                                                                                                                                        
+            '322322-322322', # HLT_IsoMu24_v13, 292.464/pb                                                                                                                                       
+            '322324-322324', # HLT_IsoMu24_v13, 69.26/pb                                                                                                                                         
+            '322332-322332', # HLT_IsoMu24_v13-313.996/pb                                                                                                                                       
+            '322348-322348', # HLT_IsoMu24_v13, 414.112/pb                                                                                                                                       
+            '322355-322356', # HLT_IsoMu24_v13, 268.46/pb                                                                                                                                        
+            '322381-322381', # HLT_IsoMu24_v13, 178.73/pb                  
+            '322407-322407', # HLT_IsoMu24_v13, 169.958/pb                                                                                                                                       
+            '322430-322431', # HLT_IsoMu24_v13-370.371/pb                                                                                                                                       
+            '322480-322480', # HLT_IsoMu24_v13, 109.337/pb                                                                                                                                       
+            '322492-322492', # HLT_IsoMu24_v13, 287.515/pb                                                                                                                                       
+            '322510-322510', # HLT_IsoMu24_v13, 2.229/pb                                                                                                                                         
+            '322599-322599', # HLT_IsoMu24_v13, 94.351/pb                                                                                                                                        
+            '322602-322603', # HLT_IsoMu24_v13, 26.803/pb                                                                                                                                        
+            '322605-322605', # HLT_IsoMu24_v13, 89.624/pb                                                                                                                                        
+            '322617-322617', # HLT_IsoMu24_v13, 136.646/pb                                                                                                                                       
+            '322625-322625', # HLT_IsoMu24_v13-335.273/pb                                                                                                                                       
+            '322633-322633', # HLT_IsoMu24_v13, 50.946/pb                                                                                                                                        
+            '323414-323414', # HLT_IsoMu24_v13, 6.204/pb                                                                                                                                         
+            '323423-323423', # HLT_IsoMu24_v13, 21.037/pb                                                                                                                                        
+            '323470-323475', # HLT_IsoMu24_v13-321.533/pb                                                                                                                                       
+            '323487-323488', # HLT_IsoMu24_v13-340.364/pb                                                                                                                                       
+            '323492-323493', # HLT_IsoMu24_v13-33.198/pb                                                                                                                                        
+            '323495-323495', # HLT_IsoMu24_v13-32.347/pb                                                                                                                                        
+            '323524-323526', # HLT_IsoMu24_v13, 480.533/pb                                                                                                                                       
+            '323693-323693', # HLT_IsoMu24_v13, 40.083/pb                                                                                                                                        
+            '323696-323696', # HLT_IsoMu24_v13, 88.848/pb                                                                                                                                        
+            '323702-323702', # HLT_IsoMu24_v13, 145.958/pb                                                                                                                                       
+            '323725-323727', # HLT_IsoMu24_v13-380.043/pb                                                                                                                                       
+            '323755-323755', # HLT_IsoMu24_v13, 296.639/pb                                                                                                                                       
+            '323775-323775', # HLT_IsoMu24_v13, 46.768/pb                                                                                                                                        
+            '323778-323778', # HLT_IsoMu24_v13, 270.936/pb                                                                                                                                       
+            '323790-323790', # HLT_IsoMu24_v13, 276.737/pb    
+            '323794-323794', # HLT_IsoMu24_v13, 16.057/pb                                                                                                                                        
+            '323841-323841', # HLT_IsoMu24_v13, 155.038/pb                                                                                                                                       
+            '323857-323857', # HLT_IsoMu24_v13, 95.513/pb                                                                                                                                        
+            '323940-323940', # HLT_IsoMu24_v13, 426.706/pb                                                                                                                                       
+            '323954-323954', # HLT_IsoMu24_v13, 15.141/pb                                                                                                                                        
+            '323976-323976', # HLT_IsoMu24_v13, 14.399/pb                                                                                                                                        
+            '323978-323978', # HLT_IsoMu24_v13, 21.952/pb                                                                                                                                        
+            '323980-323980', # HLT_IsoMu24_v13, 67.732/pb                                                                                                                                        
+            '323983-323983', # HLT_IsoMu24_v13, 56.791/pb                                                                                                                                        
+            '323997-323997', # HLT_IsoMu24_v13, 128.792/pb                                                                                                                                       
+            '324021-324022', # HLT_IsoMu24_v13-380.271/pb                                                                                                                                       
+            '324077-324077', # HLT_IsoMu24_v13, 242.583/pb                                                                                                                                       
+            '324201-324202', # HLT_IsoMu24_v13, 402.099/pb                                                                                                                                       
+            '324205-324207', # HLT_IsoMu24_v13, 44.541/pb                                                                                                                                        
+            '324209-324209', # HLT_IsoMu24_v13, 16.079/pb                                                                                                                                        
+            '324237-324237', # HLT_IsoMu24_v13, 74.992/pb                                                                                                                                        
+            '324245-324245', # HLT_IsoMu24_v13, 417.199/pb                                                                                                                                       
+            '324293-324293', # HLT_IsoMu24_v13, 513.035/pb                                                                                                                                       
+            '324315-324315', # HLT_IsoMu24_v13, 70.437/pb                                                                                                                                        
+            '324318-324318', # HLT_IsoMu24_v13, 99.84/pb                                                                                                                                         
+            '324420-324420', # HLT_IsoMu24_v13, 199.727/pb                                                                                                                                       
+            '324729-324729', # HLT_IsoMu24_v13, 14.797/pb                                                                                                                                        
+            '324747-324747', # HLT_IsoMu24_v13-308.246/pb                                                                                                                                       
+            '324764-324765', # HLT_IsoMu24_v13, 117.745/pb                                                                                                                                       
+            '324769-324769', # HLT_IsoMu24_v13, 46.77/pb                                                                                                                                         
+            '324772-324772', # HLT_IsoMu24_v13, 18.783/pb     
+            '324785-324785', # HLT_IsoMu24_v13, 185.798/pb                                                                                                                                       
+            '324791-324791', # HLT_IsoMu24_v13, 245.007/pb                                                                                                                                       
+            '324835-324835', # HLT_IsoMu24_v13, 85.856/pb                                                                                                                                        
+            '324840-324841', # HLT_IsoMu24_v13-328.73/pb                                                                                                                                        
+            '324846-324846', # HLT_IsoMu24_v13, 68.553/pb                                                                                                                                        
+            '324878-324878', # HLT_IsoMu24_v13, 403.017/pb                                                                                                                                       
+            '324897-324897', # HLT_IsoMu24_v13, 50.229/pb                                                                                                                                        
+            '324970-324970', # HLT_IsoMu24_v13, 479.466/pb                                                                                                                                       
+            '324980-324980', # HLT_IsoMu24_v13, 513.295/pb                                                                                                                                       
+            '324997-325001', # HLT_IsoMu24_v13-370.507/pb                                                                                                                                       
+            '325022-325022', # HLT_IsoMu24_v13, 433.386/pb                                                                                                                                       
+            '325057-325057', # HLT_IsoMu24_v13, 120.048/pb                                                                                                                                       
+            '325097-325101', # HLT_IsoMu24_v13-351.717/pb                                                                                                                                       
+            '325110-325110', # HLT_IsoMu24_v13-3.259/pb                                                                                                                                         
+            '325117-325117', # HLT_IsoMu24_v13, 85.217/pb                                                                                                                                        
+            '325159-325159', # HLT_IsoMu24_v13, 61.44/pb                                                                                                                                         
+            '325168-325170', # HLT_IsoMu24_v13, 273.009/pb                                                                                                                                       
+            '325172-325172', # HLT_IsoMu24_v13, 67.636/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ##---------HLT_IsoMu27----------##
+    cms.PSet( # 1mu PSet 25-100 BEGINS
+      path = cms.string("HLT_IsoMu27"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(27.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+            '315257-315257', # HLT_IsoMu27_v14, 7.929/pb                                                                                                                                         
+            '315259-315259', # HLT_IsoMu27_v14, 13.919/pb                                                                                                                                        
+            '315264-315265', # HLT_IsoMu27_v14, 46.158/pb                                                                                                                                        
+            '315267-315267', # HLT_IsoMu27_v14-37.143/pb                                                                                                                                        
+            '315270-315270', # HLT_IsoMu27_v14, 78.981/pb                                                                                                                                        
+            '315322-315322', # HLT_IsoMu27_v14, 180.063/pb                                                                                                                                       
+            '315339-315339', # HLT_IsoMu27_v14, 93.349/pb                                                                                                                                        
+            '315357-315357', # HLT_IsoMu27_v14, 151.931/pb                                                                                                                                       
+            '315361-315361', # HLT_IsoMu27_v14, 118.532/pb                                                                                                                                       
+            '315363-315363', # HLT_IsoMu27_v14, 14.489/pb                                                                                                                                        
+            '315366-315366', # HLT_IsoMu27_v14, 100.183/pb                                                                                                                                       
+            '315420-315420', # HLT_IsoMu27_v14, 258.566/pb                                                                                                                                       
+            '315488-315490', # HLT_IsoMu27_v14, 296.522/pb                                                                                                                                       
+            '315506-315506', # HLT_IsoMu27_v14, 27.983/pb                                                                                                                                        
+            '315510-315510', # HLT_IsoMu27_v14, 103.172/pb                                                                                                                                       
+            '315512-315512', # HLT_IsoMu27_v14, 236.871/pb                                                                                                                                       
+            '315543-315543', # HLT_IsoMu27_v14-36.886/pb                                                                                                                                        
+            '315555-315557', # HLT_IsoMu27_v14, 114.498/pb                                                                                                                                       
+            '315640-315642', # HLT_IsoMu27_v14, 43.181/pb                                                                                                                                        
+            '315644-315648', # HLT_IsoMu27_v14, 439.459/pb                                                                                                                                       
+            '315689-315690', # HLT_IsoMu27_v14, 448.961/pb                                                                                                                                       
+            '315702-315705', # HLT_IsoMu27_v14-328.569/pb                                                                                                                                       
+            '315713-315713', # HLT_IsoMu27_v14-353.735/pb                                                                                                                                       
+            '315721-315721', # HLT_IsoMu27_v14, 210.579/pb                                                                                                                                       
+            '315741-315741', # HLT_IsoMu27_v14, 23.717/pb                                                                                                                                        
+            '315764-315764', # HLT_IsoMu27_v14, 114.011/pb               
+            '315770-315770', # HLT_IsoMu27_v14, 121.796/pb                                                                                                                                       
+            '315784-315786', # HLT_IsoMu27_v14, 179.651/pb                                                                                                                                       
+            '315790-315790', # HLT_IsoMu27_v14, 173.124/pb                                                                                                                                       
+            '315800-315801', # HLT_IsoMu27_v14-304.75/pb                                                                                                                                        
+            '315840-315840', # HLT_IsoMu27_v14-354.111/pb                                                                                                                                       
+            '315973-315974', # HLT_IsoMu27_v14/HLT_IsoMu27_v15, 297.118/pb                                                                                                                       
+            '316058-316062', # HLT_IsoMu27_v15, 512.949/pb                                                                                                                                       
+            '316082-316082', # HLT_IsoMu27_v15, 141.36/pb                                                                                                                                        
+            '316110-316111', # HLT_IsoMu27_v15, 97.131/pb                                                                                                                                        
+            '316113-316114', # HLT_IsoMu27_v15-388.486/pb                                                                                                                                       
+            '316153-316153', # HLT_IsoMu27_v15, 256.24/pb                                                                                                                                        
+            '316186-316187', # HLT_IsoMu27_v15, 527.582/pb                                                                                                                                       
+            '316199-316202', # HLT_IsoMu27_v15, 589.387/pb                                                                                                                                       
+            '316216-316219', # HLT_IsoMu27_v15, 551.849/pb                                                                                                                                       
+            '316239-316241', # HLT_IsoMu27_v15, 546.196/pb                                                                                                                                       
+            '316271-316271', # HLT_IsoMu27_v15, 29.698/pb                                                                                                                                        
+            '316361-316363', # HLT_IsoMu27_v16, 84.941/pb                                                                                                                                        
+            '316377-316380', # HLT_IsoMu27_v16, 188.825/pb                                                                                                                                       
+            '316455-316455', # HLT_IsoMu27_v16, 9.607/pb                                                                                                                                         
+            '316457-316457', # HLT_IsoMu27_v16-326.273/pb                                                                                                                                       
+            '316469-316470', # HLT_IsoMu27_v16, 265.747/pb                                                                                                                                       
+            '316472-316472', # HLT_IsoMu27_v16, 66.237/pb                                                                                                                                        
+            '316505-316505', # HLT_IsoMu27_v16, 401.22/pb                                                                                                                                        
+            '316569-316569', # HLT_IsoMu27_v16, 485.569/pb                                                                                                                                       
+            '316590-316590', # HLT_IsoMu27_v16, 189.247/pb                                                                                                                                       
+            '316613-316613', # HLT_IsoMu27_v16-31.466/pb                                                                                                                                        
+            '316615-316615', # HLT_IsoMu27_v16, 49.127/pb                                                                                                                                        
+            '316666-316667', # HLT_IsoMu27_v16-321.521/pb                                                                                                                                       
+            '316700-316702', # HLT_IsoMu27_v16-353.699/pb                                                                                                                                       
+            '316715-316723', # HLT_IsoMu27_v16, 440.225/pb                                                                                                                                       
+            '316758-316758', # HLT_IsoMu27_v16, 455.683/pb                                                                                                                                       
+            '316766-316766', # HLT_IsoMu27_v16, 561.053/pb                                                                                                                                       
+            '316876-316877', # HLT_IsoMu27_v16-327.431/pb                                                                                                                                       
+            '316879-316879', # HLT_IsoMu27_v16-36.513/pb                                                                                                                                        
+            '316928-316928', # HLT_IsoMu27_v16, 44.417/pb                                                                                                                                        
+            '316985-316985', # HLT_IsoMu27_v16, 172.546/pb                                                                                                                                       
+            '316993-316995', # HLT_IsoMu27_v16, 265.445/pb                                                                                                                                       
+            '317080-317080', # HLT_IsoMu27_v16, 7.844/pb                                                                                                                                         
+            '317087-317087', # HLT_IsoMu27_v16, 243.2/pb                                                                                                                                         
+            '317089-317089', # HLT_IsoMu27_v16, 212.905/pb                                                                                                                                       
+            '317182-317182', # HLT_IsoMu27_v16, 406.207/pb                                                                                                                                       
+            '317212-317213', # HLT_IsoMu27_v16, 176.661/pb                                                                                                                                       
+            '317279-317279', # HLT_IsoMu27_v16, 65.892/pb                                                                                                                                        
+            '317291-317292', # HLT_IsoMu27_v16-359.036/pb                                                                                                                                       
+            '317297-317297', # HLT_IsoMu27_v16, 123.799/pb                                                                                                                                       
+            '317319-317320', # HLT_IsoMu27_v16, 514.282/pb                                                                                                                                       
+            '317338-317340', # HLT_IsoMu27_v16, 219.977/pb                                                                                                                                       
+            '317382-317383', # HLT_IsoMu27_v16, 46.591/pb                                                                                                                                        
+            '317391-317392', # HLT_IsoMu27_v16, 493.374/pb  
+            '317435-317435', # HLT_IsoMu27_v16-360.613/pb                                                                                                                                       
+            '317438-317438', # HLT_IsoMu27_v16, 49.71/pb                                                                                                                                         
+            '317475-317475', # HLT_IsoMu27_v16, 25.761/pb                                                                                                                                        
+            '317478-317478', # HLT_IsoMu27_v16, 7.937/pb                                                                                                                                         
+            '317484-317484', # HLT_IsoMu27_v16, 160.356/pb                                                                                                                                       
+            '317488-317488', # HLT_IsoMu27_v16, 181.128/pb                                                                                                                                       
+            '317527-317527', # HLT_IsoMu27_v16, 452.099/pb                                                                                                                                       
+            '317591-317591', # HLT_IsoMu27_v16, 111.117/pb                                                                                                                                       
+            '317626-317626', # HLT_IsoMu27_v16, 528.94/pb                                                                                                                                        
+            '317640-317641', # HLT_IsoMu27_v16, 529.494/pb                                                                                                                                       
+            '317648-317650', # HLT_IsoMu27_v16, 483.09/pb                                                                                                                                        
+            '317661-317661', # HLT_IsoMu27_v16-375.651/pb                                                                                                                                       
+            '317663-317663', # HLT_IsoMu27_v16, 153.301/pb                                                                                                                                       
+            '317683-317683', # HLT_IsoMu27_v16, 117.852/pb                                                                                                                                       
+            '317696-317696', # HLT_IsoMu27_v16, 228.787/pb                                                                                                                                       
+            '318733-318733', # HLT_IsoMu27_v16, 2.792/pb                                                                                                                                         
+            '318828-318828', # HLT_IsoMu27_v16, 13.229/pb                                                                                                                                        
+            '318872-318872', # HLT_IsoMu27_v16, 91.855/pb                                                                                                                                        
+            '318874-318874', # HLT_IsoMu27_v16, 99.565/pb                                                                                                                                        
+            '318876-318877', # HLT_IsoMu27_v16, 207.136/pb                                                                                                                                       
+            '319077-319077', # HLT_IsoMu27_v16, 16.372/pb                                                                                                                                        
+            '319337-319337', # HLT_IsoMu27_v16, 232.389/pb                                                                                                                                       
+            '319347-319349', # HLT_IsoMu27_v16, 256.706/pb                                                                                                                                       
+            '319449-319450', # HLT_IsoMu27_v16, 456.219/pb                                                                                                                                       
+            '319456-319456', # HLT_IsoMu27_v16, 52.016/pb                                                                                                                                        
+            '319459-319459', # HLT_IsoMu27_v16, 17.212/pb     
+            '319486-319486', # HLT_IsoMu27_v16, 20.315/pb                                                                                                                                        
+            '319503-319503', # HLT_IsoMu27_v16, 90.959/pb                                                                                                                                        
+            '319524-319524', # HLT_IsoMu27_v16, 456.701/pb                                                                                                                                       
+            '319526-319526', # HLT_IsoMu27_v16, 69.66/pb                                                                                                                                         
+            '319528-319528', # HLT_IsoMu27_v16, 58.411/pb                                                                                                                                        
+            '319579-319579', # HLT_IsoMu27_v16, 818.49/pb                                                                                                                                        
+            '319625-319625', # HLT_IsoMu27_v16, 70.596/pb                                                                                                                                        
+            '319639-319639', # HLT_IsoMu27_v16, 409.34/pb                                                                                                                                        
+            '319656-319659', # HLT_IsoMu27_v16, 221.8/pb                                                                                                                                         
+            '319678-319678', # HLT_IsoMu27_v16, 95.425/pb                                                                                                                                        
+            '319687-319687', # HLT_IsoMu27_v16, 16.053/pb                                                                                                                                        
+            '319697-319698', # HLT_IsoMu27_v16, 96.857/pb                                                                                                                                        
+            '319756-319756', # HLT_IsoMu27_v16, 490.205/pb                                                                                                                                       
+            '319840-319841', # HLT_IsoMu27_v16, 69.999/pb                                                                                                                                        
+            '319847-319849', # HLT_IsoMu27_v16, 193.537/pb                                                                                                                                       
+            '319851-319851', # HLT_IsoMu27_v16, 1.137/pb                                                                                                                                         
+            '319853-319854', # HLT_IsoMu27_v16, 124.92/pb                                                                                                                                        
+            '319908-319910', # HLT_IsoMu27_v16-324.281/pb                                                                                                                                       
+            '319912-319915', # HLT_IsoMu27_v16, 119.686/pb                                                                                                                                       
+            '319941-319942', # HLT_IsoMu27_v16, 111.886/pb                                                                                                                                       
+            '319950-319950', # HLT_IsoMu27_v16, 65.936/pb                                                                                                                                        
+            '319991-319993', # HLT_IsoMu27_v16, 530.374/pb                                                                                                                                       
+            '320002-320002', # HLT_IsoMu27_v16, 50.203/pb                                                                                                                                        
+            '320006-320006', # HLT_IsoMu27_v16, 114.14/pb                                                                                                                                        
+            '320010-320012', # HLT_IsoMu27_v16, 153.875/pb                                                                                                                                       
+            '320023-320026', # HLT_IsoMu27_v16-305.475/pb      
+            '320038-320040', # HLT_IsoMu27_v16, 404.341/pb                                                                                                                                       
+            '320059-320065', # HLT_IsoMu27_v16-395.979/pb                                                                                                                                       
+            '320673-320674', # HLT_IsoMu27_v16, 98.341/pb                                                                                                                                        
+            '320688-320688', # HLT_IsoMu27_v16, 130.855/pb                                                                                                                                       
+            '320712-320712', # HLT_IsoMu27_v16, 69.58/pb                                                                                                                                         
+            '320757-320757', # HLT_IsoMu27_v16, 116.684/pb                                                                                                                                       
+            '320804-320804', # HLT_IsoMu27_v16-319.033/pb                                                                                                                                       
+            '320807-320807', # HLT_IsoMu27_v16, 0.348/pb                                                                                                                                         
+            '320809-320809', # HLT_IsoMu27_v16, 106.231/pb                                                                                                                                       
+            '320821-320824', # HLT_IsoMu27_v16, 454.293/pb                                                                                                                                       
+            '320838-320838', # HLT_IsoMu27_v16, 92.366/pb                                                                                                                                        
+            '320840-320841', # HLT_IsoMu27_v16, 191.511/pb                                                                                                                                       
+            '320853-320859', # HLT_IsoMu27_v16, 433.068/pb                                                                                                                                       
+            '320887-320888', # HLT_IsoMu27_v16, 113.862/pb                                                                                                                                       
+            '320916-320917', # HLT_IsoMu27_v16, 484.437/pb                                                                                                                                       
+            '320920-320920', # HLT_IsoMu27_v16, 24.013/pb                                                                                                                                        
+            '320933-320934', # HLT_IsoMu27_v16, 262.426/pb                                                                                                                                       
+            '320936-320936', # HLT_IsoMu27_v16, 78.32/pb                                                                                                                                         
+            '320941-320941', # HLT_IsoMu27_v16, 15.638/pb                                                                                                                                        
+            '320980-320980', # HLT_IsoMu27_v16-38.408/pb                                                                                                                                        
+            '320995-320996', # HLT_IsoMu27_v16, 74.084/pb                                                                                                                                        
+            '321004-321007', # HLT_IsoMu27_v16-320.57/pb                                                                                                                                        
+            '321009-321012', # HLT_IsoMu27_v16, 105.863/pb                                                                                                                                       
+            '321051-321051', # HLT_IsoMu27_v16-311.577/pb                                                                                                                                       
+            '321055-321055', # HLT_IsoMu27_v16, 125.495/pb                                                                                                                                       
+            '321067-321069', # HLT_IsoMu27_v16-369.401/pb    
+            '321119-321119', # HLT_IsoMu27_v16, 58.668/pb                                                                                                                                        
+            '321121-321122', # HLT_IsoMu27_v16, 136.178/pb                                                                                                                                       
+            '321124-321124', # HLT_IsoMu27_v16, 185.308/pb                                                                                                                                       
+            '321126-321126', # HLT_IsoMu27_v16, 78.957/pb                                                                                                                                        
+            '321134-321134', # HLT_IsoMu27_v16, 8.164/pb                                                                                                                                         
+            '321138-321138', # HLT_IsoMu27_v16, 141.977/pb                                                                                                                                       
+            '321140-321140', # HLT_IsoMu27_v16, 116.949/pb                                                                                                                                       
+            '321149-321149', # HLT_IsoMu27_v16, 434.675/pb                                                                                                                                       
+            '321165-321167', # HLT_IsoMu27_v16, 277.898/pb                                                                                                                                       
+            '321177-321178', # HLT_IsoMu27_v16, 174.709/pb                                                                                                                                       
+            '321218-321219', # HLT_IsoMu27_v16, 463.69/pb                                                                                                                                        
+            '321221-321221', # HLT_IsoMu27_v16, 5.906/pb                                                                                                                                         
+            '321230-321233', # HLT_IsoMu27_v16, 275.104/pb                                                                                                                                       
+            '321262-321262', # HLT_IsoMu27_v16, 1.669/pb                                                                                                                                         
+            '321283-321283', # HLT_IsoMu27_v16, 119.781/pb                                                                                                                                       
+            '321294-321296', # HLT_IsoMu27_v16, 233.977/pb                                                                                                                                       
+            '321305-321305', # HLT_IsoMu27_v16, 601.905/pb                                                                                                                                       
+            '321311-321313', # HLT_IsoMu27_v16, 87.325/pb                                                                                                                                        
+            '321393-321393', # HLT_IsoMu27_v16, 49.689/pb                                                                                                                                        
+            '321396-321397', # HLT_IsoMu27_v16, 417.281/pb                                                                                                                                       
+            '321414-321415', # HLT_IsoMu27_v16, 523.015/pb                                                                                                                                       
+            '321431-321434', # HLT_IsoMu27_v16, 296.1/pb                                                                                                                                         
+            '321436-321436', # HLT_IsoMu27_v16, 138.442/pb                                                                                                                                       
+            '321457-321457', # HLT_IsoMu27_v16, 482.762/pb                                                                                                                                       
+            '321461-321461', # HLT_IsoMu27_v16, 21.013/pb                                                                                                                                        
+            '321475-321475', # HLT_IsoMu27_v16, 471.913/pb     
+            '321710-321710', # HLT_IsoMu27_v16, 17.235/pb                                                                                                                                        
+            '321712-321712', # HLT_IsoMu27_v16, 84.378/pb                                                                                                                                        
+            '321730-321730', # HLT_IsoMu27_v16, 102.671/pb                                                                                                                                       
+            '321732-321732', # HLT_IsoMu27_v16-344.692/pb                                                                                                                                       
+            '321735-321735', # HLT_IsoMu27_v16, 23.661/pb                                                                                                                                        
+            '321755-321755', # HLT_IsoMu27_v16, 213.438/pb                                                                                                                                       
+            '321758-321758', # HLT_IsoMu27_v16-37.518/pb                                                                                                                                        
+            '321760-321760', # HLT_IsoMu27_v16, 146.153/pb                                                                                                                                       
+            '321773-321778', # HLT_IsoMu27_v16, 174.569/pb                                                                                                                                       
+            '321780-321781', # HLT_IsoMu27_v16, 181.684/pb                                                                                                                                       
+            '321813-321813', # HLT_IsoMu27_v16, 120.244/pb                                                                                                                                       
+            '321815-321815', # HLT_IsoMu27_v16, 5.12/pb                                                                                                                                          
+            '321817-321818', # HLT_IsoMu27_v16, 286.489/pb                                                                                                                                       
+            '321820-321820', # HLT_IsoMu27_v16-32.069/pb                                                                                                                                        
+            '321831-321834', # HLT_IsoMu27_v16, 488.005/pb                                                                                                                                       
+            '321879-321880', # HLT_IsoMu27_v16, 131.546/pb                                                                                                                                       
+            '321887-321887', # HLT_IsoMu27_v16, 276.941/pb                                                                                                                                       
+            '321908-321909', # HLT_IsoMu27_v16, 485.884/pb                                                                                                                                       
+            '321917-321917', # HLT_IsoMu27_v16, 261.22/pb                                                                                                                                        
+            '321919-321919', # HLT_IsoMu27_v16, 1.489/pb                                                                                                                                         
+            '321933-321933', # HLT_IsoMu27_v16, 101.007/pb                                                                                                                                       
+            '321960-321961', # HLT_IsoMu27_v16, 139.431/pb                                                                                                                                       
+            '321973-321973', # HLT_IsoMu27_v16-358.667/pb                                                                                                                                       
+            '321975-321975', # HLT_IsoMu27_v16, 145.784/pb                                                                                                                                       
+            '321988-321988', # HLT_IsoMu27_v16-384.022/pb                                                                                                                                       
+            '321990-321990', # HLT_IsoMu27_v16, 81.032/pb   
+            '322013-322014', # HLT_IsoMu27_v16, 7.816/pb                                                                                                                                         
+            '322022-322022', # HLT_IsoMu27_v16, 452.969/pb                                                                                                                                       
+            '322040-322040', # HLT_IsoMu27_v16, 13.692/pb                                                                                                                                        
+            '322057-322057', # HLT_IsoMu27_v16, 8.235/pb                                                                                                                                         
+            '322068-322068', # HLT_IsoMu27_v16, 232.599/pb                                                                                                                                       
+            '322079-322079', # HLT_IsoMu27_v16, 140.245/pb                                                                                                                                       
+            '322106-322106', # HLT_IsoMu27_v16, 281.859/pb                                                                                                                                       
+            '322113-322113', # HLT_IsoMu27_v16, 40.79/pb                                                                                                                                         
+            '322118-322118', # HLT_IsoMu27_v16, 268.229/pb                                                                                                                                       
+            '322179-322179', # HLT_IsoMu27_v16, 469.75/pb                                                                                                                                        
+            '322201-322201', # HLT_IsoMu27_v16, 84.335/pb                                                                                                                                        
+            '322204-322204', # HLT_IsoMu27_v16-311.166/pb                                                                                                                                       
+            '322222-322222', # HLT_IsoMu27_v16, 92.744/pb                                                                                                                                        
+            '322252-322252', # HLT_IsoMu27_v16, 420.358/pb                                                                                                                                       
+            '322317-322317', # HLT_IsoMu27_v16, 19.246/pb                                                                                                                                        
+            '322319-322319', # HLT_IsoMu27_v16, 55.502/pb                                                                                                                                        
+            '322322-322322', # HLT_IsoMu27_v16, 292.464/pb                                                                                                                                       
+            '322324-322324', # HLT_IsoMu27_v16, 69.26/pb                                                                                                                                         
+            '322332-322332', # HLT_IsoMu27_v16-313.996/pb                                                                                                                                       
+            '322348-322348', # HLT_IsoMu27_v16, 414.112/pb                                                                                                                                       
+            '322355-322356', # HLT_IsoMu27_v16, 268.46/pb                                                                                                                                        
+            '322381-322381', # HLT_IsoMu27_v16, 178.73/pb                                                                                                                                        
+            '322407-322407', # HLT_IsoMu27_v16, 169.958/pb                                                                                                                                       
+            '322430-322431', # HLT_IsoMu27_v16-370.371/pb                                                                                                                                       
+            '322480-322480', # HLT_IsoMu27_v16, 109.337/pb                                                                                                                                       
+            '322492-322492', # HLT_IsoMu27_v16, 287.515/pb   
+            '322510-322510', # HLT_IsoMu27_v16, 2.229/pb                                                                                                                                         
+            '322599-322599', # HLT_IsoMu27_v16, 94.351/pb                                                                                                                                        
+            '322602-322603', # HLT_IsoMu27_v16, 26.803/pb                                                                                                                                        
+            '322605-322605', # HLT_IsoMu27_v16, 89.624/pb                                                                                                                                        
+            '322617-322617', # HLT_IsoMu27_v16, 136.646/pb                                                                                                                                       
+            '322625-322625', # HLT_IsoMu27_v16-335.273/pb                                                                                                                                       
+            '322633-322633', # HLT_IsoMu27_v16, 50.946/pb                                                                                                                                        
+            '323414-323414', # HLT_IsoMu27_v16, 6.204/pb                                                                                                                                         
+            '323423-323423', # HLT_IsoMu27_v16, 21.037/pb                                                                                                                                        
+            '323470-323475', # HLT_IsoMu27_v16-321.533/pb                                                                                                                                       
+            '323487-323488', # HLT_IsoMu27_v16-340.364/pb                                                                                                                                       
+            '323492-323493', # HLT_IsoMu27_v16-33.198/pb                                                                                                                                        
+            '323495-323495', # HLT_IsoMu27_v16-32.347/pb                                                                                                                                        
+            '323524-323526', # HLT_IsoMu27_v16, 480.533/pb                                                                                                                                       
+            '323693-323693', # HLT_IsoMu27_v16, 40.083/pb                                                                                                                                        
+            '323696-323696', # HLT_IsoMu27_v16, 88.848/pb                                                                                                                                        
+            '323702-323702', # HLT_IsoMu27_v16, 145.958/pb                                                                                                                                       
+            '323725-323727', # HLT_IsoMu27_v16-380.043/pb                                                                                                                                       
+            '323755-323755', # HLT_IsoMu27_v16, 296.639/pb                                                                                                                                       
+            '323775-323775', # HLT_IsoMu27_v16, 46.768/pb                                                                                                                                        
+            '323778-323778', # HLT_IsoMu27_v16, 270.936/pb                                                                                                                                       
+            '323790-323790', # HLT_IsoMu27_v16, 276.737/pb                                                                                                                                       
+            '323794-323794', # HLT_IsoMu27_v16, 16.057/pb                                                                                                                                        
+            '323841-323841', # HLT_IsoMu27_v16, 155.038/pb                                                                                                                                       
+            '323857-323857', # HLT_IsoMu27_v16, 95.513/pb                                                                                                                                        
+            '323940-323940', # HLT_IsoMu27_v16, 426.706/pb 
+            '323954-323954', # HLT_IsoMu27_v16, 15.141/pb                                                                                                                                        
+            '323976-323976', # HLT_IsoMu27_v16, 14.399/pb                                                                                                                                        
+            '323978-323978', # HLT_IsoMu27_v16, 21.952/pb                                                                                                                                        
+            '323980-323980', # HLT_IsoMu27_v16, 67.732/pb                                                                                                                                        
+            '323983-323983', # HLT_IsoMu27_v16, 56.791/pb                                                                                                                                        
+            '323997-323997', # HLT_IsoMu27_v16, 128.792/pb                                                                                                                                       
+            '324021-324022', # HLT_IsoMu27_v16-380.271/pb                                                                                                                                       
+            '324077-324077', # HLT_IsoMu27_v16, 242.583/pb                                                                                                                                       
+            '324201-324202', # HLT_IsoMu27_v16, 402.099/pb                                                                                                                                       
+            '324205-324207', # HLT_IsoMu27_v16, 44.541/pb                                                                                                                                        
+            '324209-324209', # HLT_IsoMu27_v16, 16.079/pb                                                                                                                                        
+            '324237-324237', # HLT_IsoMu27_v16, 74.992/pb                                                                                                                                        
+            '324245-324245', # HLT_IsoMu27_v16, 417.199/pb                                                                                                                                       
+            '324293-324293', # HLT_IsoMu27_v16, 513.035/pb                                                                                                                                       
+            '324315-324315', # HLT_IsoMu27_v16, 70.437/pb                                                                                                                                        
+            '324318-324318', # HLT_IsoMu27_v16, 99.84/pb                                                                                                                                         
+            '324420-324420', # HLT_IsoMu27_v16, 199.727/pb                                                                                                                                       
+            '324729-324729', # HLT_IsoMu27_v16, 14.797/pb                                                                                                                                        
+            '324747-324747', # HLT_IsoMu27_v16-308.246/pb                                                                                                                                       
+            '324764-324765', # HLT_IsoMu27_v16, 117.745/pb                                                                                                                                       
+            '324769-324769', # HLT_IsoMu27_v16, 46.77/pb                                                                                                                                         
+            '324772-324772', # HLT_IsoMu27_v16, 18.783/pb                                                                                                                                        
+            '324785-324785', # HLT_IsoMu27_v16, 185.798/pb                                                                                                                                       
+            '324791-324791', # HLT_IsoMu27_v16, 245.007/pb                                                                                                                                       
+            '324835-324835', # HLT_IsoMu27_v16, 85.856/pb                                                                                                                                        
+            '324840-324841', # HLT_IsoMu27_v16-328.73/pb      
+            '324846-324846', # HLT_IsoMu27_v16, 68.553/pb                                                                                                                                        
+            '324878-324878', # HLT_IsoMu27_v16, 403.017/pb                                                                                                                                       
+            '324897-324897', # HLT_IsoMu27_v16, 50.229/pb                                                                                                                                        
+            '324970-324970', # HLT_IsoMu27_v16, 479.466/pb                                                                                                                                       
+            '324980-324980', # HLT_IsoMu27_v16, 513.295/pb                                                                                                                                       
+            '324997-325001', # HLT_IsoMu27_v16-370.507/pb                                                                                                                                       
+            '325022-325022', # HLT_IsoMu27_v16, 433.386/pb                                                                                                                                       
+            '325057-325057', # HLT_IsoMu27_v16, 120.048/pb                                                                                                                                       
+            '325097-325101', # HLT_IsoMu27_v16-351.717/pb                                                                                                                                       
+            '325110-325110', # HLT_IsoMu27_v16-3.259/pb                                                                                                                                         
+            '325117-325117', # HLT_IsoMu27_v16, 85.217/pb                                                                                                                                        
+            '325159-325159', # HLT_IsoMu27_v16, 61.44/pb                                                                                                                                         
+            '325168-325170', # HLT_IsoMu27_v16, 273.009/pb                                                                                                                                       
+            '325172-325172', # HLT_IsoMu27_v16, 67.636/pb
+        )),
+      ), # 1mu PSet 25-100 ENDS
+    ), ## mu VPSet ENDS
+
+  'e' : cms.VPSet(
+    cms.PSet( # 1e PSet 32-100 BEGINS
+      path = cms.string("HLT_Ele32_WPTight_Gsf"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(32.), ## Set this to the lepton pt threshold of the path above (if the threshold is < 8 GeV, set to -1.)
+      jet_minPt = cms.double(30.), ## If no jet is required in Trigger Path above we set this to 30 GeV
+      average_prescale = cms.double(1), # Since unprescaled
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+            '315257-315257', # HLT_Ele32_WPTight_Gsf_v13, 7.929/pb                                                                                                                               
+            '315259-315259', # HLT_Ele32_WPTight_Gsf_v13, 13.919/pb                                                                                                                              
+            '315264-315265', # HLT_Ele32_WPTight_Gsf_v13, 46.158/pb                                                                                                                              
+            '315267-315267', # HLT_Ele32_WPTight_Gsf_v13-37.143/pb                                                                                                                              
+            '315270-315270', # HLT_Ele32_WPTight_Gsf_v13, 78.981/pb                                                                                                                              
+            '315322-315322', # HLT_Ele32_WPTight_Gsf_v13, 180.063/pb                                                                                                                             
+            '315339-315339', # HLT_Ele32_WPTight_Gsf_v13, 93.349/pb                                                                                                                              
+            '315357-315357', # HLT_Ele32_WPTight_Gsf_v13, 151.931/pb                                                                                                                             
+            '315361-315361', # HLT_Ele32_WPTight_Gsf_v13, 118.532/pb                                                                                                                             
+            '315363-315363', # HLT_Ele32_WPTight_Gsf_v13, 14.489/pb                                                                                                                              
+            '315366-315366', # HLT_Ele32_WPTight_Gsf_v13, 100.183/pb                                                                                                                             
+            '315420-315420', # HLT_Ele32_WPTight_Gsf_v13, 258.566/pb                                                                                                                             
+            '315488-315490', # HLT_Ele32_WPTight_Gsf_v13, 296.522/pb                                                                                                                             
+            '315506-315506', # HLT_Ele32_WPTight_Gsf_v13, 27.983/pb                                                                                                                              
+            '315510-315510', # HLT_Ele32_WPTight_Gsf_v13, 103.172/pb                                                                                                                             
+            '315512-315512', # HLT_Ele32_WPTight_Gsf_v13, 236.871/pb                                                                                                                             
+            '315543-315543', # HLT_Ele32_WPTight_Gsf_v13-36.886/pb                                                                                                                              
+            '315555-315557', # HLT_Ele32_WPTight_Gsf_v13, 114.498/pb                                                                                                                             
+            '315640-315642', # HLT_Ele32_WPTight_Gsf_v13, 43.181/pb                                                                                                                              
+            '315644-315648', # HLT_Ele32_WPTight_Gsf_v13, 439.459/pb                                                                                                                             
+            '315689-315690', # HLT_Ele32_WPTight_Gsf_v13, 448.961/pb                                                                                                                             
+            '315702-315705', # HLT_Ele32_WPTight_Gsf_v13-328.569/pb                                                                                                                             
+            '315713-315713', # HLT_Ele32_WPTight_Gsf_v13-353.735/pb                                                                                                                             
+            '315721-315721', # HLT_Ele32_WPTight_Gsf_v13, 210.579/pb                                                                                                                             
+            '315741-315741', # HLT_Ele32_WPTight_Gsf_v13, 23.717/pb                                                                                                                              
+            '315764-315764', # HLT_Ele32_WPTight_Gsf_v13, 114.011/pb                                                                                                                             
+            '315770-315770', # HLT_Ele32_WPTight_Gsf_v13, 121.796/pb                                                                                                                             
+            '315784-315786', # HLT_Ele32_WPTight_Gsf_v13, 179.651/pb                                                                                                                             
+            '315790-315790', # HLT_Ele32_WPTight_Gsf_v13, 173.124/pb                                                                                                                             
+            '315800-315801', # HLT_Ele32_WPTight_Gsf_v13-304.75/pb                                                                                                                              
+            '315840-315840', # HLT_Ele32_WPTight_Gsf_v13-354.111/pb                                                                                                                             
+            '315973-315974', # HLT_Ele32_WPTight_Gsf_v13/HLT_Ele32_WPTight_Gsf_v14, 297.118/pb     
+            '316058-316062', # HLT_Ele32_WPTight_Gsf_v14, 512.949/pb                                                                                                                             
+            '316082-316082', # HLT_Ele32_WPTight_Gsf_v14, 141.36/pb                                                                                                                              
+            '316110-316111', # HLT_Ele32_WPTight_Gsf_v14, 97.131/pb                                                                                                                              
+            '316113-316114', # HLT_Ele32_WPTight_Gsf_v14-388.486/pb                                                                                                                             
+            '316153-316153', # HLT_Ele32_WPTight_Gsf_v14, 256.24/pb                                                                                                                              
+            '316186-316187', # HLT_Ele32_WPTight_Gsf_v14, 527.582/pb                                                                                                                             
+            '316199-316202', # HLT_Ele32_WPTight_Gsf_v14, 589.387/pb                                                                                                                             
+            '316216-316219', # HLT_Ele32_WPTight_Gsf_v14, 551.849/pb                                                                                                                             
+            '316239-316241', # HLT_Ele32_WPTight_Gsf_v14, 546.196/pb                                                                                                                             
+            '316271-316271', # HLT_Ele32_WPTight_Gsf_v14, 29.698/pb                                                                                                                              
+            '316361-316363', # HLT_Ele32_WPTight_Gsf_v15, 84.941/pb                                                                                                                              
+            '316377-316380', # HLT_Ele32_WPTight_Gsf_v15, 188.825/pb                                                                                                                             
+            '316455-316455', # HLT_Ele32_WPTight_Gsf_v15, 9.607/pb                                                                                                                               
+            '316457-316457', # HLT_Ele32_WPTight_Gsf_v15-326.273/pb                                                                                                                             
+            '316469-316470', # HLT_Ele32_WPTight_Gsf_v15, 265.747/pb                                                                                                                             
+            '316472-316472', # HLT_Ele32_WPTight_Gsf_v15, 66.237/pb                                                                                                                              
+            '316505-316505', # HLT_Ele32_WPTight_Gsf_v15, 401.22/pb                                                                                                                              
+            '316569-316569', # HLT_Ele32_WPTight_Gsf_v15, 485.569/pb                                                                                                                             
+            '316590-316590', # HLT_Ele32_WPTight_Gsf_v15, 189.247/pb                                                                                                                             
+            '316613-316613', # HLT_Ele32_WPTight_Gsf_v15-31.466/pb                                                                                                                              
+            '316615-316615', # HLT_Ele32_WPTight_Gsf_v15, 49.127/pb                                                                                                                              
+            '316666-316667', # HLT_Ele32_WPTight_Gsf_v15-321.521/pb                                                                                                                             
+            '316700-316702', # HLT_Ele32_WPTight_Gsf_v15-353.699/pb                                                                                                                             
+            '316715-316723', # HLT_Ele32_WPTight_Gsf_v15, 440.225/pb                                                                                                                             
+            '316758-316758', # HLT_Ele32_WPTight_Gsf_v15, 455.683/pb                                                                                                                             
+            '316766-316766', # HLT_Ele32_WPTight_Gsf_v15, 561.053/pb                                                                                                                             
+            '316876-316877', # HLT_Ele32_WPTight_Gsf_v15-327.431/pb                                                                                                                             
+            '316879-316879', # HLT_Ele32_WPTight_Gsf_v15-36.513/pb                                                                                                                              
+            '316928-316928', # HLT_Ele32_WPTight_Gsf_v15, 44.417/pb         
+            '316985-316985', # HLT_Ele32_WPTight_Gsf_v15, 172.546/pb                                                                                                                             
+            '316993-316995', # HLT_Ele32_WPTight_Gsf_v15, 265.445/pb                                                                                                                             
+            '317080-317080', # HLT_Ele32_WPTight_Gsf_v15, 7.844/pb                                                                                                                               
+            '317087-317087', # HLT_Ele32_WPTight_Gsf_v15, 243.2/pb                                                                                                                               
+            '317089-317089', # HLT_Ele32_WPTight_Gsf_v15, 212.905/pb                                                                                                                             
+            '317182-317182', # HLT_Ele32_WPTight_Gsf_v15, 406.207/pb                                                                                                                             
+            '317212-317213', # HLT_Ele32_WPTight_Gsf_v15, 176.661/pb                                                                                                                             
+            '317279-317279', # HLT_Ele32_WPTight_Gsf_v15, 65.892/pb                                                                                                                              
+            '317291-317292', # HLT_Ele32_WPTight_Gsf_v15-359.036/pb                                                                                                                             
+            '317297-317297', # HLT_Ele32_WPTight_Gsf_v15, 123.799/pb                                                                                                                             
+            '317319-317320', # HLT_Ele32_WPTight_Gsf_v15, 514.282/pb                                                                                                                             
+            '317338-317340', # HLT_Ele32_WPTight_Gsf_v15, 219.977/pb                                                                                                                             
+            '317382-317383', # HLT_Ele32_WPTight_Gsf_v15, 46.591/pb                                                                                                                              
+            '317391-317392', # HLT_Ele32_WPTight_Gsf_v15, 493.374/pb                                                                                                                             
+            '317435-317435', # HLT_Ele32_WPTight_Gsf_v15-360.613/pb                                                                                                                             
+            '317438-317438', # HLT_Ele32_WPTight_Gsf_v15, 49.71/pb                                                                                                                               
+            '317475-317475', # HLT_Ele32_WPTight_Gsf_v15, 25.761/pb                                                                                                                              
+            '317478-317478', # HLT_Ele32_WPTight_Gsf_v15, 7.937/pb                                                                                                                               
+            '317484-317484', # HLT_Ele32_WPTight_Gsf_v15, 160.356/pb                                                                                                                             
+            '317488-317488', # HLT_Ele32_WPTight_Gsf_v15, 181.128/pb                                                                                                                             
+            '317527-317527', # HLT_Ele32_WPTight_Gsf_v15, 452.099/pb                                                                                                                             
+            '317591-317591', # HLT_Ele32_WPTight_Gsf_v15, 111.117/pb                                                                                                                             
+            '317626-317626', # HLT_Ele32_WPTight_Gsf_v15, 528.94/pb                                                                                                                              
+            '317640-317641', # HLT_Ele32_WPTight_Gsf_v15, 529.494/pb                                                                                                                             
+            '317648-317650', # HLT_Ele32_WPTight_Gsf_v15, 483.09/pb                                                                                                                              
+            '317661-317661', # HLT_Ele32_WPTight_Gsf_v15-375.651/pb                
+            '317663-317663', # HLT_Ele32_WPTight_Gsf_v15, 153.301/pb                                                                                                                             
+            '317683-317683', # HLT_Ele32_WPTight_Gsf_v15, 117.852/pb                                                                                                                             
+            '317696-317696', # HLT_Ele32_WPTight_Gsf_v15, 228.787/pb                                                                                                                             
+            '318733-318733', # HLT_Ele32_WPTight_Gsf_v15, 2.792/pb                                                                                                                               
+            '318828-318828', # HLT_Ele32_WPTight_Gsf_v15, 13.229/pb                                                                                                                              
+            '318872-318872', # HLT_Ele32_WPTight_Gsf_v15, 91.855/pb                                                                                                                              
+            '318874-318874', # HLT_Ele32_WPTight_Gsf_v15, 99.565/pb                                                                                                                              
+            '318876-318877', # HLT_Ele32_WPTight_Gsf_v15, 207.136/pb                                                                                                                             
+            '319077-319077', # HLT_Ele32_WPTight_Gsf_v15, 16.372/pb                                                                                                                              
+            '319337-319337', # HLT_Ele32_WPTight_Gsf_v15, 232.389/pb                                                                                                                             
+            '319347-319349', # HLT_Ele32_WPTight_Gsf_v15, 256.706/pb                                                                                                                             
+            '319449-319450', # HLT_Ele32_WPTight_Gsf_v15, 456.219/pb                                                                                                                             
+            '319456-319456', # HLT_Ele32_WPTight_Gsf_v15, 52.016/pb                                                                                                                              
+            '319459-319459', # HLT_Ele32_WPTight_Gsf_v15, 17.212/pb                                                                                                                              
+            '319486-319486', # HLT_Ele32_WPTight_Gsf_v15, 20.315/pb                                                                                                                              
+            '319503-319503', # HLT_Ele32_WPTight_Gsf_v15, 90.959/pb                                                                                                                              
+            '319524-319524', # HLT_Ele32_WPTight_Gsf_v15, 456.701/pb                                                                                                                             
+            '319526-319526', # HLT_Ele32_WPTight_Gsf_v15, 69.66/pb                                                                                                                               
+            '319528-319528', # HLT_Ele32_WPTight_Gsf_v15, 58.411/pb                                                                                                                              
+            '319579-319579', # HLT_Ele32_WPTight_Gsf_v15, 818.49/pb                                                                                                                              
+            '319625-319625', # HLT_Ele32_WPTight_Gsf_v15, 70.596/pb                                                                                                                              
+            '319639-319639', # HLT_Ele32_WPTight_Gsf_v15, 409.34/pb                                                                                                                              
+            '319656-319659', # HLT_Ele32_WPTight_Gsf_v15, 221.8/pb                                                                                                                               
+            '319678-319678', # HLT_Ele32_WPTight_Gsf_v15, 95.425/pb                                                                                                                              
+            '319687-319687', # HLT_Ele32_WPTight_Gsf_v15, 16.053/pb                                                                                                                              
+            '319697-319698', # HLT_Ele32_WPTight_Gsf_v15, 96.857/pb             
+            '319756-319756', # HLT_Ele32_WPTight_Gsf_v15, 490.205/pb                                                                                                                             
+            '319840-319841', # HLT_Ele32_WPTight_Gsf_v15, 69.999/pb                                                                                                                              
+            '319847-319849', # HLT_Ele32_WPTight_Gsf_v15, 193.537/pb                                                                                                                             
+            '319851-319851', # HLT_Ele32_WPTight_Gsf_v15, 1.137/pb                                                                                                                               
+            '319853-319854', # HLT_Ele32_WPTight_Gsf_v15, 124.92/pb                                                                                                                              
+            '319908-319910', # HLT_Ele32_WPTight_Gsf_v15-324.281/pb                                                                                                                             
+            '319912-319915', # HLT_Ele32_WPTight_Gsf_v15, 119.686/pb                                                                                                                             
+            '319941-319942', # HLT_Ele32_WPTight_Gsf_v15, 111.886/pb                                                                                                                             
+            '319950-319950', # HLT_Ele32_WPTight_Gsf_v15, 65.936/pb                                                                                                                              
+            '319991-319993', # HLT_Ele32_WPTight_Gsf_v15, 530.374/pb                                                                                                                             
+            '320002-320002', # HLT_Ele32_WPTight_Gsf_v15, 50.203/pb                                                                                                                              
+            '320006-320006', # HLT_Ele32_WPTight_Gsf_v15, 114.14/pb                                                                                                                              
+            '320010-320012', # HLT_Ele32_WPTight_Gsf_v15, 153.875/pb                                                                                                                             
+            '320023-320026', # HLT_Ele32_WPTight_Gsf_v15-305.475/pb                                                                                                                             
+            '320038-320040', # HLT_Ele32_WPTight_Gsf_v15, 404.341/pb                                                                                                                             
+            '320059-320065', # HLT_Ele32_WPTight_Gsf_v15-395.979/pb                                                                                                                             
+            '320673-320674', # HLT_Ele32_WPTight_Gsf_v15, 98.341/pb                                                                                                                              
+            '320688-320688', # HLT_Ele32_WPTight_Gsf_v15, 130.855/pb                                                                                                                             
+            '320712-320712', # HLT_Ele32_WPTight_Gsf_v15, 69.58/pb                                                                                                                               
+            '320757-320757', # HLT_Ele32_WPTight_Gsf_v15, 116.684/pb                                                                                                                             
+            '320804-320804', # HLT_Ele32_WPTight_Gsf_v15-319.033/pb                                                                                                                             
+            '320807-320807', # HLT_Ele32_WPTight_Gsf_v15, 0.348/pb                                                                                                                               
+            '320809-320809', # HLT_Ele32_WPTight_Gsf_v15, 106.231/pb                                                                                                                             
+            '320821-320824', # HLT_Ele32_WPTight_Gsf_v15, 454.293/pb                                                                                                                             
+            '320838-320838', # HLT_Ele32_WPTight_Gsf_v15, 92.366/pb                                                                                                                              
+            '320840-320841', # HLT_Ele32_WPTight_Gsf_v15, 191.511/pb 
+            '320853-320859', # HLT_Ele32_WPTight_Gsf_v15, 433.068/pb                                                                                                                             
+            '320887-320888', # HLT_Ele32_WPTight_Gsf_v15, 113.862/pb                                                                                                                             
+            '320916-320917', # HLT_Ele32_WPTight_Gsf_v15, 484.437/pb                                                                                                                             
+            '320920-320920', # HLT_Ele32_WPTight_Gsf_v15, 24.013/pb                                                                                                                              
+            '320933-320934', # HLT_Ele32_WPTight_Gsf_v15, 262.426/pb                                                                                                                             
+            '320936-320936', # HLT_Ele32_WPTight_Gsf_v15, 78.32/pb                                                                                                                               
+            '320941-320941', # HLT_Ele32_WPTight_Gsf_v15, 15.638/pb                                                                                                                              
+            '320980-320980', # HLT_Ele32_WPTight_Gsf_v15-38.408/pb                                                                                                                              
+            '320995-320996', # HLT_Ele32_WPTight_Gsf_v15, 74.084/pb                                                                                                                              
+            '321004-321007', # HLT_Ele32_WPTight_Gsf_v15-320.57/pb                                                                                                                              
+            '321009-321012', # HLT_Ele32_WPTight_Gsf_v15, 105.863/pb                                                                                                                             
+            '321051-321051', # HLT_Ele32_WPTight_Gsf_v15-311.577/pb                                                                                                                             
+            '321055-321055', # HLT_Ele32_WPTight_Gsf_v15, 125.495/pb                                                                                                                             
+            '321067-321069', # HLT_Ele32_WPTight_Gsf_v15-369.401/pb                                                                                                                             
+            '321119-321119', # HLT_Ele32_WPTight_Gsf_v15, 58.668/pb                                                                                                                              
+            '321121-321122', # HLT_Ele32_WPTight_Gsf_v15, 136.178/pb                                                                                                                             
+            '321124-321124', # HLT_Ele32_WPTight_Gsf_v15, 185.308/pb                                                                                                                             
+            '321126-321126', # HLT_Ele32_WPTight_Gsf_v15, 78.957/pb                                                                                                                              
+            '321134-321134', # HLT_Ele32_WPTight_Gsf_v15, 8.164/pb                                                                                                                               
+            '321138-321138', # HLT_Ele32_WPTight_Gsf_v15, 141.977/pb                                                                                                                             
+            '321140-321140', # HLT_Ele32_WPTight_Gsf_v15, 116.949/pb                                                                                                                             
+            '321149-321149', # HLT_Ele32_WPTight_Gsf_v15, 434.675/pb                                                                                                                             
+            '321165-321167', # HLT_Ele32_WPTight_Gsf_v15, 277.898/pb                                                                                                                             
+            '321177-321178', # HLT_Ele32_WPTight_Gsf_v15, 174.709/pb                                                                                                                             
+            '321218-321219', # HLT_Ele32_WPTight_Gsf_v15, 463.69/pb                                                                                                                              
+            '321221-321221', # HLT_Ele32_WPTight_Gsf_v15, 5.906/pb        
+            '321230-321233', # HLT_Ele32_WPTight_Gsf_v15, 275.104/pb                                                                                                                             
+            '321262-321262', # HLT_Ele32_WPTight_Gsf_v15, 1.669/pb                                                                                                                               
+            '321283-321283', # HLT_Ele32_WPTight_Gsf_v15, 119.781/pb                                                                                                                             
+            '321294-321296', # HLT_Ele32_WPTight_Gsf_v15, 233.977/pb                                                                                                                             
+            '321305-321305', # HLT_Ele32_WPTight_Gsf_v15, 601.905/pb                                                                                                                             
+            '321311-321313', # HLT_Ele32_WPTight_Gsf_v15, 87.325/pb                                                                                                                              
+            '321393-321393', # HLT_Ele32_WPTight_Gsf_v15, 49.689/pb                                                                                                                              
+            '321396-321397', # HLT_Ele32_WPTight_Gsf_v15, 417.281/pb                                                                                                                             
+            '321414-321415', # HLT_Ele32_WPTight_Gsf_v15, 523.015/pb                                                                                                                             
+            '321431-321434', # HLT_Ele32_WPTight_Gsf_v15, 296.1/pb                                                                                                                               
+            '321436-321436', # HLT_Ele32_WPTight_Gsf_v15, 138.442/pb                                                                                                                             
+            '321457-321457', # HLT_Ele32_WPTight_Gsf_v15, 482.762/pb                                                                                                                             
+            '321461-321461', # HLT_Ele32_WPTight_Gsf_v15, 21.013/pb                                                                                                                              
+            '321475-321475', # HLT_Ele32_WPTight_Gsf_v15, 471.913/pb                                                                                                                             
+            '321710-321710', # HLT_Ele32_WPTight_Gsf_v15, 17.235/pb                                                                                                                              
+            '321712-321712', # HLT_Ele32_WPTight_Gsf_v15, 84.378/pb                                                                                                                              
+            '321730-321730', # HLT_Ele32_WPTight_Gsf_v15, 102.671/pb                                                                                                                             
+            '321732-321732', # HLT_Ele32_WPTight_Gsf_v15-344.692/pb                                                                                                                             
+            '321735-321735', # HLT_Ele32_WPTight_Gsf_v15, 23.661/pb                                                                                                                              
+            '321755-321755', # HLT_Ele32_WPTight_Gsf_v15, 213.438/pb                                                                                                                             
+            '321758-321758', # HLT_Ele32_WPTight_Gsf_v15-37.518/pb                                                                                                                              
+            '321760-321760', # HLT_Ele32_WPTight_Gsf_v15, 146.153/pb                                                                                                                             
+            '321773-321778', # HLT_Ele32_WPTight_Gsf_v15, 174.569/pb                                                                                                                             
+            '321780-321781', # HLT_Ele32_WPTight_Gsf_v15, 181.684/pb                                                                                                                             
+            '321813-321813', # HLT_Ele32_WPTight_Gsf_v15, 120.244/pb                                                                                                                             
+            '321815-321815', # HLT_Ele32_WPTight_Gsf_v15, 5.12/pb           
+            '321817-321818', # HLT_Ele32_WPTight_Gsf_v15, 286.489/pb                                                                                                                             
+            '321820-321820', # HLT_Ele32_WPTight_Gsf_v15-32.069/pb                                                                                                                              
+            '321831-321834', # HLT_Ele32_WPTight_Gsf_v15, 488.005/pb                                                                                                                             
+            '321879-321880', # HLT_Ele32_WPTight_Gsf_v15, 131.546/pb                                                                                                                             
+            '321887-321887', # HLT_Ele32_WPTight_Gsf_v15, 276.941/pb                                                                                                                             
+            '321908-321909', # HLT_Ele32_WPTight_Gsf_v15, 485.884/pb                                                                                                                             
+            '321917-321917', # HLT_Ele32_WPTight_Gsf_v15, 261.22/pb                                                                                                                              
+            '321919-321919', # HLT_Ele32_WPTight_Gsf_v15, 1.489/pb                                                                                                                               
+            '321933-321933', # HLT_Ele32_WPTight_Gsf_v15, 101.007/pb                                                                                                                             
+            '321960-321961', # HLT_Ele32_WPTight_Gsf_v15, 139.431/pb                                                                                                                             
+            '321973-321973', # HLT_Ele32_WPTight_Gsf_v15-358.667/pb                                                                                                                             
+            '321975-321975', # HLT_Ele32_WPTight_Gsf_v15, 145.784/pb                                                                                                                             
+            '321988-321988', # HLT_Ele32_WPTight_Gsf_v15-384.022/pb                                                                                                                             
+            '321990-321990', # HLT_Ele32_WPTight_Gsf_v15, 81.032/pb                                                                                                                              
+            '322013-322014', # HLT_Ele32_WPTight_Gsf_v15, 7.816/pb                                                                                                                               
+            '322022-322022', # HLT_Ele32_WPTight_Gsf_v15, 452.969/pb                                                                                                                             
+            '322040-322040', # HLT_Ele32_WPTight_Gsf_v15, 13.692/pb                                                                                                                              
+            '322057-322057', # HLT_Ele32_WPTight_Gsf_v15, 8.235/pb                                                                                                                               
+            '322068-322068', # HLT_Ele32_WPTight_Gsf_v15, 232.599/pb                                                                                                                             
+            '322079-322079', # HLT_Ele32_WPTight_Gsf_v15, 140.245/pb                                                                                                                             
+            '322106-322106', # HLT_Ele32_WPTight_Gsf_v15, 281.859/pb                                                                                                                             
+            '322113-322113', # HLT_Ele32_WPTight_Gsf_v15, 40.79/pb                                                                                                                               
+            '322118-322118', # HLT_Ele32_WPTight_Gsf_v15, 268.229/pb                                                                                                                             
+            '322179-322179', # HLT_Ele32_WPTight_Gsf_v15, 469.75/pb                                                                                                                              
+            '322201-322201', # HLT_Ele32_WPTight_Gsf_v15, 84.335/pb                                                                                                                              
+            '322204-322204', # HLT_Ele32_WPTight_Gsf_v15-311.166/pb  
+            '322222-322222', # HLT_Ele32_WPTight_Gsf_v15, 92.744/pb                                                                                                                              
+            '322252-322252', # HLT_Ele32_WPTight_Gsf_v15, 420.358/pb                                                                                                                             
+            '322317-322317', # HLT_Ele32_WPTight_Gsf_v15, 19.246/pb                                                                                                                              
+            '322319-322319', # HLT_Ele32_WPTight_Gsf_v15, 55.502/pb                                                                                                                              
+            '322322-322322', # HLT_Ele32_WPTight_Gsf_v15, 292.464/pb                                                                                                                             
+            '322324-322324', # HLT_Ele32_WPTight_Gsf_v15, 69.26/pb                                                                                                                               
+            '322332-322332', # HLT_Ele32_WPTight_Gsf_v15-313.996/pb                                                                                                                             
+            '322348-322348', # HLT_Ele32_WPTight_Gsf_v15, 414.112/pb                                                                                                                             
+            '322355-322356', # HLT_Ele32_WPTight_Gsf_v15, 268.46/pb                                                                                                                              
+            '322381-322381', # HLT_Ele32_WPTight_Gsf_v15, 178.73/pb                                                                                                                              
+            '322407-322407', # HLT_Ele32_WPTight_Gsf_v15, 169.958/pb                                                                                                                             
+            '322430-322431', # HLT_Ele32_WPTight_Gsf_v15-370.371/pb                                                                                                                             
+            '322480-322480', # HLT_Ele32_WPTight_Gsf_v15, 109.337/pb                                                                                                                             
+            '322492-322492', # HLT_Ele32_WPTight_Gsf_v15, 287.515/pb                                                                                                                             
+            '322510-322510', # HLT_Ele32_WPTight_Gsf_v15, 2.229/pb                                                                                                                               
+            '322599-322599', # HLT_Ele32_WPTight_Gsf_v15, 94.351/pb                                                                                                                              
+            '322602-322603', # HLT_Ele32_WPTight_Gsf_v15, 26.803/pb                                                                                                                              
+            '322605-322605', # HLT_Ele32_WPTight_Gsf_v15, 89.624/pb                                                                                                                              
+            '322617-322617', # HLT_Ele32_WPTight_Gsf_v15, 136.646/pb                                                                                                                             
+            '322625-322625', # HLT_Ele32_WPTight_Gsf_v15-335.273/pb                                                                                                                             
+            '322633-322633', # HLT_Ele32_WPTight_Gsf_v15, 50.946/pb                                                                                                                              
+            '323414-323414', # HLT_Ele32_WPTight_Gsf_v15, 6.204/pb                                                                                                                               
+            '323423-323423', # HLT_Ele32_WPTight_Gsf_v15, 21.037/pb                                                                                                                              
+            '323470-323475', # HLT_Ele32_WPTight_Gsf_v15-321.533/pb                                                                                                                             
+            '323487-323488', # HLT_Ele32_WPTight_Gsf_v15-340.364/pb                                                                                                                             
+            '323492-323493', # HLT_Ele32_WPTight_Gsf_v15-33.198/pb            
+            '323495-323495', # HLT_Ele32_WPTight_Gsf_v15-32.347/pb                                                                                                                              
+            '323524-323526', # HLT_Ele32_WPTight_Gsf_v15, 480.533/pb                                                                                                                             
+            '323693-323693', # HLT_Ele32_WPTight_Gsf_v15, 40.083/pb                                                                                                                              
+            '323696-323696', # HLT_Ele32_WPTight_Gsf_v15, 88.848/pb                                                                                                                              
+            '323702-323702', # HLT_Ele32_WPTight_Gsf_v15, 145.958/pb                                                                                                                             
+            '323725-323727', # HLT_Ele32_WPTight_Gsf_v15-380.043/pb                                                                                                                             
+            '323755-323755', # HLT_Ele32_WPTight_Gsf_v15, 296.639/pb                                                                                                                             
+            '323775-323775', # HLT_Ele32_WPTight_Gsf_v15, 46.768/pb                                                                                                                              
+            '323778-323778', # HLT_Ele32_WPTight_Gsf_v15, 270.936/pb                                                                                                                             
+            '323790-323790', # HLT_Ele32_WPTight_Gsf_v15, 276.737/pb                                                                                                                             
+            '323794-323794', # HLT_Ele32_WPTight_Gsf_v15, 16.057/pb                                                                                                                              
+            '323841-323841', # HLT_Ele32_WPTight_Gsf_v15, 155.038/pb                                                                                                                             
+            '323857-323857', # HLT_Ele32_WPTight_Gsf_v15, 95.513/pb                                                                                                                              
+            '323940-323940', # HLT_Ele32_WPTight_Gsf_v15, 426.706/pb                                                                                                                             
+            '323954-323954', # HLT_Ele32_WPTight_Gsf_v15, 15.141/pb                                                                                                                              
+            '323976-323976', # HLT_Ele32_WPTight_Gsf_v15, 14.399/pb                                                                                                                              
+            '323978-323978', # HLT_Ele32_WPTight_Gsf_v15, 21.952/pb                                                                                                                              
+            '323980-323980', # HLT_Ele32_WPTight_Gsf_v15, 67.732/pb                                                                                                                              
+            '323983-323983', # HLT_Ele32_WPTight_Gsf_v15, 56.791/pb                                                                                                                              
+            '323997-323997', # HLT_Ele32_WPTight_Gsf_v15, 128.792/pb                                                                                                                             
+            '324021-324022', # HLT_Ele32_WPTight_Gsf_v15-380.271/pb                                                                                                                             
+            '324077-324077', # HLT_Ele32_WPTight_Gsf_v15, 242.583/pb                                                                                                                             
+            '324201-324202', # HLT_Ele32_WPTight_Gsf_v15, 402.099/pb                                                                                                                             
+            '324205-324207', # HLT_Ele32_WPTight_Gsf_v15, 44.541/pb                                                                                                                              
+            '324209-324209', # HLT_Ele32_WPTight_Gsf_v15, 16.079/pb                                                                                                                              
+            '324237-324237', # HLT_Ele32_WPTight_Gsf_v15, 74.992/pb           
+            '324245-324245', # HLT_Ele32_WPTight_Gsf_v15, 417.199/pb                                                                                                                             
+            '324293-324293', # HLT_Ele32_WPTight_Gsf_v15, 513.035/pb                                                                                                                             
+            '324315-324315', # HLT_Ele32_WPTight_Gsf_v15, 70.437/pb                                                                                                                              
+            '324318-324318', # HLT_Ele32_WPTight_Gsf_v15, 99.84/pb                                                                                                                               
+            '324420-324420', # HLT_Ele32_WPTight_Gsf_v15, 199.727/pb                                                                                                                             
+            '324729-324729', # HLT_Ele32_WPTight_Gsf_v15, 14.797/pb                                                                                                                              
+            '324747-324747', # HLT_Ele32_WPTight_Gsf_v15-308.246/pb                                                                                                                             
+            '324764-324765', # HLT_Ele32_WPTight_Gsf_v15, 117.745/pb                                                                                                                             
+            '324769-324769', # HLT_Ele32_WPTight_Gsf_v15, 46.77/pb                                                                                                                               
+            '324772-324772', # HLT_Ele32_WPTight_Gsf_v15, 18.783/pb                                                                                                                              
+            '324785-324785', # HLT_Ele32_WPTight_Gsf_v15, 185.798/pb                                                                                                                             
+            '324791-324791', # HLT_Ele32_WPTight_Gsf_v15, 245.007/pb                                                                                                                             
+            '324835-324835', # HLT_Ele32_WPTight_Gsf_v15, 85.856/pb                                                                                                                              
+            '324840-324841', # HLT_Ele32_WPTight_Gsf_v15-328.73/pb                                                                                                                              
+            '324846-324846', # HLT_Ele32_WPTight_Gsf_v15, 68.553/pb                                                                                                                              
+            '324878-324878', # HLT_Ele32_WPTight_Gsf_v15, 403.017/pb                                                                                                                             
+            '324897-324897', # HLT_Ele32_WPTight_Gsf_v15, 50.229/pb                                                                                                                              
+            '324970-324970', # HLT_Ele32_WPTight_Gsf_v15, 479.466/pb                                                                                                                             
+            '324980-324980', # HLT_Ele32_WPTight_Gsf_v15, 513.295/pb                                                                                                                             
+            '324997-325001', # HLT_Ele32_WPTight_Gsf_v15-370.507/pb                                                                                                                             
+            '325022-325022', # HLT_Ele32_WPTight_Gsf_v15, 433.386/pb                                                                                                                             
+            '325057-325057', # HLT_Ele32_WPTight_Gsf_v15, 120.048/pb                                                                                                                             
+            '325097-325101', # HLT_Ele32_WPTight_Gsf_v15-351.717/pb                                                                                                                             
+            '325110-325110', # HLT_Ele32_WPTight_Gsf_v15-3.259/pb                                                                                                                               
+            '325117-325117', # HLT_Ele32_WPTight_Gsf_v15, 85.217/pb                                                                                                                              
+            '325159-325159', # HLT_Ele32_WPTight_Gsf_v15, 61.44/pb      
+            '325168-325170', # HLT_Ele32_WPTight_Gsf_v15, 273.009/pb                                                                                                                             
+            '325172-325172', # HLT_Ele32_WPTight_Gsf_v15, 67.636/pb      
+        )),
+      ), # 1e PSet 32-100 ENDS
+    ), ## e VPSet ENDS
+}
@@ -0,0 +1,1460 @@
+import FWCore.ParameterSet.Config as cms
+
+leptonFR_triggers = {
+  'mu' : cms.VPSet(
+    cms.PSet(
+      path = cms.string("HLT_Mu3_PFJet40"),
+      cone_minPt = cms.double(10.),
+      cone_maxPt = cms.double(32.),
+      minRecoPt = cms.double(-1.),
+      jet_minPt = cms.double(45.),
+      average_prescale = cms.double(4849), # L=7.408/pb; present in all eras; prescale factor 4849.0 (4863.2 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '273158-273158', # HLT_Mu3_PFJet40_v1, 0.025/pb
+        '273302-273302', # HLT_Mu3_PFJet40_v1, 0.008/pb
+        '273402-273406', # HLT_Mu3_PFJet40_v1, 0.006/pb
+        '273408-273411', # HLT_Mu3_PFJet40_v1, 0.013/pb
+        '273425-273425', # HLT_Mu3_PFJet40_v1, 0.013/pb
+        '273446-273450', # HLT_Mu3_PFJet40_v1, 0.036/pb
+        '273492-273494', # HLT_Mu3_PFJet40_v1, 0.008/pb
+        '273502-273503', # HLT_Mu3_PFJet40_v1, 0.036/pb
+        '273554-273555', # HLT_Mu3_PFJet40_v1, 0.011/pb
+        '273725-273725', # HLT_Mu3_PFJet40_v1, 0.061/pb
+        '273728-273728', # HLT_Mu3_PFJet40_v1, 0.002/pb
+        '273730-273730', # HLT_Mu3_PFJet40_v1, 0.054/pb
+        '274094-274094', # HLT_Mu3_PFJet40_v1, 0.005/pb
+        '274146-274146', # HLT_Mu3_PFJet40_v1, 0.001/pb
+        '274157-274157', # HLT_Mu3_PFJet40_v1, 0.007/pb
+        '274159-274161', # HLT_Mu3_PFJet40_v1, 0.018/pb
+        '274172-274172', # HLT_Mu3_PFJet40_v1, 0.001/pb
+        '274198-274200', # HLT_Mu3_PFJet40_v1, 0.031/pb
+        '274240-274241', # HLT_Mu3_PFJet40_v1, 0.026/pb
+        '274244-274244', # HLT_Mu3_PFJet40_v1, 0.025/pb
+        '274250-274251', # HLT_Mu3_PFJet40_v1, 0.025/pb
+        '274283-274284', # HLT_Mu3_PFJet40_v1, 0.004/pb
+        '274286-274286', # HLT_Mu3_PFJet40_v1, 0.003/pb
+        '274314-274317', # HLT_Mu3_PFJet40_v1, 0.103/pb
+        '274319-274319', # HLT_Mu3_PFJet40_v1, 0.014/pb
+        '274335-274339', # HLT_Mu3_PFJet40_v1, 0.139/pb
+        '274344-274345', # HLT_Mu3_PFJet40_v1, 0.13/pb
+        '274382-274382', # HLT_Mu3_PFJet40_v1, 0.001/pb
+        '274387-274388', # HLT_Mu3_PFJet40_v1, 0.053/pb
+        '274420-274422', # HLT_Mu3_PFJet40_v1, 0.085/pb
+        '274440-274442', # HLT_Mu3_PFJet40_v1, 0.039/pb
+        '274954-274955', # HLT_Mu3_PFJet40_v2, 0.003/pb
+        '274968-274971', # HLT_Mu3_PFJet40_v2, 0.07/pb
+        '274998-275001', # HLT_Mu3_PFJet40_v2, 0.097/pb
+        '275059-275059', # HLT_Mu3_PFJet40_v2, 0.001/pb
+        '275066-275068', # HLT_Mu3_PFJet40_v2, 0.109/pb
+        '275073-275074', # HLT_Mu3_PFJet40_v2, 0.096/pb
+        '275124-275125', # HLT_Mu3_PFJet40_v2, 0.106/pb
+        '275282-275284', # HLT_Mu3_PFJet40_v2, 0.007/pb
+        '275290-275293', # HLT_Mu3_PFJet40_v2, 0.016/pb
+        '275309-275311', # HLT_Mu3_PFJet40_v2, 0.089/pb
+        '275319-275319', # HLT_Mu3_PFJet40_v2, 0.003/pb
+        '275337-275338', # HLT_Mu3_PFJet40_v2, 0.023/pb
+        '275344-275345', # HLT_Mu3_PFJet40_v2, 0.014/pb
+        '275370-275371', # HLT_Mu3_PFJet40_v2, 0.019/pb
+        '275375-275376', # HLT_Mu3_PFJet40_v2, 0.105/pb
+        '275657-275659', # HLT_Mu3_PFJet40_v2, 0.009/pb
+        '275761-275761', # HLT_Mu3_PFJet40_v2, 0.0/pb
+        '275767-275767', # HLT_Mu3_PFJet40_v2, 0.0/pb
+        '275772-275774', # HLT_Mu3_PFJet40_v2, 0.008/pb
+        '275776-275778', # HLT_Mu3_PFJet40_v2, 0.017/pb
+        '275782-275782', # HLT_Mu3_PFJet40_v2, 0.02/pb
+        '275832-275837', # HLT_Mu3_PFJet40_v2, 0.067/pb
+        '275847-275847', # HLT_Mu3_PFJet40_v2, 0.051/pb
+        '275886-275886', # HLT_Mu3_PFJet40_v2, 0.001/pb
+        '275890-275890', # HLT_Mu3_PFJet40_v2, 0.031/pb
+        '275911-275913', # HLT_Mu3_PFJet40_v2, 0.025/pb
+        '275918-275918', # HLT_Mu3_PFJet40_v2, 0.007/pb
+        '275920-275921', # HLT_Mu3_PFJet40_v2, 0.012/pb
+        '275923-275923', # HLT_Mu3_PFJet40_v2, 0.003/pb
+        '275931-275931', # HLT_Mu3_PFJet40_v2, 0.002/pb
+        '275963-275963', # HLT_Mu3_PFJet40_v2, 0.002/pb
+        '276092-276092', # HLT_Mu3_PFJet40_v2, 0.001/pb
+        '276097-276097', # HLT_Mu3_PFJet40_v2, 0.011/pb
+        '276242-276244', # HLT_Mu3_PFJet40_v2, 0.081/pb
+        '276282-276283', # HLT_Mu3_PFJet40_v3, 0.05/pb
+        '276315-276315', # HLT_Mu3_PFJet40_v3, 0.004/pb
+        '276317-276318', # HLT_Mu3_PFJet40_v3, 0.016/pb
+        '276355-276355', # HLT_Mu3_PFJet40_v3, 0.001/pb
+        '276361-276361', # HLT_Mu3_PFJet40_v3, 0.019/pb
+        '276363-276363', # HLT_Mu3_PFJet40_v3, 0.037/pb
+        '276384-276384', # HLT_Mu3_PFJet40_v3, 0.024/pb
+        '276437-276437', # HLT_Mu3_PFJet40_v3, 0.049/pb
+        '276454-276454', # HLT_Mu3_PFJet40_v3, 0.013/pb
+        '276458-276458', # HLT_Mu3_PFJet40_v3, 0.007/pb
+        '276495-276495', # HLT_Mu3_PFJet40_v3, 0.004/pb
+        '276501-276502', # HLT_Mu3_PFJet40_v3, 0.075/pb
+        '276525-276525', # HLT_Mu3_PFJet40_v3, 0.065/pb
+        '276527-276528', # HLT_Mu3_PFJet40_v3, 0.013/pb
+        '276542-276545', # HLT_Mu3_PFJet40_v3, 0.047/pb
+        '276581-276587', # HLT_Mu3_PFJet40_v3, 0.074/pb
+        '276653-276653', # HLT_Mu3_PFJet40_v3, 0.01/pb
+        '276655-276655', # HLT_Mu3_PFJet40_v3, 0.025/pb
+        '276659-276659', # HLT_Mu3_PFJet40_v3, 0.006/pb
+        '276775-276776', # HLT_Mu3_PFJet40_v3, 0.069/pb
+        '276794-276794', # HLT_Mu3_PFJet40_v3, 0.021/pb
+        '276807-276808', # HLT_Mu3_PFJet40_v3, 0.023/pb
+        '276810-276811', # HLT_Mu3_PFJet40_v3, 0.068/pb
+        '276831-276831', # HLT_Mu3_PFJet40_v3, 0.063/pb
+        '276834-276834', # HLT_Mu3_PFJet40_v3, 0.017/pb
+        '276870-276870', # HLT_Mu3_PFJet40_v3, 0.08/pb
+        '276935-276935', # HLT_Mu3_PFJet40_v3, 0.017/pb
+        '276940-276940', # HLT_Mu3_PFJet40_v3, 0.003/pb
+        '276946-276948', # HLT_Mu3_PFJet40_v3, 0.013/pb
+        '276950-276950', # HLT_Mu3_PFJet40_v3, 0.056/pb
+        '277069-277073', # HLT_Mu3_PFJet40_v3, 0.162/pb
+        '277076-277076', # HLT_Mu3_PFJet40_v3, 0.025/pb
+        '277087-277087', # HLT_Mu3_PFJet40_v3, 0.025/pb
+        '277094-277094', # HLT_Mu3_PFJet40_v3, 0.012/pb
+        '277096-277096', # HLT_Mu3_PFJet40_v3, 0.049/pb
+        '277112-277112', # HLT_Mu3_PFJet40_v3, 0.01/pb
+        '277126-277127', # HLT_Mu3_PFJet40_v3, 0.021/pb
+        '277148-277148', # HLT_Mu3_PFJet40_v3, 0.014/pb
+        '277166-277166', # HLT_Mu3_PFJet40_v3, 0.008/pb
+        '277168-277168', # HLT_Mu3_PFJet40_v3, 0.053/pb
+        '277180-277180', # HLT_Mu3_PFJet40_v3, 0.003/pb
+        '277194-277194', # HLT_Mu3_PFJet40_v3, 0.043/pb
+        '277305-277305', # HLT_Mu3_PFJet40_v3, 0.014/pb
+        '277420-277420', # HLT_Mu3_PFJet40_v3, 0.005/pb
+        '277981-277981', # HLT_Mu3_PFJet40_v3, 0.001/pb
+        '277991-277992', # HLT_Mu3_PFJet40_v3, 0.011/pb
+        '278017-278018', # HLT_Mu3_PFJet40_v3, 0.036/pb
+        '278167-278167', # HLT_Mu3_PFJet40_v3, 0.052/pb
+        '278175-278175', # HLT_Mu3_PFJet40_v3, 0.002/pb
+        '278193-278193', # HLT_Mu3_PFJet40_v3, 0.003/pb
+        '278239-278240', # HLT_Mu3_PFJet40_v3, 0.046/pb
+        '278273-278274', # HLT_Mu3_PFJet40_v4, 0.003/pb
+        '278288-278290', # HLT_Mu3_PFJet40_v4, 0.002/pb
+        '278308-278308', # HLT_Mu3_PFJet40_v4, 0.038/pb
+        '278310-278310', # HLT_Mu3_PFJet40_v4, 0.013/pb
+        '278315-278315', # HLT_Mu3_PFJet40_v4, 0.016/pb
+        '278345-278346', # HLT_Mu3_PFJet40_v4, 0.02/pb
+        '278349-278349', # HLT_Mu3_PFJet40_v4, 0.015/pb
+        '278366-278366', # HLT_Mu3_PFJet40_v4, 0.012/pb
+        '278406-278406', # HLT_Mu3_PFJet40_v4, 0.036/pb
+        '278509-278509', # HLT_Mu3_PFJet40_v4, 0.033/pb
+        '278769-278770', # HLT_Mu3_PFJet40_v4, 0.018/pb
+        '278801-278805', # HLT_Mu3_PFJet40_v4, 0.014/pb
+        '278808-278808', # HLT_Mu3_PFJet40_v4, 0.041/pb
+        '278820-278820', # HLT_Mu3_PFJet40_v4, 0.035/pb
+        '278822-278822', # HLT_Mu3_PFJet40_v4, 0.04/pb
+        '278873-278875', # HLT_Mu3_PFJet40_v4, 0.029/pb
+        '278923-278923', # HLT_Mu3_PFJet40_v4, 0.009/pb
+        '278957-278957', # HLT_Mu3_PFJet40_v4, 0.003/pb
+        '278962-278963', # HLT_Mu3_PFJet40_v4, 0.011/pb
+        '278969-278969', # HLT_Mu3_PFJet40_v4, 0.031/pb
+        '278975-278976', # HLT_Mu3_PFJet40_v4, 0.02/pb
+        '278986-278986', # HLT_Mu3_PFJet40_v4, 0.003/pb
+        '279024-279024', # HLT_Mu3_PFJet40_v4, 0.007/pb
+        '279029-279029', # HLT_Mu3_PFJet40_v4, 0.005/pb
+        '279071-279071', # HLT_Mu3_PFJet40_v4, 0.004/pb
+        '279080-279080', # HLT_Mu3_PFJet40_v4, 0.003/pb
+        '279115-279116', # HLT_Mu3_PFJet40_v4, 0.019/pb
+        '279479-279479', # HLT_Mu3_PFJet40_v4, 0.005/pb
+        '279588-279588', # HLT_Mu3_PFJet40_v4, 0.105/pb
+        '279653-279654', # HLT_Mu3_PFJet40_v4, 0.131/pb
+        '279656-279656', # HLT_Mu3_PFJet40_v4, 0.004/pb
+        '279658-279658', # HLT_Mu3_PFJet40_v4, 0.079/pb
+        '279667-279667', # HLT_Mu3_PFJet40_v4, 0.082/pb
+        '279681-279685', # HLT_Mu3_PFJet40_v4, 0.023/pb
+        '279691-279691', # HLT_Mu3_PFJet40_v4, 0.003/pb
+        '279694-279694', # HLT_Mu3_PFJet40_v4, 0.215/pb
+        '279715-279716', # HLT_Mu3_PFJet40_v4, 0.215/pb
+        '279760-279760', # HLT_Mu3_PFJet40_v4, 0.049/pb
+        '279766-279767', # HLT_Mu3_PFJet40_v4, 0.255/pb
+        '279794-279794', # HLT_Mu3_PFJet40_v4, 0.086/pb
+        '279823-279823', # HLT_Mu3_PFJet40_v4, 0.024/pb
+        '279841-279841', # HLT_Mu3_PFJet40_v4, 0.185/pb
+        '279844-279844', # HLT_Mu3_PFJet40_v4, 0.015/pb
+        '279887-279887', # HLT_Mu3_PFJet40_v4, 0.006/pb
+        '279931-279931', # HLT_Mu3_PFJet40_v4, 0.293/pb
+        '279966-279966', # HLT_Mu3_PFJet40_v4, 0.025/pb
+        '279975-279975', # HLT_Mu3_PFJet40_v4, 0.085/pb
+        '279993-279994', # HLT_Mu3_PFJet40_v4, 0.008/pb
+        '280013-280013', # HLT_Mu3_PFJet40_v4, 0.002/pb
+        '280015-280018', # HLT_Mu3_PFJet40_v4, 0.111/pb
+        '280020-280020', # HLT_Mu3_PFJet40_v4, 0.001/pb
+        '280024-280024', # HLT_Mu3_PFJet40_v4, 0.012/pb
+        '280187-280188', # HLT_Mu3_PFJet40_v4, 0.006/pb
+        '280191-280191', # HLT_Mu3_PFJet40_v4, 0.021/pb
+        '280194-280194', # HLT_Mu3_PFJet40_v4, 0.005/pb
+        '280242-280242', # HLT_Mu3_PFJet40_v4, 0.014/pb
+        '280249-280249', # HLT_Mu3_PFJet40_v4, 0.034/pb
+        '280251-280251', # HLT_Mu3_PFJet40_v4, 0.009/pb
+        '280327-280327', # HLT_Mu3_PFJet40_v4, 0.001/pb
+        '280330-280330', # HLT_Mu3_PFJet40_v4, 0.019/pb
+        '280349-280349', # HLT_Mu3_PFJet40_v4, 0.014/pb
+        '280363-280364', # HLT_Mu3_PFJet40_v4, 0.04/pb
+        '280383-280385', # HLT_Mu3_PFJet40_v4, 0.045/pb
+        '281613-281613', # HLT_Mu3_PFJet40_v6, 0.012/pb
+        '281639-281639', # HLT_Mu3_PFJet40_v6, 0.002/pb
+        '281641-281641', # HLT_Mu3_PFJet40_v6, 0.005/pb
+        '281693-281693', # HLT_Mu3_PFJet40_v6, 0.05/pb
+        '281707-281707', # HLT_Mu3_PFJet40_v6, 0.02/pb
+        '281726-281727', # HLT_Mu3_PFJet40_v6, 0.043/pb
+        '281797-281797', # HLT_Mu3_PFJet40_v6, 0.045/pb
+        '281975-281976', # HLT_Mu3_PFJet40_v6, 0.055/pb
+        '282033-282035', # HLT_Mu3_PFJet40_v6, 0.002/pb
+        '282037-282037', # HLT_Mu3_PFJet40_v6, 0.044/pb
+        '282092-282092', # HLT_Mu3_PFJet40_v6, 0.041/pb
+        '282708-282708', # HLT_Mu3_PFJet40_v6, 0.0/pb
+        '282710-282710', # HLT_Mu3_PFJet40_v6, 0.0/pb
+        '282712-282712', # HLT_Mu3_PFJet40_v6, 0.001/pb
+        '282730-282735', # HLT_Mu3_PFJet40_v6, 0.059/pb
+        '282800-282800', # HLT_Mu3_PFJet40_v6, 0.007/pb
+        '282807-282807', # HLT_Mu3_PFJet40_v6, 0.007/pb
+        '282814-282814', # HLT_Mu3_PFJet40_v6, 0.043/pb
+        '282842-282842', # HLT_Mu3_PFJet40_v6, 0.002/pb
+        '282917-282919', # HLT_Mu3_PFJet40_v6, 0.007/pb
+        '282922-282923', # HLT_Mu3_PFJet40_v6, 0.008/pb
+        '283042-283043', # HLT_Mu3_PFJet40_v6, 0.011/pb
+        '283049-283050', # HLT_Mu3_PFJet40_v6, 0.004/pb
+        '283052-283052', # HLT_Mu3_PFJet40_v6, 0.002/pb
+        '283059-283059', # HLT_Mu3_PFJet40_v6, 0.01/pb
+        '283270-283270', # HLT_Mu3_PFJet40_v6, 0.039/pb
+        '283283-283283', # HLT_Mu3_PFJet40_v6, 0.043/pb
+        '283305-283308', # HLT_Mu3_PFJet40_v6, 0.037/pb
+        '283353-283353', # HLT_Mu3_PFJet40_v6, 0.015/pb
+        '283358-283359', # HLT_Mu3_PFJet40_v6, 0.031/pb
+        '283407-283408', # HLT_Mu3_PFJet40_v6, 0.052/pb
+        '283416-283416', # HLT_Mu3_PFJet40_v6, 0.004/pb
+        '283453-283453', # HLT_Mu3_PFJet40_v6, 0.009/pb
+        '283469-283469', # HLT_Mu3_PFJet40_v6, 0.0/pb
+        '283478-283478', # HLT_Mu3_PFJet40_v6, 0.018/pb
+        '283548-283548', # HLT_Mu3_PFJet40_v6, 0.003/pb
+        '283680-283682', # HLT_Mu3_PFJet40_v6, 0.011/pb
+        '283685-283685', # HLT_Mu3_PFJet40_v6, 0.006/pb
+        '283820-283820', # HLT_Mu3_PFJet40_v6, 0.032/pb
+        '283830-283830', # HLT_Mu3_PFJet40_v6, 0.017/pb
+        '283834-283835', # HLT_Mu3_PFJet40_v6, 0.004/pb
+        '283865-283865', # HLT_Mu3_PFJet40_v6, 0.025/pb
+        '283876-283877', # HLT_Mu3_PFJet40_v6, 0.047/pb
+        '283884-283885', # HLT_Mu3_PFJet40_v6, 0.046/pb
+        '283933-283934', # HLT_Mu3_PFJet40_v6, 0.03/pb
+        '283946-283946', # HLT_Mu3_PFJet40_v6, 0.03/pb
+        '283964-283964', # HLT_Mu3_PFJet40_v6, 0.008/pb
+        '284006-284006', # HLT_Mu3_PFJet40_v6, 0.007/pb
+        '284014-284014', # HLT_Mu3_PFJet40_v6, 0.006/pb
+        '284025-284025', # HLT_Mu3_PFJet40_v6, 0.001/pb
+        '284029-284029', # HLT_Mu3_PFJet40_v6, 0.002/pb
+        '284035-284044', # HLT_Mu3_PFJet40_v6, 0.035/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu8"),
+      cone_minPt = cms.double(15.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(8.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(9123), # L=3.937/pb; present in all eras; prescale factor 9123.1 (9081.0 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '273158-273158',  # HLT_Mu8_v3, 0.14/pb
+        '273302-273302',  # HLT_Mu8_v3, 0.045/pb
+        '273402-273406',  # HLT_Mu8_v3, 0.033/pb
+        '273408-273411',  # HLT_Mu8_v3, 0.142/pb
+        '273425-273425',  # HLT_Mu8_v3, 0.074/pb
+        '273446-273450',  # HLT_Mu8_v3, 0.206/pb
+        '273492-273494',  # HLT_Mu8_v3, 0.086/pb
+        '273502-273503',  # HLT_Mu8_v3, 0.2/pb
+        '273554-273555',  # HLT_Mu8_v3, 0.065/pb
+        '273725-273725',  # HLT_Mu8_v3, 0.342/pb
+        '273728-273728',  # HLT_Mu8_v3, 0.014/pb
+        '273730-273730',  # HLT_Mu8_v3, 0.253/pb
+        '274094-274094',  # HLT_Mu8_v3, 0.027/pb
+        '274146-274146',  # HLT_Mu8_v3, 0.009/pb
+        '274157-274157',  # HLT_Mu8_v3, 0.028/pb
+        '274159-274161',  # HLT_Mu8_v3, 0.105/pb
+        '274172-274172',  # HLT_Mu8_v3, 0.005/pb
+        '274198-274200',  # HLT_Mu8_v3, 0.022/pb
+        '274240-274241',  # HLT_Mu8_v3, 0.016/pb
+        '274244-274244',  # HLT_Mu8_v3, 0.021/pb
+        '274250-274251',  # HLT_Mu8_v3, 0.011/pb
+        '274283-274284',  # HLT_Mu8_v3, 0.002/pb
+        '274286-274286',  # HLT_Mu8_v3, 0.001/pb
+        '274314-274317',  # HLT_Mu8_v3, 0.013/pb
+        '274319-274319',  # HLT_Mu8_v3, 0.001/pb
+        '274335-274339',  # HLT_Mu8_v3, 0.02/pb
+        '274344-274345',  # HLT_Mu8_v3, 0.028/pb
+        '274382-274382',  # HLT_Mu8_v3, 0.0/pb
+        '274387-274388',  # HLT_Mu8_v3, 0.028/pb
+        '274420-274422',  # HLT_Mu8_v3, 0.057/pb
+        '274440-274442',  # HLT_Mu8_v3, 0.021/pb
+        '274954-274955',  # HLT_Mu8_v4, 0.002/pb
+        '274968-274971',  # HLT_Mu8_v4, 0.038/pb
+        '274998-275001',  # HLT_Mu8_v4, 0.061/pb
+        '275059-275059',  # HLT_Mu8_v4, 0.0/pb
+        '275066-275068',  # HLT_Mu8_v4, 0.011/pb
+        '275073-275074',  # HLT_Mu8_v4, 0.019/pb
+        '275124-275125',  # HLT_Mu8_v4, 0.012/pb
+        '275282-275284',  # HLT_Mu8_v4, 0.002/pb
+        '275290-275293',  # HLT_Mu8_v4, 0.009/pb
+        '275309-275311',  # HLT_Mu8_v4, 0.06/pb
+        '275319-275319',  # HLT_Mu8_v4, 0.001/pb
+        '275337-275338',  # HLT_Mu8_v4, 0.01/pb
+        '275344-275345',  # HLT_Mu8_v4, 0.005/pb
+        '275370-275371',  # HLT_Mu8_v4, 0.007/pb
+        '275375-275376',  # HLT_Mu8_v4, 0.066/pb
+        '275657-275659',  # HLT_Mu8_v4, 0.003/pb
+        '275761-275761',  # HLT_Mu8_v4, 0.0/pb
+        '275767-275767',  # HLT_Mu8_v4, 0.004/pb
+        '275772-275774',  # HLT_Mu8_v4, 0.009/pb
+        '275776-275778',  # HLT_Mu8_v4, 0.006/pb
+        '275782-275782',  # HLT_Mu8_v4, 0.013/pb
+        '275832-275837',  # HLT_Mu8_v4, 0.033/pb
+        '275847-275847',  # HLT_Mu8_v4, 0.038/pb
+        '275886-275886',  # HLT_Mu8_v4, 0.0/pb
+        '275890-275890',  # HLT_Mu8_v4, 0.011/pb
+        '275911-275913',  # HLT_Mu8_v4, 0.009/pb
+        '275918-275918',  # HLT_Mu8_v4, 0.002/pb
+        '275920-275921',  # HLT_Mu8_v4, 0.008/pb
+        '275923-275923',  # HLT_Mu8_v4, 0.002/pb
+        '275931-275931',  # HLT_Mu8_v4, 0.001/pb
+        '275963-275963',  # HLT_Mu8_v4, 0.001/pb
+        '276092-276092',  # HLT_Mu8_v4, 0.0/pb
+        '276097-276097',  # HLT_Mu8_v4, 0.004/pb
+        '276242-276244',  # HLT_Mu8_v4, 0.044/pb
+        '276282-276283',  # HLT_Mu8_v4, 0.02/pb
+        '276315-276315',  # HLT_Mu8_v4, 0.001/pb
+        '276317-276318',  # HLT_Mu8_v4, 0.005/pb
+        '276355-276355',  # HLT_Mu8_v4, 0.0/pb
+        '276361-276361',  # HLT_Mu8_v4, 0.007/pb
+        '276363-276363',  # HLT_Mu8_v4, 0.021/pb
+        '276384-276384',  # HLT_Mu8_v4, 0.016/pb
+        '276437-276437',  # HLT_Mu8_v4, 0.02/pb
+        '276454-276454',  # HLT_Mu8_v4, 0.008/pb
+        '276458-276458',  # HLT_Mu8_v4, 0.005/pb
+        '276495-276495',  # HLT_Mu8_v4, 0.001/pb
+        '276501-276502',  # HLT_Mu8_v4, 0.037/pb
+        '276525-276525',  # HLT_Mu8_v4, 0.034/pb
+        '276527-276528',  # HLT_Mu8_v4, 0.009/pb
+        '276542-276545',  # HLT_Mu8_v4, 0.02/pb
+        '276581-276587',  # HLT_Mu8_v4, 0.04/pb
+        '276653-276653',  # HLT_Mu8_v4, 0.004/pb
+        '276655-276655',  # HLT_Mu8_v4, 0.011/pb
+        '276659-276659',  # HLT_Mu8_v4, 0.004/pb
+        '276775-276776',  # HLT_Mu8_v4, 0.035/pb
+        '276794-276794',  # HLT_Mu8_v4, 0.016/pb
+        '276807-276808',  # HLT_Mu8_v4, 0.008/pb
+        '276810-276811',  # HLT_Mu8_v4, 0.043/pb
+        '276831-276831',  # HLT_Mu8_v4, 0.032/pb
+        '276834-276834',  # HLT_Mu8_v4, 0.012/pb
+        '276870-276870',  # HLT_Mu8_v4, 0.041/pb
+        '276935-276935',  # HLT_Mu8_v4, 0.006/pb
+        '276940-276940',  # HLT_Mu8_v4, 0.001/pb
+        '276946-276948',  # HLT_Mu8_v4, 0.005/pb
+        '276950-276950',  # HLT_Mu8_v4, 0.031/pb
+        '277069-277073',  # HLT_Mu8_v4, 0.018/pb
+        '277076-277076',  # HLT_Mu8_v4, 0.017/pb
+        '277087-277087',  # HLT_Mu8_v4, 0.019/pb
+        '277094-277094',  # HLT_Mu8_v4, 0.004/pb
+        '277096-277096',  # HLT_Mu8_v4, 0.023/pb
+        '277112-277112',  # HLT_Mu8_v4, 0.002/pb
+        '277126-277127',  # HLT_Mu8_v4, 0.007/pb
+        '277148-277148',  # HLT_Mu8_v4, 0.005/pb
+        '277166-277166',  # HLT_Mu8_v4, 0.003/pb
+        '277168-277168',  # HLT_Mu8_v4, 0.029/pb
+        '277180-277180',  # HLT_Mu8_v4, 0.001/pb
+        '277194-277194',  # HLT_Mu8_v4, 0.015/pb
+        '277305-277305',  # HLT_Mu8_v4, 0.005/pb
+        '277420-277420',  # HLT_Mu8_v4, 0.002/pb
+        '277981-277981',  # HLT_Mu8_v4, 0.001/pb
+        '277991-277992',  # HLT_Mu8_v4, 0.009/pb
+        '278017-278018',  # HLT_Mu8_v4, 0.013/pb
+        '278167-278167',  # HLT_Mu8_v4, 0.027/pb
+        '278175-278175',  # HLT_Mu8_v4, 0.001/pb
+        '278193-278193',  # HLT_Mu8_v4, 0.001/pb
+        '278239-278240',  # HLT_Mu8_v4, 0.021/pb
+        '278273-278274',  # HLT_Mu8_v4, 0.001/pb
+        '278288-278290',  # HLT_Mu8_v4, 0.0/pb
+        '278308-278308',  # HLT_Mu8_v4, 0.011/pb
+        '278310-278310',  # HLT_Mu8_v4, 0.004/pb
+        '278315-278315',  # HLT_Mu8_v4, 0.005/pb
+        '278345-278346',  # HLT_Mu8_v4, 0.006/pb
+        '278349-278349',  # HLT_Mu8_v4, 0.005/pb
+        '278366-278366',  # HLT_Mu8_v4, 0.004/pb
+        '278406-278406',  # HLT_Mu8_v4, 0.011/pb
+        '278509-278509',  # HLT_Mu8_v4, 0.01/pb
+        '278769-278770',  # HLT_Mu8_v4, 0.005/pb
+        '278801-278805',  # HLT_Mu8_v4, 0.01/pb
+        '278808-278808',  # HLT_Mu8_v4, 0.013/pb
+        '278820-278820',  # HLT_Mu8_v4, 0.01/pb
+        '278822-278822',  # HLT_Mu8_v4, 0.013/pb
+        '278873-278875',  # HLT_Mu8_v4, 0.009/pb
+        '278923-278923',  # HLT_Mu8_v4, 0.003/pb
+        '278957-278957',  # HLT_Mu8_v4, 0.001/pb
+        '278962-278963',  # HLT_Mu8_v4, 0.003/pb
+        '278969-278969',  # HLT_Mu8_v4, 0.009/pb
+        '278975-278976',  # HLT_Mu8_v4, 0.006/pb
+        '278986-278986',  # HLT_Mu8_v4, 0.001/pb
+        '279024-279024',  # HLT_Mu8_v4, 0.002/pb
+        '279029-279029',  # HLT_Mu8_v4, 0.002/pb
+        '279071-279071',  # HLT_Mu8_v4, 0.001/pb
+        '279080-279080',  # HLT_Mu8_v4, 0.001/pb
+        '279115-279116',  # HLT_Mu8_v4, 0.006/pb
+        '279479-279479',  # HLT_Mu8_v4, 0.0/pb
+        '279588-279588',  # HLT_Mu8_v4, 0.008/pb
+        '279653-279654',  # HLT_Mu8_v4, 0.01/pb
+        '279656-279656',  # HLT_Mu8_v4, 0.0/pb
+        '279658-279658',  # HLT_Mu8_v4, 0.006/pb
+        '279667-279667',  # HLT_Mu8_v4, 0.006/pb
+        '279681-279685',  # HLT_Mu8_v4, 0.002/pb
+        '279691-279691',  # HLT_Mu8_v4, 0.0/pb
+        '279694-279694',  # HLT_Mu8_v4, 0.016/pb
+        '279715-279716',  # HLT_Mu8_v4, 0.016/pb
+        '279760-279760',  # HLT_Mu8_v4, 0.004/pb
+        '279766-279767',  # HLT_Mu8_v4, 0.018/pb
+        '279794-279794',  # HLT_Mu8_v4, 0.007/pb
+        '279823-279823',  # HLT_Mu8_v4, 0.002/pb
+        '279841-279841',  # HLT_Mu8_v4, 0.014/pb
+        '279844-279844',  # HLT_Mu8_v4, 0.001/pb
+        '279887-279887',  # HLT_Mu8_v4, 0.002/pb
+        '279931-279931',  # HLT_Mu8_v4, 0.021/pb
+        '279966-279966',  # HLT_Mu8_v4, 0.002/pb
+        '279975-279975',  # HLT_Mu8_v4, 0.007/pb
+        '279993-279994',  # HLT_Mu8_v4, 0.001/pb
+        '280013-280013',  # HLT_Mu8_v4, 0.0/pb
+        '280015-280018',  # HLT_Mu8_v4, 0.022/pb
+        '280020-280020',  # HLT_Mu8_v4, 0.0/pb
+        '280024-280024',  # HLT_Mu8_v4, 0.004/pb
+        '280187-280188',  # HLT_Mu8_v4, 0.002/pb
+        '280191-280191',  # HLT_Mu8_v4, 0.006/pb
+        '280194-280194',  # HLT_Mu8_v4, 0.002/pb
+        '280242-280242',  # HLT_Mu8_v4, 0.004/pb
+        '280249-280249',  # HLT_Mu8_v4, 0.011/pb
+        '280251-280251',  # HLT_Mu8_v4, 0.003/pb
+        '280327-280327',  # HLT_Mu8_v4, 0.0/pb
+        '280330-280330',  # HLT_Mu8_v4, 0.006/pb
+        '280349-280349',  # HLT_Mu8_v4, 0.005/pb
+        '280363-280364',  # HLT_Mu8_v4, 0.013/pb
+        '280383-280385',  # HLT_Mu8_v4, 0.014/pb
+        '281613-281613',  # HLT_Mu8_v5, 0.001/pb
+        '281639-281639',  # HLT_Mu8_v5, 0.0/pb
+        '281641-281641',  # HLT_Mu8_v5, 0.001/pb
+        '281693-281693',  # HLT_Mu8_v5, 0.016/pb
+        '281707-281707',  # HLT_Mu8_v5, 0.006/pb
+        '281726-281727',  # HLT_Mu8_v5, 0.014/pb
+        '281797-281797',  # HLT_Mu8_v5, 0.014/pb
+        '281975-281976',  # HLT_Mu8_v5, 0.017/pb
+        '282033-282035',  # HLT_Mu8_v5, 0.001/pb
+        '282037-282037',  # HLT_Mu8_v5, 0.013/pb
+        '282092-282092',  # HLT_Mu8_v5, 0.013/pb
+        '282708-282708',  # HLT_Mu8_v5, 0.0/pb
+        '282710-282710',  # HLT_Mu8_v5, 0.002/pb
+        '282712-282712',  # HLT_Mu8_v5, 0.0/pb
+        '282730-282735',  # HLT_Mu8_v5, 0.018/pb
+        '282800-282800',  # HLT_Mu8_v5, 0.002/pb
+        '282807-282807',  # HLT_Mu8_v5, 0.002/pb
+        '282814-282814',  # HLT_Mu8_v5, 0.014/pb
+        '282842-282842',  # HLT_Mu8_v5, 0.0/pb
+        '282917-282919',  # HLT_Mu8_v5, 0.002/pb
+        '282922-282923',  # HLT_Mu8_v5, 0.002/pb
+        '283042-283043',  # HLT_Mu8_v5, 0.013/pb
+        '283049-283050',  # HLT_Mu8_v5, 0.001/pb
+        '283052-283052',  # HLT_Mu8_v5, 0.001/pb
+        '283059-283059',  # HLT_Mu8_v5, 0.003/pb
+        '283270-283270',  # HLT_Mu8_v5, 0.012/pb
+        '283283-283283',  # HLT_Mu8_v5, 0.014/pb
+        '283305-283308',  # HLT_Mu8_v5, 0.011/pb
+        '283353-283353',  # HLT_Mu8_v5, 0.004/pb
+        '283358-283359',  # HLT_Mu8_v5, 0.01/pb
+        '283407-283408',  # HLT_Mu8_v5, 0.016/pb
+        '283416-283416',  # HLT_Mu8_v5, 0.001/pb
+        '283453-283453',  # HLT_Mu8_v5, 0.003/pb
+        '283469-283469',  # HLT_Mu8_v5, 0.0/pb
+        '283478-283478',  # HLT_Mu8_v5, 0.005/pb
+        '283548-283548',  # HLT_Mu8_v5, 0.001/pb
+        '283680-283682',  # HLT_Mu8_v5, 0.003/pb
+        '283685-283685',  # HLT_Mu8_v5, 0.001/pb
+        '283820-283820',  # HLT_Mu8_v5, 0.01/pb
+        '283830-283830',  # HLT_Mu8_v5, 0.005/pb
+        '283834-283835',  # HLT_Mu8_v5, 0.001/pb
+        '283865-283865',  # HLT_Mu8_v5, 0.007/pb
+        '283876-283877',  # HLT_Mu8_v5, 0.014/pb
+        '283884-283885',  # HLT_Mu8_v5, 0.014/pb
+        '283933-283934',  # HLT_Mu8_v5, 0.009/pb
+        '283946-283946',  # HLT_Mu8_v5, 0.009/pb
+        '283964-283964',  # HLT_Mu8_v5, 0.003/pb
+        '284006-284006',  # HLT_Mu8_v5, 0.002/pb
+        '284014-284014',  # HLT_Mu8_v5, 0.002/pb
+        '284025-284025',  # HLT_Mu8_v5, 0.0/pb
+        '284029-284029',  # HLT_Mu8_v5, 0.001/pb
+        '284035-284044',  # HLT_Mu8_v5, 0.011/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu17"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(17.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(127.0), # L=282.781/pb; present in all eras; prescale factor 127.0 (127.4 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '273158-273158',  # HLT_Mu17_v2, 1.83/pb
+        '273302-273302',  # HLT_Mu17_v2, 1.632/pb
+        '273402-273406',  # HLT_Mu17_v2, 1.179/pb
+        '273408-273411',  # HLT_Mu17_v2, 4.394/pb
+        '273425-273425',  # HLT_Mu17_v2, 2.672/pb
+        '273446-273450',  # HLT_Mu17_v2, 7.207/pb
+        '273492-273494',  # HLT_Mu17_v2, 3.092/pb
+        '273502-273503',  # HLT_Mu17_v2, 7.215/pb
+        '273554-273555',  # HLT_Mu17_v2, 2.157/pb
+        '273725-273725',  # HLT_Mu17_v2, 11.978/pb
+        '273728-273728',  # HLT_Mu17_v2, 0.49/pb
+        '273730-273730',  # HLT_Mu17_v2, 13.853/pb
+        '274094-274094',  # HLT_Mu17_v2, 0.973/pb
+        '274146-274146',  # HLT_Mu17_v2, 0.284/pb
+        '274157-274157',  # HLT_Mu17_v2, 0.792/pb
+        '274159-274161',  # HLT_Mu17_v2, 3.493/pb
+        '274172-274172',  # HLT_Mu17_v2, 0.159/pb
+        '274198-274200',  # HLT_Mu17_v2, 5.944/pb
+        '274240-274241',  # HLT_Mu17_v2, 3.64/pb
+        '274244-274244',  # HLT_Mu17_v2, 5.035/pb
+        '274250-274251',  # HLT_Mu17_v2, 1.686/pb
+        '274283-274284',  # HLT_Mu17_v2, 0.101/pb
+        '274286-274286',  # HLT_Mu17_v2, 0.072/pb
+        '274314-274317',  # HLT_Mu17_v2, 0.689/pb
+        '274319-274319',  # HLT_Mu17_v2, 0.091/pb
+        '274335-274339',  # HLT_Mu17_v2, 4.292/pb
+        '274344-274345',  # HLT_Mu17_v2, 6.735/pb
+        '274382-274382',  # HLT_Mu17_v2, 0.025/pb
+        '274387-274388',  # HLT_Mu17_v2, 6.241/pb
+        '274420-274422',  # HLT_Mu17_v2, 14.117/pb
+        '274440-274442',  # HLT_Mu17_v2, 5.433/pb
+        '274954-274955',  # HLT_Mu17_v3, 0.574/pb
+        '274968-274971',  # HLT_Mu17_v3, 10.006/pb
+        '274998-275001',  # HLT_Mu17_v3, 16.245/pb
+        '275059-275059',  # HLT_Mu17_v3, 0.03/pb
+        '275066-275068',  # HLT_Mu17_v3, 2.045/pb
+        '275073-275074',  # HLT_Mu17_v3, 5.743/pb
+        '275124-275125',  # HLT_Mu17_v3, 2.567/pb
+        '275282-275284',  # HLT_Mu17_v3, 0.37/pb
+        '275290-275293',  # HLT_Mu17_v3, 2.366/pb
+        '275309-275311',  # HLT_Mu17_v3, 16.568/pb
+        '275319-275319',  # HLT_Mu17_v3, 0.123/pb
+        '275337-275338',  # HLT_Mu17_v3, 2.325/pb
+        '275344-275345',  # HLT_Mu17_v3, 0.726/pb
+        '275370-275371',  # HLT_Mu17_v3, 0.995/pb
+        '275375-275376',  # HLT_Mu17_v3, 17.508/pb
+        '275657-275659',  # HLT_Mu17_v3, 0.251/pb
+        '275761-275761',  # HLT_Mu17_v3, 0.004/pb
+        '275767-275767',  # HLT_Mu17_v3, 0.002/pb
+        '275772-275774',  # HLT_Mu17_v3, 0.22/pb
+        '275776-275778',  # HLT_Mu17_v3, 0.468/pb
+        '275782-275782',  # HLT_Mu17_v3, 0.552/pb
+        '275832-275837',  # HLT_Mu17_v3, 1.843/pb
+        '275847-275847',  # HLT_Mu17_v3, 1.428/pb
+        '275886-275886',  # HLT_Mu17_v3, 0.019/pb
+        '275890-275890',  # HLT_Mu17_v3, 0.857/pb
+        '275911-275913',  # HLT_Mu17_v3, 0.678/pb
+        '275918-275918',  # HLT_Mu17_v3, 0.199/pb
+        '275920-275921',  # HLT_Mu17_v3, 0.344/pb
+        '275923-275923',  # HLT_Mu17_v3, 0.081/pb
+        '275931-275931',  # HLT_Mu17_v3, 0.058/pb
+        '275963-275963',  # HLT_Mu17_v3, 0.049/pb
+        '276092-276092',  # HLT_Mu17_v3, 0.037/pb
+        '276097-276097',  # HLT_Mu17_v3, 0.297/pb
+        '276242-276244',  # HLT_Mu17_v3, 2.232/pb
+        '276282-276283',  # HLT_Mu17_v3, 1.367/pb
+        '276315-276315',  # HLT_Mu17_v3, 0.096/pb
+        '276317-276318',  # HLT_Mu17_v3, 0.421/pb
+        '276355-276355',  # HLT_Mu17_v3, 0.016/pb
+        '276361-276361',  # HLT_Mu17_v3, 0.522/pb
+        '276363-276363',  # HLT_Mu17_v3, 1.026/pb
+        '276384-276384',  # HLT_Mu17_v3, 0.675/pb
+        '276437-276437',  # HLT_Mu17_v3, 1.348/pb
+        '276454-276454',  # HLT_Mu17_v3, 0.352/pb
+        '276458-276458',  # HLT_Mu17_v3, 0.209/pb
+        '276495-276495',  # HLT_Mu17_v3, 0.095/pb
+        '276501-276502',  # HLT_Mu17_v3, 2.046/pb
+        '276525-276525',  # HLT_Mu17_v3, 1.791/pb
+        '276527-276528',  # HLT_Mu17_v3, 0.353/pb
+        '276542-276545',  # HLT_Mu17_v3, 1.295/pb
+        '276581-276587',  # HLT_Mu17_v3, 2.032/pb
+        '276653-276653',  # HLT_Mu17_v3, 0.27/pb
+        '276655-276655',  # HLT_Mu17_v3, 0.699/pb
+        '276659-276659',  # HLT_Mu17_v3, 0.166/pb
+        '276775-276776',  # HLT_Mu17_v3, 1.911/pb
+        '276794-276794',  # HLT_Mu17_v3, 0.591/pb
+        '276807-276808',  # HLT_Mu17_v3, 0.63/pb
+        '276810-276811',  # HLT_Mu17_v3, 1.896/pb
+        '276831-276831',  # HLT_Mu17_v3, 1.736/pb
+        '276834-276834',  # HLT_Mu17_v3, 0.474/pb
+        '276870-276870',  # HLT_Mu17_v3, 3.24/pb
+        '276935-276935',  # HLT_Mu17_v3, 0.712/pb
+        '276940-276940',  # HLT_Mu17_v3, 0.104/pb
+        '276946-276948',  # HLT_Mu17_v3, 0.549/pb
+        '276950-276950',  # HLT_Mu17_v3, 2.259/pb
+        '277069-277073',  # HLT_Mu17_v3, 1.918/pb
+        '277076-277076',  # HLT_Mu17_v3, 1.007/pb
+        '277087-277087',  # HLT_Mu17_v3, 1.151/pb
+        '277094-277094',  # HLT_Mu17_v3, 0.485/pb
+        '277096-277096',  # HLT_Mu17_v3, 1.982/pb
+        '277112-277112',  # HLT_Mu17_v3, 0.113/pb
+        '277126-277127',  # HLT_Mu17_v3, 0.852/pb
+        '277148-277148',  # HLT_Mu17_v3, 0.574/pb
+        '277166-277166',  # HLT_Mu17_v3, 0.323/pb
+        '277168-277168',  # HLT_Mu17_v3, 2.141/pb
+        '277180-277180',  # HLT_Mu17_v3, 0.115/pb
+        '277194-277194',  # HLT_Mu17_v3, 1.767/pb
+        '277305-277305',  # HLT_Mu17_v3, 0.575/pb
+        '277420-277420',  # HLT_Mu17_v3, 0.22/pb
+        '277981-277981',  # HLT_Mu17_v3, 0.061/pb
+        '277991-277992',  # HLT_Mu17_v3, 0.428/pb
+        '278017-278018',  # HLT_Mu17_v3, 1.424/pb
+        '278167-278167',  # HLT_Mu17_v3, 2.084/pb
+        '278175-278175',  # HLT_Mu17_v3, 0.083/pb
+        '278193-278193',  # HLT_Mu17_v3, 0.132/pb
+        '278239-278240',  # HLT_Mu17_v3, 1.881/pb
+        '278273-278274',  # HLT_Mu17_v3, 0.039/pb
+        '278288-278290',  # HLT_Mu17_v3, 0.024/pb
+        '278308-278308',  # HLT_Mu17_v3, 0.508/pb
+        '278310-278310',  # HLT_Mu17_v3, 0.16/pb
+        '278315-278315',  # HLT_Mu17_v3, 0.212/pb
+        '278345-278346',  # HLT_Mu17_v3, 0.263/pb
+        '278349-278349',  # HLT_Mu17_v3, 0.185/pb
+        '278366-278366',  # HLT_Mu17_v3, 0.149/pb
+        '278406-278406',  # HLT_Mu17_v3, 0.467/pb
+        '278509-278509',  # HLT_Mu17_v3, 0.423/pb
+        '278769-278770',  # HLT_Mu17_v3, 0.244/pb
+        '278801-278805',  # HLT_Mu17_v3, 0.19/pb
+        '278808-278808',  # HLT_Mu17_v3, 0.518/pb
+        '278820-278820',  # HLT_Mu17_v3, 0.449/pb
+        '278822-278822',  # HLT_Mu17_v3, 0.507/pb
+        '278873-278875',  # HLT_Mu17_v3, 0.369/pb
+        '278923-278923',  # HLT_Mu17_v3, 0.116/pb
+        '278957-278957',  # HLT_Mu17_v3, 0.04/pb
+        '278962-278963',  # HLT_Mu17_v3, 0.149/pb
+        '278969-278969',  # HLT_Mu17_v3, 0.409/pb
+        '278975-278976',  # HLT_Mu17_v3, 0.244/pb
+        '278986-278986',  # HLT_Mu17_v3, 0.035/pb
+        '279024-279024',  # HLT_Mu17_v3, 0.088/pb
+        '279029-279029',  # HLT_Mu17_v3, 0.068/pb
+        '279071-279071',  # HLT_Mu17_v3, 0.049/pb
+        '279080-279080',  # HLT_Mu17_v3, 0.057/pb
+        '279115-279116',  # HLT_Mu17_v3, 0.255/pb
+        '279479-279479',  # HLT_Mu17_v3, 0.021/pb
+        '279588-279588',  # HLT_Mu17_v3, 0.344/pb
+        '279653-279654',  # HLT_Mu17_v3, 0.427/pb
+        '279656-279656',  # HLT_Mu17_v3, 0.01/pb
+        '279658-279658',  # HLT_Mu17_v3, 0.216/pb
+        '279667-279667',  # HLT_Mu17_v3, 0.286/pb
+        '279681-279685',  # HLT_Mu17_v3, 0.089/pb
+        '279691-279691',  # HLT_Mu17_v3, 0.009/pb
+        '279694-279694',  # HLT_Mu17_v3, 0.664/pb
+        '279715-279716',  # HLT_Mu17_v3, 0.653/pb
+        '279760-279760',  # HLT_Mu17_v3, 0.184/pb
+        '279766-279767',  # HLT_Mu17_v3, 0.714/pb
+        '279794-279794',  # HLT_Mu17_v3, 0.302/pb
+        '279823-279823',  # HLT_Mu17_v3, 0.093/pb
+        '279841-279841',  # HLT_Mu17_v3, 0.597/pb
+        '279844-279844',  # HLT_Mu17_v3, 0.051/pb
+        '279887-279887',  # HLT_Mu17_v3, 0.087/pb
+        '279931-279931',  # HLT_Mu17_v3, 0.867/pb
+        '279966-279966',  # HLT_Mu17_v3, 0.087/pb
+        '279975-279975',  # HLT_Mu17_v3, 0.295/pb
+        '279993-279994',  # HLT_Mu17_v3, 0.023/pb
+        '280013-280013',  # HLT_Mu17_v3, 0.006/pb
+        '280015-280018',  # HLT_Mu17_v3, 0.962/pb
+        '280020-280020',  # HLT_Mu17_v3, 0.022/pb
+        '280024-280024',  # HLT_Mu17_v3, 0.199/pb
+        '280187-280188',  # HLT_Mu17_v3, 0.074/pb
+        '280191-280191',  # HLT_Mu17_v3, 0.28/pb
+        '280194-280194',  # HLT_Mu17_v3, 0.064/pb
+        '280242-280242',  # HLT_Mu17_v3, 0.184/pb
+        '280249-280249',  # HLT_Mu17_v3, 0.427/pb
+        '280251-280251',  # HLT_Mu17_v3, 0.118/pb
+        '280327-280327',  # HLT_Mu17_v3, 0.01/pb
+        '280330-280330',  # HLT_Mu17_v3, 0.26/pb
+        '280349-280349',  # HLT_Mu17_v3, 0.181/pb
+        '280363-280364',  # HLT_Mu17_v3, 0.525/pb
+        '280383-280385',  # HLT_Mu17_v3, 0.583/pb
+        '281613-281613',  # HLT_Mu17_v4, 0.155/pb
+        '281639-281639',  # HLT_Mu17_v4, 0.022/pb
+        '281641-281641',  # HLT_Mu17_v4, 0.062/pb
+        '281693-281693',  # HLT_Mu17_v4, 0.642/pb
+        '281707-281707',  # HLT_Mu17_v4, 0.259/pb
+        '281726-281727',  # HLT_Mu17_v4, 0.551/pb
+        '281797-281797',  # HLT_Mu17_v4, 0.569/pb
+        '281975-281976',  # HLT_Mu17_v4, 0.703/pb
+        '282033-282035',  # HLT_Mu17_v4, 0.028/pb
+        '282037-282037',  # HLT_Mu17_v4, 0.561/pb
+        '282092-282092',  # HLT_Mu17_v4, 0.518/pb
+        '282708-282708',  # HLT_Mu17_v4, 0.001/pb
+        '282710-282710',  # HLT_Mu17_v4, 0.001/pb
+        '282712-282712',  # HLT_Mu17_v4, 0.012/pb
+        '282730-282735',  # HLT_Mu17_v4, 0.736/pb
+        '282800-282800',  # HLT_Mu17_v4, 0.092/pb
+        '282807-282807',  # HLT_Mu17_v4, 0.098/pb
+        '282814-282814',  # HLT_Mu17_v4, 0.543/pb
+        '282842-282842',  # HLT_Mu17_v4, 0.015/pb
+        '282917-282919',  # HLT_Mu17_v4, 0.095/pb
+        '282922-282923',  # HLT_Mu17_v4, 0.106/pb
+        '283042-283043',  # HLT_Mu17_v4, 0.15/pb
+        '283049-283050',  # HLT_Mu17_v4, 0.041/pb
+        '283052-283052',  # HLT_Mu17_v4, 0.022/pb
+        '283059-283059',  # HLT_Mu17_v4, 0.139/pb
+        '283270-283270',  # HLT_Mu17_v4, 0.487/pb
+        '283283-283283',  # HLT_Mu17_v4, 0.585/pb
+        '283305-283308',  # HLT_Mu17_v4, 0.466/pb
+        '283353-283353',  # HLT_Mu17_v4, 0.174/pb
+        '283358-283359',  # HLT_Mu17_v4, 0.4/pb
+        '283407-283408',  # HLT_Mu17_v4, 0.641/pb
+        '283416-283416',  # HLT_Mu17_v4, 0.054/pb
+        '283453-283453',  # HLT_Mu17_v4, 0.091/pb
+        '283469-283469',  # HLT_Mu17_v4, 0.0/pb
+        '283478-283478',  # HLT_Mu17_v4, 0.224/pb
+        '283548-283548',  # HLT_Mu17_v4, 0.043/pb
+        '283680-283682',  # HLT_Mu17_v4, 0.143/pb
+        '283685-283685',  # HLT_Mu17_v4, 0.08/pb
+        '283820-283820',  # HLT_Mu17_v4, 0.405/pb
+        '283830-283830',  # HLT_Mu17_v4, 0.211/pb
+        '283834-283835',  # HLT_Mu17_v4, 0.051/pb
+        '283865-283865',  # HLT_Mu17_v4, 0.315/pb
+        '283876-283877',  # HLT_Mu17_v4, 0.586/pb
+        '283884-283885',  # HLT_Mu17_v4, 0.584/pb
+        '283933-283934',  # HLT_Mu17_v4, 0.369/pb
+        '283946-283946',  # HLT_Mu17_v4, 0.371/pb
+        '283964-283964',  # HLT_Mu17_v4, 0.104/pb
+        '284006-284006',  # HLT_Mu17_v4, 0.086/pb
+        '284014-284014',  # HLT_Mu17_v4, 0.075/pb
+        '284025-284025',  # HLT_Mu17_v4, 0.007/pb
+        '284029-284029',  # HLT_Mu17_v4, 0.021/pb
+        '284035-284044',  # HLT_Mu17_v4, 0.451/pb
+      )),
+    ),
+  ),
+  'e' : cms.VPSet(
+    cms.PSet(
+      path = cms.string("HLT_Ele8_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(15.),
+      cone_maxPt = cms.double(45.),
+      minRecoPt = cms.double(8.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(5140), # L=6.988/pb; present in all eras; prescale factor 5140.3 (5135.5 from delivery)
+      trigger_type = cms.string('2e'),
+      run_ranges = cms.vstring(*(
+        '273158-273158',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.017/pb
+        '273302-273302',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.01/pb
+        '273402-273406',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.007/pb
+        '273408-273411',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.016/pb
+        '273425-273425',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.017/pb
+        '273446-273450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.046/pb
+        '273492-273494',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.019/pb
+        '273502-273503',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.045/pb
+        '273554-273555',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.014/pb
+        '273725-273725',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.076/pb
+        '273728-273728',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.003/pb
+        '273730-273730',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.068/pb
+        '274094-274094',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.006/pb
+        '274146-274146',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.002/pb
+        '274157-274157',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.009/pb
+        '274159-274161',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.022/pb
+        '274172-274172',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.001/pb
+        '274198-274200',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.039/pb
+        '274240-274241',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.033/pb
+        '274244-274244',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.032/pb
+        '274250-274251',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.031/pb
+        '274283-274284',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.005/pb
+        '274286-274286',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.004/pb
+        '274314-274317',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.037/pb
+        '274319-274319',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.005/pb
+        '274335-274339',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.051/pb
+        '274344-274345',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.043/pb
+        '274382-274382',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.001/pb
+        '274387-274388',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.067/pb
+        '274420-274422',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.106/pb
+        '274440-274442',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.049/pb
+        '274954-274955',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.004/pb
+        '274968-274971',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.088/pb
+        '274998-275001',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.121/pb
+        '275059-275059',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.001/pb
+        '275066-275068',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4/HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.04/pb
+        '275073-275074',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.036/pb
+        '275124-275125',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.038/pb
+        '275282-275284',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.009/pb
+        '275290-275293',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.02/pb
+        '275309-275311',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.111/pb
+        '275319-275319',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
+        '275337-275338',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.028/pb
+        '275344-275345',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.018/pb
+        '275370-275371',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.024/pb
+        '275375-275376',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.132/pb
+        '275657-275659',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.012/pb
+        '275761-275761',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.0/pb
+        '275767-275767',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.0/pb
+        '275772-275774',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.01/pb
+        '275776-275778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.021/pb
+        '275782-275782',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.025/pb
+        '275832-275837',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.084/pb
+        '275847-275847',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.064/pb
+        '275886-275886',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.001/pb
+        '275890-275890',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.039/pb
+        '275911-275913',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
+        '275918-275918',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.009/pb
+        '275920-275921',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.015/pb
+        '275923-275923',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
+        '275931-275931',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.003/pb
+        '275963-275963',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
+        '276092-276092',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
+        '276097-276097',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.014/pb
+        '276242-276244',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.101/pb
+        '276282-276283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.063/pb
+        '276315-276315',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.005/pb
+        '276317-276318',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.019/pb
+        '276355-276355',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.001/pb
+        '276361-276361',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.024/pb
+        '276363-276363',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.046/pb
+        '276384-276384',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.03/pb
+        '276437-276437',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.061/pb
+        '276454-276454',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
+        '276458-276458',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.009/pb
+        '276495-276495',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.005/pb
+        '276501-276502',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.093/pb
+        '276525-276525',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.081/pb
+        '276527-276528',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
+        '276542-276545',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.059/pb
+        '276581-276587',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.093/pb
+        '276653-276653',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.013/pb
+        '276655-276655',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
+        '276659-276659',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.007/pb
+        '276775-276776',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.087/pb
+        '276794-276794',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.026/pb
+        '276807-276808',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.029/pb
+        '276810-276811',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.085/pb
+        '276831-276831',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.079/pb
+        '276834-276834',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.021/pb
+        '276870-276870',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.1/pb
+        '276935-276935',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.022/pb
+        '276940-276940',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.003/pb
+        '276946-276948',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
+        '276950-276950',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.071/pb
+        '277069-277073',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.06/pb
+        '277076-277076',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
+        '277087-277087',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
+        '277094-277094',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
+        '277096-277096',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.061/pb
+        '277112-277112',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
+        '277126-277127',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.026/pb
+        '277148-277148',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.017/pb
+        '277166-277166',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.01/pb
+        '277168-277168',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.067/pb
+        '277180-277180',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
+        '277194-277194',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.055/pb
+        '277305-277305',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.019/pb
+        '277420-277420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.007/pb
+        '277981-277981',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
+        '277991-277992',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.013/pb
+        '278017-278018',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.046/pb
+        '278167-278167',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.065/pb
+        '278175-278175',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
+        '278193-278193',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
+        '278239-278240',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.058/pb
+        '278273-278274',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.003/pb
+        '278288-278290',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.002/pb
+        '278308-278308',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.051/pb
+        '278310-278310',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.019/pb
+        '278315-278315',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.021/pb
+        '278345-278346',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.026/pb
+        '278349-278349',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.022/pb
+        '278366-278366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.017/pb
+        '278406-278406',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.05/pb
+        '278509-278509',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.045/pb
+        '278769-278770',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.023/pb
+        '278801-278805',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
+        '278808-278808',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.061/pb
+        '278820-278820',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.048/pb
+        '278822-278822',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
+        '278873-278875',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
+        '278923-278923',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.011/pb
+        '278957-278957',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
+        '278962-278963',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.014/pb
+        '278969-278969',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
+        '278975-278976',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.029/pb
+        '278986-278986',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
+        '279024-279024',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.01/pb
+        '279029-279029',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
+        '279071-279071',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.006/pb
+        '279080-279080',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.005/pb
+        '279115-279116',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
+        '279479-279479',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.002/pb
+        '279588-279588',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.036/pb
+        '279653-279654',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.045/pb
+        '279656-279656',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
+        '279658-279658',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
+        '279667-279667',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.029/pb
+        '279681-279685',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.009/pb
+        '279691-279691',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
+        '279694-279694',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.073/pb
+        '279715-279716',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.072/pb
+        '279760-279760',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
+        '279766-279767',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.083/pb
+        '279794-279794',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.03/pb
+        '279823-279823',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.009/pb
+        '279841-279841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.063/pb
+        '279844-279844',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.006/pb
+        '279887-279887',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
+        '279931-279931',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.097/pb
+        '279966-279966',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.01/pb
+        '279975-279975',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.03/pb
+        '279993-279994',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.003/pb
+        '280013-280013',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
+        '280015-280018',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.099/pb
+        '280020-280020',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.002/pb
+        '280024-280024',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.017/pb
+        '280187-280188',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
+        '280191-280191',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.029/pb
+        '280194-280194',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.007/pb
+        '280242-280242',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
+        '280249-280249',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.049/pb
+        '280251-280251',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.014/pb
+        '280327-280327',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
+        '280330-280330',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
+        '280349-280349',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.021/pb
+        '280363-280364',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
+        '280383-280385',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.064/pb
+        '281613-281613',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
+        '281639-281639',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
+        '281641-281641',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
+        '281693-281693',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.071/pb
+        '281707-281707',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.026/pb
+        '281726-281727',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.064/pb
+        '281797-281797',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.062/pb
+        '281975-281976',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.077/pb
+        '282033-282035',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.003/pb
+        '282037-282037',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.061/pb
+        '282092-282092',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.059/pb
+        '282708-282708',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
+        '282710-282710',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
+        '282712-282712',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
+        '282730-282735',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.083/pb
+        '282800-282800',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.01/pb
+        '282807-282807',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
+        '282814-282814',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.062/pb
+        '282842-282842',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
+        '282917-282919',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.01/pb
+        '282922-282923',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.011/pb
+        '283042-283043',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.014/pb
+        '283049-283050',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
+        '283052-283052',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.003/pb
+        '283059-283059',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.013/pb
+        '283270-283270',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.054/pb
+        '283283-283283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.063/pb
+        '283305-283308',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.051/pb
+        '283353-283353',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
+        '283358-283359',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.045/pb
+        '283407-283408',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.072/pb
+        '283416-283416',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
+        '283453-283453',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
+        '283469-283469',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
+        '283478-283478',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.024/pb
+        '283548-283548',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.004/pb
+        '283680-283682',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.014/pb
+        '283685-283685',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
+        '283820-283820',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.047/pb
+        '283830-283830',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.025/pb
+        '283834-283835',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
+        '283865-283865',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.034/pb
+        '283876-283877',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.066/pb
+        '283884-283885',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.065/pb
+        '283933-283934',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.041/pb
+        '283946-283946',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.04/pb
+        '283964-283964',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
+        '284006-284006',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.01/pb
+        '284014-284014',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
+        '284025-284025',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.001/pb
+        '284029-284029',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.003/pb
+        '284035-284044',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.048/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Ele17_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(17.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(572.4), # L=62.761/pb; present in all eras; prescale factor 572.4 (573.4 from delivery)
+      trigger_type = cms.string('2e'),
+      run_ranges = cms.vstring(*(
+        '273158-273158',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 2.491/pb
+        '273302-273302',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.204/pb
+        '273402-273406',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.145/pb
+        '273408-273411',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.336/pb
+        '273425-273425',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.334/pb
+        '273446-273450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.866/pb
+        '273492-273494',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.387/pb
+        '273502-273503',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.902/pb
+        '273554-273555',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.243/pb
+        '273725-273725',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 1.443/pb
+        '273728-273728',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.061/pb
+        '273730-273730',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 1.36/pb
+        '274094-274094',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.122/pb
+        '274146-274146',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.032/pb
+        '274157-274157',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.105/pb
+        '274159-274161',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.393/pb
+        '274172-274172',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.018/pb
+        '274198-274200',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.653/pb
+        '274240-274241',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.448/pb
+        '274244-274244',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.62/pb
+        '274250-274251',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.292/pb
+        '274283-274284',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.038/pb
+        '274286-274286',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.027/pb
+        '274314-274317',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.258/pb
+        '274319-274319',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.034/pb
+        '274335-274339',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.584/pb
+        '274344-274345',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.81/pb
+        '274382-274382',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.009/pb
+        '274387-274388',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.811/pb
+        '274420-274422',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 1.664/pb
+        '274440-274442',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.613/pb
+        '274954-274955',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 0.072/pb
+        '274968-274971',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 1.133/pb
+        '274998-275001',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 1.791/pb
+        '275059-275059',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 0.006/pb
+        '275066-275068',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2/HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.317/pb
+        '275073-275074',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.599/pb
+        '275124-275125',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.346/pb
+        '275282-275284',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.061/pb
+        '275290-275293',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.265/pb
+        '275309-275311',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 1.795/pb
+        '275319-275319',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.027/pb
+        '275337-275338',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.287/pb
+        '275344-275345',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.13/pb
+        '275370-275371',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.174/pb
+        '275375-275376',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.953/pb
+        '275657-275659',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.089/pb
+        '275761-275761',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.002/pb
+        '275767-275767',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.001/pb
+        '275772-275774',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.076/pb
+        '275776-275778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.146/pb
+        '275782-275782',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.413/pb
+        '275832-275837',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.966/pb
+        '275847-275847',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.104/pb
+        '275886-275886',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.008/pb
+        '275890-275890',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.281/pb
+        '275911-275913',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.231/pb
+        '275918-275918',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.062/pb
+        '275920-275921',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.256/pb
+        '275923-275923',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.06/pb
+        '275931-275931',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.043/pb
+        '275963-275963',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.02/pb
+        '276092-276092',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.015/pb
+        '276097-276097',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.108/pb
+        '276242-276244',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.317/pb
+        '276282-276283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.564/pb
+        '276315-276315',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.036/pb
+        '276317-276318',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.143/pb
+        '276355-276355',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.006/pb
+        '276361-276361',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.175/pb
+        '276363-276363',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.633/pb
+        '276384-276384',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.506/pb
+        '276437-276437',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.546/pb
+        '276454-276454',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.263/pb
+        '276458-276458',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.159/pb
+        '276495-276495',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.038/pb
+        '276501-276502',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.096/pb
+        '276525-276525',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.987/pb
+        '276527-276528',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.267/pb
+        '276542-276545',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.553/pb
+        '276581-276587',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.15/pb
+        '276653-276653',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.096/pb
+        '276655-276655',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.305/pb
+        '276659-276659',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.124/pb
+        '276775-276776',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.024/pb
+        '276794-276794',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.454/pb
+        '276807-276808',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.216/pb
+        '276810-276811',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.297/pb
+        '276831-276831',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.938/pb
+        '276834-276834',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.363/pb
+        '276870-276870',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.215/pb
+        '276935-276935',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.156/pb
+        '276940-276940',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.022/pb
+        '276946-276948',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.124/pb
+        '276950-276950',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.934/pb
+        '277069-277073',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.487/pb
+        '277076-277076',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.525/pb
+        '277087-277087',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.54/pb
+        '277094-277094',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.102/pb
+        '277096-277096',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.674/pb
+        '277112-277112',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.056/pb
+        '277126-277127',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.197/pb
+        '277148-277148',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.135/pb
+        '277166-277166',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.074/pb
+        '277168-277168',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.847/pb
+        '277180-277180',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.025/pb
+        '277194-277194',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.401/pb
+        '277305-277305',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.124/pb
+        '277420-277420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.043/pb
+        '277981-277981',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.029/pb
+        '277991-277992',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.267/pb
+        '278017-278018',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.313/pb
+        '278167-278167',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.808/pb
+        '278175-278175',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.041/pb
+        '278193-278193',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.03/pb
+        '278239-278240',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.593/pb
+        '278273-278274',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.013/pb
+        '278288-278290',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.008/pb
+        '278308-278308',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.187/pb
+        '278310-278310',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.064/pb
+        '278315-278315',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.078/pb
+        '278345-278346',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.097/pb
+        '278349-278349',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.074/pb
+        '278366-278366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.059/pb
+        '278406-278406',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.182/pb
+        '278509-278509',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.164/pb
+        '278769-278770',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.091/pb
+        '278801-278805',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.071/pb
+        '278808-278808',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.207/pb
+        '278820-278820',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.173/pb
+        '278822-278822',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.201/pb
+        '278873-278875',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.144/pb
+        '278923-278923',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.049/pb
+        '278957-278957',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.018/pb
+        '278962-278963',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.057/pb
+        '278969-278969',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.161/pb
+        '278975-278976',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.098/pb
+        '278986-278986',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.016/pb
+        '279024-279024',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.035/pb
+        '279029-279029',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.027/pb
+        '279071-279071',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.019/pb
+        '279080-279080',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.017/pb
+        '279115-279116',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.097/pb
+        '279479-279479',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.007/pb
+        '279588-279588',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.133/pb
+        '279653-279654',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.167/pb
+        '279656-279656',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.004/pb
+        '279658-279658',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.086/pb
+        '279667-279667',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.112/pb
+        '279681-279685',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.037/pb
+        '279691-279691',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.004/pb
+        '279694-279694',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.262/pb
+        '279715-279716',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.256/pb
+        '279760-279760',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.075/pb
+        '279766-279767',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.284/pb
+        '279794-279794',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.118/pb
+        '279823-279823',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.041/pb
+        '279841-279841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.229/pb
+        '279844-279844',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.025/pb
+        '279887-279887',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.037/pb
+        '279931-279931',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.342/pb
+        '279966-279966',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.041/pb
+        '279975-279975',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.12/pb
+        '279993-279994',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.012/pb
+        '280013-280013',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.003/pb
+        '280015-280018',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.342/pb
+        '280020-280020',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.007/pb
+        '280024-280024',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.06/pb
+        '280187-280188',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.035/pb
+        '280191-280191',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.106/pb
+        '280194-280194',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.026/pb
+        '280242-280242',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.073/pb
+        '280249-280249',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.169/pb
+        '280251-280251',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.047/pb
+        '280327-280327',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.004/pb
+        '280330-280330',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.099/pb
+        '280349-280349',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.072/pb
+        '280363-280364',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.202/pb
+        '280383-280385',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.231/pb
+        '281613-281613',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.072/pb
+        '281639-281639',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.009/pb
+        '281641-281641',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.023/pb
+        '281693-281693',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.253/pb
+        '281707-281707',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.106/pb
+        '281726-281727',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.217/pb
+        '281797-281797',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.231/pb
+        '281975-281976',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.278/pb
+        '282033-282035',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
+        '282037-282037',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.219/pb
+        '282092-282092',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.207/pb
+        '282708-282708',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
+        '282710-282710',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.0/pb
+        '282712-282712',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.006/pb
+        '282730-282735',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.3/pb
+        '282800-282800',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
+        '282807-282807',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.036/pb
+        '282814-282814',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.214/pb
+        '282842-282842',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
+        '282917-282919',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
+        '282922-282923',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.04/pb
+        '283042-283043',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
+        '283049-283050',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.023/pb
+        '283052-283052',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
+        '283059-283059',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.051/pb
+        '283270-283270',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.203/pb
+        '283283-283283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.215/pb
+        '283305-283308',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.19/pb
+        '283353-283353',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.082/pb
+        '283358-283359',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.156/pb
+        '283407-283408',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.266/pb
+        '283416-283416',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.022/pb
+        '283453-283453',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.049/pb
+        '283469-283469',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.0/pb
+        '283478-283478',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.096/pb
+        '283548-283548',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.015/pb
+        '283680-283682',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.054/pb
+        '283685-283685',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.034/pb
+        '283820-283820',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.162/pb
+        '283830-283830',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.084/pb
+        '283834-283835',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.02/pb
+        '283865-283865',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.131/pb
+        '283876-283877',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.24/pb
+        '283884-283885',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.237/pb
+        '283933-283934',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.156/pb
+        '283946-283946',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.154/pb
+        '283964-283964',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
+        '284006-284006',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.035/pb
+        '284014-284014',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.03/pb
+        '284025-284025',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
+        '284029-284029',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
+        '284035-284044',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.179/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Ele23_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(23.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(572.4), # L=62.7611/pb; present in all eras; prescale factor 572.4 (573.4 from delivery)
+      trigger_type = cms.string('2e'),
+      run_ranges = cms.vstring(*(
+        '273158-273158',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 2.491/pb
+        '273302-273302',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.204/pb
+        '273402-273406',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.145/pb
+        '273408-273411',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.336/pb
+        '273425-273425',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.334/pb
+        '273446-273450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.866/pb
+        '273492-273494',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.387/pb
+        '273502-273503',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.902/pb
+        '273554-273555',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.243/pb
+        '273725-273725',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 1.443/pb
+        '273728-273728',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.061/pb
+        '273730-273730',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 1.36/pb
+        '274094-274094',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.122/pb
+        '274146-274146',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.032/pb
+        '274157-274157',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.105/pb
+        '274159-274161',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.393/pb
+        '274172-274172',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.018/pb
+        '274198-274200',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.653/pb
+        '274240-274241',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.448/pb
+        '274244-274244',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.62/pb
+        '274250-274251',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.292/pb
+        '274283-274284',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.038/pb
+        '274286-274286',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.027/pb
+        '274314-274317',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.258/pb
+        '274319-274319',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.034/pb
+        '274335-274339',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.584/pb
+        '274344-274345',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.81/pb
+        '274382-274382',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.009/pb
+        '274387-274388',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.811/pb
+        '274420-274422',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 1.664/pb
+        '274440-274442',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.613/pb
+        '274954-274955',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 0.072/pb
+        '274968-274971',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 1.133/pb
+        '274998-275001',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 1.791/pb
+        '275059-275059',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 0.006/pb
+        '275066-275068',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4/HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.317/pb
+        '275073-275074',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.599/pb
+        '275124-275125',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.346/pb
+        '275282-275284',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.061/pb
+        '275290-275293',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.265/pb
+        '275309-275311',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 1.795/pb
+        '275319-275319',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.027/pb
+        '275337-275338',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.287/pb
+        '275344-275345',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.13/pb
+        '275370-275371',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.174/pb
+        '275375-275376',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.953/pb
+        '275657-275659',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.089/pb
+        '275761-275761',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
+        '275767-275767',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.001/pb
+        '275772-275774',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.076/pb
+        '275776-275778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.146/pb
+        '275782-275782',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.413/pb
+        '275832-275837',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.966/pb
+        '275847-275847',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.104/pb
+        '275886-275886',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.008/pb
+        '275890-275890',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.281/pb
+        '275911-275913',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.231/pb
+        '275918-275918',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.062/pb
+        '275920-275921',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.256/pb
+        '275923-275923',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.06/pb
+        '275931-275931',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.043/pb
+        '275963-275963',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.02/pb
+        '276092-276092',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.015/pb
+        '276097-276097',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.108/pb
+        '276242-276244',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.317/pb
+        '276282-276283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.564/pb
+        '276315-276315',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.036/pb
+        '276317-276318',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.143/pb
+        '276355-276355',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.006/pb
+        '276361-276361',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.175/pb
+        '276363-276363',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.633/pb
+        '276384-276384',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.506/pb
+        '276437-276437',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.546/pb
+        '276454-276454',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.263/pb
+        '276458-276458',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.159/pb
+        '276495-276495',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.038/pb
+        '276501-276502',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.096/pb
+        '276525-276525',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.987/pb
+        '276527-276528',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.267/pb
+        '276542-276545',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.553/pb
+        '276581-276587',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.15/pb
+        '276653-276653',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.096/pb
+        '276655-276655',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.305/pb
+        '276659-276659',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.124/pb
+        '276775-276776',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.024/pb
+        '276794-276794',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.454/pb
+        '276807-276808',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.216/pb
+        '276810-276811',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.297/pb
+        '276831-276831',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.938/pb
+        '276834-276834',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.363/pb
+        '276870-276870',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.215/pb
+        '276935-276935',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.156/pb
+        '276940-276940',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.022/pb
+        '276946-276948',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.124/pb
+        '276950-276950',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.934/pb
+        '277069-277073',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.487/pb
+        '277076-277076',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.525/pb
+        '277087-277087',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.54/pb
+        '277094-277094',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.102/pb
+        '277096-277096',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.674/pb
+        '277112-277112',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.056/pb
+        '277126-277127',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.197/pb
+        '277148-277148',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.135/pb
+        '277166-277166',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.074/pb
+        '277168-277168',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.847/pb
+        '277180-277180',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.025/pb
+        '277194-277194',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.401/pb
+        '277305-277305',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.124/pb
+        '277420-277420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.043/pb
+        '277981-277981',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.029/pb
+        '277991-277992',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.267/pb
+        '278017-278018',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.313/pb
+        '278167-278167',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.808/pb
+        '278175-278175',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.041/pb
+        '278193-278193',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.03/pb
+        '278239-278240',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.593/pb
+        '278273-278274',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.013/pb
+        '278288-278290',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
+        '278308-278308',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.187/pb
+        '278310-278310',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.064/pb
+        '278315-278315',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.078/pb
+        '278345-278346',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.097/pb
+        '278349-278349',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.074/pb
+        '278366-278366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
+        '278406-278406',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.182/pb
+        '278509-278509',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.164/pb
+        '278769-278770',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.091/pb
+        '278801-278805',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.071/pb
+        '278808-278808',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.207/pb
+        '278820-278820',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.173/pb
+        '278822-278822',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.201/pb
+        '278873-278875',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.144/pb
+        '278923-278923',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.049/pb
+        '278957-278957',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
+        '278962-278963',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.057/pb
+        '278969-278969',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.161/pb
+        '278975-278976',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.098/pb
+        '278986-278986',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.016/pb
+        '279024-279024',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.035/pb
+        '279029-279029',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.027/pb
+        '279071-279071',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.019/pb
+        '279080-279080',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.017/pb
+        '279115-279116',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.097/pb
+        '279479-279479',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.007/pb
+        '279588-279588',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.133/pb
+        '279653-279654',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.167/pb
+        '279656-279656',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
+        '279658-279658',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.086/pb
+        '279667-279667',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.112/pb
+        '279681-279685',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.037/pb
+        '279691-279691',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
+        '279694-279694',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.262/pb
+        '279715-279716',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.256/pb
+        '279760-279760',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.075/pb
+        '279766-279767',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.284/pb
+        '279794-279794',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.118/pb
+        '279823-279823',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.041/pb
+        '279841-279841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.229/pb
+        '279844-279844',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
+        '279887-279887',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.037/pb
+        '279931-279931',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.342/pb
+        '279966-279966',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.041/pb
+        '279975-279975',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.12/pb
+        '279993-279994',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
+        '280013-280013',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.003/pb
+        '280015-280018',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.342/pb
+        '280020-280020',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.007/pb
+        '280024-280024',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.06/pb
+        '280187-280188',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.035/pb
+        '280191-280191',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.106/pb
+        '280194-280194',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.026/pb
+        '280242-280242',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.073/pb
+        '280249-280249',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.169/pb
+        '280251-280251',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.047/pb
+        '280327-280327',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
+        '280330-280330',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.099/pb
+        '280349-280349',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.072/pb
+        '280363-280364',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.202/pb
+        '280383-280385',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.231/pb
+        '281613-281613',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.072/pb
+        '281639-281639',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
+        '281641-281641',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.023/pb
+        '281693-281693',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.253/pb
+        '281707-281707',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.106/pb
+        '281726-281727',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.217/pb
+        '281797-281797',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.231/pb
+        '281975-281976',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.278/pb
+        '282033-282035',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
+        '282037-282037',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.219/pb
+        '282092-282092',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.207/pb
+        '282708-282708',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.001/pb
+        '282710-282710',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
+        '282712-282712',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
+        '282730-282735',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.3/pb
+        '282800-282800',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.042/pb
+        '282807-282807',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.036/pb
+        '282814-282814',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.214/pb
+        '282842-282842',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.008/pb
+        '282917-282919',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.042/pb
+        '282922-282923',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.04/pb
+        '283042-283043',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.059/pb
+        '283049-283050',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.023/pb
+        '283052-283052',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
+        '283059-283059',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.051/pb
+        '283270-283270',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.203/pb
+        '283283-283283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.215/pb
+        '283305-283308',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.19/pb
+        '283353-283353',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.082/pb
+        '283358-283359',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.156/pb
+        '283407-283408',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.266/pb
+        '283416-283416',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.022/pb
+        '283453-283453',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.049/pb
+        '283469-283469',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
+        '283478-283478',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.096/pb
+        '283548-283548',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.015/pb
+        '283680-283682',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.054/pb
+        '283685-283685',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.034/pb
+        '283820-283820',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.162/pb
+        '283830-283830',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.084/pb
+        '283834-283835',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
+        '283865-283865',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.131/pb
+        '283876-283877',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.24/pb
+        '283884-283885',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.237/pb
+        '283933-283934',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.156/pb
+        '283946-283946',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.154/pb
+        '283964-283964',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.042/pb
+        '284006-284006',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.035/pb
+        '284014-284014',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.03/pb
+        '284025-284025',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.004/pb
+        '284029-284029',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
+        '284035-284044',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.179/pb
+      )),
+    ),
+  ),
+}
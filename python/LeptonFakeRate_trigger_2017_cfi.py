@@ -0,0 +1,1904 @@
+import FWCore.ParameterSet.Config as cms
+
+leptonFR_triggers = {
+  'mu' : cms.VPSet(
+    cms.PSet(
+      path = cms.string("HLT_Mu3_PFJet40"),
+      cone_minPt = cms.double(10.),
+      cone_maxPt = cms.double(32.),
+      minRecoPt = cms.double(-1.),
+      jet_minPt = cms.double(45.),
+      average_prescale = cms.double(9006), # L=4.611/pb; present in C, D, E, F, missing in B; prescale factor 9005.6 (8870.8 from delivery)
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+        '299368-299370',  # HLT_Mu3_PFJet40_v9, 0.016/pb
+        '299380-299381',  # HLT_Mu3_PFJet40_v9, 0.004/pb
+        '299394-299396',  # HLT_Mu3_PFJet40_v9, 0.004/pb
+        '299420-299420',  # HLT_Mu3_PFJet40_v9, 0.001/pb
+        '299443-299443',  # HLT_Mu3_PFJet40_v9, 0.0/pb
+        '299450-299450',  # HLT_Mu3_PFJet40_v9, 0.001/pb
+        '299477-299481',  # HLT_Mu3_PFJet40_v9, 0.027/pb
+        '299593-299595',  # HLT_Mu3_PFJet40_v9, 0.017/pb
+        '299597-299597',  # HLT_Mu3_PFJet40_v9, 0.005/pb
+        '299649-299649',  # HLT_Mu3_PFJet40_v9, 0.003/pb
+        '300087-300087',  # HLT_Mu3_PFJet40_v10, 0.001/pb
+        '300105-300107',  # HLT_Mu3_PFJet40_v10, 0.002/pb
+        '300117-300117',  # HLT_Mu3_PFJet40_v10, 0.0/pb
+        '300122-300123',  # HLT_Mu3_PFJet40_v10, 0.025/pb
+        '300155-300157',  # HLT_Mu3_PFJet40_v10, 0.029/pb
+        '300226-300226',  # HLT_Mu3_PFJet40_v10, 0.007/pb
+        '300233-300240',  # HLT_Mu3_PFJet40_v10, 0.027/pb
+        '300280-300284',  # HLT_Mu3_PFJet40_v10, 0.019/pb
+        '300364-300375',  # HLT_Mu3_PFJet40_v10, 0.004/pb
+        '300389-300401',  # HLT_Mu3_PFJet40_v10, 0.021/pb
+        '300459-300459',  # HLT_Mu3_PFJet40_v10, 0.005/pb
+        '300461-300464',  # HLT_Mu3_PFJet40_v10, 0.008/pb
+        '300466-300467',  # HLT_Mu3_PFJet40_v10, 0.013/pb
+        '300497-300497',  # HLT_Mu3_PFJet40_v10, 0.002/pb
+        '300514-300517',  # HLT_Mu3_PFJet40_v10, 0.024/pb
+        '300558-300558',  # HLT_Mu3_PFJet40_v10, 0.007/pb
+        '300560-300560',  # HLT_Mu3_PFJet40_v10, 0.009/pb
+        '300574-300576',  # HLT_Mu3_PFJet40_v10, 0.02/pb
+        '300631-300633',  # HLT_Mu3_PFJet40_v10, 0.01/pb
+        '300635-300636',  # HLT_Mu3_PFJet40_v10, 0.02/pb
+        '300673-300676',  # HLT_Mu3_PFJet40_v10, 0.001/pb
+        '300742-300742',  # HLT_Mu3_PFJet40_v10, 0.005/pb
+        '300777-300777',  # HLT_Mu3_PFJet40_v10, 0.008/pb
+        '300780-300780',  # HLT_Mu3_PFJet40_v10, 0.005/pb
+        '300785-300785',  # HLT_Mu3_PFJet40_v10, 0.013/pb
+        '300806-300806',  # HLT_Mu3_PFJet40_v10, 0.003/pb
+        '300811-300812',  # HLT_Mu3_PFJet40_v10, 0.01/pb
+        '300816-300817',  # HLT_Mu3_PFJet40_v10, 0.008/pb
+        '301046-301046',  # HLT_Mu3_PFJet40_v10, 0.002/pb
+        '301141-301142',  # HLT_Mu3_PFJet40_v10, 0.017/pb
+        '301161-301161',  # HLT_Mu3_PFJet40_v10, 0.015/pb
+        '301165-301165',  # HLT_Mu3_PFJet40_v10, 0.003/pb
+        '301179-301180',  # HLT_Mu3_PFJet40_v10, 0.002/pb
+        '301183-301183',  # HLT_Mu3_PFJet40_v10, 0.005/pb
+        '301281-301281',  # HLT_Mu3_PFJet40_v10, 0.002/pb
+        '301283-301283',  # HLT_Mu3_PFJet40_v10, 0.017/pb
+        '301298-301298',  # HLT_Mu3_PFJet40_v10, 0.016/pb
+        '301323-301323',  # HLT_Mu3_PFJet40_v10, 0.017/pb
+        '301330-301330',  # HLT_Mu3_PFJet40_v10, 0.006/pb
+        '301359-301359',  # HLT_Mu3_PFJet40_v10, 0.005/pb
+        '301384-301384',  # HLT_Mu3_PFJet40_v10, 0.009/pb
+        '301391-301393',  # HLT_Mu3_PFJet40_v10, 0.015/pb
+        '301396-301399',  # HLT_Mu3_PFJet40_v10, 0.018/pb
+        '301417-301417',  # HLT_Mu3_PFJet40_v10, 0.006/pb
+        '301447-301450',  # HLT_Mu3_PFJet40_v10, 0.026/pb
+        '301461-301461',  # HLT_Mu3_PFJet40_v10, 0.01/pb
+        '301472-301472',  # HLT_Mu3_PFJet40_v10, 0.014/pb
+        '301475-301476',  # HLT_Mu3_PFJet40_v10, 0.019/pb
+        '301519-301519',  # HLT_Mu3_PFJet40_v10, 0.003/pb
+        '301524-301524',  # HLT_Mu3_PFJet40_v10, 0.005/pb
+        '301529-301532',  # HLT_Mu3_PFJet40_v10, 0.023/pb
+        '301567-301567',  # HLT_Mu3_PFJet40_v10, 0.006/pb
+        '301627-301627',  # HLT_Mu3_PFJet40_v10, 0.015/pb
+        '301664-301665',  # HLT_Mu3_PFJet40_v10, 0.016/pb
+        '301694-301694',  # HLT_Mu3_PFJet40_v10, 0.001/pb
+        '301912-301914',  # HLT_Mu3_PFJet40_v10, 0.004/pb
+        '301941-301941',  # HLT_Mu3_PFJet40_v10, 0.004/pb
+        '301959-301960',  # HLT_Mu3_PFJet40_v10, 0.017/pb
+        '301970-301970',  # HLT_Mu3_PFJet40_v10, 0.001/pb
+        '301984-301987',  # HLT_Mu3_PFJet40_v10, 0.018/pb
+        '301997-301998',  # HLT_Mu3_PFJet40_v10, 0.017/pb
+        '302019-302019',  # HLT_Mu3_PFJet40_v10, 0.0/pb
+        '302026-302026',  # HLT_Mu3_PFJet40_v11, 0.0/pb
+        '302029-302029',  # HLT_Mu3_PFJet40_v11, 0.001/pb
+        '302031-302031',  # HLT_Mu3_PFJet40_v11, 0.007/pb
+        '302033-302034',  # HLT_Mu3_PFJet40_v11, 0.001/pb
+        '302037-302038',  # HLT_Mu3_PFJet40_v11, 0.0/pb
+        '302040-302043',  # HLT_Mu3_PFJet40_v11, 0.01/pb
+        '302131-302131',  # HLT_Mu3_PFJet40_v11, 0.009/pb
+        '302159-302159',  # HLT_Mu3_PFJet40_v11, 0.001/pb
+        '302163-302163',  # HLT_Mu3_PFJet40_v11, 0.011/pb
+        '302165-302166',  # HLT_Mu3_PFJet40_v11, 0.001/pb
+        '302225-302225',  # HLT_Mu3_PFJet40_v11, 0.008/pb
+        '302228-302229',  # HLT_Mu3_PFJet40_v11, 0.006/pb
+        '302240-302240',  # HLT_Mu3_PFJet40_v11, 0.01/pb
+        '302262-302263',  # HLT_Mu3_PFJet40_v11, 0.017/pb
+        '302277-302277',  # HLT_Mu3_PFJet40_v11, 0.003/pb
+        '302279-302280',  # HLT_Mu3_PFJet40_v11, 0.003/pb
+        '302322-302322',  # HLT_Mu3_PFJet40_v11, 0.009/pb
+        '302328-302328',  # HLT_Mu3_PFJet40_v11, 0.006/pb
+        '302337-302337',  # HLT_Mu3_PFJet40_v11, 0.001/pb
+        '302342-302344',  # HLT_Mu3_PFJet40_v11, 0.005/pb
+        '302350-302350',  # HLT_Mu3_PFJet40_v11, 0.001/pb
+        '302388-302388',  # HLT_Mu3_PFJet40_v11, 0.006/pb
+        '302392-302393',  # HLT_Mu3_PFJet40_v11, 0.012/pb
+        '302448-302448',  # HLT_Mu3_PFJet40_v11, 0.018/pb
+        '302472-302476',  # HLT_Mu3_PFJet40_v11, 0.016/pb
+        '302479-302479',  # HLT_Mu3_PFJet40_v11, 0.003/pb
+        '302484-302485',  # HLT_Mu3_PFJet40_v11, 0.01/pb
+        '302492-302494',  # HLT_Mu3_PFJet40_v11, 0.149/pb
+        '302509-302509',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '302513-302513',  # HLT_Mu3_PFJet40_v12, 0.002/pb
+        '302522-302523',  # HLT_Mu3_PFJet40_v12, 0.003/pb
+        '302525-302526',  # HLT_Mu3_PFJet40_v12, 0.069/pb
+        '302548-302548',  # HLT_Mu3_PFJet40_v12, 0.003/pb
+        '302551-302551',  # HLT_Mu3_PFJet40_v12, 0.0/pb
+        '302553-302555',  # HLT_Mu3_PFJet40_v12, 0.009/pb
+        '302563-302563',  # HLT_Mu3_PFJet40_v12, 0.0/pb
+        '302565-302565',  # HLT_Mu3_PFJet40_v12, 0.0/pb
+        '302572-302573',  # HLT_Mu3_PFJet40_v12, 0.098/pb
+        '302596-302597',  # HLT_Mu3_PFJet40_v12, 0.133/pb
+        '302634-302635',  # HLT_Mu3_PFJet40_v12, 0.117/pb
+        '302651-302651',  # HLT_Mu3_PFJet40_v12, 0.007/pb
+        '302654-302654',  # HLT_Mu3_PFJet40_v12, 0.015/pb
+        '302661-302661',  # HLT_Mu3_PFJet40_v12, 0.002/pb
+        '302663-302663',  # HLT_Mu3_PFJet40_v12, 0.067/pb
+        '303825-303825',  # HLT_Mu3_PFJet40_v12, 0.015/pb
+        '303832-303832',  # HLT_Mu3_PFJet40_v12, 0.109/pb
+        '303838-303838',  # HLT_Mu3_PFJet40_v12, 0.108/pb
+        '303885-303885',  # HLT_Mu3_PFJet40_v12, 0.096/pb
+        '303948-303948',  # HLT_Mu3_PFJet40_v12, 0.075/pb
+        '303998-304000',  # HLT_Mu3_PFJet40_v12, 0.003/pb
+        '304062-304062',  # HLT_Mu3_PFJet40_v12, 0.007/pb
+        '304119-304120',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '304125-304125',  # HLT_Mu3_PFJet40_v12, 0.006/pb
+        '304144-304144',  # HLT_Mu3_PFJet40_v12, 0.009/pb
+        '304158-304158',  # HLT_Mu3_PFJet40_v12, 0.008/pb
+        '304169-304170',  # HLT_Mu3_PFJet40_v12, 0.014/pb
+        '304199-304200',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '304204-304204',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '304209-304209',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '304291-304292',  # HLT_Mu3_PFJet40_v12, 0.005/pb
+        '304333-304333',  # HLT_Mu3_PFJet40_v12, 0.004/pb
+        '304354-304354',  # HLT_Mu3_PFJet40_v12, 0.0/pb
+        '304366-304366',  # HLT_Mu3_PFJet40_v12, 0.005/pb
+        '304446-304447',  # HLT_Mu3_PFJet40_v12, 0.005/pb
+        '304451-304451',  # HLT_Mu3_PFJet40_v12, 0.0/pb
+        '304505-304508',  # HLT_Mu3_PFJet40_v12, 0.084/pb
+        '304562-304562',  # HLT_Mu3_PFJet40_v12, 0.055/pb
+        '304616-304616',  # HLT_Mu3_PFJet40_v12, 0.029/pb
+        '304625-304626',  # HLT_Mu3_PFJet40_v12, 0.007/pb
+        '304654-304655',  # HLT_Mu3_PFJet40_v12, 0.076/pb
+        '304661-304663',  # HLT_Mu3_PFJet40_v12, 0.03/pb
+        '304671-304672',  # HLT_Mu3_PFJet40_v12, 0.038/pb
+        '304737-304740',  # HLT_Mu3_PFJet40_v12, 0.111/pb
+        '304776-304778',  # HLT_Mu3_PFJet40_v12, 0.075/pb
+        '304797-304797',  # HLT_Mu3_PFJet40_v12, 0.173/pb
+        '305044-305046',  # HLT_Mu3_PFJet40_v12, 0.139/pb
+        '305059-305059',  # HLT_Mu3_PFJet40_v12, 0.007/pb
+        '305062-305064',  # HLT_Mu3_PFJet40_v12, 0.123/pb
+        '305081-305081',  # HLT_Mu3_PFJet40_v12, 0.025/pb
+        '305112-305114',  # HLT_Mu3_PFJet40_v12, 0.083/pb
+        '305178-305184',  # HLT_Mu3_PFJet40_v12, 0.005/pb
+        '305186-305186',  # HLT_Mu3_PFJet40_v12, 0.008/pb
+        '305188-305188',  # HLT_Mu3_PFJet40_v12, 0.193/pb
+        '305202-305202',  # HLT_Mu3_PFJet40_v12, 0.01/pb
+        '305204-305204',  # HLT_Mu3_PFJet40_v12, 0.06/pb
+        '305207-305208',  # HLT_Mu3_PFJet40_v12, 0.04/pb
+        '305234-305234',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '305236-305237',  # HLT_Mu3_PFJet40_v12, 0.036/pb
+        '305247-305248',  # HLT_Mu3_PFJet40_v12, 0.039/pb
+        '305252-305252',  # HLT_Mu3_PFJet40_v12, 0.032/pb
+        '305282-305282',  # HLT_Mu3_PFJet40_v12, 0.002/pb
+        '305310-305314',  # HLT_Mu3_PFJet40_v12, 0.076/pb
+        '305336-305336',  # HLT_Mu3_PFJet40_v12, 0.003/pb
+        '305338-305338',  # HLT_Mu3_PFJet40_v12, 0.002/pb
+        '305341-305341',  # HLT_Mu3_PFJet40_v12, 0.009/pb
+        '305349-305351',  # HLT_Mu3_PFJet40_v12, 0.049/pb
+        '305358-305358',  # HLT_Mu3_PFJet40_v12, 0.002/pb
+        '305364-305366',  # HLT_Mu3_PFJet40_v12, 0.1/pb
+        '305376-305377',  # HLT_Mu3_PFJet40_v12, 0.058/pb
+        '305405-305406',  # HLT_Mu3_PFJet40_v12, 0.046/pb
+        '305440-305441',  # HLT_Mu3_PFJet40_v12, 0.004/pb
+        '305516-305518',  # HLT_Mu3_PFJet40_v12, 0.042/pb
+        '305586-305586',  # HLT_Mu3_PFJet40_v12, 0.005/pb
+        '305589-305590',  # HLT_Mu3_PFJet40_v12, 0.052/pb
+        '305636-305636',  # HLT_Mu3_PFJet40_v12, 0.056/pb
+        '305766-305766',  # HLT_Mu3_PFJet40_v12, 0.01/pb
+        '305809-305809',  # HLT_Mu3_PFJet40_v12, 0.001/pb
+        '305814-305814',  # HLT_Mu3_PFJet40_v12, 0.044/pb
+        '305821-305821',  # HLT_Mu3_PFJet40_v12, 0.008/pb
+        '305832-305832',  # HLT_Mu3_PFJet40_v12, 0.002/pb
+        '305840-305840',  # HLT_Mu3_PFJet40_v12, 0.032/pb
+        '305842-305842',  # HLT_Mu3_PFJet40_v12, 0.027/pb
+        '305862-305862',  # HLT_Mu3_PFJet40_v12, 0.006/pb
+        '305898-305898',  # HLT_Mu3_PFJet40_v12, 0.007/pb
+        '305902-305902',  # HLT_Mu3_PFJet40_v12, 0.005/pb
+        '305967-305967',  # HLT_Mu3_PFJet40_v12, 0.0/pb
+        '306029-306030',  # HLT_Mu3_PFJet40_v13, 0.001/pb
+        '306036-306038',  # HLT_Mu3_PFJet40_v13, 0.002/pb
+        '306041-306042',  # HLT_Mu3_PFJet40_v13, 0.01/pb
+        '306048-306049',  # HLT_Mu3_PFJet40_v13, 0.015/pb
+        '306051-306051',  # HLT_Mu3_PFJet40_v13, 0.013/pb
+        '306091-306092',  # HLT_Mu3_PFJet40_v13, 0.027/pb
+        '306095-306095',  # HLT_Mu3_PFJet40_v13, 0.01/pb
+        '306121-306122',  # HLT_Mu3_PFJet40_v13, 0.0/pb
+        '306125-306126',  # HLT_Mu3_PFJet40_v13, 0.019/pb
+        '306134-306135',  # HLT_Mu3_PFJet40_v13, 0.016/pb
+        '306138-306139',  # HLT_Mu3_PFJet40_v13, 0.082/pb
+        '306153-306155',  # HLT_Mu3_PFJet40_v13, 0.069/pb
+        '306169-306171',  # HLT_Mu3_PFJet40_v13, 0.047/pb
+        '306418-306420',  # HLT_Mu3_PFJet40_v14, 0.002/pb
+        '306422-306423',  # HLT_Mu3_PFJet40_v14, 0.008/pb
+        '306432-306432',  # HLT_Mu3_PFJet40_v14, 0.006/pb
+        '306454-306460',  # HLT_Mu3_PFJet40_v14, 0.096/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu8"),
+      cone_minPt = cms.double(15.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(8.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(15943), # L=2.605/pb; present in all eras; prescale factor 15943.0 (15120.6 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '297050-297050',  # HLT_Mu8_v6, 0.002/pb
+        '297056-297057',  # HLT_Mu8_v6, 0.004/pb
+        '297099-297101',  # HLT_Mu8_v6, 0.006/pb
+        '297113-297114',  # HLT_Mu8_v6, 0.002/pb
+        '297175-297178',  # HLT_Mu8_v6, 0.007/pb
+        '297215-297215',  # HLT_Mu8_v6, 0.0/pb
+        '297218-297219',  # HLT_Mu8_v6, 0.011/pb
+        '297224-297225',  # HLT_Mu8_v6, 0.0/pb
+        '297227-297227',  # HLT_Mu8_v6, 0.0/pb
+        '297292-297293',  # HLT_Mu8_v6, 0.005/pb
+        '297296-297296',  # HLT_Mu8_v6, 0.002/pb
+        '297308-297308',  # HLT_Mu8_v6, 0.0/pb
+        '297359-297359',  # HLT_Mu8_v6, 0.0/pb
+        '297411-297411',  # HLT_Mu8_v6, 0.005/pb
+        '297424-297426',  # HLT_Mu8_v6, 0.001/pb
+        '297429-297435',  # HLT_Mu8_v6, 0.005/pb
+        '297467-297469',  # HLT_Mu8_v6, 0.0/pb
+        '297483-297488',  # HLT_Mu8_v6, 0.011/pb
+        '297503-297505',  # HLT_Mu8_v6, 0.007/pb
+        '297557-297558',  # HLT_Mu8_v7, 0.003/pb
+        '297562-297563',  # HLT_Mu8_v7, 0.003/pb
+        '297598-297599',  # HLT_Mu8_v7, 0.002/pb
+        '297603-297606',  # HLT_Mu8_v7, 0.007/pb
+        '297620-297620',  # HLT_Mu8_v7, 0.0/pb
+        '297656-297656',  # HLT_Mu8_v7, 0.0/pb
+        '297665-297666',  # HLT_Mu8_v7, 0.002/pb
+        '297670-297670',  # HLT_Mu8_v7, 0.0/pb
+        '297674-297675',  # HLT_Mu8_v7, 0.003/pb
+        '297722-297723',  # HLT_Mu8_v7, 0.002/pb
+        '298996-298997',  # HLT_Mu8_v7, 0.001/pb
+        '299000-299000',  # HLT_Mu8_v7, 0.0/pb
+        '299042-299042',  # HLT_Mu8_v7, 0.0/pb
+        '299061-299062',  # HLT_Mu8_v7, 0.003/pb
+        '299064-299065',  # HLT_Mu8_v7, 0.002/pb
+        '299067-299067',  # HLT_Mu8_v7, 0.002/pb
+        '299096-299096',  # HLT_Mu8_v7, 0.001/pb
+        '299149-299149',  # HLT_Mu8_v7, 0.002/pb
+        '299178-299178',  # HLT_Mu8_v7, 0.0/pb
+        '299180-299180',  # HLT_Mu8_v7, 0.0/pb
+        '299184-299185',  # HLT_Mu8_v7, 0.004/pb
+        '299327-299327',  # HLT_Mu8_v7, 0.0/pb
+        '299329-299329',  # HLT_Mu8_v7, 0.001/pb
+        '299368-299370',  # HLT_Mu8_v8, 0.015/pb
+        '299380-299381',  # HLT_Mu8_v8, 0.003/pb
+        '299394-299396',  # HLT_Mu8_v8, 0.003/pb
+        '299420-299420',  # HLT_Mu8_v8, 0.001/pb
+        '299443-299443',  # HLT_Mu8_v8, 0.0/pb
+        '299450-299450',  # HLT_Mu8_v8, 0.001/pb
+        '299477-299481',  # HLT_Mu8_v8, 0.045/pb
+        '299593-299595',  # HLT_Mu8_v8, 0.017/pb
+        '299597-299597',  # HLT_Mu8_v8, 0.006/pb
+        '299649-299649',  # HLT_Mu8_v8, 0.003/pb
+        '300087-300087',  # HLT_Mu8_v9, 0.004/pb
+        '300105-300107',  # HLT_Mu8_v9, 0.002/pb
+        '300117-300117',  # HLT_Mu8_v9, 0.0/pb
+        '300122-300123',  # HLT_Mu8_v9, 0.027/pb
+        '300155-300157',  # HLT_Mu8_v9, 0.034/pb
+        '300226-300226',  # HLT_Mu8_v9, 0.006/pb
+        '300233-300240',  # HLT_Mu8_v9, 0.029/pb
+        '300280-300284',  # HLT_Mu8_v9, 0.029/pb
+        '300364-300375',  # HLT_Mu8_v9, 0.004/pb
+        '300389-300401',  # HLT_Mu8_v9, 0.023/pb
+        '300459-300459',  # HLT_Mu8_v9, 0.004/pb
+        '300461-300464',  # HLT_Mu8_v9, 0.008/pb
+        '300466-300467',  # HLT_Mu8_v9, 0.017/pb
+        '300497-300497',  # HLT_Mu8_v9, 0.002/pb
+        '300514-300517',  # HLT_Mu8_v9, 0.024/pb
+        '300558-300558',  # HLT_Mu8_v9, 0.008/pb
+        '300560-300560',  # HLT_Mu8_v9, 0.012/pb
+        '300574-300576',  # HLT_Mu8_v9, 0.02/pb
+        '300631-300633',  # HLT_Mu8_v9, 0.009/pb
+        '300635-300636',  # HLT_Mu8_v9, 0.025/pb
+        '300673-300676',  # HLT_Mu8_v9, 0.001/pb
+        '300742-300742',  # HLT_Mu8_v9, 0.004/pb
+        '300777-300777',  # HLT_Mu8_v9, 0.007/pb
+        '300780-300780',  # HLT_Mu8_v9, 0.005/pb
+        '300785-300785',  # HLT_Mu8_v9, 0.018/pb
+        '300806-300806',  # HLT_Mu8_v9, 0.002/pb
+        '300811-300812',  # HLT_Mu8_v9, 0.008/pb
+        '300816-300817',  # HLT_Mu8_v9, 0.009/pb
+        '301046-301046',  # HLT_Mu8_v9, 0.002/pb
+        '301141-301142',  # HLT_Mu8_v9, 0.011/pb
+        '301161-301161',  # HLT_Mu8_v9, 0.008/pb
+        '301165-301165',  # HLT_Mu8_v9, 0.002/pb
+        '301179-301180',  # HLT_Mu8_v9, 0.001/pb
+        '301183-301183',  # HLT_Mu8_v9, 0.002/pb
+        '301281-301281',  # HLT_Mu8_v9, 0.001/pb
+        '301283-301283',  # HLT_Mu8_v9, 0.009/pb
+        '301298-301298',  # HLT_Mu8_v9, 0.006/pb
+        '301323-301323',  # HLT_Mu8_v9, 0.007/pb
+        '301330-301330',  # HLT_Mu8_v9, 0.002/pb
+        '301359-301359',  # HLT_Mu8_v9, 0.002/pb
+        '301384-301384',  # HLT_Mu8_v9, 0.006/pb
+        '301391-301393',  # HLT_Mu8_v9, 0.01/pb
+        '301396-301399',  # HLT_Mu8_v9, 0.012/pb
+        '301417-301417',  # HLT_Mu8_v9, 0.004/pb
+        '301447-301450',  # HLT_Mu8_v9, 0.017/pb
+        '301461-301461',  # HLT_Mu8_v9, 0.006/pb
+        '301472-301472',  # HLT_Mu8_v9, 0.009/pb
+        '301475-301476',  # HLT_Mu8_v9, 0.012/pb
+        '301519-301519',  # HLT_Mu8_v9, 0.002/pb
+        '301524-301524',  # HLT_Mu8_v9, 0.003/pb
+        '301529-301532',  # HLT_Mu8_v9, 0.015/pb
+        '301567-301567',  # HLT_Mu8_v9, 0.004/pb
+        '301627-301627',  # HLT_Mu8_v9, 0.01/pb
+        '301664-301665',  # HLT_Mu8_v9, 0.011/pb
+        '301694-301694',  # HLT_Mu8_v9, 0.001/pb
+        '301912-301914',  # HLT_Mu8_v9, 0.006/pb
+        '301941-301941',  # HLT_Mu8_v9, 0.006/pb
+        '301959-301960',  # HLT_Mu8_v9, 0.026/pb
+        '301970-301970',  # HLT_Mu8_v9, 0.001/pb
+        '301984-301987',  # HLT_Mu8_v9, 0.028/pb
+        '301997-301998',  # HLT_Mu8_v9, 0.027/pb
+        '302019-302019',  # HLT_Mu8_v9, 0.001/pb
+        '302026-302026',  # HLT_Mu8_v10, 0.0/pb
+        '302029-302029',  # HLT_Mu8_v10, 0.001/pb
+        '302031-302031',  # HLT_Mu8_v10, 0.01/pb
+        '302033-302034',  # HLT_Mu8_v10, 0.001/pb
+        '302037-302038',  # HLT_Mu8_v10, 0.0/pb
+        '302040-302043',  # HLT_Mu8_v10, 0.013/pb
+        '302131-302131',  # HLT_Mu8_v10, 0.012/pb
+        '302159-302159',  # HLT_Mu8_v10, 0.001/pb
+        '302163-302163',  # HLT_Mu8_v10, 0.015/pb
+        '302165-302166',  # HLT_Mu8_v10, 0.001/pb
+        '302225-302225',  # HLT_Mu8_v10, 0.011/pb
+        '302228-302229',  # HLT_Mu8_v10, 0.008/pb
+        '302240-302240',  # HLT_Mu8_v10, 0.013/pb
+        '302262-302263',  # HLT_Mu8_v10, 0.022/pb
+        '302277-302277',  # HLT_Mu8_v10, 0.004/pb
+        '302279-302280',  # HLT_Mu8_v10, 0.004/pb
+        '302322-302322',  # HLT_Mu8_v10, 0.011/pb
+        '302328-302328',  # HLT_Mu8_v10, 0.009/pb
+        '302337-302337',  # HLT_Mu8_v10, 0.001/pb
+        '302342-302344',  # HLT_Mu8_v10, 0.007/pb
+        '302350-302350',  # HLT_Mu8_v10, 0.002/pb
+        '302388-302388',  # HLT_Mu8_v10, 0.008/pb
+        '302392-302393',  # HLT_Mu8_v10, 0.015/pb
+        '302448-302448',  # HLT_Mu8_v10, 0.024/pb
+        '302472-302476',  # HLT_Mu8_v10, 0.022/pb
+        '302479-302479',  # HLT_Mu8_v10, 0.004/pb
+        '302484-302485',  # HLT_Mu8_v10, 0.014/pb
+        '302492-302494',  # HLT_Mu8_v10, 0.152/pb
+        '302509-302509',  # HLT_Mu8_v10, 0.0/pb
+        '302513-302513',  # HLT_Mu8_v10, 0.001/pb
+        '302522-302523',  # HLT_Mu8_v10, 0.001/pb
+        '302525-302526',  # HLT_Mu8_v10, 0.015/pb
+        '302548-302548',  # HLT_Mu8_v10, 0.001/pb
+        '302551-302551',  # HLT_Mu8_v10, 0.0/pb
+        '302553-302555',  # HLT_Mu8_v10, 0.003/pb
+        '302563-302563',  # HLT_Mu8_v10, 0.0/pb
+        '302565-302565',  # HLT_Mu8_v10, 0.0/pb
+        '302572-302573',  # HLT_Mu8_v10, 0.019/pb
+        '302596-302597',  # HLT_Mu8_v10, 0.026/pb
+        '302634-302635',  # HLT_Mu8_v10, 0.023/pb
+        '302651-302651',  # HLT_Mu8_v10, 0.002/pb
+        '302654-302654',  # HLT_Mu8_v10, 0.004/pb
+        '302661-302661',  # HLT_Mu8_v10, 0.001/pb
+        '302663-302663',  # HLT_Mu8_v10, 0.012/pb
+        '303825-303825',  # HLT_Mu8_v10, 0.002/pb
+        '303832-303832',  # HLT_Mu8_v10, 0.023/pb
+        '303838-303838',  # HLT_Mu8_v10, 0.025/pb
+        '303885-303885',  # HLT_Mu8_v10, 0.024/pb
+        '303948-303948',  # HLT_Mu8_v10, 0.02/pb
+        '303998-304000',  # HLT_Mu8_v10, 0.013/pb
+        '304062-304062',  # HLT_Mu8_v10, 0.025/pb
+        '304119-304120',  # HLT_Mu8_v10, 0.004/pb
+        '304125-304125',  # HLT_Mu8_v10, 0.023/pb
+        '304144-304144',  # HLT_Mu8_v10, 0.033/pb
+        '304158-304158',  # HLT_Mu8_v10, 0.028/pb
+        '304169-304170',  # HLT_Mu8_v10, 0.046/pb
+        '304199-304200',  # HLT_Mu8_v10, 0.004/pb
+        '304204-304204',  # HLT_Mu8_v10, 0.006/pb
+        '304209-304209',  # HLT_Mu8_v10, 0.005/pb
+        '304291-304292',  # HLT_Mu8_v10, 0.021/pb
+        '304333-304333',  # HLT_Mu8_v10, 0.019/pb
+        '304354-304354',  # HLT_Mu8_v10, 0.002/pb
+        '304366-304366',  # HLT_Mu8_v10, 0.021/pb
+        '304446-304447',  # HLT_Mu8_v10, 0.022/pb
+        '304451-304451',  # HLT_Mu8_v10, 0.001/pb
+        '304505-304508',  # HLT_Mu8_v10, 0.022/pb
+        '304562-304562',  # HLT_Mu8_v10, 0.013/pb
+        '304616-304616',  # HLT_Mu8_v10, 0.011/pb
+        '304625-304626',  # HLT_Mu8_v10, 0.004/pb
+        '304654-304655',  # HLT_Mu8_v10, 0.021/pb
+        '304661-304663',  # HLT_Mu8_v10, 0.011/pb
+        '304671-304672',  # HLT_Mu8_v10, 0.014/pb
+        '304737-304740',  # HLT_Mu8_v10, 0.026/pb
+        '304776-304778',  # HLT_Mu8_v10, 0.022/pb
+        '304797-304797',  # HLT_Mu8_v10, 0.036/pb
+        '305044-305046',  # HLT_Mu8_v10, 0.027/pb
+        '305059-305059',  # HLT_Mu8_v10, 0.005/pb
+        '305062-305064',  # HLT_Mu8_v10, 0.028/pb
+        '305081-305081',  # HLT_Mu8_v10, 0.012/pb
+        '305112-305114',  # HLT_Mu8_v10, 0.025/pb
+        '305178-305184',  # HLT_Mu8_v10, 0.006/pb
+        '305186-305186',  # HLT_Mu8_v10, 0.004/pb
+        '305188-305188',  # HLT_Mu8_v10, 0.03/pb
+        '305202-305202',  # HLT_Mu8_v10, 0.006/pb
+        '305204-305204',  # HLT_Mu8_v10, 0.015/pb
+        '305207-305208',  # HLT_Mu8_v10, 0.016/pb
+        '305234-305234',  # HLT_Mu8_v10, 0.0/pb
+        '305236-305237',  # HLT_Mu8_v10, 0.014/pb
+        '305247-305248',  # HLT_Mu8_v10, 0.016/pb
+        '305252-305252',  # HLT_Mu8_v10, 0.007/pb
+        '305282-305282',  # HLT_Mu8_v10, 0.001/pb
+        '305310-305314',  # HLT_Mu8_v10, 0.023/pb
+        '305336-305336',  # HLT_Mu8_v10, 0.002/pb
+        '305338-305338',  # HLT_Mu8_v10, 0.001/pb
+        '305341-305341',  # HLT_Mu8_v10, 0.005/pb
+        '305349-305351',  # HLT_Mu8_v10, 0.012/pb
+        '305358-305358',  # HLT_Mu8_v10, 0.001/pb
+        '305364-305366',  # HLT_Mu8_v10, 0.026/pb
+        '305376-305377',  # HLT_Mu8_v10, 0.019/pb
+        '305405-305406',  # HLT_Mu8_v10, 0.024/pb
+        '305440-305441',  # HLT_Mu8_v10, 0.005/pb
+        '305516-305518',  # HLT_Mu8_v10, 0.022/pb
+        '305586-305586',  # HLT_Mu8_v10, 0.007/pb
+        '305589-305590',  # HLT_Mu8_v10, 0.021/pb
+        '305636-305636',  # HLT_Mu8_v10, 0.029/pb
+        '305766-305766',  # HLT_Mu8_v10, 0.011/pb
+        '305809-305809',  # HLT_Mu8_v10, 0.002/pb
+        '305814-305814',  # HLT_Mu8_v10, 0.023/pb
+        '305821-305821',  # HLT_Mu8_v10, 0.01/pb
+        '305832-305832',  # HLT_Mu8_v10, 0.002/pb
+        '305840-305840',  # HLT_Mu8_v10, 0.014/pb
+        '305842-305842',  # HLT_Mu8_v10, 0.011/pb
+        '305862-305862',  # HLT_Mu8_v10, 0.008/pb
+        '305898-305898',  # HLT_Mu8_v10, 0.009/pb
+        '305902-305902',  # HLT_Mu8_v10, 0.006/pb
+        '305967-305967',  # HLT_Mu8_v10, 0.0/pb
+        '306029-306030',  # HLT_Mu8_v10, 0.002/pb
+        '306036-306038',  # HLT_Mu8_v10, 0.002/pb
+        '306041-306042',  # HLT_Mu8_v10, 0.008/pb
+        '306048-306049',  # HLT_Mu8_v10, 0.006/pb
+        '306051-306051',  # HLT_Mu8_v10, 0.005/pb
+        '306091-306092',  # HLT_Mu8_v10, 0.014/pb
+        '306095-306095',  # HLT_Mu8_v10, 0.004/pb
+        '306121-306122',  # HLT_Mu8_v10, 0.003/pb
+        '306125-306126',  # HLT_Mu8_v10, 0.043/pb
+        '306134-306135',  # HLT_Mu8_v10, 0.014/pb
+        '306138-306139',  # HLT_Mu8_v10, 0.033/pb
+        '306153-306155',  # HLT_Mu8_v10, 0.034/pb
+        '306169-306171',  # HLT_Mu8_v10, 0.02/pb
+        '306418-306420',  # HLT_Mu8_v11, 0.003/pb
+        '306422-306423',  # HLT_Mu8_v11, 0.005/pb
+        '306432-306432',  # HLT_Mu8_v11, 0.002/pb
+        '306454-306460',  # HLT_Mu8_v11, 0.048/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu17"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(17.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(592.9), # L=70.038/pb; present in all eras; prescale factor 592.9 (600.1 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '297050-297050',  # HLT_Mu17_v5, 0.158/pb
+        '297056-297057',  # HLT_Mu17_v5, 0.24/pb
+        '297099-297101',  # HLT_Mu17_v6, 0.402/pb
+        '297113-297114',  # HLT_Mu17_v6, 0.142/pb
+        '297175-297178',  # HLT_Mu17_v6, 0.468/pb
+        '297215-297215',  # HLT_Mu17_v6, 0.02/pb
+        '297218-297219',  # HLT_Mu17_v6, 0.709/pb
+        '297224-297225',  # HLT_Mu17_v6, 0.023/pb
+        '297227-297227',  # HLT_Mu17_v6, 0.026/pb
+        '297292-297293',  # HLT_Mu17_v6, 0.331/pb
+        '297296-297296',  # HLT_Mu17_v6, 0.14/pb
+        '297308-297308',  # HLT_Mu17_v6, 0.01/pb
+        '297359-297359',  # HLT_Mu17_v6, 0.022/pb
+        '297411-297411',  # HLT_Mu17_v6, 0.336/pb
+        '297424-297426',  # HLT_Mu17_v6, 0.162/pb
+        '297429-297435',  # HLT_Mu17_v6, 0.332/pb
+        '297467-297469',  # HLT_Mu17_v6, 0.116/pb
+        '297483-297488',  # HLT_Mu17_v6, 0.786/pb
+        '297503-297505',  # HLT_Mu17_v6, 0.447/pb
+        '297557-297558',  # HLT_Mu17_v7, 0.265/pb
+        '297562-297563',  # HLT_Mu17_v7, 0.178/pb
+        '297598-297599',  # HLT_Mu17_v7, 0.156/pb
+        '297603-297606',  # HLT_Mu17_v7, 0.461/pb
+        '297620-297620',  # HLT_Mu17_v7, 0.137/pb
+        '297656-297656',  # HLT_Mu17_v7, 0.155/pb
+        '297665-297666',  # HLT_Mu17_v7, 0.131/pb
+        '297670-297670',  # HLT_Mu17_v7, 0.004/pb
+        '297674-297675',  # HLT_Mu17_v7, 0.285/pb
+        '297722-297723',  # HLT_Mu17_v7, 0.238/pb
+        '298996-298997',  # HLT_Mu17_v7, 0.043/pb
+        '299000-299000',  # HLT_Mu17_v7, 0.013/pb
+        '299042-299042',  # HLT_Mu17_v7, 0.003/pb
+        '299061-299062',  # HLT_Mu17_v7, 0.206/pb
+        '299064-299065',  # HLT_Mu17_v7, 0.122/pb
+        '299067-299067',  # HLT_Mu17_v7, 0.115/pb
+        '299096-299096',  # HLT_Mu17_v7, 0.04/pb
+        '299149-299149',  # HLT_Mu17_v7, 0.18/pb
+        '299178-299178',  # HLT_Mu17_v7, 0.026/pb
+        '299180-299180',  # HLT_Mu17_v7, 0.026/pb
+        '299184-299185',  # HLT_Mu17_v7, 0.245/pb
+        '299327-299327',  # HLT_Mu17_v7, 0.025/pb
+        '299329-299329',  # HLT_Mu17_v7, 0.062/pb
+        '299368-299370',  # HLT_Mu17_v8, 0.328/pb
+        '299380-299381',  # HLT_Mu17_v8, 0.072/pb
+        '299394-299396',  # HLT_Mu17_v8, 0.057/pb
+        '299420-299420',  # HLT_Mu17_v8, 0.011/pb
+        '299443-299443',  # HLT_Mu17_v8, 0.005/pb
+        '299450-299450',  # HLT_Mu17_v8, 0.01/pb
+        '299477-299481',  # HLT_Mu17_v8, 0.659/pb
+        '299593-299595',  # HLT_Mu17_v8, 0.401/pb
+        '299597-299597',  # HLT_Mu17_v8, 0.142/pb
+        '299649-299649',  # HLT_Mu17_v8, 0.057/pb
+        '300087-300087',  # HLT_Mu17_v9, 0.021/pb
+        '300105-300107',  # HLT_Mu17_v9, 0.028/pb
+        '300117-300117',  # HLT_Mu17_v9, 0.005/pb
+        '300122-300123',  # HLT_Mu17_v9, 0.558/pb
+        '300155-300157',  # HLT_Mu17_v9, 0.683/pb
+        '300226-300226',  # HLT_Mu17_v9, 0.088/pb
+        '300233-300240',  # HLT_Mu17_v9, 0.606/pb
+        '300280-300284',  # HLT_Mu17_v9, 0.421/pb
+        '300364-300375',  # HLT_Mu17_v9, 0.067/pb
+        '300389-300401',  # HLT_Mu17_v9, 0.517/pb
+        '300459-300459',  # HLT_Mu17_v9, 0.068/pb
+        '300461-300464',  # HLT_Mu17_v9, 0.198/pb
+        '300466-300467',  # HLT_Mu17_v9, 0.337/pb
+        '300497-300497',  # HLT_Mu17_v9, 0.045/pb
+        '300514-300517',  # HLT_Mu17_v9, 0.516/pb
+        '300558-300558',  # HLT_Mu17_v9, 0.199/pb
+        '300560-300560',  # HLT_Mu17_v9, 0.234/pb
+        '300574-300576',  # HLT_Mu17_v9, 0.461/pb
+        '300631-300633',  # HLT_Mu17_v9, 0.173/pb
+        '300635-300636',  # HLT_Mu17_v9, 0.52/pb
+        '300673-300676',  # HLT_Mu17_v9, 0.019/pb
+        '300742-300742',  # HLT_Mu17_v9, 0.07/pb
+        '300777-300777',  # HLT_Mu17_v9, 0.135/pb
+        '300780-300780',  # HLT_Mu17_v9, 0.132/pb
+        '300785-300785',  # HLT_Mu17_v9, 0.355/pb
+        '300806-300806',  # HLT_Mu17_v9, 0.062/pb
+        '300811-300812',  # HLT_Mu17_v9, 0.161/pb
+        '300816-300817',  # HLT_Mu17_v9, 0.224/pb
+        '301046-301046',  # HLT_Mu17_v9, 0.03/pb
+        '301141-301142',  # HLT_Mu17_v9, 0.341/pb
+        '301161-301161',  # HLT_Mu17_v9, 0.287/pb
+        '301165-301165',  # HLT_Mu17_v9, 0.055/pb
+        '301179-301180',  # HLT_Mu17_v9, 0.035/pb
+        '301183-301183',  # HLT_Mu17_v9, 0.105/pb
+        '301281-301281',  # HLT_Mu17_v9, 0.043/pb
+        '301283-301283',  # HLT_Mu17_v9, 0.335/pb
+        '301298-301298',  # HLT_Mu17_v9, 0.303/pb
+        '301323-301323',  # HLT_Mu17_v9, 0.33/pb
+        '301330-301330',  # HLT_Mu17_v9, 0.111/pb
+        '301359-301359',  # HLT_Mu17_v9, 0.099/pb
+        '301384-301384',  # HLT_Mu17_v9, 0.163/pb
+        '301391-301393',  # HLT_Mu17_v9, 0.29/pb
+        '301396-301399',  # HLT_Mu17_v9, 0.22/pb
+        '301417-301417',  # HLT_Mu17_v9, 0.117/pb
+        '301447-301450',  # HLT_Mu17_v9, 0.393/pb
+        '301461-301461',  # HLT_Mu17_v9, 0.185/pb
+        '301472-301472',  # HLT_Mu17_v9, 0.271/pb
+        '301475-301476',  # HLT_Mu17_v9, 0.225/pb
+        '301519-301519',  # HLT_Mu17_v9, 0.063/pb
+        '301524-301524',  # HLT_Mu17_v9, 0.096/pb
+        '301529-301532',  # HLT_Mu17_v9, 0.247/pb
+        '301567-301567',  # HLT_Mu17_v9, 0.12/pb
+        '301627-301627',  # HLT_Mu17_v9, 0.286/pb
+        '301664-301665',  # HLT_Mu17_v9, 0.305/pb
+        '301694-301694',  # HLT_Mu17_v9, 0.019/pb
+        '301912-301914',  # HLT_Mu17_v9, 0.186/pb
+        '301941-301941',  # HLT_Mu17_v9, 0.173/pb
+        '301959-301960',  # HLT_Mu17_v9, 0.566/pb
+        '301970-301970',  # HLT_Mu17_v9, 0.039/pb
+        '301984-301987',  # HLT_Mu17_v9, 0.584/pb
+        '301997-301998',  # HLT_Mu17_v9, 0.565/pb
+        '302019-302019',  # HLT_Mu17_v9, 0.016/pb
+        '302026-302026',  # HLT_Mu17_v10, 0.008/pb
+        '302029-302029',  # HLT_Mu17_v10, 0.026/pb
+        '302031-302031',  # HLT_Mu17_v10, 0.288/pb
+        '302033-302034',  # HLT_Mu17_v10, 0.02/pb
+        '302037-302038',  # HLT_Mu17_v10, 0.0/pb
+        '302040-302043',  # HLT_Mu17_v10, 0.38/pb
+        '302131-302131',  # HLT_Mu17_v10, 0.35/pb
+        '302159-302159',  # HLT_Mu17_v10, 0.037/pb
+        '302163-302163',  # HLT_Mu17_v10, 0.448/pb
+        '302165-302166',  # HLT_Mu17_v10, 0.03/pb
+        '302225-302225',  # HLT_Mu17_v10, 0.32/pb
+        '302228-302229',  # HLT_Mu17_v10, 0.245/pb
+        '302240-302240',  # HLT_Mu17_v10, 0.371/pb
+        '302262-302263',  # HLT_Mu17_v10, 0.643/pb
+        '302277-302277',  # HLT_Mu17_v10, 0.125/pb
+        '302279-302280',  # HLT_Mu17_v10, 0.124/pb
+        '302322-302322',  # HLT_Mu17_v10, 0.334/pb
+        '302328-302328',  # HLT_Mu17_v10, 0.25/pb
+        '302337-302337',  # HLT_Mu17_v10, 0.039/pb
+        '302342-302344',  # HLT_Mu17_v10, 0.212/pb
+        '302350-302350',  # HLT_Mu17_v10, 0.059/pb
+        '302388-302388',  # HLT_Mu17_v10, 0.232/pb
+        '302392-302393',  # HLT_Mu17_v10, 0.44/pb
+        '302448-302448',  # HLT_Mu17_v10, 0.712/pb
+        '302472-302476',  # HLT_Mu17_v10, 0.615/pb
+        '302479-302479',  # HLT_Mu17_v10, 0.115/pb
+        '302484-302485',  # HLT_Mu17_v10, 0.395/pb
+        '302492-302494',  # HLT_Mu17_v10, 0.432/pb
+        '302509-302509',  # HLT_Mu17_v10, 0.007/pb
+        '302513-302513',  # HLT_Mu17_v10, 0.017/pb
+        '302522-302523',  # HLT_Mu17_v10, 0.019/pb
+        '302525-302526',  # HLT_Mu17_v10, 0.446/pb
+        '302548-302548',  # HLT_Mu17_v10, 0.027/pb
+        '302551-302551',  # HLT_Mu17_v10, 0.0/pb
+        '302553-302555',  # HLT_Mu17_v10, 0.067/pb
+        '302563-302563',  # HLT_Mu17_v10, 0.0/pb
+        '302565-302565',  # HLT_Mu17_v10, 0.0/pb
+        '302572-302573',  # HLT_Mu17_v10, 0.557/pb
+        '302596-302597',  # HLT_Mu17_v10, 0.743/pb
+        '302634-302635',  # HLT_Mu17_v10, 0.673/pb
+        '302651-302651',  # HLT_Mu17_v10, 0.052/pb
+        '302654-302654',  # HLT_Mu17_v10, 0.11/pb
+        '302661-302661',  # HLT_Mu17_v10, 0.016/pb
+        '302663-302663',  # HLT_Mu17_v10, 0.346/pb
+        '303825-303825',  # HLT_Mu17_v10, 0.069/pb
+        '303832-303832',  # HLT_Mu17_v10, 0.665/pb
+        '303838-303838',  # HLT_Mu17_v10, 0.712/pb
+        '303885-303885',  # HLT_Mu17_v10, 0.69/pb
+        '303948-303948',  # HLT_Mu17_v10, 0.572/pb
+        '303998-304000',  # HLT_Mu17_v10, 0.372/pb
+        '304062-304062',  # HLT_Mu17_v10, 0.723/pb
+        '304119-304120',  # HLT_Mu17_v10, 0.098/pb
+        '304125-304125',  # HLT_Mu17_v10, 0.67/pb
+        '304144-304144',  # HLT_Mu17_v10, 0.941/pb
+        '304158-304158',  # HLT_Mu17_v10, 0.811/pb
+        '304169-304170',  # HLT_Mu17_v10, 1.357/pb
+        '304199-304200',  # HLT_Mu17_v10, 0.112/pb
+        '304204-304204',  # HLT_Mu17_v10, 0.181/pb
+        '304209-304209',  # HLT_Mu17_v10, 0.127/pb
+        '304291-304292',  # HLT_Mu17_v10, 0.594/pb
+        '304333-304333',  # HLT_Mu17_v10, 0.521/pb
+        '304354-304354',  # HLT_Mu17_v10, 0.053/pb
+        '304366-304366',  # HLT_Mu17_v10, 0.604/pb
+        '304446-304447',  # HLT_Mu17_v10, 0.623/pb
+        '304451-304451',  # HLT_Mu17_v10, 0.026/pb
+        '304505-304508',  # HLT_Mu17_v10, 0.633/pb
+        '304562-304562',  # HLT_Mu17_v10, 0.356/pb
+        '304616-304616',  # HLT_Mu17_v10, 0.296/pb
+        '304625-304626',  # HLT_Mu17_v10, 0.113/pb
+        '304654-304655',  # HLT_Mu17_v10, 0.593/pb
+        '304661-304663',  # HLT_Mu17_v10, 0.31/pb
+        '304671-304672',  # HLT_Mu17_v10, 0.38/pb
+        '304737-304740',  # HLT_Mu17_v10, 0.751/pb
+        '304776-304778',  # HLT_Mu17_v10, 0.609/pb
+        '304797-304797',  # HLT_Mu17_v10, 1.048/pb
+        '305044-305046',  # HLT_Mu17_v10, 0.787/pb
+        '305059-305059',  # HLT_Mu17_v10, 0.122/pb
+        '305062-305064',  # HLT_Mu17_v10, 0.757/pb
+        '305081-305081',  # HLT_Mu17_v10, 0.322/pb
+        '305112-305114',  # HLT_Mu17_v10, 0.696/pb
+        '305178-305184',  # HLT_Mu17_v10, 0.077/pb
+        '305186-305186',  # HLT_Mu17_v10, 0.116/pb
+        '305188-305188',  # HLT_Mu17_v10, 0.89/pb
+        '305202-305202',  # HLT_Mu17_v10, 0.167/pb
+        '305204-305204',  # HLT_Mu17_v10, 0.434/pb
+        '305207-305208',  # HLT_Mu17_v10, 0.433/pb
+        '305234-305234',  # HLT_Mu17_v10, 0.011/pb
+        '305236-305237',  # HLT_Mu17_v10, 0.394/pb
+        '305247-305248',  # HLT_Mu17_v10, 0.433/pb
+        '305252-305252',  # HLT_Mu17_v10, 0.198/pb
+        '305282-305282',  # HLT_Mu17_v10, 0.04/pb
+        '305310-305314',  # HLT_Mu17_v10, 0.655/pb
+        '305336-305336',  # HLT_Mu17_v10, 0.051/pb
+        '305338-305338',  # HLT_Mu17_v10, 0.025/pb
+        '305341-305341',  # HLT_Mu17_v10, 0.131/pb
+        '305349-305351',  # HLT_Mu17_v10, 0.339/pb
+        '305358-305358',  # HLT_Mu17_v10, 0.038/pb
+        '305364-305366',  # HLT_Mu17_v10, 0.742/pb
+        '305376-305377',  # HLT_Mu17_v10, 0.539/pb
+        '305405-305406',  # HLT_Mu17_v10, 0.631/pb
+        '305440-305441',  # HLT_Mu17_v10, 0.092/pb
+        '305516-305518',  # HLT_Mu17_v10, 0.579/pb
+        '305586-305586',  # HLT_Mu17_v10, 0.133/pb
+        '305589-305590',  # HLT_Mu17_v10, 0.621/pb
+        '305636-305636',  # HLT_Mu17_v10, 0.77/pb
+        '305766-305766',  # HLT_Mu17_v10, 0.223/pb
+        '305809-305809',  # HLT_Mu17_v10, 0.035/pb
+        '305814-305814',  # HLT_Mu17_v10, 0.605/pb
+        '305821-305821',  # HLT_Mu17_v10, 0.199/pb
+        '305832-305832',  # HLT_Mu17_v10, 0.045/pb
+        '305840-305840',  # HLT_Mu17_v10, 0.395/pb
+        '305842-305842',  # HLT_Mu17_v10, 0.331/pb
+        '305862-305862',  # HLT_Mu17_v10, 0.158/pb
+        '305898-305898',  # HLT_Mu17_v10, 0.184/pb
+        '305902-305902',  # HLT_Mu17_v10, 0.119/pb
+        '305967-305967',  # HLT_Mu17_v10, 0.008/pb
+        '306029-306030',  # HLT_Mu17_v10, 0.034/pb
+        '306036-306038',  # HLT_Mu17_v10, 0.043/pb
+        '306041-306042',  # HLT_Mu17_v10, 0.189/pb
+        '306048-306049',  # HLT_Mu17_v10, 0.175/pb
+        '306051-306051',  # HLT_Mu17_v10, 0.149/pb
+        '306091-306092',  # HLT_Mu17_v10, 0.367/pb
+        '306095-306095',  # HLT_Mu17_v10, 0.112/pb
+        '306121-306122',  # HLT_Mu17_v10, 0.053/pb
+        '306125-306126',  # HLT_Mu17_v10, 1.226/pb
+        '306134-306135',  # HLT_Mu17_v10, 0.308/pb
+        '306138-306139',  # HLT_Mu17_v10, 1.012/pb
+        '306153-306155',  # HLT_Mu17_v10, 0.931/pb
+        '306169-306171',  # HLT_Mu17_v10, 0.605/pb
+        '306418-306420',  # HLT_Mu17_v11, 0.056/pb
+        '306422-306423',  # HLT_Mu17_v11, 0.131/pb
+        '306432-306432',  # HLT_Mu17_v11, 0.074/pb
+        '306454-306460',  # HLT_Mu17_v11, 1.275/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu20"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(20.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(72.3), # L=574.1/pb; present in all eras; prescale factor 72.3 (73.9 from delivery)
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+        '297050-297050',  # HLT_Mu20_v5, 15.787/pb
+        '297056-297057',  # HLT_Mu20_v5, 23.957/pb
+        '297099-297101',  # HLT_Mu20_v6, 40.249/pb
+        '297113-297114',  # HLT_Mu20_v6, 14.167/pb
+        '297175-297178',  # HLT_Mu20_v6, 46.764/pb
+        '297215-297215',  # HLT_Mu20_v6, 0.017/pb
+        '297218-297219',  # HLT_Mu20_v6, 70.562/pb
+        '297224-297225',  # HLT_Mu20_v6, 2.302/pb
+        '297227-297227',  # HLT_Mu20_v6, 2.612/pb
+        '297292-297293',  # HLT_Mu20_v6, 33.113/pb
+        '297296-297296',  # HLT_Mu20_v6, 14.034/pb
+        '297308-297308',  # HLT_Mu20_v6, 1.05/pb
+        '297359-297359',  # HLT_Mu20_v6, 0.019/pb
+        '297411-297411',  # HLT_Mu20_v6, 33.596/pb
+        '297424-297426',  # HLT_Mu20_v6, 3.995/pb
+        '297429-297435',  # HLT_Mu20_v6, 33.198/pb
+        '297467-297469',  # HLT_Mu20_v6, 0.097/pb
+        '297483-297488',  # HLT_Mu20_v6, 72.381/pb
+        '297503-297505',  # HLT_Mu20_v6, 44.741/pb
+        '297557-297558',  # HLT_Mu20_v7, 14.995/pb
+        '297562-297563',  # HLT_Mu20_v7, 17.798/pb
+        '297598-297599',  # HLT_Mu20_v7, 11.334/pb
+        '297603-297606',  # HLT_Mu20_v7, 29.809/pb
+        '297620-297620',  # HLT_Mu20_v7, 0.114/pb
+        '297656-297656',  # HLT_Mu20_v7, 0.129/pb
+        '297665-297666',  # HLT_Mu20_v7, 0.131/pb
+        '297670-297670',  # HLT_Mu20_v7, 0.003/pb
+        '297674-297675',  # HLT_Mu20_v7, 0.241/pb
+        '297722-297723',  # HLT_Mu20_v7, 0.198/pb
+        '298996-298997',  # HLT_Mu20_v7, 0.053/pb
+        '299000-299000',  # HLT_Mu20_v7, 0.018/pb
+        '299042-299042',  # HLT_Mu20_v7, 0.004/pb
+        '299061-299062',  # HLT_Mu20_v7, 0.193/pb
+        '299064-299065',  # HLT_Mu20_v7, 0.122/pb
+        '299067-299067',  # HLT_Mu20_v7, 0.151/pb
+        '299096-299096',  # HLT_Mu20_v7, 0.033/pb
+        '299149-299149',  # HLT_Mu20_v7, 0.15/pb
+        '299178-299178',  # HLT_Mu20_v7, 0.022/pb
+        '299180-299180',  # HLT_Mu20_v7, 0.022/pb
+        '299184-299185',  # HLT_Mu20_v7, 0.231/pb
+        '299327-299327',  # HLT_Mu20_v7, 0.024/pb
+        '299329-299329',  # HLT_Mu20_v7, 0.062/pb
+        '299368-299370',  # HLT_Mu20_v8, 0.408/pb
+        '299380-299381',  # HLT_Mu20_v8, 0.081/pb
+        '299394-299396',  # HLT_Mu20_v8, 0.082/pb
+        '299420-299420',  # HLT_Mu20_v8, 0.018/pb
+        '299443-299443',  # HLT_Mu20_v8, 0.008/pb
+        '299450-299450',  # HLT_Mu20_v8, 0.017/pb
+        '299477-299481',  # HLT_Mu20_v8, 1.176/pb
+        '299593-299595',  # HLT_Mu20_v8, 0.443/pb
+        '299597-299597',  # HLT_Mu20_v8, 0.158/pb
+        '299649-299649',  # HLT_Mu20_v8, 0.069/pb
+        '300087-300087',  # HLT_Mu20_v9, 0.093/pb
+        '300105-300107',  # HLT_Mu20_v9, 0.047/pb
+        '300117-300117',  # HLT_Mu20_v9, 0.008/pb
+        '300122-300123',  # HLT_Mu20_v9, 0.721/pb
+        '300155-300157',  # HLT_Mu20_v9, 0.89/pb
+        '300226-300226',  # HLT_Mu20_v9, 0.147/pb
+        '300233-300240',  # HLT_Mu20_v9, 0.776/pb
+        '300280-300284',  # HLT_Mu20_v9, 2.006/pb
+        '300364-300375',  # HLT_Mu20_v9, 0.099/pb
+        '300389-300401',  # HLT_Mu20_v9, 0.605/pb
+        '300459-300459',  # HLT_Mu20_v9, 0.113/pb
+        '300461-300464',  # HLT_Mu20_v9, 0.21/pb
+        '300466-300467',  # HLT_Mu20_v9, 0.449/pb
+        '300497-300497',  # HLT_Mu20_v9, 0.044/pb
+        '300514-300517',  # HLT_Mu20_v9, 0.634/pb
+        '300558-300558',  # HLT_Mu20_v9, 0.213/pb
+        '300560-300560',  # HLT_Mu20_v9, 0.317/pb
+        '300574-300576',  # HLT_Mu20_v9, 0.519/pb
+        '300631-300633',  # HLT_Mu20_v9, 0.239/pb
+        '300635-300636',  # HLT_Mu20_v9, 0.643/pb
+        '300673-300676',  # HLT_Mu20_v9, 0.032/pb
+        '300742-300742',  # HLT_Mu20_v9, 0.117/pb
+        '300777-300777',  # HLT_Mu20_v9, 0.186/pb
+        '300780-300780',  # HLT_Mu20_v9, 0.128/pb
+        '300785-300785',  # HLT_Mu20_v9, 0.457/pb
+        '300806-300806',  # HLT_Mu20_v9, 0.06/pb
+        '300811-300812',  # HLT_Mu20_v9, 0.213/pb
+        '300816-300817',  # HLT_Mu20_v9, 0.23/pb
+        '301046-301046',  # HLT_Mu20_v9, 0.001/pb
+        '301141-301142',  # HLT_Mu20_v9, 0.005/pb
+        '301161-301161',  # HLT_Mu20_v9, 0.004/pb
+        '301165-301165',  # HLT_Mu20_v9, 0.001/pb
+        '301179-301180',  # HLT_Mu20_v9, 0.0/pb
+        '301183-301183',  # HLT_Mu20_v9, 0.001/pb
+        '301281-301281',  # HLT_Mu20_v9, 0.0/pb
+        '301283-301283',  # HLT_Mu20_v9, 0.004/pb
+        '301298-301298',  # HLT_Mu20_v9, 0.003/pb
+        '301323-301323',  # HLT_Mu20_v9, 0.003/pb
+        '301330-301330',  # HLT_Mu20_v9, 0.001/pb
+        '301359-301359',  # HLT_Mu20_v9, 0.001/pb
+        '301384-301384',  # HLT_Mu20_v9, 0.001/pb
+        '301391-301393',  # HLT_Mu20_v9, 0.002/pb
+        '301396-301399',  # HLT_Mu20_v9, 0.005/pb
+        '301417-301417',  # HLT_Mu20_v9, 0.001/pb
+        '301447-301450',  # HLT_Mu20_v9, 0.006/pb
+        '301461-301461',  # HLT_Mu20_v9, 0.002/pb
+        '301472-301472',  # HLT_Mu20_v9, 0.002/pb
+        '301475-301476',  # HLT_Mu20_v9, 0.006/pb
+        '301519-301519',  # HLT_Mu20_v9, 0.001/pb
+        '301524-301524',  # HLT_Mu20_v9, 0.001/pb
+        '301529-301532',  # HLT_Mu20_v9, 0.007/pb
+        '301567-301567',  # HLT_Mu20_v9, 0.001/pb
+        '301627-301627',  # HLT_Mu20_v9, 0.003/pb
+        '301664-301665',  # HLT_Mu20_v9, 0.003/pb
+        '301694-301694',  # HLT_Mu20_v9, 0.014/pb
+        '301912-301914',  # HLT_Mu20_v9, 0.002/pb
+        '301941-301941',  # HLT_Mu20_v9, 0.002/pb
+        '301959-301960',  # HLT_Mu20_v9, 0.01/pb
+        '301970-301970',  # HLT_Mu20_v9, 0.0/pb
+        '301984-301987',  # HLT_Mu20_v9, 0.011/pb
+        '301997-301998',  # HLT_Mu20_v9, 0.01/pb
+        '302019-302019',  # HLT_Mu20_v9, 0.0/pb
+        '302026-302026',  # HLT_Mu20_v10, 0.006/pb
+        '302029-302029',  # HLT_Mu20_v10, 0.019/pb
+        '302031-302031',  # HLT_Mu20_v10, 0.198/pb
+        '302033-302034',  # HLT_Mu20_v10, 0.014/pb
+        '302037-302038',  # HLT_Mu20_v10, 0.0/pb
+        '302040-302043',  # HLT_Mu20_v10, 0.263/pb
+        '302131-302131',  # HLT_Mu20_v10, 0.241/pb
+        '302159-302159',  # HLT_Mu20_v10, 0.026/pb
+        '302163-302163',  # HLT_Mu20_v10, 0.308/pb
+        '302165-302166',  # HLT_Mu20_v10, 0.021/pb
+        '302225-302225',  # HLT_Mu20_v10, 0.22/pb
+        '302228-302229',  # HLT_Mu20_v10, 0.168/pb
+        '302240-302240',  # HLT_Mu20_v10, 0.255/pb
+        '302262-302263',  # HLT_Mu20_v10, 0.444/pb
+        '302277-302277',  # HLT_Mu20_v10, 0.085/pb
+        '302279-302280',  # HLT_Mu20_v10, 0.088/pb
+        '302322-302322',  # HLT_Mu20_v10, 0.231/pb
+        '302328-302328',  # HLT_Mu20_v10, 0.171/pb
+        '302337-302337',  # HLT_Mu20_v10, 0.028/pb
+        '302342-302344',  # HLT_Mu20_v10, 0.145/pb
+        '302350-302350',  # HLT_Mu20_v10, 0.041/pb
+        '302388-302388',  # HLT_Mu20_v10, 0.166/pb
+        '302392-302393',  # HLT_Mu20_v10, 0.312/pb
+        '302448-302448',  # HLT_Mu20_v10, 0.496/pb
+        '302472-302476',  # HLT_Mu20_v10, 0.433/pb
+        '302479-302479',  # HLT_Mu20_v10, 0.084/pb
+        '302484-302485',  # HLT_Mu20_v10, 0.281/pb
+        '302492-302494',  # HLT_Mu20_v10, 0.341/pb
+        '302509-302509',  # HLT_Mu20_v10, 0.005/pb
+        '302513-302513',  # HLT_Mu20_v10, 0.013/pb
+        '302522-302523',  # HLT_Mu20_v10, 0.014/pb
+        '302525-302526',  # HLT_Mu20_v10, 0.313/pb
+        '302548-302548',  # HLT_Mu20_v10, 0.019/pb
+        '302551-302551',  # HLT_Mu20_v10, 0.001/pb
+        '302553-302555',  # HLT_Mu20_v10, 0.05/pb
+        '302563-302563',  # HLT_Mu20_v10, 0.0/pb
+        '302565-302565',  # HLT_Mu20_v10, 0.001/pb
+        '302572-302573',  # HLT_Mu20_v10, 0.387/pb
+        '302596-302597',  # HLT_Mu20_v10, 0.517/pb
+        '302634-302635',  # HLT_Mu20_v10, 0.471/pb
+        '302651-302651',  # HLT_Mu20_v10, 0.038/pb
+        '302654-302654',  # HLT_Mu20_v10, 0.08/pb
+        '302661-302661',  # HLT_Mu20_v10, 0.012/pb
+        '302663-302663',  # HLT_Mu20_v10, 0.241/pb
+        '303825-303825',  # HLT_Mu20_v10, 0.047/pb
+        '303832-303832',  # HLT_Mu20_v10, 0.471/pb
+        '303838-303838',  # HLT_Mu20_v10, 0.508/pb
+        '303885-303885',  # HLT_Mu20_v10, 0.496/pb
+        '303948-303948',  # HLT_Mu20_v10, 0.416/pb
+        '303998-304000',  # HLT_Mu20_v10, 0.276/pb
+        '304062-304062',  # HLT_Mu20_v10, 0.516/pb
+        '304119-304120',  # HLT_Mu20_v10, 0.074/pb
+        '304125-304125',  # HLT_Mu20_v10, 0.476/pb
+        '304144-304144',  # HLT_Mu20_v10, 0.674/pb
+        '304158-304158',  # HLT_Mu20_v10, 0.568/pb
+        '304169-304170',  # HLT_Mu20_v10, 0.969/pb
+        '304199-304200',  # HLT_Mu20_v10, 0.085/pb
+        '304204-304204',  # HLT_Mu20_v10, 0.135/pb
+        '304209-304209',  # HLT_Mu20_v10, 0.095/pb
+        '304291-304292',  # HLT_Mu20_v10, 0.425/pb
+        '304333-304333',  # HLT_Mu20_v10, 0.381/pb
+        '304354-304354',  # HLT_Mu20_v10, 0.041/pb
+        '304366-304366',  # HLT_Mu20_v10, 0.438/pb
+        '304446-304447',  # HLT_Mu20_v10, 0.451/pb
+        '304451-304451',  # HLT_Mu20_v10, 0.018/pb
+        '304505-304508',  # HLT_Mu20_v10, 0.459/pb
+        '304562-304562',  # HLT_Mu20_v10, 0.257/pb
+        '304616-304616',  # HLT_Mu20_v10, 0.221/pb
+        '304625-304626',  # HLT_Mu20_v10, 0.085/pb
+        '304654-304655',  # HLT_Mu20_v10, 0.428/pb
+        '304661-304663',  # HLT_Mu20_v10, 0.232/pb
+        '304671-304672',  # HLT_Mu20_v10, 0.283/pb
+        '304737-304740',  # HLT_Mu20_v10, 0.542/pb
+        '304776-304778',  # HLT_Mu20_v10, 0.441/pb
+        '304797-304797',  # HLT_Mu20_v10, 0.745/pb
+        '305044-305046',  # HLT_Mu20_v10, 0.552/pb
+        '305059-305059',  # HLT_Mu20_v10, 0.094/pb
+        '305062-305064',  # HLT_Mu20_v10, 0.544/pb
+        '305081-305081',  # HLT_Mu20_v10, 0.238/pb
+        '305112-305114',  # HLT_Mu20_v10, 0.501/pb
+        '305178-305184',  # HLT_Mu20_v10, 0.069/pb
+        '305186-305186',  # HLT_Mu20_v10, 0.089/pb
+        '305188-305188',  # HLT_Mu20_v10, 0.624/pb
+        '305202-305202',  # HLT_Mu20_v10, 0.127/pb
+        '305204-305204',  # HLT_Mu20_v10, 0.315/pb
+        '305207-305208',  # HLT_Mu20_v10, 0.325/pb
+        '305234-305234',  # HLT_Mu20_v10, 0.008/pb
+        '305236-305237',  # HLT_Mu20_v10, 0.289/pb
+        '305247-305248',  # HLT_Mu20_v10, 0.319/pb
+        '305252-305252',  # HLT_Mu20_v10, 0.138/pb
+        '305282-305282',  # HLT_Mu20_v10, 0.029/pb
+        '305310-305314',  # HLT_Mu20_v10, 0.473/pb
+        '305336-305336',  # HLT_Mu20_v10, 0.039/pb
+        '305338-305338',  # HLT_Mu20_v10, 0.02/pb
+        '305341-305341',  # HLT_Mu20_v10, 0.101/pb
+        '305349-305351',  # HLT_Mu20_v10, 0.243/pb
+        '305358-305358',  # HLT_Mu20_v10, 0.03/pb
+        '305364-305366',  # HLT_Mu20_v10, 0.539/pb
+        '305376-305377',  # HLT_Mu20_v10, 0.396/pb
+        '305405-305406',  # HLT_Mu20_v10, 0.449/pb
+        '305440-305441',  # HLT_Mu20_v10, 0.082/pb
+        '305516-305518',  # HLT_Mu20_v10, 0.411/pb
+        '305586-305586',  # HLT_Mu20_v10, 0.117/pb
+        '305589-305590',  # HLT_Mu20_v10, 0.4/pb
+        '305636-305636',  # HLT_Mu20_v10, 0.535/pb
+        '305766-305766',  # HLT_Mu20_v10, 0.19/pb
+        '305809-305809',  # HLT_Mu20_v10, 0.031/pb
+        '305814-305814',  # HLT_Mu20_v10, 0.428/pb
+        '305821-305821',  # HLT_Mu20_v10, 0.172/pb
+        '305832-305832',  # HLT_Mu20_v10, 0.039/pb
+        '305840-305840',  # HLT_Mu20_v10, 0.265/pb
+        '305842-305842',  # HLT_Mu20_v10, 0.205/pb
+        '305862-305862',  # HLT_Mu20_v10, 0.139/pb
+        '305898-305898',  # HLT_Mu20_v10, 0.161/pb
+        '305902-305902',  # HLT_Mu20_v10, 0.105/pb
+        '305967-305967',  # HLT_Mu20_v10, 0.007/pb
+        '306029-306030',  # HLT_Mu20_v10, 0.03/pb
+        '306036-306038',  # HLT_Mu20_v10, 0.038/pb
+        '306041-306042',  # HLT_Mu20_v10, 0.154/pb
+        '306048-306049',  # HLT_Mu20_v10, 0.114/pb
+        '306051-306051',  # HLT_Mu20_v10, 0.093/pb
+        '306091-306092',  # HLT_Mu20_v10, 0.261/pb
+        '306095-306095',  # HLT_Mu20_v10, 0.069/pb
+        '306121-306122',  # HLT_Mu20_v10, 0.047/pb
+        '306125-306126',  # HLT_Mu20_v10, 0.801/pb
+        '306134-306135',  # HLT_Mu20_v10, 0.253/pb
+        '306138-306139',  # HLT_Mu20_v10, 0.617/pb
+        '306153-306155',  # HLT_Mu20_v10, 0.637/pb
+        '306169-306171',  # HLT_Mu20_v10, 0.356/pb
+        '306418-306420',  # HLT_Mu20_v11, 0.05/pb
+        '306422-306423',  # HLT_Mu20_v11, 0.1/pb
+        '306432-306432',  # HLT_Mu20_v11, 0.046/pb
+        '306454-306460',  # HLT_Mu20_v11, 0.848/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu27"),
+      cone_minPt = cms.double(45.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(27.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(224.5), # L=184.944/pb; present in all eras; prescale factor 224.5 (216.1 from delivery)
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+        '297050-297050',  # HLT_Mu27_v6, 0.789/pb
+        '297056-297057',  # HLT_Mu27_v6, 1.198/pb
+        '297099-297101',  # HLT_Mu27_v7, 1.949/pb
+        '297113-297114',  # HLT_Mu27_v7, 0.708/pb
+        '297175-297178',  # HLT_Mu27_v7, 2.338/pb
+        '297215-297215',  # HLT_Mu27_v7, 0.039/pb
+        '297218-297219',  # HLT_Mu27_v7, 3.535/pb
+        '297224-297225',  # HLT_Mu27_v7, 0.115/pb
+        '297227-297227',  # HLT_Mu27_v7, 0.131/pb
+        '297292-297293',  # HLT_Mu27_v7, 1.656/pb
+        '297296-297296',  # HLT_Mu27_v7, 0.702/pb
+        '297308-297308',  # HLT_Mu27_v7, 0.052/pb
+        '297359-297359',  # HLT_Mu27_v7, 0.044/pb
+        '297411-297411',  # HLT_Mu27_v7, 1.68/pb
+        '297424-297426',  # HLT_Mu27_v7, 0.43/pb
+        '297429-297435',  # HLT_Mu27_v7, 1.66/pb
+        '297467-297469',  # HLT_Mu27_v7, 0.222/pb
+        '297483-297488',  # HLT_Mu27_v7, 3.735/pb
+        '297503-297505',  # HLT_Mu27_v7, 2.237/pb
+        '297557-297558',  # HLT_Mu27_v8, 0.965/pb
+        '297562-297563',  # HLT_Mu27_v8, 0.89/pb
+        '297598-297599',  # HLT_Mu27_v8, 0.648/pb
+        '297603-297606',  # HLT_Mu27_v8, 2.306/pb
+        '297620-297620',  # HLT_Mu27_v8, 0.261/pb
+        '297656-297656',  # HLT_Mu27_v8, 0.296/pb
+        '297665-297666',  # HLT_Mu27_v8, 0.653/pb
+        '297670-297670',  # HLT_Mu27_v8, 0.007/pb
+        '297674-297675',  # HLT_Mu27_v8, 1.072/pb
+        '297722-297723',  # HLT_Mu27_v8, 0.7/pb
+        '298996-298997',  # HLT_Mu27_v8, 0.199/pb
+        '299000-299000',  # HLT_Mu27_v8, 0.067/pb
+        '299042-299042',  # HLT_Mu27_v8, 0.017/pb
+        '299061-299062',  # HLT_Mu27_v8, 1.028/pb
+        '299064-299065',  # HLT_Mu27_v8, 0.609/pb
+        '299067-299067',  # HLT_Mu27_v8, 0.573/pb
+        '299096-299096',  # HLT_Mu27_v8, 0.201/pb
+        '299149-299149',  # HLT_Mu27_v8, 0.665/pb
+        '299178-299178',  # HLT_Mu27_v8, 0.05/pb
+        '299180-299180',  # HLT_Mu27_v8, 0.13/pb
+        '299184-299185',  # HLT_Mu27_v8, 1.223/pb
+        '299327-299327',  # HLT_Mu27_v8, 0.126/pb
+        '299329-299329',  # HLT_Mu27_v8, 0.312/pb
+        '299368-299370',  # HLT_Mu27_v9, 0.926/pb
+        '299380-299381',  # HLT_Mu27_v9, 0.187/pb
+        '299394-299396',  # HLT_Mu27_v9, 0.183/pb
+        '299420-299420',  # HLT_Mu27_v9, 0.04/pb
+        '299443-299443',  # HLT_Mu27_v9, 0.017/pb
+        '299450-299450',  # HLT_Mu27_v9, 0.038/pb
+        '299477-299481',  # HLT_Mu27_v9, 2.694/pb
+        '299593-299595',  # HLT_Mu27_v9, 1.016/pb
+        '299597-299597',  # HLT_Mu27_v9, 0.365/pb
+        '299649-299649',  # HLT_Mu27_v9, 0.149/pb
+        '300087-300087',  # HLT_Mu27_v10, 0.213/pb
+        '300105-300107',  # HLT_Mu27_v10, 0.104/pb
+        '300117-300117',  # HLT_Mu27_v10, 0.018/pb
+        '300122-300123',  # HLT_Mu27_v10, 1.647/pb
+        '300155-300157',  # HLT_Mu27_v10, 2.039/pb
+        '300226-300226',  # HLT_Mu27_v10, 0.331/pb
+        '300233-300240',  # HLT_Mu27_v10, 1.769/pb
+        '300280-300284',  # HLT_Mu27_v10, 2.655/pb
+        '300364-300375',  # HLT_Mu27_v10, 2.167/pb
+        '300389-300401',  # HLT_Mu27_v10, 1.388/pb
+        '300459-300459',  # HLT_Mu27_v10, 0.248/pb
+        '300461-300464',  # HLT_Mu27_v10, 0.48/pb
+        '300466-300467',  # HLT_Mu27_v10, 1.037/pb
+        '300497-300497',  # HLT_Mu27_v10, 0.096/pb
+        '300514-300517',  # HLT_Mu27_v10, 1.442/pb
+        '300558-300558',  # HLT_Mu27_v10, 0.493/pb
+        '300560-300560',  # HLT_Mu27_v10, 0.731/pb
+        '300574-300576',  # HLT_Mu27_v10, 1.188/pb
+        '300631-300633',  # HLT_Mu27_v10, 0.531/pb
+        '300635-300636',  # HLT_Mu27_v10, 1.485/pb
+        '300673-300676',  # HLT_Mu27_v10, 0.07/pb
+        '300742-300742',  # HLT_Mu27_v10, 0.256/pb
+        '300777-300777',  # HLT_Mu27_v10, 0.414/pb
+        '300780-300780',  # HLT_Mu27_v10, 0.296/pb
+        '300785-300785',  # HLT_Mu27_v10, 1.056/pb
+        '300806-300806',  # HLT_Mu27_v10, 0.132/pb
+        '300811-300812',  # HLT_Mu27_v10, 0.48/pb
+        '300816-300817',  # HLT_Mu27_v10, 0.531/pb
+        '301046-301046',  # HLT_Mu27_v10, 0.06/pb
+        '301141-301142',  # HLT_Mu27_v10, 0.683/pb
+        '301161-301161',  # HLT_Mu27_v10, 0.579/pb
+        '301165-301165',  # HLT_Mu27_v10, 0.11/pb
+        '301179-301180',  # HLT_Mu27_v10, 0.073/pb
+        '301183-301183',  # HLT_Mu27_v10, 0.216/pb
+        '301281-301281',  # HLT_Mu27_v10, 0.088/pb
+        '301283-301283',  # HLT_Mu27_v10, 0.678/pb
+        '301298-301298',  # HLT_Mu27_v10, 0.624/pb
+        '301323-301323',  # HLT_Mu27_v10, 0.679/pb
+        '301330-301330',  # HLT_Mu27_v10, 0.23/pb
+        '301359-301359',  # HLT_Mu27_v10, 0.205/pb
+        '301384-301384',  # HLT_Mu27_v10, 0.337/pb
+        '301391-301393',  # HLT_Mu27_v10, 0.597/pb
+        '301396-301399',  # HLT_Mu27_v10, 0.693/pb
+        '301417-301417',  # HLT_Mu27_v10, 0.242/pb
+        '301447-301450',  # HLT_Mu27_v10, 1.008/pb
+        '301461-301461',  # HLT_Mu27_v10, 0.381/pb
+        '301472-301472',  # HLT_Mu27_v10, 0.559/pb
+        '301475-301476',  # HLT_Mu27_v10, 0.741/pb
+        '301519-301519',  # HLT_Mu27_v10, 0.13/pb
+        '301524-301524',  # HLT_Mu27_v10, 0.196/pb
+        '301529-301532',  # HLT_Mu27_v10, 0.891/pb
+        '301567-301567',  # HLT_Mu27_v10, 0.248/pb
+        '301627-301627',  # HLT_Mu27_v10, 0.587/pb
+        '301664-301665',  # HLT_Mu27_v10, 0.625/pb
+        '301694-301694',  # HLT_Mu27_v10, 0.041/pb
+        '301912-301914',  # HLT_Mu27_v10, 0.38/pb
+        '301941-301941',  # HLT_Mu27_v10, 0.355/pb
+        '301959-301960',  # HLT_Mu27_v10, 1.568/pb
+        '301970-301970',  # HLT_Mu27_v10, 0.08/pb
+        '301984-301987',  # HLT_Mu27_v10, 1.663/pb
+        '301997-301998',  # HLT_Mu27_v10, 1.576/pb
+        '302019-302019',  # HLT_Mu27_v10, 0.033/pb
+        '302026-302026',  # HLT_Mu27_v11, 0.017/pb
+        '302029-302029',  # HLT_Mu27_v11, 0.055/pb
+        '302031-302031',  # HLT_Mu27_v11, 0.591/pb
+        '302033-302034',  # HLT_Mu27_v11, 0.04/pb
+        '302037-302038',  # HLT_Mu27_v11, 0.0/pb
+        '302040-302043',  # HLT_Mu27_v11, 0.76/pb
+        '302131-302131',  # HLT_Mu27_v11, 0.705/pb
+        '302159-302159',  # HLT_Mu27_v11, 0.077/pb
+        '302163-302163',  # HLT_Mu27_v11, 0.902/pb
+        '302165-302166',  # HLT_Mu27_v11, 0.06/pb
+        '302225-302225',  # HLT_Mu27_v11, 0.649/pb
+        '302228-302229',  # HLT_Mu27_v11, 0.502/pb
+        '302240-302240',  # HLT_Mu27_v11, 0.753/pb
+        '302262-302263',  # HLT_Mu27_v11, 1.303/pb
+        '302277-302277',  # HLT_Mu27_v11, 0.256/pb
+        '302279-302280',  # HLT_Mu27_v11, 0.248/pb
+        '302322-302322',  # HLT_Mu27_v11, 0.669/pb
+        '302328-302328',  # HLT_Mu27_v11, 0.507/pb
+        '302337-302337',  # HLT_Mu27_v11, 0.08/pb
+        '302342-302344',  # HLT_Mu27_v11, 0.434/pb
+        '302350-302350',  # HLT_Mu27_v11, 0.118/pb
+        '302388-302388',  # HLT_Mu27_v11, 0.478/pb
+        '302392-302393',  # HLT_Mu27_v11, 0.908/pb
+        '302448-302448',  # HLT_Mu27_v11, 1.454/pb
+        '302472-302476',  # HLT_Mu27_v11, 1.361/pb
+        '302479-302479',  # HLT_Mu27_v11, 0.238/pb
+        '302484-302485',  # HLT_Mu27_v11, 0.815/pb
+        '302492-302494',  # HLT_Mu27_v11, 0.725/pb
+        '302509-302509',  # HLT_Mu27_v11, 0.015/pb
+        '302513-302513',  # HLT_Mu27_v11, 0.036/pb
+        '302522-302523',  # HLT_Mu27_v11, 0.04/pb
+        '302525-302526',  # HLT_Mu27_v11, 0.918/pb
+        '302548-302548',  # HLT_Mu27_v11, 0.055/pb
+        '302551-302551',  # HLT_Mu27_v11, 0.104/pb
+        '302553-302555',  # HLT_Mu27_v11, 0.231/pb
+        '302563-302563',  # HLT_Mu27_v11, 0.001/pb
+        '302565-302565',  # HLT_Mu27_v11, 0.149/pb
+        '302572-302573',  # HLT_Mu27_v11, 1.138/pb
+        '302596-302597',  # HLT_Mu27_v11, 1.516/pb
+        '302634-302635',  # HLT_Mu27_v11, 1.376/pb
+        '302651-302651',  # HLT_Mu27_v11, 0.107/pb
+        '302654-302654',  # HLT_Mu27_v11, 0.228/pb
+        '302661-302661',  # HLT_Mu27_v11, 0.034/pb
+        '302663-302663',  # HLT_Mu27_v11, 0.702/pb
+        '303825-303825',  # HLT_Mu27_v11, 0.139/pb
+        '303832-303832',  # HLT_Mu27_v11, 1.363/pb
+        '303838-303838',  # HLT_Mu27_v11, 1.465/pb
+        '303885-303885',  # HLT_Mu27_v11, 1.428/pb
+        '303948-303948',  # HLT_Mu27_v11, 1.188/pb
+        '303998-304000',  # HLT_Mu27_v11, 0.777/pb
+        '304062-304062',  # HLT_Mu27_v11, 1.491/pb
+        '304119-304120',  # HLT_Mu27_v11, 0.21/pb
+        '304125-304125',  # HLT_Mu27_v11, 1.378/pb
+        '304144-304144',  # HLT_Mu27_v11, 1.947/pb
+        '304158-304158',  # HLT_Mu27_v11, 1.658/pb
+        '304169-304170',  # HLT_Mu27_v11, 2.749/pb
+        '304199-304200',  # HLT_Mu27_v11, 0.236/pb
+        '304204-304204',  # HLT_Mu27_v11, 0.382/pb
+        '304209-304209',  # HLT_Mu27_v11, 0.271/pb
+        '304291-304292',  # HLT_Mu27_v11, 1.233/pb
+        '304333-304333',  # HLT_Mu27_v11, 1.1/pb
+        '304354-304354',  # HLT_Mu27_v11, 0.122/pb
+        '304366-304366',  # HLT_Mu27_v11, 1.274/pb
+        '304446-304447',  # HLT_Mu27_v11, 1.3/pb
+        '304451-304451',  # HLT_Mu27_v11, 0.053/pb
+        '304505-304508',  # HLT_Mu27_v11, 1.335/pb
+        '304562-304562',  # HLT_Mu27_v11, 0.745/pb
+        '304616-304616',  # HLT_Mu27_v11, 0.635/pb
+        '304625-304626',  # HLT_Mu27_v11, 0.256/pb
+        '304654-304655',  # HLT_Mu27_v11, 1.248/pb
+        '304661-304663',  # HLT_Mu27_v11, 0.666/pb
+        '304671-304672',  # HLT_Mu27_v11, 0.816/pb
+        '304737-304740',  # HLT_Mu27_v11, 1.571/pb
+        '304776-304778',  # HLT_Mu27_v11, 1.286/pb
+        '304797-304797',  # HLT_Mu27_v11, 2.167/pb
+        '305044-305046',  # HLT_Mu27_v11, 1.614/pb
+        '305059-305059',  # HLT_Mu27_v11, 0.282/pb
+        '305062-305064',  # HLT_Mu27_v11, 2.861/pb
+        '305081-305081',  # HLT_Mu27_v11, 0.693/pb
+        '305112-305114',  # HLT_Mu27_v11, 1.463/pb
+        '305178-305184',  # HLT_Mu27_v11, 2.371/pb
+        '305186-305186',  # HLT_Mu27_v11, 0.254/pb
+        '305188-305188',  # HLT_Mu27_v11, 1.791/pb
+        '305202-305202',  # HLT_Mu27_v11, 0.38/pb
+        '305204-305204',  # HLT_Mu27_v11, 0.9/pb
+        '305207-305208',  # HLT_Mu27_v11, 0.942/pb
+        '305234-305234',  # HLT_Mu27_v11, 0.024/pb
+        '305236-305237',  # HLT_Mu27_v11, 0.839/pb
+        '305247-305248',  # HLT_Mu27_v11, 0.922/pb
+        '305252-305252',  # HLT_Mu27_v11, 0.407/pb
+        '305282-305282',  # HLT_Mu27_v11, 0.087/pb
+        '305310-305314',  # HLT_Mu27_v11, 1.376/pb
+        '305336-305336',  # HLT_Mu27_v11, 0.118/pb
+        '305338-305338',  # HLT_Mu27_v11, 0.059/pb
+        '305341-305341',  # HLT_Mu27_v11, 0.294/pb
+        '305349-305351',  # HLT_Mu27_v11, 0.7/pb
+        '305358-305358',  # HLT_Mu27_v11, 0.088/pb
+        '305364-305366',  # HLT_Mu27_v11, 1.566/pb
+        '305376-305377',  # HLT_Mu27_v11, 1.151/pb
+        '305405-305406',  # HLT_Mu27_v11, 1.414/pb
+        '305440-305441',  # HLT_Mu27_v11, 0.269/pb
+        '305516-305518',  # HLT_Mu27_v11, 1.289/pb
+        '305586-305586',  # HLT_Mu27_v11, 0.386/pb
+        '305589-305590',  # HLT_Mu27_v11, 1.234/pb
+        '305636-305636',  # HLT_Mu27_v11, 1.678/pb
+        '305766-305766',  # HLT_Mu27_v11, 0.618/pb
+        '305809-305809',  # HLT_Mu27_v11, 0.103/pb
+        '305814-305814',  # HLT_Mu27_v11, 1.349/pb
+        '305821-305821',  # HLT_Mu27_v11, 0.559/pb
+        '305832-305832',  # HLT_Mu27_v11, 0.13/pb
+        '305840-305840',  # HLT_Mu27_v11, 0.814/pb
+        '305842-305842',  # HLT_Mu27_v11, 0.632/pb
+        '305862-305862',  # HLT_Mu27_v11, 0.458/pb
+        '305898-305898',  # HLT_Mu27_v11, 0.527/pb
+        '305902-305902',  # HLT_Mu27_v11, 0.347/pb
+        '305967-305967',  # HLT_Mu27_v11, 0.024/pb
+        '306029-306030',  # HLT_Mu27_v11, 0.099/pb
+        '306036-306038',  # HLT_Mu27_v11, 0.127/pb
+        '306041-306042',  # HLT_Mu27_v11, 0.493/pb
+        '306048-306049',  # HLT_Mu27_v11, 0.348/pb
+        '306051-306051',  # HLT_Mu27_v11, 0.29/pb
+        '306091-306092',  # HLT_Mu27_v11, 0.808/pb
+        '306095-306095',  # HLT_Mu27_v11, 0.217/pb
+        '306121-306122',  # HLT_Mu27_v11, 0.156/pb
+        '306125-306126',  # HLT_Mu27_v11, 2.5/pb
+        '306134-306135',  # HLT_Mu27_v11, 0.815/pb
+        '306138-306139',  # HLT_Mu27_v11, 1.935/pb
+        '306153-306155',  # HLT_Mu27_v11, 1.991/pb
+        '306169-306171',  # HLT_Mu27_v11, 1.145/pb
+        '306418-306420',  # HLT_Mu27_v12, 0.165/pb
+        '306422-306423',  # HLT_Mu27_v12, 0.315/pb
+        '306432-306432',  # HLT_Mu27_v12, 0.143/pb
+        '306454-306460',  # HLT_Mu27_v12, 4.256/pb
+      )),
+    ),
+  ),
+  'e' : cms.VPSet(
+    cms.PSet(
+      path = cms.string("HLT_Ele8_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(15.),
+      cone_maxPt = cms.double(45.),
+      minRecoPt = cms.double(8.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(11364), # L=3.654/pb; present in C, D, E, F, missing in B; prescale factor 11363.9 (11029.2 from delivery)
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+        '299368-299370',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.03/pb
+        '299380-299381',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
+        '299394-299396',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
+        '299420-299420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.001/pb
+        '299443-299443',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.0/pb
+        '299450-299450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.001/pb
+        '299477-299481',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.083/pb
+        '299593-299595',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.039/pb
+        '299597-299597',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.014/pb
+        '299649-299649',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
+        '300087-300087',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.004/pb
+        '300105-300107',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
+        '300117-300117',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.0/pb
+        '300122-300123',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.072/pb
+        '300155-300157',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.088/pb
+        '300226-300226',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.006/pb
+        '300233-300240',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.072/pb
+        '300280-300284',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.041/pb
+        '300364-300375',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.005/pb
+        '300389-300401',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.058/pb
+        '300459-300459',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.005/pb
+        '300461-300464',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.019/pb
+        '300466-300467',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.051/pb
+        '300497-300497',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
+        '300514-300517',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.055/pb
+        '300558-300558',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
+        '300560-300560',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.039/pb
+        '300574-300576',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.044/pb
+        '300631-300633',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.014/pb
+        '300635-300636',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.07/pb
+        '300673-300676',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.001/pb
+        '300742-300742',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.005/pb
+        '300777-300777',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.011/pb
+        '300780-300780',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.013/pb
+        '300785-300785',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.052/pb
+        '300806-300806',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
+        '300811-300812',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.01/pb
+        '300816-300817',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.022/pb
+        '301046-301046',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
+        '301141-301142',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.012/pb
+        '301161-301161',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.008/pb
+        '301165-301165',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301179-301180',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
+        '301183-301183',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301281-301281',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
+        '301283-301283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.009/pb
+        '301298-301298',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
+        '301323-301323',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.006/pb
+        '301330-301330',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301359-301359',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301384-301384',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
+        '301391-301393',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
+        '301396-301399',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.011/pb
+        '301417-301417',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301447-301450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.013/pb
+        '301461-301461',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
+        '301472-301472',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
+        '301475-301476',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.012/pb
+        '301519-301519',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
+        '301524-301524',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301529-301532',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.015/pb
+        '301567-301567',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
+        '301627-301627',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
+        '301664-301665',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
+        '301694-301694',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
+        '301912-301914',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
+        '301941-301941',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
+        '301959-301960',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.021/pb
+        '301970-301970',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
+        '301984-301987',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.023/pb
+        '301997-301998',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.021/pb
+        '302019-302019',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
+        '302026-302026',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.0/pb
+        '302029-302029',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
+        '302031-302031',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.01/pb
+        '302033-302034',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
+        '302037-302038',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.0/pb
+        '302040-302043',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.013/pb
+        '302131-302131',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.012/pb
+        '302159-302159',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
+        '302163-302163',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
+        '302165-302166',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
+        '302225-302225',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.011/pb
+        '302228-302229',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.009/pb
+        '302240-302240',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.013/pb
+        '302262-302263',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.023/pb
+        '302277-302277',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
+        '302279-302280',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
+        '302322-302322',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.012/pb
+        '302328-302328',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.009/pb
+        '302337-302337',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
+        '302342-302344',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.008/pb
+        '302350-302350',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.002/pb
+        '302388-302388',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.008/pb
+        '302392-302393',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
+        '302448-302448',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.026/pb
+        '302472-302476',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.022/pb
+        '302479-302479',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
+        '302484-302485',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.014/pb
+        '302492-302494',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.152/pb
+        '302509-302509',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302513-302513',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '302522-302523',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '302525-302526',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.016/pb
+        '302548-302548',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '302551-302551',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302553-302555',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '302563-302563',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302565-302565',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302572-302573',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.02/pb
+        '302596-302597',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
+        '302634-302635',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.024/pb
+        '302651-302651',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '302654-302654',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '302661-302661',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '302663-302663',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.012/pb
+        '303825-303825',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '303832-303832',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.024/pb
+        '303838-303838',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.026/pb
+        '303885-303885',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
+        '303948-303948',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
+        '303998-304000',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.013/pb
+        '304062-304062',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.026/pb
+        '304119-304120',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
+        '304125-304125',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.024/pb
+        '304144-304144',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.034/pb
+        '304158-304158',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.029/pb
+        '304169-304170',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.049/pb
+        '304199-304200',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '304204-304204',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
+        '304209-304209',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
+        '304291-304292',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
+        '304333-304333',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.019/pb
+        '304354-304354',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '304366-304366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.022/pb
+        '304446-304447',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.022/pb
+        '304451-304451',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '304505-304508',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.023/pb
+        '304562-304562',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.013/pb
+        '304616-304616',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.011/pb
+        '304625-304626',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '304654-304655',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
+        '304661-304663',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.011/pb
+        '304671-304672',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
+        '304737-304740',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
+        '304776-304778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.022/pb
+        '304797-304797',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.037/pb
+        '305044-305046',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.028/pb
+        '305059-305059',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '305062-305064',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
+        '305081-305081',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.011/pb
+        '305112-305114',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
+        '305178-305184',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
+        '305186-305186',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '305188-305188',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.032/pb
+        '305202-305202',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
+        '305204-305204',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.016/pb
+        '305207-305208',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.015/pb
+        '305234-305234',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '305236-305237',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
+        '305247-305248',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.015/pb
+        '305252-305252',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.007/pb
+        '305282-305282',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '305310-305314',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.023/pb
+        '305336-305336',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '305338-305338',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '305341-305341',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
+        '305349-305351',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.012/pb
+        '305358-305358',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '305364-305366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.026/pb
+        '305376-305377',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.019/pb
+        '305405-305406',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.059/pb
+        '305440-305441',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
+        '305516-305518',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.054/pb
+        '305586-305586',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
+        '305589-305590',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.072/pb
+        '305636-305636',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.074/pb
+        '305766-305766',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.01/pb
+        '305809-305809',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '305814-305814',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.056/pb
+        '305821-305821',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.007/pb
+        '305832-305832',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '305840-305840',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.044/pb
+        '305842-305842',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.038/pb
+        '305862-305862',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
+        '305898-305898',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
+        '305902-305902',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '305967-305967',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '306029-306030',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.001/pb
+        '306036-306038',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.001/pb
+        '306041-306042',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.012/pb
+        '306048-306049',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.021/pb
+        '306051-306051',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.017/pb
+        '306091-306092',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.036/pb
+        '306095-306095',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.013/pb
+        '306121-306122',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.002/pb
+        '306125-306126',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.129/pb
+        '306134-306135',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.019/pb
+        '306138-306139',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.115/pb
+        '306153-306155',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.093/pb
+        '306169-306171',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.068/pb
+        '306418-306420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
+        '306422-306423',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
+        '306432-306432',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
+        '306454-306460',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.133/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Ele17_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(17.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(1167), # L=35.593/pb; present in C, D, E, F, missing in B; prescale factor 1166.8 (1181.3 from delivery)
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+        '299368-299370',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.184/pb
+        '299380-299381',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.015/pb
+        '299394-299396',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.015/pb
+        '299420-299420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.003/pb
+        '299443-299443',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.001/pb
+        '299450-299450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.003/pb
+        '299477-299481',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.417/pb
+        '299593-299595',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.25/pb
+        '299597-299597',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.095/pb
+        '299649-299649',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.011/pb
+        '300087-300087',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.014/pb
+        '300105-300107',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
+        '300117-300117',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
+        '300122-300123',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.336/pb
+        '300155-300157',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.424/pb
+        '300226-300226',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.027/pb
+        '300233-300240',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.36/pb
+        '300280-300284',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.244/pb
+        '300364-300375',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.032/pb
+        '300389-300401',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.327/pb
+        '300459-300459',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
+        '300461-300464',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.124/pb
+        '300466-300467',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.225/pb
+        '300497-300497',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.007/pb
+        '300514-300517',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.291/pb
+        '300558-300558',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.132/pb
+        '300560-300560',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.156/pb
+        '300574-300576',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.284/pb
+        '300631-300633',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.076/pb
+        '300635-300636',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.347/pb
+        '300673-300676',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
+        '300742-300742',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.021/pb
+        '300777-300777',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.06/pb
+        '300780-300780',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.088/pb
+        '300785-300785',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.236/pb
+        '300806-300806',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
+        '300811-300812',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.051/pb
+        '300816-300817',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.149/pb
+        '301046-301046',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.016/pb
+        '301141-301142',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.177/pb
+        '301161-301161',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.149/pb
+        '301165-301165',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.029/pb
+        '301179-301180',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.019/pb
+        '301183-301183',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.055/pb
+        '301281-301281',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.023/pb
+        '301283-301283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.175/pb
+        '301298-301298',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.159/pb
+        '301323-301323',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.174/pb
+        '301330-301330',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.059/pb
+        '301359-301359',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.052/pb
+        '301384-301384',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.086/pb
+        '301391-301393',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.152/pb
+        '301396-301399',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.179/pb
+        '301417-301417',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.062/pb
+        '301447-301450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.259/pb
+        '301461-301461',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.097/pb
+        '301472-301472',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.143/pb
+        '301475-301476',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.192/pb
+        '301519-301519',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.033/pb
+        '301524-301524',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.05/pb
+        '301529-301532',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.231/pb
+        '301567-301567',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.063/pb
+        '301627-301627',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.15/pb
+        '301664-301665',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.16/pb
+        '301694-301694',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.01/pb
+        '301912-301914',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.097/pb
+        '301941-301941',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.091/pb
+        '301959-301960',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.404/pb
+        '301970-301970',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.02/pb
+        '301984-301987',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.428/pb
+        '301997-301998',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.406/pb
+        '302019-302019',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.008/pb
+        '302026-302026',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.004/pb
+        '302029-302029',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.014/pb
+        '302031-302031',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.151/pb
+        '302033-302034',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.01/pb
+        '302037-302038',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.0/pb
+        '302040-302043',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.197/pb
+        '302131-302131',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.182/pb
+        '302159-302159',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
+        '302163-302163',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.233/pb
+        '302165-302166',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.016/pb
+        '302225-302225',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.167/pb
+        '302228-302229',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.128/pb
+        '302240-302240',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.194/pb
+        '302262-302263',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.335/pb
+        '302277-302277',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.066/pb
+        '302279-302280',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.064/pb
+        '302322-302322',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.173/pb
+        '302328-302328',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.13/pb
+        '302337-302337',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
+        '302342-302344',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.111/pb
+        '302350-302350',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.031/pb
+        '302388-302388',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.122/pb
+        '302392-302393',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.232/pb
+        '302448-302448',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.373/pb
+        '302472-302476',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.323/pb
+        '302479-302479',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.061/pb
+        '302484-302485',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.208/pb
+        '302492-302494',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.293/pb
+        '302509-302509',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.004/pb
+        '302513-302513',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.009/pb
+        '302522-302523',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.01/pb
+        '302525-302526',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.234/pb
+        '302548-302548',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.014/pb
+        '302551-302551',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
+        '302553-302555',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.035/pb
+        '302563-302563',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
+        '302565-302565',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
+        '302572-302573',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.292/pb
+        '302596-302597',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.389/pb
+        '302634-302635',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.353/pb
+        '302651-302651',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.027/pb
+        '302654-302654',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.058/pb
+        '302661-302661',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.009/pb
+        '302663-302663',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.181/pb
+        '303825-303825',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.036/pb
+        '303832-303832',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.349/pb
+        '303838-303838',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.374/pb
+        '303885-303885',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.362/pb
+        '303948-303948',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.301/pb
+        '303998-304000',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.196/pb
+        '304062-304062',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.381/pb
+        '304119-304120',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.049/pb
+        '304125-304125',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.353/pb
+        '304144-304144',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.491/pb
+        '304158-304158',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.425/pb
+        '304169-304170',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.708/pb
+        '304199-304200',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.059/pb
+        '304204-304204',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.093/pb
+        '304209-304209',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.065/pb
+        '304291-304292',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.31/pb
+        '304333-304333',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.271/pb
+        '304354-304354',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.025/pb
+        '304366-304366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.312/pb
+        '304446-304447',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.323/pb
+        '304451-304451',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.014/pb
+        '304505-304508',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.328/pb
+        '304562-304562',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.182/pb
+        '304616-304616',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.151/pb
+        '304625-304626',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.054/pb
+        '304654-304655',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.307/pb
+        '304661-304663',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.158/pb
+        '304671-304672',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.194/pb
+        '304737-304740',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.387/pb
+        '304776-304778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.314/pb
+        '304797-304797',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.542/pb
+        '305044-305046',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.409/pb
+        '305059-305059',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.059/pb
+        '305062-305064',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.395/pb
+        '305081-305081',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.16/pb
+        '305112-305114',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.357/pb
+        '305178-305184',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.037/pb
+        '305186-305186',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.058/pb
+        '305188-305188',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.463/pb
+        '305202-305202',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.08/pb
+        '305204-305204',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.229/pb
+        '305207-305208',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.219/pb
+        '305234-305234',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
+        '305236-305237',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.198/pb
+        '305247-305248',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.219/pb
+        '305252-305252',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.104/pb
+        '305282-305282',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.019/pb
+        '305310-305314',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.335/pb
+        '305336-305336',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.025/pb
+        '305338-305338',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.012/pb
+        '305341-305341',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.064/pb
+        '305349-305351',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.179/pb
+        '305358-305358',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.018/pb
+        '305364-305366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.382/pb
+        '305376-305377',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.275/pb
+        '305405-305406',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.438/pb
+        '305440-305441',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.044/pb
+        '305516-305518',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.401/pb
+        '305586-305586',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.064/pb
+        '305589-305590',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.478/pb
+        '305636-305636',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.54/pb
+        '305766-305766',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.118/pb
+        '305809-305809',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.017/pb
+        '305814-305814',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.421/pb
+        '305821-305821',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.097/pb
+        '305832-305832',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.021/pb
+        '305840-305840',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.299/pb
+        '305842-305842',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.249/pb
+        '305862-305862',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.076/pb
+        '305898-305898',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.089/pb
+        '305902-305902',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.057/pb
+        '305967-305967',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.004/pb
+        '306029-306030',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
+        '306036-306038',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.021/pb
+        '306041-306042',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.114/pb
+        '306048-306049',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.134/pb
+        '306051-306051',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.115/pb
+        '306091-306092',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.257/pb
+        '306095-306095',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.087/pb
+        '306121-306122',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.026/pb
+        '306125-306126',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.891/pb
+        '306134-306135',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.184/pb
+        '306138-306139',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.768/pb
+        '306153-306155',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.659/pb
+        '306169-306171',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.464/pb
+        '306418-306420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
+        '306422-306423',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.09/pb
+        '306432-306432',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.056/pb
+        '306454-306460',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.924/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Ele23_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(23.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(1087), # L=38.216/pb; present in C, D, E, F, missing in B; prescale factor 1086.7 (1101.5 from delivery)
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+        '299368-299370',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.184/pb
+        '299380-299381',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.015/pb
+        '299394-299396',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.015/pb
+        '299420-299420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
+        '299443-299443',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.001/pb
+        '299450-299450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
+        '299477-299481',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.417/pb
+        '299593-299595',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.25/pb
+        '299597-299597',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.095/pb
+        '299649-299649',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.011/pb
+        '300087-300087',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.014/pb
+        '300105-300107',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.009/pb
+        '300117-300117',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
+        '300122-300123',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.336/pb
+        '300155-300157',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.424/pb
+        '300226-300226',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.027/pb
+        '300233-300240',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.36/pb
+        '300280-300284',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.244/pb
+        '300364-300375',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.032/pb
+        '300389-300401',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.327/pb
+        '300459-300459',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
+        '300461-300464',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.124/pb
+        '300466-300467',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.225/pb
+        '300497-300497',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.007/pb
+        '300514-300517',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.291/pb
+        '300558-300558',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.132/pb
+        '300560-300560',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.156/pb
+        '300574-300576',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.284/pb
+        '300631-300633',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.076/pb
+        '300635-300636',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.347/pb
+        '300673-300676',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.006/pb
+        '300742-300742',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.021/pb
+        '300777-300777',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.06/pb
+        '300780-300780',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.088/pb
+        '300785-300785',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.236/pb
+        '300806-300806',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.009/pb
+        '300811-300812',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.051/pb
+        '300816-300817',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.149/pb
+        '301046-301046',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.016/pb
+        '301141-301142',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.177/pb
+        '301161-301161',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.149/pb
+        '301165-301165',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.029/pb
+        '301179-301180',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.019/pb
+        '301183-301183',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.055/pb
+        '301281-301281',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.023/pb
+        '301283-301283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.175/pb
+        '301298-301298',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.159/pb
+        '301323-301323',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.174/pb
+        '301330-301330',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.059/pb
+        '301359-301359',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.052/pb
+        '301384-301384',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.086/pb
+        '301391-301393',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.152/pb
+        '301396-301399',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.179/pb
+        '301417-301417',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.062/pb
+        '301447-301450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.259/pb
+        '301461-301461',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.097/pb
+        '301472-301472',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.143/pb
+        '301475-301476',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.192/pb
+        '301519-301519',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.033/pb
+        '301524-301524',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.05/pb
+        '301529-301532',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.231/pb
+        '301567-301567',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.063/pb
+        '301627-301627',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.15/pb
+        '301664-301665',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.16/pb
+        '301694-301694',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.01/pb
+        '301912-301914',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.097/pb
+        '301941-301941',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.091/pb
+        '301959-301960',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.404/pb
+        '301970-301970',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.02/pb
+        '301984-301987',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.428/pb
+        '301997-301998',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.406/pb
+        '302019-302019',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.008/pb
+        '302026-302026',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
+        '302029-302029',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.014/pb
+        '302031-302031',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.151/pb
+        '302033-302034',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.01/pb
+        '302037-302038',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.0/pb
+        '302040-302043',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.197/pb
+        '302131-302131',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.182/pb
+        '302159-302159',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.02/pb
+        '302163-302163',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.233/pb
+        '302165-302166',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
+        '302225-302225',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.167/pb
+        '302228-302229',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.128/pb
+        '302240-302240',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.194/pb
+        '302262-302263',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.335/pb
+        '302277-302277',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.066/pb
+        '302279-302280',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.064/pb
+        '302322-302322',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.173/pb
+        '302328-302328',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.13/pb
+        '302337-302337',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.02/pb
+        '302342-302344',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.111/pb
+        '302350-302350',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.031/pb
+        '302388-302388',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.122/pb
+        '302392-302393',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.232/pb
+        '302448-302448',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.373/pb
+        '302472-302476',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.323/pb
+        '302479-302479',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.061/pb
+        '302484-302485',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.208/pb
+        '302492-302494',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.293/pb
+        '302509-302509',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '302513-302513',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
+        '302522-302523',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.01/pb
+        '302525-302526',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.234/pb
+        '302548-302548',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
+        '302551-302551',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302553-302555',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.035/pb
+        '302563-302563',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302565-302565',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '302572-302573',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.292/pb
+        '302596-302597',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.389/pb
+        '302634-302635',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.353/pb
+        '302651-302651',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
+        '302654-302654',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.058/pb
+        '302661-302661',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
+        '302663-302663',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.181/pb
+        '303825-303825',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.036/pb
+        '303832-303832',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.349/pb
+        '303838-303838',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.374/pb
+        '303885-303885',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.362/pb
+        '303948-303948',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.301/pb
+        '303998-304000',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.196/pb
+        '304062-304062',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.381/pb
+        '304119-304120',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.049/pb
+        '304125-304125',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.353/pb
+        '304144-304144',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.491/pb
+        '304158-304158',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.425/pb
+        '304169-304170',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.708/pb
+        '304199-304200',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.059/pb
+        '304204-304204',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.093/pb
+        '304209-304209',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.065/pb
+        '304291-304292',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.31/pb
+        '304333-304333',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.271/pb
+        '304354-304354',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
+        '304366-304366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.312/pb
+        '304446-304447',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.323/pb
+        '304451-304451',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
+        '304505-304508',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.328/pb
+        '304562-304562',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.182/pb
+        '304616-304616',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.151/pb
+        '304625-304626',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.054/pb
+        '304654-304655',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.307/pb
+        '304661-304663',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.158/pb
+        '304671-304672',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.194/pb
+        '304737-304740',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.387/pb
+        '304776-304778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.314/pb
+        '304797-304797',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.542/pb
+        '305044-305046',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.409/pb
+        '305059-305059',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.059/pb
+        '305062-305064',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.395/pb
+        '305081-305081',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.16/pb
+        '305112-305114',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.357/pb
+        '305178-305184',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.037/pb
+        '305186-305186',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.058/pb
+        '305188-305188',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.463/pb
+        '305202-305202',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.08/pb
+        '305204-305204',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.229/pb
+        '305207-305208',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.219/pb
+        '305234-305234',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
+        '305236-305237',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.198/pb
+        '305247-305248',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.219/pb
+        '305252-305252',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.104/pb
+        '305282-305282',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.019/pb
+        '305310-305314',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.335/pb
+        '305336-305336',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
+        '305338-305338',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.012/pb
+        '305341-305341',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.064/pb
+        '305349-305351',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.179/pb
+        '305358-305358',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.018/pb
+        '305364-305366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.382/pb
+        '305376-305377',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.275/pb
+        '305405-305406',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.572/pb
+        '305440-305441',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.044/pb
+        '305516-305518',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.523/pb
+        '305586-305586',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.064/pb
+        '305589-305590',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.662/pb
+        '305636-305636',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.71/pb
+        '305766-305766',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.127/pb
+        '305809-305809',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.017/pb
+        '305814-305814',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.55/pb
+        '305821-305821',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.097/pb
+        '305832-305832',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
+        '305840-305840',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.409/pb
+        '305842-305842',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.342/pb
+        '305862-305862',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.076/pb
+        '305898-305898',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.089/pb
+        '305902-305902',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.057/pb
+        '305967-305967',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '306029-306030',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.016/pb
+        '306036-306038',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.021/pb
+        '306041-306042',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.136/pb
+        '306048-306049',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.184/pb
+        '306051-306051',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.159/pb
+        '306091-306092',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.338/pb
+        '306095-306095',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.12/pb
+        '306121-306122',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.026/pb
+        '306125-306126',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 1.208/pb
+        '306134-306135',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.219/pb
+        '306138-306139',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 1.069/pb
+        '306153-306155',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.875/pb
+        '306169-306171',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.657/pb
+        '306418-306420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.027/pb
+        '306422-306423',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.117/pb
+        '306432-306432',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.078/pb
+        '306454-306460',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 1.252/pb
+      )),
+    ),
+  ),
+}
@@ -0,0 +1,2472 @@
+import FWCore.ParameterSet.Config as cms
+
+leptonFR_triggers = {
+  'mu' : cms.VPSet(
+    cms.PSet(
+      path = cms.string("HLT_Mu3_PFJet40"),
+      cone_minPt = cms.double(10.),
+      cone_maxPt = cms.double(32.),
+      minRecoPt = cms.double(-1.),
+      jet_minPt = cms.double(45.),
+      average_prescale = cms.double(22160), # L=2.695/pb; present in all eras; prescale factor 22160.5 (22182.4 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315259-315259',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315264-315265',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315267-315267',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315270-315270',  # HLT_Mu3_PFJet40_v14, 0.002/pb
+        '315322-315322',  # HLT_Mu3_PFJet40_v14, 0.004/pb
+        '315339-315339',  # HLT_Mu3_PFJet40_v14, 0.002/pb
+        '315357-315357',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315361-315361',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315363-315363',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315366-315366',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315420-315420',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315488-315490',  # HLT_Mu3_PFJet40_v14, 0.007/pb
+        '315506-315506',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315510-315510',  # HLT_Mu3_PFJet40_v14, 0.003/pb
+        '315512-315512',  # HLT_Mu3_PFJet40_v14, 0.007/pb
+        '315543-315543',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315555-315557',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315640-315642',  # HLT_Mu3_PFJet40_v14, 0.0/pb
+        '315644-315648',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315689-315690',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315702-315705',  # HLT_Mu3_PFJet40_v14, 0.01/pb
+        '315713-315713',  # HLT_Mu3_PFJet40_v14, 0.011/pb
+        '315721-315721',  # HLT_Mu3_PFJet40_v14, 0.006/pb
+        '315741-315741',  # HLT_Mu3_PFJet40_v14, 0.001/pb
+        '315764-315764',  # HLT_Mu3_PFJet40_v14, 0.003/pb
+        '315770-315770',  # HLT_Mu3_PFJet40_v14, 0.004/pb
+        '315784-315786',  # HLT_Mu3_PFJet40_v14, 0.005/pb
+        '315790-315790',  # HLT_Mu3_PFJet40_v14, 0.005/pb
+        '315800-315801',  # HLT_Mu3_PFJet40_v14, 0.009/pb
+        '315840-315840',  # HLT_Mu3_PFJet40_v14, 0.011/pb
+        '315973-315974',  # HLT_Mu3_PFJet40_v14/HLT_Mu3_PFJet40_v15, 0.009/pb
+        '316058-316062',  # HLT_Mu3_PFJet40_v15, 0.016/pb
+        '316082-316082',  # HLT_Mu3_PFJet40_v15, 0.004/pb
+        '316110-316111',  # HLT_Mu3_PFJet40_v15, 0.0/pb
+        '316113-316114',  # HLT_Mu3_PFJet40_v15, 0.001/pb
+        '316153-316153',  # HLT_Mu3_PFJet40_v15, 0.008/pb
+        '316186-316187',  # HLT_Mu3_PFJet40_v15, 0.016/pb
+        '316199-316202',  # HLT_Mu3_PFJet40_v15, 0.018/pb
+        '316216-316219',  # HLT_Mu3_PFJet40_v15, 0.017/pb
+        '316239-316241',  # HLT_Mu3_PFJet40_v15, 0.017/pb
+        '316271-316271',  # HLT_Mu3_PFJet40_v15, 0.001/pb
+        '316361-316363',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '316377-316380',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '316455-316455',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '316457-316457',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '316469-316470',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '316472-316472',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '316505-316505',  # HLT_Mu3_PFJet40_v16, 0.012/pb
+        '316569-316569',  # HLT_Mu3_PFJet40_v16, 0.015/pb
+        '316590-316590',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '316613-316613',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '316615-316615',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '316666-316667',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316700-316702',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316715-316723',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316758-316758',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316766-316766',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316876-316877',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '316879-316879',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316928-316928',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '316985-316985',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '316993-316995',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '317080-317080',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '317087-317087',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '317089-317089',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '317182-317182',  # HLT_Mu3_PFJet40_v16, 0.037/pb
+        '317212-317213',  # HLT_Mu3_PFJet40_v16, 0.016/pb
+        '317279-317279',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '317291-317292',  # HLT_Mu3_PFJet40_v16, 0.033/pb
+        '317297-317297',  # HLT_Mu3_PFJet40_v16, 0.011/pb
+        '317319-317320',  # HLT_Mu3_PFJet40_v16, 0.047/pb
+        '317338-317340',  # HLT_Mu3_PFJet40_v16, 0.02/pb
+        '317382-317383',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '317391-317392',  # HLT_Mu3_PFJet40_v16, 0.045/pb
+        '317435-317435',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '317438-317438',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '317475-317475',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '317478-317478',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '317484-317484',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '317488-317488',  # HLT_Mu3_PFJet40_v16, 0.016/pb
+        '317527-317527',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '317591-317591',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '317626-317626',  # HLT_Mu3_PFJet40_v16, 0.048/pb
+        '317640-317641',  # HLT_Mu3_PFJet40_v16, 0.048/pb
+        '317648-317650',  # HLT_Mu3_PFJet40_v16, 0.044/pb
+        '317661-317661',  # HLT_Mu3_PFJet40_v16, 0.034/pb
+        '317663-317663',  # HLT_Mu3_PFJet40_v16, 0.014/pb
+        '317683-317683',  # HLT_Mu3_PFJet40_v16, 0.011/pb
+        '317696-317696',  # HLT_Mu3_PFJet40_v16, 0.021/pb
+        '318733-318733',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '318828-318828',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '318872-318872',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '318874-318874',  # HLT_Mu3_PFJet40_v16, 0.009/pb
+        '318876-318877',  # HLT_Mu3_PFJet40_v16, 0.019/pb
+        '319077-319077',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '319337-319337',  # HLT_Mu3_PFJet40_v16, 0.021/pb
+        '319347-319349',  # HLT_Mu3_PFJet40_v16, 0.023/pb
+        '319449-319450',  # HLT_Mu3_PFJet40_v16, 0.041/pb
+        '319456-319456',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '319459-319459',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '319486-319486',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '319503-319503',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '319524-319524',  # HLT_Mu3_PFJet40_v16, 0.042/pb
+        '319526-319526',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '319528-319528',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '319579-319579',  # HLT_Mu3_PFJet40_v16, 0.074/pb
+        '319625-319625',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '319639-319639',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '319656-319659',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '319678-319678',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '319687-319687',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '319697-319698',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '319756-319756',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '319840-319841',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '319847-319849',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '319851-319851',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '319853-319854',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '319908-319910',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '319912-319915',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '319941-319942',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '319950-319950',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '319991-319993',  # HLT_Mu3_PFJet40_v16, 0.048/pb
+        '320002-320002',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '320006-320006',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '320010-320012',  # HLT_Mu3_PFJet40_v16, 0.014/pb
+        '320023-320026',  # HLT_Mu3_PFJet40_v16, 0.028/pb
+        '320038-320040',  # HLT_Mu3_PFJet40_v16, 0.037/pb
+        '320059-320065',  # HLT_Mu3_PFJet40_v16, 0.036/pb
+        '320673-320674',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '320688-320688',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '320712-320712',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '320757-320757',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '320804-320804',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '320807-320807',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '320809-320809',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '320821-320824',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '320838-320838',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '320840-320841',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '320853-320859',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '320887-320888',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '320916-320917',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '320920-320920',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '320933-320934',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '320936-320936',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '320941-320941',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '320980-320980',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '320995-320996',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321004-321007',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '321009-321012',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321051-321051',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '321055-321055',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321067-321069',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '321119-321119',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321121-321122',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321124-321124',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '321126-321126',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321134-321134',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '321138-321138',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321140-321140',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321149-321149',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '321165-321167',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '321177-321178',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '321218-321219',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '321221-321221',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '321230-321233',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '321262-321262',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '321283-321283',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321294-321296',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '321305-321305',  # HLT_Mu3_PFJet40_v16, 0.009/pb
+        '321311-321313',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321393-321393',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321396-321397',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '321414-321415',  # HLT_Mu3_PFJet40_v16, 0.048/pb
+        '321431-321434',  # HLT_Mu3_PFJet40_v16, 0.027/pb
+        '321436-321436',  # HLT_Mu3_PFJet40_v16, 0.013/pb
+        '321457-321457',  # HLT_Mu3_PFJet40_v16, 0.044/pb
+        '321461-321461',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321475-321475',  # HLT_Mu3_PFJet40_v16, 0.043/pb
+        '321710-321710',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321712-321712',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321730-321730',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321732-321732',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '321735-321735',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '321755-321755',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '321758-321758',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321760-321760',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321773-321778',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '321780-321781',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '321813-321813',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321815-321815',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '321817-321818',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '321820-321820',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '321831-321834',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '321879-321880',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321887-321887',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '321908-321909',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '321917-321917',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '321919-321919',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '321933-321933',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321960-321961',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321973-321973',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '321975-321975',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '321988-321988',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '321990-321990',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '322013-322014',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '322022-322022',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '322040-322040',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '322057-322057',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '322068-322068',  # HLT_Mu3_PFJet40_v16, 0.021/pb
+        '322079-322079',  # HLT_Mu3_PFJet40_v16, 0.013/pb
+        '322106-322106',  # HLT_Mu3_PFJet40_v16, 0.026/pb
+        '322113-322113',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '322118-322118',  # HLT_Mu3_PFJet40_v16, 0.024/pb
+        '322179-322179',  # HLT_Mu3_PFJet40_v16, 0.043/pb
+        '322201-322201',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '322204-322204',  # HLT_Mu3_PFJet40_v16, 0.028/pb
+        '322222-322222',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '322252-322252',  # HLT_Mu3_PFJet40_v16, 0.038/pb
+        '322317-322317',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '322319-322319',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '322322-322322',  # HLT_Mu3_PFJet40_v16, 0.027/pb
+        '322324-322324',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '322332-322332',  # HLT_Mu3_PFJet40_v16, 0.029/pb
+        '322348-322348',  # HLT_Mu3_PFJet40_v16, 0.038/pb
+        '322355-322356',  # HLT_Mu3_PFJet40_v16, 0.024/pb
+        '322381-322381',  # HLT_Mu3_PFJet40_v16, 0.016/pb
+        '322407-322407',  # HLT_Mu3_PFJet40_v16, 0.015/pb
+        '322430-322431',  # HLT_Mu3_PFJet40_v16, 0.034/pb
+        '322480-322480',  # HLT_Mu3_PFJet40_v16, 0.01/pb
+        '322492-322492',  # HLT_Mu3_PFJet40_v16, 0.026/pb
+        '322510-322510',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '322599-322599',  # HLT_Mu3_PFJet40_v16, 0.009/pb
+        '322602-322603',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '322605-322605',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '322617-322617',  # HLT_Mu3_PFJet40_v16, 0.012/pb
+        '322625-322625',  # HLT_Mu3_PFJet40_v16, 0.03/pb
+        '322633-322633',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '323414-323414',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '323423-323423',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '323470-323475',  # HLT_Mu3_PFJet40_v16, 0.029/pb
+        '323487-323488',  # HLT_Mu3_PFJet40_v16, 0.031/pb
+        '323492-323493',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '323495-323495',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '323524-323526',  # HLT_Mu3_PFJet40_v16, 0.044/pb
+        '323693-323693',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '323696-323696',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '323702-323702',  # HLT_Mu3_PFJet40_v16, 0.013/pb
+        '323725-323727',  # HLT_Mu3_PFJet40_v16, 0.035/pb
+        '323755-323755',  # HLT_Mu3_PFJet40_v16, 0.027/pb
+        '323775-323775',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '323778-323778',  # HLT_Mu3_PFJet40_v16, 0.025/pb
+        '323790-323790',  # HLT_Mu3_PFJet40_v16, 0.025/pb
+        '323794-323794',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '323841-323841',  # HLT_Mu3_PFJet40_v16, 0.014/pb
+        '323857-323857',  # HLT_Mu3_PFJet40_v16, 0.009/pb
+        '323940-323940',  # HLT_Mu3_PFJet40_v16, 0.039/pb
+        '323954-323954',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '323976-323976',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '323978-323978',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '323980-323980',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '323983-323983',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '323997-323997',  # HLT_Mu3_PFJet40_v16, 0.012/pb
+        '324021-324022',  # HLT_Mu3_PFJet40_v16, 0.035/pb
+        '324077-324077',  # HLT_Mu3_PFJet40_v16, 0.022/pb
+        '324201-324202',  # HLT_Mu3_PFJet40_v16, 0.009/pb
+        '324205-324207',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324209-324209',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '324237-324237',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324245-324245',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '324293-324293',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '324315-324315',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324318-324318',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '324420-324420',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '324729-324729',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '324747-324747',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '324764-324765',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '324769-324769',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324772-324772',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '324785-324785',  # HLT_Mu3_PFJet40_v16, 0.003/pb
+        '324791-324791',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '324835-324835',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324840-324841',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '324846-324846',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324878-324878',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '324897-324897',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '324970-324970',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '324980-324980',  # HLT_Mu3_PFJet40_v16, 0.008/pb
+        '324997-325001',  # HLT_Mu3_PFJet40_v16, 0.006/pb
+        '325022-325022',  # HLT_Mu3_PFJet40_v16, 0.007/pb
+        '325057-325057',  # HLT_Mu3_PFJet40_v16, 0.002/pb
+        '325097-325101',  # HLT_Mu3_PFJet40_v16, 0.005/pb
+        '325110-325110',  # HLT_Mu3_PFJet40_v16, 0.0/pb
+        '325117-325117',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '325159-325159',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+        '325168-325170',  # HLT_Mu3_PFJet40_v16, 0.004/pb
+        '325172-325172',  # HLT_Mu3_PFJet40_v16, 0.001/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu8"),
+      cone_minPt = cms.double(15.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(8.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(6990), # L=8.546/pb; present in all eras; prescale factor 6990.5 (6981.9 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Mu8_v11, 0.0/pb
+        '315259-315259',  # HLT_Mu8_v11, 0.0/pb
+        '315264-315265',  # HLT_Mu8_v11, 0.001/pb
+        '315267-315267',  # HLT_Mu8_v11, 0.001/pb
+        '315270-315270',  # HLT_Mu8_v11, 0.002/pb
+        '315322-315322',  # HLT_Mu8_v11, 0.005/pb
+        '315339-315339',  # HLT_Mu8_v11, 0.003/pb
+        '315357-315357',  # HLT_Mu8_v11, 0.004/pb
+        '315361-315361',  # HLT_Mu8_v11, 0.003/pb
+        '315363-315363',  # HLT_Mu8_v11, 0.0/pb
+        '315366-315366',  # HLT_Mu8_v11, 0.003/pb
+        '315420-315420',  # HLT_Mu8_v11, 0.007/pb
+        '315488-315490',  # HLT_Mu8_v11, 0.01/pb
+        '315506-315506',  # HLT_Mu8_v11, 0.001/pb
+        '315510-315510',  # HLT_Mu8_v11, 0.004/pb
+        '315512-315512',  # HLT_Mu8_v11, 0.009/pb
+        '315543-315543',  # HLT_Mu8_v11, 0.001/pb
+        '315555-315557',  # HLT_Mu8_v11, 0.004/pb
+        '315640-315642',  # HLT_Mu8_v11, 0.003/pb
+        '315644-315648',  # HLT_Mu8_v11, 0.017/pb
+        '315689-315690',  # HLT_Mu8_v11, 0.017/pb
+        '315702-315705',  # HLT_Mu8_v11, 0.013/pb
+        '315713-315713',  # HLT_Mu8_v11, 0.014/pb
+        '315721-315721',  # HLT_Mu8_v11, 0.008/pb
+        '315741-315741',  # HLT_Mu8_v11, 0.001/pb
+        '315764-315764',  # HLT_Mu8_v11, 0.004/pb
+        '315770-315770',  # HLT_Mu8_v11, 0.005/pb
+        '315784-315786',  # HLT_Mu8_v11, 0.007/pb
+        '315790-315790',  # HLT_Mu8_v11, 0.007/pb
+        '315800-315801',  # HLT_Mu8_v11, 0.012/pb
+        '315840-315840',  # HLT_Mu8_v11, 0.014/pb
+        '315973-315974',  # HLT_Mu8_v11, 0.012/pb
+        '316058-316062',  # HLT_Mu8_v11, 0.024/pb
+        '316082-316082',  # HLT_Mu8_v11, 0.007/pb
+        '316110-316111',  # HLT_Mu8_v11, 0.005/pb
+        '316113-316114',  # HLT_Mu8_v11, 0.018/pb
+        '316153-316153',  # HLT_Mu8_v11, 0.012/pb
+        '316186-316187',  # HLT_Mu8_v11, 0.025/pb
+        '316199-316202',  # HLT_Mu8_v11, 0.027/pb
+        '316216-316219',  # HLT_Mu8_v11, 0.026/pb
+        '316239-316241',  # HLT_Mu8_v11, 0.025/pb
+        '316271-316271',  # HLT_Mu8_v11, 0.001/pb
+        '316361-316363',  # HLT_Mu8_v12, 0.004/pb
+        '316377-316380',  # HLT_Mu8_v12, 0.009/pb
+        '316455-316455',  # HLT_Mu8_v12, 0.0/pb
+        '316457-316457',  # HLT_Mu8_v12, 0.015/pb
+        '316469-316470',  # HLT_Mu8_v12, 0.012/pb
+        '316472-316472',  # HLT_Mu8_v12, 0.003/pb
+        '316505-316505',  # HLT_Mu8_v12, 0.019/pb
+        '316569-316569',  # HLT_Mu8_v12, 0.023/pb
+        '316590-316590',  # HLT_Mu8_v12, 0.009/pb
+        '316613-316613',  # HLT_Mu8_v12, 0.001/pb
+        '316615-316615',  # HLT_Mu8_v12, 0.002/pb
+        '316666-316667',  # HLT_Mu8_v12, 0.015/pb
+        '316700-316702',  # HLT_Mu8_v12, 0.016/pb
+        '316715-316723',  # HLT_Mu8_v12, 0.021/pb
+        '316758-316758',  # HLT_Mu8_v12, 0.021/pb
+        '316766-316766',  # HLT_Mu8_v12, 0.026/pb
+        '316876-316877',  # HLT_Mu8_v12, 0.015/pb
+        '316879-316879',  # HLT_Mu8_v12, 0.002/pb
+        '316928-316928',  # HLT_Mu8_v12, 0.002/pb
+        '316985-316985',  # HLT_Mu8_v12, 0.008/pb
+        '316993-316995',  # HLT_Mu8_v12, 0.012/pb
+        '317080-317080',  # HLT_Mu8_v12, 0.0/pb
+        '317087-317087',  # HLT_Mu8_v12, 0.011/pb
+        '317089-317089',  # HLT_Mu8_v12, 0.01/pb
+        '317182-317182',  # HLT_Mu8_v12, 0.019/pb
+        '317212-317213',  # HLT_Mu8_v12, 0.008/pb
+        '317279-317279',  # HLT_Mu8_v12, 0.003/pb
+        '317291-317292',  # HLT_Mu8_v12, 0.017/pb
+        '317297-317297',  # HLT_Mu8_v12, 0.006/pb
+        '317319-317320',  # HLT_Mu8_v12, 0.024/pb
+        '317338-317340',  # HLT_Mu8_v12, 0.01/pb
+        '317382-317383',  # HLT_Mu8_v12, 0.002/pb
+        '317391-317392',  # HLT_Mu8_v12, 0.023/pb
+        '317435-317435',  # HLT_Mu8_v12, 0.017/pb
+        '317438-317438',  # HLT_Mu8_v12, 0.002/pb
+        '317475-317475',  # HLT_Mu8_v12, 0.001/pb
+        '317478-317478',  # HLT_Mu8_v12, 0.0/pb
+        '317484-317484',  # HLT_Mu8_v12, 0.007/pb
+        '317488-317488',  # HLT_Mu8_v12, 0.008/pb
+        '317527-317527',  # HLT_Mu8_v12, 0.021/pb
+        '317591-317591',  # HLT_Mu8_v12, 0.005/pb
+        '317626-317626',  # HLT_Mu8_v12, 0.025/pb
+        '317640-317641',  # HLT_Mu8_v12, 0.025/pb
+        '317648-317650',  # HLT_Mu8_v12, 0.023/pb
+        '317661-317661',  # HLT_Mu8_v12, 0.018/pb
+        '317663-317663',  # HLT_Mu8_v12, 0.007/pb
+        '317683-317683',  # HLT_Mu8_v12, 0.005/pb
+        '317696-317696',  # HLT_Mu8_v12, 0.011/pb
+        '318733-318733',  # HLT_Mu8_v12, 0.0/pb
+        '318828-318828',  # HLT_Mu8_v12, 0.001/pb
+        '318872-318872',  # HLT_Mu8_v12, 0.004/pb
+        '318874-318874',  # HLT_Mu8_v12, 0.005/pb
+        '318876-318877',  # HLT_Mu8_v12, 0.01/pb
+        '319077-319077',  # HLT_Mu8_v12, 0.001/pb
+        '319337-319337',  # HLT_Mu8_v12, 0.011/pb
+        '319347-319349',  # HLT_Mu8_v12, 0.012/pb
+        '319449-319450',  # HLT_Mu8_v12, 0.021/pb
+        '319456-319456',  # HLT_Mu8_v12, 0.002/pb
+        '319459-319459',  # HLT_Mu8_v12, 0.001/pb
+        '319486-319486',  # HLT_Mu8_v12, 0.001/pb
+        '319503-319503',  # HLT_Mu8_v12, 0.004/pb
+        '319524-319524',  # HLT_Mu8_v12, 0.021/pb
+        '319526-319526',  # HLT_Mu8_v12, 0.003/pb
+        '319528-319528',  # HLT_Mu8_v12, 0.011/pb
+        '319579-319579',  # HLT_Mu8_v12, 0.038/pb
+        '319625-319625',  # HLT_Mu8_v12, 0.011/pb
+        '319639-319639',  # HLT_Mu8_v12, 0.081/pb
+        '319656-319659',  # HLT_Mu8_v12, 0.045/pb
+        '319678-319678',  # HLT_Mu8_v12, 0.017/pb
+        '319687-319687',  # HLT_Mu8_v12, 0.003/pb
+        '319697-319698',  # HLT_Mu8_v12, 0.022/pb
+        '319756-319756',  # HLT_Mu8_v12, 0.104/pb
+        '319840-319841',  # HLT_Mu8_v12, 0.016/pb
+        '319847-319849',  # HLT_Mu8_v12, 0.036/pb
+        '319851-319851',  # HLT_Mu8_v12, 0.0/pb
+        '319853-319854',  # HLT_Mu8_v12, 0.028/pb
+        '319908-319910',  # HLT_Mu8_v12, 0.072/pb
+        '319912-319915',  # HLT_Mu8_v12, 0.027/pb
+        '319941-319942',  # HLT_Mu8_v12, 0.019/pb
+        '319950-319950',  # HLT_Mu8_v12, 0.01/pb
+        '319991-319993',  # HLT_Mu8_v12, 0.109/pb
+        '320002-320002',  # HLT_Mu8_v12, 0.008/pb
+        '320006-320006',  # HLT_Mu8_v12, 0.023/pb
+        '320010-320012',  # HLT_Mu8_v12, 0.034/pb
+        '320023-320026',  # HLT_Mu8_v12, 0.062/pb
+        '320038-320040',  # HLT_Mu8_v12, 0.082/pb
+        '320059-320065',  # HLT_Mu8_v12, 0.083/pb
+        '320673-320674',  # HLT_Mu8_v12, 0.022/pb
+        '320688-320688',  # HLT_Mu8_v12, 0.029/pb
+        '320712-320712',  # HLT_Mu8_v12, 0.013/pb
+        '320757-320757',  # HLT_Mu8_v12, 0.022/pb
+        '320804-320804',  # HLT_Mu8_v12, 0.069/pb
+        '320807-320807',  # HLT_Mu8_v12, 0.002/pb
+        '320809-320809',  # HLT_Mu8_v12, 0.024/pb
+        '320821-320824',  # HLT_Mu8_v12, 0.099/pb
+        '320838-320838',  # HLT_Mu8_v12, 0.017/pb
+        '320840-320841',  # HLT_Mu8_v12, 0.042/pb
+        '320853-320859',  # HLT_Mu8_v12, 0.091/pb
+        '320887-320888',  # HLT_Mu8_v12, 0.019/pb
+        '320916-320917',  # HLT_Mu8_v12, 0.103/pb
+        '320920-320920',  # HLT_Mu8_v12, 0.005/pb
+        '320933-320934',  # HLT_Mu8_v12, 0.058/pb
+        '320936-320936',  # HLT_Mu8_v12, 0.017/pb
+        '320941-320941',  # HLT_Mu8_v12, 0.003/pb
+        '320980-320980',  # HLT_Mu8_v12, 0.006/pb
+        '320995-320996',  # HLT_Mu8_v12, 0.017/pb
+        '321004-321007',  # HLT_Mu8_v12, 0.07/pb
+        '321009-321012',  # HLT_Mu8_v12, 0.024/pb
+        '321051-321051',  # HLT_Mu8_v12, 0.064/pb
+        '321055-321055',  # HLT_Mu8_v12, 0.028/pb
+        '321067-321069',  # HLT_Mu8_v12, 0.079/pb
+        '321119-321119',  # HLT_Mu8_v12, 0.009/pb
+        '321121-321122',  # HLT_Mu8_v12, 0.028/pb
+        '321124-321124',  # HLT_Mu8_v12, 0.041/pb
+        '321126-321126',  # HLT_Mu8_v12, 0.017/pb
+        '321134-321134',  # HLT_Mu8_v12, 0.002/pb
+        '321138-321138',  # HLT_Mu8_v12, 0.032/pb
+        '321140-321140',  # HLT_Mu8_v12, 0.026/pb
+        '321149-321149',  # HLT_Mu8_v12, 0.089/pb
+        '321165-321167',  # HLT_Mu8_v12, 0.058/pb
+        '321177-321178',  # HLT_Mu8_v12, 0.03/pb
+        '321218-321219',  # HLT_Mu8_v12, 0.095/pb
+        '321221-321221',  # HLT_Mu8_v12, 0.001/pb
+        '321230-321233',  # HLT_Mu8_v12, 0.052/pb
+        '321262-321262',  # HLT_Mu8_v12, 0.0/pb
+        '321283-321283',  # HLT_Mu8_v12, 0.019/pb
+        '321294-321296',  # HLT_Mu8_v12, 0.05/pb
+        '321305-321305',  # HLT_Mu8_v12, 0.124/pb
+        '321311-321313',  # HLT_Mu8_v12, 0.019/pb
+        '321393-321393',  # HLT_Mu8_v12, 0.008/pb
+        '321396-321397',  # HLT_Mu8_v12, 0.089/pb
+        '321414-321415',  # HLT_Mu8_v12, 0.106/pb
+        '321431-321434',  # HLT_Mu8_v12, 0.058/pb
+        '321436-321436',  # HLT_Mu8_v12, 0.031/pb
+        '321457-321457',  # HLT_Mu8_v12, 0.098/pb
+        '321461-321461',  # HLT_Mu8_v12, 0.005/pb
+        '321475-321475',  # HLT_Mu8_v12, 0.099/pb
+        '321710-321710',  # HLT_Mu8_v12, 0.003/pb
+        '321712-321712',  # HLT_Mu8_v12, 0.017/pb
+        '321730-321730',  # HLT_Mu8_v12, 0.017/pb
+        '321732-321732',  # HLT_Mu8_v12, 0.076/pb
+        '321735-321735',  # HLT_Mu8_v12, 0.005/pb
+        '321755-321755',  # HLT_Mu8_v12, 0.039/pb
+        '321758-321758',  # HLT_Mu8_v12, 0.008/pb
+        '321760-321760',  # HLT_Mu8_v12, 0.033/pb
+        '321773-321778',  # HLT_Mu8_v12, 0.034/pb
+        '321780-321781',  # HLT_Mu8_v12, 0.041/pb
+        '321813-321813',  # HLT_Mu8_v12, 0.021/pb
+        '321815-321815',  # HLT_Mu8_v12, 0.001/pb
+        '321817-321818',  # HLT_Mu8_v12, 0.064/pb
+        '321820-321820',  # HLT_Mu8_v12, 0.007/pb
+        '321831-321834',  # HLT_Mu8_v12, 0.103/pb
+        '321879-321880',  # HLT_Mu8_v12, 0.027/pb
+        '321887-321887',  # HLT_Mu8_v12, 0.057/pb
+        '321908-321909',  # HLT_Mu8_v12, 0.103/pb
+        '321917-321917',  # HLT_Mu8_v12, 0.052/pb
+        '321919-321919',  # HLT_Mu8_v12, 0.0/pb
+        '321933-321933',  # HLT_Mu8_v12, 0.018/pb
+        '321960-321961',  # HLT_Mu8_v12, 0.024/pb
+        '321973-321973',  # HLT_Mu8_v12, 0.074/pb
+        '321975-321975',  # HLT_Mu8_v12, 0.033/pb
+        '321988-321988',  # HLT_Mu8_v12, 0.079/pb
+        '321990-321990',  # HLT_Mu8_v12, 0.018/pb
+        '322013-322014',  # HLT_Mu8_v12, 0.001/pb
+        '322022-322022',  # HLT_Mu8_v12, 0.096/pb
+        '322040-322040',  # HLT_Mu8_v12, 0.002/pb
+        '322057-322057',  # HLT_Mu8_v12, 0.001/pb
+        '322068-322068',  # HLT_Mu8_v12, 0.044/pb
+        '322079-322079',  # HLT_Mu8_v12, 0.023/pb
+        '322106-322106',  # HLT_Mu8_v12, 0.054/pb
+        '322113-322113',  # HLT_Mu8_v12, 0.006/pb
+        '322118-322118',  # HLT_Mu8_v12, 0.055/pb
+        '322179-322179',  # HLT_Mu8_v12, 0.098/pb
+        '322201-322201',  # HLT_Mu8_v12, 0.013/pb
+        '322204-322204',  # HLT_Mu8_v12, 0.067/pb
+        '322222-322222',  # HLT_Mu8_v12, 0.021/pb
+        '322252-322252',  # HLT_Mu8_v12, 0.088/pb
+        '322317-322317',  # HLT_Mu8_v12, 0.003/pb
+        '322319-322319',  # HLT_Mu8_v12, 0.01/pb
+        '322322-322322',  # HLT_Mu8_v12, 0.064/pb
+        '322324-322324',  # HLT_Mu8_v12, 0.015/pb
+        '322332-322332',  # HLT_Mu8_v12, 0.064/pb
+        '322348-322348',  # HLT_Mu8_v12, 0.086/pb
+        '322355-322356',  # HLT_Mu8_v12, 0.056/pb
+        '322381-322381',  # HLT_Mu8_v12, 0.036/pb
+        '322407-322407',  # HLT_Mu8_v12, 0.036/pb
+        '322430-322431',  # HLT_Mu8_v12, 0.078/pb
+        '322480-322480',  # HLT_Mu8_v12, 0.022/pb
+        '322492-322492',  # HLT_Mu8_v12, 0.064/pb
+        '322510-322510',  # HLT_Mu8_v12, 0.0/pb
+        '322599-322599',  # HLT_Mu8_v12, 0.016/pb
+        '322602-322603',  # HLT_Mu8_v12, 0.005/pb
+        '322605-322605',  # HLT_Mu8_v12, 0.019/pb
+        '322617-322617',  # HLT_Mu8_v12, 0.03/pb
+        '322625-322625',  # HLT_Mu8_v12, 0.069/pb
+        '322633-322633',  # HLT_Mu8_v12, 0.011/pb
+        '323414-323414',  # HLT_Mu8_v12, 0.001/pb
+        '323423-323423',  # HLT_Mu8_v12, 0.005/pb
+        '323470-323475',  # HLT_Mu8_v12, 0.066/pb
+        '323487-323488',  # HLT_Mu8_v12, 0.072/pb
+        '323492-323493',  # HLT_Mu8_v12, 0.007/pb
+        '323495-323495',  # HLT_Mu8_v12, 0.007/pb
+        '323524-323526',  # HLT_Mu8_v12, 0.105/pb
+        '323693-323693',  # HLT_Mu8_v12, 0.007/pb
+        '323696-323696',  # HLT_Mu8_v12, 0.018/pb
+        '323702-323702',  # HLT_Mu8_v12, 0.033/pb
+        '323725-323727',  # HLT_Mu8_v12, 0.079/pb
+        '323755-323755',  # HLT_Mu8_v12, 0.059/pb
+        '323775-323775',  # HLT_Mu8_v12, 0.008/pb
+        '323778-323778',  # HLT_Mu8_v12, 0.059/pb
+        '323790-323790',  # HLT_Mu8_v12, 0.058/pb
+        '323794-323794',  # HLT_Mu8_v12, 0.004/pb
+        '323841-323841',  # HLT_Mu8_v12, 0.031/pb
+        '323857-323857',  # HLT_Mu8_v12, 0.021/pb
+        '323940-323940',  # HLT_Mu8_v12, 0.087/pb
+        '323954-323954',  # HLT_Mu8_v12, 0.003/pb
+        '323976-323976',  # HLT_Mu8_v12, 0.002/pb
+        '323978-323978',  # HLT_Mu8_v12, 0.003/pb
+        '323980-323980',  # HLT_Mu8_v12, 0.013/pb
+        '323983-323983',  # HLT_Mu8_v12, 0.013/pb
+        '323997-323997',  # HLT_Mu8_v12, 0.029/pb
+        '324021-324022',  # HLT_Mu8_v12, 0.077/pb
+        '324077-324077',  # HLT_Mu8_v12, 0.046/pb
+        '324201-324202',  # HLT_Mu8_v12, 0.086/pb
+        '324205-324207',  # HLT_Mu8_v12, 0.01/pb
+        '324209-324209',  # HLT_Mu8_v12, 0.004/pb
+        '324237-324237',  # HLT_Mu8_v12, 0.013/pb
+        '324245-324245',  # HLT_Mu8_v12, 0.09/pb
+        '324293-324293',  # HLT_Mu8_v12, 0.11/pb
+        '324315-324315',  # HLT_Mu8_v12, 0.013/pb
+        '324318-324318',  # HLT_Mu8_v12, 0.022/pb
+        '324420-324420',  # HLT_Mu8_v12, 0.042/pb
+        '324729-324729',  # HLT_Mu8_v12, 0.003/pb
+        '324747-324747',  # HLT_Mu8_v12, 0.064/pb
+        '324764-324765',  # HLT_Mu8_v12, 0.026/pb
+        '324769-324769',  # HLT_Mu8_v12, 0.01/pb
+        '324772-324772',  # HLT_Mu8_v12, 0.004/pb
+        '324785-324785',  # HLT_Mu8_v12, 0.038/pb
+        '324791-324791',  # HLT_Mu8_v12, 0.055/pb
+        '324835-324835',  # HLT_Mu8_v12, 0.015/pb
+        '324840-324841',  # HLT_Mu8_v12, 0.073/pb
+        '324846-324846',  # HLT_Mu8_v12, 0.015/pb
+        '324878-324878',  # HLT_Mu8_v12, 0.088/pb
+        '324897-324897',  # HLT_Mu8_v12, 0.008/pb
+        '324970-324970',  # HLT_Mu8_v12, 0.101/pb
+        '324980-324980',  # HLT_Mu8_v12, 0.109/pb
+        '324997-325001',  # HLT_Mu8_v12, 0.079/pb
+        '325022-325022',  # HLT_Mu8_v12, 0.088/pb
+        '325057-325057',  # HLT_Mu8_v12, 0.022/pb
+        '325097-325101',  # HLT_Mu8_v12, 0.072/pb
+        '325110-325110',  # HLT_Mu8_v12, 0.001/pb
+        '325117-325117',  # HLT_Mu8_v12, 0.019/pb
+        '325159-325159',  # HLT_Mu8_v12, 0.013/pb
+        '325168-325170',  # HLT_Mu8_v12, 0.061/pb
+        '325172-325172',  # HLT_Mu8_v12, 0.015/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu17"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(17.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(1305), # L=45.781/pb; present in all eras; prescale factor 1304.9 (1307.1 from delivery)
+      trigger_type = cms.string('2mu'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Mu17_v11, 0.006/pb
+        '315259-315259',  # HLT_Mu17_v11, 0.011/pb
+        '315264-315265',  # HLT_Mu17_v11, 0.036/pb
+        '315267-315267',  # HLT_Mu17_v11, 0.029/pb
+        '315270-315270',  # HLT_Mu17_v11, 0.061/pb
+        '315322-315322',  # HLT_Mu17_v11, 0.139/pb
+        '315339-315339',  # HLT_Mu17_v11, 0.072/pb
+        '315357-315357',  # HLT_Mu17_v11, 0.117/pb
+        '315361-315361',  # HLT_Mu17_v11, 0.091/pb
+        '315363-315363',  # HLT_Mu17_v11, 0.011/pb
+        '315366-315366',  # HLT_Mu17_v11, 0.077/pb
+        '315420-315420',  # HLT_Mu17_v11, 0.199/pb
+        '315488-315490',  # HLT_Mu17_v11, 0.228/pb
+        '315506-315506',  # HLT_Mu17_v11, 0.022/pb
+        '315510-315510',  # HLT_Mu17_v11, 0.079/pb
+        '315512-315512',  # HLT_Mu17_v11, 0.182/pb
+        '315543-315543',  # HLT_Mu17_v11, 0.028/pb
+        '315555-315557',  # HLT_Mu17_v11, 0.088/pb
+        '315640-315642',  # HLT_Mu17_v11, 0.033/pb
+        '315644-315648',  # HLT_Mu17_v11, 0.338/pb
+        '315689-315690',  # HLT_Mu17_v11, 0.345/pb
+        '315702-315705',  # HLT_Mu17_v11, 0.253/pb
+        '315713-315713',  # HLT_Mu17_v11, 0.272/pb
+        '315721-315721',  # HLT_Mu17_v11, 0.162/pb
+        '315741-315741',  # HLT_Mu17_v11, 0.018/pb
+        '315764-315764',  # HLT_Mu17_v11, 0.088/pb
+        '315770-315770',  # HLT_Mu17_v11, 0.094/pb
+        '315784-315786',  # HLT_Mu17_v11, 0.138/pb
+        '315790-315790',  # HLT_Mu17_v11, 0.133/pb
+        '315800-315801',  # HLT_Mu17_v11, 0.234/pb
+        '315840-315840',  # HLT_Mu17_v11, 0.272/pb
+        '315973-315974',  # HLT_Mu17_v11/HLT_Mu17_v12, 0.241/pb
+        '316060-316061',  # HLT_Mu17_v12, 0.294/pb
+        '316082-316082',  # HLT_Mu17_v12, 0.027/pb
+        '316110-316111',  # HLT_Mu17_v12, 0.075/pb
+        '316113-316114',  # HLT_Mu17_v12, 0.299/pb
+        '316153-316153',  # HLT_Mu17_v12, 0.197/pb
+        '316186-316187',  # HLT_Mu17_v12, 0.406/pb
+        '316199-316202',  # HLT_Mu17_v12, 0.453/pb
+        '316216-316219',  # HLT_Mu17_v12, 0.424/pb
+        '316239-316241',  # HLT_Mu17_v12, 0.42/pb
+        '316271-316271',  # HLT_Mu17_v12, 0.023/pb
+        '316361-316363',  # HLT_Mu17_v13, 0.065/pb
+        '316377-316380',  # HLT_Mu17_v13, 0.145/pb
+        '316455-316455',  # HLT_Mu17_v13, 0.007/pb
+        '316457-316457',  # HLT_Mu17_v13, 0.251/pb
+        '316469-316470',  # HLT_Mu17_v13, 0.204/pb
+        '316472-316472',  # HLT_Mu17_v13, 0.051/pb
+        '316505-316505',  # HLT_Mu17_v13, 0.309/pb
+        '316569-316569',  # HLT_Mu17_v13, 0.374/pb
+        '316590-316590',  # HLT_Mu17_v13, 0.146/pb
+        '316613-316613',  # HLT_Mu17_v13, 0.024/pb
+        '316615-316615',  # HLT_Mu17_v13, 0.038/pb
+        '316666-316667',  # HLT_Mu17_v13, 0.247/pb
+        '316700-316702',  # HLT_Mu17_v13, 0.272/pb
+        '316715-316723',  # HLT_Mu17_v13, 0.339/pb
+        '316758-316758',  # HLT_Mu17_v13, 0.351/pb
+        '316766-316766',  # HLT_Mu17_v13, 0.432/pb
+        '316876-316877',  # HLT_Mu17_v13, 0.252/pb
+        '316879-316879',  # HLT_Mu17_v13, 0.028/pb
+        '316928-316928',  # HLT_Mu17_v13, 0.034/pb
+        '316985-316985',  # HLT_Mu17_v13, 0.133/pb
+        '316993-316995',  # HLT_Mu17_v13, 0.204/pb
+        '317080-317080',  # HLT_Mu17_v13, 0.006/pb
+        '317087-317087',  # HLT_Mu17_v13, 0.187/pb
+        '317089-317089',  # HLT_Mu17_v13, 0.164/pb
+        '317182-317182',  # HLT_Mu17_v13, 0.312/pb
+        '317212-317213',  # HLT_Mu17_v13, 0.136/pb
+        '317279-317279',  # HLT_Mu17_v13, 0.051/pb
+        '317291-317292',  # HLT_Mu17_v13, 0.276/pb
+        '317297-317297',  # HLT_Mu17_v13, 0.095/pb
+        '317319-317320',  # HLT_Mu17_v13, 0.396/pb
+        '317338-317340',  # HLT_Mu17_v13, 0.169/pb
+        '317382-317383',  # HLT_Mu17_v13, 0.036/pb
+        '317391-317392',  # HLT_Mu17_v13, 0.38/pb
+        '317435-317435',  # HLT_Mu17_v13, 0.277/pb
+        '317438-317438',  # HLT_Mu17_v13, 0.038/pb
+        '317475-317475',  # HLT_Mu17_v13, 0.02/pb
+        '317478-317478',  # HLT_Mu17_v13, 0.006/pb
+        '317484-317484',  # HLT_Mu17_v13, 0.123/pb
+        '317488-317488',  # HLT_Mu17_v13, 0.139/pb
+        '317527-317527',  # HLT_Mu17_v13, 0.348/pb
+        '317591-317591',  # HLT_Mu17_v13, 0.085/pb
+        '317626-317626',  # HLT_Mu17_v13, 0.407/pb
+        '317640-317641',  # HLT_Mu17_v13, 0.407/pb
+        '317648-317650',  # HLT_Mu17_v13, 0.372/pb
+        '317661-317661',  # HLT_Mu17_v13, 0.289/pb
+        '317663-317663',  # HLT_Mu17_v13, 0.118/pb
+        '317683-317683',  # HLT_Mu17_v13, 0.091/pb
+        '317696-317696',  # HLT_Mu17_v13, 0.176/pb
+        '318733-318733',  # HLT_Mu17_v13, 0.002/pb
+        '318828-318828',  # HLT_Mu17_v13, 0.01/pb
+        '318872-318872',  # HLT_Mu17_v13, 0.071/pb
+        '318874-318874',  # HLT_Mu17_v13, 0.077/pb
+        '318876-318877',  # HLT_Mu17_v13, 0.159/pb
+        '319077-319077',  # HLT_Mu17_v13, 0.013/pb
+        '319337-319337',  # HLT_Mu17_v13, 0.179/pb
+        '319347-319349',  # HLT_Mu17_v13, 0.197/pb
+        '319449-319450',  # HLT_Mu17_v13, 0.351/pb
+        '319456-319456',  # HLT_Mu17_v13, 0.04/pb
+        '319459-319459',  # HLT_Mu17_v13, 0.013/pb
+        '319486-319486',  # HLT_Mu17_v13, 0.016/pb
+        '319503-319503',  # HLT_Mu17_v13, 0.07/pb
+        '319524-319524',  # HLT_Mu17_v13, 0.351/pb
+        '319526-319526',  # HLT_Mu17_v13, 0.054/pb
+        '319528-319528',  # HLT_Mu17_v13, 0.045/pb
+        '319579-319579',  # HLT_Mu17_v13, 0.63/pb
+        '319625-319625',  # HLT_Mu17_v13, 0.054/pb
+        '319639-319639',  # HLT_Mu17_v13, 0.315/pb
+        '319656-319659',  # HLT_Mu17_v13, 0.171/pb
+        '319678-319678',  # HLT_Mu17_v13, 0.073/pb
+        '319687-319687',  # HLT_Mu17_v13, 0.012/pb
+        '319697-319698',  # HLT_Mu17_v13, 0.075/pb
+        '319756-319756',  # HLT_Mu17_v13, 0.377/pb
+        '319840-319841',  # HLT_Mu17_v13, 0.054/pb
+        '319847-319849',  # HLT_Mu17_v13, 0.149/pb
+        '319851-319851',  # HLT_Mu17_v13, 0.001/pb
+        '319853-319854',  # HLT_Mu17_v13, 0.096/pb
+        '319908-319910',  # HLT_Mu17_v13, 0.249/pb
+        '319912-319915',  # HLT_Mu17_v13, 0.092/pb
+        '319941-319942',  # HLT_Mu17_v13, 0.086/pb
+        '319950-319950',  # HLT_Mu17_v13, 0.051/pb
+        '319991-319993',  # HLT_Mu17_v13, 0.408/pb
+        '320002-320002',  # HLT_Mu17_v13, 0.039/pb
+        '320006-320006',  # HLT_Mu17_v13, 0.088/pb
+        '320010-320012',  # HLT_Mu17_v13, 0.118/pb
+        '320023-320026',  # HLT_Mu17_v13, 0.235/pb
+        '320038-320040',  # HLT_Mu17_v13, 0.311/pb
+        '320059-320065',  # HLT_Mu17_v13, 0.305/pb
+        '320673-320674',  # HLT_Mu17_v13, 0.076/pb
+        '320688-320688',  # HLT_Mu17_v13, 0.101/pb
+        '320712-320712',  # HLT_Mu17_v13, 0.054/pb
+        '320757-320757',  # HLT_Mu17_v13, 0.09/pb
+        '320804-320804',  # HLT_Mu17_v13, 0.245/pb
+        '320807-320807',  # HLT_Mu17_v13, 0.0/pb
+        '320809-320809',  # HLT_Mu17_v13, 0.082/pb
+        '320821-320824',  # HLT_Mu17_v13, 0.349/pb
+        '320838-320838',  # HLT_Mu17_v13, 0.071/pb
+        '320840-320841',  # HLT_Mu17_v13, 0.147/pb
+        '320853-320859',  # HLT_Mu17_v13, 0.333/pb
+        '320887-320888',  # HLT_Mu17_v13, 0.088/pb
+        '320916-320917',  # HLT_Mu17_v13, 0.373/pb
+        '320920-320920',  # HLT_Mu17_v13, 0.018/pb
+        '320933-320934',  # HLT_Mu17_v13, 0.202/pb
+        '320936-320936',  # HLT_Mu17_v13, 0.06/pb
+        '320941-320941',  # HLT_Mu17_v13, 0.012/pb
+        '320980-320980',  # HLT_Mu17_v13, 0.03/pb
+        '320995-320996',  # HLT_Mu17_v13, 0.057/pb
+        '321004-321007',  # HLT_Mu17_v13, 0.247/pb
+        '321009-321012',  # HLT_Mu17_v13, 0.081/pb
+        '321051-321051',  # HLT_Mu17_v13, 0.24/pb
+        '321055-321055',  # HLT_Mu17_v13, 0.097/pb
+        '321067-321069',  # HLT_Mu17_v13, 0.284/pb
+        '321119-321119',  # HLT_Mu17_v13, 0.045/pb
+        '321121-321122',  # HLT_Mu17_v13, 0.105/pb
+        '321124-321124',  # HLT_Mu17_v13, 0.143/pb
+        '321126-321126',  # HLT_Mu17_v13, 0.061/pb
+        '321134-321134',  # HLT_Mu17_v13, 0.006/pb
+        '321138-321138',  # HLT_Mu17_v13, 0.109/pb
+        '321140-321140',  # HLT_Mu17_v13, 0.09/pb
+        '321149-321149',  # HLT_Mu17_v13, 0.334/pb
+        '321165-321167',  # HLT_Mu17_v13, 0.214/pb
+        '321177-321178',  # HLT_Mu17_v13, 0.134/pb
+        '321218-321219',  # HLT_Mu17_v13, 0.357/pb
+        '321221-321221',  # HLT_Mu17_v13, 0.005/pb
+        '321230-321233',  # HLT_Mu17_v13, 0.212/pb
+        '321262-321262',  # HLT_Mu17_v13, 0.001/pb
+        '321283-321283',  # HLT_Mu17_v13, 0.092/pb
+        '321294-321296',  # HLT_Mu17_v13, 0.18/pb
+        '321305-321305',  # HLT_Mu17_v13, 0.463/pb
+        '321311-321313',  # HLT_Mu17_v13, 0.067/pb
+        '321393-321393',  # HLT_Mu17_v13, 0.038/pb
+        '321396-321397',  # HLT_Mu17_v13, 0.321/pb
+        '321414-321415',  # HLT_Mu17_v13, 0.402/pb
+        '321431-321434',  # HLT_Mu17_v13, 0.228/pb
+        '321436-321436',  # HLT_Mu17_v13, 0.106/pb
+        '321457-321457',  # HLT_Mu17_v13, 0.371/pb
+        '321461-321461',  # HLT_Mu17_v13, 0.016/pb
+        '321475-321475',  # HLT_Mu17_v13, 0.363/pb
+        '321710-321710',  # HLT_Mu17_v13, 0.013/pb
+        '321712-321712',  # HLT_Mu17_v13, 0.065/pb
+        '321730-321730',  # HLT_Mu17_v13, 0.079/pb
+        '321732-321732',  # HLT_Mu17_v13, 0.265/pb
+        '321735-321735',  # HLT_Mu17_v13, 0.018/pb
+        '321755-321755',  # HLT_Mu17_v13, 0.164/pb
+        '321758-321758',  # HLT_Mu17_v13, 0.029/pb
+        '321760-321760',  # HLT_Mu17_v13, 0.112/pb
+        '321773-321778',  # HLT_Mu17_v13, 0.134/pb
+        '321780-321781',  # HLT_Mu17_v13, 0.14/pb
+        '321813-321813',  # HLT_Mu17_v13, 0.092/pb
+        '321815-321815',  # HLT_Mu17_v13, 0.004/pb
+        '321817-321818',  # HLT_Mu17_v13, 0.22/pb
+        '321820-321820',  # HLT_Mu17_v13, 0.025/pb
+        '321831-321834',  # HLT_Mu17_v13, 0.375/pb
+        '321879-321880',  # HLT_Mu17_v13, 0.101/pb
+        '321887-321887',  # HLT_Mu17_v13, 0.213/pb
+        '321908-321909',  # HLT_Mu17_v13, 0.374/pb
+        '321917-321917',  # HLT_Mu17_v13, 0.201/pb
+        '321919-321919',  # HLT_Mu17_v13, 0.001/pb
+        '321933-321933',  # HLT_Mu17_v13, 0.078/pb
+        '321960-321961',  # HLT_Mu17_v13, 0.107/pb
+        '321973-321973',  # HLT_Mu17_v13, 0.276/pb
+        '321975-321975',  # HLT_Mu17_v13, 0.112/pb
+        '321988-321988',  # HLT_Mu17_v13, 0.295/pb
+        '321990-321990',  # HLT_Mu17_v13, 0.062/pb
+        '322013-322014',  # HLT_Mu17_v13, 0.006/pb
+        '322022-322022',  # HLT_Mu17_v13, 0.348/pb
+        '322040-322040',  # HLT_Mu17_v13, 0.011/pb
+        '322057-322057',  # HLT_Mu17_v13, 0.006/pb
+        '322068-322068',  # HLT_Mu17_v13, 0.179/pb
+        '322079-322079',  # HLT_Mu17_v13, 0.108/pb
+        '322106-322106',  # HLT_Mu17_v13, 0.217/pb
+        '322113-322113',  # HLT_Mu17_v13, 0.031/pb
+        '322118-322118',  # HLT_Mu17_v13, 0.206/pb
+        '322179-322179',  # HLT_Mu17_v13, 0.361/pb
+        '322201-322201',  # HLT_Mu17_v13, 0.065/pb
+        '322204-322204',  # HLT_Mu17_v13, 0.239/pb
+        '322222-322222',  # HLT_Mu17_v13, 0.071/pb
+        '322252-322252',  # HLT_Mu17_v13, 0.323/pb
+        '322317-322317',  # HLT_Mu17_v13, 0.015/pb
+        '322319-322319',  # HLT_Mu17_v13, 0.043/pb
+        '322322-322322',  # HLT_Mu17_v13, 0.225/pb
+        '322324-322324',  # HLT_Mu17_v13, 0.053/pb
+        '322332-322332',  # HLT_Mu17_v13, 0.242/pb
+        '322348-322348',  # HLT_Mu17_v13, 0.319/pb
+        '322355-322356',  # HLT_Mu17_v13, 0.207/pb
+        '322381-322381',  # HLT_Mu17_v13, 0.137/pb
+        '322407-322407',  # HLT_Mu17_v13, 0.131/pb
+        '322430-322431',  # HLT_Mu17_v13, 0.285/pb
+        '322480-322480',  # HLT_Mu17_v13, 0.084/pb
+        '322492-322492',  # HLT_Mu17_v13, 0.221/pb
+        '322510-322510',  # HLT_Mu17_v13, 0.002/pb
+        '322599-322599',  # HLT_Mu17_v13, 0.073/pb
+        '322602-322603',  # HLT_Mu17_v13, 0.021/pb
+        '322605-322605',  # HLT_Mu17_v13, 0.069/pb
+        '322617-322617',  # HLT_Mu17_v13, 0.105/pb
+        '322625-322625',  # HLT_Mu17_v13, 0.258/pb
+        '322633-322633',  # HLT_Mu17_v13, 0.039/pb
+        '323414-323414',  # HLT_Mu17_v13, 0.005/pb
+        '323423-323423',  # HLT_Mu17_v13, 0.016/pb
+        '323470-323475',  # HLT_Mu17_v13, 0.247/pb
+        '323487-323488',  # HLT_Mu17_v13, 0.262/pb
+        '323492-323493',  # HLT_Mu17_v13, 0.026/pb
+        '323495-323495',  # HLT_Mu17_v13, 0.025/pb
+        '323524-323526',  # HLT_Mu17_v13, 0.37/pb
+        '323693-323693',  # HLT_Mu17_v13, 0.031/pb
+        '323696-323696',  # HLT_Mu17_v13, 0.068/pb
+        '323702-323702',  # HLT_Mu17_v13, 0.112/pb
+        '323725-323727',  # HLT_Mu17_v13, 0.292/pb
+        '323755-323755',  # HLT_Mu17_v13, 0.228/pb
+        '323775-323775',  # HLT_Mu17_v13, 0.036/pb
+        '323778-323778',  # HLT_Mu17_v13, 0.208/pb
+        '323790-323790',  # HLT_Mu17_v13, 0.213/pb
+        '323794-323794',  # HLT_Mu17_v13, 0.012/pb
+        '323841-323841',  # HLT_Mu17_v13, 0.119/pb
+        '323857-323857',  # HLT_Mu17_v13, 0.073/pb
+        '323940-323940',  # HLT_Mu17_v13, 0.328/pb
+        '323954-323954',  # HLT_Mu17_v13, 0.012/pb
+        '323976-323976',  # HLT_Mu17_v13, 0.011/pb
+        '323978-323978',  # HLT_Mu17_v13, 0.017/pb
+        '323980-323980',  # HLT_Mu17_v13, 0.052/pb
+        '323983-323983',  # HLT_Mu17_v13, 0.044/pb
+        '323997-323997',  # HLT_Mu17_v13, 0.099/pb
+        '324021-324022',  # HLT_Mu17_v13, 0.293/pb
+        '324077-324077',  # HLT_Mu17_v13, 0.187/pb
+        '324201-324202',  # HLT_Mu17_v13, 0.309/pb
+        '324205-324207',  # HLT_Mu17_v13, 0.034/pb
+        '324209-324209',  # HLT_Mu17_v13, 0.012/pb
+        '324237-324237',  # HLT_Mu17_v13, 0.058/pb
+        '324245-324245',  # HLT_Mu17_v13, 0.321/pb
+        '324293-324293',  # HLT_Mu17_v13, 0.395/pb
+        '324315-324315',  # HLT_Mu17_v13, 0.054/pb
+        '324318-324318',  # HLT_Mu17_v13, 0.077/pb
+        '324420-324420',  # HLT_Mu17_v13, 0.154/pb
+        '324729-324729',  # HLT_Mu17_v13, 0.011/pb
+        '324747-324747',  # HLT_Mu17_v13, 0.237/pb
+        '324764-324765',  # HLT_Mu17_v13, 0.091/pb
+        '324769-324769',  # HLT_Mu17_v13, 0.036/pb
+        '324772-324772',  # HLT_Mu17_v13, 0.014/pb
+        '324785-324785',  # HLT_Mu17_v13, 0.143/pb
+        '324791-324791',  # HLT_Mu17_v13, 0.188/pb
+        '324835-324835',  # HLT_Mu17_v13, 0.066/pb
+        '324840-324841',  # HLT_Mu17_v13, 0.253/pb
+        '324846-324846',  # HLT_Mu17_v13, 0.053/pb
+        '324878-324878',  # HLT_Mu17_v13, 0.31/pb
+        '324897-324897',  # HLT_Mu17_v13, 0.039/pb
+        '324970-324970',  # HLT_Mu17_v13, 0.369/pb
+        '324980-324980',  # HLT_Mu17_v13, 0.395/pb
+        '324997-325001',  # HLT_Mu17_v13, 0.285/pb
+        '325022-325022',  # HLT_Mu17_v13, 0.333/pb
+        '325057-325057',  # HLT_Mu17_v13, 0.092/pb
+        '325097-325101',  # HLT_Mu17_v13, 0.271/pb
+        '325110-325110',  # HLT_Mu17_v13, 0.003/pb
+        '325117-325117',  # HLT_Mu17_v13, 0.066/pb
+        '325159-325159',  # HLT_Mu17_v13, 0.047/pb
+        '325168-325170',  # HLT_Mu17_v13, 0.21/pb
+        '325172-325172',  # HLT_Mu17_v13, 0.052/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu20"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(20.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(1081), # L=55.273/pb; present in all eras; prescale factor 1080.8 (1082.1 from delivery)
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Mu20_v11, 0.004/pb
+        '315259-315259',  # HLT_Mu20_v11, 0.007/pb
+        '315264-315265',  # HLT_Mu20_v11, 0.022/pb
+        '315267-315267',  # HLT_Mu20_v11, 0.018/pb
+        '315270-315270',  # HLT_Mu20_v11, 0.038/pb
+        '315322-315322',  # HLT_Mu20_v11, 0.086/pb
+        '315339-315339',  # HLT_Mu20_v11, 0.044/pb
+        '315357-315357',  # HLT_Mu20_v11, 0.08/pb
+        '315361-315361',  # HLT_Mu20_v11, 0.063/pb
+        '315363-315363',  # HLT_Mu20_v11, 0.008/pb
+        '315366-315366',  # HLT_Mu20_v11, 0.053/pb
+        '315420-315420',  # HLT_Mu20_v11, 0.137/pb
+        '315488-315490',  # HLT_Mu20_v11, 0.202/pb
+        '315506-315506',  # HLT_Mu20_v11, 0.019/pb
+        '315510-315510',  # HLT_Mu20_v11, 0.07/pb
+        '315512-315512',  # HLT_Mu20_v11, 0.161/pb
+        '315543-315543',  # HLT_Mu20_v11, 0.025/pb
+        '315555-315557',  # HLT_Mu20_v11, 0.078/pb
+        '315640-315642',  # HLT_Mu20_v11, 0.034/pb
+        '315644-315648',  # HLT_Mu20_v11, 0.299/pb
+        '315689-315690',  # HLT_Mu20_v11, 0.305/pb
+        '315702-315705',  # HLT_Mu20_v11, 0.224/pb
+        '315713-315713',  # HLT_Mu20_v11, 0.241/pb
+        '315721-315721',  # HLT_Mu20_v11, 0.143/pb
+        '315741-315741',  # HLT_Mu20_v11, 0.016/pb
+        '315764-315764',  # HLT_Mu20_v11, 0.078/pb
+        '315770-315770',  # HLT_Mu20_v11, 0.083/pb
+        '315784-315786',  # HLT_Mu20_v11, 0.122/pb
+        '315790-315790',  # HLT_Mu20_v11, 0.118/pb
+        '315800-315801',  # HLT_Mu20_v11, 0.207/pb
+        '315840-315840',  # HLT_Mu20_v11, 0.241/pb
+        '315973-315974',  # HLT_Mu20_v11, 0.207/pb
+        '316058-316062',  # HLT_Mu20_v11, 0.489/pb
+        '316082-316082',  # HLT_Mu20_v11, 0.135/pb
+        '316110-316111',  # HLT_Mu20_v11, 0.093/pb
+        '316113-316114',  # HLT_Mu20_v11, 0.37/pb
+        '316153-316153',  # HLT_Mu20_v11, 0.244/pb
+        '316186-316187',  # HLT_Mu20_v11, 0.502/pb
+        '316199-316202',  # HLT_Mu20_v11, 0.561/pb
+        '316216-316219',  # HLT_Mu20_v11, 0.526/pb
+        '316239-316241',  # HLT_Mu20_v11, 0.52/pb
+        '316271-316271',  # HLT_Mu20_v11, 0.028/pb
+        '316361-316363',  # HLT_Mu20_v12, 0.081/pb
+        '316377-316380',  # HLT_Mu20_v12, 0.18/pb
+        '316455-316455',  # HLT_Mu20_v12, 0.009/pb
+        '316457-316457',  # HLT_Mu20_v12, 0.311/pb
+        '316469-316470',  # HLT_Mu20_v12, 0.253/pb
+        '316472-316472',  # HLT_Mu20_v12, 0.063/pb
+        '316505-316505',  # HLT_Mu20_v12, 0.382/pb
+        '316569-316569',  # HLT_Mu20_v12, 0.462/pb
+        '316590-316590',  # HLT_Mu20_v12, 0.18/pb
+        '316613-316613',  # HLT_Mu20_v12, 0.03/pb
+        '316615-316615',  # HLT_Mu20_v12, 0.047/pb
+        '316666-316667',  # HLT_Mu20_v12, 0.306/pb
+        '316700-316702',  # HLT_Mu20_v12, 0.337/pb
+        '316715-316723',  # HLT_Mu20_v12, 0.419/pb
+        '316758-316758',  # HLT_Mu20_v12, 0.434/pb
+        '316766-316766',  # HLT_Mu20_v12, 0.534/pb
+        '316876-316877',  # HLT_Mu20_v12, 0.312/pb
+        '316879-316879',  # HLT_Mu20_v12, 0.035/pb
+        '316928-316928',  # HLT_Mu20_v12, 0.042/pb
+        '316985-316985',  # HLT_Mu20_v12, 0.164/pb
+        '316993-316995',  # HLT_Mu20_v12, 0.253/pb
+        '317080-317080',  # HLT_Mu20_v12, 0.007/pb
+        '317087-317087',  # HLT_Mu20_v12, 0.232/pb
+        '317089-317089',  # HLT_Mu20_v12, 0.203/pb
+        '317182-317182',  # HLT_Mu20_v12, 0.387/pb
+        '317212-317213',  # HLT_Mu20_v12, 0.168/pb
+        '317279-317279',  # HLT_Mu20_v12, 0.063/pb
+        '317291-317292',  # HLT_Mu20_v12, 0.342/pb
+        '317297-317297',  # HLT_Mu20_v12, 0.118/pb
+        '317319-317320',  # HLT_Mu20_v12, 0.49/pb
+        '317338-317340',  # HLT_Mu20_v12, 0.21/pb
+        '317382-317383',  # HLT_Mu20_v12, 0.044/pb
+        '317391-317392',  # HLT_Mu20_v12, 0.47/pb
+        '317435-317435',  # HLT_Mu20_v12, 0.343/pb
+        '317438-317438',  # HLT_Mu20_v12, 0.047/pb
+        '317475-317475',  # HLT_Mu20_v12, 0.025/pb
+        '317478-317478',  # HLT_Mu20_v12, 0.008/pb
+        '317484-317484',  # HLT_Mu20_v12, 0.153/pb
+        '317488-317488',  # HLT_Mu20_v12, 0.173/pb
+        '317527-317527',  # HLT_Mu20_v12, 0.431/pb
+        '317591-317591',  # HLT_Mu20_v12, 0.106/pb
+        '317626-317626',  # HLT_Mu20_v12, 0.504/pb
+        '317640-317641',  # HLT_Mu20_v12, 0.504/pb
+        '317648-317650',  # HLT_Mu20_v12, 0.46/pb
+        '317661-317661',  # HLT_Mu20_v12, 0.358/pb
+        '317663-317663',  # HLT_Mu20_v12, 0.146/pb
+        '317683-317683',  # HLT_Mu20_v12, 0.112/pb
+        '317696-317696',  # HLT_Mu20_v12, 0.218/pb
+        '318733-318733',  # HLT_Mu20_v12, 0.003/pb
+        '318828-318828',  # HLT_Mu20_v12, 0.013/pb
+        '318872-318872',  # HLT_Mu20_v12, 0.087/pb
+        '318874-318874',  # HLT_Mu20_v12, 0.095/pb
+        '318876-318877',  # HLT_Mu20_v12, 0.197/pb
+        '319077-319077',  # HLT_Mu20_v12, 0.016/pb
+        '319337-319337',  # HLT_Mu20_v12, 0.221/pb
+        '319347-319349',  # HLT_Mu20_v12, 0.244/pb
+        '319449-319450',  # HLT_Mu20_v12, 0.434/pb
+        '319456-319456',  # HLT_Mu20_v12, 0.05/pb
+        '319459-319459',  # HLT_Mu20_v12, 0.016/pb
+        '319486-319486',  # HLT_Mu20_v12, 0.019/pb
+        '319503-319503',  # HLT_Mu20_v12, 0.087/pb
+        '319524-319524',  # HLT_Mu20_v12, 0.435/pb
+        '319526-319526',  # HLT_Mu20_v12, 0.066/pb
+        '319528-319528',  # HLT_Mu20_v12, 0.056/pb
+        '319579-319579',  # HLT_Mu20_v12, 0.78/pb
+        '319625-319625',  # HLT_Mu20_v12, 0.067/pb
+        '319639-319639',  # HLT_Mu20_v12, 0.39/pb
+        '319656-319659',  # HLT_Mu20_v12, 0.211/pb
+        '319678-319678',  # HLT_Mu20_v12, 0.091/pb
+        '319687-319687',  # HLT_Mu20_v12, 0.015/pb
+        '319697-319698',  # HLT_Mu20_v12, 0.092/pb
+        '319756-319756',  # HLT_Mu20_v12, 0.467/pb
+        '319840-319841',  # HLT_Mu20_v12, 0.067/pb
+        '319847-319849',  # HLT_Mu20_v12, 0.184/pb
+        '319851-319851',  # HLT_Mu20_v12, 0.001/pb
+        '319853-319854',  # HLT_Mu20_v12, 0.119/pb
+        '319908-319910',  # HLT_Mu20_v12, 0.313/pb
+        '319912-319915',  # HLT_Mu20_v12, 0.114/pb
+        '319941-319942',  # HLT_Mu20_v12, 0.107/pb
+        '319950-319950',  # HLT_Mu20_v12, 0.063/pb
+        '319991-319993',  # HLT_Mu20_v12, 0.505/pb
+        '320002-320002',  # HLT_Mu20_v12, 0.048/pb
+        '320006-320006',  # HLT_Mu20_v12, 0.109/pb
+        '320010-320012',  # HLT_Mu20_v12, 0.147/pb
+        '320023-320026',  # HLT_Mu20_v12, 0.291/pb
+        '320038-320040',  # HLT_Mu20_v12, 0.385/pb
+        '320059-320065',  # HLT_Mu20_v12, 0.377/pb
+        '320673-320674',  # HLT_Mu20_v12, 0.094/pb
+        '320688-320688',  # HLT_Mu20_v12, 0.125/pb
+        '320712-320712',  # HLT_Mu20_v12, 0.066/pb
+        '320757-320757',  # HLT_Mu20_v12, 0.111/pb
+        '320804-320804',  # HLT_Mu20_v12, 0.304/pb
+        '320807-320807',  # HLT_Mu20_v12, 0.002/pb
+        '320809-320809',  # HLT_Mu20_v12, 0.101/pb
+        '320821-320824',  # HLT_Mu20_v12, 0.433/pb
+        '320838-320838',  # HLT_Mu20_v12, 0.088/pb
+        '320840-320841',  # HLT_Mu20_v12, 0.182/pb
+        '320853-320859',  # HLT_Mu20_v12, 0.412/pb
+        '320887-320888',  # HLT_Mu20_v12, 0.108/pb
+        '320916-320917',  # HLT_Mu20_v12, 0.461/pb
+        '320920-320920',  # HLT_Mu20_v12, 0.023/pb
+        '320933-320934',  # HLT_Mu20_v12, 0.25/pb
+        '320936-320936',  # HLT_Mu20_v12, 0.075/pb
+        '320941-320941',  # HLT_Mu20_v12, 0.015/pb
+        '320980-320980',  # HLT_Mu20_v12, 0.037/pb
+        '320995-320996',  # HLT_Mu20_v12, 0.071/pb
+        '321004-321007',  # HLT_Mu20_v12, 0.305/pb
+        '321009-321012',  # HLT_Mu20_v12, 0.101/pb
+        '321051-321051',  # HLT_Mu20_v12, 0.297/pb
+        '321055-321055',  # HLT_Mu20_v12, 0.12/pb
+        '321067-321069',  # HLT_Mu20_v12, 0.352/pb
+        '321119-321119',  # HLT_Mu20_v12, 0.056/pb
+        '321121-321122',  # HLT_Mu20_v12, 0.13/pb
+        '321124-321124',  # HLT_Mu20_v12, 0.176/pb
+        '321126-321126',  # HLT_Mu20_v12, 0.075/pb
+        '321134-321134',  # HLT_Mu20_v12, 0.008/pb
+        '321138-321138',  # HLT_Mu20_v12, 0.135/pb
+        '321140-321140',  # HLT_Mu20_v12, 0.111/pb
+        '321149-321149',  # HLT_Mu20_v12, 0.414/pb
+        '321165-321167',  # HLT_Mu20_v12, 0.266/pb
+        '321177-321178',  # HLT_Mu20_v12, 0.166/pb
+        '321218-321219',  # HLT_Mu20_v12, 0.442/pb
+        '321221-321221',  # HLT_Mu20_v12, 0.006/pb
+        '321230-321233',  # HLT_Mu20_v12, 0.262/pb
+        '321262-321262',  # HLT_Mu20_v12, 0.002/pb
+        '321283-321283',  # HLT_Mu20_v12, 0.114/pb
+        '321294-321296',  # HLT_Mu20_v12, 0.223/pb
+        '321305-321305',  # HLT_Mu20_v12, 0.573/pb
+        '321311-321313',  # HLT_Mu20_v12, 0.083/pb
+        '321393-321393',  # HLT_Mu20_v12, 0.047/pb
+        '321396-321397',  # HLT_Mu20_v12, 0.397/pb
+        '321414-321415',  # HLT_Mu20_v12, 0.498/pb
+        '321431-321434',  # HLT_Mu20_v12, 0.282/pb
+        '321436-321436',  # HLT_Mu20_v12, 0.132/pb
+        '321457-321457',  # HLT_Mu20_v12, 0.46/pb
+        '321461-321461',  # HLT_Mu20_v12, 0.02/pb
+        '321475-321475',  # HLT_Mu20_v12, 0.449/pb
+        '321710-321710',  # HLT_Mu20_v12, 0.016/pb
+        '321712-321712',  # HLT_Mu20_v12, 0.08/pb
+        '321730-321730',  # HLT_Mu20_v12, 0.098/pb
+        '321732-321732',  # HLT_Mu20_v12, 0.328/pb
+        '321735-321735',  # HLT_Mu20_v12, 0.023/pb
+        '321755-321755',  # HLT_Mu20_v12, 0.203/pb
+        '321758-321758',  # HLT_Mu20_v12, 0.036/pb
+        '321760-321760',  # HLT_Mu20_v12, 0.139/pb
+        '321773-321778',  # HLT_Mu20_v12, 0.166/pb
+        '321780-321781',  # HLT_Mu20_v12, 0.173/pb
+        '321813-321813',  # HLT_Mu20_v12, 0.115/pb
+        '321815-321815',  # HLT_Mu20_v12, 0.005/pb
+        '321817-321818',  # HLT_Mu20_v12, 0.273/pb
+        '321820-321820',  # HLT_Mu20_v12, 0.031/pb
+        '321831-321834',  # HLT_Mu20_v12, 0.465/pb
+        '321879-321880',  # HLT_Mu20_v12, 0.125/pb
+        '321887-321887',  # HLT_Mu20_v12, 0.264/pb
+        '321908-321909',  # HLT_Mu20_v12, 0.463/pb
+        '321917-321917',  # HLT_Mu20_v12, 0.249/pb
+        '321919-321919',  # HLT_Mu20_v12, 0.001/pb
+        '321933-321933',  # HLT_Mu20_v12, 0.096/pb
+        '321960-321961',  # HLT_Mu20_v12, 0.133/pb
+        '321973-321973',  # HLT_Mu20_v12, 0.342/pb
+        '321975-321975',  # HLT_Mu20_v12, 0.139/pb
+        '321988-321988',  # HLT_Mu20_v12, 0.366/pb
+        '321990-321990',  # HLT_Mu20_v12, 0.077/pb
+        '322013-322014',  # HLT_Mu20_v12, 0.007/pb
+        '322022-322022',  # HLT_Mu20_v12, 0.431/pb
+        '322040-322040',  # HLT_Mu20_v12, 0.013/pb
+        '322057-322057',  # HLT_Mu20_v12, 0.008/pb
+        '322068-322068',  # HLT_Mu20_v12, 0.222/pb
+        '322079-322079',  # HLT_Mu20_v12, 0.134/pb
+        '322106-322106',  # HLT_Mu20_v12, 0.268/pb
+        '322113-322113',  # HLT_Mu20_v12, 0.039/pb
+        '322118-322118',  # HLT_Mu20_v12, 0.255/pb
+        '322179-322179',  # HLT_Mu20_v12, 0.447/pb
+        '322201-322201',  # HLT_Mu20_v12, 0.08/pb
+        '322204-322204',  # HLT_Mu20_v12, 0.296/pb
+        '322222-322222',  # HLT_Mu20_v12, 0.088/pb
+        '322252-322252',  # HLT_Mu20_v12, 0.4/pb
+        '322317-322317',  # HLT_Mu20_v12, 0.018/pb
+        '322319-322319',  # HLT_Mu20_v12, 0.053/pb
+        '322322-322322',  # HLT_Mu20_v12, 0.279/pb
+        '322324-322324',  # HLT_Mu20_v12, 0.066/pb
+        '322332-322332',  # HLT_Mu20_v12, 0.299/pb
+        '322348-322348',  # HLT_Mu20_v12, 0.394/pb
+        '322355-322356',  # HLT_Mu20_v12, 0.256/pb
+        '322381-322381',  # HLT_Mu20_v12, 0.17/pb
+        '322407-322407',  # HLT_Mu20_v12, 0.162/pb
+        '322430-322431',  # HLT_Mu20_v12, 0.353/pb
+        '322480-322480',  # HLT_Mu20_v12, 0.104/pb
+        '322492-322492',  # HLT_Mu20_v12, 0.274/pb
+        '322510-322510',  # HLT_Mu20_v12, 0.002/pb
+        '322599-322599',  # HLT_Mu20_v12, 0.09/pb
+        '322602-322603',  # HLT_Mu20_v12, 0.026/pb
+        '322605-322605',  # HLT_Mu20_v12, 0.085/pb
+        '322617-322617',  # HLT_Mu20_v12, 0.13/pb
+        '322625-322625',  # HLT_Mu20_v12, 0.319/pb
+        '322633-322633',  # HLT_Mu20_v12, 0.049/pb
+        '323414-323414',  # HLT_Mu20_v12, 0.006/pb
+        '323423-323423',  # HLT_Mu20_v12, 0.02/pb
+        '323470-323475',  # HLT_Mu20_v12, 0.306/pb
+        '323487-323488',  # HLT_Mu20_v12, 0.324/pb
+        '323492-323493',  # HLT_Mu20_v12, 0.032/pb
+        '323495-323495',  # HLT_Mu20_v12, 0.031/pb
+        '323524-323526',  # HLT_Mu20_v12, 0.458/pb
+        '323693-323693',  # HLT_Mu20_v12, 0.038/pb
+        '323696-323696',  # HLT_Mu20_v12, 0.085/pb
+        '323702-323702',  # HLT_Mu20_v12, 0.139/pb
+        '323725-323727',  # HLT_Mu20_v12, 0.362/pb
+        '323755-323755',  # HLT_Mu20_v12, 0.283/pb
+        '323775-323775',  # HLT_Mu20_v12, 0.045/pb
+        '323778-323778',  # HLT_Mu20_v12, 0.258/pb
+        '323790-323790',  # HLT_Mu20_v12, 0.264/pb
+        '323794-323794',  # HLT_Mu20_v12, 0.015/pb
+        '323841-323841',  # HLT_Mu20_v12, 0.148/pb
+        '323857-323857',  # HLT_Mu20_v12, 0.091/pb
+        '323940-323940',  # HLT_Mu20_v12, 0.406/pb
+        '323954-323954',  # HLT_Mu20_v12, 0.014/pb
+        '323976-323976',  # HLT_Mu20_v12, 0.014/pb
+        '323978-323978',  # HLT_Mu20_v12, 0.021/pb
+        '323980-323980',  # HLT_Mu20_v12, 0.065/pb
+        '323983-323983',  # HLT_Mu20_v12, 0.054/pb
+        '323997-323997',  # HLT_Mu20_v12, 0.123/pb
+        '324021-324022',  # HLT_Mu20_v12, 0.362/pb
+        '324077-324077',  # HLT_Mu20_v12, 0.231/pb
+        '324201-324202',  # HLT_Mu20_v12, 0.383/pb
+        '324205-324207',  # HLT_Mu20_v12, 0.042/pb
+        '324209-324209',  # HLT_Mu20_v12, 0.015/pb
+        '324237-324237',  # HLT_Mu20_v12, 0.071/pb
+        '324245-324245',  # HLT_Mu20_v12, 0.397/pb
+        '324293-324293',  # HLT_Mu20_v12, 0.489/pb
+        '324315-324315',  # HLT_Mu20_v12, 0.067/pb
+        '324318-324318',  # HLT_Mu20_v12, 0.095/pb
+        '324420-324420',  # HLT_Mu20_v12, 0.19/pb
+        '324729-324729',  # HLT_Mu20_v12, 0.014/pb
+        '324747-324747',  # HLT_Mu20_v12, 0.294/pb
+        '324764-324765',  # HLT_Mu20_v12, 0.112/pb
+        '324769-324769',  # HLT_Mu20_v12, 0.045/pb
+        '324772-324772',  # HLT_Mu20_v12, 0.018/pb
+        '324785-324785',  # HLT_Mu20_v12, 0.177/pb
+        '324791-324791',  # HLT_Mu20_v12, 0.233/pb
+        '324835-324835',  # HLT_Mu20_v12, 0.082/pb
+        '324840-324841',  # HLT_Mu20_v12, 0.313/pb
+        '324846-324846',  # HLT_Mu20_v12, 0.065/pb
+        '324878-324878',  # HLT_Mu20_v12, 0.384/pb
+        '324897-324897',  # HLT_Mu20_v12, 0.048/pb
+        '324970-324970',  # HLT_Mu20_v12, 0.457/pb
+        '324980-324980',  # HLT_Mu20_v12, 0.489/pb
+        '324997-325001',  # HLT_Mu20_v12, 0.353/pb
+        '325022-325022',  # HLT_Mu20_v12, 0.413/pb
+        '325057-325057',  # HLT_Mu20_v12, 0.114/pb
+        '325097-325101',  # HLT_Mu20_v12, 0.335/pb
+        '325110-325110',  # HLT_Mu20_v12, 0.003/pb
+        '325117-325117',  # HLT_Mu20_v12, 0.081/pb
+        '325159-325159',  # HLT_Mu20_v12, 0.059/pb
+        '325168-325170',  # HLT_Mu20_v12, 0.26/pb
+        '325172-325172',  # HLT_Mu20_v12, 0.064/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Mu27"),
+      cone_minPt = cms.double(45.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(27.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(475), # L=125.783/pb; present in all eras; prescale factor 475.0 (464.6 from delivery)
+      trigger_type = cms.string('1mu'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Mu27_v12, 0.054/pb
+        '315259-315259',  # HLT_Mu27_v12, 0.094/pb
+        '315264-315265',  # HLT_Mu27_v12, 0.208/pb
+        '315267-315267',  # HLT_Mu27_v12, 0.167/pb
+        '315270-315270',  # HLT_Mu27_v12, 0.356/pb
+        '315322-315322',  # HLT_Mu27_v12, 0.811/pb
+        '315339-315339',  # HLT_Mu27_v12, 0.42/pb
+        '315357-315357',  # HLT_Mu27_v12, 0.513/pb
+        '315361-315361',  # HLT_Mu27_v12, 0.4/pb
+        '315363-315363',  # HLT_Mu27_v12, 0.049/pb
+        '315366-315366',  # HLT_Mu27_v12, 0.338/pb
+        '315420-315420',  # HLT_Mu27_v12, 0.874/pb
+        '315488-315490',  # HLT_Mu27_v12, 0.77/pb
+        '315506-315506',  # HLT_Mu27_v12, 0.063/pb
+        '315510-315510',  # HLT_Mu27_v12, 0.232/pb
+        '315512-315512',  # HLT_Mu27_v12, 0.532/pb
+        '315543-315543',  # HLT_Mu27_v12, 0.083/pb
+        '315555-315557',  # HLT_Mu27_v12, 0.257/pb
+        '315640-315642',  # HLT_Mu27_v12, 1.332/pb
+        '315644-315648',  # HLT_Mu27_v12, 0.988/pb
+        '315689-315690',  # HLT_Mu27_v12, 1.009/pb
+        '315702-315705',  # HLT_Mu27_v12, 0.738/pb
+        '315713-315713',  # HLT_Mu27_v12, 0.795/pb
+        '315721-315721',  # HLT_Mu27_v12, 0.473/pb
+        '315741-315741',  # HLT_Mu27_v12, 0.053/pb
+        '315764-315764',  # HLT_Mu27_v12, 0.256/pb
+        '315770-315770',  # HLT_Mu27_v12, 0.274/pb
+        '315784-315786',  # HLT_Mu27_v12, 0.404/pb
+        '315790-315790',  # HLT_Mu27_v12, 0.389/pb
+        '315800-315801',  # HLT_Mu27_v12, 0.685/pb
+        '315840-315840',  # HLT_Mu27_v12, 0.796/pb
+        '315973-315974',  # HLT_Mu27_v12, 0.663/pb
+        '316058-316062',  # HLT_Mu27_v12, 1.026/pb
+        '316082-316082',  # HLT_Mu27_v12, 0.283/pb
+        '316110-316111',  # HLT_Mu27_v12, 0.194/pb
+        '316113-316114',  # HLT_Mu27_v12, 0.777/pb
+        '316153-316153',  # HLT_Mu27_v12, 0.512/pb
+        '316186-316187',  # HLT_Mu27_v12, 1.055/pb
+        '316199-316202',  # HLT_Mu27_v12, 1.179/pb
+        '316216-316219',  # HLT_Mu27_v12, 1.104/pb
+        '316239-316241',  # HLT_Mu27_v12, 1.092/pb
+        '316271-316271',  # HLT_Mu27_v12, 0.059/pb
+        '316361-316363',  # HLT_Mu27_v13, 0.17/pb
+        '316377-316380',  # HLT_Mu27_v13, 0.378/pb
+        '316455-316455',  # HLT_Mu27_v13, 0.019/pb
+        '316457-316457',  # HLT_Mu27_v13, 0.653/pb
+        '316469-316470',  # HLT_Mu27_v13, 0.531/pb
+        '316472-316472',  # HLT_Mu27_v13, 0.132/pb
+        '316505-316505',  # HLT_Mu27_v13, 0.802/pb
+        '316569-316569',  # HLT_Mu27_v13, 0.971/pb
+        '316590-316590',  # HLT_Mu27_v13, 0.378/pb
+        '316613-316613',  # HLT_Mu27_v13, 0.063/pb
+        '316615-316615',  # HLT_Mu27_v13, 0.098/pb
+        '316666-316667',  # HLT_Mu27_v13, 0.643/pb
+        '316700-316702',  # HLT_Mu27_v13, 0.707/pb
+        '316715-316723',  # HLT_Mu27_v13, 0.88/pb
+        '316758-316758',  # HLT_Mu27_v13, 0.911/pb
+        '316766-316766',  # HLT_Mu27_v13, 1.122/pb
+        '316876-316877',  # HLT_Mu27_v13, 0.655/pb
+        '316879-316879',  # HLT_Mu27_v13, 0.073/pb
+        '316928-316928',  # HLT_Mu27_v13, 0.089/pb
+        '316985-316985',  # HLT_Mu27_v13, 0.345/pb
+        '316993-316995',  # HLT_Mu27_v13, 0.531/pb
+        '317080-317080',  # HLT_Mu27_v13, 0.016/pb
+        '317087-317087',  # HLT_Mu27_v13, 0.486/pb
+        '317089-317089',  # HLT_Mu27_v13, 0.426/pb
+        '317182-317182',  # HLT_Mu27_v13, 0.812/pb
+        '317212-317213',  # HLT_Mu27_v13, 0.353/pb
+        '317279-317279',  # HLT_Mu27_v13, 0.132/pb
+        '317291-317292',  # HLT_Mu27_v13, 0.718/pb
+        '317297-317297',  # HLT_Mu27_v13, 0.248/pb
+        '317319-317320',  # HLT_Mu27_v13, 1.029/pb
+        '317338-317340',  # HLT_Mu27_v13, 0.44/pb
+        '317382-317383',  # HLT_Mu27_v13, 0.093/pb
+        '317391-317392',  # HLT_Mu27_v13, 0.987/pb
+        '317435-317435',  # HLT_Mu27_v13, 0.721/pb
+        '317438-317438',  # HLT_Mu27_v13, 0.099/pb
+        '317475-317475',  # HLT_Mu27_v13, 0.052/pb
+        '317478-317478',  # HLT_Mu27_v13, 0.016/pb
+        '317484-317484',  # HLT_Mu27_v13, 0.321/pb
+        '317488-317488',  # HLT_Mu27_v13, 0.362/pb
+        '317527-317527',  # HLT_Mu27_v13, 0.904/pb
+        '317591-317591',  # HLT_Mu27_v13, 0.222/pb
+        '317626-317626',  # HLT_Mu27_v13, 1.058/pb
+        '317640-317641',  # HLT_Mu27_v13, 1.059/pb
+        '317648-317650',  # HLT_Mu27_v13, 0.966/pb
+        '317661-317661',  # HLT_Mu27_v13, 0.751/pb
+        '317663-317663',  # HLT_Mu27_v13, 0.307/pb
+        '317683-317683',  # HLT_Mu27_v13, 0.236/pb
+        '317696-317696',  # HLT_Mu27_v13, 0.458/pb
+        '318733-318733',  # HLT_Mu27_v13, 0.006/pb
+        '318828-318828',  # HLT_Mu27_v13, 0.026/pb
+        '318872-318872',  # HLT_Mu27_v13, 0.184/pb
+        '318874-318874',  # HLT_Mu27_v13, 0.199/pb
+        '318876-318877',  # HLT_Mu27_v13, 0.414/pb
+        '319077-319077',  # HLT_Mu27_v13, 0.033/pb
+        '319337-319337',  # HLT_Mu27_v13, 0.465/pb
+        '319347-319349',  # HLT_Mu27_v13, 0.513/pb
+        '319449-319450',  # HLT_Mu27_v13, 0.912/pb
+        '319456-319456',  # HLT_Mu27_v13, 0.104/pb
+        '319459-319459',  # HLT_Mu27_v13, 0.034/pb
+        '319486-319486',  # HLT_Mu27_v13, 0.041/pb
+        '319503-319503',  # HLT_Mu27_v13, 0.182/pb
+        '319524-319524',  # HLT_Mu27_v13, 0.913/pb
+        '319526-319526',  # HLT_Mu27_v13, 0.139/pb
+        '319528-319528',  # HLT_Mu27_v13, 0.117/pb
+        '319579-319579',  # HLT_Mu27_v13, 1.637/pb
+        '319625-319625',  # HLT_Mu27_v13, 0.141/pb
+        '319639-319639',  # HLT_Mu27_v13, 0.819/pb
+        '319656-319659',  # HLT_Mu27_v13, 0.444/pb
+        '319678-319678',  # HLT_Mu27_v13, 0.191/pb
+        '319687-319687',  # HLT_Mu27_v13, 0.032/pb
+        '319697-319698',  # HLT_Mu27_v13, 0.194/pb
+        '319756-319756',  # HLT_Mu27_v13, 0.98/pb
+        '319840-319841',  # HLT_Mu27_v13, 0.14/pb
+        '319847-319849',  # HLT_Mu27_v13, 0.387/pb
+        '319851-319851',  # HLT_Mu27_v13, 0.002/pb
+        '319853-319854',  # HLT_Mu27_v13, 0.25/pb
+        '319908-319910',  # HLT_Mu27_v13, 1.767/pb
+        '319912-319915',  # HLT_Mu27_v13, 0.239/pb
+        '319941-319942',  # HLT_Mu27_v13, 0.224/pb
+        '319950-319950',  # HLT_Mu27_v13, 0.132/pb
+        '319991-319993',  # HLT_Mu27_v13, 1.061/pb
+        '320002-320002',  # HLT_Mu27_v13, 0.1/pb
+        '320006-320006',  # HLT_Mu27_v13, 0.228/pb
+        '320010-320012',  # HLT_Mu27_v13, 0.308/pb
+        '320023-320026',  # HLT_Mu27_v13, 0.611/pb
+        '320038-320040',  # HLT_Mu27_v13, 0.809/pb
+        '320059-320065',  # HLT_Mu27_v13, 0.792/pb
+        '320673-320674',  # HLT_Mu27_v13, 0.197/pb
+        '320688-320688',  # HLT_Mu27_v13, 0.262/pb
+        '320712-320712',  # HLT_Mu27_v13, 0.139/pb
+        '320757-320757',  # HLT_Mu27_v13, 0.233/pb
+        '320804-320804',  # HLT_Mu27_v13, 0.638/pb
+        '320807-320807',  # HLT_Mu27_v13, 0.348/pb
+        '320809-320809',  # HLT_Mu27_v13, 0.212/pb
+        '320821-320824',  # HLT_Mu27_v13, 0.909/pb
+        '320838-320838',  # HLT_Mu27_v13, 0.185/pb
+        '320840-320841',  # HLT_Mu27_v13, 0.383/pb
+        '320853-320859',  # HLT_Mu27_v13, 0.866/pb
+        '320887-320888',  # HLT_Mu27_v13, 0.228/pb
+        '320916-320917',  # HLT_Mu27_v13, 0.969/pb
+        '320920-320920',  # HLT_Mu27_v13, 0.048/pb
+        '320933-320934',  # HLT_Mu27_v13, 0.525/pb
+        '320936-320936',  # HLT_Mu27_v13, 0.157/pb
+        '320941-320941',  # HLT_Mu27_v13, 0.031/pb
+        '320980-320980',  # HLT_Mu27_v13, 0.077/pb
+        '320995-320996',  # HLT_Mu27_v13, 0.148/pb
+        '321004-321007',  # HLT_Mu27_v13, 0.641/pb
+        '321009-321012',  # HLT_Mu27_v13, 0.212/pb
+        '321051-321051',  # HLT_Mu27_v13, 0.623/pb
+        '321055-321055',  # HLT_Mu27_v13, 0.251/pb
+        '321067-321069',  # HLT_Mu27_v13, 0.739/pb
+        '321119-321119',  # HLT_Mu27_v13, 0.117/pb
+        '321121-321122',  # HLT_Mu27_v13, 0.272/pb
+        '321124-321124',  # HLT_Mu27_v13, 0.371/pb
+        '321126-321126',  # HLT_Mu27_v13, 0.158/pb
+        '321134-321134',  # HLT_Mu27_v13, 0.016/pb
+        '321138-321138',  # HLT_Mu27_v13, 0.284/pb
+        '321140-321140',  # HLT_Mu27_v13, 0.234/pb
+        '321149-321149',  # HLT_Mu27_v13, 0.869/pb
+        '321165-321167',  # HLT_Mu27_v13, 0.945/pb
+        '321177-321178',  # HLT_Mu27_v13, 0.349/pb
+        '321218-321219',  # HLT_Mu27_v13, 0.927/pb
+        '321221-321221',  # HLT_Mu27_v13, 0.012/pb
+        '321230-321233',  # HLT_Mu27_v13, 0.55/pb
+        '321262-321262',  # HLT_Mu27_v13, 0.003/pb
+        '321283-321283',  # HLT_Mu27_v13, 0.24/pb
+        '321294-321296',  # HLT_Mu27_v13, 0.468/pb
+        '321305-321305',  # HLT_Mu27_v13, 1.204/pb
+        '321311-321313',  # HLT_Mu27_v13, 0.175/pb
+        '321393-321393',  # HLT_Mu27_v13, 0.099/pb
+        '321396-321397',  # HLT_Mu27_v13, 0.835/pb
+        '321414-321415',  # HLT_Mu27_v13, 1.046/pb
+        '321431-321434',  # HLT_Mu27_v13, 0.592/pb
+        '321436-321436',  # HLT_Mu27_v13, 0.277/pb
+        '321457-321457',  # HLT_Mu27_v13, 0.966/pb
+        '321461-321461',  # HLT_Mu27_v13, 0.042/pb
+        '321475-321475',  # HLT_Mu27_v13, 0.944/pb
+        '321710-321710',  # HLT_Mu27_v13, 0.034/pb
+        '321712-321712',  # HLT_Mu27_v13, 0.169/pb
+        '321730-321730',  # HLT_Mu27_v13, 0.205/pb
+        '321732-321732',  # HLT_Mu27_v13, 0.689/pb
+        '321735-321735',  # HLT_Mu27_v13, 0.047/pb
+        '321755-321755',  # HLT_Mu27_v13, 0.427/pb
+        '321758-321758',  # HLT_Mu27_v13, 0.075/pb
+        '321760-321760',  # HLT_Mu27_v13, 0.292/pb
+        '321773-321778',  # HLT_Mu27_v13, 0.349/pb
+        '321780-321781',  # HLT_Mu27_v13, 0.363/pb
+        '321813-321813',  # HLT_Mu27_v13, 0.24/pb
+        '321815-321815',  # HLT_Mu27_v13, 0.01/pb
+        '321817-321818',  # HLT_Mu27_v13, 0.573/pb
+        '321820-321820',  # HLT_Mu27_v13, 0.064/pb
+        '321831-321834',  # HLT_Mu27_v13, 0.976/pb
+        '321879-321880',  # HLT_Mu27_v13, 0.263/pb
+        '321887-321887',  # HLT_Mu27_v13, 0.554/pb
+        '321908-321909',  # HLT_Mu27_v13, 0.972/pb
+        '321917-321917',  # HLT_Mu27_v13, 0.522/pb
+        '321919-321919',  # HLT_Mu27_v13, 0.003/pb
+        '321933-321933',  # HLT_Mu27_v13, 0.202/pb
+        '321960-321961',  # HLT_Mu27_v13, 0.279/pb
+        '321973-321973',  # HLT_Mu27_v13, 0.717/pb
+        '321975-321975',  # HLT_Mu27_v13, 0.292/pb
+        '321988-321988',  # HLT_Mu27_v13, 0.768/pb
+        '321990-321990',  # HLT_Mu27_v13, 0.162/pb
+        '322013-322014',  # HLT_Mu27_v13, 0.016/pb
+        '322022-322022',  # HLT_Mu27_v13, 0.906/pb
+        '322040-322040',  # HLT_Mu27_v13, 0.027/pb
+        '322057-322057',  # HLT_Mu27_v13, 0.016/pb
+        '322068-322068',  # HLT_Mu27_v13, 0.465/pb
+        '322079-322079',  # HLT_Mu27_v13, 0.28/pb
+        '322106-322106',  # HLT_Mu27_v13, 0.564/pb
+        '322113-322113',  # HLT_Mu27_v13, 0.082/pb
+        '322118-322118',  # HLT_Mu27_v13, 0.536/pb
+        '322179-322179',  # HLT_Mu27_v13, 0.939/pb
+        '322201-322201',  # HLT_Mu27_v13, 0.169/pb
+        '322204-322204',  # HLT_Mu27_v13, 0.622/pb
+        '322222-322222',  # HLT_Mu27_v13, 0.185/pb
+        '322252-322252',  # HLT_Mu27_v13, 0.841/pb
+        '322317-322317',  # HLT_Mu27_v13, 0.038/pb
+        '322319-322319',  # HLT_Mu27_v13, 0.111/pb
+        '322322-322322',  # HLT_Mu27_v13, 0.585/pb
+        '322324-322324',  # HLT_Mu27_v13, 0.139/pb
+        '322332-322332',  # HLT_Mu27_v13, 0.628/pb
+        '322348-322348',  # HLT_Mu27_v13, 0.828/pb
+        '322355-322356',  # HLT_Mu27_v13, 0.537/pb
+        '322381-322381',  # HLT_Mu27_v13, 0.357/pb
+        '322407-322407',  # HLT_Mu27_v13, 0.34/pb
+        '322430-322431',  # HLT_Mu27_v13, 0.741/pb
+        '322480-322480',  # HLT_Mu27_v13, 0.219/pb
+        '322492-322492',  # HLT_Mu27_v13, 0.575/pb
+        '322510-322510',  # HLT_Mu27_v13, 0.004/pb
+        '322599-322599',  # HLT_Mu27_v13, 0.189/pb
+        '322602-322603',  # HLT_Mu27_v13, 0.054/pb
+        '322605-322605',  # HLT_Mu27_v13, 0.179/pb
+        '322617-322617',  # HLT_Mu27_v13, 0.273/pb
+        '322625-322625',  # HLT_Mu27_v13, 0.671/pb
+        '322633-322633',  # HLT_Mu27_v13, 0.102/pb
+        '323414-323414',  # HLT_Mu27_v13, 0.012/pb
+        '323423-323423',  # HLT_Mu27_v13, 0.042/pb
+        '323470-323475',  # HLT_Mu27_v13, 0.643/pb
+        '323487-323488',  # HLT_Mu27_v13, 0.681/pb
+        '323492-323493',  # HLT_Mu27_v13, 0.066/pb
+        '323495-323495',  # HLT_Mu27_v13, 0.065/pb
+        '323524-323526',  # HLT_Mu27_v13, 0.961/pb
+        '323693-323693',  # HLT_Mu27_v13, 0.08/pb
+        '323696-323696',  # HLT_Mu27_v13, 0.178/pb
+        '323702-323702',  # HLT_Mu27_v13, 0.292/pb
+        '323725-323727',  # HLT_Mu27_v13, 0.76/pb
+        '323755-323755',  # HLT_Mu27_v13, 0.593/pb
+        '323775-323775',  # HLT_Mu27_v13, 0.094/pb
+        '323778-323778',  # HLT_Mu27_v13, 0.542/pb
+        '323790-323790',  # HLT_Mu27_v13, 0.553/pb
+        '323794-323794',  # HLT_Mu27_v13, 0.032/pb
+        '323841-323841',  # HLT_Mu27_v13, 0.31/pb
+        '323857-323857',  # HLT_Mu27_v13, 0.191/pb
+        '323940-323940',  # HLT_Mu27_v13, 0.853/pb
+        '323954-323954',  # HLT_Mu27_v13, 0.03/pb
+        '323976-323976',  # HLT_Mu27_v13, 0.029/pb
+        '323978-323978',  # HLT_Mu27_v13, 0.044/pb
+        '323980-323980',  # HLT_Mu27_v13, 0.135/pb
+        '323983-323983',  # HLT_Mu27_v13, 0.114/pb
+        '323997-323997',  # HLT_Mu27_v13, 0.258/pb
+        '324021-324022',  # HLT_Mu27_v13, 0.761/pb
+        '324077-324077',  # HLT_Mu27_v13, 0.485/pb
+        '324201-324202',  # HLT_Mu27_v13, 0.804/pb
+        '324205-324207',  # HLT_Mu27_v13, 0.089/pb
+        '324209-324209',  # HLT_Mu27_v13, 0.032/pb
+        '324237-324237',  # HLT_Mu27_v13, 0.15/pb
+        '324245-324245',  # HLT_Mu27_v13, 0.834/pb
+        '324293-324293',  # HLT_Mu27_v13, 1.026/pb
+        '324315-324315',  # HLT_Mu27_v13, 0.141/pb
+        '324318-324318',  # HLT_Mu27_v13, 0.2/pb
+        '324420-324420',  # HLT_Mu27_v13, 0.399/pb
+        '324729-324729',  # HLT_Mu27_v13, 0.03/pb
+        '324747-324747',  # HLT_Mu27_v13, 0.616/pb
+        '324764-324765',  # HLT_Mu27_v13, 0.235/pb
+        '324769-324769',  # HLT_Mu27_v13, 0.094/pb
+        '324772-324772',  # HLT_Mu27_v13, 0.038/pb
+        '324785-324785',  # HLT_Mu27_v13, 0.372/pb
+        '324791-324791',  # HLT_Mu27_v13, 0.49/pb
+        '324835-324835',  # HLT_Mu27_v13, 0.172/pb
+        '324840-324841',  # HLT_Mu27_v13, 0.657/pb
+        '324846-324846',  # HLT_Mu27_v13, 0.137/pb
+        '324878-324878',  # HLT_Mu27_v13, 0.806/pb
+        '324897-324897',  # HLT_Mu27_v13, 0.1/pb
+        '324970-324970',  # HLT_Mu27_v13, 0.959/pb
+        '324980-324980',  # HLT_Mu27_v13, 1.027/pb
+        '324997-325001',  # HLT_Mu27_v13, 0.741/pb
+        '325022-325022',  # HLT_Mu27_v13, 0.867/pb
+        '325057-325057',  # HLT_Mu27_v13, 0.24/pb
+        '325097-325101',  # HLT_Mu27_v13, 0.703/pb
+        '325110-325110',  # HLT_Mu27_v13, 0.007/pb
+        '325117-325117',  # HLT_Mu27_v13, 0.17/pb
+        '325159-325159',  # HLT_Mu27_v13, 0.123/pb
+        '325168-325170',  # HLT_Mu27_v13, 0.546/pb
+        '325172-325172',  # HLT_Mu27_v13, 0.135/pb
+      )),
+    ),
+  ),
+  'e' : cms.VPSet(
+    cms.PSet(
+      path = cms.string("HLT_Ele8_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(15.),
+      cone_maxPt = cms.double(45.),
+      minRecoPt = cms.double(8.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(9318), # L=6.411/pb; present in all eras; prescale factor 9318.5 (9325.6 from delivery)
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315259-315259',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315264-315265',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315267-315267',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315270-315270',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315322-315322',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315339-315339',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315357-315357',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315361-315361',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315363-315363',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315366-315366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315420-315420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315488-315490',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.008/pb
+        '315506-315506',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315510-315510',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
+        '315512-315512',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '315543-315543',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315555-315557',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
+        '315640-315642',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315644-315648',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '315689-315690',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '315702-315705',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
+        '315713-315713',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
+        '315721-315721',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '315741-315741',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315764-315764',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
+        '315770-315770',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
+        '315784-315786',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
+        '315790-315790',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
+        '315800-315801',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.008/pb
+        '315840-315840',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
+        '315973-315974',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16/HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.008/pb
+        '316058-316062',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.013/pb
+        '316082-316082',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.004/pb
+        '316110-316111',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.003/pb
+        '316113-316114',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.01/pb
+        '316153-316153',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.007/pb
+        '316186-316187',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.014/pb
+        '316199-316202',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.016/pb
+        '316216-316219',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.015/pb
+        '316239-316241',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.014/pb
+        '316271-316271',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.001/pb
+        '316361-316363',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '316377-316380',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '316455-316455',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '316457-316457',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '316469-316470',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '316472-316472',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '316505-316505',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '316569-316569',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '316590-316590',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '316613-316613',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '316615-316615',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '316666-316667',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
+        '316700-316702',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '316715-316723',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '316758-316758',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '316766-316766',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '316876-316877',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '316879-316879',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '316928-316928',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '316985-316985',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
+        '316993-316995',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '317080-317080',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '317087-317087',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.032/pb
+        '317089-317089',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
+        '317182-317182',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
+        '317212-317213',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
+        '317279-317279',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '317291-317292',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.047/pb
+        '317297-317297',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '317319-317320',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
+        '317338-317340',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.029/pb
+        '317382-317383',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '317391-317392',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.065/pb
+        '317435-317435',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.047/pb
+        '317438-317438',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '317475-317475',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '317478-317478',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '317484-317484',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.021/pb
+        '317488-317488',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '317527-317527',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.059/pb
+        '317591-317591',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '317626-317626',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
+        '317640-317641',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
+        '317648-317650',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
+        '317661-317661',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
+        '317663-317663',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
+        '317683-317683',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '317696-317696',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.03/pb
+        '318733-318733',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '318828-318828',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '318872-318872',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '318874-318874',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '318876-318877',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.027/pb
+        '319077-319077',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '319337-319337',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
+        '319347-319349',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.034/pb
+        '319449-319450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
+        '319456-319456',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '319459-319459',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '319486-319486',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '319503-319503',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '319524-319524',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
+        '319526-319526',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '319528-319528',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
+        '319579-319579',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
+        '319625-319625',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '319639-319639',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.054/pb
+        '319656-319659',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.029/pb
+        '319678-319678',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '319687-319687',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '319697-319698',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '319756-319756',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.065/pb
+        '319840-319841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '319847-319849',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
+        '319851-319851',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '319853-319854',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '319908-319910',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
+        '319912-319915',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '319941-319942',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '319950-319950',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '319991-319993',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
+        '320002-320002',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '320006-320006',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '320010-320012',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
+        '320023-320026',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.04/pb
+        '320038-320040',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
+        '320059-320065',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
+        '320673-320674',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '320688-320688',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
+        '320712-320712',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '320757-320757',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '320804-320804',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
+        '320807-320807',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '320809-320809',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '320821-320824',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
+        '320838-320838',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '320840-320841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
+        '320853-320859',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.057/pb
+        '320887-320888',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '320916-320917',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
+        '320920-320920',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '320933-320934',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '320936-320936',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
+        '320941-320941',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '320980-320980',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '320995-320996',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
+        '321004-321007',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
+        '321009-321012',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '321051-321051',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
+        '321055-321055',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
+        '321067-321069',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
+        '321119-321119',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
+        '321121-321122',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '321124-321124',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '321126-321126',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
+        '321134-321134',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '321138-321138',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
+        '321140-321140',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '321149-321149',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.057/pb
+        '321165-321167',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
+        '321177-321178',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
+        '321218-321219',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.061/pb
+        '321221-321221',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '321230-321233',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
+        '321262-321262',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '321283-321283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '321294-321296',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
+        '321305-321305',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.079/pb
+        '321311-321313',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '321393-321393',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '321396-321397',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
+        '321414-321415',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.069/pb
+        '321431-321434',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.039/pb
+        '321436-321436',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '321457-321457',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
+        '321461-321461',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '321475-321475',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.062/pb
+        '321710-321710',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '321712-321712',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '321730-321730',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '321732-321732',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.045/pb
+        '321735-321735',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '321755-321755',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
+        '321758-321758',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '321760-321760',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
+        '321773-321778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
+        '321780-321781',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '321813-321813',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '321815-321815',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '321817-321818',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
+        '321820-321820',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '321831-321834',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
+        '321879-321880',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
+        '321887-321887',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
+        '321908-321909',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
+        '321917-321917',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.034/pb
+        '321919-321919',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '321933-321933',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '321960-321961',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '321973-321973',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.047/pb
+        '321975-321975',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
+        '321988-321988',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.051/pb
+        '321990-321990',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '322013-322014',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '322022-322022',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
+        '322040-322040',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '322057-322057',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '322068-322068',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
+        '322079-322079',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '322106-322106',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
+        '322113-322113',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '322118-322118',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '322179-322179',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.062/pb
+        '322201-322201',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '322204-322204',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
+        '322222-322222',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '322252-322252',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
+        '322317-322317',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '322319-322319',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '322322-322322',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
+        '322324-322324',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '322332-322332',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
+        '322348-322348',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.054/pb
+        '322355-322356',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '322381-322381',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '322407-322407',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.022/pb
+        '322430-322431',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
+        '322480-322480',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '322492-322492',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
+        '322510-322510',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '322599-322599',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '322602-322603',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '322605-322605',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '322617-322617',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '322625-322625',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.044/pb
+        '322633-322633',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '323414-323414',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '323423-323423',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '323470-323475',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
+        '323487-323488',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.045/pb
+        '323492-323493',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '323495-323495',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '323524-323526',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
+        '323693-323693',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '323696-323696',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '323702-323702',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
+        '323725-323727',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
+        '323755-323755',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.039/pb
+        '323775-323775',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '323778-323778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
+        '323790-323790',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
+        '323794-323794',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '323841-323841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
+        '323857-323857',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '323940-323940',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.056/pb
+        '323954-323954',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '323976-323976',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '323978-323978',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
+        '323980-323980',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '323983-323983',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '323997-323997',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
+        '324021-324022',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
+        '324077-324077',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.032/pb
+        '324201-324202',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
+        '324205-324207',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '324209-324209',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '324237-324237',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
+        '324245-324245',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
+        '324293-324293',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
+        '324315-324315',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '324318-324318',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '324420-324420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.026/pb
+        '324729-324729',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '324747-324747',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
+        '324764-324765',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '324769-324769',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '324772-324772',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '324785-324785',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '324791-324791',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.032/pb
+        '324835-324835',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '324840-324841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
+        '324846-324846',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+        '324878-324878',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
+        '324897-324897',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
+        '324970-324970',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
+        '324980-324980',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
+        '324997-325001',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
+        '325022-325022',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.057/pb
+        '325057-325057',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '325097-325101',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.046/pb
+        '325110-325110',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '325117-325117',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '325159-325159',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
+        '325168-325170',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
+        '325172-325172',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Ele17_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(25.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(17.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(1537), # L=38.861/pb; present in all eras; prescale factor 1537.3 (1538.9 from delivery)
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '315259-315259',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '315264-315265',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
+        '315267-315267',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
+        '315270-315270',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
+        '315322-315322',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
+        '315339-315339',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
+        '315357-315357',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
+        '315361-315361',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
+        '315363-315363',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
+        '315366-315366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
+        '315420-315420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
+        '315488-315490',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.11/pb
+        '315506-315506',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.01/pb
+        '315510-315510',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.038/pb
+        '315512-315512',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.088/pb
+        '315543-315543',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
+        '315555-315557',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.042/pb
+        '315640-315642',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.016/pb
+        '315644-315648',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.163/pb
+        '315689-315690',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.166/pb
+        '315702-315705',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.122/pb
+        '315713-315713',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.131/pb
+        '315721-315721',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.078/pb
+        '315741-315741',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
+        '315764-315764',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.042/pb
+        '315770-315770',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.045/pb
+        '315784-315786',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.067/pb
+        '315790-315790',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.064/pb
+        '315800-315801',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.113/pb
+        '315840-315840',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.131/pb
+        '315973-315974',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14/HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.11/pb
+        '316058-316062',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.19/pb
+        '316082-316082',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.052/pb
+        '316110-316111',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.036/pb
+        '316113-316114',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.144/pb
+        '316153-316153',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.095/pb
+        '316186-316187',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.195/pb
+        '316199-316202',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.218/pb
+        '316216-316219',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.204/pb
+        '316239-316241',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.202/pb
+        '316271-316271',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.011/pb
+        '316361-316363',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.031/pb
+        '316377-316380',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.07/pb
+        '316455-316455',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
+        '316457-316457',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.121/pb
+        '316469-316470',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.098/pb
+        '316472-316472',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.025/pb
+        '316505-316505',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.149/pb
+        '316569-316569',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.18/pb
+        '316590-316590',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.07/pb
+        '316613-316613',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '316615-316615',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.018/pb
+        '316666-316667',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.119/pb
+        '316700-316702',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
+        '316715-316723',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.163/pb
+        '316758-316758',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.169/pb
+        '316766-316766',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.208/pb
+        '316876-316877',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.121/pb
+        '316879-316879',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
+        '316928-316928',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.033/pb
+        '316985-316985',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.128/pb
+        '316993-316995',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.197/pb
+        '317080-317080',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '317087-317087',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.18/pb
+        '317089-317089',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.158/pb
+        '317182-317182',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.301/pb
+        '317212-317213',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
+        '317279-317279',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.049/pb
+        '317291-317292',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.266/pb
+        '317297-317297',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.092/pb
+        '317319-317320',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.381/pb
+        '317338-317340',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.163/pb
+        '317382-317383',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.035/pb
+        '317391-317392',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.365/pb
+        '317435-317435',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.267/pb
+        '317438-317438',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
+        '317475-317475',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.019/pb
+        '317478-317478',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '317484-317484',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.119/pb
+        '317488-317488',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.134/pb
+        '317527-317527',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.335/pb
+        '317591-317591',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.082/pb
+        '317626-317626',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.392/pb
+        '317640-317641',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.392/pb
+        '317648-317650',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.358/pb
+        '317661-317661',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.278/pb
+        '317663-317663',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.114/pb
+        '317683-317683',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.087/pb
+        '317696-317696',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.169/pb
+        '318733-318733',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
+        '318828-318828',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.01/pb
+        '318872-318872',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.068/pb
+        '318874-318874',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.074/pb
+        '318876-318877',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.153/pb
+        '319077-319077',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '319337-319337',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.172/pb
+        '319347-319349',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.19/pb
+        '319449-319450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.338/pb
+        '319456-319456',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.039/pb
+        '319459-319459',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.013/pb
+        '319486-319486',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.015/pb
+        '319503-319503',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.067/pb
+        '319524-319524',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.338/pb
+        '319526-319526',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
+        '319528-319528',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.043/pb
+        '319579-319579',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.606/pb
+        '319625-319625',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
+        '319639-319639',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.303/pb
+        '319656-319659',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.164/pb
+        '319678-319678',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.071/pb
+        '319687-319687',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '319697-319698',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.072/pb
+        '319756-319756',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.363/pb
+        '319840-319841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
+        '319847-319849',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.143/pb
+        '319851-319851',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '319853-319854',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.093/pb
+        '319908-319910',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.24/pb
+        '319912-319915',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
+        '319941-319942',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.083/pb
+        '319950-319950',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.049/pb
+        '319991-319993',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.393/pb
+        '320002-320002',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
+        '320006-320006',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.085/pb
+        '320010-320012',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.114/pb
+        '320023-320026',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.226/pb
+        '320038-320040',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.3/pb
+        '320059-320065',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.293/pb
+        '320673-320674',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.073/pb
+        '320688-320688',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.097/pb
+        '320712-320712',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
+        '320757-320757',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.086/pb
+        '320804-320804',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.236/pb
+        '320807-320807',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '320809-320809',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.079/pb
+        '320821-320824',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.337/pb
+        '320838-320838',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.068/pb
+        '320840-320841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.142/pb
+        '320853-320859',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.321/pb
+        '320887-320888',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.084/pb
+        '320916-320917',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.359/pb
+        '320920-320920',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.018/pb
+        '320933-320934',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.194/pb
+        '320936-320936',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.058/pb
+        '320941-320941',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '320980-320980',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.028/pb
+        '320995-320996',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.055/pb
+        '321004-321007',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.237/pb
+        '321009-321012',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.078/pb
+        '321051-321051',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.231/pb
+        '321055-321055',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.093/pb
+        '321067-321069',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.274/pb
+        '321119-321119',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.043/pb
+        '321121-321122',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.101/pb
+        '321124-321124',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.137/pb
+        '321126-321126',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.058/pb
+        '321134-321134',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '321138-321138',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.105/pb
+        '321140-321140',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.087/pb
+        '321149-321149',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.322/pb
+        '321165-321167',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.206/pb
+        '321177-321178',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.129/pb
+        '321218-321219',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.343/pb
+        '321221-321221',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
+        '321230-321233',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.204/pb
+        '321262-321262',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '321283-321283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
+        '321294-321296',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.173/pb
+        '321305-321305',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.446/pb
+        '321311-321313',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.065/pb
+        '321393-321393',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
+        '321396-321397',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.309/pb
+        '321414-321415',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.387/pb
+        '321431-321434',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.219/pb
+        '321436-321436',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.103/pb
+        '321457-321457',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.358/pb
+        '321461-321461',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
+        '321475-321475',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.35/pb
+        '321710-321710',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.013/pb
+        '321712-321712',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.063/pb
+        '321730-321730',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.076/pb
+        '321732-321732',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.255/pb
+        '321735-321735',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.018/pb
+        '321755-321755',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.158/pb
+        '321758-321758',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.028/pb
+        '321760-321760',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.108/pb
+        '321773-321778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.129/pb
+        '321780-321781',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.135/pb
+        '321813-321813',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
+        '321815-321815',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
+        '321817-321818',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.212/pb
+        '321820-321820',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.024/pb
+        '321831-321834',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.361/pb
+        '321879-321880',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.097/pb
+        '321887-321887',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.205/pb
+        '321908-321909',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.36/pb
+        '321917-321917',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.193/pb
+        '321919-321919',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '321933-321933',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.075/pb
+        '321960-321961',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.103/pb
+        '321973-321973',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.266/pb
+        '321975-321975',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.108/pb
+        '321988-321988',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.284/pb
+        '321990-321990',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.06/pb
+        '322013-322014',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '322022-322022',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.336/pb
+        '322040-322040',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.01/pb
+        '322057-322057',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
+        '322068-322068',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.172/pb
+        '322079-322079',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.104/pb
+        '322106-322106',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.209/pb
+        '322113-322113',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.03/pb
+        '322118-322118',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.199/pb
+        '322179-322179',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.348/pb
+        '322201-322201',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.062/pb
+        '322204-322204',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.23/pb
+        '322222-322222',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.069/pb
+        '322252-322252',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.311/pb
+        '322317-322317',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
+        '322319-322319',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.041/pb
+        '322322-322322',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.217/pb
+        '322324-322324',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.051/pb
+        '322332-322332',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.233/pb
+        '322348-322348',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.307/pb
+        '322355-322356',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.199/pb
+        '322381-322381',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.132/pb
+        '322407-322407',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.126/pb
+        '322430-322431',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.274/pb
+        '322480-322480',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.081/pb
+        '322492-322492',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.213/pb
+        '322510-322510',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
+        '322599-322599',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.07/pb
+        '322602-322603',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.02/pb
+        '322605-322605',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.066/pb
+        '322617-322617',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.101/pb
+        '322625-322625',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.248/pb
+        '322633-322633',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.038/pb
+        '323414-323414',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
+        '323423-323423',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
+        '323470-323475',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.238/pb
+        '323487-323488',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.252/pb
+        '323492-323493',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.025/pb
+        '323495-323495',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.024/pb
+        '323524-323526',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.356/pb
+        '323693-323693',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.03/pb
+        '323696-323696',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.066/pb
+        '323702-323702',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.108/pb
+        '323725-323727',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.282/pb
+        '323755-323755',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.22/pb
+        '323775-323775',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.035/pb
+        '323778-323778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.201/pb
+        '323790-323790',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.205/pb
+        '323794-323794',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '323841-323841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.115/pb
+        '323857-323857',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.071/pb
+        '323940-323940',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.316/pb
+        '323954-323954',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
+        '323976-323976',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
+        '323978-323978',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
+        '323980-323980',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.05/pb
+        '323983-323983',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.042/pb
+        '323997-323997',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.095/pb
+        '324021-324022',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.282/pb
+        '324077-324077',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.18/pb
+        '324201-324202',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.298/pb
+        '324205-324207',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.033/pb
+        '324209-324209',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '324237-324237',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.056/pb
+        '324245-324245',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.309/pb
+        '324293-324293',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.38/pb
+        '324315-324315',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
+        '324318-324318',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.074/pb
+        '324420-324420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.148/pb
+        '324729-324729',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
+        '324747-324747',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.228/pb
+        '324764-324765',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.087/pb
+        '324769-324769',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.035/pb
+        '324772-324772',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
+        '324785-324785',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.138/pb
+        '324791-324791',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.181/pb
+        '324835-324835',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.064/pb
+        '324840-324841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.244/pb
+        '324846-324846',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.051/pb
+        '324878-324878',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.299/pb
+        '324897-324897',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
+        '324970-324970',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.355/pb
+        '324980-324980',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.38/pb
+        '324997-325001',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.274/pb
+        '325022-325022',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.321/pb
+        '325057-325057',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
+        '325097-325101',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.261/pb
+        '325110-325110',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
+        '325117-325117',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.063/pb
+        '325159-325159',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.046/pb
+        '325168-325170',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.202/pb
+        '325172-325172',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.05/pb
+      )),
+    ),
+    cms.PSet(
+      path = cms.string("HLT_Ele23_CaloIdM_TrackIdM_PFJet30"),
+      cone_minPt = cms.double(32.),
+      cone_maxPt = cms.double(100.),
+      minRecoPt = cms.double(23.),
+      jet_minPt = cms.double(30.),
+      average_prescale = cms.double(1537), # L=38.875/pb; present in all eras; prescale factor 1536.7 (1538.4 from delivery)
+      trigger_type = cms.string('1e'),
+      run_ranges = cms.vstring(*(
+        '315257-315257',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
+        '315259-315259',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315264-315265',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
+        '315267-315267',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
+        '315270-315270',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
+        '315322-315322',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.008/pb
+        '315339-315339',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
+        '315357-315357',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.007/pb
+        '315361-315361',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
+        '315363-315363',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
+        '315366-315366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
+        '315420-315420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
+        '315488-315490',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.11/pb
+        '315506-315506',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.01/pb
+        '315510-315510',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.038/pb
+        '315512-315512',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.088/pb
+        '315543-315543',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
+        '315555-315557',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.042/pb
+        '315640-315642',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
+        '315644-315648',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.163/pb
+        '315689-315690',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.166/pb
+        '315702-315705',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.122/pb
+        '315713-315713',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
+        '315721-315721',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.078/pb
+        '315741-315741',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
+        '315764-315764',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.042/pb
+        '315770-315770',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.045/pb
+        '315784-315786',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.067/pb
+        '315790-315790',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.064/pb
+        '315800-315801',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.113/pb
+        '315840-315840',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
+        '315973-315974',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16/HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.11/pb
+        '316058-316062',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.19/pb
+        '316082-316082',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.052/pb
+        '316110-316111',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.036/pb
+        '316113-316114',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.144/pb
+        '316153-316153',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.095/pb
+        '316186-316187',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.195/pb
+        '316199-316202',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.218/pb
+        '316216-316219',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.204/pb
+        '316239-316241',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.202/pb
+        '316271-316271',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.011/pb
+        '316361-316363',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
+        '316377-316380',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
+        '316455-316455',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '316457-316457',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.121/pb
+        '316469-316470',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.098/pb
+        '316472-316472',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
+        '316505-316505',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.149/pb
+        '316569-316569',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.18/pb
+        '316590-316590',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
+        '316613-316613',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '316615-316615',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '316666-316667',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.119/pb
+        '316700-316702',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.131/pb
+        '316715-316723',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.163/pb
+        '316758-316758',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.169/pb
+        '316766-316766',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.208/pb
+        '316876-316877',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.121/pb
+        '316879-316879',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '316928-316928',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.033/pb
+        '316985-316985',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.128/pb
+        '316993-316995',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.197/pb
+        '317080-317080',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '317087-317087',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.18/pb
+        '317089-317089',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.158/pb
+        '317182-317182',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.301/pb
+        '317212-317213',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.131/pb
+        '317279-317279',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
+        '317291-317292',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.266/pb
+        '317297-317297',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.092/pb
+        '317319-317320',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.381/pb
+        '317338-317340',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.163/pb
+        '317382-317383',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '317391-317392',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.365/pb
+        '317435-317435',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.267/pb
+        '317438-317438',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
+        '317475-317475',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
+        '317478-317478',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '317484-317484',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.119/pb
+        '317488-317488',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.134/pb
+        '317527-317527',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.335/pb
+        '317591-317591',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.082/pb
+        '317626-317626',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.392/pb
+        '317640-317641',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.392/pb
+        '317648-317650',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.358/pb
+        '317661-317661',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.278/pb
+        '317663-317663',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.114/pb
+        '317683-317683',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.087/pb
+        '317696-317696',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.169/pb
+        '318733-318733',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '318828-318828',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
+        '318872-318872',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
+        '318874-318874',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.074/pb
+        '318876-318877',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.153/pb
+        '319077-319077',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '319337-319337',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.172/pb
+        '319347-319349',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.19/pb
+        '319449-319450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.338/pb
+        '319456-319456',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.039/pb
+        '319459-319459',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '319486-319486',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
+        '319503-319503',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.067/pb
+        '319524-319524',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.338/pb
+        '319526-319526',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
+        '319528-319528',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
+        '319579-319579',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.606/pb
+        '319625-319625',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
+        '319639-319639',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.303/pb
+        '319656-319659',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.164/pb
+        '319678-319678',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.071/pb
+        '319687-319687',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '319697-319698',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.072/pb
+        '319756-319756',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.363/pb
+        '319840-319841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
+        '319847-319849',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.143/pb
+        '319851-319851',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '319853-319854',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.093/pb
+        '319908-319910',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.24/pb
+        '319912-319915',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
+        '319941-319942',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.083/pb
+        '319950-319950',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
+        '319991-319993',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.393/pb
+        '320002-320002',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
+        '320006-320006',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.085/pb
+        '320010-320012',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.114/pb
+        '320023-320026',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.226/pb
+        '320038-320040',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.3/pb
+        '320059-320065',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.293/pb
+        '320673-320674',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.073/pb
+        '320688-320688',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.097/pb
+        '320712-320712',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
+        '320757-320757',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.086/pb
+        '320804-320804',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.236/pb
+        '320807-320807',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
+        '320809-320809',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.079/pb
+        '320821-320824',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.337/pb
+        '320838-320838',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
+        '320840-320841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.142/pb
+        '320853-320859',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.321/pb
+        '320887-320888',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.084/pb
+        '320916-320917',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.359/pb
+        '320920-320920',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '320933-320934',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.194/pb
+        '320936-320936',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.058/pb
+        '320941-320941',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '320980-320980',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
+        '320995-320996',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
+        '321004-321007',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.237/pb
+        '321009-321012',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.078/pb
+        '321051-321051',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.231/pb
+        '321055-321055',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.093/pb
+        '321067-321069',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.274/pb
+        '321119-321119',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
+        '321121-321122',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.101/pb
+        '321124-321124',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.137/pb
+        '321126-321126',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.058/pb
+        '321134-321134',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '321138-321138',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.105/pb
+        '321140-321140',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.087/pb
+        '321149-321149',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.322/pb
+        '321165-321167',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.206/pb
+        '321177-321178',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.129/pb
+        '321218-321219',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.343/pb
+        '321221-321221',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '321230-321233',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.204/pb
+        '321262-321262',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '321283-321283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
+        '321294-321296',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.173/pb
+        '321305-321305',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.446/pb
+        '321311-321313',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.065/pb
+        '321393-321393',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
+        '321396-321397',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.309/pb
+        '321414-321415',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.387/pb
+        '321431-321434',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.219/pb
+        '321436-321436',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.103/pb
+        '321457-321457',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.358/pb
+        '321461-321461',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '321475-321475',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.35/pb
+        '321710-321710',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
+        '321712-321712',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
+        '321730-321730',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.076/pb
+        '321732-321732',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.255/pb
+        '321735-321735',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
+        '321755-321755',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.158/pb
+        '321758-321758',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
+        '321760-321760',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
+        '321773-321778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.129/pb
+        '321780-321781',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.135/pb
+        '321813-321813',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
+        '321815-321815',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
+        '321817-321818',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.212/pb
+        '321820-321820',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '321831-321834',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.361/pb
+        '321879-321880',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.097/pb
+        '321887-321887',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.205/pb
+        '321908-321909',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.36/pb
+        '321917-321917',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.193/pb
+        '321919-321919',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
+        '321933-321933',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.075/pb
+        '321960-321961',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.103/pb
+        '321973-321973',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.266/pb
+        '321975-321975',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
+        '321988-321988',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.284/pb
+        '321990-321990',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
+        '322013-322014',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '322022-322022',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.336/pb
+        '322040-322040',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
+        '322057-322057',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
+        '322068-322068',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.172/pb
+        '322079-322079',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.104/pb
+        '322106-322106',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.209/pb
+        '322113-322113',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.03/pb
+        '322118-322118',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.199/pb
+        '322179-322179',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.348/pb
+        '322201-322201',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.062/pb
+        '322204-322204',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.23/pb
+        '322222-322222',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.069/pb
+        '322252-322252',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.311/pb
+        '322317-322317',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '322319-322319',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
+        '322322-322322',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.217/pb
+        '322324-322324',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.051/pb
+        '322332-322332',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.233/pb
+        '322348-322348',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.307/pb
+        '322355-322356',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.199/pb
+        '322381-322381',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.132/pb
+        '322407-322407',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.126/pb
+        '322430-322431',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.274/pb
+        '322480-322480',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.081/pb
+        '322492-322492',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.213/pb
+        '322510-322510',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '322599-322599',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
+        '322602-322603',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
+        '322605-322605',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.066/pb
+        '322617-322617',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.101/pb
+        '322625-322625',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.248/pb
+        '322633-322633',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
+        '323414-323414',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
+        '323423-323423',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '323470-323475',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.238/pb
+        '323487-323488',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.252/pb
+        '323492-323493',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
+        '323495-323495',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
+        '323524-323526',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.356/pb
+        '323693-323693',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.03/pb
+        '323696-323696',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.066/pb
+        '323702-323702',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
+        '323725-323727',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.282/pb
+        '323755-323755',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.22/pb
+        '323775-323775',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '323778-323778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.201/pb
+        '323790-323790',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.205/pb
+        '323794-323794',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '323841-323841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.115/pb
+        '323857-323857',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.071/pb
+        '323940-323940',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.316/pb
+        '323954-323954',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '323976-323976',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '323978-323978',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
+        '323980-323980',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
+        '323983-323983',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
+        '323997-323997',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.095/pb
+        '324021-324022',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.282/pb
+        '324077-324077',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.18/pb
+        '324201-324202',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.298/pb
+        '324205-324207',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.033/pb
+        '324209-324209',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
+        '324237-324237',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.056/pb
+        '324245-324245',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.309/pb
+        '324293-324293',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.38/pb
+        '324315-324315',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
+        '324318-324318',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.074/pb
+        '324420-324420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.148/pb
+        '324729-324729',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
+        '324747-324747',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.228/pb
+        '324764-324765',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.087/pb
+        '324769-324769',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
+        '324772-324772',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
+        '324785-324785',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.138/pb
+        '324791-324791',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.181/pb
+        '324835-324835',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
+        '324840-324841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.244/pb
+        '324846-324846',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.051/pb
+        '324878-324878',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.299/pb
+        '324897-324897',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
+        '324970-324970',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.355/pb
+        '324980-324980',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.38/pb
+        '324997-325001',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.274/pb
+        '325022-325022',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.321/pb
+        '325057-325057',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
+        '325097-325101',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.261/pb
+        '325110-325110',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
+        '325117-325117',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
+        '325159-325159',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.046/pb
+        '325168-325170',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.202/pb
+        '325172-325172',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
+      )),
+    ),
+  ),
+}
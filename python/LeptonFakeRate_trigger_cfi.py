@@ -1,5841 +1,10 @@
 import FWCore.ParameterSet.Config as cms
 
-leptonFR_triggers = {
-  '2016' : {
-    'mu' : cms.VPSet(
-      cms.PSet(
-        path = cms.string("HLT_Mu3_PFJet40"),
-        cone_minPt = cms.double(10.),
-        cone_maxPt = cms.double(32.),
-        minRecoPt = cms.double(-1.),
-        jet_minPt = cms.double(45.),
-        average_prescale = cms.double(4849), # L=7.408/pb; present in all eras; prescale factor 4849.0 (4863.2 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '273158-273158', # HLT_Mu3_PFJet40_v1, 0.025/pb
-          '273302-273302', # HLT_Mu3_PFJet40_v1, 0.008/pb
-          '273402-273406', # HLT_Mu3_PFJet40_v1, 0.006/pb
-          '273408-273411', # HLT_Mu3_PFJet40_v1, 0.013/pb
-          '273425-273425', # HLT_Mu3_PFJet40_v1, 0.013/pb
-          '273446-273450', # HLT_Mu3_PFJet40_v1, 0.036/pb
-          '273492-273494', # HLT_Mu3_PFJet40_v1, 0.008/pb
-          '273502-273503', # HLT_Mu3_PFJet40_v1, 0.036/pb
-          '273554-273555', # HLT_Mu3_PFJet40_v1, 0.011/pb
-          '273725-273725', # HLT_Mu3_PFJet40_v1, 0.061/pb
-          '273728-273728', # HLT_Mu3_PFJet40_v1, 0.002/pb
-          '273730-273730', # HLT_Mu3_PFJet40_v1, 0.054/pb
-          '274094-274094', # HLT_Mu3_PFJet40_v1, 0.005/pb
-          '274146-274146', # HLT_Mu3_PFJet40_v1, 0.001/pb
-          '274157-274157', # HLT_Mu3_PFJet40_v1, 0.007/pb
-          '274159-274161', # HLT_Mu3_PFJet40_v1, 0.018/pb
-          '274172-274172', # HLT_Mu3_PFJet40_v1, 0.001/pb
-          '274198-274200', # HLT_Mu3_PFJet40_v1, 0.031/pb
-          '274240-274241', # HLT_Mu3_PFJet40_v1, 0.026/pb
-          '274244-274244', # HLT_Mu3_PFJet40_v1, 0.025/pb
-          '274250-274251', # HLT_Mu3_PFJet40_v1, 0.025/pb
-          '274283-274284', # HLT_Mu3_PFJet40_v1, 0.004/pb
-          '274286-274286', # HLT_Mu3_PFJet40_v1, 0.003/pb
-          '274314-274317', # HLT_Mu3_PFJet40_v1, 0.103/pb
-          '274319-274319', # HLT_Mu3_PFJet40_v1, 0.014/pb
-          '274335-274339', # HLT_Mu3_PFJet40_v1, 0.139/pb
-          '274344-274345', # HLT_Mu3_PFJet40_v1, 0.13/pb
-          '274382-274382', # HLT_Mu3_PFJet40_v1, 0.001/pb
-          '274387-274388', # HLT_Mu3_PFJet40_v1, 0.053/pb
-          '274420-274422', # HLT_Mu3_PFJet40_v1, 0.085/pb
-          '274440-274442', # HLT_Mu3_PFJet40_v1, 0.039/pb
-          '274954-274955', # HLT_Mu3_PFJet40_v2, 0.003/pb
-          '274968-274971', # HLT_Mu3_PFJet40_v2, 0.07/pb
-          '274998-275001', # HLT_Mu3_PFJet40_v2, 0.097/pb
-          '275059-275059', # HLT_Mu3_PFJet40_v2, 0.001/pb
-          '275066-275068', # HLT_Mu3_PFJet40_v2, 0.109/pb
-          '275073-275074', # HLT_Mu3_PFJet40_v2, 0.096/pb
-          '275124-275125', # HLT_Mu3_PFJet40_v2, 0.106/pb
-          '275282-275284', # HLT_Mu3_PFJet40_v2, 0.007/pb
-          '275290-275293', # HLT_Mu3_PFJet40_v2, 0.016/pb
-          '275309-275311', # HLT_Mu3_PFJet40_v2, 0.089/pb
-          '275319-275319', # HLT_Mu3_PFJet40_v2, 0.003/pb
-          '275337-275338', # HLT_Mu3_PFJet40_v2, 0.023/pb
-          '275344-275345', # HLT_Mu3_PFJet40_v2, 0.014/pb
-          '275370-275371', # HLT_Mu3_PFJet40_v2, 0.019/pb
-          '275375-275376', # HLT_Mu3_PFJet40_v2, 0.105/pb
-          '275657-275659', # HLT_Mu3_PFJet40_v2, 0.009/pb
-          '275761-275761', # HLT_Mu3_PFJet40_v2, 0.0/pb
-          '275767-275767', # HLT_Mu3_PFJet40_v2, 0.0/pb
-          '275772-275774', # HLT_Mu3_PFJet40_v2, 0.008/pb
-          '275776-275778', # HLT_Mu3_PFJet40_v2, 0.017/pb
-          '275782-275782', # HLT_Mu3_PFJet40_v2, 0.02/pb
-          '275832-275837', # HLT_Mu3_PFJet40_v2, 0.067/pb
-          '275847-275847', # HLT_Mu3_PFJet40_v2, 0.051/pb
-          '275886-275886', # HLT_Mu3_PFJet40_v2, 0.001/pb
-          '275890-275890', # HLT_Mu3_PFJet40_v2, 0.031/pb
-          '275911-275913', # HLT_Mu3_PFJet40_v2, 0.025/pb
-          '275918-275918', # HLT_Mu3_PFJet40_v2, 0.007/pb
-          '275920-275921', # HLT_Mu3_PFJet40_v2, 0.012/pb
-          '275923-275923', # HLT_Mu3_PFJet40_v2, 0.003/pb
-          '275931-275931', # HLT_Mu3_PFJet40_v2, 0.002/pb
-          '275963-275963', # HLT_Mu3_PFJet40_v2, 0.002/pb
-          '276092-276092', # HLT_Mu3_PFJet40_v2, 0.001/pb
-          '276097-276097', # HLT_Mu3_PFJet40_v2, 0.011/pb
-          '276242-276244', # HLT_Mu3_PFJet40_v2, 0.081/pb
-          '276282-276283', # HLT_Mu3_PFJet40_v3, 0.05/pb
-          '276315-276315', # HLT_Mu3_PFJet40_v3, 0.004/pb
-          '276317-276318', # HLT_Mu3_PFJet40_v3, 0.016/pb
-          '276355-276355', # HLT_Mu3_PFJet40_v3, 0.001/pb
-          '276361-276361', # HLT_Mu3_PFJet40_v3, 0.019/pb
-          '276363-276363', # HLT_Mu3_PFJet40_v3, 0.037/pb
-          '276384-276384', # HLT_Mu3_PFJet40_v3, 0.024/pb
-          '276437-276437', # HLT_Mu3_PFJet40_v3, 0.049/pb
-          '276454-276454', # HLT_Mu3_PFJet40_v3, 0.013/pb
-          '276458-276458', # HLT_Mu3_PFJet40_v3, 0.007/pb
-          '276495-276495', # HLT_Mu3_PFJet40_v3, 0.004/pb
-          '276501-276502', # HLT_Mu3_PFJet40_v3, 0.075/pb
-          '276525-276525', # HLT_Mu3_PFJet40_v3, 0.065/pb
-          '276527-276528', # HLT_Mu3_PFJet40_v3, 0.013/pb
-          '276542-276545', # HLT_Mu3_PFJet40_v3, 0.047/pb
-          '276581-276587', # HLT_Mu3_PFJet40_v3, 0.074/pb
-          '276653-276653', # HLT_Mu3_PFJet40_v3, 0.01/pb
-          '276655-276655', # HLT_Mu3_PFJet40_v3, 0.025/pb
-          '276659-276659', # HLT_Mu3_PFJet40_v3, 0.006/pb
-          '276775-276776', # HLT_Mu3_PFJet40_v3, 0.069/pb
-          '276794-276794', # HLT_Mu3_PFJet40_v3, 0.021/pb
-          '276807-276808', # HLT_Mu3_PFJet40_v3, 0.023/pb
-          '276810-276811', # HLT_Mu3_PFJet40_v3, 0.068/pb
-          '276831-276831', # HLT_Mu3_PFJet40_v3, 0.063/pb
-          '276834-276834', # HLT_Mu3_PFJet40_v3, 0.017/pb
-          '276870-276870', # HLT_Mu3_PFJet40_v3, 0.08/pb
-          '276935-276935', # HLT_Mu3_PFJet40_v3, 0.017/pb
-          '276940-276940', # HLT_Mu3_PFJet40_v3, 0.003/pb
-          '276946-276948', # HLT_Mu3_PFJet40_v3, 0.013/pb
-          '276950-276950', # HLT_Mu3_PFJet40_v3, 0.056/pb
-          '277069-277073', # HLT_Mu3_PFJet40_v3, 0.162/pb
-          '277076-277076', # HLT_Mu3_PFJet40_v3, 0.025/pb
-          '277087-277087', # HLT_Mu3_PFJet40_v3, 0.025/pb
-          '277094-277094', # HLT_Mu3_PFJet40_v3, 0.012/pb
-          '277096-277096', # HLT_Mu3_PFJet40_v3, 0.049/pb
-          '277112-277112', # HLT_Mu3_PFJet40_v3, 0.01/pb
-          '277126-277127', # HLT_Mu3_PFJet40_v3, 0.021/pb
-          '277148-277148', # HLT_Mu3_PFJet40_v3, 0.014/pb
-          '277166-277166', # HLT_Mu3_PFJet40_v3, 0.008/pb
-          '277168-277168', # HLT_Mu3_PFJet40_v3, 0.053/pb
-          '277180-277180', # HLT_Mu3_PFJet40_v3, 0.003/pb
-          '277194-277194', # HLT_Mu3_PFJet40_v3, 0.043/pb
-          '277305-277305', # HLT_Mu3_PFJet40_v3, 0.014/pb
-          '277420-277420', # HLT_Mu3_PFJet40_v3, 0.005/pb
-          '277981-277981', # HLT_Mu3_PFJet40_v3, 0.001/pb
-          '277991-277992', # HLT_Mu3_PFJet40_v3, 0.011/pb
-          '278017-278018', # HLT_Mu3_PFJet40_v3, 0.036/pb
-          '278167-278167', # HLT_Mu3_PFJet40_v3, 0.052/pb
-          '278175-278175', # HLT_Mu3_PFJet40_v3, 0.002/pb
-          '278193-278193', # HLT_Mu3_PFJet40_v3, 0.003/pb
-          '278239-278240', # HLT_Mu3_PFJet40_v3, 0.046/pb
-          '278273-278274', # HLT_Mu3_PFJet40_v4, 0.003/pb
-          '278288-278290', # HLT_Mu3_PFJet40_v4, 0.002/pb
-          '278308-278308', # HLT_Mu3_PFJet40_v4, 0.038/pb
-          '278310-278310', # HLT_Mu3_PFJet40_v4, 0.013/pb
-          '278315-278315', # HLT_Mu3_PFJet40_v4, 0.016/pb
-          '278345-278346', # HLT_Mu3_PFJet40_v4, 0.02/pb
-          '278349-278349', # HLT_Mu3_PFJet40_v4, 0.015/pb
-          '278366-278366', # HLT_Mu3_PFJet40_v4, 0.012/pb
-          '278406-278406', # HLT_Mu3_PFJet40_v4, 0.036/pb
-          '278509-278509', # HLT_Mu3_PFJet40_v4, 0.033/pb
-          '278769-278770', # HLT_Mu3_PFJet40_v4, 0.018/pb
-          '278801-278805', # HLT_Mu3_PFJet40_v4, 0.014/pb
-          '278808-278808', # HLT_Mu3_PFJet40_v4, 0.041/pb
-          '278820-278820', # HLT_Mu3_PFJet40_v4, 0.035/pb
-          '278822-278822', # HLT_Mu3_PFJet40_v4, 0.04/pb
-          '278873-278875', # HLT_Mu3_PFJet40_v4, 0.029/pb
-          '278923-278923', # HLT_Mu3_PFJet40_v4, 0.009/pb
-          '278957-278957', # HLT_Mu3_PFJet40_v4, 0.003/pb
-          '278962-278963', # HLT_Mu3_PFJet40_v4, 0.011/pb
-          '278969-278969', # HLT_Mu3_PFJet40_v4, 0.031/pb
-          '278975-278976', # HLT_Mu3_PFJet40_v4, 0.02/pb
-          '278986-278986', # HLT_Mu3_PFJet40_v4, 0.003/pb
-          '279024-279024', # HLT_Mu3_PFJet40_v4, 0.007/pb
-          '279029-279029', # HLT_Mu3_PFJet40_v4, 0.005/pb
-          '279071-279071', # HLT_Mu3_PFJet40_v4, 0.004/pb
-          '279080-279080', # HLT_Mu3_PFJet40_v4, 0.003/pb
-          '279115-279116', # HLT_Mu3_PFJet40_v4, 0.019/pb
-          '279479-279479', # HLT_Mu3_PFJet40_v4, 0.005/pb
-          '279588-279588', # HLT_Mu3_PFJet40_v4, 0.105/pb
-          '279653-279654', # HLT_Mu3_PFJet40_v4, 0.131/pb
-          '279656-279656', # HLT_Mu3_PFJet40_v4, 0.004/pb
-          '279658-279658', # HLT_Mu3_PFJet40_v4, 0.079/pb
-          '279667-279667', # HLT_Mu3_PFJet40_v4, 0.082/pb
-          '279681-279685', # HLT_Mu3_PFJet40_v4, 0.023/pb
-          '279691-279691', # HLT_Mu3_PFJet40_v4, 0.003/pb
-          '279694-279694', # HLT_Mu3_PFJet40_v4, 0.215/pb
-          '279715-279716', # HLT_Mu3_PFJet40_v4, 0.215/pb
-          '279760-279760', # HLT_Mu3_PFJet40_v4, 0.049/pb
-          '279766-279767', # HLT_Mu3_PFJet40_v4, 0.255/pb
-          '279794-279794', # HLT_Mu3_PFJet40_v4, 0.086/pb
-          '279823-279823', # HLT_Mu3_PFJet40_v4, 0.024/pb
-          '279841-279841', # HLT_Mu3_PFJet40_v4, 0.185/pb
-          '279844-279844', # HLT_Mu3_PFJet40_v4, 0.015/pb
-          '279887-279887', # HLT_Mu3_PFJet40_v4, 0.006/pb
-          '279931-279931', # HLT_Mu3_PFJet40_v4, 0.293/pb
-          '279966-279966', # HLT_Mu3_PFJet40_v4, 0.025/pb
-          '279975-279975', # HLT_Mu3_PFJet40_v4, 0.085/pb
-          '279993-279994', # HLT_Mu3_PFJet40_v4, 0.008/pb
-          '280013-280013', # HLT_Mu3_PFJet40_v4, 0.002/pb
-          '280015-280018', # HLT_Mu3_PFJet40_v4, 0.111/pb
-          '280020-280020', # HLT_Mu3_PFJet40_v4, 0.001/pb
-          '280024-280024', # HLT_Mu3_PFJet40_v4, 0.012/pb
-          '280187-280188', # HLT_Mu3_PFJet40_v4, 0.006/pb
-          '280191-280191', # HLT_Mu3_PFJet40_v4, 0.021/pb
-          '280194-280194', # HLT_Mu3_PFJet40_v4, 0.005/pb
-          '280242-280242', # HLT_Mu3_PFJet40_v4, 0.014/pb
-          '280249-280249', # HLT_Mu3_PFJet40_v4, 0.034/pb
-          '280251-280251', # HLT_Mu3_PFJet40_v4, 0.009/pb
-          '280327-280327', # HLT_Mu3_PFJet40_v4, 0.001/pb
-          '280330-280330', # HLT_Mu3_PFJet40_v4, 0.019/pb
-          '280349-280349', # HLT_Mu3_PFJet40_v4, 0.014/pb
-          '280363-280364', # HLT_Mu3_PFJet40_v4, 0.04/pb
-          '280383-280385', # HLT_Mu3_PFJet40_v4, 0.045/pb
-          '281613-281613', # HLT_Mu3_PFJet40_v6, 0.012/pb
-          '281639-281639', # HLT_Mu3_PFJet40_v6, 0.002/pb
-          '281641-281641', # HLT_Mu3_PFJet40_v6, 0.005/pb
-          '281693-281693', # HLT_Mu3_PFJet40_v6, 0.05/pb
-          '281707-281707', # HLT_Mu3_PFJet40_v6, 0.02/pb
-          '281726-281727', # HLT_Mu3_PFJet40_v6, 0.043/pb
-          '281797-281797', # HLT_Mu3_PFJet40_v6, 0.045/pb
-          '281975-281976', # HLT_Mu3_PFJet40_v6, 0.055/pb
-          '282033-282035', # HLT_Mu3_PFJet40_v6, 0.002/pb
-          '282037-282037', # HLT_Mu3_PFJet40_v6, 0.044/pb
-          '282092-282092', # HLT_Mu3_PFJet40_v6, 0.041/pb
-          '282708-282708', # HLT_Mu3_PFJet40_v6, 0.0/pb
-          '282710-282710', # HLT_Mu3_PFJet40_v6, 0.0/pb
-          '282712-282712', # HLT_Mu3_PFJet40_v6, 0.001/pb
-          '282730-282735', # HLT_Mu3_PFJet40_v6, 0.059/pb
-          '282800-282800', # HLT_Mu3_PFJet40_v6, 0.007/pb
-          '282807-282807', # HLT_Mu3_PFJet40_v6, 0.007/pb
-          '282814-282814', # HLT_Mu3_PFJet40_v6, 0.043/pb
-          '282842-282842', # HLT_Mu3_PFJet40_v6, 0.002/pb
-          '282917-282919', # HLT_Mu3_PFJet40_v6, 0.007/pb
-          '282922-282923', # HLT_Mu3_PFJet40_v6, 0.008/pb
-          '283042-283043', # HLT_Mu3_PFJet40_v6, 0.011/pb
-          '283049-283050', # HLT_Mu3_PFJet40_v6, 0.004/pb
-          '283052-283052', # HLT_Mu3_PFJet40_v6, 0.002/pb
-          '283059-283059', # HLT_Mu3_PFJet40_v6, 0.01/pb
-          '283270-283270', # HLT_Mu3_PFJet40_v6, 0.039/pb
-          '283283-283283', # HLT_Mu3_PFJet40_v6, 0.043/pb
-          '283305-283308', # HLT_Mu3_PFJet40_v6, 0.037/pb
-          '283353-283353', # HLT_Mu3_PFJet40_v6, 0.015/pb
-          '283358-283359', # HLT_Mu3_PFJet40_v6, 0.031/pb
-          '283407-283408', # HLT_Mu3_PFJet40_v6, 0.052/pb
-          '283416-283416', # HLT_Mu3_PFJet40_v6, 0.004/pb
-          '283453-283453', # HLT_Mu3_PFJet40_v6, 0.009/pb
-          '283469-283469', # HLT_Mu3_PFJet40_v6, 0.0/pb
-          '283478-283478', # HLT_Mu3_PFJet40_v6, 0.018/pb
-          '283548-283548', # HLT_Mu3_PFJet40_v6, 0.003/pb
-          '283680-283682', # HLT_Mu3_PFJet40_v6, 0.011/pb
-          '283685-283685', # HLT_Mu3_PFJet40_v6, 0.006/pb
-          '283820-283820', # HLT_Mu3_PFJet40_v6, 0.032/pb
-          '283830-283830', # HLT_Mu3_PFJet40_v6, 0.017/pb
-          '283834-283835', # HLT_Mu3_PFJet40_v6, 0.004/pb
-          '283865-283865', # HLT_Mu3_PFJet40_v6, 0.025/pb
-          '283876-283877', # HLT_Mu3_PFJet40_v6, 0.047/pb
-          '283884-283885', # HLT_Mu3_PFJet40_v6, 0.046/pb
-          '283933-283934', # HLT_Mu3_PFJet40_v6, 0.03/pb
-          '283946-283946', # HLT_Mu3_PFJet40_v6, 0.03/pb
-          '283964-283964', # HLT_Mu3_PFJet40_v6, 0.008/pb
-          '284006-284006', # HLT_Mu3_PFJet40_v6, 0.007/pb
-          '284014-284014', # HLT_Mu3_PFJet40_v6, 0.006/pb
-          '284025-284025', # HLT_Mu3_PFJet40_v6, 0.001/pb
-          '284029-284029', # HLT_Mu3_PFJet40_v6, 0.002/pb
-          '284035-284044', # HLT_Mu3_PFJet40_v6, 0.035/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu8"),
-        cone_minPt = cms.double(15.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(8.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(9123), # L=3.937/pb; present in all eras; prescale factor 9123.1 (9081.0 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '273158-273158',  # HLT_Mu8_v3, 0.14/pb
-          '273302-273302',  # HLT_Mu8_v3, 0.045/pb
-          '273402-273406',  # HLT_Mu8_v3, 0.033/pb
-          '273408-273411',  # HLT_Mu8_v3, 0.142/pb
-          '273425-273425',  # HLT_Mu8_v3, 0.074/pb
-          '273446-273450',  # HLT_Mu8_v3, 0.206/pb
-          '273492-273494',  # HLT_Mu8_v3, 0.086/pb
-          '273502-273503',  # HLT_Mu8_v3, 0.2/pb
-          '273554-273555',  # HLT_Mu8_v3, 0.065/pb
-          '273725-273725',  # HLT_Mu8_v3, 0.342/pb
-          '273728-273728',  # HLT_Mu8_v3, 0.014/pb
-          '273730-273730',  # HLT_Mu8_v3, 0.253/pb
-          '274094-274094',  # HLT_Mu8_v3, 0.027/pb
-          '274146-274146',  # HLT_Mu8_v3, 0.009/pb
-          '274157-274157',  # HLT_Mu8_v3, 0.028/pb
-          '274159-274161',  # HLT_Mu8_v3, 0.105/pb
-          '274172-274172',  # HLT_Mu8_v3, 0.005/pb
-          '274198-274200',  # HLT_Mu8_v3, 0.022/pb
-          '274240-274241',  # HLT_Mu8_v3, 0.016/pb
-          '274244-274244',  # HLT_Mu8_v3, 0.021/pb
-          '274250-274251',  # HLT_Mu8_v3, 0.011/pb
-          '274283-274284',  # HLT_Mu8_v3, 0.002/pb
-          '274286-274286',  # HLT_Mu8_v3, 0.001/pb
-          '274314-274317',  # HLT_Mu8_v3, 0.013/pb
-          '274319-274319',  # HLT_Mu8_v3, 0.001/pb
-          '274335-274339',  # HLT_Mu8_v3, 0.02/pb
-          '274344-274345',  # HLT_Mu8_v3, 0.028/pb
-          '274382-274382',  # HLT_Mu8_v3, 0.0/pb
-          '274387-274388',  # HLT_Mu8_v3, 0.028/pb
-          '274420-274422',  # HLT_Mu8_v3, 0.057/pb
-          '274440-274442',  # HLT_Mu8_v3, 0.021/pb
-          '274954-274955',  # HLT_Mu8_v4, 0.002/pb
-          '274968-274971',  # HLT_Mu8_v4, 0.038/pb
-          '274998-275001',  # HLT_Mu8_v4, 0.061/pb
-          '275059-275059',  # HLT_Mu8_v4, 0.0/pb
-          '275066-275068',  # HLT_Mu8_v4, 0.011/pb
-          '275073-275074',  # HLT_Mu8_v4, 0.019/pb
-          '275124-275125',  # HLT_Mu8_v4, 0.012/pb
-          '275282-275284',  # HLT_Mu8_v4, 0.002/pb
-          '275290-275293',  # HLT_Mu8_v4, 0.009/pb
-          '275309-275311',  # HLT_Mu8_v4, 0.06/pb
-          '275319-275319',  # HLT_Mu8_v4, 0.001/pb
-          '275337-275338',  # HLT_Mu8_v4, 0.01/pb
-          '275344-275345',  # HLT_Mu8_v4, 0.005/pb
-          '275370-275371',  # HLT_Mu8_v4, 0.007/pb
-          '275375-275376',  # HLT_Mu8_v4, 0.066/pb
-          '275657-275659',  # HLT_Mu8_v4, 0.003/pb
-          '275761-275761',  # HLT_Mu8_v4, 0.0/pb
-          '275767-275767',  # HLT_Mu8_v4, 0.004/pb
-          '275772-275774',  # HLT_Mu8_v4, 0.009/pb
-          '275776-275778',  # HLT_Mu8_v4, 0.006/pb
-          '275782-275782',  # HLT_Mu8_v4, 0.013/pb
-          '275832-275837',  # HLT_Mu8_v4, 0.033/pb
-          '275847-275847',  # HLT_Mu8_v4, 0.038/pb
-          '275886-275886',  # HLT_Mu8_v4, 0.0/pb
-          '275890-275890',  # HLT_Mu8_v4, 0.011/pb
-          '275911-275913',  # HLT_Mu8_v4, 0.009/pb
-          '275918-275918',  # HLT_Mu8_v4, 0.002/pb
-          '275920-275921',  # HLT_Mu8_v4, 0.008/pb
-          '275923-275923',  # HLT_Mu8_v4, 0.002/pb
-          '275931-275931',  # HLT_Mu8_v4, 0.001/pb
-          '275963-275963',  # HLT_Mu8_v4, 0.001/pb
-          '276092-276092',  # HLT_Mu8_v4, 0.0/pb
-          '276097-276097',  # HLT_Mu8_v4, 0.004/pb
-          '276242-276244',  # HLT_Mu8_v4, 0.044/pb
-          '276282-276283',  # HLT_Mu8_v4, 0.02/pb
-          '276315-276315',  # HLT_Mu8_v4, 0.001/pb
-          '276317-276318',  # HLT_Mu8_v4, 0.005/pb
-          '276355-276355',  # HLT_Mu8_v4, 0.0/pb
-          '276361-276361',  # HLT_Mu8_v4, 0.007/pb
-          '276363-276363',  # HLT_Mu8_v4, 0.021/pb
-          '276384-276384',  # HLT_Mu8_v4, 0.016/pb
-          '276437-276437',  # HLT_Mu8_v4, 0.02/pb
-          '276454-276454',  # HLT_Mu8_v4, 0.008/pb
-          '276458-276458',  # HLT_Mu8_v4, 0.005/pb
-          '276495-276495',  # HLT_Mu8_v4, 0.001/pb
-          '276501-276502',  # HLT_Mu8_v4, 0.037/pb
-          '276525-276525',  # HLT_Mu8_v4, 0.034/pb
-          '276527-276528',  # HLT_Mu8_v4, 0.009/pb
-          '276542-276545',  # HLT_Mu8_v4, 0.02/pb
-          '276581-276587',  # HLT_Mu8_v4, 0.04/pb
-          '276653-276653',  # HLT_Mu8_v4, 0.004/pb
-          '276655-276655',  # HLT_Mu8_v4, 0.011/pb
-          '276659-276659',  # HLT_Mu8_v4, 0.004/pb
-          '276775-276776',  # HLT_Mu8_v4, 0.035/pb
-          '276794-276794',  # HLT_Mu8_v4, 0.016/pb
-          '276807-276808',  # HLT_Mu8_v4, 0.008/pb
-          '276810-276811',  # HLT_Mu8_v4, 0.043/pb
-          '276831-276831',  # HLT_Mu8_v4, 0.032/pb
-          '276834-276834',  # HLT_Mu8_v4, 0.012/pb
-          '276870-276870',  # HLT_Mu8_v4, 0.041/pb
-          '276935-276935',  # HLT_Mu8_v4, 0.006/pb
-          '276940-276940',  # HLT_Mu8_v4, 0.001/pb
-          '276946-276948',  # HLT_Mu8_v4, 0.005/pb
-          '276950-276950',  # HLT_Mu8_v4, 0.031/pb
-          '277069-277073',  # HLT_Mu8_v4, 0.018/pb
-          '277076-277076',  # HLT_Mu8_v4, 0.017/pb
-          '277087-277087',  # HLT_Mu8_v4, 0.019/pb
-          '277094-277094',  # HLT_Mu8_v4, 0.004/pb
-          '277096-277096',  # HLT_Mu8_v4, 0.023/pb
-          '277112-277112',  # HLT_Mu8_v4, 0.002/pb
-          '277126-277127',  # HLT_Mu8_v4, 0.007/pb
-          '277148-277148',  # HLT_Mu8_v4, 0.005/pb
-          '277166-277166',  # HLT_Mu8_v4, 0.003/pb
-          '277168-277168',  # HLT_Mu8_v4, 0.029/pb
-          '277180-277180',  # HLT_Mu8_v4, 0.001/pb
-          '277194-277194',  # HLT_Mu8_v4, 0.015/pb
-          '277305-277305',  # HLT_Mu8_v4, 0.005/pb
-          '277420-277420',  # HLT_Mu8_v4, 0.002/pb
-          '277981-277981',  # HLT_Mu8_v4, 0.001/pb
-          '277991-277992',  # HLT_Mu8_v4, 0.009/pb
-          '278017-278018',  # HLT_Mu8_v4, 0.013/pb
-          '278167-278167',  # HLT_Mu8_v4, 0.027/pb
-          '278175-278175',  # HLT_Mu8_v4, 0.001/pb
-          '278193-278193',  # HLT_Mu8_v4, 0.001/pb
-          '278239-278240',  # HLT_Mu8_v4, 0.021/pb
-          '278273-278274',  # HLT_Mu8_v4, 0.001/pb
-          '278288-278290',  # HLT_Mu8_v4, 0.0/pb
-          '278308-278308',  # HLT_Mu8_v4, 0.011/pb
-          '278310-278310',  # HLT_Mu8_v4, 0.004/pb
-          '278315-278315',  # HLT_Mu8_v4, 0.005/pb
-          '278345-278346',  # HLT_Mu8_v4, 0.006/pb
-          '278349-278349',  # HLT_Mu8_v4, 0.005/pb
-          '278366-278366',  # HLT_Mu8_v4, 0.004/pb
-          '278406-278406',  # HLT_Mu8_v4, 0.011/pb
-          '278509-278509',  # HLT_Mu8_v4, 0.01/pb
-          '278769-278770',  # HLT_Mu8_v4, 0.005/pb
-          '278801-278805',  # HLT_Mu8_v4, 0.01/pb
-          '278808-278808',  # HLT_Mu8_v4, 0.013/pb
-          '278820-278820',  # HLT_Mu8_v4, 0.01/pb
-          '278822-278822',  # HLT_Mu8_v4, 0.013/pb
-          '278873-278875',  # HLT_Mu8_v4, 0.009/pb
-          '278923-278923',  # HLT_Mu8_v4, 0.003/pb
-          '278957-278957',  # HLT_Mu8_v4, 0.001/pb
-          '278962-278963',  # HLT_Mu8_v4, 0.003/pb
-          '278969-278969',  # HLT_Mu8_v4, 0.009/pb
-          '278975-278976',  # HLT_Mu8_v4, 0.006/pb
-          '278986-278986',  # HLT_Mu8_v4, 0.001/pb
-          '279024-279024',  # HLT_Mu8_v4, 0.002/pb
-          '279029-279029',  # HLT_Mu8_v4, 0.002/pb
-          '279071-279071',  # HLT_Mu8_v4, 0.001/pb
-          '279080-279080',  # HLT_Mu8_v4, 0.001/pb
-          '279115-279116',  # HLT_Mu8_v4, 0.006/pb
-          '279479-279479',  # HLT_Mu8_v4, 0.0/pb
-          '279588-279588',  # HLT_Mu8_v4, 0.008/pb
-          '279653-279654',  # HLT_Mu8_v4, 0.01/pb
-          '279656-279656',  # HLT_Mu8_v4, 0.0/pb
-          '279658-279658',  # HLT_Mu8_v4, 0.006/pb
-          '279667-279667',  # HLT_Mu8_v4, 0.006/pb
-          '279681-279685',  # HLT_Mu8_v4, 0.002/pb
-          '279691-279691',  # HLT_Mu8_v4, 0.0/pb
-          '279694-279694',  # HLT_Mu8_v4, 0.016/pb
-          '279715-279716',  # HLT_Mu8_v4, 0.016/pb
-          '279760-279760',  # HLT_Mu8_v4, 0.004/pb
-          '279766-279767',  # HLT_Mu8_v4, 0.018/pb
-          '279794-279794',  # HLT_Mu8_v4, 0.007/pb
-          '279823-279823',  # HLT_Mu8_v4, 0.002/pb
-          '279841-279841',  # HLT_Mu8_v4, 0.014/pb
-          '279844-279844',  # HLT_Mu8_v4, 0.001/pb
-          '279887-279887',  # HLT_Mu8_v4, 0.002/pb
-          '279931-279931',  # HLT_Mu8_v4, 0.021/pb
-          '279966-279966',  # HLT_Mu8_v4, 0.002/pb
-          '279975-279975',  # HLT_Mu8_v4, 0.007/pb
-          '279993-279994',  # HLT_Mu8_v4, 0.001/pb
-          '280013-280013',  # HLT_Mu8_v4, 0.0/pb
-          '280015-280018',  # HLT_Mu8_v4, 0.022/pb
-          '280020-280020',  # HLT_Mu8_v4, 0.0/pb
-          '280024-280024',  # HLT_Mu8_v4, 0.004/pb
-          '280187-280188',  # HLT_Mu8_v4, 0.002/pb
-          '280191-280191',  # HLT_Mu8_v4, 0.006/pb
-          '280194-280194',  # HLT_Mu8_v4, 0.002/pb
-          '280242-280242',  # HLT_Mu8_v4, 0.004/pb
-          '280249-280249',  # HLT_Mu8_v4, 0.011/pb
-          '280251-280251',  # HLT_Mu8_v4, 0.003/pb
-          '280327-280327',  # HLT_Mu8_v4, 0.0/pb
-          '280330-280330',  # HLT_Mu8_v4, 0.006/pb
-          '280349-280349',  # HLT_Mu8_v4, 0.005/pb
-          '280363-280364',  # HLT_Mu8_v4, 0.013/pb
-          '280383-280385',  # HLT_Mu8_v4, 0.014/pb
-          '281613-281613',  # HLT_Mu8_v5, 0.001/pb
-          '281639-281639',  # HLT_Mu8_v5, 0.0/pb
-          '281641-281641',  # HLT_Mu8_v5, 0.001/pb
-          '281693-281693',  # HLT_Mu8_v5, 0.016/pb
-          '281707-281707',  # HLT_Mu8_v5, 0.006/pb
-          '281726-281727',  # HLT_Mu8_v5, 0.014/pb
-          '281797-281797',  # HLT_Mu8_v5, 0.014/pb
-          '281975-281976',  # HLT_Mu8_v5, 0.017/pb
-          '282033-282035',  # HLT_Mu8_v5, 0.001/pb
-          '282037-282037',  # HLT_Mu8_v5, 0.013/pb
-          '282092-282092',  # HLT_Mu8_v5, 0.013/pb
-          '282708-282708',  # HLT_Mu8_v5, 0.0/pb
-          '282710-282710',  # HLT_Mu8_v5, 0.002/pb
-          '282712-282712',  # HLT_Mu8_v5, 0.0/pb
-          '282730-282735',  # HLT_Mu8_v5, 0.018/pb
-          '282800-282800',  # HLT_Mu8_v5, 0.002/pb
-          '282807-282807',  # HLT_Mu8_v5, 0.002/pb
-          '282814-282814',  # HLT_Mu8_v5, 0.014/pb
-          '282842-282842',  # HLT_Mu8_v5, 0.0/pb
-          '282917-282919',  # HLT_Mu8_v5, 0.002/pb
-          '282922-282923',  # HLT_Mu8_v5, 0.002/pb
-          '283042-283043',  # HLT_Mu8_v5, 0.013/pb
-          '283049-283050',  # HLT_Mu8_v5, 0.001/pb
-          '283052-283052',  # HLT_Mu8_v5, 0.001/pb
-          '283059-283059',  # HLT_Mu8_v5, 0.003/pb
-          '283270-283270',  # HLT_Mu8_v5, 0.012/pb
-          '283283-283283',  # HLT_Mu8_v5, 0.014/pb
-          '283305-283308',  # HLT_Mu8_v5, 0.011/pb
-          '283353-283353',  # HLT_Mu8_v5, 0.004/pb
-          '283358-283359',  # HLT_Mu8_v5, 0.01/pb
-          '283407-283408',  # HLT_Mu8_v5, 0.016/pb
-          '283416-283416',  # HLT_Mu8_v5, 0.001/pb
-          '283453-283453',  # HLT_Mu8_v5, 0.003/pb
-          '283469-283469',  # HLT_Mu8_v5, 0.0/pb
-          '283478-283478',  # HLT_Mu8_v5, 0.005/pb
-          '283548-283548',  # HLT_Mu8_v5, 0.001/pb
-          '283680-283682',  # HLT_Mu8_v5, 0.003/pb
-          '283685-283685',  # HLT_Mu8_v5, 0.001/pb
-          '283820-283820',  # HLT_Mu8_v5, 0.01/pb
-          '283830-283830',  # HLT_Mu8_v5, 0.005/pb
-          '283834-283835',  # HLT_Mu8_v5, 0.001/pb
-          '283865-283865',  # HLT_Mu8_v5, 0.007/pb
-          '283876-283877',  # HLT_Mu8_v5, 0.014/pb
-          '283884-283885',  # HLT_Mu8_v5, 0.014/pb
-          '283933-283934',  # HLT_Mu8_v5, 0.009/pb
-          '283946-283946',  # HLT_Mu8_v5, 0.009/pb
-          '283964-283964',  # HLT_Mu8_v5, 0.003/pb
-          '284006-284006',  # HLT_Mu8_v5, 0.002/pb
-          '284014-284014',  # HLT_Mu8_v5, 0.002/pb
-          '284025-284025',  # HLT_Mu8_v5, 0.0/pb
-          '284029-284029',  # HLT_Mu8_v5, 0.001/pb
-          '284035-284044',  # HLT_Mu8_v5, 0.011/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu17"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(17.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(127.0), # L=282.781/pb; present in all eras; prescale factor 127.0 (127.4 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '273158-273158',  # HLT_Mu17_v2, 1.83/pb
-          '273302-273302',  # HLT_Mu17_v2, 1.632/pb
-          '273402-273406',  # HLT_Mu17_v2, 1.179/pb
-          '273408-273411',  # HLT_Mu17_v2, 4.394/pb
-          '273425-273425',  # HLT_Mu17_v2, 2.672/pb
-          '273446-273450',  # HLT_Mu17_v2, 7.207/pb
-          '273492-273494',  # HLT_Mu17_v2, 3.092/pb
-          '273502-273503',  # HLT_Mu17_v2, 7.215/pb
-          '273554-273555',  # HLT_Mu17_v2, 2.157/pb
-          '273725-273725',  # HLT_Mu17_v2, 11.978/pb
-          '273728-273728',  # HLT_Mu17_v2, 0.49/pb
-          '273730-273730',  # HLT_Mu17_v2, 13.853/pb
-          '274094-274094',  # HLT_Mu17_v2, 0.973/pb
-          '274146-274146',  # HLT_Mu17_v2, 0.284/pb
-          '274157-274157',  # HLT_Mu17_v2, 0.792/pb
-          '274159-274161',  # HLT_Mu17_v2, 3.493/pb
-          '274172-274172',  # HLT_Mu17_v2, 0.159/pb
-          '274198-274200',  # HLT_Mu17_v2, 5.944/pb
-          '274240-274241',  # HLT_Mu17_v2, 3.64/pb
-          '274244-274244',  # HLT_Mu17_v2, 5.035/pb
-          '274250-274251',  # HLT_Mu17_v2, 1.686/pb
-          '274283-274284',  # HLT_Mu17_v2, 0.101/pb
-          '274286-274286',  # HLT_Mu17_v2, 0.072/pb
-          '274314-274317',  # HLT_Mu17_v2, 0.689/pb
-          '274319-274319',  # HLT_Mu17_v2, 0.091/pb
-          '274335-274339',  # HLT_Mu17_v2, 4.292/pb
-          '274344-274345',  # HLT_Mu17_v2, 6.735/pb
-          '274382-274382',  # HLT_Mu17_v2, 0.025/pb
-          '274387-274388',  # HLT_Mu17_v2, 6.241/pb
-          '274420-274422',  # HLT_Mu17_v2, 14.117/pb
-          '274440-274442',  # HLT_Mu17_v2, 5.433/pb
-          '274954-274955',  # HLT_Mu17_v3, 0.574/pb
-          '274968-274971',  # HLT_Mu17_v3, 10.006/pb
-          '274998-275001',  # HLT_Mu17_v3, 16.245/pb
-          '275059-275059',  # HLT_Mu17_v3, 0.03/pb
-          '275066-275068',  # HLT_Mu17_v3, 2.045/pb
-          '275073-275074',  # HLT_Mu17_v3, 5.743/pb
-          '275124-275125',  # HLT_Mu17_v3, 2.567/pb
-          '275282-275284',  # HLT_Mu17_v3, 0.37/pb
-          '275290-275293',  # HLT_Mu17_v3, 2.366/pb
-          '275309-275311',  # HLT_Mu17_v3, 16.568/pb
-          '275319-275319',  # HLT_Mu17_v3, 0.123/pb
-          '275337-275338',  # HLT_Mu17_v3, 2.325/pb
-          '275344-275345',  # HLT_Mu17_v3, 0.726/pb
-          '275370-275371',  # HLT_Mu17_v3, 0.995/pb
-          '275375-275376',  # HLT_Mu17_v3, 17.508/pb
-          '275657-275659',  # HLT_Mu17_v3, 0.251/pb
-          '275761-275761',  # HLT_Mu17_v3, 0.004/pb
-          '275767-275767',  # HLT_Mu17_v3, 0.002/pb
-          '275772-275774',  # HLT_Mu17_v3, 0.22/pb
-          '275776-275778',  # HLT_Mu17_v3, 0.468/pb
-          '275782-275782',  # HLT_Mu17_v3, 0.552/pb
-          '275832-275837',  # HLT_Mu17_v3, 1.843/pb
-          '275847-275847',  # HLT_Mu17_v3, 1.428/pb
-          '275886-275886',  # HLT_Mu17_v3, 0.019/pb
-          '275890-275890',  # HLT_Mu17_v3, 0.857/pb
-          '275911-275913',  # HLT_Mu17_v3, 0.678/pb
-          '275918-275918',  # HLT_Mu17_v3, 0.199/pb
-          '275920-275921',  # HLT_Mu17_v3, 0.344/pb
-          '275923-275923',  # HLT_Mu17_v3, 0.081/pb
-          '275931-275931',  # HLT_Mu17_v3, 0.058/pb
-          '275963-275963',  # HLT_Mu17_v3, 0.049/pb
-          '276092-276092',  # HLT_Mu17_v3, 0.037/pb
-          '276097-276097',  # HLT_Mu17_v3, 0.297/pb
-          '276242-276244',  # HLT_Mu17_v3, 2.232/pb
-          '276282-276283',  # HLT_Mu17_v3, 1.367/pb
-          '276315-276315',  # HLT_Mu17_v3, 0.096/pb
-          '276317-276318',  # HLT_Mu17_v3, 0.421/pb
-          '276355-276355',  # HLT_Mu17_v3, 0.016/pb
-          '276361-276361',  # HLT_Mu17_v3, 0.522/pb
-          '276363-276363',  # HLT_Mu17_v3, 1.026/pb
-          '276384-276384',  # HLT_Mu17_v3, 0.675/pb
-          '276437-276437',  # HLT_Mu17_v3, 1.348/pb
-          '276454-276454',  # HLT_Mu17_v3, 0.352/pb
-          '276458-276458',  # HLT_Mu17_v3, 0.209/pb
-          '276495-276495',  # HLT_Mu17_v3, 0.095/pb
-          '276501-276502',  # HLT_Mu17_v3, 2.046/pb
-          '276525-276525',  # HLT_Mu17_v3, 1.791/pb
-          '276527-276528',  # HLT_Mu17_v3, 0.353/pb
-          '276542-276545',  # HLT_Mu17_v3, 1.295/pb
-          '276581-276587',  # HLT_Mu17_v3, 2.032/pb
-          '276653-276653',  # HLT_Mu17_v3, 0.27/pb
-          '276655-276655',  # HLT_Mu17_v3, 0.699/pb
-          '276659-276659',  # HLT_Mu17_v3, 0.166/pb
-          '276775-276776',  # HLT_Mu17_v3, 1.911/pb
-          '276794-276794',  # HLT_Mu17_v3, 0.591/pb
-          '276807-276808',  # HLT_Mu17_v3, 0.63/pb
-          '276810-276811',  # HLT_Mu17_v3, 1.896/pb
-          '276831-276831',  # HLT_Mu17_v3, 1.736/pb
-          '276834-276834',  # HLT_Mu17_v3, 0.474/pb
-          '276870-276870',  # HLT_Mu17_v3, 3.24/pb
-          '276935-276935',  # HLT_Mu17_v3, 0.712/pb
-          '276940-276940',  # HLT_Mu17_v3, 0.104/pb
-          '276946-276948',  # HLT_Mu17_v3, 0.549/pb
-          '276950-276950',  # HLT_Mu17_v3, 2.259/pb
-          '277069-277073',  # HLT_Mu17_v3, 1.918/pb
-          '277076-277076',  # HLT_Mu17_v3, 1.007/pb
-          '277087-277087',  # HLT_Mu17_v3, 1.151/pb
-          '277094-277094',  # HLT_Mu17_v3, 0.485/pb
-          '277096-277096',  # HLT_Mu17_v3, 1.982/pb
-          '277112-277112',  # HLT_Mu17_v3, 0.113/pb
-          '277126-277127',  # HLT_Mu17_v3, 0.852/pb
-          '277148-277148',  # HLT_Mu17_v3, 0.574/pb
-          '277166-277166',  # HLT_Mu17_v3, 0.323/pb
-          '277168-277168',  # HLT_Mu17_v3, 2.141/pb
-          '277180-277180',  # HLT_Mu17_v3, 0.115/pb
-          '277194-277194',  # HLT_Mu17_v3, 1.767/pb
-          '277305-277305',  # HLT_Mu17_v3, 0.575/pb
-          '277420-277420',  # HLT_Mu17_v3, 0.22/pb
-          '277981-277981',  # HLT_Mu17_v3, 0.061/pb
-          '277991-277992',  # HLT_Mu17_v3, 0.428/pb
-          '278017-278018',  # HLT_Mu17_v3, 1.424/pb
-          '278167-278167',  # HLT_Mu17_v3, 2.084/pb
-          '278175-278175',  # HLT_Mu17_v3, 0.083/pb
-          '278193-278193',  # HLT_Mu17_v3, 0.132/pb
-          '278239-278240',  # HLT_Mu17_v3, 1.881/pb
-          '278273-278274',  # HLT_Mu17_v3, 0.039/pb
-          '278288-278290',  # HLT_Mu17_v3, 0.024/pb
-          '278308-278308',  # HLT_Mu17_v3, 0.508/pb
-          '278310-278310',  # HLT_Mu17_v3, 0.16/pb
-          '278315-278315',  # HLT_Mu17_v3, 0.212/pb
-          '278345-278346',  # HLT_Mu17_v3, 0.263/pb
-          '278349-278349',  # HLT_Mu17_v3, 0.185/pb
-          '278366-278366',  # HLT_Mu17_v3, 0.149/pb
-          '278406-278406',  # HLT_Mu17_v3, 0.467/pb
-          '278509-278509',  # HLT_Mu17_v3, 0.423/pb
-          '278769-278770',  # HLT_Mu17_v3, 0.244/pb
-          '278801-278805',  # HLT_Mu17_v3, 0.19/pb
-          '278808-278808',  # HLT_Mu17_v3, 0.518/pb
-          '278820-278820',  # HLT_Mu17_v3, 0.449/pb
-          '278822-278822',  # HLT_Mu17_v3, 0.507/pb
-          '278873-278875',  # HLT_Mu17_v3, 0.369/pb
-          '278923-278923',  # HLT_Mu17_v3, 0.116/pb
-          '278957-278957',  # HLT_Mu17_v3, 0.04/pb
-          '278962-278963',  # HLT_Mu17_v3, 0.149/pb
-          '278969-278969',  # HLT_Mu17_v3, 0.409/pb
-          '278975-278976',  # HLT_Mu17_v3, 0.244/pb
-          '278986-278986',  # HLT_Mu17_v3, 0.035/pb
-          '279024-279024',  # HLT_Mu17_v3, 0.088/pb
-          '279029-279029',  # HLT_Mu17_v3, 0.068/pb
-          '279071-279071',  # HLT_Mu17_v3, 0.049/pb
-          '279080-279080',  # HLT_Mu17_v3, 0.057/pb
-          '279115-279116',  # HLT_Mu17_v3, 0.255/pb
-          '279479-279479',  # HLT_Mu17_v3, 0.021/pb
-          '279588-279588',  # HLT_Mu17_v3, 0.344/pb
-          '279653-279654',  # HLT_Mu17_v3, 0.427/pb
-          '279656-279656',  # HLT_Mu17_v3, 0.01/pb
-          '279658-279658',  # HLT_Mu17_v3, 0.216/pb
-          '279667-279667',  # HLT_Mu17_v3, 0.286/pb
-          '279681-279685',  # HLT_Mu17_v3, 0.089/pb
-          '279691-279691',  # HLT_Mu17_v3, 0.009/pb
-          '279694-279694',  # HLT_Mu17_v3, 0.664/pb
-          '279715-279716',  # HLT_Mu17_v3, 0.653/pb
-          '279760-279760',  # HLT_Mu17_v3, 0.184/pb
-          '279766-279767',  # HLT_Mu17_v3, 0.714/pb
-          '279794-279794',  # HLT_Mu17_v3, 0.302/pb
-          '279823-279823',  # HLT_Mu17_v3, 0.093/pb
-          '279841-279841',  # HLT_Mu17_v3, 0.597/pb
-          '279844-279844',  # HLT_Mu17_v3, 0.051/pb
-          '279887-279887',  # HLT_Mu17_v3, 0.087/pb
-          '279931-279931',  # HLT_Mu17_v3, 0.867/pb
-          '279966-279966',  # HLT_Mu17_v3, 0.087/pb
-          '279975-279975',  # HLT_Mu17_v3, 0.295/pb
-          '279993-279994',  # HLT_Mu17_v3, 0.023/pb
-          '280013-280013',  # HLT_Mu17_v3, 0.006/pb
-          '280015-280018',  # HLT_Mu17_v3, 0.962/pb
-          '280020-280020',  # HLT_Mu17_v3, 0.022/pb
-          '280024-280024',  # HLT_Mu17_v3, 0.199/pb
-          '280187-280188',  # HLT_Mu17_v3, 0.074/pb
-          '280191-280191',  # HLT_Mu17_v3, 0.28/pb
-          '280194-280194',  # HLT_Mu17_v3, 0.064/pb
-          '280242-280242',  # HLT_Mu17_v3, 0.184/pb
-          '280249-280249',  # HLT_Mu17_v3, 0.427/pb
-          '280251-280251',  # HLT_Mu17_v3, 0.118/pb
-          '280327-280327',  # HLT_Mu17_v3, 0.01/pb
-          '280330-280330',  # HLT_Mu17_v3, 0.26/pb
-          '280349-280349',  # HLT_Mu17_v3, 0.181/pb
-          '280363-280364',  # HLT_Mu17_v3, 0.525/pb
-          '280383-280385',  # HLT_Mu17_v3, 0.583/pb
-          '281613-281613',  # HLT_Mu17_v4, 0.155/pb
-          '281639-281639',  # HLT_Mu17_v4, 0.022/pb
-          '281641-281641',  # HLT_Mu17_v4, 0.062/pb
-          '281693-281693',  # HLT_Mu17_v4, 0.642/pb
-          '281707-281707',  # HLT_Mu17_v4, 0.259/pb
-          '281726-281727',  # HLT_Mu17_v4, 0.551/pb
-          '281797-281797',  # HLT_Mu17_v4, 0.569/pb
-          '281975-281976',  # HLT_Mu17_v4, 0.703/pb
-          '282033-282035',  # HLT_Mu17_v4, 0.028/pb
-          '282037-282037',  # HLT_Mu17_v4, 0.561/pb
-          '282092-282092',  # HLT_Mu17_v4, 0.518/pb
-          '282708-282708',  # HLT_Mu17_v4, 0.001/pb
-          '282710-282710',  # HLT_Mu17_v4, 0.001/pb
-          '282712-282712',  # HLT_Mu17_v4, 0.012/pb
-          '282730-282735',  # HLT_Mu17_v4, 0.736/pb
-          '282800-282800',  # HLT_Mu17_v4, 0.092/pb
-          '282807-282807',  # HLT_Mu17_v4, 0.098/pb
-          '282814-282814',  # HLT_Mu17_v4, 0.543/pb
-          '282842-282842',  # HLT_Mu17_v4, 0.015/pb
-          '282917-282919',  # HLT_Mu17_v4, 0.095/pb
-          '282922-282923',  # HLT_Mu17_v4, 0.106/pb
-          '283042-283043',  # HLT_Mu17_v4, 0.15/pb
-          '283049-283050',  # HLT_Mu17_v4, 0.041/pb
-          '283052-283052',  # HLT_Mu17_v4, 0.022/pb
-          '283059-283059',  # HLT_Mu17_v4, 0.139/pb
-          '283270-283270',  # HLT_Mu17_v4, 0.487/pb
-          '283283-283283',  # HLT_Mu17_v4, 0.585/pb
-          '283305-283308',  # HLT_Mu17_v4, 0.466/pb
-          '283353-283353',  # HLT_Mu17_v4, 0.174/pb
-          '283358-283359',  # HLT_Mu17_v4, 0.4/pb
-          '283407-283408',  # HLT_Mu17_v4, 0.641/pb
-          '283416-283416',  # HLT_Mu17_v4, 0.054/pb
-          '283453-283453',  # HLT_Mu17_v4, 0.091/pb
-          '283469-283469',  # HLT_Mu17_v4, 0.0/pb
-          '283478-283478',  # HLT_Mu17_v4, 0.224/pb
-          '283548-283548',  # HLT_Mu17_v4, 0.043/pb
-          '283680-283682',  # HLT_Mu17_v4, 0.143/pb
-          '283685-283685',  # HLT_Mu17_v4, 0.08/pb
-          '283820-283820',  # HLT_Mu17_v4, 0.405/pb
-          '283830-283830',  # HLT_Mu17_v4, 0.211/pb
-          '283834-283835',  # HLT_Mu17_v4, 0.051/pb
-          '283865-283865',  # HLT_Mu17_v4, 0.315/pb
-          '283876-283877',  # HLT_Mu17_v4, 0.586/pb
-          '283884-283885',  # HLT_Mu17_v4, 0.584/pb
-          '283933-283934',  # HLT_Mu17_v4, 0.369/pb
-          '283946-283946',  # HLT_Mu17_v4, 0.371/pb
-          '283964-283964',  # HLT_Mu17_v4, 0.104/pb
-          '284006-284006',  # HLT_Mu17_v4, 0.086/pb
-          '284014-284014',  # HLT_Mu17_v4, 0.075/pb
-          '284025-284025',  # HLT_Mu17_v4, 0.007/pb
-          '284029-284029',  # HLT_Mu17_v4, 0.021/pb
-          '284035-284044',  # HLT_Mu17_v4, 0.451/pb
-        )),
-      ),
-    ),
-    'e' : cms.VPSet(
-      cms.PSet(
-        path = cms.string("HLT_Ele8_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(15.),
-        cone_maxPt = cms.double(45.),
-        minRecoPt = cms.double(8.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(5140), # L=6.988/pb; present in all eras; prescale factor 5140.3 (5135.5 from delivery)
-        trigger_type = cms.string('2e'),
-        run_ranges = cms.vstring(*(
-          '273158-273158',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.017/pb
-          '273302-273302',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.01/pb
-          '273402-273406',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.007/pb
-          '273408-273411',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.016/pb
-          '273425-273425',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.017/pb
-          '273446-273450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.046/pb
-          '273492-273494',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.019/pb
-          '273502-273503',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.045/pb
-          '273554-273555',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.014/pb
-          '273725-273725',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.076/pb
-          '273728-273728',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.003/pb
-          '273730-273730',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.068/pb
-          '274094-274094',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.006/pb
-          '274146-274146',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.002/pb
-          '274157-274157',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.009/pb
-          '274159-274161',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.022/pb
-          '274172-274172',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.001/pb
-          '274198-274200',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.039/pb
-          '274240-274241',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.033/pb
-          '274244-274244',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.032/pb
-          '274250-274251',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.031/pb
-          '274283-274284',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.005/pb
-          '274286-274286',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.004/pb
-          '274314-274317',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.037/pb
-          '274319-274319',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.005/pb
-          '274335-274339',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.051/pb
-          '274344-274345',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.043/pb
-          '274382-274382',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.001/pb
-          '274387-274388',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.067/pb
-          '274420-274422',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.106/pb
-          '274440-274442',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v3, 0.049/pb
-          '274954-274955',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.004/pb
-          '274968-274971',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.088/pb
-          '274998-275001',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.121/pb
-          '275059-275059',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4, 0.001/pb
-          '275066-275068',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v4/HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.04/pb
-          '275073-275074',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.036/pb
-          '275124-275125',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.038/pb
-          '275282-275284',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.009/pb
-          '275290-275293',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.02/pb
-          '275309-275311',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v5, 0.111/pb
-          '275319-275319',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
-          '275337-275338',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.028/pb
-          '275344-275345',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.018/pb
-          '275370-275371',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.024/pb
-          '275375-275376',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.132/pb
-          '275657-275659',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.012/pb
-          '275761-275761',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.0/pb
-          '275767-275767',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.0/pb
-          '275772-275774',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.01/pb
-          '275776-275778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.021/pb
-          '275782-275782',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.025/pb
-          '275832-275837',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.084/pb
-          '275847-275847',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.064/pb
-          '275886-275886',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.001/pb
-          '275890-275890',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.039/pb
-          '275911-275913',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
-          '275918-275918',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.009/pb
-          '275920-275921',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.015/pb
-          '275923-275923',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
-          '275931-275931',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.003/pb
-          '275963-275963',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
-          '276092-276092',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
-          '276097-276097',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.014/pb
-          '276242-276244',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.101/pb
-          '276282-276283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.063/pb
-          '276315-276315',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.005/pb
-          '276317-276318',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.019/pb
-          '276355-276355',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.001/pb
-          '276361-276361',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.024/pb
-          '276363-276363',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.046/pb
-          '276384-276384',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.03/pb
-          '276437-276437',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.061/pb
-          '276454-276454',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
-          '276458-276458',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.009/pb
-          '276495-276495',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.005/pb
-          '276501-276502',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.093/pb
-          '276525-276525',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.081/pb
-          '276527-276528',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
-          '276542-276545',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.059/pb
-          '276581-276587',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.093/pb
-          '276653-276653',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.013/pb
-          '276655-276655',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
-          '276659-276659',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.007/pb
-          '276775-276776',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.087/pb
-          '276794-276794',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.026/pb
-          '276807-276808',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.029/pb
-          '276810-276811',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.085/pb
-          '276831-276831',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.079/pb
-          '276834-276834',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.021/pb
-          '276870-276870',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.1/pb
-          '276935-276935',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.022/pb
-          '276940-276940',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.003/pb
-          '276946-276948',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
-          '276950-276950',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.071/pb
-          '277069-277073',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.06/pb
-          '277076-277076',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
-          '277087-277087',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.031/pb
-          '277094-277094',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.016/pb
-          '277096-277096',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.061/pb
-          '277112-277112',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
-          '277126-277127',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.026/pb
-          '277148-277148',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.017/pb
-          '277166-277166',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.01/pb
-          '277168-277168',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.067/pb
-          '277180-277180',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
-          '277194-277194',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.055/pb
-          '277305-277305',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.019/pb
-          '277420-277420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.007/pb
-          '277981-277981',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
-          '277991-277992',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.013/pb
-          '278017-278018',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.046/pb
-          '278167-278167',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.065/pb
-          '278175-278175',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
-          '278193-278193',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.004/pb
-          '278239-278240',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v6, 0.058/pb
-          '278273-278274',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.003/pb
-          '278288-278290',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.002/pb
-          '278308-278308',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.051/pb
-          '278310-278310',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.019/pb
-          '278315-278315',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.021/pb
-          '278345-278346',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.026/pb
-          '278349-278349',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.022/pb
-          '278366-278366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.017/pb
-          '278406-278406',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.05/pb
-          '278509-278509',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.045/pb
-          '278769-278770',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.023/pb
-          '278801-278805',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
-          '278808-278808',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.061/pb
-          '278820-278820',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.048/pb
-          '278822-278822',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
-          '278873-278875',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
-          '278923-278923',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.011/pb
-          '278957-278957',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
-          '278962-278963',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.014/pb
-          '278969-278969',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
-          '278975-278976',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.029/pb
-          '278986-278986',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
-          '279024-279024',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.01/pb
-          '279029-279029',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
-          '279071-279071',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.006/pb
-          '279080-279080',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.005/pb
-          '279115-279116',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
-          '279479-279479',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.002/pb
-          '279588-279588',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.036/pb
-          '279653-279654',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.045/pb
-          '279656-279656',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
-          '279658-279658',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
-          '279667-279667',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.029/pb
-          '279681-279685',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.009/pb
-          '279691-279691',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
-          '279694-279694',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.073/pb
-          '279715-279716',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.072/pb
-          '279760-279760',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
-          '279766-279767',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.083/pb
-          '279794-279794',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.03/pb
-          '279823-279823',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.009/pb
-          '279841-279841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.063/pb
-          '279844-279844',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.006/pb
-          '279887-279887',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
-          '279931-279931',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.097/pb
-          '279966-279966',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.01/pb
-          '279975-279975',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.03/pb
-          '279993-279994',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.003/pb
-          '280013-280013',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
-          '280015-280018',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.099/pb
-          '280020-280020',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.002/pb
-          '280024-280024',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.017/pb
-          '280187-280188',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
-          '280191-280191',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.029/pb
-          '280194-280194',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.007/pb
-          '280242-280242',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
-          '280249-280249',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.049/pb
-          '280251-280251',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.014/pb
-          '280327-280327',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
-          '280330-280330',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
-          '280349-280349',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.021/pb
-          '280363-280364',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
-          '280383-280385',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v7, 0.064/pb
-          '281613-281613',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
-          '281639-281639',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
-          '281641-281641',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
-          '281693-281693',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.071/pb
-          '281707-281707',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.026/pb
-          '281726-281727',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.064/pb
-          '281797-281797',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.062/pb
-          '281975-281976',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.077/pb
-          '282033-282035',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.003/pb
-          '282037-282037',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.061/pb
-          '282092-282092',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.059/pb
-          '282708-282708',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
-          '282710-282710',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
-          '282712-282712',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
-          '282730-282735',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.083/pb
-          '282800-282800',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.01/pb
-          '282807-282807',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
-          '282814-282814',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.062/pb
-          '282842-282842',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
-          '282917-282919',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.01/pb
-          '282922-282923',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.011/pb
-          '283042-283043',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.014/pb
-          '283049-283050',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
-          '283052-283052',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.003/pb
-          '283059-283059',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.013/pb
-          '283270-283270',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.054/pb
-          '283283-283283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.063/pb
-          '283305-283308',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.051/pb
-          '283353-283353',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
-          '283358-283359',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.045/pb
-          '283407-283408',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.072/pb
-          '283416-283416',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
-          '283453-283453',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
-          '283469-283469',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
-          '283478-283478',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.024/pb
-          '283548-283548',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.004/pb
-          '283680-283682',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.014/pb
-          '283685-283685',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
-          '283820-283820',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.047/pb
-          '283830-283830',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.025/pb
-          '283834-283835',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
-          '283865-283865',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.034/pb
-          '283876-283877',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.066/pb
-          '283884-283885',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.065/pb
-          '283933-283934',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.041/pb
-          '283946-283946',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.04/pb
-          '283964-283964',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
-          '284006-284006',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.01/pb
-          '284014-284014',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
-          '284025-284025',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.001/pb
-          '284029-284029',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.003/pb
-          '284035-284044',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v9, 0.048/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Ele17_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(25.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(17.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(572.4), # L=62.761/pb; present in all eras; prescale factor 572.4 (573.4 from delivery)
-        trigger_type = cms.string('2e'),
-        run_ranges = cms.vstring(*(
-          '273158-273158',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 2.491/pb
-          '273302-273302',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.204/pb
-          '273402-273406',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.145/pb
-          '273408-273411',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.336/pb
-          '273425-273425',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.334/pb
-          '273446-273450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.866/pb
-          '273492-273494',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.387/pb
-          '273502-273503',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.902/pb
-          '273554-273555',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.243/pb
-          '273725-273725',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 1.443/pb
-          '273728-273728',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.061/pb
-          '273730-273730',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 1.36/pb
-          '274094-274094',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.122/pb
-          '274146-274146',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.032/pb
-          '274157-274157',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.105/pb
-          '274159-274161',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.393/pb
-          '274172-274172',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.018/pb
-          '274198-274200',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.653/pb
-          '274240-274241',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.448/pb
-          '274244-274244',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.62/pb
-          '274250-274251',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.292/pb
-          '274283-274284',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.038/pb
-          '274286-274286',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.027/pb
-          '274314-274317',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.258/pb
-          '274319-274319',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.034/pb
-          '274335-274339',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.584/pb
-          '274344-274345',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.81/pb
-          '274382-274382',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.009/pb
-          '274387-274388',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.811/pb
-          '274420-274422',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 1.664/pb
-          '274440-274442',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v1, 0.613/pb
-          '274954-274955',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 0.072/pb
-          '274968-274971',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 1.133/pb
-          '274998-275001',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 1.791/pb
-          '275059-275059',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2, 0.006/pb
-          '275066-275068',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v2/HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.317/pb
-          '275073-275074',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.599/pb
-          '275124-275125',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.346/pb
-          '275282-275284',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.061/pb
-          '275290-275293',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 0.265/pb
-          '275309-275311',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v3, 1.795/pb
-          '275319-275319',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.027/pb
-          '275337-275338',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.287/pb
-          '275344-275345',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.13/pb
-          '275370-275371',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.174/pb
-          '275375-275376',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.953/pb
-          '275657-275659',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.089/pb
-          '275761-275761',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.002/pb
-          '275767-275767',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.001/pb
-          '275772-275774',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.076/pb
-          '275776-275778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.146/pb
-          '275782-275782',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.413/pb
-          '275832-275837',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.966/pb
-          '275847-275847',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.104/pb
-          '275886-275886',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.008/pb
-          '275890-275890',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.281/pb
-          '275911-275913',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.231/pb
-          '275918-275918',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.062/pb
-          '275920-275921',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.256/pb
-          '275923-275923',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.06/pb
-          '275931-275931',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.043/pb
-          '275963-275963',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.02/pb
-          '276092-276092',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.015/pb
-          '276097-276097',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.108/pb
-          '276242-276244',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.317/pb
-          '276282-276283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.564/pb
-          '276315-276315',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.036/pb
-          '276317-276318',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.143/pb
-          '276355-276355',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.006/pb
-          '276361-276361',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.175/pb
-          '276363-276363',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.633/pb
-          '276384-276384',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.506/pb
-          '276437-276437',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.546/pb
-          '276454-276454',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.263/pb
-          '276458-276458',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.159/pb
-          '276495-276495',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.038/pb
-          '276501-276502',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.096/pb
-          '276525-276525',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.987/pb
-          '276527-276528',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.267/pb
-          '276542-276545',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.553/pb
-          '276581-276587',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.15/pb
-          '276653-276653',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.096/pb
-          '276655-276655',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.305/pb
-          '276659-276659',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.124/pb
-          '276775-276776',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.024/pb
-          '276794-276794',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.454/pb
-          '276807-276808',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.216/pb
-          '276810-276811',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.297/pb
-          '276831-276831',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.938/pb
-          '276834-276834',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.363/pb
-          '276870-276870',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 1.215/pb
-          '276935-276935',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.156/pb
-          '276940-276940',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.022/pb
-          '276946-276948',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.124/pb
-          '276950-276950',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.934/pb
-          '277069-277073',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.487/pb
-          '277076-277076',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.525/pb
-          '277087-277087',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.54/pb
-          '277094-277094',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.102/pb
-          '277096-277096',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.674/pb
-          '277112-277112',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.056/pb
-          '277126-277127',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.197/pb
-          '277148-277148',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.135/pb
-          '277166-277166',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.074/pb
-          '277168-277168',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.847/pb
-          '277180-277180',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.025/pb
-          '277194-277194',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.401/pb
-          '277305-277305',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.124/pb
-          '277420-277420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.043/pb
-          '277981-277981',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.029/pb
-          '277991-277992',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.267/pb
-          '278017-278018',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.313/pb
-          '278167-278167',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.808/pb
-          '278175-278175',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.041/pb
-          '278193-278193',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.03/pb
-          '278239-278240',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v4, 0.593/pb
-          '278273-278274',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.013/pb
-          '278288-278290',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.008/pb
-          '278308-278308',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.187/pb
-          '278310-278310',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.064/pb
-          '278315-278315',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.078/pb
-          '278345-278346',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.097/pb
-          '278349-278349',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.074/pb
-          '278366-278366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.059/pb
-          '278406-278406',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.182/pb
-          '278509-278509',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.164/pb
-          '278769-278770',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.091/pb
-          '278801-278805',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.071/pb
-          '278808-278808',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.207/pb
-          '278820-278820',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.173/pb
-          '278822-278822',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.201/pb
-          '278873-278875',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.144/pb
-          '278923-278923',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.049/pb
-          '278957-278957',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.018/pb
-          '278962-278963',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.057/pb
-          '278969-278969',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.161/pb
-          '278975-278976',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.098/pb
-          '278986-278986',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.016/pb
-          '279024-279024',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.035/pb
-          '279029-279029',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.027/pb
-          '279071-279071',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.019/pb
-          '279080-279080',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.017/pb
-          '279115-279116',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.097/pb
-          '279479-279479',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.007/pb
-          '279588-279588',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.133/pb
-          '279653-279654',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.167/pb
-          '279656-279656',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.004/pb
-          '279658-279658',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.086/pb
-          '279667-279667',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.112/pb
-          '279681-279685',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.037/pb
-          '279691-279691',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.004/pb
-          '279694-279694',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.262/pb
-          '279715-279716',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.256/pb
-          '279760-279760',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.075/pb
-          '279766-279767',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.284/pb
-          '279794-279794',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.118/pb
-          '279823-279823',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.041/pb
-          '279841-279841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.229/pb
-          '279844-279844',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.025/pb
-          '279887-279887',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.037/pb
-          '279931-279931',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.342/pb
-          '279966-279966',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.041/pb
-          '279975-279975',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.12/pb
-          '279993-279994',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.012/pb
-          '280013-280013',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.003/pb
-          '280015-280018',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.342/pb
-          '280020-280020',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.007/pb
-          '280024-280024',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.06/pb
-          '280187-280188',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.035/pb
-          '280191-280191',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.106/pb
-          '280194-280194',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.026/pb
-          '280242-280242',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.073/pb
-          '280249-280249',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.169/pb
-          '280251-280251',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.047/pb
-          '280327-280327',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.004/pb
-          '280330-280330',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.099/pb
-          '280349-280349',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.072/pb
-          '280363-280364',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.202/pb
-          '280383-280385',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v5, 0.231/pb
-          '281613-281613',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.072/pb
-          '281639-281639',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.009/pb
-          '281641-281641',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.023/pb
-          '281693-281693',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.253/pb
-          '281707-281707',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.106/pb
-          '281726-281727',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.217/pb
-          '281797-281797',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.231/pb
-          '281975-281976',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.278/pb
-          '282033-282035',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
-          '282037-282037',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.219/pb
-          '282092-282092',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.207/pb
-          '282708-282708',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.001/pb
-          '282710-282710',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.0/pb
-          '282712-282712',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.006/pb
-          '282730-282735',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.3/pb
-          '282800-282800',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
-          '282807-282807',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.036/pb
-          '282814-282814',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.214/pb
-          '282842-282842',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
-          '282917-282919',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
-          '282922-282923',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.04/pb
-          '283042-283043',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
-          '283049-283050',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.023/pb
-          '283052-283052',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
-          '283059-283059',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.051/pb
-          '283270-283270',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.203/pb
-          '283283-283283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.215/pb
-          '283305-283308',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.19/pb
-          '283353-283353',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.082/pb
-          '283358-283359',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.156/pb
-          '283407-283408',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.266/pb
-          '283416-283416',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.022/pb
-          '283453-283453',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.049/pb
-          '283469-283469',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.0/pb
-          '283478-283478',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.096/pb
-          '283548-283548',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.015/pb
-          '283680-283682',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.054/pb
-          '283685-283685',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.034/pb
-          '283820-283820',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.162/pb
-          '283830-283830',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.084/pb
-          '283834-283835',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.02/pb
-          '283865-283865',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.131/pb
-          '283876-283877',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.24/pb
-          '283884-283885',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.237/pb
-          '283933-283934',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.156/pb
-          '283946-283946',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.154/pb
-          '283964-283964',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.042/pb
-          '284006-284006',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.035/pb
-          '284014-284014',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.03/pb
-          '284025-284025',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
-          '284029-284029',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
-          '284035-284044',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v7, 0.179/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Ele23_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(23.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(572.4), # L=62.7611/pb; present in all eras; prescale factor 572.4 (573.4 from delivery)
-        trigger_type = cms.string('2e'),
-        run_ranges = cms.vstring(*(
-          '273158-273158',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 2.491/pb
-          '273302-273302',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.204/pb
-          '273402-273406',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.145/pb
-          '273408-273411',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.336/pb
-          '273425-273425',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.334/pb
-          '273446-273450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.866/pb
-          '273492-273494',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.387/pb
-          '273502-273503',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.902/pb
-          '273554-273555',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.243/pb
-          '273725-273725',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 1.443/pb
-          '273728-273728',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.061/pb
-          '273730-273730',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 1.36/pb
-          '274094-274094',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.122/pb
-          '274146-274146',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.032/pb
-          '274157-274157',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.105/pb
-          '274159-274161',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.393/pb
-          '274172-274172',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.018/pb
-          '274198-274200',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.653/pb
-          '274240-274241',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.448/pb
-          '274244-274244',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.62/pb
-          '274250-274251',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.292/pb
-          '274283-274284',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.038/pb
-          '274286-274286',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.027/pb
-          '274314-274317',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.258/pb
-          '274319-274319',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.034/pb
-          '274335-274339',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.584/pb
-          '274344-274345',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.81/pb
-          '274382-274382',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.009/pb
-          '274387-274388',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.811/pb
-          '274420-274422',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 1.664/pb
-          '274440-274442',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v3, 0.613/pb
-          '274954-274955',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 0.072/pb
-          '274968-274971',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 1.133/pb
-          '274998-275001',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 1.791/pb
-          '275059-275059',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4, 0.006/pb
-          '275066-275068',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v4/HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.317/pb
-          '275073-275074',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.599/pb
-          '275124-275125',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.346/pb
-          '275282-275284',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.061/pb
-          '275290-275293',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 0.265/pb
-          '275309-275311',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v5, 1.795/pb
-          '275319-275319',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.027/pb
-          '275337-275338',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.287/pb
-          '275344-275345',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.13/pb
-          '275370-275371',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.174/pb
-          '275375-275376',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.953/pb
-          '275657-275659',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.089/pb
-          '275761-275761',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.002/pb
-          '275767-275767',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.001/pb
-          '275772-275774',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.076/pb
-          '275776-275778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.146/pb
-          '275782-275782',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.413/pb
-          '275832-275837',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.966/pb
-          '275847-275847',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.104/pb
-          '275886-275886',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.008/pb
-          '275890-275890',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.281/pb
-          '275911-275913',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.231/pb
-          '275918-275918',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.062/pb
-          '275920-275921',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.256/pb
-          '275923-275923',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.06/pb
-          '275931-275931',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.043/pb
-          '275963-275963',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.02/pb
-          '276092-276092',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.015/pb
-          '276097-276097',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.108/pb
-          '276242-276244',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.317/pb
-          '276282-276283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.564/pb
-          '276315-276315',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.036/pb
-          '276317-276318',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.143/pb
-          '276355-276355',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.006/pb
-          '276361-276361',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.175/pb
-          '276363-276363',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.633/pb
-          '276384-276384',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.506/pb
-          '276437-276437',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.546/pb
-          '276454-276454',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.263/pb
-          '276458-276458',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.159/pb
-          '276495-276495',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.038/pb
-          '276501-276502',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.096/pb
-          '276525-276525',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.987/pb
-          '276527-276528',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.267/pb
-          '276542-276545',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.553/pb
-          '276581-276587',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.15/pb
-          '276653-276653',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.096/pb
-          '276655-276655',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.305/pb
-          '276659-276659',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.124/pb
-          '276775-276776',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.024/pb
-          '276794-276794',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.454/pb
-          '276807-276808',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.216/pb
-          '276810-276811',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.297/pb
-          '276831-276831',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.938/pb
-          '276834-276834',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.363/pb
-          '276870-276870',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 1.215/pb
-          '276935-276935',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.156/pb
-          '276940-276940',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.022/pb
-          '276946-276948',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.124/pb
-          '276950-276950',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.934/pb
-          '277069-277073',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.487/pb
-          '277076-277076',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.525/pb
-          '277087-277087',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.54/pb
-          '277094-277094',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.102/pb
-          '277096-277096',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.674/pb
-          '277112-277112',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.056/pb
-          '277126-277127',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.197/pb
-          '277148-277148',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.135/pb
-          '277166-277166',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.074/pb
-          '277168-277168',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.847/pb
-          '277180-277180',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.025/pb
-          '277194-277194',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.401/pb
-          '277305-277305',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.124/pb
-          '277420-277420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.043/pb
-          '277981-277981',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.029/pb
-          '277991-277992',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.267/pb
-          '278017-278018',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.313/pb
-          '278167-278167',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.808/pb
-          '278175-278175',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.041/pb
-          '278193-278193',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.03/pb
-          '278239-278240',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v6, 0.593/pb
-          '278273-278274',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.013/pb
-          '278288-278290',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.008/pb
-          '278308-278308',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.187/pb
-          '278310-278310',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.064/pb
-          '278315-278315',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.078/pb
-          '278345-278346',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.097/pb
-          '278349-278349',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.074/pb
-          '278366-278366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.059/pb
-          '278406-278406',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.182/pb
-          '278509-278509',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.164/pb
-          '278769-278770',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.091/pb
-          '278801-278805',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.071/pb
-          '278808-278808',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.207/pb
-          '278820-278820',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.173/pb
-          '278822-278822',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.201/pb
-          '278873-278875',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.144/pb
-          '278923-278923',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.049/pb
-          '278957-278957',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.018/pb
-          '278962-278963',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.057/pb
-          '278969-278969',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.161/pb
-          '278975-278976',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.098/pb
-          '278986-278986',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.016/pb
-          '279024-279024',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.035/pb
-          '279029-279029',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.027/pb
-          '279071-279071',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.019/pb
-          '279080-279080',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.017/pb
-          '279115-279116',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.097/pb
-          '279479-279479',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.007/pb
-          '279588-279588',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.133/pb
-          '279653-279654',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.167/pb
-          '279656-279656',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
-          '279658-279658',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.086/pb
-          '279667-279667',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.112/pb
-          '279681-279685',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.037/pb
-          '279691-279691',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
-          '279694-279694',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.262/pb
-          '279715-279716',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.256/pb
-          '279760-279760',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.075/pb
-          '279766-279767',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.284/pb
-          '279794-279794',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.118/pb
-          '279823-279823',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.041/pb
-          '279841-279841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.229/pb
-          '279844-279844',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.025/pb
-          '279887-279887',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.037/pb
-          '279931-279931',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.342/pb
-          '279966-279966',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.041/pb
-          '279975-279975',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.12/pb
-          '279993-279994',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.012/pb
-          '280013-280013',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.003/pb
-          '280015-280018',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.342/pb
-          '280020-280020',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.007/pb
-          '280024-280024',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.06/pb
-          '280187-280188',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.035/pb
-          '280191-280191',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.106/pb
-          '280194-280194',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.026/pb
-          '280242-280242',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.073/pb
-          '280249-280249',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.169/pb
-          '280251-280251',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.047/pb
-          '280327-280327',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.004/pb
-          '280330-280330',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.099/pb
-          '280349-280349',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.072/pb
-          '280363-280364',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.202/pb
-          '280383-280385',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v7, 0.231/pb
-          '281613-281613',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.072/pb
-          '281639-281639',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
-          '281641-281641',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.023/pb
-          '281693-281693',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.253/pb
-          '281707-281707',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.106/pb
-          '281726-281727',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.217/pb
-          '281797-281797',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.231/pb
-          '281975-281976',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.278/pb
-          '282033-282035',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
-          '282037-282037',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.219/pb
-          '282092-282092',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.207/pb
-          '282708-282708',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.001/pb
-          '282710-282710',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
-          '282712-282712',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
-          '282730-282735',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.3/pb
-          '282800-282800',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.042/pb
-          '282807-282807',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.036/pb
-          '282814-282814',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.214/pb
-          '282842-282842',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.008/pb
-          '282917-282919',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.042/pb
-          '282922-282923',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.04/pb
-          '283042-283043',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.059/pb
-          '283049-283050',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.023/pb
-          '283052-283052',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
-          '283059-283059',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.051/pb
-          '283270-283270',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.203/pb
-          '283283-283283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.215/pb
-          '283305-283308',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.19/pb
-          '283353-283353',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.082/pb
-          '283358-283359',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.156/pb
-          '283407-283408',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.266/pb
-          '283416-283416',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.022/pb
-          '283453-283453',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.049/pb
-          '283469-283469',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.0/pb
-          '283478-283478',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.096/pb
-          '283548-283548',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.015/pb
-          '283680-283682',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.054/pb
-          '283685-283685',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.034/pb
-          '283820-283820',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.162/pb
-          '283830-283830',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.084/pb
-          '283834-283835',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
-          '283865-283865',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.131/pb
-          '283876-283877',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.24/pb
-          '283884-283885',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.237/pb
-          '283933-283934',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.156/pb
-          '283946-283946',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.154/pb
-          '283964-283964',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.042/pb
-          '284006-284006',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.035/pb
-          '284014-284014',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.03/pb
-          '284025-284025',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.004/pb
-          '284029-284029',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.012/pb
-          '284035-284044',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v9, 0.179/pb
-        )),
-      ),
-    ),
-  },
-  '2017' : {
-    'mu' : cms.VPSet(
-      cms.PSet(
-        path = cms.string("HLT_Mu3_PFJet40"),
-        cone_minPt = cms.double(10.),
-        cone_maxPt = cms.double(32.),
-        minRecoPt = cms.double(-1.),
-        jet_minPt = cms.double(45.),
-        average_prescale = cms.double(9006), # L=4.611/pb; present in C, D, E, F, missing in B; prescale factor 9005.6 (8870.8 from delivery)
-        trigger_type = cms.string('1mu'),
-        run_ranges = cms.vstring(*(
-          '299368-299370',  # HLT_Mu3_PFJet40_v9, 0.016/pb
-          '299380-299381',  # HLT_Mu3_PFJet40_v9, 0.004/pb
-          '299394-299396',  # HLT_Mu3_PFJet40_v9, 0.004/pb
-          '299420-299420',  # HLT_Mu3_PFJet40_v9, 0.001/pb
-          '299443-299443',  # HLT_Mu3_PFJet40_v9, 0.0/pb
-          '299450-299450',  # HLT_Mu3_PFJet40_v9, 0.001/pb
-          '299477-299481',  # HLT_Mu3_PFJet40_v9, 0.027/pb
-          '299593-299595',  # HLT_Mu3_PFJet40_v9, 0.017/pb
-          '299597-299597',  # HLT_Mu3_PFJet40_v9, 0.005/pb
-          '299649-299649',  # HLT_Mu3_PFJet40_v9, 0.003/pb
-          '300087-300087',  # HLT_Mu3_PFJet40_v10, 0.001/pb
-          '300105-300107',  # HLT_Mu3_PFJet40_v10, 0.002/pb
-          '300117-300117',  # HLT_Mu3_PFJet40_v10, 0.0/pb
-          '300122-300123',  # HLT_Mu3_PFJet40_v10, 0.025/pb
-          '300155-300157',  # HLT_Mu3_PFJet40_v10, 0.029/pb
-          '300226-300226',  # HLT_Mu3_PFJet40_v10, 0.007/pb
-          '300233-300240',  # HLT_Mu3_PFJet40_v10, 0.027/pb
-          '300280-300284',  # HLT_Mu3_PFJet40_v10, 0.019/pb
-          '300364-300375',  # HLT_Mu3_PFJet40_v10, 0.004/pb
-          '300389-300401',  # HLT_Mu3_PFJet40_v10, 0.021/pb
-          '300459-300459',  # HLT_Mu3_PFJet40_v10, 0.005/pb
-          '300461-300464',  # HLT_Mu3_PFJet40_v10, 0.008/pb
-          '300466-300467',  # HLT_Mu3_PFJet40_v10, 0.013/pb
-          '300497-300497',  # HLT_Mu3_PFJet40_v10, 0.002/pb
-          '300514-300517',  # HLT_Mu3_PFJet40_v10, 0.024/pb
-          '300558-300558',  # HLT_Mu3_PFJet40_v10, 0.007/pb
-          '300560-300560',  # HLT_Mu3_PFJet40_v10, 0.009/pb
-          '300574-300576',  # HLT_Mu3_PFJet40_v10, 0.02/pb
-          '300631-300633',  # HLT_Mu3_PFJet40_v10, 0.01/pb
-          '300635-300636',  # HLT_Mu3_PFJet40_v10, 0.02/pb
-          '300673-300676',  # HLT_Mu3_PFJet40_v10, 0.001/pb
-          '300742-300742',  # HLT_Mu3_PFJet40_v10, 0.005/pb
-          '300777-300777',  # HLT_Mu3_PFJet40_v10, 0.008/pb
-          '300780-300780',  # HLT_Mu3_PFJet40_v10, 0.005/pb
-          '300785-300785',  # HLT_Mu3_PFJet40_v10, 0.013/pb
-          '300806-300806',  # HLT_Mu3_PFJet40_v10, 0.003/pb
-          '300811-300812',  # HLT_Mu3_PFJet40_v10, 0.01/pb
-          '300816-300817',  # HLT_Mu3_PFJet40_v10, 0.008/pb
-          '301046-301046',  # HLT_Mu3_PFJet40_v10, 0.002/pb
-          '301141-301142',  # HLT_Mu3_PFJet40_v10, 0.017/pb
-          '301161-301161',  # HLT_Mu3_PFJet40_v10, 0.015/pb
-          '301165-301165',  # HLT_Mu3_PFJet40_v10, 0.003/pb
-          '301179-301180',  # HLT_Mu3_PFJet40_v10, 0.002/pb
-          '301183-301183',  # HLT_Mu3_PFJet40_v10, 0.005/pb
-          '301281-301281',  # HLT_Mu3_PFJet40_v10, 0.002/pb
-          '301283-301283',  # HLT_Mu3_PFJet40_v10, 0.017/pb
-          '301298-301298',  # HLT_Mu3_PFJet40_v10, 0.016/pb
-          '301323-301323',  # HLT_Mu3_PFJet40_v10, 0.017/pb
-          '301330-301330',  # HLT_Mu3_PFJet40_v10, 0.006/pb
-          '301359-301359',  # HLT_Mu3_PFJet40_v10, 0.005/pb
-          '301384-301384',  # HLT_Mu3_PFJet40_v10, 0.009/pb
-          '301391-301393',  # HLT_Mu3_PFJet40_v10, 0.015/pb
-          '301396-301399',  # HLT_Mu3_PFJet40_v10, 0.018/pb
-          '301417-301417',  # HLT_Mu3_PFJet40_v10, 0.006/pb
-          '301447-301450',  # HLT_Mu3_PFJet40_v10, 0.026/pb
-          '301461-301461',  # HLT_Mu3_PFJet40_v10, 0.01/pb
-          '301472-301472',  # HLT_Mu3_PFJet40_v10, 0.014/pb
-          '301475-301476',  # HLT_Mu3_PFJet40_v10, 0.019/pb
-          '301519-301519',  # HLT_Mu3_PFJet40_v10, 0.003/pb
-          '301524-301524',  # HLT_Mu3_PFJet40_v10, 0.005/pb
-          '301529-301532',  # HLT_Mu3_PFJet40_v10, 0.023/pb
-          '301567-301567',  # HLT_Mu3_PFJet40_v10, 0.006/pb
-          '301627-301627',  # HLT_Mu3_PFJet40_v10, 0.015/pb
-          '301664-301665',  # HLT_Mu3_PFJet40_v10, 0.016/pb
-          '301694-301694',  # HLT_Mu3_PFJet40_v10, 0.001/pb
-          '301912-301914',  # HLT_Mu3_PFJet40_v10, 0.004/pb
-          '301941-301941',  # HLT_Mu3_PFJet40_v10, 0.004/pb
-          '301959-301960',  # HLT_Mu3_PFJet40_v10, 0.017/pb
-          '301970-301970',  # HLT_Mu3_PFJet40_v10, 0.001/pb
-          '301984-301987',  # HLT_Mu3_PFJet40_v10, 0.018/pb
-          '301997-301998',  # HLT_Mu3_PFJet40_v10, 0.017/pb
-          '302019-302019',  # HLT_Mu3_PFJet40_v10, 0.0/pb
-          '302026-302026',  # HLT_Mu3_PFJet40_v11, 0.0/pb
-          '302029-302029',  # HLT_Mu3_PFJet40_v11, 0.001/pb
-          '302031-302031',  # HLT_Mu3_PFJet40_v11, 0.007/pb
-          '302033-302034',  # HLT_Mu3_PFJet40_v11, 0.001/pb
-          '302037-302038',  # HLT_Mu3_PFJet40_v11, 0.0/pb
-          '302040-302043',  # HLT_Mu3_PFJet40_v11, 0.01/pb
-          '302131-302131',  # HLT_Mu3_PFJet40_v11, 0.009/pb
-          '302159-302159',  # HLT_Mu3_PFJet40_v11, 0.001/pb
-          '302163-302163',  # HLT_Mu3_PFJet40_v11, 0.011/pb
-          '302165-302166',  # HLT_Mu3_PFJet40_v11, 0.001/pb
-          '302225-302225',  # HLT_Mu3_PFJet40_v11, 0.008/pb
-          '302228-302229',  # HLT_Mu3_PFJet40_v11, 0.006/pb
-          '302240-302240',  # HLT_Mu3_PFJet40_v11, 0.01/pb
-          '302262-302263',  # HLT_Mu3_PFJet40_v11, 0.017/pb
-          '302277-302277',  # HLT_Mu3_PFJet40_v11, 0.003/pb
-          '302279-302280',  # HLT_Mu3_PFJet40_v11, 0.003/pb
-          '302322-302322',  # HLT_Mu3_PFJet40_v11, 0.009/pb
-          '302328-302328',  # HLT_Mu3_PFJet40_v11, 0.006/pb
-          '302337-302337',  # HLT_Mu3_PFJet40_v11, 0.001/pb
-          '302342-302344',  # HLT_Mu3_PFJet40_v11, 0.005/pb
-          '302350-302350',  # HLT_Mu3_PFJet40_v11, 0.001/pb
-          '302388-302388',  # HLT_Mu3_PFJet40_v11, 0.006/pb
-          '302392-302393',  # HLT_Mu3_PFJet40_v11, 0.012/pb
-          '302448-302448',  # HLT_Mu3_PFJet40_v11, 0.018/pb
-          '302472-302476',  # HLT_Mu3_PFJet40_v11, 0.016/pb
-          '302479-302479',  # HLT_Mu3_PFJet40_v11, 0.003/pb
-          '302484-302485',  # HLT_Mu3_PFJet40_v11, 0.01/pb
-          '302492-302494',  # HLT_Mu3_PFJet40_v11, 0.149/pb
-          '302509-302509',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '302513-302513',  # HLT_Mu3_PFJet40_v12, 0.002/pb
-          '302522-302523',  # HLT_Mu3_PFJet40_v12, 0.003/pb
-          '302525-302526',  # HLT_Mu3_PFJet40_v12, 0.069/pb
-          '302548-302548',  # HLT_Mu3_PFJet40_v12, 0.003/pb
-          '302551-302551',  # HLT_Mu3_PFJet40_v12, 0.0/pb
-          '302553-302555',  # HLT_Mu3_PFJet40_v12, 0.009/pb
-          '302563-302563',  # HLT_Mu3_PFJet40_v12, 0.0/pb
-          '302565-302565',  # HLT_Mu3_PFJet40_v12, 0.0/pb
-          '302572-302573',  # HLT_Mu3_PFJet40_v12, 0.098/pb
-          '302596-302597',  # HLT_Mu3_PFJet40_v12, 0.133/pb
-          '302634-302635',  # HLT_Mu3_PFJet40_v12, 0.117/pb
-          '302651-302651',  # HLT_Mu3_PFJet40_v12, 0.007/pb
-          '302654-302654',  # HLT_Mu3_PFJet40_v12, 0.015/pb
-          '302661-302661',  # HLT_Mu3_PFJet40_v12, 0.002/pb
-          '302663-302663',  # HLT_Mu3_PFJet40_v12, 0.067/pb
-          '303825-303825',  # HLT_Mu3_PFJet40_v12, 0.015/pb
-          '303832-303832',  # HLT_Mu3_PFJet40_v12, 0.109/pb
-          '303838-303838',  # HLT_Mu3_PFJet40_v12, 0.108/pb
-          '303885-303885',  # HLT_Mu3_PFJet40_v12, 0.096/pb
-          '303948-303948',  # HLT_Mu3_PFJet40_v12, 0.075/pb
-          '303998-304000',  # HLT_Mu3_PFJet40_v12, 0.003/pb
-          '304062-304062',  # HLT_Mu3_PFJet40_v12, 0.007/pb
-          '304119-304120',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '304125-304125',  # HLT_Mu3_PFJet40_v12, 0.006/pb
-          '304144-304144',  # HLT_Mu3_PFJet40_v12, 0.009/pb
-          '304158-304158',  # HLT_Mu3_PFJet40_v12, 0.008/pb
-          '304169-304170',  # HLT_Mu3_PFJet40_v12, 0.014/pb
-          '304199-304200',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '304204-304204',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '304209-304209',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '304291-304292',  # HLT_Mu3_PFJet40_v12, 0.005/pb
-          '304333-304333',  # HLT_Mu3_PFJet40_v12, 0.004/pb
-          '304354-304354',  # HLT_Mu3_PFJet40_v12, 0.0/pb
-          '304366-304366',  # HLT_Mu3_PFJet40_v12, 0.005/pb
-          '304446-304447',  # HLT_Mu3_PFJet40_v12, 0.005/pb
-          '304451-304451',  # HLT_Mu3_PFJet40_v12, 0.0/pb
-          '304505-304508',  # HLT_Mu3_PFJet40_v12, 0.084/pb
-          '304562-304562',  # HLT_Mu3_PFJet40_v12, 0.055/pb
-          '304616-304616',  # HLT_Mu3_PFJet40_v12, 0.029/pb
-          '304625-304626',  # HLT_Mu3_PFJet40_v12, 0.007/pb
-          '304654-304655',  # HLT_Mu3_PFJet40_v12, 0.076/pb
-          '304661-304663',  # HLT_Mu3_PFJet40_v12, 0.03/pb
-          '304671-304672',  # HLT_Mu3_PFJet40_v12, 0.038/pb
-          '304737-304740',  # HLT_Mu3_PFJet40_v12, 0.111/pb
-          '304776-304778',  # HLT_Mu3_PFJet40_v12, 0.075/pb
-          '304797-304797',  # HLT_Mu3_PFJet40_v12, 0.173/pb
-          '305044-305046',  # HLT_Mu3_PFJet40_v12, 0.139/pb
-          '305059-305059',  # HLT_Mu3_PFJet40_v12, 0.007/pb
-          '305062-305064',  # HLT_Mu3_PFJet40_v12, 0.123/pb
-          '305081-305081',  # HLT_Mu3_PFJet40_v12, 0.025/pb
-          '305112-305114',  # HLT_Mu3_PFJet40_v12, 0.083/pb
-          '305178-305184',  # HLT_Mu3_PFJet40_v12, 0.005/pb
-          '305186-305186',  # HLT_Mu3_PFJet40_v12, 0.008/pb
-          '305188-305188',  # HLT_Mu3_PFJet40_v12, 0.193/pb
-          '305202-305202',  # HLT_Mu3_PFJet40_v12, 0.01/pb
-          '305204-305204',  # HLT_Mu3_PFJet40_v12, 0.06/pb
-          '305207-305208',  # HLT_Mu3_PFJet40_v12, 0.04/pb
-          '305234-305234',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '305236-305237',  # HLT_Mu3_PFJet40_v12, 0.036/pb
-          '305247-305248',  # HLT_Mu3_PFJet40_v12, 0.039/pb
-          '305252-305252',  # HLT_Mu3_PFJet40_v12, 0.032/pb
-          '305282-305282',  # HLT_Mu3_PFJet40_v12, 0.002/pb
-          '305310-305314',  # HLT_Mu3_PFJet40_v12, 0.076/pb
-          '305336-305336',  # HLT_Mu3_PFJet40_v12, 0.003/pb
-          '305338-305338',  # HLT_Mu3_PFJet40_v12, 0.002/pb
-          '305341-305341',  # HLT_Mu3_PFJet40_v12, 0.009/pb
-          '305349-305351',  # HLT_Mu3_PFJet40_v12, 0.049/pb
-          '305358-305358',  # HLT_Mu3_PFJet40_v12, 0.002/pb
-          '305364-305366',  # HLT_Mu3_PFJet40_v12, 0.1/pb
-          '305376-305377',  # HLT_Mu3_PFJet40_v12, 0.058/pb
-          '305405-305406',  # HLT_Mu3_PFJet40_v12, 0.046/pb
-          '305440-305441',  # HLT_Mu3_PFJet40_v12, 0.004/pb
-          '305516-305518',  # HLT_Mu3_PFJet40_v12, 0.042/pb
-          '305586-305586',  # HLT_Mu3_PFJet40_v12, 0.005/pb
-          '305589-305590',  # HLT_Mu3_PFJet40_v12, 0.052/pb
-          '305636-305636',  # HLT_Mu3_PFJet40_v12, 0.056/pb
-          '305766-305766',  # HLT_Mu3_PFJet40_v12, 0.01/pb
-          '305809-305809',  # HLT_Mu3_PFJet40_v12, 0.001/pb
-          '305814-305814',  # HLT_Mu3_PFJet40_v12, 0.044/pb
-          '305821-305821',  # HLT_Mu3_PFJet40_v12, 0.008/pb
-          '305832-305832',  # HLT_Mu3_PFJet40_v12, 0.002/pb
-          '305840-305840',  # HLT_Mu3_PFJet40_v12, 0.032/pb
-          '305842-305842',  # HLT_Mu3_PFJet40_v12, 0.027/pb
-          '305862-305862',  # HLT_Mu3_PFJet40_v12, 0.006/pb
-          '305898-305898',  # HLT_Mu3_PFJet40_v12, 0.007/pb
-          '305902-305902',  # HLT_Mu3_PFJet40_v12, 0.005/pb
-          '305967-305967',  # HLT_Mu3_PFJet40_v12, 0.0/pb
-          '306029-306030',  # HLT_Mu3_PFJet40_v13, 0.001/pb
-          '306036-306038',  # HLT_Mu3_PFJet40_v13, 0.002/pb
-          '306041-306042',  # HLT_Mu3_PFJet40_v13, 0.01/pb
-          '306048-306049',  # HLT_Mu3_PFJet40_v13, 0.015/pb
-          '306051-306051',  # HLT_Mu3_PFJet40_v13, 0.013/pb
-          '306091-306092',  # HLT_Mu3_PFJet40_v13, 0.027/pb
-          '306095-306095',  # HLT_Mu3_PFJet40_v13, 0.01/pb
-          '306121-306122',  # HLT_Mu3_PFJet40_v13, 0.0/pb
-          '306125-306126',  # HLT_Mu3_PFJet40_v13, 0.019/pb
-          '306134-306135',  # HLT_Mu3_PFJet40_v13, 0.016/pb
-          '306138-306139',  # HLT_Mu3_PFJet40_v13, 0.082/pb
-          '306153-306155',  # HLT_Mu3_PFJet40_v13, 0.069/pb
-          '306169-306171',  # HLT_Mu3_PFJet40_v13, 0.047/pb
-          '306418-306420',  # HLT_Mu3_PFJet40_v14, 0.002/pb
-          '306422-306423',  # HLT_Mu3_PFJet40_v14, 0.008/pb
-          '306432-306432',  # HLT_Mu3_PFJet40_v14, 0.006/pb
-          '306454-306460',  # HLT_Mu3_PFJet40_v14, 0.096/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu8"),
-        cone_minPt = cms.double(15.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(8.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(15943), # L=2.605/pb; present in all eras; prescale factor 15943.0 (15120.6 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '297050-297050',  # HLT_Mu8_v6, 0.002/pb
-          '297056-297057',  # HLT_Mu8_v6, 0.004/pb
-          '297099-297101',  # HLT_Mu8_v6, 0.006/pb
-          '297113-297114',  # HLT_Mu8_v6, 0.002/pb
-          '297175-297178',  # HLT_Mu8_v6, 0.007/pb
-          '297215-297215',  # HLT_Mu8_v6, 0.0/pb
-          '297218-297219',  # HLT_Mu8_v6, 0.011/pb
-          '297224-297225',  # HLT_Mu8_v6, 0.0/pb
-          '297227-297227',  # HLT_Mu8_v6, 0.0/pb
-          '297292-297293',  # HLT_Mu8_v6, 0.005/pb
-          '297296-297296',  # HLT_Mu8_v6, 0.002/pb
-          '297308-297308',  # HLT_Mu8_v6, 0.0/pb
-          '297359-297359',  # HLT_Mu8_v6, 0.0/pb
-          '297411-297411',  # HLT_Mu8_v6, 0.005/pb
-          '297424-297426',  # HLT_Mu8_v6, 0.001/pb
-          '297429-297435',  # HLT_Mu8_v6, 0.005/pb
-          '297467-297469',  # HLT_Mu8_v6, 0.0/pb
-          '297483-297488',  # HLT_Mu8_v6, 0.011/pb
-          '297503-297505',  # HLT_Mu8_v6, 0.007/pb
-          '297557-297558',  # HLT_Mu8_v7, 0.003/pb
-          '297562-297563',  # HLT_Mu8_v7, 0.003/pb
-          '297598-297599',  # HLT_Mu8_v7, 0.002/pb
-          '297603-297606',  # HLT_Mu8_v7, 0.007/pb
-          '297620-297620',  # HLT_Mu8_v7, 0.0/pb
-          '297656-297656',  # HLT_Mu8_v7, 0.0/pb
-          '297665-297666',  # HLT_Mu8_v7, 0.002/pb
-          '297670-297670',  # HLT_Mu8_v7, 0.0/pb
-          '297674-297675',  # HLT_Mu8_v7, 0.003/pb
-          '297722-297723',  # HLT_Mu8_v7, 0.002/pb
-          '298996-298997',  # HLT_Mu8_v7, 0.001/pb
-          '299000-299000',  # HLT_Mu8_v7, 0.0/pb
-          '299042-299042',  # HLT_Mu8_v7, 0.0/pb
-          '299061-299062',  # HLT_Mu8_v7, 0.003/pb
-          '299064-299065',  # HLT_Mu8_v7, 0.002/pb
-          '299067-299067',  # HLT_Mu8_v7, 0.002/pb
-          '299096-299096',  # HLT_Mu8_v7, 0.001/pb
-          '299149-299149',  # HLT_Mu8_v7, 0.002/pb
-          '299178-299178',  # HLT_Mu8_v7, 0.0/pb
-          '299180-299180',  # HLT_Mu8_v7, 0.0/pb
-          '299184-299185',  # HLT_Mu8_v7, 0.004/pb
-          '299327-299327',  # HLT_Mu8_v7, 0.0/pb
-          '299329-299329',  # HLT_Mu8_v7, 0.001/pb
-          '299368-299370',  # HLT_Mu8_v8, 0.015/pb
-          '299380-299381',  # HLT_Mu8_v8, 0.003/pb
-          '299394-299396',  # HLT_Mu8_v8, 0.003/pb
-          '299420-299420',  # HLT_Mu8_v8, 0.001/pb
-          '299443-299443',  # HLT_Mu8_v8, 0.0/pb
-          '299450-299450',  # HLT_Mu8_v8, 0.001/pb
-          '299477-299481',  # HLT_Mu8_v8, 0.045/pb
-          '299593-299595',  # HLT_Mu8_v8, 0.017/pb
-          '299597-299597',  # HLT_Mu8_v8, 0.006/pb
-          '299649-299649',  # HLT_Mu8_v8, 0.003/pb
-          '300087-300087',  # HLT_Mu8_v9, 0.004/pb
-          '300105-300107',  # HLT_Mu8_v9, 0.002/pb
-          '300117-300117',  # HLT_Mu8_v9, 0.0/pb
-          '300122-300123',  # HLT_Mu8_v9, 0.027/pb
-          '300155-300157',  # HLT_Mu8_v9, 0.034/pb
-          '300226-300226',  # HLT_Mu8_v9, 0.006/pb
-          '300233-300240',  # HLT_Mu8_v9, 0.029/pb
-          '300280-300284',  # HLT_Mu8_v9, 0.029/pb
-          '300364-300375',  # HLT_Mu8_v9, 0.004/pb
-          '300389-300401',  # HLT_Mu8_v9, 0.023/pb
-          '300459-300459',  # HLT_Mu8_v9, 0.004/pb
-          '300461-300464',  # HLT_Mu8_v9, 0.008/pb
-          '300466-300467',  # HLT_Mu8_v9, 0.017/pb
-          '300497-300497',  # HLT_Mu8_v9, 0.002/pb
-          '300514-300517',  # HLT_Mu8_v9, 0.024/pb
-          '300558-300558',  # HLT_Mu8_v9, 0.008/pb
-          '300560-300560',  # HLT_Mu8_v9, 0.012/pb
-          '300574-300576',  # HLT_Mu8_v9, 0.02/pb
-          '300631-300633',  # HLT_Mu8_v9, 0.009/pb
-          '300635-300636',  # HLT_Mu8_v9, 0.025/pb
-          '300673-300676',  # HLT_Mu8_v9, 0.001/pb
-          '300742-300742',  # HLT_Mu8_v9, 0.004/pb
-          '300777-300777',  # HLT_Mu8_v9, 0.007/pb
-          '300780-300780',  # HLT_Mu8_v9, 0.005/pb
-          '300785-300785',  # HLT_Mu8_v9, 0.018/pb
-          '300806-300806',  # HLT_Mu8_v9, 0.002/pb
-          '300811-300812',  # HLT_Mu8_v9, 0.008/pb
-          '300816-300817',  # HLT_Mu8_v9, 0.009/pb
-          '301046-301046',  # HLT_Mu8_v9, 0.002/pb
-          '301141-301142',  # HLT_Mu8_v9, 0.011/pb
-          '301161-301161',  # HLT_Mu8_v9, 0.008/pb
-          '301165-301165',  # HLT_Mu8_v9, 0.002/pb
-          '301179-301180',  # HLT_Mu8_v9, 0.001/pb
-          '301183-301183',  # HLT_Mu8_v9, 0.002/pb
-          '301281-301281',  # HLT_Mu8_v9, 0.001/pb
-          '301283-301283',  # HLT_Mu8_v9, 0.009/pb
-          '301298-301298',  # HLT_Mu8_v9, 0.006/pb
-          '301323-301323',  # HLT_Mu8_v9, 0.007/pb
-          '301330-301330',  # HLT_Mu8_v9, 0.002/pb
-          '301359-301359',  # HLT_Mu8_v9, 0.002/pb
-          '301384-301384',  # HLT_Mu8_v9, 0.006/pb
-          '301391-301393',  # HLT_Mu8_v9, 0.01/pb
-          '301396-301399',  # HLT_Mu8_v9, 0.012/pb
-          '301417-301417',  # HLT_Mu8_v9, 0.004/pb
-          '301447-301450',  # HLT_Mu8_v9, 0.017/pb
-          '301461-301461',  # HLT_Mu8_v9, 0.006/pb
-          '301472-301472',  # HLT_Mu8_v9, 0.009/pb
-          '301475-301476',  # HLT_Mu8_v9, 0.012/pb
-          '301519-301519',  # HLT_Mu8_v9, 0.002/pb
-          '301524-301524',  # HLT_Mu8_v9, 0.003/pb
-          '301529-301532',  # HLT_Mu8_v9, 0.015/pb
-          '301567-301567',  # HLT_Mu8_v9, 0.004/pb
-          '301627-301627',  # HLT_Mu8_v9, 0.01/pb
-          '301664-301665',  # HLT_Mu8_v9, 0.011/pb
-          '301694-301694',  # HLT_Mu8_v9, 0.001/pb
-          '301912-301914',  # HLT_Mu8_v9, 0.006/pb
-          '301941-301941',  # HLT_Mu8_v9, 0.006/pb
-          '301959-301960',  # HLT_Mu8_v9, 0.026/pb
-          '301970-301970',  # HLT_Mu8_v9, 0.001/pb
-          '301984-301987',  # HLT_Mu8_v9, 0.028/pb
-          '301997-301998',  # HLT_Mu8_v9, 0.027/pb
-          '302019-302019',  # HLT_Mu8_v9, 0.001/pb
-          '302026-302026',  # HLT_Mu8_v10, 0.0/pb
-          '302029-302029',  # HLT_Mu8_v10, 0.001/pb
-          '302031-302031',  # HLT_Mu8_v10, 0.01/pb
-          '302033-302034',  # HLT_Mu8_v10, 0.001/pb
-          '302037-302038',  # HLT_Mu8_v10, 0.0/pb
-          '302040-302043',  # HLT_Mu8_v10, 0.013/pb
-          '302131-302131',  # HLT_Mu8_v10, 0.012/pb
-          '302159-302159',  # HLT_Mu8_v10, 0.001/pb
-          '302163-302163',  # HLT_Mu8_v10, 0.015/pb
-          '302165-302166',  # HLT_Mu8_v10, 0.001/pb
-          '302225-302225',  # HLT_Mu8_v10, 0.011/pb
-          '302228-302229',  # HLT_Mu8_v10, 0.008/pb
-          '302240-302240',  # HLT_Mu8_v10, 0.013/pb
-          '302262-302263',  # HLT_Mu8_v10, 0.022/pb
-          '302277-302277',  # HLT_Mu8_v10, 0.004/pb
-          '302279-302280',  # HLT_Mu8_v10, 0.004/pb
-          '302322-302322',  # HLT_Mu8_v10, 0.011/pb
-          '302328-302328',  # HLT_Mu8_v10, 0.009/pb
-          '302337-302337',  # HLT_Mu8_v10, 0.001/pb
-          '302342-302344',  # HLT_Mu8_v10, 0.007/pb
-          '302350-302350',  # HLT_Mu8_v10, 0.002/pb
-          '302388-302388',  # HLT_Mu8_v10, 0.008/pb
-          '302392-302393',  # HLT_Mu8_v10, 0.015/pb
-          '302448-302448',  # HLT_Mu8_v10, 0.024/pb
-          '302472-302476',  # HLT_Mu8_v10, 0.022/pb
-          '302479-302479',  # HLT_Mu8_v10, 0.004/pb
-          '302484-302485',  # HLT_Mu8_v10, 0.014/pb
-          '302492-302494',  # HLT_Mu8_v10, 0.152/pb
-          '302509-302509',  # HLT_Mu8_v10, 0.0/pb
-          '302513-302513',  # HLT_Mu8_v10, 0.001/pb
-          '302522-302523',  # HLT_Mu8_v10, 0.001/pb
-          '302525-302526',  # HLT_Mu8_v10, 0.015/pb
-          '302548-302548',  # HLT_Mu8_v10, 0.001/pb
-          '302551-302551',  # HLT_Mu8_v10, 0.0/pb
-          '302553-302555',  # HLT_Mu8_v10, 0.003/pb
-          '302563-302563',  # HLT_Mu8_v10, 0.0/pb
-          '302565-302565',  # HLT_Mu8_v10, 0.0/pb
-          '302572-302573',  # HLT_Mu8_v10, 0.019/pb
-          '302596-302597',  # HLT_Mu8_v10, 0.026/pb
-          '302634-302635',  # HLT_Mu8_v10, 0.023/pb
-          '302651-302651',  # HLT_Mu8_v10, 0.002/pb
-          '302654-302654',  # HLT_Mu8_v10, 0.004/pb
-          '302661-302661',  # HLT_Mu8_v10, 0.001/pb
-          '302663-302663',  # HLT_Mu8_v10, 0.012/pb
-          '303825-303825',  # HLT_Mu8_v10, 0.002/pb
-          '303832-303832',  # HLT_Mu8_v10, 0.023/pb
-          '303838-303838',  # HLT_Mu8_v10, 0.025/pb
-          '303885-303885',  # HLT_Mu8_v10, 0.024/pb
-          '303948-303948',  # HLT_Mu8_v10, 0.02/pb
-          '303998-304000',  # HLT_Mu8_v10, 0.013/pb
-          '304062-304062',  # HLT_Mu8_v10, 0.025/pb
-          '304119-304120',  # HLT_Mu8_v10, 0.004/pb
-          '304125-304125',  # HLT_Mu8_v10, 0.023/pb
-          '304144-304144',  # HLT_Mu8_v10, 0.033/pb
-          '304158-304158',  # HLT_Mu8_v10, 0.028/pb
-          '304169-304170',  # HLT_Mu8_v10, 0.046/pb
-          '304199-304200',  # HLT_Mu8_v10, 0.004/pb
-          '304204-304204',  # HLT_Mu8_v10, 0.006/pb
-          '304209-304209',  # HLT_Mu8_v10, 0.005/pb
-          '304291-304292',  # HLT_Mu8_v10, 0.021/pb
-          '304333-304333',  # HLT_Mu8_v10, 0.019/pb
-          '304354-304354',  # HLT_Mu8_v10, 0.002/pb
-          '304366-304366',  # HLT_Mu8_v10, 0.021/pb
-          '304446-304447',  # HLT_Mu8_v10, 0.022/pb
-          '304451-304451',  # HLT_Mu8_v10, 0.001/pb
-          '304505-304508',  # HLT_Mu8_v10, 0.022/pb
-          '304562-304562',  # HLT_Mu8_v10, 0.013/pb
-          '304616-304616',  # HLT_Mu8_v10, 0.011/pb
-          '304625-304626',  # HLT_Mu8_v10, 0.004/pb
-          '304654-304655',  # HLT_Mu8_v10, 0.021/pb
-          '304661-304663',  # HLT_Mu8_v10, 0.011/pb
-          '304671-304672',  # HLT_Mu8_v10, 0.014/pb
-          '304737-304740',  # HLT_Mu8_v10, 0.026/pb
-          '304776-304778',  # HLT_Mu8_v10, 0.022/pb
-          '304797-304797',  # HLT_Mu8_v10, 0.036/pb
-          '305044-305046',  # HLT_Mu8_v10, 0.027/pb
-          '305059-305059',  # HLT_Mu8_v10, 0.005/pb
-          '305062-305064',  # HLT_Mu8_v10, 0.028/pb
-          '305081-305081',  # HLT_Mu8_v10, 0.012/pb
-          '305112-305114',  # HLT_Mu8_v10, 0.025/pb
-          '305178-305184',  # HLT_Mu8_v10, 0.006/pb
-          '305186-305186',  # HLT_Mu8_v10, 0.004/pb
-          '305188-305188',  # HLT_Mu8_v10, 0.03/pb
-          '305202-305202',  # HLT_Mu8_v10, 0.006/pb
-          '305204-305204',  # HLT_Mu8_v10, 0.015/pb
-          '305207-305208',  # HLT_Mu8_v10, 0.016/pb
-          '305234-305234',  # HLT_Mu8_v10, 0.0/pb
-          '305236-305237',  # HLT_Mu8_v10, 0.014/pb
-          '305247-305248',  # HLT_Mu8_v10, 0.016/pb
-          '305252-305252',  # HLT_Mu8_v10, 0.007/pb
-          '305282-305282',  # HLT_Mu8_v10, 0.001/pb
-          '305310-305314',  # HLT_Mu8_v10, 0.023/pb
-          '305336-305336',  # HLT_Mu8_v10, 0.002/pb
-          '305338-305338',  # HLT_Mu8_v10, 0.001/pb
-          '305341-305341',  # HLT_Mu8_v10, 0.005/pb
-          '305349-305351',  # HLT_Mu8_v10, 0.012/pb
-          '305358-305358',  # HLT_Mu8_v10, 0.001/pb
-          '305364-305366',  # HLT_Mu8_v10, 0.026/pb
-          '305376-305377',  # HLT_Mu8_v10, 0.019/pb
-          '305405-305406',  # HLT_Mu8_v10, 0.024/pb
-          '305440-305441',  # HLT_Mu8_v10, 0.005/pb
-          '305516-305518',  # HLT_Mu8_v10, 0.022/pb
-          '305586-305586',  # HLT_Mu8_v10, 0.007/pb
-          '305589-305590',  # HLT_Mu8_v10, 0.021/pb
-          '305636-305636',  # HLT_Mu8_v10, 0.029/pb
-          '305766-305766',  # HLT_Mu8_v10, 0.011/pb
-          '305809-305809',  # HLT_Mu8_v10, 0.002/pb
-          '305814-305814',  # HLT_Mu8_v10, 0.023/pb
-          '305821-305821',  # HLT_Mu8_v10, 0.01/pb
-          '305832-305832',  # HLT_Mu8_v10, 0.002/pb
-          '305840-305840',  # HLT_Mu8_v10, 0.014/pb
-          '305842-305842',  # HLT_Mu8_v10, 0.011/pb
-          '305862-305862',  # HLT_Mu8_v10, 0.008/pb
-          '305898-305898',  # HLT_Mu8_v10, 0.009/pb
-          '305902-305902',  # HLT_Mu8_v10, 0.006/pb
-          '305967-305967',  # HLT_Mu8_v10, 0.0/pb
-          '306029-306030',  # HLT_Mu8_v10, 0.002/pb
-          '306036-306038',  # HLT_Mu8_v10, 0.002/pb
-          '306041-306042',  # HLT_Mu8_v10, 0.008/pb
-          '306048-306049',  # HLT_Mu8_v10, 0.006/pb
-          '306051-306051',  # HLT_Mu8_v10, 0.005/pb
-          '306091-306092',  # HLT_Mu8_v10, 0.014/pb
-          '306095-306095',  # HLT_Mu8_v10, 0.004/pb
-          '306121-306122',  # HLT_Mu8_v10, 0.003/pb
-          '306125-306126',  # HLT_Mu8_v10, 0.043/pb
-          '306134-306135',  # HLT_Mu8_v10, 0.014/pb
-          '306138-306139',  # HLT_Mu8_v10, 0.033/pb
-          '306153-306155',  # HLT_Mu8_v10, 0.034/pb
-          '306169-306171',  # HLT_Mu8_v10, 0.02/pb
-          '306418-306420',  # HLT_Mu8_v11, 0.003/pb
-          '306422-306423',  # HLT_Mu8_v11, 0.005/pb
-          '306432-306432',  # HLT_Mu8_v11, 0.002/pb
-          '306454-306460',  # HLT_Mu8_v11, 0.048/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu17"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(17.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(592.9), # L=70.038/pb; present in all eras; prescale factor 592.9 (600.1 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '297050-297050',  # HLT_Mu17_v5, 0.158/pb
-          '297056-297057',  # HLT_Mu17_v5, 0.24/pb
-          '297099-297101',  # HLT_Mu17_v6, 0.402/pb
-          '297113-297114',  # HLT_Mu17_v6, 0.142/pb
-          '297175-297178',  # HLT_Mu17_v6, 0.468/pb
-          '297215-297215',  # HLT_Mu17_v6, 0.02/pb
-          '297218-297219',  # HLT_Mu17_v6, 0.709/pb
-          '297224-297225',  # HLT_Mu17_v6, 0.023/pb
-          '297227-297227',  # HLT_Mu17_v6, 0.026/pb
-          '297292-297293',  # HLT_Mu17_v6, 0.331/pb
-          '297296-297296',  # HLT_Mu17_v6, 0.14/pb
-          '297308-297308',  # HLT_Mu17_v6, 0.01/pb
-          '297359-297359',  # HLT_Mu17_v6, 0.022/pb
-          '297411-297411',  # HLT_Mu17_v6, 0.336/pb
-          '297424-297426',  # HLT_Mu17_v6, 0.162/pb
-          '297429-297435',  # HLT_Mu17_v6, 0.332/pb
-          '297467-297469',  # HLT_Mu17_v6, 0.116/pb
-          '297483-297488',  # HLT_Mu17_v6, 0.786/pb
-          '297503-297505',  # HLT_Mu17_v6, 0.447/pb
-          '297557-297558',  # HLT_Mu17_v7, 0.265/pb
-          '297562-297563',  # HLT_Mu17_v7, 0.178/pb
-          '297598-297599',  # HLT_Mu17_v7, 0.156/pb
-          '297603-297606',  # HLT_Mu17_v7, 0.461/pb
-          '297620-297620',  # HLT_Mu17_v7, 0.137/pb
-          '297656-297656',  # HLT_Mu17_v7, 0.155/pb
-          '297665-297666',  # HLT_Mu17_v7, 0.131/pb
-          '297670-297670',  # HLT_Mu17_v7, 0.004/pb
-          '297674-297675',  # HLT_Mu17_v7, 0.285/pb
-          '297722-297723',  # HLT_Mu17_v7, 0.238/pb
-          '298996-298997',  # HLT_Mu17_v7, 0.043/pb
-          '299000-299000',  # HLT_Mu17_v7, 0.013/pb
-          '299042-299042',  # HLT_Mu17_v7, 0.003/pb
-          '299061-299062',  # HLT_Mu17_v7, 0.206/pb
-          '299064-299065',  # HLT_Mu17_v7, 0.122/pb
-          '299067-299067',  # HLT_Mu17_v7, 0.115/pb
-          '299096-299096',  # HLT_Mu17_v7, 0.04/pb
-          '299149-299149',  # HLT_Mu17_v7, 0.18/pb
-          '299178-299178',  # HLT_Mu17_v7, 0.026/pb
-          '299180-299180',  # HLT_Mu17_v7, 0.026/pb
-          '299184-299185',  # HLT_Mu17_v7, 0.245/pb
-          '299327-299327',  # HLT_Mu17_v7, 0.025/pb
-          '299329-299329',  # HLT_Mu17_v7, 0.062/pb
-          '299368-299370',  # HLT_Mu17_v8, 0.328/pb
-          '299380-299381',  # HLT_Mu17_v8, 0.072/pb
-          '299394-299396',  # HLT_Mu17_v8, 0.057/pb
-          '299420-299420',  # HLT_Mu17_v8, 0.011/pb
-          '299443-299443',  # HLT_Mu17_v8, 0.005/pb
-          '299450-299450',  # HLT_Mu17_v8, 0.01/pb
-          '299477-299481',  # HLT_Mu17_v8, 0.659/pb
-          '299593-299595',  # HLT_Mu17_v8, 0.401/pb
-          '299597-299597',  # HLT_Mu17_v8, 0.142/pb
-          '299649-299649',  # HLT_Mu17_v8, 0.057/pb
-          '300087-300087',  # HLT_Mu17_v9, 0.021/pb
-          '300105-300107',  # HLT_Mu17_v9, 0.028/pb
-          '300117-300117',  # HLT_Mu17_v9, 0.005/pb
-          '300122-300123',  # HLT_Mu17_v9, 0.558/pb
-          '300155-300157',  # HLT_Mu17_v9, 0.683/pb
-          '300226-300226',  # HLT_Mu17_v9, 0.088/pb
-          '300233-300240',  # HLT_Mu17_v9, 0.606/pb
-          '300280-300284',  # HLT_Mu17_v9, 0.421/pb
-          '300364-300375',  # HLT_Mu17_v9, 0.067/pb
-          '300389-300401',  # HLT_Mu17_v9, 0.517/pb
-          '300459-300459',  # HLT_Mu17_v9, 0.068/pb
-          '300461-300464',  # HLT_Mu17_v9, 0.198/pb
-          '300466-300467',  # HLT_Mu17_v9, 0.337/pb
-          '300497-300497',  # HLT_Mu17_v9, 0.045/pb
-          '300514-300517',  # HLT_Mu17_v9, 0.516/pb
-          '300558-300558',  # HLT_Mu17_v9, 0.199/pb
-          '300560-300560',  # HLT_Mu17_v9, 0.234/pb
-          '300574-300576',  # HLT_Mu17_v9, 0.461/pb
-          '300631-300633',  # HLT_Mu17_v9, 0.173/pb
-          '300635-300636',  # HLT_Mu17_v9, 0.52/pb
-          '300673-300676',  # HLT_Mu17_v9, 0.019/pb
-          '300742-300742',  # HLT_Mu17_v9, 0.07/pb
-          '300777-300777',  # HLT_Mu17_v9, 0.135/pb
-          '300780-300780',  # HLT_Mu17_v9, 0.132/pb
-          '300785-300785',  # HLT_Mu17_v9, 0.355/pb
-          '300806-300806',  # HLT_Mu17_v9, 0.062/pb
-          '300811-300812',  # HLT_Mu17_v9, 0.161/pb
-          '300816-300817',  # HLT_Mu17_v9, 0.224/pb
-          '301046-301046',  # HLT_Mu17_v9, 0.03/pb
-          '301141-301142',  # HLT_Mu17_v9, 0.341/pb
-          '301161-301161',  # HLT_Mu17_v9, 0.287/pb
-          '301165-301165',  # HLT_Mu17_v9, 0.055/pb
-          '301179-301180',  # HLT_Mu17_v9, 0.035/pb
-          '301183-301183',  # HLT_Mu17_v9, 0.105/pb
-          '301281-301281',  # HLT_Mu17_v9, 0.043/pb
-          '301283-301283',  # HLT_Mu17_v9, 0.335/pb
-          '301298-301298',  # HLT_Mu17_v9, 0.303/pb
-          '301323-301323',  # HLT_Mu17_v9, 0.33/pb
-          '301330-301330',  # HLT_Mu17_v9, 0.111/pb
-          '301359-301359',  # HLT_Mu17_v9, 0.099/pb
-          '301384-301384',  # HLT_Mu17_v9, 0.163/pb
-          '301391-301393',  # HLT_Mu17_v9, 0.29/pb
-          '301396-301399',  # HLT_Mu17_v9, 0.22/pb
-          '301417-301417',  # HLT_Mu17_v9, 0.117/pb
-          '301447-301450',  # HLT_Mu17_v9, 0.393/pb
-          '301461-301461',  # HLT_Mu17_v9, 0.185/pb
-          '301472-301472',  # HLT_Mu17_v9, 0.271/pb
-          '301475-301476',  # HLT_Mu17_v9, 0.225/pb
-          '301519-301519',  # HLT_Mu17_v9, 0.063/pb
-          '301524-301524',  # HLT_Mu17_v9, 0.096/pb
-          '301529-301532',  # HLT_Mu17_v9, 0.247/pb
-          '301567-301567',  # HLT_Mu17_v9, 0.12/pb
-          '301627-301627',  # HLT_Mu17_v9, 0.286/pb
-          '301664-301665',  # HLT_Mu17_v9, 0.305/pb
-          '301694-301694',  # HLT_Mu17_v9, 0.019/pb
-          '301912-301914',  # HLT_Mu17_v9, 0.186/pb
-          '301941-301941',  # HLT_Mu17_v9, 0.173/pb
-          '301959-301960',  # HLT_Mu17_v9, 0.566/pb
-          '301970-301970',  # HLT_Mu17_v9, 0.039/pb
-          '301984-301987',  # HLT_Mu17_v9, 0.584/pb
-          '301997-301998',  # HLT_Mu17_v9, 0.565/pb
-          '302019-302019',  # HLT_Mu17_v9, 0.016/pb
-          '302026-302026',  # HLT_Mu17_v10, 0.008/pb
-          '302029-302029',  # HLT_Mu17_v10, 0.026/pb
-          '302031-302031',  # HLT_Mu17_v10, 0.288/pb
-          '302033-302034',  # HLT_Mu17_v10, 0.02/pb
-          '302037-302038',  # HLT_Mu17_v10, 0.0/pb
-          '302040-302043',  # HLT_Mu17_v10, 0.38/pb
-          '302131-302131',  # HLT_Mu17_v10, 0.35/pb
-          '302159-302159',  # HLT_Mu17_v10, 0.037/pb
-          '302163-302163',  # HLT_Mu17_v10, 0.448/pb
-          '302165-302166',  # HLT_Mu17_v10, 0.03/pb
-          '302225-302225',  # HLT_Mu17_v10, 0.32/pb
-          '302228-302229',  # HLT_Mu17_v10, 0.245/pb
-          '302240-302240',  # HLT_Mu17_v10, 0.371/pb
-          '302262-302263',  # HLT_Mu17_v10, 0.643/pb
-          '302277-302277',  # HLT_Mu17_v10, 0.125/pb
-          '302279-302280',  # HLT_Mu17_v10, 0.124/pb
-          '302322-302322',  # HLT_Mu17_v10, 0.334/pb
-          '302328-302328',  # HLT_Mu17_v10, 0.25/pb
-          '302337-302337',  # HLT_Mu17_v10, 0.039/pb
-          '302342-302344',  # HLT_Mu17_v10, 0.212/pb
-          '302350-302350',  # HLT_Mu17_v10, 0.059/pb
-          '302388-302388',  # HLT_Mu17_v10, 0.232/pb
-          '302392-302393',  # HLT_Mu17_v10, 0.44/pb
-          '302448-302448',  # HLT_Mu17_v10, 0.712/pb
-          '302472-302476',  # HLT_Mu17_v10, 0.615/pb
-          '302479-302479',  # HLT_Mu17_v10, 0.115/pb
-          '302484-302485',  # HLT_Mu17_v10, 0.395/pb
-          '302492-302494',  # HLT_Mu17_v10, 0.432/pb
-          '302509-302509',  # HLT_Mu17_v10, 0.007/pb
-          '302513-302513',  # HLT_Mu17_v10, 0.017/pb
-          '302522-302523',  # HLT_Mu17_v10, 0.019/pb
-          '302525-302526',  # HLT_Mu17_v10, 0.446/pb
-          '302548-302548',  # HLT_Mu17_v10, 0.027/pb
-          '302551-302551',  # HLT_Mu17_v10, 0.0/pb
-          '302553-302555',  # HLT_Mu17_v10, 0.067/pb
-          '302563-302563',  # HLT_Mu17_v10, 0.0/pb
-          '302565-302565',  # HLT_Mu17_v10, 0.0/pb
-          '302572-302573',  # HLT_Mu17_v10, 0.557/pb
-          '302596-302597',  # HLT_Mu17_v10, 0.743/pb
-          '302634-302635',  # HLT_Mu17_v10, 0.673/pb
-          '302651-302651',  # HLT_Mu17_v10, 0.052/pb
-          '302654-302654',  # HLT_Mu17_v10, 0.11/pb
-          '302661-302661',  # HLT_Mu17_v10, 0.016/pb
-          '302663-302663',  # HLT_Mu17_v10, 0.346/pb
-          '303825-303825',  # HLT_Mu17_v10, 0.069/pb
-          '303832-303832',  # HLT_Mu17_v10, 0.665/pb
-          '303838-303838',  # HLT_Mu17_v10, 0.712/pb
-          '303885-303885',  # HLT_Mu17_v10, 0.69/pb
-          '303948-303948',  # HLT_Mu17_v10, 0.572/pb
-          '303998-304000',  # HLT_Mu17_v10, 0.372/pb
-          '304062-304062',  # HLT_Mu17_v10, 0.723/pb
-          '304119-304120',  # HLT_Mu17_v10, 0.098/pb
-          '304125-304125',  # HLT_Mu17_v10, 0.67/pb
-          '304144-304144',  # HLT_Mu17_v10, 0.941/pb
-          '304158-304158',  # HLT_Mu17_v10, 0.811/pb
-          '304169-304170',  # HLT_Mu17_v10, 1.357/pb
-          '304199-304200',  # HLT_Mu17_v10, 0.112/pb
-          '304204-304204',  # HLT_Mu17_v10, 0.181/pb
-          '304209-304209',  # HLT_Mu17_v10, 0.127/pb
-          '304291-304292',  # HLT_Mu17_v10, 0.594/pb
-          '304333-304333',  # HLT_Mu17_v10, 0.521/pb
-          '304354-304354',  # HLT_Mu17_v10, 0.053/pb
-          '304366-304366',  # HLT_Mu17_v10, 0.604/pb
-          '304446-304447',  # HLT_Mu17_v10, 0.623/pb
-          '304451-304451',  # HLT_Mu17_v10, 0.026/pb
-          '304505-304508',  # HLT_Mu17_v10, 0.633/pb
-          '304562-304562',  # HLT_Mu17_v10, 0.356/pb
-          '304616-304616',  # HLT_Mu17_v10, 0.296/pb
-          '304625-304626',  # HLT_Mu17_v10, 0.113/pb
-          '304654-304655',  # HLT_Mu17_v10, 0.593/pb
-          '304661-304663',  # HLT_Mu17_v10, 0.31/pb
-          '304671-304672',  # HLT_Mu17_v10, 0.38/pb
-          '304737-304740',  # HLT_Mu17_v10, 0.751/pb
-          '304776-304778',  # HLT_Mu17_v10, 0.609/pb
-          '304797-304797',  # HLT_Mu17_v10, 1.048/pb
-          '305044-305046',  # HLT_Mu17_v10, 0.787/pb
-          '305059-305059',  # HLT_Mu17_v10, 0.122/pb
-          '305062-305064',  # HLT_Mu17_v10, 0.757/pb
-          '305081-305081',  # HLT_Mu17_v10, 0.322/pb
-          '305112-305114',  # HLT_Mu17_v10, 0.696/pb
-          '305178-305184',  # HLT_Mu17_v10, 0.077/pb
-          '305186-305186',  # HLT_Mu17_v10, 0.116/pb
-          '305188-305188',  # HLT_Mu17_v10, 0.89/pb
-          '305202-305202',  # HLT_Mu17_v10, 0.167/pb
-          '305204-305204',  # HLT_Mu17_v10, 0.434/pb
-          '305207-305208',  # HLT_Mu17_v10, 0.433/pb
-          '305234-305234',  # HLT_Mu17_v10, 0.011/pb
-          '305236-305237',  # HLT_Mu17_v10, 0.394/pb
-          '305247-305248',  # HLT_Mu17_v10, 0.433/pb
-          '305252-305252',  # HLT_Mu17_v10, 0.198/pb
-          '305282-305282',  # HLT_Mu17_v10, 0.04/pb
-          '305310-305314',  # HLT_Mu17_v10, 0.655/pb
-          '305336-305336',  # HLT_Mu17_v10, 0.051/pb
-          '305338-305338',  # HLT_Mu17_v10, 0.025/pb
-          '305341-305341',  # HLT_Mu17_v10, 0.131/pb
-          '305349-305351',  # HLT_Mu17_v10, 0.339/pb
-          '305358-305358',  # HLT_Mu17_v10, 0.038/pb
-          '305364-305366',  # HLT_Mu17_v10, 0.742/pb
-          '305376-305377',  # HLT_Mu17_v10, 0.539/pb
-          '305405-305406',  # HLT_Mu17_v10, 0.631/pb
-          '305440-305441',  # HLT_Mu17_v10, 0.092/pb
-          '305516-305518',  # HLT_Mu17_v10, 0.579/pb
-          '305586-305586',  # HLT_Mu17_v10, 0.133/pb
-          '305589-305590',  # HLT_Mu17_v10, 0.621/pb
-          '305636-305636',  # HLT_Mu17_v10, 0.77/pb
-          '305766-305766',  # HLT_Mu17_v10, 0.223/pb
-          '305809-305809',  # HLT_Mu17_v10, 0.035/pb
-          '305814-305814',  # HLT_Mu17_v10, 0.605/pb
-          '305821-305821',  # HLT_Mu17_v10, 0.199/pb
-          '305832-305832',  # HLT_Mu17_v10, 0.045/pb
-          '305840-305840',  # HLT_Mu17_v10, 0.395/pb
-          '305842-305842',  # HLT_Mu17_v10, 0.331/pb
-          '305862-305862',  # HLT_Mu17_v10, 0.158/pb
-          '305898-305898',  # HLT_Mu17_v10, 0.184/pb
-          '305902-305902',  # HLT_Mu17_v10, 0.119/pb
-          '305967-305967',  # HLT_Mu17_v10, 0.008/pb
-          '306029-306030',  # HLT_Mu17_v10, 0.034/pb
-          '306036-306038',  # HLT_Mu17_v10, 0.043/pb
-          '306041-306042',  # HLT_Mu17_v10, 0.189/pb
-          '306048-306049',  # HLT_Mu17_v10, 0.175/pb
-          '306051-306051',  # HLT_Mu17_v10, 0.149/pb
-          '306091-306092',  # HLT_Mu17_v10, 0.367/pb
-          '306095-306095',  # HLT_Mu17_v10, 0.112/pb
-          '306121-306122',  # HLT_Mu17_v10, 0.053/pb
-          '306125-306126',  # HLT_Mu17_v10, 1.226/pb
-          '306134-306135',  # HLT_Mu17_v10, 0.308/pb
-          '306138-306139',  # HLT_Mu17_v10, 1.012/pb
-          '306153-306155',  # HLT_Mu17_v10, 0.931/pb
-          '306169-306171',  # HLT_Mu17_v10, 0.605/pb
-          '306418-306420',  # HLT_Mu17_v11, 0.056/pb
-          '306422-306423',  # HLT_Mu17_v11, 0.131/pb
-          '306432-306432',  # HLT_Mu17_v11, 0.074/pb
-          '306454-306460',  # HLT_Mu17_v11, 1.275/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu20"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(20.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(72.3), # L=574.1/pb; present in all eras; prescale factor 72.3 (73.9 from delivery)
-        trigger_type = cms.string('1mu'),
-        run_ranges = cms.vstring(*(
-          '297050-297050',  # HLT_Mu20_v5, 15.787/pb
-          '297056-297057',  # HLT_Mu20_v5, 23.957/pb
-          '297099-297101',  # HLT_Mu20_v6, 40.249/pb
-          '297113-297114',  # HLT_Mu20_v6, 14.167/pb
-          '297175-297178',  # HLT_Mu20_v6, 46.764/pb
-          '297215-297215',  # HLT_Mu20_v6, 0.017/pb
-          '297218-297219',  # HLT_Mu20_v6, 70.562/pb
-          '297224-297225',  # HLT_Mu20_v6, 2.302/pb
-          '297227-297227',  # HLT_Mu20_v6, 2.612/pb
-          '297292-297293',  # HLT_Mu20_v6, 33.113/pb
-          '297296-297296',  # HLT_Mu20_v6, 14.034/pb
-          '297308-297308',  # HLT_Mu20_v6, 1.05/pb
-          '297359-297359',  # HLT_Mu20_v6, 0.019/pb
-          '297411-297411',  # HLT_Mu20_v6, 33.596/pb
-          '297424-297426',  # HLT_Mu20_v6, 3.995/pb
-          '297429-297435',  # HLT_Mu20_v6, 33.198/pb
-          '297467-297469',  # HLT_Mu20_v6, 0.097/pb
-          '297483-297488',  # HLT_Mu20_v6, 72.381/pb
-          '297503-297505',  # HLT_Mu20_v6, 44.741/pb
-          '297557-297558',  # HLT_Mu20_v7, 14.995/pb
-          '297562-297563',  # HLT_Mu20_v7, 17.798/pb
-          '297598-297599',  # HLT_Mu20_v7, 11.334/pb
-          '297603-297606',  # HLT_Mu20_v7, 29.809/pb
-          '297620-297620',  # HLT_Mu20_v7, 0.114/pb
-          '297656-297656',  # HLT_Mu20_v7, 0.129/pb
-          '297665-297666',  # HLT_Mu20_v7, 0.131/pb
-          '297670-297670',  # HLT_Mu20_v7, 0.003/pb
-          '297674-297675',  # HLT_Mu20_v7, 0.241/pb
-          '297722-297723',  # HLT_Mu20_v7, 0.198/pb
-          '298996-298997',  # HLT_Mu20_v7, 0.053/pb
-          '299000-299000',  # HLT_Mu20_v7, 0.018/pb
-          '299042-299042',  # HLT_Mu20_v7, 0.004/pb
-          '299061-299062',  # HLT_Mu20_v7, 0.193/pb
-          '299064-299065',  # HLT_Mu20_v7, 0.122/pb
-          '299067-299067',  # HLT_Mu20_v7, 0.151/pb
-          '299096-299096',  # HLT_Mu20_v7, 0.033/pb
-          '299149-299149',  # HLT_Mu20_v7, 0.15/pb
-          '299178-299178',  # HLT_Mu20_v7, 0.022/pb
-          '299180-299180',  # HLT_Mu20_v7, 0.022/pb
-          '299184-299185',  # HLT_Mu20_v7, 0.231/pb
-          '299327-299327',  # HLT_Mu20_v7, 0.024/pb
-          '299329-299329',  # HLT_Mu20_v7, 0.062/pb
-          '299368-299370',  # HLT_Mu20_v8, 0.408/pb
-          '299380-299381',  # HLT_Mu20_v8, 0.081/pb
-          '299394-299396',  # HLT_Mu20_v8, 0.082/pb
-          '299420-299420',  # HLT_Mu20_v8, 0.018/pb
-          '299443-299443',  # HLT_Mu20_v8, 0.008/pb
-          '299450-299450',  # HLT_Mu20_v8, 0.017/pb
-          '299477-299481',  # HLT_Mu20_v8, 1.176/pb
-          '299593-299595',  # HLT_Mu20_v8, 0.443/pb
-          '299597-299597',  # HLT_Mu20_v8, 0.158/pb
-          '299649-299649',  # HLT_Mu20_v8, 0.069/pb
-          '300087-300087',  # HLT_Mu20_v9, 0.093/pb
-          '300105-300107',  # HLT_Mu20_v9, 0.047/pb
-          '300117-300117',  # HLT_Mu20_v9, 0.008/pb
-          '300122-300123',  # HLT_Mu20_v9, 0.721/pb
-          '300155-300157',  # HLT_Mu20_v9, 0.89/pb
-          '300226-300226',  # HLT_Mu20_v9, 0.147/pb
-          '300233-300240',  # HLT_Mu20_v9, 0.776/pb
-          '300280-300284',  # HLT_Mu20_v9, 2.006/pb
-          '300364-300375',  # HLT_Mu20_v9, 0.099/pb
-          '300389-300401',  # HLT_Mu20_v9, 0.605/pb
-          '300459-300459',  # HLT_Mu20_v9, 0.113/pb
-          '300461-300464',  # HLT_Mu20_v9, 0.21/pb
-          '300466-300467',  # HLT_Mu20_v9, 0.449/pb
-          '300497-300497',  # HLT_Mu20_v9, 0.044/pb
-          '300514-300517',  # HLT_Mu20_v9, 0.634/pb
-          '300558-300558',  # HLT_Mu20_v9, 0.213/pb
-          '300560-300560',  # HLT_Mu20_v9, 0.317/pb
-          '300574-300576',  # HLT_Mu20_v9, 0.519/pb
-          '300631-300633',  # HLT_Mu20_v9, 0.239/pb
-          '300635-300636',  # HLT_Mu20_v9, 0.643/pb
-          '300673-300676',  # HLT_Mu20_v9, 0.032/pb
-          '300742-300742',  # HLT_Mu20_v9, 0.117/pb
-          '300777-300777',  # HLT_Mu20_v9, 0.186/pb
-          '300780-300780',  # HLT_Mu20_v9, 0.128/pb
-          '300785-300785',  # HLT_Mu20_v9, 0.457/pb
-          '300806-300806',  # HLT_Mu20_v9, 0.06/pb
-          '300811-300812',  # HLT_Mu20_v9, 0.213/pb
-          '300816-300817',  # HLT_Mu20_v9, 0.23/pb
-          '301046-301046',  # HLT_Mu20_v9, 0.001/pb
-          '301141-301142',  # HLT_Mu20_v9, 0.005/pb
-          '301161-301161',  # HLT_Mu20_v9, 0.004/pb
-          '301165-301165',  # HLT_Mu20_v9, 0.001/pb
-          '301179-301180',  # HLT_Mu20_v9, 0.0/pb
-          '301183-301183',  # HLT_Mu20_v9, 0.001/pb
-          '301281-301281',  # HLT_Mu20_v9, 0.0/pb
-          '301283-301283',  # HLT_Mu20_v9, 0.004/pb
-          '301298-301298',  # HLT_Mu20_v9, 0.003/pb
-          '301323-301323',  # HLT_Mu20_v9, 0.003/pb
-          '301330-301330',  # HLT_Mu20_v9, 0.001/pb
-          '301359-301359',  # HLT_Mu20_v9, 0.001/pb
-          '301384-301384',  # HLT_Mu20_v9, 0.001/pb
-          '301391-301393',  # HLT_Mu20_v9, 0.002/pb
-          '301396-301399',  # HLT_Mu20_v9, 0.005/pb
-          '301417-301417',  # HLT_Mu20_v9, 0.001/pb
-          '301447-301450',  # HLT_Mu20_v9, 0.006/pb
-          '301461-301461',  # HLT_Mu20_v9, 0.002/pb
-          '301472-301472',  # HLT_Mu20_v9, 0.002/pb
-          '301475-301476',  # HLT_Mu20_v9, 0.006/pb
-          '301519-301519',  # HLT_Mu20_v9, 0.001/pb
-          '301524-301524',  # HLT_Mu20_v9, 0.001/pb
-          '301529-301532',  # HLT_Mu20_v9, 0.007/pb
-          '301567-301567',  # HLT_Mu20_v9, 0.001/pb
-          '301627-301627',  # HLT_Mu20_v9, 0.003/pb
-          '301664-301665',  # HLT_Mu20_v9, 0.003/pb
-          '301694-301694',  # HLT_Mu20_v9, 0.014/pb
-          '301912-301914',  # HLT_Mu20_v9, 0.002/pb
-          '301941-301941',  # HLT_Mu20_v9, 0.002/pb
-          '301959-301960',  # HLT_Mu20_v9, 0.01/pb
-          '301970-301970',  # HLT_Mu20_v9, 0.0/pb
-          '301984-301987',  # HLT_Mu20_v9, 0.011/pb
-          '301997-301998',  # HLT_Mu20_v9, 0.01/pb
-          '302019-302019',  # HLT_Mu20_v9, 0.0/pb
-          '302026-302026',  # HLT_Mu20_v10, 0.006/pb
-          '302029-302029',  # HLT_Mu20_v10, 0.019/pb
-          '302031-302031',  # HLT_Mu20_v10, 0.198/pb
-          '302033-302034',  # HLT_Mu20_v10, 0.014/pb
-          '302037-302038',  # HLT_Mu20_v10, 0.0/pb
-          '302040-302043',  # HLT_Mu20_v10, 0.263/pb
-          '302131-302131',  # HLT_Mu20_v10, 0.241/pb
-          '302159-302159',  # HLT_Mu20_v10, 0.026/pb
-          '302163-302163',  # HLT_Mu20_v10, 0.308/pb
-          '302165-302166',  # HLT_Mu20_v10, 0.021/pb
-          '302225-302225',  # HLT_Mu20_v10, 0.22/pb
-          '302228-302229',  # HLT_Mu20_v10, 0.168/pb
-          '302240-302240',  # HLT_Mu20_v10, 0.255/pb
-          '302262-302263',  # HLT_Mu20_v10, 0.444/pb
-          '302277-302277',  # HLT_Mu20_v10, 0.085/pb
-          '302279-302280',  # HLT_Mu20_v10, 0.088/pb
-          '302322-302322',  # HLT_Mu20_v10, 0.231/pb
-          '302328-302328',  # HLT_Mu20_v10, 0.171/pb
-          '302337-302337',  # HLT_Mu20_v10, 0.028/pb
-          '302342-302344',  # HLT_Mu20_v10, 0.145/pb
-          '302350-302350',  # HLT_Mu20_v10, 0.041/pb
-          '302388-302388',  # HLT_Mu20_v10, 0.166/pb
-          '302392-302393',  # HLT_Mu20_v10, 0.312/pb
-          '302448-302448',  # HLT_Mu20_v10, 0.496/pb
-          '302472-302476',  # HLT_Mu20_v10, 0.433/pb
-          '302479-302479',  # HLT_Mu20_v10, 0.084/pb
-          '302484-302485',  # HLT_Mu20_v10, 0.281/pb
-          '302492-302494',  # HLT_Mu20_v10, 0.341/pb
-          '302509-302509',  # HLT_Mu20_v10, 0.005/pb
-          '302513-302513',  # HLT_Mu20_v10, 0.013/pb
-          '302522-302523',  # HLT_Mu20_v10, 0.014/pb
-          '302525-302526',  # HLT_Mu20_v10, 0.313/pb
-          '302548-302548',  # HLT_Mu20_v10, 0.019/pb
-          '302551-302551',  # HLT_Mu20_v10, 0.001/pb
-          '302553-302555',  # HLT_Mu20_v10, 0.05/pb
-          '302563-302563',  # HLT_Mu20_v10, 0.0/pb
-          '302565-302565',  # HLT_Mu20_v10, 0.001/pb
-          '302572-302573',  # HLT_Mu20_v10, 0.387/pb
-          '302596-302597',  # HLT_Mu20_v10, 0.517/pb
-          '302634-302635',  # HLT_Mu20_v10, 0.471/pb
-          '302651-302651',  # HLT_Mu20_v10, 0.038/pb
-          '302654-302654',  # HLT_Mu20_v10, 0.08/pb
-          '302661-302661',  # HLT_Mu20_v10, 0.012/pb
-          '302663-302663',  # HLT_Mu20_v10, 0.241/pb
-          '303825-303825',  # HLT_Mu20_v10, 0.047/pb
-          '303832-303832',  # HLT_Mu20_v10, 0.471/pb
-          '303838-303838',  # HLT_Mu20_v10, 0.508/pb
-          '303885-303885',  # HLT_Mu20_v10, 0.496/pb
-          '303948-303948',  # HLT_Mu20_v10, 0.416/pb
-          '303998-304000',  # HLT_Mu20_v10, 0.276/pb
-          '304062-304062',  # HLT_Mu20_v10, 0.516/pb
-          '304119-304120',  # HLT_Mu20_v10, 0.074/pb
-          '304125-304125',  # HLT_Mu20_v10, 0.476/pb
-          '304144-304144',  # HLT_Mu20_v10, 0.674/pb
-          '304158-304158',  # HLT_Mu20_v10, 0.568/pb
-          '304169-304170',  # HLT_Mu20_v10, 0.969/pb
-          '304199-304200',  # HLT_Mu20_v10, 0.085/pb
-          '304204-304204',  # HLT_Mu20_v10, 0.135/pb
-          '304209-304209',  # HLT_Mu20_v10, 0.095/pb
-          '304291-304292',  # HLT_Mu20_v10, 0.425/pb
-          '304333-304333',  # HLT_Mu20_v10, 0.381/pb
-          '304354-304354',  # HLT_Mu20_v10, 0.041/pb
-          '304366-304366',  # HLT_Mu20_v10, 0.438/pb
-          '304446-304447',  # HLT_Mu20_v10, 0.451/pb
-          '304451-304451',  # HLT_Mu20_v10, 0.018/pb
-          '304505-304508',  # HLT_Mu20_v10, 0.459/pb
-          '304562-304562',  # HLT_Mu20_v10, 0.257/pb
-          '304616-304616',  # HLT_Mu20_v10, 0.221/pb
-          '304625-304626',  # HLT_Mu20_v10, 0.085/pb
-          '304654-304655',  # HLT_Mu20_v10, 0.428/pb
-          '304661-304663',  # HLT_Mu20_v10, 0.232/pb
-          '304671-304672',  # HLT_Mu20_v10, 0.283/pb
-          '304737-304740',  # HLT_Mu20_v10, 0.542/pb
-          '304776-304778',  # HLT_Mu20_v10, 0.441/pb
-          '304797-304797',  # HLT_Mu20_v10, 0.745/pb
-          '305044-305046',  # HLT_Mu20_v10, 0.552/pb
-          '305059-305059',  # HLT_Mu20_v10, 0.094/pb
-          '305062-305064',  # HLT_Mu20_v10, 0.544/pb
-          '305081-305081',  # HLT_Mu20_v10, 0.238/pb
-          '305112-305114',  # HLT_Mu20_v10, 0.501/pb
-          '305178-305184',  # HLT_Mu20_v10, 0.069/pb
-          '305186-305186',  # HLT_Mu20_v10, 0.089/pb
-          '305188-305188',  # HLT_Mu20_v10, 0.624/pb
-          '305202-305202',  # HLT_Mu20_v10, 0.127/pb
-          '305204-305204',  # HLT_Mu20_v10, 0.315/pb
-          '305207-305208',  # HLT_Mu20_v10, 0.325/pb
-          '305234-305234',  # HLT_Mu20_v10, 0.008/pb
-          '305236-305237',  # HLT_Mu20_v10, 0.289/pb
-          '305247-305248',  # HLT_Mu20_v10, 0.319/pb
-          '305252-305252',  # HLT_Mu20_v10, 0.138/pb
-          '305282-305282',  # HLT_Mu20_v10, 0.029/pb
-          '305310-305314',  # HLT_Mu20_v10, 0.473/pb
-          '305336-305336',  # HLT_Mu20_v10, 0.039/pb
-          '305338-305338',  # HLT_Mu20_v10, 0.02/pb
-          '305341-305341',  # HLT_Mu20_v10, 0.101/pb
-          '305349-305351',  # HLT_Mu20_v10, 0.243/pb
-          '305358-305358',  # HLT_Mu20_v10, 0.03/pb
-          '305364-305366',  # HLT_Mu20_v10, 0.539/pb
-          '305376-305377',  # HLT_Mu20_v10, 0.396/pb
-          '305405-305406',  # HLT_Mu20_v10, 0.449/pb
-          '305440-305441',  # HLT_Mu20_v10, 0.082/pb
-          '305516-305518',  # HLT_Mu20_v10, 0.411/pb
-          '305586-305586',  # HLT_Mu20_v10, 0.117/pb
-          '305589-305590',  # HLT_Mu20_v10, 0.4/pb
-          '305636-305636',  # HLT_Mu20_v10, 0.535/pb
-          '305766-305766',  # HLT_Mu20_v10, 0.19/pb
-          '305809-305809',  # HLT_Mu20_v10, 0.031/pb
-          '305814-305814',  # HLT_Mu20_v10, 0.428/pb
-          '305821-305821',  # HLT_Mu20_v10, 0.172/pb
-          '305832-305832',  # HLT_Mu20_v10, 0.039/pb
-          '305840-305840',  # HLT_Mu20_v10, 0.265/pb
-          '305842-305842',  # HLT_Mu20_v10, 0.205/pb
-          '305862-305862',  # HLT_Mu20_v10, 0.139/pb
-          '305898-305898',  # HLT_Mu20_v10, 0.161/pb
-          '305902-305902',  # HLT_Mu20_v10, 0.105/pb
-          '305967-305967',  # HLT_Mu20_v10, 0.007/pb
-          '306029-306030',  # HLT_Mu20_v10, 0.03/pb
-          '306036-306038',  # HLT_Mu20_v10, 0.038/pb
-          '306041-306042',  # HLT_Mu20_v10, 0.154/pb
-          '306048-306049',  # HLT_Mu20_v10, 0.114/pb
-          '306051-306051',  # HLT_Mu20_v10, 0.093/pb
-          '306091-306092',  # HLT_Mu20_v10, 0.261/pb
-          '306095-306095',  # HLT_Mu20_v10, 0.069/pb
-          '306121-306122',  # HLT_Mu20_v10, 0.047/pb
-          '306125-306126',  # HLT_Mu20_v10, 0.801/pb
-          '306134-306135',  # HLT_Mu20_v10, 0.253/pb
-          '306138-306139',  # HLT_Mu20_v10, 0.617/pb
-          '306153-306155',  # HLT_Mu20_v10, 0.637/pb
-          '306169-306171',  # HLT_Mu20_v10, 0.356/pb
-          '306418-306420',  # HLT_Mu20_v11, 0.05/pb
-          '306422-306423',  # HLT_Mu20_v11, 0.1/pb
-          '306432-306432',  # HLT_Mu20_v11, 0.046/pb
-          '306454-306460',  # HLT_Mu20_v11, 0.848/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu27"),
-        cone_minPt = cms.double(45.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(27.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(224.5), # L=184.944/pb; present in all eras; prescale factor 224.5 (216.1 from delivery)
-        trigger_type = cms.string('1mu'),
-        run_ranges = cms.vstring(*(
-          '297050-297050',  # HLT_Mu27_v6, 0.789/pb
-          '297056-297057',  # HLT_Mu27_v6, 1.198/pb
-          '297099-297101',  # HLT_Mu27_v7, 1.949/pb
-          '297113-297114',  # HLT_Mu27_v7, 0.708/pb
-          '297175-297178',  # HLT_Mu27_v7, 2.338/pb
-          '297215-297215',  # HLT_Mu27_v7, 0.039/pb
-          '297218-297219',  # HLT_Mu27_v7, 3.535/pb
-          '297224-297225',  # HLT_Mu27_v7, 0.115/pb
-          '297227-297227',  # HLT_Mu27_v7, 0.131/pb
-          '297292-297293',  # HLT_Mu27_v7, 1.656/pb
-          '297296-297296',  # HLT_Mu27_v7, 0.702/pb
-          '297308-297308',  # HLT_Mu27_v7, 0.052/pb
-          '297359-297359',  # HLT_Mu27_v7, 0.044/pb
-          '297411-297411',  # HLT_Mu27_v7, 1.68/pb
-          '297424-297426',  # HLT_Mu27_v7, 0.43/pb
-          '297429-297435',  # HLT_Mu27_v7, 1.66/pb
-          '297467-297469',  # HLT_Mu27_v7, 0.222/pb
-          '297483-297488',  # HLT_Mu27_v7, 3.735/pb
-          '297503-297505',  # HLT_Mu27_v7, 2.237/pb
-          '297557-297558',  # HLT_Mu27_v8, 0.965/pb
-          '297562-297563',  # HLT_Mu27_v8, 0.89/pb
-          '297598-297599',  # HLT_Mu27_v8, 0.648/pb
-          '297603-297606',  # HLT_Mu27_v8, 2.306/pb
-          '297620-297620',  # HLT_Mu27_v8, 0.261/pb
-          '297656-297656',  # HLT_Mu27_v8, 0.296/pb
-          '297665-297666',  # HLT_Mu27_v8, 0.653/pb
-          '297670-297670',  # HLT_Mu27_v8, 0.007/pb
-          '297674-297675',  # HLT_Mu27_v8, 1.072/pb
-          '297722-297723',  # HLT_Mu27_v8, 0.7/pb
-          '298996-298997',  # HLT_Mu27_v8, 0.199/pb
-          '299000-299000',  # HLT_Mu27_v8, 0.067/pb
-          '299042-299042',  # HLT_Mu27_v8, 0.017/pb
-          '299061-299062',  # HLT_Mu27_v8, 1.028/pb
-          '299064-299065',  # HLT_Mu27_v8, 0.609/pb
-          '299067-299067',  # HLT_Mu27_v8, 0.573/pb
-          '299096-299096',  # HLT_Mu27_v8, 0.201/pb
-          '299149-299149',  # HLT_Mu27_v8, 0.665/pb
-          '299178-299178',  # HLT_Mu27_v8, 0.05/pb
-          '299180-299180',  # HLT_Mu27_v8, 0.13/pb
-          '299184-299185',  # HLT_Mu27_v8, 1.223/pb
-          '299327-299327',  # HLT_Mu27_v8, 0.126/pb
-          '299329-299329',  # HLT_Mu27_v8, 0.312/pb
-          '299368-299370',  # HLT_Mu27_v9, 0.926/pb
-          '299380-299381',  # HLT_Mu27_v9, 0.187/pb
-          '299394-299396',  # HLT_Mu27_v9, 0.183/pb
-          '299420-299420',  # HLT_Mu27_v9, 0.04/pb
-          '299443-299443',  # HLT_Mu27_v9, 0.017/pb
-          '299450-299450',  # HLT_Mu27_v9, 0.038/pb
-          '299477-299481',  # HLT_Mu27_v9, 2.694/pb
-          '299593-299595',  # HLT_Mu27_v9, 1.016/pb
-          '299597-299597',  # HLT_Mu27_v9, 0.365/pb
-          '299649-299649',  # HLT_Mu27_v9, 0.149/pb
-          '300087-300087',  # HLT_Mu27_v10, 0.213/pb
-          '300105-300107',  # HLT_Mu27_v10, 0.104/pb
-          '300117-300117',  # HLT_Mu27_v10, 0.018/pb
-          '300122-300123',  # HLT_Mu27_v10, 1.647/pb
-          '300155-300157',  # HLT_Mu27_v10, 2.039/pb
-          '300226-300226',  # HLT_Mu27_v10, 0.331/pb
-          '300233-300240',  # HLT_Mu27_v10, 1.769/pb
-          '300280-300284',  # HLT_Mu27_v10, 2.655/pb
-          '300364-300375',  # HLT_Mu27_v10, 2.167/pb
-          '300389-300401',  # HLT_Mu27_v10, 1.388/pb
-          '300459-300459',  # HLT_Mu27_v10, 0.248/pb
-          '300461-300464',  # HLT_Mu27_v10, 0.48/pb
-          '300466-300467',  # HLT_Mu27_v10, 1.037/pb
-          '300497-300497',  # HLT_Mu27_v10, 0.096/pb
-          '300514-300517',  # HLT_Mu27_v10, 1.442/pb
-          '300558-300558',  # HLT_Mu27_v10, 0.493/pb
-          '300560-300560',  # HLT_Mu27_v10, 0.731/pb
-          '300574-300576',  # HLT_Mu27_v10, 1.188/pb
-          '300631-300633',  # HLT_Mu27_v10, 0.531/pb
-          '300635-300636',  # HLT_Mu27_v10, 1.485/pb
-          '300673-300676',  # HLT_Mu27_v10, 0.07/pb
-          '300742-300742',  # HLT_Mu27_v10, 0.256/pb
-          '300777-300777',  # HLT_Mu27_v10, 0.414/pb
-          '300780-300780',  # HLT_Mu27_v10, 0.296/pb
-          '300785-300785',  # HLT_Mu27_v10, 1.056/pb
-          '300806-300806',  # HLT_Mu27_v10, 0.132/pb
-          '300811-300812',  # HLT_Mu27_v10, 0.48/pb
-          '300816-300817',  # HLT_Mu27_v10, 0.531/pb
-          '301046-301046',  # HLT_Mu27_v10, 0.06/pb
-          '301141-301142',  # HLT_Mu27_v10, 0.683/pb
-          '301161-301161',  # HLT_Mu27_v10, 0.579/pb
-          '301165-301165',  # HLT_Mu27_v10, 0.11/pb
-          '301179-301180',  # HLT_Mu27_v10, 0.073/pb
-          '301183-301183',  # HLT_Mu27_v10, 0.216/pb
-          '301281-301281',  # HLT_Mu27_v10, 0.088/pb
-          '301283-301283',  # HLT_Mu27_v10, 0.678/pb
-          '301298-301298',  # HLT_Mu27_v10, 0.624/pb
-          '301323-301323',  # HLT_Mu27_v10, 0.679/pb
-          '301330-301330',  # HLT_Mu27_v10, 0.23/pb
-          '301359-301359',  # HLT_Mu27_v10, 0.205/pb
-          '301384-301384',  # HLT_Mu27_v10, 0.337/pb
-          '301391-301393',  # HLT_Mu27_v10, 0.597/pb
-          '301396-301399',  # HLT_Mu27_v10, 0.693/pb
-          '301417-301417',  # HLT_Mu27_v10, 0.242/pb
-          '301447-301450',  # HLT_Mu27_v10, 1.008/pb
-          '301461-301461',  # HLT_Mu27_v10, 0.381/pb
-          '301472-301472',  # HLT_Mu27_v10, 0.559/pb
-          '301475-301476',  # HLT_Mu27_v10, 0.741/pb
-          '301519-301519',  # HLT_Mu27_v10, 0.13/pb
-          '301524-301524',  # HLT_Mu27_v10, 0.196/pb
-          '301529-301532',  # HLT_Mu27_v10, 0.891/pb
-          '301567-301567',  # HLT_Mu27_v10, 0.248/pb
-          '301627-301627',  # HLT_Mu27_v10, 0.587/pb
-          '301664-301665',  # HLT_Mu27_v10, 0.625/pb
-          '301694-301694',  # HLT_Mu27_v10, 0.041/pb
-          '301912-301914',  # HLT_Mu27_v10, 0.38/pb
-          '301941-301941',  # HLT_Mu27_v10, 0.355/pb
-          '301959-301960',  # HLT_Mu27_v10, 1.568/pb
-          '301970-301970',  # HLT_Mu27_v10, 0.08/pb
-          '301984-301987',  # HLT_Mu27_v10, 1.663/pb
-          '301997-301998',  # HLT_Mu27_v10, 1.576/pb
-          '302019-302019',  # HLT_Mu27_v10, 0.033/pb
-          '302026-302026',  # HLT_Mu27_v11, 0.017/pb
-          '302029-302029',  # HLT_Mu27_v11, 0.055/pb
-          '302031-302031',  # HLT_Mu27_v11, 0.591/pb
-          '302033-302034',  # HLT_Mu27_v11, 0.04/pb
-          '302037-302038',  # HLT_Mu27_v11, 0.0/pb
-          '302040-302043',  # HLT_Mu27_v11, 0.76/pb
-          '302131-302131',  # HLT_Mu27_v11, 0.705/pb
-          '302159-302159',  # HLT_Mu27_v11, 0.077/pb
-          '302163-302163',  # HLT_Mu27_v11, 0.902/pb
-          '302165-302166',  # HLT_Mu27_v11, 0.06/pb
-          '302225-302225',  # HLT_Mu27_v11, 0.649/pb
-          '302228-302229',  # HLT_Mu27_v11, 0.502/pb
-          '302240-302240',  # HLT_Mu27_v11, 0.753/pb
-          '302262-302263',  # HLT_Mu27_v11, 1.303/pb
-          '302277-302277',  # HLT_Mu27_v11, 0.256/pb
-          '302279-302280',  # HLT_Mu27_v11, 0.248/pb
-          '302322-302322',  # HLT_Mu27_v11, 0.669/pb
-          '302328-302328',  # HLT_Mu27_v11, 0.507/pb
-          '302337-302337',  # HLT_Mu27_v11, 0.08/pb
-          '302342-302344',  # HLT_Mu27_v11, 0.434/pb
-          '302350-302350',  # HLT_Mu27_v11, 0.118/pb
-          '302388-302388',  # HLT_Mu27_v11, 0.478/pb
-          '302392-302393',  # HLT_Mu27_v11, 0.908/pb
-          '302448-302448',  # HLT_Mu27_v11, 1.454/pb
-          '302472-302476',  # HLT_Mu27_v11, 1.361/pb
-          '302479-302479',  # HLT_Mu27_v11, 0.238/pb
-          '302484-302485',  # HLT_Mu27_v11, 0.815/pb
-          '302492-302494',  # HLT_Mu27_v11, 0.725/pb
-          '302509-302509',  # HLT_Mu27_v11, 0.015/pb
-          '302513-302513',  # HLT_Mu27_v11, 0.036/pb
-          '302522-302523',  # HLT_Mu27_v11, 0.04/pb
-          '302525-302526',  # HLT_Mu27_v11, 0.918/pb
-          '302548-302548',  # HLT_Mu27_v11, 0.055/pb
-          '302551-302551',  # HLT_Mu27_v11, 0.104/pb
-          '302553-302555',  # HLT_Mu27_v11, 0.231/pb
-          '302563-302563',  # HLT_Mu27_v11, 0.001/pb
-          '302565-302565',  # HLT_Mu27_v11, 0.149/pb
-          '302572-302573',  # HLT_Mu27_v11, 1.138/pb
-          '302596-302597',  # HLT_Mu27_v11, 1.516/pb
-          '302634-302635',  # HLT_Mu27_v11, 1.376/pb
-          '302651-302651',  # HLT_Mu27_v11, 0.107/pb
-          '302654-302654',  # HLT_Mu27_v11, 0.228/pb
-          '302661-302661',  # HLT_Mu27_v11, 0.034/pb
-          '302663-302663',  # HLT_Mu27_v11, 0.702/pb
-          '303825-303825',  # HLT_Mu27_v11, 0.139/pb
-          '303832-303832',  # HLT_Mu27_v11, 1.363/pb
-          '303838-303838',  # HLT_Mu27_v11, 1.465/pb
-          '303885-303885',  # HLT_Mu27_v11, 1.428/pb
-          '303948-303948',  # HLT_Mu27_v11, 1.188/pb
-          '303998-304000',  # HLT_Mu27_v11, 0.777/pb
-          '304062-304062',  # HLT_Mu27_v11, 1.491/pb
-          '304119-304120',  # HLT_Mu27_v11, 0.21/pb
-          '304125-304125',  # HLT_Mu27_v11, 1.378/pb
-          '304144-304144',  # HLT_Mu27_v11, 1.947/pb
-          '304158-304158',  # HLT_Mu27_v11, 1.658/pb
-          '304169-304170',  # HLT_Mu27_v11, 2.749/pb
-          '304199-304200',  # HLT_Mu27_v11, 0.236/pb
-          '304204-304204',  # HLT_Mu27_v11, 0.382/pb
-          '304209-304209',  # HLT_Mu27_v11, 0.271/pb
-          '304291-304292',  # HLT_Mu27_v11, 1.233/pb
-          '304333-304333',  # HLT_Mu27_v11, 1.1/pb
-          '304354-304354',  # HLT_Mu27_v11, 0.122/pb
-          '304366-304366',  # HLT_Mu27_v11, 1.274/pb
-          '304446-304447',  # HLT_Mu27_v11, 1.3/pb
-          '304451-304451',  # HLT_Mu27_v11, 0.053/pb
-          '304505-304508',  # HLT_Mu27_v11, 1.335/pb
-          '304562-304562',  # HLT_Mu27_v11, 0.745/pb
-          '304616-304616',  # HLT_Mu27_v11, 0.635/pb
-          '304625-304626',  # HLT_Mu27_v11, 0.256/pb
-          '304654-304655',  # HLT_Mu27_v11, 1.248/pb
-          '304661-304663',  # HLT_Mu27_v11, 0.666/pb
-          '304671-304672',  # HLT_Mu27_v11, 0.816/pb
-          '304737-304740',  # HLT_Mu27_v11, 1.571/pb
-          '304776-304778',  # HLT_Mu27_v11, 1.286/pb
-          '304797-304797',  # HLT_Mu27_v11, 2.167/pb
-          '305044-305046',  # HLT_Mu27_v11, 1.614/pb
-          '305059-305059',  # HLT_Mu27_v11, 0.282/pb
-          '305062-305064',  # HLT_Mu27_v11, 2.861/pb
-          '305081-305081',  # HLT_Mu27_v11, 0.693/pb
-          '305112-305114',  # HLT_Mu27_v11, 1.463/pb
-          '305178-305184',  # HLT_Mu27_v11, 2.371/pb
-          '305186-305186',  # HLT_Mu27_v11, 0.254/pb
-          '305188-305188',  # HLT_Mu27_v11, 1.791/pb
-          '305202-305202',  # HLT_Mu27_v11, 0.38/pb
-          '305204-305204',  # HLT_Mu27_v11, 0.9/pb
-          '305207-305208',  # HLT_Mu27_v11, 0.942/pb
-          '305234-305234',  # HLT_Mu27_v11, 0.024/pb
-          '305236-305237',  # HLT_Mu27_v11, 0.839/pb
-          '305247-305248',  # HLT_Mu27_v11, 0.922/pb
-          '305252-305252',  # HLT_Mu27_v11, 0.407/pb
-          '305282-305282',  # HLT_Mu27_v11, 0.087/pb
-          '305310-305314',  # HLT_Mu27_v11, 1.376/pb
-          '305336-305336',  # HLT_Mu27_v11, 0.118/pb
-          '305338-305338',  # HLT_Mu27_v11, 0.059/pb
-          '305341-305341',  # HLT_Mu27_v11, 0.294/pb
-          '305349-305351',  # HLT_Mu27_v11, 0.7/pb
-          '305358-305358',  # HLT_Mu27_v11, 0.088/pb
-          '305364-305366',  # HLT_Mu27_v11, 1.566/pb
-          '305376-305377',  # HLT_Mu27_v11, 1.151/pb
-          '305405-305406',  # HLT_Mu27_v11, 1.414/pb
-          '305440-305441',  # HLT_Mu27_v11, 0.269/pb
-          '305516-305518',  # HLT_Mu27_v11, 1.289/pb
-          '305586-305586',  # HLT_Mu27_v11, 0.386/pb
-          '305589-305590',  # HLT_Mu27_v11, 1.234/pb
-          '305636-305636',  # HLT_Mu27_v11, 1.678/pb
-          '305766-305766',  # HLT_Mu27_v11, 0.618/pb
-          '305809-305809',  # HLT_Mu27_v11, 0.103/pb
-          '305814-305814',  # HLT_Mu27_v11, 1.349/pb
-          '305821-305821',  # HLT_Mu27_v11, 0.559/pb
-          '305832-305832',  # HLT_Mu27_v11, 0.13/pb
-          '305840-305840',  # HLT_Mu27_v11, 0.814/pb
-          '305842-305842',  # HLT_Mu27_v11, 0.632/pb
-          '305862-305862',  # HLT_Mu27_v11, 0.458/pb
-          '305898-305898',  # HLT_Mu27_v11, 0.527/pb
-          '305902-305902',  # HLT_Mu27_v11, 0.347/pb
-          '305967-305967',  # HLT_Mu27_v11, 0.024/pb
-          '306029-306030',  # HLT_Mu27_v11, 0.099/pb
-          '306036-306038',  # HLT_Mu27_v11, 0.127/pb
-          '306041-306042',  # HLT_Mu27_v11, 0.493/pb
-          '306048-306049',  # HLT_Mu27_v11, 0.348/pb
-          '306051-306051',  # HLT_Mu27_v11, 0.29/pb
-          '306091-306092',  # HLT_Mu27_v11, 0.808/pb
-          '306095-306095',  # HLT_Mu27_v11, 0.217/pb
-          '306121-306122',  # HLT_Mu27_v11, 0.156/pb
-          '306125-306126',  # HLT_Mu27_v11, 2.5/pb
-          '306134-306135',  # HLT_Mu27_v11, 0.815/pb
-          '306138-306139',  # HLT_Mu27_v11, 1.935/pb
-          '306153-306155',  # HLT_Mu27_v11, 1.991/pb
-          '306169-306171',  # HLT_Mu27_v11, 1.145/pb
-          '306418-306420',  # HLT_Mu27_v12, 0.165/pb
-          '306422-306423',  # HLT_Mu27_v12, 0.315/pb
-          '306432-306432',  # HLT_Mu27_v12, 0.143/pb
-          '306454-306460',  # HLT_Mu27_v12, 4.256/pb
-        )),
-      ),
-    ),
-    'e' : cms.VPSet(
-      cms.PSet(
-        path = cms.string("HLT_Ele8_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(15.),
-        cone_maxPt = cms.double(45.),
-        minRecoPt = cms.double(8.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(11364), # L=3.654/pb; present in C, D, E, F, missing in B; prescale factor 11363.9 (11029.2 from delivery)
-        trigger_type = cms.string('1e'),
-        run_ranges = cms.vstring(*(
-          '299368-299370',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.03/pb
-          '299380-299381',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
-          '299394-299396',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
-          '299420-299420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.001/pb
-          '299443-299443',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.0/pb
-          '299450-299450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.001/pb
-          '299477-299481',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.083/pb
-          '299593-299595',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.039/pb
-          '299597-299597',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.014/pb
-          '299649-299649',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
-          '300087-300087',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.004/pb
-          '300105-300107',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
-          '300117-300117',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.0/pb
-          '300122-300123',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.072/pb
-          '300155-300157',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.088/pb
-          '300226-300226',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.006/pb
-          '300233-300240',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.072/pb
-          '300280-300284',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.041/pb
-          '300364-300375',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.005/pb
-          '300389-300401',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.058/pb
-          '300459-300459',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.005/pb
-          '300461-300464',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.019/pb
-          '300466-300467',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.051/pb
-          '300497-300497',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
-          '300514-300517',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.055/pb
-          '300558-300558',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
-          '300560-300560',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.039/pb
-          '300574-300576',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.044/pb
-          '300631-300633',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.014/pb
-          '300635-300636',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.07/pb
-          '300673-300676',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.001/pb
-          '300742-300742',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.005/pb
-          '300777-300777',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.011/pb
-          '300780-300780',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.013/pb
-          '300785-300785',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.052/pb
-          '300806-300806',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
-          '300811-300812',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.01/pb
-          '300816-300817',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v11, 0.022/pb
-          '301046-301046',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
-          '301141-301142',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.012/pb
-          '301161-301161',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.008/pb
-          '301165-301165',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301179-301180',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
-          '301183-301183',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301281-301281',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
-          '301283-301283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.009/pb
-          '301298-301298',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
-          '301323-301323',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.006/pb
-          '301330-301330',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301359-301359',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301384-301384',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
-          '301391-301393',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
-          '301396-301399',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.011/pb
-          '301417-301417',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301447-301450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.013/pb
-          '301461-301461',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
-          '301472-301472',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
-          '301475-301476',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.012/pb
-          '301519-301519',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
-          '301524-301524',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301529-301532',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.015/pb
-          '301567-301567',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.002/pb
-          '301627-301627',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
-          '301664-301665',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
-          '301694-301694',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
-          '301912-301914',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
-          '301941-301941',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.003/pb
-          '301959-301960',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.021/pb
-          '301970-301970',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.001/pb
-          '301984-301987',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.023/pb
-          '301997-301998',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.021/pb
-          '302019-302019',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
-          '302026-302026',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.0/pb
-          '302029-302029',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
-          '302031-302031',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.01/pb
-          '302033-302034',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
-          '302037-302038',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.0/pb
-          '302040-302043',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.013/pb
-          '302131-302131',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.012/pb
-          '302159-302159',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
-          '302163-302163',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
-          '302165-302166',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
-          '302225-302225',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.011/pb
-          '302228-302229',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.009/pb
-          '302240-302240',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.013/pb
-          '302262-302263',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.023/pb
-          '302277-302277',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
-          '302279-302280',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
-          '302322-302322',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.012/pb
-          '302328-302328',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.009/pb
-          '302337-302337',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.001/pb
-          '302342-302344',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.008/pb
-          '302350-302350',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.002/pb
-          '302388-302388',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.008/pb
-          '302392-302393',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
-          '302448-302448',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.026/pb
-          '302472-302476',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.022/pb
-          '302479-302479',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
-          '302484-302485',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.014/pb
-          '302492-302494',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v13, 0.152/pb
-          '302509-302509',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302513-302513',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '302522-302523',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '302525-302526',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.016/pb
-          '302548-302548',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '302551-302551',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302553-302555',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '302563-302563',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302565-302565',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302572-302573',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.02/pb
-          '302596-302597',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
-          '302634-302635',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.024/pb
-          '302651-302651',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '302654-302654',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '302661-302661',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '302663-302663',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.012/pb
-          '303825-303825',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '303832-303832',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.024/pb
-          '303838-303838',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.026/pb
-          '303885-303885',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
-          '303948-303948',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
-          '303998-304000',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.013/pb
-          '304062-304062',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.026/pb
-          '304119-304120',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
-          '304125-304125',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.024/pb
-          '304144-304144',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.034/pb
-          '304158-304158',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.029/pb
-          '304169-304170',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.049/pb
-          '304199-304200',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '304204-304204',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
-          '304209-304209',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
-          '304291-304292',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
-          '304333-304333',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.019/pb
-          '304354-304354',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '304366-304366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.022/pb
-          '304446-304447',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.022/pb
-          '304451-304451',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '304505-304508',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.023/pb
-          '304562-304562',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.013/pb
-          '304616-304616',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.011/pb
-          '304625-304626',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '304654-304655',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
-          '304661-304663',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.011/pb
-          '304671-304672',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
-          '304737-304740',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
-          '304776-304778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.022/pb
-          '304797-304797',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.037/pb
-          '305044-305046',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.028/pb
-          '305059-305059',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '305062-305064',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
-          '305081-305081',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.011/pb
-          '305112-305114',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
-          '305178-305184',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
-          '305186-305186',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '305188-305188',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.032/pb
-          '305202-305202',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
-          '305204-305204',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.016/pb
-          '305207-305208',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.015/pb
-          '305234-305234',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '305236-305237',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
-          '305247-305248',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.015/pb
-          '305252-305252',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.007/pb
-          '305282-305282',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '305310-305314',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.023/pb
-          '305336-305336',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '305338-305338',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '305341-305341',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
-          '305349-305351',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.012/pb
-          '305358-305358',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '305364-305366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.026/pb
-          '305376-305377',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.019/pb
-          '305405-305406',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.059/pb
-          '305440-305441',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
-          '305516-305518',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.054/pb
-          '305586-305586',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
-          '305589-305590',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.072/pb
-          '305636-305636',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.074/pb
-          '305766-305766',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.01/pb
-          '305809-305809',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '305814-305814',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.056/pb
-          '305821-305821',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.007/pb
-          '305832-305832',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '305840-305840',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.044/pb
-          '305842-305842',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.038/pb
-          '305862-305862',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
-          '305898-305898',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
-          '305902-305902',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '305967-305967',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '306029-306030',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.001/pb
-          '306036-306038',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.001/pb
-          '306041-306042',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.012/pb
-          '306048-306049',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.021/pb
-          '306051-306051',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.017/pb
-          '306091-306092',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.036/pb
-          '306095-306095',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.013/pb
-          '306121-306122',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.002/pb
-          '306125-306126',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.129/pb
-          '306134-306135',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.019/pb
-          '306138-306139',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.115/pb
-          '306153-306155',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.093/pb
-          '306169-306171',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v15, 0.068/pb
-          '306418-306420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
-          '306422-306423',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
-          '306432-306432',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
-          '306454-306460',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.133/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Ele17_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(25.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(17.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(1167), # L=35.593/pb; present in C, D, E, F, missing in B; prescale factor 1166.8 (1181.3 from delivery)
-        trigger_type = cms.string('1e'),
-        run_ranges = cms.vstring(*(
-          '299368-299370',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.184/pb
-          '299380-299381',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.015/pb
-          '299394-299396',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.015/pb
-          '299420-299420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.003/pb
-          '299443-299443',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.001/pb
-          '299450-299450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.003/pb
-          '299477-299481',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.417/pb
-          '299593-299595',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.25/pb
-          '299597-299597',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.095/pb
-          '299649-299649',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v8, 0.011/pb
-          '300087-300087',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.014/pb
-          '300105-300107',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
-          '300117-300117',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.002/pb
-          '300122-300123',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.336/pb
-          '300155-300157',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.424/pb
-          '300226-300226',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.027/pb
-          '300233-300240',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.36/pb
-          '300280-300284',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.244/pb
-          '300364-300375',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.032/pb
-          '300389-300401',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.327/pb
-          '300459-300459',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.02/pb
-          '300461-300464',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.124/pb
-          '300466-300467',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.225/pb
-          '300497-300497',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.007/pb
-          '300514-300517',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.291/pb
-          '300558-300558',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.132/pb
-          '300560-300560',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.156/pb
-          '300574-300576',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.284/pb
-          '300631-300633',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.076/pb
-          '300635-300636',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.347/pb
-          '300673-300676',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.006/pb
-          '300742-300742',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.021/pb
-          '300777-300777',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.06/pb
-          '300780-300780',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.088/pb
-          '300785-300785',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.236/pb
-          '300806-300806',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.009/pb
-          '300811-300812',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.051/pb
-          '300816-300817',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v9, 0.149/pb
-          '301046-301046',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.016/pb
-          '301141-301142',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.177/pb
-          '301161-301161',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.149/pb
-          '301165-301165',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.029/pb
-          '301179-301180',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.019/pb
-          '301183-301183',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.055/pb
-          '301281-301281',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.023/pb
-          '301283-301283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.175/pb
-          '301298-301298',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.159/pb
-          '301323-301323',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.174/pb
-          '301330-301330',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.059/pb
-          '301359-301359',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.052/pb
-          '301384-301384',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.086/pb
-          '301391-301393',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.152/pb
-          '301396-301399',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.179/pb
-          '301417-301417',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.062/pb
-          '301447-301450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.259/pb
-          '301461-301461',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.097/pb
-          '301472-301472',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.143/pb
-          '301475-301476',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.192/pb
-          '301519-301519',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.033/pb
-          '301524-301524',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.05/pb
-          '301529-301532',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.231/pb
-          '301567-301567',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.063/pb
-          '301627-301627',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.15/pb
-          '301664-301665',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.16/pb
-          '301694-301694',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.01/pb
-          '301912-301914',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.097/pb
-          '301941-301941',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.091/pb
-          '301959-301960',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.404/pb
-          '301970-301970',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.02/pb
-          '301984-301987',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.428/pb
-          '301997-301998',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.406/pb
-          '302019-302019',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v10, 0.008/pb
-          '302026-302026',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.004/pb
-          '302029-302029',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.014/pb
-          '302031-302031',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.151/pb
-          '302033-302034',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.01/pb
-          '302037-302038',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.0/pb
-          '302040-302043',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.197/pb
-          '302131-302131',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.182/pb
-          '302159-302159',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
-          '302163-302163',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.233/pb
-          '302165-302166',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.016/pb
-          '302225-302225',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.167/pb
-          '302228-302229',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.128/pb
-          '302240-302240',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.194/pb
-          '302262-302263',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.335/pb
-          '302277-302277',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.066/pb
-          '302279-302280',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.064/pb
-          '302322-302322',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.173/pb
-          '302328-302328',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.13/pb
-          '302337-302337',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
-          '302342-302344',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.111/pb
-          '302350-302350',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.031/pb
-          '302388-302388',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.122/pb
-          '302392-302393',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.232/pb
-          '302448-302448',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.373/pb
-          '302472-302476',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.323/pb
-          '302479-302479',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.061/pb
-          '302484-302485',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.208/pb
-          '302492-302494',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v11, 0.293/pb
-          '302509-302509',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.004/pb
-          '302513-302513',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.009/pb
-          '302522-302523',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.01/pb
-          '302525-302526',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.234/pb
-          '302548-302548',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.014/pb
-          '302551-302551',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
-          '302553-302555',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.035/pb
-          '302563-302563',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
-          '302565-302565',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.0/pb
-          '302572-302573',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.292/pb
-          '302596-302597',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.389/pb
-          '302634-302635',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.353/pb
-          '302651-302651',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.027/pb
-          '302654-302654',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.058/pb
-          '302661-302661',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.009/pb
-          '302663-302663',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.181/pb
-          '303825-303825',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.036/pb
-          '303832-303832',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.349/pb
-          '303838-303838',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.374/pb
-          '303885-303885',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.362/pb
-          '303948-303948',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.301/pb
-          '303998-304000',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.196/pb
-          '304062-304062',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.381/pb
-          '304119-304120',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.049/pb
-          '304125-304125',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.353/pb
-          '304144-304144',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.491/pb
-          '304158-304158',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.425/pb
-          '304169-304170',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.708/pb
-          '304199-304200',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.059/pb
-          '304204-304204',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.093/pb
-          '304209-304209',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.065/pb
-          '304291-304292',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.31/pb
-          '304333-304333',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.271/pb
-          '304354-304354',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.025/pb
-          '304366-304366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.312/pb
-          '304446-304447',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.323/pb
-          '304451-304451',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.014/pb
-          '304505-304508',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.328/pb
-          '304562-304562',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.182/pb
-          '304616-304616',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.151/pb
-          '304625-304626',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.054/pb
-          '304654-304655',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.307/pb
-          '304661-304663',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.158/pb
-          '304671-304672',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.194/pb
-          '304737-304740',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.387/pb
-          '304776-304778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.314/pb
-          '304797-304797',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.542/pb
-          '305044-305046',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.409/pb
-          '305059-305059',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.059/pb
-          '305062-305064',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.395/pb
-          '305081-305081',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.16/pb
-          '305112-305114',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.357/pb
-          '305178-305184',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.037/pb
-          '305186-305186',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.058/pb
-          '305188-305188',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.463/pb
-          '305202-305202',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.08/pb
-          '305204-305204',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.229/pb
-          '305207-305208',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.219/pb
-          '305234-305234',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.005/pb
-          '305236-305237',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.198/pb
-          '305247-305248',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.219/pb
-          '305252-305252',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.104/pb
-          '305282-305282',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.019/pb
-          '305310-305314',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.335/pb
-          '305336-305336',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.025/pb
-          '305338-305338',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.012/pb
-          '305341-305341',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.064/pb
-          '305349-305351',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.179/pb
-          '305358-305358',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.018/pb
-          '305364-305366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.382/pb
-          '305376-305377',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.275/pb
-          '305405-305406',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.438/pb
-          '305440-305441',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.044/pb
-          '305516-305518',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.401/pb
-          '305586-305586',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.064/pb
-          '305589-305590',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.478/pb
-          '305636-305636',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.54/pb
-          '305766-305766',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.118/pb
-          '305809-305809',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.017/pb
-          '305814-305814',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.421/pb
-          '305821-305821',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.097/pb
-          '305832-305832',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.021/pb
-          '305840-305840',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.299/pb
-          '305842-305842',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.249/pb
-          '305862-305862',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.076/pb
-          '305898-305898',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.089/pb
-          '305902-305902',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.057/pb
-          '305967-305967',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v12, 0.004/pb
-          '306029-306030',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
-          '306036-306038',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.021/pb
-          '306041-306042',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.114/pb
-          '306048-306049',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.134/pb
-          '306051-306051',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.115/pb
-          '306091-306092',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.257/pb
-          '306095-306095',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.087/pb
-          '306121-306122',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.026/pb
-          '306125-306126',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.891/pb
-          '306134-306135',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.184/pb
-          '306138-306139',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.768/pb
-          '306153-306155',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.659/pb
-          '306169-306171',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v13, 0.464/pb
-          '306418-306420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
-          '306422-306423',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.09/pb
-          '306432-306432',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.056/pb
-          '306454-306460',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.924/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Ele23_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(23.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(1087), # L=38.216/pb; present in C, D, E, F, missing in B; prescale factor 1086.7 (1101.5 from delivery)
-        trigger_type = cms.string('1e'),
-        run_ranges = cms.vstring(*(
-          '299368-299370',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.184/pb
-          '299380-299381',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.015/pb
-          '299394-299396',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.015/pb
-          '299420-299420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
-          '299443-299443',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.001/pb
-          '299450-299450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.003/pb
-          '299477-299481',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.417/pb
-          '299593-299595',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.25/pb
-          '299597-299597',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.095/pb
-          '299649-299649',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v10, 0.011/pb
-          '300087-300087',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.014/pb
-          '300105-300107',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.009/pb
-          '300117-300117',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.002/pb
-          '300122-300123',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.336/pb
-          '300155-300157',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.424/pb
-          '300226-300226',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.027/pb
-          '300233-300240',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.36/pb
-          '300280-300284',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.244/pb
-          '300364-300375',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.032/pb
-          '300389-300401',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.327/pb
-          '300459-300459',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.02/pb
-          '300461-300464',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.124/pb
-          '300466-300467',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.225/pb
-          '300497-300497',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.007/pb
-          '300514-300517',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.291/pb
-          '300558-300558',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.132/pb
-          '300560-300560',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.156/pb
-          '300574-300576',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.284/pb
-          '300631-300633',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.076/pb
-          '300635-300636',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.347/pb
-          '300673-300676',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.006/pb
-          '300742-300742',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.021/pb
-          '300777-300777',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.06/pb
-          '300780-300780',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.088/pb
-          '300785-300785',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.236/pb
-          '300806-300806',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.009/pb
-          '300811-300812',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.051/pb
-          '300816-300817',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v11, 0.149/pb
-          '301046-301046',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.016/pb
-          '301141-301142',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.177/pb
-          '301161-301161',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.149/pb
-          '301165-301165',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.029/pb
-          '301179-301180',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.019/pb
-          '301183-301183',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.055/pb
-          '301281-301281',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.023/pb
-          '301283-301283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.175/pb
-          '301298-301298',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.159/pb
-          '301323-301323',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.174/pb
-          '301330-301330',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.059/pb
-          '301359-301359',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.052/pb
-          '301384-301384',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.086/pb
-          '301391-301393',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.152/pb
-          '301396-301399',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.179/pb
-          '301417-301417',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.062/pb
-          '301447-301450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.259/pb
-          '301461-301461',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.097/pb
-          '301472-301472',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.143/pb
-          '301475-301476',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.192/pb
-          '301519-301519',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.033/pb
-          '301524-301524',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.05/pb
-          '301529-301532',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.231/pb
-          '301567-301567',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.063/pb
-          '301627-301627',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.15/pb
-          '301664-301665',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.16/pb
-          '301694-301694',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.01/pb
-          '301912-301914',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.097/pb
-          '301941-301941',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.091/pb
-          '301959-301960',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.404/pb
-          '301970-301970',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.02/pb
-          '301984-301987',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.428/pb
-          '301997-301998',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.406/pb
-          '302019-302019',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v12, 0.008/pb
-          '302026-302026',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.004/pb
-          '302029-302029',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.014/pb
-          '302031-302031',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.151/pb
-          '302033-302034',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.01/pb
-          '302037-302038',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.0/pb
-          '302040-302043',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.197/pb
-          '302131-302131',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.182/pb
-          '302159-302159',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.02/pb
-          '302163-302163',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.233/pb
-          '302165-302166',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.016/pb
-          '302225-302225',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.167/pb
-          '302228-302229',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.128/pb
-          '302240-302240',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.194/pb
-          '302262-302263',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.335/pb
-          '302277-302277',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.066/pb
-          '302279-302280',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.064/pb
-          '302322-302322',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.173/pb
-          '302328-302328',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.13/pb
-          '302337-302337',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.02/pb
-          '302342-302344',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.111/pb
-          '302350-302350',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.031/pb
-          '302388-302388',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.122/pb
-          '302392-302393',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.232/pb
-          '302448-302448',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.373/pb
-          '302472-302476',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.323/pb
-          '302479-302479',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.061/pb
-          '302484-302485',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.208/pb
-          '302492-302494',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v13, 0.293/pb
-          '302509-302509',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '302513-302513',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
-          '302522-302523',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.01/pb
-          '302525-302526',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.234/pb
-          '302548-302548',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
-          '302551-302551',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302553-302555',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.035/pb
-          '302563-302563',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302565-302565',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '302572-302573',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.292/pb
-          '302596-302597',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.389/pb
-          '302634-302635',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.353/pb
-          '302651-302651',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.027/pb
-          '302654-302654',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.058/pb
-          '302661-302661',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
-          '302663-302663',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.181/pb
-          '303825-303825',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.036/pb
-          '303832-303832',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.349/pb
-          '303838-303838',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.374/pb
-          '303885-303885',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.362/pb
-          '303948-303948',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.301/pb
-          '303998-304000',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.196/pb
-          '304062-304062',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.381/pb
-          '304119-304120',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.049/pb
-          '304125-304125',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.353/pb
-          '304144-304144',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.491/pb
-          '304158-304158',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.425/pb
-          '304169-304170',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.708/pb
-          '304199-304200',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.059/pb
-          '304204-304204',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.093/pb
-          '304209-304209',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.065/pb
-          '304291-304292',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.31/pb
-          '304333-304333',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.271/pb
-          '304354-304354',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
-          '304366-304366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.312/pb
-          '304446-304447',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.323/pb
-          '304451-304451',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
-          '304505-304508',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.328/pb
-          '304562-304562',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.182/pb
-          '304616-304616',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.151/pb
-          '304625-304626',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.054/pb
-          '304654-304655',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.307/pb
-          '304661-304663',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.158/pb
-          '304671-304672',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.194/pb
-          '304737-304740',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.387/pb
-          '304776-304778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.314/pb
-          '304797-304797',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.542/pb
-          '305044-305046',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.409/pb
-          '305059-305059',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.059/pb
-          '305062-305064',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.395/pb
-          '305081-305081',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.16/pb
-          '305112-305114',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.357/pb
-          '305178-305184',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.037/pb
-          '305186-305186',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.058/pb
-          '305188-305188',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.463/pb
-          '305202-305202',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.08/pb
-          '305204-305204',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.229/pb
-          '305207-305208',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.219/pb
-          '305234-305234',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
-          '305236-305237',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.198/pb
-          '305247-305248',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.219/pb
-          '305252-305252',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.104/pb
-          '305282-305282',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.019/pb
-          '305310-305314',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.335/pb
-          '305336-305336',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.025/pb
-          '305338-305338',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.012/pb
-          '305341-305341',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.064/pb
-          '305349-305351',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.179/pb
-          '305358-305358',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.018/pb
-          '305364-305366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.382/pb
-          '305376-305377',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.275/pb
-          '305405-305406',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.572/pb
-          '305440-305441',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.044/pb
-          '305516-305518',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.523/pb
-          '305586-305586',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.064/pb
-          '305589-305590',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.662/pb
-          '305636-305636',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.71/pb
-          '305766-305766',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.127/pb
-          '305809-305809',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.017/pb
-          '305814-305814',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.55/pb
-          '305821-305821',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.097/pb
-          '305832-305832',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.021/pb
-          '305840-305840',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.409/pb
-          '305842-305842',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.342/pb
-          '305862-305862',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.076/pb
-          '305898-305898',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.089/pb
-          '305902-305902',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.057/pb
-          '305967-305967',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '306029-306030',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.016/pb
-          '306036-306038',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.021/pb
-          '306041-306042',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.136/pb
-          '306048-306049',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.184/pb
-          '306051-306051',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.159/pb
-          '306091-306092',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.338/pb
-          '306095-306095',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.12/pb
-          '306121-306122',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.026/pb
-          '306125-306126',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 1.208/pb
-          '306134-306135',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.219/pb
-          '306138-306139',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 1.069/pb
-          '306153-306155',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.875/pb
-          '306169-306171',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v15, 0.657/pb
-          '306418-306420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.027/pb
-          '306422-306423',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.117/pb
-          '306432-306432',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.078/pb
-          '306454-306460',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 1.252/pb
-        )),
-      ),
-    ),
-  },
-  '2018' : {
-    'mu' : cms.VPSet(
-      cms.PSet(
-        path = cms.string("HLT_Mu3_PFJet40"),
-        cone_minPt = cms.double(10.),
-        cone_maxPt = cms.double(32.),
-        minRecoPt = cms.double(-1.),
-        jet_minPt = cms.double(45.),
-        average_prescale = cms.double(22160), # L=2.695/pb; present in all eras; prescale factor 22160.5 (22182.4 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315259-315259',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315264-315265',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315267-315267',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315270-315270',  # HLT_Mu3_PFJet40_v14, 0.002/pb
-          '315322-315322',  # HLT_Mu3_PFJet40_v14, 0.004/pb
-          '315339-315339',  # HLT_Mu3_PFJet40_v14, 0.002/pb
-          '315357-315357',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315361-315361',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315363-315363',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315366-315366',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315420-315420',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315488-315490',  # HLT_Mu3_PFJet40_v14, 0.007/pb
-          '315506-315506',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315510-315510',  # HLT_Mu3_PFJet40_v14, 0.003/pb
-          '315512-315512',  # HLT_Mu3_PFJet40_v14, 0.007/pb
-          '315543-315543',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315555-315557',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315640-315642',  # HLT_Mu3_PFJet40_v14, 0.0/pb
-          '315644-315648',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315689-315690',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315702-315705',  # HLT_Mu3_PFJet40_v14, 0.01/pb
-          '315713-315713',  # HLT_Mu3_PFJet40_v14, 0.011/pb
-          '315721-315721',  # HLT_Mu3_PFJet40_v14, 0.006/pb
-          '315741-315741',  # HLT_Mu3_PFJet40_v14, 0.001/pb
-          '315764-315764',  # HLT_Mu3_PFJet40_v14, 0.003/pb
-          '315770-315770',  # HLT_Mu3_PFJet40_v14, 0.004/pb
-          '315784-315786',  # HLT_Mu3_PFJet40_v14, 0.005/pb
-          '315790-315790',  # HLT_Mu3_PFJet40_v14, 0.005/pb
-          '315800-315801',  # HLT_Mu3_PFJet40_v14, 0.009/pb
-          '315840-315840',  # HLT_Mu3_PFJet40_v14, 0.011/pb
-          '315973-315974',  # HLT_Mu3_PFJet40_v14/HLT_Mu3_PFJet40_v15, 0.009/pb
-          '316058-316062',  # HLT_Mu3_PFJet40_v15, 0.016/pb
-          '316082-316082',  # HLT_Mu3_PFJet40_v15, 0.004/pb
-          '316110-316111',  # HLT_Mu3_PFJet40_v15, 0.0/pb
-          '316113-316114',  # HLT_Mu3_PFJet40_v15, 0.001/pb
-          '316153-316153',  # HLT_Mu3_PFJet40_v15, 0.008/pb
-          '316186-316187',  # HLT_Mu3_PFJet40_v15, 0.016/pb
-          '316199-316202',  # HLT_Mu3_PFJet40_v15, 0.018/pb
-          '316216-316219',  # HLT_Mu3_PFJet40_v15, 0.017/pb
-          '316239-316241',  # HLT_Mu3_PFJet40_v15, 0.017/pb
-          '316271-316271',  # HLT_Mu3_PFJet40_v15, 0.001/pb
-          '316361-316363',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '316377-316380',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '316455-316455',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '316457-316457',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '316469-316470',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '316472-316472',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '316505-316505',  # HLT_Mu3_PFJet40_v16, 0.012/pb
-          '316569-316569',  # HLT_Mu3_PFJet40_v16, 0.015/pb
-          '316590-316590',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '316613-316613',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '316615-316615',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '316666-316667',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316700-316702',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316715-316723',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316758-316758',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316766-316766',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316876-316877',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '316879-316879',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316928-316928',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '316985-316985',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '316993-316995',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '317080-317080',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '317087-317087',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '317089-317089',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '317182-317182',  # HLT_Mu3_PFJet40_v16, 0.037/pb
-          '317212-317213',  # HLT_Mu3_PFJet40_v16, 0.016/pb
-          '317279-317279',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '317291-317292',  # HLT_Mu3_PFJet40_v16, 0.033/pb
-          '317297-317297',  # HLT_Mu3_PFJet40_v16, 0.011/pb
-          '317319-317320',  # HLT_Mu3_PFJet40_v16, 0.047/pb
-          '317338-317340',  # HLT_Mu3_PFJet40_v16, 0.02/pb
-          '317382-317383',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '317391-317392',  # HLT_Mu3_PFJet40_v16, 0.045/pb
-          '317435-317435',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '317438-317438',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '317475-317475',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '317478-317478',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '317484-317484',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '317488-317488',  # HLT_Mu3_PFJet40_v16, 0.016/pb
-          '317527-317527',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '317591-317591',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '317626-317626',  # HLT_Mu3_PFJet40_v16, 0.048/pb
-          '317640-317641',  # HLT_Mu3_PFJet40_v16, 0.048/pb
-          '317648-317650',  # HLT_Mu3_PFJet40_v16, 0.044/pb
-          '317661-317661',  # HLT_Mu3_PFJet40_v16, 0.034/pb
-          '317663-317663',  # HLT_Mu3_PFJet40_v16, 0.014/pb
-          '317683-317683',  # HLT_Mu3_PFJet40_v16, 0.011/pb
-          '317696-317696',  # HLT_Mu3_PFJet40_v16, 0.021/pb
-          '318733-318733',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '318828-318828',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '318872-318872',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '318874-318874',  # HLT_Mu3_PFJet40_v16, 0.009/pb
-          '318876-318877',  # HLT_Mu3_PFJet40_v16, 0.019/pb
-          '319077-319077',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '319337-319337',  # HLT_Mu3_PFJet40_v16, 0.021/pb
-          '319347-319349',  # HLT_Mu3_PFJet40_v16, 0.023/pb
-          '319449-319450',  # HLT_Mu3_PFJet40_v16, 0.041/pb
-          '319456-319456',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '319459-319459',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '319486-319486',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '319503-319503',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '319524-319524',  # HLT_Mu3_PFJet40_v16, 0.042/pb
-          '319526-319526',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '319528-319528',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '319579-319579',  # HLT_Mu3_PFJet40_v16, 0.074/pb
-          '319625-319625',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '319639-319639',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '319656-319659',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '319678-319678',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '319687-319687',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '319697-319698',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '319756-319756',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '319840-319841',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '319847-319849',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '319851-319851',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '319853-319854',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '319908-319910',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '319912-319915',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '319941-319942',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '319950-319950',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '319991-319993',  # HLT_Mu3_PFJet40_v16, 0.048/pb
-          '320002-320002',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '320006-320006',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '320010-320012',  # HLT_Mu3_PFJet40_v16, 0.014/pb
-          '320023-320026',  # HLT_Mu3_PFJet40_v16, 0.028/pb
-          '320038-320040',  # HLT_Mu3_PFJet40_v16, 0.037/pb
-          '320059-320065',  # HLT_Mu3_PFJet40_v16, 0.036/pb
-          '320673-320674',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '320688-320688',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '320712-320712',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '320757-320757',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '320804-320804',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '320807-320807',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '320809-320809',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '320821-320824',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '320838-320838',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '320840-320841',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '320853-320859',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '320887-320888',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '320916-320917',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '320920-320920',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '320933-320934',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '320936-320936',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '320941-320941',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '320980-320980',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '320995-320996',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321004-321007',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '321009-321012',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321051-321051',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '321055-321055',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321067-321069',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '321119-321119',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321121-321122',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321124-321124',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '321126-321126',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321134-321134',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '321138-321138',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321140-321140',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321149-321149',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '321165-321167',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '321177-321178',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '321218-321219',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '321221-321221',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '321230-321233',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '321262-321262',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '321283-321283',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321294-321296',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '321305-321305',  # HLT_Mu3_PFJet40_v16, 0.009/pb
-          '321311-321313',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321393-321393',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321396-321397',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '321414-321415',  # HLT_Mu3_PFJet40_v16, 0.048/pb
-          '321431-321434',  # HLT_Mu3_PFJet40_v16, 0.027/pb
-          '321436-321436',  # HLT_Mu3_PFJet40_v16, 0.013/pb
-          '321457-321457',  # HLT_Mu3_PFJet40_v16, 0.044/pb
-          '321461-321461',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321475-321475',  # HLT_Mu3_PFJet40_v16, 0.043/pb
-          '321710-321710',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321712-321712',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321730-321730',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321732-321732',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '321735-321735',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '321755-321755',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '321758-321758',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321760-321760',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321773-321778',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '321780-321781',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '321813-321813',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321815-321815',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '321817-321818',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '321820-321820',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '321831-321834',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '321879-321880',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321887-321887',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '321908-321909',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '321917-321917',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '321919-321919',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '321933-321933',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321960-321961',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321973-321973',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '321975-321975',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '321988-321988',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '321990-321990',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '322013-322014',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '322022-322022',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '322040-322040',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '322057-322057',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '322068-322068',  # HLT_Mu3_PFJet40_v16, 0.021/pb
-          '322079-322079',  # HLT_Mu3_PFJet40_v16, 0.013/pb
-          '322106-322106',  # HLT_Mu3_PFJet40_v16, 0.026/pb
-          '322113-322113',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '322118-322118',  # HLT_Mu3_PFJet40_v16, 0.024/pb
-          '322179-322179',  # HLT_Mu3_PFJet40_v16, 0.043/pb
-          '322201-322201',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '322204-322204',  # HLT_Mu3_PFJet40_v16, 0.028/pb
-          '322222-322222',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '322252-322252',  # HLT_Mu3_PFJet40_v16, 0.038/pb
-          '322317-322317',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '322319-322319',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '322322-322322',  # HLT_Mu3_PFJet40_v16, 0.027/pb
-          '322324-322324',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '322332-322332',  # HLT_Mu3_PFJet40_v16, 0.029/pb
-          '322348-322348',  # HLT_Mu3_PFJet40_v16, 0.038/pb
-          '322355-322356',  # HLT_Mu3_PFJet40_v16, 0.024/pb
-          '322381-322381',  # HLT_Mu3_PFJet40_v16, 0.016/pb
-          '322407-322407',  # HLT_Mu3_PFJet40_v16, 0.015/pb
-          '322430-322431',  # HLT_Mu3_PFJet40_v16, 0.034/pb
-          '322480-322480',  # HLT_Mu3_PFJet40_v16, 0.01/pb
-          '322492-322492',  # HLT_Mu3_PFJet40_v16, 0.026/pb
-          '322510-322510',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '322599-322599',  # HLT_Mu3_PFJet40_v16, 0.009/pb
-          '322602-322603',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '322605-322605',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '322617-322617',  # HLT_Mu3_PFJet40_v16, 0.012/pb
-          '322625-322625',  # HLT_Mu3_PFJet40_v16, 0.03/pb
-          '322633-322633',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '323414-323414',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '323423-323423',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '323470-323475',  # HLT_Mu3_PFJet40_v16, 0.029/pb
-          '323487-323488',  # HLT_Mu3_PFJet40_v16, 0.031/pb
-          '323492-323493',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '323495-323495',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '323524-323526',  # HLT_Mu3_PFJet40_v16, 0.044/pb
-          '323693-323693',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '323696-323696',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '323702-323702',  # HLT_Mu3_PFJet40_v16, 0.013/pb
-          '323725-323727',  # HLT_Mu3_PFJet40_v16, 0.035/pb
-          '323755-323755',  # HLT_Mu3_PFJet40_v16, 0.027/pb
-          '323775-323775',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '323778-323778',  # HLT_Mu3_PFJet40_v16, 0.025/pb
-          '323790-323790',  # HLT_Mu3_PFJet40_v16, 0.025/pb
-          '323794-323794',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '323841-323841',  # HLT_Mu3_PFJet40_v16, 0.014/pb
-          '323857-323857',  # HLT_Mu3_PFJet40_v16, 0.009/pb
-          '323940-323940',  # HLT_Mu3_PFJet40_v16, 0.039/pb
-          '323954-323954',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '323976-323976',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '323978-323978',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '323980-323980',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '323983-323983',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '323997-323997',  # HLT_Mu3_PFJet40_v16, 0.012/pb
-          '324021-324022',  # HLT_Mu3_PFJet40_v16, 0.035/pb
-          '324077-324077',  # HLT_Mu3_PFJet40_v16, 0.022/pb
-          '324201-324202',  # HLT_Mu3_PFJet40_v16, 0.009/pb
-          '324205-324207',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324209-324209',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '324237-324237',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324245-324245',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '324293-324293',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '324315-324315',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324318-324318',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '324420-324420',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '324729-324729',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '324747-324747',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '324764-324765',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '324769-324769',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324772-324772',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '324785-324785',  # HLT_Mu3_PFJet40_v16, 0.003/pb
-          '324791-324791',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '324835-324835',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324840-324841',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '324846-324846',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324878-324878',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '324897-324897',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '324970-324970',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '324980-324980',  # HLT_Mu3_PFJet40_v16, 0.008/pb
-          '324997-325001',  # HLT_Mu3_PFJet40_v16, 0.006/pb
-          '325022-325022',  # HLT_Mu3_PFJet40_v16, 0.007/pb
-          '325057-325057',  # HLT_Mu3_PFJet40_v16, 0.002/pb
-          '325097-325101',  # HLT_Mu3_PFJet40_v16, 0.005/pb
-          '325110-325110',  # HLT_Mu3_PFJet40_v16, 0.0/pb
-          '325117-325117',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '325159-325159',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-          '325168-325170',  # HLT_Mu3_PFJet40_v16, 0.004/pb
-          '325172-325172',  # HLT_Mu3_PFJet40_v16, 0.001/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu8"),
-        cone_minPt = cms.double(15.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(8.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(6990), # L=8.546/pb; present in all eras; prescale factor 6990.5 (6981.9 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Mu8_v11, 0.0/pb
-          '315259-315259',  # HLT_Mu8_v11, 0.0/pb
-          '315264-315265',  # HLT_Mu8_v11, 0.001/pb
-          '315267-315267',  # HLT_Mu8_v11, 0.001/pb
-          '315270-315270',  # HLT_Mu8_v11, 0.002/pb
-          '315322-315322',  # HLT_Mu8_v11, 0.005/pb
-          '315339-315339',  # HLT_Mu8_v11, 0.003/pb
-          '315357-315357',  # HLT_Mu8_v11, 0.004/pb
-          '315361-315361',  # HLT_Mu8_v11, 0.003/pb
-          '315363-315363',  # HLT_Mu8_v11, 0.0/pb
-          '315366-315366',  # HLT_Mu8_v11, 0.003/pb
-          '315420-315420',  # HLT_Mu8_v11, 0.007/pb
-          '315488-315490',  # HLT_Mu8_v11, 0.01/pb
-          '315506-315506',  # HLT_Mu8_v11, 0.001/pb
-          '315510-315510',  # HLT_Mu8_v11, 0.004/pb
-          '315512-315512',  # HLT_Mu8_v11, 0.009/pb
-          '315543-315543',  # HLT_Mu8_v11, 0.001/pb
-          '315555-315557',  # HLT_Mu8_v11, 0.004/pb
-          '315640-315642',  # HLT_Mu8_v11, 0.003/pb
-          '315644-315648',  # HLT_Mu8_v11, 0.017/pb
-          '315689-315690',  # HLT_Mu8_v11, 0.017/pb
-          '315702-315705',  # HLT_Mu8_v11, 0.013/pb
-          '315713-315713',  # HLT_Mu8_v11, 0.014/pb
-          '315721-315721',  # HLT_Mu8_v11, 0.008/pb
-          '315741-315741',  # HLT_Mu8_v11, 0.001/pb
-          '315764-315764',  # HLT_Mu8_v11, 0.004/pb
-          '315770-315770',  # HLT_Mu8_v11, 0.005/pb
-          '315784-315786',  # HLT_Mu8_v11, 0.007/pb
-          '315790-315790',  # HLT_Mu8_v11, 0.007/pb
-          '315800-315801',  # HLT_Mu8_v11, 0.012/pb
-          '315840-315840',  # HLT_Mu8_v11, 0.014/pb
-          '315973-315974',  # HLT_Mu8_v11, 0.012/pb
-          '316058-316062',  # HLT_Mu8_v11, 0.024/pb
-          '316082-316082',  # HLT_Mu8_v11, 0.007/pb
-          '316110-316111',  # HLT_Mu8_v11, 0.005/pb
-          '316113-316114',  # HLT_Mu8_v11, 0.018/pb
-          '316153-316153',  # HLT_Mu8_v11, 0.012/pb
-          '316186-316187',  # HLT_Mu8_v11, 0.025/pb
-          '316199-316202',  # HLT_Mu8_v11, 0.027/pb
-          '316216-316219',  # HLT_Mu8_v11, 0.026/pb
-          '316239-316241',  # HLT_Mu8_v11, 0.025/pb
-          '316271-316271',  # HLT_Mu8_v11, 0.001/pb
-          '316361-316363',  # HLT_Mu8_v12, 0.004/pb
-          '316377-316380',  # HLT_Mu8_v12, 0.009/pb
-          '316455-316455',  # HLT_Mu8_v12, 0.0/pb
-          '316457-316457',  # HLT_Mu8_v12, 0.015/pb
-          '316469-316470',  # HLT_Mu8_v12, 0.012/pb
-          '316472-316472',  # HLT_Mu8_v12, 0.003/pb
-          '316505-316505',  # HLT_Mu8_v12, 0.019/pb
-          '316569-316569',  # HLT_Mu8_v12, 0.023/pb
-          '316590-316590',  # HLT_Mu8_v12, 0.009/pb
-          '316613-316613',  # HLT_Mu8_v12, 0.001/pb
-          '316615-316615',  # HLT_Mu8_v12, 0.002/pb
-          '316666-316667',  # HLT_Mu8_v12, 0.015/pb
-          '316700-316702',  # HLT_Mu8_v12, 0.016/pb
-          '316715-316723',  # HLT_Mu8_v12, 0.021/pb
-          '316758-316758',  # HLT_Mu8_v12, 0.021/pb
-          '316766-316766',  # HLT_Mu8_v12, 0.026/pb
-          '316876-316877',  # HLT_Mu8_v12, 0.015/pb
-          '316879-316879',  # HLT_Mu8_v12, 0.002/pb
-          '316928-316928',  # HLT_Mu8_v12, 0.002/pb
-          '316985-316985',  # HLT_Mu8_v12, 0.008/pb
-          '316993-316995',  # HLT_Mu8_v12, 0.012/pb
-          '317080-317080',  # HLT_Mu8_v12, 0.0/pb
-          '317087-317087',  # HLT_Mu8_v12, 0.011/pb
-          '317089-317089',  # HLT_Mu8_v12, 0.01/pb
-          '317182-317182',  # HLT_Mu8_v12, 0.019/pb
-          '317212-317213',  # HLT_Mu8_v12, 0.008/pb
-          '317279-317279',  # HLT_Mu8_v12, 0.003/pb
-          '317291-317292',  # HLT_Mu8_v12, 0.017/pb
-          '317297-317297',  # HLT_Mu8_v12, 0.006/pb
-          '317319-317320',  # HLT_Mu8_v12, 0.024/pb
-          '317338-317340',  # HLT_Mu8_v12, 0.01/pb
-          '317382-317383',  # HLT_Mu8_v12, 0.002/pb
-          '317391-317392',  # HLT_Mu8_v12, 0.023/pb
-          '317435-317435',  # HLT_Mu8_v12, 0.017/pb
-          '317438-317438',  # HLT_Mu8_v12, 0.002/pb
-          '317475-317475',  # HLT_Mu8_v12, 0.001/pb
-          '317478-317478',  # HLT_Mu8_v12, 0.0/pb
-          '317484-317484',  # HLT_Mu8_v12, 0.007/pb
-          '317488-317488',  # HLT_Mu8_v12, 0.008/pb
-          '317527-317527',  # HLT_Mu8_v12, 0.021/pb
-          '317591-317591',  # HLT_Mu8_v12, 0.005/pb
-          '317626-317626',  # HLT_Mu8_v12, 0.025/pb
-          '317640-317641',  # HLT_Mu8_v12, 0.025/pb
-          '317648-317650',  # HLT_Mu8_v12, 0.023/pb
-          '317661-317661',  # HLT_Mu8_v12, 0.018/pb
-          '317663-317663',  # HLT_Mu8_v12, 0.007/pb
-          '317683-317683',  # HLT_Mu8_v12, 0.005/pb
-          '317696-317696',  # HLT_Mu8_v12, 0.011/pb
-          '318733-318733',  # HLT_Mu8_v12, 0.0/pb
-          '318828-318828',  # HLT_Mu8_v12, 0.001/pb
-          '318872-318872',  # HLT_Mu8_v12, 0.004/pb
-          '318874-318874',  # HLT_Mu8_v12, 0.005/pb
-          '318876-318877',  # HLT_Mu8_v12, 0.01/pb
-          '319077-319077',  # HLT_Mu8_v12, 0.001/pb
-          '319337-319337',  # HLT_Mu8_v12, 0.011/pb
-          '319347-319349',  # HLT_Mu8_v12, 0.012/pb
-          '319449-319450',  # HLT_Mu8_v12, 0.021/pb
-          '319456-319456',  # HLT_Mu8_v12, 0.002/pb
-          '319459-319459',  # HLT_Mu8_v12, 0.001/pb
-          '319486-319486',  # HLT_Mu8_v12, 0.001/pb
-          '319503-319503',  # HLT_Mu8_v12, 0.004/pb
-          '319524-319524',  # HLT_Mu8_v12, 0.021/pb
-          '319526-319526',  # HLT_Mu8_v12, 0.003/pb
-          '319528-319528',  # HLT_Mu8_v12, 0.011/pb
-          '319579-319579',  # HLT_Mu8_v12, 0.038/pb
-          '319625-319625',  # HLT_Mu8_v12, 0.011/pb
-          '319639-319639',  # HLT_Mu8_v12, 0.081/pb
-          '319656-319659',  # HLT_Mu8_v12, 0.045/pb
-          '319678-319678',  # HLT_Mu8_v12, 0.017/pb
-          '319687-319687',  # HLT_Mu8_v12, 0.003/pb
-          '319697-319698',  # HLT_Mu8_v12, 0.022/pb
-          '319756-319756',  # HLT_Mu8_v12, 0.104/pb
-          '319840-319841',  # HLT_Mu8_v12, 0.016/pb
-          '319847-319849',  # HLT_Mu8_v12, 0.036/pb
-          '319851-319851',  # HLT_Mu8_v12, 0.0/pb
-          '319853-319854',  # HLT_Mu8_v12, 0.028/pb
-          '319908-319910',  # HLT_Mu8_v12, 0.072/pb
-          '319912-319915',  # HLT_Mu8_v12, 0.027/pb
-          '319941-319942',  # HLT_Mu8_v12, 0.019/pb
-          '319950-319950',  # HLT_Mu8_v12, 0.01/pb
-          '319991-319993',  # HLT_Mu8_v12, 0.109/pb
-          '320002-320002',  # HLT_Mu8_v12, 0.008/pb
-          '320006-320006',  # HLT_Mu8_v12, 0.023/pb
-          '320010-320012',  # HLT_Mu8_v12, 0.034/pb
-          '320023-320026',  # HLT_Mu8_v12, 0.062/pb
-          '320038-320040',  # HLT_Mu8_v12, 0.082/pb
-          '320059-320065',  # HLT_Mu8_v12, 0.083/pb
-          '320673-320674',  # HLT_Mu8_v12, 0.022/pb
-          '320688-320688',  # HLT_Mu8_v12, 0.029/pb
-          '320712-320712',  # HLT_Mu8_v12, 0.013/pb
-          '320757-320757',  # HLT_Mu8_v12, 0.022/pb
-          '320804-320804',  # HLT_Mu8_v12, 0.069/pb
-          '320807-320807',  # HLT_Mu8_v12, 0.002/pb
-          '320809-320809',  # HLT_Mu8_v12, 0.024/pb
-          '320821-320824',  # HLT_Mu8_v12, 0.099/pb
-          '320838-320838',  # HLT_Mu8_v12, 0.017/pb
-          '320840-320841',  # HLT_Mu8_v12, 0.042/pb
-          '320853-320859',  # HLT_Mu8_v12, 0.091/pb
-          '320887-320888',  # HLT_Mu8_v12, 0.019/pb
-          '320916-320917',  # HLT_Mu8_v12, 0.103/pb
-          '320920-320920',  # HLT_Mu8_v12, 0.005/pb
-          '320933-320934',  # HLT_Mu8_v12, 0.058/pb
-          '320936-320936',  # HLT_Mu8_v12, 0.017/pb
-          '320941-320941',  # HLT_Mu8_v12, 0.003/pb
-          '320980-320980',  # HLT_Mu8_v12, 0.006/pb
-          '320995-320996',  # HLT_Mu8_v12, 0.017/pb
-          '321004-321007',  # HLT_Mu8_v12, 0.07/pb
-          '321009-321012',  # HLT_Mu8_v12, 0.024/pb
-          '321051-321051',  # HLT_Mu8_v12, 0.064/pb
-          '321055-321055',  # HLT_Mu8_v12, 0.028/pb
-          '321067-321069',  # HLT_Mu8_v12, 0.079/pb
-          '321119-321119',  # HLT_Mu8_v12, 0.009/pb
-          '321121-321122',  # HLT_Mu8_v12, 0.028/pb
-          '321124-321124',  # HLT_Mu8_v12, 0.041/pb
-          '321126-321126',  # HLT_Mu8_v12, 0.017/pb
-          '321134-321134',  # HLT_Mu8_v12, 0.002/pb
-          '321138-321138',  # HLT_Mu8_v12, 0.032/pb
-          '321140-321140',  # HLT_Mu8_v12, 0.026/pb
-          '321149-321149',  # HLT_Mu8_v12, 0.089/pb
-          '321165-321167',  # HLT_Mu8_v12, 0.058/pb
-          '321177-321178',  # HLT_Mu8_v12, 0.03/pb
-          '321218-321219',  # HLT_Mu8_v12, 0.095/pb
-          '321221-321221',  # HLT_Mu8_v12, 0.001/pb
-          '321230-321233',  # HLT_Mu8_v12, 0.052/pb
-          '321262-321262',  # HLT_Mu8_v12, 0.0/pb
-          '321283-321283',  # HLT_Mu8_v12, 0.019/pb
-          '321294-321296',  # HLT_Mu8_v12, 0.05/pb
-          '321305-321305',  # HLT_Mu8_v12, 0.124/pb
-          '321311-321313',  # HLT_Mu8_v12, 0.019/pb
-          '321393-321393',  # HLT_Mu8_v12, 0.008/pb
-          '321396-321397',  # HLT_Mu8_v12, 0.089/pb
-          '321414-321415',  # HLT_Mu8_v12, 0.106/pb
-          '321431-321434',  # HLT_Mu8_v12, 0.058/pb
-          '321436-321436',  # HLT_Mu8_v12, 0.031/pb
-          '321457-321457',  # HLT_Mu8_v12, 0.098/pb
-          '321461-321461',  # HLT_Mu8_v12, 0.005/pb
-          '321475-321475',  # HLT_Mu8_v12, 0.099/pb
-          '321710-321710',  # HLT_Mu8_v12, 0.003/pb
-          '321712-321712',  # HLT_Mu8_v12, 0.017/pb
-          '321730-321730',  # HLT_Mu8_v12, 0.017/pb
-          '321732-321732',  # HLT_Mu8_v12, 0.076/pb
-          '321735-321735',  # HLT_Mu8_v12, 0.005/pb
-          '321755-321755',  # HLT_Mu8_v12, 0.039/pb
-          '321758-321758',  # HLT_Mu8_v12, 0.008/pb
-          '321760-321760',  # HLT_Mu8_v12, 0.033/pb
-          '321773-321778',  # HLT_Mu8_v12, 0.034/pb
-          '321780-321781',  # HLT_Mu8_v12, 0.041/pb
-          '321813-321813',  # HLT_Mu8_v12, 0.021/pb
-          '321815-321815',  # HLT_Mu8_v12, 0.001/pb
-          '321817-321818',  # HLT_Mu8_v12, 0.064/pb
-          '321820-321820',  # HLT_Mu8_v12, 0.007/pb
-          '321831-321834',  # HLT_Mu8_v12, 0.103/pb
-          '321879-321880',  # HLT_Mu8_v12, 0.027/pb
-          '321887-321887',  # HLT_Mu8_v12, 0.057/pb
-          '321908-321909',  # HLT_Mu8_v12, 0.103/pb
-          '321917-321917',  # HLT_Mu8_v12, 0.052/pb
-          '321919-321919',  # HLT_Mu8_v12, 0.0/pb
-          '321933-321933',  # HLT_Mu8_v12, 0.018/pb
-          '321960-321961',  # HLT_Mu8_v12, 0.024/pb
-          '321973-321973',  # HLT_Mu8_v12, 0.074/pb
-          '321975-321975',  # HLT_Mu8_v12, 0.033/pb
-          '321988-321988',  # HLT_Mu8_v12, 0.079/pb
-          '321990-321990',  # HLT_Mu8_v12, 0.018/pb
-          '322013-322014',  # HLT_Mu8_v12, 0.001/pb
-          '322022-322022',  # HLT_Mu8_v12, 0.096/pb
-          '322040-322040',  # HLT_Mu8_v12, 0.002/pb
-          '322057-322057',  # HLT_Mu8_v12, 0.001/pb
-          '322068-322068',  # HLT_Mu8_v12, 0.044/pb
-          '322079-322079',  # HLT_Mu8_v12, 0.023/pb
-          '322106-322106',  # HLT_Mu8_v12, 0.054/pb
-          '322113-322113',  # HLT_Mu8_v12, 0.006/pb
-          '322118-322118',  # HLT_Mu8_v12, 0.055/pb
-          '322179-322179',  # HLT_Mu8_v12, 0.098/pb
-          '322201-322201',  # HLT_Mu8_v12, 0.013/pb
-          '322204-322204',  # HLT_Mu8_v12, 0.067/pb
-          '322222-322222',  # HLT_Mu8_v12, 0.021/pb
-          '322252-322252',  # HLT_Mu8_v12, 0.088/pb
-          '322317-322317',  # HLT_Mu8_v12, 0.003/pb
-          '322319-322319',  # HLT_Mu8_v12, 0.01/pb
-          '322322-322322',  # HLT_Mu8_v12, 0.064/pb
-          '322324-322324',  # HLT_Mu8_v12, 0.015/pb
-          '322332-322332',  # HLT_Mu8_v12, 0.064/pb
-          '322348-322348',  # HLT_Mu8_v12, 0.086/pb
-          '322355-322356',  # HLT_Mu8_v12, 0.056/pb
-          '322381-322381',  # HLT_Mu8_v12, 0.036/pb
-          '322407-322407',  # HLT_Mu8_v12, 0.036/pb
-          '322430-322431',  # HLT_Mu8_v12, 0.078/pb
-          '322480-322480',  # HLT_Mu8_v12, 0.022/pb
-          '322492-322492',  # HLT_Mu8_v12, 0.064/pb
-          '322510-322510',  # HLT_Mu8_v12, 0.0/pb
-          '322599-322599',  # HLT_Mu8_v12, 0.016/pb
-          '322602-322603',  # HLT_Mu8_v12, 0.005/pb
-          '322605-322605',  # HLT_Mu8_v12, 0.019/pb
-          '322617-322617',  # HLT_Mu8_v12, 0.03/pb
-          '322625-322625',  # HLT_Mu8_v12, 0.069/pb
-          '322633-322633',  # HLT_Mu8_v12, 0.011/pb
-          '323414-323414',  # HLT_Mu8_v12, 0.001/pb
-          '323423-323423',  # HLT_Mu8_v12, 0.005/pb
-          '323470-323475',  # HLT_Mu8_v12, 0.066/pb
-          '323487-323488',  # HLT_Mu8_v12, 0.072/pb
-          '323492-323493',  # HLT_Mu8_v12, 0.007/pb
-          '323495-323495',  # HLT_Mu8_v12, 0.007/pb
-          '323524-323526',  # HLT_Mu8_v12, 0.105/pb
-          '323693-323693',  # HLT_Mu8_v12, 0.007/pb
-          '323696-323696',  # HLT_Mu8_v12, 0.018/pb
-          '323702-323702',  # HLT_Mu8_v12, 0.033/pb
-          '323725-323727',  # HLT_Mu8_v12, 0.079/pb
-          '323755-323755',  # HLT_Mu8_v12, 0.059/pb
-          '323775-323775',  # HLT_Mu8_v12, 0.008/pb
-          '323778-323778',  # HLT_Mu8_v12, 0.059/pb
-          '323790-323790',  # HLT_Mu8_v12, 0.058/pb
-          '323794-323794',  # HLT_Mu8_v12, 0.004/pb
-          '323841-323841',  # HLT_Mu8_v12, 0.031/pb
-          '323857-323857',  # HLT_Mu8_v12, 0.021/pb
-          '323940-323940',  # HLT_Mu8_v12, 0.087/pb
-          '323954-323954',  # HLT_Mu8_v12, 0.003/pb
-          '323976-323976',  # HLT_Mu8_v12, 0.002/pb
-          '323978-323978',  # HLT_Mu8_v12, 0.003/pb
-          '323980-323980',  # HLT_Mu8_v12, 0.013/pb
-          '323983-323983',  # HLT_Mu8_v12, 0.013/pb
-          '323997-323997',  # HLT_Mu8_v12, 0.029/pb
-          '324021-324022',  # HLT_Mu8_v12, 0.077/pb
-          '324077-324077',  # HLT_Mu8_v12, 0.046/pb
-          '324201-324202',  # HLT_Mu8_v12, 0.086/pb
-          '324205-324207',  # HLT_Mu8_v12, 0.01/pb
-          '324209-324209',  # HLT_Mu8_v12, 0.004/pb
-          '324237-324237',  # HLT_Mu8_v12, 0.013/pb
-          '324245-324245',  # HLT_Mu8_v12, 0.09/pb
-          '324293-324293',  # HLT_Mu8_v12, 0.11/pb
-          '324315-324315',  # HLT_Mu8_v12, 0.013/pb
-          '324318-324318',  # HLT_Mu8_v12, 0.022/pb
-          '324420-324420',  # HLT_Mu8_v12, 0.042/pb
-          '324729-324729',  # HLT_Mu8_v12, 0.003/pb
-          '324747-324747',  # HLT_Mu8_v12, 0.064/pb
-          '324764-324765',  # HLT_Mu8_v12, 0.026/pb
-          '324769-324769',  # HLT_Mu8_v12, 0.01/pb
-          '324772-324772',  # HLT_Mu8_v12, 0.004/pb
-          '324785-324785',  # HLT_Mu8_v12, 0.038/pb
-          '324791-324791',  # HLT_Mu8_v12, 0.055/pb
-          '324835-324835',  # HLT_Mu8_v12, 0.015/pb
-          '324840-324841',  # HLT_Mu8_v12, 0.073/pb
-          '324846-324846',  # HLT_Mu8_v12, 0.015/pb
-          '324878-324878',  # HLT_Mu8_v12, 0.088/pb
-          '324897-324897',  # HLT_Mu8_v12, 0.008/pb
-          '324970-324970',  # HLT_Mu8_v12, 0.101/pb
-          '324980-324980',  # HLT_Mu8_v12, 0.109/pb
-          '324997-325001',  # HLT_Mu8_v12, 0.079/pb
-          '325022-325022',  # HLT_Mu8_v12, 0.088/pb
-          '325057-325057',  # HLT_Mu8_v12, 0.022/pb
-          '325097-325101',  # HLT_Mu8_v12, 0.072/pb
-          '325110-325110',  # HLT_Mu8_v12, 0.001/pb
-          '325117-325117',  # HLT_Mu8_v12, 0.019/pb
-          '325159-325159',  # HLT_Mu8_v12, 0.013/pb
-          '325168-325170',  # HLT_Mu8_v12, 0.061/pb
-          '325172-325172',  # HLT_Mu8_v12, 0.015/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu17"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(17.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(1305), # L=45.781/pb; present in all eras; prescale factor 1304.9 (1307.1 from delivery)
-        trigger_type = cms.string('2mu'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Mu17_v11, 0.006/pb
-          '315259-315259',  # HLT_Mu17_v11, 0.011/pb
-          '315264-315265',  # HLT_Mu17_v11, 0.036/pb
-          '315267-315267',  # HLT_Mu17_v11, 0.029/pb
-          '315270-315270',  # HLT_Mu17_v11, 0.061/pb
-          '315322-315322',  # HLT_Mu17_v11, 0.139/pb
-          '315339-315339',  # HLT_Mu17_v11, 0.072/pb
-          '315357-315357',  # HLT_Mu17_v11, 0.117/pb
-          '315361-315361',  # HLT_Mu17_v11, 0.091/pb
-          '315363-315363',  # HLT_Mu17_v11, 0.011/pb
-          '315366-315366',  # HLT_Mu17_v11, 0.077/pb
-          '315420-315420',  # HLT_Mu17_v11, 0.199/pb
-          '315488-315490',  # HLT_Mu17_v11, 0.228/pb
-          '315506-315506',  # HLT_Mu17_v11, 0.022/pb
-          '315510-315510',  # HLT_Mu17_v11, 0.079/pb
-          '315512-315512',  # HLT_Mu17_v11, 0.182/pb
-          '315543-315543',  # HLT_Mu17_v11, 0.028/pb
-          '315555-315557',  # HLT_Mu17_v11, 0.088/pb
-          '315640-315642',  # HLT_Mu17_v11, 0.033/pb
-          '315644-315648',  # HLT_Mu17_v11, 0.338/pb
-          '315689-315690',  # HLT_Mu17_v11, 0.345/pb
-          '315702-315705',  # HLT_Mu17_v11, 0.253/pb
-          '315713-315713',  # HLT_Mu17_v11, 0.272/pb
-          '315721-315721',  # HLT_Mu17_v11, 0.162/pb
-          '315741-315741',  # HLT_Mu17_v11, 0.018/pb
-          '315764-315764',  # HLT_Mu17_v11, 0.088/pb
-          '315770-315770',  # HLT_Mu17_v11, 0.094/pb
-          '315784-315786',  # HLT_Mu17_v11, 0.138/pb
-          '315790-315790',  # HLT_Mu17_v11, 0.133/pb
-          '315800-315801',  # HLT_Mu17_v11, 0.234/pb
-          '315840-315840',  # HLT_Mu17_v11, 0.272/pb
-          '315973-315974',  # HLT_Mu17_v11/HLT_Mu17_v12, 0.241/pb
-          '316060-316061',  # HLT_Mu17_v12, 0.294/pb
-          '316082-316082',  # HLT_Mu17_v12, 0.027/pb
-          '316110-316111',  # HLT_Mu17_v12, 0.075/pb
-          '316113-316114',  # HLT_Mu17_v12, 0.299/pb
-          '316153-316153',  # HLT_Mu17_v12, 0.197/pb
-          '316186-316187',  # HLT_Mu17_v12, 0.406/pb
-          '316199-316202',  # HLT_Mu17_v12, 0.453/pb
-          '316216-316219',  # HLT_Mu17_v12, 0.424/pb
-          '316239-316241',  # HLT_Mu17_v12, 0.42/pb
-          '316271-316271',  # HLT_Mu17_v12, 0.023/pb
-          '316361-316363',  # HLT_Mu17_v13, 0.065/pb
-          '316377-316380',  # HLT_Mu17_v13, 0.145/pb
-          '316455-316455',  # HLT_Mu17_v13, 0.007/pb
-          '316457-316457',  # HLT_Mu17_v13, 0.251/pb
-          '316469-316470',  # HLT_Mu17_v13, 0.204/pb
-          '316472-316472',  # HLT_Mu17_v13, 0.051/pb
-          '316505-316505',  # HLT_Mu17_v13, 0.309/pb
-          '316569-316569',  # HLT_Mu17_v13, 0.374/pb
-          '316590-316590',  # HLT_Mu17_v13, 0.146/pb
-          '316613-316613',  # HLT_Mu17_v13, 0.024/pb
-          '316615-316615',  # HLT_Mu17_v13, 0.038/pb
-          '316666-316667',  # HLT_Mu17_v13, 0.247/pb
-          '316700-316702',  # HLT_Mu17_v13, 0.272/pb
-          '316715-316723',  # HLT_Mu17_v13, 0.339/pb
-          '316758-316758',  # HLT_Mu17_v13, 0.351/pb
-          '316766-316766',  # HLT_Mu17_v13, 0.432/pb
-          '316876-316877',  # HLT_Mu17_v13, 0.252/pb
-          '316879-316879',  # HLT_Mu17_v13, 0.028/pb
-          '316928-316928',  # HLT_Mu17_v13, 0.034/pb
-          '316985-316985',  # HLT_Mu17_v13, 0.133/pb
-          '316993-316995',  # HLT_Mu17_v13, 0.204/pb
-          '317080-317080',  # HLT_Mu17_v13, 0.006/pb
-          '317087-317087',  # HLT_Mu17_v13, 0.187/pb
-          '317089-317089',  # HLT_Mu17_v13, 0.164/pb
-          '317182-317182',  # HLT_Mu17_v13, 0.312/pb
-          '317212-317213',  # HLT_Mu17_v13, 0.136/pb
-          '317279-317279',  # HLT_Mu17_v13, 0.051/pb
-          '317291-317292',  # HLT_Mu17_v13, 0.276/pb
-          '317297-317297',  # HLT_Mu17_v13, 0.095/pb
-          '317319-317320',  # HLT_Mu17_v13, 0.396/pb
-          '317338-317340',  # HLT_Mu17_v13, 0.169/pb
-          '317382-317383',  # HLT_Mu17_v13, 0.036/pb
-          '317391-317392',  # HLT_Mu17_v13, 0.38/pb
-          '317435-317435',  # HLT_Mu17_v13, 0.277/pb
-          '317438-317438',  # HLT_Mu17_v13, 0.038/pb
-          '317475-317475',  # HLT_Mu17_v13, 0.02/pb
-          '317478-317478',  # HLT_Mu17_v13, 0.006/pb
-          '317484-317484',  # HLT_Mu17_v13, 0.123/pb
-          '317488-317488',  # HLT_Mu17_v13, 0.139/pb
-          '317527-317527',  # HLT_Mu17_v13, 0.348/pb
-          '317591-317591',  # HLT_Mu17_v13, 0.085/pb
-          '317626-317626',  # HLT_Mu17_v13, 0.407/pb
-          '317640-317641',  # HLT_Mu17_v13, 0.407/pb
-          '317648-317650',  # HLT_Mu17_v13, 0.372/pb
-          '317661-317661',  # HLT_Mu17_v13, 0.289/pb
-          '317663-317663',  # HLT_Mu17_v13, 0.118/pb
-          '317683-317683',  # HLT_Mu17_v13, 0.091/pb
-          '317696-317696',  # HLT_Mu17_v13, 0.176/pb
-          '318733-318733',  # HLT_Mu17_v13, 0.002/pb
-          '318828-318828',  # HLT_Mu17_v13, 0.01/pb
-          '318872-318872',  # HLT_Mu17_v13, 0.071/pb
-          '318874-318874',  # HLT_Mu17_v13, 0.077/pb
-          '318876-318877',  # HLT_Mu17_v13, 0.159/pb
-          '319077-319077',  # HLT_Mu17_v13, 0.013/pb
-          '319337-319337',  # HLT_Mu17_v13, 0.179/pb
-          '319347-319349',  # HLT_Mu17_v13, 0.197/pb
-          '319449-319450',  # HLT_Mu17_v13, 0.351/pb
-          '319456-319456',  # HLT_Mu17_v13, 0.04/pb
-          '319459-319459',  # HLT_Mu17_v13, 0.013/pb
-          '319486-319486',  # HLT_Mu17_v13, 0.016/pb
-          '319503-319503',  # HLT_Mu17_v13, 0.07/pb
-          '319524-319524',  # HLT_Mu17_v13, 0.351/pb
-          '319526-319526',  # HLT_Mu17_v13, 0.054/pb
-          '319528-319528',  # HLT_Mu17_v13, 0.045/pb
-          '319579-319579',  # HLT_Mu17_v13, 0.63/pb
-          '319625-319625',  # HLT_Mu17_v13, 0.054/pb
-          '319639-319639',  # HLT_Mu17_v13, 0.315/pb
-          '319656-319659',  # HLT_Mu17_v13, 0.171/pb
-          '319678-319678',  # HLT_Mu17_v13, 0.073/pb
-          '319687-319687',  # HLT_Mu17_v13, 0.012/pb
-          '319697-319698',  # HLT_Mu17_v13, 0.075/pb
-          '319756-319756',  # HLT_Mu17_v13, 0.377/pb
-          '319840-319841',  # HLT_Mu17_v13, 0.054/pb
-          '319847-319849',  # HLT_Mu17_v13, 0.149/pb
-          '319851-319851',  # HLT_Mu17_v13, 0.001/pb
-          '319853-319854',  # HLT_Mu17_v13, 0.096/pb
-          '319908-319910',  # HLT_Mu17_v13, 0.249/pb
-          '319912-319915',  # HLT_Mu17_v13, 0.092/pb
-          '319941-319942',  # HLT_Mu17_v13, 0.086/pb
-          '319950-319950',  # HLT_Mu17_v13, 0.051/pb
-          '319991-319993',  # HLT_Mu17_v13, 0.408/pb
-          '320002-320002',  # HLT_Mu17_v13, 0.039/pb
-          '320006-320006',  # HLT_Mu17_v13, 0.088/pb
-          '320010-320012',  # HLT_Mu17_v13, 0.118/pb
-          '320023-320026',  # HLT_Mu17_v13, 0.235/pb
-          '320038-320040',  # HLT_Mu17_v13, 0.311/pb
-          '320059-320065',  # HLT_Mu17_v13, 0.305/pb
-          '320673-320674',  # HLT_Mu17_v13, 0.076/pb
-          '320688-320688',  # HLT_Mu17_v13, 0.101/pb
-          '320712-320712',  # HLT_Mu17_v13, 0.054/pb
-          '320757-320757',  # HLT_Mu17_v13, 0.09/pb
-          '320804-320804',  # HLT_Mu17_v13, 0.245/pb
-          '320807-320807',  # HLT_Mu17_v13, 0.0/pb
-          '320809-320809',  # HLT_Mu17_v13, 0.082/pb
-          '320821-320824',  # HLT_Mu17_v13, 0.349/pb
-          '320838-320838',  # HLT_Mu17_v13, 0.071/pb
-          '320840-320841',  # HLT_Mu17_v13, 0.147/pb
-          '320853-320859',  # HLT_Mu17_v13, 0.333/pb
-          '320887-320888',  # HLT_Mu17_v13, 0.088/pb
-          '320916-320917',  # HLT_Mu17_v13, 0.373/pb
-          '320920-320920',  # HLT_Mu17_v13, 0.018/pb
-          '320933-320934',  # HLT_Mu17_v13, 0.202/pb
-          '320936-320936',  # HLT_Mu17_v13, 0.06/pb
-          '320941-320941',  # HLT_Mu17_v13, 0.012/pb
-          '320980-320980',  # HLT_Mu17_v13, 0.03/pb
-          '320995-320996',  # HLT_Mu17_v13, 0.057/pb
-          '321004-321007',  # HLT_Mu17_v13, 0.247/pb
-          '321009-321012',  # HLT_Mu17_v13, 0.081/pb
-          '321051-321051',  # HLT_Mu17_v13, 0.24/pb
-          '321055-321055',  # HLT_Mu17_v13, 0.097/pb
-          '321067-321069',  # HLT_Mu17_v13, 0.284/pb
-          '321119-321119',  # HLT_Mu17_v13, 0.045/pb
-          '321121-321122',  # HLT_Mu17_v13, 0.105/pb
-          '321124-321124',  # HLT_Mu17_v13, 0.143/pb
-          '321126-321126',  # HLT_Mu17_v13, 0.061/pb
-          '321134-321134',  # HLT_Mu17_v13, 0.006/pb
-          '321138-321138',  # HLT_Mu17_v13, 0.109/pb
-          '321140-321140',  # HLT_Mu17_v13, 0.09/pb
-          '321149-321149',  # HLT_Mu17_v13, 0.334/pb
-          '321165-321167',  # HLT_Mu17_v13, 0.214/pb
-          '321177-321178',  # HLT_Mu17_v13, 0.134/pb
-          '321218-321219',  # HLT_Mu17_v13, 0.357/pb
-          '321221-321221',  # HLT_Mu17_v13, 0.005/pb
-          '321230-321233',  # HLT_Mu17_v13, 0.212/pb
-          '321262-321262',  # HLT_Mu17_v13, 0.001/pb
-          '321283-321283',  # HLT_Mu17_v13, 0.092/pb
-          '321294-321296',  # HLT_Mu17_v13, 0.18/pb
-          '321305-321305',  # HLT_Mu17_v13, 0.463/pb
-          '321311-321313',  # HLT_Mu17_v13, 0.067/pb
-          '321393-321393',  # HLT_Mu17_v13, 0.038/pb
-          '321396-321397',  # HLT_Mu17_v13, 0.321/pb
-          '321414-321415',  # HLT_Mu17_v13, 0.402/pb
-          '321431-321434',  # HLT_Mu17_v13, 0.228/pb
-          '321436-321436',  # HLT_Mu17_v13, 0.106/pb
-          '321457-321457',  # HLT_Mu17_v13, 0.371/pb
-          '321461-321461',  # HLT_Mu17_v13, 0.016/pb
-          '321475-321475',  # HLT_Mu17_v13, 0.363/pb
-          '321710-321710',  # HLT_Mu17_v13, 0.013/pb
-          '321712-321712',  # HLT_Mu17_v13, 0.065/pb
-          '321730-321730',  # HLT_Mu17_v13, 0.079/pb
-          '321732-321732',  # HLT_Mu17_v13, 0.265/pb
-          '321735-321735',  # HLT_Mu17_v13, 0.018/pb
-          '321755-321755',  # HLT_Mu17_v13, 0.164/pb
-          '321758-321758',  # HLT_Mu17_v13, 0.029/pb
-          '321760-321760',  # HLT_Mu17_v13, 0.112/pb
-          '321773-321778',  # HLT_Mu17_v13, 0.134/pb
-          '321780-321781',  # HLT_Mu17_v13, 0.14/pb
-          '321813-321813',  # HLT_Mu17_v13, 0.092/pb
-          '321815-321815',  # HLT_Mu17_v13, 0.004/pb
-          '321817-321818',  # HLT_Mu17_v13, 0.22/pb
-          '321820-321820',  # HLT_Mu17_v13, 0.025/pb
-          '321831-321834',  # HLT_Mu17_v13, 0.375/pb
-          '321879-321880',  # HLT_Mu17_v13, 0.101/pb
-          '321887-321887',  # HLT_Mu17_v13, 0.213/pb
-          '321908-321909',  # HLT_Mu17_v13, 0.374/pb
-          '321917-321917',  # HLT_Mu17_v13, 0.201/pb
-          '321919-321919',  # HLT_Mu17_v13, 0.001/pb
-          '321933-321933',  # HLT_Mu17_v13, 0.078/pb
-          '321960-321961',  # HLT_Mu17_v13, 0.107/pb
-          '321973-321973',  # HLT_Mu17_v13, 0.276/pb
-          '321975-321975',  # HLT_Mu17_v13, 0.112/pb
-          '321988-321988',  # HLT_Mu17_v13, 0.295/pb
-          '321990-321990',  # HLT_Mu17_v13, 0.062/pb
-          '322013-322014',  # HLT_Mu17_v13, 0.006/pb
-          '322022-322022',  # HLT_Mu17_v13, 0.348/pb
-          '322040-322040',  # HLT_Mu17_v13, 0.011/pb
-          '322057-322057',  # HLT_Mu17_v13, 0.006/pb
-          '322068-322068',  # HLT_Mu17_v13, 0.179/pb
-          '322079-322079',  # HLT_Mu17_v13, 0.108/pb
-          '322106-322106',  # HLT_Mu17_v13, 0.217/pb
-          '322113-322113',  # HLT_Mu17_v13, 0.031/pb
-          '322118-322118',  # HLT_Mu17_v13, 0.206/pb
-          '322179-322179',  # HLT_Mu17_v13, 0.361/pb
-          '322201-322201',  # HLT_Mu17_v13, 0.065/pb
-          '322204-322204',  # HLT_Mu17_v13, 0.239/pb
-          '322222-322222',  # HLT_Mu17_v13, 0.071/pb
-          '322252-322252',  # HLT_Mu17_v13, 0.323/pb
-          '322317-322317',  # HLT_Mu17_v13, 0.015/pb
-          '322319-322319',  # HLT_Mu17_v13, 0.043/pb
-          '322322-322322',  # HLT_Mu17_v13, 0.225/pb
-          '322324-322324',  # HLT_Mu17_v13, 0.053/pb
-          '322332-322332',  # HLT_Mu17_v13, 0.242/pb
-          '322348-322348',  # HLT_Mu17_v13, 0.319/pb
-          '322355-322356',  # HLT_Mu17_v13, 0.207/pb
-          '322381-322381',  # HLT_Mu17_v13, 0.137/pb
-          '322407-322407',  # HLT_Mu17_v13, 0.131/pb
-          '322430-322431',  # HLT_Mu17_v13, 0.285/pb
-          '322480-322480',  # HLT_Mu17_v13, 0.084/pb
-          '322492-322492',  # HLT_Mu17_v13, 0.221/pb
-          '322510-322510',  # HLT_Mu17_v13, 0.002/pb
-          '322599-322599',  # HLT_Mu17_v13, 0.073/pb
-          '322602-322603',  # HLT_Mu17_v13, 0.021/pb
-          '322605-322605',  # HLT_Mu17_v13, 0.069/pb
-          '322617-322617',  # HLT_Mu17_v13, 0.105/pb
-          '322625-322625',  # HLT_Mu17_v13, 0.258/pb
-          '322633-322633',  # HLT_Mu17_v13, 0.039/pb
-          '323414-323414',  # HLT_Mu17_v13, 0.005/pb
-          '323423-323423',  # HLT_Mu17_v13, 0.016/pb
-          '323470-323475',  # HLT_Mu17_v13, 0.247/pb
-          '323487-323488',  # HLT_Mu17_v13, 0.262/pb
-          '323492-323493',  # HLT_Mu17_v13, 0.026/pb
-          '323495-323495',  # HLT_Mu17_v13, 0.025/pb
-          '323524-323526',  # HLT_Mu17_v13, 0.37/pb
-          '323693-323693',  # HLT_Mu17_v13, 0.031/pb
-          '323696-323696',  # HLT_Mu17_v13, 0.068/pb
-          '323702-323702',  # HLT_Mu17_v13, 0.112/pb
-          '323725-323727',  # HLT_Mu17_v13, 0.292/pb
-          '323755-323755',  # HLT_Mu17_v13, 0.228/pb
-          '323775-323775',  # HLT_Mu17_v13, 0.036/pb
-          '323778-323778',  # HLT_Mu17_v13, 0.208/pb
-          '323790-323790',  # HLT_Mu17_v13, 0.213/pb
-          '323794-323794',  # HLT_Mu17_v13, 0.012/pb
-          '323841-323841',  # HLT_Mu17_v13, 0.119/pb
-          '323857-323857',  # HLT_Mu17_v13, 0.073/pb
-          '323940-323940',  # HLT_Mu17_v13, 0.328/pb
-          '323954-323954',  # HLT_Mu17_v13, 0.012/pb
-          '323976-323976',  # HLT_Mu17_v13, 0.011/pb
-          '323978-323978',  # HLT_Mu17_v13, 0.017/pb
-          '323980-323980',  # HLT_Mu17_v13, 0.052/pb
-          '323983-323983',  # HLT_Mu17_v13, 0.044/pb
-          '323997-323997',  # HLT_Mu17_v13, 0.099/pb
-          '324021-324022',  # HLT_Mu17_v13, 0.293/pb
-          '324077-324077',  # HLT_Mu17_v13, 0.187/pb
-          '324201-324202',  # HLT_Mu17_v13, 0.309/pb
-          '324205-324207',  # HLT_Mu17_v13, 0.034/pb
-          '324209-324209',  # HLT_Mu17_v13, 0.012/pb
-          '324237-324237',  # HLT_Mu17_v13, 0.058/pb
-          '324245-324245',  # HLT_Mu17_v13, 0.321/pb
-          '324293-324293',  # HLT_Mu17_v13, 0.395/pb
-          '324315-324315',  # HLT_Mu17_v13, 0.054/pb
-          '324318-324318',  # HLT_Mu17_v13, 0.077/pb
-          '324420-324420',  # HLT_Mu17_v13, 0.154/pb
-          '324729-324729',  # HLT_Mu17_v13, 0.011/pb
-          '324747-324747',  # HLT_Mu17_v13, 0.237/pb
-          '324764-324765',  # HLT_Mu17_v13, 0.091/pb
-          '324769-324769',  # HLT_Mu17_v13, 0.036/pb
-          '324772-324772',  # HLT_Mu17_v13, 0.014/pb
-          '324785-324785',  # HLT_Mu17_v13, 0.143/pb
-          '324791-324791',  # HLT_Mu17_v13, 0.188/pb
-          '324835-324835',  # HLT_Mu17_v13, 0.066/pb
-          '324840-324841',  # HLT_Mu17_v13, 0.253/pb
-          '324846-324846',  # HLT_Mu17_v13, 0.053/pb
-          '324878-324878',  # HLT_Mu17_v13, 0.31/pb
-          '324897-324897',  # HLT_Mu17_v13, 0.039/pb
-          '324970-324970',  # HLT_Mu17_v13, 0.369/pb
-          '324980-324980',  # HLT_Mu17_v13, 0.395/pb
-          '324997-325001',  # HLT_Mu17_v13, 0.285/pb
-          '325022-325022',  # HLT_Mu17_v13, 0.333/pb
-          '325057-325057',  # HLT_Mu17_v13, 0.092/pb
-          '325097-325101',  # HLT_Mu17_v13, 0.271/pb
-          '325110-325110',  # HLT_Mu17_v13, 0.003/pb
-          '325117-325117',  # HLT_Mu17_v13, 0.066/pb
-          '325159-325159',  # HLT_Mu17_v13, 0.047/pb
-          '325168-325170',  # HLT_Mu17_v13, 0.21/pb
-          '325172-325172',  # HLT_Mu17_v13, 0.052/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu20"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(20.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(1081), # L=55.273/pb; present in all eras; prescale factor 1080.8 (1082.1 from delivery)
-        trigger_type = cms.string('1mu'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Mu20_v11, 0.004/pb
-          '315259-315259',  # HLT_Mu20_v11, 0.007/pb
-          '315264-315265',  # HLT_Mu20_v11, 0.022/pb
-          '315267-315267',  # HLT_Mu20_v11, 0.018/pb
-          '315270-315270',  # HLT_Mu20_v11, 0.038/pb
-          '315322-315322',  # HLT_Mu20_v11, 0.086/pb
-          '315339-315339',  # HLT_Mu20_v11, 0.044/pb
-          '315357-315357',  # HLT_Mu20_v11, 0.08/pb
-          '315361-315361',  # HLT_Mu20_v11, 0.063/pb
-          '315363-315363',  # HLT_Mu20_v11, 0.008/pb
-          '315366-315366',  # HLT_Mu20_v11, 0.053/pb
-          '315420-315420',  # HLT_Mu20_v11, 0.137/pb
-          '315488-315490',  # HLT_Mu20_v11, 0.202/pb
-          '315506-315506',  # HLT_Mu20_v11, 0.019/pb
-          '315510-315510',  # HLT_Mu20_v11, 0.07/pb
-          '315512-315512',  # HLT_Mu20_v11, 0.161/pb
-          '315543-315543',  # HLT_Mu20_v11, 0.025/pb
-          '315555-315557',  # HLT_Mu20_v11, 0.078/pb
-          '315640-315642',  # HLT_Mu20_v11, 0.034/pb
-          '315644-315648',  # HLT_Mu20_v11, 0.299/pb
-          '315689-315690',  # HLT_Mu20_v11, 0.305/pb
-          '315702-315705',  # HLT_Mu20_v11, 0.224/pb
-          '315713-315713',  # HLT_Mu20_v11, 0.241/pb
-          '315721-315721',  # HLT_Mu20_v11, 0.143/pb
-          '315741-315741',  # HLT_Mu20_v11, 0.016/pb
-          '315764-315764',  # HLT_Mu20_v11, 0.078/pb
-          '315770-315770',  # HLT_Mu20_v11, 0.083/pb
-          '315784-315786',  # HLT_Mu20_v11, 0.122/pb
-          '315790-315790',  # HLT_Mu20_v11, 0.118/pb
-          '315800-315801',  # HLT_Mu20_v11, 0.207/pb
-          '315840-315840',  # HLT_Mu20_v11, 0.241/pb
-          '315973-315974',  # HLT_Mu20_v11, 0.207/pb
-          '316058-316062',  # HLT_Mu20_v11, 0.489/pb
-          '316082-316082',  # HLT_Mu20_v11, 0.135/pb
-          '316110-316111',  # HLT_Mu20_v11, 0.093/pb
-          '316113-316114',  # HLT_Mu20_v11, 0.37/pb
-          '316153-316153',  # HLT_Mu20_v11, 0.244/pb
-          '316186-316187',  # HLT_Mu20_v11, 0.502/pb
-          '316199-316202',  # HLT_Mu20_v11, 0.561/pb
-          '316216-316219',  # HLT_Mu20_v11, 0.526/pb
-          '316239-316241',  # HLT_Mu20_v11, 0.52/pb
-          '316271-316271',  # HLT_Mu20_v11, 0.028/pb
-          '316361-316363',  # HLT_Mu20_v12, 0.081/pb
-          '316377-316380',  # HLT_Mu20_v12, 0.18/pb
-          '316455-316455',  # HLT_Mu20_v12, 0.009/pb
-          '316457-316457',  # HLT_Mu20_v12, 0.311/pb
-          '316469-316470',  # HLT_Mu20_v12, 0.253/pb
-          '316472-316472',  # HLT_Mu20_v12, 0.063/pb
-          '316505-316505',  # HLT_Mu20_v12, 0.382/pb
-          '316569-316569',  # HLT_Mu20_v12, 0.462/pb
-          '316590-316590',  # HLT_Mu20_v12, 0.18/pb
-          '316613-316613',  # HLT_Mu20_v12, 0.03/pb
-          '316615-316615',  # HLT_Mu20_v12, 0.047/pb
-          '316666-316667',  # HLT_Mu20_v12, 0.306/pb
-          '316700-316702',  # HLT_Mu20_v12, 0.337/pb
-          '316715-316723',  # HLT_Mu20_v12, 0.419/pb
-          '316758-316758',  # HLT_Mu20_v12, 0.434/pb
-          '316766-316766',  # HLT_Mu20_v12, 0.534/pb
-          '316876-316877',  # HLT_Mu20_v12, 0.312/pb
-          '316879-316879',  # HLT_Mu20_v12, 0.035/pb
-          '316928-316928',  # HLT_Mu20_v12, 0.042/pb
-          '316985-316985',  # HLT_Mu20_v12, 0.164/pb
-          '316993-316995',  # HLT_Mu20_v12, 0.253/pb
-          '317080-317080',  # HLT_Mu20_v12, 0.007/pb
-          '317087-317087',  # HLT_Mu20_v12, 0.232/pb
-          '317089-317089',  # HLT_Mu20_v12, 0.203/pb
-          '317182-317182',  # HLT_Mu20_v12, 0.387/pb
-          '317212-317213',  # HLT_Mu20_v12, 0.168/pb
-          '317279-317279',  # HLT_Mu20_v12, 0.063/pb
-          '317291-317292',  # HLT_Mu20_v12, 0.342/pb
-          '317297-317297',  # HLT_Mu20_v12, 0.118/pb
-          '317319-317320',  # HLT_Mu20_v12, 0.49/pb
-          '317338-317340',  # HLT_Mu20_v12, 0.21/pb
-          '317382-317383',  # HLT_Mu20_v12, 0.044/pb
-          '317391-317392',  # HLT_Mu20_v12, 0.47/pb
-          '317435-317435',  # HLT_Mu20_v12, 0.343/pb
-          '317438-317438',  # HLT_Mu20_v12, 0.047/pb
-          '317475-317475',  # HLT_Mu20_v12, 0.025/pb
-          '317478-317478',  # HLT_Mu20_v12, 0.008/pb
-          '317484-317484',  # HLT_Mu20_v12, 0.153/pb
-          '317488-317488',  # HLT_Mu20_v12, 0.173/pb
-          '317527-317527',  # HLT_Mu20_v12, 0.431/pb
-          '317591-317591',  # HLT_Mu20_v12, 0.106/pb
-          '317626-317626',  # HLT_Mu20_v12, 0.504/pb
-          '317640-317641',  # HLT_Mu20_v12, 0.504/pb
-          '317648-317650',  # HLT_Mu20_v12, 0.46/pb
-          '317661-317661',  # HLT_Mu20_v12, 0.358/pb
-          '317663-317663',  # HLT_Mu20_v12, 0.146/pb
-          '317683-317683',  # HLT_Mu20_v12, 0.112/pb
-          '317696-317696',  # HLT_Mu20_v12, 0.218/pb
-          '318733-318733',  # HLT_Mu20_v12, 0.003/pb
-          '318828-318828',  # HLT_Mu20_v12, 0.013/pb
-          '318872-318872',  # HLT_Mu20_v12, 0.087/pb
-          '318874-318874',  # HLT_Mu20_v12, 0.095/pb
-          '318876-318877',  # HLT_Mu20_v12, 0.197/pb
-          '319077-319077',  # HLT_Mu20_v12, 0.016/pb
-          '319337-319337',  # HLT_Mu20_v12, 0.221/pb
-          '319347-319349',  # HLT_Mu20_v12, 0.244/pb
-          '319449-319450',  # HLT_Mu20_v12, 0.434/pb
-          '319456-319456',  # HLT_Mu20_v12, 0.05/pb
-          '319459-319459',  # HLT_Mu20_v12, 0.016/pb
-          '319486-319486',  # HLT_Mu20_v12, 0.019/pb
-          '319503-319503',  # HLT_Mu20_v12, 0.087/pb
-          '319524-319524',  # HLT_Mu20_v12, 0.435/pb
-          '319526-319526',  # HLT_Mu20_v12, 0.066/pb
-          '319528-319528',  # HLT_Mu20_v12, 0.056/pb
-          '319579-319579',  # HLT_Mu20_v12, 0.78/pb
-          '319625-319625',  # HLT_Mu20_v12, 0.067/pb
-          '319639-319639',  # HLT_Mu20_v12, 0.39/pb
-          '319656-319659',  # HLT_Mu20_v12, 0.211/pb
-          '319678-319678',  # HLT_Mu20_v12, 0.091/pb
-          '319687-319687',  # HLT_Mu20_v12, 0.015/pb
-          '319697-319698',  # HLT_Mu20_v12, 0.092/pb
-          '319756-319756',  # HLT_Mu20_v12, 0.467/pb
-          '319840-319841',  # HLT_Mu20_v12, 0.067/pb
-          '319847-319849',  # HLT_Mu20_v12, 0.184/pb
-          '319851-319851',  # HLT_Mu20_v12, 0.001/pb
-          '319853-319854',  # HLT_Mu20_v12, 0.119/pb
-          '319908-319910',  # HLT_Mu20_v12, 0.313/pb
-          '319912-319915',  # HLT_Mu20_v12, 0.114/pb
-          '319941-319942',  # HLT_Mu20_v12, 0.107/pb
-          '319950-319950',  # HLT_Mu20_v12, 0.063/pb
-          '319991-319993',  # HLT_Mu20_v12, 0.505/pb
-          '320002-320002',  # HLT_Mu20_v12, 0.048/pb
-          '320006-320006',  # HLT_Mu20_v12, 0.109/pb
-          '320010-320012',  # HLT_Mu20_v12, 0.147/pb
-          '320023-320026',  # HLT_Mu20_v12, 0.291/pb
-          '320038-320040',  # HLT_Mu20_v12, 0.385/pb
-          '320059-320065',  # HLT_Mu20_v12, 0.377/pb
-          '320673-320674',  # HLT_Mu20_v12, 0.094/pb
-          '320688-320688',  # HLT_Mu20_v12, 0.125/pb
-          '320712-320712',  # HLT_Mu20_v12, 0.066/pb
-          '320757-320757',  # HLT_Mu20_v12, 0.111/pb
-          '320804-320804',  # HLT_Mu20_v12, 0.304/pb
-          '320807-320807',  # HLT_Mu20_v12, 0.002/pb
-          '320809-320809',  # HLT_Mu20_v12, 0.101/pb
-          '320821-320824',  # HLT_Mu20_v12, 0.433/pb
-          '320838-320838',  # HLT_Mu20_v12, 0.088/pb
-          '320840-320841',  # HLT_Mu20_v12, 0.182/pb
-          '320853-320859',  # HLT_Mu20_v12, 0.412/pb
-          '320887-320888',  # HLT_Mu20_v12, 0.108/pb
-          '320916-320917',  # HLT_Mu20_v12, 0.461/pb
-          '320920-320920',  # HLT_Mu20_v12, 0.023/pb
-          '320933-320934',  # HLT_Mu20_v12, 0.25/pb
-          '320936-320936',  # HLT_Mu20_v12, 0.075/pb
-          '320941-320941',  # HLT_Mu20_v12, 0.015/pb
-          '320980-320980',  # HLT_Mu20_v12, 0.037/pb
-          '320995-320996',  # HLT_Mu20_v12, 0.071/pb
-          '321004-321007',  # HLT_Mu20_v12, 0.305/pb
-          '321009-321012',  # HLT_Mu20_v12, 0.101/pb
-          '321051-321051',  # HLT_Mu20_v12, 0.297/pb
-          '321055-321055',  # HLT_Mu20_v12, 0.12/pb
-          '321067-321069',  # HLT_Mu20_v12, 0.352/pb
-          '321119-321119',  # HLT_Mu20_v12, 0.056/pb
-          '321121-321122',  # HLT_Mu20_v12, 0.13/pb
-          '321124-321124',  # HLT_Mu20_v12, 0.176/pb
-          '321126-321126',  # HLT_Mu20_v12, 0.075/pb
-          '321134-321134',  # HLT_Mu20_v12, 0.008/pb
-          '321138-321138',  # HLT_Mu20_v12, 0.135/pb
-          '321140-321140',  # HLT_Mu20_v12, 0.111/pb
-          '321149-321149',  # HLT_Mu20_v12, 0.414/pb
-          '321165-321167',  # HLT_Mu20_v12, 0.266/pb
-          '321177-321178',  # HLT_Mu20_v12, 0.166/pb
-          '321218-321219',  # HLT_Mu20_v12, 0.442/pb
-          '321221-321221',  # HLT_Mu20_v12, 0.006/pb
-          '321230-321233',  # HLT_Mu20_v12, 0.262/pb
-          '321262-321262',  # HLT_Mu20_v12, 0.002/pb
-          '321283-321283',  # HLT_Mu20_v12, 0.114/pb
-          '321294-321296',  # HLT_Mu20_v12, 0.223/pb
-          '321305-321305',  # HLT_Mu20_v12, 0.573/pb
-          '321311-321313',  # HLT_Mu20_v12, 0.083/pb
-          '321393-321393',  # HLT_Mu20_v12, 0.047/pb
-          '321396-321397',  # HLT_Mu20_v12, 0.397/pb
-          '321414-321415',  # HLT_Mu20_v12, 0.498/pb
-          '321431-321434',  # HLT_Mu20_v12, 0.282/pb
-          '321436-321436',  # HLT_Mu20_v12, 0.132/pb
-          '321457-321457',  # HLT_Mu20_v12, 0.46/pb
-          '321461-321461',  # HLT_Mu20_v12, 0.02/pb
-          '321475-321475',  # HLT_Mu20_v12, 0.449/pb
-          '321710-321710',  # HLT_Mu20_v12, 0.016/pb
-          '321712-321712',  # HLT_Mu20_v12, 0.08/pb
-          '321730-321730',  # HLT_Mu20_v12, 0.098/pb
-          '321732-321732',  # HLT_Mu20_v12, 0.328/pb
-          '321735-321735',  # HLT_Mu20_v12, 0.023/pb
-          '321755-321755',  # HLT_Mu20_v12, 0.203/pb
-          '321758-321758',  # HLT_Mu20_v12, 0.036/pb
-          '321760-321760',  # HLT_Mu20_v12, 0.139/pb
-          '321773-321778',  # HLT_Mu20_v12, 0.166/pb
-          '321780-321781',  # HLT_Mu20_v12, 0.173/pb
-          '321813-321813',  # HLT_Mu20_v12, 0.115/pb
-          '321815-321815',  # HLT_Mu20_v12, 0.005/pb
-          '321817-321818',  # HLT_Mu20_v12, 0.273/pb
-          '321820-321820',  # HLT_Mu20_v12, 0.031/pb
-          '321831-321834',  # HLT_Mu20_v12, 0.465/pb
-          '321879-321880',  # HLT_Mu20_v12, 0.125/pb
-          '321887-321887',  # HLT_Mu20_v12, 0.264/pb
-          '321908-321909',  # HLT_Mu20_v12, 0.463/pb
-          '321917-321917',  # HLT_Mu20_v12, 0.249/pb
-          '321919-321919',  # HLT_Mu20_v12, 0.001/pb
-          '321933-321933',  # HLT_Mu20_v12, 0.096/pb
-          '321960-321961',  # HLT_Mu20_v12, 0.133/pb
-          '321973-321973',  # HLT_Mu20_v12, 0.342/pb
-          '321975-321975',  # HLT_Mu20_v12, 0.139/pb
-          '321988-321988',  # HLT_Mu20_v12, 0.366/pb
-          '321990-321990',  # HLT_Mu20_v12, 0.077/pb
-          '322013-322014',  # HLT_Mu20_v12, 0.007/pb
-          '322022-322022',  # HLT_Mu20_v12, 0.431/pb
-          '322040-322040',  # HLT_Mu20_v12, 0.013/pb
-          '322057-322057',  # HLT_Mu20_v12, 0.008/pb
-          '322068-322068',  # HLT_Mu20_v12, 0.222/pb
-          '322079-322079',  # HLT_Mu20_v12, 0.134/pb
-          '322106-322106',  # HLT_Mu20_v12, 0.268/pb
-          '322113-322113',  # HLT_Mu20_v12, 0.039/pb
-          '322118-322118',  # HLT_Mu20_v12, 0.255/pb
-          '322179-322179',  # HLT_Mu20_v12, 0.447/pb
-          '322201-322201',  # HLT_Mu20_v12, 0.08/pb
-          '322204-322204',  # HLT_Mu20_v12, 0.296/pb
-          '322222-322222',  # HLT_Mu20_v12, 0.088/pb
-          '322252-322252',  # HLT_Mu20_v12, 0.4/pb
-          '322317-322317',  # HLT_Mu20_v12, 0.018/pb
-          '322319-322319',  # HLT_Mu20_v12, 0.053/pb
-          '322322-322322',  # HLT_Mu20_v12, 0.279/pb
-          '322324-322324',  # HLT_Mu20_v12, 0.066/pb
-          '322332-322332',  # HLT_Mu20_v12, 0.299/pb
-          '322348-322348',  # HLT_Mu20_v12, 0.394/pb
-          '322355-322356',  # HLT_Mu20_v12, 0.256/pb
-          '322381-322381',  # HLT_Mu20_v12, 0.17/pb
-          '322407-322407',  # HLT_Mu20_v12, 0.162/pb
-          '322430-322431',  # HLT_Mu20_v12, 0.353/pb
-          '322480-322480',  # HLT_Mu20_v12, 0.104/pb
-          '322492-322492',  # HLT_Mu20_v12, 0.274/pb
-          '322510-322510',  # HLT_Mu20_v12, 0.002/pb
-          '322599-322599',  # HLT_Mu20_v12, 0.09/pb
-          '322602-322603',  # HLT_Mu20_v12, 0.026/pb
-          '322605-322605',  # HLT_Mu20_v12, 0.085/pb
-          '322617-322617',  # HLT_Mu20_v12, 0.13/pb
-          '322625-322625',  # HLT_Mu20_v12, 0.319/pb
-          '322633-322633',  # HLT_Mu20_v12, 0.049/pb
-          '323414-323414',  # HLT_Mu20_v12, 0.006/pb
-          '323423-323423',  # HLT_Mu20_v12, 0.02/pb
-          '323470-323475',  # HLT_Mu20_v12, 0.306/pb
-          '323487-323488',  # HLT_Mu20_v12, 0.324/pb
-          '323492-323493',  # HLT_Mu20_v12, 0.032/pb
-          '323495-323495',  # HLT_Mu20_v12, 0.031/pb
-          '323524-323526',  # HLT_Mu20_v12, 0.458/pb
-          '323693-323693',  # HLT_Mu20_v12, 0.038/pb
-          '323696-323696',  # HLT_Mu20_v12, 0.085/pb
-          '323702-323702',  # HLT_Mu20_v12, 0.139/pb
-          '323725-323727',  # HLT_Mu20_v12, 0.362/pb
-          '323755-323755',  # HLT_Mu20_v12, 0.283/pb
-          '323775-323775',  # HLT_Mu20_v12, 0.045/pb
-          '323778-323778',  # HLT_Mu20_v12, 0.258/pb
-          '323790-323790',  # HLT_Mu20_v12, 0.264/pb
-          '323794-323794',  # HLT_Mu20_v12, 0.015/pb
-          '323841-323841',  # HLT_Mu20_v12, 0.148/pb
-          '323857-323857',  # HLT_Mu20_v12, 0.091/pb
-          '323940-323940',  # HLT_Mu20_v12, 0.406/pb
-          '323954-323954',  # HLT_Mu20_v12, 0.014/pb
-          '323976-323976',  # HLT_Mu20_v12, 0.014/pb
-          '323978-323978',  # HLT_Mu20_v12, 0.021/pb
-          '323980-323980',  # HLT_Mu20_v12, 0.065/pb
-          '323983-323983',  # HLT_Mu20_v12, 0.054/pb
-          '323997-323997',  # HLT_Mu20_v12, 0.123/pb
-          '324021-324022',  # HLT_Mu20_v12, 0.362/pb
-          '324077-324077',  # HLT_Mu20_v12, 0.231/pb
-          '324201-324202',  # HLT_Mu20_v12, 0.383/pb
-          '324205-324207',  # HLT_Mu20_v12, 0.042/pb
-          '324209-324209',  # HLT_Mu20_v12, 0.015/pb
-          '324237-324237',  # HLT_Mu20_v12, 0.071/pb
-          '324245-324245',  # HLT_Mu20_v12, 0.397/pb
-          '324293-324293',  # HLT_Mu20_v12, 0.489/pb
-          '324315-324315',  # HLT_Mu20_v12, 0.067/pb
-          '324318-324318',  # HLT_Mu20_v12, 0.095/pb
-          '324420-324420',  # HLT_Mu20_v12, 0.19/pb
-          '324729-324729',  # HLT_Mu20_v12, 0.014/pb
-          '324747-324747',  # HLT_Mu20_v12, 0.294/pb
-          '324764-324765',  # HLT_Mu20_v12, 0.112/pb
-          '324769-324769',  # HLT_Mu20_v12, 0.045/pb
-          '324772-324772',  # HLT_Mu20_v12, 0.018/pb
-          '324785-324785',  # HLT_Mu20_v12, 0.177/pb
-          '324791-324791',  # HLT_Mu20_v12, 0.233/pb
-          '324835-324835',  # HLT_Mu20_v12, 0.082/pb
-          '324840-324841',  # HLT_Mu20_v12, 0.313/pb
-          '324846-324846',  # HLT_Mu20_v12, 0.065/pb
-          '324878-324878',  # HLT_Mu20_v12, 0.384/pb
-          '324897-324897',  # HLT_Mu20_v12, 0.048/pb
-          '324970-324970',  # HLT_Mu20_v12, 0.457/pb
-          '324980-324980',  # HLT_Mu20_v12, 0.489/pb
-          '324997-325001',  # HLT_Mu20_v12, 0.353/pb
-          '325022-325022',  # HLT_Mu20_v12, 0.413/pb
-          '325057-325057',  # HLT_Mu20_v12, 0.114/pb
-          '325097-325101',  # HLT_Mu20_v12, 0.335/pb
-          '325110-325110',  # HLT_Mu20_v12, 0.003/pb
-          '325117-325117',  # HLT_Mu20_v12, 0.081/pb
-          '325159-325159',  # HLT_Mu20_v12, 0.059/pb
-          '325168-325170',  # HLT_Mu20_v12, 0.26/pb
-          '325172-325172',  # HLT_Mu20_v12, 0.064/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Mu27"),
-        cone_minPt = cms.double(45.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(27.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(475), # L=125.783/pb; present in all eras; prescale factor 475.0 (464.6 from delivery)
-        trigger_type = cms.string('1mu'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Mu27_v12, 0.054/pb
-          '315259-315259',  # HLT_Mu27_v12, 0.094/pb
-          '315264-315265',  # HLT_Mu27_v12, 0.208/pb
-          '315267-315267',  # HLT_Mu27_v12, 0.167/pb
-          '315270-315270',  # HLT_Mu27_v12, 0.356/pb
-          '315322-315322',  # HLT_Mu27_v12, 0.811/pb
-          '315339-315339',  # HLT_Mu27_v12, 0.42/pb
-          '315357-315357',  # HLT_Mu27_v12, 0.513/pb
-          '315361-315361',  # HLT_Mu27_v12, 0.4/pb
-          '315363-315363',  # HLT_Mu27_v12, 0.049/pb
-          '315366-315366',  # HLT_Mu27_v12, 0.338/pb
-          '315420-315420',  # HLT_Mu27_v12, 0.874/pb
-          '315488-315490',  # HLT_Mu27_v12, 0.77/pb
-          '315506-315506',  # HLT_Mu27_v12, 0.063/pb
-          '315510-315510',  # HLT_Mu27_v12, 0.232/pb
-          '315512-315512',  # HLT_Mu27_v12, 0.532/pb
-          '315543-315543',  # HLT_Mu27_v12, 0.083/pb
-          '315555-315557',  # HLT_Mu27_v12, 0.257/pb
-          '315640-315642',  # HLT_Mu27_v12, 1.332/pb
-          '315644-315648',  # HLT_Mu27_v12, 0.988/pb
-          '315689-315690',  # HLT_Mu27_v12, 1.009/pb
-          '315702-315705',  # HLT_Mu27_v12, 0.738/pb
-          '315713-315713',  # HLT_Mu27_v12, 0.795/pb
-          '315721-315721',  # HLT_Mu27_v12, 0.473/pb
-          '315741-315741',  # HLT_Mu27_v12, 0.053/pb
-          '315764-315764',  # HLT_Mu27_v12, 0.256/pb
-          '315770-315770',  # HLT_Mu27_v12, 0.274/pb
-          '315784-315786',  # HLT_Mu27_v12, 0.404/pb
-          '315790-315790',  # HLT_Mu27_v12, 0.389/pb
-          '315800-315801',  # HLT_Mu27_v12, 0.685/pb
-          '315840-315840',  # HLT_Mu27_v12, 0.796/pb
-          '315973-315974',  # HLT_Mu27_v12, 0.663/pb
-          '316058-316062',  # HLT_Mu27_v12, 1.026/pb
-          '316082-316082',  # HLT_Mu27_v12, 0.283/pb
-          '316110-316111',  # HLT_Mu27_v12, 0.194/pb
-          '316113-316114',  # HLT_Mu27_v12, 0.777/pb
-          '316153-316153',  # HLT_Mu27_v12, 0.512/pb
-          '316186-316187',  # HLT_Mu27_v12, 1.055/pb
-          '316199-316202',  # HLT_Mu27_v12, 1.179/pb
-          '316216-316219',  # HLT_Mu27_v12, 1.104/pb
-          '316239-316241',  # HLT_Mu27_v12, 1.092/pb
-          '316271-316271',  # HLT_Mu27_v12, 0.059/pb
-          '316361-316363',  # HLT_Mu27_v13, 0.17/pb
-          '316377-316380',  # HLT_Mu27_v13, 0.378/pb
-          '316455-316455',  # HLT_Mu27_v13, 0.019/pb
-          '316457-316457',  # HLT_Mu27_v13, 0.653/pb
-          '316469-316470',  # HLT_Mu27_v13, 0.531/pb
-          '316472-316472',  # HLT_Mu27_v13, 0.132/pb
-          '316505-316505',  # HLT_Mu27_v13, 0.802/pb
-          '316569-316569',  # HLT_Mu27_v13, 0.971/pb
-          '316590-316590',  # HLT_Mu27_v13, 0.378/pb
-          '316613-316613',  # HLT_Mu27_v13, 0.063/pb
-          '316615-316615',  # HLT_Mu27_v13, 0.098/pb
-          '316666-316667',  # HLT_Mu27_v13, 0.643/pb
-          '316700-316702',  # HLT_Mu27_v13, 0.707/pb
-          '316715-316723',  # HLT_Mu27_v13, 0.88/pb
-          '316758-316758',  # HLT_Mu27_v13, 0.911/pb
-          '316766-316766',  # HLT_Mu27_v13, 1.122/pb
-          '316876-316877',  # HLT_Mu27_v13, 0.655/pb
-          '316879-316879',  # HLT_Mu27_v13, 0.073/pb
-          '316928-316928',  # HLT_Mu27_v13, 0.089/pb
-          '316985-316985',  # HLT_Mu27_v13, 0.345/pb
-          '316993-316995',  # HLT_Mu27_v13, 0.531/pb
-          '317080-317080',  # HLT_Mu27_v13, 0.016/pb
-          '317087-317087',  # HLT_Mu27_v13, 0.486/pb
-          '317089-317089',  # HLT_Mu27_v13, 0.426/pb
-          '317182-317182',  # HLT_Mu27_v13, 0.812/pb
-          '317212-317213',  # HLT_Mu27_v13, 0.353/pb
-          '317279-317279',  # HLT_Mu27_v13, 0.132/pb
-          '317291-317292',  # HLT_Mu27_v13, 0.718/pb
-          '317297-317297',  # HLT_Mu27_v13, 0.248/pb
-          '317319-317320',  # HLT_Mu27_v13, 1.029/pb
-          '317338-317340',  # HLT_Mu27_v13, 0.44/pb
-          '317382-317383',  # HLT_Mu27_v13, 0.093/pb
-          '317391-317392',  # HLT_Mu27_v13, 0.987/pb
-          '317435-317435',  # HLT_Mu27_v13, 0.721/pb
-          '317438-317438',  # HLT_Mu27_v13, 0.099/pb
-          '317475-317475',  # HLT_Mu27_v13, 0.052/pb
-          '317478-317478',  # HLT_Mu27_v13, 0.016/pb
-          '317484-317484',  # HLT_Mu27_v13, 0.321/pb
-          '317488-317488',  # HLT_Mu27_v13, 0.362/pb
-          '317527-317527',  # HLT_Mu27_v13, 0.904/pb
-          '317591-317591',  # HLT_Mu27_v13, 0.222/pb
-          '317626-317626',  # HLT_Mu27_v13, 1.058/pb
-          '317640-317641',  # HLT_Mu27_v13, 1.059/pb
-          '317648-317650',  # HLT_Mu27_v13, 0.966/pb
-          '317661-317661',  # HLT_Mu27_v13, 0.751/pb
-          '317663-317663',  # HLT_Mu27_v13, 0.307/pb
-          '317683-317683',  # HLT_Mu27_v13, 0.236/pb
-          '317696-317696',  # HLT_Mu27_v13, 0.458/pb
-          '318733-318733',  # HLT_Mu27_v13, 0.006/pb
-          '318828-318828',  # HLT_Mu27_v13, 0.026/pb
-          '318872-318872',  # HLT_Mu27_v13, 0.184/pb
-          '318874-318874',  # HLT_Mu27_v13, 0.199/pb
-          '318876-318877',  # HLT_Mu27_v13, 0.414/pb
-          '319077-319077',  # HLT_Mu27_v13, 0.033/pb
-          '319337-319337',  # HLT_Mu27_v13, 0.465/pb
-          '319347-319349',  # HLT_Mu27_v13, 0.513/pb
-          '319449-319450',  # HLT_Mu27_v13, 0.912/pb
-          '319456-319456',  # HLT_Mu27_v13, 0.104/pb
-          '319459-319459',  # HLT_Mu27_v13, 0.034/pb
-          '319486-319486',  # HLT_Mu27_v13, 0.041/pb
-          '319503-319503',  # HLT_Mu27_v13, 0.182/pb
-          '319524-319524',  # HLT_Mu27_v13, 0.913/pb
-          '319526-319526',  # HLT_Mu27_v13, 0.139/pb
-          '319528-319528',  # HLT_Mu27_v13, 0.117/pb
-          '319579-319579',  # HLT_Mu27_v13, 1.637/pb
-          '319625-319625',  # HLT_Mu27_v13, 0.141/pb
-          '319639-319639',  # HLT_Mu27_v13, 0.819/pb
-          '319656-319659',  # HLT_Mu27_v13, 0.444/pb
-          '319678-319678',  # HLT_Mu27_v13, 0.191/pb
-          '319687-319687',  # HLT_Mu27_v13, 0.032/pb
-          '319697-319698',  # HLT_Mu27_v13, 0.194/pb
-          '319756-319756',  # HLT_Mu27_v13, 0.98/pb
-          '319840-319841',  # HLT_Mu27_v13, 0.14/pb
-          '319847-319849',  # HLT_Mu27_v13, 0.387/pb
-          '319851-319851',  # HLT_Mu27_v13, 0.002/pb
-          '319853-319854',  # HLT_Mu27_v13, 0.25/pb
-          '319908-319910',  # HLT_Mu27_v13, 1.767/pb
-          '319912-319915',  # HLT_Mu27_v13, 0.239/pb
-          '319941-319942',  # HLT_Mu27_v13, 0.224/pb
-          '319950-319950',  # HLT_Mu27_v13, 0.132/pb
-          '319991-319993',  # HLT_Mu27_v13, 1.061/pb
-          '320002-320002',  # HLT_Mu27_v13, 0.1/pb
-          '320006-320006',  # HLT_Mu27_v13, 0.228/pb
-          '320010-320012',  # HLT_Mu27_v13, 0.308/pb
-          '320023-320026',  # HLT_Mu27_v13, 0.611/pb
-          '320038-320040',  # HLT_Mu27_v13, 0.809/pb
-          '320059-320065',  # HLT_Mu27_v13, 0.792/pb
-          '320673-320674',  # HLT_Mu27_v13, 0.197/pb
-          '320688-320688',  # HLT_Mu27_v13, 0.262/pb
-          '320712-320712',  # HLT_Mu27_v13, 0.139/pb
-          '320757-320757',  # HLT_Mu27_v13, 0.233/pb
-          '320804-320804',  # HLT_Mu27_v13, 0.638/pb
-          '320807-320807',  # HLT_Mu27_v13, 0.348/pb
-          '320809-320809',  # HLT_Mu27_v13, 0.212/pb
-          '320821-320824',  # HLT_Mu27_v13, 0.909/pb
-          '320838-320838',  # HLT_Mu27_v13, 0.185/pb
-          '320840-320841',  # HLT_Mu27_v13, 0.383/pb
-          '320853-320859',  # HLT_Mu27_v13, 0.866/pb
-          '320887-320888',  # HLT_Mu27_v13, 0.228/pb
-          '320916-320917',  # HLT_Mu27_v13, 0.969/pb
-          '320920-320920',  # HLT_Mu27_v13, 0.048/pb
-          '320933-320934',  # HLT_Mu27_v13, 0.525/pb
-          '320936-320936',  # HLT_Mu27_v13, 0.157/pb
-          '320941-320941',  # HLT_Mu27_v13, 0.031/pb
-          '320980-320980',  # HLT_Mu27_v13, 0.077/pb
-          '320995-320996',  # HLT_Mu27_v13, 0.148/pb
-          '321004-321007',  # HLT_Mu27_v13, 0.641/pb
-          '321009-321012',  # HLT_Mu27_v13, 0.212/pb
-          '321051-321051',  # HLT_Mu27_v13, 0.623/pb
-          '321055-321055',  # HLT_Mu27_v13, 0.251/pb
-          '321067-321069',  # HLT_Mu27_v13, 0.739/pb
-          '321119-321119',  # HLT_Mu27_v13, 0.117/pb
-          '321121-321122',  # HLT_Mu27_v13, 0.272/pb
-          '321124-321124',  # HLT_Mu27_v13, 0.371/pb
-          '321126-321126',  # HLT_Mu27_v13, 0.158/pb
-          '321134-321134',  # HLT_Mu27_v13, 0.016/pb
-          '321138-321138',  # HLT_Mu27_v13, 0.284/pb
-          '321140-321140',  # HLT_Mu27_v13, 0.234/pb
-          '321149-321149',  # HLT_Mu27_v13, 0.869/pb
-          '321165-321167',  # HLT_Mu27_v13, 0.945/pb
-          '321177-321178',  # HLT_Mu27_v13, 0.349/pb
-          '321218-321219',  # HLT_Mu27_v13, 0.927/pb
-          '321221-321221',  # HLT_Mu27_v13, 0.012/pb
-          '321230-321233',  # HLT_Mu27_v13, 0.55/pb
-          '321262-321262',  # HLT_Mu27_v13, 0.003/pb
-          '321283-321283',  # HLT_Mu27_v13, 0.24/pb
-          '321294-321296',  # HLT_Mu27_v13, 0.468/pb
-          '321305-321305',  # HLT_Mu27_v13, 1.204/pb
-          '321311-321313',  # HLT_Mu27_v13, 0.175/pb
-          '321393-321393',  # HLT_Mu27_v13, 0.099/pb
-          '321396-321397',  # HLT_Mu27_v13, 0.835/pb
-          '321414-321415',  # HLT_Mu27_v13, 1.046/pb
-          '321431-321434',  # HLT_Mu27_v13, 0.592/pb
-          '321436-321436',  # HLT_Mu27_v13, 0.277/pb
-          '321457-321457',  # HLT_Mu27_v13, 0.966/pb
-          '321461-321461',  # HLT_Mu27_v13, 0.042/pb
-          '321475-321475',  # HLT_Mu27_v13, 0.944/pb
-          '321710-321710',  # HLT_Mu27_v13, 0.034/pb
-          '321712-321712',  # HLT_Mu27_v13, 0.169/pb
-          '321730-321730',  # HLT_Mu27_v13, 0.205/pb
-          '321732-321732',  # HLT_Mu27_v13, 0.689/pb
-          '321735-321735',  # HLT_Mu27_v13, 0.047/pb
-          '321755-321755',  # HLT_Mu27_v13, 0.427/pb
-          '321758-321758',  # HLT_Mu27_v13, 0.075/pb
-          '321760-321760',  # HLT_Mu27_v13, 0.292/pb
-          '321773-321778',  # HLT_Mu27_v13, 0.349/pb
-          '321780-321781',  # HLT_Mu27_v13, 0.363/pb
-          '321813-321813',  # HLT_Mu27_v13, 0.24/pb
-          '321815-321815',  # HLT_Mu27_v13, 0.01/pb
-          '321817-321818',  # HLT_Mu27_v13, 0.573/pb
-          '321820-321820',  # HLT_Mu27_v13, 0.064/pb
-          '321831-321834',  # HLT_Mu27_v13, 0.976/pb
-          '321879-321880',  # HLT_Mu27_v13, 0.263/pb
-          '321887-321887',  # HLT_Mu27_v13, 0.554/pb
-          '321908-321909',  # HLT_Mu27_v13, 0.972/pb
-          '321917-321917',  # HLT_Mu27_v13, 0.522/pb
-          '321919-321919',  # HLT_Mu27_v13, 0.003/pb
-          '321933-321933',  # HLT_Mu27_v13, 0.202/pb
-          '321960-321961',  # HLT_Mu27_v13, 0.279/pb
-          '321973-321973',  # HLT_Mu27_v13, 0.717/pb
-          '321975-321975',  # HLT_Mu27_v13, 0.292/pb
-          '321988-321988',  # HLT_Mu27_v13, 0.768/pb
-          '321990-321990',  # HLT_Mu27_v13, 0.162/pb
-          '322013-322014',  # HLT_Mu27_v13, 0.016/pb
-          '322022-322022',  # HLT_Mu27_v13, 0.906/pb
-          '322040-322040',  # HLT_Mu27_v13, 0.027/pb
-          '322057-322057',  # HLT_Mu27_v13, 0.016/pb
-          '322068-322068',  # HLT_Mu27_v13, 0.465/pb
-          '322079-322079',  # HLT_Mu27_v13, 0.28/pb
-          '322106-322106',  # HLT_Mu27_v13, 0.564/pb
-          '322113-322113',  # HLT_Mu27_v13, 0.082/pb
-          '322118-322118',  # HLT_Mu27_v13, 0.536/pb
-          '322179-322179',  # HLT_Mu27_v13, 0.939/pb
-          '322201-322201',  # HLT_Mu27_v13, 0.169/pb
-          '322204-322204',  # HLT_Mu27_v13, 0.622/pb
-          '322222-322222',  # HLT_Mu27_v13, 0.185/pb
-          '322252-322252',  # HLT_Mu27_v13, 0.841/pb
-          '322317-322317',  # HLT_Mu27_v13, 0.038/pb
-          '322319-322319',  # HLT_Mu27_v13, 0.111/pb
-          '322322-322322',  # HLT_Mu27_v13, 0.585/pb
-          '322324-322324',  # HLT_Mu27_v13, 0.139/pb
-          '322332-322332',  # HLT_Mu27_v13, 0.628/pb
-          '322348-322348',  # HLT_Mu27_v13, 0.828/pb
-          '322355-322356',  # HLT_Mu27_v13, 0.537/pb
-          '322381-322381',  # HLT_Mu27_v13, 0.357/pb
-          '322407-322407',  # HLT_Mu27_v13, 0.34/pb
-          '322430-322431',  # HLT_Mu27_v13, 0.741/pb
-          '322480-322480',  # HLT_Mu27_v13, 0.219/pb
-          '322492-322492',  # HLT_Mu27_v13, 0.575/pb
-          '322510-322510',  # HLT_Mu27_v13, 0.004/pb
-          '322599-322599',  # HLT_Mu27_v13, 0.189/pb
-          '322602-322603',  # HLT_Mu27_v13, 0.054/pb
-          '322605-322605',  # HLT_Mu27_v13, 0.179/pb
-          '322617-322617',  # HLT_Mu27_v13, 0.273/pb
-          '322625-322625',  # HLT_Mu27_v13, 0.671/pb
-          '322633-322633',  # HLT_Mu27_v13, 0.102/pb
-          '323414-323414',  # HLT_Mu27_v13, 0.012/pb
-          '323423-323423',  # HLT_Mu27_v13, 0.042/pb
-          '323470-323475',  # HLT_Mu27_v13, 0.643/pb
-          '323487-323488',  # HLT_Mu27_v13, 0.681/pb
-          '323492-323493',  # HLT_Mu27_v13, 0.066/pb
-          '323495-323495',  # HLT_Mu27_v13, 0.065/pb
-          '323524-323526',  # HLT_Mu27_v13, 0.961/pb
-          '323693-323693',  # HLT_Mu27_v13, 0.08/pb
-          '323696-323696',  # HLT_Mu27_v13, 0.178/pb
-          '323702-323702',  # HLT_Mu27_v13, 0.292/pb
-          '323725-323727',  # HLT_Mu27_v13, 0.76/pb
-          '323755-323755',  # HLT_Mu27_v13, 0.593/pb
-          '323775-323775',  # HLT_Mu27_v13, 0.094/pb
-          '323778-323778',  # HLT_Mu27_v13, 0.542/pb
-          '323790-323790',  # HLT_Mu27_v13, 0.553/pb
-          '323794-323794',  # HLT_Mu27_v13, 0.032/pb
-          '323841-323841',  # HLT_Mu27_v13, 0.31/pb
-          '323857-323857',  # HLT_Mu27_v13, 0.191/pb
-          '323940-323940',  # HLT_Mu27_v13, 0.853/pb
-          '323954-323954',  # HLT_Mu27_v13, 0.03/pb
-          '323976-323976',  # HLT_Mu27_v13, 0.029/pb
-          '323978-323978',  # HLT_Mu27_v13, 0.044/pb
-          '323980-323980',  # HLT_Mu27_v13, 0.135/pb
-          '323983-323983',  # HLT_Mu27_v13, 0.114/pb
-          '323997-323997',  # HLT_Mu27_v13, 0.258/pb
-          '324021-324022',  # HLT_Mu27_v13, 0.761/pb
-          '324077-324077',  # HLT_Mu27_v13, 0.485/pb
-          '324201-324202',  # HLT_Mu27_v13, 0.804/pb
-          '324205-324207',  # HLT_Mu27_v13, 0.089/pb
-          '324209-324209',  # HLT_Mu27_v13, 0.032/pb
-          '324237-324237',  # HLT_Mu27_v13, 0.15/pb
-          '324245-324245',  # HLT_Mu27_v13, 0.834/pb
-          '324293-324293',  # HLT_Mu27_v13, 1.026/pb
-          '324315-324315',  # HLT_Mu27_v13, 0.141/pb
-          '324318-324318',  # HLT_Mu27_v13, 0.2/pb
-          '324420-324420',  # HLT_Mu27_v13, 0.399/pb
-          '324729-324729',  # HLT_Mu27_v13, 0.03/pb
-          '324747-324747',  # HLT_Mu27_v13, 0.616/pb
-          '324764-324765',  # HLT_Mu27_v13, 0.235/pb
-          '324769-324769',  # HLT_Mu27_v13, 0.094/pb
-          '324772-324772',  # HLT_Mu27_v13, 0.038/pb
-          '324785-324785',  # HLT_Mu27_v13, 0.372/pb
-          '324791-324791',  # HLT_Mu27_v13, 0.49/pb
-          '324835-324835',  # HLT_Mu27_v13, 0.172/pb
-          '324840-324841',  # HLT_Mu27_v13, 0.657/pb
-          '324846-324846',  # HLT_Mu27_v13, 0.137/pb
-          '324878-324878',  # HLT_Mu27_v13, 0.806/pb
-          '324897-324897',  # HLT_Mu27_v13, 0.1/pb
-          '324970-324970',  # HLT_Mu27_v13, 0.959/pb
-          '324980-324980',  # HLT_Mu27_v13, 1.027/pb
-          '324997-325001',  # HLT_Mu27_v13, 0.741/pb
-          '325022-325022',  # HLT_Mu27_v13, 0.867/pb
-          '325057-325057',  # HLT_Mu27_v13, 0.24/pb
-          '325097-325101',  # HLT_Mu27_v13, 0.703/pb
-          '325110-325110',  # HLT_Mu27_v13, 0.007/pb
-          '325117-325117',  # HLT_Mu27_v13, 0.17/pb
-          '325159-325159',  # HLT_Mu27_v13, 0.123/pb
-          '325168-325170',  # HLT_Mu27_v13, 0.546/pb
-          '325172-325172',  # HLT_Mu27_v13, 0.135/pb
-        )),
-      ),
-    ),
-    'e' : cms.VPSet(
-      cms.PSet(
-        path = cms.string("HLT_Ele8_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(15.),
-        cone_maxPt = cms.double(45.),
-        minRecoPt = cms.double(8.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(9318), # L=6.411/pb; present in all eras; prescale factor 9318.5 (9325.6 from delivery)
-        trigger_type = cms.string('1e'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315259-315259',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315264-315265',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315267-315267',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315270-315270',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315322-315322',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315339-315339',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315357-315357',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315361-315361',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315363-315363',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315366-315366',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315420-315420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315488-315490',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.008/pb
-          '315506-315506',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315510-315510',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
-          '315512-315512',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '315543-315543',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315555-315557',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
-          '315640-315642',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315644-315648',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '315689-315690',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '315702-315705',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
-          '315713-315713',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
-          '315721-315721',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '315741-315741',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315764-315764',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
-          '315770-315770',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.003/pb
-          '315784-315786',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
-          '315790-315790',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
-          '315800-315801',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.008/pb
-          '315840-315840',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
-          '315973-315974',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v16/HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.008/pb
-          '316058-316062',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.013/pb
-          '316082-316082',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.004/pb
-          '316110-316111',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.003/pb
-          '316113-316114',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.01/pb
-          '316153-316153',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.007/pb
-          '316186-316187',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.014/pb
-          '316199-316202',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.016/pb
-          '316216-316219',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.015/pb
-          '316239-316241',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.014/pb
-          '316271-316271',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v17, 0.001/pb
-          '316361-316363',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '316377-316380',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '316455-316455',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '316457-316457',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '316469-316470',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '316472-316472',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '316505-316505',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '316569-316569',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '316590-316590',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '316613-316613',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '316615-316615',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '316666-316667',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
-          '316700-316702',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '316715-316723',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '316758-316758',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '316766-316766',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '316876-316877',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '316879-316879',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '316928-316928',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '316985-316985',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
-          '316993-316995',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '317080-317080',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '317087-317087',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.032/pb
-          '317089-317089',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
-          '317182-317182',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
-          '317212-317213',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
-          '317279-317279',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '317291-317292',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.047/pb
-          '317297-317297',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '317319-317320',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
-          '317338-317340',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.029/pb
-          '317382-317383',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '317391-317392',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.065/pb
-          '317435-317435',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.047/pb
-          '317438-317438',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '317475-317475',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '317478-317478',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '317484-317484',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.021/pb
-          '317488-317488',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '317527-317527',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.059/pb
-          '317591-317591',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '317626-317626',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
-          '317640-317641',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
-          '317648-317650',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
-          '317661-317661',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
-          '317663-317663',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
-          '317683-317683',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '317696-317696',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.03/pb
-          '318733-318733',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '318828-318828',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '318872-318872',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '318874-318874',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '318876-318877',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.027/pb
-          '319077-319077',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '319337-319337',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
-          '319347-319349',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.034/pb
-          '319449-319450',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
-          '319456-319456',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '319459-319459',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '319486-319486',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '319503-319503',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '319524-319524',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
-          '319526-319526',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '319528-319528',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
-          '319579-319579',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
-          '319625-319625',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '319639-319639',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.054/pb
-          '319656-319659',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.029/pb
-          '319678-319678',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '319687-319687',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '319697-319698',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '319756-319756',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.065/pb
-          '319840-319841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '319847-319849',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
-          '319851-319851',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '319853-319854',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '319908-319910',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
-          '319912-319915',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '319941-319942',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '319950-319950',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '319991-319993',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
-          '320002-320002',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '320006-320006',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '320010-320012',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
-          '320023-320026',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.04/pb
-          '320038-320040',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
-          '320059-320065',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
-          '320673-320674',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '320688-320688',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
-          '320712-320712',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '320757-320757',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '320804-320804',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
-          '320807-320807',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '320809-320809',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '320821-320824',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
-          '320838-320838',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '320840-320841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
-          '320853-320859',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.057/pb
-          '320887-320888',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '320916-320917',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
-          '320920-320920',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '320933-320934',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '320936-320936',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
-          '320941-320941',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '320980-320980',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '320995-320996',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
-          '321004-321007',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
-          '321009-321012',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '321051-321051',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
-          '321055-321055',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
-          '321067-321069',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
-          '321119-321119',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
-          '321121-321122',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '321124-321124',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '321126-321126',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
-          '321134-321134',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '321138-321138',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
-          '321140-321140',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '321149-321149',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.057/pb
-          '321165-321167',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
-          '321177-321178',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
-          '321218-321219',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.061/pb
-          '321221-321221',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '321230-321233',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
-          '321262-321262',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '321283-321283',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '321294-321296',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
-          '321305-321305',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.079/pb
-          '321311-321313',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '321393-321393',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '321396-321397',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
-          '321414-321415',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.069/pb
-          '321431-321434',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.039/pb
-          '321436-321436',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '321457-321457',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
-          '321461-321461',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '321475-321475',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.062/pb
-          '321710-321710',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '321712-321712',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '321730-321730',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '321732-321732',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.045/pb
-          '321735-321735',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '321755-321755',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
-          '321758-321758',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '321760-321760',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
-          '321773-321778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.023/pb
-          '321780-321781',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '321813-321813',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '321815-321815',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '321817-321818',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
-          '321820-321820',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '321831-321834',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
-          '321879-321880',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
-          '321887-321887',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
-          '321908-321909',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
-          '321917-321917',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.034/pb
-          '321919-321919',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '321933-321933',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '321960-321961',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '321973-321973',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.047/pb
-          '321975-321975',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
-          '321988-321988',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.051/pb
-          '321990-321990',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '322013-322014',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '322022-322022',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
-          '322040-322040',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '322057-322057',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '322068-322068',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
-          '322079-322079',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '322106-322106',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
-          '322113-322113',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '322118-322118',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '322179-322179',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.062/pb
-          '322201-322201',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '322204-322204',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
-          '322222-322222',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '322252-322252',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
-          '322317-322317',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '322319-322319',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '322322-322322',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
-          '322324-322324',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '322332-322332',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
-          '322348-322348',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.054/pb
-          '322355-322356',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '322381-322381',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '322407-322407',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.022/pb
-          '322430-322431',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
-          '322480-322480',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '322492-322492',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
-          '322510-322510',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '322599-322599',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '322602-322603',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '322605-322605',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '322617-322617',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '322625-322625',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.044/pb
-          '322633-322633',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '323414-323414',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '323423-323423',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '323470-323475',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
-          '323487-323488',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.045/pb
-          '323492-323493',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '323495-323495',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '323524-323526',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
-          '323693-323693',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '323696-323696',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '323702-323702',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
-          '323725-323727',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
-          '323755-323755',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.039/pb
-          '323775-323775',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '323778-323778',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
-          '323790-323790',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
-          '323794-323794',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '323841-323841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
-          '323857-323857',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '323940-323940',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.056/pb
-          '323954-323954',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '323976-323976',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '323978-323978',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.003/pb
-          '323980-323980',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '323983-323983',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '323997-323997',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.017/pb
-          '324021-324022',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
-          '324077-324077',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.032/pb
-          '324201-324202',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
-          '324205-324207',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '324209-324209',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '324237-324237',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
-          '324245-324245',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
-          '324293-324293',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
-          '324315-324315',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '324318-324318',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '324420-324420',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.026/pb
-          '324729-324729',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '324747-324747',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
-          '324764-324765',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '324769-324769',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '324772-324772',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '324785-324785',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '324791-324791',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.032/pb
-          '324835-324835',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '324840-324841',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
-          '324846-324846',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-          '324878-324878',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.053/pb
-          '324897-324897',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.007/pb
-          '324970-324970',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
-          '324980-324980',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
-          '324997-325001',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
-          '325022-325022',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.057/pb
-          '325057-325057',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '325097-325101',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.046/pb
-          '325110-325110',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '325117-325117',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '325159-325159',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.008/pb
-          '325168-325170',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.036/pb
-          '325172-325172',  # HLT_Ele8_CaloIdM_TrackIdM_PFJet30_v18, 0.009/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Ele17_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(25.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(17.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(1537), # L=38.861/pb; present in all eras; prescale factor 1537.3 (1538.9 from delivery)
-        trigger_type = cms.string('1e'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '315259-315259',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '315264-315265',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.002/pb
-          '315267-315267',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.001/pb
-          '315270-315270',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
-          '315322-315322',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.006/pb
-          '315339-315339',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
-          '315357-315357',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.005/pb
-          '315361-315361',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.004/pb
-          '315363-315363',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.0/pb
-          '315366-315366',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.003/pb
-          '315420-315420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
-          '315488-315490',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.11/pb
-          '315506-315506',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.01/pb
-          '315510-315510',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.038/pb
-          '315512-315512',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.088/pb
-          '315543-315543',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.014/pb
-          '315555-315557',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.042/pb
-          '315640-315642',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.016/pb
-          '315644-315648',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.163/pb
-          '315689-315690',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.166/pb
-          '315702-315705',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.122/pb
-          '315713-315713',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.131/pb
-          '315721-315721',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.078/pb
-          '315741-315741',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.009/pb
-          '315764-315764',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.042/pb
-          '315770-315770',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.045/pb
-          '315784-315786',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.067/pb
-          '315790-315790',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.064/pb
-          '315800-315801',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.113/pb
-          '315840-315840',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14, 0.131/pb
-          '315973-315974',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v14/HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.11/pb
-          '316058-316062',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.19/pb
-          '316082-316082',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.052/pb
-          '316110-316111',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.036/pb
-          '316113-316114',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.144/pb
-          '316153-316153',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.095/pb
-          '316186-316187',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.195/pb
-          '316199-316202',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.218/pb
-          '316216-316219',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.204/pb
-          '316239-316241',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.202/pb
-          '316271-316271',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v15, 0.011/pb
-          '316361-316363',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.031/pb
-          '316377-316380',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.07/pb
-          '316455-316455',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
-          '316457-316457',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.121/pb
-          '316469-316470',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.098/pb
-          '316472-316472',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.025/pb
-          '316505-316505',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.149/pb
-          '316569-316569',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.18/pb
-          '316590-316590',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.07/pb
-          '316613-316613',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '316615-316615',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.018/pb
-          '316666-316667',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.119/pb
-          '316700-316702',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
-          '316715-316723',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.163/pb
-          '316758-316758',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.169/pb
-          '316766-316766',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.208/pb
-          '316876-316877',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.121/pb
-          '316879-316879',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
-          '316928-316928',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.033/pb
-          '316985-316985',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.128/pb
-          '316993-316995',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.197/pb
-          '317080-317080',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '317087-317087',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.18/pb
-          '317089-317089',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.158/pb
-          '317182-317182',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.301/pb
-          '317212-317213',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
-          '317279-317279',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.049/pb
-          '317291-317292',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.266/pb
-          '317297-317297',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.092/pb
-          '317319-317320',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.381/pb
-          '317338-317340',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.163/pb
-          '317382-317383',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.035/pb
-          '317391-317392',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.365/pb
-          '317435-317435',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.267/pb
-          '317438-317438',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
-          '317475-317475',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.019/pb
-          '317478-317478',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '317484-317484',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.119/pb
-          '317488-317488',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.134/pb
-          '317527-317527',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.335/pb
-          '317591-317591',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.082/pb
-          '317626-317626',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.392/pb
-          '317640-317641',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.392/pb
-          '317648-317650',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.358/pb
-          '317661-317661',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.278/pb
-          '317663-317663',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.114/pb
-          '317683-317683',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.087/pb
-          '317696-317696',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.169/pb
-          '318733-318733',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
-          '318828-318828',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.01/pb
-          '318872-318872',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.068/pb
-          '318874-318874',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.074/pb
-          '318876-318877',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.153/pb
-          '319077-319077',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '319337-319337',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.172/pb
-          '319347-319349',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.19/pb
-          '319449-319450',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.338/pb
-          '319456-319456',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.039/pb
-          '319459-319459',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.013/pb
-          '319486-319486',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.015/pb
-          '319503-319503',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.067/pb
-          '319524-319524',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.338/pb
-          '319526-319526',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
-          '319528-319528',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.043/pb
-          '319579-319579',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.606/pb
-          '319625-319625',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
-          '319639-319639',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.303/pb
-          '319656-319659',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.164/pb
-          '319678-319678',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.071/pb
-          '319687-319687',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '319697-319698',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.072/pb
-          '319756-319756',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.363/pb
-          '319840-319841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
-          '319847-319849',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.143/pb
-          '319851-319851',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '319853-319854',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.093/pb
-          '319908-319910',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.24/pb
-          '319912-319915',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
-          '319941-319942',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.083/pb
-          '319950-319950',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.049/pb
-          '319991-319993',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.393/pb
-          '320002-320002',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
-          '320006-320006',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.085/pb
-          '320010-320012',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.114/pb
-          '320023-320026',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.226/pb
-          '320038-320040',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.3/pb
-          '320059-320065',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.293/pb
-          '320673-320674',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.073/pb
-          '320688-320688',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.097/pb
-          '320712-320712',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
-          '320757-320757',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.086/pb
-          '320804-320804',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.236/pb
-          '320807-320807',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '320809-320809',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.079/pb
-          '320821-320824',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.337/pb
-          '320838-320838',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.068/pb
-          '320840-320841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.142/pb
-          '320853-320859',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.321/pb
-          '320887-320888',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.084/pb
-          '320916-320917',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.359/pb
-          '320920-320920',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.018/pb
-          '320933-320934',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.194/pb
-          '320936-320936',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.058/pb
-          '320941-320941',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '320980-320980',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.028/pb
-          '320995-320996',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.055/pb
-          '321004-321007',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.237/pb
-          '321009-321012',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.078/pb
-          '321051-321051',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.231/pb
-          '321055-321055',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.093/pb
-          '321067-321069',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.274/pb
-          '321119-321119',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.043/pb
-          '321121-321122',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.101/pb
-          '321124-321124',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.137/pb
-          '321126-321126',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.058/pb
-          '321134-321134',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '321138-321138',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.105/pb
-          '321140-321140',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.087/pb
-          '321149-321149',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.322/pb
-          '321165-321167',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.206/pb
-          '321177-321178',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.129/pb
-          '321218-321219',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.343/pb
-          '321221-321221',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
-          '321230-321233',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.204/pb
-          '321262-321262',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '321283-321283',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
-          '321294-321296',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.173/pb
-          '321305-321305',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.446/pb
-          '321311-321313',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.065/pb
-          '321393-321393',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
-          '321396-321397',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.309/pb
-          '321414-321415',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.387/pb
-          '321431-321434',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.219/pb
-          '321436-321436',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.103/pb
-          '321457-321457',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.358/pb
-          '321461-321461',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
-          '321475-321475',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.35/pb
-          '321710-321710',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.013/pb
-          '321712-321712',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.063/pb
-          '321730-321730',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.076/pb
-          '321732-321732',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.255/pb
-          '321735-321735',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.018/pb
-          '321755-321755',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.158/pb
-          '321758-321758',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.028/pb
-          '321760-321760',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.108/pb
-          '321773-321778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.129/pb
-          '321780-321781',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.135/pb
-          '321813-321813',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
-          '321815-321815',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
-          '321817-321818',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.212/pb
-          '321820-321820',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.024/pb
-          '321831-321834',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.361/pb
-          '321879-321880',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.097/pb
-          '321887-321887',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.205/pb
-          '321908-321909',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.36/pb
-          '321917-321917',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.193/pb
-          '321919-321919',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '321933-321933',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.075/pb
-          '321960-321961',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.103/pb
-          '321973-321973',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.266/pb
-          '321975-321975',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.108/pb
-          '321988-321988',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.284/pb
-          '321990-321990',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.06/pb
-          '322013-322014',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '322022-322022',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.336/pb
-          '322040-322040',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.01/pb
-          '322057-322057',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.006/pb
-          '322068-322068',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.172/pb
-          '322079-322079',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.104/pb
-          '322106-322106',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.209/pb
-          '322113-322113',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.03/pb
-          '322118-322118',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.199/pb
-          '322179-322179',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.348/pb
-          '322201-322201',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.062/pb
-          '322204-322204',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.23/pb
-          '322222-322222',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.069/pb
-          '322252-322252',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.311/pb
-          '322317-322317',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
-          '322319-322319',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.041/pb
-          '322322-322322',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.217/pb
-          '322324-322324',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.051/pb
-          '322332-322332',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.233/pb
-          '322348-322348',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.307/pb
-          '322355-322356',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.199/pb
-          '322381-322381',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.132/pb
-          '322407-322407',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.126/pb
-          '322430-322431',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.274/pb
-          '322480-322480',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.081/pb
-          '322492-322492',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.213/pb
-          '322510-322510',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
-          '322599-322599',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.07/pb
-          '322602-322603',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.02/pb
-          '322605-322605',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.066/pb
-          '322617-322617',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.101/pb
-          '322625-322625',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.248/pb
-          '322633-322633',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.038/pb
-          '323414-323414',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
-          '323423-323423',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
-          '323470-323475',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.238/pb
-          '323487-323488',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.252/pb
-          '323492-323493',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.025/pb
-          '323495-323495',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.024/pb
-          '323524-323526',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.356/pb
-          '323693-323693',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.03/pb
-          '323696-323696',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.066/pb
-          '323702-323702',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.108/pb
-          '323725-323727',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.282/pb
-          '323755-323755',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.22/pb
-          '323775-323775',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.035/pb
-          '323778-323778',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.201/pb
-          '323790-323790',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.205/pb
-          '323794-323794',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '323841-323841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.115/pb
-          '323857-323857',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.071/pb
-          '323940-323940',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.316/pb
-          '323954-323954',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
-          '323976-323976',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
-          '323978-323978',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
-          '323980-323980',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.05/pb
-          '323983-323983',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.042/pb
-          '323997-323997',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.095/pb
-          '324021-324022',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.282/pb
-          '324077-324077',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.18/pb
-          '324201-324202',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.298/pb
-          '324205-324207',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.033/pb
-          '324209-324209',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '324237-324237',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.056/pb
-          '324245-324245',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.309/pb
-          '324293-324293',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.38/pb
-          '324315-324315',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.052/pb
-          '324318-324318',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.074/pb
-          '324420-324420',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.148/pb
-          '324729-324729',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.011/pb
-          '324747-324747',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.228/pb
-          '324764-324765',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.087/pb
-          '324769-324769',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.035/pb
-          '324772-324772',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
-          '324785-324785',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.138/pb
-          '324791-324791',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.181/pb
-          '324835-324835',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.064/pb
-          '324840-324841',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.244/pb
-          '324846-324846',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.051/pb
-          '324878-324878',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.299/pb
-          '324897-324897',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.037/pb
-          '324970-324970',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.355/pb
-          '324980-324980',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.38/pb
-          '324997-325001',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.274/pb
-          '325022-325022',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.321/pb
-          '325057-325057',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.089/pb
-          '325097-325101',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.261/pb
-          '325110-325110',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
-          '325117-325117',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.063/pb
-          '325159-325159',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.046/pb
-          '325168-325170',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.202/pb
-          '325172-325172',  # HLT_Ele17_CaloIdM_TrackIdM_PFJet30_v16, 0.05/pb
-        )),
-      ),
-      cms.PSet(
-        path = cms.string("HLT_Ele23_CaloIdM_TrackIdM_PFJet30"),
-        cone_minPt = cms.double(32.),
-        cone_maxPt = cms.double(100.),
-        minRecoPt = cms.double(23.),
-        jet_minPt = cms.double(30.),
-        average_prescale = cms.double(1537), # L=38.875/pb; present in all eras; prescale factor 1536.7 (1538.4 from delivery)
-        trigger_type = cms.string('1e'),
-        run_ranges = cms.vstring(*(
-          '315257-315257',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.0/pb
-          '315259-315259',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315264-315265',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
-          '315267-315267',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.002/pb
-          '315270-315270',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
-          '315322-315322',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.008/pb
-          '315339-315339',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.004/pb
-          '315357-315357',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.007/pb
-          '315361-315361',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
-          '315363-315363',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.001/pb
-          '315366-315366',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.005/pb
-          '315420-315420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.012/pb
-          '315488-315490',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.11/pb
-          '315506-315506',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.01/pb
-          '315510-315510',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.038/pb
-          '315512-315512',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.088/pb
-          '315543-315543',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.014/pb
-          '315555-315557',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.042/pb
-          '315640-315642',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.016/pb
-          '315644-315648',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.163/pb
-          '315689-315690',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.166/pb
-          '315702-315705',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.122/pb
-          '315713-315713',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
-          '315721-315721',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.078/pb
-          '315741-315741',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.009/pb
-          '315764-315764',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.042/pb
-          '315770-315770',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.045/pb
-          '315784-315786',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.067/pb
-          '315790-315790',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.064/pb
-          '315800-315801',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.113/pb
-          '315840-315840',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16, 0.131/pb
-          '315973-315974',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v16/HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.11/pb
-          '316058-316062',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.19/pb
-          '316082-316082',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.052/pb
-          '316110-316111',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.036/pb
-          '316113-316114',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.144/pb
-          '316153-316153',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.095/pb
-          '316186-316187',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.195/pb
-          '316199-316202',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.218/pb
-          '316216-316219',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.204/pb
-          '316239-316241',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.202/pb
-          '316271-316271',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v17, 0.011/pb
-          '316361-316363',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.031/pb
-          '316377-316380',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
-          '316455-316455',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '316457-316457',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.121/pb
-          '316469-316470',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.098/pb
-          '316472-316472',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
-          '316505-316505',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.149/pb
-          '316569-316569',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.18/pb
-          '316590-316590',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
-          '316613-316613',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '316615-316615',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '316666-316667',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.119/pb
-          '316700-316702',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.131/pb
-          '316715-316723',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.163/pb
-          '316758-316758',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.169/pb
-          '316766-316766',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.208/pb
-          '316876-316877',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.121/pb
-          '316879-316879',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '316928-316928',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.033/pb
-          '316985-316985',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.128/pb
-          '316993-316995',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.197/pb
-          '317080-317080',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '317087-317087',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.18/pb
-          '317089-317089',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.158/pb
-          '317182-317182',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.301/pb
-          '317212-317213',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.131/pb
-          '317279-317279',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
-          '317291-317292',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.266/pb
-          '317297-317297',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.092/pb
-          '317319-317320',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.381/pb
-          '317338-317340',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.163/pb
-          '317382-317383',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '317391-317392',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.365/pb
-          '317435-317435',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.267/pb
-          '317438-317438',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
-          '317475-317475',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.019/pb
-          '317478-317478',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '317484-317484',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.119/pb
-          '317488-317488',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.134/pb
-          '317527-317527',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.335/pb
-          '317591-317591',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.082/pb
-          '317626-317626',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.392/pb
-          '317640-317641',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.392/pb
-          '317648-317650',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.358/pb
-          '317661-317661',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.278/pb
-          '317663-317663',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.114/pb
-          '317683-317683',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.087/pb
-          '317696-317696',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.169/pb
-          '318733-318733',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '318828-318828',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
-          '318872-318872',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
-          '318874-318874',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.074/pb
-          '318876-318877',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.153/pb
-          '319077-319077',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '319337-319337',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.172/pb
-          '319347-319349',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.19/pb
-          '319449-319450',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.338/pb
-          '319456-319456',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.039/pb
-          '319459-319459',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '319486-319486',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.015/pb
-          '319503-319503',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.067/pb
-          '319524-319524',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.338/pb
-          '319526-319526',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
-          '319528-319528',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
-          '319579-319579',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.606/pb
-          '319625-319625',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
-          '319639-319639',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.303/pb
-          '319656-319659',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.164/pb
-          '319678-319678',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.071/pb
-          '319687-319687',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '319697-319698',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.072/pb
-          '319756-319756',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.363/pb
-          '319840-319841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
-          '319847-319849',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.143/pb
-          '319851-319851',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '319853-319854',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.093/pb
-          '319908-319910',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.24/pb
-          '319912-319915',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
-          '319941-319942',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.083/pb
-          '319950-319950',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.049/pb
-          '319991-319993',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.393/pb
-          '320002-320002',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
-          '320006-320006',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.085/pb
-          '320010-320012',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.114/pb
-          '320023-320026',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.226/pb
-          '320038-320040',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.3/pb
-          '320059-320065',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.293/pb
-          '320673-320674',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.073/pb
-          '320688-320688',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.097/pb
-          '320712-320712',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
-          '320757-320757',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.086/pb
-          '320804-320804',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.236/pb
-          '320807-320807',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.0/pb
-          '320809-320809',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.079/pb
-          '320821-320824',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.337/pb
-          '320838-320838',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.068/pb
-          '320840-320841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.142/pb
-          '320853-320859',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.321/pb
-          '320887-320888',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.084/pb
-          '320916-320917',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.359/pb
-          '320920-320920',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '320933-320934',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.194/pb
-          '320936-320936',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.058/pb
-          '320941-320941',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '320980-320980',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
-          '320995-320996',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.055/pb
-          '321004-321007',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.237/pb
-          '321009-321012',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.078/pb
-          '321051-321051',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.231/pb
-          '321055-321055',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.093/pb
-          '321067-321069',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.274/pb
-          '321119-321119',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.043/pb
-          '321121-321122',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.101/pb
-          '321124-321124',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.137/pb
-          '321126-321126',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.058/pb
-          '321134-321134',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '321138-321138',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.105/pb
-          '321140-321140',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.087/pb
-          '321149-321149',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.322/pb
-          '321165-321167',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.206/pb
-          '321177-321178',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.129/pb
-          '321218-321219',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.343/pb
-          '321221-321221',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '321230-321233',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.204/pb
-          '321262-321262',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '321283-321283',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
-          '321294-321296',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.173/pb
-          '321305-321305',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.446/pb
-          '321311-321313',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.065/pb
-          '321393-321393',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
-          '321396-321397',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.309/pb
-          '321414-321415',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.387/pb
-          '321431-321434',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.219/pb
-          '321436-321436',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.103/pb
-          '321457-321457',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.358/pb
-          '321461-321461',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '321475-321475',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.35/pb
-          '321710-321710',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.013/pb
-          '321712-321712',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
-          '321730-321730',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.076/pb
-          '321732-321732',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.255/pb
-          '321735-321735',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.018/pb
-          '321755-321755',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.158/pb
-          '321758-321758',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.028/pb
-          '321760-321760',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
-          '321773-321778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.129/pb
-          '321780-321781',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.135/pb
-          '321813-321813',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
-          '321815-321815',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.004/pb
-          '321817-321818',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.212/pb
-          '321820-321820',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '321831-321834',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.361/pb
-          '321879-321880',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.097/pb
-          '321887-321887',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.205/pb
-          '321908-321909',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.36/pb
-          '321917-321917',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.193/pb
-          '321919-321919',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.001/pb
-          '321933-321933',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.075/pb
-          '321960-321961',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.103/pb
-          '321973-321973',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.266/pb
-          '321975-321975',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
-          '321988-321988',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.284/pb
-          '321990-321990',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.06/pb
-          '322013-322014',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '322022-322022',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.336/pb
-          '322040-322040',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.01/pb
-          '322057-322057',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.006/pb
-          '322068-322068',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.172/pb
-          '322079-322079',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.104/pb
-          '322106-322106',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.209/pb
-          '322113-322113',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.03/pb
-          '322118-322118',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.199/pb
-          '322179-322179',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.348/pb
-          '322201-322201',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.062/pb
-          '322204-322204',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.23/pb
-          '322222-322222',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.069/pb
-          '322252-322252',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.311/pb
-          '322317-322317',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '322319-322319',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.041/pb
-          '322322-322322',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.217/pb
-          '322324-322324',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.051/pb
-          '322332-322332',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.233/pb
-          '322348-322348',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.307/pb
-          '322355-322356',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.199/pb
-          '322381-322381',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.132/pb
-          '322407-322407',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.126/pb
-          '322430-322431',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.274/pb
-          '322480-322480',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.081/pb
-          '322492-322492',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.213/pb
-          '322510-322510',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '322599-322599',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.07/pb
-          '322602-322603',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.02/pb
-          '322605-322605',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.066/pb
-          '322617-322617',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.101/pb
-          '322625-322625',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.248/pb
-          '322633-322633',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.038/pb
-          '323414-323414',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.005/pb
-          '323423-323423',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '323470-323475',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.238/pb
-          '323487-323488',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.252/pb
-          '323492-323493',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.025/pb
-          '323495-323495',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.024/pb
-          '323524-323526',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.356/pb
-          '323693-323693',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.03/pb
-          '323696-323696',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.066/pb
-          '323702-323702',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.108/pb
-          '323725-323727',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.282/pb
-          '323755-323755',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.22/pb
-          '323775-323775',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '323778-323778',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.201/pb
-          '323790-323790',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.205/pb
-          '323794-323794',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '323841-323841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.115/pb
-          '323857-323857',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.071/pb
-          '323940-323940',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.316/pb
-          '323954-323954',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '323976-323976',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '323978-323978',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.016/pb
-          '323980-323980',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
-          '323983-323983',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.042/pb
-          '323997-323997',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.095/pb
-          '324021-324022',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.282/pb
-          '324077-324077',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.18/pb
-          '324201-324202',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.298/pb
-          '324205-324207',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.033/pb
-          '324209-324209',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.012/pb
-          '324237-324237',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.056/pb
-          '324245-324245',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.309/pb
-          '324293-324293',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.38/pb
-          '324315-324315',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.052/pb
-          '324318-324318',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.074/pb
-          '324420-324420',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.148/pb
-          '324729-324729',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.011/pb
-          '324747-324747',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.228/pb
-          '324764-324765',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.087/pb
-          '324769-324769',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.035/pb
-          '324772-324772',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.014/pb
-          '324785-324785',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.138/pb
-          '324791-324791',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.181/pb
-          '324835-324835',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.064/pb
-          '324840-324841',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.244/pb
-          '324846-324846',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.051/pb
-          '324878-324878',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.299/pb
-          '324897-324897',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.037/pb
-          '324970-324970',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.355/pb
-          '324980-324980',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.38/pb
-          '324997-325001',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.274/pb
-          '325022-325022',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.321/pb
-          '325057-325057',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.089/pb
-          '325097-325101',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.261/pb
-          '325110-325110',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.002/pb
-          '325117-325117',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.063/pb
-          '325159-325159',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.046/pb
-          '325168-325170',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.202/pb
-          '325172-325172',  # HLT_Ele23_CaloIdM_TrackIdM_PFJet30_v18, 0.05/pb
-        )),
-      ),
-    ),
-  },
-}
+from tthAnalysis.NanoAOD.eraTables import LazyEraDict
 
-for era in leptonFR_triggers:
-  for lepton in leptonFR_triggers[era]:
-    for hlt_path in leptonFR_triggers[era][lepton]:
+def add_trigger_flags(leptonFR_triggers_era):
+  for lepton in leptonFR_triggers_era:
+    for hlt_path in leptonFR_triggers_era[lepton]:
       if hlt_path.trigger_type.value() == '1mu':
         assert(lepton == 'mu')
         hlt_path.is_trigger_1mu = cms.bool(True)
@@ -5862,3 +31,8 @@ for era in leptonFR_triggers:
         hlt_path.is_trigger_2e  = cms.bool(True)
       else:
         raise ValueError("Invalid trigger type: %s" % hlt_path.trigger_type.value())
+
+# the tables are defined in LeptonFakeRate_trigger_<era>_cfi.py and loaded on first access
+leptonFR_triggers = LazyEraDict(
+  'tthAnalysis.NanoAOD.LeptonFakeRate_trigger_{}_cfi', 'leptonFR_triggers', add_trigger_flags
+)
@@ -5,6 +5,7 @@ from tthAnalysis.NanoAOD.addJetSubstructureObservables import addJetSubstructure
 from tthAnalysis.NanoAOD.addLeptonSubtractedAK8Jets import addLeptonSubtractedAK8Jets
 from tthAnalysis.NanoAOD.addLeptonSubtractedAK4Jets import addLeptonSubtractedAK4Jets
 from tthAnalysis.NanoAOD.triggers import Triggers
+from tthAnalysis.NanoAOD.intervals import IntervalSet
 
 from PhysicsTools.NanoAOD.common_cff import Var, ExtVar
 from Configuration.Eras.Modifier_run2_miniAOD_80XLegacy_cff import run2_miniAOD_80XLegacy
@@ -164,7 +165,17 @@ def recomputeQGL(process):
   )
   process.es_prefer_qgl = cms.ESPrefer("PoolDBESSource", "QGPoolDBESSource")
 
-def addVariables(process, is_mc, year, reportEvery, hlt_filter, suppressMessages = True, checkUniqueness = True):
+def getLumiMaskRuns(process):
+  if not hasattr(process.source, 'lumisToProcess'):
+    return None
+  run_ranges = []
+  for lumi_range in process.source.lumisToProcess:
+    # single lumis, e.g. '273158:1', have no explicit end run
+    run_ranges.append((lumi_range.start(), max(lumi_range.start(), lumi_range.end())))
+  return IntervalSet(run_ranges) if run_ranges else None
+
+def addVariables(process, is_mc, year, reportEvery, hlt_filter, suppressMessages = True, checkUniqueness = True,
+                 pruneHltFilter = False):
 
   process.electronTable.variables.hoe.precision = cms.int32(12)
   process.electronTable.variables.deltaPhiSC = Var(
@@ -347,7 +358,25 @@ def addVariables(process, is_mc, year, reportEvery, hlt_filter, suppressMessages
     else:
       raise ValueError("Invalid value for 'hlt_filter' option: %s" % hlt_filter)
 
-    triggers = [ '{}_v*'.format(trigger) for trigger in getattr(Triggers(year), triggers_attr) ]
+    triggers_obj = Triggers(year)
+    trigger_names = getattr(triggers_obj, triggers_attr)
+    if pruneHltFilter:
+      # keep only the paths that are active in the runs of the lumi mask; if the mask is applied later (by CRAB, for
+      # instance), this is a no-op
+      lumi_mask_runs = getLumiMaskRuns(process) if not is_mc else None
+      if lumi_mask_runs:
+        trigger_names_live = trigger_names & triggers_obj.active_paths_in(lumi_mask_runs)
+        print(
+          "Dropped {} out of {} HLT paths that are not active in the runs selected by the lumi mask: {}".format(
+            len(trigger_names) - len(trigger_names_live),
+            len(trigger_names),
+            ', '.join(sorted(trigger_names - trigger_names_live)),
+          )
+        )
+        trigger_names = trigger_names_live
+      else:
+        print("NOT pruning the HLT paths because there is no lumi mask to intersect with")
+    triggers = [ '{}_v*'.format(trigger) for trigger in sorted(trigger_names) ]
     process.triggerFilter = triggerResultsFilter.clone(
       hltResults        = cms.InputTag("TriggerResults::HLT"),
       triggerConditions = cms.vstring(triggers),
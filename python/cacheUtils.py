@@ -0,0 +1,35 @@
+import logging
+import os
+import tempfile
+
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle
+
+CACHE_DIR_ENV = 'TTH_NANOAOD_CACHE_DIR'
+CACHE_DIR_DEFAULT = os.path.join(os.path.expanduser('~'), '.cache', 'tthAnalysis', 'NanoAOD')
+
+def get_cache_dir():
+  return os.environ.get(CACHE_DIR_ENV, CACHE_DIR_DEFAULT)
+
+def read_cache(cache_path):
+  try:
+    with open(cache_path, 'rb') as cache_file:
+      return pickle.load(cache_file)
+  except Exception:
+    # a missing, truncated or incompatible cache file is rebuilt by the caller
+    return None
+
+def write_cache(cache_path, obj):
+  cache_dir = os.path.dirname(cache_path)
+  try:
+    if not os.path.isdir(cache_dir):
+      os.makedirs(cache_dir)
+    # write to a temporary file first, so that concurrent jobs never see a partially written cache
+    cache_fd, cache_tmp_path = tempfile.mkstemp(dir = cache_dir, suffix = '.tmp')
+    with os.fdopen(cache_fd, 'wb') as cache_file:
+      pickle.dump(obj, cache_file, protocol = 2)
+    os.rename(cache_tmp_path, cache_path)
+  except (IOError, OSError) as err:
+    logging.getLogger(__name__).debug("Unable to write cache file {}: {}".format(cache_path, err))
@@ -0,0 +1,92 @@
+from tthAnalysis.NanoAOD.cacheUtils import get_cache_dir
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+DAS_CACHE_NAME = 'das.sqlite'
+
+# time-to-live of the cached responses in seconds; None means that the response never expires
+TTL_IMMUTABLE = None
+TTL_DEFAULT = 24 * 3600
+TTL_SHORT = 3600
+
+# the parents, files and lumis of a VALID dataset do not change anymore
+IMMUTABLE_QUERY_TYPES = [ 'parent', 'file', 'run,lumi', 'lumi' ]
+
+def normalize_query(query, options = ()):
+  return ' '.join(query.split() + sorted(options))
+
+def get_query_type(query):
+  query_split = query.split()
+  return query_split[0].split('=')[0] if query_split else ''
+
+def get_ttl(query, status = None):
+  """Returns the time-to-live of a query given the status of the dataset it refers to, if known"""
+  if status == 'PRODUCTION' or '*' in query:
+    # datasets in production keep changing and the wildcard searches pick up new datasets
+    return TTL_SHORT
+  if status == 'VALID' and get_query_type(query) in IMMUTABLE_QUERY_TYPES:
+    return TTL_IMMUTABLE
+  return TTL_DEFAULT
+
+class DASCache(object):
+  """Stores the responses of DAS queries in an SQLite database that is shared by all dataset scripts
+
+  The responses are keyed by the normalized query string. With refresh enabled the cached responses are ignored,
+  but the new responses are still stored for the next invocation.
+  """
+
+  def __init__(self, path = '', refresh = False):
+    if not path:
+      path = os.path.join(get_cache_dir(), DAS_CACHE_NAME)
+    cache_dir = os.path.dirname(path)
+    if cache_dir and not os.path.isdir(cache_dir):
+      os.makedirs(cache_dir)
+    self.path = path
+    self.refresh = refresh
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(path, timeout = 60, check_same_thread = False)
+    with self.lock, self.connection:
+      self.connection.execute(
+        'CREATE TABLE IF NOT EXISTS responses (query TEXT PRIMARY KEY, response TEXT, created REAL, expires REAL)'
+      )
+    logging.debug("Using DAS cache: {}".format(path))
+
+  def get(self, query, options = ()):
+    if self.refresh:
+      return None
+    with self.lock:
+      row = self.connection.execute(
+        'SELECT response, expires FROM responses WHERE query = ?', (normalize_query(query, options),)
+      ).fetchone()
+    if row is None:
+      return None
+    response, expires = row
+    if expires is not None and expires < time.time():
+      return None
+    return response
+
+  def put(self, query, response, ttl = TTL_DEFAULT, options = ()):
+    created = time.time()
+    expires = created + ttl if ttl is not None else None
+    with self.lock, self.connection:
+      self.connection.execute(
+        'INSERT OR REPLACE INTO responses (query, response, created, expires) VALUES (?, ?, ?, ?)',
+        (normalize_query(query, options), response, created, expires)
+      )
+
+  def purge(self):
+    """Removes the expired responses"""
+    with self.lock, self.connection:
+      self.connection.execute('DELETE FROM responses WHERE expires IS NOT NULL AND expires < ?', (time.time(),))
+
+  def close(self):
+    with self.lock:
+      self.connection.close()
+
+def get_das_cache(refresh = False):
+  """Returns the shared DAS cache, or None if the caches are disabled with an empty TTH_NANOAOD_CACHE_DIR"""
+  return DASCache(refresh = refresh) if get_cache_dir() else None
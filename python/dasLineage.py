@@ -0,0 +1,101 @@
+from tthAnalysis.NanoAOD.dasMetadata import fetch_metadata, get_parent_query
+
+import collections
+import json
+import logging
+import os
+
+def parse_parents(query_out):
+  return [ line.strip() for line in query_out.split('\n') if line.strip().startswith('/') ]
+
+class DatasetLineage(object):
+  """Memoized parent graph of DAS datasets
+
+  The graph is crawled breadth-first: the parents of all datasets at the same depth are fetched concurrently in one
+  go, and every dataset is visited only once, no matter how many children it has. Crawling the same graph deeper or
+  for additional datasets reuses the datasets that have already been visited.
+  """
+
+  def __init__(self, das):
+    self.das = das
+    self.metadata = collections.OrderedDict()
+    self.parents = {}
+
+  def crawl(self, datasets, depth):
+    """Fetches the metadata of the given datasets and their ancestors up to the given number of generations
+
+    Only the metadata of the given datasets is queried, since the ancestors are reported by name only. Nothing is
+    fetched for the datasets in the last generation, since their parents would lie beyond the requested depth.
+    """
+    datasets = list(collections.OrderedDict.fromkeys(datasets))
+    datasets_missing = [ dataset for dataset in datasets if dataset not in self.metadata ]
+    if datasets_missing:
+      for dataset, metadata in fetch_metadata(self.das, datasets_missing, parents = True).items():
+        self.metadata[dataset] = metadata
+        self.parents[dataset] = parse_parents(metadata.parent)
+    level = datasets
+    for generation in range(1, depth):
+      level = list(collections.OrderedDict.fromkeys(
+        parent for dataset in level for parent in self.parents.get(dataset, [])
+      ))
+      if not level:
+        break
+      level_missing = [ dataset for dataset in level if dataset not in self.parents ]
+      if level_missing:
+        logging.debug("Fetching the parents of {} dataset(s) in generation {}".format(len(level_missing), generation))
+        parent_outs = self.das.query_many(list(map(get_parent_query, level_missing)))
+        for dataset, parent_out in zip(level_missing, parent_outs):
+          self.parents[dataset] = parse_parents(parent_out)
+    return self
+
+  def get_parents(self, dataset):
+    return self.parents.get(dataset, [])
+
+  def get_parent(self, dataset):
+    """Returns the first parent of the dataset, or an empty string if the dataset has no known parents"""
+    parents = self.get_parents(dataset)
+    if len(parents) > 1:
+      logging.warning("Dataset {} has multiple parents: {}".format(dataset, ', '.join(parents)))
+    return parents[0] if parents else ''
+
+  def get_ancestors(self, dataset, depth):
+    """Returns the list of ancestors of the dataset in each generation, up to the given number of generations"""
+    ancestors = []
+    level = [ dataset ]
+    for _ in range(depth):
+      level = list(collections.OrderedDict.fromkeys(
+        parent for child in level for parent in self.get_parents(child)
+      ))
+      if not level:
+        break
+      ancestors.append(level)
+    return ancestors
+
+  def to_dict(self, datasets, depth):
+    datasets_dict = collections.OrderedDict()
+    for dataset in datasets:
+      metadata = self.metadata[dataset]
+      datasets_dict[dataset] = collections.OrderedDict([
+        ( 'nevents',                metadata.nevents                ),
+        ( 'last_modification_date', metadata.last_modification_date ),
+        ( 'status',                 metadata.status                 ),
+        ( 'parents',                self.parents.get(dataset)       ),
+      ])
+    return {
+      'depth'    : depth,
+      'datasets' : datasets_dict,
+      'lineage'  : collections.OrderedDict(
+        ( dataset, self.get_ancestors(dataset, depth) ) for dataset in datasets
+      ),
+    }
+
+  def dump(self, output_fn, datasets, depth):
+    """Writes the graph into a JSON file
+
+    The metadata is written for the given datasets only, while their ancestors appear in the lineage by name.
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_fn))
+    if not os.path.isdir(output_dir):
+      os.makedirs(output_dir)
+    with open(output_fn, 'w') as output_file:
+      json.dump(self.to_dict(datasets, depth), output_file, indent = 2)
@@ -0,0 +1,98 @@
+import collections
+import logging
+
+DatasetMetadata = collections.namedtuple('DatasetMetadata', [
+  'name', 'nevents', 'last_modification_date', 'status', 'parent',
+])
+
+METADATA_FIELDS = [ 'name', 'nevents', 'last_modification_date', 'dataset_access_type' ]
+METADATA_GREP = ', '.join('dataset.{}'.format(field) for field in METADATA_FIELDS)
+
+# DAS merges the records of several services, so the same dataset may otherwise be listed more than once
+METADATA_OPTIONS = [ '-unique' ]
+
+def split_dataset(dataset):
+  dataset_split = dataset.split('/')
+  if len(dataset_split) != 4 or dataset_split[0]:
+    raise ValueError("Invalid dataset name: %s" % dataset)
+  return dataset_split[1], dataset_split[2], dataset_split[3]
+
+def get_group_query(primary_dataset, tier):
+  return "dataset dataset=/{}/*/{} status=* | grep {}".format(primary_dataset, tier, METADATA_GREP)
+
+def get_dataset_query(dataset):
+  return "dataset dataset={} status=* | grep {}".format(dataset, METADATA_GREP)
+
+def get_parent_query(dataset):
+  return "parent dataset={}".format(dataset)
+
+def to_int(value_str):
+  try:
+    return int(value_str)
+  except ValueError:
+    return None
+
+def parse_metadata(query_out):
+  """Parses the output of a metadata query into a dictionary of dataset name -> ( nevents, date, status )"""
+  metadata = {}
+  for line in query_out.split('\n'):
+    line_split = line.split()
+    if not line_split or line_split[0].startswith('['):
+      continue
+    if len(line_split) != len(METADATA_FIELDS):
+      logging.debug("Skipping unexpected line in the dataset metadata: {}".format(line))
+      continue
+    name, nevents, date, status = line_split
+    metadata[name] = ( to_int(nevents), to_int(date), status )
+  return metadata
+
+def fetch_metadata(das, datasets, parents = False):
+  """Returns the metadata of the given datasets as a dictionary of dataset name -> DatasetMetadata
+
+  The datasets are grouped by their primary dataset name and data tier, and the metadata of each group is
+  retrieved in a single wildcard query. The datasets that are missing from the wildcard results are queried one by
+  one. All queries go through the DAS query engine, so they run concurrently and their results are cached. The
+  parents cannot be retrieved in bulk, so they are queried concurrently per dataset if requested. The fields that
+  could not be retrieved are set to None.
+  """
+  datasets = list(collections.OrderedDict.fromkeys(datasets))
+  groups = collections.OrderedDict()
+  for dataset in datasets:
+    primary_dataset, _, tier = split_dataset(dataset)
+    groups[(primary_dataset, tier)] = None
+
+  metadata = {}
+  group_queries = [ get_group_query(primary_dataset, tier) for primary_dataset, tier in groups ]
+  for query_out in das.query_many(group_queries, METADATA_OPTIONS):
+    metadata.update(parse_metadata(query_out))
+  datasets_missing = [ dataset for dataset in datasets if dataset not in metadata ]
+  if datasets_missing:
+    # each of these costs an extra query, so a growing number hints at a change in how DAS matches the wildcards
+    logging.info("Metadata of {}/{} dataset(s) missing from the wildcard queries, querying them one by one".format(
+      len(datasets_missing), len(datasets)
+    ))
+    for query_out in das.query_many(list(map(get_dataset_query, datasets_missing)), METADATA_OPTIONS):
+      metadata.update(parse_metadata(query_out))
+
+  for dataset in datasets:
+    if dataset not in metadata:
+      logging.warning("Unable to find metadata for dataset {}".format(dataset))
+      metadata[dataset] = ( None, None, None )
+
+  parent_outs = {}
+  if parents:
+    parent_outs = dict(zip(datasets, das.map(
+      lambda dataset: das.query(get_parent_query(dataset), status = metadata[dataset][2]), datasets
+    )))
+
+  result = collections.OrderedDict()
+  for dataset in datasets:
+    nevents, date, status = metadata[dataset]
+    result[dataset] = DatasetMetadata(
+      name                   = dataset,
+      nevents                = nevents,
+      last_modification_date = date,
+      status                 = status,
+      parent                 = parent_outs.get(dataset, ''),
+    )
+  return result
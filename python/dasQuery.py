@@ -0,0 +1,137 @@
+from tthAnalysis.NanoAOD.dasCache import get_ttl
+from tthAnalysis.NanoAOD.processUtils import run_command, run_command_stream
+
+import logging
+import os
+import threading
+import time
+
+import multiprocessing.pool
+
+DASGOCLIENT_ENV = 'DASGOCLIENT'
+DASGOCLIENT_DEFAULT = 'dasgoclient'
+
+# marks the cache entries that hold parsed results instead of raw query outputs
+PARSED_CACHE_TAG = '#parsed'
+
+def get_executable(executable = ''):
+  # a mock dasgoclient can be plugged in with an environment variable instead of a command line option
+  return executable or os.environ.get(DASGOCLIENT_ENV, DASGOCLIENT_DEFAULT)
+
+class DASQueryEngine(object):
+  """Runs dasgoclient queries concurrently with per-query timeouts and retries
+
+  At most nof_workers dasgoclient processes run at the same time, no matter how many threads submit the queries.
+  A query that times out or exits with a non-zero code is retried after an exponentially growing delay. The
+  results are memoized, so that the same query is sent only once per engine, and stored in the optional DASCache,
+  so that they are not sent again in the next invocation either.
+  """
+
+  def __init__(self, executable = '', nof_workers = 8, timeout = 60, max_tries = 5, backoff = 1., max_backoff = 60.,
+               cache = None):
+    if nof_workers < 1:
+      raise ValueError("Invalid number of workers: %d" % nof_workers)
+    if max_tries < 1:
+      raise ValueError("Invalid number of tries: %d" % max_tries)
+    self.executable = get_executable(executable)
+    self.nof_workers = nof_workers
+    self.timeout = timeout
+    self.max_tries = max_tries
+    self.backoff = backoff
+    self.max_backoff = max_backoff
+    self.slots = threading.BoundedSemaphore(nof_workers)
+    self.results = {}
+    self.results_lock = threading.Lock()
+    # the threads that send the same query at the same time wait for the first one instead of sending it again
+    self.query_locks = {}
+    self.cache = cache
+
+  def get_command(self, query, options = ()):
+    return [ self.executable, '-query={}'.format(query) ] + list(options)
+
+  def get_delay(self, ntries):
+    return min(self.backoff * 2 ** (ntries - 1), self.max_backoff)
+
+  def execute(self, query, options = (), parse = None):
+    """Runs a query with retries and returns its output, or the output parsed while streaming if parse is given"""
+    cmd = self.get_command(query, options)
+    for ntries in range(1, self.max_tries + 1):
+      with self.slots:
+        if parse is None:
+          out, err, returncode, timed_out = run_command(cmd, self.timeout)
+        else:
+          out, err, returncode, timed_out = run_command_stream(cmd, self.timeout, parse)
+      if not timed_out and returncode == 0:
+        return out
+      reason = 'timed out after {}s'.format(self.timeout) if timed_out else 'exited with code {}: {}'.format(
+        returncode, err
+      )
+      if ntries < self.max_tries:
+        delay = self.get_delay(ntries)
+        logging.warning("Query '{}' {} (try {}/{}), retrying in {:.1f}s".format(
+          query, reason, ntries, self.max_tries, delay
+        ))
+        time.sleep(delay)
+    raise RuntimeError("Query '%s' failed after %d tries: %s" % (query, self.max_tries, reason))
+
+  def query(self, query, options = (), status = None):
+    """Returns the output of a single query, without the trailing newline
+
+    The status of the dataset in the query, if known, determines how long the output is cached.
+    """
+    key = (query, tuple(options))
+    with self.results_lock:
+      if key in self.results:
+        return self.results[key]
+      query_lock = self.query_locks.setdefault(key, threading.Lock())
+    with query_lock:
+      with self.results_lock:
+        if key in self.results:
+          return self.results[key]
+      out = self.cache.get(query, options) if self.cache else None
+      if out is None:
+        logging.debug("Running query: {}".format(query))
+        out = self.execute(query, options)
+        if self.cache:
+          self.cache.put(query, out, get_ttl(query, status), options)
+      with self.results_lock:
+        self.results[key] = out
+        del self.query_locks[key]
+    return out
+
+  def query_parsed(self, query, parse, options = (), status = None, serialize = None, deserialize = None):
+    """Returns the output of a single query as parsed by the given function
+
+    The parse function receives an iterator over the lines of the output. The output is parsed while it is read from
+    dasgoclient and, unlike in query(), it is not memoized, so that large outputs such as the files or the lumis of a
+    dataset are never held in memory as a whole. For the same reason the raw output is never stored in the DAS
+    cache: only the parsed result is cached, and only if it can be converted to and from a string with the given
+    serialize and deserialize functions.
+    """
+    use_cache = self.cache is not None and serialize is not None and deserialize is not None
+    # the parsed results are kept apart from the raw outputs of the same query
+    cache_options = list(options) + [ PARSED_CACHE_TAG ]
+    if use_cache:
+      cached = self.cache.get(query, cache_options)
+      if cached is not None:
+        return deserialize(cached)
+    logging.debug("Running query: {}".format(query))
+    result = self.execute(query, options, parse)
+    if use_cache:
+      self.cache.put(query, serialize(result), get_ttl(query, status), cache_options)
+    return result
+
+  def map(self, func, iterable):
+    """Calls the function on every item in a pool of threads and returns the results in the same order"""
+    items = list(iterable)
+    if not items:
+      return []
+    pool = multiprocessing.pool.ThreadPool(min(self.nof_workers, len(items)))
+    try:
+      return pool.map(func, items)
+    finally:
+      pool.close()
+      pool.join()
+
+  def query_many(self, queries, options = (), status = None):
+    return self.map(lambda query: self.query(query, options, status), queries)
@@ -0,0 +1,156 @@
+from tthAnalysis.NanoAOD.dasCache import normalize_query
+from tthAnalysis.NanoAOD.processUtils import run_command
+
+import collections
+import os
+import sqlite3
+import sys
+import time
+
+# the fake dasgoclient is configured with environment variables, so that it can stand in for dasgoclient in any tool
+REPLAY_FIXTURES_ENV = 'DAS_REPLAY_FIXTURES'
+REPLAY_MODE_ENV = 'DAS_REPLAY_MODE'
+REPLAY_LATENCY_ENV = 'DAS_REPLAY_LATENCY'
+REPLAY_CLIENT_ENV = 'DAS_REPLAY_CLIENT'
+REPLAY_LOG_ENV = 'DAS_REPLAY_LOG'
+
+REPLAY_MODES = [ 'replay', 'record' ]
+LATENCY_RECORDED = 'recorded'
+DASGOCLIENT_NAME = 'dasgoclient'
+RECORD_TIMEOUT = 300
+
+Fixture = collections.namedtuple('Fixture', [ 'out', 'err', 'returncode', 'duration' ])
+
+class FixtureStore(object):
+  """Recorded dasgoclient responses, keyed by the normalized query string and stored in an SQLite database"""
+
+  def __init__(self, path):
+    fixture_dir = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(fixture_dir):
+      os.makedirs(fixture_dir)
+    self.path = path
+    self.connection = sqlite3.connect(path, timeout = 60)
+    with self.connection:
+      self.connection.execute(
+        'CREATE TABLE IF NOT EXISTS fixtures '
+        '(query TEXT PRIMARY KEY, out TEXT, err TEXT, returncode INTEGER, duration REAL)'
+      )
+
+  def get(self, query, options = ()):
+    row = self.connection.execute(
+      'SELECT out, err, returncode, duration FROM fixtures WHERE query = ?', (normalize_query(query, options),)
+    ).fetchone()
+    return Fixture(*row) if row else None
+
+  def put(self, query, fixture, options = ()):
+    with self.connection:
+      self.connection.execute(
+        'INSERT OR REPLACE INTO fixtures (query, out, err, returncode, duration) VALUES (?, ?, ?, ?, ?)',
+        (normalize_query(query, options), fixture.out, fixture.err, fixture.returncode, fixture.duration)
+      )
+
+  def __len__(self):
+    return self.connection.execute('SELECT COUNT(*) FROM fixtures').fetchone()[0]
+
+  def close(self):
+    self.connection.close()
+
+def parse_client_args(argv):
+  """Splits the dasgoclient arguments into the query and the remaining options"""
+  query = ''
+  options = []
+  args = list(argv)
+  while args:
+    arg = args.pop(0)
+    if arg.startswith('-query=') or arg.startswith('--query='):
+      query = arg.split('=', 1)[1]
+    elif arg in [ '-query', '--query' ] and args:
+      query = args.pop(0)
+    else:
+      options.append(arg)
+  return query, options
+
+def find_real_client(exclude):
+  """Returns the first dasgoclient in $PATH that is not the fake one"""
+  for path_dir in os.environ.get('PATH', '').split(os.pathsep):
+    candidate = os.path.join(path_dir, DASGOCLIENT_NAME)
+    if os.path.isfile(candidate) and os.access(candidate, os.X_OK) and \
+       os.path.realpath(candidate) != os.path.realpath(exclude):
+      return candidate
+  return ''
+
+def write_text(stream, text):
+  # the responses are stored as text, whereas the standard streams of py2 expect bytes
+  stream.write(text + '\n' if sys.version_info[0] >= 3 else (text + u'\n').encode('utf-8'))
+
+def get_latency(fixture, latency_str):
+  if latency_str == LATENCY_RECORDED:
+    return fixture.duration or 0.
+  return float(latency_str) if latency_str else 0.
+
+def log_query(log_fn, status, query, options):
+  if not log_fn:
+    return
+  # a single short write in append mode, so that concurrent clients do not interleave their lines
+  with open(log_fn, 'a') as log_file:
+    log_file.write('{}\t{}\n'.format(status, normalize_query(query, options)))
+
+def read_log(log_fn):
+  """Returns the number of queries per status, plus the number of unique queries, in the log of the fake client"""
+  stats = collections.Counter()
+  queries = set()
+  if os.path.isfile(log_fn):
+    with open(log_fn, 'r') as log_file:
+      for line in log_file:
+        status, _, query = line.rstrip('\n').partition('\t')
+        stats[status] += 1
+        queries.add(query)
+  stats['unique'] = len(queries)
+  return stats
+
+def record(store, query, options, client):
+  if not client:
+    raise RuntimeError("Unable to find the real %s in $PATH or $%s" % (DASGOCLIENT_NAME, REPLAY_CLIENT_ENV))
+  t_start = time.time()
+  out, err, returncode, timed_out = run_command([ client, '-query={}'.format(query) ] + options, RECORD_TIMEOUT)
+  fixture = Fixture(out, err, 1 if timed_out else returncode, time.time() - t_start)
+  # failed queries are passed through but not recorded, so that they are not replayed as if they were genuine
+  if fixture.returncode == 0:
+    store.put(query, fixture, options)
+  return fixture
+
+def main(argv, executable):
+  """Entry point of the fake dasgoclient; returns the exit code"""
+  fixtures_fn = os.environ.get(REPLAY_FIXTURES_ENV, '')
+  if not fixtures_fn:
+    sys.stderr.write("The fixture database is not set; use ${}\n".format(REPLAY_FIXTURES_ENV))
+    return 2
+  mode = os.environ.get(REPLAY_MODE_ENV, 'replay')
+  if mode not in REPLAY_MODES:
+    sys.stderr.write("Invalid ${}: {}\n".format(REPLAY_MODE_ENV, mode))
+    return 2
+  query, options = parse_client_args(argv)
+  log_fn = os.environ.get(REPLAY_LOG_ENV, '')
+
+  store = FixtureStore(fixtures_fn)
+  try:
+    fixture = store.get(query, options)
+    if fixture is not None:
+      time.sleep(get_latency(fixture, os.environ.get(REPLAY_LATENCY_ENV, '')))
+      status = 'hit'
+    elif mode == 'record':
+      fixture = record(store, query, options, os.environ.get(REPLAY_CLIENT_ENV, '') or find_real_client(executable))
+      status = 'record'
+    else:
+      # unknown datasets yield an empty response in DAS as well
+      fixture = Fixture('', '', 0, 0.)
+      status = 'miss'
+  finally:
+    store.close()
+
+  log_query(log_fn, status, query, options)
+  if fixture.out:
+    write_text(sys.stdout, fixture.out)
+  if fixture.err:
+    write_text(sys.stderr, fixture.err)
+  return fixture.returncode
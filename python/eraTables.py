@@ -0,0 +1,47 @@
+import importlib
+
+try:
+  from collections.abc import Mapping
+except ImportError:
+  from collections import Mapping
+
+ERAS = ( '2016', '2017', '2018' )
+
+class LazyEraDict(Mapping):
+  """Maps an era to a table that is defined in a separate module per era
+
+  The per-era module is imported only when the table of the corresponding era is accessed for the first time, so that
+  the jobs do not pay for parsing and compiling the tables of the eras they do not need.
+  """
+
+  def __init__(self, module_template, attr_name, postprocess = None, eras = ERAS):
+    self.module_template = module_template
+    self.attr_name = attr_name
+    self.postprocess = postprocess
+    self.eras = tuple(eras)
+    self._tables = {}
+
+  def module_name(self, era):
+    if era not in self.eras:
+      raise KeyError(era)
+    return self.module_template.format(era)
+
+  def __getitem__(self, era):
+    if era not in self._tables:
+      table = getattr(importlib.import_module(self.module_name(era)), self.attr_name)
+      if self.postprocess:
+        self.postprocess(table)
+      self._tables[era] = table
+    return self._tables[era]
+
+  def __contains__(self, era):
+    return era in self.eras
+
+  def __iter__(self):
+    return iter(self.eras)
+
+  def __len__(self):
+    return len(self.eras)
+
+  def is_loaded(self, era):
+    return era in self._tables
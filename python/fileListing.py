@@ -0,0 +1,119 @@
+from tthAnalysis.NanoAOD.cacheUtils import get_cache_dir
+
+import collections
+import json
+import logging
+import multiprocessing.pool
+import os
+import sqlite3
+import threading
+
+LISTING_CACHE_NAME = 'listings.sqlite'
+
+def list_local_directory(path):
+  """Returns the sizes of the files in a directory as a dictionary of file name -> size in bytes"""
+  listing = {}
+  for name in os.listdir(path):
+    file_path = os.path.join(path, name)
+    if os.path.isfile(file_path):
+      listing[name] = os.path.getsize(file_path)
+  return listing
+
+class ListingCache(object):
+  """Stores the directory listings in an SQLite database, keyed by the directory path
+
+  A listing is valid as long as the modification time of its directory has not changed, which is the case until a
+  file is added to, removed from or renamed in the directory. The size of a file that is still being written into
+  is therefore not updated.
+  """
+
+  def __init__(self, path = ''):
+    if not path:
+      path = os.path.join(get_cache_dir(), LISTING_CACHE_NAME)
+    cache_dir = os.path.dirname(path)
+    if cache_dir and not os.path.isdir(cache_dir):
+      os.makedirs(cache_dir)
+    self.path = path
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(path, timeout = 60, check_same_thread = False)
+    with self.lock, self.connection:
+      self.connection.execute('CREATE TABLE IF NOT EXISTS listings (path TEXT PRIMARY KEY, mtime REAL, listing TEXT)')
+    logging.debug("Using directory listing cache: {}".format(path))
+
+  def get(self, path, mtime):
+    with self.lock:
+      row = self.connection.execute('SELECT mtime, listing FROM listings WHERE path = ?', (path,)).fetchone()
+    if row is None or row[0] != mtime:
+      return None
+    return json.loads(row[1])
+
+  def put(self, path, mtime, listing):
+    with self.lock, self.connection:
+      self.connection.execute(
+        'INSERT OR REPLACE INTO listings (path, mtime, listing) VALUES (?, ?, ?)', (path, mtime, json.dumps(listing))
+      )
+
+  def close(self):
+    with self.lock:
+      self.connection.close()
+
+def get_listing_cache():
+  """Returns the shared listing cache, or None if the caches are disabled with an empty TTH_NANOAOD_CACHE_DIR"""
+  return ListingCache() if get_cache_dir() else None
+
+class FileLister(object):
+  """Checks the existence and the sizes of many files with one listing per parent directory
+
+  The directories are listed concurrently in a pool of threads, and every directory is listed only once per
+  instance. The listing function is configurable, so that the directories on HDFS can be listed through its API
+  instead of stat'ing the files one by one on the FUSE mount.
+  """
+
+  def __init__(self, list_directory = list_local_directory, nof_workers = 8, cache = None):
+    self.list_directory = list_directory
+    self.nof_workers = nof_workers
+    self.cache = cache
+    self.listings = {}
+
+  def fetch(self, path):
+    """Returns the listing of a directory, or None if the directory cannot be listed"""
+    try:
+      mtime = os.path.getmtime(path)
+    except OSError:
+      return None
+    if self.cache:
+      listing = self.cache.get(path, mtime)
+      if listing is not None:
+        return listing
+    try:
+      listing = self.list_directory(path)
+    except Exception as err:
+      logging.warning("Unable to list directory {}: {}".format(path, err))
+      return None
+    if self.cache:
+      self.cache.put(path, mtime, listing)
+    return listing
+
+  def list_directories(self, paths):
+    paths_missing = [ path for path in collections.OrderedDict.fromkeys(paths) if path not in self.listings ]
+    if not paths_missing:
+      return
+    logging.debug("Listing {} directories".format(len(paths_missing)))
+    pool = multiprocessing.pool.ThreadPool(max(min(self.nof_workers, len(paths_missing)), 1))
+    try:
+      self.listings.update(zip(paths_missing, pool.map(self.fetch, paths_missing)))
+    finally:
+      pool.close()
+      pool.join()
+
+  def get_sizes(self, file_paths):
+    """Returns the sizes of the given files that exist, in the order of their first occurrence"""
+    file_paths = list(collections.OrderedDict.fromkeys(file_paths))
+    self.list_directories(os.path.dirname(file_path) for file_path in file_paths)
+    sizes = collections.OrderedDict()
+    for file_path in file_paths:
+      listing = self.listings[os.path.dirname(file_path)]
+      file_name = os.path.basename(file_path)
+      if listing is not None and file_name in listing:
+        sizes[file_path] = listing[file_name]
+    return sizes
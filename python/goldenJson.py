@@ -0,0 +1,109 @@
+from tthAnalysis.NanoAOD.lumiMask import LumiMask
+from tthAnalysis.NanoAOD.cacheUtils import get_cache_dir, read_cache, write_cache
+
+import bisect
+import hashlib
+import json
+import os
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+# bump the version whenever the layout of the cached golden JSONs changes
+GOLDEN_JSON_CACHE_VERSION = 1
+
+# the run and lumi numbers are combined into a single key, so that all ranges fit in one sorted array
+LUMI_BITS = 32
+
+_golden_jsons = {}
+
+def get_key(run, lumi):
+  return (run << LUMI_BITS) | lumi
+
+class GoldenJSON(object):
+  """Certified lumi sections of a golden JSON file
+
+  The lumi ranges of all runs are flattened into two sorted arrays of (run, lumi) keys, so that checking a lumi
+  section takes a single bisection, or a single np.searchsorted() call for arrays of run and lumi numbers.
+  """
+
+  def __init__(self, compact_list):
+    self.lumi_mask = LumiMask.from_compact_list(compact_list)
+    self.starts = []
+    self.ends = []
+    for run in self.lumi_mask.runs():
+      for lumi_min, lumi_max in self.lumi_mask[run]:
+        self.starts.append(get_key(run, lumi_min))
+        self.ends.append(get_key(run, lumi_max))
+    self._starts_array = None
+    self._ends_array = None
+
+  def __getstate__(self):
+    return { 'lumi_mask' : self.lumi_mask, 'starts' : self.starts, 'ends' : self.ends }
+
+  def __setstate__(self, state):
+    self.__dict__.update(state)
+    self._starts_array = None
+    self._ends_array = None
+
+  def contains(self, run, lumi):
+    key = get_key(run, lumi)
+    idx = bisect.bisect_right(self.starts, key) - 1
+    return idx >= 0 and key <= self.ends[idx]
+
+  def mask(self, runs, lumis):
+    """Returns which of the (run, lumi) pairs are certified, as a boolean array if NumPy is available"""
+    if np is None:
+      return [ self.contains(run, lumi) for run, lumi in zip(runs, lumis) ]
+    if self._starts_array is None:
+      self._starts_array = np.asarray(self.starts, dtype = np.int64)
+      self._ends_array = np.asarray(self.ends, dtype = np.int64)
+    keys = (np.asarray(runs, dtype = np.int64) << LUMI_BITS) | np.asarray(lumis, dtype = np.int64)
+    idxs = np.searchsorted(self._starts_array, keys, side = 'right') - 1
+    is_certified = idxs >= 0
+    is_certified[is_certified] = keys[is_certified] <= self._ends_array[idxs[is_certified]]
+    return is_certified
+
+  def runs(self):
+    return self.lumi_mask.runs()
+
+  def __contains__(self, run):
+    return run in self.lumi_mask
+
+  def __getitem__(self, run):
+    return self.lumi_mask[run]
+
+  def __len__(self):
+    return len(self.lumi_mask)
+
+def get_file_hash(path):
+  file_hash = hashlib.sha1(str(GOLDEN_JSON_CACHE_VERSION).encode())
+  with open(path, 'rb') as golden_json_file:
+    file_hash.update(golden_json_file.read())
+  return file_hash.hexdigest()
+
+def load_golden_json(path, use_cache = True):
+  """Returns the certified lumi sections of a golden JSON file, e.g. Cert_*_JSON.txt
+
+  The parsed file is memoized and stored in a cache file that is keyed by the content hash of the golden JSON.
+  """
+  if not os.path.isfile(path):
+    raise RuntimeError("No such file: %s" % path)
+  path = os.path.abspath(path)
+  if path in _golden_jsons:
+    return _golden_jsons[path]
+  cache_dir = get_cache_dir()
+  cache_path = ''
+  golden_json = None
+  if use_cache and cache_dir:
+    cache_path = os.path.join(cache_dir, 'golden_{}.pkl'.format(get_file_hash(path)))
+    golden_json = read_cache(cache_path)
+  if golden_json is None:
+    with open(path, 'r') as golden_json_file:
+      golden_json = GoldenJSON(json.load(golden_json_file))
+    if cache_path:
+      write_cache(cache_path, golden_json)
+  _golden_jsons[path] = golden_json
+  return golden_json
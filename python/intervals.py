@@ -0,0 +1,138 @@
+import bisect
+
+class IntervalSet(object):
+  """Sorted, non-overlapping closed intervals of integers, e.g. run or lumi ranges
+
+  The intervals are stored as two parallel lists of lower and upper bounds, so that the membership can be tested
+  with a single bisection instead of scanning a fully expanded list of values.
+  """
+  __slots__ = ('starts', 'ends')
+
+  def __init__(self, ranges = ()):
+    self.starts = []
+    self.ends = []
+    for range_min, range_max in sorted(ranges):
+      assert(range_min <= range_max)
+      if self.ends and range_min <= self.ends[-1] + 1:
+        # merge overlapping or adjacent ranges
+        self.ends[-1] = max(self.ends[-1], range_max)
+      else:
+        self.starts.append(range_min)
+        self.ends.append(range_max)
+
+  @classmethod
+  def from_strings(cls, range_strs, sep = '-'):
+    ranges = []
+    for range_str in range_strs:
+      range_split = range_str.split(sep)
+      assert(len(range_split) == 2)
+      ranges.append((int(range_split[0]), int(range_split[1])))
+    return cls(ranges)
+
+  def __contains__(self, value):
+    idx = bisect.bisect_right(self.starts, value) - 1
+    return idx >= 0 and value <= self.ends[idx]
+
+  def overlaps(self, range_min, range_max):
+    idx = bisect.bisect_left(self.ends, range_min)
+    return idx < len(self.starts) and self.starts[idx] <= range_max
+
+  def intersects(self, other):
+    if len(other) > len(self):
+      return other.intersects(self)
+    return any(self.overlaps(range_min, range_max) for range_min, range_max in other)
+
+  @classmethod
+  def from_bounds(cls, starts, ends):
+    """Builds the set from lists of lower and upper bounds that are already sorted, disjoint and non-adjacent"""
+    interval_set = cls()
+    interval_set.starts = starts
+    interval_set.ends = ends
+    return interval_set
+
+  @classmethod
+  def from_values(cls, values):
+    values = sorted(set(values))
+    if not values:
+      return cls()
+    if values[-1] - values[0] + 1 == len(values):
+      # the values form a single range, which is the common case for the lumi sections of a run
+      return cls.from_bounds([ values[0] ], [ values[-1] ])
+    starts = [ values[0] ]
+    ends = []
+    for value_prev, value in zip(values, values[1:]):
+      if value != value_prev + 1:
+        ends.append(value_prev)
+        starts.append(value)
+    ends.append(values[-1])
+    return cls.from_bounds(starts, ends)
+
+  def union(self, other):
+    return self.__class__(list(self) + list(other))
+
+  def intersection(self, other):
+    ranges = []
+    idx_self, idx_other = 0, 0
+    while idx_self < len(self.starts) and idx_other < len(other.starts):
+      range_min = max(self.starts[idx_self], other.starts[idx_other])
+      range_max = min(self.ends[idx_self], other.ends[idx_other])
+      if range_min <= range_max:
+        ranges.append((range_min, range_max))
+      if self.ends[idx_self] < other.ends[idx_other]:
+        idx_self += 1
+      else:
+        idx_other += 1
+    return self.__class__(ranges)
+
+  def difference(self, other):
+    ranges = []
+    idx_other = 0
+    for range_min, range_max in self:
+      # skip the intervals that end before the current interval starts
+      while idx_other < len(other.starts) and other.ends[idx_other] < range_min:
+        idx_other += 1
+      value = range_min
+      idx = idx_other
+      while idx < len(other.starts) and other.starts[idx] <= range_max:
+        if other.starts[idx] > value:
+          ranges.append((value, other.starts[idx] - 1))
+        value = max(value, other.ends[idx] + 1)
+        idx += 1
+      if value <= range_max:
+        ranges.append((value, range_max))
+    return self.__class__(ranges)
+
+  __or__ = union
+  __and__ = intersection
+  __sub__ = difference
+
+  def __iter__(self):
+    return iter(zip(self.starts, self.ends))
+
+  def __len__(self):
+    return len(self.starts)
+
+  def __bool__(self):
+    return bool(self.starts)
+  __nonzero__ = __bool__
+
+  def __eq__(self, other):
+    return isinstance(other, IntervalSet) and self.starts == other.starts and self.ends == other.ends
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __repr__(self):
+    return '{}({})'.format(self.__class__.__name__, [ list(interval) for interval in self ])
+
+  def size(self):
+    return sum(range_max - range_min + 1 for range_min, range_max in self)
+
+  def to_list(self):
+    return [ [ range_min, range_max ] for range_min, range_max in self ]
+
+  def expand(self):
+    values = []
+    for range_min, range_max in self:
+      values.extend(range(range_min, range_max + 1))
+    return values
@@ -0,0 +1,91 @@
+import collections
+import json
+import logging
+import os
+
+def pack_files(weights, capacity = None):
+  """Groups the files into jobs so that the total weight of each job does not exceed the capacity
+
+  The files are packed with the first-fit decreasing heuristic: the heaviest files are placed first, each into the
+  first job that can still accommodate it. The ties are broken by the order of the files, so that the same input
+  always results in the same jobs. A file that is heavier than the capacity gets a job of its own. The jobs are
+  ordered by their first file, and the files within each job follow the input order. If the capacity is not set,
+  every file becomes a separate job.
+
+  :param weights: list of (file, weight) pairs, e.g. the file sizes or the numbers of events
+  :param capacity: maximum total weight of a job
+  :return: list of jobs, each a list of files
+  """
+  if not capacity:
+    return [ [ name ] for name, _ in weights ]
+  bins = []
+  loads = []
+  order = sorted(range(len(weights)), key = lambda idx: (-weights[idx][1], idx))
+  for file_idx in order:
+    weight = weights[file_idx][1]
+    for bin_idx, load in enumerate(loads):
+      if load + weight <= capacity:
+        bins[bin_idx].append(file_idx)
+        loads[bin_idx] += weight
+        break
+    else:
+      bins.append([ file_idx ])
+      loads.append(weight)
+  return [ [ weights[file_idx][0] for file_idx in sorted(bin_files) ] for bin_files in sorted(bins, key = min) ]
+
+class JobPlan(object):
+  """Assignment of the input files to numbered jobs that is kept in a JSON manifest
+
+  The jobs that have been planned before are never changed, so that the outputs of the jobs that have already
+  finished stay valid when the job configuration is regenerated: only the input files that are not part of any job
+  are packed into new jobs, which are numbered after the existing ones.
+  """
+
+  def __init__(self, manifest_fn):
+    self.manifest_fn = manifest_fn
+    self.jobs = collections.OrderedDict()
+    self.settings = {}
+    if os.path.isfile(manifest_fn):
+      with open(manifest_fn, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+      self.settings = manifest['settings']
+      for job_idx, input_files in sorted(manifest['jobs'].items(), key = lambda item: int(item[0])):
+        self.jobs[int(job_idx)] = input_files
+
+  def update(self, input_files, get_weight, capacity, settings):
+    """Packs the input files that are not yet assigned to any job into new jobs; returns the indices of the new jobs
+
+    :param input_files: list of input files
+    :param get_weight: function that returns the weight of an input file; called only for the unassigned files
+    :param capacity: maximum total weight of a job, or None for one file per job
+    :param settings: dictionary of the packing options that is recorded in the manifest
+    """
+    if self.jobs and settings != self.settings:
+      logging.warning(
+        'The existing {} jobs were planned with {} instead of {}; only the new input files are packed with the new '
+        'settings'.format(len(self.jobs), self.settings, settings)
+      )
+    assigned = set(input_file for input_files in self.jobs.values() for input_file in input_files)
+    removed = sorted(assigned - set(input_files))
+    if removed:
+      logging.warning(
+        '{} file(s) that are no longer in the input, such as {}, are still part of the existing jobs; remove {} to '
+        'plan the jobs from scratch'.format(len(removed), removed[0], self.manifest_fn)
+      )
+    unassigned = [ ( name, get_weight(name) ) for name in input_files if name not in assigned ]
+    # so that the tree indices start from 1 instead of 0
+    first_idx = max(self.jobs) + 1 if self.jobs else 1
+    new_jobs = []
+    for job_offset, job_files in enumerate(pack_files(unassigned, capacity)):
+      self.jobs[first_idx + job_offset] = job_files
+      new_jobs.append(first_idx + job_offset)
+    if not self.settings:
+      self.settings = settings
+    return new_jobs
+
+  def save(self):
+    with open(self.manifest_fn, 'w') as manifest_file:
+      json.dump({
+        'settings' : self.settings,
+        'jobs'     : collections.OrderedDict(( str(job_idx), job_files ) for job_idx, job_files in self.jobs.items()),
+      }, manifest_file, indent = 2)
@@ -0,0 +1,38 @@
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.triggerCache import load_tables
+
+import collections
+
+LeptonFRTrigger = collections.namedtuple('LeptonFRTrigger', [
+  'path', 'cone_minPt', 'cone_maxPt', 'minRecoPt', 'jet_minPt', 'average_prescale', 'trigger_type', 'runs',
+])
+
+LEPTONFR_TABLES = [ 'leptonFR', 'leptonFR_bbWWSL' ]
+
+_leptonFR_triggers = {}
+
+def get_leptonFR_triggers(era, table_name = 'leptonFR'):
+  """Returns the lepton fake rate triggers of an era as a dictionary of lepton flavor -> list of LeptonFRTrigger
+
+  The run ranges of each cms.PSet are parsed only once per era into an IntervalSet.
+  """
+  if table_name not in LEPTONFR_TABLES:
+    raise ValueError("Invalid lepton fake rate table: %s" % table_name)
+  key = (era, table_name)
+  if key not in _leptonFR_triggers:
+    table = load_tables(era)[table_name]
+    _leptonFR_triggers[key] = {
+      lepton : [
+        LeptonFRTrigger(
+          path             = hlt['path'],
+          cone_minPt       = hlt['cone_minPt'],
+          cone_maxPt       = hlt['cone_maxPt'],
+          minRecoPt        = hlt['minRecoPt'],
+          jet_minPt        = hlt['jet_minPt'],
+          average_prescale = hlt['average_prescale'],
+          trigger_type     = hlt['trigger_type'],
+          runs             = IntervalSet(hlt['runs']),
+        ) for hlt in table[lepton]
+      ] for lepton in table
+    }
+  return _leptonFR_triggers[key]
@@ -0,0 +1,175 @@
+from tthAnalysis.NanoAOD.processUtils import kill_process_tree
+from tthAnalysis.NanoAOD.slurmTracker import STATE_SKIPPED, JobDB, check_output
+
+import collections
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+STATE_COMPLETED = 'COMPLETED'
+STATE_FAILED = 'FAILED'
+
+EVENTS_RE = re.compile(r'TrigReport Events total = (\d+)')
+
+# preexec_fn is not safe in the presence of threads, so it is only used if start_new_session is not available
+NEW_SESSION_KWARGS = { 'start_new_session' : True } if sys.version_info[0] >= 3 else { 'preexec_fn' : os.setsid }
+
+JobResult = collections.namedtuple('JobResult', [ 'name', 'state', 'error', 'runtime', 'nof_events', 'nof_files' ])
+
+def get_physical_memory():
+  """Returns the amount of physical memory in bytes, or 0 if it cannot be determined"""
+  try:
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+  except (ValueError, OSError, AttributeError):
+    return 0
+
+def get_nof_workers(nof_cores = 0, memory_budget = 0, memory_per_job = 0):
+  """Returns the number of jobs that fit into the given number of cores and the memory budget at the same time"""
+  nof_workers = nof_cores or multiprocessing.cpu_count()
+  if memory_budget and memory_per_job:
+    nof_workers = min(nof_workers, memory_budget // memory_per_job)
+  return max(int(nof_workers), 1)
+
+def parse_nof_events(cmsrun_log):
+  """Returns the number of events processed by cmsRun according to its summary, or None if there is no summary"""
+  if not cmsrun_log or not os.path.isfile(cmsrun_log):
+    return None
+  nof_events = None
+  with open(cmsrun_log, 'r') as cmsrun_log_file:
+    for line in cmsrun_log_file:
+      events_match = EVENTS_RE.search(line)
+      if events_match:
+        nof_events = int(events_match.group(1))
+  return nof_events
+
+class LocalRunner(object):
+  """Runs the job scripts on the current machine in a fixed number of parallel processes
+
+  The jobs share the database of the SLURM job tracker, so that an interrupted run is resumed without rerunning the
+  jobs whose output already exists. The output of each job is appended to its log file. A job is considered done if
+  its exit code is zero and its output file is at least as large as the job script itself requires; otherwise the
+  job is rerun up to max_retries times. The events per job are taken from the cmsRun summary, if there is one, or
+  else from the job list. Only the jobs in job_info are run, so that the stale jobs of an earlier job list are left
+  alone; without job_info, all jobs of the database are run.
+  """
+
+  def __init__(self, db, nof_workers, max_retries = 2, job_info = None):
+    self.db = db
+    self.nof_workers = nof_workers
+    self.max_retries = max_retries
+    self.job_info = job_info or {}
+    self.names = list(job_info) if job_info is not None else None
+    self.lock = threading.Lock()
+    self.processes = {}
+    self.stopped = threading.Event()
+    self.results = []
+
+  def run_once(self, job, attempt):
+    # the logs of the earlier attempts are kept
+    with open(job.logfile, 'a') as logfile:
+      logfile.write('=== Attempt {} of job {} started at {} ===\n'.format(attempt, job.name, time.ctime()))
+      logfile.flush()
+      process = subprocess.Popen([ job.script ], stdout = logfile, stderr = subprocess.STDOUT, **NEW_SESSION_KWARGS)
+      self.db.set_submitted(job.name, str(process.pid))
+      with self.lock:
+        self.processes[job.name] = process
+      t_start = time.time()
+      # unlike Popen.wait(), wait4() also reports the peak RSS of the job, including the processes it waited for
+      _, status, rusage = os.wait4(process.pid, 0)
+      runtime = time.time() - t_start
+      process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+      with self.lock:
+        del self.processes[job.name]
+    error = 'exit code {}'.format(process.returncode) if process.returncode != 0 else check_output(job.output_file)
+    self.db.set_state(
+      job.name, STATE_FAILED if error else STATE_COMPLETED, process.returncode, runtime, rusage.ru_maxrss * 1024
+    )
+    return error, runtime
+
+  def run_job(self, job):
+    error, runtime = '', 0.
+    for attempt in range(self.max_retries + 1):
+      if self.stopped.is_set():
+        break
+      logging.info('Running job {} (attempt {})'.format(job.name, attempt + 1))
+      error, runtime = self.run_once(job, attempt + 1)
+      if not error:
+        break
+      if self.stopped.is_set():
+        error = 'killed'
+        break
+      logging.warning('Job {} failed with {}, see {}'.format(job.name, error, job.logfile))
+    info = self.job_info.get(job.name, {})
+    nof_events = parse_nof_events(info.get('cmsrun_log'))
+    if nof_events is None:
+      nof_events = info.get('nevents')
+    return JobResult(
+      job.name, STATE_FAILED if error else STATE_COMPLETED, error, runtime, nof_events, info.get('nof_files', 1)
+    )
+
+  def run(self):
+    """Runs the jobs whose output does not exist yet and waits for all of them to finish; returns the job results"""
+    pending = []
+    for job in self.db.jobs(names = self.names):
+      if job.output_file and not check_output(job.output_file):
+        if job.state != STATE_COMPLETED:
+          self.db.set_state(job.name, STATE_SKIPPED)
+        continue
+      # the jobs of an interrupted run have been killed, so they are run again from scratch
+      self.db.reset(job.name)
+      pending.append(self.db.get(job.name))
+    nof_workers = max(min(self.nof_workers, len(pending)), 1)
+    logging.info('Running {} job(s) in {} parallel process(es)'.format(len(pending), nof_workers))
+
+    pool = multiprocessing.pool.ThreadPool(nof_workers)
+    try:
+      for result in pool.imap_unordered(self.run_job, pending):
+        self.results.append(result)
+        if result.state == STATE_COMPLETED:
+          logging.info('Job {} finished in {:.0f}s ({}/{} done)'.format(
+            result.name, result.runtime, len(self.results), len(pending)
+          ))
+        else:
+          logging.error('Job {} failed with {} ({}/{} done)'.format(
+            result.name, result.error, len(self.results), len(pending)
+          ))
+    except KeyboardInterrupt:
+      logging.warning('Interrupted, killing the running jobs')
+      self.kill()
+      raise
+    finally:
+      pool.close()
+      pool.join()
+    return self.results
+
+  def kill(self):
+    self.stopped.set()
+    with self.lock:
+      processes = list(self.processes.values())
+    for process in processes:
+      kill_process_tree(process.pid)
+
+def summarize(results, wall_time):
+  """Returns the lines of the throughput summary of the finished jobs"""
+  completed = [ result for result in results if result.state == STATE_COMPLETED ]
+  nof_files = sum(result.nof_files for result in completed)
+  lines = [
+    'Finished {} job(s) in {:.1f}s: {} completed, {} failed'.format(
+      len(results), wall_time, len(completed), len(results) - len(completed)
+    ),
+    'Throughput: {:.1f} files/h'.format(3600. * nof_files / wall_time if wall_time > 0. else 0.),
+  ]
+  nof_events = [ result.nof_events for result in completed ]
+  if completed and None not in nof_events:
+    lines[-1] += ', {:.1f} events/s ({} events in total)'.format(
+      sum(nof_events) / wall_time if wall_time > 0. else 0., sum(nof_events)
+    )
+  elif completed:
+    lines[-1] += ', events/s unknown for {} job(s) without cmsRun summary'.format(nof_events.count(None))
+  return lines
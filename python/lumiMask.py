@@ -0,0 +1,84 @@
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+
+def parse_lumi_list(lumis_str):
+  """Parses a list of lumi numbers as printed by dasgoclient, e.g. [1,2,3,7], straight into lumi ranges"""
+  lumis_str = lumis_str.strip()
+  if not (lumis_str.startswith('[') and lumis_str.endswith(']')):
+    raise ValueError("Invalid list of lumis: %s" % lumis_str)
+  lumis_body = lumis_str[1:-1]
+  return IntervalSet.from_values(map(int, lumis_body.split(','))) if lumis_body.strip() else IntervalSet()
+
+class LumiMask(object):
+  """Lumi sections of each run, stored as sorted lumi ranges instead of the individual lumi numbers
+
+  The set operations are carried out run by run with a linear merge of the sorted ranges, so their cost scales with
+  the number of ranges rather than with the number of lumi sections.
+  """
+
+  def __init__(self, run_lumis = None):
+    # runs without any lumi sections are not stored
+    self.run_lumis = {}
+    if run_lumis:
+      for run, lumis in run_lumis.items():
+        if lumis:
+          self.run_lumis[int(run)] = lumis
+
+  @classmethod
+  def from_compact_list(cls, compact_list):
+    """Builds the mask from a dictionary of run -> list of [ first lumi, last lumi ], as in the golden JSON files"""
+    return cls({ run : IntervalSet(map(tuple, lumi_ranges)) for run, lumi_ranges in compact_list.items() })
+
+  @classmethod
+  def from_lumis(cls, run_lumis):
+    """Builds the mask from a dictionary of run -> lumi numbers"""
+    return cls({ run : IntervalSet.from_values(lumis) for run, lumis in run_lumis.items() })
+
+  def to_compact_list(self):
+    return { str(run) : self.run_lumis[run].to_list() for run in self.runs() }
+
+  def runs(self):
+    return sorted(self.run_lumis.keys())
+
+  def contains(self, run, lumi):
+    return run in self.run_lumis and lumi in self.run_lumis[run]
+
+  def size(self):
+    return sum(lumis.size() for lumis in self.run_lumis.values())
+
+  def __contains__(self, run):
+    return run in self.run_lumis
+
+  def __getitem__(self, run):
+    return self.run_lumis.get(run, IntervalSet())
+
+  def __iter__(self):
+    return iter(self.runs())
+
+  def __len__(self):
+    return len(self.run_lumis)
+
+  def __bool__(self):
+    return bool(self.run_lumis)
+  __nonzero__ = __bool__
+
+  def __eq__(self, other):
+    return isinstance(other, LumiMask) and self.run_lumis == other.run_lumis
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __repr__(self):
+    return '{}({})'.format(self.__class__.__name__, self.to_compact_list())
+
+  def union(self, other):
+    return self.__class__({ run : self[run] | other[run] for run in set(self.run_lumis) | set(other.run_lumis) })
+
+  def intersection(self, other):
+    return self.__class__({ run : self[run] & other[run] for run in set(self.run_lumis) & set(other.run_lumis) })
+
+  def difference(self, other):
+    return self.__class__({ run : self[run] - other[run] for run in self.run_lumis })
+
+  __or__ = union
+  __and__ = intersection
+  __sub__ = difference
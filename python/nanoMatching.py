@@ -0,0 +1,79 @@
+import collections
+import json
+import os
+import re
+
+# the primary dataset names that match only themselves when used as a regex
+LITERAL_RE = re.compile(r'^[\w-]+$')
+
+def get_nanoaod_pattern(miniaod, data_str, mc_str):
+  """Returns the primary dataset name and the regex of the NanoAOD datasets that may have been produced from the
+  given MINIAOD(SIM) dataset
+  """
+  miniaod_split = miniaod.split('/')
+  assert(len(miniaod_split) == 4)
+  miniaod_lead = miniaod_split[1]
+  miniaod_sublead = miniaod_split[2]
+  miniaod_tier = miniaod_split[3]
+  if miniaod_tier == 'MINIAOD':
+    assert(miniaod_sublead.startswith('Run201'))
+    miniaod_sublead_split = miniaod_sublead.split('-')
+    assert(len(miniaod_sublead_split) > 1)
+    nanoaod_sublead = '{}.*-{}'.format(miniaod_sublead_split[0], data_str)
+  elif miniaod_tier == 'MINIAODSIM':
+    assert(miniaod_sublead.startswith('RunII'))
+    miniaod_sublead_split = miniaod_sublead.split('-')
+    assert (len(miniaod_sublead_split) > 1)
+    nanoaod_sublead = re.sub(r'MiniAOD(v\d)?', mc_str, miniaod_sublead_split[0])
+  else:
+    raise RuntimeError('Unexpected tier %s found in DBS name %s' % (miniaod_tier, miniaod))
+  nanoaod_re = re.compile('/{}/{}.*/{}'.format(miniaod_lead, nanoaod_sublead, miniaod_tier.replace('MINI', 'NANO')))
+  return miniaod_lead, nanoaod_re
+
+class NanoAODIndex(object):
+  """Groups the NanoAOD datasets by their primary dataset name
+
+  The regex of a MINIAOD(SIM) dataset starts with its primary dataset name, so it can only match the datasets that
+  share this name, and finding the NanoAOD candidates requires only a dictionary lookup and a handful of regex
+  matches. The data and MC strings are parts of the regex, as in a linear scan over all datasets. Only the primary
+  dataset names that contain regex metacharacters are matched against all datasets.
+  """
+
+  def __init__(self, dbs_nano):
+    self.all_datasets = list(dbs_nano)
+    self.datasets = collections.defaultdict(list)
+    for nanoaod in self.all_datasets:
+      nanoaod_split = nanoaod.split('/')
+      if len(nanoaod_split) > 1 and not nanoaod_split[0]:
+        self.datasets[nanoaod_split[1]].append(nanoaod)
+
+  def find_candidates(self, miniaod, data_str, mc_str):
+    primary_dataset, nanoaod_re = get_nanoaod_pattern(miniaod, data_str, mc_str)
+    if LITERAL_RE.match(primary_dataset):
+      nanoaods = self.datasets.get(primary_dataset, [])
+    else:
+      nanoaods = self.all_datasets
+    return [ nanoaod for nanoaod in nanoaods if nanoaod_re.match(nanoaod) ]
+
+def load_state(state_fn):
+  """Returns the state of the incremental mode of find_nano_datasets.py, which maps the MINIAOD(SIM) datasets to
+  their candidates and to the outcome of their last check
+  """
+  if not state_fn or not os.path.isfile(state_fn):
+    return {}
+  with open(state_fn, 'r') as f:
+    return json.load(f)
+
+def save_state(state_fn, state):
+  state_fn_tmp = '{}.tmp'.format(state_fn)
+  with open(state_fn_tmp, 'w') as f:
+    json.dump(state, f, indent = 2, sort_keys = True)
+  os.rename(state_fn_tmp, state_fn)
+
+def is_up_to_date(state_entry, nanoaod_cands, dbs_nano):
+  # check again if the candidates or the status of the NanoAOD changed (e.g. from PRODUCTION to VALID), or if the
+  # previous check failed
+  if not state_entry or not state_entry.get('match') or state_entry['candidates'] != nanoaod_cands:
+    return False
+  nanoaod = state_entry['nanoaod']
+  return nanoaod in dbs_nano and dbs_nano[nanoaod] == state_entry['status']
@@ -0,0 +1,90 @@
+import subprocess
+import threading
+
+import psutil
+
+MEMORY_UNITS = { 'K' : 1024, 'M' : 1024 ** 2, 'G' : 1024 ** 3, 'T' : 1024 ** 4 }
+
+def kill_process_tree(pid):
+  try:
+    parent = psutil.Process(pid)
+    for child in parent.children(recursive = True):
+      child.kill()
+    parent.kill()
+  except psutil.NoSuchProcess:
+    pass
+
+def decode(output):
+  # the output is text on both py2 and py3, as are the responses stored in the DAS cache
+  return output.decode('utf-8') if isinstance(output, bytes) else output
+
+def run_command(cmd, timeout):
+  """Runs a command and kills it with all its children if it does not finish in the given number of seconds
+
+  Unlike signal.alarm(), the timer works in any thread, so that multiple commands can run concurrently.
+  Returns a tuple of stdout, stderr, exit code and whether the command timed out.
+  """
+  process = subprocess.Popen(cmd, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+  timed_out = threading.Event()
+  def kill():
+    timed_out.set()
+    kill_process_tree(process.pid)
+  timer = threading.Timer(timeout, kill)
+  timer.daemon = True
+  timer.start()
+  try:
+    out, err = process.communicate()
+  finally:
+    timer.cancel()
+  return decode(out).rstrip('\n'), decode(err).rstrip('\n'), process.returncode, timed_out.is_set()
+
+def run_command_stream(cmd, timeout, parse):
+  """Runs a command like run_command(), but passes its stdout line by line to the parse function as it is read
+
+  The parse function receives an iterator over the lines, without the trailing newlines. The stderr is read in a
+  separate thread, so that the command cannot block on a full stderr pipe. Returns a tuple of the parsed output,
+  stderr, exit code and whether the command timed out; if the command timed out, the parsed output of the truncated
+  stdout is discarded.
+  """
+  process = subprocess.Popen(cmd, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+  timed_out = threading.Event()
+  def kill():
+    timed_out.set()
+    kill_process_tree(process.pid)
+  timer = threading.Timer(timeout, kill)
+  timer.daemon = True
+  timer.start()
+  err_chunks = []
+  err_reader = threading.Thread(target = lambda: err_chunks.append(process.stderr.read()))
+  err_reader.daemon = True
+  err_reader.start()
+  result = None
+  try:
+    lines = ( decode(line).rstrip('\n') for line in iter(process.stdout.readline, b'') )
+    try:
+      result = parse(lines)
+      # drain whatever the parser left, so that the command does not block on a full pipe
+      for _ in lines:
+        pass
+    except Exception:
+      if not timed_out.is_set():
+        kill_process_tree(process.pid)
+        process.wait()
+        raise
+    process.wait()
+  finally:
+    timer.cancel()
+    err_reader.join()
+  err = decode(err_chunks[0]).rstrip('\n') if err_chunks else ''
+  if timed_out.is_set():
+    result = None
+  return result, err, process.returncode, timed_out.is_set()
+
+def parse_memory(memory_str):
+  """Converts a memory size as reported by sacct, e.g. 1234K or 1.5G, into bytes"""
+  if not memory_str:
+    return None
+  unit = memory_str[-1].upper()
+  if unit in MEMORY_UNITS:
+    return int(float(memory_str[:-1]) * MEMORY_UNITS[unit])
+  return int(float(memory_str))
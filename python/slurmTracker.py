@@ -0,0 +1,317 @@
+from tthAnalysis.NanoAOD.processUtils import parse_memory, run_command
+
+import collections
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+# job states that are not going to change anymore
+FINAL_STATES = [
+  'COMPLETED', 'FAILED', 'CANCELLED', 'TIMEOUT', 'OUT_OF_MEMORY', 'NODE_FAIL', 'PREEMPTED', 'BOOT_FAIL', 'DEADLINE',
+]
+# states of the job DB that are not reported by SLURM
+STATE_NEW = 'NEW'
+STATE_SUBMITTED = 'SUBMITTED'
+STATE_GAVE_UP = 'GAVE_UP'
+STATE_SKIPPED = 'SKIPPED'
+# the job has not been reported by sacct nor by squeue for too long
+STATE_LOST = 'LOST'
+INACTIVE_STATES = FINAL_STATES + [ STATE_LOST, STATE_GAVE_UP, STATE_SKIPPED ]
+
+# the same threshold as in the job scripts, below which the output file is considered broken
+OUTPUT_MIN_SIZE = 1000
+
+SACCT_FORMAT = 'JobID,State,ExitCode,Elapsed,MaxRSS'
+SACCT_BATCH_SIZE = 200
+COMMAND_TIMEOUT = 120
+
+JobRecord = collections.namedtuple('JobRecord', [
+  'name', 'script', 'logfile', 'output_file', 'job_id', 'state', 'exit_code', 'runtime', 'max_rss', 'attempts',
+  'updated',
+])
+
+def parse_elapsed(elapsed_str):
+  """Converts the elapsed time reported by sacct, e.g. 1-02:03:04 or 03:04.5, into seconds"""
+  if not elapsed_str:
+    return None
+  days = 0
+  if '-' in elapsed_str:
+    days_str, elapsed_str = elapsed_str.split('-', 1)
+    days = int(days_str)
+  seconds = 0.
+  for part in elapsed_str.split(':'):
+    seconds = seconds * 60 + float(part)
+  return days * 86400 + seconds
+
+def parse_sacct(sacct_out):
+  """Returns the state, exit code, runtime and peak RSS of each job in the parsable output of sacct
+
+  The state, the exit code and the runtime are taken from the line of the job allocation, whereas the peak RSS is
+  only reported for the job steps, e.g. 1234.batch, so the largest value among the steps is taken.
+  """
+  jobs = {}
+  max_rss = collections.defaultdict(int)
+  for line in sacct_out.split('\n'):
+    line_split = line.strip().split('|')
+    if len(line_split) < 5:
+      continue
+    job_id, state, exit_code, elapsed, rss = line_split[:5]
+    job_id_base = job_id.split('.')[0]
+    rss_value = parse_memory(rss)
+    if rss_value:
+      max_rss[job_id_base] = max(max_rss[job_id_base], rss_value)
+    if job_id == job_id_base:
+      # e.g. CANCELLED by 1234
+      state = state.split()[0] if state else ''
+      jobs[job_id] = ( state, int(exit_code.split(':')[0]) if exit_code else None, parse_elapsed(elapsed) )
+  return { job_id : job + ( max_rss.get(job_id) or None, ) for job_id, job in jobs.items() }
+
+def check_output(output_file):
+  """Returns an error message if the output file is missing or too small to be valid, otherwise an empty string"""
+  if not output_file:
+    return ''
+  if not os.path.isfile(output_file):
+    return 'output file {} is missing'.format(output_file)
+  output_size = os.path.getsize(output_file)
+  if output_size < OUTPUT_MIN_SIZE:
+    return 'output file {} is broken ({} bytes)'.format(output_file, output_size)
+  return ''
+
+class JobDB(object):
+  """Stores the SLURM jobs and their latest state in an SQLite database, so that the jobs can be tracked across
+  invocations of the tracker; the database can be shared by multiple threads
+  """
+
+  def __init__(self, path):
+    db_dir = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(db_dir):
+      os.makedirs(db_dir)
+    self.path = path
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(path, timeout = 60, check_same_thread = False)
+    with self.lock, self.connection:
+      self.connection.execute(
+        'CREATE TABLE IF NOT EXISTS jobs (name TEXT PRIMARY KEY, script TEXT, logfile TEXT, output_file TEXT, '
+        'job_id TEXT, state TEXT, exit_code INTEGER, runtime REAL, max_rss INTEGER, attempts INTEGER, updated REAL)'
+      )
+
+  def add(self, name, script, logfile, output_file):
+    """Adds a new job, or updates the paths of an existing job without touching its state"""
+    with self.lock, self.connection:
+      self.connection.execute(
+        'INSERT OR IGNORE INTO jobs (name, state, attempts, updated) VALUES (?, ?, 0, ?)',
+        (name, STATE_NEW, time.time())
+      )
+      self.connection.execute(
+        'UPDATE jobs SET script = ?, logfile = ?, output_file = ? WHERE name = ?', (script, logfile, output_file, name)
+      )
+
+  def get(self, name):
+    with self.lock:
+      row = self.connection.execute(
+        'SELECT {} FROM jobs WHERE name = ?'.format(', '.join(JobRecord._fields)), (name,)
+      ).fetchone()
+    return JobRecord(*row) if row else None
+
+  def jobs(self, states = None, names = None):
+    """Returns the jobs in the given states, out of the given jobs; all jobs of the database by default"""
+    with self.lock:
+      rows = self.connection.execute(
+        'SELECT {} FROM jobs ORDER BY name'.format(', '.join(JobRecord._fields))
+      ).fetchall()
+    names = set(names) if names is not None else None
+    return [
+      JobRecord(*row) for row in rows if (states is None or row[5] in states) and (names is None or row[0] in names)
+    ]
+
+  def set_submitted(self, name, job_id):
+    with self.lock, self.connection:
+      self.connection.execute(
+        'UPDATE jobs SET job_id = ?, state = ?, exit_code = NULL, runtime = NULL, max_rss = NULL, '
+        'attempts = attempts + 1, updated = ? WHERE name = ?', (job_id, STATE_SUBMITTED, time.time(), name)
+      )
+
+  def reset(self, name):
+    with self.lock, self.connection:
+      self.connection.execute(
+        'UPDATE jobs SET state = ?, attempts = 0, updated = ? WHERE name = ?', (STATE_NEW, time.time(), name)
+      )
+
+  def set_state(self, name, state, exit_code = None, runtime = None, max_rss = None):
+    with self.lock, self.connection:
+      self.connection.execute(
+        'UPDATE jobs SET state = ?, exit_code = ?, runtime = ?, max_rss = ?, updated = ? WHERE name = ?',
+        (state, exit_code, runtime, max_rss, time.time(), name)
+      )
+
+  def summary(self, names = None):
+    return collections.Counter(job.state for job in self.jobs(names = names))
+
+  def close(self):
+    with self.lock:
+      self.connection.close()
+
+class SlurmTracker(object):
+  """Submits SLURM jobs and follows them with batched sacct queries until all of them have finished
+
+  The polling interval doubles every time that none of the jobs changed their state, and falls back to the minimum
+  as soon as one of them did. A failed sacct query is retried with the same backoff. The jobs that fail are
+  resubmitted up to max_resubmits times. A failed sbatch call is retried after an exponentially growing delay, and
+  the job is given up if it cannot be submitted in submit_tries attempts. A job that sacct has not reported for
+  missing_timeout seconds is looked up in squeue, and considered lost if squeue does not know it either. The
+  commands are configurable, so that the tracker can be run against stand-ins of sbatch, sacct and squeue. Only the
+  jobs in names are run, so that the stale jobs of an earlier job list are left alone; by default, all jobs of the
+  database are run.
+  """
+
+  def __init__(self, db, sbatch_args = (), max_resubmits = 2, poll_min = 5., poll_max = 60., sbatch = 'sbatch',
+               sacct = 'sacct', squeue = 'squeue', submit_tries = 3, missing_timeout = 600., names = None):
+    self.db = db
+    self.sbatch_args = list(sbatch_args)
+    self.max_resubmits = max_resubmits
+    self.poll_min = poll_min
+    self.poll_max = poll_max
+    self.sbatch = sbatch
+    self.sacct = sacct
+    self.squeue = squeue
+    self.submit_tries = submit_tries
+    self.missing_timeout = missing_timeout
+    self.names = names
+
+  def is_done(self, job):
+    return job.state == 'COMPLETED' and not job.exit_code and not check_output(job.output_file)
+
+  def submit(self, job):
+    """Submits the job, retrying a failed sbatch call; returns whether the job was submitted"""
+    cmd = [ self.sbatch ] + self.sbatch_args + [ '--output={}'.format(job.logfile), job.script ]
+    for ntries in range(1, self.submit_tries + 1):
+      out, err, returncode, timed_out = run_command(cmd, COMMAND_TIMEOUT)
+      job_id_match = re.search(r'(\d+)\s*$', out)
+      if not timed_out and returncode == 0 and job_id_match:
+        job_id = job_id_match.group(1)
+        self.db.set_submitted(job.name, job_id)
+        logging.info('Submitted job {} for {} (attempt {})'.format(job_id, job.name, job.attempts + 1))
+        return True
+      reason = 'timed out' if timed_out else (err or out)
+      if ntries < self.submit_tries:
+        delay = min(self.poll_min * 2 ** (ntries - 1), self.poll_max)
+        logging.warning("Unable to submit job {} with '{}' (try {}/{}), retrying in {:.1f}s: {}".format(
+          job.name, ' '.join(cmd), ntries, self.submit_tries, delay, reason
+        ))
+        time.sleep(delay)
+    logging.error("Unable to submit job {} with '{}', giving up: {}".format(job.name, ' '.join(cmd), reason))
+    self.db.set_state(job.name, STATE_GAVE_UP, job.exit_code, job.runtime, job.max_rss)
+    return False
+
+  def query(self, job_ids):
+    """Returns the state of the given jobs, or None if sacct failed"""
+    results = {}
+    for idx in range(0, len(job_ids), SACCT_BATCH_SIZE):
+      cmd = [
+        self.sacct, '--noheader', '--parsable2', '--format={}'.format(SACCT_FORMAT),
+        '--jobs={}'.format(','.join(job_ids[idx:idx + SACCT_BATCH_SIZE])),
+      ]
+      out, err, returncode, timed_out = run_command(cmd, COMMAND_TIMEOUT)
+      if timed_out or returncode != 0:
+        logging.warning("Command '{}' failed: {}".format(' '.join(cmd[:4]), err or 'timed out'))
+        return None
+      results.update(parse_sacct(out))
+    return results
+
+  def query_queue(self, job_ids):
+    """Returns the IDs of the given jobs that are still in the queue, or None if squeue failed"""
+    queued = set()
+    for idx in range(0, len(job_ids), SACCT_BATCH_SIZE):
+      cmd = [ self.squeue, '--noheader', '--jobs={}'.format(','.join(job_ids[idx:idx + SACCT_BATCH_SIZE])) ]
+      out, err, returncode, timed_out = run_command(cmd, COMMAND_TIMEOUT)
+      if timed_out or returncode != 0:
+        logging.warning("Command '{}' failed: {}".format(cmd[0], err or 'timed out'))
+        return None
+      queued.update(line.split()[0] for line in out.split('\n') if line.strip())
+    return queued
+
+  def finish(self, job):
+    """Handles a job that has reached a final state: resubmits it if it failed, or gives up on it"""
+    if self.is_done(job):
+      logging.info('Job {} for {} finished in {:.0f}s'.format(job.job_id, job.name, job.runtime or 0.))
+    elif job.attempts <= self.max_resubmits:
+      logging.warning('Job {} for {} ended with state {} and exit code {}, resubmitting'.format(
+        job.job_id, job.name, job.state, job.exit_code
+      ))
+      self.submit(job)
+    else:
+      logging.error('Job {} for {} ended with state {} and exit code {}, giving up after {} attempts'.format(
+        job.job_id, job.name, job.state, job.exit_code, job.attempts
+      ))
+      self.db.set_state(job.name, STATE_GAVE_UP, job.exit_code, job.runtime, job.max_rss)
+
+  def update(self, jobs):
+    """Updates the state of the given jobs and handles the finished ones; returns whether any state changed"""
+    results = self.query([ job.job_id for job in jobs ])
+    if results is None:
+      return False
+    changed = False
+    missing = []
+    for job in jobs:
+      if job.job_id not in results:
+        # a job may not be visible to sacct right after its submission
+        if time.time() - job.updated > self.missing_timeout:
+          missing.append(job)
+        continue
+      state, exit_code, runtime, max_rss = results[job.job_id]
+      if state == job.state and state not in FINAL_STATES:
+        continue
+      changed = True
+      self.db.set_state(job.name, state, exit_code, runtime, max_rss)
+      if state in FINAL_STATES:
+        self.finish(self.db.get(job.name))
+    if missing:
+      queued = self.query_queue([ job.job_id for job in missing ])
+      for job in missing:
+        if queued is None or job.job_id in queued:
+          continue
+        logging.warning('Job {} for {} has not been reported by sacct for {:.0f}s and is not in the queue'.format(
+          job.job_id, job.name, time.time() - job.updated
+        ))
+        changed = True
+        self.db.set_state(job.name, STATE_LOST)
+        self.finish(self.db.get(job.name))
+    return changed
+
+  def get_active(self):
+    return [ job for job in self.db.jobs(names = self.names) if job.job_id and job.state not in INACTIVE_STATES ]
+
+  def run(self):
+    """Submits the jobs that have not been submitted or have not produced their output yet, and waits for all of
+    them to finish; returns the number of jobs that failed permanently
+    """
+    for job in self.db.jobs(names = self.names):
+      if job.output_file and not check_output(job.output_file):
+        if job.state == STATE_NEW:
+          self.db.set_state(job.name, STATE_SKIPPED)
+        continue
+      if job.state in INACTIVE_STATES and not self.is_done(job):
+        # the failed jobs of the previous invocation get a new set of attempts
+        self.db.reset(job.name)
+        job = self.db.get(job.name)
+      # the jobs that are still active from the previous invocation are only tracked
+      if job.state == STATE_NEW:
+        self.submit(job)
+
+    poll_interval = self.poll_min
+    while True:
+      active = self.get_active()
+      if not active:
+        break
+      time.sleep(poll_interval)
+      if self.update(active):
+        poll_interval = self.poll_min
+      else:
+        poll_interval = min(2 * poll_interval, self.poll_max)
+      summary = self.db.summary(self.names)
+      logging.info('Jobs: {}'.format(', '.join('{} {}'.format(summary[state], state) for state in sorted(summary))))
+
+    return len(self.db.jobs([ STATE_GAVE_UP ], self.names))
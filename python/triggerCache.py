@@ -0,0 +1,162 @@
+from tthAnalysis.NanoAOD.cacheUtils import get_cache_dir, read_cache, write_cache
+from tthAnalysis.NanoAOD.eraTables import ERAS
+
+import hashlib
+import importlib
+import logging
+import os
+import re
+
+# bump the version whenever the layout of the cached tables changes
+CACHE_VERSION = 2
+
+TABLE_MODULES = [
+  ( 'analysis',        'tthAnalysis.NanoAOD.triggers_{}'                         ),
+  ( 'leptonFR',        'tthAnalysis.NanoAOD.LeptonFakeRate_trigger_{}_cfi'        ),
+  ( 'leptonFR_bbWWSL', 'tthAnalysis.NanoAOD.LeptonFakeRate_bbWWSL_trigger_{}_cfi' ),
+]
+LEPTONFR_KEYS = [ 'path', 'cone_minPt', 'cone_maxPt', 'minRecoPt', 'jet_minPt', 'average_prescale', 'trigger_type' ]
+
+# the luminosity recorded in each run range is available only in the comments of the tables, e.g.
+# [273158, 273158], # HLT_TripleMu_12_10_5_v2, 50.239/pb
+# '273158-273158', # HLT_Mu3_PFJet40_v1, 0.025/pb
+RUN_RANGE_RE = re.compile(
+  r"^\s*(\[\s*(?P<list_min>\d+)\s*,\s*(?P<list_max>\d+)\s*\]|'(?P<str_min>\d+)-(?P<str_max>\d+)')\s*,?\s*(#(?P<comment>.*))?$"
+)
+LUMI_RE = re.compile(r'(?P<lumi>\d+(\.\d+)?)/pb\s*$')
+ANALYSIS_NAME_RE = re.compile(r"^\s*'name'\s*:\s*'(?P<name>\w+)'")
+LEPTON_RE = re.compile(r"^\s*'(?P<lepton>\w+)'\s*:\s*cms\.VPSet\(")
+LEPTONFR_PATH_RE = re.compile(r"^\s*path\s*=\s*cms\.string\(")
+
+_tables = {}
+
+def get_source_path(module_name):
+  return os.path.join(os.path.dirname(os.path.abspath(__file__)), '{}.py'.format(module_name.split('.')[-1]))
+
+def get_source_hash(era):
+  source_hash = hashlib.sha1(str(CACHE_VERSION).encode())
+  for _, module_template in TABLE_MODULES:
+    with open(get_source_path(module_template.format(era)), 'rb') as source_file:
+      source_hash.update(source_file.read())
+  return source_hash.hexdigest()
+
+def parse_range_lumis(source_path, is_analysis):
+  """Collects the run ranges and their luminosities (in 1/pb) from the comments in the source file of a table
+
+  The ranges are keyed by the HLT path name in the analysis tables, and by the lepton flavor and the position
+  of the PSet in its VPSet in the lepton fake rate tables.
+  """
+  range_lumis = {}
+  key = None
+  lepton = None
+  pset_idx = -1
+  with open(source_path, 'r') as source_file:
+    for line in source_file:
+      if is_analysis:
+        name_match = ANALYSIS_NAME_RE.match(line)
+        if name_match:
+          key = name_match.group('name')
+          continue
+      else:
+        lepton_match = LEPTON_RE.match(line)
+        if lepton_match:
+          lepton = lepton_match.group('lepton')
+          pset_idx = -1
+          continue
+        if LEPTONFR_PATH_RE.match(line):
+          pset_idx += 1
+          key = (lepton, pset_idx)
+          continue
+      range_match = RUN_RANGE_RE.match(line)
+      if not range_match:
+        continue
+      assert(key is not None)
+      if range_match.group('list_min'):
+        run_range = ( int(range_match.group('list_min')), int(range_match.group('list_max')) )
+      else:
+        run_range = ( int(range_match.group('str_min')), int(range_match.group('str_max')) )
+      comment = range_match.group('comment')
+      lumi_match = LUMI_RE.search(comment.strip()) if comment else None
+      if key not in range_lumis:
+        range_lumis[key] = []
+      range_lumis[key].append((run_range, float(lumi_match.group('lumi')) if lumi_match else None))
+  return range_lumis
+
+def get_lumis(run_ranges, range_lumis, key, source_path):
+  if key not in range_lumis or [ run_range for run_range, _ in range_lumis[key] ] != run_ranges:
+    logging.getLogger(__name__).warning(
+      "Unable to match the luminosities of {} in the comments of {}".format(key, source_path)
+    )
+    return [ None ] * len(run_ranges)
+  return [ lumi for _, lumi in range_lumis[key] ]
+
+def get_int_lumi(lumis):
+  # integrated luminosity in 1/fb
+  if None in lumis:
+    return None
+  return round(sum(lumis) / 1000., 3)
+
+def build_tables(era):
+  """Executes the trigger tables of an era and converts them into plain python objects"""
+  tables = {}
+  for table_name, module_template in TABLE_MODULES:
+    module_name = module_template.format(era)
+    source_path = get_source_path(module_name)
+    module = importlib.import_module(module_name)
+    if table_name == 'analysis':
+      range_lumis = parse_range_lumis(source_path, True)
+      table = {}
+      for trigger_type, triggers in module.triggers_analysis.items():
+        table[trigger_type] = []
+        for trigger in triggers:
+          run_ranges = [ tuple(run_range) for run_range in trigger['runs'] ]
+          lumis = get_lumis(run_ranges, range_lumis, trigger['name'], source_path)
+          entry = {
+            'name'        : trigger['name'],
+            'int_lumi'    : get_int_lumi(lumis),
+            'unprescaled' : trigger['unprescaled'],
+            'runs'        : run_ranges,
+            'lumis'       : lumis,
+          }
+          table[trigger_type].append(entry)
+    else:
+      range_lumis = parse_range_lumis(source_path, False)
+      table = {}
+      for lepton, hlt_paths in module.leptonFR_triggers.items():
+        table[lepton] = []
+        for pset_idx, hlt_path in enumerate(hlt_paths):
+          entry = { key : getattr(hlt_path, key).value() for key in LEPTONFR_KEYS }
+          run_ranges = []
+          for run_range in hlt_path.run_ranges:
+            run_range_split = run_range.split('-')
+            assert(len(run_range_split) == 2)
+            run_ranges.append(( int(run_range_split[0]), int(run_range_split[1]) ))
+          entry['runs'] = run_ranges
+          entry['lumis'] = get_lumis(run_ranges, range_lumis, (lepton, pset_idx), source_path)
+          table[lepton].append(entry)
+    tables[table_name] = table
+  return tables
+
+def load_tables(era, use_cache = True):
+  """Returns the trigger tables of an era as plain python objects
+
+  The tables are read from a cache file that is keyed by the content hash of their source files. If there is no
+  such file, the tables are built from the sources and the cache file is written for the next caller. Set the
+  environment variable TTH_NANOAOD_CACHE_DIR to an empty string to disable the cache.
+  """
+  if era not in ERAS:
+    raise ValueError("Invalid era: %s" % era)
+  if era in _tables:
+    return _tables[era]
+  cache_dir = get_cache_dir()
+  cache_path = ''
+  tables = None
+  if use_cache and cache_dir:
+    cache_path = os.path.join(cache_dir, 'triggers_{}_{}.pkl'.format(era, get_source_hash(era)))
+    tables = read_cache(cache_path)
+  if tables is None:
+    tables = build_tables(era)
+    if cache_path:
+      write_cache(cache_path, tables)
+  _tables[era] = tables
+  return tables
@@ -0,0 +1,85 @@
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.triggerCache import load_tables
+
+import bisect
+
+class PathLumi(object):
+  """Luminosity recorded by an HLT path, stored as a prefix sum over its run ranges (in 1/pb)
+
+  The luminosity is known only per run range of the trigger tables, so a run range that only partially overlaps
+  with the queried runs is counted in full.
+  """
+
+  def __init__(self, run_ranges, lumis):
+    assert(len(run_ranges) == len(lumis))
+    range_lumis = sorted(zip(run_ranges, lumis))
+    self.starts = [ run_range[0] for run_range, _ in range_lumis ]
+    self.ends = [ run_range[1] for run_range, _ in range_lumis ]
+    assert(all(self.ends[idx] < self.starts[idx + 1] for idx in range(len(self.starts) - 1)))
+    self.cumulative = [ 0. ]
+    for _, lumi in range_lumis:
+      self.cumulative.append(self.cumulative[-1] + lumi)
+
+  def get_idx_range(self, run_min, run_max):
+    idx_first = bisect.bisect_left(self.ends, run_min)
+    idx_last = bisect.bisect_right(self.starts, run_max)
+    return idx_first, max(idx_first, idx_last)
+
+  def total(self):
+    return self.cumulative[-1]
+
+  def between(self, run_min, run_max):
+    idx_first, idx_last = self.get_idx_range(run_min, run_max)
+    return self.cumulative[idx_last] - self.cumulative[idx_first]
+
+  def for_runs(self, runs):
+    """Sums up the run ranges that overlap with the given runs, e.g. with the runs of a golden JSON
+
+    The runs can be given as an IntervalSet or as an iterable of run numbers.
+    """
+    if not isinstance(runs, IntervalSet):
+      runs = IntervalSet((run, run) for run in runs)
+    lumi = 0.
+    idx_counted = 0
+    for run_min, run_max in runs:
+      idx_first, idx_last = self.get_idx_range(run_min, run_max)
+      # do not count the same run range twice if it overlaps with multiple intervals of runs
+      idx_first = max(idx_first, idx_counted)
+      if idx_last > idx_first:
+        lumi += self.cumulative[idx_last] - self.cumulative[idx_first]
+        idx_counted = idx_last
+    return lumi
+
+class TriggerLumis(object):
+  """Integrated luminosities of the HLT paths of an era (in 1/pb)"""
+
+  def __init__(self, era):
+    tables = load_tables(era)
+    self.path_lumis = {}
+    for trigger_type in tables['analysis']:
+      for trigger in tables['analysis'][trigger_type]:
+        if None not in trigger['lumis']:
+          self.path_lumis[trigger['name']] = PathLumi(trigger['runs'], trigger['lumis'])
+    for table_name in [ 'leptonFR', 'leptonFR_bbWWSL' ]:
+      for lepton in tables[table_name]:
+        for hlt in tables[table_name][lepton]:
+          # the luminosities in the analysis tables take precedence
+          if hlt['path'] not in self.path_lumis and None not in hlt['lumis']:
+            self.path_lumis[hlt['path']] = PathLumi(hlt['runs'], hlt['lumis'])
+
+  def __getitem__(self, path):
+    if path not in self.path_lumis:
+      raise ValueError("No luminosity available for HLT path: %s" % path)
+    return self.path_lumis[path]
+
+  def __contains__(self, path):
+    return path in self.path_lumis
+
+  def total(self, path):
+    return self[path].total()
+
+  def between(self, path, run_min, run_max):
+    return self[path].between(run_min, run_max)
+
+  def for_runs(self, path, runs):
+    return self[path].for_runs(runs)
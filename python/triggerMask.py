@@ -0,0 +1,69 @@
+import numpy as np
+
+WORD_SIZE = 64
+
+class TriggerRunMask(object):
+  """Maps an array of run numbers to a bitmask of the HLT paths that are active or unprescaled in each run
+
+  The run ranges of all paths are split into elementary segments at every range boundary, and the bitmask of each
+  segment is computed once. Annotating the runs then takes a single np.searchsorted() over the segment boundaries.
+  Path number i corresponds to bit i % 64 of word i // 64 in the returned masks.
+  """
+
+  def __init__(self, triggers, paths = None):
+    self.paths = sorted(paths if paths is not None else triggers.triggers_flat)
+    invalid_paths = set(self.paths) - set(triggers.run_ranges.keys())
+    if invalid_paths:
+      raise ValueError("Invalid HLT paths: %s" % ', '.join(sorted(invalid_paths)))
+    self.nof_words = max((len(self.paths) + WORD_SIZE - 1) // WORD_SIZE, 1)
+
+    range_bounds = [ self.get_bounds(triggers.run_ranges[path]) for path in self.paths ]
+    if range_bounds:
+      # segment i covers the runs from self.edges[i] to self.edges[i + 1] - 1
+      self.edges = np.unique(np.concatenate([ np.concatenate([ starts, ends + 1 ]) for starts, ends in range_bounds ]))
+    else:
+      self.edges = np.zeros(0, dtype = np.int64)
+    self.active = np.zeros((len(self.edges), self.nof_words), dtype = np.uint64)
+    self.unprescaled = np.zeros_like(self.active)
+
+    for path_idx, (path, (starts, ends)) in enumerate(zip(self.paths, range_bounds)):
+      word, bit = self.get_bit(path_idx)
+      is_covered = np.zeros(len(self.edges) + 1, dtype = np.int64)
+      np.add.at(is_covered, np.searchsorted(self.edges, starts), 1)
+      np.add.at(is_covered, np.searchsorted(self.edges, ends + 1), -1)
+      is_covered = np.cumsum(is_covered)[:-1] > 0
+      self.active[is_covered, word] |= bit
+      if path in triggers.triggers_unprescaled_flat:
+        self.unprescaled[is_covered, word] |= bit
+
+  @staticmethod
+  def get_bounds(run_ranges):
+    return np.asarray(run_ranges.starts, dtype = np.int64), np.asarray(run_ranges.ends, dtype = np.int64)
+
+  @staticmethod
+  def get_bit(path_idx):
+    return path_idx // WORD_SIZE, np.uint64(1 << (path_idx % WORD_SIZE))
+
+  def annotate(self, runs, unprescaled = False):
+    """Returns an array of shape (len(runs), nof_words) holding the bitmask of each run"""
+    runs = np.asarray(runs, dtype = np.int64)
+    table = self.unprescaled if unprescaled else self.active
+    segment_idxs = np.searchsorted(self.edges, runs, side = 'right') - 1
+    masks = np.zeros((len(runs), self.nof_words), dtype = np.uint64)
+    is_inside = segment_idxs >= 0
+    masks[is_inside] = table[segment_idxs[is_inside]]
+    return masks
+
+  def passes(self, masks, path):
+    """Returns a boolean array telling which of the annotated runs have the given path enabled"""
+    if path not in self.paths:
+      raise ValueError("Invalid HLT path: %s" % path)
+    word, bit = self.get_bit(self.paths.index(path))
+    return (masks[:, word] & bit) != 0
+
+  def decode(self, mask):
+    """Returns the names of the paths that are set in the bitmask of a single run"""
+    return [
+      path for path_idx, path in enumerate(self.paths)
+      if int(mask[path_idx // WORD_SIZE]) & (1 << (path_idx % WORD_SIZE))
+    ]
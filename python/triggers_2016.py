@@ -0,0 +1,6662 @@
+triggers_analysis = {
+  '3mu' : [
+    {
+      'name'        : 'HLT_TripleMu_12_10_5',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_TripleMu_12_10_5_v2, 50.239/pb
+        [273302, 273302], # HLT_TripleMu_12_10_5_v2, 16.319/pb
+        [273402, 273406], # HLT_TripleMu_12_10_5_v2, 13.589/pb
+        [273408, 273411], # HLT_TripleMu_12_10_5_v2, 13.087/pb
+        [273425, 273425], # HLT_TripleMu_12_10_5_v2, 26.717/pb
+        [273446, 273450], # HLT_TripleMu_12_10_5_v2, 94.292/pb
+        [273492, 273494], # HLT_TripleMu_12_10_5_v2, 30.924/pb
+        [273502, 273503], # HLT_TripleMu_12_10_5_v2, 72.147/pb
+        [273554, 273555], # HLT_TripleMu_12_10_5_v2, 38.827/pb
+        [273725, 273725], # HLT_TripleMu_12_10_5_v2, 154.653/pb
+        [273728, 273728], # HLT_TripleMu_12_10_5_v2, 4.897/pb
+        [273730, 273730], # HLT_TripleMu_12_10_5_v2, 86.49/pb
+        [274094, 274094], # HLT_TripleMu_12_10_5_v2, 9.735/pb
+        [274146, 274146], # HLT_TripleMu_12_10_5_v2, 5.12/pb
+        [274157, 274157], # HLT_TripleMu_12_10_5_v2, 38.994/pb
+        [274159, 274161], # HLT_TripleMu_12_10_5_v2, 62.883/pb
+        [274172, 274172], # HLT_TripleMu_12_10_5_v2, 5.249/pb
+        [274198, 274200], # HLT_TripleMu_12_10_5_v2, 135.972/pb
+        [274240, 274241], # HLT_TripleMu_12_10_5_v2, 134.472/pb
+        [274244, 274244], # HLT_TripleMu_12_10_5_v2, 56.348/pb
+        [274250, 274251], # HLT_TripleMu_12_10_5_v2, 159.993/pb
+        [274283, 274284], # HLT_TripleMu_12_10_5_v2, 30.266/pb
+        [274286, 274286], # HLT_TripleMu_12_10_5_v2, 21.668/pb
+        [274314, 274317], # HLT_TripleMu_12_10_5_v2, 206.7/pb
+        [274319, 274319], # HLT_TripleMu_12_10_5_v2, 27.302/pb
+        [274335, 274339], # HLT_TripleMu_12_10_5_v2, 246.003/pb
+        [274344, 274345], # HLT_TripleMu_12_10_5_v2, 87.68/pb
+        [274382, 274382], # HLT_TripleMu_12_10_5_v2, 7.428/pb
+        [274387, 274388], # HLT_TripleMu_12_10_5_v2, 312.374/pb
+        [274420, 274422], # HLT_TripleMu_12_10_5_v2, 359.125/pb
+        [274440, 274442], # HLT_TripleMu_12_10_5_v2, 226.466/pb
+        [274954, 274955], # HLT_TripleMu_12_10_5_v3, 5.735/pb
+        [274968, 274971], # HLT_TripleMu_12_10_5_v3, 422.272/pb
+        [274998, 275001], # HLT_TripleMu_12_10_5_v3, 489.252/pb
+        [275059, 275059], # HLT_TripleMu_12_10_5_v3, 6.094/pb
+        [275066, 275068], # HLT_TripleMu_12_10_5_v3, 231.774/pb
+        [275073, 275074], # HLT_TripleMu_12_10_5_v3, 144.124/pb
+        [275124, 275125], # HLT_TripleMu_12_10_5_v3, 205.394/pb
+        [275282, 275284], # HLT_TripleMu_12_10_5_v3, 49.295/pb
+        [275290, 275293], # HLT_TripleMu_12_10_5_v3, 94.338/pb
+        [275309, 275311], # HLT_TripleMu_12_10_5_v3, 411.084/pb
+        [275319, 275319], # HLT_TripleMu_12_10_5_v3, 24.399/pb
+        [275337, 275338], # HLT_TripleMu_12_10_5_v3, 143.358/pb
+        [275344, 275345], # HLT_TripleMu_12_10_5_v3, 109.524/pb
+        [275370, 275371], # HLT_TripleMu_12_10_5_v3, 145.599/pb
+        [275375, 275376], # HLT_TripleMu_12_10_5_v3, 528.636/pb
+        [275657, 275659], # HLT_TripleMu_12_10_5_v3, 80.874/pb
+        [275761, 275761], # HLT_TripleMu_12_10_5_v3, 1.667/pb
+        [275767, 275767], # HLT_TripleMu_12_10_5_v3, 0.714/pb
+        [275772, 275774], # HLT_TripleMu_12_10_5_v3, 66.444/pb
+        [275776, 275778], # HLT_TripleMu_12_10_5_v3, 116.898/pb
+        [275782, 275782], # HLT_TripleMu_12_10_5_v3, 99.533/pb
+        [275832, 275837], # HLT_TripleMu_12_10_5_v3, 441.03/pb
+        [275847, 275847], # HLT_TripleMu_12_10_5_v3, 198.947/pb
+        [275886, 275886], # HLT_TripleMu_12_10_5_v3, 7.581/pb
+        [275890, 275890], # HLT_TripleMu_12_10_5_v3, 235.22/pb
+        [275911, 275913], # HLT_TripleMu_12_10_5_v3, 201.741/pb
+        [275918, 275918], # HLT_TripleMu_12_10_5_v3, 49.71/pb
+        [275920, 275921], # HLT_TripleMu_12_10_5_v3, 62.257/pb
+        [275923, 275923], # HLT_TripleMu_12_10_5_v3, 14.5/pb
+        [275931, 275931], # HLT_TripleMu_12_10_5_v3, 10.418/pb
+        [275963, 275963], # HLT_TripleMu_12_10_5_v3, 19.553/pb
+        [276092, 276092], # HLT_TripleMu_12_10_5_v3, 14.768/pb
+        [276097, 276097], # HLT_TripleMu_12_10_5_v3, 99.405/pb
+        [276242, 276244], # HLT_TripleMu_12_10_5_v3, 479.052/pb
+        [276282, 276283], # HLT_TripleMu_12_10_5_v3, 372.59/pb
+        [276315, 276315], # HLT_TripleMu_12_10_5_v3, 34.051/pb
+        [276317, 276318], # HLT_TripleMu_12_10_5_v3, 124.306/pb
+        [276355, 276355], # HLT_TripleMu_12_10_5_v3, 6.205/pb
+        [276361, 276361], # HLT_TripleMu_12_10_5_v3, 149.465/pb
+        [276363, 276363], # HLT_TripleMu_12_10_5_v3, 206.376/pb
+        [276384, 276384], # HLT_TripleMu_12_10_5_v3, 121.517/pb
+        [276437, 276437], # HLT_TripleMu_12_10_5_v3, 355.688/pb
+        [276454, 276454], # HLT_TripleMu_12_10_5_v3, 63.924/pb
+        [276458, 276458], # HLT_TripleMu_12_10_5_v3, 33.169/pb
+        [276495, 276495], # HLT_TripleMu_12_10_5_v3, 38.062/pb
+        [276501, 276502], # HLT_TripleMu_12_10_5_v3, 486.891/pb
+        [276525, 276525], # HLT_TripleMu_12_10_5_v3, 402.663/pb
+        [276527, 276528], # HLT_TripleMu_12_10_5_v3, 60.758/pb
+        [276542, 276545], # HLT_TripleMu_12_10_5_v3, 345.204/pb
+        [276581, 276587], # HLT_TripleMu_12_10_5_v3, 471.493/pb
+        [276653, 276653], # HLT_TripleMu_12_10_5_v3, 86.12/pb
+        [276655, 276655], # HLT_TripleMu_12_10_5_v3, 160.843/pb
+        [276659, 276659], # HLT_TripleMu_12_10_5_v3, 29.939/pb
+        [276775, 276776], # HLT_TripleMu_12_10_5_v3, 443.702/pb
+        [276794, 276794], # HLT_TripleMu_12_10_5_v3, 87.206/pb
+        [276807, 276808], # HLT_TripleMu_12_10_5_v3, 188.301/pb
+        [276810, 276811], # HLT_TripleMu_12_10_5_v3, 346.409/pb
+        [276831, 276831], # HLT_TripleMu_12_10_5_v3, 400.298/pb
+        [276834, 276834], # HLT_TripleMu_12_10_5_v3, 72.6/pb
+        [276870, 276870], # HLT_TripleMu_12_10_5_v3, 526.587/pb
+        [276935, 276935], # HLT_TripleMu_12_10_5_v3, 169.998/pb
+        [276940, 276940], # HLT_TripleMu_12_10_5_v3, 28.701/pb
+        [276946, 276948], # HLT_TripleMu_12_10_5_v3, 114.81/pb
+        [276950, 276950], # HLT_TripleMu_12_10_5_v3, 323.179/pb
+        [277069, 277073], # HLT_TripleMu_12_10_5_v3, 390.296/pb
+        [277076, 277076], # HLT_TripleMu_12_10_5_v3, 125.929/pb
+        [277087, 277087], # HLT_TripleMu_12_10_5_v3, 86.357/pb
+        [277094, 277094], # HLT_TripleMu_12_10_5_v3, 131.103/pb
+        [277096, 277096], # HLT_TripleMu_12_10_5_v3, 320.668/pb
+        [277112, 277112], # HLT_TripleMu_12_10_5_v3, 17.339/pb
+        [277126, 277127], # HLT_TripleMu_12_10_5_v3, 185.976/pb
+        [277148, 277148], # HLT_TripleMu_12_10_5_v3, 128.192/pb
+        [277166, 277166], # HLT_TripleMu_12_10_5_v3, 70.666/pb
+        [277168, 277168], # HLT_TripleMu_12_10_5_v3, 318.998/pb
+        [277180, 277180], # HLT_TripleMu_12_10_5_v3, 31.25/pb
+        [277194, 277194], # HLT_TripleMu_12_10_5_v3, 367.175/pb
+        [277305, 277305], # HLT_TripleMu_12_10_5_v3, 154.262/pb
+        [277420, 277420], # HLT_TripleMu_12_10_5_v3, 60.844/pb
+        [277981, 277981], # HLT_TripleMu_12_10_5_v3, 4.601/pb
+        [277991, 277992], # HLT_TripleMu_12_10_5_v3, 21.692/pb
+        [278017, 278018], # HLT_TripleMu_12_10_5_v3, 338.894/pb
+        [278167, 278167], # HLT_TripleMu_12_10_5_v3, 314.532/pb
+        [278175, 278175], # HLT_TripleMu_12_10_5_v3, 9.045/pb
+        [278193, 278193], # HLT_TripleMu_12_10_5_v3, 34.581/pb
+        [278239, 278240], # HLT_TripleMu_12_10_5_v3, 330.009/pb
+        [278273, 278274], # HLT_TripleMu_12_10_5_v3, 23.87/pb
+        [278288, 278290], # HLT_TripleMu_12_10_5_v3, 14.747/pb
+        [278308, 278308], # HLT_TripleMu_12_10_5_v3, 313.102/pb
+        [278310, 278310], # HLT_TripleMu_12_10_5_v3, 88.422/pb
+        [278315, 278315], # HLT_TripleMu_12_10_5_v3, 137.45/pb
+        [278345, 278346], # HLT_TripleMu_12_10_5_v3, 171.231/pb
+        [278349, 278349], # HLT_TripleMu_12_10_5_v3, 94.737/pb
+        [278366, 278366], # HLT_TripleMu_12_10_5_v3, 59.423/pb
+        [278406, 278406], # HLT_TripleMu_12_10_5_v3, 296.962/pb
+        [278509, 278509], # HLT_TripleMu_12_10_5_v3, 273.442/pb
+        [278769, 278770], # HLT_TripleMu_12_10_5_v3, 170.993/pb
+        [278801, 278805], # HLT_TripleMu_12_10_5_v3, 137.142/pb
+        [278808, 278808], # HLT_TripleMu_12_10_5_v3, 269.634/pb
+        [278820, 278820], # HLT_TripleMu_12_10_5_v3, 286.511/pb
+        [278822, 278822], # HLT_TripleMu_12_10_5_v3, 191.158/pb
+        [278873, 278875], # HLT_TripleMu_12_10_5_v3, 198.657/pb
+        [278923, 278923], # HLT_TripleMu_12_10_5_v3, 98.543/pb
+        [278957, 278957], # HLT_TripleMu_12_10_5_v3, 36.164/pb
+        [278962, 278963], # HLT_TripleMu_12_10_5_v3, 113.024/pb
+        [278969, 278969], # HLT_TripleMu_12_10_5_v3, 282.492/pb
+        [278975, 278976], # HLT_TripleMu_12_10_5_v3, 122.556/pb
+        [278986, 278986], # HLT_TripleMu_12_10_5_v3, 31.548/pb
+        [279024, 279024], # HLT_TripleMu_12_10_5_v3, 49.596/pb
+        [279029, 279029], # HLT_TripleMu_12_10_5_v3, 38.088/pb
+        [279071, 279071], # HLT_TripleMu_12_10_5_v3, 22.581/pb
+        [279080, 279080], # HLT_TripleMu_12_10_5_v3, 12.773/pb
+        [279115, 279116], # HLT_TripleMu_12_10_5_v3, 174.938/pb
+        [279479, 279479], # HLT_TripleMu_12_10_5_v3, 5.927/pb
+        [279588, 279588], # HLT_TripleMu_12_10_5_v3, 228.517/pb
+        [279653, 279654], # HLT_TripleMu_12_10_5_v3, 283.775/pb
+        [279656, 279656], # HLT_TripleMu_12_10_5_v3, 5.684/pb
+        [279658, 279658], # HLT_TripleMu_12_10_5_v3, 93.394/pb
+        [279667, 279667], # HLT_TripleMu_12_10_5_v3, 208.732/pb
+        [279681, 279685], # HLT_TripleMu_12_10_5_v3, 74.528/pb
+        [279691, 279691], # HLT_TripleMu_12_10_5_v3, 9.656/pb
+        [279694, 279694], # HLT_TripleMu_12_10_5_v3, 406.418/pb
+        [279715, 279716], # HLT_TripleMu_12_10_5_v3, 383.763/pb
+        [279760, 279760], # HLT_TripleMu_12_10_5_v3, 153.502/pb
+        [279766, 279767], # HLT_TripleMu_12_10_5_v3, 358.144/pb
+        [279794, 279794], # HLT_TripleMu_12_10_5_v3, 223.093/pb
+        [279823, 279823], # HLT_TripleMu_12_10_5_v3, 81.828/pb
+        [279841, 279841], # HLT_TripleMu_12_10_5_v3, 380.359/pb
+        [279844, 279844], # HLT_TripleMu_12_10_5_v3, 56.588/pb
+        [279887, 279887], # HLT_TripleMu_12_10_5_v3, 73.316/pb
+        [279931, 279931], # HLT_TripleMu_12_10_5_v3, 475.316/pb
+        [279966, 279966], # HLT_TripleMu_12_10_5_v3, 93.011/pb
+        [279975, 279975], # HLT_TripleMu_12_10_5_v3, 239.011/pb
+        [279993, 279994], # HLT_TripleMu_12_10_5_v3, 30.455/pb
+        [280013, 280013], # HLT_TripleMu_12_10_5_v3, 5.636/pb
+        [280015, 280018], # HLT_TripleMu_12_10_5_v3, 398.79/pb
+        [280020, 280020], # HLT_TripleMu_12_10_5_v3, 4.614/pb
+        [280024, 280024], # HLT_TripleMu_12_10_5_v3, 41.841/pb
+        [280187, 280188], # HLT_TripleMu_12_10_5_v3, 74.778/pb
+        [280191, 280191], # HLT_TripleMu_12_10_5_v3, 178.951/pb
+        [280194, 280194], # HLT_TripleMu_12_10_5_v3, 36.665/pb
+        [280242, 280242], # HLT_TripleMu_12_10_5_v3, 147.69/pb
+        [280249, 280249], # HLT_TripleMu_12_10_5_v3, 239.16/pb
+        [280251, 280251], # HLT_TripleMu_12_10_5_v3, 47.176/pb
+        [280327, 280327], # HLT_TripleMu_12_10_5_v3, 8.719/pb
+        [280330, 280330], # HLT_TripleMu_12_10_5_v3, 185.776/pb
+        [280349, 280349], # HLT_TripleMu_12_10_5_v3, 104.129/pb
+        [280363, 280364], # HLT_TripleMu_12_10_5_v3, 205.282/pb
+        [280383, 280385], # HLT_TripleMu_12_10_5_v3, 372.972/pb
+        [281613, 281613], # HLT_TripleMu_12_10_5_v4, 9.764/pb
+        [281639, 281639], # HLT_TripleMu_12_10_5_v4, 18.977/pb
+        [281641, 281641], # HLT_TripleMu_12_10_5_v4, 39.268/pb
+        [281693, 281693], # HLT_TripleMu_12_10_5_v4, 376.118/pb
+        [281707, 281707], # HLT_TripleMu_12_10_5_v4, 214.55/pb
+        [281726, 281727], # HLT_TripleMu_12_10_5_v4, 251.373/pb
+        [281797, 281797], # HLT_TripleMu_12_10_5_v4, 397.836/pb
+        [281975, 281976], # HLT_TripleMu_12_10_5_v4, 393.967/pb
+        [282033, 282035], # HLT_TripleMu_12_10_5_v4, 26.293/pb
+        [282037, 282037], # HLT_TripleMu_12_10_5_v4, 331.413/pb
+        [282092, 282092], # HLT_TripleMu_12_10_5_v4, 296.762/pb
+        [282708, 282708], # HLT_TripleMu_12_10_5_v4, 2.118/pb
+        [282710, 282710], # HLT_TripleMu_12_10_5_v4, 0.346/pb
+        [282712, 282712], # HLT_TripleMu_12_10_5_v4, 16.683/pb
+        [282730, 282735], # HLT_TripleMu_12_10_5_v4, 469.07/pb
+        [282800, 282800], # HLT_TripleMu_12_10_5_v4, 93.58/pb
+        [282807, 282807], # HLT_TripleMu_12_10_5_v4, 70.563/pb
+        [282814, 282814], # HLT_TripleMu_12_10_5_v4, 276.224/pb
+        [282842, 282842], # HLT_TripleMu_12_10_5_v4, 23.509/pb
+        [282917, 282919], # HLT_TripleMu_12_10_5_v4, 88.074/pb
+        [282922, 282923], # HLT_TripleMu_12_10_5_v4, 66.001/pb
+        [283042, 283043], # HLT_TripleMu_12_10_5_v4, 118.119/pb
+        [283049, 283050], # HLT_TripleMu_12_10_5_v4, 61.072/pb
+        [283052, 283052], # HLT_TripleMu_12_10_5_v4, 28.777/pb
+        [283059, 283059], # HLT_TripleMu_12_10_5_v4, 98.778/pb
+        [283270, 283270], # HLT_TripleMu_12_10_5_v4, 381.444/pb
+        [283283, 283283], # HLT_TripleMu_12_10_5_v4, 197.444/pb
+        [283305, 283308], # HLT_TripleMu_12_10_5_v4, 338.86/pb
+        [283353, 283353], # HLT_TripleMu_12_10_5_v4, 191.088/pb
+        [283358, 283359], # HLT_TripleMu_12_10_5_v4, 233.089/pb
+        [283407, 283408], # HLT_TripleMu_12_10_5_v4, 466.833/pb
+        [283416, 283416], # HLT_TripleMu_12_10_5_v4, 21.628/pb
+        [283453, 283453], # HLT_TripleMu_12_10_5_v4, 123.278/pb
+        [283469, 283469], # HLT_TripleMu_12_10_5_v4, 0.031/pb
+        [283478, 283478], # HLT_TripleMu_12_10_5_v4, 210.23/pb
+        [283548, 283548], # HLT_TripleMu_12_10_5_v4, 26.451/pb
+        [283680, 283682], # HLT_TripleMu_12_10_5_v4, 102.814/pb
+        [283685, 283685], # HLT_TripleMu_12_10_5_v4, 20.432/pb
+        [283820, 283820], # HLT_TripleMu_12_10_5_v4, 259.058/pb
+        [283830, 283830], # HLT_TripleMu_12_10_5_v4, 102.255/pb
+        [283834, 283835], # HLT_TripleMu_12_10_5_v4, 20.323/pb
+        [283865, 283865], # HLT_TripleMu_12_10_5_v4, 264.403/pb
+        [283876, 283877], # HLT_TripleMu_12_10_5_v4, 409.447/pb
+        [283884, 283885], # HLT_TripleMu_12_10_5_v4, 392.377/pb
+        [283933, 283934], # HLT_TripleMu_12_10_5_v4, 309.793/pb
+        [283946, 283946], # HLT_TripleMu_12_10_5_v4, 300.188/pb
+        [283964, 283964], # HLT_TripleMu_12_10_5_v4, 58.698/pb
+        [284006, 284006], # HLT_TripleMu_12_10_5_v4, 57.69/pb
+        [284014, 284014], # HLT_TripleMu_12_10_5_v4, 47.826/pb
+        [284025, 284025], # HLT_TripleMu_12_10_5_v4, 12.193/pb
+        [284029, 284029], # HLT_TripleMu_12_10_5_v4, 29.941/pb
+        [284035, 284044], # HLT_TripleMu_12_10_5_v4, 303.58/pb
+      ],
+    },
+  ],
+  '1e2mu' : [
+    {
+      'name'        : 'HLT_DiMu9_Ele9_CaloIdL_TrackIdL',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 50.239/pb
+        [273302, 273302], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 16.319/pb
+        [273402, 273406], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 13.589/pb
+        [273408, 273411], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 13.087/pb
+        [273425, 273425], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 26.717/pb
+        [273446, 273450], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 94.292/pb
+        [273492, 273494], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 30.924/pb
+        [273502, 273503], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 72.147/pb
+        [273554, 273555], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 38.827/pb
+        [273725, 273725], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 154.653/pb
+        [273728, 273728], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 4.897/pb
+        [273730, 273730], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 86.49/pb
+        [274094, 274094], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 9.735/pb
+        [274146, 274146], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 5.12/pb
+        [274157, 274157], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 38.994/pb
+        [274159, 274161], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 62.883/pb
+        [274172, 274172], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 5.249/pb
+        [274198, 274200], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 135.972/pb
+        [274240, 274241], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 134.472/pb
+        [274244, 274244], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 56.348/pb
+        [274250, 274251], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 159.993/pb
+        [274283, 274284], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 30.266/pb
+        [274286, 274286], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 21.668/pb
+        [274314, 274317], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 206.7/pb
+        [274319, 274319], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 27.302/pb
+        [274335, 274339], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 246.003/pb
+        [274344, 274345], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 87.68/pb
+        [274382, 274382], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 7.428/pb
+        [274387, 274388], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 312.374/pb
+        [274420, 274422], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 359.125/pb
+        [274440, 274442], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v3, 226.466/pb
+        [274954, 274955], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v4, 5.735/pb
+        [274968, 274971], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v4, 422.272/pb
+        [274998, 275001], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v4, 489.252/pb
+        [275059, 275059], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v4, 6.094/pb
+        [275066, 275068], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v4/HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v5, 231.774/pb
+        [275073, 275074], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v5, 144.124/pb
+        [275124, 275125], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v5, 205.394/pb
+        [275282, 275284], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v5, 49.295/pb
+        [275290, 275293], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v5, 94.338/pb
+        [275309, 275311], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v5, 411.084/pb
+        [275319, 275319], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 24.399/pb
+        [275337, 275338], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 143.358/pb
+        [275344, 275345], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 109.524/pb
+        [275370, 275371], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 145.599/pb
+        [275375, 275376], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 528.636/pb
+        [275657, 275659], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 80.874/pb
+        [275761, 275761], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 1.667/pb
+        [275767, 275767], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 0.714/pb
+        [275772, 275774], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 66.444/pb
+        [275776, 275778], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 116.898/pb
+        [275782, 275782], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 99.533/pb
+        [275832, 275837], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 441.03/pb
+        [275847, 275847], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 198.947/pb
+        [275886, 275886], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 7.581/pb
+        [275890, 275890], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 235.22/pb
+        [275911, 275913], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 201.741/pb
+        [275918, 275918], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 49.71/pb
+        [275920, 275921], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 62.257/pb
+        [275923, 275923], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 14.5/pb
+        [275931, 275931], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 10.418/pb
+        [275963, 275963], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 19.553/pb
+        [276092, 276092], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 14.768/pb
+        [276097, 276097], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 99.405/pb
+        [276242, 276244], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 479.052/pb
+        [276282, 276283], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 372.59/pb
+        [276315, 276315], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 34.051/pb
+        [276317, 276318], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 124.306/pb
+        [276355, 276355], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 6.205/pb
+        [276361, 276361], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 149.465/pb
+        [276363, 276363], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 206.376/pb
+        [276384, 276384], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 121.517/pb
+        [276437, 276437], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 355.688/pb
+        [276454, 276454], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 63.924/pb
+        [276458, 276458], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 33.169/pb
+        [276495, 276495], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 38.062/pb
+        [276501, 276502], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 486.891/pb
+        [276525, 276525], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 402.663/pb
+        [276527, 276528], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 60.758/pb
+        [276542, 276545], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 345.204/pb
+        [276581, 276587], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 471.493/pb
+        [276653, 276653], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 86.12/pb
+        [276655, 276655], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 160.843/pb
+        [276659, 276659], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 29.939/pb
+        [276775, 276776], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 443.702/pb
+        [276794, 276794], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 87.206/pb
+        [276807, 276808], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 188.301/pb
+        [276810, 276811], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 346.409/pb
+        [276831, 276831], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 400.298/pb
+        [276834, 276834], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 72.6/pb
+        [276870, 276870], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 526.587/pb
+        [276935, 276935], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 169.998/pb
+        [276940, 276940], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 28.701/pb
+        [276946, 276948], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 114.81/pb
+        [276950, 276950], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 323.179/pb
+        [277069, 277073], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 390.296/pb
+        [277076, 277076], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 125.929/pb
+        [277087, 277087], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 86.357/pb
+        [277094, 277094], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 131.103/pb
+        [277096, 277096], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 320.668/pb
+        [277112, 277112], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 17.339/pb
+        [277126, 277127], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 185.976/pb
+        [277148, 277148], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 128.192/pb
+        [277166, 277166], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 70.666/pb
+        [277168, 277168], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 318.998/pb
+        [277180, 277180], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 31.25/pb
+        [277194, 277194], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 367.175/pb
+        [277305, 277305], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 154.262/pb
+        [277420, 277420], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 60.844/pb
+        [277981, 277981], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 4.601/pb
+        [277991, 277992], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 21.692/pb
+        [278017, 278018], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 338.894/pb
+        [278167, 278167], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 314.532/pb
+        [278175, 278175], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 9.045/pb
+        [278193, 278193], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 34.581/pb
+        [278239, 278240], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 330.009/pb
+        [278273, 278274], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 23.87/pb
+        [278288, 278290], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 14.747/pb
+        [278308, 278308], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 313.102/pb
+        [278310, 278310], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 88.422/pb
+        [278315, 278315], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 137.45/pb
+        [278345, 278346], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 171.231/pb
+        [278349, 278349], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 94.737/pb
+        [278366, 278366], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 59.423/pb
+        [278406, 278406], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 296.962/pb
+        [278509, 278509], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 273.442/pb
+        [278769, 278770], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 170.993/pb
+        [278801, 278805], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 137.142/pb
+        [278808, 278808], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 269.634/pb
+        [278820, 278820], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 286.511/pb
+        [278822, 278822], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 191.158/pb
+        [278873, 278875], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 198.657/pb
+        [278923, 278923], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 98.543/pb
+        [278957, 278957], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 36.164/pb
+        [278962, 278963], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 113.024/pb
+        [278969, 278969], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 282.492/pb
+        [278975, 278976], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 122.556/pb
+        [278986, 278986], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 31.548/pb
+        [279024, 279024], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 49.596/pb
+        [279029, 279029], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 38.088/pb
+        [279071, 279071], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 22.581/pb
+        [279080, 279080], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 12.773/pb
+        [279115, 279116], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 174.938/pb
+        [279479, 279479], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 5.927/pb
+        [279588, 279588], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 228.517/pb
+        [279653, 279654], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 283.775/pb
+        [279656, 279656], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 5.684/pb
+        [279658, 279658], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 93.394/pb
+        [279667, 279667], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 208.732/pb
+        [279681, 279685], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 74.528/pb
+        [279691, 279691], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 9.656/pb
+        [279694, 279694], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 406.418/pb
+        [279715, 279716], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 383.763/pb
+        [279760, 279760], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 153.502/pb
+        [279766, 279767], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 358.144/pb
+        [279794, 279794], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 223.093/pb
+        [279823, 279823], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 81.828/pb
+        [279841, 279841], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 380.359/pb
+        [279844, 279844], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 56.588/pb
+        [279887, 279887], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 73.316/pb
+        [279931, 279931], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 475.316/pb
+        [279966, 279966], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 93.011/pb
+        [279975, 279975], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 239.011/pb
+        [279993, 279994], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 30.455/pb
+        [280013, 280013], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 5.636/pb
+        [280015, 280018], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 398.79/pb
+        [280020, 280020], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 4.614/pb
+        [280024, 280024], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 41.841/pb
+        [280187, 280188], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 74.778/pb
+        [280191, 280191], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 178.951/pb
+        [280194, 280194], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 36.665/pb
+        [280242, 280242], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 147.69/pb
+        [280249, 280249], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 239.16/pb
+        [280251, 280251], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 47.176/pb
+        [280327, 280327], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 8.719/pb
+        [280330, 280330], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 185.776/pb
+        [280349, 280349], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 104.129/pb
+        [280363, 280364], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 205.282/pb
+        [280383, 280385], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v6, 372.972/pb
+        [281613, 281613], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 9.764/pb
+        [281639, 281639], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 18.977/pb
+        [281641, 281641], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 39.268/pb
+        [281693, 281693], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 376.118/pb
+        [281707, 281707], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 214.55/pb
+        [281726, 281727], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 251.373/pb
+        [281797, 281797], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 397.836/pb
+        [281975, 281976], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 393.967/pb
+        [282033, 282035], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 26.293/pb
+        [282037, 282037], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 331.413/pb
+        [282092, 282092], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 296.762/pb
+        [282708, 282708], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 2.118/pb
+        [282710, 282710], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 0.346/pb
+        [282712, 282712], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 16.683/pb
+        [282730, 282735], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 469.07/pb
+        [282800, 282800], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 93.58/pb
+        [282807, 282807], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 70.563/pb
+        [282814, 282814], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 276.224/pb
+        [282842, 282842], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 23.509/pb
+        [282917, 282919], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 88.074/pb
+        [282922, 282923], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 66.001/pb
+        [283042, 283043], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 118.119/pb
+        [283049, 283050], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 61.072/pb
+        [283052, 283052], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 28.777/pb
+        [283059, 283059], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 98.778/pb
+        [283270, 283270], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 381.444/pb
+        [283283, 283283], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 197.444/pb
+        [283305, 283308], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 338.86/pb
+        [283353, 283353], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 191.088/pb
+        [283358, 283359], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 233.089/pb
+        [283407, 283408], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 466.833/pb
+        [283416, 283416], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 21.628/pb
+        [283453, 283453], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 123.278/pb
+        [283469, 283469], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 0.031/pb
+        [283478, 283478], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 210.23/pb
+        [283548, 283548], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 26.451/pb
+        [283680, 283682], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 102.814/pb
+        [283685, 283685], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 20.432/pb
+        [283820, 283820], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 259.058/pb
+        [283830, 283830], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 102.255/pb
+        [283834, 283835], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 20.323/pb
+        [283865, 283865], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 264.403/pb
+        [283876, 283877], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 409.447/pb
+        [283884, 283885], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 392.377/pb
+        [283933, 283934], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 309.793/pb
+        [283946, 283946], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 300.188/pb
+        [283964, 283964], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 58.698/pb
+        [284006, 284006], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 57.69/pb
+        [284014, 284014], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 47.826/pb
+        [284025, 284025], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 12.193/pb
+        [284029, 284029], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 29.941/pb
+        [284035, 284044], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_v8, 303.58/pb
+      ],
+    },
+  ],
+  '2e1mu' : [
+    {
+      'name'        : 'HLT_Mu8_DiEle12_CaloIdL_TrackIdL',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 50.239/pb
+        [273302, 273302], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 16.319/pb
+        [273402, 273406], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 13.589/pb
+        [273408, 273411], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 13.087/pb
+        [273425, 273425], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 26.717/pb
+        [273446, 273450], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 94.292/pb
+        [273492, 273494], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 30.924/pb
+        [273502, 273503], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 72.147/pb
+        [273554, 273555], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 38.827/pb
+        [273725, 273725], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 154.653/pb
+        [273728, 273728], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 4.897/pb
+        [273730, 273730], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 86.49/pb
+        [274094, 274094], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 9.735/pb
+        [274146, 274146], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 5.12/pb
+        [274157, 274157], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 38.994/pb
+        [274159, 274161], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 62.883/pb
+        [274172, 274172], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 5.249/pb
+        [274198, 274200], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 135.972/pb
+        [274240, 274241], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 134.472/pb
+        [274244, 274244], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 56.348/pb
+        [274250, 274251], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 159.993/pb
+        [274283, 274284], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 30.266/pb
+        [274286, 274286], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 21.668/pb
+        [274314, 274317], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 206.7/pb
+        [274319, 274319], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 27.302/pb
+        [274335, 274339], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 246.003/pb
+        [274344, 274345], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 87.68/pb
+        [274382, 274382], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 7.428/pb
+        [274387, 274388], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 312.374/pb
+        [274420, 274422], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 359.125/pb
+        [274440, 274442], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v3, 226.466/pb
+        [274954, 274955], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v4, 5.735/pb
+        [274968, 274971], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v4, 422.272/pb
+        [274998, 275001], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v4, 489.252/pb
+        [275059, 275059], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v4, 6.094/pb
+        [275066, 275068], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v4/HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v5, 231.774/pb
+        [275073, 275074], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v5, 144.124/pb
+        [275124, 275125], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v5, 205.394/pb
+        [275282, 275284], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v5, 49.295/pb
+        [275290, 275293], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v5, 94.338/pb
+        [275309, 275311], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v5, 411.084/pb
+        [275319, 275319], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 24.399/pb
+        [275337, 275338], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 143.358/pb
+        [275344, 275345], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 109.524/pb
+        [275370, 275371], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 145.599/pb
+        [275375, 275376], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 528.636/pb
+        [275657, 275659], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 80.874/pb
+        [275761, 275761], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 1.667/pb
+        [275767, 275767], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 0.714/pb
+        [275772, 275774], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 66.444/pb
+        [275776, 275778], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 116.898/pb
+        [275782, 275782], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 99.533/pb
+        [275832, 275837], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 441.03/pb
+        [275847, 275847], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 198.947/pb
+        [275886, 275886], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 7.581/pb
+        [275890, 275890], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 235.22/pb
+        [275911, 275913], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 201.741/pb
+        [275918, 275918], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 49.71/pb
+        [275920, 275921], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 62.257/pb
+        [275923, 275923], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 14.5/pb
+        [275931, 275931], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 10.418/pb
+        [275963, 275963], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 19.553/pb
+        [276092, 276092], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 14.768/pb
+        [276097, 276097], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 99.405/pb
+        [276242, 276244], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 479.052/pb
+        [276282, 276283], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 372.59/pb
+        [276315, 276315], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 34.051/pb
+        [276317, 276318], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 124.306/pb
+        [276355, 276355], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 6.205/pb
+        [276361, 276361], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 149.465/pb
+        [276363, 276363], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 206.376/pb
+        [276384, 276384], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 121.517/pb
+        [276437, 276437], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 355.688/pb
+        [276454, 276454], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 63.924/pb
+        [276458, 276458], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 33.169/pb
+        [276495, 276495], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 38.062/pb
+        [276501, 276502], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 486.891/pb
+        [276525, 276525], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 402.663/pb
+        [276527, 276528], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 60.758/pb
+        [276542, 276545], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 345.204/pb
+        [276581, 276587], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 471.493/pb
+        [276653, 276653], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 86.12/pb
+        [276655, 276655], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 160.843/pb
+        [276659, 276659], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 29.939/pb
+        [276775, 276776], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 443.702/pb
+        [276794, 276794], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 87.206/pb
+        [276807, 276808], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 188.301/pb
+        [276810, 276811], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 346.409/pb
+        [276831, 276831], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 400.298/pb
+        [276834, 276834], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 72.6/pb
+        [276870, 276870], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 526.587/pb
+        [276935, 276935], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 169.998/pb
+        [276940, 276940], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 28.701/pb
+        [276946, 276948], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 114.81/pb
+        [276950, 276950], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 323.179/pb
+        [277069, 277073], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 390.296/pb
+        [277076, 277076], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 125.929/pb
+        [277087, 277087], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 86.357/pb
+        [277094, 277094], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 131.103/pb
+        [277096, 277096], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 320.668/pb
+        [277112, 277112], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 17.339/pb
+        [277126, 277127], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 185.976/pb
+        [277148, 277148], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 128.192/pb
+        [277166, 277166], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 70.666/pb
+        [277168, 277168], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 318.998/pb
+        [277180, 277180], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 31.25/pb
+        [277194, 277194], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 367.175/pb
+        [277305, 277305], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 154.262/pb
+        [277420, 277420], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 60.844/pb
+        [277981, 277981], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 4.601/pb
+        [277991, 277992], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 21.692/pb
+        [278017, 278018], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 338.894/pb
+        [278167, 278167], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 314.532/pb
+        [278175, 278175], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 9.045/pb
+        [278193, 278193], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 34.581/pb
+        [278239, 278240], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 330.009/pb
+        [278273, 278274], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 23.87/pb
+        [278288, 278290], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 14.747/pb
+        [278308, 278308], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 313.102/pb
+        [278310, 278310], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 88.422/pb
+        [278315, 278315], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 137.45/pb
+        [278345, 278346], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 171.231/pb
+        [278349, 278349], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 94.737/pb
+        [278366, 278366], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 59.423/pb
+        [278406, 278406], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 296.962/pb
+        [278509, 278509], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 273.442/pb
+        [278769, 278770], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 170.993/pb
+        [278801, 278805], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 137.142/pb
+        [278808, 278808], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 269.634/pb
+        [278820, 278820], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 286.511/pb
+        [278822, 278822], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 191.158/pb
+        [278873, 278875], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 198.657/pb
+        [278923, 278923], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 98.543/pb
+        [278957, 278957], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 36.164/pb
+        [278962, 278963], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 113.024/pb
+        [278969, 278969], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 282.492/pb
+        [278975, 278976], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 122.556/pb
+        [278986, 278986], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 31.548/pb
+        [279024, 279024], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 49.596/pb
+        [279029, 279029], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 38.088/pb
+        [279071, 279071], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 22.581/pb
+        [279080, 279080], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 12.773/pb
+        [279115, 279116], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 174.938/pb
+        [279479, 279479], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 5.927/pb
+        [279588, 279588], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 228.517/pb
+        [279653, 279654], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 283.775/pb
+        [279656, 279656], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 5.684/pb
+        [279658, 279658], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 93.394/pb
+        [279667, 279667], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 208.732/pb
+        [279681, 279685], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 74.528/pb
+        [279691, 279691], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 9.656/pb
+        [279694, 279694], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 406.418/pb
+        [279715, 279716], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 383.763/pb
+        [279760, 279760], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 153.502/pb
+        [279766, 279767], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 358.144/pb
+        [279794, 279794], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 223.093/pb
+        [279823, 279823], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 81.828/pb
+        [279841, 279841], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 380.359/pb
+        [279844, 279844], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 56.588/pb
+        [279887, 279887], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 73.316/pb
+        [279931, 279931], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 475.316/pb
+        [279966, 279966], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 93.011/pb
+        [279975, 279975], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 239.011/pb
+        [279993, 279994], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 30.455/pb
+        [280013, 280013], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 5.636/pb
+        [280015, 280018], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 398.79/pb
+        [280020, 280020], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 4.614/pb
+        [280024, 280024], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 41.841/pb
+        [280187, 280188], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 74.778/pb
+        [280191, 280191], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 178.951/pb
+        [280194, 280194], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 36.665/pb
+        [280242, 280242], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 147.69/pb
+        [280249, 280249], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 239.16/pb
+        [280251, 280251], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 47.176/pb
+        [280327, 280327], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 8.719/pb
+        [280330, 280330], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 185.776/pb
+        [280349, 280349], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 104.129/pb
+        [280363, 280364], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 205.282/pb
+        [280383, 280385], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v6, 372.972/pb
+        [281613, 281613], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 9.764/pb
+        [281639, 281639], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 18.977/pb
+        [281641, 281641], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 39.268/pb
+        [281693, 281693], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 376.118/pb
+        [281707, 281707], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 214.55/pb
+        [281726, 281727], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 251.373/pb
+        [281797, 281797], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 397.836/pb
+        [281975, 281976], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 393.967/pb
+        [282033, 282035], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 26.293/pb
+        [282037, 282037], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 331.413/pb
+        [282092, 282092], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v8, 296.762/pb
+        [282708, 282708], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 2.118/pb
+        [282710, 282710], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 0.346/pb
+        [282712, 282712], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 16.683/pb
+        [282730, 282735], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 469.07/pb
+        [282800, 282800], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 93.58/pb
+        [282807, 282807], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 70.563/pb
+        [282814, 282814], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 276.224/pb
+        [282842, 282842], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 23.509/pb
+        [282917, 282919], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 88.074/pb
+        [282922, 282923], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 66.001/pb
+        [283042, 283043], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 118.119/pb
+        [283049, 283050], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 61.072/pb
+        [283052, 283052], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 28.777/pb
+        [283059, 283059], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 98.778/pb
+        [283270, 283270], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 381.444/pb
+        [283283, 283283], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 197.444/pb
+        [283305, 283308], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 338.86/pb
+        [283353, 283353], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 191.088/pb
+        [283358, 283359], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 233.089/pb
+        [283407, 283408], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 466.833/pb
+        [283416, 283416], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 21.628/pb
+        [283453, 283453], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 123.278/pb
+        [283469, 283469], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 0.031/pb
+        [283478, 283478], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 210.23/pb
+        [283548, 283548], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 26.451/pb
+        [283680, 283682], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 102.814/pb
+        [283685, 283685], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 20.432/pb
+        [283820, 283820], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 259.058/pb
+        [283830, 283830], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 102.255/pb
+        [283834, 283835], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 20.323/pb
+        [283865, 283865], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 264.403/pb
+        [283876, 283877], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 409.447/pb
+        [283884, 283885], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 392.377/pb
+        [283933, 283934], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 309.793/pb
+        [283946, 283946], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 300.188/pb
+        [283964, 283964], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 58.698/pb
+        [284006, 284006], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 57.69/pb
+        [284014, 284014], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 47.826/pb
+        [284025, 284025], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 12.193/pb
+        [284029, 284029], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 29.941/pb
+        [284035, 284044], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 303.58/pb
+      ],
+    },
+  ],
+  '3e' : [
+    {
+      'name'        : 'HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 50.239/pb
+        [273302, 273302], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 16.319/pb
+        [273402, 273406], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 13.589/pb
+        [273408, 273411], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 13.087/pb
+        [273425, 273425], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 26.717/pb
+        [273446, 273450], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 94.292/pb
+        [273492, 273494], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 30.924/pb
+        [273502, 273503], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 72.147/pb
+        [273554, 273555], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 38.827/pb
+        [273725, 273725], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 154.653/pb
+        [273728, 273728], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 4.897/pb
+        [273730, 273730], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 86.49/pb
+        [274094, 274094], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 9.735/pb
+        [274146, 274146], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 5.12/pb
+        [274157, 274157], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 38.994/pb
+        [274159, 274161], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 62.883/pb
+        [274172, 274172], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 5.249/pb
+        [274198, 274200], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 135.972/pb
+        [274240, 274241], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 134.472/pb
+        [274244, 274244], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 56.348/pb
+        [274250, 274251], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 159.993/pb
+        [274283, 274284], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 30.266/pb
+        [274286, 274286], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 21.668/pb
+        [274314, 274317], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 206.7/pb
+        [274319, 274319], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 27.302/pb
+        [274335, 274339], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 246.003/pb
+        [274344, 274345], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 87.68/pb
+        [274382, 274382], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 7.428/pb
+        [274387, 274388], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 312.374/pb
+        [274420, 274422], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 359.125/pb
+        [274440, 274442], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 226.466/pb
+        [274954, 274955], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 5.735/pb
+        [274968, 274971], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 422.272/pb
+        [274998, 275001], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 489.252/pb
+        [275059, 275059], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 6.094/pb
+        [275066, 275068], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4/HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 231.774/pb
+        [275073, 275074], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 144.124/pb
+        [275124, 275125], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 205.394/pb
+        [275282, 275284], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 49.295/pb
+        [275290, 275293], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 94.338/pb
+        [275309, 275311], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 411.084/pb
+        [275319, 275319], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 24.399/pb
+        [275337, 275338], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 143.358/pb
+        [275344, 275345], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 109.524/pb
+        [275370, 275371], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 145.599/pb
+        [275375, 275376], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 528.636/pb
+        [275657, 275659], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 80.874/pb
+        [275761, 275761], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 1.667/pb
+        [275767, 275767], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 0.714/pb
+        [275772, 275774], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 66.444/pb
+        [275776, 275778], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 116.898/pb
+        [275782, 275782], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 99.533/pb
+        [275832, 275837], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 441.03/pb
+        [275847, 275847], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 198.947/pb
+        [275886, 275886], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 7.581/pb
+        [275890, 275890], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 235.22/pb
+        [275911, 275913], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 201.741/pb
+        [275918, 275918], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 49.71/pb
+        [275920, 275921], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 62.257/pb
+        [275923, 275923], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 14.5/pb
+        [275931, 275931], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 10.418/pb
+        [275963, 275963], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 19.553/pb
+        [276092, 276092], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 14.768/pb
+        [276097, 276097], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 99.405/pb
+        [276242, 276244], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 479.052/pb
+        [276282, 276283], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 372.59/pb
+        [276315, 276315], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 34.051/pb
+        [276317, 276318], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 124.306/pb
+        [276355, 276355], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 6.205/pb
+        [276361, 276361], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 149.465/pb
+        [276363, 276363], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 206.376/pb
+        [276384, 276384], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 121.517/pb
+        [276437, 276437], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 355.688/pb
+        [276454, 276454], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 63.924/pb
+        [276458, 276458], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 33.169/pb
+        [276495, 276495], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 38.062/pb
+        [276501, 276502], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 486.891/pb
+        [276525, 276525], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 402.663/pb
+        [276527, 276528], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 60.758/pb
+        [276542, 276545], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 345.204/pb
+        [276581, 276587], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 471.493/pb
+        [276653, 276653], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 86.12/pb
+        [276655, 276655], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 160.843/pb
+        [276659, 276659], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 29.939/pb
+        [276775, 276776], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 443.702/pb
+        [276794, 276794], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 87.206/pb
+        [276807, 276808], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 188.301/pb
+        [276810, 276811], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 346.409/pb
+        [276831, 276831], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 400.298/pb
+        [276834, 276834], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 72.6/pb
+        [276870, 276870], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 526.587/pb
+        [276935, 276935], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 169.998/pb
+        [276940, 276940], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 28.701/pb
+        [276946, 276948], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 114.81/pb
+        [276950, 276950], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 323.179/pb
+        [277069, 277073], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 390.296/pb
+        [277076, 277076], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 125.929/pb
+        [277087, 277087], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 86.357/pb
+        [277094, 277094], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 131.103/pb
+        [277096, 277096], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 320.668/pb
+        [277112, 277112], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 17.339/pb
+        [277126, 277127], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 185.976/pb
+        [277148, 277148], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 128.192/pb
+        [277166, 277166], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 70.666/pb
+        [277168, 277168], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 318.998/pb
+        [277180, 277180], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 31.25/pb
+        [277194, 277194], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 367.175/pb
+        [277305, 277305], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 154.262/pb
+        [277420, 277420], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 60.844/pb
+        [277981, 277981], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 4.601/pb
+        [277991, 277992], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 21.692/pb
+        [278017, 278018], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 338.894/pb
+        [278167, 278167], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 314.532/pb
+        [278175, 278175], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 9.045/pb
+        [278193, 278193], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 34.581/pb
+        [278239, 278240], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 330.009/pb
+        [278273, 278274], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 23.87/pb
+        [278288, 278290], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 14.747/pb
+        [278308, 278308], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 313.102/pb
+        [278310, 278310], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 88.422/pb
+        [278315, 278315], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 137.45/pb
+        [278345, 278346], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 171.231/pb
+        [278349, 278349], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 94.737/pb
+        [278366, 278366], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 59.423/pb
+        [278406, 278406], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 296.962/pb
+        [278509, 278509], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 273.442/pb
+        [278769, 278770], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 170.993/pb
+        [278801, 278805], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 137.142/pb
+        [278808, 278808], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 269.634/pb
+        [278820, 278820], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 286.511/pb
+        [278822, 278822], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 191.158/pb
+        [278873, 278875], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 198.657/pb
+        [278923, 278923], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 98.543/pb
+        [278957, 278957], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 36.164/pb
+        [278962, 278963], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 113.024/pb
+        [278969, 278969], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 282.492/pb
+        [278975, 278976], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 122.556/pb
+        [278986, 278986], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 31.548/pb
+        [279024, 279024], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 49.596/pb
+        [279029, 279029], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 38.088/pb
+        [279071, 279071], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 22.581/pb
+        [279080, 279080], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 12.773/pb
+        [279115, 279116], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 174.938/pb
+        [279479, 279479], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 5.927/pb
+        [279588, 279588], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 228.517/pb
+        [279653, 279654], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 283.775/pb
+        [279656, 279656], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 5.684/pb
+        [279658, 279658], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 93.394/pb
+        [279667, 279667], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 208.732/pb
+        [279681, 279685], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 74.528/pb
+        [279691, 279691], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 9.656/pb
+        [279694, 279694], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 406.418/pb
+        [279715, 279716], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 383.763/pb
+        [279760, 279760], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 153.502/pb
+        [279766, 279767], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 358.144/pb
+        [279794, 279794], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 223.093/pb
+        [279823, 279823], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 81.828/pb
+        [279841, 279841], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 380.359/pb
+        [279844, 279844], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 56.588/pb
+        [279887, 279887], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 73.316/pb
+        [279931, 279931], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 475.316/pb
+        [279966, 279966], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 93.011/pb
+        [279975, 279975], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 239.011/pb
+        [279993, 279994], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 30.455/pb
+        [280013, 280013], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 5.636/pb
+        [280015, 280018], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 398.79/pb
+        [280020, 280020], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 4.614/pb
+        [280024, 280024], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 41.841/pb
+        [280187, 280188], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 74.778/pb
+        [280191, 280191], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 178.951/pb
+        [280194, 280194], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 36.665/pb
+        [280242, 280242], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 147.69/pb
+        [280249, 280249], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 239.16/pb
+        [280251, 280251], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 47.176/pb
+        [280327, 280327], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 8.719/pb
+        [280330, 280330], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 185.776/pb
+        [280349, 280349], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 104.129/pb
+        [280363, 280364], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 205.282/pb
+        [280383, 280385], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 372.972/pb
+        [281613, 281613], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 9.764/pb
+        [281639, 281639], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 18.977/pb
+        [281641, 281641], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 39.268/pb
+        [281693, 281693], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 376.118/pb
+        [281707, 281707], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 214.55/pb
+        [281726, 281727], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 251.373/pb
+        [281797, 281797], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 397.836/pb
+        [281975, 281976], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 393.967/pb
+        [282033, 282035], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 26.293/pb
+        [282037, 282037], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 331.413/pb
+        [282092, 282092], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 296.762/pb
+        [282708, 282708], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 2.118/pb
+        [282710, 282710], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 0.346/pb
+        [282712, 282712], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 16.683/pb
+        [282730, 282735], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 469.07/pb
+        [282800, 282800], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 93.58/pb
+        [282807, 282807], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 70.563/pb
+        [282814, 282814], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 276.224/pb
+        [282842, 282842], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 23.509/pb
+        [282917, 282919], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 88.074/pb
+        [282922, 282923], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 66.001/pb
+        [283042, 283043], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 118.119/pb
+        [283049, 283050], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 61.072/pb
+        [283052, 283052], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 28.777/pb
+        [283059, 283059], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 98.778/pb
+        [283270, 283270], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 381.444/pb
+        [283283, 283283], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 197.444/pb
+        [283305, 283308], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 338.86/pb
+        [283353, 283353], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 191.088/pb
+        [283358, 283359], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 233.089/pb
+        [283407, 283408], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 466.833/pb
+        [283416, 283416], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 21.628/pb
+        [283453, 283453], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 123.278/pb
+        [283469, 283469], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 0.031/pb
+        [283478, 283478], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 210.23/pb
+        [283548, 283548], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 26.451/pb
+        [283680, 283682], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 102.814/pb
+        [283685, 283685], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 20.432/pb
+        [283820, 283820], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 259.058/pb
+        [283830, 283830], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 102.255/pb
+        [283834, 283835], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 20.323/pb
+        [283865, 283865], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 264.403/pb
+        [283876, 283877], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 409.447/pb
+        [283884, 283885], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 392.377/pb
+        [283933, 283934], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 309.793/pb
+        [283946, 283946], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 300.188/pb
+        [283964, 283964], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 58.698/pb
+        [284006, 284006], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 57.69/pb
+        [284014, 284014], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 47.826/pb
+        [284025, 284025], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 12.193/pb
+        [284029, 284029], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 29.941/pb
+        [284035, 284044], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 303.58/pb
+      ],
+    },
+  ],
+  '2mu' : [
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL',
+      'unprescaled' : False, # prescaled in run H
+      'runs'        : [
+        [273158, 273158], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 50.239/pb
+        [273302, 273302], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 16.319/pb
+        [273402, 273406], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 13.589/pb
+        [273408, 273411], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 13.087/pb
+        [273425, 273425], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 26.717/pb
+        [273446, 273450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 94.292/pb
+        [273492, 273494], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 30.924/pb
+        [273502, 273503], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 72.147/pb
+        [273554, 273555], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 38.827/pb
+        [273725, 273725], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 154.653/pb
+        [273728, 273728], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 4.897/pb
+        [273730, 273730], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 86.49/pb
+        [274094, 274094], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 9.735/pb
+        [274146, 274146], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 5.12/pb
+        [274157, 274157], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 38.994/pb
+        [274159, 274161], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 62.883/pb
+        [274172, 274172], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 5.249/pb
+        [274198, 274200], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 135.972/pb
+        [274240, 274241], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 134.472/pb
+        [274244, 274244], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 56.348/pb
+        [274250, 274251], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 159.993/pb
+        [274283, 274284], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 30.266/pb
+        [274286, 274286], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 21.668/pb
+        [274314, 274317], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 206.7/pb
+        [274319, 274319], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 27.302/pb
+        [274335, 274339], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 246.003/pb
+        [274344, 274345], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 87.68/pb
+        [274382, 274382], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 7.428/pb
+        [274387, 274388], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 312.374/pb
+        [274420, 274422], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 359.125/pb
+        [274440, 274442], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v2, 226.466/pb
+        [274954, 274955], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 5.735/pb
+        [274968, 274971], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 422.272/pb
+        [274998, 275001], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 489.252/pb
+        [275059, 275059], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 6.094/pb
+        [275066, 275068], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 24.399/pb
+        [275337, 275338], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 143.358/pb
+        [275344, 275345], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 109.524/pb
+        [275370, 275371], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 145.599/pb
+        [275375, 275376], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 528.636/pb
+        [275657, 275659], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 80.874/pb
+        [275761, 275761], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 1.667/pb
+        [275767, 275767], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 0.714/pb
+        [275772, 275774], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 66.444/pb
+        [275776, 275778], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 116.898/pb
+        [275782, 275782], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 99.533/pb
+        [275832, 275837], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 441.03/pb
+        [275847, 275847], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 198.947/pb
+        [275886, 275886], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 7.581/pb
+        [275890, 275890], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 235.22/pb
+        [275911, 275913], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 201.741/pb
+        [275918, 275918], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 49.71/pb
+        [275920, 275921], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 62.257/pb
+        [275923, 275923], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 14.5/pb
+        [275931, 275931], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 10.418/pb
+        [275963, 275963], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 19.553/pb
+        [276092, 276092], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 14.768/pb
+        [276097, 276097], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 99.405/pb
+        [276242, 276244], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v3, 479.052/pb
+        [276282, 276283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 372.59/pb
+        [276315, 276315], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 34.051/pb
+        [276317, 276318], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 124.306/pb
+        [276355, 276355], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 6.205/pb
+        [276361, 276361], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 149.465/pb
+        [276363, 276363], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 206.376/pb
+        [276384, 276384], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 121.517/pb
+        [276437, 276437], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 355.688/pb
+        [276454, 276454], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 63.924/pb
+        [276458, 276458], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 33.169/pb
+        [276495, 276495], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 38.062/pb
+        [276501, 276502], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 486.891/pb
+        [276525, 276525], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 402.663/pb
+        [276527, 276528], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 60.758/pb
+        [276542, 276545], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 345.204/pb
+        [276581, 276587], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 471.493/pb
+        [276653, 276653], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 86.12/pb
+        [276655, 276655], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 160.843/pb
+        [276659, 276659], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 29.939/pb
+        [276775, 276776], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 443.702/pb
+        [276794, 276794], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 87.206/pb
+        [276807, 276808], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 188.301/pb
+        [276810, 276811], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 346.409/pb
+        [276831, 276831], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 400.298/pb
+        [276834, 276834], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 72.6/pb
+        [276870, 276870], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 526.587/pb
+        [276935, 276935], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 169.998/pb
+        [276940, 276940], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 28.701/pb
+        [276946, 276948], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 114.81/pb
+        [276950, 276950], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 323.179/pb
+        [277069, 277073], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 390.296/pb
+        [277076, 277076], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 125.929/pb
+        [277087, 277087], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 86.357/pb
+        [277094, 277094], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 131.103/pb
+        [277096, 277096], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 320.668/pb
+        [277112, 277112], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 17.339/pb
+        [277126, 277127], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 185.976/pb
+        [277148, 277148], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 128.192/pb
+        [277166, 277166], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 70.666/pb
+        [277168, 277168], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 318.998/pb
+        [277180, 277180], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 31.25/pb
+        [277194, 277194], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 367.175/pb
+        [277305, 277305], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 154.262/pb
+        [277420, 277420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 60.844/pb
+        [277981, 277981], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 4.601/pb
+        [277991, 277992], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 21.692/pb
+        [278017, 278018], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 338.894/pb
+        [278167, 278167], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 314.532/pb
+        [278175, 278175], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 9.045/pb
+        [278193, 278193], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 34.581/pb
+        [278239, 278240], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 330.009/pb
+        [278273, 278274], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 23.87/pb
+        [278288, 278290], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 14.747/pb
+        [278308, 278308], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 313.102/pb
+        [278310, 278310], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 88.422/pb
+        [278315, 278315], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 137.45/pb
+        [278345, 278346], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 171.231/pb
+        [278349, 278349], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 94.737/pb
+        [278366, 278366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 59.423/pb
+        [278406, 278406], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 296.962/pb
+        [278509, 278509], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 273.442/pb
+        [278769, 278770], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 170.993/pb
+        [278801, 278805], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 137.142/pb
+        [278808, 278808], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 269.634/pb
+        [278820, 278820], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 286.511/pb
+        [278822, 278822], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 191.158/pb
+        [278873, 278875], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 198.657/pb
+        [278923, 278923], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 98.543/pb
+        [278957, 278957], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 36.164/pb
+        [278962, 278963], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 113.024/pb
+        [278969, 278969], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 282.492/pb
+        [278975, 278976], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 122.556/pb
+        [278986, 278986], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 31.548/pb
+        [279024, 279024], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 49.596/pb
+        [279029, 279029], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 38.088/pb
+        [279071, 279071], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 22.581/pb
+        [279080, 279080], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 12.773/pb
+        [279115, 279116], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 174.938/pb
+        [279479, 279479], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 5.927/pb
+        [279588, 279588], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 228.517/pb
+        [279653, 279654], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 283.775/pb
+        [279656, 279656], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 5.684/pb
+        [279658, 279658], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 93.394/pb
+        [279667, 279667], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 208.732/pb
+        [279681, 279685], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 74.528/pb
+        [279691, 279691], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 9.656/pb
+        [279694, 279694], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 406.418/pb
+        [279715, 279716], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 383.763/pb
+        [279760, 279760], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 153.502/pb
+        [279766, 279767], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 358.144/pb
+        [279794, 279794], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 223.093/pb
+        [279823, 279823], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 81.828/pb
+        [279841, 279841], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 380.359/pb
+        [279844, 279844], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 56.588/pb
+        [279887, 279887], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 73.316/pb
+        [279931, 279931], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 475.316/pb
+        [279966, 279966], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 93.011/pb
+        [279975, 279975], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 239.011/pb
+        [279993, 279994], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 30.455/pb
+        [280013, 280013], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 5.636/pb
+        [280015, 280018], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 398.79/pb
+        [280020, 280020], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 4.614/pb
+        [280024, 280024], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 41.841/pb
+        [280187, 280188], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 74.778/pb
+        [280191, 280191], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 178.951/pb
+        [280194, 280194], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 36.665/pb
+        [280242, 280242], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 147.69/pb
+        [280249, 280249], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 239.16/pb
+        [280251, 280251], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 47.176/pb
+        [280327, 280327], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 8.719/pb
+        [280330, 280330], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 185.776/pb
+        [280349, 280349], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 104.129/pb
+        [280363, 280364], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 205.282/pb
+        [280383, 280385], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v4, 372.972/pb
+        [281613, 281613], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 4.356/pb
+        [281639, 281639], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.575/pb
+        [281641, 281641], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 1.689/pb
+        [281693, 281693], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 18.703/pb
+        [281707, 281707], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 7.208/pb
+        [281726, 281727], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 16.783/pb
+        [281797, 281797], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 16.747/pb
+        [281975, 281976], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 20.415/pb
+        [282033, 282035], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.782/pb
+        [282037, 282037], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 16.068/pb
+        [282092, 282092], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 15.629/pb
+        [282708, 282708], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.056/pb
+        [282710, 282710], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.346/pb
+        [282712, 282712], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.439/pb
+        [282730, 282735], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 22.127/pb
+        [282800, 282800], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.692/pb
+        [282807, 282807], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.402/pb
+        [282814, 282814], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 16.367/pb
+        [282842, 282842], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.599/pb
+        [282917, 282919], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.621/pb
+        [282922, 282923], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.933/pb
+        [283042, 283043], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 5.175/pb
+        [283049, 283050], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 1.58/pb
+        [283052, 283052], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.763/pb
+        [283059, 283059], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 3.392/pb
+        [283270, 283270], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 14.509/pb
+        [283283, 283283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 16.567/pb
+        [283305, 283308], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 13.643/pb
+        [283353, 283353], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 5.376/pb
+        [283358, 283359], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 11.859/pb
+        [283407, 283408], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 19.281/pb
+        [283416, 283416], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 1.664/pb
+        [283453, 283453], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 3.281/pb
+        [283469, 283469], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.001/pb
+        [283478, 283478], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 6.362/pb
+        [283548, 283548], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 1.025/pb
+        [283680, 283682], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 3.612/pb
+        [283685, 283685], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.355/pb
+        [283820, 283820], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 12.359/pb
+        [283830, 283830], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 6.537/pb
+        [283834, 283835], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 1.563/pb
+        [283865, 283865], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 8.934/pb
+        [283876, 283877], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 17.434/pb
+        [283884, 283885], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 17.233/pb
+        [283933, 283934], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 10.877/pb
+        [283946, 283946], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 10.793/pb
+        [283964, 283964], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 3.251/pb
+        [284006, 284006], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.655/pb
+        [284014, 284014], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 2.277/pb
+        [284025, 284025], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.292/pb
+        [284029, 284029], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 0.788/pb
+        [284035, 284044], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_v6, 12.817/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 50.239/pb
+        [273302, 273302], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 16.319/pb
+        [273402, 273406], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 13.589/pb
+        [273408, 273411], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 13.087/pb
+        [273425, 273425], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 26.717/pb
+        [273446, 273450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 94.292/pb
+        [273492, 273494], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 30.924/pb
+        [273502, 273503], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 72.147/pb
+        [273554, 273555], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 38.827/pb
+        [273725, 273725], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 154.653/pb
+        [273728, 273728], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 4.897/pb
+        [273730, 273730], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 86.49/pb
+        [274094, 274094], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 9.735/pb
+        [274146, 274146], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 5.12/pb
+        [274157, 274157], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 38.994/pb
+        [274159, 274161], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 62.883/pb
+        [274172, 274172], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 5.249/pb
+        [274198, 274200], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 135.972/pb
+        [274240, 274241], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 134.472/pb
+        [274244, 274244], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 56.348/pb
+        [274250, 274251], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 159.993/pb
+        [274283, 274284], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 30.266/pb
+        [274286, 274286], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 21.668/pb
+        [274314, 274317], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 206.7/pb
+        [274319, 274319], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 27.302/pb
+        [274335, 274339], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 246.003/pb
+        [274344, 274345], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 87.68/pb
+        [274382, 274382], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 7.428/pb
+        [274387, 274388], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 312.374/pb
+        [274420, 274422], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 359.125/pb
+        [274440, 274442], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v2, 226.466/pb
+        [274954, 274955], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 5.735/pb
+        [274968, 274971], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 422.272/pb
+        [274998, 275001], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 489.252/pb
+        [275059, 275059], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 6.094/pb
+        [275066, 275068], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 24.399/pb
+        [275337, 275338], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 143.358/pb
+        [275344, 275345], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 109.524/pb
+        [275370, 275371], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 145.599/pb
+        [275375, 275376], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 528.636/pb
+        [275657, 275659], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 80.874/pb
+        [275761, 275761], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 1.667/pb
+        [275767, 275767], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 0.714/pb
+        [275772, 275774], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 66.444/pb
+        [275776, 275778], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 116.898/pb
+        [275782, 275782], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 99.533/pb
+        [275832, 275837], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 441.03/pb
+        [275847, 275847], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 198.947/pb
+        [275886, 275886], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 7.581/pb
+        [275890, 275890], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 235.22/pb
+        [275911, 275913], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 201.741/pb
+        [275918, 275918], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 49.71/pb
+        [275920, 275921], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 62.257/pb
+        [275923, 275923], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 14.5/pb
+        [275931, 275931], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 10.418/pb
+        [275963, 275963], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 19.553/pb
+        [276092, 276092], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 14.768/pb
+        [276097, 276097], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 99.405/pb
+        [276242, 276244], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v3, 479.052/pb
+        [276282, 276283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 372.59/pb
+        [276315, 276315], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 34.051/pb
+        [276317, 276318], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 124.306/pb
+        [276355, 276355], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 6.205/pb
+        [276361, 276361], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 149.465/pb
+        [276363, 276363], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 206.376/pb
+        [276384, 276384], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 121.517/pb
+        [276437, 276437], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 355.688/pb
+        [276454, 276454], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 63.924/pb
+        [276458, 276458], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 33.169/pb
+        [276495, 276495], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 38.062/pb
+        [276501, 276502], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 486.891/pb
+        [276525, 276525], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 402.663/pb
+        [276527, 276528], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 60.758/pb
+        [276542, 276545], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 345.204/pb
+        [276581, 276587], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 471.493/pb
+        [276653, 276653], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 86.12/pb
+        [276655, 276655], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 160.843/pb
+        [276659, 276659], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 29.939/pb
+        [276775, 276776], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 443.702/pb
+        [276794, 276794], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 87.206/pb
+        [276807, 276808], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 188.301/pb
+        [276810, 276811], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 346.409/pb
+        [276831, 276831], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 400.298/pb
+        [276834, 276834], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 72.6/pb
+        [276870, 276870], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 526.587/pb
+        [276935, 276935], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 169.998/pb
+        [276940, 276940], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 28.701/pb
+        [276946, 276948], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 114.81/pb
+        [276950, 276950], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 323.179/pb
+        [277069, 277073], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 390.296/pb
+        [277076, 277076], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 125.929/pb
+        [277087, 277087], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 86.357/pb
+        [277094, 277094], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 131.103/pb
+        [277096, 277096], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 320.668/pb
+        [277112, 277112], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 17.339/pb
+        [277126, 277127], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 185.976/pb
+        [277148, 277148], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 128.192/pb
+        [277166, 277166], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 70.666/pb
+        [277168, 277168], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 318.998/pb
+        [277180, 277180], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 31.25/pb
+        [277194, 277194], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 367.175/pb
+        [277305, 277305], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 154.262/pb
+        [277420, 277420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 60.844/pb
+        [277981, 277981], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 4.601/pb
+        [277991, 277992], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 21.692/pb
+        [278017, 278018], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 338.894/pb
+        [278167, 278167], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 314.532/pb
+        [278175, 278175], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 9.045/pb
+        [278193, 278193], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 34.581/pb
+        [278239, 278240], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 330.009/pb
+        [278273, 278274], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 23.87/pb
+        [278288, 278290], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 14.747/pb
+        [278308, 278308], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 313.102/pb
+        [278310, 278310], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 88.422/pb
+        [278315, 278315], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 137.45/pb
+        [278345, 278346], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 171.231/pb
+        [278349, 278349], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 94.737/pb
+        [278366, 278366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 59.423/pb
+        [278406, 278406], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 296.962/pb
+        [278509, 278509], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 273.442/pb
+        [278769, 278770], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 170.993/pb
+        [278801, 278805], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 137.142/pb
+        [278808, 278808], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 269.634/pb
+        [278820, 278820], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 286.511/pb
+        [278822, 278822], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 191.158/pb
+        [278873, 278875], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 198.657/pb
+        [278923, 278923], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 98.543/pb
+        [278957, 278957], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 36.164/pb
+        [278962, 278963], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 113.024/pb
+        [278969, 278969], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 282.492/pb
+        [278975, 278976], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 122.556/pb
+        [278986, 278986], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 31.548/pb
+        [279024, 279024], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 49.596/pb
+        [279029, 279029], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 38.088/pb
+        [279071, 279071], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 22.581/pb
+        [279080, 279080], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 12.773/pb
+        [279115, 279116], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 174.938/pb
+        [279479, 279479], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 5.927/pb
+        [279588, 279588], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 228.517/pb
+        [279653, 279654], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 283.775/pb
+        [279656, 279656], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 5.684/pb
+        [279658, 279658], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 93.394/pb
+        [279667, 279667], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 208.732/pb
+        [279681, 279685], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 74.528/pb
+        [279691, 279691], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 9.656/pb
+        [279694, 279694], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 406.418/pb
+        [279715, 279716], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 383.763/pb
+        [279760, 279760], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 153.502/pb
+        [279766, 279767], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 358.144/pb
+        [279794, 279794], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 223.093/pb
+        [279823, 279823], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 81.828/pb
+        [279841, 279841], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 380.359/pb
+        [279844, 279844], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 56.588/pb
+        [279887, 279887], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 73.316/pb
+        [279931, 279931], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 475.316/pb
+        [279966, 279966], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 93.011/pb
+        [279975, 279975], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 239.011/pb
+        [279993, 279994], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 30.455/pb
+        [280013, 280013], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 5.636/pb
+        [280015, 280018], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 398.79/pb
+        [280020, 280020], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 4.614/pb
+        [280024, 280024], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 41.841/pb
+        [280187, 280188], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 74.778/pb
+        [280191, 280191], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 178.951/pb
+        [280194, 280194], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 36.665/pb
+        [280242, 280242], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 147.69/pb
+        [280249, 280249], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 239.16/pb
+        [280251, 280251], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 47.176/pb
+        [280327, 280327], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 8.719/pb
+        [280330, 280330], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 185.776/pb
+        [280349, 280349], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 104.129/pb
+        [280363, 280364], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 205.282/pb
+        [280383, 280385], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v4, 372.972/pb
+        [281613, 281613], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 9.764/pb
+        [281639, 281639], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 18.977/pb
+        [281641, 281641], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 39.268/pb
+        [281693, 281693], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 376.118/pb
+        [281707, 281707], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 214.55/pb
+        [281726, 281727], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 251.373/pb
+        [281797, 281797], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 397.836/pb
+        [281975, 281976], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 393.967/pb
+        [282033, 282035], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 26.293/pb
+        [282037, 282037], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 331.413/pb
+        [282092, 282092], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 296.762/pb
+        [282708, 282708], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 2.118/pb
+        [282710, 282710], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 0.346/pb
+        [282712, 282712], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 16.683/pb
+        [282730, 282735], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 469.07/pb
+        [282800, 282800], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 93.58/pb
+        [282807, 282807], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 70.563/pb
+        [282814, 282814], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 276.224/pb
+        [282842, 282842], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 23.509/pb
+        [282917, 282919], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 88.074/pb
+        [282922, 282923], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 66.001/pb
+        [283042, 283043], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 118.119/pb
+        [283049, 283050], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 61.072/pb
+        [283052, 283052], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 28.777/pb
+        [283059, 283059], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 98.778/pb
+        [283270, 283270], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 381.444/pb
+        [283283, 283283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 197.444/pb
+        [283305, 283308], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 338.86/pb
+        [283353, 283353], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 191.088/pb
+        [283358, 283359], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 233.089/pb
+        [283407, 283408], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 466.833/pb
+        [283416, 283416], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 21.628/pb
+        [283453, 283453], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 123.278/pb
+        [283469, 283469], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 0.031/pb
+        [283478, 283478], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 210.23/pb
+        [283548, 283548], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 26.451/pb
+        [283680, 283682], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 102.814/pb
+        [283685, 283685], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 20.432/pb
+        [283820, 283820], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 259.058/pb
+        [283830, 283830], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 102.255/pb
+        [283834, 283835], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 20.323/pb
+        [283865, 283865], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 264.403/pb
+        [283876, 283877], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 409.447/pb
+        [283884, 283885], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 392.377/pb
+        [283933, 283934], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 309.793/pb
+        [283946, 283946], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 300.188/pb
+        [283964, 283964], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 58.698/pb
+        [284006, 284006], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 57.69/pb
+        [284014, 284014], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 47.826/pb
+        [284025, 284025], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 12.193/pb
+        [284029, 284029], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 29.941/pb
+        [284035, 284044], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_v7, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL',
+      'unprescaled' : False, # presca;ed in run H
+      'runs'        : [
+        [273158, 273158], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 50.239/pb
+        [273302, 273302], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 16.319/pb
+        [273402, 273406], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 13.589/pb
+        [273408, 273411], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 13.087/pb
+        [273425, 273425], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 26.717/pb
+        [273446, 273450], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 94.292/pb
+        [273492, 273494], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 30.924/pb
+        [273502, 273503], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 72.147/pb
+        [273554, 273555], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 38.827/pb
+        [273725, 273725], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 154.653/pb
+        [273728, 273728], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 4.897/pb
+        [273730, 273730], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 86.49/pb
+        [274094, 274094], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 9.735/pb
+        [274146, 274146], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 5.12/pb
+        [274157, 274157], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 38.994/pb
+        [274159, 274161], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 62.883/pb
+        [274172, 274172], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 5.249/pb
+        [274198, 274200], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 135.972/pb
+        [274240, 274241], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 134.472/pb
+        [274244, 274244], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 56.348/pb
+        [274250, 274251], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 159.993/pb
+        [274283, 274284], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 30.266/pb
+        [274286, 274286], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 21.668/pb
+        [274314, 274317], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 206.7/pb
+        [274319, 274319], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 27.302/pb
+        [274335, 274339], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 246.003/pb
+        [274344, 274345], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 87.68/pb
+        [274382, 274382], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 7.428/pb
+        [274387, 274388], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 312.374/pb
+        [274420, 274422], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 359.125/pb
+        [274440, 274442], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v2, 226.466/pb
+        [274954, 274955], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 5.735/pb
+        [274968, 274971], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 422.272/pb
+        [274998, 275001], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 489.252/pb
+        [275059, 275059], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 6.094/pb
+        [275066, 275068], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 24.399/pb
+        [275337, 275338], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 143.358/pb
+        [275344, 275345], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 109.524/pb
+        [275370, 275371], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 145.599/pb
+        [275375, 275376], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 528.636/pb
+        [275657, 275659], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 80.874/pb
+        [275761, 275761], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 1.667/pb
+        [275767, 275767], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 0.714/pb
+        [275772, 275774], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 66.444/pb
+        [275776, 275778], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 116.898/pb
+        [275782, 275782], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 99.533/pb
+        [275832, 275837], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 441.03/pb
+        [275847, 275847], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 198.947/pb
+        [275886, 275886], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 7.581/pb
+        [275890, 275890], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 235.22/pb
+        [275911, 275913], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 201.741/pb
+        [275918, 275918], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 49.71/pb
+        [275920, 275921], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 62.257/pb
+        [275923, 275923], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 14.5/pb
+        [275931, 275931], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 10.418/pb
+        [275963, 275963], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 19.553/pb
+        [276092, 276092], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 14.768/pb
+        [276097, 276097], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 99.405/pb
+        [276242, 276244], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 479.052/pb
+        [276282, 276283], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 372.59/pb
+        [276315, 276315], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 34.051/pb
+        [276317, 276318], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 124.306/pb
+        [276355, 276355], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 6.205/pb
+        [276361, 276361], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 149.465/pb
+        [276363, 276363], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 206.376/pb
+        [276384, 276384], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 121.517/pb
+        [276437, 276437], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 355.688/pb
+        [276454, 276454], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 63.924/pb
+        [276458, 276458], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 33.169/pb
+        [276495, 276495], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 38.062/pb
+        [276501, 276502], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 486.891/pb
+        [276525, 276525], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 402.663/pb
+        [276527, 276528], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 60.758/pb
+        [276542, 276545], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 345.204/pb
+        [276581, 276587], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 471.493/pb
+        [276653, 276653], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 86.12/pb
+        [276655, 276655], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 160.843/pb
+        [276659, 276659], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 29.939/pb
+        [276775, 276776], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 443.702/pb
+        [276794, 276794], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 87.206/pb
+        [276807, 276808], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 188.301/pb
+        [276810, 276811], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 346.409/pb
+        [276831, 276831], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 400.298/pb
+        [276834, 276834], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 72.6/pb
+        [276870, 276870], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 526.587/pb
+        [276935, 276935], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 169.998/pb
+        [276940, 276940], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 28.701/pb
+        [276946, 276948], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 114.81/pb
+        [276950, 276950], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 323.179/pb
+        [277069, 277073], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 390.296/pb
+        [277076, 277076], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 125.929/pb
+        [277087, 277087], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 86.357/pb
+        [277094, 277094], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 131.103/pb
+        [277096, 277096], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 320.668/pb
+        [277112, 277112], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 17.339/pb
+        [277126, 277127], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 185.976/pb
+        [277148, 277148], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 128.192/pb
+        [277166, 277166], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 70.666/pb
+        [277168, 277168], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 318.998/pb
+        [277180, 277180], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 31.25/pb
+        [277194, 277194], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 367.175/pb
+        [277305, 277305], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 154.262/pb
+        [277420, 277420], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 60.844/pb
+        [277981, 277981], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 4.601/pb
+        [277991, 277992], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 21.692/pb
+        [278017, 278018], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 338.894/pb
+        [278167, 278167], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 314.532/pb
+        [278175, 278175], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 9.045/pb
+        [278193, 278193], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 34.581/pb
+        [278239, 278240], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 330.009/pb
+        [278273, 278274], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 23.87/pb
+        [278288, 278290], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 14.747/pb
+        [278308, 278308], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 313.102/pb
+        [278310, 278310], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 88.422/pb
+        [278315, 278315], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 137.45/pb
+        [278345, 278346], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 171.231/pb
+        [278349, 278349], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 94.737/pb
+        [278366, 278366], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 59.423/pb
+        [278406, 278406], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 296.962/pb
+        [278509, 278509], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 273.442/pb
+        [278769, 278770], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 170.993/pb
+        [278801, 278805], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 137.142/pb
+        [278808, 278808], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 269.634/pb
+        [278820, 278820], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 286.511/pb
+        [278822, 278822], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 191.158/pb
+        [278873, 278875], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 198.657/pb
+        [278923, 278923], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 98.543/pb
+        [278957, 278957], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 36.164/pb
+        [278962, 278963], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 113.024/pb
+        [278969, 278969], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 282.492/pb
+        [278975, 278976], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 122.556/pb
+        [278986, 278986], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 31.548/pb
+        [279024, 279024], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 49.596/pb
+        [279029, 279029], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 38.088/pb
+        [279071, 279071], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 22.581/pb
+        [279080, 279080], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 12.773/pb
+        [279115, 279116], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 174.938/pb
+        [279479, 279479], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 5.927/pb
+        [279588, 279588], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 228.517/pb
+        [279653, 279654], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 283.775/pb
+        [279656, 279656], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 5.684/pb
+        [279658, 279658], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 93.394/pb
+        [279667, 279667], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 208.732/pb
+        [279681, 279685], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 74.528/pb
+        [279691, 279691], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 9.656/pb
+        [279694, 279694], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 406.418/pb
+        [279715, 279716], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 383.763/pb
+        [279760, 279760], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 153.502/pb
+        [279766, 279767], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 358.144/pb
+        [279794, 279794], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 223.093/pb
+        [279823, 279823], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 81.828/pb
+        [279841, 279841], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 380.359/pb
+        [279844, 279844], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 56.588/pb
+        [279887, 279887], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 73.316/pb
+        [279931, 279931], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 475.316/pb
+        [279966, 279966], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 93.011/pb
+        [279975, 279975], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 239.011/pb
+        [279993, 279994], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 30.455/pb
+        [280013, 280013], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 5.636/pb
+        [280015, 280018], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 398.79/pb
+        [280020, 280020], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 4.614/pb
+        [280024, 280024], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 41.841/pb
+        [280187, 280188], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 74.778/pb
+        [280191, 280191], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 178.951/pb
+        [280194, 280194], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 36.665/pb
+        [280242, 280242], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 147.69/pb
+        [280249, 280249], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 239.16/pb
+        [280251, 280251], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 47.176/pb
+        [280327, 280327], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 8.719/pb
+        [280330, 280330], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 185.776/pb
+        [280349, 280349], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 104.129/pb
+        [280363, 280364], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 205.282/pb
+        [280383, 280385], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v3, 372.972/pb
+        [281613, 281613], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 4.356/pb
+        [281639, 281639], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.575/pb
+        [281641, 281641], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 1.689/pb
+        [281693, 281693], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 18.703/pb
+        [281707, 281707], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 7.208/pb
+        [281726, 281727], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 16.783/pb
+        [281797, 281797], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 16.747/pb
+        [281975, 281976], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 20.415/pb
+        [282033, 282035], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.782/pb
+        [282037, 282037], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 16.068/pb
+        [282092, 282092], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 15.629/pb
+        [282708, 282708], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.056/pb
+        [282710, 282710], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.346/pb
+        [282712, 282712], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.439/pb
+        [282730, 282735], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 22.127/pb
+        [282800, 282800], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.692/pb
+        [282807, 282807], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.402/pb
+        [282814, 282814], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 16.367/pb
+        [282842, 282842], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.599/pb
+        [282917, 282919], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.621/pb
+        [282922, 282923], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.933/pb
+        [283042, 283043], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 5.175/pb
+        [283049, 283050], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 1.58/pb
+        [283052, 283052], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.763/pb
+        [283059, 283059], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 3.392/pb
+        [283270, 283270], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 14.509/pb
+        [283283, 283283], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 16.567/pb
+        [283305, 283308], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 13.643/pb
+        [283353, 283353], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 5.376/pb
+        [283358, 283359], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 11.859/pb
+        [283407, 283408], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 19.281/pb
+        [283416, 283416], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 1.664/pb
+        [283453, 283453], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 3.281/pb
+        [283469, 283469], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.001/pb
+        [283478, 283478], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 6.362/pb
+        [283548, 283548], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 1.025/pb
+        [283680, 283682], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 3.612/pb
+        [283685, 283685], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.355/pb
+        [283820, 283820], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 12.359/pb
+        [283830, 283830], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 6.537/pb
+        [283834, 283835], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 1.563/pb
+        [283865, 283865], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 8.934/pb
+        [283876, 283877], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 17.434/pb
+        [283884, 283885], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 17.233/pb
+        [283933, 283934], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 10.877/pb
+        [283946, 283946], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 10.793/pb
+        [283964, 283964], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 3.251/pb
+        [284006, 284006], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.655/pb
+        [284014, 284014], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 2.277/pb
+        [284025, 284025], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.292/pb
+        [284029, 284029], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 0.788/pb
+        [284035, 284044], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_v5, 12.817/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 50.239/pb
+        [273302, 273302], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 16.319/pb
+        [273402, 273406], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 13.589/pb
+        [273408, 273411], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 13.087/pb
+        [273425, 273425], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 26.717/pb
+        [273446, 273450], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 94.292/pb
+        [273492, 273494], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 30.924/pb
+        [273502, 273503], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 72.147/pb
+        [273554, 273555], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 38.827/pb
+        [273725, 273725], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 154.653/pb
+        [273728, 273728], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 4.897/pb
+        [273730, 273730], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 86.49/pb
+        [274094, 274094], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 9.735/pb
+        [274146, 274146], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 5.12/pb
+        [274157, 274157], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 38.994/pb
+        [274159, 274161], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 62.883/pb
+        [274172, 274172], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 5.249/pb
+        [274198, 274200], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 135.972/pb
+        [274240, 274241], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 134.472/pb
+        [274244, 274244], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 56.348/pb
+        [274250, 274251], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 159.993/pb
+        [274283, 274284], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 30.266/pb
+        [274286, 274286], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 21.668/pb
+        [274314, 274317], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 206.7/pb
+        [274319, 274319], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 27.302/pb
+        [274335, 274339], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 246.003/pb
+        [274344, 274345], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 87.68/pb
+        [274382, 274382], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 7.428/pb
+        [274387, 274388], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 312.374/pb
+        [274420, 274422], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 359.125/pb
+        [274440, 274442], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v2, 226.466/pb
+        [274954, 274955], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 5.735/pb
+        [274968, 274971], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 422.272/pb
+        [274998, 275001], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 489.252/pb
+        [275059, 275059], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 6.094/pb
+        [275066, 275068], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 24.399/pb
+        [275337, 275338], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 143.358/pb
+        [275344, 275345], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 109.524/pb
+        [275370, 275371], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 145.599/pb
+        [275375, 275376], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 528.636/pb
+        [275657, 275659], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 80.874/pb
+        [275761, 275761], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 1.667/pb
+        [275767, 275767], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 0.714/pb
+        [275772, 275774], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 66.444/pb
+        [275776, 275778], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 116.898/pb
+        [275782, 275782], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 99.533/pb
+        [275832, 275837], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 441.03/pb
+        [275847, 275847], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 198.947/pb
+        [275886, 275886], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 7.581/pb
+        [275890, 275890], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 235.22/pb
+        [275911, 275913], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 201.741/pb
+        [275918, 275918], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 49.71/pb
+        [275920, 275921], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 62.257/pb
+        [275923, 275923], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 14.5/pb
+        [275931, 275931], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 10.418/pb
+        [275963, 275963], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 19.553/pb
+        [276092, 276092], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 14.768/pb
+        [276097, 276097], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 99.405/pb
+        [276242, 276244], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 479.052/pb
+        [276282, 276283], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 372.59/pb
+        [276315, 276315], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 34.051/pb
+        [276317, 276318], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 124.306/pb
+        [276355, 276355], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 6.205/pb
+        [276361, 276361], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 149.465/pb
+        [276363, 276363], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 206.376/pb
+        [276384, 276384], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 121.517/pb
+        [276437, 276437], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 355.688/pb
+        [276454, 276454], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 63.924/pb
+        [276458, 276458], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 33.169/pb
+        [276495, 276495], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 38.062/pb
+        [276501, 276502], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 486.891/pb
+        [276525, 276525], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 402.663/pb
+        [276527, 276528], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 60.758/pb
+        [276542, 276545], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 345.204/pb
+        [276581, 276587], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 471.493/pb
+        [276653, 276653], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 86.12/pb
+        [276655, 276655], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 160.843/pb
+        [276659, 276659], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 29.939/pb
+        [276775, 276776], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 443.702/pb
+        [276794, 276794], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 87.206/pb
+        [276807, 276808], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 188.301/pb
+        [276810, 276811], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 346.409/pb
+        [276831, 276831], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 400.298/pb
+        [276834, 276834], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 72.6/pb
+        [276870, 276870], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 526.587/pb
+        [276935, 276935], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 169.998/pb
+        [276940, 276940], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 28.701/pb
+        [276946, 276948], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 114.81/pb
+        [276950, 276950], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 323.179/pb
+        [277069, 277073], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 390.296/pb
+        [277076, 277076], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 125.929/pb
+        [277087, 277087], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 86.357/pb
+        [277094, 277094], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 131.103/pb
+        [277096, 277096], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 320.668/pb
+        [277112, 277112], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 17.339/pb
+        [277126, 277127], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 185.976/pb
+        [277148, 277148], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 128.192/pb
+        [277166, 277166], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 70.666/pb
+        [277168, 277168], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 318.998/pb
+        [277180, 277180], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 31.25/pb
+        [277194, 277194], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 367.175/pb
+        [277305, 277305], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 154.262/pb
+        [277420, 277420], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 60.844/pb
+        [277981, 277981], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 4.601/pb
+        [277991, 277992], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 21.692/pb
+        [278017, 278018], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 338.894/pb
+        [278167, 278167], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 314.532/pb
+        [278175, 278175], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 9.045/pb
+        [278193, 278193], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 34.581/pb
+        [278239, 278240], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 330.009/pb
+        [278273, 278274], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 23.87/pb
+        [278288, 278290], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 14.747/pb
+        [278308, 278308], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 313.102/pb
+        [278310, 278310], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 88.422/pb
+        [278315, 278315], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 137.45/pb
+        [278345, 278346], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 171.231/pb
+        [278349, 278349], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 94.737/pb
+        [278366, 278366], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 59.423/pb
+        [278406, 278406], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 296.962/pb
+        [278509, 278509], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 273.442/pb
+        [278769, 278770], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 170.993/pb
+        [278801, 278805], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 137.142/pb
+        [278808, 278808], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 269.634/pb
+        [278820, 278820], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 286.511/pb
+        [278822, 278822], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 191.158/pb
+        [278873, 278875], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 198.657/pb
+        [278923, 278923], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 98.543/pb
+        [278957, 278957], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 36.164/pb
+        [278962, 278963], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 113.024/pb
+        [278969, 278969], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 282.492/pb
+        [278975, 278976], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 122.556/pb
+        [278986, 278986], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 31.548/pb
+        [279024, 279024], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 49.596/pb
+        [279029, 279029], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 38.088/pb
+        [279071, 279071], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 22.581/pb
+        [279080, 279080], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 12.773/pb
+        [279115, 279116], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 174.938/pb
+        [279479, 279479], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 5.927/pb
+        [279588, 279588], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 228.517/pb
+        [279653, 279654], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 283.775/pb
+        [279656, 279656], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 5.684/pb
+        [279658, 279658], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 93.394/pb
+        [279667, 279667], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 208.732/pb
+        [279681, 279685], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 74.528/pb
+        [279691, 279691], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 9.656/pb
+        [279694, 279694], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 406.418/pb
+        [279715, 279716], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 383.763/pb
+        [279760, 279760], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 153.502/pb
+        [279766, 279767], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 358.144/pb
+        [279794, 279794], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 223.093/pb
+        [279823, 279823], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 81.828/pb
+        [279841, 279841], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 380.359/pb
+        [279844, 279844], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 56.588/pb
+        [279887, 279887], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 73.316/pb
+        [279931, 279931], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 475.316/pb
+        [279966, 279966], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 93.011/pb
+        [279975, 279975], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 239.011/pb
+        [279993, 279994], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 30.455/pb
+        [280013, 280013], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 5.636/pb
+        [280015, 280018], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 398.79/pb
+        [280020, 280020], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 4.614/pb
+        [280024, 280024], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 41.841/pb
+        [280187, 280188], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 74.778/pb
+        [280191, 280191], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 178.951/pb
+        [280194, 280194], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 36.665/pb
+        [280242, 280242], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 147.69/pb
+        [280249, 280249], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 239.16/pb
+        [280251, 280251], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 47.176/pb
+        [280327, 280327], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 8.719/pb
+        [280330, 280330], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 185.776/pb
+        [280349, 280349], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 104.129/pb
+        [280363, 280364], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 205.282/pb
+        [280383, 280385], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v3, 372.972/pb
+        [281613, 281613], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 9.764/pb
+        [281639, 281639], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 18.977/pb
+        [281641, 281641], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 39.268/pb
+        [281693, 281693], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 376.118/pb
+        [281707, 281707], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 214.55/pb
+        [281726, 281727], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 251.373/pb
+        [281797, 281797], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 397.836/pb
+        [281975, 281976], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 393.967/pb
+        [282033, 282035], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 26.293/pb
+        [282037, 282037], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 331.413/pb
+        [282092, 282092], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 296.762/pb
+        [282708, 282708], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 2.118/pb
+        [282710, 282710], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 0.346/pb
+        [282712, 282712], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 16.683/pb
+        [282730, 282735], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 469.07/pb
+        [282800, 282800], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 93.58/pb
+        [282807, 282807], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 70.563/pb
+        [282814, 282814], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 276.224/pb
+        [282842, 282842], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 23.509/pb
+        [282917, 282919], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 88.074/pb
+        [282922, 282923], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 66.001/pb
+        [283042, 283043], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 118.119/pb
+        [283049, 283050], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 61.072/pb
+        [283052, 283052], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 28.777/pb
+        [283059, 283059], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 98.778/pb
+        [283270, 283270], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 381.444/pb
+        [283283, 283283], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 197.444/pb
+        [283305, 283308], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 338.86/pb
+        [283353, 283353], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 191.088/pb
+        [283358, 283359], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 233.089/pb
+        [283407, 283408], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 466.833/pb
+        [283416, 283416], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 21.628/pb
+        [283453, 283453], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 123.278/pb
+        [283469, 283469], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 0.031/pb
+        [283478, 283478], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 210.23/pb
+        [283548, 283548], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 26.451/pb
+        [283680, 283682], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 102.814/pb
+        [283685, 283685], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 20.432/pb
+        [283820, 283820], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 259.058/pb
+        [283830, 283830], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 102.255/pb
+        [283834, 283835], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 20.323/pb
+        [283865, 283865], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 264.403/pb
+        [283876, 283877], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 409.447/pb
+        [283884, 283885], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 392.377/pb
+        [283933, 283934], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 309.793/pb
+        [283946, 283946], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 300.188/pb
+        [283964, 283964], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 58.698/pb
+        [284006, 284006], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 57.69/pb
+        [284014, 284014], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 47.826/pb
+        [284025, 284025], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 12.193/pb
+        [284029, 284029], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 29.941/pb
+        [284035, 284044], # HLT_Mu17_TrkIsoVVL_TkMu8_TrkIsoVVL_DZ_v6, 303.58/pb
+      ],
+    },
+  ],
+  '1e1mu' : [
+    {
+      'name'        : 'HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL', # missing in run H
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 50.239/pb
+        [273302, 273302], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 16.319/pb
+        [273402, 273406], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 13.589/pb
+        [273408, 273411], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 13.087/pb
+        [273425, 273425], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 26.717/pb
+        [273446, 273450], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 94.292/pb
+        [273492, 273494], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 30.924/pb
+        [273502, 273503], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 72.147/pb
+        [273554, 273555], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 38.827/pb
+        [273725, 273725], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 154.653/pb
+        [273728, 273728], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 4.897/pb
+        [273730, 273730], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 86.49/pb
+        [274094, 274094], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 9.735/pb
+        [274146, 274146], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 5.12/pb
+        [274157, 274157], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 38.994/pb
+        [274159, 274161], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 62.883/pb
+        [274172, 274172], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 5.249/pb
+        [274198, 274200], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 135.972/pb
+        [274240, 274241], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 134.472/pb
+        [274244, 274244], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 56.348/pb
+        [274250, 274251], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 159.993/pb
+        [274283, 274284], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 30.266/pb
+        [274286, 274286], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 21.668/pb
+        [274314, 274317], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 206.7/pb
+        [274319, 274319], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 27.302/pb
+        [274335, 274339], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 246.003/pb
+        [274344, 274345], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 87.68/pb
+        [274382, 274382], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 7.428/pb
+        [274387, 274388], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 312.374/pb
+        [274420, 274422], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 359.125/pb
+        [274440, 274442], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v3, 226.466/pb
+        [274954, 274955], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v4, 5.735/pb
+        [274968, 274971], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v4, 422.272/pb
+        [274998, 275001], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v4, 489.252/pb
+        [275059, 275059], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v4, 6.094/pb
+        [275066, 275068], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v4/HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v5, 231.774/pb
+        [275073, 275074], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v5, 144.124/pb
+        [275124, 275125], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v5, 205.394/pb
+        [275282, 275284], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v5, 49.295/pb
+        [275290, 275293], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v5, 94.338/pb
+        [275309, 275311], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v5, 411.084/pb
+        [275319, 275319], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 24.399/pb
+        [275337, 275338], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 143.358/pb
+        [275344, 275345], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 109.524/pb
+        [275370, 275371], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 145.599/pb
+        [275375, 275376], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 528.636/pb
+        [275657, 275659], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 80.874/pb
+        [275761, 275761], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 1.667/pb
+        [275767, 275767], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 0.714/pb
+        [275772, 275774], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 66.444/pb
+        [275776, 275778], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 116.898/pb
+        [275782, 275782], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 99.533/pb
+        [275832, 275837], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 441.03/pb
+        [275847, 275847], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 198.947/pb
+        [275886, 275886], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 7.581/pb
+        [275890, 275890], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 235.22/pb
+        [275911, 275913], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 201.741/pb
+        [275918, 275918], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 49.71/pb
+        [275920, 275921], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 62.257/pb
+        [275923, 275923], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 14.5/pb
+        [275931, 275931], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 10.418/pb
+        [275963, 275963], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 19.553/pb
+        [276092, 276092], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 14.768/pb
+        [276097, 276097], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 99.405/pb
+        [276242, 276244], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 479.052/pb
+        [276282, 276283], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 372.59/pb
+        [276315, 276315], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 34.051/pb
+        [276317, 276318], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 124.306/pb
+        [276355, 276355], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 6.205/pb
+        [276361, 276361], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 149.465/pb
+        [276363, 276363], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 206.376/pb
+        [276384, 276384], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 121.517/pb
+        [276437, 276437], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 355.688/pb
+        [276454, 276454], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 63.924/pb
+        [276458, 276458], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 33.169/pb
+        [276495, 276495], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 38.062/pb
+        [276501, 276502], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 486.891/pb
+        [276525, 276525], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 402.663/pb
+        [276527, 276528], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 60.758/pb
+        [276542, 276545], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 345.204/pb
+        [276581, 276587], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 471.493/pb
+        [276653, 276653], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 86.12/pb
+        [276655, 276655], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 160.843/pb
+        [276659, 276659], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 29.939/pb
+        [276775, 276776], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 443.702/pb
+        [276794, 276794], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 87.206/pb
+        [276807, 276808], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 188.301/pb
+        [276810, 276811], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 346.409/pb
+        [276831, 276831], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 400.298/pb
+        [276834, 276834], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 72.6/pb
+        [276870, 276870], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 526.587/pb
+        [276935, 276935], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 169.998/pb
+        [276940, 276940], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 28.701/pb
+        [276946, 276948], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 114.81/pb
+        [276950, 276950], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 323.179/pb
+        [277069, 277073], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 390.296/pb
+        [277076, 277076], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 125.929/pb
+        [277087, 277087], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 86.357/pb
+        [277094, 277094], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 131.103/pb
+        [277096, 277096], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 320.668/pb
+        [277112, 277112], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 17.339/pb
+        [277126, 277127], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 185.976/pb
+        [277148, 277148], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 128.192/pb
+        [277166, 277166], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 70.666/pb
+        [277168, 277168], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 318.998/pb
+        [277180, 277180], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 31.25/pb
+        [277194, 277194], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 367.175/pb
+        [277305, 277305], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 154.262/pb
+        [277420, 277420], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 60.844/pb
+        [277981, 277981], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 4.601/pb
+        [277991, 277992], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 21.692/pb
+        [278017, 278018], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 338.894/pb
+        [278167, 278167], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 314.532/pb
+        [278175, 278175], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 9.045/pb
+        [278193, 278193], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 34.581/pb
+        [278239, 278240], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v6, 330.009/pb
+        [278273, 278274], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 23.87/pb
+        [278288, 278290], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 14.747/pb
+        [278308, 278308], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 313.102/pb
+        [278310, 278310], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 88.422/pb
+        [278315, 278315], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 137.45/pb
+        [278345, 278346], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 171.231/pb
+        [278349, 278349], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 94.737/pb
+        [278366, 278366], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 59.423/pb
+        [278406, 278406], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 296.962/pb
+        [278509, 278509], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 273.442/pb
+        [278769, 278770], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 170.993/pb
+        [278801, 278805], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 137.142/pb
+        [278808, 278808], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 269.634/pb
+        [278820, 278820], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 286.511/pb
+        [278822, 278822], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 191.158/pb
+        [278873, 278875], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 198.657/pb
+        [278923, 278923], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 98.543/pb
+        [278957, 278957], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 36.164/pb
+        [278962, 278963], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 113.024/pb
+        [278969, 278969], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 282.492/pb
+        [278975, 278976], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 122.556/pb
+        [278986, 278986], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 31.548/pb
+        [279024, 279024], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 49.596/pb
+        [279029, 279029], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 38.088/pb
+        [279071, 279071], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 22.581/pb
+        [279080, 279080], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 12.773/pb
+        [279115, 279116], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 174.938/pb
+        [279479, 279479], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 5.927/pb
+        [279588, 279588], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 228.517/pb
+        [279653, 279654], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 283.775/pb
+        [279656, 279656], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 5.684/pb
+        [279658, 279658], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 93.394/pb
+        [279667, 279667], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 208.732/pb
+        [279681, 279685], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 74.528/pb
+        [279691, 279691], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 9.656/pb
+        [279694, 279694], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 406.418/pb
+        [279715, 279716], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 383.763/pb
+        [279760, 279760], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 153.502/pb
+        [279766, 279767], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 358.144/pb
+        [279794, 279794], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 223.093/pb
+        [279823, 279823], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 81.828/pb
+        [279841, 279841], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 380.359/pb
+        [279844, 279844], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 56.588/pb
+        [279887, 279887], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 73.316/pb
+        [279931, 279931], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 475.316/pb
+        [279966, 279966], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 93.011/pb
+        [279975, 279975], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 239.011/pb
+        [279993, 279994], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 30.455/pb
+        [280013, 280013], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 5.636/pb
+        [280015, 280018], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 398.79/pb
+        [280020, 280020], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 4.614/pb
+        [280024, 280024], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 41.841/pb
+        [280187, 280188], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 74.778/pb
+        [280191, 280191], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 178.951/pb
+        [280194, 280194], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 36.665/pb
+        [280242, 280242], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 147.69/pb
+        [280249, 280249], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 239.16/pb
+        [280251, 280251], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 47.176/pb
+        [280327, 280327], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 8.719/pb
+        [280330, 280330], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 185.776/pb
+        [280349, 280349], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 104.129/pb
+        [280363, 280364], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 205.282/pb
+        [280383, 280385], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_v7, 372.972/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ', # present in F, G, H
+      'unprescaled' : True,
+      'runs'        : [
+        [278273, 278274], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 23.87/pb
+        [278288, 278290], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 14.747/pb
+        [278308, 278308], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 313.102/pb
+        [278310, 278310], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 88.422/pb
+        [278315, 278315], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 137.45/pb
+        [278345, 278346], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 171.231/pb
+        [278349, 278349], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 94.737/pb
+        [278366, 278366], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 59.423/pb
+        [278406, 278406], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 296.962/pb
+        [278509, 278509], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 273.442/pb
+        [278769, 278770], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 170.993/pb
+        [278801, 278805], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 137.142/pb
+        [278808, 278808], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 269.634/pb
+        [278820, 278820], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 286.511/pb
+        [278822, 278822], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 191.158/pb
+        [278873, 278875], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 198.657/pb
+        [278923, 278923], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 98.543/pb
+        [278957, 278957], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 36.164/pb
+        [278962, 278963], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 113.024/pb
+        [278969, 278969], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 282.492/pb
+        [278975, 278976], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 122.556/pb
+        [278986, 278986], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 31.548/pb
+        [279024, 279024], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 49.596/pb
+        [279029, 279029], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 38.088/pb
+        [279071, 279071], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 22.581/pb
+        [279080, 279080], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 12.773/pb
+        [279115, 279116], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 174.938/pb
+        [279479, 279479], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 5.927/pb
+        [279588, 279588], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 228.517/pb
+        [279653, 279654], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 283.775/pb
+        [279656, 279656], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 5.684/pb
+        [279658, 279658], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 93.394/pb
+        [279667, 279667], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 208.732/pb
+        [279681, 279685], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 74.528/pb
+        [279691, 279691], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 9.656/pb
+        [279694, 279694], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 406.418/pb
+        [279715, 279716], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 383.763/pb
+        [279760, 279760], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 153.502/pb
+        [279766, 279767], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 358.144/pb
+        [279794, 279794], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 223.093/pb
+        [279823, 279823], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 81.828/pb
+        [279841, 279841], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 380.359/pb
+        [279844, 279844], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 56.588/pb
+        [279887, 279887], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 73.316/pb
+        [279931, 279931], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 475.316/pb
+        [279966, 279966], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 93.011/pb
+        [279975, 279975], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 239.011/pb
+        [279993, 279994], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 30.455/pb
+        [280013, 280013], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 5.636/pb
+        [280015, 280018], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 398.79/pb
+        [280020, 280020], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 4.614/pb
+        [280024, 280024], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 41.841/pb
+        [280187, 280188], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 74.778/pb
+        [280191, 280191], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 178.951/pb
+        [280194, 280194], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 36.665/pb
+        [280242, 280242], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 147.69/pb
+        [280249, 280249], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 239.16/pb
+        [280251, 280251], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 47.176/pb
+        [280327, 280327], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 8.719/pb
+        [280330, 280330], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 185.776/pb
+        [280349, 280349], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 104.129/pb
+        [280363, 280364], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 205.282/pb
+        [280383, 280385], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v1, 372.972/pb
+        [281613, 281613], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 9.764/pb
+        [281639, 281639], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 18.977/pb
+        [281641, 281641], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 39.268/pb
+        [281693, 281693], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 376.118/pb
+        [281707, 281707], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 214.55/pb
+        [281726, 281727], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 251.373/pb
+        [281797, 281797], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 397.836/pb
+        [281975, 281976], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 393.967/pb
+        [282033, 282035], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 26.293/pb
+        [282037, 282037], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 331.413/pb
+        [282092, 282092], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 296.762/pb
+        [282708, 282708], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 2.118/pb
+        [282710, 282710], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 0.346/pb
+        [282712, 282712], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 16.683/pb
+        [282730, 282735], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 469.07/pb
+        [282800, 282800], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 93.58/pb
+        [282807, 282807], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 70.563/pb
+        [282814, 282814], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 276.224/pb
+        [282842, 282842], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 23.509/pb
+        [282917, 282919], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 88.074/pb
+        [282922, 282923], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 66.001/pb
+        [283042, 283043], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 118.119/pb
+        [283049, 283050], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 61.072/pb
+        [283052, 283052], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 28.777/pb
+        [283059, 283059], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 98.778/pb
+        [283270, 283270], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 381.444/pb
+        [283283, 283283], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 197.444/pb
+        [283305, 283308], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 338.86/pb
+        [283353, 283353], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 191.088/pb
+        [283358, 283359], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 233.089/pb
+        [283407, 283408], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 466.833/pb
+        [283416, 283416], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 21.628/pb
+        [283453, 283453], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 123.278/pb
+        [283469, 283469], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 0.031/pb
+        [283478, 283478], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 210.23/pb
+        [283548, 283548], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 26.451/pb
+        [283680, 283682], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 102.814/pb
+        [283685, 283685], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 20.432/pb
+        [283820, 283820], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 259.058/pb
+        [283830, 283830], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 102.255/pb
+        [283834, 283835], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 20.323/pb
+        [283865, 283865], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 264.403/pb
+        [283876, 283877], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 409.447/pb
+        [283884, 283885], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 392.377/pb
+        [283933, 283934], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 309.793/pb
+        [283946, 283946], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 300.188/pb
+        [283964, 283964], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 58.698/pb
+        [284006, 284006], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 57.69/pb
+        [284014, 284014], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 47.826/pb
+        [284025, 284025], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 12.193/pb
+        [284029, 284029], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 29.941/pb
+        [284035, 284044], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL', # missing in run H
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 50.239/pb
+        [273302, 273302], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 16.319/pb
+        [273402, 273406], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 13.589/pb
+        [273408, 273411], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 13.087/pb
+        [273425, 273425], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 26.717/pb
+        [273446, 273450], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 94.292/pb
+        [273492, 273494], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 30.924/pb
+        [273502, 273503], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 72.147/pb
+        [273554, 273555], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 38.827/pb
+        [273725, 273725], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 154.653/pb
+        [273728, 273728], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 4.897/pb
+        [273730, 273730], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 86.49/pb
+        [274094, 274094], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 9.735/pb
+        [274146, 274146], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 5.12/pb
+        [274157, 274157], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 38.994/pb
+        [274159, 274161], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 62.883/pb
+        [274172, 274172], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 5.249/pb
+        [274198, 274200], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 135.972/pb
+        [274240, 274241], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 134.472/pb
+        [274244, 274244], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 56.348/pb
+        [274250, 274251], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 159.993/pb
+        [274283, 274284], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 30.266/pb
+        [274286, 274286], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 21.668/pb
+        [274314, 274317], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 206.7/pb
+        [274319, 274319], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 27.302/pb
+        [274335, 274339], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 246.003/pb
+        [274344, 274345], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 87.68/pb
+        [274382, 274382], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 7.428/pb
+        [274387, 274388], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 312.374/pb
+        [274420, 274422], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 359.125/pb
+        [274440, 274442], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v1, 226.466/pb
+        [274954, 274955], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v2, 5.735/pb
+        [274968, 274971], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v2, 422.272/pb
+        [274998, 275001], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v2, 489.252/pb
+        [275059, 275059], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v2, 6.094/pb
+        [275066, 275068], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v2/HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 24.399/pb
+        [275337, 275338], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 143.358/pb
+        [275344, 275345], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 109.524/pb
+        [275370, 275371], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 145.599/pb
+        [275375, 275376], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 528.636/pb
+        [275657, 275659], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 80.874/pb
+        [275761, 275761], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 1.667/pb
+        [275767, 275767], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 0.714/pb
+        [275772, 275774], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 66.444/pb
+        [275776, 275778], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 116.898/pb
+        [275782, 275782], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 99.533/pb
+        [275832, 275837], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 441.03/pb
+        [275847, 275847], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 198.947/pb
+        [275886, 275886], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 7.581/pb
+        [275890, 275890], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 235.22/pb
+        [275911, 275913], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 201.741/pb
+        [275918, 275918], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 49.71/pb
+        [275920, 275921], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 62.257/pb
+        [275923, 275923], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 14.5/pb
+        [275931, 275931], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 10.418/pb
+        [275963, 275963], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 19.553/pb
+        [276092, 276092], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 14.768/pb
+        [276097, 276097], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 99.405/pb
+        [276242, 276244], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 479.052/pb
+        [276282, 276283], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 372.59/pb
+        [276315, 276315], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 34.051/pb
+        [276317, 276318], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 124.306/pb
+        [276355, 276355], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 6.205/pb
+        [276361, 276361], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 149.465/pb
+        [276363, 276363], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 206.376/pb
+        [276384, 276384], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 121.517/pb
+        [276437, 276437], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 355.688/pb
+        [276454, 276454], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 63.924/pb
+        [276458, 276458], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 33.169/pb
+        [276495, 276495], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 38.062/pb
+        [276501, 276502], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 486.891/pb
+        [276525, 276525], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 402.663/pb
+        [276527, 276528], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 60.758/pb
+        [276542, 276545], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 345.204/pb
+        [276581, 276587], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 471.493/pb
+        [276653, 276653], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 86.12/pb
+        [276655, 276655], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 160.843/pb
+        [276659, 276659], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 29.939/pb
+        [276775, 276776], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 443.702/pb
+        [276794, 276794], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 87.206/pb
+        [276807, 276808], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 188.301/pb
+        [276810, 276811], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 346.409/pb
+        [276831, 276831], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 400.298/pb
+        [276834, 276834], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 72.6/pb
+        [276870, 276870], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 526.587/pb
+        [276935, 276935], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 169.998/pb
+        [276940, 276940], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 28.701/pb
+        [276946, 276948], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 114.81/pb
+        [276950, 276950], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 323.179/pb
+        [277069, 277073], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 390.296/pb
+        [277076, 277076], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 125.929/pb
+        [277087, 277087], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 86.357/pb
+        [277094, 277094], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 131.103/pb
+        [277096, 277096], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 320.668/pb
+        [277112, 277112], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 17.339/pb
+        [277126, 277127], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 185.976/pb
+        [277148, 277148], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 128.192/pb
+        [277166, 277166], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 70.666/pb
+        [277168, 277168], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 318.998/pb
+        [277180, 277180], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 31.25/pb
+        [277194, 277194], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 367.175/pb
+        [277305, 277305], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 154.262/pb
+        [277420, 277420], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 60.844/pb
+        [277981, 277981], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 4.601/pb
+        [277991, 277992], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 21.692/pb
+        [278017, 278018], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 338.894/pb
+        [278167, 278167], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 314.532/pb
+        [278175, 278175], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 9.045/pb
+        [278193, 278193], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 34.581/pb
+        [278239, 278240], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v4, 330.009/pb
+        [278273, 278274], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 23.87/pb
+        [278288, 278290], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 14.747/pb
+        [278308, 278308], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 313.102/pb
+        [278310, 278310], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 88.422/pb
+        [278315, 278315], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 137.45/pb
+        [278345, 278346], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 171.231/pb
+        [278349, 278349], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 94.737/pb
+        [278366, 278366], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 59.423/pb
+        [278406, 278406], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 296.962/pb
+        [278509, 278509], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 273.442/pb
+        [278769, 278770], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 170.993/pb
+        [278801, 278805], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 137.142/pb
+        [278808, 278808], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 269.634/pb
+        [278820, 278820], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 286.511/pb
+        [278822, 278822], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 191.158/pb
+        [278873, 278875], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 198.657/pb
+        [278923, 278923], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 98.543/pb
+        [278957, 278957], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 36.164/pb
+        [278962, 278963], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 113.024/pb
+        [278969, 278969], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 282.492/pb
+        [278975, 278976], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 122.556/pb
+        [278986, 278986], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 31.548/pb
+        [279024, 279024], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 49.596/pb
+        [279029, 279029], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 38.088/pb
+        [279071, 279071], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 22.581/pb
+        [279080, 279080], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 12.773/pb
+        [279115, 279116], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 174.938/pb
+        [279479, 279479], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 5.927/pb
+        [279588, 279588], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 228.517/pb
+        [279653, 279654], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 283.775/pb
+        [279656, 279656], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 5.684/pb
+        [279658, 279658], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 93.394/pb
+        [279667, 279667], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 208.732/pb
+        [279681, 279685], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 74.528/pb
+        [279691, 279691], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 9.656/pb
+        [279694, 279694], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 406.418/pb
+        [279715, 279716], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 383.763/pb
+        [279760, 279760], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 153.502/pb
+        [279766, 279767], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 358.144/pb
+        [279794, 279794], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 223.093/pb
+        [279823, 279823], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 81.828/pb
+        [279841, 279841], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 380.359/pb
+        [279844, 279844], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 56.588/pb
+        [279887, 279887], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 73.316/pb
+        [279931, 279931], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 475.316/pb
+        [279966, 279966], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 93.011/pb
+        [279975, 279975], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 239.011/pb
+        [279993, 279994], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 30.455/pb
+        [280013, 280013], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 5.636/pb
+        [280015, 280018], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 398.79/pb
+        [280020, 280020], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 4.614/pb
+        [280024, 280024], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 41.841/pb
+        [280187, 280188], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 74.778/pb
+        [280191, 280191], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 178.951/pb
+        [280194, 280194], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 36.665/pb
+        [280242, 280242], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 147.69/pb
+        [280249, 280249], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 239.16/pb
+        [280251, 280251], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 47.176/pb
+        [280327, 280327], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 8.719/pb
+        [280330, 280330], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 185.776/pb
+        [280349, 280349], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 104.129/pb
+        [280363, 280364], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 205.282/pb
+        [280383, 280385], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_v5, 372.972/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ', # present in run H
+      'unprescaled' : True,
+      'runs'        : [
+        [281613, 281613], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 9.764/pb
+        [281639, 281639], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 18.977/pb
+        [281641, 281641], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 39.268/pb
+        [281693, 281693], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 376.118/pb
+        [281707, 281707], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 214.55/pb
+        [281726, 281727], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 251.373/pb
+        [281797, 281797], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 397.836/pb
+        [281975, 281976], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 393.967/pb
+        [282033, 282035], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 26.293/pb
+        [282037, 282037], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 331.413/pb
+        [282092, 282092], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 296.762/pb
+        [282708, 282708], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 2.118/pb
+        [282710, 282710], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 0.346/pb
+        [282712, 282712], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 16.683/pb
+        [282730, 282735], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 469.07/pb
+        [282800, 282800], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 93.58/pb
+        [282807, 282807], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 70.563/pb
+        [282814, 282814], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 276.224/pb
+        [282842, 282842], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 23.509/pb
+        [282917, 282919], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 88.074/pb
+        [282922, 282923], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 66.001/pb
+        [283042, 283043], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 118.119/pb
+        [283049, 283050], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 61.072/pb
+        [283052, 283052], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 28.777/pb
+        [283059, 283059], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 98.778/pb
+        [283270, 283270], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 381.444/pb
+        [283283, 283283], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 197.444/pb
+        [283305, 283308], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 338.86/pb
+        [283353, 283353], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 191.088/pb
+        [283358, 283359], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 233.089/pb
+        [283407, 283408], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 466.833/pb
+        [283416, 283416], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 21.628/pb
+        [283453, 283453], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 123.278/pb
+        [283469, 283469], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 0.031/pb
+        [283478, 283478], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 210.23/pb
+        [283548, 283548], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 26.451/pb
+        [283680, 283682], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 102.814/pb
+        [283685, 283685], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 20.432/pb
+        [283820, 283820], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 259.058/pb
+        [283830, 283830], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 102.255/pb
+        [283834, 283835], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 20.323/pb
+        [283865, 283865], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 264.403/pb
+        [283876, 283877], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 409.447/pb
+        [283884, 283885], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 392.377/pb
+        [283933, 283934], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 309.793/pb
+        [283946, 283946], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 300.188/pb
+        [283964, 283964], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 58.698/pb
+        [284006, 284006], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 57.69/pb
+        [284014, 284014], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 47.826/pb
+        [284025, 284025], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 12.193/pb
+        [284029, 284029], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 29.941/pb
+        [284035, 284044], # HLT_Mu23_TrkIsoVVL_Ele8_CaloIdL_TrackIdL_IsoVL_DZ_v3, 303.58/pb
+      ],
+    },
+  ],
+  '2e' : [
+    {
+      'name'        : 'HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 50.239/pb
+        [273302, 273302], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 16.319/pb
+        [273402, 273406], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 13.589/pb
+        [273408, 273411], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 13.087/pb
+        [273425, 273425], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 26.717/pb
+        [273446, 273450], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 94.292/pb
+        [273492, 273494], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 30.924/pb
+        [273502, 273503], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 72.147/pb
+        [273554, 273555], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 38.827/pb
+        [273725, 273725], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 154.653/pb
+        [273728, 273728], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 4.897/pb
+        [273730, 273730], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 86.49/pb
+        [274094, 274094], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 9.735/pb
+        [274146, 274146], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 5.12/pb
+        [274157, 274157], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 38.994/pb
+        [274159, 274161], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 62.883/pb
+        [274172, 274172], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 5.249/pb
+        [274198, 274200], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 135.972/pb
+        [274240, 274241], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 134.472/pb
+        [274244, 274244], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 56.348/pb
+        [274250, 274251], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 159.993/pb
+        [274283, 274284], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 30.266/pb
+        [274286, 274286], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 21.668/pb
+        [274314, 274317], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 206.7/pb
+        [274319, 274319], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 27.302/pb
+        [274335, 274339], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 246.003/pb
+        [274344, 274345], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 87.68/pb
+        [274382, 274382], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 7.428/pb
+        [274387, 274388], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 312.374/pb
+        [274420, 274422], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 359.125/pb
+        [274440, 274442], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v3, 226.466/pb
+        [274954, 274955], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v4, 5.735/pb
+        [274968, 274971], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v4, 422.272/pb
+        [274998, 275001], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v4, 489.252/pb
+        [275059, 275059], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v4, 6.094/pb
+        [275066, 275068], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v4/HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 231.774/pb
+        [275073, 275074], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 144.124/pb
+        [275124, 275125], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 205.394/pb
+        [275282, 275284], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 49.295/pb
+        [275290, 275293], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 94.338/pb
+        [275309, 275311], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 411.084/pb
+        [275319, 275319], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 24.399/pb
+        [275337, 275338], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 143.358/pb
+        [275344, 275345], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 109.524/pb
+        [275370, 275371], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 145.599/pb
+        [275375, 275376], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 528.636/pb
+        [275657, 275659], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 80.874/pb
+        [275761, 275761], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 1.667/pb
+        [275767, 275767], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 0.714/pb
+        [275772, 275774], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 66.444/pb
+        [275776, 275778], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 116.898/pb
+        [275782, 275782], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 99.533/pb
+        [275832, 275837], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 441.03/pb
+        [275847, 275847], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 198.947/pb
+        [275886, 275886], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 7.581/pb
+        [275890, 275890], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 235.22/pb
+        [275911, 275913], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 201.741/pb
+        [275918, 275918], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 49.71/pb
+        [275920, 275921], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 62.257/pb
+        [275923, 275923], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 14.5/pb
+        [275931, 275931], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 10.418/pb
+        [275963, 275963], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 19.553/pb
+        [276092, 276092], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 14.768/pb
+        [276097, 276097], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 99.405/pb
+        [276242, 276244], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 479.052/pb
+        [276282, 276283], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 372.59/pb
+        [276315, 276315], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 34.051/pb
+        [276317, 276318], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 124.306/pb
+        [276355, 276355], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 6.205/pb
+        [276361, 276361], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 149.465/pb
+        [276363, 276363], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 206.376/pb
+        [276384, 276384], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 121.517/pb
+        [276437, 276437], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 355.688/pb
+        [276454, 276454], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 63.924/pb
+        [276458, 276458], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 33.169/pb
+        [276495, 276495], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 38.062/pb
+        [276501, 276502], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 486.891/pb
+        [276525, 276525], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 402.663/pb
+        [276527, 276528], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 60.758/pb
+        [276542, 276545], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 345.204/pb
+        [276581, 276587], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 471.493/pb
+        [276653, 276653], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 86.12/pb
+        [276655, 276655], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 160.843/pb
+        [276659, 276659], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 29.939/pb
+        [276775, 276776], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 443.702/pb
+        [276794, 276794], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 87.206/pb
+        [276807, 276808], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 188.301/pb
+        [276810, 276811], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 346.409/pb
+        [276831, 276831], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 400.298/pb
+        [276834, 276834], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 72.6/pb
+        [276870, 276870], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 526.587/pb
+        [276935, 276935], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 169.998/pb
+        [276940, 276940], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 28.701/pb
+        [276946, 276948], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 114.81/pb
+        [276950, 276950], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 323.179/pb
+        [277069, 277073], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 390.296/pb
+        [277076, 277076], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 125.929/pb
+        [277087, 277087], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 86.357/pb
+        [277094, 277094], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 131.103/pb
+        [277096, 277096], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 320.668/pb
+        [277112, 277112], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 17.339/pb
+        [277126, 277127], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 185.976/pb
+        [277148, 277148], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 128.192/pb
+        [277166, 277166], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 70.666/pb
+        [277168, 277168], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 318.998/pb
+        [277180, 277180], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 31.25/pb
+        [277194, 277194], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 367.175/pb
+        [277305, 277305], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 154.262/pb
+        [277420, 277420], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 60.844/pb
+        [277981, 277981], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 4.601/pb
+        [277991, 277992], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 21.692/pb
+        [278017, 278018], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 338.894/pb
+        [278167, 278167], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 314.532/pb
+        [278175, 278175], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 9.045/pb
+        [278193, 278193], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 34.581/pb
+        [278239, 278240], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v7, 330.009/pb
+        [278273, 278274], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 23.87/pb
+        [278288, 278290], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 14.747/pb
+        [278308, 278308], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 313.102/pb
+        [278310, 278310], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 88.422/pb
+        [278315, 278315], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 137.45/pb
+        [278345, 278346], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 171.231/pb
+        [278349, 278349], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 94.737/pb
+        [278366, 278366], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 59.423/pb
+        [278406, 278406], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 296.962/pb
+        [278509, 278509], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 273.442/pb
+        [278769, 278770], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 170.993/pb
+        [278801, 278805], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 137.142/pb
+        [278808, 278808], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 269.634/pb
+        [278820, 278820], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 286.511/pb
+        [278822, 278822], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 191.158/pb
+        [278873, 278875], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 198.657/pb
+        [278923, 278923], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 98.543/pb
+        [278957, 278957], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 36.164/pb
+        [278962, 278963], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 113.024/pb
+        [278969, 278969], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 282.492/pb
+        [278975, 278976], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 122.556/pb
+        [278986, 278986], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 31.548/pb
+        [279024, 279024], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 49.596/pb
+        [279029, 279029], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 38.088/pb
+        [279071, 279071], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 22.581/pb
+        [279080, 279080], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 12.773/pb
+        [279115, 279116], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 174.938/pb
+        [279479, 279479], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 5.927/pb
+        [279588, 279588], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 228.517/pb
+        [279653, 279654], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 283.775/pb
+        [279656, 279656], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 5.684/pb
+        [279658, 279658], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 93.394/pb
+        [279667, 279667], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 208.732/pb
+        [279681, 279685], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 74.528/pb
+        [279691, 279691], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 9.656/pb
+        [279694, 279694], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 406.418/pb
+        [279715, 279716], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 383.763/pb
+        [279760, 279760], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 153.502/pb
+        [279766, 279767], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 358.144/pb
+        [279794, 279794], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 223.093/pb
+        [279823, 279823], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 81.828/pb
+        [279841, 279841], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 380.359/pb
+        [279844, 279844], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 56.588/pb
+        [279887, 279887], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 73.316/pb
+        [279931, 279931], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 475.316/pb
+        [279966, 279966], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 93.011/pb
+        [279975, 279975], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 239.011/pb
+        [279993, 279994], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 30.455/pb
+        [280013, 280013], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 5.636/pb
+        [280015, 280018], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 398.79/pb
+        [280020, 280020], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 4.614/pb
+        [280024, 280024], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 41.841/pb
+        [280187, 280188], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 74.778/pb
+        [280191, 280191], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 178.951/pb
+        [280194, 280194], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 36.665/pb
+        [280242, 280242], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 147.69/pb
+        [280249, 280249], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 239.16/pb
+        [280251, 280251], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 47.176/pb
+        [280327, 280327], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 8.719/pb
+        [280330, 280330], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 185.776/pb
+        [280349, 280349], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 104.129/pb
+        [280363, 280364], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 205.282/pb
+        [280383, 280385], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 372.972/pb
+        [281613, 281613], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 9.764/pb
+        [281639, 281639], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 18.977/pb
+        [281641, 281641], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 39.268/pb
+        [281693, 281693], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 376.118/pb
+        [281707, 281707], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 214.55/pb
+        [281726, 281727], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 251.373/pb
+        [281797, 281797], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 397.836/pb
+        [281975, 281976], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 393.967/pb
+        [282033, 282035], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 26.293/pb
+        [282037, 282037], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 331.413/pb
+        [282092, 282092], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 296.762/pb
+        [282708, 282708], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 2.118/pb
+        [282710, 282710], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 0.346/pb
+        [282712, 282712], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 16.683/pb
+        [282730, 282735], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 469.07/pb
+        [282800, 282800], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 93.58/pb
+        [282807, 282807], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 70.563/pb
+        [282814, 282814], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 276.224/pb
+        [282842, 282842], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 23.509/pb
+        [282917, 282919], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 88.074/pb
+        [282922, 282923], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 66.001/pb
+        [283042, 283043], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 118.119/pb
+        [283049, 283050], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 61.072/pb
+        [283052, 283052], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 28.777/pb
+        [283059, 283059], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 98.778/pb
+        [283270, 283270], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 381.444/pb
+        [283283, 283283], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 197.444/pb
+        [283305, 283308], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 338.86/pb
+        [283353, 283353], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 191.088/pb
+        [283358, 283359], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 233.089/pb
+        [283407, 283408], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 466.833/pb
+        [283416, 283416], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 21.628/pb
+        [283453, 283453], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 123.278/pb
+        [283469, 283469], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 0.031/pb
+        [283478, 283478], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 210.23/pb
+        [283548, 283548], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 26.451/pb
+        [283680, 283682], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 102.814/pb
+        [283685, 283685], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 20.432/pb
+        [283820, 283820], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 259.058/pb
+        [283830, 283830], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 102.255/pb
+        [283834, 283835], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 20.323/pb
+        [283865, 283865], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 264.403/pb
+        [283876, 283877], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 409.447/pb
+        [283884, 283885], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 392.377/pb
+        [283933, 283934], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 309.793/pb
+        [283946, 283946], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 300.188/pb
+        [283964, 283964], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 58.698/pb
+        [284006, 284006], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 57.69/pb
+        [284014, 284014], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 47.826/pb
+        [284025, 284025], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 12.193/pb
+        [284029, 284029], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 29.941/pb
+        [284035, 284044], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 303.58/pb
+      ],
+    },
+  ],
+  '1mu' : [
+    {
+      'name'        : 'HLT_IsoMu22',
+      'unprescaled' : False, # prescaled since mid run E
+      'runs'        : [
+        [273158, 273158], # HLT_IsoMu22_v2, 50.239/pb
+        [273302, 273302], # HLT_IsoMu22_v2, 16.319/pb
+        [273402, 273406], # HLT_IsoMu22_v2, 13.589/pb
+        [273408, 273411], # HLT_IsoMu22_v2, 13.087/pb
+        [273425, 273425], # HLT_IsoMu22_v2, 26.717/pb
+        [273446, 273450], # HLT_IsoMu22_v2, 94.292/pb
+        [273492, 273494], # HLT_IsoMu22_v2, 30.924/pb
+        [273502, 273503], # HLT_IsoMu22_v2, 72.147/pb
+        [273554, 273555], # HLT_IsoMu22_v2, 38.827/pb
+        [273725, 273725], # HLT_IsoMu22_v2, 154.653/pb
+        [273728, 273728], # HLT_IsoMu22_v2, 4.897/pb
+        [273730, 273730], # HLT_IsoMu22_v2, 86.49/pb
+        [274094, 274094], # HLT_IsoMu22_v2, 9.735/pb
+        [274146, 274146], # HLT_IsoMu22_v2, 5.12/pb
+        [274157, 274157], # HLT_IsoMu22_v2, 38.994/pb
+        [274159, 274161], # HLT_IsoMu22_v2, 62.883/pb
+        [274172, 274172], # HLT_IsoMu22_v2, 5.249/pb
+        [274198, 274200], # HLT_IsoMu22_v2, 135.972/pb
+        [274240, 274241], # HLT_IsoMu22_v2, 134.472/pb
+        [274244, 274244], # HLT_IsoMu22_v2, 56.348/pb
+        [274250, 274251], # HLT_IsoMu22_v2, 159.993/pb
+        [274283, 274284], # HLT_IsoMu22_v2, 30.266/pb
+        [274286, 274286], # HLT_IsoMu22_v2, 21.668/pb
+        [274314, 274317], # HLT_IsoMu22_v2, 206.7/pb
+        [274319, 274319], # HLT_IsoMu22_v2, 27.302/pb
+        [274335, 274339], # HLT_IsoMu22_v2, 246.003/pb
+        [274344, 274345], # HLT_IsoMu22_v2, 87.68/pb
+        [274382, 274382], # HLT_IsoMu22_v2, 7.428/pb
+        [274387, 274388], # HLT_IsoMu22_v2, 312.374/pb
+        [274420, 274422], # HLT_IsoMu22_v2, 359.125/pb
+        [274440, 274442], # HLT_IsoMu22_v2, 226.466/pb
+        [274954, 274955], # HLT_IsoMu22_v3, 5.735/pb
+        [274968, 274971], # HLT_IsoMu22_v3, 422.272/pb
+        [274998, 275001], # HLT_IsoMu22_v3, 489.252/pb
+        [275059, 275059], # HLT_IsoMu22_v3, 6.094/pb
+        [275066, 275068], # HLT_IsoMu22_v3, 231.774/pb
+        [275073, 275074], # HLT_IsoMu22_v3, 144.124/pb
+        [275124, 275125], # HLT_IsoMu22_v3, 205.394/pb
+        [275282, 275284], # HLT_IsoMu22_v3, 49.295/pb
+        [275290, 275293], # HLT_IsoMu22_v3, 94.338/pb
+        [275309, 275311], # HLT_IsoMu22_v3, 411.084/pb
+        [275319, 275319], # HLT_IsoMu22_v3, 24.399/pb
+        [275337, 275338], # HLT_IsoMu22_v3, 143.358/pb
+        [275344, 275345], # HLT_IsoMu22_v3, 109.524/pb
+        [275370, 275371], # HLT_IsoMu22_v3, 145.599/pb
+        [275375, 275376], # HLT_IsoMu22_v3, 528.636/pb
+        [275657, 275659], # HLT_IsoMu22_v3, 80.874/pb
+        [275761, 275761], # HLT_IsoMu22_v3, 1.667/pb
+        [275767, 275767], # HLT_IsoMu22_v3, 0.714/pb
+        [275772, 275774], # HLT_IsoMu22_v3, 66.444/pb
+        [275776, 275778], # HLT_IsoMu22_v3, 116.898/pb
+        [275782, 275782], # HLT_IsoMu22_v3, 99.533/pb
+        [275832, 275837], # HLT_IsoMu22_v3, 441.03/pb
+        [275847, 275847], # HLT_IsoMu22_v3, 198.947/pb
+        [275886, 275886], # HLT_IsoMu22_v3, 7.581/pb
+        [275890, 275890], # HLT_IsoMu22_v3, 235.22/pb
+        [275911, 275913], # HLT_IsoMu22_v3, 201.741/pb
+        [275918, 275918], # HLT_IsoMu22_v3, 49.71/pb
+        [275920, 275921], # HLT_IsoMu22_v3, 62.257/pb
+        [275923, 275923], # HLT_IsoMu22_v3, 14.5/pb
+        [275931, 275931], # HLT_IsoMu22_v3, 10.418/pb
+        [275963, 275963], # HLT_IsoMu22_v3, 19.553/pb
+        [276092, 276092], # HLT_IsoMu22_v3, 14.768/pb
+        [276097, 276097], # HLT_IsoMu22_v3, 99.405/pb
+        [276242, 276244], # HLT_IsoMu22_v3, 479.052/pb
+        [276282, 276283], # HLT_IsoMu22_v3, 372.59/pb
+        [276315, 276315], # HLT_IsoMu22_v3, 34.051/pb
+        [276317, 276318], # HLT_IsoMu22_v3, 124.306/pb
+        [276355, 276355], # HLT_IsoMu22_v3, 6.205/pb
+        [276361, 276361], # HLT_IsoMu22_v3, 149.465/pb
+        [276363, 276363], # HLT_IsoMu22_v3, 206.376/pb
+        [276384, 276384], # HLT_IsoMu22_v3, 121.517/pb
+        [276437, 276437], # HLT_IsoMu22_v3, 355.688/pb
+        [276454, 276454], # HLT_IsoMu22_v3, 63.924/pb
+        [276458, 276458], # HLT_IsoMu22_v3, 33.169/pb
+        [276495, 276495], # HLT_IsoMu22_v3, 38.062/pb
+        [276501, 276502], # HLT_IsoMu22_v3, 486.891/pb
+        [276525, 276525], # HLT_IsoMu22_v3, 402.663/pb
+        [276527, 276528], # HLT_IsoMu22_v3, 60.758/pb
+        [276542, 276545], # HLT_IsoMu22_v3, 345.204/pb
+        [276581, 276587], # HLT_IsoMu22_v3, 471.493/pb
+        [276653, 276653], # HLT_IsoMu22_v3, 86.12/pb
+        [276655, 276655], # HLT_IsoMu22_v3, 160.843/pb
+        [276659, 276659], # HLT_IsoMu22_v3, 29.939/pb
+        [276775, 276776], # HLT_IsoMu22_v3, 443.702/pb
+        [276794, 276794], # HLT_IsoMu22_v3, 87.206/pb
+        [276807, 276808], # HLT_IsoMu22_v3, 188.301/pb
+        [276810, 276811], # HLT_IsoMu22_v3, 346.409/pb
+        [276831, 276831], # HLT_IsoMu22_v3, 400.298/pb
+        [276834, 276834], # HLT_IsoMu22_v3, 72.6/pb
+        [276870, 276870], # HLT_IsoMu22_v3, 513.042/pb
+        [276935, 276935], # HLT_IsoMu22_v3, 128.487/pb
+        [276940, 276940], # HLT_IsoMu22_v3, 16.262/pb
+        [276946, 276948], # HLT_IsoMu22_v3, 113.478/pb
+        [276950, 276950], # HLT_IsoMu22_v3, 323.179/pb
+        [277070, 277073], # HLT_IsoMu22_v3, 303.149/pb
+        [277076, 277076], # HLT_IsoMu22_v3, 125.929/pb
+        [277087, 277087], # HLT_IsoMu22_v3, 86.357/pb
+        [277094, 277094], # HLT_IsoMu22_v3, 71.944/pb
+        [277096, 277096], # HLT_IsoMu22_v3, 320.668/pb
+        [277112, 277112], # HLT_IsoMu22_v3, 12.913/pb
+        [277127, 277127], # HLT_IsoMu22_v3, 181.81/pb
+        [277148, 277148], # HLT_IsoMu22_v3, 128.17/pb
+        [277166, 277166], # HLT_IsoMu22_v3, 66.646/pb
+        [277168, 277168], # HLT_IsoMu22_v3, 317.531/pb
+        [277180, 277180], # HLT_IsoMu22_v3, 18.477/pb
+        [277194, 277194], # HLT_IsoMu22_v3, 314.183/pb
+        [277305, 277305], # HLT_IsoMu22_v3, 93.106/pb
+        [277420, 277420], # HLT_IsoMu22_v3, 25.075/pb
+        [277981, 277981], # HLT_IsoMu22_v3, 4.601/pb
+        [277991, 277992], # HLT_IsoMu22_v3, 21.386/pb
+        [278017, 278018], # HLT_IsoMu22_v3, 244.899/pb
+        [278167, 278167], # HLT_IsoMu22_v3, 314.532/pb
+        [278175, 278175], # HLT_IsoMu22_v3, 8.712/pb
+        [278193, 278193], # HLT_IsoMu22_v3, 25.283/pb
+        [278239, 278240], # HLT_IsoMu22_v3, 329.574/pb
+        [278273, 278274], # HLT_IsoMu22_v3, 22.542/pb
+        [278288, 278290], # HLT_IsoMu22_v3, 13.31/pb
+        [278308, 278308], # HLT_IsoMu22_v3, 260.311/pb
+        [278310, 278310], # HLT_IsoMu22_v3, 88.422/pb
+        [278315, 278315], # HLT_IsoMu22_v3, 104.138/pb
+        [278345, 278346], # HLT_IsoMu22_v3, 122.945/pb
+        [278349, 278349], # HLT_IsoMu22_v3, 94.737/pb
+        [278366, 278366], # HLT_IsoMu22_v3, 59.423/pb
+        [278406, 278406], # HLT_IsoMu22_v3, 210.055/pb
+        [278509, 278509], # HLT_IsoMu22_v3, 180.065/pb
+        [278770, 278770], # HLT_IsoMu22_v3, 66.171/pb
+        [278804, 278805], # HLT_IsoMu22_v3, 38.466/pb
+        [278808, 278808], # HLT_IsoMu22_v3, 269.634/pb
+        [278820, 278820], # HLT_IsoMu22_v3, 198.291/pb
+        [278822, 278822], # HLT_IsoMu22_v3, 191.158/pb
+        [278873, 278875], # HLT_IsoMu22_v3, 198.446/pb
+        [278963, 278963], # HLT_IsoMu22_v3, 14.235/pb
+        [278969, 278969], # HLT_IsoMu22_v3, 149.94/pb
+        [278975, 278976], # HLT_IsoMu22_v3, 122.556/pb
+        [279024, 279024], # HLT_IsoMu22_v3, 49.039/pb
+        [279029, 279029], # HLT_IsoMu22_v3, 38.088/pb
+        [279071, 279071], # HLT_IsoMu22_v3, 22.581/pb
+        [279080, 279080], # HLT_IsoMu22_v3, 11.815/pb
+        [279115, 279116], # HLT_IsoMu22_v3, 94.0/pb
+        [279479, 279479], # HLT_IsoMu22_v3, 5.927/pb
+        [279588, 279588], # HLT_IsoMu22_v3, 146.246/pb
+        [279654, 279654], # HLT_IsoMu22_v3, 171.798/pb
+        [279656, 279656], # HLT_IsoMu22_v3, 5.684/pb
+        [279658, 279658], # HLT_IsoMu22_v3, 93.394/pb
+        [279667, 279667], # HLT_IsoMu22_v3, 88.595/pb
+        [279694, 279694], # HLT_IsoMu22_v3, 281.611/pb
+        [279715, 279716], # HLT_IsoMu22_v3, 288.748/pb
+        [279760, 279760], # HLT_IsoMu22_v3, 25.559/pb
+        [279766, 279767], # HLT_IsoMu22_v3, 358.144/pb
+        [279794, 279794], # HLT_IsoMu22_v3, 93.563/pb
+        [279841, 279841], # HLT_IsoMu22_v3, 233.357/pb
+        [279931, 279931], # HLT_IsoMu22_v3, 374.292/pb
+        [279975, 279975], # HLT_IsoMu22_v3, 76.5/pb
+        [280015, 280018], # HLT_IsoMu22_v3, 380.44/pb
+        [280020, 280020], # HLT_IsoMu22_v3, 4.614/pb
+        [280024, 280024], # HLT_IsoMu22_v3, 41.841/pb
+        [280191, 280191], # HLT_IsoMu22_v3, 132.815/pb
+        [280194, 280194], # HLT_IsoMu22_v3, 34.566/pb
+        [280242, 280242], # HLT_IsoMu22_v3, 25.015/pb
+        [280249, 280249], # HLT_IsoMu22_v3, 239.16/pb
+        [280251, 280251], # HLT_IsoMu22_v3, 47.176/pb
+        [280330, 280330], # HLT_IsoMu22_v3, 76.827/pb
+        [280349, 280349], # HLT_IsoMu22_v3, 104.129/pb
+        [280363, 280364], # HLT_IsoMu22_v3, 204.989/pb
+        [280385, 280385], # HLT_IsoMu22_v3, 257.401/pb
+        [281613, 281613], # HLT_IsoMu22_v5, 9.154/pb
+        [281641, 281641], # HLT_IsoMu22_v5, 36.171/pb
+        [281693, 281693], # HLT_IsoMu22_v5, 278.604/pb
+        [281707, 281707], # HLT_IsoMu22_v5, 71.66/pb
+        [281726, 281727], # HLT_IsoMu22_v5, 251.373/pb
+        [281797, 281797], # HLT_IsoMu22_v5, 235.896/pb
+        [281976, 281976], # HLT_IsoMu22_v5, 270.062/pb
+        [282035, 282035], # HLT_IsoMu22_v5, 1.267/pb
+        [282037, 282037], # HLT_IsoMu22_v5, 232.526/pb
+        [282092, 282092], # HLT_IsoMu22_v5, 262.782/pb
+        [282734, 282735], # HLT_IsoMu22_v5, 294.148/pb
+        [282807, 282807], # HLT_IsoMu22_v5, 15.962/pb
+        [282814, 282814], # HLT_IsoMu22_v5, 276.224/pb
+        [282922, 282923], # HLT_IsoMu22_v5, 66.001/pb
+        [283042, 283043], # HLT_IsoMu22_v5, 18.326/pb
+        [283059, 283059], # HLT_IsoMu22_v5, 32.079/pb
+        [283270, 283270], # HLT_IsoMu22_v5, 172.582/pb
+        [283283, 283283], # HLT_IsoMu22_v5, 197.444/pb
+        [283307, 283308], # HLT_IsoMu22_v5, 193.364/pb
+        [283358, 283359], # HLT_IsoMu22_v5, 221.154/pb
+        [283408, 283408], # HLT_IsoMu22_v5, 235.64/pb
+        [283416, 283416], # HLT_IsoMu22_v5, 21.628/pb
+        [283478, 283478], # HLT_IsoMu22_v5, 26.887/pb
+        [283548, 283548], # HLT_IsoMu22_v5, 25.693/pb
+        [283682, 283682], # HLT_IsoMu22_v5, 41.97/pb
+        [283685, 283685], # HLT_IsoMu22_v5, 20.432/pb
+        [283820, 283820], # HLT_IsoMu22_v5, 259.058/pb
+        [283830, 283830], # HLT_IsoMu22_v5, 102.255/pb
+        [283834, 283835], # HLT_IsoMu22_v5, 20.323/pb
+        [283865, 283865], # HLT_IsoMu22_v5, 87.196/pb
+        [283877, 283877], # HLT_IsoMu22_v5, 232.287/pb
+        [283885, 283885], # HLT_IsoMu22_v5, 235.827/pb
+        [283934, 283934], # HLT_IsoMu22_v5, 102.456/pb
+        [283946, 283946], # HLT_IsoMu22_v5, 115.801/pb
+        [283964, 283964], # HLT_IsoMu22_v5, 58.366/pb
+        [284006, 284006], # HLT_IsoMu22_v5, 51.487/pb
+        [284014, 284014], # HLT_IsoMu22_v5, 47.826/pb
+        [284036, 284044], # HLT_IsoMu22_v5, 185.383/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoTkMu22',
+      'unprescaled' : False, # prescaled since mid run E
+      'runs'        : [
+        [273158, 273158], # HLT_IsoTkMu22_v2, 50.239/pb
+        [273302, 273302], # HLT_IsoTkMu22_v2, 16.319/pb
+        [273402, 273406], # HLT_IsoTkMu22_v2, 13.589/pb
+        [273408, 273411], # HLT_IsoTkMu22_v2, 13.087/pb
+        [273425, 273425], # HLT_IsoTkMu22_v2, 26.717/pb
+        [273446, 273450], # HLT_IsoTkMu22_v2, 94.292/pb
+        [273492, 273494], # HLT_IsoTkMu22_v2, 30.924/pb
+        [273502, 273503], # HLT_IsoTkMu22_v2, 72.147/pb
+        [273554, 273555], # HLT_IsoTkMu22_v2, 38.827/pb
+        [273725, 273725], # HLT_IsoTkMu22_v2, 154.653/pb
+        [273728, 273728], # HLT_IsoTkMu22_v2, 4.897/pb
+        [273730, 273730], # HLT_IsoTkMu22_v2, 86.49/pb
+        [274094, 274094], # HLT_IsoTkMu22_v2, 9.735/pb
+        [274146, 274146], # HLT_IsoTkMu22_v2, 5.12/pb
+        [274157, 274157], # HLT_IsoTkMu22_v2, 38.994/pb
+        [274159, 274161], # HLT_IsoTkMu22_v2, 62.883/pb
+        [274172, 274172], # HLT_IsoTkMu22_v2, 5.249/pb
+        [274198, 274200], # HLT_IsoTkMu22_v2, 135.972/pb
+        [274240, 274241], # HLT_IsoTkMu22_v2, 134.472/pb
+        [274244, 274244], # HLT_IsoTkMu22_v2, 56.348/pb
+        [274250, 274251], # HLT_IsoTkMu22_v2, 159.993/pb
+        [274283, 274284], # HLT_IsoTkMu22_v2, 30.266/pb
+        [274286, 274286], # HLT_IsoTkMu22_v2, 21.668/pb
+        [274314, 274317], # HLT_IsoTkMu22_v2, 206.7/pb
+        [274319, 274319], # HLT_IsoTkMu22_v2, 27.302/pb
+        [274335, 274339], # HLT_IsoTkMu22_v2, 246.003/pb
+        [274344, 274345], # HLT_IsoTkMu22_v2, 87.68/pb
+        [274382, 274382], # HLT_IsoTkMu22_v2, 7.428/pb
+        [274387, 274388], # HLT_IsoTkMu22_v2, 312.374/pb
+        [274420, 274422], # HLT_IsoTkMu22_v2, 359.125/pb
+        [274440, 274442], # HLT_IsoTkMu22_v2, 226.466/pb
+        [274954, 274955], # HLT_IsoTkMu22_v3, 5.735/pb
+        [274968, 274971], # HLT_IsoTkMu22_v3, 422.272/pb
+        [274998, 275001], # HLT_IsoTkMu22_v3, 489.252/pb
+        [275059, 275059], # HLT_IsoTkMu22_v3, 6.094/pb
+        [275066, 275068], # HLT_IsoTkMu22_v3, 231.774/pb
+        [275073, 275074], # HLT_IsoTkMu22_v3, 144.124/pb
+        [275124, 275125], # HLT_IsoTkMu22_v3, 205.394/pb
+        [275282, 275284], # HLT_IsoTkMu22_v3, 49.295/pb
+        [275290, 275293], # HLT_IsoTkMu22_v3, 94.338/pb
+        [275309, 275311], # HLT_IsoTkMu22_v3, 411.084/pb
+        [275319, 275319], # HLT_IsoTkMu22_v3, 24.399/pb
+        [275337, 275338], # HLT_IsoTkMu22_v3, 143.358/pb
+        [275344, 275345], # HLT_IsoTkMu22_v3, 109.524/pb
+        [275370, 275371], # HLT_IsoTkMu22_v3, 145.599/pb
+        [275375, 275376], # HLT_IsoTkMu22_v3, 528.636/pb
+        [275657, 275659], # HLT_IsoTkMu22_v4, 80.874/pb
+        [275761, 275761], # HLT_IsoTkMu22_v4, 1.667/pb
+        [275767, 275767], # HLT_IsoTkMu22_v4, 0.714/pb
+        [275772, 275774], # HLT_IsoTkMu22_v4, 66.444/pb
+        [275776, 275778], # HLT_IsoTkMu22_v4, 116.898/pb
+        [275782, 275782], # HLT_IsoTkMu22_v4, 99.533/pb
+        [275832, 275837], # HLT_IsoTkMu22_v4, 441.03/pb
+        [275847, 275847], # HLT_IsoTkMu22_v4, 198.947/pb
+        [275886, 275886], # HLT_IsoTkMu22_v4, 7.581/pb
+        [275890, 275890], # HLT_IsoTkMu22_v4, 235.22/pb
+        [275911, 275913], # HLT_IsoTkMu22_v4, 201.741/pb
+        [275918, 275918], # HLT_IsoTkMu22_v4, 49.71/pb
+        [275920, 275921], # HLT_IsoTkMu22_v4, 62.257/pb
+        [275923, 275923], # HLT_IsoTkMu22_v4, 14.5/pb
+        [275931, 275931], # HLT_IsoTkMu22_v4, 10.418/pb
+        [275963, 275963], # HLT_IsoTkMu22_v4, 19.553/pb
+        [276092, 276092], # HLT_IsoTkMu22_v4, 14.768/pb
+        [276097, 276097], # HLT_IsoTkMu22_v4, 99.405/pb
+        [276242, 276244], # HLT_IsoTkMu22_v4, 479.052/pb
+        [276282, 276283], # HLT_IsoTkMu22_v4, 372.59/pb
+        [276315, 276315], # HLT_IsoTkMu22_v4, 34.051/pb
+        [276317, 276318], # HLT_IsoTkMu22_v4, 124.306/pb
+        [276355, 276355], # HLT_IsoTkMu22_v4, 6.205/pb
+        [276361, 276361], # HLT_IsoTkMu22_v4, 149.465/pb
+        [276363, 276363], # HLT_IsoTkMu22_v4, 206.376/pb
+        [276384, 276384], # HLT_IsoTkMu22_v4, 121.517/pb
+        [276437, 276437], # HLT_IsoTkMu22_v4, 355.688/pb
+        [276454, 276454], # HLT_IsoTkMu22_v4, 63.924/pb
+        [276458, 276458], # HLT_IsoTkMu22_v4, 33.169/pb
+        [276495, 276495], # HLT_IsoTkMu22_v4, 38.062/pb
+        [276501, 276502], # HLT_IsoTkMu22_v4, 486.891/pb
+        [276525, 276525], # HLT_IsoTkMu22_v4, 402.663/pb
+        [276527, 276528], # HLT_IsoTkMu22_v4, 60.758/pb
+        [276542, 276545], # HLT_IsoTkMu22_v4, 345.204/pb
+        [276581, 276587], # HLT_IsoTkMu22_v4, 471.493/pb
+        [276653, 276653], # HLT_IsoTkMu22_v4, 86.12/pb
+        [276655, 276655], # HLT_IsoTkMu22_v4, 160.843/pb
+        [276659, 276659], # HLT_IsoTkMu22_v4, 29.939/pb
+        [276775, 276776], # HLT_IsoTkMu22_v4, 443.702/pb
+        [276794, 276794], # HLT_IsoTkMu22_v4, 87.206/pb
+        [276807, 276808], # HLT_IsoTkMu22_v4, 188.301/pb
+        [276810, 276811], # HLT_IsoTkMu22_v4, 346.409/pb
+        [276831, 276831], # HLT_IsoTkMu22_v4, 400.298/pb
+        [276834, 276834], # HLT_IsoTkMu22_v4, 72.6/pb
+        [276870, 276870], # HLT_IsoTkMu22_v4, 513.042/pb
+        [276935, 276935], # HLT_IsoTkMu22_v4, 128.487/pb
+        [276940, 276940], # HLT_IsoTkMu22_v4, 16.262/pb
+        [276946, 276948], # HLT_IsoTkMu22_v4, 113.478/pb
+        [276950, 276950], # HLT_IsoTkMu22_v4, 323.179/pb
+        [277070, 277073], # HLT_IsoTkMu22_v4, 303.149/pb
+        [277076, 277076], # HLT_IsoTkMu22_v4, 125.929/pb
+        [277087, 277087], # HLT_IsoTkMu22_v4, 86.357/pb
+        [277094, 277094], # HLT_IsoTkMu22_v4, 71.944/pb
+        [277096, 277096], # HLT_IsoTkMu22_v4, 320.668/pb
+        [277112, 277112], # HLT_IsoTkMu22_v4, 12.913/pb
+        [277127, 277127], # HLT_IsoTkMu22_v4, 181.81/pb
+        [277148, 277148], # HLT_IsoTkMu22_v4, 128.17/pb
+        [277166, 277166], # HLT_IsoTkMu22_v4, 66.646/pb
+        [277168, 277168], # HLT_IsoTkMu22_v4, 317.531/pb
+        [277180, 277180], # HLT_IsoTkMu22_v4, 18.477/pb
+        [277194, 277194], # HLT_IsoTkMu22_v4, 314.183/pb
+        [277305, 277305], # HLT_IsoTkMu22_v4, 93.106/pb
+        [277420, 277420], # HLT_IsoTkMu22_v4, 25.075/pb
+        [277981, 277981], # HLT_IsoTkMu22_v4, 4.601/pb
+        [277991, 277992], # HLT_IsoTkMu22_v4, 21.386/pb
+        [278017, 278018], # HLT_IsoTkMu22_v4, 244.899/pb
+        [278167, 278167], # HLT_IsoTkMu22_v4, 314.532/pb
+        [278175, 278175], # HLT_IsoTkMu22_v4, 8.712/pb
+        [278193, 278193], # HLT_IsoTkMu22_v4, 25.283/pb
+        [278239, 278240], # HLT_IsoTkMu22_v4, 329.574/pb
+        [278273, 278274], # HLT_IsoTkMu22_v4, 22.542/pb
+        [278288, 278290], # HLT_IsoTkMu22_v4, 13.31/pb
+        [278308, 278308], # HLT_IsoTkMu22_v4, 260.311/pb
+        [278310, 278310], # HLT_IsoTkMu22_v4, 88.422/pb
+        [278315, 278315], # HLT_IsoTkMu22_v4, 104.138/pb
+        [278345, 278346], # HLT_IsoTkMu22_v4, 122.945/pb
+        [278349, 278349], # HLT_IsoTkMu22_v4, 94.737/pb
+        [278366, 278366], # HLT_IsoTkMu22_v4, 59.423/pb
+        [278406, 278406], # HLT_IsoTkMu22_v4, 210.055/pb
+        [278509, 278509], # HLT_IsoTkMu22_v4, 180.065/pb
+        [278770, 278770], # HLT_IsoTkMu22_v4, 66.171/pb
+        [278804, 278805], # HLT_IsoTkMu22_v4, 38.466/pb
+        [278808, 278808], # HLT_IsoTkMu22_v4, 269.634/pb
+        [278820, 278820], # HLT_IsoTkMu22_v4, 198.291/pb
+        [278822, 278822], # HLT_IsoTkMu22_v4, 191.158/pb
+        [278873, 278875], # HLT_IsoTkMu22_v4, 198.446/pb
+        [278963, 278963], # HLT_IsoTkMu22_v4, 14.235/pb
+        [278969, 278969], # HLT_IsoTkMu22_v4, 149.94/pb
+        [278975, 278976], # HLT_IsoTkMu22_v4, 122.556/pb
+        [279024, 279024], # HLT_IsoTkMu22_v4, 49.039/pb
+        [279029, 279029], # HLT_IsoTkMu22_v4, 38.088/pb
+        [279071, 279071], # HLT_IsoTkMu22_v4, 22.581/pb
+        [279080, 279080], # HLT_IsoTkMu22_v4, 11.815/pb
+        [279115, 279116], # HLT_IsoTkMu22_v4, 94.0/pb
+        [279479, 279479], # HLT_IsoTkMu22_v4, 5.927/pb
+        [279588, 279588], # HLT_IsoTkMu22_v4, 146.246/pb
+        [279654, 279654], # HLT_IsoTkMu22_v4, 171.798/pb
+        [279656, 279656], # HLT_IsoTkMu22_v4, 5.684/pb
+        [279658, 279658], # HLT_IsoTkMu22_v4, 93.394/pb
+        [279667, 279667], # HLT_IsoTkMu22_v4, 88.595/pb
+        [279694, 279694], # HLT_IsoTkMu22_v4, 281.611/pb
+        [279715, 279716], # HLT_IsoTkMu22_v4, 288.748/pb
+        [279760, 279760], # HLT_IsoTkMu22_v4, 25.559/pb
+        [279766, 279767], # HLT_IsoTkMu22_v4, 358.144/pb
+        [279794, 279794], # HLT_IsoTkMu22_v4, 93.563/pb
+        [279841, 279841], # HLT_IsoTkMu22_v4, 233.357/pb
+        [279931, 279931], # HLT_IsoTkMu22_v4, 374.292/pb
+        [279975, 279975], # HLT_IsoTkMu22_v4, 76.5/pb
+        [280015, 280018], # HLT_IsoTkMu22_v4, 380.44/pb
+        [280020, 280020], # HLT_IsoTkMu22_v4, 4.614/pb
+        [280024, 280024], # HLT_IsoTkMu22_v4, 41.841/pb
+        [280191, 280191], # HLT_IsoTkMu22_v4, 132.815/pb
+        [280194, 280194], # HLT_IsoTkMu22_v4, 34.566/pb
+        [280242, 280242], # HLT_IsoTkMu22_v4, 25.015/pb
+        [280249, 280249], # HLT_IsoTkMu22_v4, 239.16/pb
+        [280251, 280251], # HLT_IsoTkMu22_v4, 47.176/pb
+        [280330, 280330], # HLT_IsoTkMu22_v4, 76.827/pb
+        [280349, 280349], # HLT_IsoTkMu22_v4, 104.129/pb
+        [280363, 280364], # HLT_IsoTkMu22_v4, 204.989/pb
+        [280385, 280385], # HLT_IsoTkMu22_v4, 257.401/pb
+        [281613, 281613], # HLT_IsoTkMu22_v5, 9.154/pb
+        [281641, 281641], # HLT_IsoTkMu22_v5, 36.171/pb
+        [281693, 281693], # HLT_IsoTkMu22_v5, 278.604/pb
+        [281707, 281707], # HLT_IsoTkMu22_v5, 71.66/pb
+        [281726, 281727], # HLT_IsoTkMu22_v5, 251.373/pb
+        [281797, 281797], # HLT_IsoTkMu22_v5, 235.896/pb
+        [281976, 281976], # HLT_IsoTkMu22_v5, 270.062/pb
+        [282035, 282035], # HLT_IsoTkMu22_v5, 1.267/pb
+        [282037, 282037], # HLT_IsoTkMu22_v5, 232.526/pb
+        [282092, 282092], # HLT_IsoTkMu22_v5, 262.782/pb
+        [282734, 282735], # HLT_IsoTkMu22_v5, 294.148/pb
+        [282807, 282807], # HLT_IsoTkMu22_v5, 15.962/pb
+        [282814, 282814], # HLT_IsoTkMu22_v5, 276.224/pb
+        [282922, 282923], # HLT_IsoTkMu22_v5, 66.001/pb
+        [283042, 283043], # HLT_IsoTkMu22_v5, 18.326/pb
+        [283059, 283059], # HLT_IsoTkMu22_v5, 32.079/pb
+        [283270, 283270], # HLT_IsoTkMu22_v5, 172.582/pb
+        [283283, 283283], # HLT_IsoTkMu22_v5, 197.444/pb
+        [283307, 283308], # HLT_IsoTkMu22_v5, 193.364/pb
+        [283358, 283359], # HLT_IsoTkMu22_v5, 221.154/pb
+        [283408, 283408], # HLT_IsoTkMu22_v5, 235.64/pb
+        [283416, 283416], # HLT_IsoTkMu22_v5, 21.628/pb
+        [283478, 283478], # HLT_IsoTkMu22_v5, 26.887/pb
+        [283548, 283548], # HLT_IsoTkMu22_v5, 25.693/pb
+        [283682, 283682], # HLT_IsoTkMu22_v5, 41.97/pb
+        [283685, 283685], # HLT_IsoTkMu22_v5, 20.432/pb
+        [283820, 283820], # HLT_IsoTkMu22_v5, 259.058/pb
+        [283830, 283830], # HLT_IsoTkMu22_v5, 102.255/pb
+        [283834, 283835], # HLT_IsoTkMu22_v5, 20.323/pb
+        [283865, 283865], # HLT_IsoTkMu22_v5, 87.196/pb
+        [283877, 283877], # HLT_IsoTkMu22_v5, 232.287/pb
+        [283885, 283885], # HLT_IsoTkMu22_v5, 235.827/pb
+        [283934, 283934], # HLT_IsoTkMu22_v5, 102.456/pb
+        [283946, 283946], # HLT_IsoTkMu22_v5, 115.801/pb
+        [283964, 283964], # HLT_IsoTkMu22_v5, 58.366/pb
+        [284006, 284006], # HLT_IsoTkMu22_v5, 51.487/pb
+        [284014, 284014], # HLT_IsoTkMu22_v5, 47.826/pb
+        [284036, 284044], # HLT_IsoTkMu22_v5, 185.383/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoMu22_eta2p1',
+      'unprescaled' : True, # introduced mid run B
+      'runs'        : [
+        [274954, 274955], # HLT_IsoMu22_eta2p1_v2, 5.735/pb
+        [274968, 274971], # HLT_IsoMu22_eta2p1_v2, 422.272/pb
+        [274998, 275001], # HLT_IsoMu22_eta2p1_v2, 489.252/pb
+        [275059, 275059], # HLT_IsoMu22_eta2p1_v2, 6.094/pb
+        [275066, 275068], # HLT_IsoMu22_eta2p1_v2, 231.774/pb
+        [275073, 275074], # HLT_IsoMu22_eta2p1_v2, 144.124/pb
+        [275124, 275125], # HLT_IsoMu22_eta2p1_v2, 205.394/pb
+        [275282, 275284], # HLT_IsoMu22_eta2p1_v2, 49.295/pb
+        [275290, 275293], # HLT_IsoMu22_eta2p1_v2, 94.338/pb
+        [275309, 275311], # HLT_IsoMu22_eta2p1_v2, 411.084/pb
+        [275319, 275319], # HLT_IsoMu22_eta2p1_v2, 24.399/pb
+        [275337, 275338], # HLT_IsoMu22_eta2p1_v2, 143.358/pb
+        [275344, 275345], # HLT_IsoMu22_eta2p1_v2, 109.524/pb
+        [275370, 275371], # HLT_IsoMu22_eta2p1_v2, 145.599/pb
+        [275375, 275376], # HLT_IsoMu22_eta2p1_v2, 528.636/pb
+        [275657, 275659], # HLT_IsoMu22_eta2p1_v2, 80.874/pb
+        [275761, 275761], # HLT_IsoMu22_eta2p1_v2, 1.667/pb
+        [275767, 275767], # HLT_IsoMu22_eta2p1_v2, 0.714/pb
+        [275772, 275774], # HLT_IsoMu22_eta2p1_v2, 66.444/pb
+        [275776, 275778], # HLT_IsoMu22_eta2p1_v2, 116.898/pb
+        [275782, 275782], # HLT_IsoMu22_eta2p1_v2, 99.533/pb
+        [275832, 275837], # HLT_IsoMu22_eta2p1_v2, 441.03/pb
+        [275847, 275847], # HLT_IsoMu22_eta2p1_v2, 198.947/pb
+        [275886, 275886], # HLT_IsoMu22_eta2p1_v2, 7.581/pb
+        [275890, 275890], # HLT_IsoMu22_eta2p1_v2, 235.22/pb
+        [275911, 275913], # HLT_IsoMu22_eta2p1_v2, 201.741/pb
+        [275918, 275918], # HLT_IsoMu22_eta2p1_v2, 49.71/pb
+        [275920, 275921], # HLT_IsoMu22_eta2p1_v2, 62.257/pb
+        [275923, 275923], # HLT_IsoMu22_eta2p1_v2, 14.5/pb
+        [275931, 275931], # HLT_IsoMu22_eta2p1_v2, 10.418/pb
+        [275963, 275963], # HLT_IsoMu22_eta2p1_v2, 19.553/pb
+        [276092, 276092], # HLT_IsoMu22_eta2p1_v2, 14.768/pb
+        [276097, 276097], # HLT_IsoMu22_eta2p1_v2, 99.405/pb
+        [276242, 276244], # HLT_IsoMu22_eta2p1_v2, 479.052/pb
+        [276282, 276283], # HLT_IsoMu22_eta2p1_v2, 372.59/pb
+        [276315, 276315], # HLT_IsoMu22_eta2p1_v2, 34.051/pb
+        [276317, 276318], # HLT_IsoMu22_eta2p1_v2, 124.306/pb
+        [276355, 276355], # HLT_IsoMu22_eta2p1_v2, 6.205/pb
+        [276361, 276361], # HLT_IsoMu22_eta2p1_v2, 149.465/pb
+        [276363, 276363], # HLT_IsoMu22_eta2p1_v2, 206.376/pb
+        [276384, 276384], # HLT_IsoMu22_eta2p1_v2, 121.517/pb
+        [276437, 276437], # HLT_IsoMu22_eta2p1_v2, 355.688/pb
+        [276454, 276454], # HLT_IsoMu22_eta2p1_v2, 63.924/pb
+        [276458, 276458], # HLT_IsoMu22_eta2p1_v2, 33.169/pb
+        [276495, 276495], # HLT_IsoMu22_eta2p1_v2, 38.062/pb
+        [276501, 276502], # HLT_IsoMu22_eta2p1_v2, 486.891/pb
+        [276525, 276525], # HLT_IsoMu22_eta2p1_v2, 402.663/pb
+        [276527, 276528], # HLT_IsoMu22_eta2p1_v2, 60.758/pb
+        [276542, 276545], # HLT_IsoMu22_eta2p1_v2, 345.204/pb
+        [276581, 276587], # HLT_IsoMu22_eta2p1_v2, 471.493/pb
+        [276653, 276653], # HLT_IsoMu22_eta2p1_v2, 86.12/pb
+        [276655, 276655], # HLT_IsoMu22_eta2p1_v2, 160.843/pb
+        [276659, 276659], # HLT_IsoMu22_eta2p1_v2, 29.939/pb
+        [276775, 276776], # HLT_IsoMu22_eta2p1_v2, 443.702/pb
+        [276794, 276794], # HLT_IsoMu22_eta2p1_v2, 87.206/pb
+        [276807, 276808], # HLT_IsoMu22_eta2p1_v2, 188.301/pb
+        [276810, 276811], # HLT_IsoMu22_eta2p1_v2, 346.409/pb
+        [276831, 276831], # HLT_IsoMu22_eta2p1_v2, 400.298/pb
+        [276834, 276834], # HLT_IsoMu22_eta2p1_v2, 72.6/pb
+        [276870, 276870], # HLT_IsoMu22_eta2p1_v2, 526.587/pb
+        [276935, 276935], # HLT_IsoMu22_eta2p1_v2, 169.998/pb
+        [276940, 276940], # HLT_IsoMu22_eta2p1_v2, 28.701/pb
+        [276946, 276948], # HLT_IsoMu22_eta2p1_v2, 114.81/pb
+        [276950, 276950], # HLT_IsoMu22_eta2p1_v2, 323.179/pb
+        [277069, 277073], # HLT_IsoMu22_eta2p1_v2, 390.296/pb
+        [277076, 277076], # HLT_IsoMu22_eta2p1_v2, 125.929/pb
+        [277087, 277087], # HLT_IsoMu22_eta2p1_v2, 86.357/pb
+        [277094, 277094], # HLT_IsoMu22_eta2p1_v2, 131.103/pb
+        [277096, 277096], # HLT_IsoMu22_eta2p1_v2, 320.668/pb
+        [277112, 277112], # HLT_IsoMu22_eta2p1_v2, 17.339/pb
+        [277126, 277127], # HLT_IsoMu22_eta2p1_v2, 185.976/pb
+        [277148, 277148], # HLT_IsoMu22_eta2p1_v2, 128.192/pb
+        [277166, 277166], # HLT_IsoMu22_eta2p1_v2, 70.666/pb
+        [277168, 277168], # HLT_IsoMu22_eta2p1_v2, 318.998/pb
+        [277180, 277180], # HLT_IsoMu22_eta2p1_v2, 31.25/pb
+        [277194, 277194], # HLT_IsoMu22_eta2p1_v2, 367.175/pb
+        [277305, 277305], # HLT_IsoMu22_eta2p1_v2, 154.262/pb
+        [277420, 277420], # HLT_IsoMu22_eta2p1_v2, 60.844/pb
+        [277981, 277981], # HLT_IsoMu22_eta2p1_v2, 4.601/pb
+        [277991, 277992], # HLT_IsoMu22_eta2p1_v2, 21.692/pb
+        [278017, 278018], # HLT_IsoMu22_eta2p1_v2, 338.894/pb
+        [278167, 278167], # HLT_IsoMu22_eta2p1_v2, 314.532/pb
+        [278175, 278175], # HLT_IsoMu22_eta2p1_v2, 9.045/pb
+        [278193, 278193], # HLT_IsoMu22_eta2p1_v2, 34.581/pb
+        [278239, 278240], # HLT_IsoMu22_eta2p1_v2, 330.009/pb
+        [278273, 278274], # HLT_IsoMu22_eta2p1_v2, 23.87/pb
+        [278288, 278290], # HLT_IsoMu22_eta2p1_v2, 14.747/pb
+        [278308, 278308], # HLT_IsoMu22_eta2p1_v2, 313.102/pb
+        [278310, 278310], # HLT_IsoMu22_eta2p1_v2, 88.422/pb
+        [278315, 278315], # HLT_IsoMu22_eta2p1_v2, 137.45/pb
+        [278345, 278346], # HLT_IsoMu22_eta2p1_v2, 171.231/pb
+        [278349, 278349], # HLT_IsoMu22_eta2p1_v2, 94.737/pb
+        [278366, 278366], # HLT_IsoMu22_eta2p1_v2, 59.423/pb
+        [278406, 278406], # HLT_IsoMu22_eta2p1_v2, 296.962/pb
+        [278509, 278509], # HLT_IsoMu22_eta2p1_v2, 273.442/pb
+        [278769, 278770], # HLT_IsoMu22_eta2p1_v2, 170.993/pb
+        [278801, 278805], # HLT_IsoMu22_eta2p1_v2, 137.142/pb
+        [278808, 278808], # HLT_IsoMu22_eta2p1_v2, 269.634/pb
+        [278820, 278820], # HLT_IsoMu22_eta2p1_v2, 286.511/pb
+        [278822, 278822], # HLT_IsoMu22_eta2p1_v2, 191.158/pb
+        [278873, 278875], # HLT_IsoMu22_eta2p1_v2, 198.657/pb
+        [278923, 278923], # HLT_IsoMu22_eta2p1_v2, 98.543/pb
+        [278957, 278957], # HLT_IsoMu22_eta2p1_v2, 36.164/pb
+        [278962, 278963], # HLT_IsoMu22_eta2p1_v2, 113.024/pb
+        [278969, 278969], # HLT_IsoMu22_eta2p1_v2, 282.492/pb
+        [278975, 278976], # HLT_IsoMu22_eta2p1_v2, 122.556/pb
+        [278986, 278986], # HLT_IsoMu22_eta2p1_v2, 31.548/pb
+        [279024, 279024], # HLT_IsoMu22_eta2p1_v2, 49.596/pb
+        [279029, 279029], # HLT_IsoMu22_eta2p1_v2, 38.088/pb
+        [279071, 279071], # HLT_IsoMu22_eta2p1_v2, 22.581/pb
+        [279080, 279080], # HLT_IsoMu22_eta2p1_v2, 12.773/pb
+        [279115, 279116], # HLT_IsoMu22_eta2p1_v2, 174.938/pb
+        [279479, 279479], # HLT_IsoMu22_eta2p1_v2, 5.927/pb
+        [279588, 279588], # HLT_IsoMu22_eta2p1_v2, 228.517/pb
+        [279653, 279654], # HLT_IsoMu22_eta2p1_v2, 283.775/pb
+        [279656, 279656], # HLT_IsoMu22_eta2p1_v2, 5.684/pb
+        [279658, 279658], # HLT_IsoMu22_eta2p1_v2, 93.394/pb
+        [279667, 279667], # HLT_IsoMu22_eta2p1_v2, 208.732/pb
+        [279681, 279685], # HLT_IsoMu22_eta2p1_v2, 74.528/pb
+        [279691, 279691], # HLT_IsoMu22_eta2p1_v2, 9.656/pb
+        [279694, 279694], # HLT_IsoMu22_eta2p1_v2, 406.418/pb
+        [279715, 279716], # HLT_IsoMu22_eta2p1_v2, 383.763/pb
+        [279760, 279760], # HLT_IsoMu22_eta2p1_v2, 153.502/pb
+        [279766, 279767], # HLT_IsoMu22_eta2p1_v2, 358.144/pb
+        [279794, 279794], # HLT_IsoMu22_eta2p1_v2, 223.093/pb
+        [279823, 279823], # HLT_IsoMu22_eta2p1_v2, 81.828/pb
+        [279841, 279841], # HLT_IsoMu22_eta2p1_v2, 380.359/pb
+        [279844, 279844], # HLT_IsoMu22_eta2p1_v2, 56.588/pb
+        [279887, 279887], # HLT_IsoMu22_eta2p1_v2, 73.316/pb
+        [279931, 279931], # HLT_IsoMu22_eta2p1_v2, 475.316/pb
+        [279966, 279966], # HLT_IsoMu22_eta2p1_v2, 93.011/pb
+        [279975, 279975], # HLT_IsoMu22_eta2p1_v2, 239.011/pb
+        [279993, 279994], # HLT_IsoMu22_eta2p1_v2, 30.455/pb
+        [280013, 280013], # HLT_IsoMu22_eta2p1_v2, 5.636/pb
+        [280015, 280018], # HLT_IsoMu22_eta2p1_v2, 398.79/pb
+        [280020, 280020], # HLT_IsoMu22_eta2p1_v2, 4.614/pb
+        [280024, 280024], # HLT_IsoMu22_eta2p1_v2, 41.841/pb
+        [280187, 280188], # HLT_IsoMu22_eta2p1_v2, 74.778/pb
+        [280191, 280191], # HLT_IsoMu22_eta2p1_v2, 178.951/pb
+        [280194, 280194], # HLT_IsoMu22_eta2p1_v2, 36.665/pb
+        [280242, 280242], # HLT_IsoMu22_eta2p1_v2, 147.69/pb
+        [280249, 280249], # HLT_IsoMu22_eta2p1_v2, 239.16/pb
+        [280251, 280251], # HLT_IsoMu22_eta2p1_v2, 47.176/pb
+        [280327, 280327], # HLT_IsoMu22_eta2p1_v2, 8.719/pb
+        [280330, 280330], # HLT_IsoMu22_eta2p1_v2, 185.776/pb
+        [280349, 280349], # HLT_IsoMu22_eta2p1_v2, 104.129/pb
+        [280363, 280364], # HLT_IsoMu22_eta2p1_v2, 205.282/pb
+        [280383, 280385], # HLT_IsoMu22_eta2p1_v2, 372.972/pb
+        [281613, 281613], # HLT_IsoMu22_eta2p1_v4, 9.764/pb
+        [281639, 281639], # HLT_IsoMu22_eta2p1_v4, 18.977/pb
+        [281641, 281641], # HLT_IsoMu22_eta2p1_v4, 39.268/pb
+        [281693, 281693], # HLT_IsoMu22_eta2p1_v4, 376.118/pb
+        [281707, 281707], # HLT_IsoMu22_eta2p1_v4, 214.55/pb
+        [281726, 281727], # HLT_IsoMu22_eta2p1_v4, 251.373/pb
+        [281797, 281797], # HLT_IsoMu22_eta2p1_v4, 397.836/pb
+        [281975, 281976], # HLT_IsoMu22_eta2p1_v4, 393.967/pb
+        [282033, 282035], # HLT_IsoMu22_eta2p1_v4, 26.293/pb
+        [282037, 282037], # HLT_IsoMu22_eta2p1_v4, 331.413/pb
+        [282092, 282092], # HLT_IsoMu22_eta2p1_v4, 296.762/pb
+        [282708, 282708], # HLT_IsoMu22_eta2p1_v4, 2.118/pb
+        [282710, 282710], # HLT_IsoMu22_eta2p1_v4, 0.346/pb
+        [282712, 282712], # HLT_IsoMu22_eta2p1_v4, 16.683/pb
+        [282730, 282735], # HLT_IsoMu22_eta2p1_v4, 469.07/pb
+        [282800, 282800], # HLT_IsoMu22_eta2p1_v4, 93.58/pb
+        [282807, 282807], # HLT_IsoMu22_eta2p1_v4, 70.563/pb
+        [282814, 282814], # HLT_IsoMu22_eta2p1_v4, 276.224/pb
+        [282842, 282842], # HLT_IsoMu22_eta2p1_v4, 23.509/pb
+        [282917, 282919], # HLT_IsoMu22_eta2p1_v4, 88.074/pb
+        [282922, 282923], # HLT_IsoMu22_eta2p1_v4, 66.001/pb
+        [283042, 283043], # HLT_IsoMu22_eta2p1_v4, 118.119/pb
+        [283049, 283050], # HLT_IsoMu22_eta2p1_v4, 61.072/pb
+        [283052, 283052], # HLT_IsoMu22_eta2p1_v4, 28.777/pb
+        [283059, 283059], # HLT_IsoMu22_eta2p1_v4, 98.778/pb
+        [283270, 283270], # HLT_IsoMu22_eta2p1_v4, 381.444/pb
+        [283283, 283283], # HLT_IsoMu22_eta2p1_v4, 197.444/pb
+        [283305, 283308], # HLT_IsoMu22_eta2p1_v4, 338.86/pb
+        [283353, 283353], # HLT_IsoMu22_eta2p1_v4, 191.088/pb
+        [283358, 283359], # HLT_IsoMu22_eta2p1_v4, 233.089/pb
+        [283407, 283408], # HLT_IsoMu22_eta2p1_v4, 466.833/pb
+        [283416, 283416], # HLT_IsoMu22_eta2p1_v4, 21.628/pb
+        [283453, 283453], # HLT_IsoMu22_eta2p1_v4, 123.278/pb
+        [283469, 283469], # HLT_IsoMu22_eta2p1_v4, 0.031/pb
+        [283478, 283478], # HLT_IsoMu22_eta2p1_v4, 210.23/pb
+        [283548, 283548], # HLT_IsoMu22_eta2p1_v4, 26.451/pb
+        [283680, 283682], # HLT_IsoMu22_eta2p1_v4, 102.814/pb
+        [283685, 283685], # HLT_IsoMu22_eta2p1_v4, 20.432/pb
+        [283820, 283820], # HLT_IsoMu22_eta2p1_v4, 259.058/pb
+        [283830, 283830], # HLT_IsoMu22_eta2p1_v4, 102.255/pb
+        [283834, 283835], # HLT_IsoMu22_eta2p1_v4, 20.323/pb
+        [283865, 283865], # HLT_IsoMu22_eta2p1_v4, 264.403/pb
+        [283876, 283877], # HLT_IsoMu22_eta2p1_v4, 409.447/pb
+        [283884, 283885], # HLT_IsoMu22_eta2p1_v4, 392.377/pb
+        [283933, 283934], # HLT_IsoMu22_eta2p1_v4, 309.793/pb
+        [283946, 283946], # HLT_IsoMu22_eta2p1_v4, 300.188/pb
+        [283964, 283964], # HLT_IsoMu22_eta2p1_v4, 58.698/pb
+        [284006, 284006], # HLT_IsoMu22_eta2p1_v4, 57.69/pb
+        [284014, 284014], # HLT_IsoMu22_eta2p1_v4, 47.826/pb
+        [284025, 284025], # HLT_IsoMu22_eta2p1_v4, 12.193/pb
+        [284029, 284029], # HLT_IsoMu22_eta2p1_v4, 29.941/pb
+        [284035, 284044], # HLT_IsoMu22_eta2p1_v4, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoTkMu22_eta2p1',
+      'unprescaled' : True, # introduced mid run B
+      'runs'        : [
+        [274954, 274955], # HLT_IsoTkMu22_eta2p1_v2, 5.735/pb
+        [274968, 274971], # HLT_IsoTkMu22_eta2p1_v2, 422.272/pb
+        [274998, 275001], # HLT_IsoTkMu22_eta2p1_v2, 489.252/pb
+        [275059, 275059], # HLT_IsoTkMu22_eta2p1_v2, 6.094/pb
+        [275066, 275068], # HLT_IsoTkMu22_eta2p1_v2, 231.774/pb
+        [275073, 275074], # HLT_IsoTkMu22_eta2p1_v2, 144.124/pb
+        [275124, 275125], # HLT_IsoTkMu22_eta2p1_v2, 205.394/pb
+        [275282, 275284], # HLT_IsoTkMu22_eta2p1_v2, 49.295/pb
+        [275290, 275293], # HLT_IsoTkMu22_eta2p1_v2, 94.338/pb
+        [275309, 275311], # HLT_IsoTkMu22_eta2p1_v2, 411.084/pb
+        [275319, 275319], # HLT_IsoTkMu22_eta2p1_v2, 24.399/pb
+        [275337, 275338], # HLT_IsoTkMu22_eta2p1_v2, 143.358/pb
+        [275344, 275345], # HLT_IsoTkMu22_eta2p1_v2, 109.524/pb
+        [275370, 275371], # HLT_IsoTkMu22_eta2p1_v2, 145.599/pb
+        [275375, 275376], # HLT_IsoTkMu22_eta2p1_v2, 528.636/pb
+        [275657, 275659], # HLT_IsoTkMu22_eta2p1_v3, 80.874/pb
+        [275761, 275761], # HLT_IsoTkMu22_eta2p1_v3, 1.667/pb
+        [275767, 275767], # HLT_IsoTkMu22_eta2p1_v3, 0.714/pb
+        [275772, 275774], # HLT_IsoTkMu22_eta2p1_v3, 66.444/pb
+        [275776, 275778], # HLT_IsoTkMu22_eta2p1_v3, 116.898/pb
+        [275782, 275782], # HLT_IsoTkMu22_eta2p1_v3, 99.533/pb
+        [275832, 275837], # HLT_IsoTkMu22_eta2p1_v3, 441.03/pb
+        [275847, 275847], # HLT_IsoTkMu22_eta2p1_v3, 198.947/pb
+        [275886, 275886], # HLT_IsoTkMu22_eta2p1_v3, 7.581/pb
+        [275890, 275890], # HLT_IsoTkMu22_eta2p1_v3, 235.22/pb
+        [275911, 275913], # HLT_IsoTkMu22_eta2p1_v3, 201.741/pb
+        [275918, 275918], # HLT_IsoTkMu22_eta2p1_v3, 49.71/pb
+        [275920, 275921], # HLT_IsoTkMu22_eta2p1_v3, 62.257/pb
+        [275923, 275923], # HLT_IsoTkMu22_eta2p1_v3, 14.5/pb
+        [275931, 275931], # HLT_IsoTkMu22_eta2p1_v3, 10.418/pb
+        [275963, 275963], # HLT_IsoTkMu22_eta2p1_v3, 19.553/pb
+        [276092, 276092], # HLT_IsoTkMu22_eta2p1_v3, 14.768/pb
+        [276097, 276097], # HLT_IsoTkMu22_eta2p1_v3, 99.405/pb
+        [276242, 276244], # HLT_IsoTkMu22_eta2p1_v3, 479.052/pb
+        [276282, 276283], # HLT_IsoTkMu22_eta2p1_v3, 372.59/pb
+        [276315, 276315], # HLT_IsoTkMu22_eta2p1_v3, 34.051/pb
+        [276317, 276318], # HLT_IsoTkMu22_eta2p1_v3, 124.306/pb
+        [276355, 276355], # HLT_IsoTkMu22_eta2p1_v3, 6.205/pb
+        [276361, 276361], # HLT_IsoTkMu22_eta2p1_v3, 149.465/pb
+        [276363, 276363], # HLT_IsoTkMu22_eta2p1_v3, 206.376/pb
+        [276384, 276384], # HLT_IsoTkMu22_eta2p1_v3, 121.517/pb
+        [276437, 276437], # HLT_IsoTkMu22_eta2p1_v3, 355.688/pb
+        [276454, 276454], # HLT_IsoTkMu22_eta2p1_v3, 63.924/pb
+        [276458, 276458], # HLT_IsoTkMu22_eta2p1_v3, 33.169/pb
+        [276495, 276495], # HLT_IsoTkMu22_eta2p1_v3, 38.062/pb
+        [276501, 276502], # HLT_IsoTkMu22_eta2p1_v3, 486.891/pb
+        [276525, 276525], # HLT_IsoTkMu22_eta2p1_v3, 402.663/pb
+        [276527, 276528], # HLT_IsoTkMu22_eta2p1_v3, 60.758/pb
+        [276542, 276545], # HLT_IsoTkMu22_eta2p1_v3, 345.204/pb
+        [276581, 276587], # HLT_IsoTkMu22_eta2p1_v3, 471.493/pb
+        [276653, 276653], # HLT_IsoTkMu22_eta2p1_v3, 86.12/pb
+        [276655, 276655], # HLT_IsoTkMu22_eta2p1_v3, 160.843/pb
+        [276659, 276659], # HLT_IsoTkMu22_eta2p1_v3, 29.939/pb
+        [276775, 276776], # HLT_IsoTkMu22_eta2p1_v3, 443.702/pb
+        [276794, 276794], # HLT_IsoTkMu22_eta2p1_v3, 87.206/pb
+        [276807, 276808], # HLT_IsoTkMu22_eta2p1_v3, 188.301/pb
+        [276810, 276811], # HLT_IsoTkMu22_eta2p1_v3, 346.409/pb
+        [276831, 276831], # HLT_IsoTkMu22_eta2p1_v3, 400.298/pb
+        [276834, 276834], # HLT_IsoTkMu22_eta2p1_v3, 72.6/pb
+        [276870, 276870], # HLT_IsoTkMu22_eta2p1_v3, 526.587/pb
+        [276935, 276935], # HLT_IsoTkMu22_eta2p1_v3, 169.998/pb
+        [276940, 276940], # HLT_IsoTkMu22_eta2p1_v3, 28.701/pb
+        [276946, 276948], # HLT_IsoTkMu22_eta2p1_v3, 114.81/pb
+        [276950, 276950], # HLT_IsoTkMu22_eta2p1_v3, 323.179/pb
+        [277069, 277073], # HLT_IsoTkMu22_eta2p1_v3, 390.296/pb
+        [277076, 277076], # HLT_IsoTkMu22_eta2p1_v3, 125.929/pb
+        [277087, 277087], # HLT_IsoTkMu22_eta2p1_v3, 86.357/pb
+        [277094, 277094], # HLT_IsoTkMu22_eta2p1_v3, 131.103/pb
+        [277096, 277096], # HLT_IsoTkMu22_eta2p1_v3, 320.668/pb
+        [277112, 277112], # HLT_IsoTkMu22_eta2p1_v3, 17.339/pb
+        [277126, 277127], # HLT_IsoTkMu22_eta2p1_v3, 185.976/pb
+        [277148, 277148], # HLT_IsoTkMu22_eta2p1_v3, 128.192/pb
+        [277166, 277166], # HLT_IsoTkMu22_eta2p1_v3, 70.666/pb
+        [277168, 277168], # HLT_IsoTkMu22_eta2p1_v3, 318.998/pb
+        [277180, 277180], # HLT_IsoTkMu22_eta2p1_v3, 31.25/pb
+        [277194, 277194], # HLT_IsoTkMu22_eta2p1_v3, 367.175/pb
+        [277305, 277305], # HLT_IsoTkMu22_eta2p1_v3, 154.262/pb
+        [277420, 277420], # HLT_IsoTkMu22_eta2p1_v3, 60.844/pb
+        [277981, 277981], # HLT_IsoTkMu22_eta2p1_v3, 4.601/pb
+        [277991, 277992], # HLT_IsoTkMu22_eta2p1_v3, 21.692/pb
+        [278017, 278018], # HLT_IsoTkMu22_eta2p1_v3, 338.894/pb
+        [278167, 278167], # HLT_IsoTkMu22_eta2p1_v3, 314.532/pb
+        [278175, 278175], # HLT_IsoTkMu22_eta2p1_v3, 9.045/pb
+        [278193, 278193], # HLT_IsoTkMu22_eta2p1_v3, 34.581/pb
+        [278239, 278240], # HLT_IsoTkMu22_eta2p1_v3, 330.009/pb
+        [278273, 278274], # HLT_IsoTkMu22_eta2p1_v3, 23.87/pb
+        [278288, 278290], # HLT_IsoTkMu22_eta2p1_v3, 14.747/pb
+        [278308, 278308], # HLT_IsoTkMu22_eta2p1_v3, 313.102/pb
+        [278310, 278310], # HLT_IsoTkMu22_eta2p1_v3, 88.422/pb
+        [278315, 278315], # HLT_IsoTkMu22_eta2p1_v3, 137.45/pb
+        [278345, 278346], # HLT_IsoTkMu22_eta2p1_v3, 171.231/pb
+        [278349, 278349], # HLT_IsoTkMu22_eta2p1_v3, 94.737/pb
+        [278366, 278366], # HLT_IsoTkMu22_eta2p1_v3, 59.423/pb
+        [278406, 278406], # HLT_IsoTkMu22_eta2p1_v3, 296.962/pb
+        [278509, 278509], # HLT_IsoTkMu22_eta2p1_v3, 273.442/pb
+        [278769, 278770], # HLT_IsoTkMu22_eta2p1_v3, 170.993/pb
+        [278801, 278805], # HLT_IsoTkMu22_eta2p1_v3, 137.142/pb
+        [278808, 278808], # HLT_IsoTkMu22_eta2p1_v3, 269.634/pb
+        [278820, 278820], # HLT_IsoTkMu22_eta2p1_v3, 286.511/pb
+        [278822, 278822], # HLT_IsoTkMu22_eta2p1_v3, 191.158/pb
+        [278873, 278875], # HLT_IsoTkMu22_eta2p1_v3, 198.657/pb
+        [278923, 278923], # HLT_IsoTkMu22_eta2p1_v3, 98.543/pb
+        [278957, 278957], # HLT_IsoTkMu22_eta2p1_v3, 36.164/pb
+        [278962, 278963], # HLT_IsoTkMu22_eta2p1_v3, 113.024/pb
+        [278969, 278969], # HLT_IsoTkMu22_eta2p1_v3, 282.492/pb
+        [278975, 278976], # HLT_IsoTkMu22_eta2p1_v3, 122.556/pb
+        [278986, 278986], # HLT_IsoTkMu22_eta2p1_v3, 31.548/pb
+        [279024, 279024], # HLT_IsoTkMu22_eta2p1_v3, 49.596/pb
+        [279029, 279029], # HLT_IsoTkMu22_eta2p1_v3, 38.088/pb
+        [279071, 279071], # HLT_IsoTkMu22_eta2p1_v3, 22.581/pb
+        [279080, 279080], # HLT_IsoTkMu22_eta2p1_v3, 12.773/pb
+        [279115, 279116], # HLT_IsoTkMu22_eta2p1_v3, 174.938/pb
+        [279479, 279479], # HLT_IsoTkMu22_eta2p1_v3, 5.927/pb
+        [279588, 279588], # HLT_IsoTkMu22_eta2p1_v3, 228.517/pb
+        [279653, 279654], # HLT_IsoTkMu22_eta2p1_v3, 283.775/pb
+        [279656, 279656], # HLT_IsoTkMu22_eta2p1_v3, 5.684/pb
+        [279658, 279658], # HLT_IsoTkMu22_eta2p1_v3, 93.394/pb
+        [279667, 279667], # HLT_IsoTkMu22_eta2p1_v3, 208.732/pb
+        [279681, 279685], # HLT_IsoTkMu22_eta2p1_v3, 74.528/pb
+        [279691, 279691], # HLT_IsoTkMu22_eta2p1_v3, 9.656/pb
+        [279694, 279694], # HLT_IsoTkMu22_eta2p1_v3, 406.418/pb
+        [279715, 279716], # HLT_IsoTkMu22_eta2p1_v3, 383.763/pb
+        [279760, 279760], # HLT_IsoTkMu22_eta2p1_v3, 153.502/pb
+        [279766, 279767], # HLT_IsoTkMu22_eta2p1_v3, 358.144/pb
+        [279794, 279794], # HLT_IsoTkMu22_eta2p1_v3, 223.093/pb
+        [279823, 279823], # HLT_IsoTkMu22_eta2p1_v3, 81.828/pb
+        [279841, 279841], # HLT_IsoTkMu22_eta2p1_v3, 380.359/pb
+        [279844, 279844], # HLT_IsoTkMu22_eta2p1_v3, 56.588/pb
+        [279887, 279887], # HLT_IsoTkMu22_eta2p1_v3, 73.316/pb
+        [279931, 279931], # HLT_IsoTkMu22_eta2p1_v3, 475.316/pb
+        [279966, 279966], # HLT_IsoTkMu22_eta2p1_v3, 93.011/pb
+        [279975, 279975], # HLT_IsoTkMu22_eta2p1_v3, 239.011/pb
+        [279993, 279994], # HLT_IsoTkMu22_eta2p1_v3, 30.455/pb
+        [280013, 280013], # HLT_IsoTkMu22_eta2p1_v3, 5.636/pb
+        [280015, 280018], # HLT_IsoTkMu22_eta2p1_v3, 398.79/pb
+        [280020, 280020], # HLT_IsoTkMu22_eta2p1_v3, 4.614/pb
+        [280024, 280024], # HLT_IsoTkMu22_eta2p1_v3, 41.841/pb
+        [280187, 280188], # HLT_IsoTkMu22_eta2p1_v3, 74.778/pb
+        [280191, 280191], # HLT_IsoTkMu22_eta2p1_v3, 178.951/pb
+        [280194, 280194], # HLT_IsoTkMu22_eta2p1_v3, 36.665/pb
+        [280242, 280242], # HLT_IsoTkMu22_eta2p1_v3, 147.69/pb
+        [280249, 280249], # HLT_IsoTkMu22_eta2p1_v3, 239.16/pb
+        [280251, 280251], # HLT_IsoTkMu22_eta2p1_v3, 47.176/pb
+        [280327, 280327], # HLT_IsoTkMu22_eta2p1_v3, 8.719/pb
+        [280330, 280330], # HLT_IsoTkMu22_eta2p1_v3, 185.776/pb
+        [280349, 280349], # HLT_IsoTkMu22_eta2p1_v3, 104.129/pb
+        [280363, 280364], # HLT_IsoTkMu22_eta2p1_v3, 205.282/pb
+        [280383, 280385], # HLT_IsoTkMu22_eta2p1_v3, 372.972/pb
+        [281613, 281613], # HLT_IsoTkMu22_eta2p1_v4, 9.764/pb
+        [281639, 281639], # HLT_IsoTkMu22_eta2p1_v4, 18.977/pb
+        [281641, 281641], # HLT_IsoTkMu22_eta2p1_v4, 39.268/pb
+        [281693, 281693], # HLT_IsoTkMu22_eta2p1_v4, 376.118/pb
+        [281707, 281707], # HLT_IsoTkMu22_eta2p1_v4, 214.55/pb
+        [281726, 281727], # HLT_IsoTkMu22_eta2p1_v4, 251.373/pb
+        [281797, 281797], # HLT_IsoTkMu22_eta2p1_v4, 397.836/pb
+        [281975, 281976], # HLT_IsoTkMu22_eta2p1_v4, 393.967/pb
+        [282033, 282035], # HLT_IsoTkMu22_eta2p1_v4, 26.293/pb
+        [282037, 282037], # HLT_IsoTkMu22_eta2p1_v4, 331.413/pb
+        [282092, 282092], # HLT_IsoTkMu22_eta2p1_v4, 296.762/pb
+        [282708, 282708], # HLT_IsoTkMu22_eta2p1_v4, 2.118/pb
+        [282710, 282710], # HLT_IsoTkMu22_eta2p1_v4, 0.346/pb
+        [282712, 282712], # HLT_IsoTkMu22_eta2p1_v4, 16.683/pb
+        [282730, 282735], # HLT_IsoTkMu22_eta2p1_v4, 469.07/pb
+        [282800, 282800], # HLT_IsoTkMu22_eta2p1_v4, 93.58/pb
+        [282807, 282807], # HLT_IsoTkMu22_eta2p1_v4, 70.563/pb
+        [282814, 282814], # HLT_IsoTkMu22_eta2p1_v4, 276.224/pb
+        [282842, 282842], # HLT_IsoTkMu22_eta2p1_v4, 23.509/pb
+        [282917, 282919], # HLT_IsoTkMu22_eta2p1_v4, 88.074/pb
+        [282922, 282923], # HLT_IsoTkMu22_eta2p1_v4, 66.001/pb
+        [283042, 283043], # HLT_IsoTkMu22_eta2p1_v4, 118.119/pb
+        [283049, 283050], # HLT_IsoTkMu22_eta2p1_v4, 61.072/pb
+        [283052, 283052], # HLT_IsoTkMu22_eta2p1_v4, 28.777/pb
+        [283059, 283059], # HLT_IsoTkMu22_eta2p1_v4, 98.778/pb
+        [283270, 283270], # HLT_IsoTkMu22_eta2p1_v4, 381.444/pb
+        [283283, 283283], # HLT_IsoTkMu22_eta2p1_v4, 197.444/pb
+        [283305, 283308], # HLT_IsoTkMu22_eta2p1_v4, 338.86/pb
+        [283353, 283353], # HLT_IsoTkMu22_eta2p1_v4, 191.088/pb
+        [283358, 283359], # HLT_IsoTkMu22_eta2p1_v4, 233.089/pb
+        [283407, 283408], # HLT_IsoTkMu22_eta2p1_v4, 466.833/pb
+        [283416, 283416], # HLT_IsoTkMu22_eta2p1_v4, 21.628/pb
+        [283453, 283453], # HLT_IsoTkMu22_eta2p1_v4, 123.278/pb
+        [283469, 283469], # HLT_IsoTkMu22_eta2p1_v4, 0.031/pb
+        [283478, 283478], # HLT_IsoTkMu22_eta2p1_v4, 210.23/pb
+        [283548, 283548], # HLT_IsoTkMu22_eta2p1_v4, 26.451/pb
+        [283680, 283682], # HLT_IsoTkMu22_eta2p1_v4, 102.814/pb
+        [283685, 283685], # HLT_IsoTkMu22_eta2p1_v4, 20.432/pb
+        [283820, 283820], # HLT_IsoTkMu22_eta2p1_v4, 259.058/pb
+        [283830, 283830], # HLT_IsoTkMu22_eta2p1_v4, 102.255/pb
+        [283834, 283835], # HLT_IsoTkMu22_eta2p1_v4, 20.323/pb
+        [283865, 283865], # HLT_IsoTkMu22_eta2p1_v4, 264.403/pb
+        [283876, 283877], # HLT_IsoTkMu22_eta2p1_v4, 409.447/pb
+        [283884, 283885], # HLT_IsoTkMu22_eta2p1_v4, 392.377/pb
+        [283933, 283934], # HLT_IsoTkMu22_eta2p1_v4, 309.793/pb
+        [283946, 283946], # HLT_IsoTkMu22_eta2p1_v4, 300.188/pb
+        [283964, 283964], # HLT_IsoTkMu22_eta2p1_v4, 58.698/pb
+        [284006, 284006], # HLT_IsoTkMu22_eta2p1_v4, 57.69/pb
+        [284014, 284014], # HLT_IsoTkMu22_eta2p1_v4, 47.826/pb
+        [284025, 284025], # HLT_IsoTkMu22_eta2p1_v4, 12.193/pb
+        [284029, 284029], # HLT_IsoTkMu22_eta2p1_v4, 29.941/pb
+        [284035, 284044], # HLT_IsoTkMu22_eta2p1_v4, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoMu24',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_IsoMu24_v1, 50.239/pb
+        [273302, 273302], # HLT_IsoMu24_v1, 16.319/pb
+        [273402, 273406], # HLT_IsoMu24_v1, 13.589/pb
+        [273408, 273411], # HLT_IsoMu24_v1, 13.087/pb
+        [273425, 273425], # HLT_IsoMu24_v1, 26.717/pb
+        [273446, 273450], # HLT_IsoMu24_v1, 94.292/pb
+        [273492, 273494], # HLT_IsoMu24_v1, 30.924/pb
+        [273502, 273503], # HLT_IsoMu24_v1, 72.147/pb
+        [273554, 273555], # HLT_IsoMu24_v1, 38.827/pb
+        [273725, 273725], # HLT_IsoMu24_v1, 154.653/pb
+        [273728, 273728], # HLT_IsoMu24_v1, 4.897/pb
+        [273730, 273730], # HLT_IsoMu24_v1, 86.49/pb
+        [274094, 274094], # HLT_IsoMu24_v1, 9.735/pb
+        [274146, 274146], # HLT_IsoMu24_v1, 5.12/pb
+        [274157, 274157], # HLT_IsoMu24_v1, 38.994/pb
+        [274159, 274161], # HLT_IsoMu24_v1, 62.883/pb
+        [274172, 274172], # HLT_IsoMu24_v1, 5.249/pb
+        [274198, 274200], # HLT_IsoMu24_v1, 135.972/pb
+        [274240, 274241], # HLT_IsoMu24_v1, 134.472/pb
+        [274244, 274244], # HLT_IsoMu24_v1, 56.348/pb
+        [274250, 274251], # HLT_IsoMu24_v1, 159.993/pb
+        [274283, 274284], # HLT_IsoMu24_v1, 30.266/pb
+        [274286, 274286], # HLT_IsoMu24_v1, 21.668/pb
+        [274314, 274317], # HLT_IsoMu24_v1, 206.7/pb
+        [274319, 274319], # HLT_IsoMu24_v1, 27.302/pb
+        [274335, 274339], # HLT_IsoMu24_v1, 246.003/pb
+        [274344, 274345], # HLT_IsoMu24_v1, 87.68/pb
+        [274382, 274382], # HLT_IsoMu24_v1, 7.428/pb
+        [274387, 274388], # HLT_IsoMu24_v1, 312.374/pb
+        [274420, 274422], # HLT_IsoMu24_v1, 359.125/pb
+        [274440, 274442], # HLT_IsoMu24_v1, 226.466/pb
+        [274954, 274955], # HLT_IsoMu24_v2, 5.735/pb
+        [274968, 274971], # HLT_IsoMu24_v2, 422.272/pb
+        [274998, 275001], # HLT_IsoMu24_v2, 489.252/pb
+        [275059, 275059], # HLT_IsoMu24_v2, 6.094/pb
+        [275066, 275068], # HLT_IsoMu24_v2, 231.774/pb
+        [275073, 275074], # HLT_IsoMu24_v2, 144.124/pb
+        [275124, 275125], # HLT_IsoMu24_v2, 205.394/pb
+        [275282, 275284], # HLT_IsoMu24_v2, 49.295/pb
+        [275290, 275293], # HLT_IsoMu24_v2, 94.338/pb
+        [275309, 275311], # HLT_IsoMu24_v2, 411.084/pb
+        [275319, 275319], # HLT_IsoMu24_v2, 24.399/pb
+        [275337, 275338], # HLT_IsoMu24_v2, 143.358/pb
+        [275344, 275345], # HLT_IsoMu24_v2, 109.524/pb
+        [275370, 275371], # HLT_IsoMu24_v2, 145.599/pb
+        [275375, 275376], # HLT_IsoMu24_v2, 528.636/pb
+        [275657, 275659], # HLT_IsoMu24_v2, 80.874/pb
+        [275761, 275761], # HLT_IsoMu24_v2, 1.667/pb
+        [275767, 275767], # HLT_IsoMu24_v2, 0.714/pb
+        [275772, 275774], # HLT_IsoMu24_v2, 66.444/pb
+        [275776, 275778], # HLT_IsoMu24_v2, 116.898/pb
+        [275782, 275782], # HLT_IsoMu24_v2, 99.533/pb
+        [275832, 275837], # HLT_IsoMu24_v2, 441.03/pb
+        [275847, 275847], # HLT_IsoMu24_v2, 198.947/pb
+        [275886, 275886], # HLT_IsoMu24_v2, 7.581/pb
+        [275890, 275890], # HLT_IsoMu24_v2, 235.22/pb
+        [275911, 275913], # HLT_IsoMu24_v2, 201.741/pb
+        [275918, 275918], # HLT_IsoMu24_v2, 49.71/pb
+        [275920, 275921], # HLT_IsoMu24_v2, 62.257/pb
+        [275923, 275923], # HLT_IsoMu24_v2, 14.5/pb
+        [275931, 275931], # HLT_IsoMu24_v2, 10.418/pb
+        [275963, 275963], # HLT_IsoMu24_v2, 19.553/pb
+        [276092, 276092], # HLT_IsoMu24_v2, 14.768/pb
+        [276097, 276097], # HLT_IsoMu24_v2, 99.405/pb
+        [276242, 276244], # HLT_IsoMu24_v2, 479.052/pb
+        [276282, 276283], # HLT_IsoMu24_v2, 372.59/pb
+        [276315, 276315], # HLT_IsoMu24_v2, 34.051/pb
+        [276317, 276318], # HLT_IsoMu24_v2, 124.306/pb
+        [276355, 276355], # HLT_IsoMu24_v2, 6.205/pb
+        [276361, 276361], # HLT_IsoMu24_v2, 149.465/pb
+        [276363, 276363], # HLT_IsoMu24_v2, 206.376/pb
+        [276384, 276384], # HLT_IsoMu24_v2, 121.517/pb
+        [276437, 276437], # HLT_IsoMu24_v2, 355.688/pb
+        [276454, 276454], # HLT_IsoMu24_v2, 63.924/pb
+        [276458, 276458], # HLT_IsoMu24_v2, 33.169/pb
+        [276495, 276495], # HLT_IsoMu24_v2, 38.062/pb
+        [276501, 276502], # HLT_IsoMu24_v2, 486.891/pb
+        [276525, 276525], # HLT_IsoMu24_v2, 402.663/pb
+        [276527, 276528], # HLT_IsoMu24_v2, 60.758/pb
+        [276542, 276545], # HLT_IsoMu24_v2, 345.204/pb
+        [276581, 276587], # HLT_IsoMu24_v2, 471.493/pb
+        [276653, 276653], # HLT_IsoMu24_v2, 86.12/pb
+        [276655, 276655], # HLT_IsoMu24_v2, 160.843/pb
+        [276659, 276659], # HLT_IsoMu24_v2, 29.939/pb
+        [276775, 276776], # HLT_IsoMu24_v2, 443.702/pb
+        [276794, 276794], # HLT_IsoMu24_v2, 87.206/pb
+        [276807, 276808], # HLT_IsoMu24_v2, 188.301/pb
+        [276810, 276811], # HLT_IsoMu24_v2, 346.409/pb
+        [276831, 276831], # HLT_IsoMu24_v2, 400.298/pb
+        [276834, 276834], # HLT_IsoMu24_v2, 72.6/pb
+        [276870, 276870], # HLT_IsoMu24_v2, 526.587/pb
+        [276935, 276935], # HLT_IsoMu24_v2, 169.998/pb
+        [276940, 276940], # HLT_IsoMu24_v2, 28.701/pb
+        [276946, 276948], # HLT_IsoMu24_v2, 114.81/pb
+        [276950, 276950], # HLT_IsoMu24_v2, 323.179/pb
+        [277069, 277073], # HLT_IsoMu24_v2, 390.296/pb
+        [277076, 277076], # HLT_IsoMu24_v2, 125.929/pb
+        [277087, 277087], # HLT_IsoMu24_v2, 86.357/pb
+        [277094, 277094], # HLT_IsoMu24_v2, 131.103/pb
+        [277096, 277096], # HLT_IsoMu24_v2, 320.668/pb
+        [277112, 277112], # HLT_IsoMu24_v2, 17.339/pb
+        [277126, 277127], # HLT_IsoMu24_v2, 185.976/pb
+        [277148, 277148], # HLT_IsoMu24_v2, 128.192/pb
+        [277166, 277166], # HLT_IsoMu24_v2, 70.666/pb
+        [277168, 277168], # HLT_IsoMu24_v2, 318.998/pb
+        [277180, 277180], # HLT_IsoMu24_v2, 31.25/pb
+        [277194, 277194], # HLT_IsoMu24_v2, 367.175/pb
+        [277305, 277305], # HLT_IsoMu24_v2, 154.262/pb
+        [277420, 277420], # HLT_IsoMu24_v2, 60.844/pb
+        [277981, 277981], # HLT_IsoMu24_v2, 4.601/pb
+        [277991, 277992], # HLT_IsoMu24_v2, 21.692/pb
+        [278017, 278018], # HLT_IsoMu24_v2, 338.894/pb
+        [278167, 278167], # HLT_IsoMu24_v2, 314.532/pb
+        [278175, 278175], # HLT_IsoMu24_v2, 9.045/pb
+        [278193, 278193], # HLT_IsoMu24_v2, 34.581/pb
+        [278239, 278240], # HLT_IsoMu24_v2, 330.009/pb
+        [278273, 278274], # HLT_IsoMu24_v2, 23.87/pb
+        [278288, 278290], # HLT_IsoMu24_v2, 14.747/pb
+        [278308, 278308], # HLT_IsoMu24_v2, 313.102/pb
+        [278310, 278310], # HLT_IsoMu24_v2, 88.422/pb
+        [278315, 278315], # HLT_IsoMu24_v2, 137.45/pb
+        [278345, 278346], # HLT_IsoMu24_v2, 171.231/pb
+        [278349, 278349], # HLT_IsoMu24_v2, 94.737/pb
+        [278366, 278366], # HLT_IsoMu24_v2, 59.423/pb
+        [278406, 278406], # HLT_IsoMu24_v2, 296.962/pb
+        [278509, 278509], # HLT_IsoMu24_v2, 273.442/pb
+        [278769, 278770], # HLT_IsoMu24_v2, 170.993/pb
+        [278801, 278805], # HLT_IsoMu24_v2, 137.142/pb
+        [278808, 278808], # HLT_IsoMu24_v2, 269.634/pb
+        [278820, 278820], # HLT_IsoMu24_v2, 286.511/pb
+        [278822, 278822], # HLT_IsoMu24_v2, 191.158/pb
+        [278873, 278875], # HLT_IsoMu24_v2, 198.657/pb
+        [278923, 278923], # HLT_IsoMu24_v2, 98.543/pb
+        [278957, 278957], # HLT_IsoMu24_v2, 36.164/pb
+        [278962, 278963], # HLT_IsoMu24_v2, 113.024/pb
+        [278969, 278969], # HLT_IsoMu24_v2, 282.492/pb
+        [278975, 278976], # HLT_IsoMu24_v2, 122.556/pb
+        [278986, 278986], # HLT_IsoMu24_v2, 31.548/pb
+        [279024, 279024], # HLT_IsoMu24_v2, 49.596/pb
+        [279029, 279029], # HLT_IsoMu24_v2, 38.088/pb
+        [279071, 279071], # HLT_IsoMu24_v2, 22.581/pb
+        [279080, 279080], # HLT_IsoMu24_v2, 12.773/pb
+        [279115, 279116], # HLT_IsoMu24_v2, 174.938/pb
+        [279479, 279479], # HLT_IsoMu24_v2, 5.927/pb
+        [279588, 279588], # HLT_IsoMu24_v2, 228.517/pb
+        [279653, 279654], # HLT_IsoMu24_v2, 283.775/pb
+        [279656, 279656], # HLT_IsoMu24_v2, 5.684/pb
+        [279658, 279658], # HLT_IsoMu24_v2, 93.394/pb
+        [279667, 279667], # HLT_IsoMu24_v2, 208.732/pb
+        [279681, 279685], # HLT_IsoMu24_v2, 74.528/pb
+        [279691, 279691], # HLT_IsoMu24_v2, 9.656/pb
+        [279694, 279694], # HLT_IsoMu24_v2, 406.418/pb
+        [279715, 279716], # HLT_IsoMu24_v2, 383.763/pb
+        [279760, 279760], # HLT_IsoMu24_v2, 153.502/pb
+        [279766, 279767], # HLT_IsoMu24_v2, 358.144/pb
+        [279794, 279794], # HLT_IsoMu24_v2, 223.093/pb
+        [279823, 279823], # HLT_IsoMu24_v2, 81.828/pb
+        [279841, 279841], # HLT_IsoMu24_v2, 380.359/pb
+        [279844, 279844], # HLT_IsoMu24_v2, 56.588/pb
+        [279887, 279887], # HLT_IsoMu24_v2, 73.316/pb
+        [279931, 279931], # HLT_IsoMu24_v2, 475.316/pb
+        [279966, 279966], # HLT_IsoMu24_v2, 93.011/pb
+        [279975, 279975], # HLT_IsoMu24_v2, 239.011/pb
+        [279993, 279994], # HLT_IsoMu24_v2, 30.455/pb
+        [280013, 280013], # HLT_IsoMu24_v2, 5.636/pb
+        [280015, 280018], # HLT_IsoMu24_v2, 398.79/pb
+        [280020, 280020], # HLT_IsoMu24_v2, 4.614/pb
+        [280024, 280024], # HLT_IsoMu24_v2, 41.841/pb
+        [280187, 280188], # HLT_IsoMu24_v2, 74.778/pb
+        [280191, 280191], # HLT_IsoMu24_v2, 178.951/pb
+        [280194, 280194], # HLT_IsoMu24_v2, 36.665/pb
+        [280242, 280242], # HLT_IsoMu24_v2, 147.69/pb
+        [280249, 280249], # HLT_IsoMu24_v2, 239.16/pb
+        [280251, 280251], # HLT_IsoMu24_v2, 47.176/pb
+        [280327, 280327], # HLT_IsoMu24_v2, 8.719/pb
+        [280330, 280330], # HLT_IsoMu24_v2, 185.776/pb
+        [280349, 280349], # HLT_IsoMu24_v2, 104.129/pb
+        [280363, 280364], # HLT_IsoMu24_v2, 205.282/pb
+        [280383, 280385], # HLT_IsoMu24_v2, 372.972/pb
+        [281613, 281613], # HLT_IsoMu24_v4, 9.764/pb
+        [281639, 281639], # HLT_IsoMu24_v4, 18.977/pb
+        [281641, 281641], # HLT_IsoMu24_v4, 39.268/pb
+        [281693, 281693], # HLT_IsoMu24_v4, 376.118/pb
+        [281707, 281707], # HLT_IsoMu24_v4, 214.55/pb
+        [281726, 281727], # HLT_IsoMu24_v4, 251.373/pb
+        [281797, 281797], # HLT_IsoMu24_v4, 397.836/pb
+        [281975, 281976], # HLT_IsoMu24_v4, 393.967/pb
+        [282033, 282035], # HLT_IsoMu24_v4, 26.293/pb
+        [282037, 282037], # HLT_IsoMu24_v4, 331.413/pb
+        [282092, 282092], # HLT_IsoMu24_v4, 296.762/pb
+        [282708, 282708], # HLT_IsoMu24_v4, 2.118/pb
+        [282710, 282710], # HLT_IsoMu24_v4, 0.346/pb
+        [282712, 282712], # HLT_IsoMu24_v4, 16.683/pb
+        [282730, 282735], # HLT_IsoMu24_v4, 469.07/pb
+        [282800, 282800], # HLT_IsoMu24_v4, 93.58/pb
+        [282807, 282807], # HLT_IsoMu24_v4, 70.563/pb
+        [282814, 282814], # HLT_IsoMu24_v4, 276.224/pb
+        [282842, 282842], # HLT_IsoMu24_v4, 23.509/pb
+        [282917, 282919], # HLT_IsoMu24_v4, 88.074/pb
+        [282922, 282923], # HLT_IsoMu24_v4, 66.001/pb
+        [283042, 283043], # HLT_IsoMu24_v4, 118.119/pb
+        [283049, 283050], # HLT_IsoMu24_v4, 61.072/pb
+        [283052, 283052], # HLT_IsoMu24_v4, 28.777/pb
+        [283059, 283059], # HLT_IsoMu24_v4, 98.778/pb
+        [283270, 283270], # HLT_IsoMu24_v4, 381.444/pb
+        [283283, 283283], # HLT_IsoMu24_v4, 197.444/pb
+        [283305, 283308], # HLT_IsoMu24_v4, 338.86/pb
+        [283353, 283353], # HLT_IsoMu24_v4, 191.088/pb
+        [283358, 283359], # HLT_IsoMu24_v4, 233.089/pb
+        [283407, 283408], # HLT_IsoMu24_v4, 466.833/pb
+        [283416, 283416], # HLT_IsoMu24_v4, 21.628/pb
+        [283453, 283453], # HLT_IsoMu24_v4, 123.278/pb
+        [283469, 283469], # HLT_IsoMu24_v4, 0.031/pb
+        [283478, 283478], # HLT_IsoMu24_v4, 210.23/pb
+        [283548, 283548], # HLT_IsoMu24_v4, 26.451/pb
+        [283680, 283682], # HLT_IsoMu24_v4, 102.814/pb
+        [283685, 283685], # HLT_IsoMu24_v4, 20.432/pb
+        [283820, 283820], # HLT_IsoMu24_v4, 259.058/pb
+        [283830, 283830], # HLT_IsoMu24_v4, 102.255/pb
+        [283834, 283835], # HLT_IsoMu24_v4, 20.323/pb
+        [283865, 283865], # HLT_IsoMu24_v4, 264.403/pb
+        [283876, 283877], # HLT_IsoMu24_v4, 409.447/pb
+        [283884, 283885], # HLT_IsoMu24_v4, 392.377/pb
+        [283933, 283934], # HLT_IsoMu24_v4, 309.793/pb
+        [283946, 283946], # HLT_IsoMu24_v4, 300.188/pb
+        [283964, 283964], # HLT_IsoMu24_v4, 58.698/pb
+        [284006, 284006], # HLT_IsoMu24_v4, 57.69/pb
+        [284014, 284014], # HLT_IsoMu24_v4, 47.826/pb
+        [284025, 284025], # HLT_IsoMu24_v4, 12.193/pb
+        [284029, 284029], # HLT_IsoMu24_v4, 29.941/pb
+        [284035, 284044], # HLT_IsoMu24_v4, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoTkMu24',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_IsoTkMu24_v1, 50.239/pb
+        [273302, 273302], # HLT_IsoTkMu24_v1, 16.319/pb
+        [273402, 273406], # HLT_IsoTkMu24_v1, 13.589/pb
+        [273408, 273411], # HLT_IsoTkMu24_v1, 13.087/pb
+        [273425, 273425], # HLT_IsoTkMu24_v1, 26.717/pb
+        [273446, 273450], # HLT_IsoTkMu24_v1, 94.292/pb
+        [273492, 273494], # HLT_IsoTkMu24_v1, 30.924/pb
+        [273502, 273503], # HLT_IsoTkMu24_v1, 72.147/pb
+        [273554, 273555], # HLT_IsoTkMu24_v1, 38.827/pb
+        [273725, 273725], # HLT_IsoTkMu24_v1, 154.653/pb
+        [273728, 273728], # HLT_IsoTkMu24_v1, 4.897/pb
+        [273730, 273730], # HLT_IsoTkMu24_v1, 86.49/pb
+        [274094, 274094], # HLT_IsoTkMu24_v1, 9.735/pb
+        [274146, 274146], # HLT_IsoTkMu24_v1, 5.12/pb
+        [274157, 274157], # HLT_IsoTkMu24_v1, 38.994/pb
+        [274159, 274161], # HLT_IsoTkMu24_v1, 62.883/pb
+        [274172, 274172], # HLT_IsoTkMu24_v1, 5.249/pb
+        [274198, 274200], # HLT_IsoTkMu24_v1, 135.972/pb
+        [274240, 274241], # HLT_IsoTkMu24_v1, 134.472/pb
+        [274244, 274244], # HLT_IsoTkMu24_v1, 56.348/pb
+        [274250, 274251], # HLT_IsoTkMu24_v1, 159.993/pb
+        [274283, 274284], # HLT_IsoTkMu24_v1, 30.266/pb
+        [274286, 274286], # HLT_IsoTkMu24_v1, 21.668/pb
+        [274314, 274317], # HLT_IsoTkMu24_v1, 206.7/pb
+        [274319, 274319], # HLT_IsoTkMu24_v1, 27.302/pb
+        [274335, 274339], # HLT_IsoTkMu24_v1, 246.003/pb
+        [274344, 274345], # HLT_IsoTkMu24_v1, 87.68/pb
+        [274382, 274382], # HLT_IsoTkMu24_v1, 7.428/pb
+        [274387, 274388], # HLT_IsoTkMu24_v1, 312.374/pb
+        [274420, 274422], # HLT_IsoTkMu24_v1, 359.125/pb
+        [274440, 274442], # HLT_IsoTkMu24_v1, 226.466/pb
+        [274954, 274955], # HLT_IsoTkMu24_v2, 5.735/pb
+        [274968, 274971], # HLT_IsoTkMu24_v2, 422.272/pb
+        [274998, 275001], # HLT_IsoTkMu24_v2, 489.252/pb
+        [275059, 275059], # HLT_IsoTkMu24_v2, 6.094/pb
+        [275066, 275068], # HLT_IsoTkMu24_v2, 231.774/pb
+        [275073, 275074], # HLT_IsoTkMu24_v2, 144.124/pb
+        [275124, 275125], # HLT_IsoTkMu24_v2, 205.394/pb
+        [275282, 275284], # HLT_IsoTkMu24_v2, 49.295/pb
+        [275290, 275293], # HLT_IsoTkMu24_v2, 94.338/pb
+        [275309, 275311], # HLT_IsoTkMu24_v2, 411.084/pb
+        [275319, 275319], # HLT_IsoTkMu24_v2, 24.399/pb
+        [275337, 275338], # HLT_IsoTkMu24_v2, 143.358/pb
+        [275344, 275345], # HLT_IsoTkMu24_v2, 109.524/pb
+        [275370, 275371], # HLT_IsoTkMu24_v2, 145.599/pb
+        [275375, 275376], # HLT_IsoTkMu24_v2, 528.636/pb
+        [275657, 275659], # HLT_IsoTkMu24_v3, 80.874/pb
+        [275761, 275761], # HLT_IsoTkMu24_v3, 1.667/pb
+        [275767, 275767], # HLT_IsoTkMu24_v3, 0.714/pb
+        [275772, 275774], # HLT_IsoTkMu24_v3, 66.444/pb
+        [275776, 275778], # HLT_IsoTkMu24_v3, 116.898/pb
+        [275782, 275782], # HLT_IsoTkMu24_v3, 99.533/pb
+        [275832, 275837], # HLT_IsoTkMu24_v3, 441.03/pb
+        [275847, 275847], # HLT_IsoTkMu24_v3, 198.947/pb
+        [275886, 275886], # HLT_IsoTkMu24_v3, 7.581/pb
+        [275890, 275890], # HLT_IsoTkMu24_v3, 235.22/pb
+        [275911, 275913], # HLT_IsoTkMu24_v3, 201.741/pb
+        [275918, 275918], # HLT_IsoTkMu24_v3, 49.71/pb
+        [275920, 275921], # HLT_IsoTkMu24_v3, 62.257/pb
+        [275923, 275923], # HLT_IsoTkMu24_v3, 14.5/pb
+        [275931, 275931], # HLT_IsoTkMu24_v3, 10.418/pb
+        [275963, 275963], # HLT_IsoTkMu24_v3, 19.553/pb
+        [276092, 276092], # HLT_IsoTkMu24_v3, 14.768/pb
+        [276097, 276097], # HLT_IsoTkMu24_v3, 99.405/pb
+        [276242, 276244], # HLT_IsoTkMu24_v3, 479.052/pb
+        [276282, 276283], # HLT_IsoTkMu24_v3, 372.59/pb
+        [276315, 276315], # HLT_IsoTkMu24_v3, 34.051/pb
+        [276317, 276318], # HLT_IsoTkMu24_v3, 124.306/pb
+        [276355, 276355], # HLT_IsoTkMu24_v3, 6.205/pb
+        [276361, 276361], # HLT_IsoTkMu24_v3, 149.465/pb
+        [276363, 276363], # HLT_IsoTkMu24_v3, 206.376/pb
+        [276384, 276384], # HLT_IsoTkMu24_v3, 121.517/pb
+        [276437, 276437], # HLT_IsoTkMu24_v3, 355.688/pb
+        [276454, 276454], # HLT_IsoTkMu24_v3, 63.924/pb
+        [276458, 276458], # HLT_IsoTkMu24_v3, 33.169/pb
+        [276495, 276495], # HLT_IsoTkMu24_v3, 38.062/pb
+        [276501, 276502], # HLT_IsoTkMu24_v3, 486.891/pb
+        [276525, 276525], # HLT_IsoTkMu24_v3, 402.663/pb
+        [276527, 276528], # HLT_IsoTkMu24_v3, 60.758/pb
+        [276542, 276545], # HLT_IsoTkMu24_v3, 345.204/pb
+        [276581, 276587], # HLT_IsoTkMu24_v3, 471.493/pb
+        [276653, 276653], # HLT_IsoTkMu24_v3, 86.12/pb
+        [276655, 276655], # HLT_IsoTkMu24_v3, 160.843/pb
+        [276659, 276659], # HLT_IsoTkMu24_v3, 29.939/pb
+        [276775, 276776], # HLT_IsoTkMu24_v3, 443.702/pb
+        [276794, 276794], # HLT_IsoTkMu24_v3, 87.206/pb
+        [276807, 276808], # HLT_IsoTkMu24_v3, 188.301/pb
+        [276810, 276811], # HLT_IsoTkMu24_v3, 346.409/pb
+        [276831, 276831], # HLT_IsoTkMu24_v3, 400.298/pb
+        [276834, 276834], # HLT_IsoTkMu24_v3, 72.6/pb
+        [276870, 276870], # HLT_IsoTkMu24_v3, 526.587/pb
+        [276935, 276935], # HLT_IsoTkMu24_v3, 169.998/pb
+        [276940, 276940], # HLT_IsoTkMu24_v3, 28.701/pb
+        [276946, 276948], # HLT_IsoTkMu24_v3, 114.81/pb
+        [276950, 276950], # HLT_IsoTkMu24_v3, 323.179/pb
+        [277069, 277073], # HLT_IsoTkMu24_v3, 390.296/pb
+        [277076, 277076], # HLT_IsoTkMu24_v3, 125.929/pb
+        [277087, 277087], # HLT_IsoTkMu24_v3, 86.357/pb
+        [277094, 277094], # HLT_IsoTkMu24_v3, 131.103/pb
+        [277096, 277096], # HLT_IsoTkMu24_v3, 320.668/pb
+        [277112, 277112], # HLT_IsoTkMu24_v3, 17.339/pb
+        [277126, 277127], # HLT_IsoTkMu24_v3, 185.976/pb
+        [277148, 277148], # HLT_IsoTkMu24_v3, 128.192/pb
+        [277166, 277166], # HLT_IsoTkMu24_v3, 70.666/pb
+        [277168, 277168], # HLT_IsoTkMu24_v3, 318.998/pb
+        [277180, 277180], # HLT_IsoTkMu24_v3, 31.25/pb
+        [277194, 277194], # HLT_IsoTkMu24_v3, 367.175/pb
+        [277305, 277305], # HLT_IsoTkMu24_v3, 154.262/pb
+        [277420, 277420], # HLT_IsoTkMu24_v3, 60.844/pb
+        [277981, 277981], # HLT_IsoTkMu24_v3, 4.601/pb
+        [277991, 277992], # HLT_IsoTkMu24_v3, 21.692/pb
+        [278017, 278018], # HLT_IsoTkMu24_v3, 338.894/pb
+        [278167, 278167], # HLT_IsoTkMu24_v3, 314.532/pb
+        [278175, 278175], # HLT_IsoTkMu24_v3, 9.045/pb
+        [278193, 278193], # HLT_IsoTkMu24_v3, 34.581/pb
+        [278239, 278240], # HLT_IsoTkMu24_v3, 330.009/pb
+        [278273, 278274], # HLT_IsoTkMu24_v3, 23.87/pb
+        [278288, 278290], # HLT_IsoTkMu24_v3, 14.747/pb
+        [278308, 278308], # HLT_IsoTkMu24_v3, 313.102/pb
+        [278310, 278310], # HLT_IsoTkMu24_v3, 88.422/pb
+        [278315, 278315], # HLT_IsoTkMu24_v3, 137.45/pb
+        [278345, 278346], # HLT_IsoTkMu24_v3, 171.231/pb
+        [278349, 278349], # HLT_IsoTkMu24_v3, 94.737/pb
+        [278366, 278366], # HLT_IsoTkMu24_v3, 59.423/pb
+        [278406, 278406], # HLT_IsoTkMu24_v3, 296.962/pb
+        [278509, 278509], # HLT_IsoTkMu24_v3, 273.442/pb
+        [278769, 278770], # HLT_IsoTkMu24_v3, 170.993/pb
+        [278801, 278805], # HLT_IsoTkMu24_v3, 137.142/pb
+        [278808, 278808], # HLT_IsoTkMu24_v3, 269.634/pb
+        [278820, 278820], # HLT_IsoTkMu24_v3, 286.511/pb
+        [278822, 278822], # HLT_IsoTkMu24_v3, 191.158/pb
+        [278873, 278875], # HLT_IsoTkMu24_v3, 198.657/pb
+        [278923, 278923], # HLT_IsoTkMu24_v3, 98.543/pb
+        [278957, 278957], # HLT_IsoTkMu24_v3, 36.164/pb
+        [278962, 278963], # HLT_IsoTkMu24_v3, 113.024/pb
+        [278969, 278969], # HLT_IsoTkMu24_v3, 282.492/pb
+        [278975, 278976], # HLT_IsoTkMu24_v3, 122.556/pb
+        [278986, 278986], # HLT_IsoTkMu24_v3, 31.548/pb
+        [279024, 279024], # HLT_IsoTkMu24_v3, 49.596/pb
+        [279029, 279029], # HLT_IsoTkMu24_v3, 38.088/pb
+        [279071, 279071], # HLT_IsoTkMu24_v3, 22.581/pb
+        [279080, 279080], # HLT_IsoTkMu24_v3, 12.773/pb
+        [279115, 279116], # HLT_IsoTkMu24_v3, 174.938/pb
+        [279479, 279479], # HLT_IsoTkMu24_v3, 5.927/pb
+        [279588, 279588], # HLT_IsoTkMu24_v3, 228.517/pb
+        [279653, 279654], # HLT_IsoTkMu24_v3, 283.775/pb
+        [279656, 279656], # HLT_IsoTkMu24_v3, 5.684/pb
+        [279658, 279658], # HLT_IsoTkMu24_v3, 93.394/pb
+        [279667, 279667], # HLT_IsoTkMu24_v3, 208.732/pb
+        [279681, 279685], # HLT_IsoTkMu24_v3, 74.528/pb
+        [279691, 279691], # HLT_IsoTkMu24_v3, 9.656/pb
+        [279694, 279694], # HLT_IsoTkMu24_v3, 406.418/pb
+        [279715, 279716], # HLT_IsoTkMu24_v3, 383.763/pb
+        [279760, 279760], # HLT_IsoTkMu24_v3, 153.502/pb
+        [279766, 279767], # HLT_IsoTkMu24_v3, 358.144/pb
+        [279794, 279794], # HLT_IsoTkMu24_v3, 223.093/pb
+        [279823, 279823], # HLT_IsoTkMu24_v3, 81.828/pb
+        [279841, 279841], # HLT_IsoTkMu24_v3, 380.359/pb
+        [279844, 279844], # HLT_IsoTkMu24_v3, 56.588/pb
+        [279887, 279887], # HLT_IsoTkMu24_v3, 73.316/pb
+        [279931, 279931], # HLT_IsoTkMu24_v3, 475.316/pb
+        [279966, 279966], # HLT_IsoTkMu24_v3, 93.011/pb
+        [279975, 279975], # HLT_IsoTkMu24_v3, 239.011/pb
+        [279993, 279994], # HLT_IsoTkMu24_v3, 30.455/pb
+        [280013, 280013], # HLT_IsoTkMu24_v3, 5.636/pb
+        [280015, 280018], # HLT_IsoTkMu24_v3, 398.79/pb
+        [280020, 280020], # HLT_IsoTkMu24_v3, 4.614/pb
+        [280024, 280024], # HLT_IsoTkMu24_v3, 41.841/pb
+        [280187, 280188], # HLT_IsoTkMu24_v3, 74.778/pb
+        [280191, 280191], # HLT_IsoTkMu24_v3, 178.951/pb
+        [280194, 280194], # HLT_IsoTkMu24_v3, 36.665/pb
+        [280242, 280242], # HLT_IsoTkMu24_v3, 147.69/pb
+        [280249, 280249], # HLT_IsoTkMu24_v3, 239.16/pb
+        [280251, 280251], # HLT_IsoTkMu24_v3, 47.176/pb
+        [280327, 280327], # HLT_IsoTkMu24_v3, 8.719/pb
+        [280330, 280330], # HLT_IsoTkMu24_v3, 185.776/pb
+        [280349, 280349], # HLT_IsoTkMu24_v3, 104.129/pb
+        [280363, 280364], # HLT_IsoTkMu24_v3, 205.282/pb
+        [280383, 280385], # HLT_IsoTkMu24_v3, 372.972/pb
+        [281613, 281613], # HLT_IsoTkMu24_v4, 9.764/pb
+        [281639, 281639], # HLT_IsoTkMu24_v4, 18.977/pb
+        [281641, 281641], # HLT_IsoTkMu24_v4, 39.268/pb
+        [281693, 281693], # HLT_IsoTkMu24_v4, 376.118/pb
+        [281707, 281707], # HLT_IsoTkMu24_v4, 214.55/pb
+        [281726, 281727], # HLT_IsoTkMu24_v4, 251.373/pb
+        [281797, 281797], # HLT_IsoTkMu24_v4, 397.836/pb
+        [281975, 281976], # HLT_IsoTkMu24_v4, 393.967/pb
+        [282033, 282035], # HLT_IsoTkMu24_v4, 26.293/pb
+        [282037, 282037], # HLT_IsoTkMu24_v4, 331.413/pb
+        [282092, 282092], # HLT_IsoTkMu24_v4, 296.762/pb
+        [282708, 282708], # HLT_IsoTkMu24_v4, 2.118/pb
+        [282710, 282710], # HLT_IsoTkMu24_v4, 0.346/pb
+        [282712, 282712], # HLT_IsoTkMu24_v4, 16.683/pb
+        [282730, 282735], # HLT_IsoTkMu24_v4, 469.07/pb
+        [282800, 282800], # HLT_IsoTkMu24_v4, 93.58/pb
+        [282807, 282807], # HLT_IsoTkMu24_v4, 70.563/pb
+        [282814, 282814], # HLT_IsoTkMu24_v4, 276.224/pb
+        [282842, 282842], # HLT_IsoTkMu24_v4, 23.509/pb
+        [282917, 282919], # HLT_IsoTkMu24_v4, 88.074/pb
+        [282922, 282923], # HLT_IsoTkMu24_v4, 66.001/pb
+        [283042, 283043], # HLT_IsoTkMu24_v4, 118.119/pb
+        [283049, 283050], # HLT_IsoTkMu24_v4, 61.072/pb
+        [283052, 283052], # HLT_IsoTkMu24_v4, 28.777/pb
+        [283059, 283059], # HLT_IsoTkMu24_v4, 98.778/pb
+        [283270, 283270], # HLT_IsoTkMu24_v4, 381.444/pb
+        [283283, 283283], # HLT_IsoTkMu24_v4, 197.444/pb
+        [283305, 283308], # HLT_IsoTkMu24_v4, 338.86/pb
+        [283353, 283353], # HLT_IsoTkMu24_v4, 191.088/pb
+        [283358, 283359], # HLT_IsoTkMu24_v4, 233.089/pb
+        [283407, 283408], # HLT_IsoTkMu24_v4, 466.833/pb
+        [283416, 283416], # HLT_IsoTkMu24_v4, 21.628/pb
+        [283453, 283453], # HLT_IsoTkMu24_v4, 123.278/pb
+        [283469, 283469], # HLT_IsoTkMu24_v4, 0.031/pb
+        [283478, 283478], # HLT_IsoTkMu24_v4, 210.23/pb
+        [283548, 283548], # HLT_IsoTkMu24_v4, 26.451/pb
+        [283680, 283682], # HLT_IsoTkMu24_v4, 102.814/pb
+        [283685, 283685], # HLT_IsoTkMu24_v4, 20.432/pb
+        [283820, 283820], # HLT_IsoTkMu24_v4, 259.058/pb
+        [283830, 283830], # HLT_IsoTkMu24_v4, 102.255/pb
+        [283834, 283835], # HLT_IsoTkMu24_v4, 20.323/pb
+        [283865, 283865], # HLT_IsoTkMu24_v4, 264.403/pb
+        [283876, 283877], # HLT_IsoTkMu24_v4, 409.447/pb
+        [283884, 283885], # HLT_IsoTkMu24_v4, 392.377/pb
+        [283933, 283934], # HLT_IsoTkMu24_v4, 309.793/pb
+        [283946, 283946], # HLT_IsoTkMu24_v4, 300.188/pb
+        [283964, 283964], # HLT_IsoTkMu24_v4, 58.698/pb
+        [284006, 284006], # HLT_IsoTkMu24_v4, 57.69/pb
+        [284014, 284014], # HLT_IsoTkMu24_v4, 47.826/pb
+        [284025, 284025], # HLT_IsoTkMu24_v4, 12.193/pb
+        [284029, 284029], # HLT_IsoTkMu24_v4, 29.941/pb
+        [284035, 284044], # HLT_IsoTkMu24_v4, 303.58/pb
+      ],
+    },
+  ],
+  '1mu_noiso' : [
+    {
+      'name'        : 'HLT_Mu45_eta2p1',
+      'unprescaled' : False, # prescaled in runs F, G, H
+      'runs'        : [
+        [273158, 273158], # HLT_Mu45_eta2p1_v2, 50.239/pb
+        [273302, 273302], # HLT_Mu45_eta2p1_v2, 16.319/pb
+        [273402, 273406], # HLT_Mu45_eta2p1_v2, 13.589/pb
+        [273408, 273411], # HLT_Mu45_eta2p1_v2, 13.087/pb
+        [273425, 273425], # HLT_Mu45_eta2p1_v2, 26.717/pb
+        [273446, 273450], # HLT_Mu45_eta2p1_v2, 94.292/pb
+        [273492, 273494], # HLT_Mu45_eta2p1_v2, 30.924/pb
+        [273502, 273503], # HLT_Mu45_eta2p1_v2, 72.147/pb
+        [273554, 273555], # HLT_Mu45_eta2p1_v2, 38.827/pb
+        [273725, 273725], # HLT_Mu45_eta2p1_v2, 154.653/pb
+        [273728, 273728], # HLT_Mu45_eta2p1_v2, 4.897/pb
+        [273730, 273730], # HLT_Mu45_eta2p1_v2, 86.49/pb
+        [274094, 274094], # HLT_Mu45_eta2p1_v2, 9.735/pb
+        [274146, 274146], # HLT_Mu45_eta2p1_v2, 5.12/pb
+        [274157, 274157], # HLT_Mu45_eta2p1_v2, 38.994/pb
+        [274159, 274161], # HLT_Mu45_eta2p1_v2, 62.883/pb
+        [274172, 274172], # HLT_Mu45_eta2p1_v2, 5.249/pb
+        [274198, 274200], # HLT_Mu45_eta2p1_v2, 135.972/pb
+        [274240, 274241], # HLT_Mu45_eta2p1_v2, 134.472/pb
+        [274244, 274244], # HLT_Mu45_eta2p1_v2, 56.348/pb
+        [274250, 274251], # HLT_Mu45_eta2p1_v2, 159.993/pb
+        [274283, 274284], # HLT_Mu45_eta2p1_v2, 30.266/pb
+        [274286, 274286], # HLT_Mu45_eta2p1_v2, 21.668/pb
+        [274314, 274317], # HLT_Mu45_eta2p1_v2, 206.7/pb
+        [274319, 274319], # HLT_Mu45_eta2p1_v2, 27.302/pb
+        [274335, 274339], # HLT_Mu45_eta2p1_v2, 246.003/pb
+        [274344, 274345], # HLT_Mu45_eta2p1_v2, 87.68/pb
+        [274382, 274382], # HLT_Mu45_eta2p1_v2, 7.428/pb
+        [274387, 274388], # HLT_Mu45_eta2p1_v2, 312.374/pb
+        [274420, 274422], # HLT_Mu45_eta2p1_v2, 359.125/pb
+        [274440, 274442], # HLT_Mu45_eta2p1_v2, 226.466/pb
+        [274954, 274955], # HLT_Mu45_eta2p1_v3, 5.735/pb
+        [274968, 274971], # HLT_Mu45_eta2p1_v3, 422.272/pb
+        [274998, 275001], # HLT_Mu45_eta2p1_v3, 489.252/pb
+        [275059, 275059], # HLT_Mu45_eta2p1_v3, 6.094/pb
+        [275066, 275068], # HLT_Mu45_eta2p1_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu45_eta2p1_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu45_eta2p1_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu45_eta2p1_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu45_eta2p1_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu45_eta2p1_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu45_eta2p1_v3, 24.399/pb
+        [275337, 275338], # HLT_Mu45_eta2p1_v3, 143.358/pb
+        [275344, 275345], # HLT_Mu45_eta2p1_v3, 109.524/pb
+        [275370, 275371], # HLT_Mu45_eta2p1_v3, 145.599/pb
+        [275375, 275376], # HLT_Mu45_eta2p1_v3, 528.636/pb
+        [275657, 275659], # HLT_Mu45_eta2p1_v3, 80.874/pb
+        [275761, 275761], # HLT_Mu45_eta2p1_v3, 1.667/pb
+        [275767, 275767], # HLT_Mu45_eta2p1_v3, 0.714/pb
+        [275772, 275774], # HLT_Mu45_eta2p1_v3, 66.444/pb
+        [275776, 275778], # HLT_Mu45_eta2p1_v3, 116.898/pb
+        [275782, 275782], # HLT_Mu45_eta2p1_v3, 99.533/pb
+        [275832, 275837], # HLT_Mu45_eta2p1_v3, 441.03/pb
+        [275847, 275847], # HLT_Mu45_eta2p1_v3, 198.947/pb
+        [275886, 275886], # HLT_Mu45_eta2p1_v3, 7.581/pb
+        [275890, 275890], # HLT_Mu45_eta2p1_v3, 235.22/pb
+        [275911, 275913], # HLT_Mu45_eta2p1_v3, 201.741/pb
+        [275918, 275918], # HLT_Mu45_eta2p1_v3, 49.71/pb
+        [275920, 275921], # HLT_Mu45_eta2p1_v3, 62.257/pb
+        [275923, 275923], # HLT_Mu45_eta2p1_v3, 14.5/pb
+        [275931, 275931], # HLT_Mu45_eta2p1_v3, 10.418/pb
+        [275963, 275963], # HLT_Mu45_eta2p1_v3, 19.553/pb
+        [276092, 276092], # HLT_Mu45_eta2p1_v3, 14.768/pb
+        [276097, 276097], # HLT_Mu45_eta2p1_v3, 99.405/pb
+        [276242, 276244], # HLT_Mu45_eta2p1_v3, 479.052/pb
+        [276282, 276283], # HLT_Mu45_eta2p1_v4, 372.59/pb
+        [276315, 276315], # HLT_Mu45_eta2p1_v4, 34.051/pb
+        [276317, 276318], # HLT_Mu45_eta2p1_v4, 124.306/pb
+        [276355, 276355], # HLT_Mu45_eta2p1_v4, 6.205/pb
+        [276361, 276361], # HLT_Mu45_eta2p1_v4, 149.465/pb
+        [276363, 276363], # HLT_Mu45_eta2p1_v4, 206.376/pb
+        [276384, 276384], # HLT_Mu45_eta2p1_v4, 121.517/pb
+        [276437, 276437], # HLT_Mu45_eta2p1_v4, 355.688/pb
+        [276454, 276454], # HLT_Mu45_eta2p1_v4, 63.924/pb
+        [276458, 276458], # HLT_Mu45_eta2p1_v4, 33.169/pb
+        [276495, 276495], # HLT_Mu45_eta2p1_v4, 38.062/pb
+        [276501, 276502], # HLT_Mu45_eta2p1_v4, 486.891/pb
+        [276525, 276525], # HLT_Mu45_eta2p1_v4, 402.663/pb
+        [276527, 276528], # HLT_Mu45_eta2p1_v4, 60.758/pb
+        [276542, 276545], # HLT_Mu45_eta2p1_v4, 345.204/pb
+        [276581, 276587], # HLT_Mu45_eta2p1_v4, 471.493/pb
+        [276653, 276653], # HLT_Mu45_eta2p1_v4, 86.12/pb
+        [276655, 276655], # HLT_Mu45_eta2p1_v4, 160.843/pb
+        [276659, 276659], # HLT_Mu45_eta2p1_v4, 29.939/pb
+        [276775, 276776], # HLT_Mu45_eta2p1_v4, 443.702/pb
+        [276794, 276794], # HLT_Mu45_eta2p1_v4, 87.206/pb
+        [276807, 276808], # HLT_Mu45_eta2p1_v4, 188.301/pb
+        [276810, 276811], # HLT_Mu45_eta2p1_v4, 346.409/pb
+        [276831, 276831], # HLT_Mu45_eta2p1_v4, 400.298/pb
+        [276834, 276834], # HLT_Mu45_eta2p1_v4, 72.6/pb
+        [276870, 276870], # HLT_Mu45_eta2p1_v4, 526.587/pb
+        [276935, 276935], # HLT_Mu45_eta2p1_v4, 169.998/pb
+        [276940, 276940], # HLT_Mu45_eta2p1_v4, 28.701/pb
+        [276946, 276948], # HLT_Mu45_eta2p1_v4, 114.81/pb
+        [276950, 276950], # HLT_Mu45_eta2p1_v4, 323.179/pb
+        [277069, 277073], # HLT_Mu45_eta2p1_v4, 390.296/pb
+        [277076, 277076], # HLT_Mu45_eta2p1_v4, 125.929/pb
+        [277087, 277087], # HLT_Mu45_eta2p1_v4, 86.357/pb
+        [277094, 277094], # HLT_Mu45_eta2p1_v4, 131.103/pb
+        [277096, 277096], # HLT_Mu45_eta2p1_v4, 320.668/pb
+        [277112, 277112], # HLT_Mu45_eta2p1_v4, 17.339/pb
+        [277126, 277127], # HLT_Mu45_eta2p1_v4, 185.976/pb
+        [277148, 277148], # HLT_Mu45_eta2p1_v4, 128.192/pb
+        [277166, 277166], # HLT_Mu45_eta2p1_v4, 70.666/pb
+        [277168, 277168], # HLT_Mu45_eta2p1_v4, 318.998/pb
+        [277180, 277180], # HLT_Mu45_eta2p1_v4, 31.25/pb
+        [277194, 277194], # HLT_Mu45_eta2p1_v4, 367.175/pb
+        [277305, 277305], # HLT_Mu45_eta2p1_v4, 154.262/pb
+        [277420, 277420], # HLT_Mu45_eta2p1_v4, 60.844/pb
+        [277981, 277981], # HLT_Mu45_eta2p1_v4, 4.601/pb
+        [277991, 277992], # HLT_Mu45_eta2p1_v4, 21.692/pb
+        [278017, 278018], # HLT_Mu45_eta2p1_v4, 338.894/pb
+        [278167, 278167], # HLT_Mu45_eta2p1_v4, 314.532/pb
+        [278175, 278175], # HLT_Mu45_eta2p1_v4, 9.045/pb
+        [278193, 278193], # HLT_Mu45_eta2p1_v4, 34.581/pb
+        [278239, 278240], # HLT_Mu45_eta2p1_v4, 330.009/pb
+        [278308, 278308], # HLT_Mu45_eta2p1_v4, 76.214/pb
+        [278310, 278310], # HLT_Mu45_eta2p1_v4, 88.422/pb
+        [278346, 278346], # HLT_Mu45_eta2p1_v4, 1.065/pb
+        [278349, 278349], # HLT_Mu45_eta2p1_v4, 94.737/pb
+        [278366, 278366], # HLT_Mu45_eta2p1_v4, 59.423/pb
+        [278406, 278406], # HLT_Mu45_eta2p1_v4, 106.479/pb
+        [278509, 278509], # HLT_Mu45_eta2p1_v4, 83.12/pb
+        [278804, 278804], # HLT_Mu45_eta2p1_v4, 0.747/pb
+        [278808, 278808], # HLT_Mu45_eta2p1_v4, 206.429/pb
+        [278820, 278820], # HLT_Mu45_eta2p1_v4, 92.947/pb
+        [278822, 278822], # HLT_Mu45_eta2p1_v4, 191.158/pb
+        [278874, 278875], # HLT_Mu45_eta2p1_v4, 126.83/pb
+        [278969, 278969], # HLT_Mu45_eta2p1_v4, 43.975/pb
+        [278975, 278976], # HLT_Mu45_eta2p1_v4, 122.556/pb
+        [279024, 279024], # HLT_Mu45_eta2p1_v4, 49.039/pb
+        [279029, 279029], # HLT_Mu45_eta2p1_v4, 38.088/pb
+        [279071, 279071], # HLT_Mu45_eta2p1_v4, 22.581/pb
+        [279080, 279080], # HLT_Mu45_eta2p1_v4, 11.815/pb
+        [279115, 279115], # HLT_Mu45_eta2p1_v4, 14.592/pb
+        [279479, 279479], # HLT_Mu45_eta2p1_v4, 3.739/pb
+        [279588, 279588], # HLT_Mu45_eta2p1_v4, 45.139/pb
+        [279654, 279654], # HLT_Mu45_eta2p1_v4, 69.728/pb
+        [279656, 279656], # HLT_Mu45_eta2p1_v4, 5.684/pb
+        [279658, 279658], # HLT_Mu45_eta2p1_v4, 93.394/pb
+        [279694, 279694], # HLT_Mu45_eta2p1_v4, 181.401/pb
+        [279716, 279716], # HLT_Mu45_eta2p1_v4, 189.552/pb
+        [279766, 279767], # HLT_Mu45_eta2p1_v4, 276.919/pb
+        [279841, 279841], # HLT_Mu45_eta2p1_v4, 145.283/pb
+        [279931, 279931], # HLT_Mu45_eta2p1_v4, 264.252/pb
+        [280016, 280018], # HLT_Mu45_eta2p1_v4, 282.67/pb
+        [280020, 280020], # HLT_Mu45_eta2p1_v4, 4.614/pb
+        [280024, 280024], # HLT_Mu45_eta2p1_v4, 41.841/pb
+        [280191, 280191], # HLT_Mu45_eta2p1_v4, 29.849/pb
+        [280194, 280194], # HLT_Mu45_eta2p1_v4, 34.566/pb
+        [280249, 280249], # HLT_Mu45_eta2p1_v4, 160.486/pb
+        [280251, 280251], # HLT_Mu45_eta2p1_v4, 47.176/pb
+        [280349, 280349], # HLT_Mu45_eta2p1_v4, 76.712/pb
+        [280363, 280364], # HLT_Mu45_eta2p1_v4, 204.989/pb
+        [280385, 280385], # HLT_Mu45_eta2p1_v4, 154.134/pb
+        [281613, 281613], # HLT_Mu45_eta2p1_v5, 8.92/pb
+        [281693, 281693], # HLT_Mu45_eta2p1_v5, 186.462/pb
+        [281726, 281727], # HLT_Mu45_eta2p1_v5, 243.997/pb
+        [281797, 281797], # HLT_Mu45_eta2p1_v5, 150.794/pb
+        [281976, 281976], # HLT_Mu45_eta2p1_v5, 193.249/pb
+        [282037, 282037], # HLT_Mu45_eta2p1_v5, 148.705/pb
+        [282092, 282092], # HLT_Mu45_eta2p1_v5, 175.119/pb
+        [282710, 282710], # HLT_Mu45_eta2p1_v5, 0.346/pb
+        [282735, 282735], # HLT_Mu45_eta2p1_v5, 211.341/pb
+        [282814, 282814], # HLT_Mu45_eta2p1_v5, 199.57/pb
+        [282923, 282923], # HLT_Mu45_eta2p1_v5, 1.025/pb
+        [283042, 283042], # HLT_Mu45_eta2p1_v5, 1.419/pb
+        [283270, 283270], # HLT_Mu45_eta2p1_v5, 83.337/pb
+        [283283, 283283], # HLT_Mu45_eta2p1_v5, 197.444/pb
+        [283308, 283308], # HLT_Mu45_eta2p1_v5, 92.999/pb
+        [283358, 283359], # HLT_Mu45_eta2p1_v5, 133.314/pb
+        [283408, 283408], # HLT_Mu45_eta2p1_v5, 158.529/pb
+        [283416, 283416], # HLT_Mu45_eta2p1_v5, 21.628/pb
+        [283685, 283685], # HLT_Mu45_eta2p1_v5, 13.473/pb
+        [283820, 283820], # HLT_Mu45_eta2p1_v5, 2.891/pb
+        [283830, 283830], # HLT_Mu45_eta2p1_v5, 102.255/pb
+        [283834, 283835], # HLT_Mu45_eta2p1_v5, 20.323/pb
+        [283865, 283865], # HLT_Mu45_eta2p1_v5, 2.104/pb
+        [283877, 283877], # HLT_Mu45_eta2p1_v5, 147.737/pb
+        [283885, 283885], # HLT_Mu45_eta2p1_v5, 142.058/pb
+        [283934, 283934], # HLT_Mu45_eta2p1_v5, 32.84/pb
+        [283946, 283946], # HLT_Mu45_eta2p1_v5, 38.156/pb
+        [283964, 283964], # HLT_Mu45_eta2p1_v5, 58.366/pb
+        [284006, 284006], # HLT_Mu45_eta2p1_v5, 4.993/pb
+        [284037, 284044], # HLT_Mu45_eta2p1_v5, 96.43/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu50',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Mu50_v2, 50.239/pb
+        [273302, 273302], # HLT_Mu50_v2, 16.319/pb
+        [273402, 273406], # HLT_Mu50_v2, 13.589/pb
+        [273408, 273411], # HLT_Mu50_v2, 13.087/pb
+        [273425, 273425], # HLT_Mu50_v2, 26.717/pb
+        [273446, 273450], # HLT_Mu50_v2, 94.292/pb
+        [273492, 273494], # HLT_Mu50_v2, 30.924/pb
+        [273502, 273503], # HLT_Mu50_v2, 72.147/pb
+        [273554, 273555], # HLT_Mu50_v2, 38.827/pb
+        [273725, 273725], # HLT_Mu50_v2, 154.653/pb
+        [273728, 273728], # HLT_Mu50_v2, 4.897/pb
+        [273730, 273730], # HLT_Mu50_v2, 86.49/pb
+        [274094, 274094], # HLT_Mu50_v2, 9.735/pb
+        [274146, 274146], # HLT_Mu50_v2, 5.12/pb
+        [274157, 274157], # HLT_Mu50_v2, 38.994/pb
+        [274159, 274161], # HLT_Mu50_v2, 62.883/pb
+        [274172, 274172], # HLT_Mu50_v2, 5.249/pb
+        [274198, 274200], # HLT_Mu50_v2, 135.972/pb
+        [274240, 274241], # HLT_Mu50_v2, 134.472/pb
+        [274244, 274244], # HLT_Mu50_v2, 56.348/pb
+        [274250, 274251], # HLT_Mu50_v2, 159.993/pb
+        [274283, 274284], # HLT_Mu50_v2, 30.266/pb
+        [274286, 274286], # HLT_Mu50_v2, 21.668/pb
+        [274314, 274317], # HLT_Mu50_v2, 206.7/pb
+        [274319, 274319], # HLT_Mu50_v2, 27.302/pb
+        [274335, 274339], # HLT_Mu50_v2, 246.003/pb
+        [274344, 274345], # HLT_Mu50_v2, 87.68/pb
+        [274382, 274382], # HLT_Mu50_v2, 7.428/pb
+        [274387, 274388], # HLT_Mu50_v2, 312.374/pb
+        [274420, 274422], # HLT_Mu50_v2, 359.125/pb
+        [274440, 274442], # HLT_Mu50_v2, 226.466/pb
+        [274954, 274955], # HLT_Mu50_v3, 5.735/pb
+        [274968, 274971], # HLT_Mu50_v3, 422.272/pb
+        [274998, 275001], # HLT_Mu50_v3, 489.252/pb
+        [275059, 275059], # HLT_Mu50_v3, 6.094/pb
+        [275066, 275068], # HLT_Mu50_v3, 231.774/pb
+        [275073, 275074], # HLT_Mu50_v3, 144.124/pb
+        [275124, 275125], # HLT_Mu50_v3, 205.394/pb
+        [275282, 275284], # HLT_Mu50_v3, 49.295/pb
+        [275290, 275293], # HLT_Mu50_v3, 94.338/pb
+        [275309, 275311], # HLT_Mu50_v3, 411.084/pb
+        [275319, 275319], # HLT_Mu50_v3, 24.399/pb
+        [275337, 275338], # HLT_Mu50_v3, 143.358/pb
+        [275344, 275345], # HLT_Mu50_v3, 109.524/pb
+        [275370, 275371], # HLT_Mu50_v3, 145.599/pb
+        [275375, 275376], # HLT_Mu50_v3, 528.636/pb
+        [275657, 275659], # HLT_Mu50_v3, 80.874/pb
+        [275761, 275761], # HLT_Mu50_v3, 1.667/pb
+        [275767, 275767], # HLT_Mu50_v3, 0.714/pb
+        [275772, 275774], # HLT_Mu50_v3, 66.444/pb
+        [275776, 275778], # HLT_Mu50_v3, 116.898/pb
+        [275782, 275782], # HLT_Mu50_v3, 99.533/pb
+        [275832, 275837], # HLT_Mu50_v3, 441.03/pb
+        [275847, 275847], # HLT_Mu50_v3, 198.947/pb
+        [275886, 275886], # HLT_Mu50_v3, 7.581/pb
+        [275890, 275890], # HLT_Mu50_v3, 235.22/pb
+        [275911, 275913], # HLT_Mu50_v3, 201.741/pb
+        [275918, 275918], # HLT_Mu50_v3, 49.71/pb
+        [275920, 275921], # HLT_Mu50_v3, 62.257/pb
+        [275923, 275923], # HLT_Mu50_v3, 14.5/pb
+        [275931, 275931], # HLT_Mu50_v3, 10.418/pb
+        [275963, 275963], # HLT_Mu50_v3, 19.553/pb
+        [276092, 276092], # HLT_Mu50_v3, 14.768/pb
+        [276097, 276097], # HLT_Mu50_v3, 99.405/pb
+        [276242, 276244], # HLT_Mu50_v3, 479.052/pb
+        [276282, 276283], # HLT_Mu50_v4, 372.59/pb
+        [276315, 276315], # HLT_Mu50_v4, 34.051/pb
+        [276317, 276318], # HLT_Mu50_v4, 124.306/pb
+        [276355, 276355], # HLT_Mu50_v4, 6.205/pb
+        [276361, 276361], # HLT_Mu50_v4, 149.465/pb
+        [276363, 276363], # HLT_Mu50_v4, 206.376/pb
+        [276384, 276384], # HLT_Mu50_v4, 121.517/pb
+        [276437, 276437], # HLT_Mu50_v4, 355.688/pb
+        [276454, 276454], # HLT_Mu50_v4, 63.924/pb
+        [276458, 276458], # HLT_Mu50_v4, 33.169/pb
+        [276495, 276495], # HLT_Mu50_v4, 38.062/pb
+        [276501, 276502], # HLT_Mu50_v4, 486.891/pb
+        [276525, 276525], # HLT_Mu50_v4, 402.663/pb
+        [276527, 276528], # HLT_Mu50_v4, 60.758/pb
+        [276542, 276545], # HLT_Mu50_v4, 345.204/pb
+        [276581, 276587], # HLT_Mu50_v4, 471.493/pb
+        [276653, 276653], # HLT_Mu50_v4, 86.12/pb
+        [276655, 276655], # HLT_Mu50_v4, 160.843/pb
+        [276659, 276659], # HLT_Mu50_v4, 29.939/pb
+        [276775, 276776], # HLT_Mu50_v4, 443.702/pb
+        [276794, 276794], # HLT_Mu50_v4, 87.206/pb
+        [276807, 276808], # HLT_Mu50_v4, 188.301/pb
+        [276810, 276811], # HLT_Mu50_v4, 346.409/pb
+        [276831, 276831], # HLT_Mu50_v4, 400.298/pb
+        [276834, 276834], # HLT_Mu50_v4, 72.6/pb
+        [276870, 276870], # HLT_Mu50_v4, 526.587/pb
+        [276935, 276935], # HLT_Mu50_v4, 169.998/pb
+        [276940, 276940], # HLT_Mu50_v4, 28.701/pb
+        [276946, 276948], # HLT_Mu50_v4, 114.81/pb
+        [276950, 276950], # HLT_Mu50_v4, 323.179/pb
+        [277069, 277073], # HLT_Mu50_v4, 390.296/pb
+        [277076, 277076], # HLT_Mu50_v4, 125.929/pb
+        [277087, 277087], # HLT_Mu50_v4, 86.357/pb
+        [277094, 277094], # HLT_Mu50_v4, 131.103/pb
+        [277096, 277096], # HLT_Mu50_v4, 320.668/pb
+        [277112, 277112], # HLT_Mu50_v4, 17.339/pb
+        [277126, 277127], # HLT_Mu50_v4, 185.976/pb
+        [277148, 277148], # HLT_Mu50_v4, 128.192/pb
+        [277166, 277166], # HLT_Mu50_v4, 70.666/pb
+        [277168, 277168], # HLT_Mu50_v4, 318.998/pb
+        [277180, 277180], # HLT_Mu50_v4, 31.25/pb
+        [277194, 277194], # HLT_Mu50_v4, 367.175/pb
+        [277305, 277305], # HLT_Mu50_v4, 154.262/pb
+        [277420, 277420], # HLT_Mu50_v4, 60.844/pb
+        [277981, 277981], # HLT_Mu50_v4, 4.601/pb
+        [277991, 277992], # HLT_Mu50_v4, 21.692/pb
+        [278017, 278018], # HLT_Mu50_v4, 338.894/pb
+        [278167, 278167], # HLT_Mu50_v4, 314.532/pb
+        [278175, 278175], # HLT_Mu50_v4, 9.045/pb
+        [278193, 278193], # HLT_Mu50_v4, 34.581/pb
+        [278239, 278240], # HLT_Mu50_v4, 330.009/pb
+        [278273, 278274], # HLT_Mu50_v4, 23.87/pb
+        [278288, 278290], # HLT_Mu50_v4, 14.747/pb
+        [278308, 278308], # HLT_Mu50_v4, 313.102/pb
+        [278310, 278310], # HLT_Mu50_v4, 88.422/pb
+        [278315, 278315], # HLT_Mu50_v4, 137.45/pb
+        [278345, 278346], # HLT_Mu50_v4, 171.231/pb
+        [278349, 278349], # HLT_Mu50_v4, 94.737/pb
+        [278366, 278366], # HLT_Mu50_v4, 59.423/pb
+        [278406, 278406], # HLT_Mu50_v4, 296.962/pb
+        [278509, 278509], # HLT_Mu50_v4, 273.442/pb
+        [278769, 278770], # HLT_Mu50_v4, 170.993/pb
+        [278801, 278805], # HLT_Mu50_v4, 137.142/pb
+        [278808, 278808], # HLT_Mu50_v4, 269.634/pb
+        [278820, 278820], # HLT_Mu50_v4, 286.511/pb
+        [278822, 278822], # HLT_Mu50_v4, 191.158/pb
+        [278873, 278875], # HLT_Mu50_v4, 198.657/pb
+        [278923, 278923], # HLT_Mu50_v4, 98.543/pb
+        [278957, 278957], # HLT_Mu50_v4, 36.164/pb
+        [278962, 278963], # HLT_Mu50_v4, 113.024/pb
+        [278969, 278969], # HLT_Mu50_v4, 282.492/pb
+        [278975, 278976], # HLT_Mu50_v4, 122.556/pb
+        [278986, 278986], # HLT_Mu50_v4, 31.548/pb
+        [279024, 279024], # HLT_Mu50_v4, 49.596/pb
+        [279029, 279029], # HLT_Mu50_v4, 38.088/pb
+        [279071, 279071], # HLT_Mu50_v4, 22.581/pb
+        [279080, 279080], # HLT_Mu50_v4, 12.773/pb
+        [279115, 279116], # HLT_Mu50_v4, 174.938/pb
+        [279479, 279479], # HLT_Mu50_v4, 5.927/pb
+        [279588, 279588], # HLT_Mu50_v4, 228.517/pb
+        [279653, 279654], # HLT_Mu50_v4, 283.775/pb
+        [279656, 279656], # HLT_Mu50_v4, 5.684/pb
+        [279658, 279658], # HLT_Mu50_v4, 93.394/pb
+        [279667, 279667], # HLT_Mu50_v4, 208.732/pb
+        [279681, 279685], # HLT_Mu50_v4, 74.528/pb
+        [279691, 279691], # HLT_Mu50_v4, 9.656/pb
+        [279694, 279694], # HLT_Mu50_v4, 406.418/pb
+        [279715, 279716], # HLT_Mu50_v4, 383.763/pb
+        [279760, 279760], # HLT_Mu50_v4, 153.502/pb
+        [279766, 279767], # HLT_Mu50_v4, 358.144/pb
+        [279794, 279794], # HLT_Mu50_v4, 223.093/pb
+        [279823, 279823], # HLT_Mu50_v4, 81.828/pb
+        [279841, 279841], # HLT_Mu50_v4, 380.359/pb
+        [279844, 279844], # HLT_Mu50_v4, 56.588/pb
+        [279887, 279887], # HLT_Mu50_v4, 73.316/pb
+        [279931, 279931], # HLT_Mu50_v4, 475.316/pb
+        [279966, 279966], # HLT_Mu50_v4, 93.011/pb
+        [279975, 279975], # HLT_Mu50_v4, 239.011/pb
+        [279993, 279994], # HLT_Mu50_v4, 30.455/pb
+        [280013, 280013], # HLT_Mu50_v4, 5.636/pb
+        [280015, 280018], # HLT_Mu50_v4, 398.79/pb
+        [280020, 280020], # HLT_Mu50_v4, 4.614/pb
+        [280024, 280024], # HLT_Mu50_v4, 41.841/pb
+        [280187, 280188], # HLT_Mu50_v4, 74.778/pb
+        [280191, 280191], # HLT_Mu50_v4, 178.951/pb
+        [280194, 280194], # HLT_Mu50_v4, 36.665/pb
+        [280242, 280242], # HLT_Mu50_v4, 147.69/pb
+        [280249, 280249], # HLT_Mu50_v4, 239.16/pb
+        [280251, 280251], # HLT_Mu50_v4, 47.176/pb
+        [280327, 280327], # HLT_Mu50_v4, 8.719/pb
+        [280330, 280330], # HLT_Mu50_v4, 185.776/pb
+        [280349, 280349], # HLT_Mu50_v4, 104.129/pb
+        [280363, 280364], # HLT_Mu50_v4, 205.282/pb
+        [280383, 280385], # HLT_Mu50_v4, 372.972/pb
+        [281613, 281613], # HLT_Mu50_v5, 9.764/pb
+        [281639, 281639], # HLT_Mu50_v5, 18.977/pb
+        [281641, 281641], # HLT_Mu50_v5, 39.268/pb
+        [281693, 281693], # HLT_Mu50_v5, 376.118/pb
+        [281707, 281707], # HLT_Mu50_v5, 214.55/pb
+        [281726, 281727], # HLT_Mu50_v5, 251.373/pb
+        [281797, 281797], # HLT_Mu50_v5, 397.836/pb
+        [281975, 281976], # HLT_Mu50_v5, 393.967/pb
+        [282033, 282035], # HLT_Mu50_v5, 26.293/pb
+        [282037, 282037], # HLT_Mu50_v5, 331.413/pb
+        [282092, 282092], # HLT_Mu50_v5, 296.762/pb
+        [282708, 282708], # HLT_Mu50_v5, 2.118/pb
+        [282710, 282710], # HLT_Mu50_v5, 0.346/pb
+        [282712, 282712], # HLT_Mu50_v5, 16.683/pb
+        [282730, 282735], # HLT_Mu50_v5, 469.07/pb
+        [282800, 282800], # HLT_Mu50_v5, 93.58/pb
+        [282807, 282807], # HLT_Mu50_v5, 70.563/pb
+        [282814, 282814], # HLT_Mu50_v5, 276.224/pb
+        [282842, 282842], # HLT_Mu50_v5, 23.509/pb
+        [282917, 282919], # HLT_Mu50_v5, 88.074/pb
+        [282922, 282923], # HLT_Mu50_v5, 66.001/pb
+        [283042, 283043], # HLT_Mu50_v5, 118.119/pb
+        [283049, 283050], # HLT_Mu50_v5, 61.072/pb
+        [283052, 283052], # HLT_Mu50_v5, 28.777/pb
+        [283059, 283059], # HLT_Mu50_v5, 98.778/pb
+        [283270, 283270], # HLT_Mu50_v5, 381.444/pb
+        [283283, 283283], # HLT_Mu50_v5, 197.444/pb
+        [283305, 283308], # HLT_Mu50_v5, 338.86/pb
+        [283353, 283353], # HLT_Mu50_v5, 191.088/pb
+        [283358, 283359], # HLT_Mu50_v5, 233.089/pb
+        [283407, 283408], # HLT_Mu50_v5, 466.833/pb
+        [283416, 283416], # HLT_Mu50_v5, 21.628/pb
+        [283453, 283453], # HLT_Mu50_v5, 123.278/pb
+        [283469, 283469], # HLT_Mu50_v5, 0.031/pb
+        [283478, 283478], # HLT_Mu50_v5, 210.23/pb
+        [283548, 283548], # HLT_Mu50_v5, 26.451/pb
+        [283680, 283682], # HLT_Mu50_v5, 102.814/pb
+        [283685, 283685], # HLT_Mu50_v5, 20.432/pb
+        [283820, 283820], # HLT_Mu50_v5, 259.058/pb
+        [283830, 283830], # HLT_Mu50_v5, 102.255/pb
+        [283834, 283835], # HLT_Mu50_v5, 20.323/pb
+        [283865, 283865], # HLT_Mu50_v5, 264.403/pb
+        [283876, 283877], # HLT_Mu50_v5, 409.447/pb
+        [283884, 283885], # HLT_Mu50_v5, 392.377/pb
+        [283933, 283934], # HLT_Mu50_v5, 309.793/pb
+        [283946, 283946], # HLT_Mu50_v5, 300.188/pb
+        [283964, 283964], # HLT_Mu50_v5, 58.698/pb
+        [284006, 284006], # HLT_Mu50_v5, 57.69/pb
+        [284014, 284014], # HLT_Mu50_v5, 47.826/pb
+        [284025, 284025], # HLT_Mu50_v5, 12.193/pb
+        [284029, 284029], # HLT_Mu50_v5, 29.941/pb
+        [284035, 284044], # HLT_Mu50_v5, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_TkMu50',
+      'unprescaled' : True, # enabled mid-run B
+      'runs'        : [
+        [274954, 274955], # HLT_TkMu50_v1, 5.735/pb
+        [274968, 274971], # HLT_TkMu50_v1, 422.272/pb
+        [274998, 275001], # HLT_TkMu50_v1, 489.252/pb
+        [275059, 275059], # HLT_TkMu50_v1, 6.094/pb
+        [275066, 275068], # HLT_TkMu50_v1, 231.774/pb
+        [275073, 275074], # HLT_TkMu50_v1, 144.124/pb
+        [275124, 275125], # HLT_TkMu50_v1, 205.394/pb
+        [275282, 275284], # HLT_TkMu50_v1, 49.295/pb
+        [275290, 275293], # HLT_TkMu50_v1, 94.338/pb
+        [275309, 275311], # HLT_TkMu50_v1, 411.084/pb
+        [275319, 275319], # HLT_TkMu50_v1, 24.399/pb
+        [275337, 275338], # HLT_TkMu50_v1, 143.358/pb
+        [275344, 275345], # HLT_TkMu50_v1, 109.524/pb
+        [275370, 275371], # HLT_TkMu50_v1, 145.599/pb
+        [275375, 275376], # HLT_TkMu50_v1, 528.636/pb
+        [275657, 275659], # HLT_TkMu50_v2, 80.874/pb
+        [275761, 275761], # HLT_TkMu50_v2, 1.667/pb
+        [275767, 275767], # HLT_TkMu50_v2, 0.714/pb
+        [275772, 275774], # HLT_TkMu50_v2, 66.444/pb
+        [275776, 275778], # HLT_TkMu50_v2, 116.898/pb
+        [275782, 275782], # HLT_TkMu50_v2, 99.533/pb
+        [275832, 275837], # HLT_TkMu50_v2, 441.03/pb
+        [275847, 275847], # HLT_TkMu50_v2, 198.947/pb
+        [275886, 275886], # HLT_TkMu50_v2, 7.581/pb
+        [275890, 275890], # HLT_TkMu50_v2, 235.22/pb
+        [275911, 275913], # HLT_TkMu50_v2, 201.741/pb
+        [275918, 275918], # HLT_TkMu50_v2, 49.71/pb
+        [275920, 275921], # HLT_TkMu50_v2, 62.257/pb
+        [275923, 275923], # HLT_TkMu50_v2, 14.5/pb
+        [275931, 275931], # HLT_TkMu50_v2, 10.418/pb
+        [275963, 275963], # HLT_TkMu50_v2, 19.553/pb
+        [276092, 276092], # HLT_TkMu50_v2, 14.768/pb
+        [276097, 276097], # HLT_TkMu50_v2, 99.405/pb
+        [276242, 276244], # HLT_TkMu50_v2, 479.052/pb
+        [276282, 276283], # HLT_TkMu50_v3, 372.59/pb
+        [276315, 276315], # HLT_TkMu50_v3, 34.051/pb
+        [276317, 276318], # HLT_TkMu50_v3, 124.306/pb
+        [276355, 276355], # HLT_TkMu50_v3, 6.205/pb
+        [276361, 276361], # HLT_TkMu50_v3, 149.465/pb
+        [276363, 276363], # HLT_TkMu50_v3, 206.376/pb
+        [276384, 276384], # HLT_TkMu50_v3, 121.517/pb
+        [276437, 276437], # HLT_TkMu50_v3, 355.688/pb
+        [276454, 276454], # HLT_TkMu50_v3, 63.924/pb
+        [276458, 276458], # HLT_TkMu50_v3, 33.169/pb
+        [276495, 276495], # HLT_TkMu50_v3, 38.062/pb
+        [276501, 276502], # HLT_TkMu50_v3, 486.891/pb
+        [276525, 276525], # HLT_TkMu50_v3, 402.663/pb
+        [276527, 276528], # HLT_TkMu50_v3, 60.758/pb
+        [276542, 276545], # HLT_TkMu50_v3, 345.204/pb
+        [276581, 276587], # HLT_TkMu50_v3, 471.493/pb
+        [276653, 276653], # HLT_TkMu50_v3, 86.12/pb
+        [276655, 276655], # HLT_TkMu50_v3, 160.843/pb
+        [276659, 276659], # HLT_TkMu50_v3, 29.939/pb
+        [276775, 276776], # HLT_TkMu50_v3, 443.702/pb
+        [276794, 276794], # HLT_TkMu50_v3, 87.206/pb
+        [276807, 276808], # HLT_TkMu50_v3, 188.301/pb
+        [276810, 276811], # HLT_TkMu50_v3, 346.409/pb
+        [276831, 276831], # HLT_TkMu50_v3, 400.298/pb
+        [276834, 276834], # HLT_TkMu50_v3, 72.6/pb
+        [276870, 276870], # HLT_TkMu50_v3, 526.587/pb
+        [276935, 276935], # HLT_TkMu50_v3, 169.998/pb
+        [276940, 276940], # HLT_TkMu50_v3, 28.701/pb
+        [276946, 276948], # HLT_TkMu50_v3, 114.81/pb
+        [276950, 276950], # HLT_TkMu50_v3, 323.179/pb
+        [277069, 277073], # HLT_TkMu50_v3, 390.296/pb
+        [277076, 277076], # HLT_TkMu50_v3, 125.929/pb
+        [277087, 277087], # HLT_TkMu50_v3, 86.357/pb
+        [277094, 277094], # HLT_TkMu50_v3, 131.103/pb
+        [277096, 277096], # HLT_TkMu50_v3, 320.668/pb
+        [277112, 277112], # HLT_TkMu50_v3, 17.339/pb
+        [277126, 277127], # HLT_TkMu50_v3, 185.976/pb
+        [277148, 277148], # HLT_TkMu50_v3, 128.192/pb
+        [277166, 277166], # HLT_TkMu50_v3, 70.666/pb
+        [277168, 277168], # HLT_TkMu50_v3, 318.998/pb
+        [277180, 277180], # HLT_TkMu50_v3, 31.25/pb
+        [277194, 277194], # HLT_TkMu50_v3, 367.175/pb
+        [277305, 277305], # HLT_TkMu50_v3, 154.262/pb
+        [277420, 277420], # HLT_TkMu50_v3, 60.844/pb
+        [277981, 277981], # HLT_TkMu50_v3, 4.601/pb
+        [277991, 277992], # HLT_TkMu50_v3, 21.692/pb
+        [278017, 278018], # HLT_TkMu50_v3, 338.894/pb
+        [278167, 278167], # HLT_TkMu50_v3, 314.532/pb
+        [278175, 278175], # HLT_TkMu50_v3, 9.045/pb
+        [278193, 278193], # HLT_TkMu50_v3, 34.581/pb
+        [278239, 278240], # HLT_TkMu50_v3, 330.009/pb
+        [278273, 278274], # HLT_TkMu50_v3, 23.87/pb
+        [278288, 278290], # HLT_TkMu50_v3, 14.747/pb
+        [278308, 278308], # HLT_TkMu50_v3, 313.102/pb
+        [278310, 278310], # HLT_TkMu50_v3, 88.422/pb
+        [278315, 278315], # HLT_TkMu50_v3, 137.45/pb
+        [278345, 278346], # HLT_TkMu50_v3, 171.231/pb
+        [278349, 278349], # HLT_TkMu50_v3, 94.737/pb
+        [278366, 278366], # HLT_TkMu50_v3, 59.423/pb
+        [278406, 278406], # HLT_TkMu50_v3, 296.962/pb
+        [278509, 278509], # HLT_TkMu50_v3, 273.442/pb
+        [278769, 278770], # HLT_TkMu50_v3, 170.993/pb
+        [278801, 278805], # HLT_TkMu50_v3, 137.142/pb
+        [278808, 278808], # HLT_TkMu50_v3, 269.634/pb
+        [278820, 278820], # HLT_TkMu50_v3, 286.511/pb
+        [278822, 278822], # HLT_TkMu50_v3, 191.158/pb
+        [278873, 278875], # HLT_TkMu50_v3, 198.657/pb
+        [278923, 278923], # HLT_TkMu50_v3, 98.543/pb
+        [278957, 278957], # HLT_TkMu50_v3, 36.164/pb
+        [278962, 278963], # HLT_TkMu50_v3, 113.024/pb
+        [278969, 278969], # HLT_TkMu50_v3, 282.492/pb
+        [278975, 278976], # HLT_TkMu50_v3, 122.556/pb
+        [278986, 278986], # HLT_TkMu50_v3, 31.548/pb
+        [279024, 279024], # HLT_TkMu50_v3, 49.596/pb
+        [279029, 279029], # HLT_TkMu50_v3, 38.088/pb
+        [279071, 279071], # HLT_TkMu50_v3, 22.581/pb
+        [279080, 279080], # HLT_TkMu50_v3, 12.773/pb
+        [279115, 279116], # HLT_TkMu50_v3, 174.938/pb
+        [279479, 279479], # HLT_TkMu50_v3, 5.927/pb
+        [279588, 279588], # HLT_TkMu50_v3, 228.517/pb
+        [279653, 279654], # HLT_TkMu50_v3, 283.775/pb
+        [279656, 279656], # HLT_TkMu50_v3, 5.684/pb
+        [279658, 279658], # HLT_TkMu50_v3, 93.394/pb
+        [279667, 279667], # HLT_TkMu50_v3, 208.732/pb
+        [279681, 279685], # HLT_TkMu50_v3, 74.528/pb
+        [279691, 279691], # HLT_TkMu50_v3, 9.656/pb
+        [279694, 279694], # HLT_TkMu50_v3, 406.418/pb
+        [279715, 279716], # HLT_TkMu50_v3, 383.763/pb
+        [279760, 279760], # HLT_TkMu50_v3, 153.502/pb
+        [279766, 279767], # HLT_TkMu50_v3, 358.144/pb
+        [279794, 279794], # HLT_TkMu50_v3, 223.093/pb
+        [279823, 279823], # HLT_TkMu50_v3, 81.828/pb
+        [279841, 279841], # HLT_TkMu50_v3, 380.359/pb
+        [279844, 279844], # HLT_TkMu50_v3, 56.588/pb
+        [279887, 279887], # HLT_TkMu50_v3, 73.316/pb
+        [279931, 279931], # HLT_TkMu50_v3, 475.316/pb
+        [279966, 279966], # HLT_TkMu50_v3, 93.011/pb
+        [279975, 279975], # HLT_TkMu50_v3, 239.011/pb
+        [279993, 279994], # HLT_TkMu50_v3, 30.455/pb
+        [280013, 280013], # HLT_TkMu50_v3, 5.636/pb
+        [280015, 280018], # HLT_TkMu50_v3, 398.79/pb
+        [280020, 280020], # HLT_TkMu50_v3, 4.614/pb
+        [280024, 280024], # HLT_TkMu50_v3, 41.841/pb
+        [280187, 280188], # HLT_TkMu50_v3, 74.778/pb
+        [280191, 280191], # HLT_TkMu50_v3, 178.951/pb
+        [280194, 280194], # HLT_TkMu50_v3, 36.665/pb
+        [280242, 280242], # HLT_TkMu50_v3, 147.69/pb
+        [280249, 280249], # HLT_TkMu50_v3, 239.16/pb
+        [280251, 280251], # HLT_TkMu50_v3, 47.176/pb
+        [280327, 280327], # HLT_TkMu50_v3, 8.719/pb
+        [280330, 280330], # HLT_TkMu50_v3, 185.776/pb
+        [280349, 280349], # HLT_TkMu50_v3, 104.129/pb
+        [280363, 280364], # HLT_TkMu50_v3, 205.282/pb
+        [280383, 280385], # HLT_TkMu50_v3, 372.972/pb
+        [281613, 281613], # HLT_TkMu50_v3, 9.764/pb
+        [281639, 281639], # HLT_TkMu50_v3, 18.977/pb
+        [281641, 281641], # HLT_TkMu50_v3, 39.268/pb
+        [281693, 281693], # HLT_TkMu50_v3, 376.118/pb
+        [281707, 281707], # HLT_TkMu50_v3, 214.55/pb
+        [281726, 281727], # HLT_TkMu50_v3, 251.373/pb
+        [281797, 281797], # HLT_TkMu50_v3, 397.836/pb
+        [281975, 281976], # HLT_TkMu50_v3, 393.967/pb
+        [282033, 282035], # HLT_TkMu50_v3, 26.293/pb
+        [282037, 282037], # HLT_TkMu50_v3, 331.413/pb
+        [282092, 282092], # HLT_TkMu50_v3, 296.762/pb
+        [282708, 282708], # HLT_TkMu50_v3, 2.118/pb
+        [282710, 282710], # HLT_TkMu50_v3, 0.346/pb
+        [282712, 282712], # HLT_TkMu50_v3, 16.683/pb
+        [282730, 282735], # HLT_TkMu50_v3, 469.07/pb
+        [282800, 282800], # HLT_TkMu50_v3, 93.58/pb
+        [282807, 282807], # HLT_TkMu50_v3, 70.563/pb
+        [282814, 282814], # HLT_TkMu50_v3, 276.224/pb
+        [282842, 282842], # HLT_TkMu50_v3, 23.509/pb
+        [282917, 282919], # HLT_TkMu50_v3, 88.074/pb
+        [282922, 282923], # HLT_TkMu50_v3, 66.001/pb
+        [283042, 283043], # HLT_TkMu50_v3, 118.119/pb
+        [283049, 283050], # HLT_TkMu50_v3, 61.072/pb
+        [283052, 283052], # HLT_TkMu50_v3, 28.777/pb
+        [283059, 283059], # HLT_TkMu50_v3, 98.778/pb
+        [283270, 283270], # HLT_TkMu50_v3, 381.444/pb
+        [283283, 283283], # HLT_TkMu50_v3, 197.444/pb
+        [283305, 283308], # HLT_TkMu50_v3, 338.86/pb
+        [283353, 283353], # HLT_TkMu50_v3, 191.088/pb
+        [283358, 283359], # HLT_TkMu50_v3, 233.089/pb
+        [283407, 283408], # HLT_TkMu50_v3, 466.833/pb
+        [283416, 283416], # HLT_TkMu50_v3, 21.628/pb
+        [283453, 283453], # HLT_TkMu50_v3, 123.278/pb
+        [283469, 283469], # HLT_TkMu50_v3, 0.031/pb
+        [283478, 283478], # HLT_TkMu50_v3, 210.23/pb
+        [283548, 283548], # HLT_TkMu50_v3, 26.451/pb
+        [283680, 283682], # HLT_TkMu50_v3, 102.814/pb
+        [283685, 283685], # HLT_TkMu50_v3, 20.432/pb
+        [283820, 283820], # HLT_TkMu50_v3, 259.058/pb
+        [283830, 283830], # HLT_TkMu50_v3, 102.255/pb
+        [283834, 283835], # HLT_TkMu50_v3, 20.323/pb
+        [283865, 283865], # HLT_TkMu50_v3, 264.403/pb
+        [283876, 283877], # HLT_TkMu50_v3, 409.447/pb
+        [283884, 283885], # HLT_TkMu50_v3, 392.377/pb
+        [283933, 283934], # HLT_TkMu50_v3, 309.793/pb
+        [283946, 283946], # HLT_TkMu50_v3, 300.188/pb
+        [283964, 283964], # HLT_TkMu50_v3, 58.698/pb
+        [284006, 284006], # HLT_TkMu50_v3, 57.69/pb
+        [284014, 284014], # HLT_TkMu50_v3, 47.826/pb
+        [284025, 284025], # HLT_TkMu50_v3, 12.193/pb
+        [284029, 284029], # HLT_TkMu50_v3, 29.941/pb
+        [284035, 284044], # HLT_TkMu50_v3, 303.58/pb
+      ],
+    },
+  ],
+  '1e' : [
+    {
+      'name'        : 'HLT_Ele27_WPTight_Gsf',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Ele27_WPTight_Gsf_v1, 50.239/pb
+        [273302, 273302], # HLT_Ele27_WPTight_Gsf_v1, 16.319/pb
+        [273402, 273406], # HLT_Ele27_WPTight_Gsf_v1, 13.589/pb
+        [273408, 273411], # HLT_Ele27_WPTight_Gsf_v1, 13.087/pb
+        [273425, 273425], # HLT_Ele27_WPTight_Gsf_v1, 26.717/pb
+        [273446, 273450], # HLT_Ele27_WPTight_Gsf_v1, 94.292/pb
+        [273492, 273494], # HLT_Ele27_WPTight_Gsf_v1, 30.924/pb
+        [273502, 273503], # HLT_Ele27_WPTight_Gsf_v1, 72.147/pb
+        [273554, 273555], # HLT_Ele27_WPTight_Gsf_v1, 38.827/pb
+        [273725, 273725], # HLT_Ele27_WPTight_Gsf_v1, 154.653/pb
+        [273728, 273728], # HLT_Ele27_WPTight_Gsf_v1, 4.897/pb
+        [273730, 273730], # HLT_Ele27_WPTight_Gsf_v1, 86.49/pb
+        [274094, 274094], # HLT_Ele27_WPTight_Gsf_v1, 9.735/pb
+        [274146, 274146], # HLT_Ele27_WPTight_Gsf_v1, 5.12/pb
+        [274157, 274157], # HLT_Ele27_WPTight_Gsf_v1, 38.994/pb
+        [274159, 274161], # HLT_Ele27_WPTight_Gsf_v1, 62.883/pb
+        [274172, 274172], # HLT_Ele27_WPTight_Gsf_v1, 5.249/pb
+        [274198, 274200], # HLT_Ele27_WPTight_Gsf_v1, 135.972/pb
+        [274240, 274241], # HLT_Ele27_WPTight_Gsf_v1, 134.472/pb
+        [274244, 274244], # HLT_Ele27_WPTight_Gsf_v1, 56.348/pb
+        [274250, 274251], # HLT_Ele27_WPTight_Gsf_v1, 159.993/pb
+        [274283, 274284], # HLT_Ele27_WPTight_Gsf_v1, 30.266/pb
+        [274286, 274286], # HLT_Ele27_WPTight_Gsf_v1, 21.668/pb
+        [274314, 274317], # HLT_Ele27_WPTight_Gsf_v1, 206.7/pb
+        [274319, 274319], # HLT_Ele27_WPTight_Gsf_v1, 27.302/pb
+        [274335, 274339], # HLT_Ele27_WPTight_Gsf_v1, 246.003/pb
+        [274344, 274345], # HLT_Ele27_WPTight_Gsf_v1, 87.68/pb
+        [274382, 274382], # HLT_Ele27_WPTight_Gsf_v1, 7.428/pb
+        [274387, 274388], # HLT_Ele27_WPTight_Gsf_v1, 312.374/pb
+        [274420, 274422], # HLT_Ele27_WPTight_Gsf_v1, 359.125/pb
+        [274440, 274442], # HLT_Ele27_WPTight_Gsf_v1, 226.466/pb
+        [274954, 274955], # HLT_Ele27_WPTight_Gsf_v2, 5.735/pb
+        [274968, 274971], # HLT_Ele27_WPTight_Gsf_v2, 422.272/pb
+        [274998, 275001], # HLT_Ele27_WPTight_Gsf_v2, 489.252/pb
+        [275059, 275059], # HLT_Ele27_WPTight_Gsf_v2, 6.094/pb
+        [275066, 275068], # HLT_Ele27_WPTight_Gsf_v2/HLT_Ele27_WPTight_Gsf_v3, 231.774/pb
+        [275073, 275074], # HLT_Ele27_WPTight_Gsf_v3, 144.124/pb
+        [275124, 275125], # HLT_Ele27_WPTight_Gsf_v3, 205.394/pb
+        [275282, 275284], # HLT_Ele27_WPTight_Gsf_v3, 49.295/pb
+        [275290, 275293], # HLT_Ele27_WPTight_Gsf_v3, 94.338/pb
+        [275309, 275311], # HLT_Ele27_WPTight_Gsf_v3, 411.084/pb
+        [275319, 275319], # HLT_Ele27_WPTight_Gsf_v4, 24.399/pb
+        [275337, 275338], # HLT_Ele27_WPTight_Gsf_v4, 143.358/pb
+        [275344, 275345], # HLT_Ele27_WPTight_Gsf_v4, 109.524/pb
+        [275370, 275371], # HLT_Ele27_WPTight_Gsf_v4, 145.599/pb
+        [275375, 275376], # HLT_Ele27_WPTight_Gsf_v4, 528.636/pb
+        [275657, 275659], # HLT_Ele27_WPTight_Gsf_v4, 80.874/pb
+        [275761, 275761], # HLT_Ele27_WPTight_Gsf_v4, 1.667/pb
+        [275767, 275767], # HLT_Ele27_WPTight_Gsf_v4, 0.714/pb
+        [275772, 275774], # HLT_Ele27_WPTight_Gsf_v4, 66.444/pb
+        [275776, 275778], # HLT_Ele27_WPTight_Gsf_v4, 116.898/pb
+        [275782, 275782], # HLT_Ele27_WPTight_Gsf_v4, 99.533/pb
+        [275832, 275837], # HLT_Ele27_WPTight_Gsf_v4, 441.03/pb
+        [275847, 275847], # HLT_Ele27_WPTight_Gsf_v4, 198.947/pb
+        [275886, 275886], # HLT_Ele27_WPTight_Gsf_v4, 7.581/pb
+        [275890, 275890], # HLT_Ele27_WPTight_Gsf_v4, 235.22/pb
+        [275911, 275913], # HLT_Ele27_WPTight_Gsf_v4, 201.741/pb
+        [275918, 275918], # HLT_Ele27_WPTight_Gsf_v4, 49.71/pb
+        [275920, 275921], # HLT_Ele27_WPTight_Gsf_v4, 62.257/pb
+        [275923, 275923], # HLT_Ele27_WPTight_Gsf_v4, 14.5/pb
+        [275931, 275931], # HLT_Ele27_WPTight_Gsf_v4, 10.418/pb
+        [275963, 275963], # HLT_Ele27_WPTight_Gsf_v4, 19.553/pb
+        [276092, 276092], # HLT_Ele27_WPTight_Gsf_v4, 14.768/pb
+        [276097, 276097], # HLT_Ele27_WPTight_Gsf_v4, 99.405/pb
+        [276242, 276244], # HLT_Ele27_WPTight_Gsf_v4, 479.052/pb
+        [276282, 276283], # HLT_Ele27_WPTight_Gsf_v4, 372.59/pb
+        [276315, 276315], # HLT_Ele27_WPTight_Gsf_v4, 34.051/pb
+        [276317, 276318], # HLT_Ele27_WPTight_Gsf_v4, 124.306/pb
+        [276355, 276355], # HLT_Ele27_WPTight_Gsf_v4, 6.205/pb
+        [276361, 276361], # HLT_Ele27_WPTight_Gsf_v4, 149.465/pb
+        [276363, 276363], # HLT_Ele27_WPTight_Gsf_v4, 206.376/pb
+        [276384, 276384], # HLT_Ele27_WPTight_Gsf_v4, 121.517/pb
+        [276437, 276437], # HLT_Ele27_WPTight_Gsf_v4, 355.688/pb
+        [276454, 276454], # HLT_Ele27_WPTight_Gsf_v4, 63.924/pb
+        [276458, 276458], # HLT_Ele27_WPTight_Gsf_v4, 33.169/pb
+        [276495, 276495], # HLT_Ele27_WPTight_Gsf_v4, 38.062/pb
+        [276501, 276502], # HLT_Ele27_WPTight_Gsf_v4, 486.891/pb
+        [276525, 276525], # HLT_Ele27_WPTight_Gsf_v4, 402.663/pb
+        [276527, 276528], # HLT_Ele27_WPTight_Gsf_v4, 60.758/pb
+        [276542, 276545], # HLT_Ele27_WPTight_Gsf_v4, 345.204/pb
+        [276581, 276587], # HLT_Ele27_WPTight_Gsf_v4, 471.493/pb
+        [276653, 276653], # HLT_Ele27_WPTight_Gsf_v4, 86.12/pb
+        [276655, 276655], # HLT_Ele27_WPTight_Gsf_v4, 160.843/pb
+        [276659, 276659], # HLT_Ele27_WPTight_Gsf_v4, 29.939/pb
+        [276775, 276776], # HLT_Ele27_WPTight_Gsf_v4, 443.702/pb
+        [276794, 276794], # HLT_Ele27_WPTight_Gsf_v4, 87.206/pb
+        [276807, 276808], # HLT_Ele27_WPTight_Gsf_v4, 188.301/pb
+        [276810, 276811], # HLT_Ele27_WPTight_Gsf_v4, 346.409/pb
+        [276831, 276831], # HLT_Ele27_WPTight_Gsf_v4, 400.298/pb
+        [276834, 276834], # HLT_Ele27_WPTight_Gsf_v4, 72.6/pb
+        [276870, 276870], # HLT_Ele27_WPTight_Gsf_v5, 526.587/pb
+        [276935, 276935], # HLT_Ele27_WPTight_Gsf_v5, 169.998/pb
+        [276940, 276940], # HLT_Ele27_WPTight_Gsf_v5, 28.701/pb
+        [276946, 276948], # HLT_Ele27_WPTight_Gsf_v5, 114.81/pb
+        [276950, 276950], # HLT_Ele27_WPTight_Gsf_v5, 323.179/pb
+        [277069, 277073], # HLT_Ele27_WPTight_Gsf_v5, 390.296/pb
+        [277076, 277076], # HLT_Ele27_WPTight_Gsf_v5, 125.929/pb
+        [277087, 277087], # HLT_Ele27_WPTight_Gsf_v5, 86.357/pb
+        [277094, 277094], # HLT_Ele27_WPTight_Gsf_v5, 131.103/pb
+        [277096, 277096], # HLT_Ele27_WPTight_Gsf_v5, 320.668/pb
+        [277112, 277112], # HLT_Ele27_WPTight_Gsf_v5, 17.339/pb
+        [277126, 277127], # HLT_Ele27_WPTight_Gsf_v5, 185.976/pb
+        [277148, 277148], # HLT_Ele27_WPTight_Gsf_v5, 128.192/pb
+        [277166, 277166], # HLT_Ele27_WPTight_Gsf_v5, 70.666/pb
+        [277168, 277168], # HLT_Ele27_WPTight_Gsf_v5, 318.998/pb
+        [277180, 277180], # HLT_Ele27_WPTight_Gsf_v5, 31.25/pb
+        [277194, 277194], # HLT_Ele27_WPTight_Gsf_v5, 367.175/pb
+        [277305, 277305], # HLT_Ele27_WPTight_Gsf_v5, 154.262/pb
+        [277420, 277420], # HLT_Ele27_WPTight_Gsf_v5, 60.844/pb
+        [277981, 277981], # HLT_Ele27_WPTight_Gsf_v5, 4.601/pb
+        [277991, 277992], # HLT_Ele27_WPTight_Gsf_v5, 21.692/pb
+        [278017, 278018], # HLT_Ele27_WPTight_Gsf_v5, 338.894/pb
+        [278167, 278167], # HLT_Ele27_WPTight_Gsf_v5, 314.532/pb
+        [278175, 278175], # HLT_Ele27_WPTight_Gsf_v5, 9.045/pb
+        [278193, 278193], # HLT_Ele27_WPTight_Gsf_v5, 34.581/pb
+        [278239, 278240], # HLT_Ele27_WPTight_Gsf_v5, 330.009/pb
+        [278273, 278274], # HLT_Ele27_WPTight_Gsf_v6, 23.87/pb
+        [278288, 278290], # HLT_Ele27_WPTight_Gsf_v6, 14.747/pb
+        [278308, 278308], # HLT_Ele27_WPTight_Gsf_v6, 313.102/pb
+        [278310, 278310], # HLT_Ele27_WPTight_Gsf_v6, 88.422/pb
+        [278315, 278315], # HLT_Ele27_WPTight_Gsf_v6, 137.45/pb
+        [278345, 278346], # HLT_Ele27_WPTight_Gsf_v6, 171.231/pb
+        [278349, 278349], # HLT_Ele27_WPTight_Gsf_v6, 94.737/pb
+        [278366, 278366], # HLT_Ele27_WPTight_Gsf_v6, 59.423/pb
+        [278406, 278406], # HLT_Ele27_WPTight_Gsf_v6, 296.962/pb
+        [278509, 278509], # HLT_Ele27_WPTight_Gsf_v6, 273.442/pb
+        [278769, 278770], # HLT_Ele27_WPTight_Gsf_v6, 170.993/pb
+        [278801, 278805], # HLT_Ele27_WPTight_Gsf_v6, 137.142/pb
+        [278808, 278808], # HLT_Ele27_WPTight_Gsf_v6, 269.634/pb
+        [278820, 278820], # HLT_Ele27_WPTight_Gsf_v6, 286.511/pb
+        [278822, 278822], # HLT_Ele27_WPTight_Gsf_v6, 191.158/pb
+        [278873, 278875], # HLT_Ele27_WPTight_Gsf_v6, 198.657/pb
+        [278923, 278923], # HLT_Ele27_WPTight_Gsf_v6, 98.543/pb
+        [278957, 278957], # HLT_Ele27_WPTight_Gsf_v6, 36.164/pb
+        [278962, 278963], # HLT_Ele27_WPTight_Gsf_v6, 113.024/pb
+        [278969, 278969], # HLT_Ele27_WPTight_Gsf_v6, 282.492/pb
+        [278975, 278976], # HLT_Ele27_WPTight_Gsf_v6, 122.556/pb
+        [278986, 278986], # HLT_Ele27_WPTight_Gsf_v6, 31.548/pb
+        [279024, 279024], # HLT_Ele27_WPTight_Gsf_v6, 49.596/pb
+        [279029, 279029], # HLT_Ele27_WPTight_Gsf_v6, 38.088/pb
+        [279071, 279071], # HLT_Ele27_WPTight_Gsf_v6, 22.581/pb
+        [279080, 279080], # HLT_Ele27_WPTight_Gsf_v6, 12.773/pb
+        [279115, 279116], # HLT_Ele27_WPTight_Gsf_v6, 174.938/pb
+        [279479, 279479], # HLT_Ele27_WPTight_Gsf_v6, 5.927/pb
+        [279588, 279588], # HLT_Ele27_WPTight_Gsf_v6, 228.517/pb
+        [279653, 279654], # HLT_Ele27_WPTight_Gsf_v6, 283.775/pb
+        [279656, 279656], # HLT_Ele27_WPTight_Gsf_v6, 5.684/pb
+        [279658, 279658], # HLT_Ele27_WPTight_Gsf_v6, 93.394/pb
+        [279667, 279667], # HLT_Ele27_WPTight_Gsf_v6, 208.732/pb
+        [279681, 279685], # HLT_Ele27_WPTight_Gsf_v6, 74.528/pb
+        [279691, 279691], # HLT_Ele27_WPTight_Gsf_v6, 9.656/pb
+        [279694, 279694], # HLT_Ele27_WPTight_Gsf_v6, 406.418/pb
+        [279715, 279716], # HLT_Ele27_WPTight_Gsf_v6, 383.763/pb
+        [279760, 279760], # HLT_Ele27_WPTight_Gsf_v6, 153.502/pb
+        [279766, 279767], # HLT_Ele27_WPTight_Gsf_v6, 358.144/pb
+        [279794, 279794], # HLT_Ele27_WPTight_Gsf_v6, 223.093/pb
+        [279823, 279823], # HLT_Ele27_WPTight_Gsf_v6, 81.828/pb
+        [279841, 279841], # HLT_Ele27_WPTight_Gsf_v6, 380.359/pb
+        [279844, 279844], # HLT_Ele27_WPTight_Gsf_v6, 56.588/pb
+        [279887, 279887], # HLT_Ele27_WPTight_Gsf_v6, 73.316/pb
+        [279931, 279931], # HLT_Ele27_WPTight_Gsf_v6, 475.316/pb
+        [279966, 279966], # HLT_Ele27_WPTight_Gsf_v6, 93.011/pb
+        [279975, 279975], # HLT_Ele27_WPTight_Gsf_v6, 239.011/pb
+        [279993, 279994], # HLT_Ele27_WPTight_Gsf_v6, 30.455/pb
+        [280013, 280013], # HLT_Ele27_WPTight_Gsf_v6, 5.636/pb
+        [280015, 280018], # HLT_Ele27_WPTight_Gsf_v6, 398.79/pb
+        [280020, 280020], # HLT_Ele27_WPTight_Gsf_v6, 4.614/pb
+        [280024, 280024], # HLT_Ele27_WPTight_Gsf_v6, 41.841/pb
+        [280187, 280188], # HLT_Ele27_WPTight_Gsf_v6, 74.778/pb
+        [280191, 280191], # HLT_Ele27_WPTight_Gsf_v6, 178.951/pb
+        [280194, 280194], # HLT_Ele27_WPTight_Gsf_v6, 36.665/pb
+        [280242, 280242], # HLT_Ele27_WPTight_Gsf_v6, 147.69/pb
+        [280249, 280249], # HLT_Ele27_WPTight_Gsf_v6, 239.16/pb
+        [280251, 280251], # HLT_Ele27_WPTight_Gsf_v6, 47.176/pb
+        [280327, 280327], # HLT_Ele27_WPTight_Gsf_v6, 8.719/pb
+        [280330, 280330], # HLT_Ele27_WPTight_Gsf_v6, 185.776/pb
+        [280349, 280349], # HLT_Ele27_WPTight_Gsf_v6, 104.129/pb
+        [280363, 280364], # HLT_Ele27_WPTight_Gsf_v6, 205.282/pb
+        [280383, 280385], # HLT_Ele27_WPTight_Gsf_v6, 372.972/pb
+        [281613, 281613], # HLT_Ele27_WPTight_Gsf_v7, 9.764/pb
+        [281639, 281639], # HLT_Ele27_WPTight_Gsf_v7, 18.977/pb
+        [281641, 281641], # HLT_Ele27_WPTight_Gsf_v7, 39.268/pb
+        [281693, 281693], # HLT_Ele27_WPTight_Gsf_v7, 376.118/pb
+        [281707, 281707], # HLT_Ele27_WPTight_Gsf_v7, 214.55/pb
+        [281726, 281727], # HLT_Ele27_WPTight_Gsf_v7, 251.373/pb
+        [281797, 281797], # HLT_Ele27_WPTight_Gsf_v7, 397.836/pb
+        [281975, 281976], # HLT_Ele27_WPTight_Gsf_v7, 393.967/pb
+        [282033, 282035], # HLT_Ele27_WPTight_Gsf_v7, 26.293/pb
+        [282037, 282037], # HLT_Ele27_WPTight_Gsf_v7, 331.413/pb
+        [282092, 282092], # HLT_Ele27_WPTight_Gsf_v7, 296.762/pb
+        [282708, 282708], # HLT_Ele27_WPTight_Gsf_v7, 2.118/pb
+        [282710, 282710], # HLT_Ele27_WPTight_Gsf_v7, 0.346/pb
+        [282712, 282712], # HLT_Ele27_WPTight_Gsf_v7, 16.683/pb
+        [282730, 282735], # HLT_Ele27_WPTight_Gsf_v7, 469.07/pb
+        [282800, 282800], # HLT_Ele27_WPTight_Gsf_v7, 93.58/pb
+        [282807, 282807], # HLT_Ele27_WPTight_Gsf_v7, 70.563/pb
+        [282814, 282814], # HLT_Ele27_WPTight_Gsf_v7, 276.224/pb
+        [282842, 282842], # HLT_Ele27_WPTight_Gsf_v7, 23.509/pb
+        [282917, 282919], # HLT_Ele27_WPTight_Gsf_v7, 88.074/pb
+        [282922, 282923], # HLT_Ele27_WPTight_Gsf_v7, 66.001/pb
+        [283042, 283043], # HLT_Ele27_WPTight_Gsf_v7, 118.119/pb
+        [283049, 283050], # HLT_Ele27_WPTight_Gsf_v7, 61.072/pb
+        [283052, 283052], # HLT_Ele27_WPTight_Gsf_v7, 28.777/pb
+        [283059, 283059], # HLT_Ele27_WPTight_Gsf_v7, 98.778/pb
+        [283270, 283270], # HLT_Ele27_WPTight_Gsf_v7, 381.444/pb
+        [283283, 283283], # HLT_Ele27_WPTight_Gsf_v7, 197.444/pb
+        [283305, 283308], # HLT_Ele27_WPTight_Gsf_v7, 338.86/pb
+        [283353, 283353], # HLT_Ele27_WPTight_Gsf_v7, 191.088/pb
+        [283358, 283359], # HLT_Ele27_WPTight_Gsf_v7, 233.089/pb
+        [283407, 283408], # HLT_Ele27_WPTight_Gsf_v7, 466.833/pb
+        [283416, 283416], # HLT_Ele27_WPTight_Gsf_v7, 21.628/pb
+        [283453, 283453], # HLT_Ele27_WPTight_Gsf_v7, 123.278/pb
+        [283469, 283469], # HLT_Ele27_WPTight_Gsf_v7, 0.031/pb
+        [283478, 283478], # HLT_Ele27_WPTight_Gsf_v7, 210.23/pb
+        [283548, 283548], # HLT_Ele27_WPTight_Gsf_v7, 26.451/pb
+        [283680, 283682], # HLT_Ele27_WPTight_Gsf_v7, 102.814/pb
+        [283685, 283685], # HLT_Ele27_WPTight_Gsf_v7, 20.432/pb
+        [283820, 283820], # HLT_Ele27_WPTight_Gsf_v7, 259.058/pb
+        [283830, 283830], # HLT_Ele27_WPTight_Gsf_v7, 102.255/pb
+        [283834, 283835], # HLT_Ele27_WPTight_Gsf_v7, 20.323/pb
+        [283865, 283865], # HLT_Ele27_WPTight_Gsf_v7, 264.403/pb
+        [283876, 283877], # HLT_Ele27_WPTight_Gsf_v7, 409.447/pb
+        [283884, 283885], # HLT_Ele27_WPTight_Gsf_v7, 392.377/pb
+        [283933, 283934], # HLT_Ele27_WPTight_Gsf_v7, 309.793/pb
+        [283946, 283946], # HLT_Ele27_WPTight_Gsf_v7, 300.188/pb
+        [283964, 283964], # HLT_Ele27_WPTight_Gsf_v7, 58.698/pb
+        [284006, 284006], # HLT_Ele27_WPTight_Gsf_v7, 57.69/pb
+        [284014, 284014], # HLT_Ele27_WPTight_Gsf_v7, 47.826/pb
+        [284025, 284025], # HLT_Ele27_WPTight_Gsf_v7, 12.193/pb
+        [284029, 284029], # HLT_Ele27_WPTight_Gsf_v7, 29.941/pb
+        [284035, 284044], # HLT_Ele27_WPTight_Gsf_v7, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele25_eta2p1_WPTight_Gsf',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 50.239/pb
+        [273302, 273302], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 16.319/pb
+        [273402, 273406], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 13.589/pb
+        [273408, 273411], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 13.087/pb
+        [273425, 273425], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 26.717/pb
+        [273446, 273450], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 94.292/pb
+        [273492, 273494], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 30.924/pb
+        [273502, 273503], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 72.147/pb
+        [273554, 273555], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 38.827/pb
+        [273725, 273725], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 154.653/pb
+        [273728, 273728], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 4.897/pb
+        [273730, 273730], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 86.49/pb
+        [274094, 274094], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 9.735/pb
+        [274146, 274146], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 5.12/pb
+        [274157, 274157], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 38.994/pb
+        [274159, 274161], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 62.883/pb
+        [274172, 274172], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 5.249/pb
+        [274198, 274200], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 135.972/pb
+        [274240, 274241], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 134.472/pb
+        [274244, 274244], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 56.348/pb
+        [274250, 274251], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 159.993/pb
+        [274283, 274284], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 30.266/pb
+        [274286, 274286], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 21.668/pb
+        [274314, 274317], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 206.7/pb
+        [274319, 274319], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 27.302/pb
+        [274335, 274339], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 246.003/pb
+        [274344, 274345], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 87.68/pb
+        [274382, 274382], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 7.428/pb
+        [274387, 274388], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 312.374/pb
+        [274420, 274422], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 359.125/pb
+        [274440, 274442], # HLT_Ele25_eta2p1_WPTight_Gsf_v1, 226.466/pb
+        [274954, 274955], # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 5.735/pb
+        [274968, 274971], # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 422.272/pb
+        [274998, 275001], # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 489.252/pb
+        [275059, 275059], # HLT_Ele25_eta2p1_WPTight_Gsf_v2, 6.094/pb
+        [275066, 275068], # HLT_Ele25_eta2p1_WPTight_Gsf_v2/HLT_Ele25_eta2p1_WPTight_Gsf_v3, 231.774/pb
+        [275073, 275074], # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 144.124/pb
+        [275124, 275125], # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 205.394/pb
+        [275282, 275284], # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 49.295/pb
+        [275290, 275293], # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 94.338/pb
+        [275309, 275311], # HLT_Ele25_eta2p1_WPTight_Gsf_v3, 411.084/pb
+        [275319, 275319], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 24.399/pb
+        [275337, 275338], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 143.358/pb
+        [275344, 275345], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 109.524/pb
+        [275370, 275371], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 145.599/pb
+        [275375, 275376], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 528.636/pb
+        [275657, 275659], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 80.874/pb
+        [275761, 275761], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 1.667/pb
+        [275767, 275767], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 0.714/pb
+        [275772, 275774], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 66.444/pb
+        [275776, 275778], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 116.898/pb
+        [275782, 275782], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 99.533/pb
+        [275832, 275837], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 441.03/pb
+        [275847, 275847], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 198.947/pb
+        [275886, 275886], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 7.581/pb
+        [275890, 275890], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 235.22/pb
+        [275911, 275913], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 201.741/pb
+        [275918, 275918], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 49.71/pb
+        [275920, 275921], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 62.257/pb
+        [275923, 275923], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 14.5/pb
+        [275931, 275931], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 10.418/pb
+        [275963, 275963], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 19.553/pb
+        [276092, 276092], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 14.768/pb
+        [276097, 276097], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 99.405/pb
+        [276242, 276244], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 479.052/pb
+        [276282, 276283], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 372.59/pb
+        [276315, 276315], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 34.051/pb
+        [276317, 276318], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 124.306/pb
+        [276355, 276355], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 6.205/pb
+        [276361, 276361], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 149.465/pb
+        [276363, 276363], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 206.376/pb
+        [276384, 276384], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 121.517/pb
+        [276437, 276437], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 355.688/pb
+        [276454, 276454], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 63.924/pb
+        [276458, 276458], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 33.169/pb
+        [276495, 276495], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 38.062/pb
+        [276501, 276502], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 486.891/pb
+        [276525, 276525], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 402.663/pb
+        [276527, 276528], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 60.758/pb
+        [276542, 276545], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 345.204/pb
+        [276581, 276587], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 471.493/pb
+        [276653, 276653], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 86.12/pb
+        [276655, 276655], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 160.843/pb
+        [276659, 276659], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 29.939/pb
+        [276775, 276776], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 443.702/pb
+        [276794, 276794], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 87.206/pb
+        [276807, 276808], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 188.301/pb
+        [276810, 276811], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 346.409/pb
+        [276831, 276831], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 400.298/pb
+        [276834, 276834], # HLT_Ele25_eta2p1_WPTight_Gsf_v4, 72.6/pb
+        [276870, 276870], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 526.587/pb
+        [276935, 276935], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 169.998/pb
+        [276940, 276940], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 28.701/pb
+        [276946, 276948], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 114.81/pb
+        [276950, 276950], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 323.179/pb
+        [277069, 277073], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 390.296/pb
+        [277076, 277076], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 125.929/pb
+        [277087, 277087], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 86.357/pb
+        [277094, 277094], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 131.103/pb
+        [277096, 277096], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 320.668/pb
+        [277112, 277112], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 17.339/pb
+        [277126, 277127], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 185.976/pb
+        [277148, 277148], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 128.192/pb
+        [277166, 277166], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 70.666/pb
+        [277168, 277168], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 318.998/pb
+        [277180, 277180], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 31.25/pb
+        [277194, 277194], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 367.175/pb
+        [277305, 277305], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 154.262/pb
+        [277420, 277420], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 60.844/pb
+        [277981, 277981], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 4.601/pb
+        [277991, 277992], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 21.692/pb
+        [278017, 278018], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 338.894/pb
+        [278167, 278167], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 314.532/pb
+        [278175, 278175], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 9.045/pb
+        [278193, 278193], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 34.581/pb
+        [278239, 278240], # HLT_Ele25_eta2p1_WPTight_Gsf_v5, 330.009/pb
+        [278273, 278274], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 23.87/pb
+        [278288, 278290], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 14.747/pb
+        [278308, 278308], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 313.102/pb
+        [278310, 278310], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 88.422/pb
+        [278315, 278315], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 137.45/pb
+        [278345, 278346], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 171.231/pb
+        [278349, 278349], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 94.737/pb
+        [278366, 278366], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 59.423/pb
+        [278406, 278406], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 296.962/pb
+        [278509, 278509], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 273.442/pb
+        [278769, 278770], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 170.993/pb
+        [278801, 278805], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 137.142/pb
+        [278808, 278808], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 269.634/pb
+        [278820, 278820], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 286.511/pb
+        [278822, 278822], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 191.158/pb
+        [278873, 278875], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 198.657/pb
+        [278923, 278923], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 98.543/pb
+        [278957, 278957], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 36.164/pb
+        [278962, 278963], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 113.024/pb
+        [278969, 278969], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 282.492/pb
+        [278975, 278976], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 122.556/pb
+        [278986, 278986], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 31.548/pb
+        [279024, 279024], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 49.596/pb
+        [279029, 279029], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 38.088/pb
+        [279071, 279071], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 22.581/pb
+        [279080, 279080], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 12.773/pb
+        [279115, 279116], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 174.938/pb
+        [279479, 279479], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 5.927/pb
+        [279588, 279588], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 228.517/pb
+        [279653, 279654], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 283.775/pb
+        [279656, 279656], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 5.684/pb
+        [279658, 279658], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 93.394/pb
+        [279667, 279667], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 208.732/pb
+        [279681, 279685], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 74.528/pb
+        [279691, 279691], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 9.656/pb
+        [279694, 279694], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 406.418/pb
+        [279715, 279716], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 383.763/pb
+        [279760, 279760], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 153.502/pb
+        [279766, 279767], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 358.144/pb
+        [279794, 279794], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 223.093/pb
+        [279823, 279823], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 81.828/pb
+        [279841, 279841], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 380.359/pb
+        [279844, 279844], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 56.588/pb
+        [279887, 279887], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 73.316/pb
+        [279931, 279931], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 475.316/pb
+        [279966, 279966], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 93.011/pb
+        [279975, 279975], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 239.011/pb
+        [279993, 279994], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 30.455/pb
+        [280013, 280013], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 5.636/pb
+        [280015, 280018], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 398.79/pb
+        [280020, 280020], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 4.614/pb
+        [280024, 280024], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 41.841/pb
+        [280187, 280188], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 74.778/pb
+        [280191, 280191], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 178.951/pb
+        [280194, 280194], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 36.665/pb
+        [280242, 280242], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 147.69/pb
+        [280249, 280249], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 239.16/pb
+        [280251, 280251], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 47.176/pb
+        [280327, 280327], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 8.719/pb
+        [280330, 280330], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 185.776/pb
+        [280349, 280349], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 104.129/pb
+        [280363, 280364], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 205.282/pb
+        [280383, 280385], # HLT_Ele25_eta2p1_WPTight_Gsf_v6, 372.972/pb
+        [281613, 281613], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 9.764/pb
+        [281639, 281639], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 18.977/pb
+        [281641, 281641], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 39.268/pb
+        [281693, 281693], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 376.118/pb
+        [281707, 281707], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 214.55/pb
+        [281726, 281727], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 251.373/pb
+        [281797, 281797], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 397.836/pb
+        [281975, 281976], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 393.967/pb
+        [282033, 282035], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 26.293/pb
+        [282037, 282037], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 331.413/pb
+        [282092, 282092], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 296.762/pb
+        [282708, 282708], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 2.118/pb
+        [282710, 282710], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 0.346/pb
+        [282712, 282712], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 16.683/pb
+        [282730, 282735], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 469.07/pb
+        [282800, 282800], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 93.58/pb
+        [282807, 282807], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 70.563/pb
+        [282814, 282814], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 276.224/pb
+        [282842, 282842], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 23.509/pb
+        [282917, 282919], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 88.074/pb
+        [282922, 282923], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 66.001/pb
+        [283042, 283043], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 118.119/pb
+        [283049, 283050], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 61.072/pb
+        [283052, 283052], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 28.777/pb
+        [283059, 283059], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 98.778/pb
+        [283270, 283270], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 381.444/pb
+        [283283, 283283], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 197.444/pb
+        [283305, 283308], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 338.86/pb
+        [283353, 283353], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 191.088/pb
+        [283358, 283359], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 233.089/pb
+        [283407, 283408], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 466.833/pb
+        [283416, 283416], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 21.628/pb
+        [283453, 283453], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 123.278/pb
+        [283469, 283469], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 0.031/pb
+        [283478, 283478], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 210.23/pb
+        [283548, 283548], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 26.451/pb
+        [283680, 283682], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 102.814/pb
+        [283685, 283685], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 20.432/pb
+        [283820, 283820], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 259.058/pb
+        [283830, 283830], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 102.255/pb
+        [283834, 283835], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 20.323/pb
+        [283865, 283865], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 264.403/pb
+        [283876, 283877], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 409.447/pb
+        [283884, 283885], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 392.377/pb
+        [283933, 283934], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 309.793/pb
+        [283946, 283946], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 300.188/pb
+        [283964, 283964], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 58.698/pb
+        [284006, 284006], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 57.69/pb
+        [284014, 284014], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 47.826/pb
+        [284025, 284025], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 12.193/pb
+        [284029, 284029], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 29.941/pb
+        [284035, 284044], # HLT_Ele25_eta2p1_WPTight_Gsf_v7, 303.58/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele27_eta2p1_WPLoose_Gsf',
+      'unprescaled' : False, # heavily prescaled in run H
+      'runs'        : [
+        [273158, 273158], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 50.239/pb
+        [273302, 273302], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 16.319/pb
+        [273402, 273406], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 13.589/pb
+        [273408, 273411], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 13.087/pb
+        [273425, 273425], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 26.717/pb
+        [273446, 273450], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 94.292/pb
+        [273492, 273494], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 30.924/pb
+        [273502, 273503], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 72.147/pb
+        [273554, 273555], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 38.827/pb
+        [273725, 273725], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 154.653/pb
+        [273728, 273728], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 4.897/pb
+        [273730, 273730], # HLT_Ele27_eta2p1_WPLoose_Gsf_v2, 86.49/pb
+        [274094, 274094], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 9.735/pb
+        [274146, 274146], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 5.12/pb
+        [274157, 274157], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 38.994/pb
+        [274159, 274161], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 62.883/pb
+        [274172, 274172], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 5.249/pb
+        [274198, 274200], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 135.972/pb
+        [274240, 274241], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 134.472/pb
+        [274244, 274244], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 56.348/pb
+        [274250, 274251], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 159.993/pb
+        [274283, 274284], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 30.266/pb
+        [274286, 274286], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 21.668/pb
+        [274314, 274317], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 206.7/pb
+        [274319, 274319], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 27.302/pb
+        [274335, 274339], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 246.003/pb
+        [274344, 274345], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 87.68/pb
+        [274382, 274382], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 7.428/pb
+        [274387, 274388], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 312.374/pb
+        [274420, 274422], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 359.125/pb
+        [274440, 274442], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 226.466/pb
+        [274954, 274955], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 5.735/pb
+        [274968, 274971], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 422.272/pb
+        [274998, 275001], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 489.252/pb
+        [275059, 275059], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3, 6.094/pb
+        [275066, 275068], # HLT_Ele27_eta2p1_WPLoose_Gsf_v3/HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 231.774/pb
+        [275073, 275074], # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 144.124/pb
+        [275124, 275125], # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 205.394/pb
+        [275282, 275284], # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 49.295/pb
+        [275290, 275293], # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 94.338/pb
+        [275309, 275311], # HLT_Ele27_eta2p1_WPLoose_Gsf_v4, 411.084/pb
+        [275319, 275319], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 24.399/pb
+        [275337, 275338], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 143.358/pb
+        [275344, 275345], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 109.524/pb
+        [275370, 275371], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 145.599/pb
+        [275375, 275376], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 528.636/pb
+        [275657, 275659], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 80.874/pb
+        [275761, 275761], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 1.667/pb
+        [275767, 275767], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 0.714/pb
+        [275772, 275774], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 66.444/pb
+        [275776, 275778], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 116.898/pb
+        [275782, 275782], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 99.533/pb
+        [275832, 275837], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 441.03/pb
+        [275847, 275847], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 198.947/pb
+        [275886, 275886], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 7.581/pb
+        [275890, 275890], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 235.22/pb
+        [275911, 275913], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 201.741/pb
+        [275918, 275918], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 49.71/pb
+        [275920, 275921], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 62.257/pb
+        [275923, 275923], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 14.5/pb
+        [275931, 275931], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 10.418/pb
+        [275963, 275963], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 19.553/pb
+        [276092, 276092], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 14.768/pb
+        [276097, 276097], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 99.405/pb
+        [276242, 276244], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 479.052/pb
+        [276282, 276283], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 372.59/pb
+        [276315, 276315], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 34.051/pb
+        [276317, 276318], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 124.306/pb
+        [276355, 276355], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 6.205/pb
+        [276361, 276361], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 149.465/pb
+        [276363, 276363], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 206.376/pb
+        [276384, 276384], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 121.517/pb
+        [276437, 276437], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 355.688/pb
+        [276454, 276454], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 63.924/pb
+        [276458, 276458], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 33.169/pb
+        [276495, 276495], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 38.062/pb
+        [276501, 276502], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 486.891/pb
+        [276525, 276525], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 402.663/pb
+        [276527, 276528], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 60.758/pb
+        [276542, 276545], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 345.204/pb
+        [276581, 276587], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 471.493/pb
+        [276653, 276653], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 86.12/pb
+        [276655, 276655], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 160.843/pb
+        [276659, 276659], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 29.939/pb
+        [276775, 276776], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 443.702/pb
+        [276794, 276794], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 87.206/pb
+        [276807, 276808], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 188.301/pb
+        [276810, 276811], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 346.409/pb
+        [276831, 276831], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 400.298/pb
+        [276834, 276834], # HLT_Ele27_eta2p1_WPLoose_Gsf_v5, 72.6/pb
+        [276870, 276870], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 526.587/pb
+        [276935, 276935], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 169.998/pb
+        [276940, 276940], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 28.701/pb
+        [276946, 276948], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 114.81/pb
+        [276950, 276950], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 323.179/pb
+        [277069, 277073], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 390.296/pb
+        [277076, 277076], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 125.929/pb
+        [277087, 277087], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 86.357/pb
+        [277094, 277094], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 131.103/pb
+        [277096, 277096], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 320.668/pb
+        [277112, 277112], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 17.339/pb
+        [277126, 277127], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 185.976/pb
+        [277148, 277148], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 128.192/pb
+        [277166, 277166], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 70.666/pb
+        [277168, 277168], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 318.998/pb
+        [277180, 277180], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 31.25/pb
+        [277194, 277194], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 367.175/pb
+        [277305, 277305], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 154.262/pb
+        [277420, 277420], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 60.844/pb
+        [277981, 277981], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 4.601/pb
+        [277991, 277992], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 21.692/pb
+        [278017, 278018], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 338.894/pb
+        [278167, 278167], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 314.532/pb
+        [278175, 278175], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 9.045/pb
+        [278193, 278193], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 34.581/pb
+        [278239, 278240], # HLT_Ele27_eta2p1_WPLoose_Gsf_v6, 330.009/pb
+        [278273, 278274], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 23.87/pb
+        [278288, 278290], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 14.747/pb
+        [278308, 278308], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 313.102/pb
+        [278310, 278310], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 88.422/pb
+        [278315, 278315], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 137.45/pb
+        [278345, 278346], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 171.231/pb
+        [278349, 278349], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 94.737/pb
+        [278366, 278366], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 59.423/pb
+        [278406, 278406], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 296.962/pb
+        [278509, 278509], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 273.442/pb
+        [278769, 278770], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 170.993/pb
+        [278801, 278805], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 137.142/pb
+        [278808, 278808], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 269.634/pb
+        [278820, 278820], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 286.511/pb
+        [278822, 278822], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 191.158/pb
+        [278873, 278875], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 198.657/pb
+        [278923, 278923], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 98.543/pb
+        [278957, 278957], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 36.164/pb
+        [278962, 278963], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 113.024/pb
+        [278969, 278969], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 282.492/pb
+        [278975, 278976], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 122.556/pb
+        [278986, 278986], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 31.548/pb
+        [279024, 279024], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 49.596/pb
+        [279029, 279029], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 38.088/pb
+        [279071, 279071], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 22.581/pb
+        [279080, 279080], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 12.773/pb
+        [279115, 279116], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 174.938/pb
+        [279479, 279479], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 5.927/pb
+        [279588, 279588], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 228.517/pb
+        [279653, 279654], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 283.775/pb
+        [279656, 279656], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 5.684/pb
+        [279658, 279658], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 93.394/pb
+        [279667, 279667], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 208.732/pb
+        [279681, 279685], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 74.528/pb
+        [279691, 279691], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 9.656/pb
+        [279694, 279694], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 406.418/pb
+        [279715, 279716], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 383.763/pb
+        [279760, 279760], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 153.502/pb
+        [279766, 279767], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 358.144/pb
+        [279794, 279794], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 223.093/pb
+        [279823, 279823], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 81.828/pb
+        [279841, 279841], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 380.359/pb
+        [279844, 279844], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 56.588/pb
+        [279887, 279887], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 73.316/pb
+        [279931, 279931], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 475.316/pb
+        [279966, 279966], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 93.011/pb
+        [279975, 279975], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 239.011/pb
+        [279993, 279994], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 30.455/pb
+        [280013, 280013], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 5.636/pb
+        [280015, 280018], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 398.79/pb
+        [280020, 280020], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 4.614/pb
+        [280024, 280024], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 41.841/pb
+        [280187, 280188], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 74.778/pb
+        [280191, 280191], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 178.951/pb
+        [280194, 280194], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 36.665/pb
+        [280242, 280242], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 147.69/pb
+        [280249, 280249], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 239.16/pb
+        [280251, 280251], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 47.176/pb
+        [280327, 280327], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 8.719/pb
+        [280330, 280330], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 185.776/pb
+        [280349, 280349], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 104.129/pb
+        [280363, 280364], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 205.282/pb
+        [280383, 280385], # HLT_Ele27_eta2p1_WPLoose_Gsf_v7, 372.972/pb
+        [281613, 281613], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.039/pb
+        [281639, 281639], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.076/pb
+        [281641, 281641], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.157/pb
+        [281693, 281693], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.504/pb
+        [281707, 281707], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.858/pb
+        [281726, 281727], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.005/pb
+        [281797, 281797], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.591/pb
+        [281975, 281976], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.576/pb
+        [282033, 282035], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.105/pb
+        [282037, 282037], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.326/pb
+        [282092, 282092], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.187/pb
+        [282708, 282708], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.008/pb
+        [282710, 282710], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.346/pb
+        [282712, 282712], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.067/pb
+        [282730, 282735], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.876/pb
+        [282800, 282800], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.374/pb
+        [282807, 282807], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.282/pb
+        [282814, 282814], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.105/pb
+        [282842, 282842], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.094/pb
+        [282917, 282919], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.352/pb
+        [282922, 282923], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.264/pb
+        [283042, 283043], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.886/pb
+        [283049, 283050], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.244/pb
+        [283052, 283052], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.115/pb
+        [283059, 283059], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.395/pb
+        [283270, 283270], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.526/pb
+        [283283, 283283], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.79/pb
+        [283305, 283308], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.355/pb
+        [283353, 283353], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.764/pb
+        [283358, 283359], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.932/pb
+        [283407, 283408], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.867/pb
+        [283416, 283416], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.087/pb
+        [283453, 283453], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.493/pb
+        [283469, 283469], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.0/pb
+        [283478, 283478], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.841/pb
+        [283548, 283548], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.106/pb
+        [283680, 283682], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.411/pb
+        [283685, 283685], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.082/pb
+        [283820, 283820], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.036/pb
+        [283830, 283830], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.409/pb
+        [283834, 283835], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.081/pb
+        [283865, 283865], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.058/pb
+        [283876, 283877], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.638/pb
+        [283884, 283885], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.57/pb
+        [283933, 283934], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.239/pb
+        [283946, 283946], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.201/pb
+        [283964, 283964], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.235/pb
+        [284006, 284006], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.231/pb
+        [284014, 284014], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.191/pb
+        [284025, 284025], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.049/pb
+        [284029, 284029], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 0.12/pb
+        [284035, 284044], # HLT_Ele27_eta2p1_WPLoose_Gsf_v8, 1.214/pb
+      ],
+    },
+  ],
+  '1e_noiso' : [
+    {
+      'name'        : 'HLT_Ele105_CaloIdVT_GsfTrkIdT',
+      'unprescaled' : False, # prescaled in runs F, G, H
+      'runs'        : [
+        [273158, 273158], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 50.239/pb
+        [273302, 273302], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 16.319/pb
+        [273402, 273406], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 13.589/pb
+        [273408, 273411], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 13.087/pb
+        [273425, 273425], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 26.717/pb
+        [273446, 273450], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 94.292/pb
+        [273492, 273494], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 30.924/pb
+        [273502, 273503], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 72.147/pb
+        [273554, 273555], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 38.827/pb
+        [273725, 273725], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 154.653/pb
+        [273728, 273728], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 4.897/pb
+        [273730, 273730], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 86.49/pb
+        [274094, 274094], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 9.735/pb
+        [274146, 274146], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 5.12/pb
+        [274157, 274157], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 38.994/pb
+        [274159, 274161], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 62.883/pb
+        [274172, 274172], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 5.249/pb
+        [274198, 274200], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 135.972/pb
+        [274240, 274241], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 134.472/pb
+        [274244, 274244], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 56.348/pb
+        [274250, 274251], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 159.993/pb
+        [274283, 274284], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 30.266/pb
+        [274286, 274286], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 21.668/pb
+        [274314, 274317], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 206.7/pb
+        [274319, 274319], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 27.302/pb
+        [274335, 274339], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 246.003/pb
+        [274344, 274345], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 87.68/pb
+        [274382, 274382], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 7.428/pb
+        [274387, 274388], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 312.374/pb
+        [274420, 274422], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 359.125/pb
+        [274440, 274442], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v3, 226.466/pb
+        [274954, 274955], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v4, 5.735/pb
+        [274968, 274971], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v4, 422.272/pb
+        [274998, 275001], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v4, 489.252/pb
+        [275059, 275059], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v4, 6.094/pb
+        [275066, 275068], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v4/HLT_Ele105_CaloIdVT_GsfTrkIdT_v5, 231.774/pb
+        [275073, 275074], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v5, 144.124/pb
+        [275124, 275125], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v5, 205.394/pb
+        [275282, 275284], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v5, 49.295/pb
+        [275290, 275293], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v5, 94.338/pb
+        [275309, 275311], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v5, 411.084/pb
+        [275319, 275319], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 24.399/pb
+        [275337, 275338], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 143.358/pb
+        [275344, 275345], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 109.524/pb
+        [275370, 275371], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 145.599/pb
+        [275375, 275376], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 528.636/pb
+        [275657, 275659], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 80.874/pb
+        [275761, 275761], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 1.667/pb
+        [275767, 275767], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 0.714/pb
+        [275772, 275774], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 66.444/pb
+        [275776, 275778], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 116.898/pb
+        [275782, 275782], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 99.533/pb
+        [275832, 275837], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 441.03/pb
+        [275847, 275847], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 198.947/pb
+        [275886, 275886], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 7.581/pb
+        [275890, 275890], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 235.22/pb
+        [275911, 275913], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 201.741/pb
+        [275918, 275918], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 49.71/pb
+        [275920, 275921], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 62.257/pb
+        [275923, 275923], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 14.5/pb
+        [275931, 275931], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 10.418/pb
+        [275963, 275963], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 19.553/pb
+        [276092, 276092], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 14.768/pb
+        [276097, 276097], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 99.405/pb
+        [276242, 276244], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 479.052/pb
+        [276282, 276283], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 372.59/pb
+        [276315, 276315], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 34.051/pb
+        [276317, 276318], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 124.306/pb
+        [276355, 276355], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 6.205/pb
+        [276361, 276361], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 149.465/pb
+        [276363, 276363], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 206.376/pb
+        [276384, 276384], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 121.517/pb
+        [276437, 276437], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 355.688/pb
+        [276454, 276454], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 63.924/pb
+        [276458, 276458], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 33.169/pb
+        [276495, 276495], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 38.062/pb
+        [276501, 276502], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 486.891/pb
+        [276525, 276525], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 402.663/pb
+        [276527, 276528], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 60.758/pb
+        [276542, 276545], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 345.204/pb
+        [276581, 276587], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 471.493/pb
+        [276653, 276653], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 86.12/pb
+        [276655, 276655], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 160.843/pb
+        [276659, 276659], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 29.939/pb
+        [276775, 276776], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 443.702/pb
+        [276794, 276794], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 87.206/pb
+        [276807, 276808], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 188.301/pb
+        [276810, 276811], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 346.409/pb
+        [276831, 276831], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 400.298/pb
+        [276834, 276834], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v6, 72.6/pb
+        [276870, 276870], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 526.587/pb
+        [276935, 276935], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 169.998/pb
+        [276940, 276940], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 28.701/pb
+        [276946, 276948], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 114.81/pb
+        [276950, 276950], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 323.179/pb
+        [277069, 277073], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 390.296/pb
+        [277076, 277076], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 125.929/pb
+        [277087, 277087], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 86.357/pb
+        [277094, 277094], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 131.103/pb
+        [277096, 277096], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 320.668/pb
+        [277112, 277112], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 17.339/pb
+        [277126, 277127], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 185.976/pb
+        [277148, 277148], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 128.192/pb
+        [277166, 277166], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 70.666/pb
+        [277168, 277168], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 318.998/pb
+        [277180, 277180], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 31.25/pb
+        [277194, 277194], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 367.175/pb
+        [277305, 277305], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 154.262/pb
+        [277420, 277420], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 60.844/pb
+        [277981, 277981], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 4.601/pb
+        [277991, 277992], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 21.692/pb
+        [278017, 278018], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 338.894/pb
+        [278167, 278167], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 314.532/pb
+        [278175, 278175], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 9.045/pb
+        [278193, 278193], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 34.581/pb
+        [278239, 278240], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 330.009/pb
+        [278308, 278308], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 76.214/pb
+        [278310, 278310], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 88.422/pb
+        [278346, 278346], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 1.065/pb
+        [278349, 278349], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 94.737/pb
+        [278366, 278366], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 59.423/pb
+        [278406, 278406], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 106.479/pb
+        [278509, 278509], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 83.12/pb
+        [278804, 278804], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 0.747/pb
+        [278808, 278808], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 206.429/pb
+        [278820, 278820], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 92.947/pb
+        [278822, 278822], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 191.158/pb
+        [278874, 278875], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 126.83/pb
+        [278969, 278969], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 43.975/pb
+        [278975, 278976], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 122.556/pb
+        [279024, 279024], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 49.039/pb
+        [279029, 279029], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 38.088/pb
+        [279071, 279071], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 22.581/pb
+        [279080, 279080], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 11.815/pb
+        [279115, 279115], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 14.592/pb
+        [279479, 279479], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 3.739/pb
+        [279588, 279588], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 45.139/pb
+        [279654, 279654], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 69.728/pb
+        [279656, 279656], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 5.684/pb
+        [279658, 279658], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 93.394/pb
+        [279694, 279694], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 181.401/pb
+        [279716, 279716], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 189.552/pb
+        [279766, 279767], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 276.919/pb
+        [279841, 279841], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 145.283/pb
+        [279931, 279931], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 264.252/pb
+        [280016, 280018], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 282.67/pb
+        [280020, 280020], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 4.614/pb
+        [280024, 280024], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 41.841/pb
+        [280191, 280191], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 29.849/pb
+        [280194, 280194], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 34.566/pb
+        [280249, 280249], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 160.486/pb
+        [280251, 280251], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 47.176/pb
+        [280349, 280349], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 76.712/pb
+        [280363, 280364], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 204.989/pb
+        [280385, 280385], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v7, 154.134/pb
+        [281613, 281613], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 8.92/pb
+        [281693, 281693], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 186.462/pb
+        [281726, 281727], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 243.997/pb
+        [281797, 281797], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 150.794/pb
+        [281976, 281976], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 193.249/pb
+        [282037, 282037], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 148.705/pb
+        [282092, 282092], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 175.119/pb
+        [282710, 282710], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 0.346/pb
+        [282735, 282735], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 211.341/pb
+        [282814, 282814], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 199.57/pb
+        [282923, 282923], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 1.025/pb
+        [283042, 283042], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 1.419/pb
+        [283270, 283270], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 83.337/pb
+        [283283, 283283], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 197.444/pb
+        [283308, 283308], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 92.999/pb
+        [283358, 283359], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 133.314/pb
+        [283408, 283408], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 158.529/pb
+        [283416, 283416], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 21.628/pb
+        [283685, 283685], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 13.473/pb
+        [283820, 283820], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 2.891/pb
+        [283830, 283830], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 102.255/pb
+        [283834, 283835], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 20.323/pb
+        [283865, 283865], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 2.104/pb
+        [283877, 283877], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 147.737/pb
+        [283885, 283885], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 142.058/pb
+        [283934, 283934], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 32.84/pb
+        [283946, 283946], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 38.156/pb
+        [283964, 283964], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 58.366/pb
+        [284006, 284006], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 4.993/pb
+        [284037, 284044], # HLT_Ele105_CaloIdVT_GsfTrkIdT_v8, 96.43/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele115_CaloIdVT_GsfTrkIdT',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 50.239/pb
+        [273302, 273302], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 16.319/pb
+        [273402, 273406], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 13.589/pb
+        [273408, 273411], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 13.087/pb
+        [273425, 273425], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 26.717/pb
+        [273446, 273450], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 94.292/pb
+        [273492, 273494], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 30.924/pb
+        [273502, 273503], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 72.147/pb
+        [273554, 273555], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 38.827/pb
+        [273725, 273725], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 154.653/pb
+        [273728, 273728], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 4.897/pb
+        [273730, 273730], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 86.49/pb
+        [274094, 274094], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 9.735/pb
+        [274146, 274146], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 5.12/pb
+        [274157, 274157], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 38.994/pb
+        [274159, 274161], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 62.883/pb
+        [274172, 274172], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 5.249/pb
+        [274198, 274200], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 135.972/pb
+        [274240, 274241], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 134.472/pb
+        [274244, 274244], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 56.348/pb
+        [274250, 274251], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 159.993/pb
+        [274283, 274284], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 30.266/pb
+        [274286, 274286], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 21.668/pb
+        [274314, 274317], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 206.7/pb
+        [274319, 274319], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 27.302/pb
+        [274335, 274339], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 246.003/pb
+        [274344, 274345], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 87.68/pb
+        [274382, 274382], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 7.428/pb
+        [274387, 274388], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 312.374/pb
+        [274420, 274422], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 359.125/pb
+        [274440, 274442], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v2, 226.466/pb
+        [274954, 274955], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v3, 5.735/pb
+        [274968, 274971], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v3, 422.272/pb
+        [274998, 275001], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v3, 489.252/pb
+        [275059, 275059], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v3, 6.094/pb
+        [275066, 275068], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v3/HLT_Ele115_CaloIdVT_GsfTrkIdT_v4, 231.774/pb
+        [275073, 275074], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v4, 144.124/pb
+        [275124, 275125], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v4, 205.394/pb
+        [275282, 275284], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v4, 49.295/pb
+        [275290, 275293], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v4, 94.338/pb
+        [275309, 275311], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v4, 411.084/pb
+        [275319, 275319], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 24.399/pb
+        [275337, 275338], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 143.358/pb
+        [275344, 275345], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 109.524/pb
+        [275370, 275371], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 145.599/pb
+        [275375, 275376], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 528.636/pb
+        [275657, 275659], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 80.874/pb
+        [275761, 275761], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 1.667/pb
+        [275767, 275767], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 0.714/pb
+        [275772, 275774], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 66.444/pb
+        [275776, 275778], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 116.898/pb
+        [275782, 275782], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 99.533/pb
+        [275832, 275837], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 441.03/pb
+        [275847, 275847], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 198.947/pb
+        [275886, 275886], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 7.581/pb
+        [275890, 275890], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 235.22/pb
+        [275911, 275913], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 201.741/pb
+        [275918, 275918], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 49.71/pb
+        [275920, 275921], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 62.257/pb
+        [275923, 275923], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 14.5/pb
+        [275931, 275931], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 10.418/pb
+        [275963, 275963], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 19.553/pb
+        [276092, 276092], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 14.768/pb
+        [276097, 276097], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 99.405/pb
+        [276242, 276244], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 479.052/pb
+        [276282, 276283], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 372.59/pb
+        [276315, 276315], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 34.051/pb
+        [276317, 276318], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 124.306/pb
+        [276355, 276355], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 6.205/pb
+        [276361, 276361], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 149.465/pb
+        [276363, 276363], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 206.376/pb
+        [276384, 276384], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 121.517/pb
+        [276437, 276437], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 355.688/pb
+        [276454, 276454], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 63.924/pb
+        [276458, 276458], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 33.169/pb
+        [276495, 276495], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 38.062/pb
+        [276501, 276502], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 486.891/pb
+        [276525, 276525], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 402.663/pb
+        [276527, 276528], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 60.758/pb
+        [276542, 276545], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 345.204/pb
+        [276581, 276587], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 471.493/pb
+        [276653, 276653], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 86.12/pb
+        [276655, 276655], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 160.843/pb
+        [276659, 276659], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 29.939/pb
+        [276775, 276776], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 443.702/pb
+        [276794, 276794], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 87.206/pb
+        [276807, 276808], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 188.301/pb
+        [276810, 276811], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 346.409/pb
+        [276831, 276831], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 400.298/pb
+        [276834, 276834], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v5, 72.6/pb
+        [276870, 276870], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 526.587/pb
+        [276935, 276935], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 169.998/pb
+        [276940, 276940], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 28.701/pb
+        [276946, 276948], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 114.81/pb
+        [276950, 276950], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 323.179/pb
+        [277069, 277073], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 390.296/pb
+        [277076, 277076], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 125.929/pb
+        [277087, 277087], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 86.357/pb
+        [277094, 277094], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 131.103/pb
+        [277096, 277096], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 320.668/pb
+        [277112, 277112], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 17.339/pb
+        [277126, 277127], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 185.976/pb
+        [277148, 277148], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 128.192/pb
+        [277166, 277166], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 70.666/pb
+        [277168, 277168], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 318.998/pb
+        [277180, 277180], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 31.25/pb
+        [277194, 277194], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 367.175/pb
+        [277305, 277305], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 154.262/pb
+        [277420, 277420], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 60.844/pb
+        [277981, 277981], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 4.601/pb
+        [277991, 277992], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 21.692/pb
+        [278017, 278018], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 338.894/pb
+        [278167, 278167], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 314.532/pb
+        [278175, 278175], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 9.045/pb
+        [278193, 278193], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 34.581/pb
+        [278239, 278240], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 330.009/pb
+        [278273, 278274], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 23.87/pb
+        [278288, 278290], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 14.747/pb
+        [278308, 278308], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 313.102/pb
+        [278310, 278310], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 88.422/pb
+        [278315, 278315], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 137.45/pb
+        [278345, 278346], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 171.231/pb
+        [278349, 278349], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 94.737/pb
+        [278366, 278366], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 59.423/pb
+        [278406, 278406], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 296.962/pb
+        [278509, 278509], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 273.442/pb
+        [278769, 278770], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 170.993/pb
+        [278801, 278805], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 137.142/pb
+        [278808, 278808], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 269.634/pb
+        [278820, 278820], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 286.511/pb
+        [278822, 278822], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 191.158/pb
+        [278873, 278875], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 198.657/pb
+        [278923, 278923], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 98.543/pb
+        [278957, 278957], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 36.164/pb
+        [278962, 278963], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 113.024/pb
+        [278969, 278969], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 282.492/pb
+        [278975, 278976], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 122.556/pb
+        [278986, 278986], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 31.548/pb
+        [279024, 279024], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 49.596/pb
+        [279029, 279029], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 38.088/pb
+        [279071, 279071], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 22.581/pb
+        [279080, 279080], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 12.773/pb
+        [279115, 279116], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 174.938/pb
+        [279479, 279479], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 5.927/pb
+        [279588, 279588], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 228.517/pb
+        [279653, 279654], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 283.775/pb
+        [279656, 279656], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 5.684/pb
+        [279658, 279658], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 93.394/pb
+        [279667, 279667], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 208.732/pb
+        [279681, 279685], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 74.528/pb
+        [279691, 279691], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 9.656/pb
+        [279694, 279694], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 406.418/pb
+        [279715, 279716], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 383.763/pb
+        [279760, 279760], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 153.502/pb
+        [279766, 279767], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 358.144/pb
+        [279794, 279794], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 223.093/pb
+        [279823, 279823], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 81.828/pb
+        [279841, 279841], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 380.359/pb
+        [279844, 279844], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 56.588/pb
+        [279887, 279887], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 73.316/pb
+        [279931, 279931], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 475.316/pb
+        [279966, 279966], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 93.011/pb
+        [279975, 279975], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 239.011/pb
+        [279993, 279994], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 30.455/pb
+        [280013, 280013], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 5.636/pb
+        [280015, 280018], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 398.79/pb
+        [280020, 280020], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 4.614/pb
+        [280024, 280024], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 41.841/pb
+        [280187, 280188], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 74.778/pb
+        [280191, 280191], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 178.951/pb
+        [280194, 280194], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 36.665/pb
+        [280242, 280242], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 147.69/pb
+        [280249, 280249], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 239.16/pb
+        [280251, 280251], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 47.176/pb
+        [280327, 280327], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 8.719/pb
+        [280330, 280330], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 185.776/pb
+        [280349, 280349], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 104.129/pb
+        [280363, 280364], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 205.282/pb
+        [280383, 280385], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v6, 372.972/pb
+        [281613, 281613], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 9.764/pb
+        [281639, 281639], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 18.977/pb
+        [281641, 281641], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 39.268/pb
+        [281693, 281693], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 376.118/pb
+        [281707, 281707], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 214.55/pb
+        [281726, 281727], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 251.373/pb
+        [281797, 281797], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 397.836/pb
+        [281975, 281976], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 393.967/pb
+        [282033, 282035], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 26.293/pb
+        [282037, 282037], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 331.413/pb
+        [282092, 282092], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 296.762/pb
+        [282708, 282708], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 2.118/pb
+        [282710, 282710], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 0.346/pb
+        [282712, 282712], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 16.683/pb
+        [282730, 282735], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 469.07/pb
+        [282800, 282800], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 93.58/pb
+        [282807, 282807], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 70.563/pb
+        [282814, 282814], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 276.224/pb
+        [282842, 282842], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 23.509/pb
+        [282917, 282919], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 88.074/pb
+        [282922, 282923], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 66.001/pb
+        [283042, 283043], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 118.119/pb
+        [283049, 283050], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 61.072/pb
+        [283052, 283052], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 28.777/pb
+        [283059, 283059], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 98.778/pb
+        [283270, 283270], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 381.444/pb
+        [283283, 283283], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 197.444/pb
+        [283305, 283308], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 338.86/pb
+        [283353, 283353], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 191.088/pb
+        [283358, 283359], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 233.089/pb
+        [283407, 283408], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 466.833/pb
+        [283416, 283416], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 21.628/pb
+        [283453, 283453], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 123.278/pb
+        [283469, 283469], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 0.031/pb
+        [283478, 283478], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 210.23/pb
+        [283548, 283548], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 26.451/pb
+        [283680, 283682], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 102.814/pb
+        [283685, 283685], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 20.432/pb
+        [283820, 283820], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 259.058/pb
+        [283830, 283830], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 102.255/pb
+        [283834, 283835], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 20.323/pb
+        [283865, 283865], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 264.403/pb
+        [283876, 283877], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 409.447/pb
+        [283884, 283885], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 392.377/pb
+        [283933, 283934], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 309.793/pb
+        [283946, 283946], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 300.188/pb
+        [283964, 283964], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 58.698/pb
+        [284006, 284006], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 57.69/pb
+        [284014, 284014], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 47.826/pb
+        [284025, 284025], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 12.193/pb
+        [284029, 284029], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 29.941/pb
+        [284035, 284044], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v7, 303.58/pb
+      ],
+    },
+  ],
+  '1mu1tau' : [
+    {
+      'name'        : 'HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1',
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 50.239/pb
+        [273302, 273302], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 16.319/pb
+        [273402, 273406], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 13.589/pb
+        [273408, 273411], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 13.087/pb
+        [273425, 273425], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 26.717/pb
+        [273446, 273450], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 94.292/pb
+        [273492, 273494], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 30.924/pb
+        [273502, 273503], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 72.147/pb
+        [273554, 273555], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 38.827/pb
+        [273725, 273725], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 154.653/pb
+        [273728, 273728], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 4.897/pb
+        [273730, 273730], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 86.49/pb
+        [274094, 274094], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 9.735/pb
+        [274146, 274146], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 5.12/pb
+        [274157, 274157], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 38.994/pb
+        [274159, 274161], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 62.883/pb
+        [274172, 274172], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 5.249/pb
+        [274198, 274200], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 135.972/pb
+        [274240, 274241], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 134.472/pb
+        [274244, 274244], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 56.348/pb
+        [274250, 274251], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 159.993/pb
+        [274283, 274284], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 30.266/pb
+        [274286, 274286], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 21.668/pb
+        [274314, 274317], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 206.7/pb
+        [274319, 274319], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 27.302/pb
+        [274335, 274339], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 246.003/pb
+        [274344, 274345], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 87.68/pb
+        [274382, 274382], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 7.428/pb
+        [274387, 274388], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 312.374/pb
+        [274420, 274422], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 359.125/pb
+        [274440, 274442], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v1, 226.466/pb
+        [274954, 274955], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 5.735/pb
+        [274968, 274971], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 422.272/pb
+        [274998, 275001], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 489.252/pb
+        [275059, 275059], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 6.094/pb
+        [275066, 275068], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 231.774/pb
+        [275073, 275074], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 144.124/pb
+        [275124, 275125], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 205.394/pb
+        [275282, 275284], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 49.295/pb
+        [275290, 275293], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 94.338/pb
+        [275309, 275311], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 411.084/pb
+        [275319, 275319], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 24.399/pb
+        [275337, 275338], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 143.358/pb
+        [275344, 275345], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 109.524/pb
+        [275370, 275371], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 145.599/pb
+        [275375, 275376], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 528.636/pb
+        [275657, 275659], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 80.874/pb
+        [275761, 275761], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 1.667/pb
+        [275767, 275767], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 0.714/pb
+        [275772, 275774], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 66.444/pb
+        [275776, 275778], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 116.898/pb
+        [275782, 275782], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 99.533/pb
+        [275832, 275837], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 441.03/pb
+        [275847, 275847], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 198.947/pb
+        [275886, 275886], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 7.581/pb
+        [275890, 275890], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 235.22/pb
+        [275911, 275913], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 201.741/pb
+        [275918, 275918], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 49.71/pb
+        [275920, 275921], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 62.257/pb
+        [275923, 275923], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 14.5/pb
+        [275931, 275931], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 10.418/pb
+        [275963, 275963], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 19.553/pb
+        [276092, 276092], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 14.768/pb
+        [276097, 276097], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 99.405/pb
+        [276242, 276244], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 479.052/pb
+        [276282, 276283], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 372.59/pb
+        [276315, 276315], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 34.051/pb
+        [276317, 276318], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 124.306/pb
+        [276355, 276355], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 6.205/pb
+        [276361, 276361], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 149.465/pb
+        [276363, 276363], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 206.376/pb
+        [276384, 276384], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 121.517/pb
+        [276437, 276437], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 355.688/pb
+        [276454, 276454], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 63.924/pb
+        [276458, 276458], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 33.169/pb
+        [276495, 276495], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 38.062/pb
+        [276501, 276502], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 486.891/pb
+        [276525, 276525], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 402.663/pb
+        [276527, 276528], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 60.758/pb
+        [276542, 276545], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 345.204/pb
+        [276581, 276587], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 471.493/pb
+        [276653, 276653], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 86.12/pb
+        [276655, 276655], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 160.843/pb
+        [276659, 276659], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 29.939/pb
+        [276775, 276776], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 443.702/pb
+        [276794, 276794], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 87.206/pb
+        [276807, 276808], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 188.301/pb
+        [276810, 276811], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 346.409/pb
+        [276831, 276831], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 400.298/pb
+        [276834, 276834], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 72.6/pb
+        [276870, 276870], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 526.587/pb
+        [276935, 276935], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 169.998/pb
+        [276940, 276940], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 28.701/pb
+        [276946, 276948], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 114.81/pb
+        [276950, 276950], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 323.179/pb
+        [277069, 277073], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 390.296/pb
+        [277076, 277076], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 125.929/pb
+        [277087, 277087], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 86.357/pb
+        [277094, 277094], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 131.103/pb
+        [277096, 277096], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 320.668/pb
+        [277112, 277112], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 17.339/pb
+        [277126, 277127], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 185.976/pb
+        [277148, 277148], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 128.192/pb
+        [277166, 277166], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 70.666/pb
+        [277168, 277168], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 318.998/pb
+        [277180, 277180], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 31.25/pb
+        [277194, 277194], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 367.175/pb
+        [277305, 277305], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 154.262/pb
+        [277420, 277420], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 60.844/pb
+        [277981, 277981], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 4.601/pb
+        [277991, 277992], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 21.692/pb
+        [278017, 278018], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 338.894/pb
+        [278167, 278167], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 314.532/pb
+        [278175, 278175], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 9.045/pb
+        [278193, 278193], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 34.581/pb
+        [278239, 278240], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v2, 330.009/pb
+        [278273, 278274], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 23.87/pb
+        [278288, 278290], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 14.747/pb
+        [278308, 278308], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 313.102/pb
+        [278310, 278310], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 88.422/pb
+        [278315, 278315], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 137.45/pb
+        [278345, 278346], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 171.231/pb
+        [278349, 278349], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 94.737/pb
+        [278366, 278366], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 59.423/pb
+        [278406, 278406], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 296.962/pb
+        [278509, 278509], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 273.442/pb
+        [278769, 278770], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 170.993/pb
+        [278801, 278805], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 137.142/pb
+        [278808, 278808], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 269.634/pb
+        [278820, 278820], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 286.511/pb
+        [278822, 278822], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 191.158/pb
+        [278873, 278875], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 198.657/pb
+        [278923, 278923], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 98.543/pb
+        [278957, 278957], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 36.164/pb
+        [278962, 278963], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 113.024/pb
+        [278969, 278969], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 282.492/pb
+        [278975, 278976], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 122.556/pb
+        [278986, 278986], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 31.548/pb
+        [279024, 279024], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 49.596/pb
+        [279029, 279029], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 38.088/pb
+        [279071, 279071], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 22.581/pb
+        [279080, 279080], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 12.773/pb
+        [279115, 279116], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 174.938/pb
+        [279479, 279479], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 5.927/pb
+        [279588, 279588], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 228.517/pb
+        [279653, 279654], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 283.775/pb
+        [279656, 279656], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 5.684/pb
+        [279658, 279658], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 93.394/pb
+        [279667, 279667], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 208.732/pb
+        [279681, 279685], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 74.528/pb
+        [279691, 279691], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 9.656/pb
+        [279694, 279694], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 406.418/pb
+        [279715, 279716], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 383.763/pb
+        [279760, 279760], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 153.502/pb
+        [279766, 279767], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 358.144/pb
+        [279794, 279794], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 223.093/pb
+        [279823, 279823], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 81.828/pb
+        [279841, 279841], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 380.359/pb
+        [279844, 279844], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 56.588/pb
+        [279887, 279887], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 73.316/pb
+        [279931, 279931], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 475.316/pb
+        [279966, 279966], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 93.011/pb
+        [279975, 279975], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 239.011/pb
+        [279993, 279994], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 30.455/pb
+        [280013, 280013], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 5.636/pb
+        [280015, 280018], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 398.79/pb
+        [280020, 280020], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 4.614/pb
+        [280024, 280024], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 41.841/pb
+        [280187, 280188], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 74.778/pb
+        [280191, 280191], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 178.951/pb
+        [280194, 280194], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 36.665/pb
+        [280242, 280242], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 147.69/pb
+        [280249, 280249], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 239.16/pb
+        [280251, 280251], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 47.176/pb
+        [280327, 280327], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 8.719/pb
+        [280330, 280330], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 185.776/pb
+        [280349, 280349], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 104.129/pb
+        [280363, 280364], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 205.282/pb
+        [280383, 280385], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v3, 372.972/pb
+        [281613, 281613], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 9.764/pb
+        [281639, 281639], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 18.977/pb
+        [281641, 281641], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 39.268/pb
+        [281693, 281693], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 376.118/pb
+        [281707, 281707], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 214.55/pb
+        [281726, 281727], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 251.373/pb
+        [281797, 281797], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 397.836/pb
+        [281975, 281976], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 393.967/pb
+        [282033, 282035], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 26.293/pb
+        [282037, 282037], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 331.413/pb
+        [282092, 282092], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 296.762/pb
+        [282708, 282708], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 2.118/pb
+        [282710, 282710], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 0.346/pb
+        [282712, 282712], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 16.683/pb
+        [282730, 282735], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 469.07/pb
+        [282800, 282800], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 93.58/pb
+        [282807, 282807], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 70.563/pb
+        [282814, 282814], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 276.224/pb
+        [282842, 282842], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 23.509/pb
+        [282917, 282919], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 88.074/pb
+        [282922, 282923], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 66.001/pb
+        [283042, 283043], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 118.119/pb
+        [283049, 283050], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 61.072/pb
+        [283052, 283052], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 28.777/pb
+        [283059, 283059], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 98.778/pb
+        [283270, 283270], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 381.444/pb
+        [283283, 283283], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 197.444/pb
+        [283305, 283308], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 338.86/pb
+        [283353, 283353], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 191.088/pb
+        [283358, 283359], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 233.089/pb
+        [283407, 283408], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 466.833/pb
+        [283416, 283416], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 21.628/pb
+        [283453, 283453], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 123.278/pb
+        [283469, 283469], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 0.031/pb
+        [283478, 283478], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 210.23/pb
+        [283548, 283548], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 26.451/pb
+        [283680, 283682], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 102.814/pb
+        [283685, 283685], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 20.432/pb
+        [283820, 283820], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 259.058/pb
+        [283830, 283830], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 102.255/pb
+        [283834, 283835], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 20.323/pb
+        [283865, 283865], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 264.403/pb
+        [283876, 283877], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 409.447/pb
+        [283884, 283885], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 392.377/pb
+        [283933, 283934], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 309.793/pb
+        [283946, 283946], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 300.188/pb
+        [283964, 283964], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 58.698/pb
+        [284006, 284006], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 57.69/pb
+        [284014, 284014], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 47.826/pb
+        [284025, 284025], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 12.193/pb
+        [284029, 284029], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 29.941/pb
+        [284035, 284044], # HLT_IsoMu19_eta2p1_LooseIsoPFTau20_SingleL1_v5, 303.58/pb
+      ],
+    },
+  ],
+  '1e1tau' : [
+    {
+      'name'        : 'HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20',
+      'unprescaled' : True, # missing in G, H, but effectively prescaled by 2.1
+      'runs'        : [
+        [273158, 273158], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 50.239/pb
+        [273302, 273302], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 16.319/pb
+        [273402, 273406], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 13.589/pb
+        [273408, 273411], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 13.087/pb
+        [273425, 273425], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 26.717/pb
+        [273446, 273450], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 94.292/pb
+        [273492, 273494], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 30.924/pb
+        [273502, 273503], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 72.147/pb
+        [273554, 273555], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 38.827/pb
+        [273725, 273725], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 154.653/pb
+        [273728, 273728], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 4.897/pb
+        [273730, 273730], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v1, 86.49/pb
+        [274094, 274094], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 9.735/pb
+        [274146, 274146], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 5.12/pb
+        [274157, 274157], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 38.994/pb
+        [274159, 274161], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 62.883/pb
+        [274172, 274172], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 5.249/pb
+        [274198, 274200], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 135.972/pb
+        [274240, 274241], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 134.472/pb
+        [274244, 274244], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 56.348/pb
+        [274250, 274251], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 159.993/pb
+        [274283, 274284], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 30.266/pb
+        [274286, 274286], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 21.668/pb
+        [274314, 274317], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 206.7/pb
+        [274319, 274319], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 27.302/pb
+        [274335, 274339], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 246.003/pb
+        [274344, 274345], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 87.68/pb
+        [274382, 274382], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 7.428/pb
+        [274387, 274388], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 312.374/pb
+        [274420, 274422], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 359.125/pb
+        [274440, 274442], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 226.466/pb
+        [274954, 274955], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 5.735/pb
+        [274968, 274971], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 422.272/pb
+        [274998, 275001], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 489.252/pb
+        [275059, 275059], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2, 6.094/pb
+        [275066, 275068], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v2/HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v3, 231.774/pb
+        [275073, 275074], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v3, 144.124/pb
+        [275124, 275125], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v3, 205.394/pb
+        [275282, 275284], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v3, 49.295/pb
+        [275290, 275293], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v3, 94.338/pb
+        [275309, 275311], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v3, 411.084/pb
+        [275319, 275319], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 24.399/pb
+        [275337, 275338], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 143.358/pb
+        [275344, 275345], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 109.524/pb
+        [275370, 275371], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 145.599/pb
+        [275375, 275376], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 528.636/pb
+        [275657, 275659], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 80.874/pb
+        [275761, 275761], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 1.667/pb
+        [275767, 275767], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 0.714/pb
+        [275772, 275774], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 66.444/pb
+        [275776, 275778], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 116.898/pb
+        [275782, 275782], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 99.533/pb
+        [275832, 275837], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 441.03/pb
+        [275847, 275847], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 198.947/pb
+        [275886, 275886], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 7.581/pb
+        [275890, 275890], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 235.22/pb
+        [275911, 275913], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 201.741/pb
+        [275918, 275918], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 49.71/pb
+        [275920, 275921], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 62.257/pb
+        [275923, 275923], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 14.5/pb
+        [275931, 275931], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 10.418/pb
+        [275963, 275963], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 19.553/pb
+        [276092, 276092], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 14.768/pb
+        [276097, 276097], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 99.405/pb
+        [276242, 276244], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 479.052/pb
+        [276282, 276283], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 372.59/pb
+        [276315, 276315], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 34.051/pb
+        [276317, 276318], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 124.306/pb
+        [276355, 276355], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 6.205/pb
+        [276361, 276361], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 149.465/pb
+        [276363, 276363], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 206.376/pb
+        [276384, 276384], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 121.517/pb
+        [276437, 276437], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 355.688/pb
+        [276454, 276454], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 63.924/pb
+        [276458, 276458], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 33.169/pb
+        [276495, 276495], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 38.062/pb
+        [276501, 276502], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 486.891/pb
+        [276525, 276525], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 402.663/pb
+        [276527, 276528], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 60.758/pb
+        [276542, 276545], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 345.204/pb
+        [276581, 276587], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 471.493/pb
+        [276653, 276653], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 86.12/pb
+        [276655, 276655], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 160.843/pb
+        [276659, 276659], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 29.939/pb
+        [276775, 276776], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 443.702/pb
+        [276794, 276794], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 87.206/pb
+        [276807, 276808], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 188.301/pb
+        [276810, 276811], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 346.409/pb
+        [276831, 276831], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 400.298/pb
+        [276834, 276834], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v4, 72.6/pb
+        [276870, 276870], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 513.042/pb
+        [276935, 276935], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 128.487/pb
+        [276940, 276940], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 16.262/pb
+        [276946, 276948], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 113.478/pb
+        [276950, 276950], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 323.179/pb
+        [277070, 277073], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 303.149/pb
+        [277076, 277076], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 125.929/pb
+        [277087, 277087], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 86.357/pb
+        [277094, 277094], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 71.944/pb
+        [277096, 277096], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 320.668/pb
+        [277112, 277112], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 12.913/pb
+        [277127, 277127], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 181.81/pb
+        [277148, 277148], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 128.17/pb
+        [277166, 277166], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 66.646/pb
+        [277168, 277168], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 317.531/pb
+        [277180, 277180], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 18.477/pb
+        [277194, 277194], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 314.183/pb
+        [277305, 277305], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 93.106/pb
+        [277420, 277420], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 25.075/pb
+        [277981, 277981], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 4.601/pb
+        [277991, 277992], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 21.386/pb
+        [278017, 278018], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 244.899/pb
+        [278167, 278167], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 314.532/pb
+        [278175, 278175], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 8.712/pb
+        [278193, 278193], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 25.283/pb
+        [278239, 278240], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_v5, 329.574/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1',
+      'unprescaled' : True, # missing in G, H, but effectively prescaled by 2.0
+      'runs'        : [
+        [273158, 273158], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 50.239/pb
+        [273302, 273302], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 16.319/pb
+        [273402, 273406], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 13.589/pb
+        [273408, 273411], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 13.087/pb
+        [273425, 273425], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 26.717/pb
+        [273446, 273450], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 94.292/pb
+        [273492, 273494], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 30.924/pb
+        [273502, 273503], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 72.147/pb
+        [273554, 273555], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 38.827/pb
+        [273725, 273725], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 154.653/pb
+        [273728, 273728], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 4.897/pb
+        [273730, 273730], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v1, 86.49/pb
+        [274094, 274094], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 9.735/pb
+        [274146, 274146], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 5.12/pb
+        [274157, 274157], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 38.994/pb
+        [274159, 274161], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 62.883/pb
+        [274172, 274172], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 5.249/pb
+        [274198, 274200], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 135.972/pb
+        [274240, 274241], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 134.472/pb
+        [274244, 274244], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 56.348/pb
+        [274250, 274251], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 159.993/pb
+        [274283, 274284], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 30.266/pb
+        [274286, 274286], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 21.668/pb
+        [274314, 274317], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 206.7/pb
+        [274319, 274319], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 27.302/pb
+        [274335, 274339], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 246.003/pb
+        [274344, 274345], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 87.68/pb
+        [274382, 274382], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 7.428/pb
+        [274387, 274388], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 312.374/pb
+        [274420, 274422], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 359.125/pb
+        [274440, 274442], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 226.466/pb
+        [274954, 274955], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 5.735/pb
+        [274968, 274971], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 422.272/pb
+        [274998, 275001], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 489.252/pb
+        [275059, 275059], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2, 6.094/pb
+        [275066, 275068], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v2/HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v3, 231.774/pb
+        [275073, 275074], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v3, 144.124/pb
+        [275124, 275125], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v3, 205.394/pb
+        [275282, 275284], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v3, 49.295/pb
+        [275290, 275293], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v3, 94.338/pb
+        [275309, 275311], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v3, 411.084/pb
+        [275319, 275319], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 24.399/pb
+        [275337, 275338], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 143.358/pb
+        [275344, 275345], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 109.524/pb
+        [275370, 275371], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 145.599/pb
+        [275375, 275376], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 528.636/pb
+        [275657, 275659], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 80.874/pb
+        [275761, 275761], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 1.667/pb
+        [275767, 275767], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 0.714/pb
+        [275772, 275774], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 66.444/pb
+        [275776, 275778], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 116.898/pb
+        [275782, 275782], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 99.533/pb
+        [275832, 275837], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 441.03/pb
+        [275847, 275847], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 198.947/pb
+        [275886, 275886], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 7.581/pb
+        [275890, 275890], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 235.22/pb
+        [275911, 275913], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 201.741/pb
+        [275918, 275918], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 49.71/pb
+        [275920, 275921], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 62.257/pb
+        [275923, 275923], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 14.5/pb
+        [275931, 275931], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 10.418/pb
+        [275963, 275963], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 19.553/pb
+        [276092, 276092], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 14.768/pb
+        [276097, 276097], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 99.405/pb
+        [276242, 276244], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 479.052/pb
+        [276282, 276283], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 372.59/pb
+        [276315, 276315], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 34.051/pb
+        [276317, 276318], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 124.306/pb
+        [276355, 276355], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 6.205/pb
+        [276361, 276361], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 149.465/pb
+        [276363, 276363], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 206.376/pb
+        [276384, 276384], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 121.517/pb
+        [276437, 276437], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 355.688/pb
+        [276454, 276454], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 63.924/pb
+        [276458, 276458], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 33.169/pb
+        [276495, 276495], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 38.062/pb
+        [276501, 276502], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 486.891/pb
+        [276525, 276525], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 402.663/pb
+        [276527, 276528], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 60.758/pb
+        [276542, 276545], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 345.204/pb
+        [276581, 276587], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 471.493/pb
+        [276653, 276653], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 86.12/pb
+        [276655, 276655], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 160.843/pb
+        [276659, 276659], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 29.939/pb
+        [276775, 276776], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 443.702/pb
+        [276794, 276794], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 87.206/pb
+        [276807, 276808], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 188.301/pb
+        [276810, 276811], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 346.409/pb
+        [276831, 276831], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 400.298/pb
+        [276834, 276834], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v4, 72.6/pb
+        [276870, 276870], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 526.587/pb
+        [276935, 276935], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 169.998/pb
+        [276940, 276940], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 28.701/pb
+        [276946, 276948], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 114.81/pb
+        [276950, 276950], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 323.179/pb
+        [277069, 277073], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 390.296/pb
+        [277076, 277076], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 125.929/pb
+        [277087, 277087], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 86.357/pb
+        [277094, 277094], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 131.103/pb
+        [277096, 277096], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 320.668/pb
+        [277112, 277112], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 17.339/pb
+        [277126, 277127], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 185.976/pb
+        [277148, 277148], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 128.192/pb
+        [277166, 277166], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 70.666/pb
+        [277168, 277168], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 318.998/pb
+        [277180, 277180], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 31.25/pb
+        [277194, 277194], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 367.175/pb
+        [277305, 277305], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 154.262/pb
+        [277420, 277420], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 60.844/pb
+        [277981, 277981], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 4.601/pb
+        [277991, 277992], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 21.692/pb
+        [278017, 278018], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 338.894/pb
+        [278167, 278167], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 314.532/pb
+        [278175, 278175], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 9.045/pb
+        [278193, 278193], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 34.581/pb
+        [278239, 278240], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20_SingleL1_v5, 330.009/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30', # missing in B, C, D
+      'unprescaled' : True,
+      'runs'        : [
+        [276870, 276870], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 526.587/pb
+        [276935, 276935], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 169.998/pb
+        [276940, 276940], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 28.701/pb
+        [276946, 276948], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 114.81/pb
+        [276950, 276950], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 323.179/pb
+        [277069, 277073], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 390.296/pb
+        [277076, 277076], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 125.929/pb
+        [277087, 277087], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 86.357/pb
+        [277094, 277094], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 131.103/pb
+        [277096, 277096], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 320.668/pb
+        [277112, 277112], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 17.339/pb
+        [277126, 277127], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 185.976/pb
+        [277148, 277148], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 128.192/pb
+        [277166, 277166], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 70.666/pb
+        [277168, 277168], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 318.998/pb
+        [277180, 277180], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 31.25/pb
+        [277194, 277194], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 367.175/pb
+        [277305, 277305], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 154.262/pb
+        [277420, 277420], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 60.844/pb
+        [277981, 277981], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 4.601/pb
+        [277991, 277992], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 21.692/pb
+        [278017, 278018], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 338.894/pb
+        [278167, 278167], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 314.532/pb
+        [278175, 278175], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 9.045/pb
+        [278193, 278193], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 34.581/pb
+        [278239, 278240], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v1, 330.009/pb
+        [278273, 278274], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 23.87/pb
+        [278288, 278290], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 14.747/pb
+        [278308, 278308], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 313.102/pb
+        [278310, 278310], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 88.422/pb
+        [278315, 278315], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 137.45/pb
+        [278345, 278346], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 171.231/pb
+        [278349, 278349], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 94.737/pb
+        [278366, 278366], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 59.423/pb
+        [278406, 278406], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 296.962/pb
+        [278509, 278509], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 273.442/pb
+        [278769, 278770], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 170.993/pb
+        [278801, 278805], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 137.142/pb
+        [278808, 278808], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 269.634/pb
+        [278820, 278820], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 286.511/pb
+        [278822, 278822], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 191.158/pb
+        [278873, 278875], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 198.657/pb
+        [278923, 278923], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 98.543/pb
+        [278957, 278957], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 36.164/pb
+        [278962, 278963], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 113.024/pb
+        [278969, 278969], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 282.492/pb
+        [278975, 278976], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 122.556/pb
+        [278986, 278986], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 31.548/pb
+        [279024, 279024], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 49.596/pb
+        [279029, 279029], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 38.088/pb
+        [279071, 279071], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 22.581/pb
+        [279080, 279080], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 12.773/pb
+        [279115, 279116], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 174.938/pb
+        [279479, 279479], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 5.927/pb
+        [279588, 279588], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 228.517/pb
+        [279653, 279654], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 283.775/pb
+        [279656, 279656], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 5.684/pb
+        [279658, 279658], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 93.394/pb
+        [279667, 279667], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 208.732/pb
+        [279681, 279685], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 74.528/pb
+        [279691, 279691], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 9.656/pb
+        [279694, 279694], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 406.418/pb
+        [279715, 279716], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 383.763/pb
+        [279760, 279760], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 153.502/pb
+        [279766, 279767], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 358.144/pb
+        [279794, 279794], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 223.093/pb
+        [279823, 279823], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 81.828/pb
+        [279841, 279841], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 380.359/pb
+        [279844, 279844], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 56.588/pb
+        [279887, 279887], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 73.316/pb
+        [279931, 279931], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 475.316/pb
+        [279966, 279966], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 93.011/pb
+        [279975, 279975], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 239.011/pb
+        [279993, 279994], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 30.455/pb
+        [280013, 280013], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 5.636/pb
+        [280015, 280018], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 398.79/pb
+        [280020, 280020], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 4.614/pb
+        [280024, 280024], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 41.841/pb
+        [280187, 280188], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 74.778/pb
+        [280191, 280191], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 178.951/pb
+        [280194, 280194], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 36.665/pb
+        [280242, 280242], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 147.69/pb
+        [280249, 280249], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 239.16/pb
+        [280251, 280251], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 47.176/pb
+        [280327, 280327], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 8.719/pb
+        [280330, 280330], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 185.776/pb
+        [280349, 280349], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 104.129/pb
+        [280363, 280364], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 205.282/pb
+        [280383, 280385], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v2, 372.972/pb
+        [281613, 281613], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 9.764/pb
+        [281639, 281639], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 18.977/pb
+        [281641, 281641], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 39.268/pb
+        [281693, 281693], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 376.118/pb
+        [281707, 281707], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 214.55/pb
+        [281726, 281727], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 251.373/pb
+        [281797, 281797], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 397.836/pb
+        [281975, 281976], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 393.967/pb
+        [282033, 282035], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 26.293/pb
+        [282037, 282037], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 331.413/pb
+        [282092, 282092], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 296.762/pb
+        [282708, 282708], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 2.118/pb
+        [282710, 282710], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 0.346/pb
+        [282712, 282712], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 16.683/pb
+        [282730, 282735], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 469.07/pb
+        [282800, 282800], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 93.58/pb
+        [282807, 282807], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 70.563/pb
+        [282814, 282814], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 276.224/pb
+        [282842, 282842], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 23.509/pb
+        [282917, 282919], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 88.074/pb
+        [282922, 282923], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 66.001/pb
+        [283042, 283043], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 118.119/pb
+        [283049, 283050], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 61.072/pb
+        [283052, 283052], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 28.777/pb
+        [283059, 283059], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 98.778/pb
+        [283270, 283270], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 381.444/pb
+        [283283, 283283], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 197.444/pb
+        [283305, 283308], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 338.86/pb
+        [283353, 283353], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 191.088/pb
+        [283358, 283359], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 233.089/pb
+        [283407, 283408], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 466.833/pb
+        [283416, 283416], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 21.628/pb
+        [283453, 283453], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 123.278/pb
+        [283469, 283469], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 0.031/pb
+        [283478, 283478], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 210.23/pb
+        [283548, 283548], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 26.451/pb
+        [283680, 283682], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 102.814/pb
+        [283685, 283685], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 20.432/pb
+        [283820, 283820], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 259.058/pb
+        [283830, 283830], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 102.255/pb
+        [283834, 283835], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 20.323/pb
+        [283865, 283865], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 264.403/pb
+        [283876, 283877], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 409.447/pb
+        [283884, 283885], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 392.377/pb
+        [283933, 283934], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 309.793/pb
+        [283946, 283946], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 300.188/pb
+        [283964, 283964], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 58.698/pb
+        [284006, 284006], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 57.69/pb
+        [284014, 284014], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 47.826/pb
+        [284025, 284025], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 12.193/pb
+        [284029, 284029], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 29.941/pb
+        [284035, 284044], # HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau30_v4, 303.58/pb
+      ],
+    },
+  ],
+  '2tau' : [
+    {
+      'name'        : 'HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg', # missing in H
+      'unprescaled' : True,
+      'runs'        : [
+        [273158, 273158], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 50.239/pb
+        [273302, 273302], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 16.319/pb
+        [273402, 273406], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 13.589/pb
+        [273408, 273411], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 13.087/pb
+        [273425, 273425], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 26.717/pb
+        [273446, 273450], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 94.292/pb
+        [273492, 273494], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 30.924/pb
+        [273502, 273503], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 72.147/pb
+        [273554, 273555], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 38.827/pb
+        [273725, 273725], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 154.653/pb
+        [273728, 273728], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 4.897/pb
+        [273730, 273730], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 86.49/pb
+        [274094, 274094], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 9.735/pb
+        [274146, 274146], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 5.12/pb
+        [274157, 274157], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 38.994/pb
+        [274159, 274161], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 62.883/pb
+        [274172, 274172], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 5.249/pb
+        [274198, 274200], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 135.972/pb
+        [274240, 274241], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 134.472/pb
+        [274244, 274244], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 56.348/pb
+        [274250, 274251], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 159.993/pb
+        [274283, 274284], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 30.266/pb
+        [274286, 274286], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 21.668/pb
+        [274314, 274317], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 206.7/pb
+        [274319, 274319], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 27.302/pb
+        [274335, 274339], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 246.003/pb
+        [274344, 274345], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 87.68/pb
+        [274382, 274382], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 7.428/pb
+        [274387, 274388], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 312.374/pb
+        [274420, 274422], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 359.125/pb
+        [274440, 274442], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v2, 226.466/pb
+        [274954, 274955], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 5.735/pb
+        [274968, 274971], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 422.272/pb
+        [274998, 275001], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 489.252/pb
+        [275059, 275059], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 6.094/pb
+        [275066, 275068], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 231.774/pb
+        [275073, 275074], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 144.124/pb
+        [275124, 275125], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 205.394/pb
+        [275282, 275284], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 49.295/pb
+        [275290, 275293], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 94.338/pb
+        [275309, 275311], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 411.084/pb
+        [275319, 275319], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 24.399/pb
+        [275337, 275338], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 143.358/pb
+        [275344, 275345], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 109.524/pb
+        [275370, 275371], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 145.599/pb
+        [275375, 275376], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 528.636/pb
+        [275657, 275659], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 80.874/pb
+        [275761, 275761], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 1.667/pb
+        [275767, 275767], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 0.714/pb
+        [275772, 275774], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 66.444/pb
+        [275776, 275778], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 116.898/pb
+        [275782, 275782], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 99.533/pb
+        [275832, 275837], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 441.03/pb
+        [275847, 275847], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 198.947/pb
+        [275886, 275886], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 7.581/pb
+        [275890, 275890], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 235.22/pb
+        [275911, 275913], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 201.741/pb
+        [275918, 275918], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 49.71/pb
+        [275920, 275921], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 62.257/pb
+        [275923, 275923], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 14.5/pb
+        [275931, 275931], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 10.418/pb
+        [275963, 275963], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 19.553/pb
+        [276092, 276092], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 14.768/pb
+        [276097, 276097], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 99.405/pb
+        [276242, 276244], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 479.052/pb
+        [276282, 276283], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 372.59/pb
+        [276315, 276315], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 34.051/pb
+        [276317, 276318], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 124.306/pb
+        [276355, 276355], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 6.205/pb
+        [276361, 276361], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 149.465/pb
+        [276363, 276363], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 206.376/pb
+        [276384, 276384], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 121.517/pb
+        [276437, 276437], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 355.688/pb
+        [276454, 276454], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 63.924/pb
+        [276458, 276458], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 33.169/pb
+        [276495, 276495], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 38.062/pb
+        [276501, 276502], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 486.891/pb
+        [276525, 276525], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 402.663/pb
+        [276527, 276528], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 60.758/pb
+        [276542, 276545], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 345.204/pb
+        [276581, 276587], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 471.493/pb
+        [276653, 276653], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 86.12/pb
+        [276655, 276655], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 160.843/pb
+        [276659, 276659], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 29.939/pb
+        [276775, 276776], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 443.702/pb
+        [276794, 276794], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 87.206/pb
+        [276807, 276808], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 188.301/pb
+        [276810, 276811], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 346.409/pb
+        [276831, 276831], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 400.298/pb
+        [276834, 276834], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v3, 72.6/pb
+        [276870, 276870], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 526.587/pb
+        [276935, 276935], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 169.998/pb
+        [276940, 276940], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 28.701/pb
+        [276946, 276948], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 114.81/pb
+        [276950, 276950], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 323.179/pb
+        [277069, 277073], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 390.296/pb
+        [277076, 277076], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 125.929/pb
+        [277087, 277087], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 86.357/pb
+        [277094, 277094], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 131.103/pb
+        [277096, 277096], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 320.668/pb
+        [277112, 277112], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 17.339/pb
+        [277126, 277127], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 185.976/pb
+        [277148, 277148], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 128.192/pb
+        [277166, 277166], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 70.666/pb
+        [277168, 277168], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 318.998/pb
+        [277180, 277180], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 31.25/pb
+        [277194, 277194], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 367.175/pb
+        [277305, 277305], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 154.262/pb
+        [277420, 277420], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 60.844/pb
+        [277981, 277981], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 4.601/pb
+        [277991, 277992], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 21.692/pb
+        [278017, 278018], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 338.894/pb
+        [278167, 278167], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 314.532/pb
+        [278175, 278175], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 9.045/pb
+        [278193, 278193], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 34.581/pb
+        [278239, 278240], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v4, 330.009/pb
+        [278273, 278274], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 23.87/pb
+        [278288, 278290], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 14.747/pb
+        [278308, 278308], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 313.102/pb
+        [278310, 278310], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 88.422/pb
+        [278315, 278315], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 137.45/pb
+        [278345, 278346], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 171.231/pb
+        [278349, 278349], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 94.737/pb
+        [278366, 278366], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 59.423/pb
+        [278406, 278406], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 296.962/pb
+        [278509, 278509], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 273.442/pb
+        [278769, 278770], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 170.993/pb
+        [278801, 278805], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 137.142/pb
+        [278808, 278808], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 269.634/pb
+        [278820, 278820], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 286.511/pb
+        [278822, 278822], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 191.158/pb
+        [278873, 278875], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 198.657/pb
+        [278923, 278923], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 98.543/pb
+        [278957, 278957], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 36.164/pb
+        [278962, 278963], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 113.024/pb
+        [278969, 278969], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 282.492/pb
+        [278975, 278976], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 122.556/pb
+        [278986, 278986], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 31.548/pb
+        [279024, 279024], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 49.596/pb
+        [279029, 279029], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 38.088/pb
+        [279071, 279071], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 22.581/pb
+        [279080, 279080], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 12.773/pb
+        [279115, 279116], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 174.938/pb
+        [279479, 279479], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 5.927/pb
+        [279588, 279588], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 228.517/pb
+        [279653, 279654], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 283.775/pb
+        [279656, 279656], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 5.684/pb
+        [279658, 279658], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 93.394/pb
+        [279667, 279667], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 208.732/pb
+        [279681, 279685], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 74.528/pb
+        [279691, 279691], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 9.656/pb
+        [279694, 279694], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 406.418/pb
+        [279715, 279716], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 383.763/pb
+        [279760, 279760], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 153.502/pb
+        [279766, 279767], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 358.144/pb
+        [279794, 279794], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 223.093/pb
+        [279823, 279823], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 81.828/pb
+        [279841, 279841], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 380.359/pb
+        [279844, 279844], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 56.588/pb
+        [279887, 279887], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 73.316/pb
+        [279931, 279931], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 475.316/pb
+        [279966, 279966], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 93.011/pb
+        [279975, 279975], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 239.011/pb
+        [279993, 279994], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 30.455/pb
+        [280013, 280013], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 5.636/pb
+        [280015, 280018], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 398.79/pb
+        [280020, 280020], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 4.614/pb
+        [280024, 280024], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 41.841/pb
+        [280187, 280188], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 74.778/pb
+        [280191, 280191], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 178.951/pb
+        [280194, 280194], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 36.665/pb
+        [280242, 280242], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 147.69/pb
+        [280249, 280249], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 239.16/pb
+        [280251, 280251], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 47.176/pb
+        [280327, 280327], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 8.719/pb
+        [280330, 280330], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 185.776/pb
+        [280349, 280349], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 104.129/pb
+        [280363, 280364], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 205.282/pb
+        [280383, 280385], # HLT_DoubleMediumIsoPFTau35_Trk1_eta2p1_Reg_v5, 372.972/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg', # present only in H (effectively presscaled by 4.2)
+      'unprescaled' : True,
+      'runs'        : [
+        [281613, 281613], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 9.764/pb
+        [281639, 281639], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 18.977/pb
+        [281641, 281641], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 39.268/pb
+        [281693, 281693], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 376.118/pb
+        [281707, 281707], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 214.55/pb
+        [281726, 281727], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 251.373/pb
+        [281797, 281797], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 397.836/pb
+        [281975, 281976], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 393.967/pb
+        [282033, 282035], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 26.293/pb
+        [282037, 282037], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 331.413/pb
+        [282092, 282092], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v2, 296.762/pb
+        [282708, 282708], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 2.118/pb
+        [282710, 282710], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 0.346/pb
+        [282712, 282712], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 16.683/pb
+        [282730, 282735], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 469.07/pb
+        [282800, 282800], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 93.58/pb
+        [282807, 282807], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 70.563/pb
+        [282814, 282814], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 276.224/pb
+        [282842, 282842], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 23.509/pb
+        [282917, 282919], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 88.074/pb
+        [282922, 282923], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 66.001/pb
+        [283042, 283043], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 118.119/pb
+        [283049, 283050], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 61.072/pb
+        [283052, 283052], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 28.777/pb
+        [283059, 283059], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 98.778/pb
+        [283270, 283270], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 381.444/pb
+        [283283, 283283], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 197.444/pb
+        [283305, 283308], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 338.86/pb
+        [283353, 283353], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 191.088/pb
+        [283358, 283359], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 233.089/pb
+        [283407, 283408], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 466.833/pb
+        [283416, 283416], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 21.628/pb
+        [283453, 283453], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 123.278/pb
+        [283469, 283469], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 0.031/pb
+        [283478, 283478], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 210.23/pb
+        [283548, 283548], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 26.451/pb
+        [283680, 283682], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 102.814/pb
+        [283685, 283685], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 20.432/pb
+        [283820, 283820], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 259.058/pb
+        [283830, 283830], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 102.255/pb
+        [283834, 283835], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 20.323/pb
+        [283865, 283865], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 264.403/pb
+        [283876, 283877], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 409.447/pb
+        [283884, 283885], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 392.377/pb
+        [283933, 283934], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 309.793/pb
+        [283946, 283946], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 300.188/pb
+        [283964, 283964], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 58.698/pb
+        [284006, 284006], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 57.69/pb
+        [284014, 284014], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 47.826/pb
+        [284025, 284025], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 12.193/pb
+        [284029, 284029], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 29.941/pb
+        [284035, 284044], # HLT_DoubleMediumCombinedIsoPFTau35_Trk1_eta2p1_Reg_v3, 303.58/pb
+      ],
+    },
+  ],
+}
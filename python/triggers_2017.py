@@ -0,0 +1,5718 @@
+triggers_analysis = {
+  '3mu' : [
+    {
+      'name'        : 'HLT_TripleMu_12_10_5',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_TripleMu_12_10_5_v4, 94.725/pb
+        [297056, 297057], # HLT_TripleMu_12_10_5_v4, 143.741/pb
+        [297099, 297101], # HLT_TripleMu_12_10_5_v4, 241.495/pb
+        [297113, 297114], # HLT_TripleMu_12_10_5_v4, 85.001/pb
+        [297175, 297178], # HLT_TripleMu_12_10_5_v4, 280.582/pb
+        [297215, 297215], # HLT_TripleMu_12_10_5_v4, 12.287/pb
+        [297218, 297219], # HLT_TripleMu_12_10_5_v4, 425.447/pb
+        [297224, 297225], # HLT_TripleMu_12_10_5_v4, 13.81/pb
+        [297227, 297227], # HLT_TripleMu_12_10_5_v4, 15.669/pb
+        [297292, 297293], # HLT_TripleMu_12_10_5_v4, 198.677/pb
+        [297296, 297296], # HLT_TripleMu_12_10_5_v4, 84.207/pb
+        [297308, 297308], # HLT_TripleMu_12_10_5_v4, 6.298/pb
+        [297359, 297359], # HLT_TripleMu_12_10_5_v4, 13.795/pb
+        [297411, 297411], # HLT_TripleMu_12_10_5_v4, 201.578/pb
+        [297424, 297426], # HLT_TripleMu_12_10_5_v4, 97.376/pb
+        [297429, 297435], # HLT_TripleMu_12_10_5_v4, 199.191/pb
+        [297467, 297469], # HLT_TripleMu_12_10_5_v4, 69.859/pb
+        [297483, 297488], # HLT_TripleMu_12_10_5_v4, 471.448/pb
+        [297503, 297505], # HLT_TripleMu_12_10_5_v4, 268.446/pb
+        [297557, 297558], # HLT_TripleMu_12_10_5_v5, 158.712/pb
+        [297562, 297563], # HLT_TripleMu_12_10_5_v5, 106.785/pb
+        [297598, 297599], # HLT_TripleMu_12_10_5_v5, 93.85/pb
+        [297603, 297606], # HLT_TripleMu_12_10_5_v5, 276.775/pb
+        [297620, 297620], # HLT_TripleMu_12_10_5_v5, 82.127/pb
+        [297656, 297656], # HLT_TripleMu_12_10_5_v5, 93.083/pb
+        [297665, 297666], # HLT_TripleMu_12_10_5_v5, 78.347/pb
+        [297670, 297670], # HLT_TripleMu_12_10_5_v5, 2.132/pb
+        [297674, 297675], # HLT_TripleMu_12_10_5_v5, 170.78/pb
+        [297722, 297723], # HLT_TripleMu_12_10_5_v5, 142.686/pb
+        [298996, 298997], # HLT_TripleMu_12_10_5_v5, 26.765/pb
+        [299000, 299000], # HLT_TripleMu_12_10_5_v5, 8.038/pb
+        [299042, 299042], # HLT_TripleMu_12_10_5_v5, 2.02/pb
+        [299061, 299062], # HLT_TripleMu_12_10_5_v5, 123.32/pb
+        [299064, 299065], # HLT_TripleMu_12_10_5_v5, 73.04/pb
+        [299067, 299067], # HLT_TripleMu_12_10_5_v5, 68.807/pb
+        [299096, 299096], # HLT_TripleMu_12_10_5_v5, 24.067/pb
+        [299149, 299149], # HLT_TripleMu_12_10_5_v5, 108.249/pb
+        [299178, 299178], # HLT_TripleMu_12_10_5_v5, 15.791/pb
+        [299180, 299180], # HLT_TripleMu_12_10_5_v5, 15.575/pb
+        [299184, 299185], # HLT_TripleMu_12_10_5_v5, 146.717/pb
+        [299327, 299327], # HLT_TripleMu_12_10_5_v5, 15.178/pb
+        [299329, 299329], # HLT_TripleMu_12_10_5_v5, 37.487/pb
+        [299368, 299370], # HLT_TripleMu_12_10_5_v6, 253.498/pb
+        [299380, 299381], # HLT_TripleMu_12_10_5_v6, 66.094/pb
+        [299394, 299396], # HLT_TripleMu_12_10_5_v6, 61.673/pb
+        [299420, 299420], # HLT_TripleMu_12_10_5_v6, 13.23/pb
+        [299443, 299443], # HLT_TripleMu_12_10_5_v6, 5.608/pb
+        [299450, 299450], # HLT_TripleMu_12_10_5_v6, 12.395/pb
+        [299477, 299481], # HLT_TripleMu_12_10_5_v6, 431.547/pb
+        [299593, 299595], # HLT_TripleMu_12_10_5_v6, 268.091/pb
+        [299597, 299597], # HLT_TripleMu_12_10_5_v6, 85.37/pb
+        [299649, 299649], # HLT_TripleMu_12_10_5_v6, 56.768/pb
+        [300087, 300087], # HLT_TripleMu_12_10_5_v7, 12.856/pb
+        [300105, 300107], # HLT_TripleMu_12_10_5_v7, 34.169/pb
+        [300117, 300117], # HLT_TripleMu_12_10_5_v7, 6.067/pb
+        [300122, 300123], # HLT_TripleMu_12_10_5_v7, 394.771/pb
+        [300155, 300157], # HLT_TripleMu_12_10_5_v7, 461.282/pb
+        [300226, 300226], # HLT_TripleMu_12_10_5_v7, 115.963/pb
+        [300233, 300240], # HLT_TripleMu_12_10_5_v7, 435.357/pb
+        [300280, 300284], # HLT_TripleMu_12_10_5_v7, 311.422/pb
+        [300364, 300375], # HLT_TripleMu_12_10_5_v7, 59.002/pb
+        [300389, 300401], # HLT_TripleMu_12_10_5_v7, 339.844/pb
+        [300459, 300459], # HLT_TripleMu_12_10_5_v7, 81.507/pb
+        [300461, 300464], # HLT_TripleMu_12_10_5_v7, 132.112/pb
+        [300466, 300467], # HLT_TripleMu_12_10_5_v7, 202.273/pb
+        [300497, 300497], # HLT_TripleMu_12_10_5_v7, 40.035/pb
+        [300514, 300517], # HLT_TripleMu_12_10_5_v7, 379.864/pb
+        [300558, 300558], # HLT_TripleMu_12_10_5_v7, 119.182/pb
+        [300560, 300560], # HLT_TripleMu_12_10_5_v7, 140.271/pb
+        [300574, 300576], # HLT_TripleMu_12_10_5_v7, 315.299/pb
+        [300631, 300633], # HLT_TripleMu_12_10_5_v7, 167.565/pb
+        [300635, 300636], # HLT_TripleMu_12_10_5_v7, 312.071/pb
+        [300673, 300676], # HLT_TripleMu_12_10_5_v7, 23.1/pb
+        [300742, 300742], # HLT_TripleMu_12_10_5_v7, 83.984/pb
+        [300777, 300777], # HLT_TripleMu_12_10_5_v7, 130.415/pb
+        [300780, 300780], # HLT_TripleMu_12_10_5_v7, 79.072/pb
+        [300785, 300785], # HLT_TripleMu_12_10_5_v7, 212.774/pb
+        [300806, 300806], # HLT_TripleMu_12_10_5_v7, 54.218/pb
+        [300811, 300812], # HLT_TripleMu_12_10_5_v7, 159.497/pb
+        [300816, 300817], # HLT_TripleMu_12_10_5_v7, 134.15/pb
+        [301046, 301046], # HLT_TripleMu_12_10_5_v7, 4.222/pb
+        [301141, 301142], # HLT_TripleMu_12_10_5_v7, 97.203/pb
+        [301161, 301161], # HLT_TripleMu_12_10_5_v7, 98.077/pb
+        [301165, 301165], # HLT_TripleMu_12_10_5_v7, 15.465/pb
+        [301179, 301180], # HLT_TripleMu_12_10_5_v7, 16.878/pb
+        [301183, 301183], # HLT_TripleMu_12_10_5_v7, 45.299/pb
+        [301281, 301281], # HLT_TripleMu_12_10_5_v7, 18.542/pb
+        [301283, 301283], # HLT_TripleMu_12_10_5_v7, 120.005/pb
+        [301298, 301298], # HLT_TripleMu_12_10_5_v7, 153.993/pb
+        [301323, 301323], # HLT_TripleMu_12_10_5_v7, 165.06/pb
+        [301330, 301330], # HLT_TripleMu_12_10_5_v7, 64.443/pb
+        [301359, 301359], # HLT_TripleMu_12_10_5_v7, 57.278/pb
+        [301384, 301384], # HLT_TripleMu_12_10_5_v7, 94.354/pb
+        [301391, 301393], # HLT_TripleMu_12_10_5_v7, 147.405/pb
+        [301396, 301399], # HLT_TripleMu_12_10_5_v7, 110.63/pb
+        [301417, 301417], # HLT_TripleMu_12_10_5_v7, 67.689/pb
+        [301447, 301450], # HLT_TripleMu_12_10_5_v7, 188.658/pb
+        [301461, 301461], # HLT_TripleMu_12_10_5_v7, 98.122/pb
+        [301472, 301472], # HLT_TripleMu_12_10_5_v7, 138.033/pb
+        [301475, 301476], # HLT_TripleMu_12_10_5_v7, 109.336/pb
+        [301519, 301519], # HLT_TripleMu_12_10_5_v7, 33.367/pb
+        [301524, 301524], # HLT_TripleMu_12_10_5_v7, 41.078/pb
+        [301529, 301532], # HLT_TripleMu_12_10_5_v7, 131.943/pb
+        [301567, 301567], # HLT_TripleMu_12_10_5_v7, 63.339/pb
+        [301627, 301627], # HLT_TripleMu_12_10_5_v7, 131.459/pb
+        [301664, 301665], # HLT_TripleMu_12_10_5_v7, 138.42/pb
+        [301694, 301694], # HLT_TripleMu_12_10_5_v7, 17.576/pb
+        [301912, 301914], # HLT_TripleMu_12_10_5_v7, 79.784/pb
+        [301941, 301941], # HLT_TripleMu_12_10_5_v7, 74.507/pb
+        [301959, 301960], # HLT_TripleMu_12_10_5_v7, 290.104/pb
+        [301970, 301970], # HLT_TripleMu_12_10_5_v7, 22.349/pb
+        [301984, 301987], # HLT_TripleMu_12_10_5_v7, 292.622/pb
+        [301997, 301998], # HLT_TripleMu_12_10_5_v7, 282.538/pb
+        [302019, 302019], # HLT_TripleMu_12_10_5_v7, 9.113/pb
+        [302026, 302026], # HLT_TripleMu_12_10_5_v8, 4.652/pb
+        [302029, 302029], # HLT_TripleMu_12_10_5_v8, 15.282/pb
+        [302031, 302031], # HLT_TripleMu_12_10_5_v8, 128.522/pb
+        [302033, 302034], # HLT_TripleMu_12_10_5_v8, 5.657/pb
+        [302037, 302038], # HLT_TripleMu_12_10_5_v8, 0.069/pb
+        [302040, 302043], # HLT_TripleMu_12_10_5_v8, 104.438/pb
+        [302131, 302131], # HLT_TripleMu_12_10_5_v8, 111.635/pb
+        [302159, 302159], # HLT_TripleMu_12_10_5_v8, 16.077/pb
+        [302163, 302163], # HLT_TripleMu_12_10_5_v8, 146.312/pb
+        [302165, 302166], # HLT_TripleMu_12_10_5_v8, 8.409/pb
+        [302225, 302225], # HLT_TripleMu_12_10_5_v8, 114.788/pb
+        [302228, 302229], # HLT_TripleMu_12_10_5_v8, 105.812/pb
+        [302240, 302240], # HLT_TripleMu_12_10_5_v8, 138.868/pb
+        [302262, 302263], # HLT_TripleMu_12_10_5_v8, 241.353/pb
+        [302277, 302277], # HLT_TripleMu_12_10_5_v8, 53.761/pb
+        [302279, 302280], # HLT_TripleMu_12_10_5_v8, 18.474/pb
+        [302322, 302322], # HLT_TripleMu_12_10_5_v8, 96.87/pb
+        [302328, 302328], # HLT_TripleMu_12_10_5_v8, 93.45/pb
+        [302337, 302337], # HLT_TripleMu_12_10_5_v8, 20.377/pb
+        [302342, 302344], # HLT_TripleMu_12_10_5_v8, 91.05/pb
+        [302350, 302350], # HLT_TripleMu_12_10_5_v8, 16.493/pb
+        [302388, 302388], # HLT_TripleMu_12_10_5_v8, 126.264/pb
+        [302392, 302393], # HLT_TripleMu_12_10_5_v8, 232.234/pb
+        [302448, 302448], # HLT_TripleMu_12_10_5_v8, 307.867/pb
+        [302472, 302476], # HLT_TripleMu_12_10_5_v8, 292.111/pb
+        [302479, 302479], # HLT_TripleMu_12_10_5_v8, 68.381/pb
+        [302484, 302485], # HLT_TripleMu_12_10_5_v8, 209.762/pb
+        [302492, 302494], # HLT_TripleMu_12_10_5_v8, 93.282/pb
+        [302509, 302509], # HLT_TripleMu_12_10_5_v8, 4.987/pb
+        [302513, 302513], # HLT_TripleMu_12_10_5_v8, 12.203/pb
+        [302522, 302523], # HLT_TripleMu_12_10_5_v8, 11.257/pb
+        [302525, 302526], # HLT_TripleMu_12_10_5_v8, 223.119/pb
+        [302548, 302548], # HLT_TripleMu_12_10_5_v8, 15.74/pb
+        [302551, 302551], # HLT_TripleMu_12_10_5_v8, 0.104/pb
+        [302553, 302555], # HLT_TripleMu_12_10_5_v8, 39.038/pb
+        [302563, 302563], # HLT_TripleMu_12_10_5_v8, 0.32/pb
+        [302565, 302565], # HLT_TripleMu_12_10_5_v8, 0.149/pb
+        [302572, 302573], # HLT_TripleMu_12_10_5_v8, 241.684/pb
+        [302596, 302597], # HLT_TripleMu_12_10_5_v8, 318.295/pb
+        [302634, 302635], # HLT_TripleMu_12_10_5_v8, 300.859/pb
+        [302651, 302651], # HLT_TripleMu_12_10_5_v8, 30.035/pb
+        [302654, 302654], # HLT_TripleMu_12_10_5_v8, 63.967/pb
+        [302661, 302661], # HLT_TripleMu_12_10_5_v8, 9.465/pb
+        [302663, 302663], # HLT_TripleMu_12_10_5_v8, 134.254/pb
+        [303825, 303825], # HLT_TripleMu_12_10_5_v8, 22.834/pb
+        [303832, 303832], # HLT_TripleMu_12_10_5_v8, 321.326/pb
+        [303838, 303838], # HLT_TripleMu_12_10_5_v8, 380.035/pb
+        [303885, 303885], # HLT_TripleMu_12_10_5_v8, 400.159/pb
+        [303948, 303948], # HLT_TripleMu_12_10_5_v8, 351.61/pb
+        [303998, 304000], # HLT_TripleMu_12_10_5_v8, 256.409/pb
+        [304062, 304062], # HLT_TripleMu_12_10_5_v8, 382.105/pb
+        [304119, 304120], # HLT_TripleMu_12_10_5_v8, 93.285/pb
+        [304125, 304125], # HLT_TripleMu_12_10_5_v8, 338.101/pb
+        [304144, 304144], # HLT_TripleMu_12_10_5_v8, 533.881/pb
+        [304158, 304158], # HLT_TripleMu_12_10_5_v8, 370.885/pb
+        [304169, 304170], # HLT_TripleMu_12_10_5_v8, 414.145/pb
+        [304199, 304200], # HLT_TripleMu_12_10_5_v8, 88.201/pb
+        [304204, 304204], # HLT_TripleMu_12_10_5_v8, 153.182/pb
+        [304209, 304209], # HLT_TripleMu_12_10_5_v8, 116.174/pb
+        [304291, 304292], # HLT_TripleMu_12_10_5_v8, 350.613/pb
+        [304333, 304333], # HLT_TripleMu_12_10_5_v8, 366.646/pb
+        [304354, 304354], # HLT_TripleMu_12_10_5_v8, 68.255/pb
+        [304366, 304366], # HLT_TripleMu_12_10_5_v8, 419.018/pb
+        [304446, 304447], # HLT_TripleMu_12_10_5_v8, 385.306/pb
+        [304451, 304451], # HLT_TripleMu_12_10_5_v8, 7.416/pb
+        [304505, 304508], # HLT_TripleMu_12_10_5_v8, 425.864/pb
+        [304562, 304562], # HLT_TripleMu_12_10_5_v8, 221.934/pb
+        [304616, 304616], # HLT_TripleMu_12_10_5_v8, 253.369/pb
+        [304625, 304626], # HLT_TripleMu_12_10_5_v8, 138.626/pb
+        [304654, 304655], # HLT_TripleMu_12_10_5_v8, 403.545/pb
+        [304661, 304663], # HLT_TripleMu_12_10_5_v8, 266.757/pb
+        [304671, 304672], # HLT_TripleMu_12_10_5_v8, 320.532/pb
+        [304737, 304740], # HLT_TripleMu_12_10_5_v8, 474.819/pb
+        [304776, 304778], # HLT_TripleMu_12_10_5_v8, 432.15/pb
+        [304797, 304797], # HLT_TripleMu_12_10_5_v8, 557.403/pb
+        [305044, 305046], # HLT_TripleMu_12_10_5_v8, 378.033/pb
+        [305059, 305059], # HLT_TripleMu_12_10_5_v8, 157.786/pb
+        [305062, 305064], # HLT_TripleMu_12_10_5_v8, 390.89/pb
+        [305081, 305081], # HLT_TripleMu_12_10_5_v8, 315.14/pb
+        [305112, 305114], # HLT_TripleMu_12_10_5_v8, 497.055/pb
+        [305178, 305184], # HLT_TripleMu_12_10_5_v8, 100.554/pb
+        [305186, 305186], # HLT_TripleMu_12_10_5_v8, 122.05/pb
+        [305188, 305188], # HLT_TripleMu_12_10_5_v8, 198.33/pb
+        [305202, 305202], # HLT_TripleMu_12_10_5_v8, 207.76/pb
+        [305204, 305204], # HLT_TripleMu_12_10_5_v8, 254.513/pb
+        [305207, 305208], # HLT_TripleMu_12_10_5_v8, 401.157/pb
+        [305234, 305234], # HLT_TripleMu_12_10_5_v8, 12.655/pb
+        [305236, 305237], # HLT_TripleMu_12_10_5_v8, 344.353/pb
+        [305247, 305248], # HLT_TripleMu_12_10_5_v8, 380.308/pb
+        [305252, 305252], # HLT_TripleMu_12_10_5_v8, 95.04/pb
+        [305282, 305282], # HLT_TripleMu_12_10_5_v8, 44.345/pb
+        [305310, 305314], # HLT_TripleMu_12_10_5_v8, 481.671/pb
+        [305336, 305336], # HLT_TripleMu_12_10_5_v8, 66.203/pb
+        [305338, 305338], # HLT_TripleMu_12_10_5_v8, 33.112/pb
+        [305341, 305341], # HLT_TripleMu_12_10_5_v8, 151.78/pb
+        [305349, 305351], # HLT_TripleMu_12_10_5_v8, 186.042/pb
+        [305358, 305358], # HLT_TripleMu_12_10_5_v8, 49.594/pb
+        [305364, 305366], # HLT_TripleMu_12_10_5_v8, 511.673/pb
+        [305376, 305377], # HLT_TripleMu_12_10_5_v8, 431.522/pb
+        [305405, 305406], # HLT_TripleMu_12_10_5_v8, 475.515/pb
+        [305440, 305441], # HLT_TripleMu_12_10_5_v8, 119.869/pb
+        [305516, 305518], # HLT_TripleMu_12_10_5_v8, 438.593/pb
+        [305586, 305586], # HLT_TripleMu_12_10_5_v8, 171.033/pb
+        [305589, 305590], # HLT_TripleMu_12_10_5_v8, 314.815/pb
+        [305636, 305636], # HLT_TripleMu_12_10_5_v8, 525.22/pb
+        [305766, 305766], # HLT_TripleMu_12_10_5_v8, 263.689/pb
+        [305809, 305809], # HLT_TripleMu_12_10_5_v8, 45.952/pb
+        [305814, 305814], # HLT_TripleMu_12_10_5_v8, 446.804/pb
+        [305821, 305821], # HLT_TripleMu_12_10_5_v8, 240.463/pb
+        [305832, 305832], # HLT_TripleMu_12_10_5_v8, 58.021/pb
+        [305840, 305840], # HLT_TripleMu_12_10_5_v8, 251.347/pb
+        [305842, 305842], # HLT_TripleMu_12_10_5_v8, 114.87/pb
+        [305862, 305862], # HLT_TripleMu_12_10_5_v8, 202.189/pb
+        [305898, 305898], # HLT_TripleMu_12_10_5_v8, 230.935/pb
+        [305902, 305902], # HLT_TripleMu_12_10_5_v8, 154.345/pb
+        [305967, 305967], # HLT_TripleMu_12_10_5_v8, 10.508/pb
+        [306029, 306030], # HLT_TripleMu_12_10_5_v8, 44.125/pb
+        [306036, 306038], # HLT_TripleMu_12_10_5_v8, 56.442/pb
+        [306041, 306042], # HLT_TripleMu_12_10_5_v8, 200.189/pb
+        [306048, 306049], # HLT_TripleMu_12_10_5_v8, 107.334/pb
+        [306051, 306051], # HLT_TripleMu_12_10_5_v8, 70.67/pb
+        [306091, 306092], # HLT_TripleMu_12_10_5_v8, 280.74/pb
+        [306095, 306095], # HLT_TripleMu_12_10_5_v8, 49.131/pb
+        [306121, 306122], # HLT_TripleMu_12_10_5_v8, 69.307/pb
+        [306125, 306126], # HLT_TripleMu_12_10_5_v8, 590.489/pb
+        [306134, 306135], # HLT_TripleMu_12_10_5_v8, 336.473/pb
+        [306138, 306139], # HLT_TripleMu_12_10_5_v8, 312.896/pb
+        [306153, 306155], # HLT_TripleMu_12_10_5_v8, 580.683/pb
+        [306169, 306171], # HLT_TripleMu_12_10_5_v8, 103.163/pb
+        [306418, 306420], # HLT_TripleMu_12_10_5_v9, 73.423/pb
+        [306422, 306423], # HLT_TripleMu_12_10_5_v9, 120.463/pb
+        [306432, 306432], # HLT_TripleMu_12_10_5_v9, 33.338/pb
+        [306454, 306460], # HLT_TripleMu_12_10_5_v9, 635.031/pb
+      ],
+    },
+  ],
+  '1e2mu' : [
+    {
+      'name'        : 'HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 94.725/pb
+        [297056, 297057], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 143.741/pb
+        [297099, 297101], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 241.495/pb
+        [297113, 297114], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 85.001/pb
+        [297175, 297178], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 280.582/pb
+        [297215, 297215], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 12.287/pb
+        [297218, 297219], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 425.447/pb
+        [297224, 297225], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 13.81/pb
+        [297227, 297227], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 15.669/pb
+        [297292, 297293], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 198.677/pb
+        [297296, 297296], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 84.207/pb
+        [297308, 297308], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 6.298/pb
+        [297359, 297359], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 13.795/pb
+        [297411, 297411], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 201.578/pb
+        [297424, 297426], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 97.376/pb
+        [297429, 297435], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 199.191/pb
+        [297467, 297469], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 69.859/pb
+        [297483, 297488], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 471.448/pb
+        [297503, 297505], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v8, 268.446/pb
+        [297557, 297558], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 158.712/pb
+        [297562, 297563], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 106.785/pb
+        [297598, 297599], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 93.85/pb
+        [297603, 297606], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 276.775/pb
+        [297620, 297620], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 82.127/pb
+        [297656, 297656], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 93.083/pb
+        [297665, 297666], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 78.347/pb
+        [297670, 297670], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 2.132/pb
+        [297674, 297675], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 170.78/pb
+        [297722, 297723], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 142.686/pb
+        [298996, 298997], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 26.765/pb
+        [299000, 299000], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 8.038/pb
+        [299042, 299042], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 2.02/pb
+        [299061, 299062], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 123.32/pb
+        [299064, 299065], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 73.04/pb
+        [299067, 299067], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 68.807/pb
+        [299096, 299096], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 24.067/pb
+        [299149, 299149], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 108.249/pb
+        [299178, 299178], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 15.791/pb
+        [299180, 299180], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 15.575/pb
+        [299184, 299185], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 146.717/pb
+        [299327, 299327], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 15.178/pb
+        [299329, 299329], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v10, 37.487/pb
+        [299368, 299370], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 253.498/pb
+        [299380, 299381], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 66.094/pb
+        [299394, 299396], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 61.673/pb
+        [299420, 299420], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 13.23/pb
+        [299443, 299443], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 5.608/pb
+        [299450, 299450], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 12.395/pb
+        [299477, 299481], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 431.547/pb
+        [299593, 299595], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 268.091/pb
+        [299597, 299597], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 85.37/pb
+        [299649, 299649], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v11, 56.768/pb
+        [300087, 300087], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 12.856/pb
+        [300105, 300107], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 34.169/pb
+        [300117, 300117], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 6.067/pb
+        [300122, 300123], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 394.771/pb
+        [300155, 300157], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 461.282/pb
+        [300226, 300226], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 115.963/pb
+        [300233, 300240], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 435.357/pb
+        [300280, 300284], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 311.422/pb
+        [300364, 300375], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 59.002/pb
+        [300389, 300401], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 339.844/pb
+        [300459, 300459], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 81.507/pb
+        [300461, 300464], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 132.112/pb
+        [300466, 300467], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 202.273/pb
+        [300497, 300497], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 40.035/pb
+        [300514, 300517], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 379.864/pb
+        [300558, 300558], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 119.182/pb
+        [300560, 300560], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 140.271/pb
+        [300574, 300576], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 315.299/pb
+        [300631, 300633], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 167.565/pb
+        [300635, 300636], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 312.071/pb
+        [300673, 300676], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 23.1/pb
+        [300742, 300742], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 83.984/pb
+        [300777, 300777], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 130.415/pb
+        [300780, 300780], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 79.072/pb
+        [300785, 300785], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 212.774/pb
+        [300806, 300806], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 54.218/pb
+        [300811, 300812], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 159.497/pb
+        [300816, 300817], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v12, 134.15/pb
+        [301046, 301046], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 4.222/pb
+        [301141, 301142], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 97.203/pb
+        [301161, 301161], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 98.077/pb
+        [301165, 301165], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 15.465/pb
+        [301179, 301180], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 16.878/pb
+        [301183, 301183], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 45.299/pb
+        [301281, 301281], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 18.542/pb
+        [301283, 301283], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 120.005/pb
+        [301298, 301298], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 153.993/pb
+        [301323, 301323], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 165.06/pb
+        [301330, 301330], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 64.443/pb
+        [301359, 301359], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 57.278/pb
+        [301384, 301384], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 94.354/pb
+        [301391, 301393], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 147.405/pb
+        [301396, 301399], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 110.63/pb
+        [301417, 301417], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 67.689/pb
+        [301447, 301450], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 188.658/pb
+        [301461, 301461], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 98.122/pb
+        [301472, 301472], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 138.033/pb
+        [301475, 301476], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 109.336/pb
+        [301519, 301519], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 33.367/pb
+        [301524, 301524], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 41.078/pb
+        [301529, 301532], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 131.943/pb
+        [301567, 301567], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 63.339/pb
+        [301627, 301627], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 131.459/pb
+        [301664, 301665], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 138.42/pb
+        [301694, 301694], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 17.576/pb
+        [301912, 301914], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 79.784/pb
+        [301941, 301941], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 74.507/pb
+        [301959, 301960], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 290.104/pb
+        [301970, 301970], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 22.349/pb
+        [301984, 301987], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 292.622/pb
+        [301997, 301998], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 282.538/pb
+        [302019, 302019], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v13, 9.113/pb
+        [302026, 302026], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 4.652/pb
+        [302029, 302029], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 15.282/pb
+        [302031, 302031], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 128.522/pb
+        [302033, 302034], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 5.657/pb
+        [302037, 302038], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 0.069/pb
+        [302040, 302043], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 104.438/pb
+        [302131, 302131], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 111.635/pb
+        [302159, 302159], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 16.077/pb
+        [302163, 302163], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 146.312/pb
+        [302165, 302166], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 8.409/pb
+        [302225, 302225], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 114.788/pb
+        [302228, 302229], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 105.812/pb
+        [302240, 302240], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 138.868/pb
+        [302262, 302263], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 241.353/pb
+        [302277, 302277], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 53.761/pb
+        [302279, 302280], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 18.474/pb
+        [302322, 302322], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 96.87/pb
+        [302328, 302328], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 93.45/pb
+        [302337, 302337], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 20.377/pb
+        [302342, 302344], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 91.05/pb
+        [302350, 302350], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 16.493/pb
+        [302388, 302388], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 126.264/pb
+        [302392, 302393], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 232.234/pb
+        [302448, 302448], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 307.867/pb
+        [302472, 302476], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 292.111/pb
+        [302479, 302479], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 68.381/pb
+        [302484, 302485], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 209.762/pb
+        [302492, 302494], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 93.282/pb
+        [302509, 302509], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 4.987/pb
+        [302513, 302513], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 12.203/pb
+        [302522, 302523], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 11.257/pb
+        [302525, 302526], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 223.119/pb
+        [302548, 302548], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 15.74/pb
+        [302551, 302551], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 0.104/pb
+        [302553, 302555], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 39.038/pb
+        [302563, 302563], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 0.32/pb
+        [302565, 302565], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 0.149/pb
+        [302572, 302573], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 241.684/pb
+        [302596, 302597], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 318.295/pb
+        [302634, 302635], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 300.859/pb
+        [302651, 302651], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 30.035/pb
+        [302654, 302654], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 63.967/pb
+        [302661, 302661], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 9.465/pb
+        [302663, 302663], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 134.254/pb
+        [303825, 303825], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 22.834/pb
+        [303832, 303832], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 321.326/pb
+        [303838, 303838], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 380.035/pb
+        [303885, 303885], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 400.159/pb
+        [303948, 303948], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 351.61/pb
+        [303998, 304000], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 256.409/pb
+        [304062, 304062], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 382.105/pb
+        [304119, 304120], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 93.285/pb
+        [304125, 304125], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 338.101/pb
+        [304144, 304144], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 533.881/pb
+        [304158, 304158], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 370.885/pb
+        [304169, 304170], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 414.145/pb
+        [304199, 304200], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 88.201/pb
+        [304204, 304204], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 153.182/pb
+        [304209, 304209], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 116.174/pb
+        [304291, 304292], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 350.613/pb
+        [304333, 304333], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 366.646/pb
+        [304354, 304354], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 68.255/pb
+        [304366, 304366], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 419.018/pb
+        [304446, 304447], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 385.306/pb
+        [304451, 304451], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 7.416/pb
+        [304505, 304508], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 425.864/pb
+        [304562, 304562], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 221.934/pb
+        [304616, 304616], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 253.369/pb
+        [304625, 304626], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 138.626/pb
+        [304654, 304655], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 403.545/pb
+        [304661, 304663], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 266.757/pb
+        [304671, 304672], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 320.532/pb
+        [304737, 304740], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 474.819/pb
+        [304776, 304778], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 432.15/pb
+        [304797, 304797], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 557.403/pb
+        [305044, 305046], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 378.033/pb
+        [305059, 305059], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 157.786/pb
+        [305062, 305064], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 390.89/pb
+        [305081, 305081], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 315.14/pb
+        [305112, 305114], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 497.055/pb
+        [305178, 305184], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 100.554/pb
+        [305186, 305186], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 122.05/pb
+        [305188, 305188], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 198.33/pb
+        [305202, 305202], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 207.76/pb
+        [305204, 305204], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 254.513/pb
+        [305207, 305208], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 401.157/pb
+        [305234, 305234], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 12.655/pb
+        [305236, 305237], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 344.353/pb
+        [305247, 305248], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 380.308/pb
+        [305252, 305252], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 95.04/pb
+        [305282, 305282], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 44.345/pb
+        [305310, 305314], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 481.671/pb
+        [305336, 305336], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 66.203/pb
+        [305338, 305338], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 33.112/pb
+        [305341, 305341], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 151.78/pb
+        [305349, 305351], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 186.042/pb
+        [305358, 305358], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 49.594/pb
+        [305364, 305366], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 511.673/pb
+        [305376, 305377], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 431.522/pb
+        [305405, 305406], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 475.515/pb
+        [305440, 305441], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 119.869/pb
+        [305516, 305518], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 438.593/pb
+        [305586, 305586], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 171.033/pb
+        [305589, 305590], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 314.815/pb
+        [305636, 305636], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 525.22/pb
+        [305766, 305766], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 263.689/pb
+        [305809, 305809], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 45.952/pb
+        [305814, 305814], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 446.804/pb
+        [305821, 305821], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 240.463/pb
+        [305832, 305832], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 58.021/pb
+        [305840, 305840], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 251.347/pb
+        [305842, 305842], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 114.87/pb
+        [305862, 305862], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 202.189/pb
+        [305898, 305898], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 230.935/pb
+        [305902, 305902], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 154.345/pb
+        [305967, 305967], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 10.508/pb
+        [306029, 306030], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 44.125/pb
+        [306036, 306038], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 56.442/pb
+        [306041, 306042], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 200.189/pb
+        [306048, 306049], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 107.334/pb
+        [306051, 306051], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 70.67/pb
+        [306091, 306092], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 280.74/pb
+        [306095, 306095], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 49.131/pb
+        [306121, 306122], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 69.307/pb
+        [306125, 306126], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 590.489/pb
+        [306134, 306135], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 336.473/pb
+        [306138, 306139], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 312.896/pb
+        [306153, 306155], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 580.683/pb
+        [306169, 306171], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v14, 103.163/pb
+        [306418, 306420], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 73.423/pb
+        [306422, 306423], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 120.463/pb
+        [306432, 306432], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 33.338/pb
+        [306454, 306460], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 635.031/pb
+      ],
+    },
+  ],
+  '2e1mu' : [
+    {
+      'name'        : 'HLT_Mu8_DiEle12_CaloIdL_TrackIdL',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 94.725/pb
+        [297056, 297057], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 143.741/pb
+        [297099, 297101], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 241.495/pb
+        [297113, 297114], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 85.001/pb
+        [297175, 297178], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 280.582/pb
+        [297215, 297215], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 12.287/pb
+        [297218, 297219], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 425.447/pb
+        [297224, 297225], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 13.81/pb
+        [297227, 297227], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 15.669/pb
+        [297292, 297293], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 198.677/pb
+        [297296, 297296], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 84.207/pb
+        [297308, 297308], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 6.298/pb
+        [297359, 297359], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 13.795/pb
+        [297411, 297411], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 201.578/pb
+        [297424, 297426], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 97.376/pb
+        [297429, 297435], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 199.191/pb
+        [297467, 297469], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 69.859/pb
+        [297483, 297488], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 471.448/pb
+        [297503, 297505], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v9, 268.446/pb
+        [297557, 297558], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 158.712/pb
+        [297562, 297563], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 106.785/pb
+        [297598, 297599], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 93.85/pb
+        [297603, 297606], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 276.775/pb
+        [297620, 297620], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 82.127/pb
+        [297656, 297656], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 93.083/pb
+        [297665, 297666], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 78.347/pb
+        [297670, 297670], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 2.132/pb
+        [297674, 297675], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 170.78/pb
+        [297722, 297723], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 142.686/pb
+        [298996, 298997], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 26.765/pb
+        [299000, 299000], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 8.038/pb
+        [299042, 299042], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 2.02/pb
+        [299061, 299062], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 123.32/pb
+        [299064, 299065], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 73.04/pb
+        [299067, 299067], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 68.807/pb
+        [299096, 299096], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 24.067/pb
+        [299149, 299149], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 108.249/pb
+        [299178, 299178], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 15.791/pb
+        [299180, 299180], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 15.575/pb
+        [299184, 299185], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 146.717/pb
+        [299327, 299327], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 15.178/pb
+        [299329, 299329], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v11, 37.487/pb
+        [299368, 299370], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 253.498/pb
+        [299380, 299381], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 66.094/pb
+        [299394, 299396], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 61.673/pb
+        [299420, 299420], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 13.23/pb
+        [299443, 299443], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 5.608/pb
+        [299450, 299450], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 12.395/pb
+        [299477, 299481], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 431.547/pb
+        [299593, 299595], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 268.091/pb
+        [299597, 299597], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 85.37/pb
+        [299649, 299649], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v12, 56.768/pb
+        [300087, 300087], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 12.856/pb
+        [300105, 300107], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 34.169/pb
+        [300117, 300117], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 6.067/pb
+        [300122, 300123], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 394.771/pb
+        [300155, 300157], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 461.282/pb
+        [300226, 300226], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 115.963/pb
+        [300233, 300240], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 435.357/pb
+        [300280, 300284], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 311.422/pb
+        [300364, 300375], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 59.002/pb
+        [300389, 300401], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 339.844/pb
+        [300459, 300459], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 81.507/pb
+        [300461, 300464], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 132.112/pb
+        [300466, 300467], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 202.273/pb
+        [300497, 300497], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 40.035/pb
+        [300514, 300517], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 379.864/pb
+        [300558, 300558], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 119.182/pb
+        [300560, 300560], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 140.271/pb
+        [300574, 300576], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 315.299/pb
+        [300631, 300633], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 167.565/pb
+        [300635, 300636], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 312.071/pb
+        [300673, 300676], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 23.1/pb
+        [300742, 300742], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 83.984/pb
+        [300777, 300777], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 130.415/pb
+        [300780, 300780], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 79.072/pb
+        [300785, 300785], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 212.774/pb
+        [300806, 300806], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 54.218/pb
+        [300811, 300812], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 159.497/pb
+        [300816, 300817], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v13, 134.15/pb
+        [301046, 301046], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 4.222/pb
+        [301141, 301142], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 97.203/pb
+        [301161, 301161], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 98.077/pb
+        [301165, 301165], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 15.465/pb
+        [301179, 301180], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 16.878/pb
+        [301183, 301183], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 45.299/pb
+        [301281, 301281], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 18.542/pb
+        [301283, 301283], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 120.005/pb
+        [301298, 301298], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 153.993/pb
+        [301323, 301323], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 165.06/pb
+        [301330, 301330], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 64.443/pb
+        [301359, 301359], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 57.278/pb
+        [301384, 301384], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 94.354/pb
+        [301391, 301393], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 147.405/pb
+        [301396, 301399], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 110.63/pb
+        [301417, 301417], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 67.689/pb
+        [301447, 301450], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 188.658/pb
+        [301461, 301461], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 98.122/pb
+        [301472, 301472], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 138.033/pb
+        [301475, 301476], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 109.336/pb
+        [301519, 301519], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 33.367/pb
+        [301524, 301524], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 41.078/pb
+        [301529, 301532], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 131.943/pb
+        [301567, 301567], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 63.339/pb
+        [301627, 301627], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 131.459/pb
+        [301664, 301665], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 138.42/pb
+        [301694, 301694], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 17.576/pb
+        [301912, 301914], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 79.784/pb
+        [301941, 301941], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 74.507/pb
+        [301959, 301960], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 290.104/pb
+        [301970, 301970], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 22.349/pb
+        [301984, 301987], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 292.622/pb
+        [301997, 301998], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 282.538/pb
+        [302019, 302019], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v14, 9.113/pb
+        [302026, 302026], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 4.652/pb
+        [302029, 302029], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 15.282/pb
+        [302031, 302031], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 128.522/pb
+        [302033, 302034], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 5.657/pb
+        [302037, 302038], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 0.069/pb
+        [302040, 302043], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 104.438/pb
+        [302131, 302131], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 111.635/pb
+        [302159, 302159], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 16.077/pb
+        [302163, 302163], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 146.312/pb
+        [302165, 302166], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 8.409/pb
+        [302225, 302225], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 114.788/pb
+        [302228, 302229], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 105.812/pb
+        [302240, 302240], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 138.868/pb
+        [302262, 302263], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 241.353/pb
+        [302277, 302277], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 53.761/pb
+        [302279, 302280], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 18.474/pb
+        [302322, 302322], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 96.87/pb
+        [302328, 302328], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 93.45/pb
+        [302337, 302337], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 20.377/pb
+        [302342, 302344], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 91.05/pb
+        [302350, 302350], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 16.493/pb
+        [302388, 302388], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 126.264/pb
+        [302392, 302393], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 232.234/pb
+        [302448, 302448], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 307.867/pb
+        [302472, 302476], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 292.111/pb
+        [302479, 302479], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 68.381/pb
+        [302484, 302485], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 209.762/pb
+        [302492, 302494], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 93.282/pb
+        [302509, 302509], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 4.987/pb
+        [302513, 302513], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 12.203/pb
+        [302522, 302523], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 11.257/pb
+        [302525, 302526], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 223.119/pb
+        [302548, 302548], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 15.74/pb
+        [302551, 302551], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 0.104/pb
+        [302553, 302555], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 39.038/pb
+        [302563, 302563], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 0.32/pb
+        [302565, 302565], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 0.149/pb
+        [302572, 302573], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 241.684/pb
+        [302596, 302597], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 318.295/pb
+        [302634, 302635], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 300.859/pb
+        [302651, 302651], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 30.035/pb
+        [302654, 302654], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 63.967/pb
+        [302661, 302661], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 9.465/pb
+        [302663, 302663], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 134.254/pb
+        [303825, 303825], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 22.834/pb
+        [303832, 303832], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 321.326/pb
+        [303838, 303838], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 380.035/pb
+        [303885, 303885], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 400.159/pb
+        [303948, 303948], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 351.61/pb
+        [303998, 304000], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 256.409/pb
+        [304062, 304062], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 382.105/pb
+        [304119, 304120], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 93.285/pb
+        [304125, 304125], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 338.101/pb
+        [304144, 304144], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 533.881/pb
+        [304158, 304158], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 370.885/pb
+        [304169, 304170], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 414.145/pb
+        [304199, 304200], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 88.201/pb
+        [304204, 304204], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 153.182/pb
+        [304209, 304209], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 116.174/pb
+        [304291, 304292], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 350.613/pb
+        [304333, 304333], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 366.646/pb
+        [304354, 304354], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 68.255/pb
+        [304366, 304366], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 419.018/pb
+        [304446, 304447], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 385.306/pb
+        [304451, 304451], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 7.416/pb
+        [304505, 304508], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 425.864/pb
+        [304562, 304562], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 221.934/pb
+        [304616, 304616], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 253.369/pb
+        [304625, 304626], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 138.626/pb
+        [304654, 304655], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 403.545/pb
+        [304661, 304663], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 266.757/pb
+        [304671, 304672], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 320.532/pb
+        [304737, 304740], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 474.819/pb
+        [304776, 304778], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 432.15/pb
+        [304797, 304797], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 557.403/pb
+        [305044, 305046], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 378.033/pb
+        [305059, 305059], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 157.786/pb
+        [305062, 305064], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 390.89/pb
+        [305081, 305081], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 315.14/pb
+        [305112, 305114], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 497.055/pb
+        [305178, 305184], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 100.554/pb
+        [305186, 305186], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 122.05/pb
+        [305188, 305188], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 198.33/pb
+        [305202, 305202], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 207.76/pb
+        [305204, 305204], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 254.513/pb
+        [305207, 305208], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 401.157/pb
+        [305234, 305234], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 12.655/pb
+        [305236, 305237], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 344.353/pb
+        [305247, 305248], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 380.308/pb
+        [305252, 305252], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 95.04/pb
+        [305282, 305282], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 44.345/pb
+        [305310, 305314], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 481.671/pb
+        [305336, 305336], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 66.203/pb
+        [305338, 305338], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 33.112/pb
+        [305341, 305341], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 151.78/pb
+        [305349, 305351], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 186.042/pb
+        [305358, 305358], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 49.594/pb
+        [305364, 305366], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 511.673/pb
+        [305376, 305377], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 431.522/pb
+        [305405, 305406], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 475.515/pb
+        [305440, 305441], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 119.869/pb
+        [305516, 305518], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 438.593/pb
+        [305586, 305586], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 171.033/pb
+        [305589, 305590], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 314.815/pb
+        [305636, 305636], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 525.22/pb
+        [305766, 305766], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 263.689/pb
+        [305809, 305809], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 45.952/pb
+        [305814, 305814], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 446.804/pb
+        [305821, 305821], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 240.463/pb
+        [305832, 305832], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 58.021/pb
+        [305840, 305840], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 251.347/pb
+        [305842, 305842], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 114.87/pb
+        [305862, 305862], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 202.189/pb
+        [305898, 305898], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 230.935/pb
+        [305902, 305902], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 154.345/pb
+        [305967, 305967], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 10.508/pb
+        [306029, 306030], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 44.125/pb
+        [306036, 306038], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 56.442/pb
+        [306041, 306042], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 200.189/pb
+        [306048, 306049], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 107.334/pb
+        [306051, 306051], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 70.67/pb
+        [306091, 306092], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 280.74/pb
+        [306095, 306095], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 49.131/pb
+        [306121, 306122], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 69.307/pb
+        [306125, 306126], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 590.489/pb
+        [306134, 306135], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 336.473/pb
+        [306138, 306139], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 312.896/pb
+        [306153, 306155], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 580.683/pb
+        [306169, 306171], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v15, 103.163/pb
+        [306418, 306420], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 73.423/pb
+        [306422, 306423], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 120.463/pb
+        [306432, 306432], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 33.338/pb
+        [306454, 306460], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 635.031/pb
+      ],
+    },
+  ],
+  '3e' : [
+    {
+      'name'        : 'HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL',
+      'unprescaled' : False, # has PU dependence
+      'runs'        : [
+        [297050, 297050], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 94.725/pb
+        [297056, 297057], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 143.741/pb
+        [297099, 297101], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 241.495/pb
+        [297113, 297114], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 85.001/pb
+        [297175, 297178], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 280.582/pb
+        [297215, 297215], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 12.287/pb
+        [297218, 297219], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 425.447/pb
+        [297224, 297225], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 13.81/pb
+        [297227, 297227], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 15.669/pb
+        [297292, 297293], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 198.677/pb
+        [297296, 297296], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 84.207/pb
+        [297308, 297308], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 6.298/pb
+        [297359, 297359], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 13.795/pb
+        [297411, 297411], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 201.578/pb
+        [297424, 297426], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 97.376/pb
+        [297429, 297435], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 199.191/pb
+        [297467, 297469], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 69.859/pb
+        [297483, 297488], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 471.448/pb
+        [297503, 297505], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v1, 268.446/pb
+        [297557, 297558], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 158.712/pb
+        [297562, 297563], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 106.785/pb
+        [297598, 297599], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 93.85/pb
+        [297603, 297606], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 276.775/pb
+        [297620, 297620], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 82.127/pb
+        [297656, 297656], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 93.083/pb
+        [297665, 297666], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 78.347/pb
+        [297670, 297670], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 2.132/pb
+        [297674, 297675], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 170.78/pb
+        [297722, 297723], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 142.686/pb
+        [298996, 298997], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 26.765/pb
+        [299000, 299000], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 8.038/pb
+        [299042, 299042], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 2.02/pb
+        [299061, 299062], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 123.32/pb
+        [299064, 299065], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 73.04/pb
+        [299067, 299067], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 68.807/pb
+        [299096, 299096], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 24.067/pb
+        [299149, 299149], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 108.249/pb
+        [299178, 299178], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 15.791/pb
+        [299180, 299180], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 15.575/pb
+        [299184, 299185], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 146.717/pb
+        [299327, 299327], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 15.178/pb
+        [299329, 299329], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v3, 37.487/pb
+        [299368, 299370], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 253.498/pb
+        [299380, 299381], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 66.094/pb
+        [299394, 299396], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 61.673/pb
+        [299420, 299420], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 13.23/pb
+        [299443, 299443], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 5.608/pb
+        [299450, 299450], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 12.395/pb
+        [299477, 299481], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 431.547/pb
+        [299593, 299595], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 268.091/pb
+        [299597, 299597], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 85.37/pb
+        [299649, 299649], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v4, 56.768/pb
+        [300087, 300087], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 12.856/pb
+        [300105, 300107], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 34.169/pb
+        [300117, 300117], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 6.067/pb
+        [300122, 300123], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 394.771/pb
+        [300155, 300157], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 461.282/pb
+        [300226, 300226], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 115.963/pb
+        [300233, 300240], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 435.357/pb
+        [300280, 300284], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 311.422/pb
+        [300364, 300375], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 59.002/pb
+        [300389, 300401], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 339.844/pb
+        [300459, 300459], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 81.507/pb
+        [300461, 300464], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 132.112/pb
+        [300466, 300467], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 202.273/pb
+        [300497, 300497], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 40.035/pb
+        [300514, 300517], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 379.864/pb
+        [300558, 300558], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 119.182/pb
+        [300560, 300560], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 140.271/pb
+        [300574, 300576], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 315.299/pb
+        [300631, 300633], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 167.565/pb
+        [300635, 300636], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 312.071/pb
+        [300673, 300676], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 23.1/pb
+        [300742, 300742], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 83.984/pb
+        [300777, 300777], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 130.415/pb
+        [300780, 300780], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 79.072/pb
+        [300785, 300785], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 212.774/pb
+        [300806, 300806], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 54.218/pb
+        [300811, 300812], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 159.497/pb
+        [300816, 300817], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v5, 134.15/pb
+        [301046, 301046], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 4.222/pb
+        [301141, 301142], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 97.203/pb
+        [301161, 301161], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 98.077/pb
+        [301165, 301165], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 15.465/pb
+        [301179, 301180], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 16.878/pb
+        [301183, 301183], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 45.299/pb
+        [301281, 301281], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 18.542/pb
+        [301283, 301283], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 120.005/pb
+        [301298, 301298], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 153.993/pb
+        [301323, 301323], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 165.06/pb
+        [301330, 301330], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 64.443/pb
+        [301359, 301359], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 57.278/pb
+        [301384, 301384], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 94.354/pb
+        [301391, 301393], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 147.405/pb
+        [301396, 301399], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 110.63/pb
+        [301417, 301417], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 67.689/pb
+        [301447, 301450], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 188.658/pb
+        [301461, 301461], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 98.122/pb
+        [301472, 301472], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 138.033/pb
+        [301475, 301476], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 109.336/pb
+        [301519, 301519], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 33.367/pb
+        [301524, 301524], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 41.078/pb
+        [301529, 301532], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 131.943/pb
+        [301567, 301567], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 63.339/pb
+        [301627, 301627], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 131.459/pb
+        [301664, 301665], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 138.42/pb
+        [301694, 301694], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 17.576/pb
+        [301912, 301914], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 79.784/pb
+        [301941, 301941], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 74.507/pb
+        [301959, 301960], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 290.104/pb
+        [301970, 301970], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 22.349/pb
+        [301984, 301987], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 292.622/pb
+        [301997, 301998], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 282.538/pb
+        [302019, 302019], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v6, 9.113/pb
+        [302026, 302026], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 4.652/pb
+        [302029, 302029], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 15.282/pb
+        [302031, 302031], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 128.522/pb
+        [302033, 302034], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 5.657/pb
+        [302037, 302038], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 0.069/pb
+        [302040, 302043], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 104.438/pb
+        [302131, 302131], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 111.635/pb
+        [302159, 302159], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 16.077/pb
+        [302163, 302163], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 146.312/pb
+        [302165, 302166], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 8.409/pb
+        [302225, 302225], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 114.788/pb
+        [302228, 302229], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 105.812/pb
+        [302240, 302240], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 138.868/pb
+        [302262, 302263], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 241.353/pb
+        [302277, 302277], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 53.761/pb
+        [302279, 302280], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 18.474/pb
+        [302322, 302322], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 96.87/pb
+        [302328, 302328], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 93.45/pb
+        [302337, 302337], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 20.377/pb
+        [302342, 302344], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 91.05/pb
+        [302350, 302350], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 16.493/pb
+        [302388, 302388], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 126.264/pb
+        [302392, 302393], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 232.234/pb
+        [302448, 302448], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 307.867/pb
+        [302472, 302476], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 292.111/pb
+        [302479, 302479], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 68.381/pb
+        [302484, 302485], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 209.762/pb
+        [302492, 302494], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 93.282/pb
+        [302509, 302509], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 4.987/pb
+        [302513, 302513], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 12.203/pb
+        [302522, 302523], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 11.257/pb
+        [302525, 302526], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 223.119/pb
+        [302548, 302548], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 15.74/pb
+        [302551, 302551], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 0.104/pb
+        [302553, 302555], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 39.038/pb
+        [302563, 302563], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 0.32/pb
+        [302565, 302565], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 0.149/pb
+        [302572, 302573], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 241.684/pb
+        [302596, 302597], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 318.295/pb
+        [302634, 302635], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 300.859/pb
+        [302651, 302651], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 30.035/pb
+        [302654, 302654], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 63.967/pb
+        [302661, 302661], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 9.465/pb
+        [302663, 302663], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 134.254/pb
+        [303825, 303825], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 22.834/pb
+        [303832, 303832], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 319.146/pb
+        [303838, 303838], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 380.035/pb
+        [303885, 303885], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 400.159/pb
+        [303948, 303948], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 351.61/pb
+        [303998, 304000], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 256.409/pb
+        [304062, 304062], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 382.105/pb
+        [304119, 304120], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 93.285/pb
+        [304125, 304125], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 338.101/pb
+        [304144, 304144], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 515.153/pb
+        [304158, 304158], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 370.885/pb
+        [304169, 304170], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 414.145/pb
+        [304199, 304200], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 88.201/pb
+        [304204, 304204], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 146.532/pb
+        [304209, 304209], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 116.174/pb
+        [304291, 304292], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 327.839/pb
+        [304333, 304333], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 265.074/pb
+        [304366, 304366], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 316.608/pb
+        [304447, 304447], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 297.037/pb
+        [304451, 304451], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 7.416/pb
+        [304507, 304508], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 287.408/pb
+        [304562, 304562], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 154.568/pb
+        [304616, 304616], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 181.339/pb
+        [304625, 304626], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 45.136/pb
+        [304654, 304655], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 309.562/pb
+        [304662, 304663], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 187.704/pb
+        [304671, 304672], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 199.478/pb
+        [304737, 304740], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 337.971/pb
+        [304777, 304778], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 309.59/pb
+        [304797, 304797], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 435.186/pb
+        [305044, 305046], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 361.031/pb
+        [305059, 305059], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 1.621/pb
+        [305063, 305064], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 381.37/pb
+        [305081, 305081], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 310.486/pb
+        [305112, 305114], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 470.526/pb
+        [305186, 305186], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 91.525/pb
+        [305188, 305188], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 198.33/pb
+        [305202, 305202], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 51.016/pb
+        [305204, 305204], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 254.513/pb
+        [305207, 305208], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 198.447/pb
+        [305234, 305234], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 8.952/pb
+        [305236, 305237], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 344.353/pb
+        [305247, 305248], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 380.204/pb
+        [305252, 305252], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 95.04/pb
+        [305282, 305282], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 40.353/pb
+        [305310, 305314], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 479.975/pb
+        [305341, 305341], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 67.358/pb
+        [305349, 305351], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 186.042/pb
+        [305365, 305366], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 333.13/pb
+        [305377, 305377], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 316.862/pb
+        [305405, 305406], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 319.891/pb
+        [305516, 305518], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 365.102/pb
+        [305586, 305586], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 11.253/pb
+        [305589, 305590], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 314.526/pb
+        [305636, 305636], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 375.118/pb
+        [305766, 305766], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 76.932/pb
+        [305814, 305814], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 294.313/pb
+        [305821, 305821], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 77.142/pb
+        [305840, 305840], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 251.347/pb
+        [305842, 305842], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 114.87/pb
+        [305862, 305862], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 20.941/pb
+        [305898, 305898], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 40.896/pb
+        [306041, 306042], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 106.725/pb
+        [306048, 306049], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 107.334/pb
+        [306051, 306051], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 70.67/pb
+        [306091, 306092], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 235.841/pb
+        [306095, 306095], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 49.131/pb
+        [306125, 306126], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 479.089/pb
+        [306135, 306135], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 134.485/pb
+        [306138, 306139], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 311.736/pb
+        [306154, 306155], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 431.816/pb
+        [306169, 306171], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 102.476/pb
+        [306422, 306423], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 120.463/pb
+        [306432, 306432], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 33.338/pb
+        [306456, 306460], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v7, 451.644/pb
+      ],
+    },
+  ],
+  '2mu' : [
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8', # missing in run B
+      'unprescaled' : True,
+      'runs'        : [
+        [299368, 299370], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 253.498/pb
+        [299380, 299381], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 66.094/pb
+        [299394, 299396], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 61.673/pb
+        [299420, 299420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 13.23/pb
+        [299443, 299443], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 5.608/pb
+        [299450, 299450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 12.395/pb
+        [299477, 299481], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 431.547/pb
+        [299593, 299595], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 268.091/pb
+        [299597, 299597], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 85.37/pb
+        [299649, 299649], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v1, 56.768/pb
+        [300087, 300087], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 12.856/pb
+        [300105, 300107], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 34.169/pb
+        [300117, 300117], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 6.067/pb
+        [300122, 300123], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 394.771/pb
+        [300155, 300157], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 461.282/pb
+        [300226, 300226], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 115.963/pb
+        [300233, 300240], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 435.357/pb
+        [300280, 300284], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 311.422/pb
+        [300364, 300375], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 59.002/pb
+        [300389, 300401], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 339.844/pb
+        [300459, 300459], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 81.507/pb
+        [300461, 300464], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 132.112/pb
+        [300466, 300467], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 202.273/pb
+        [300497, 300497], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 40.035/pb
+        [300514, 300517], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 379.864/pb
+        [300558, 300558], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 119.182/pb
+        [300560, 300560], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 140.271/pb
+        [300574, 300576], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 315.299/pb
+        [300631, 300633], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 167.565/pb
+        [300635, 300636], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 312.071/pb
+        [300673, 300676], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 23.1/pb
+        [300742, 300742], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 83.984/pb
+        [300777, 300777], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 130.415/pb
+        [300780, 300780], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 79.072/pb
+        [300785, 300785], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 212.774/pb
+        [300806, 300806], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 54.218/pb
+        [300811, 300812], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 159.497/pb
+        [300816, 300817], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 134.15/pb
+        [301046, 301046], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 4.222/pb
+        [301141, 301142], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 97.203/pb
+        [301161, 301161], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 98.077/pb
+        [301165, 301165], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 15.465/pb
+        [301179, 301180], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 16.878/pb
+        [301183, 301183], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 45.299/pb
+        [301281, 301281], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 18.542/pb
+        [301283, 301283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 120.005/pb
+        [301298, 301298], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 153.993/pb
+        [301323, 301323], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 165.06/pb
+        [301330, 301330], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 64.443/pb
+        [301359, 301359], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 57.278/pb
+        [301384, 301384], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 94.354/pb
+        [301391, 301393], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 147.405/pb
+        [301396, 301399], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 110.63/pb
+        [301417, 301417], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 67.689/pb
+        [301447, 301450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 188.658/pb
+        [301461, 301461], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 98.122/pb
+        [301472, 301472], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 138.033/pb
+        [301475, 301476], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 109.336/pb
+        [301519, 301519], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 33.367/pb
+        [301524, 301524], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 41.078/pb
+        [301529, 301532], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 131.943/pb
+        [301567, 301567], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 63.339/pb
+        [301627, 301627], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 131.459/pb
+        [301664, 301665], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 138.42/pb
+        [301694, 301694], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 17.576/pb
+        [301912, 301914], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 79.784/pb
+        [301941, 301941], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 74.507/pb
+        [301959, 301960], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 290.104/pb
+        [301970, 301970], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 22.349/pb
+        [301984, 301987], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 292.622/pb
+        [301997, 301998], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 282.538/pb
+        [302019, 302019], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v2, 9.113/pb
+        [302026, 302026], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 4.652/pb
+        [302029, 302029], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 15.282/pb
+        [302031, 302031], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 128.522/pb
+        [302033, 302034], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 5.657/pb
+        [302037, 302038], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 0.069/pb
+        [302040, 302043], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 104.438/pb
+        [302131, 302131], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 111.635/pb
+        [302159, 302159], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 16.077/pb
+        [302163, 302163], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 146.312/pb
+        [302165, 302166], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 8.409/pb
+        [302225, 302225], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 114.788/pb
+        [302228, 302229], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 105.812/pb
+        [302240, 302240], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 138.868/pb
+        [302262, 302263], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 241.353/pb
+        [302277, 302277], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 53.761/pb
+        [302279, 302280], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 18.474/pb
+        [302322, 302322], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 96.87/pb
+        [302328, 302328], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 93.45/pb
+        [302337, 302337], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 20.377/pb
+        [302342, 302344], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 91.05/pb
+        [302350, 302350], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 16.493/pb
+        [302388, 302388], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 126.264/pb
+        [302392, 302393], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 232.234/pb
+        [302448, 302448], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 307.867/pb
+        [302472, 302476], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 292.111/pb
+        [302479, 302479], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 68.381/pb
+        [302484, 302485], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 209.762/pb
+        [302492, 302494], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 93.282/pb
+        [302509, 302509], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 4.987/pb
+        [302513, 302513], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 12.203/pb
+        [302522, 302523], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 11.257/pb
+        [302525, 302526], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 223.119/pb
+        [302548, 302548], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 15.74/pb
+        [302551, 302551], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 0.104/pb
+        [302553, 302555], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 39.038/pb
+        [302563, 302563], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 0.32/pb
+        [302565, 302565], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 0.149/pb
+        [302572, 302573], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 241.684/pb
+        [302596, 302597], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 318.295/pb
+        [302634, 302635], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 300.859/pb
+        [302651, 302651], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 30.035/pb
+        [302654, 302654], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 63.967/pb
+        [302661, 302661], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 9.465/pb
+        [302663, 302663], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 134.254/pb
+        [303825, 303825], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 22.834/pb
+        [303832, 303832], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 321.326/pb
+        [303838, 303838], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 380.035/pb
+        [303885, 303885], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 400.159/pb
+        [303948, 303948], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 351.61/pb
+        [303998, 304000], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 256.409/pb
+        [304062, 304062], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 382.105/pb
+        [304119, 304120], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 93.285/pb
+        [304125, 304125], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 338.101/pb
+        [304144, 304144], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 533.881/pb
+        [304158, 304158], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 370.885/pb
+        [304169, 304170], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 414.145/pb
+        [304199, 304200], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 88.201/pb
+        [304204, 304204], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 153.182/pb
+        [304209, 304209], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 116.174/pb
+        [304291, 304292], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 350.613/pb
+        [304333, 304333], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 366.646/pb
+        [304354, 304354], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 68.255/pb
+        [304366, 304366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 419.018/pb
+        [304446, 304447], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 385.306/pb
+        [304451, 304451], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 7.416/pb
+        [304505, 304508], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 425.864/pb
+        [304562, 304562], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 221.934/pb
+        [304616, 304616], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 253.369/pb
+        [304625, 304626], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 138.626/pb
+        [304654, 304655], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 403.545/pb
+        [304661, 304663], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 266.757/pb
+        [304671, 304672], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 320.532/pb
+        [304737, 304740], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 474.819/pb
+        [304776, 304778], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 432.15/pb
+        [304797, 304797], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 557.403/pb
+        [305044, 305046], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 378.033/pb
+        [305059, 305059], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 157.786/pb
+        [305062, 305064], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 390.89/pb
+        [305081, 305081], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 315.14/pb
+        [305112, 305114], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 497.055/pb
+        [305178, 305184], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 100.554/pb
+        [305186, 305186], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 122.05/pb
+        [305188, 305188], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 198.33/pb
+        [305202, 305202], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 207.76/pb
+        [305204, 305204], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 254.513/pb
+        [305207, 305208], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 401.157/pb
+        [305234, 305234], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 12.655/pb
+        [305236, 305237], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 344.353/pb
+        [305247, 305248], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 380.308/pb
+        [305252, 305252], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 95.04/pb
+        [305282, 305282], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 44.345/pb
+        [305310, 305314], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 481.671/pb
+        [305336, 305336], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 66.203/pb
+        [305338, 305338], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 33.112/pb
+        [305341, 305341], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 151.78/pb
+        [305349, 305351], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 186.042/pb
+        [305358, 305358], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 49.594/pb
+        [305364, 305366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 511.673/pb
+        [305376, 305377], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 431.522/pb
+        [305405, 305406], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 475.515/pb
+        [305440, 305441], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 119.869/pb
+        [305516, 305518], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 438.593/pb
+        [305586, 305586], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 171.033/pb
+        [305589, 305590], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 314.815/pb
+        [305636, 305636], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 525.22/pb
+        [305766, 305766], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 263.689/pb
+        [305809, 305809], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 45.952/pb
+        [305814, 305814], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 446.804/pb
+        [305821, 305821], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 240.463/pb
+        [305832, 305832], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 58.021/pb
+        [305840, 305840], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 251.347/pb
+        [305842, 305842], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 114.87/pb
+        [305862, 305862], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 202.189/pb
+        [305898, 305898], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 230.935/pb
+        [305902, 305902], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 154.345/pb
+        [305967, 305967], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 10.508/pb
+        [306029, 306030], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 44.125/pb
+        [306036, 306038], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 56.442/pb
+        [306041, 306042], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 200.189/pb
+        [306048, 306049], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 107.334/pb
+        [306051, 306051], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 70.67/pb
+        [306091, 306092], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 280.74/pb
+        [306095, 306095], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 49.131/pb
+        [306121, 306122], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 69.307/pb
+        [306125, 306126], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 590.489/pb
+        [306134, 306135], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 336.473/pb
+        [306138, 306139], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 312.896/pb
+        [306153, 306155], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 580.683/pb
+        [306169, 306171], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v3, 103.163/pb
+        [306418, 306420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 73.423/pb
+        [306422, 306423], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 120.463/pb
+        [306432, 306432], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 33.338/pb
+        [306454, 306460], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 94.725/pb
+        [297056, 297057], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 143.741/pb
+        [297099, 297101], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 241.495/pb
+        [297113, 297114], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 85.001/pb
+        [297175, 297178], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 280.582/pb
+        [297215, 297215], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 12.287/pb
+        [297218, 297219], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 425.447/pb
+        [297224, 297225], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 13.81/pb
+        [297227, 297227], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 15.669/pb
+        [297292, 297293], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 198.677/pb
+        [297296, 297296], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 84.207/pb
+        [297308, 297308], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 6.298/pb
+        [297359, 297359], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 13.795/pb
+        [297411, 297411], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 201.578/pb
+        [297424, 297426], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 97.376/pb
+        [297429, 297435], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 199.191/pb
+        [297467, 297469], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 69.859/pb
+        [297483, 297488], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 471.448/pb
+        [297503, 297505], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v7, 268.446/pb
+        [297557, 297558], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 158.712/pb
+        [297562, 297563], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 106.785/pb
+        [297598, 297599], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 93.85/pb
+        [297603, 297606], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 276.775/pb
+        [297620, 297620], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 82.127/pb
+        [297656, 297656], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 93.083/pb
+        [297665, 297666], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 78.347/pb
+        [297670, 297670], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 2.132/pb
+        [297674, 297675], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 170.78/pb
+        [297722, 297723], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 142.686/pb
+        [298996, 298997], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 26.765/pb
+        [299000, 299000], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 8.038/pb
+        [299042, 299042], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 2.02/pb
+        [299061, 299062], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 123.32/pb
+        [299064, 299065], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 73.04/pb
+        [299067, 299067], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 68.807/pb
+        [299096, 299096], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 24.067/pb
+        [299149, 299149], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 108.249/pb
+        [299178, 299178], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 15.791/pb
+        [299180, 299180], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 15.575/pb
+        [299184, 299185], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 146.717/pb
+        [299327, 299327], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 15.178/pb
+        [299329, 299329], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v8, 37.487/pb
+        [299368, 299370], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 253.498/pb
+        [299380, 299381], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 66.094/pb
+        [299394, 299396], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 61.673/pb
+        [299420, 299420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 13.23/pb
+        [299443, 299443], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 5.608/pb
+        [299450, 299450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 12.395/pb
+        [299477, 299481], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 431.547/pb
+        [299593, 299595], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 268.091/pb
+        [299597, 299597], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 85.37/pb
+        [299649, 299649], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v1, 56.768/pb
+        [300087, 300087], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 12.856/pb
+        [300105, 300107], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 34.169/pb
+        [300117, 300117], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 6.067/pb
+        [300122, 300123], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 394.771/pb
+        [300155, 300157], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 461.282/pb
+        [300226, 300226], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 115.963/pb
+        [300233, 300240], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 435.357/pb
+        [300280, 300284], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 311.422/pb
+        [300364, 300375], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 59.002/pb
+        [300389, 300401], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 339.844/pb
+        [300459, 300459], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 81.507/pb
+        [300461, 300464], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 132.112/pb
+        [300466, 300467], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 202.273/pb
+        [300497, 300497], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 40.035/pb
+        [300514, 300517], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 379.864/pb
+        [300558, 300558], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 119.182/pb
+        [300560, 300560], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 140.271/pb
+        [300574, 300576], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 315.299/pb
+        [300631, 300633], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 167.565/pb
+        [300635, 300636], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 312.071/pb
+        [300673, 300676], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 23.1/pb
+        [300742, 300742], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 83.984/pb
+        [300777, 300777], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 130.415/pb
+        [300780, 300780], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 79.072/pb
+        [300785, 300785], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 212.774/pb
+        [300806, 300806], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 54.218/pb
+        [300811, 300812], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 159.497/pb
+        [300816, 300817], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 134.15/pb
+        [301046, 301046], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 4.222/pb
+        [301141, 301142], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 97.203/pb
+        [301161, 301161], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 98.077/pb
+        [301165, 301165], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 15.465/pb
+        [301179, 301180], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 16.878/pb
+        [301183, 301183], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 45.299/pb
+        [301281, 301281], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 18.542/pb
+        [301283, 301283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 120.005/pb
+        [301298, 301298], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 153.993/pb
+        [301323, 301323], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 165.06/pb
+        [301330, 301330], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 64.443/pb
+        [301359, 301359], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 57.278/pb
+        [301384, 301384], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 94.354/pb
+        [301391, 301393], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 147.405/pb
+        [301396, 301399], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 110.63/pb
+        [301417, 301417], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 67.689/pb
+        [301447, 301450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 188.658/pb
+        [301461, 301461], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 98.122/pb
+        [301472, 301472], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 138.033/pb
+        [301475, 301476], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 109.336/pb
+        [301519, 301519], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 33.367/pb
+        [301524, 301524], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 41.078/pb
+        [301529, 301532], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 131.943/pb
+        [301567, 301567], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 63.339/pb
+        [301627, 301627], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 131.459/pb
+        [301664, 301665], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 138.42/pb
+        [301694, 301694], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 17.576/pb
+        [301912, 301914], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 79.784/pb
+        [301941, 301941], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 74.507/pb
+        [301959, 301960], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 290.104/pb
+        [301970, 301970], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 22.349/pb
+        [301984, 301987], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 292.622/pb
+        [301997, 301998], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 282.538/pb
+        [302019, 302019], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v2, 9.113/pb
+        [302026, 302026], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 4.652/pb
+        [302029, 302029], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 15.282/pb
+        [302031, 302031], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 128.522/pb
+        [302033, 302034], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 5.657/pb
+        [302037, 302038], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 0.069/pb
+        [302040, 302043], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 104.438/pb
+        [302131, 302131], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 111.635/pb
+        [302159, 302159], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 16.077/pb
+        [302163, 302163], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 146.312/pb
+        [302165, 302166], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 8.409/pb
+        [302225, 302225], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 114.788/pb
+        [302228, 302229], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 105.812/pb
+        [302240, 302240], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 138.868/pb
+        [302262, 302263], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 241.353/pb
+        [302277, 302277], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 53.761/pb
+        [302279, 302280], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 18.474/pb
+        [302322, 302322], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 96.87/pb
+        [302328, 302328], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 93.45/pb
+        [302337, 302337], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 20.377/pb
+        [302342, 302344], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 91.05/pb
+        [302350, 302350], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 16.493/pb
+        [302388, 302388], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 126.264/pb
+        [302392, 302393], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 232.234/pb
+        [302448, 302448], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 307.867/pb
+        [302472, 302476], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 292.111/pb
+        [302479, 302479], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 68.381/pb
+        [302484, 302485], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 209.762/pb
+        [302492, 302494], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 93.282/pb
+        [302509, 302509], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 4.987/pb
+        [302513, 302513], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 12.203/pb
+        [302522, 302523], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 11.257/pb
+        [302525, 302526], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 223.119/pb
+        [302548, 302548], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 15.74/pb
+        [302551, 302551], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 0.104/pb
+        [302553, 302555], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 39.038/pb
+        [302563, 302563], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 0.32/pb
+        [302565, 302565], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 0.149/pb
+        [302572, 302573], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 241.684/pb
+        [302596, 302597], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 318.295/pb
+        [302634, 302635], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 300.859/pb
+        [302651, 302651], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 30.035/pb
+        [302654, 302654], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 63.967/pb
+        [302661, 302661], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 9.465/pb
+        [302663, 302663], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 134.254/pb
+        [303825, 303825], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 22.834/pb
+        [303832, 303832], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 321.326/pb
+        [303838, 303838], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 380.035/pb
+        [303885, 303885], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 400.159/pb
+        [303948, 303948], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 351.61/pb
+        [303998, 304000], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 256.409/pb
+        [304062, 304062], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 382.105/pb
+        [304119, 304120], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 93.285/pb
+        [304125, 304125], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 338.101/pb
+        [304144, 304144], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 533.881/pb
+        [304158, 304158], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 370.885/pb
+        [304169, 304170], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 414.145/pb
+        [304199, 304200], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 88.201/pb
+        [304204, 304204], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 153.182/pb
+        [304209, 304209], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 116.174/pb
+        [304291, 304292], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 350.613/pb
+        [304333, 304333], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 366.646/pb
+        [304354, 304354], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 68.255/pb
+        [304366, 304366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 419.018/pb
+        [304446, 304447], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 385.306/pb
+        [304451, 304451], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 7.416/pb
+        [304505, 304508], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 425.864/pb
+        [304562, 304562], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 221.934/pb
+        [304616, 304616], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 253.369/pb
+        [304625, 304626], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 138.626/pb
+        [304654, 304655], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 403.545/pb
+        [304661, 304663], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 266.757/pb
+        [304671, 304672], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 320.532/pb
+        [304737, 304740], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 474.819/pb
+        [304776, 304778], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 432.15/pb
+        [304797, 304797], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 557.403/pb
+        [305044, 305046], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 378.033/pb
+        [305059, 305059], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 157.786/pb
+        [305062, 305064], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 390.89/pb
+        [305081, 305081], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 315.14/pb
+        [305112, 305114], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 497.055/pb
+        [305178, 305184], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 100.554/pb
+        [305186, 305186], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 122.05/pb
+        [305188, 305188], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 198.33/pb
+        [305202, 305202], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 207.76/pb
+        [305204, 305204], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 254.513/pb
+        [305207, 305208], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 401.157/pb
+        [305234, 305234], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 12.655/pb
+        [305236, 305237], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 344.353/pb
+        [305247, 305248], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 380.308/pb
+        [305252, 305252], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 95.04/pb
+        [305282, 305282], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 44.345/pb
+        [305310, 305314], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 481.671/pb
+        [305336, 305336], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 66.203/pb
+        [305338, 305338], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 33.112/pb
+        [305341, 305341], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 151.78/pb
+        [305349, 305351], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 186.042/pb
+        [305358, 305358], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 49.594/pb
+        [305364, 305366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 511.673/pb
+        [305376, 305377], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 431.522/pb
+        [305405, 305406], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 475.515/pb
+        [305440, 305441], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 119.869/pb
+        [305516, 305518], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 438.593/pb
+        [305586, 305586], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 171.033/pb
+        [305589, 305590], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 314.815/pb
+        [305636, 305636], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 525.22/pb
+        [305766, 305766], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 263.689/pb
+        [305809, 305809], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 45.952/pb
+        [305814, 305814], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 446.804/pb
+        [305821, 305821], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 240.463/pb
+        [305832, 305832], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 58.021/pb
+        [305840, 305840], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 251.347/pb
+        [305842, 305842], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 114.87/pb
+        [305862, 305862], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 202.189/pb
+        [305898, 305898], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 230.935/pb
+        [305902, 305902], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 154.345/pb
+        [305967, 305967], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 10.508/pb
+        [306029, 306030], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 44.125/pb
+        [306036, 306038], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 56.442/pb
+        [306041, 306042], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 200.189/pb
+        [306048, 306049], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 107.334/pb
+        [306051, 306051], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 70.67/pb
+        [306091, 306092], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 280.74/pb
+        [306095, 306095], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 49.131/pb
+        [306121, 306122], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 69.307/pb
+        [306125, 306126], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 590.489/pb
+        [306134, 306135], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 336.473/pb
+        [306138, 306139], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 312.896/pb
+        [306153, 306155], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 580.683/pb
+        [306169, 306171], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v3, 103.163/pb
+        [306418, 306420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v4, 73.423/pb
+        [306422, 306423], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v4, 120.463/pb
+        [306432, 306432], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v4, 33.338/pb
+        [306454, 306460], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass8_v4, 635.031/pb
+      ],
+    },
+  ],
+  '1e1mu' : [
+    {
+      'name'        : 'HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 94.725/pb
+        [297056, 297057], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 143.741/pb
+        [297099, 297101], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 241.495/pb
+        [297113, 297114], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 85.001/pb
+        [297175, 297178], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 280.582/pb
+        [297215, 297215], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 12.287/pb
+        [297218, 297219], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 425.447/pb
+        [297224, 297225], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 13.81/pb
+        [297227, 297227], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 15.669/pb
+        [297292, 297293], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 198.677/pb
+        [297296, 297296], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 84.207/pb
+        [297308, 297308], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 6.298/pb
+        [297359, 297359], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 13.795/pb
+        [297411, 297411], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 201.578/pb
+        [297424, 297426], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 97.376/pb
+        [297429, 297435], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 199.191/pb
+        [297467, 297469], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 69.859/pb
+        [297483, 297488], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 471.448/pb
+        [297503, 297505], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v4, 268.446/pb
+        [297557, 297558], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 158.712/pb
+        [297562, 297563], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 106.785/pb
+        [297598, 297599], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 93.85/pb
+        [297603, 297606], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 276.775/pb
+        [297620, 297620], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 82.127/pb
+        [297656, 297656], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 93.083/pb
+        [297665, 297666], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 78.347/pb
+        [297670, 297670], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 2.132/pb
+        [297674, 297675], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 170.78/pb
+        [297722, 297723], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 142.686/pb
+        [298996, 298997], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 26.765/pb
+        [299000, 299000], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 8.038/pb
+        [299042, 299042], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 2.02/pb
+        [299061, 299062], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 123.32/pb
+        [299064, 299065], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 73.04/pb
+        [299067, 299067], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 68.807/pb
+        [299096, 299096], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 24.067/pb
+        [299149, 299149], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 108.249/pb
+        [299178, 299178], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 15.791/pb
+        [299180, 299180], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 15.575/pb
+        [299184, 299185], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 146.717/pb
+        [299327, 299327], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 15.178/pb
+        [299329, 299329], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 37.487/pb
+        [299368, 299370], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 253.498/pb
+        [299380, 299381], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 66.094/pb
+        [299394, 299396], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 61.673/pb
+        [299420, 299420], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 13.23/pb
+        [299443, 299443], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 5.608/pb
+        [299450, 299450], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 12.395/pb
+        [299477, 299481], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 431.547/pb
+        [299593, 299595], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 268.091/pb
+        [299597, 299597], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 85.37/pb
+        [299649, 299649], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v7, 56.768/pb
+        [300087, 300087], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 12.856/pb
+        [300105, 300107], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 34.169/pb
+        [300117, 300117], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 6.067/pb
+        [300122, 300123], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 394.771/pb
+        [300155, 300157], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 461.282/pb
+        [300226, 300226], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 115.963/pb
+        [300233, 300240], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 435.357/pb
+        [300280, 300284], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 311.422/pb
+        [300364, 300375], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 59.002/pb
+        [300389, 300401], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 339.844/pb
+        [300459, 300459], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 81.507/pb
+        [300461, 300464], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 132.112/pb
+        [300466, 300467], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 202.273/pb
+        [300497, 300497], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 40.035/pb
+        [300514, 300517], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 379.864/pb
+        [300558, 300558], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 119.182/pb
+        [300560, 300560], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 140.271/pb
+        [300574, 300576], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 315.299/pb
+        [300631, 300633], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 167.565/pb
+        [300635, 300636], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 312.071/pb
+        [300673, 300676], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 23.1/pb
+        [300742, 300742], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 83.984/pb
+        [300777, 300777], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 130.415/pb
+        [300780, 300780], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 79.072/pb
+        [300785, 300785], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 212.774/pb
+        [300806, 300806], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 54.218/pb
+        [300811, 300812], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 159.497/pb
+        [300816, 300817], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 134.15/pb
+        [301046, 301046], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 4.222/pb
+        [301141, 301142], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 97.203/pb
+        [301161, 301161], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 98.077/pb
+        [301165, 301165], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 15.465/pb
+        [301179, 301180], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 16.878/pb
+        [301183, 301183], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 45.299/pb
+        [301281, 301281], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 18.542/pb
+        [301283, 301283], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 120.005/pb
+        [301298, 301298], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 153.993/pb
+        [301323, 301323], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 165.06/pb
+        [301330, 301330], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 64.443/pb
+        [301359, 301359], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 57.278/pb
+        [301384, 301384], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 94.354/pb
+        [301391, 301393], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 147.405/pb
+        [301396, 301399], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 110.63/pb
+        [301417, 301417], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 67.689/pb
+        [301447, 301450], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 188.658/pb
+        [301461, 301461], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 98.122/pb
+        [301472, 301472], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 138.033/pb
+        [301475, 301476], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 109.336/pb
+        [301519, 301519], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 33.367/pb
+        [301524, 301524], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 41.078/pb
+        [301529, 301532], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 131.943/pb
+        [301567, 301567], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 63.339/pb
+        [301627, 301627], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 131.459/pb
+        [301664, 301665], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 138.42/pb
+        [301694, 301694], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 17.576/pb
+        [301912, 301914], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 79.784/pb
+        [301941, 301941], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 74.507/pb
+        [301959, 301960], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 290.104/pb
+        [301970, 301970], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 22.349/pb
+        [301984, 301987], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 292.622/pb
+        [301997, 301998], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 282.538/pb
+        [302019, 302019], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 9.113/pb
+        [302026, 302026], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 4.652/pb
+        [302029, 302029], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 15.282/pb
+        [302031, 302031], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 128.522/pb
+        [302033, 302034], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 5.657/pb
+        [302037, 302038], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 0.069/pb
+        [302040, 302043], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 104.438/pb
+        [302131, 302131], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 111.635/pb
+        [302159, 302159], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 16.077/pb
+        [302163, 302163], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 146.312/pb
+        [302165, 302166], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 8.409/pb
+        [302225, 302225], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 114.788/pb
+        [302228, 302229], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 105.812/pb
+        [302240, 302240], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 138.868/pb
+        [302262, 302263], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 241.353/pb
+        [302277, 302277], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 53.761/pb
+        [302279, 302280], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 18.474/pb
+        [302322, 302322], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 96.87/pb
+        [302328, 302328], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 93.45/pb
+        [302337, 302337], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 20.377/pb
+        [302342, 302344], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 91.05/pb
+        [302350, 302350], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 16.493/pb
+        [302388, 302388], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 126.264/pb
+        [302392, 302393], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 232.234/pb
+        [302448, 302448], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 307.867/pb
+        [302472, 302476], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 292.111/pb
+        [302479, 302479], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 68.381/pb
+        [302484, 302485], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 209.762/pb
+        [302492, 302494], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 93.282/pb
+        [302509, 302509], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 4.987/pb
+        [302513, 302513], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 12.203/pb
+        [302522, 302523], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 11.257/pb
+        [302525, 302526], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 223.119/pb
+        [302548, 302548], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 15.74/pb
+        [302551, 302551], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 0.104/pb
+        [302553, 302555], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 39.038/pb
+        [302563, 302563], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 0.32/pb
+        [302565, 302565], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 0.149/pb
+        [302572, 302573], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 241.684/pb
+        [302596, 302597], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 318.295/pb
+        [302634, 302635], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 300.859/pb
+        [302651, 302651], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 30.035/pb
+        [302654, 302654], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 63.967/pb
+        [302661, 302661], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 9.465/pb
+        [302663, 302663], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 134.254/pb
+        [303825, 303825], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 22.834/pb
+        [303832, 303832], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 321.326/pb
+        [303838, 303838], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 380.035/pb
+        [303885, 303885], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 400.159/pb
+        [303948, 303948], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 351.61/pb
+        [303998, 304000], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 256.409/pb
+        [304062, 304062], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 382.105/pb
+        [304119, 304120], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 93.285/pb
+        [304125, 304125], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 338.101/pb
+        [304144, 304144], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 533.881/pb
+        [304158, 304158], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 370.885/pb
+        [304169, 304170], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 414.145/pb
+        [304199, 304200], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 88.201/pb
+        [304204, 304204], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 153.182/pb
+        [304209, 304209], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 116.174/pb
+        [304291, 304292], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 350.613/pb
+        [304333, 304333], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 366.646/pb
+        [304354, 304354], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 68.255/pb
+        [304366, 304366], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 419.018/pb
+        [304446, 304447], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 385.306/pb
+        [304451, 304451], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 7.416/pb
+        [304505, 304508], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 425.864/pb
+        [304562, 304562], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 221.934/pb
+        [304616, 304616], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 253.369/pb
+        [304625, 304626], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 138.626/pb
+        [304654, 304655], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 403.545/pb
+        [304661, 304663], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 266.757/pb
+        [304671, 304672], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 320.532/pb
+        [304737, 304740], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 474.819/pb
+        [304776, 304778], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 432.15/pb
+        [304797, 304797], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 557.403/pb
+        [305044, 305046], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 378.033/pb
+        [305059, 305059], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 157.786/pb
+        [305062, 305064], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 390.89/pb
+        [305081, 305081], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 315.14/pb
+        [305112, 305114], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 497.055/pb
+        [305178, 305184], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 100.554/pb
+        [305186, 305186], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 122.05/pb
+        [305188, 305188], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 198.33/pb
+        [305202, 305202], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 207.76/pb
+        [305204, 305204], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 254.513/pb
+        [305207, 305208], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 401.157/pb
+        [305234, 305234], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 12.655/pb
+        [305236, 305237], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 344.353/pb
+        [305247, 305248], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 380.308/pb
+        [305252, 305252], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 95.04/pb
+        [305282, 305282], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 44.345/pb
+        [305310, 305314], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 481.671/pb
+        [305336, 305336], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 66.203/pb
+        [305338, 305338], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 33.112/pb
+        [305341, 305341], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 151.78/pb
+        [305349, 305351], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 186.042/pb
+        [305358, 305358], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 49.594/pb
+        [305364, 305366], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 511.673/pb
+        [305376, 305377], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 431.522/pb
+        [305405, 305406], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 475.515/pb
+        [305440, 305441], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 119.869/pb
+        [305516, 305518], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 438.593/pb
+        [305586, 305586], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 171.033/pb
+        [305589, 305590], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 314.815/pb
+        [305636, 305636], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 525.22/pb
+        [305766, 305766], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 263.689/pb
+        [305809, 305809], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 45.952/pb
+        [305814, 305814], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 446.804/pb
+        [305821, 305821], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 240.463/pb
+        [305832, 305832], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 58.021/pb
+        [305840, 305840], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 251.347/pb
+        [305842, 305842], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 114.87/pb
+        [305862, 305862], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 202.189/pb
+        [305898, 305898], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 230.935/pb
+        [305902, 305902], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 154.345/pb
+        [305967, 305967], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 10.508/pb
+        [306029, 306030], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 44.125/pb
+        [306036, 306038], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 56.442/pb
+        [306041, 306042], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 200.189/pb
+        [306048, 306049], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 107.334/pb
+        [306051, 306051], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 70.67/pb
+        [306091, 306092], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 280.74/pb
+        [306095, 306095], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 49.131/pb
+        [306121, 306122], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 69.307/pb
+        [306125, 306126], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 590.489/pb
+        [306134, 306135], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 336.473/pb
+        [306138, 306139], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 312.896/pb
+        [306153, 306155], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 580.683/pb
+        [306169, 306171], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 103.163/pb
+        [306418, 306420], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 73.423/pb
+        [306422, 306423], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 120.463/pb
+        [306432, 306432], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 33.338/pb
+        [306454, 306460], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v5, 94.725/pb
+        [297056, 297057], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v5, 143.741/pb
+        [297099, 297101], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 241.495/pb
+        [297113, 297114], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 85.001/pb
+        [297175, 297178], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 280.582/pb
+        [297215, 297215], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 12.287/pb
+        [297218, 297219], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 425.447/pb
+        [297224, 297225], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 13.81/pb
+        [297227, 297227], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 15.669/pb
+        [297292, 297293], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 198.677/pb
+        [297296, 297296], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 84.207/pb
+        [297308, 297308], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 6.298/pb
+        [297359, 297359], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 13.795/pb
+        [297411, 297411], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 201.578/pb
+        [297424, 297426], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 97.376/pb
+        [297429, 297435], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 199.191/pb
+        [297467, 297469], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 69.859/pb
+        [297483, 297488], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 471.448/pb
+        [297503, 297505], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v6, 268.446/pb
+        [297557, 297558], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 158.712/pb
+        [297562, 297563], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 106.785/pb
+        [297598, 297599], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 93.85/pb
+        [297603, 297606], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 276.775/pb
+        [297620, 297620], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 82.127/pb
+        [297656, 297656], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 93.083/pb
+        [297665, 297666], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 78.347/pb
+        [297670, 297670], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 2.132/pb
+        [297674, 297675], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 170.78/pb
+        [297722, 297723], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 142.686/pb
+        [298996, 298997], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 26.765/pb
+        [299000, 299000], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 8.038/pb
+        [299042, 299042], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 2.02/pb
+        [299061, 299062], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 123.32/pb
+        [299064, 299065], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 73.04/pb
+        [299067, 299067], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 68.807/pb
+        [299096, 299096], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 24.067/pb
+        [299149, 299149], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 108.249/pb
+        [299178, 299178], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 15.791/pb
+        [299180, 299180], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 15.575/pb
+        [299184, 299185], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 146.717/pb
+        [299327, 299327], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 15.178/pb
+        [299329, 299329], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v8, 37.487/pb
+        [299368, 299370], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 253.498/pb
+        [299380, 299381], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 66.094/pb
+        [299394, 299396], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 61.673/pb
+        [299420, 299420], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 13.23/pb
+        [299443, 299443], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 5.608/pb
+        [299450, 299450], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 12.395/pb
+        [299477, 299481], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 431.547/pb
+        [299593, 299595], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 268.091/pb
+        [299597, 299597], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 85.37/pb
+        [299649, 299649], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v9, 56.768/pb
+        [300087, 300087], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 12.856/pb
+        [300105, 300107], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 34.169/pb
+        [300117, 300117], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 6.067/pb
+        [300122, 300123], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 394.771/pb
+        [300155, 300157], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 461.282/pb
+        [300226, 300226], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 115.963/pb
+        [300233, 300240], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 435.357/pb
+        [300280, 300284], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 311.422/pb
+        [300364, 300375], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 59.002/pb
+        [300389, 300401], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 339.844/pb
+        [300459, 300459], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 81.507/pb
+        [300461, 300464], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 132.112/pb
+        [300466, 300467], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 202.273/pb
+        [300497, 300497], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 40.035/pb
+        [300514, 300517], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 379.864/pb
+        [300558, 300558], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 119.182/pb
+        [300560, 300560], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 140.271/pb
+        [300574, 300576], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 315.299/pb
+        [300631, 300633], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 167.565/pb
+        [300635, 300636], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 312.071/pb
+        [300673, 300676], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 23.1/pb
+        [300742, 300742], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 83.984/pb
+        [300777, 300777], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 130.415/pb
+        [300780, 300780], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 79.072/pb
+        [300785, 300785], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 212.774/pb
+        [300806, 300806], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 54.218/pb
+        [300811, 300812], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 159.497/pb
+        [300816, 300817], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v10, 134.15/pb
+        [301046, 301046], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 4.222/pb
+        [301141, 301142], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 97.203/pb
+        [301161, 301161], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 98.077/pb
+        [301165, 301165], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 15.465/pb
+        [301179, 301180], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 16.878/pb
+        [301183, 301183], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 45.299/pb
+        [301281, 301281], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 18.542/pb
+        [301283, 301283], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 120.005/pb
+        [301298, 301298], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 153.993/pb
+        [301323, 301323], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 165.06/pb
+        [301330, 301330], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 64.443/pb
+        [301359, 301359], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 57.278/pb
+        [301384, 301384], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 94.354/pb
+        [301391, 301393], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 147.405/pb
+        [301396, 301399], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 110.63/pb
+        [301417, 301417], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 67.689/pb
+        [301447, 301450], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 188.658/pb
+        [301461, 301461], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 98.122/pb
+        [301472, 301472], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 138.033/pb
+        [301475, 301476], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 109.336/pb
+        [301519, 301519], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 33.367/pb
+        [301524, 301524], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 41.078/pb
+        [301529, 301532], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 131.943/pb
+        [301567, 301567], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 63.339/pb
+        [301627, 301627], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 131.459/pb
+        [301664, 301665], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 138.42/pb
+        [301694, 301694], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 17.576/pb
+        [301912, 301914], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 79.784/pb
+        [301941, 301941], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 74.507/pb
+        [301959, 301960], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 290.104/pb
+        [301970, 301970], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 22.349/pb
+        [301984, 301987], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 292.622/pb
+        [301997, 301998], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 282.538/pb
+        [302019, 302019], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 9.113/pb
+        [302026, 302026], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 4.652/pb
+        [302029, 302029], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 15.282/pb
+        [302031, 302031], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 128.522/pb
+        [302033, 302034], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 5.657/pb
+        [302037, 302038], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.069/pb
+        [302040, 302043], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 104.438/pb
+        [302131, 302131], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 111.635/pb
+        [302159, 302159], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 16.077/pb
+        [302163, 302163], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 146.312/pb
+        [302165, 302166], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 8.409/pb
+        [302225, 302225], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 114.788/pb
+        [302228, 302229], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 105.812/pb
+        [302240, 302240], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 138.868/pb
+        [302262, 302263], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 241.353/pb
+        [302277, 302277], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 53.761/pb
+        [302279, 302280], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 18.474/pb
+        [302322, 302322], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 96.87/pb
+        [302328, 302328], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 93.45/pb
+        [302337, 302337], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 20.377/pb
+        [302342, 302344], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 91.05/pb
+        [302350, 302350], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 16.493/pb
+        [302388, 302388], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 126.264/pb
+        [302392, 302393], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 232.234/pb
+        [302448, 302448], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 307.867/pb
+        [302472, 302476], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 292.111/pb
+        [302479, 302479], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 68.381/pb
+        [302484, 302485], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 209.762/pb
+        [302492, 302494], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 93.282/pb
+        [302509, 302509], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 4.987/pb
+        [302513, 302513], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 12.203/pb
+        [302522, 302523], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 11.257/pb
+        [302525, 302526], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 223.119/pb
+        [302548, 302548], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 15.74/pb
+        [302551, 302551], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.104/pb
+        [302553, 302555], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 39.038/pb
+        [302563, 302563], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.32/pb
+        [302565, 302565], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.149/pb
+        [302572, 302573], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 241.684/pb
+        [302596, 302597], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 318.295/pb
+        [302634, 302635], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 300.859/pb
+        [302651, 302651], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 30.035/pb
+        [302654, 302654], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 63.967/pb
+        [302661, 302661], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 9.465/pb
+        [302663, 302663], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 134.254/pb
+        [303825, 303825], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 22.834/pb
+        [303832, 303832], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 321.326/pb
+        [303838, 303838], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 380.035/pb
+        [303885, 303885], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 400.159/pb
+        [303948, 303948], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 351.61/pb
+        [303998, 304000], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 256.409/pb
+        [304062, 304062], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 382.105/pb
+        [304119, 304120], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 93.285/pb
+        [304125, 304125], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 338.101/pb
+        [304144, 304144], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 533.881/pb
+        [304158, 304158], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 370.885/pb
+        [304169, 304170], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 414.145/pb
+        [304199, 304200], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 88.201/pb
+        [304204, 304204], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 153.182/pb
+        [304209, 304209], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 116.174/pb
+        [304291, 304292], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 350.613/pb
+        [304333, 304333], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 366.646/pb
+        [304354, 304354], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 68.255/pb
+        [304366, 304366], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 419.018/pb
+        [304446, 304447], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 385.306/pb
+        [304451, 304451], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 7.416/pb
+        [304505, 304508], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 425.864/pb
+        [304562, 304562], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 221.934/pb
+        [304616, 304616], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 253.369/pb
+        [304625, 304626], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 138.626/pb
+        [304654, 304655], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 403.545/pb
+        [304661, 304663], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 266.757/pb
+        [304671, 304672], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 320.532/pb
+        [304737, 304740], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 474.819/pb
+        [304776, 304778], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 432.15/pb
+        [304797, 304797], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 557.403/pb
+        [305044, 305046], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 378.033/pb
+        [305059, 305059], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 157.786/pb
+        [305062, 305064], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 390.89/pb
+        [305081, 305081], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 315.14/pb
+        [305112, 305114], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 497.055/pb
+        [305178, 305184], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 100.554/pb
+        [305186, 305186], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 122.05/pb
+        [305188, 305188], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 198.33/pb
+        [305202, 305202], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 207.76/pb
+        [305204, 305204], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 254.513/pb
+        [305207, 305208], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 401.157/pb
+        [305234, 305234], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 12.655/pb
+        [305236, 305237], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 344.353/pb
+        [305247, 305248], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 380.308/pb
+        [305252, 305252], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 95.04/pb
+        [305282, 305282], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 44.345/pb
+        [305310, 305314], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 481.671/pb
+        [305336, 305336], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 66.203/pb
+        [305338, 305338], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 33.112/pb
+        [305341, 305341], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 151.78/pb
+        [305349, 305351], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 186.042/pb
+        [305358, 305358], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 49.594/pb
+        [305364, 305366], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 511.673/pb
+        [305376, 305377], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 431.522/pb
+        [305405, 305406], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 475.515/pb
+        [305440, 305441], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 119.869/pb
+        [305516, 305518], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 438.593/pb
+        [305586, 305586], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 171.033/pb
+        [305589, 305590], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 314.815/pb
+        [305636, 305636], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 525.22/pb
+        [305766, 305766], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 263.689/pb
+        [305809, 305809], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 45.952/pb
+        [305814, 305814], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 446.804/pb
+        [305821, 305821], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 240.463/pb
+        [305832, 305832], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 58.021/pb
+        [305840, 305840], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 251.347/pb
+        [305842, 305842], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 114.87/pb
+        [305862, 305862], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 202.189/pb
+        [305898, 305898], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 230.935/pb
+        [305902, 305902], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 154.345/pb
+        [305967, 305967], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 10.508/pb
+        [306029, 306030], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 44.125/pb
+        [306036, 306038], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 56.442/pb
+        [306041, 306042], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 200.189/pb
+        [306048, 306049], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 107.334/pb
+        [306051, 306051], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 70.67/pb
+        [306091, 306092], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 280.74/pb
+        [306095, 306095], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 49.131/pb
+        [306121, 306122], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 69.307/pb
+        [306125, 306126], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 590.489/pb
+        [306134, 306135], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 336.473/pb
+        [306138, 306139], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 312.896/pb
+        [306153, 306155], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 580.683/pb
+        [306169, 306171], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 103.163/pb
+        [306418, 306420], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 73.423/pb
+        [306422, 306423], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 120.463/pb
+        [306432, 306432], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 33.338/pb
+        [306454, 306460], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL', # missing in run B
+      'unprescaled' : True,
+      'runs'        : [
+        [299368, 299370], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 253.498/pb
+        [299380, 299381], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 66.094/pb
+        [299394, 299396], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 61.673/pb
+        [299420, 299420], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 13.23/pb
+        [299443, 299443], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 5.608/pb
+        [299450, 299450], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 12.395/pb
+        [299477, 299481], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 431.547/pb
+        [299593, 299595], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 268.091/pb
+        [299597, 299597], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 85.37/pb
+        [299649, 299649], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v1, 56.768/pb
+        [300087, 300087], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 12.856/pb
+        [300105, 300107], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 34.169/pb
+        [300117, 300117], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 6.067/pb
+        [300122, 300123], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 394.771/pb
+        [300155, 300157], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 461.282/pb
+        [300226, 300226], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 115.963/pb
+        [300233, 300240], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 435.357/pb
+        [300280, 300284], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 311.422/pb
+        [300364, 300375], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 59.002/pb
+        [300389, 300401], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 339.844/pb
+        [300459, 300459], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 81.507/pb
+        [300461, 300464], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 132.112/pb
+        [300466, 300467], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 202.273/pb
+        [300497, 300497], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 40.035/pb
+        [300514, 300517], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 379.864/pb
+        [300558, 300558], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 119.182/pb
+        [300560, 300560], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 140.271/pb
+        [300574, 300576], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 315.299/pb
+        [300631, 300633], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 167.565/pb
+        [300635, 300636], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 312.071/pb
+        [300673, 300676], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 23.1/pb
+        [300742, 300742], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 83.984/pb
+        [300777, 300777], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 130.415/pb
+        [300780, 300780], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 79.072/pb
+        [300785, 300785], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 212.774/pb
+        [300806, 300806], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 54.218/pb
+        [300811, 300812], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 159.497/pb
+        [300816, 300817], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v2, 134.15/pb
+        [301046, 301046], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 4.222/pb
+        [301141, 301142], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 97.203/pb
+        [301161, 301161], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 98.077/pb
+        [301165, 301165], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 15.465/pb
+        [301179, 301180], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 16.878/pb
+        [301183, 301183], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 45.299/pb
+        [301281, 301281], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 18.542/pb
+        [301283, 301283], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 120.005/pb
+        [301298, 301298], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 153.993/pb
+        [301323, 301323], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 165.06/pb
+        [301330, 301330], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 64.443/pb
+        [301359, 301359], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 57.278/pb
+        [301384, 301384], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 94.354/pb
+        [301391, 301393], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 147.405/pb
+        [301396, 301399], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 110.63/pb
+        [301417, 301417], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 67.689/pb
+        [301447, 301450], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 188.658/pb
+        [301461, 301461], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 98.122/pb
+        [301472, 301472], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 138.033/pb
+        [301475, 301476], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 109.336/pb
+        [301519, 301519], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 33.367/pb
+        [301524, 301524], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 41.078/pb
+        [301529, 301532], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 131.943/pb
+        [301567, 301567], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 63.339/pb
+        [301627, 301627], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 131.459/pb
+        [301664, 301665], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 138.42/pb
+        [301694, 301694], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 17.576/pb
+        [301912, 301914], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 79.784/pb
+        [301941, 301941], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 74.507/pb
+        [301959, 301960], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 290.104/pb
+        [301970, 301970], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 22.349/pb
+        [301984, 301987], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 292.622/pb
+        [301997, 301998], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 282.538/pb
+        [302019, 302019], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v3, 9.113/pb
+        [302026, 302026], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 4.652/pb
+        [302029, 302029], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 15.282/pb
+        [302031, 302031], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 128.522/pb
+        [302033, 302034], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 5.657/pb
+        [302037, 302038], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 0.069/pb
+        [302040, 302043], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 104.438/pb
+        [302131, 302131], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 111.635/pb
+        [302159, 302159], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 16.077/pb
+        [302163, 302163], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 146.312/pb
+        [302165, 302166], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 8.409/pb
+        [302225, 302225], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 114.788/pb
+        [302228, 302229], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 105.812/pb
+        [302240, 302240], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 138.868/pb
+        [302262, 302263], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 241.353/pb
+        [302277, 302277], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 53.761/pb
+        [302279, 302280], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 18.474/pb
+        [302322, 302322], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 96.87/pb
+        [302328, 302328], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 93.45/pb
+        [302337, 302337], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 20.377/pb
+        [302342, 302344], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 91.05/pb
+        [302350, 302350], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 16.493/pb
+        [302388, 302388], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 126.264/pb
+        [302392, 302393], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 232.234/pb
+        [302448, 302448], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 307.867/pb
+        [302472, 302476], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 292.111/pb
+        [302479, 302479], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 68.381/pb
+        [302484, 302485], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 209.762/pb
+        [302492, 302494], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 93.282/pb
+        [302509, 302509], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 4.987/pb
+        [302513, 302513], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 12.203/pb
+        [302522, 302523], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 11.257/pb
+        [302525, 302526], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 223.119/pb
+        [302548, 302548], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 15.74/pb
+        [302551, 302551], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 0.104/pb
+        [302553, 302555], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 39.038/pb
+        [302563, 302563], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 0.32/pb
+        [302565, 302565], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 0.149/pb
+        [302572, 302573], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 241.684/pb
+        [302596, 302597], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 318.295/pb
+        [302634, 302635], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 300.859/pb
+        [302651, 302651], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 30.035/pb
+        [302654, 302654], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 63.967/pb
+        [302661, 302661], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 9.465/pb
+        [302663, 302663], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 134.254/pb
+        [303825, 303825], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 22.834/pb
+        [303832, 303832], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 321.326/pb
+        [303838, 303838], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 380.035/pb
+        [303885, 303885], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 400.159/pb
+        [303948, 303948], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 351.61/pb
+        [303998, 304000], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 256.409/pb
+        [304062, 304062], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 382.105/pb
+        [304119, 304120], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 93.285/pb
+        [304125, 304125], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 338.101/pb
+        [304144, 304144], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 533.881/pb
+        [304158, 304158], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 370.885/pb
+        [304169, 304170], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 414.145/pb
+        [304199, 304200], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 88.201/pb
+        [304204, 304204], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 153.182/pb
+        [304209, 304209], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 116.174/pb
+        [304291, 304292], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 350.613/pb
+        [304333, 304333], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 366.646/pb
+        [304354, 304354], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 68.255/pb
+        [304366, 304366], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 419.018/pb
+        [304446, 304447], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 385.306/pb
+        [304451, 304451], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 7.416/pb
+        [304505, 304508], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 425.864/pb
+        [304562, 304562], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 221.934/pb
+        [304616, 304616], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 253.369/pb
+        [304625, 304626], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 138.626/pb
+        [304654, 304655], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 403.545/pb
+        [304661, 304663], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 266.757/pb
+        [304671, 304672], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 320.532/pb
+        [304737, 304740], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 474.819/pb
+        [304776, 304778], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 432.15/pb
+        [304797, 304797], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 557.403/pb
+        [305044, 305046], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 378.033/pb
+        [305059, 305059], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 157.786/pb
+        [305062, 305064], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 390.89/pb
+        [305081, 305081], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 315.14/pb
+        [305112, 305114], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 497.055/pb
+        [305178, 305184], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 100.554/pb
+        [305186, 305186], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 122.05/pb
+        [305188, 305188], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 198.33/pb
+        [305202, 305202], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 207.76/pb
+        [305204, 305204], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 254.513/pb
+        [305207, 305208], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 401.157/pb
+        [305234, 305234], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 12.655/pb
+        [305236, 305237], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 344.353/pb
+        [305247, 305248], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 380.308/pb
+        [305252, 305252], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 95.04/pb
+        [305282, 305282], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 44.345/pb
+        [305310, 305314], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 481.671/pb
+        [305336, 305336], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 66.203/pb
+        [305338, 305338], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 33.112/pb
+        [305341, 305341], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 151.78/pb
+        [305349, 305351], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 186.042/pb
+        [305358, 305358], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 49.594/pb
+        [305364, 305366], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 511.673/pb
+        [305376, 305377], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 431.522/pb
+        [305405, 305406], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 475.515/pb
+        [305440, 305441], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 119.869/pb
+        [305516, 305518], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 438.593/pb
+        [305586, 305586], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 171.033/pb
+        [305589, 305590], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 314.815/pb
+        [305636, 305636], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 525.22/pb
+        [305766, 305766], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 263.689/pb
+        [305809, 305809], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 45.952/pb
+        [305814, 305814], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 446.804/pb
+        [305821, 305821], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 240.463/pb
+        [305832, 305832], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 58.021/pb
+        [305840, 305840], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 251.347/pb
+        [305842, 305842], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 114.87/pb
+        [305862, 305862], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 202.189/pb
+        [305898, 305898], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 230.935/pb
+        [305902, 305902], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 154.345/pb
+        [305967, 305967], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 10.508/pb
+        [306029, 306030], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 44.125/pb
+        [306036, 306038], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 56.442/pb
+        [306041, 306042], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 200.189/pb
+        [306048, 306049], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 107.334/pb
+        [306051, 306051], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 70.67/pb
+        [306091, 306092], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 280.74/pb
+        [306095, 306095], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 49.131/pb
+        [306121, 306122], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 69.307/pb
+        [306125, 306126], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 590.489/pb
+        [306134, 306135], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 336.473/pb
+        [306138, 306139], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 312.896/pb
+        [306153, 306155], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 580.683/pb
+        [306169, 306171], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v4, 103.163/pb
+        [306418, 306420], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 73.423/pb
+        [306422, 306423], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 120.463/pb
+        [306432, 306432], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 33.338/pb
+        [306454, 306460], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 94.725/pb
+        [297056, 297057], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v5, 143.741/pb
+        [297099, 297101], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 241.495/pb
+        [297113, 297114], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 85.001/pb
+        [297175, 297178], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 280.582/pb
+        [297215, 297215], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 12.287/pb
+        [297218, 297219], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 425.447/pb
+        [297224, 297225], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 13.81/pb
+        [297227, 297227], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 15.669/pb
+        [297292, 297293], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 198.677/pb
+        [297296, 297296], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 84.207/pb
+        [297308, 297308], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 6.298/pb
+        [297359, 297359], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 13.795/pb
+        [297411, 297411], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 201.578/pb
+        [297424, 297426], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 97.376/pb
+        [297429, 297435], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 199.191/pb
+        [297467, 297469], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 69.859/pb
+        [297483, 297488], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 471.448/pb
+        [297503, 297505], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v6, 268.446/pb
+        [297557, 297558], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 158.712/pb
+        [297562, 297563], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 106.785/pb
+        [297598, 297599], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 93.85/pb
+        [297603, 297606], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 276.775/pb
+        [297620, 297620], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 82.127/pb
+        [297656, 297656], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 93.083/pb
+        [297665, 297666], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 78.347/pb
+        [297670, 297670], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 2.132/pb
+        [297674, 297675], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 170.78/pb
+        [297722, 297723], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 142.686/pb
+        [298996, 298997], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 26.765/pb
+        [299000, 299000], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 8.038/pb
+        [299042, 299042], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 2.02/pb
+        [299061, 299062], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 123.32/pb
+        [299064, 299065], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 73.04/pb
+        [299067, 299067], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 68.807/pb
+        [299096, 299096], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 24.067/pb
+        [299149, 299149], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 108.249/pb
+        [299178, 299178], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 15.791/pb
+        [299180, 299180], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 15.575/pb
+        [299184, 299185], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 146.717/pb
+        [299327, 299327], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 15.178/pb
+        [299329, 299329], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v8, 37.487/pb
+        [299368, 299370], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 253.498/pb
+        [299380, 299381], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 66.094/pb
+        [299394, 299396], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 61.673/pb
+        [299420, 299420], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 13.23/pb
+        [299443, 299443], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 5.608/pb
+        [299450, 299450], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 12.395/pb
+        [299477, 299481], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 431.547/pb
+        [299593, 299595], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 268.091/pb
+        [299597, 299597], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 85.37/pb
+        [299649, 299649], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v9, 56.768/pb
+        [300087, 300087], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 12.856/pb
+        [300105, 300107], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 34.169/pb
+        [300117, 300117], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 6.067/pb
+        [300122, 300123], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 394.771/pb
+        [300155, 300157], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 461.282/pb
+        [300226, 300226], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 115.963/pb
+        [300233, 300240], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 435.357/pb
+        [300280, 300284], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 311.422/pb
+        [300364, 300375], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 59.002/pb
+        [300389, 300401], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 339.844/pb
+        [300459, 300459], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 81.507/pb
+        [300461, 300464], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 132.112/pb
+        [300466, 300467], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 202.273/pb
+        [300497, 300497], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 40.035/pb
+        [300514, 300517], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 379.864/pb
+        [300558, 300558], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 119.182/pb
+        [300560, 300560], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 140.271/pb
+        [300574, 300576], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 315.299/pb
+        [300631, 300633], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 167.565/pb
+        [300635, 300636], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 312.071/pb
+        [300673, 300676], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 23.1/pb
+        [300742, 300742], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 83.984/pb
+        [300777, 300777], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 130.415/pb
+        [300780, 300780], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 79.072/pb
+        [300785, 300785], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 212.774/pb
+        [300806, 300806], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 54.218/pb
+        [300811, 300812], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 159.497/pb
+        [300816, 300817], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v10, 134.15/pb
+        [301046, 301046], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 4.222/pb
+        [301141, 301142], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 97.203/pb
+        [301161, 301161], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 98.077/pb
+        [301165, 301165], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 15.465/pb
+        [301179, 301180], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 16.878/pb
+        [301183, 301183], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 45.299/pb
+        [301281, 301281], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 18.542/pb
+        [301283, 301283], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 120.005/pb
+        [301298, 301298], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 153.993/pb
+        [301323, 301323], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 165.06/pb
+        [301330, 301330], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 64.443/pb
+        [301359, 301359], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 57.278/pb
+        [301384, 301384], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 94.354/pb
+        [301391, 301393], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 147.405/pb
+        [301396, 301399], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 110.63/pb
+        [301417, 301417], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 67.689/pb
+        [301447, 301450], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 188.658/pb
+        [301461, 301461], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 98.122/pb
+        [301472, 301472], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 138.033/pb
+        [301475, 301476], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 109.336/pb
+        [301519, 301519], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 33.367/pb
+        [301524, 301524], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 41.078/pb
+        [301529, 301532], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 131.943/pb
+        [301567, 301567], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 63.339/pb
+        [301627, 301627], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 131.459/pb
+        [301664, 301665], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 138.42/pb
+        [301694, 301694], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 17.576/pb
+        [301912, 301914], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 79.784/pb
+        [301941, 301941], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 74.507/pb
+        [301959, 301960], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 290.104/pb
+        [301970, 301970], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 22.349/pb
+        [301984, 301987], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 292.622/pb
+        [301997, 301998], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 282.538/pb
+        [302019, 302019], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v11, 9.113/pb
+        [302026, 302026], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 4.652/pb
+        [302029, 302029], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 15.282/pb
+        [302031, 302031], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 128.522/pb
+        [302033, 302034], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 5.657/pb
+        [302037, 302038], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.069/pb
+        [302040, 302043], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 104.438/pb
+        [302131, 302131], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 111.635/pb
+        [302159, 302159], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 16.077/pb
+        [302163, 302163], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 146.312/pb
+        [302165, 302166], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 8.409/pb
+        [302225, 302225], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 114.788/pb
+        [302228, 302229], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 105.812/pb
+        [302240, 302240], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 138.868/pb
+        [302262, 302263], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 241.353/pb
+        [302277, 302277], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 53.761/pb
+        [302279, 302280], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 18.474/pb
+        [302322, 302322], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 96.87/pb
+        [302328, 302328], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 93.45/pb
+        [302337, 302337], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 20.377/pb
+        [302342, 302344], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 91.05/pb
+        [302350, 302350], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 16.493/pb
+        [302388, 302388], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 126.264/pb
+        [302392, 302393], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 232.234/pb
+        [302448, 302448], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 307.867/pb
+        [302472, 302476], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 292.111/pb
+        [302479, 302479], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 68.381/pb
+        [302484, 302485], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 209.762/pb
+        [302492, 302494], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 93.282/pb
+        [302509, 302509], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 4.987/pb
+        [302513, 302513], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 12.203/pb
+        [302522, 302523], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 11.257/pb
+        [302525, 302526], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 223.119/pb
+        [302548, 302548], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 15.74/pb
+        [302551, 302551], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.104/pb
+        [302553, 302555], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 39.038/pb
+        [302563, 302563], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.32/pb
+        [302565, 302565], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 0.149/pb
+        [302572, 302573], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 241.684/pb
+        [302596, 302597], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 318.295/pb
+        [302634, 302635], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 300.859/pb
+        [302651, 302651], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 30.035/pb
+        [302654, 302654], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 63.967/pb
+        [302661, 302661], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 9.465/pb
+        [302663, 302663], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 134.254/pb
+        [303825, 303825], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 22.834/pb
+        [303832, 303832], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 321.326/pb
+        [303838, 303838], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 380.035/pb
+        [303885, 303885], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 400.159/pb
+        [303948, 303948], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 351.61/pb
+        [303998, 304000], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 256.409/pb
+        [304062, 304062], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 382.105/pb
+        [304119, 304120], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 93.285/pb
+        [304125, 304125], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 338.101/pb
+        [304144, 304144], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 533.881/pb
+        [304158, 304158], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 370.885/pb
+        [304169, 304170], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 414.145/pb
+        [304199, 304200], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 88.201/pb
+        [304204, 304204], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 153.182/pb
+        [304209, 304209], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 116.174/pb
+        [304291, 304292], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 350.613/pb
+        [304333, 304333], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 366.646/pb
+        [304354, 304354], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 68.255/pb
+        [304366, 304366], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 419.018/pb
+        [304446, 304447], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 385.306/pb
+        [304451, 304451], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 7.416/pb
+        [304505, 304508], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 425.864/pb
+        [304562, 304562], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 221.934/pb
+        [304616, 304616], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 253.369/pb
+        [304625, 304626], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 138.626/pb
+        [304654, 304655], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 403.545/pb
+        [304661, 304663], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 266.757/pb
+        [304671, 304672], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 320.532/pb
+        [304737, 304740], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 474.819/pb
+        [304776, 304778], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 432.15/pb
+        [304797, 304797], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 557.403/pb
+        [305044, 305046], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 378.033/pb
+        [305059, 305059], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 157.786/pb
+        [305062, 305064], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 390.89/pb
+        [305081, 305081], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 315.14/pb
+        [305112, 305114], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 497.055/pb
+        [305178, 305184], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 100.554/pb
+        [305186, 305186], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 122.05/pb
+        [305188, 305188], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 198.33/pb
+        [305202, 305202], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 207.76/pb
+        [305204, 305204], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 254.513/pb
+        [305207, 305208], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 401.157/pb
+        [305234, 305234], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 12.655/pb
+        [305236, 305237], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 344.353/pb
+        [305247, 305248], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 380.308/pb
+        [305252, 305252], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 95.04/pb
+        [305282, 305282], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 44.345/pb
+        [305310, 305314], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 481.671/pb
+        [305336, 305336], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 66.203/pb
+        [305338, 305338], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 33.112/pb
+        [305341, 305341], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 151.78/pb
+        [305349, 305351], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 186.042/pb
+        [305358, 305358], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 49.594/pb
+        [305364, 305366], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 511.673/pb
+        [305376, 305377], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 431.522/pb
+        [305405, 305406], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 475.515/pb
+        [305440, 305441], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 119.869/pb
+        [305516, 305518], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 438.593/pb
+        [305586, 305586], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 171.033/pb
+        [305589, 305590], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 314.815/pb
+        [305636, 305636], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 525.22/pb
+        [305766, 305766], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 263.689/pb
+        [305809, 305809], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 45.952/pb
+        [305814, 305814], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 446.804/pb
+        [305821, 305821], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 240.463/pb
+        [305832, 305832], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 58.021/pb
+        [305840, 305840], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 251.347/pb
+        [305842, 305842], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 114.87/pb
+        [305862, 305862], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 202.189/pb
+        [305898, 305898], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 230.935/pb
+        [305902, 305902], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 154.345/pb
+        [305967, 305967], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 10.508/pb
+        [306029, 306030], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 44.125/pb
+        [306036, 306038], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 56.442/pb
+        [306041, 306042], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 200.189/pb
+        [306048, 306049], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 107.334/pb
+        [306051, 306051], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 70.67/pb
+        [306091, 306092], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 280.74/pb
+        [306095, 306095], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 49.131/pb
+        [306121, 306122], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 69.307/pb
+        [306125, 306126], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 590.489/pb
+        [306134, 306135], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 336.473/pb
+        [306138, 306139], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 312.896/pb
+        [306153, 306155], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 580.683/pb
+        [306169, 306171], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v12, 103.163/pb
+        [306418, 306420], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v13, 73.423/pb
+        [306422, 306423], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v13, 120.463/pb
+        [306432, 306432], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v13, 33.338/pb
+        [306454, 306460], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_DZ_v13, 635.031/pb
+      ],
+    },
+  ],
+  '2e' : [
+    {
+      'name'        : 'HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v10, 94.725/pb
+        [297056, 297057], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v10, 143.741/pb
+        [297099, 297101], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 241.495/pb
+        [297113, 297114], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 85.001/pb
+        [297175, 297178], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 280.582/pb
+        [297215, 297215], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 12.287/pb
+        [297218, 297219], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 425.447/pb
+        [297224, 297225], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 13.81/pb
+        [297227, 297227], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 15.669/pb
+        [297292, 297293], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 198.677/pb
+        [297296, 297296], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 84.207/pb
+        [297308, 297308], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 6.298/pb
+        [297359, 297359], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 13.795/pb
+        [297411, 297411], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 201.578/pb
+        [297424, 297426], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 97.376/pb
+        [297429, 297435], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 199.191/pb
+        [297467, 297469], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 69.859/pb
+        [297483, 297488], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 471.448/pb
+        [297503, 297505], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v11, 268.446/pb
+        [297557, 297558], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 158.712/pb
+        [297562, 297563], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 106.785/pb
+        [297598, 297599], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 93.85/pb
+        [297603, 297606], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 276.775/pb
+        [297620, 297620], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 82.127/pb
+        [297656, 297656], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 93.083/pb
+        [297665, 297666], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 78.347/pb
+        [297670, 297670], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 2.132/pb
+        [297674, 297675], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 170.78/pb
+        [297722, 297723], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 142.686/pb
+        [298996, 298997], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 26.765/pb
+        [299000, 299000], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 8.038/pb
+        [299042, 299042], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 2.02/pb
+        [299061, 299062], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 123.32/pb
+        [299064, 299065], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 73.04/pb
+        [299067, 299067], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 68.807/pb
+        [299096, 299096], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 24.067/pb
+        [299149, 299149], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 108.249/pb
+        [299178, 299178], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 15.791/pb
+        [299180, 299180], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 15.575/pb
+        [299184, 299185], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 146.717/pb
+        [299327, 299327], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 15.178/pb
+        [299329, 299329], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v12, 37.487/pb
+        [299368, 299370], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 253.498/pb
+        [299380, 299381], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 66.094/pb
+        [299394, 299396], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 61.673/pb
+        [299420, 299420], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 13.23/pb
+        [299443, 299443], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 5.608/pb
+        [299450, 299450], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 12.395/pb
+        [299477, 299481], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 431.547/pb
+        [299593, 299595], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 268.091/pb
+        [299597, 299597], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 85.37/pb
+        [299649, 299649], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v13, 56.768/pb
+        [300087, 300087], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 12.856/pb
+        [300105, 300107], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 34.169/pb
+        [300117, 300117], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 6.067/pb
+        [300122, 300123], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 394.771/pb
+        [300155, 300157], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 461.282/pb
+        [300226, 300226], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 115.963/pb
+        [300233, 300240], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 435.357/pb
+        [300280, 300284], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 311.422/pb
+        [300364, 300375], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 59.002/pb
+        [300389, 300401], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 339.844/pb
+        [300459, 300459], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 81.507/pb
+        [300461, 300464], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 132.112/pb
+        [300466, 300467], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 202.273/pb
+        [300497, 300497], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 40.035/pb
+        [300514, 300517], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 379.864/pb
+        [300558, 300558], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 119.182/pb
+        [300560, 300560], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 140.271/pb
+        [300574, 300576], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 315.299/pb
+        [300631, 300633], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 167.565/pb
+        [300635, 300636], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 312.071/pb
+        [300673, 300676], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 23.1/pb
+        [300742, 300742], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 83.984/pb
+        [300777, 300777], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 130.415/pb
+        [300780, 300780], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 79.072/pb
+        [300785, 300785], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 212.774/pb
+        [300806, 300806], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 54.218/pb
+        [300811, 300812], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 159.497/pb
+        [300816, 300817], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v14, 134.15/pb
+        [301046, 301046], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 4.222/pb
+        [301141, 301142], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 97.203/pb
+        [301161, 301161], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 98.077/pb
+        [301165, 301165], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 15.465/pb
+        [301179, 301180], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 16.878/pb
+        [301183, 301183], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 45.299/pb
+        [301281, 301281], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 18.542/pb
+        [301283, 301283], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 120.005/pb
+        [301298, 301298], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 153.993/pb
+        [301323, 301323], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 165.06/pb
+        [301330, 301330], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 64.443/pb
+        [301359, 301359], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 57.278/pb
+        [301384, 301384], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 94.354/pb
+        [301391, 301393], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 147.405/pb
+        [301396, 301399], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 110.63/pb
+        [301417, 301417], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 67.689/pb
+        [301447, 301450], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 188.658/pb
+        [301461, 301461], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 98.122/pb
+        [301472, 301472], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 138.033/pb
+        [301475, 301476], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 109.336/pb
+        [301519, 301519], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 33.367/pb
+        [301524, 301524], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 41.078/pb
+        [301529, 301532], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 131.943/pb
+        [301567, 301567], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 63.339/pb
+        [301627, 301627], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 131.459/pb
+        [301664, 301665], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 138.42/pb
+        [301694, 301694], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 17.576/pb
+        [301912, 301914], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 79.784/pb
+        [301941, 301941], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 74.507/pb
+        [301959, 301960], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 290.104/pb
+        [301970, 301970], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 22.349/pb
+        [301984, 301987], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 292.622/pb
+        [301997, 301998], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 282.538/pb
+        [302019, 302019], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v15, 9.113/pb
+        [302026, 302026], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 4.652/pb
+        [302029, 302029], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 15.282/pb
+        [302031, 302031], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 128.522/pb
+        [302033, 302034], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 5.657/pb
+        [302037, 302038], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 0.069/pb
+        [302040, 302043], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 104.438/pb
+        [302131, 302131], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 111.635/pb
+        [302159, 302159], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 16.077/pb
+        [302163, 302163], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 146.312/pb
+        [302165, 302166], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 8.409/pb
+        [302225, 302225], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 114.788/pb
+        [302228, 302229], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 105.812/pb
+        [302240, 302240], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 138.868/pb
+        [302262, 302263], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 241.353/pb
+        [302277, 302277], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 53.761/pb
+        [302279, 302280], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 18.474/pb
+        [302322, 302322], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 96.87/pb
+        [302328, 302328], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 93.45/pb
+        [302337, 302337], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 20.377/pb
+        [302342, 302344], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 91.05/pb
+        [302350, 302350], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 16.493/pb
+        [302388, 302388], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 126.264/pb
+        [302392, 302393], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 232.234/pb
+        [302448, 302448], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 307.867/pb
+        [302472, 302476], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 292.111/pb
+        [302479, 302479], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 68.381/pb
+        [302484, 302485], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 209.762/pb
+        [302492, 302494], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v16, 93.282/pb
+        [302509, 302509], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 4.987/pb
+        [302513, 302513], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 12.203/pb
+        [302522, 302523], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 11.257/pb
+        [302525, 302526], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 223.119/pb
+        [302548, 302548], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 15.74/pb
+        [302551, 302551], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 0.104/pb
+        [302553, 302555], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 39.038/pb
+        [302563, 302563], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 0.32/pb
+        [302565, 302565], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 0.149/pb
+        [302572, 302573], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 241.684/pb
+        [302596, 302597], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 318.295/pb
+        [302634, 302635], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 300.859/pb
+        [302651, 302651], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 30.035/pb
+        [302654, 302654], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 63.967/pb
+        [302661, 302661], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 9.465/pb
+        [302663, 302663], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 134.254/pb
+        [303825, 303825], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 22.834/pb
+        [303832, 303832], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 321.326/pb
+        [303838, 303838], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 380.035/pb
+        [303885, 303885], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 400.159/pb
+        [303948, 303948], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 351.61/pb
+        [303998, 304000], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 256.409/pb
+        [304062, 304062], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 382.105/pb
+        [304119, 304120], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 93.285/pb
+        [304125, 304125], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 338.101/pb
+        [304144, 304144], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 533.881/pb
+        [304158, 304158], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 370.885/pb
+        [304169, 304170], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 414.145/pb
+        [304199, 304200], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 88.201/pb
+        [304204, 304204], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 153.182/pb
+        [304209, 304209], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 116.174/pb
+        [304291, 304292], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 350.613/pb
+        [304333, 304333], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 366.646/pb
+        [304354, 304354], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 68.255/pb
+        [304366, 304366], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 419.018/pb
+        [304446, 304447], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 385.306/pb
+        [304451, 304451], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 7.416/pb
+        [304505, 304508], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 425.864/pb
+        [304562, 304562], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 221.934/pb
+        [304616, 304616], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 253.369/pb
+        [304625, 304626], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 138.626/pb
+        [304654, 304655], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 403.545/pb
+        [304661, 304663], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 266.757/pb
+        [304671, 304672], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 320.532/pb
+        [304737, 304740], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 474.819/pb
+        [304776, 304778], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 432.15/pb
+        [304797, 304797], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 557.403/pb
+        [305044, 305046], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 378.033/pb
+        [305059, 305059], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 157.786/pb
+        [305062, 305064], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 390.89/pb
+        [305081, 305081], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 315.14/pb
+        [305112, 305114], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 497.055/pb
+        [305178, 305184], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 100.554/pb
+        [305186, 305186], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 122.05/pb
+        [305188, 305188], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 198.33/pb
+        [305202, 305202], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 207.76/pb
+        [305204, 305204], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 254.513/pb
+        [305207, 305208], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 401.157/pb
+        [305234, 305234], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 12.655/pb
+        [305236, 305237], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 344.353/pb
+        [305247, 305248], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 380.308/pb
+        [305252, 305252], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 95.04/pb
+        [305282, 305282], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 44.345/pb
+        [305310, 305314], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 481.671/pb
+        [305336, 305336], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 66.203/pb
+        [305338, 305338], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 33.112/pb
+        [305341, 305341], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 151.78/pb
+        [305349, 305351], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 186.042/pb
+        [305358, 305358], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 49.594/pb
+        [305364, 305366], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 511.673/pb
+        [305376, 305377], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 431.522/pb
+        [305405, 305406], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 475.515/pb
+        [305440, 305441], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 119.869/pb
+        [305516, 305518], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 438.593/pb
+        [305586, 305586], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 171.033/pb
+        [305589, 305590], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 314.815/pb
+        [305636, 305636], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 525.22/pb
+        [305766, 305766], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 263.689/pb
+        [305809, 305809], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 45.952/pb
+        [305814, 305814], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 446.804/pb
+        [305821, 305821], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 240.463/pb
+        [305832, 305832], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 58.021/pb
+        [305840, 305840], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 251.347/pb
+        [305842, 305842], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 114.87/pb
+        [305862, 305862], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 202.189/pb
+        [305898, 305898], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 230.935/pb
+        [305902, 305902], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 154.345/pb
+        [305967, 305967], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 10.508/pb
+        [306029, 306030], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 44.125/pb
+        [306036, 306038], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 56.442/pb
+        [306041, 306042], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 200.189/pb
+        [306048, 306049], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 107.334/pb
+        [306051, 306051], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 70.67/pb
+        [306091, 306092], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 280.74/pb
+        [306095, 306095], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 49.131/pb
+        [306121, 306122], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 69.307/pb
+        [306125, 306126], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 590.489/pb
+        [306134, 306135], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 336.473/pb
+        [306138, 306139], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 312.896/pb
+        [306153, 306155], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 580.683/pb
+        [306169, 306171], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 103.163/pb
+        [306418, 306420], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 73.423/pb
+        [306422, 306423], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 120.463/pb
+        [306432, 306432], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 33.338/pb
+        [306454, 306460], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 635.031/pb
+      ],
+    },
+  ],
+  '1mu' : [
+    {
+      'name'        : 'HLT_IsoMu24', # not enabled at high lumi
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_IsoMu24_v5, 94.725/pb
+        [297056, 297057], # HLT_IsoMu24_v5, 143.741/pb
+        [297099, 297101], # HLT_IsoMu24_v6, 231.302/pb
+        [297113, 297114], # HLT_IsoMu24_v6, 85.001/pb
+        [297175, 297178], # HLT_IsoMu24_v6, 280.582/pb
+        [297218, 297219], # HLT_IsoMu24_v6, 423.357/pb
+        [297224, 297225], # HLT_IsoMu24_v6, 13.81/pb
+        [297227, 297227], # HLT_IsoMu24_v6, 15.669/pb
+        [297292, 297293], # HLT_IsoMu24_v6, 198.677/pb
+        [297296, 297296], # HLT_IsoMu24_v6, 84.207/pb
+        [297308, 297308], # HLT_IsoMu24_v6, 6.298/pb
+        [297411, 297411], # HLT_IsoMu24_v6, 201.578/pb
+        [297424, 297426], # HLT_IsoMu24_v6, 97.376/pb
+        [297429, 297435], # HLT_IsoMu24_v6, 199.191/pb
+        [297467, 297469], # HLT_IsoMu24_v6, 68.567/pb
+        [297483, 297488], # HLT_IsoMu24_v6, 471.448/pb
+        [297503, 297505], # HLT_IsoMu24_v6, 268.446/pb
+        [297557, 297558], # HLT_IsoMu24_v7, 158.712/pb
+        [297562, 297563], # HLT_IsoMu24_v7, 106.785/pb
+        [297598, 297599], # HLT_IsoMu24_v7, 93.85/pb
+        [297603, 297606], # HLT_IsoMu24_v7, 276.775/pb
+        [297620, 297620], # HLT_IsoMu24_v7, 82.127/pb
+        [297656, 297656], # HLT_IsoMu24_v7, 93.083/pb
+        [297665, 297666], # HLT_IsoMu24_v7, 78.347/pb
+        [297670, 297670], # HLT_IsoMu24_v7, 2.132/pb
+        [297674, 297675], # HLT_IsoMu24_v7, 170.78/pb
+        [297722, 297723], # HLT_IsoMu24_v7, 142.686/pb
+        [298996, 298997], # HLT_IsoMu24_v7, 22.867/pb
+        [299000, 299000], # HLT_IsoMu24_v7, 8.038/pb
+        [299042, 299042], # HLT_IsoMu24_v7, 2.02/pb
+        [299061, 299062], # HLT_IsoMu24_v7, 123.32/pb
+        [299064, 299065], # HLT_IsoMu24_v7, 73.04/pb
+        [299067, 299067], # HLT_IsoMu24_v7, 68.807/pb
+        [299096, 299096], # HLT_IsoMu24_v7, 24.067/pb
+        [299149, 299149], # HLT_IsoMu24_v7, 108.249/pb
+        [299178, 299178], # HLT_IsoMu24_v7, 15.791/pb
+        [299180, 299180], # HLT_IsoMu24_v7, 15.575/pb
+        [299184, 299185], # HLT_IsoMu24_v7, 146.717/pb
+        [299327, 299327], # HLT_IsoMu24_v7, 15.178/pb
+        [299329, 299329], # HLT_IsoMu24_v7, 37.487/pb
+        [299368, 299370], # HLT_IsoMu24_v8, 253.498/pb
+        [299380, 299380], # HLT_IsoMu24_v8, 29.231/pb
+        [299395, 299396], # HLT_IsoMu24_v8, 48.62/pb
+        [299420, 299420], # HLT_IsoMu24_v8, 13.23/pb
+        [299443, 299443], # HLT_IsoMu24_v8, 5.608/pb
+        [299450, 299450], # HLT_IsoMu24_v8, 12.395/pb
+        [299477, 299481], # HLT_IsoMu24_v8, 431.547/pb
+        [299593, 299595], # HLT_IsoMu24_v8, 268.091/pb
+        [299597, 299597], # HLT_IsoMu24_v8, 85.37/pb
+        [299649, 299649], # HLT_IsoMu24_v8, 21.775/pb
+        [300087, 300087], # HLT_IsoMu24_v9, 12.856/pb
+        [300105, 300107], # HLT_IsoMu24_v9, 34.169/pb
+        [300117, 300117], # HLT_IsoMu24_v9, 6.067/pb
+        [300122, 300123], # HLT_IsoMu24_v9, 393.9/pb
+        [300155, 300157], # HLT_IsoMu24_v9, 461.282/pb
+        [300226, 300226], # HLT_IsoMu24_v9, 90.334/pb
+        [300233, 300240], # HLT_IsoMu24_v9, 435.357/pb
+        [300280, 300284], # HLT_IsoMu24_v9, 311.422/pb
+        [300364, 300375], # HLT_IsoMu24_v9, 59.002/pb
+        [300389, 300401], # HLT_IsoMu24_v9, 339.844/pb
+        [300459, 300459], # HLT_IsoMu24_v9, 81.507/pb
+        [300461, 300464], # HLT_IsoMu24_v9, 132.112/pb
+        [300466, 300467], # HLT_IsoMu24_v9, 202.273/pb
+        [300514, 300517], # HLT_IsoMu24_v9, 356.652/pb
+        [300558, 300558], # HLT_IsoMu24_v9, 119.182/pb
+        [300560, 300560], # HLT_IsoMu24_v9, 140.271/pb
+        [300574, 300576], # HLT_IsoMu24_v9, 315.299/pb
+        [300631, 300633], # HLT_IsoMu24_v9, 167.565/pb
+        [300635, 300636], # HLT_IsoMu24_v9, 312.071/pb
+        [300673, 300676], # HLT_IsoMu24_v9, 23.1/pb
+        [300742, 300742], # HLT_IsoMu24_v9, 83.984/pb
+        [300777, 300777], # HLT_IsoMu24_v9, 130.415/pb
+        [300780, 300780], # HLT_IsoMu24_v9, 79.072/pb
+        [300785, 300785], # HLT_IsoMu24_v9, 212.774/pb
+        [300811, 300812], # HLT_IsoMu24_v9, 123.469/pb
+        [300816, 300817], # HLT_IsoMu24_v9, 134.15/pb
+        [301046, 301046], # HLT_IsoMu24_v9, 4.222/pb
+        [301141, 301142], # HLT_IsoMu24_v9, 97.203/pb
+        [301161, 301161], # HLT_IsoMu24_v9, 98.077/pb
+        [301165, 301165], # HLT_IsoMu24_v9, 15.465/pb
+        [301179, 301180], # HLT_IsoMu24_v9, 16.878/pb
+        [301183, 301183], # HLT_IsoMu24_v9, 45.299/pb
+        [301281, 301281], # HLT_IsoMu24_v9, 18.542/pb
+        [301283, 301283], # HLT_IsoMu24_v9, 120.005/pb
+        [301298, 301298], # HLT_IsoMu24_v9, 153.993/pb
+        [301323, 301323], # HLT_IsoMu24_v9, 165.06/pb
+        [301330, 301330], # HLT_IsoMu24_v9, 64.443/pb
+        [301359, 301359], # HLT_IsoMu24_v9, 57.278/pb
+        [301384, 301384], # HLT_IsoMu24_v9, 94.354/pb
+        [301391, 301393], # HLT_IsoMu24_v9, 147.405/pb
+        [301396, 301399], # HLT_IsoMu24_v9, 110.63/pb
+        [301417, 301417], # HLT_IsoMu24_v9, 67.689/pb
+        [301447, 301450], # HLT_IsoMu24_v9, 188.658/pb
+        [301461, 301461], # HLT_IsoMu24_v9, 98.122/pb
+        [301472, 301472], # HLT_IsoMu24_v9, 138.033/pb
+        [301475, 301476], # HLT_IsoMu24_v9, 109.336/pb
+        [301519, 301519], # HLT_IsoMu24_v9, 33.367/pb
+        [301524, 301524], # HLT_IsoMu24_v9, 41.078/pb
+        [301529, 301532], # HLT_IsoMu24_v9, 131.943/pb
+        [301567, 301567], # HLT_IsoMu24_v9, 63.339/pb
+        [301627, 301627], # HLT_IsoMu24_v9, 131.459/pb
+        [301664, 301665], # HLT_IsoMu24_v9, 138.42/pb
+        [301694, 301694], # HLT_IsoMu24_v9, 5.787/pb
+        [301912, 301914], # HLT_IsoMu24_v9, 79.784/pb
+        [301941, 301941], # HLT_IsoMu24_v9, 74.507/pb
+        [301959, 301960], # HLT_IsoMu24_v9, 290.104/pb
+        [301970, 301970], # HLT_IsoMu24_v9, 22.349/pb
+        [301984, 301987], # HLT_IsoMu24_v9, 292.622/pb
+        [301997, 301998], # HLT_IsoMu24_v9, 282.538/pb
+        [302019, 302019], # HLT_IsoMu24_v9, 9.113/pb
+        [302026, 302026], # HLT_IsoMu24_v10, 4.652/pb
+        [302029, 302029], # HLT_IsoMu24_v10, 15.282/pb
+        [302031, 302031], # HLT_IsoMu24_v10, 128.522/pb
+        [302033, 302034], # HLT_IsoMu24_v10, 5.657/pb
+        [302037, 302038], # HLT_IsoMu24_v10, 0.069/pb
+        [302040, 302043], # HLT_IsoMu24_v10, 104.438/pb
+        [302131, 302131], # HLT_IsoMu24_v10, 111.635/pb
+        [302159, 302159], # HLT_IsoMu24_v10, 16.077/pb
+        [302163, 302163], # HLT_IsoMu24_v10, 146.312/pb
+        [302165, 302166], # HLT_IsoMu24_v10, 8.409/pb
+        [302225, 302225], # HLT_IsoMu24_v10, 114.788/pb
+        [302228, 302229], # HLT_IsoMu24_v10, 105.812/pb
+        [302240, 302240], # HLT_IsoMu24_v10, 138.868/pb
+        [302262, 302263], # HLT_IsoMu24_v10, 241.353/pb
+        [302277, 302277], # HLT_IsoMu24_v10, 53.761/pb
+        [302279, 302280], # HLT_IsoMu24_v10, 18.474/pb
+        [302322, 302322], # HLT_IsoMu24_v10, 96.87/pb
+        [302328, 302328], # HLT_IsoMu24_v10, 93.45/pb
+        [302337, 302337], # HLT_IsoMu24_v10, 20.377/pb
+        [302342, 302344], # HLT_IsoMu24_v10, 91.05/pb
+        [302350, 302350], # HLT_IsoMu24_v10, 16.493/pb
+        [302388, 302388], # HLT_IsoMu24_v10, 126.264/pb
+        [302392, 302393], # HLT_IsoMu24_v10, 232.234/pb
+        [302448, 302448], # HLT_IsoMu24_v10, 307.867/pb
+        [302472, 302476], # HLT_IsoMu24_v10, 292.111/pb
+        [302479, 302479], # HLT_IsoMu24_v10, 68.381/pb
+        [302484, 302485], # HLT_IsoMu24_v10, 209.762/pb
+        [302492, 302494], # HLT_IsoMu24_v10, 93.282/pb
+        [302509, 302509], # HLT_IsoMu24_v10, 4.987/pb
+        [302513, 302513], # HLT_IsoMu24_v10, 12.203/pb
+        [302522, 302523], # HLT_IsoMu24_v10, 11.257/pb
+        [302525, 302526], # HLT_IsoMu24_v10, 223.119/pb
+        [302548, 302548], # HLT_IsoMu24_v10, 15.74/pb
+        [302551, 302551], # HLT_IsoMu24_v10, 0.104/pb
+        [302553, 302555], # HLT_IsoMu24_v10, 39.038/pb
+        [302563, 302563], # HLT_IsoMu24_v10, 0.32/pb
+        [302565, 302565], # HLT_IsoMu24_v10, 0.149/pb
+        [302572, 302573], # HLT_IsoMu24_v10, 241.684/pb
+        [302596, 302597], # HLT_IsoMu24_v10, 318.295/pb
+        [302634, 302635], # HLT_IsoMu24_v10, 300.859/pb
+        [302651, 302651], # HLT_IsoMu24_v10, 30.035/pb
+        [302654, 302654], # HLT_IsoMu24_v10, 63.967/pb
+        [302661, 302661], # HLT_IsoMu24_v10, 9.465/pb
+        [302663, 302663], # HLT_IsoMu24_v10, 134.254/pb
+        [303825, 303825], # HLT_IsoMu24_v10, 22.834/pb
+        [303832, 303832], # HLT_IsoMu24_v10, 319.146/pb
+        [303838, 303838], # HLT_IsoMu24_v10, 380.035/pb
+        [303885, 303885], # HLT_IsoMu24_v10, 376.414/pb
+        [303948, 303948], # HLT_IsoMu24_v10, 351.61/pb
+        [303998, 304000], # HLT_IsoMu24_v10, 256.409/pb
+        [304062, 304062], # HLT_IsoMu24_v10, 382.105/pb
+        [304119, 304120], # HLT_IsoMu24_v10, 93.285/pb
+        [304125, 304125], # HLT_IsoMu24_v10, 338.101/pb
+        [304144, 304144], # HLT_IsoMu24_v10, 515.153/pb
+        [304158, 304158], # HLT_IsoMu24_v10, 370.885/pb
+        [304169, 304170], # HLT_IsoMu24_v10, 414.145/pb
+        [304199, 304200], # HLT_IsoMu24_v10, 88.201/pb
+        [304204, 304204], # HLT_IsoMu24_v10, 146.532/pb
+        [304209, 304209], # HLT_IsoMu24_v10, 116.174/pb
+        [304291, 304292], # HLT_IsoMu24_v10, 327.839/pb
+        [304333, 304333], # HLT_IsoMu24_v10, 265.074/pb
+        [304366, 304366], # HLT_IsoMu24_v10, 316.608/pb
+        [304447, 304447], # HLT_IsoMu24_v10, 297.037/pb
+        [304451, 304451], # HLT_IsoMu24_v10, 7.416/pb
+        [304507, 304508], # HLT_IsoMu24_v10, 287.408/pb
+        [304562, 304562], # HLT_IsoMu24_v10, 154.568/pb
+        [304616, 304616], # HLT_IsoMu24_v10, 181.339/pb
+        [304625, 304626], # HLT_IsoMu24_v10, 45.136/pb
+        [304654, 304655], # HLT_IsoMu24_v10, 309.562/pb
+        [304662, 304663], # HLT_IsoMu24_v10, 187.704/pb
+        [304671, 304672], # HLT_IsoMu24_v10, 199.478/pb
+        [304737, 304740], # HLT_IsoMu24_v10, 337.971/pb
+        [304778, 304778], # HLT_IsoMu24_v10, 266.217/pb
+        [304797, 304797], # HLT_IsoMu24_v10, 435.186/pb
+        [305044, 305046], # HLT_IsoMu24_v10, 361.031/pb
+        [305059, 305059], # HLT_IsoMu24_v10, 1.621/pb
+        [305063, 305064], # HLT_IsoMu24_v10, 381.37/pb
+        [305081, 305081], # HLT_IsoMu24_v10, 310.486/pb
+        [305112, 305114], # HLT_IsoMu24_v10, 470.526/pb
+        [305186, 305186], # HLT_IsoMu24_v10, 12.849/pb
+        [305188, 305188], # HLT_IsoMu24_v10, 198.33/pb
+        [305202, 305202], # HLT_IsoMu24_v10, 51.016/pb
+        [305204, 305204], # HLT_IsoMu24_v10, 254.513/pb
+        [305207, 305208], # HLT_IsoMu24_v10, 198.447/pb
+        [305234, 305234], # HLT_IsoMu24_v10, 8.952/pb
+        [305236, 305237], # HLT_IsoMu24_v10, 344.353/pb
+        [305247, 305248], # HLT_IsoMu24_v10, 380.204/pb
+        [305252, 305252], # HLT_IsoMu24_v10, 95.04/pb
+        [305282, 305282], # HLT_IsoMu24_v10, 40.353/pb
+        [305310, 305314], # HLT_IsoMu24_v10, 479.975/pb
+        [305341, 305341], # HLT_IsoMu24_v10, 67.358/pb
+        [305349, 305351], # HLT_IsoMu24_v10, 186.042/pb
+        [305365, 305366], # HLT_IsoMu24_v10, 333.13/pb
+        [305377, 305377], # HLT_IsoMu24_v10, 316.862/pb
+        [305406, 305406], # HLT_IsoMu24_v10, 244.656/pb
+        [305440, 305441], # HLT_IsoMu24_v10, 119.869/pb
+        [305516, 305518], # HLT_IsoMu24_v10, 432.701/pb
+        [305586, 305586], # HLT_IsoMu24_v10, 170.417/pb
+        [305589, 305590], # HLT_IsoMu24_v10, 314.815/pb
+        [305636, 305636], # HLT_IsoMu24_v10, 525.22/pb
+        [305766, 305766], # HLT_IsoMu24_v10, 263.689/pb
+        [305809, 305809], # HLT_IsoMu24_v10, 45.952/pb
+        [305814, 305814], # HLT_IsoMu24_v10, 446.804/pb
+        [305821, 305821], # HLT_IsoMu24_v10, 240.463/pb
+        [305832, 305832], # HLT_IsoMu24_v10, 58.021/pb
+        [305840, 305840], # HLT_IsoMu24_v10, 251.347/pb
+        [305842, 305842], # HLT_IsoMu24_v10, 114.87/pb
+        [305862, 305862], # HLT_IsoMu24_v10, 202.189/pb
+        [305898, 305898], # HLT_IsoMu24_v10, 230.935/pb
+        [305902, 305902], # HLT_IsoMu24_v10, 154.345/pb
+        [305967, 305967], # HLT_IsoMu24_v10, 10.508/pb
+        [306029, 306029], # HLT_IsoMu24_v10, 3.145/pb
+        [306036, 306038], # HLT_IsoMu24_v10, 23.374/pb
+        [306041, 306042], # HLT_IsoMu24_v10, 200.189/pb
+        [306048, 306049], # HLT_IsoMu24_v10, 107.334/pb
+        [306051, 306051], # HLT_IsoMu24_v10, 70.67/pb
+        [306091, 306092], # HLT_IsoMu24_v10, 275.647/pb
+        [306095, 306095], # HLT_IsoMu24_v10, 49.131/pb
+        [306121, 306122], # HLT_IsoMu24_v10, 69.307/pb
+        [306125, 306126], # HLT_IsoMu24_v10, 590.489/pb
+        [306134, 306135], # HLT_IsoMu24_v10, 336.473/pb
+        [306138, 306139], # HLT_IsoMu24_v10, 312.896/pb
+        [306153, 306155], # HLT_IsoMu24_v10, 580.683/pb
+        [306169, 306171], # HLT_IsoMu24_v10, 103.163/pb
+        [306418, 306420], # HLT_IsoMu24_v11, 73.423/pb
+        [306422, 306423], # HLT_IsoMu24_v11, 120.463/pb
+        [306432, 306432], # HLT_IsoMu24_v11, 33.338/pb
+        [306454, 306460], # HLT_IsoMu24_v11, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoMu27',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_IsoMu27_v8, 94.725/pb
+        [297056, 297057], # HLT_IsoMu27_v8, 143.741/pb
+        [297099, 297101], # HLT_IsoMu27_v9, 241.495/pb
+        [297113, 297114], # HLT_IsoMu27_v9, 85.001/pb
+        [297175, 297178], # HLT_IsoMu27_v9, 280.582/pb
+        [297215, 297215], # HLT_IsoMu27_v9, 12.287/pb
+        [297218, 297219], # HLT_IsoMu27_v9, 425.447/pb
+        [297224, 297225], # HLT_IsoMu27_v9, 13.81/pb
+        [297227, 297227], # HLT_IsoMu27_v9, 15.669/pb
+        [297292, 297293], # HLT_IsoMu27_v9, 198.677/pb
+        [297296, 297296], # HLT_IsoMu27_v9, 84.207/pb
+        [297308, 297308], # HLT_IsoMu27_v9, 6.298/pb
+        [297359, 297359], # HLT_IsoMu27_v9, 13.795/pb
+        [297411, 297411], # HLT_IsoMu27_v9, 201.578/pb
+        [297424, 297426], # HLT_IsoMu27_v9, 97.376/pb
+        [297429, 297435], # HLT_IsoMu27_v9, 199.191/pb
+        [297467, 297469], # HLT_IsoMu27_v9, 69.859/pb
+        [297483, 297488], # HLT_IsoMu27_v9, 471.448/pb
+        [297503, 297505], # HLT_IsoMu27_v9, 268.446/pb
+        [297557, 297558], # HLT_IsoMu27_v10, 158.712/pb
+        [297562, 297563], # HLT_IsoMu27_v10, 106.785/pb
+        [297598, 297599], # HLT_IsoMu27_v10, 93.85/pb
+        [297603, 297606], # HLT_IsoMu27_v10, 276.775/pb
+        [297620, 297620], # HLT_IsoMu27_v10, 82.127/pb
+        [297656, 297656], # HLT_IsoMu27_v10, 93.083/pb
+        [297665, 297666], # HLT_IsoMu27_v10, 78.347/pb
+        [297670, 297670], # HLT_IsoMu27_v10, 2.132/pb
+        [297674, 297675], # HLT_IsoMu27_v10, 170.78/pb
+        [297722, 297723], # HLT_IsoMu27_v10, 142.686/pb
+        [298996, 298997], # HLT_IsoMu27_v10, 26.765/pb
+        [299000, 299000], # HLT_IsoMu27_v10, 8.038/pb
+        [299042, 299042], # HLT_IsoMu27_v10, 2.02/pb
+        [299061, 299062], # HLT_IsoMu27_v10, 123.32/pb
+        [299064, 299065], # HLT_IsoMu27_v10, 73.04/pb
+        [299067, 299067], # HLT_IsoMu27_v10, 68.807/pb
+        [299096, 299096], # HLT_IsoMu27_v10, 24.067/pb
+        [299149, 299149], # HLT_IsoMu27_v10, 108.249/pb
+        [299178, 299178], # HLT_IsoMu27_v10, 15.791/pb
+        [299180, 299180], # HLT_IsoMu27_v10, 15.575/pb
+        [299184, 299185], # HLT_IsoMu27_v10, 146.717/pb
+        [299327, 299327], # HLT_IsoMu27_v10, 15.178/pb
+        [299329, 299329], # HLT_IsoMu27_v10, 37.487/pb
+        [299368, 299370], # HLT_IsoMu27_v11, 253.498/pb
+        [299380, 299381], # HLT_IsoMu27_v11, 66.094/pb
+        [299394, 299396], # HLT_IsoMu27_v11, 61.673/pb
+        [299420, 299420], # HLT_IsoMu27_v11, 13.23/pb
+        [299443, 299443], # HLT_IsoMu27_v11, 5.608/pb
+        [299450, 299450], # HLT_IsoMu27_v11, 12.395/pb
+        [299477, 299481], # HLT_IsoMu27_v11, 431.547/pb
+        [299593, 299595], # HLT_IsoMu27_v11, 268.091/pb
+        [299597, 299597], # HLT_IsoMu27_v11, 85.37/pb
+        [299649, 299649], # HLT_IsoMu27_v11, 56.768/pb
+        [300087, 300087], # HLT_IsoMu27_v12, 12.856/pb
+        [300105, 300107], # HLT_IsoMu27_v12, 34.169/pb
+        [300117, 300117], # HLT_IsoMu27_v12, 6.067/pb
+        [300122, 300123], # HLT_IsoMu27_v12, 394.771/pb
+        [300155, 300157], # HLT_IsoMu27_v12, 461.282/pb
+        [300226, 300226], # HLT_IsoMu27_v12, 115.963/pb
+        [300233, 300240], # HLT_IsoMu27_v12, 435.357/pb
+        [300280, 300284], # HLT_IsoMu27_v12, 311.422/pb
+        [300364, 300375], # HLT_IsoMu27_v12, 59.002/pb
+        [300389, 300401], # HLT_IsoMu27_v12, 339.844/pb
+        [300459, 300459], # HLT_IsoMu27_v12, 81.507/pb
+        [300461, 300464], # HLT_IsoMu27_v12, 132.112/pb
+        [300466, 300467], # HLT_IsoMu27_v12, 202.273/pb
+        [300497, 300497], # HLT_IsoMu27_v12, 40.035/pb
+        [300514, 300517], # HLT_IsoMu27_v12, 379.864/pb
+        [300558, 300558], # HLT_IsoMu27_v12, 119.182/pb
+        [300560, 300560], # HLT_IsoMu27_v12, 140.271/pb
+        [300574, 300576], # HLT_IsoMu27_v12, 315.299/pb
+        [300631, 300633], # HLT_IsoMu27_v12, 167.565/pb
+        [300635, 300636], # HLT_IsoMu27_v12, 312.071/pb
+        [300673, 300676], # HLT_IsoMu27_v12, 23.1/pb
+        [300742, 300742], # HLT_IsoMu27_v12, 83.984/pb
+        [300777, 300777], # HLT_IsoMu27_v12, 130.415/pb
+        [300780, 300780], # HLT_IsoMu27_v12, 79.072/pb
+        [300785, 300785], # HLT_IsoMu27_v12, 212.774/pb
+        [300806, 300806], # HLT_IsoMu27_v12, 54.218/pb
+        [300811, 300812], # HLT_IsoMu27_v12, 159.497/pb
+        [300816, 300817], # HLT_IsoMu27_v12, 134.15/pb
+        [301046, 301046], # HLT_IsoMu27_v12, 4.222/pb
+        [301141, 301142], # HLT_IsoMu27_v12, 97.203/pb
+        [301161, 301161], # HLT_IsoMu27_v12, 98.077/pb
+        [301165, 301165], # HLT_IsoMu27_v12, 15.465/pb
+        [301179, 301180], # HLT_IsoMu27_v12, 16.878/pb
+        [301183, 301183], # HLT_IsoMu27_v12, 45.299/pb
+        [301281, 301281], # HLT_IsoMu27_v12, 18.542/pb
+        [301283, 301283], # HLT_IsoMu27_v12, 120.005/pb
+        [301298, 301298], # HLT_IsoMu27_v12, 153.993/pb
+        [301323, 301323], # HLT_IsoMu27_v12, 165.06/pb
+        [301330, 301330], # HLT_IsoMu27_v12, 64.443/pb
+        [301359, 301359], # HLT_IsoMu27_v12, 57.278/pb
+        [301384, 301384], # HLT_IsoMu27_v12, 94.354/pb
+        [301391, 301393], # HLT_IsoMu27_v12, 147.405/pb
+        [301396, 301399], # HLT_IsoMu27_v12, 110.63/pb
+        [301417, 301417], # HLT_IsoMu27_v12, 67.689/pb
+        [301447, 301450], # HLT_IsoMu27_v12, 188.658/pb
+        [301461, 301461], # HLT_IsoMu27_v12, 98.122/pb
+        [301472, 301472], # HLT_IsoMu27_v12, 138.033/pb
+        [301475, 301476], # HLT_IsoMu27_v12, 109.336/pb
+        [301519, 301519], # HLT_IsoMu27_v12, 33.367/pb
+        [301524, 301524], # HLT_IsoMu27_v12, 41.078/pb
+        [301529, 301532], # HLT_IsoMu27_v12, 131.943/pb
+        [301567, 301567], # HLT_IsoMu27_v12, 63.339/pb
+        [301627, 301627], # HLT_IsoMu27_v12, 131.459/pb
+        [301664, 301665], # HLT_IsoMu27_v12, 138.42/pb
+        [301694, 301694], # HLT_IsoMu27_v12, 17.576/pb
+        [301912, 301914], # HLT_IsoMu27_v12, 79.784/pb
+        [301941, 301941], # HLT_IsoMu27_v12, 74.507/pb
+        [301959, 301960], # HLT_IsoMu27_v12, 290.104/pb
+        [301970, 301970], # HLT_IsoMu27_v12, 22.349/pb
+        [301984, 301987], # HLT_IsoMu27_v12, 292.622/pb
+        [301997, 301998], # HLT_IsoMu27_v12, 282.538/pb
+        [302019, 302019], # HLT_IsoMu27_v12, 9.113/pb
+        [302026, 302026], # HLT_IsoMu27_v13, 4.652/pb
+        [302029, 302029], # HLT_IsoMu27_v13, 15.282/pb
+        [302031, 302031], # HLT_IsoMu27_v13, 128.522/pb
+        [302033, 302034], # HLT_IsoMu27_v13, 5.657/pb
+        [302037, 302038], # HLT_IsoMu27_v13, 0.069/pb
+        [302040, 302043], # HLT_IsoMu27_v13, 104.438/pb
+        [302131, 302131], # HLT_IsoMu27_v13, 111.635/pb
+        [302159, 302159], # HLT_IsoMu27_v13, 16.077/pb
+        [302163, 302163], # HLT_IsoMu27_v13, 146.312/pb
+        [302165, 302166], # HLT_IsoMu27_v13, 8.409/pb
+        [302225, 302225], # HLT_IsoMu27_v13, 114.788/pb
+        [302228, 302229], # HLT_IsoMu27_v13, 105.812/pb
+        [302240, 302240], # HLT_IsoMu27_v13, 138.868/pb
+        [302262, 302263], # HLT_IsoMu27_v13, 241.353/pb
+        [302277, 302277], # HLT_IsoMu27_v13, 53.761/pb
+        [302279, 302280], # HLT_IsoMu27_v13, 18.474/pb
+        [302322, 302322], # HLT_IsoMu27_v13, 96.87/pb
+        [302328, 302328], # HLT_IsoMu27_v13, 93.45/pb
+        [302337, 302337], # HLT_IsoMu27_v13, 20.377/pb
+        [302342, 302344], # HLT_IsoMu27_v13, 91.05/pb
+        [302350, 302350], # HLT_IsoMu27_v13, 16.493/pb
+        [302388, 302388], # HLT_IsoMu27_v13, 126.264/pb
+        [302392, 302393], # HLT_IsoMu27_v13, 232.234/pb
+        [302448, 302448], # HLT_IsoMu27_v13, 307.867/pb
+        [302472, 302476], # HLT_IsoMu27_v13, 292.111/pb
+        [302479, 302479], # HLT_IsoMu27_v13, 68.381/pb
+        [302484, 302485], # HLT_IsoMu27_v13, 209.762/pb
+        [302492, 302494], # HLT_IsoMu27_v13, 93.282/pb
+        [302509, 302509], # HLT_IsoMu27_v13, 4.987/pb
+        [302513, 302513], # HLT_IsoMu27_v13, 12.203/pb
+        [302522, 302523], # HLT_IsoMu27_v13, 11.257/pb
+        [302525, 302526], # HLT_IsoMu27_v13, 223.119/pb
+        [302548, 302548], # HLT_IsoMu27_v13, 15.74/pb
+        [302551, 302551], # HLT_IsoMu27_v13, 0.104/pb
+        [302553, 302555], # HLT_IsoMu27_v13, 39.038/pb
+        [302563, 302563], # HLT_IsoMu27_v13, 0.32/pb
+        [302565, 302565], # HLT_IsoMu27_v13, 0.149/pb
+        [302572, 302573], # HLT_IsoMu27_v13, 241.684/pb
+        [302596, 302597], # HLT_IsoMu27_v13, 318.295/pb
+        [302634, 302635], # HLT_IsoMu27_v13, 300.859/pb
+        [302651, 302651], # HLT_IsoMu27_v13, 30.035/pb
+        [302654, 302654], # HLT_IsoMu27_v13, 63.967/pb
+        [302661, 302661], # HLT_IsoMu27_v13, 9.465/pb
+        [302663, 302663], # HLT_IsoMu27_v13, 134.254/pb
+        [303825, 303825], # HLT_IsoMu27_v13, 22.834/pb
+        [303832, 303832], # HLT_IsoMu27_v13, 321.326/pb
+        [303838, 303838], # HLT_IsoMu27_v13, 380.035/pb
+        [303885, 303885], # HLT_IsoMu27_v13, 400.159/pb
+        [303948, 303948], # HLT_IsoMu27_v13, 351.61/pb
+        [303998, 304000], # HLT_IsoMu27_v13, 256.409/pb
+        [304062, 304062], # HLT_IsoMu27_v13, 382.105/pb
+        [304119, 304120], # HLT_IsoMu27_v13, 93.285/pb
+        [304125, 304125], # HLT_IsoMu27_v13, 338.101/pb
+        [304144, 304144], # HLT_IsoMu27_v13, 533.881/pb
+        [304158, 304158], # HLT_IsoMu27_v13, 370.885/pb
+        [304169, 304170], # HLT_IsoMu27_v13, 414.145/pb
+        [304199, 304200], # HLT_IsoMu27_v13, 88.201/pb
+        [304204, 304204], # HLT_IsoMu27_v13, 153.182/pb
+        [304209, 304209], # HLT_IsoMu27_v13, 116.174/pb
+        [304291, 304292], # HLT_IsoMu27_v13, 350.613/pb
+        [304333, 304333], # HLT_IsoMu27_v13, 366.646/pb
+        [304354, 304354], # HLT_IsoMu27_v13, 68.255/pb
+        [304366, 304366], # HLT_IsoMu27_v13, 419.018/pb
+        [304446, 304447], # HLT_IsoMu27_v13, 385.306/pb
+        [304451, 304451], # HLT_IsoMu27_v13, 7.416/pb
+        [304505, 304508], # HLT_IsoMu27_v13, 425.864/pb
+        [304562, 304562], # HLT_IsoMu27_v13, 221.934/pb
+        [304616, 304616], # HLT_IsoMu27_v13, 253.369/pb
+        [304625, 304626], # HLT_IsoMu27_v13, 138.626/pb
+        [304654, 304655], # HLT_IsoMu27_v13, 403.545/pb
+        [304661, 304663], # HLT_IsoMu27_v13, 266.757/pb
+        [304671, 304672], # HLT_IsoMu27_v13, 320.532/pb
+        [304737, 304740], # HLT_IsoMu27_v13, 474.819/pb
+        [304776, 304778], # HLT_IsoMu27_v13, 432.15/pb
+        [304797, 304797], # HLT_IsoMu27_v13, 557.403/pb
+        [305044, 305046], # HLT_IsoMu27_v13, 378.033/pb
+        [305059, 305059], # HLT_IsoMu27_v13, 157.786/pb
+        [305062, 305064], # HLT_IsoMu27_v13, 390.89/pb
+        [305081, 305081], # HLT_IsoMu27_v13, 315.14/pb
+        [305112, 305114], # HLT_IsoMu27_v13, 497.055/pb
+        [305178, 305184], # HLT_IsoMu27_v13, 100.554/pb
+        [305186, 305186], # HLT_IsoMu27_v13, 122.05/pb
+        [305188, 305188], # HLT_IsoMu27_v13, 198.33/pb
+        [305202, 305202], # HLT_IsoMu27_v13, 207.76/pb
+        [305204, 305204], # HLT_IsoMu27_v13, 254.513/pb
+        [305207, 305208], # HLT_IsoMu27_v13, 401.157/pb
+        [305234, 305234], # HLT_IsoMu27_v13, 12.655/pb
+        [305236, 305237], # HLT_IsoMu27_v13, 344.353/pb
+        [305247, 305248], # HLT_IsoMu27_v13, 380.308/pb
+        [305252, 305252], # HLT_IsoMu27_v13, 95.04/pb
+        [305282, 305282], # HLT_IsoMu27_v13, 44.345/pb
+        [305310, 305314], # HLT_IsoMu27_v13, 481.671/pb
+        [305336, 305336], # HLT_IsoMu27_v13, 66.203/pb
+        [305338, 305338], # HLT_IsoMu27_v13, 33.112/pb
+        [305341, 305341], # HLT_IsoMu27_v13, 151.78/pb
+        [305349, 305351], # HLT_IsoMu27_v13, 186.042/pb
+        [305358, 305358], # HLT_IsoMu27_v13, 49.594/pb
+        [305364, 305366], # HLT_IsoMu27_v13, 511.673/pb
+        [305376, 305377], # HLT_IsoMu27_v13, 431.522/pb
+        [305405, 305406], # HLT_IsoMu27_v13, 475.515/pb
+        [305440, 305441], # HLT_IsoMu27_v13, 119.869/pb
+        [305516, 305518], # HLT_IsoMu27_v13, 438.593/pb
+        [305586, 305586], # HLT_IsoMu27_v13, 171.033/pb
+        [305589, 305590], # HLT_IsoMu27_v13, 314.815/pb
+        [305636, 305636], # HLT_IsoMu27_v13, 525.22/pb
+        [305766, 305766], # HLT_IsoMu27_v13, 263.689/pb
+        [305809, 305809], # HLT_IsoMu27_v13, 45.952/pb
+        [305814, 305814], # HLT_IsoMu27_v13, 446.804/pb
+        [305821, 305821], # HLT_IsoMu27_v13, 240.463/pb
+        [305832, 305832], # HLT_IsoMu27_v13, 58.021/pb
+        [305840, 305840], # HLT_IsoMu27_v13, 251.347/pb
+        [305842, 305842], # HLT_IsoMu27_v13, 114.87/pb
+        [305862, 305862], # HLT_IsoMu27_v13, 202.189/pb
+        [305898, 305898], # HLT_IsoMu27_v13, 230.935/pb
+        [305902, 305902], # HLT_IsoMu27_v13, 154.345/pb
+        [305967, 305967], # HLT_IsoMu27_v13, 10.508/pb
+        [306029, 306030], # HLT_IsoMu27_v13, 44.125/pb
+        [306036, 306038], # HLT_IsoMu27_v13, 56.442/pb
+        [306041, 306042], # HLT_IsoMu27_v13, 200.189/pb
+        [306048, 306049], # HLT_IsoMu27_v13, 107.334/pb
+        [306051, 306051], # HLT_IsoMu27_v13, 70.67/pb
+        [306091, 306092], # HLT_IsoMu27_v13, 280.74/pb
+        [306095, 306095], # HLT_IsoMu27_v13, 49.131/pb
+        [306121, 306122], # HLT_IsoMu27_v13, 69.307/pb
+        [306125, 306126], # HLT_IsoMu27_v13, 590.489/pb
+        [306134, 306135], # HLT_IsoMu27_v13, 336.473/pb
+        [306138, 306139], # HLT_IsoMu27_v13, 312.896/pb
+        [306153, 306155], # HLT_IsoMu27_v13, 580.683/pb
+        [306169, 306171], # HLT_IsoMu27_v13, 103.163/pb
+        [306418, 306420], # HLT_IsoMu27_v14, 73.423/pb
+        [306422, 306423], # HLT_IsoMu27_v14, 120.463/pb
+        [306432, 306432], # HLT_IsoMu27_v14, 33.338/pb
+        [306454, 306460], # HLT_IsoMu27_v14, 635.031/pb
+      ],
+    },
+  ],
+  '1mu_noiso' : [
+    {
+      'name'        : 'HLT_Mu50',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Mu50_v6, 94.725/pb
+        [297056, 297057], # HLT_Mu50_v6, 143.741/pb
+        [297099, 297101], # HLT_Mu50_v7, 241.495/pb
+        [297113, 297114], # HLT_Mu50_v7, 85.001/pb
+        [297175, 297178], # HLT_Mu50_v7, 280.582/pb
+        [297215, 297215], # HLT_Mu50_v7, 12.287/pb
+        [297218, 297219], # HLT_Mu50_v7, 425.447/pb
+        [297224, 297225], # HLT_Mu50_v7, 13.81/pb
+        [297227, 297227], # HLT_Mu50_v7, 15.669/pb
+        [297292, 297293], # HLT_Mu50_v7, 198.677/pb
+        [297296, 297296], # HLT_Mu50_v7, 84.207/pb
+        [297308, 297308], # HLT_Mu50_v7, 6.298/pb
+        [297359, 297359], # HLT_Mu50_v7, 13.795/pb
+        [297411, 297411], # HLT_Mu50_v7, 201.578/pb
+        [297424, 297426], # HLT_Mu50_v7, 97.376/pb
+        [297429, 297435], # HLT_Mu50_v7, 199.191/pb
+        [297467, 297469], # HLT_Mu50_v7, 69.859/pb
+        [297483, 297488], # HLT_Mu50_v7, 471.448/pb
+        [297503, 297505], # HLT_Mu50_v7, 268.446/pb
+        [297557, 297558], # HLT_Mu50_v8, 158.712/pb
+        [297562, 297563], # HLT_Mu50_v8, 106.785/pb
+        [297598, 297599], # HLT_Mu50_v8, 93.85/pb
+        [297603, 297606], # HLT_Mu50_v8, 276.775/pb
+        [297620, 297620], # HLT_Mu50_v8, 82.127/pb
+        [297656, 297656], # HLT_Mu50_v8, 93.083/pb
+        [297665, 297666], # HLT_Mu50_v8, 78.347/pb
+        [297670, 297670], # HLT_Mu50_v8, 2.132/pb
+        [297674, 297675], # HLT_Mu50_v8, 170.78/pb
+        [297722, 297723], # HLT_Mu50_v8, 142.686/pb
+        [298996, 298997], # HLT_Mu50_v8, 26.765/pb
+        [299000, 299000], # HLT_Mu50_v8, 8.038/pb
+        [299042, 299042], # HLT_Mu50_v8, 2.02/pb
+        [299061, 299062], # HLT_Mu50_v8, 123.32/pb
+        [299064, 299065], # HLT_Mu50_v8, 73.04/pb
+        [299067, 299067], # HLT_Mu50_v8, 68.807/pb
+        [299096, 299096], # HLT_Mu50_v8, 24.067/pb
+        [299149, 299149], # HLT_Mu50_v8, 108.249/pb
+        [299178, 299178], # HLT_Mu50_v8, 15.791/pb
+        [299180, 299180], # HLT_Mu50_v8, 15.575/pb
+        [299184, 299185], # HLT_Mu50_v8, 146.717/pb
+        [299327, 299327], # HLT_Mu50_v8, 15.178/pb
+        [299329, 299329], # HLT_Mu50_v8, 37.487/pb
+        [299368, 299370], # HLT_Mu50_v9, 253.498/pb
+        [299380, 299381], # HLT_Mu50_v9, 66.094/pb
+        [299394, 299396], # HLT_Mu50_v9, 61.673/pb
+        [299420, 299420], # HLT_Mu50_v9, 13.23/pb
+        [299443, 299443], # HLT_Mu50_v9, 5.608/pb
+        [299450, 299450], # HLT_Mu50_v9, 12.395/pb
+        [299477, 299481], # HLT_Mu50_v9, 431.547/pb
+        [299593, 299595], # HLT_Mu50_v9, 268.091/pb
+        [299597, 299597], # HLT_Mu50_v9, 85.37/pb
+        [299649, 299649], # HLT_Mu50_v9, 56.768/pb
+        [300087, 300087], # HLT_Mu50_v10, 12.856/pb
+        [300105, 300107], # HLT_Mu50_v10, 34.169/pb
+        [300117, 300117], # HLT_Mu50_v10, 6.067/pb
+        [300122, 300123], # HLT_Mu50_v10, 394.771/pb
+        [300155, 300157], # HLT_Mu50_v10, 461.282/pb
+        [300226, 300226], # HLT_Mu50_v10, 115.963/pb
+        [300233, 300240], # HLT_Mu50_v10, 435.357/pb
+        [300280, 300284], # HLT_Mu50_v10, 311.422/pb
+        [300364, 300375], # HLT_Mu50_v10, 59.002/pb
+        [300389, 300401], # HLT_Mu50_v10, 339.844/pb
+        [300459, 300459], # HLT_Mu50_v10, 81.507/pb
+        [300461, 300464], # HLT_Mu50_v10, 132.112/pb
+        [300466, 300467], # HLT_Mu50_v10, 202.273/pb
+        [300497, 300497], # HLT_Mu50_v10, 40.035/pb
+        [300514, 300517], # HLT_Mu50_v10, 379.864/pb
+        [300558, 300558], # HLT_Mu50_v10, 119.182/pb
+        [300560, 300560], # HLT_Mu50_v10, 140.271/pb
+        [300574, 300576], # HLT_Mu50_v10, 315.299/pb
+        [300631, 300633], # HLT_Mu50_v10, 167.565/pb
+        [300635, 300636], # HLT_Mu50_v10, 312.071/pb
+        [300673, 300676], # HLT_Mu50_v10, 23.1/pb
+        [300742, 300742], # HLT_Mu50_v10, 83.984/pb
+        [300777, 300777], # HLT_Mu50_v10, 130.415/pb
+        [300780, 300780], # HLT_Mu50_v10, 79.072/pb
+        [300785, 300785], # HLT_Mu50_v10, 212.774/pb
+        [300806, 300806], # HLT_Mu50_v10, 54.218/pb
+        [300811, 300812], # HLT_Mu50_v10, 159.497/pb
+        [300816, 300817], # HLT_Mu50_v10, 134.15/pb
+        [301046, 301046], # HLT_Mu50_v10, 4.222/pb
+        [301141, 301142], # HLT_Mu50_v10, 97.203/pb
+        [301161, 301161], # HLT_Mu50_v10, 98.077/pb
+        [301165, 301165], # HLT_Mu50_v10, 15.465/pb
+        [301179, 301180], # HLT_Mu50_v10, 16.878/pb
+        [301183, 301183], # HLT_Mu50_v10, 45.299/pb
+        [301281, 301281], # HLT_Mu50_v10, 18.542/pb
+        [301283, 301283], # HLT_Mu50_v10, 120.005/pb
+        [301298, 301298], # HLT_Mu50_v10, 153.993/pb
+        [301323, 301323], # HLT_Mu50_v10, 165.06/pb
+        [301330, 301330], # HLT_Mu50_v10, 64.443/pb
+        [301359, 301359], # HLT_Mu50_v10, 57.278/pb
+        [301384, 301384], # HLT_Mu50_v10, 94.354/pb
+        [301391, 301393], # HLT_Mu50_v10, 147.405/pb
+        [301396, 301399], # HLT_Mu50_v10, 110.63/pb
+        [301417, 301417], # HLT_Mu50_v10, 67.689/pb
+        [301447, 301450], # HLT_Mu50_v10, 188.658/pb
+        [301461, 301461], # HLT_Mu50_v10, 98.122/pb
+        [301472, 301472], # HLT_Mu50_v10, 138.033/pb
+        [301475, 301476], # HLT_Mu50_v10, 109.336/pb
+        [301519, 301519], # HLT_Mu50_v10, 33.367/pb
+        [301524, 301524], # HLT_Mu50_v10, 41.078/pb
+        [301529, 301532], # HLT_Mu50_v10, 131.943/pb
+        [301567, 301567], # HLT_Mu50_v10, 63.339/pb
+        [301627, 301627], # HLT_Mu50_v10, 131.459/pb
+        [301664, 301665], # HLT_Mu50_v10, 138.42/pb
+        [301694, 301694], # HLT_Mu50_v10, 17.576/pb
+        [301912, 301914], # HLT_Mu50_v10, 79.784/pb
+        [301941, 301941], # HLT_Mu50_v10, 74.507/pb
+        [301959, 301960], # HLT_Mu50_v10, 290.104/pb
+        [301970, 301970], # HLT_Mu50_v10, 22.349/pb
+        [301984, 301987], # HLT_Mu50_v10, 292.622/pb
+        [301997, 301998], # HLT_Mu50_v10, 282.538/pb
+        [302019, 302019], # HLT_Mu50_v10, 9.113/pb
+        [302026, 302026], # HLT_Mu50_v11, 4.652/pb
+        [302029, 302029], # HLT_Mu50_v11, 15.282/pb
+        [302031, 302031], # HLT_Mu50_v11, 128.522/pb
+        [302033, 302034], # HLT_Mu50_v11, 5.657/pb
+        [302037, 302038], # HLT_Mu50_v11, 0.069/pb
+        [302040, 302043], # HLT_Mu50_v11, 104.438/pb
+        [302131, 302131], # HLT_Mu50_v11, 111.635/pb
+        [302159, 302159], # HLT_Mu50_v11, 16.077/pb
+        [302163, 302163], # HLT_Mu50_v11, 146.312/pb
+        [302165, 302166], # HLT_Mu50_v11, 8.409/pb
+        [302225, 302225], # HLT_Mu50_v11, 114.788/pb
+        [302228, 302229], # HLT_Mu50_v11, 105.812/pb
+        [302240, 302240], # HLT_Mu50_v11, 138.868/pb
+        [302262, 302263], # HLT_Mu50_v11, 241.353/pb
+        [302277, 302277], # HLT_Mu50_v11, 53.761/pb
+        [302279, 302280], # HLT_Mu50_v11, 18.474/pb
+        [302322, 302322], # HLT_Mu50_v11, 96.87/pb
+        [302328, 302328], # HLT_Mu50_v11, 93.45/pb
+        [302337, 302337], # HLT_Mu50_v11, 20.377/pb
+        [302342, 302344], # HLT_Mu50_v11, 91.05/pb
+        [302350, 302350], # HLT_Mu50_v11, 16.493/pb
+        [302388, 302388], # HLT_Mu50_v11, 126.264/pb
+        [302392, 302393], # HLT_Mu50_v11, 232.234/pb
+        [302448, 302448], # HLT_Mu50_v11, 307.867/pb
+        [302472, 302476], # HLT_Mu50_v11, 292.111/pb
+        [302479, 302479], # HLT_Mu50_v11, 68.381/pb
+        [302484, 302485], # HLT_Mu50_v11, 209.762/pb
+        [302492, 302494], # HLT_Mu50_v11, 93.282/pb
+        [302509, 302509], # HLT_Mu50_v11, 4.987/pb
+        [302513, 302513], # HLT_Mu50_v11, 12.203/pb
+        [302522, 302523], # HLT_Mu50_v11, 11.257/pb
+        [302525, 302526], # HLT_Mu50_v11, 223.119/pb
+        [302548, 302548], # HLT_Mu50_v11, 15.74/pb
+        [302551, 302551], # HLT_Mu50_v11, 0.104/pb
+        [302553, 302555], # HLT_Mu50_v11, 39.038/pb
+        [302563, 302563], # HLT_Mu50_v11, 0.32/pb
+        [302565, 302565], # HLT_Mu50_v11, 0.149/pb
+        [302572, 302573], # HLT_Mu50_v11, 241.684/pb
+        [302596, 302597], # HLT_Mu50_v11, 318.295/pb
+        [302634, 302635], # HLT_Mu50_v11, 300.859/pb
+        [302651, 302651], # HLT_Mu50_v11, 30.035/pb
+        [302654, 302654], # HLT_Mu50_v11, 63.967/pb
+        [302661, 302661], # HLT_Mu50_v11, 9.465/pb
+        [302663, 302663], # HLT_Mu50_v11, 134.254/pb
+        [303825, 303825], # HLT_Mu50_v11, 22.834/pb
+        [303832, 303832], # HLT_Mu50_v11, 321.326/pb
+        [303838, 303838], # HLT_Mu50_v11, 380.035/pb
+        [303885, 303885], # HLT_Mu50_v11, 400.159/pb
+        [303948, 303948], # HLT_Mu50_v11, 351.61/pb
+        [303998, 304000], # HLT_Mu50_v11, 256.409/pb
+        [304062, 304062], # HLT_Mu50_v11, 382.105/pb
+        [304119, 304120], # HLT_Mu50_v11, 93.285/pb
+        [304125, 304125], # HLT_Mu50_v11, 338.101/pb
+        [304144, 304144], # HLT_Mu50_v11, 533.881/pb
+        [304158, 304158], # HLT_Mu50_v11, 370.885/pb
+        [304169, 304170], # HLT_Mu50_v11, 414.145/pb
+        [304199, 304200], # HLT_Mu50_v11, 88.201/pb
+        [304204, 304204], # HLT_Mu50_v11, 153.182/pb
+        [304209, 304209], # HLT_Mu50_v11, 116.174/pb
+        [304291, 304292], # HLT_Mu50_v11, 350.613/pb
+        [304333, 304333], # HLT_Mu50_v11, 366.646/pb
+        [304354, 304354], # HLT_Mu50_v11, 68.255/pb
+        [304366, 304366], # HLT_Mu50_v11, 419.018/pb
+        [304446, 304447], # HLT_Mu50_v11, 385.306/pb
+        [304451, 304451], # HLT_Mu50_v11, 7.416/pb
+        [304505, 304508], # HLT_Mu50_v11, 425.864/pb
+        [304562, 304562], # HLT_Mu50_v11, 221.934/pb
+        [304616, 304616], # HLT_Mu50_v11, 253.369/pb
+        [304625, 304626], # HLT_Mu50_v11, 138.626/pb
+        [304654, 304655], # HLT_Mu50_v11, 403.545/pb
+        [304661, 304663], # HLT_Mu50_v11, 266.757/pb
+        [304671, 304672], # HLT_Mu50_v11, 320.532/pb
+        [304737, 304740], # HLT_Mu50_v11, 474.819/pb
+        [304776, 304778], # HLT_Mu50_v11, 432.15/pb
+        [304797, 304797], # HLT_Mu50_v11, 557.403/pb
+        [305044, 305046], # HLT_Mu50_v11, 378.033/pb
+        [305059, 305059], # HLT_Mu50_v11, 157.786/pb
+        [305062, 305064], # HLT_Mu50_v11, 390.89/pb
+        [305081, 305081], # HLT_Mu50_v11, 315.14/pb
+        [305112, 305114], # HLT_Mu50_v11, 497.055/pb
+        [305178, 305184], # HLT_Mu50_v11, 100.554/pb
+        [305186, 305186], # HLT_Mu50_v11, 122.05/pb
+        [305188, 305188], # HLT_Mu50_v11, 198.33/pb
+        [305202, 305202], # HLT_Mu50_v11, 207.76/pb
+        [305204, 305204], # HLT_Mu50_v11, 254.513/pb
+        [305207, 305208], # HLT_Mu50_v11, 401.157/pb
+        [305234, 305234], # HLT_Mu50_v11, 12.655/pb
+        [305236, 305237], # HLT_Mu50_v11, 344.353/pb
+        [305247, 305248], # HLT_Mu50_v11, 380.308/pb
+        [305252, 305252], # HLT_Mu50_v11, 95.04/pb
+        [305282, 305282], # HLT_Mu50_v11, 44.345/pb
+        [305310, 305314], # HLT_Mu50_v11, 481.671/pb
+        [305336, 305336], # HLT_Mu50_v11, 66.203/pb
+        [305338, 305338], # HLT_Mu50_v11, 33.112/pb
+        [305341, 305341], # HLT_Mu50_v11, 151.78/pb
+        [305349, 305351], # HLT_Mu50_v11, 186.042/pb
+        [305358, 305358], # HLT_Mu50_v11, 49.594/pb
+        [305364, 305366], # HLT_Mu50_v11, 511.673/pb
+        [305376, 305377], # HLT_Mu50_v11, 431.522/pb
+        [305405, 305406], # HLT_Mu50_v11, 475.515/pb
+        [305440, 305441], # HLT_Mu50_v11, 119.869/pb
+        [305516, 305518], # HLT_Mu50_v11, 438.593/pb
+        [305586, 305586], # HLT_Mu50_v11, 171.033/pb
+        [305589, 305590], # HLT_Mu50_v11, 314.815/pb
+        [305636, 305636], # HLT_Mu50_v11, 525.22/pb
+        [305766, 305766], # HLT_Mu50_v11, 263.689/pb
+        [305809, 305809], # HLT_Mu50_v11, 45.952/pb
+        [305814, 305814], # HLT_Mu50_v11, 446.804/pb
+        [305821, 305821], # HLT_Mu50_v11, 240.463/pb
+        [305832, 305832], # HLT_Mu50_v11, 58.021/pb
+        [305840, 305840], # HLT_Mu50_v11, 251.347/pb
+        [305842, 305842], # HLT_Mu50_v11, 114.87/pb
+        [305862, 305862], # HLT_Mu50_v11, 202.189/pb
+        [305898, 305898], # HLT_Mu50_v11, 230.935/pb
+        [305902, 305902], # HLT_Mu50_v11, 154.345/pb
+        [305967, 305967], # HLT_Mu50_v11, 10.508/pb
+        [306029, 306030], # HLT_Mu50_v11, 44.125/pb
+        [306036, 306038], # HLT_Mu50_v11, 56.442/pb
+        [306041, 306042], # HLT_Mu50_v11, 200.189/pb
+        [306048, 306049], # HLT_Mu50_v11, 107.334/pb
+        [306051, 306051], # HLT_Mu50_v11, 70.67/pb
+        [306091, 306092], # HLT_Mu50_v11, 280.74/pb
+        [306095, 306095], # HLT_Mu50_v11, 49.131/pb
+        [306121, 306122], # HLT_Mu50_v11, 69.307/pb
+        [306125, 306126], # HLT_Mu50_v11, 590.489/pb
+        [306134, 306135], # HLT_Mu50_v11, 336.473/pb
+        [306138, 306139], # HLT_Mu50_v11, 312.896/pb
+        [306153, 306155], # HLT_Mu50_v11, 580.683/pb
+        [306169, 306171], # HLT_Mu50_v11, 103.163/pb
+        [306418, 306420], # HLT_Mu50_v12, 73.423/pb
+        [306422, 306423], # HLT_Mu50_v12, 120.463/pb
+        [306432, 306432], # HLT_Mu50_v12, 33.338/pb
+        [306454, 306460], # HLT_Mu50_v12, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu55', # missing in run B
+      'unprescaled' : False, # likely
+      'runs'        : [
+        [302026, 302026], # HLT_Mu55_v1, 4.652/pb
+        [302029, 302029], # HLT_Mu55_v1, 15.282/pb
+        [302031, 302031], # HLT_Mu55_v1, 128.522/pb
+        [302033, 302034], # HLT_Mu55_v1, 5.657/pb
+        [302037, 302038], # HLT_Mu55_v1, 0.069/pb
+        [302040, 302043], # HLT_Mu55_v1, 104.438/pb
+        [302131, 302131], # HLT_Mu55_v1, 111.635/pb
+        [302159, 302159], # HLT_Mu55_v1, 16.077/pb
+        [302163, 302163], # HLT_Mu55_v1, 146.312/pb
+        [302165, 302166], # HLT_Mu55_v1, 8.409/pb
+        [302225, 302225], # HLT_Mu55_v1, 114.788/pb
+        [302228, 302229], # HLT_Mu55_v1, 105.812/pb
+        [302240, 302240], # HLT_Mu55_v1, 138.868/pb
+        [302262, 302263], # HLT_Mu55_v1, 241.353/pb
+        [302277, 302277], # HLT_Mu55_v1, 53.761/pb
+        [302279, 302280], # HLT_Mu55_v1, 18.474/pb
+        [302322, 302322], # HLT_Mu55_v1, 96.87/pb
+        [302328, 302328], # HLT_Mu55_v1, 93.45/pb
+        [302337, 302337], # HLT_Mu55_v1, 20.377/pb
+        [302342, 302344], # HLT_Mu55_v1, 91.05/pb
+        [302350, 302350], # HLT_Mu55_v1, 16.493/pb
+        [302388, 302388], # HLT_Mu55_v1, 126.264/pb
+        [302392, 302393], # HLT_Mu55_v1, 232.234/pb
+        [302448, 302448], # HLT_Mu55_v1, 307.867/pb
+        [302472, 302476], # HLT_Mu55_v1, 292.111/pb
+        [302479, 302479], # HLT_Mu55_v1, 68.381/pb
+        [302484, 302485], # HLT_Mu55_v1, 209.762/pb
+        [302492, 302494], # HLT_Mu55_v1, 93.282/pb
+        [302509, 302509], # HLT_Mu55_v1, 4.987/pb
+        [302513, 302513], # HLT_Mu55_v1, 12.203/pb
+        [302522, 302523], # HLT_Mu55_v1, 11.257/pb
+        [302525, 302526], # HLT_Mu55_v1, 223.119/pb
+        [302548, 302548], # HLT_Mu55_v1, 15.74/pb
+        [302551, 302551], # HLT_Mu55_v1, 0.104/pb
+        [302553, 302555], # HLT_Mu55_v1, 39.038/pb
+        [302563, 302563], # HLT_Mu55_v1, 0.32/pb
+        [302565, 302565], # HLT_Mu55_v1, 0.149/pb
+        [302572, 302573], # HLT_Mu55_v1, 241.684/pb
+        [302596, 302597], # HLT_Mu55_v1, 318.295/pb
+        [302634, 302635], # HLT_Mu55_v1, 300.859/pb
+        [302651, 302651], # HLT_Mu55_v1, 30.035/pb
+        [302654, 302654], # HLT_Mu55_v1, 63.967/pb
+        [302661, 302661], # HLT_Mu55_v1, 9.465/pb
+        [302663, 302663], # HLT_Mu55_v1, 134.254/pb
+        [303825, 303825], # HLT_Mu55_v1, 22.834/pb
+        [303832, 303832], # HLT_Mu55_v1, 321.326/pb
+        [303838, 303838], # HLT_Mu55_v1, 380.035/pb
+        [303885, 303885], # HLT_Mu55_v1, 400.159/pb
+        [303948, 303948], # HLT_Mu55_v1, 351.61/pb
+        [303998, 304000], # HLT_Mu55_v1, 256.409/pb
+        [304062, 304062], # HLT_Mu55_v1, 382.105/pb
+        [304119, 304120], # HLT_Mu55_v1, 93.285/pb
+        [304125, 304125], # HLT_Mu55_v1, 338.101/pb
+        [304144, 304144], # HLT_Mu55_v1, 533.881/pb
+        [304158, 304158], # HLT_Mu55_v1, 370.885/pb
+        [304169, 304170], # HLT_Mu55_v1, 414.145/pb
+        [304199, 304200], # HLT_Mu55_v1, 88.201/pb
+        [304204, 304204], # HLT_Mu55_v1, 153.182/pb
+        [304209, 304209], # HLT_Mu55_v1, 116.174/pb
+        [304291, 304292], # HLT_Mu55_v1, 350.613/pb
+        [304333, 304333], # HLT_Mu55_v1, 366.646/pb
+        [304354, 304354], # HLT_Mu55_v1, 68.255/pb
+        [304366, 304366], # HLT_Mu55_v1, 419.018/pb
+        [304446, 304447], # HLT_Mu55_v1, 385.306/pb
+        [304451, 304451], # HLT_Mu55_v1, 7.416/pb
+        [304505, 304508], # HLT_Mu55_v1, 425.864/pb
+        [304562, 304562], # HLT_Mu55_v1, 221.934/pb
+        [304616, 304616], # HLT_Mu55_v1, 253.369/pb
+        [304625, 304626], # HLT_Mu55_v1, 138.626/pb
+        [304654, 304655], # HLT_Mu55_v1, 403.545/pb
+        [304661, 304663], # HLT_Mu55_v1, 266.757/pb
+        [304671, 304672], # HLT_Mu55_v1, 320.532/pb
+        [304737, 304740], # HLT_Mu55_v1, 474.819/pb
+        [304776, 304778], # HLT_Mu55_v1, 432.15/pb
+        [304797, 304797], # HLT_Mu55_v1, 557.403/pb
+        [305044, 305046], # HLT_Mu55_v1, 378.033/pb
+        [305059, 305059], # HLT_Mu55_v1, 157.786/pb
+        [305062, 305064], # HLT_Mu55_v1, 390.89/pb
+        [305081, 305081], # HLT_Mu55_v1, 315.14/pb
+        [305112, 305114], # HLT_Mu55_v1, 497.055/pb
+        [305178, 305184], # HLT_Mu55_v1, 100.554/pb
+        [305186, 305186], # HLT_Mu55_v1, 122.05/pb
+        [305188, 305188], # HLT_Mu55_v1, 198.33/pb
+        [305202, 305202], # HLT_Mu55_v1, 207.76/pb
+        [305204, 305204], # HLT_Mu55_v1, 254.513/pb
+        [305207, 305208], # HLT_Mu55_v1, 401.157/pb
+        [305234, 305234], # HLT_Mu55_v1, 12.655/pb
+        [305236, 305237], # HLT_Mu55_v1, 344.353/pb
+        [305247, 305248], # HLT_Mu55_v1, 380.308/pb
+        [305252, 305252], # HLT_Mu55_v1, 95.04/pb
+        [305282, 305282], # HLT_Mu55_v1, 44.345/pb
+        [305310, 305314], # HLT_Mu55_v1, 481.671/pb
+        [305336, 305336], # HLT_Mu55_v1, 66.203/pb
+        [305338, 305338], # HLT_Mu55_v1, 33.112/pb
+        [305341, 305341], # HLT_Mu55_v1, 151.78/pb
+        [305349, 305351], # HLT_Mu55_v1, 186.042/pb
+        [305358, 305358], # HLT_Mu55_v1, 49.594/pb
+        [305364, 305366], # HLT_Mu55_v1, 511.673/pb
+        [305376, 305377], # HLT_Mu55_v1, 431.522/pb
+        [305405, 305406], # HLT_Mu55_v1, 475.515/pb
+        [305440, 305441], # HLT_Mu55_v1, 119.869/pb
+        [305516, 305518], # HLT_Mu55_v1, 438.593/pb
+        [305586, 305586], # HLT_Mu55_v1, 171.033/pb
+        [305589, 305590], # HLT_Mu55_v1, 314.815/pb
+        [305636, 305636], # HLT_Mu55_v1, 525.22/pb
+        [305766, 305766], # HLT_Mu55_v1, 263.689/pb
+        [305809, 305809], # HLT_Mu55_v1, 45.952/pb
+        [305814, 305814], # HLT_Mu55_v1, 446.804/pb
+        [305821, 305821], # HLT_Mu55_v1, 240.463/pb
+        [305832, 305832], # HLT_Mu55_v1, 58.021/pb
+        [305840, 305840], # HLT_Mu55_v1, 251.347/pb
+        [305842, 305842], # HLT_Mu55_v1, 114.87/pb
+        [305862, 305862], # HLT_Mu55_v1, 202.189/pb
+        [305898, 305898], # HLT_Mu55_v1, 230.935/pb
+        [305902, 305902], # HLT_Mu55_v1, 154.345/pb
+        [305967, 305967], # HLT_Mu55_v1, 10.508/pb
+        [306029, 306030], # HLT_Mu55_v1, 44.125/pb
+        [306036, 306038], # HLT_Mu55_v1, 56.442/pb
+        [306041, 306042], # HLT_Mu55_v1, 200.189/pb
+        [306048, 306049], # HLT_Mu55_v1, 107.334/pb
+        [306051, 306051], # HLT_Mu55_v1, 70.67/pb
+        [306091, 306092], # HLT_Mu55_v1, 280.74/pb
+        [306095, 306095], # HLT_Mu55_v1, 49.131/pb
+        [306121, 306122], # HLT_Mu55_v1, 69.307/pb
+        [306125, 306126], # HLT_Mu55_v1, 590.489/pb
+        [306134, 306135], # HLT_Mu55_v1, 336.473/pb
+        [306138, 306139], # HLT_Mu55_v1, 312.896/pb
+        [306153, 306155], # HLT_Mu55_v1, 580.683/pb
+        [306169, 306171], # HLT_Mu55_v1, 103.163/pb
+        [306418, 306420], # HLT_Mu55_v2, 73.423/pb
+        [306422, 306423], # HLT_Mu55_v2, 120.463/pb
+        [306432, 306432], # HLT_Mu55_v2, 33.338/pb
+        [306454, 306460], # HLT_Mu55_v2, 635.031/pb
+      ],
+    },
+  ],
+  '1e' : [
+    {
+      'name'        : 'HLT_Ele35_WPTight_Gsf',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Ele35_WPTight_Gsf_v1, 94.725/pb
+        [297056, 297057], # HLT_Ele35_WPTight_Gsf_v1, 143.741/pb
+        [297099, 297101], # HLT_Ele35_WPTight_Gsf_v2, 241.495/pb
+        [297113, 297114], # HLT_Ele35_WPTight_Gsf_v2, 85.001/pb
+        [297175, 297178], # HLT_Ele35_WPTight_Gsf_v2, 280.582/pb
+        [297215, 297215], # HLT_Ele35_WPTight_Gsf_v2, 12.287/pb
+        [297218, 297219], # HLT_Ele35_WPTight_Gsf_v2, 425.447/pb
+        [297224, 297225], # HLT_Ele35_WPTight_Gsf_v2, 13.81/pb
+        [297227, 297227], # HLT_Ele35_WPTight_Gsf_v2, 15.669/pb
+        [297292, 297293], # HLT_Ele35_WPTight_Gsf_v2, 198.677/pb
+        [297296, 297296], # HLT_Ele35_WPTight_Gsf_v2, 84.207/pb
+        [297308, 297308], # HLT_Ele35_WPTight_Gsf_v2, 6.298/pb
+        [297359, 297359], # HLT_Ele35_WPTight_Gsf_v2, 13.795/pb
+        [297411, 297411], # HLT_Ele35_WPTight_Gsf_v2, 201.578/pb
+        [297424, 297426], # HLT_Ele35_WPTight_Gsf_v2, 97.376/pb
+        [297429, 297435], # HLT_Ele35_WPTight_Gsf_v2, 199.191/pb
+        [297467, 297469], # HLT_Ele35_WPTight_Gsf_v2, 69.859/pb
+        [297483, 297488], # HLT_Ele35_WPTight_Gsf_v2, 471.448/pb
+        [297503, 297505], # HLT_Ele35_WPTight_Gsf_v2, 268.446/pb
+        [297557, 297558], # HLT_Ele35_WPTight_Gsf_v3, 158.712/pb
+        [297562, 297563], # HLT_Ele35_WPTight_Gsf_v3, 106.785/pb
+        [297598, 297599], # HLT_Ele35_WPTight_Gsf_v3, 93.85/pb
+        [297603, 297606], # HLT_Ele35_WPTight_Gsf_v3, 276.775/pb
+        [297620, 297620], # HLT_Ele35_WPTight_Gsf_v3, 82.127/pb
+        [297656, 297656], # HLT_Ele35_WPTight_Gsf_v3, 93.083/pb
+        [297665, 297666], # HLT_Ele35_WPTight_Gsf_v3, 78.347/pb
+        [297670, 297670], # HLT_Ele35_WPTight_Gsf_v3, 2.132/pb
+        [297674, 297675], # HLT_Ele35_WPTight_Gsf_v3, 170.78/pb
+        [297722, 297723], # HLT_Ele35_WPTight_Gsf_v3, 142.686/pb
+        [298996, 298997], # HLT_Ele35_WPTight_Gsf_v3, 26.765/pb
+        [299000, 299000], # HLT_Ele35_WPTight_Gsf_v3, 8.038/pb
+        [299042, 299042], # HLT_Ele35_WPTight_Gsf_v3, 2.02/pb
+        [299061, 299062], # HLT_Ele35_WPTight_Gsf_v3, 123.32/pb
+        [299064, 299065], # HLT_Ele35_WPTight_Gsf_v3, 73.04/pb
+        [299067, 299067], # HLT_Ele35_WPTight_Gsf_v3, 68.807/pb
+        [299096, 299096], # HLT_Ele35_WPTight_Gsf_v3, 24.067/pb
+        [299149, 299149], # HLT_Ele35_WPTight_Gsf_v3, 108.249/pb
+        [299178, 299178], # HLT_Ele35_WPTight_Gsf_v3, 15.791/pb
+        [299180, 299180], # HLT_Ele35_WPTight_Gsf_v3, 15.575/pb
+        [299184, 299185], # HLT_Ele35_WPTight_Gsf_v3, 146.717/pb
+        [299327, 299327], # HLT_Ele35_WPTight_Gsf_v3, 15.178/pb
+        [299329, 299329], # HLT_Ele35_WPTight_Gsf_v3, 37.487/pb
+        [299368, 299370], # HLT_Ele35_WPTight_Gsf_v4, 253.498/pb
+        [299380, 299381], # HLT_Ele35_WPTight_Gsf_v4, 66.094/pb
+        [299394, 299396], # HLT_Ele35_WPTight_Gsf_v4, 61.673/pb
+        [299420, 299420], # HLT_Ele35_WPTight_Gsf_v4, 13.23/pb
+        [299443, 299443], # HLT_Ele35_WPTight_Gsf_v4, 5.608/pb
+        [299450, 299450], # HLT_Ele35_WPTight_Gsf_v4, 12.395/pb
+        [299477, 299481], # HLT_Ele35_WPTight_Gsf_v4, 431.547/pb
+        [299593, 299595], # HLT_Ele35_WPTight_Gsf_v4, 268.091/pb
+        [299597, 299597], # HLT_Ele35_WPTight_Gsf_v4, 85.37/pb
+        [299649, 299649], # HLT_Ele35_WPTight_Gsf_v4, 56.768/pb
+        [300087, 300087], # HLT_Ele35_WPTight_Gsf_v5, 12.856/pb
+        [300105, 300107], # HLT_Ele35_WPTight_Gsf_v5, 34.169/pb
+        [300117, 300117], # HLT_Ele35_WPTight_Gsf_v5, 6.067/pb
+        [300122, 300123], # HLT_Ele35_WPTight_Gsf_v5, 394.771/pb
+        [300155, 300157], # HLT_Ele35_WPTight_Gsf_v5, 461.282/pb
+        [300226, 300226], # HLT_Ele35_WPTight_Gsf_v5, 115.963/pb
+        [300233, 300240], # HLT_Ele35_WPTight_Gsf_v5, 435.357/pb
+        [300280, 300284], # HLT_Ele35_WPTight_Gsf_v5, 311.422/pb
+        [300364, 300375], # HLT_Ele35_WPTight_Gsf_v5, 59.002/pb
+        [300389, 300401], # HLT_Ele35_WPTight_Gsf_v5, 339.844/pb
+        [300459, 300459], # HLT_Ele35_WPTight_Gsf_v5, 81.507/pb
+        [300461, 300464], # HLT_Ele35_WPTight_Gsf_v5, 132.112/pb
+        [300466, 300467], # HLT_Ele35_WPTight_Gsf_v5, 202.273/pb
+        [300497, 300497], # HLT_Ele35_WPTight_Gsf_v5, 40.035/pb
+        [300514, 300517], # HLT_Ele35_WPTight_Gsf_v5, 379.864/pb
+        [300558, 300558], # HLT_Ele35_WPTight_Gsf_v5, 119.182/pb
+        [300560, 300560], # HLT_Ele35_WPTight_Gsf_v5, 140.271/pb
+        [300574, 300576], # HLT_Ele35_WPTight_Gsf_v5, 315.299/pb
+        [300631, 300633], # HLT_Ele35_WPTight_Gsf_v5, 167.565/pb
+        [300635, 300636], # HLT_Ele35_WPTight_Gsf_v5, 312.071/pb
+        [300673, 300676], # HLT_Ele35_WPTight_Gsf_v5, 23.1/pb
+        [300742, 300742], # HLT_Ele35_WPTight_Gsf_v5, 83.984/pb
+        [300777, 300777], # HLT_Ele35_WPTight_Gsf_v5, 130.415/pb
+        [300780, 300780], # HLT_Ele35_WPTight_Gsf_v5, 79.072/pb
+        [300785, 300785], # HLT_Ele35_WPTight_Gsf_v5, 212.774/pb
+        [300806, 300806], # HLT_Ele35_WPTight_Gsf_v5, 54.218/pb
+        [300811, 300812], # HLT_Ele35_WPTight_Gsf_v5, 159.497/pb
+        [300816, 300817], # HLT_Ele35_WPTight_Gsf_v5, 134.15/pb
+        [301046, 301046], # HLT_Ele35_WPTight_Gsf_v6, 4.222/pb
+        [301141, 301142], # HLT_Ele35_WPTight_Gsf_v6, 97.203/pb
+        [301161, 301161], # HLT_Ele35_WPTight_Gsf_v6, 98.077/pb
+        [301165, 301165], # HLT_Ele35_WPTight_Gsf_v6, 15.465/pb
+        [301179, 301180], # HLT_Ele35_WPTight_Gsf_v6, 16.878/pb
+        [301183, 301183], # HLT_Ele35_WPTight_Gsf_v6, 45.299/pb
+        [301281, 301281], # HLT_Ele35_WPTight_Gsf_v6, 18.542/pb
+        [301283, 301283], # HLT_Ele35_WPTight_Gsf_v6, 120.005/pb
+        [301298, 301298], # HLT_Ele35_WPTight_Gsf_v6, 153.993/pb
+        [301323, 301323], # HLT_Ele35_WPTight_Gsf_v6, 165.06/pb
+        [301330, 301330], # HLT_Ele35_WPTight_Gsf_v6, 64.443/pb
+        [301359, 301359], # HLT_Ele35_WPTight_Gsf_v6, 57.278/pb
+        [301384, 301384], # HLT_Ele35_WPTight_Gsf_v6, 94.354/pb
+        [301391, 301393], # HLT_Ele35_WPTight_Gsf_v6, 147.405/pb
+        [301396, 301399], # HLT_Ele35_WPTight_Gsf_v6, 110.63/pb
+        [301417, 301417], # HLT_Ele35_WPTight_Gsf_v6, 67.689/pb
+        [301447, 301450], # HLT_Ele35_WPTight_Gsf_v6, 188.658/pb
+        [301461, 301461], # HLT_Ele35_WPTight_Gsf_v6, 98.122/pb
+        [301472, 301472], # HLT_Ele35_WPTight_Gsf_v6, 138.033/pb
+        [301475, 301476], # HLT_Ele35_WPTight_Gsf_v6, 109.336/pb
+        [301519, 301519], # HLT_Ele35_WPTight_Gsf_v6, 33.367/pb
+        [301524, 301524], # HLT_Ele35_WPTight_Gsf_v6, 41.078/pb
+        [301529, 301532], # HLT_Ele35_WPTight_Gsf_v6, 131.943/pb
+        [301567, 301567], # HLT_Ele35_WPTight_Gsf_v6, 63.339/pb
+        [301627, 301627], # HLT_Ele35_WPTight_Gsf_v6, 131.459/pb
+        [301664, 301665], # HLT_Ele35_WPTight_Gsf_v6, 138.42/pb
+        [301694, 301694], # HLT_Ele35_WPTight_Gsf_v6, 17.576/pb
+        [301912, 301914], # HLT_Ele35_WPTight_Gsf_v6, 79.784/pb
+        [301941, 301941], # HLT_Ele35_WPTight_Gsf_v6, 74.507/pb
+        [301959, 301960], # HLT_Ele35_WPTight_Gsf_v6, 290.104/pb
+        [301970, 301970], # HLT_Ele35_WPTight_Gsf_v6, 22.349/pb
+        [301984, 301987], # HLT_Ele35_WPTight_Gsf_v6, 292.622/pb
+        [301997, 301998], # HLT_Ele35_WPTight_Gsf_v6, 282.538/pb
+        [302019, 302019], # HLT_Ele35_WPTight_Gsf_v6, 9.113/pb
+        [302026, 302026], # HLT_Ele35_WPTight_Gsf_v7, 4.652/pb
+        [302029, 302029], # HLT_Ele35_WPTight_Gsf_v7, 15.282/pb
+        [302031, 302031], # HLT_Ele35_WPTight_Gsf_v7, 128.522/pb
+        [302033, 302034], # HLT_Ele35_WPTight_Gsf_v7, 5.657/pb
+        [302037, 302038], # HLT_Ele35_WPTight_Gsf_v7, 0.069/pb
+        [302040, 302043], # HLT_Ele35_WPTight_Gsf_v7, 104.438/pb
+        [302131, 302131], # HLT_Ele35_WPTight_Gsf_v7, 111.635/pb
+        [302159, 302159], # HLT_Ele35_WPTight_Gsf_v7, 16.077/pb
+        [302163, 302163], # HLT_Ele35_WPTight_Gsf_v7, 146.312/pb
+        [302165, 302166], # HLT_Ele35_WPTight_Gsf_v7, 8.409/pb
+        [302225, 302225], # HLT_Ele35_WPTight_Gsf_v7, 114.788/pb
+        [302228, 302229], # HLT_Ele35_WPTight_Gsf_v7, 105.812/pb
+        [302240, 302240], # HLT_Ele35_WPTight_Gsf_v7, 138.868/pb
+        [302262, 302263], # HLT_Ele35_WPTight_Gsf_v7, 241.353/pb
+        [302277, 302277], # HLT_Ele35_WPTight_Gsf_v7, 53.761/pb
+        [302279, 302280], # HLT_Ele35_WPTight_Gsf_v7, 18.474/pb
+        [302322, 302322], # HLT_Ele35_WPTight_Gsf_v7, 96.87/pb
+        [302328, 302328], # HLT_Ele35_WPTight_Gsf_v7, 93.45/pb
+        [302337, 302337], # HLT_Ele35_WPTight_Gsf_v7, 20.377/pb
+        [302342, 302344], # HLT_Ele35_WPTight_Gsf_v7, 91.05/pb
+        [302350, 302350], # HLT_Ele35_WPTight_Gsf_v7, 16.493/pb
+        [302388, 302388], # HLT_Ele35_WPTight_Gsf_v7, 126.264/pb
+        [302392, 302393], # HLT_Ele35_WPTight_Gsf_v7, 232.234/pb
+        [302448, 302448], # HLT_Ele35_WPTight_Gsf_v7, 307.867/pb
+        [302472, 302476], # HLT_Ele35_WPTight_Gsf_v7, 292.111/pb
+        [302479, 302479], # HLT_Ele35_WPTight_Gsf_v7, 68.381/pb
+        [302484, 302485], # HLT_Ele35_WPTight_Gsf_v7, 209.762/pb
+        [302492, 302494], # HLT_Ele35_WPTight_Gsf_v7, 93.282/pb
+        [302509, 302509], # HLT_Ele35_WPTight_Gsf_v7, 4.987/pb
+        [302513, 302513], # HLT_Ele35_WPTight_Gsf_v7, 12.203/pb
+        [302522, 302523], # HLT_Ele35_WPTight_Gsf_v7, 11.257/pb
+        [302525, 302526], # HLT_Ele35_WPTight_Gsf_v7, 223.119/pb
+        [302548, 302548], # HLT_Ele35_WPTight_Gsf_v7, 15.74/pb
+        [302551, 302551], # HLT_Ele35_WPTight_Gsf_v7, 0.104/pb
+        [302553, 302555], # HLT_Ele35_WPTight_Gsf_v7, 39.038/pb
+        [302563, 302563], # HLT_Ele35_WPTight_Gsf_v7, 0.32/pb
+        [302565, 302565], # HLT_Ele35_WPTight_Gsf_v7, 0.149/pb
+        [302572, 302573], # HLT_Ele35_WPTight_Gsf_v7, 241.684/pb
+        [302596, 302597], # HLT_Ele35_WPTight_Gsf_v7, 318.295/pb
+        [302634, 302635], # HLT_Ele35_WPTight_Gsf_v7, 300.859/pb
+        [302651, 302651], # HLT_Ele35_WPTight_Gsf_v7, 30.035/pb
+        [302654, 302654], # HLT_Ele35_WPTight_Gsf_v7, 63.967/pb
+        [302661, 302661], # HLT_Ele35_WPTight_Gsf_v7, 9.465/pb
+        [302663, 302663], # HLT_Ele35_WPTight_Gsf_v7, 134.254/pb
+        [303825, 303825], # HLT_Ele35_WPTight_Gsf_v7, 22.834/pb
+        [303832, 303832], # HLT_Ele35_WPTight_Gsf_v7, 321.326/pb
+        [303838, 303838], # HLT_Ele35_WPTight_Gsf_v7, 380.035/pb
+        [303885, 303885], # HLT_Ele35_WPTight_Gsf_v7, 400.159/pb
+        [303948, 303948], # HLT_Ele35_WPTight_Gsf_v7, 351.61/pb
+        [303998, 304000], # HLT_Ele35_WPTight_Gsf_v7, 256.409/pb
+        [304062, 304062], # HLT_Ele35_WPTight_Gsf_v7, 382.105/pb
+        [304119, 304120], # HLT_Ele35_WPTight_Gsf_v7, 93.285/pb
+        [304125, 304125], # HLT_Ele35_WPTight_Gsf_v7, 338.101/pb
+        [304144, 304144], # HLT_Ele35_WPTight_Gsf_v7, 533.881/pb
+        [304158, 304158], # HLT_Ele35_WPTight_Gsf_v7, 370.885/pb
+        [304169, 304170], # HLT_Ele35_WPTight_Gsf_v7, 414.145/pb
+        [304199, 304200], # HLT_Ele35_WPTight_Gsf_v7, 88.201/pb
+        [304204, 304204], # HLT_Ele35_WPTight_Gsf_v7, 153.182/pb
+        [304209, 304209], # HLT_Ele35_WPTight_Gsf_v7, 116.174/pb
+        [304291, 304292], # HLT_Ele35_WPTight_Gsf_v7, 350.613/pb
+        [304333, 304333], # HLT_Ele35_WPTight_Gsf_v7, 366.646/pb
+        [304354, 304354], # HLT_Ele35_WPTight_Gsf_v7, 68.255/pb
+        [304366, 304366], # HLT_Ele35_WPTight_Gsf_v7, 419.018/pb
+        [304446, 304447], # HLT_Ele35_WPTight_Gsf_v7, 385.306/pb
+        [304451, 304451], # HLT_Ele35_WPTight_Gsf_v7, 7.416/pb
+        [304505, 304508], # HLT_Ele35_WPTight_Gsf_v7, 425.864/pb
+        [304562, 304562], # HLT_Ele35_WPTight_Gsf_v7, 221.934/pb
+        [304616, 304616], # HLT_Ele35_WPTight_Gsf_v7, 253.369/pb
+        [304625, 304626], # HLT_Ele35_WPTight_Gsf_v7, 138.626/pb
+        [304654, 304655], # HLT_Ele35_WPTight_Gsf_v7, 403.545/pb
+        [304661, 304663], # HLT_Ele35_WPTight_Gsf_v7, 266.757/pb
+        [304671, 304672], # HLT_Ele35_WPTight_Gsf_v7, 320.532/pb
+        [304737, 304740], # HLT_Ele35_WPTight_Gsf_v7, 474.819/pb
+        [304776, 304778], # HLT_Ele35_WPTight_Gsf_v7, 432.15/pb
+        [304797, 304797], # HLT_Ele35_WPTight_Gsf_v7, 557.403/pb
+        [305044, 305046], # HLT_Ele35_WPTight_Gsf_v7, 378.033/pb
+        [305059, 305059], # HLT_Ele35_WPTight_Gsf_v7, 157.786/pb
+        [305062, 305064], # HLT_Ele35_WPTight_Gsf_v7, 390.89/pb
+        [305081, 305081], # HLT_Ele35_WPTight_Gsf_v7, 315.14/pb
+        [305112, 305114], # HLT_Ele35_WPTight_Gsf_v7, 497.055/pb
+        [305178, 305184], # HLT_Ele35_WPTight_Gsf_v7, 100.554/pb
+        [305186, 305186], # HLT_Ele35_WPTight_Gsf_v7, 122.05/pb
+        [305188, 305188], # HLT_Ele35_WPTight_Gsf_v7, 198.33/pb
+        [305202, 305202], # HLT_Ele35_WPTight_Gsf_v7, 207.76/pb
+        [305204, 305204], # HLT_Ele35_WPTight_Gsf_v7, 254.513/pb
+        [305207, 305208], # HLT_Ele35_WPTight_Gsf_v7, 401.157/pb
+        [305234, 305234], # HLT_Ele35_WPTight_Gsf_v7, 12.655/pb
+        [305236, 305237], # HLT_Ele35_WPTight_Gsf_v7, 344.353/pb
+        [305247, 305248], # HLT_Ele35_WPTight_Gsf_v7, 380.308/pb
+        [305252, 305252], # HLT_Ele35_WPTight_Gsf_v7, 95.04/pb
+        [305282, 305282], # HLT_Ele35_WPTight_Gsf_v7, 44.345/pb
+        [305310, 305314], # HLT_Ele35_WPTight_Gsf_v7, 481.671/pb
+        [305336, 305336], # HLT_Ele35_WPTight_Gsf_v7, 66.203/pb
+        [305338, 305338], # HLT_Ele35_WPTight_Gsf_v7, 33.112/pb
+        [305341, 305341], # HLT_Ele35_WPTight_Gsf_v7, 151.78/pb
+        [305349, 305351], # HLT_Ele35_WPTight_Gsf_v7, 186.042/pb
+        [305358, 305358], # HLT_Ele35_WPTight_Gsf_v7, 49.594/pb
+        [305364, 305366], # HLT_Ele35_WPTight_Gsf_v7, 511.673/pb
+        [305376, 305377], # HLT_Ele35_WPTight_Gsf_v7, 431.522/pb
+        [305405, 305406], # HLT_Ele35_WPTight_Gsf_v7, 475.515/pb
+        [305440, 305441], # HLT_Ele35_WPTight_Gsf_v7, 119.869/pb
+        [305516, 305518], # HLT_Ele35_WPTight_Gsf_v7, 438.593/pb
+        [305586, 305586], # HLT_Ele35_WPTight_Gsf_v7, 171.033/pb
+        [305589, 305590], # HLT_Ele35_WPTight_Gsf_v7, 314.815/pb
+        [305636, 305636], # HLT_Ele35_WPTight_Gsf_v7, 525.22/pb
+        [305766, 305766], # HLT_Ele35_WPTight_Gsf_v7, 263.689/pb
+        [305809, 305809], # HLT_Ele35_WPTight_Gsf_v7, 45.952/pb
+        [305814, 305814], # HLT_Ele35_WPTight_Gsf_v7, 446.804/pb
+        [305821, 305821], # HLT_Ele35_WPTight_Gsf_v7, 240.463/pb
+        [305832, 305832], # HLT_Ele35_WPTight_Gsf_v7, 58.021/pb
+        [305840, 305840], # HLT_Ele35_WPTight_Gsf_v7, 251.347/pb
+        [305842, 305842], # HLT_Ele35_WPTight_Gsf_v7, 114.87/pb
+        [305862, 305862], # HLT_Ele35_WPTight_Gsf_v7, 202.189/pb
+        [305898, 305898], # HLT_Ele35_WPTight_Gsf_v7, 230.935/pb
+        [305902, 305902], # HLT_Ele35_WPTight_Gsf_v7, 154.345/pb
+        [305967, 305967], # HLT_Ele35_WPTight_Gsf_v7, 10.508/pb
+        [306029, 306030], # HLT_Ele35_WPTight_Gsf_v7, 44.125/pb
+        [306036, 306038], # HLT_Ele35_WPTight_Gsf_v7, 56.442/pb
+        [306041, 306042], # HLT_Ele35_WPTight_Gsf_v7, 200.189/pb
+        [306048, 306049], # HLT_Ele35_WPTight_Gsf_v7, 107.334/pb
+        [306051, 306051], # HLT_Ele35_WPTight_Gsf_v7, 70.67/pb
+        [306091, 306092], # HLT_Ele35_WPTight_Gsf_v7, 280.74/pb
+        [306095, 306095], # HLT_Ele35_WPTight_Gsf_v7, 49.131/pb
+        [306121, 306122], # HLT_Ele35_WPTight_Gsf_v7, 69.307/pb
+        [306125, 306126], # HLT_Ele35_WPTight_Gsf_v7, 590.489/pb
+        [306134, 306135], # HLT_Ele35_WPTight_Gsf_v7, 336.473/pb
+        [306138, 306139], # HLT_Ele35_WPTight_Gsf_v7, 312.896/pb
+        [306153, 306155], # HLT_Ele35_WPTight_Gsf_v7, 580.683/pb
+        [306169, 306171], # HLT_Ele35_WPTight_Gsf_v7, 103.163/pb
+        [306418, 306420], # HLT_Ele35_WPTight_Gsf_v7, 73.423/pb
+        [306422, 306423], # HLT_Ele35_WPTight_Gsf_v7, 120.463/pb
+        [306432, 306432], # HLT_Ele35_WPTight_Gsf_v7, 33.338/pb
+        [306454, 306460], # HLT_Ele35_WPTight_Gsf_v7, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele32_WPTight_Gsf', # missing in runs B, C
+      'unprescaled' : True,
+      'runs'        : [
+        [302026, 302026], # HLT_Ele32_WPTight_Gsf_v13, 4.652/pb
+        [302029, 302029], # HLT_Ele32_WPTight_Gsf_v13, 15.282/pb
+        [302031, 302031], # HLT_Ele32_WPTight_Gsf_v13, 128.522/pb
+        [302033, 302034], # HLT_Ele32_WPTight_Gsf_v13, 5.657/pb
+        [302037, 302038], # HLT_Ele32_WPTight_Gsf_v13, 0.069/pb
+        [302040, 302043], # HLT_Ele32_WPTight_Gsf_v13, 104.438/pb
+        [302131, 302131], # HLT_Ele32_WPTight_Gsf_v13, 111.635/pb
+        [302159, 302159], # HLT_Ele32_WPTight_Gsf_v13, 16.077/pb
+        [302163, 302163], # HLT_Ele32_WPTight_Gsf_v13, 146.312/pb
+        [302165, 302166], # HLT_Ele32_WPTight_Gsf_v13, 8.409/pb
+        [302225, 302225], # HLT_Ele32_WPTight_Gsf_v13, 114.788/pb
+        [302228, 302229], # HLT_Ele32_WPTight_Gsf_v13, 105.812/pb
+        [302240, 302240], # HLT_Ele32_WPTight_Gsf_v13, 138.868/pb
+        [302262, 302263], # HLT_Ele32_WPTight_Gsf_v13, 241.353/pb
+        [302277, 302277], # HLT_Ele32_WPTight_Gsf_v13, 53.761/pb
+        [302279, 302280], # HLT_Ele32_WPTight_Gsf_v13, 18.474/pb
+        [302322, 302322], # HLT_Ele32_WPTight_Gsf_v13, 96.87/pb
+        [302328, 302328], # HLT_Ele32_WPTight_Gsf_v13, 93.45/pb
+        [302337, 302337], # HLT_Ele32_WPTight_Gsf_v13, 20.377/pb
+        [302342, 302344], # HLT_Ele32_WPTight_Gsf_v13, 91.05/pb
+        [302350, 302350], # HLT_Ele32_WPTight_Gsf_v13, 16.493/pb
+        [302388, 302388], # HLT_Ele32_WPTight_Gsf_v13, 126.264/pb
+        [302392, 302393], # HLT_Ele32_WPTight_Gsf_v13, 232.234/pb
+        [302448, 302448], # HLT_Ele32_WPTight_Gsf_v13, 307.867/pb
+        [302472, 302476], # HLT_Ele32_WPTight_Gsf_v13, 292.111/pb
+        [302479, 302479], # HLT_Ele32_WPTight_Gsf_v13, 68.381/pb
+        [302484, 302485], # HLT_Ele32_WPTight_Gsf_v13, 209.762/pb
+        [302492, 302494], # HLT_Ele32_WPTight_Gsf_v13, 93.282/pb
+        [302509, 302509], # HLT_Ele32_WPTight_Gsf_v13, 4.987/pb
+        [302513, 302513], # HLT_Ele32_WPTight_Gsf_v13, 12.203/pb
+        [302522, 302523], # HLT_Ele32_WPTight_Gsf_v13, 11.257/pb
+        [302525, 302526], # HLT_Ele32_WPTight_Gsf_v13, 223.119/pb
+        [302548, 302548], # HLT_Ele32_WPTight_Gsf_v13, 15.74/pb
+        [302551, 302551], # HLT_Ele32_WPTight_Gsf_v13, 0.104/pb
+        [302553, 302555], # HLT_Ele32_WPTight_Gsf_v13, 39.038/pb
+        [302563, 302563], # HLT_Ele32_WPTight_Gsf_v13, 0.32/pb
+        [302565, 302565], # HLT_Ele32_WPTight_Gsf_v13, 0.149/pb
+        [302572, 302573], # HLT_Ele32_WPTight_Gsf_v13, 241.684/pb
+        [302596, 302597], # HLT_Ele32_WPTight_Gsf_v13, 318.295/pb
+        [302634, 302635], # HLT_Ele32_WPTight_Gsf_v13, 300.859/pb
+        [302651, 302651], # HLT_Ele32_WPTight_Gsf_v13, 30.035/pb
+        [302654, 302654], # HLT_Ele32_WPTight_Gsf_v13, 63.967/pb
+        [302661, 302661], # HLT_Ele32_WPTight_Gsf_v13, 9.465/pb
+        [302663, 302663], # HLT_Ele32_WPTight_Gsf_v13, 134.254/pb
+        [303825, 303825], # HLT_Ele32_WPTight_Gsf_v13, 22.834/pb
+        [303832, 303832], # HLT_Ele32_WPTight_Gsf_v13, 321.326/pb
+        [303838, 303838], # HLT_Ele32_WPTight_Gsf_v13, 380.035/pb
+        [303885, 303885], # HLT_Ele32_WPTight_Gsf_v13, 400.159/pb
+        [303948, 303948], # HLT_Ele32_WPTight_Gsf_v13, 351.61/pb
+        [303998, 304000], # HLT_Ele32_WPTight_Gsf_v13, 256.409/pb
+        [304062, 304062], # HLT_Ele32_WPTight_Gsf_v13, 382.105/pb
+        [304119, 304120], # HLT_Ele32_WPTight_Gsf_v13, 93.285/pb
+        [304125, 304125], # HLT_Ele32_WPTight_Gsf_v13, 338.101/pb
+        [304144, 304144], # HLT_Ele32_WPTight_Gsf_v13, 533.881/pb
+        [304158, 304158], # HLT_Ele32_WPTight_Gsf_v13, 370.885/pb
+        [304169, 304170], # HLT_Ele32_WPTight_Gsf_v13, 414.145/pb
+        [304199, 304200], # HLT_Ele32_WPTight_Gsf_v13, 88.201/pb
+        [304204, 304204], # HLT_Ele32_WPTight_Gsf_v13, 153.182/pb
+        [304209, 304209], # HLT_Ele32_WPTight_Gsf_v13, 116.174/pb
+        [304291, 304292], # HLT_Ele32_WPTight_Gsf_v13, 350.613/pb
+        [304333, 304333], # HLT_Ele32_WPTight_Gsf_v13, 366.646/pb
+        [304354, 304354], # HLT_Ele32_WPTight_Gsf_v13, 68.255/pb
+        [304366, 304366], # HLT_Ele32_WPTight_Gsf_v13, 419.018/pb
+        [304446, 304447], # HLT_Ele32_WPTight_Gsf_v13, 385.306/pb
+        [304451, 304451], # HLT_Ele32_WPTight_Gsf_v13, 7.416/pb
+        [304505, 304508], # HLT_Ele32_WPTight_Gsf_v13, 425.864/pb
+        [304562, 304562], # HLT_Ele32_WPTight_Gsf_v13, 221.934/pb
+        [304616, 304616], # HLT_Ele32_WPTight_Gsf_v13, 253.369/pb
+        [304625, 304626], # HLT_Ele32_WPTight_Gsf_v13, 138.626/pb
+        [304654, 304655], # HLT_Ele32_WPTight_Gsf_v13, 403.545/pb
+        [304661, 304663], # HLT_Ele32_WPTight_Gsf_v13, 266.757/pb
+        [304671, 304672], # HLT_Ele32_WPTight_Gsf_v13, 320.532/pb
+        [304737, 304740], # HLT_Ele32_WPTight_Gsf_v13, 474.819/pb
+        [304776, 304778], # HLT_Ele32_WPTight_Gsf_v13, 432.15/pb
+        [304797, 304797], # HLT_Ele32_WPTight_Gsf_v13, 557.403/pb
+        [305044, 305046], # HLT_Ele32_WPTight_Gsf_v13, 378.033/pb
+        [305059, 305059], # HLT_Ele32_WPTight_Gsf_v13, 157.786/pb
+        [305062, 305064], # HLT_Ele32_WPTight_Gsf_v13, 390.89/pb
+        [305081, 305081], # HLT_Ele32_WPTight_Gsf_v13, 315.14/pb
+        [305112, 305114], # HLT_Ele32_WPTight_Gsf_v13, 497.055/pb
+        [305178, 305184], # HLT_Ele32_WPTight_Gsf_v13, 100.554/pb
+        [305186, 305186], # HLT_Ele32_WPTight_Gsf_v13, 122.05/pb
+        [305188, 305188], # HLT_Ele32_WPTight_Gsf_v13, 198.33/pb
+        [305202, 305202], # HLT_Ele32_WPTight_Gsf_v13, 207.76/pb
+        [305204, 305204], # HLT_Ele32_WPTight_Gsf_v13, 254.513/pb
+        [305207, 305208], # HLT_Ele32_WPTight_Gsf_v13, 401.157/pb
+        [305234, 305234], # HLT_Ele32_WPTight_Gsf_v13, 12.655/pb
+        [305236, 305237], # HLT_Ele32_WPTight_Gsf_v13, 344.353/pb
+        [305247, 305248], # HLT_Ele32_WPTight_Gsf_v13, 380.308/pb
+        [305252, 305252], # HLT_Ele32_WPTight_Gsf_v13, 95.04/pb
+        [305282, 305282], # HLT_Ele32_WPTight_Gsf_v13, 44.345/pb
+        [305310, 305314], # HLT_Ele32_WPTight_Gsf_v13, 481.671/pb
+        [305336, 305336], # HLT_Ele32_WPTight_Gsf_v13, 66.203/pb
+        [305338, 305338], # HLT_Ele32_WPTight_Gsf_v13, 33.112/pb
+        [305341, 305341], # HLT_Ele32_WPTight_Gsf_v13, 151.78/pb
+        [305349, 305351], # HLT_Ele32_WPTight_Gsf_v13, 186.042/pb
+        [305358, 305358], # HLT_Ele32_WPTight_Gsf_v13, 49.594/pb
+        [305364, 305366], # HLT_Ele32_WPTight_Gsf_v13, 511.673/pb
+        [305376, 305377], # HLT_Ele32_WPTight_Gsf_v13, 431.522/pb
+        [305405, 305406], # HLT_Ele32_WPTight_Gsf_v13, 475.515/pb
+        [305440, 305441], # HLT_Ele32_WPTight_Gsf_v13, 119.869/pb
+        [305516, 305518], # HLT_Ele32_WPTight_Gsf_v13, 438.593/pb
+        [305586, 305586], # HLT_Ele32_WPTight_Gsf_v13, 171.033/pb
+        [305589, 305590], # HLT_Ele32_WPTight_Gsf_v13, 314.815/pb
+        [305636, 305636], # HLT_Ele32_WPTight_Gsf_v13, 525.22/pb
+        [305766, 305766], # HLT_Ele32_WPTight_Gsf_v13, 263.689/pb
+        [305809, 305809], # HLT_Ele32_WPTight_Gsf_v13, 45.952/pb
+        [305814, 305814], # HLT_Ele32_WPTight_Gsf_v13, 446.804/pb
+        [305821, 305821], # HLT_Ele32_WPTight_Gsf_v13, 240.463/pb
+        [305832, 305832], # HLT_Ele32_WPTight_Gsf_v13, 58.021/pb
+        [305840, 305840], # HLT_Ele32_WPTight_Gsf_v13, 251.347/pb
+        [305842, 305842], # HLT_Ele32_WPTight_Gsf_v13, 114.87/pb
+        [305862, 305862], # HLT_Ele32_WPTight_Gsf_v13, 202.189/pb
+        [305898, 305898], # HLT_Ele32_WPTight_Gsf_v13, 230.935/pb
+        [305902, 305902], # HLT_Ele32_WPTight_Gsf_v13, 154.345/pb
+        [305967, 305967], # HLT_Ele32_WPTight_Gsf_v13, 10.508/pb
+        [306029, 306030], # HLT_Ele32_WPTight_Gsf_v13, 44.125/pb
+        [306036, 306038], # HLT_Ele32_WPTight_Gsf_v13, 56.442/pb
+        [306041, 306042], # HLT_Ele32_WPTight_Gsf_v13, 200.189/pb
+        [306048, 306049], # HLT_Ele32_WPTight_Gsf_v13, 107.334/pb
+        [306051, 306051], # HLT_Ele32_WPTight_Gsf_v13, 70.67/pb
+        [306091, 306092], # HLT_Ele32_WPTight_Gsf_v13, 280.74/pb
+        [306095, 306095], # HLT_Ele32_WPTight_Gsf_v13, 49.131/pb
+        [306121, 306122], # HLT_Ele32_WPTight_Gsf_v13, 69.307/pb
+        [306125, 306126], # HLT_Ele32_WPTight_Gsf_v13, 590.489/pb
+        [306134, 306135], # HLT_Ele32_WPTight_Gsf_v13, 336.473/pb
+        [306138, 306139], # HLT_Ele32_WPTight_Gsf_v13, 312.896/pb
+        [306153, 306155], # HLT_Ele32_WPTight_Gsf_v13, 580.683/pb
+        [306169, 306171], # HLT_Ele32_WPTight_Gsf_v13, 103.163/pb
+        [306418, 306420], # HLT_Ele32_WPTight_Gsf_v13, 73.423/pb
+        [306422, 306423], # HLT_Ele32_WPTight_Gsf_v13, 120.463/pb
+        [306432, 306432], # HLT_Ele32_WPTight_Gsf_v13, 33.338/pb
+        [306454, 306460], # HLT_Ele32_WPTight_Gsf_v13, 635.031/pb
+      ],
+    },
+  ],
+  '1e_noiso' : [
+    {
+      'name'        : 'HLT_Ele115_CaloIdVT_GsfTrkIdT', # missing in run B
+      'unprescaled' : True,
+      'runs'        : [
+        [299368, 299370], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 253.498/pb
+        [299380, 299381], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 66.094/pb
+        [299394, 299396], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 61.673/pb
+        [299420, 299420], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 13.23/pb
+        [299443, 299443], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 5.608/pb
+        [299450, 299450], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 12.395/pb
+        [299477, 299481], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 431.547/pb
+        [299593, 299595], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 268.091/pb
+        [299597, 299597], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 85.37/pb
+        [299649, 299649], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v9, 56.768/pb
+        [300087, 300087], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 12.856/pb
+        [300105, 300107], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 34.169/pb
+        [300117, 300117], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 6.067/pb
+        [300122, 300123], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 394.771/pb
+        [300155, 300157], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 461.282/pb
+        [300226, 300226], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 115.963/pb
+        [300233, 300240], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 435.357/pb
+        [300280, 300284], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 311.422/pb
+        [300364, 300375], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 59.002/pb
+        [300389, 300401], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 339.844/pb
+        [300459, 300459], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 81.507/pb
+        [300461, 300464], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 132.112/pb
+        [300466, 300467], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 202.273/pb
+        [300497, 300497], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 40.035/pb
+        [300514, 300517], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 379.864/pb
+        [300558, 300558], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 119.182/pb
+        [300560, 300560], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 140.271/pb
+        [300574, 300576], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 315.299/pb
+        [300631, 300633], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 167.565/pb
+        [300635, 300636], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 312.071/pb
+        [300673, 300676], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 23.1/pb
+        [300742, 300742], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 83.984/pb
+        [300777, 300777], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 130.415/pb
+        [300780, 300780], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 79.072/pb
+        [300785, 300785], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 212.774/pb
+        [300806, 300806], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 54.218/pb
+        [300811, 300812], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 159.497/pb
+        [300816, 300817], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v10, 134.15/pb
+        [301046, 301046], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 4.222/pb
+        [301141, 301142], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 97.203/pb
+        [301161, 301161], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 98.077/pb
+        [301165, 301165], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 15.465/pb
+        [301179, 301180], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 16.878/pb
+        [301183, 301183], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 45.299/pb
+        [301281, 301281], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 18.542/pb
+        [301283, 301283], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 120.005/pb
+        [301298, 301298], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 153.993/pb
+        [301323, 301323], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 165.06/pb
+        [301330, 301330], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 64.443/pb
+        [301359, 301359], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 57.278/pb
+        [301384, 301384], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 94.354/pb
+        [301391, 301393], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 147.405/pb
+        [301396, 301399], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 110.63/pb
+        [301417, 301417], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 67.689/pb
+        [301447, 301450], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 188.658/pb
+        [301461, 301461], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 98.122/pb
+        [301472, 301472], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 138.033/pb
+        [301475, 301476], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 109.336/pb
+        [301519, 301519], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 33.367/pb
+        [301524, 301524], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 41.078/pb
+        [301529, 301532], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 131.943/pb
+        [301567, 301567], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 63.339/pb
+        [301627, 301627], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 131.459/pb
+        [301664, 301665], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 138.42/pb
+        [301694, 301694], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 17.576/pb
+        [301912, 301914], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 79.784/pb
+        [301941, 301941], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 74.507/pb
+        [301959, 301960], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 290.104/pb
+        [301970, 301970], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 22.349/pb
+        [301984, 301987], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 292.622/pb
+        [301997, 301998], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 282.538/pb
+        [302019, 302019], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v11, 9.113/pb
+        [302026, 302026], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 4.652/pb
+        [302029, 302029], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 15.282/pb
+        [302031, 302031], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 128.522/pb
+        [302033, 302034], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 5.657/pb
+        [302037, 302038], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 0.069/pb
+        [302040, 302043], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 104.438/pb
+        [302131, 302131], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 111.635/pb
+        [302159, 302159], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 16.077/pb
+        [302163, 302163], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 146.312/pb
+        [302165, 302166], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 8.409/pb
+        [302225, 302225], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 114.788/pb
+        [302228, 302229], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 105.812/pb
+        [302240, 302240], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 138.868/pb
+        [302262, 302263], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 241.353/pb
+        [302277, 302277], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 53.761/pb
+        [302279, 302280], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 18.474/pb
+        [302322, 302322], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 96.87/pb
+        [302328, 302328], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 93.45/pb
+        [302337, 302337], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 20.377/pb
+        [302342, 302344], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 91.05/pb
+        [302350, 302350], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 16.493/pb
+        [302388, 302388], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 126.264/pb
+        [302392, 302393], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 232.234/pb
+        [302448, 302448], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 307.867/pb
+        [302472, 302476], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 292.111/pb
+        [302479, 302479], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 68.381/pb
+        [302484, 302485], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 209.762/pb
+        [302492, 302494], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 93.282/pb
+        [302509, 302509], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 4.987/pb
+        [302513, 302513], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 12.203/pb
+        [302522, 302523], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 11.257/pb
+        [302525, 302526], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 223.119/pb
+        [302548, 302548], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 15.74/pb
+        [302551, 302551], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 0.104/pb
+        [302553, 302555], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 39.038/pb
+        [302563, 302563], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 0.32/pb
+        [302565, 302565], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 0.149/pb
+        [302572, 302573], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 241.684/pb
+        [302596, 302597], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 318.295/pb
+        [302634, 302635], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 300.859/pb
+        [302651, 302651], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 30.035/pb
+        [302654, 302654], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 63.967/pb
+        [302661, 302661], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 9.465/pb
+        [302663, 302663], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 134.254/pb
+        [303825, 303825], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 22.834/pb
+        [303832, 303832], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 321.326/pb
+        [303838, 303838], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 380.035/pb
+        [303885, 303885], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 400.159/pb
+        [303948, 303948], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 351.61/pb
+        [303998, 304000], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 256.409/pb
+        [304062, 304062], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 382.105/pb
+        [304119, 304120], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 93.285/pb
+        [304125, 304125], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 338.101/pb
+        [304144, 304144], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 533.881/pb
+        [304158, 304158], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 370.885/pb
+        [304169, 304170], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 414.145/pb
+        [304199, 304200], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 88.201/pb
+        [304204, 304204], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 153.182/pb
+        [304209, 304209], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 116.174/pb
+        [304291, 304292], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 350.613/pb
+        [304333, 304333], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 366.646/pb
+        [304354, 304354], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 68.255/pb
+        [304366, 304366], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 419.018/pb
+        [304446, 304447], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 385.306/pb
+        [304451, 304451], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 7.416/pb
+        [304505, 304508], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 425.864/pb
+        [304562, 304562], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 221.934/pb
+        [304616, 304616], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 253.369/pb
+        [304625, 304626], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 138.626/pb
+        [304654, 304655], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 403.545/pb
+        [304661, 304663], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 266.757/pb
+        [304671, 304672], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 320.532/pb
+        [304737, 304740], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 474.819/pb
+        [304776, 304778], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 432.15/pb
+        [304797, 304797], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 557.403/pb
+        [305044, 305046], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 378.033/pb
+        [305059, 305059], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 157.786/pb
+        [305062, 305064], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 390.89/pb
+        [305081, 305081], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 315.14/pb
+        [305112, 305114], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 497.055/pb
+        [305178, 305184], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 100.554/pb
+        [305186, 305186], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 122.05/pb
+        [305188, 305188], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 198.33/pb
+        [305202, 305202], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 207.76/pb
+        [305204, 305204], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 254.513/pb
+        [305207, 305208], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 401.157/pb
+        [305234, 305234], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 12.655/pb
+        [305236, 305237], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 344.353/pb
+        [305247, 305248], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 380.308/pb
+        [305252, 305252], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 95.04/pb
+        [305282, 305282], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 44.345/pb
+        [305310, 305314], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 481.671/pb
+        [305336, 305336], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 66.203/pb
+        [305338, 305338], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 33.112/pb
+        [305341, 305341], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 151.78/pb
+        [305349, 305351], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 186.042/pb
+        [305358, 305358], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 49.594/pb
+        [305364, 305366], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 511.673/pb
+        [305376, 305377], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 431.522/pb
+        [305405, 305406], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 475.515/pb
+        [305440, 305441], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 119.869/pb
+        [305516, 305518], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 438.593/pb
+        [305586, 305586], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 171.033/pb
+        [305589, 305590], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 314.815/pb
+        [305636, 305636], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 525.22/pb
+        [305766, 305766], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 263.689/pb
+        [305809, 305809], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 45.952/pb
+        [305814, 305814], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 446.804/pb
+        [305821, 305821], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 240.463/pb
+        [305832, 305832], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 58.021/pb
+        [305840, 305840], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 251.347/pb
+        [305842, 305842], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 114.87/pb
+        [305862, 305862], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 202.189/pb
+        [305898, 305898], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 230.935/pb
+        [305902, 305902], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 154.345/pb
+        [305967, 305967], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 10.508/pb
+        [306029, 306030], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 44.125/pb
+        [306036, 306038], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 56.442/pb
+        [306041, 306042], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 200.189/pb
+        [306048, 306049], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 107.334/pb
+        [306051, 306051], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 70.67/pb
+        [306091, 306092], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 280.74/pb
+        [306095, 306095], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 49.131/pb
+        [306121, 306122], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 69.307/pb
+        [306125, 306126], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 590.489/pb
+        [306134, 306135], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 336.473/pb
+        [306138, 306139], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 312.896/pb
+        [306153, 306155], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 580.683/pb
+        [306169, 306171], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 103.163/pb
+        [306418, 306420], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 73.423/pb
+        [306422, 306423], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 120.463/pb
+        [306432, 306432], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 33.338/pb
+        [306454, 306460], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 635.031/pb
+      ],
+    },
+  ],
+  # CV: tau trigger paths taken from slide 6 of presentation given by Hale Sert at HTT workshop in December 2017
+  #    (https://indico.cern.ch/event/684622/contributions/2807071/attachments/1575421/2487940/141217_triggerStatusPlans_hsert.pdf),
+  #     except that the 'HLT_IsoMu24_eta2p1_LooseChargedIsoPFTau20_SingleL1' path has been dropped,
+  #     as it was found to increase the trigger acceptance only marginally
+  #    (cf. slide 19 of https://indico.cern.ch/event/683144/contributions/2814995/attachments/1570846/2478034/Ruggles_TauTriggers_TauPOG_20171206_v7.pdf)
+  '1mu1tau' : [ # stored in SingleMuon dataset
+    {
+      'name'        : 'HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v1, 94.725/pb
+        [297056, 297057], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v1, 143.741/pb
+        [297099, 297101], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 241.495/pb
+        [297113, 297114], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 85.001/pb
+        [297175, 297178], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 280.582/pb
+        [297215, 297215], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 12.287/pb
+        [297218, 297219], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 425.447/pb
+        [297224, 297225], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 13.81/pb
+        [297227, 297227], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 15.669/pb
+        [297292, 297293], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 198.677/pb
+        [297296, 297296], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 84.207/pb
+        [297308, 297308], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 6.298/pb
+        [297359, 297359], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 13.795/pb
+        [297411, 297411], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 201.578/pb
+        [297424, 297426], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 97.376/pb
+        [297429, 297435], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 199.191/pb
+        [297467, 297469], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 69.859/pb
+        [297483, 297488], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 471.448/pb
+        [297503, 297505], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v2, 268.446/pb
+        [297557, 297558], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 158.712/pb
+        [297562, 297563], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 106.785/pb
+        [297598, 297599], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 93.85/pb
+        [297603, 297606], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 276.775/pb
+        [297620, 297620], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 82.127/pb
+        [297656, 297656], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 93.083/pb
+        [297665, 297666], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 78.347/pb
+        [297670, 297670], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 2.132/pb
+        [297674, 297675], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 170.78/pb
+        [297722, 297723], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 142.686/pb
+        [298996, 298997], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 26.765/pb
+        [299000, 299000], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 8.038/pb
+        [299042, 299042], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 2.02/pb
+        [299061, 299062], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 123.32/pb
+        [299064, 299065], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 73.04/pb
+        [299067, 299067], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 68.807/pb
+        [299096, 299096], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 24.067/pb
+        [299149, 299149], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 108.249/pb
+        [299178, 299178], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 15.791/pb
+        [299180, 299180], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 15.575/pb
+        [299184, 299185], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 146.717/pb
+        [299327, 299327], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 15.178/pb
+        [299329, 299329], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v3, 37.487/pb
+        [299368, 299370], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 253.498/pb
+        [299380, 299381], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 66.094/pb
+        [299394, 299396], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 61.673/pb
+        [299420, 299420], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 13.23/pb
+        [299443, 299443], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 5.608/pb
+        [299450, 299450], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 12.395/pb
+        [299477, 299481], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 431.547/pb
+        [299593, 299595], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 268.091/pb
+        [299597, 299597], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 85.37/pb
+        [299649, 299649], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v4, 56.768/pb
+        [300087, 300087], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 12.856/pb
+        [300105, 300107], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 34.169/pb
+        [300117, 300117], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 6.067/pb
+        [300122, 300123], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 394.771/pb
+        [300155, 300157], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 461.282/pb
+        [300226, 300226], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 115.963/pb
+        [300233, 300240], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 435.357/pb
+        [300280, 300284], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 311.422/pb
+        [300364, 300375], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 59.002/pb
+        [300389, 300401], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 339.844/pb
+        [300459, 300459], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 81.507/pb
+        [300461, 300464], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 132.112/pb
+        [300466, 300467], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 202.273/pb
+        [300497, 300497], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 40.035/pb
+        [300514, 300517], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 379.864/pb
+        [300558, 300558], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 119.182/pb
+        [300560, 300560], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 140.271/pb
+        [300574, 300576], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 315.299/pb
+        [300631, 300633], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 167.565/pb
+        [300635, 300636], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 312.071/pb
+        [300673, 300676], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 23.1/pb
+        [300742, 300742], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 83.984/pb
+        [300777, 300777], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 130.415/pb
+        [300780, 300780], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 79.072/pb
+        [300785, 300785], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 212.774/pb
+        [300806, 300806], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 54.218/pb
+        [300811, 300812], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 159.497/pb
+        [300816, 300817], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v5, 134.15/pb
+        [301046, 301046], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 4.222/pb
+        [301141, 301142], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 97.203/pb
+        [301161, 301161], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 98.077/pb
+        [301165, 301165], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 15.465/pb
+        [301179, 301180], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 16.878/pb
+        [301183, 301183], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 45.299/pb
+        [301281, 301281], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 18.542/pb
+        [301283, 301283], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 120.005/pb
+        [301298, 301298], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 153.993/pb
+        [301323, 301323], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 165.06/pb
+        [301330, 301330], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 64.443/pb
+        [301359, 301359], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 57.278/pb
+        [301384, 301384], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 94.354/pb
+        [301391, 301393], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 147.405/pb
+        [301396, 301399], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 110.63/pb
+        [301417, 301417], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 67.689/pb
+        [301447, 301450], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 188.658/pb
+        [301461, 301461], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 98.122/pb
+        [301472, 301472], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 138.033/pb
+        [301475, 301476], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 109.336/pb
+        [301519, 301519], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 33.367/pb
+        [301524, 301524], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 41.078/pb
+        [301529, 301532], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 131.943/pb
+        [301567, 301567], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 63.339/pb
+        [301627, 301627], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 131.459/pb
+        [301664, 301665], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 138.42/pb
+        [301694, 301694], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 17.576/pb
+        [301912, 301914], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 79.784/pb
+        [301941, 301941], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 74.507/pb
+        [301959, 301960], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 290.104/pb
+        [301970, 301970], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 22.349/pb
+        [301984, 301987], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 292.622/pb
+        [301997, 301998], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 282.538/pb
+        [302019, 302019], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v6, 9.113/pb
+        [302026, 302026], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 4.652/pb
+        [302029, 302029], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 15.282/pb
+        [302031, 302031], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 128.522/pb
+        [302033, 302034], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 5.657/pb
+        [302037, 302038], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 0.069/pb
+        [302040, 302043], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 104.438/pb
+        [302131, 302131], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 111.635/pb
+        [302159, 302159], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 16.077/pb
+        [302163, 302163], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 146.312/pb
+        [302165, 302166], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 8.409/pb
+        [302225, 302225], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 114.788/pb
+        [302228, 302229], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 105.812/pb
+        [302240, 302240], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 138.868/pb
+        [302262, 302263], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 241.353/pb
+        [302277, 302277], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 53.761/pb
+        [302279, 302280], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 18.474/pb
+        [302322, 302322], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 96.87/pb
+        [302328, 302328], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 93.45/pb
+        [302337, 302337], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 20.377/pb
+        [302342, 302344], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 91.05/pb
+        [302350, 302350], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 16.493/pb
+        [302388, 302388], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 126.264/pb
+        [302392, 302393], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 232.234/pb
+        [302448, 302448], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 307.867/pb
+        [302472, 302476], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 292.111/pb
+        [302479, 302479], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 68.381/pb
+        [302484, 302485], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 209.762/pb
+        [302492, 302494], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v7, 93.282/pb
+        [302509, 302509], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 4.987/pb
+        [302513, 302513], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 12.203/pb
+        [302522, 302523], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 11.257/pb
+        [302525, 302526], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 223.119/pb
+        [302548, 302548], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 15.74/pb
+        [302551, 302551], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 0.104/pb
+        [302553, 302555], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 39.038/pb
+        [302563, 302563], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 0.32/pb
+        [302565, 302565], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 0.149/pb
+        [302572, 302573], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 241.684/pb
+        [302596, 302597], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 318.295/pb
+        [302634, 302635], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 300.859/pb
+        [302651, 302651], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 30.035/pb
+        [302654, 302654], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 63.967/pb
+        [302661, 302661], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 9.465/pb
+        [302663, 302663], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 134.254/pb
+        [303825, 303825], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 22.834/pb
+        [303832, 303832], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 321.326/pb
+        [303838, 303838], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 380.035/pb
+        [303885, 303885], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 400.159/pb
+        [303948, 303948], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 351.61/pb
+        [303998, 304000], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 256.409/pb
+        [304062, 304062], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 382.105/pb
+        [304119, 304120], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 93.285/pb
+        [304125, 304125], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 338.101/pb
+        [304144, 304144], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 533.881/pb
+        [304158, 304158], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 370.885/pb
+        [304169, 304170], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 414.145/pb
+        [304199, 304200], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 88.201/pb
+        [304204, 304204], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 153.182/pb
+        [304209, 304209], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 116.174/pb
+        [304291, 304292], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 350.613/pb
+        [304333, 304333], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 366.646/pb
+        [304354, 304354], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 68.255/pb
+        [304366, 304366], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 419.018/pb
+        [304446, 304447], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 385.306/pb
+        [304451, 304451], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 7.416/pb
+        [304505, 304508], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 425.864/pb
+        [304562, 304562], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 221.934/pb
+        [304616, 304616], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 253.369/pb
+        [304625, 304626], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 138.626/pb
+        [304654, 304655], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 403.545/pb
+        [304661, 304663], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 266.757/pb
+        [304671, 304672], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 320.532/pb
+        [304737, 304740], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 474.819/pb
+        [304776, 304778], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 432.15/pb
+        [304797, 304797], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 557.403/pb
+        [305044, 305046], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 378.033/pb
+        [305059, 305059], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 157.786/pb
+        [305062, 305064], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 390.89/pb
+        [305081, 305081], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 315.14/pb
+        [305112, 305114], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 497.055/pb
+        [305178, 305184], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 100.554/pb
+        [305186, 305186], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 122.05/pb
+        [305188, 305188], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 198.33/pb
+        [305202, 305202], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 207.76/pb
+        [305204, 305204], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 254.513/pb
+        [305207, 305208], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 401.157/pb
+        [305234, 305234], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 12.655/pb
+        [305236, 305237], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 344.353/pb
+        [305247, 305248], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 380.308/pb
+        [305252, 305252], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 95.04/pb
+        [305282, 305282], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 44.345/pb
+        [305310, 305314], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 481.671/pb
+        [305336, 305336], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 66.203/pb
+        [305338, 305338], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 33.112/pb
+        [305341, 305341], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 151.78/pb
+        [305349, 305351], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 186.042/pb
+        [305358, 305358], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 49.594/pb
+        [305364, 305366], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 511.673/pb
+        [305376, 305377], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 431.522/pb
+        [305405, 305406], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 475.515/pb
+        [305440, 305441], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 119.869/pb
+        [305516, 305518], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 438.593/pb
+        [305586, 305586], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 171.033/pb
+        [305589, 305590], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 314.815/pb
+        [305636, 305636], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 525.22/pb
+        [305766, 305766], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 263.689/pb
+        [305809, 305809], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 45.952/pb
+        [305814, 305814], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 446.804/pb
+        [305821, 305821], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 240.463/pb
+        [305832, 305832], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 58.021/pb
+        [305840, 305840], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 251.347/pb
+        [305842, 305842], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 114.87/pb
+        [305862, 305862], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 202.189/pb
+        [305898, 305898], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 230.935/pb
+        [305902, 305902], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 154.345/pb
+        [305967, 305967], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v8, 10.508/pb
+        [306029, 306030], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 44.125/pb
+        [306036, 306038], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 56.442/pb
+        [306041, 306042], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 200.189/pb
+        [306048, 306049], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 107.334/pb
+        [306051, 306051], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 70.67/pb
+        [306091, 306092], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 280.74/pb
+        [306095, 306095], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 49.131/pb
+        [306121, 306122], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 69.307/pb
+        [306125, 306126], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 590.489/pb
+        [306134, 306135], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 336.473/pb
+        [306138, 306139], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 312.896/pb
+        [306153, 306155], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 580.683/pb
+        [306169, 306171], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v9, 103.163/pb
+        [306418, 306420], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 73.423/pb
+        [306422, 306423], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 120.463/pb
+        [306432, 306432], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 33.338/pb
+        [306454, 306460], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 635.031/pb
+      ],
+    },
+  ],
+  '1e1tau' : [ # stored in SingleElectron dataset
+    {
+      'name'        : 'HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v1, 94.725/pb
+        [297056, 297057], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v1, 143.741/pb
+        [297099, 297101], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 241.495/pb
+        [297113, 297114], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 85.001/pb
+        [297175, 297178], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 280.582/pb
+        [297215, 297215], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 12.287/pb
+        [297218, 297219], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 425.447/pb
+        [297224, 297225], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 13.81/pb
+        [297227, 297227], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 15.669/pb
+        [297292, 297293], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 198.677/pb
+        [297296, 297296], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 84.207/pb
+        [297308, 297308], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 6.298/pb
+        [297359, 297359], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 13.795/pb
+        [297411, 297411], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 201.578/pb
+        [297424, 297426], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 97.376/pb
+        [297429, 297435], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 199.191/pb
+        [297467, 297469], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 69.859/pb
+        [297483, 297488], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 471.448/pb
+        [297503, 297505], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v2, 268.446/pb
+        [297557, 297558], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 158.712/pb
+        [297562, 297563], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 106.785/pb
+        [297598, 297599], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 93.85/pb
+        [297603, 297606], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 276.775/pb
+        [297620, 297620], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 82.127/pb
+        [297656, 297656], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 93.083/pb
+        [297665, 297666], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 78.347/pb
+        [297670, 297670], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 2.132/pb
+        [297674, 297675], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 170.78/pb
+        [297722, 297723], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 142.686/pb
+        [298996, 298997], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 26.765/pb
+        [299000, 299000], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 8.038/pb
+        [299042, 299042], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 2.02/pb
+        [299061, 299062], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 123.32/pb
+        [299064, 299065], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 73.04/pb
+        [299067, 299067], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 68.807/pb
+        [299096, 299096], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 24.067/pb
+        [299149, 299149], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 108.249/pb
+        [299178, 299178], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 15.791/pb
+        [299180, 299180], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 15.575/pb
+        [299184, 299185], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 146.717/pb
+        [299327, 299327], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 15.178/pb
+        [299329, 299329], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v4, 37.487/pb
+        [299368, 299370], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 253.498/pb
+        [299380, 299381], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 66.094/pb
+        [299394, 299396], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 61.673/pb
+        [299420, 299420], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 13.23/pb
+        [299443, 299443], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 5.608/pb
+        [299450, 299450], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 12.395/pb
+        [299477, 299481], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 431.547/pb
+        [299593, 299595], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 268.091/pb
+        [299597, 299597], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 85.37/pb
+        [299649, 299649], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v5, 56.768/pb
+        [300087, 300087], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 12.856/pb
+        [300105, 300107], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 34.169/pb
+        [300117, 300117], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 6.067/pb
+        [300122, 300123], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 394.771/pb
+        [300155, 300157], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 461.282/pb
+        [300226, 300226], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 115.963/pb
+        [300233, 300240], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 435.357/pb
+        [300280, 300284], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 311.422/pb
+        [300364, 300375], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 59.002/pb
+        [300389, 300401], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 339.844/pb
+        [300459, 300459], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 81.507/pb
+        [300461, 300464], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 132.112/pb
+        [300466, 300467], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 202.273/pb
+        [300497, 300497], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 40.035/pb
+        [300514, 300517], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 379.864/pb
+        [300558, 300558], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 119.182/pb
+        [300560, 300560], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 140.271/pb
+        [300574, 300576], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 315.299/pb
+        [300631, 300633], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 167.565/pb
+        [300635, 300636], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 312.071/pb
+        [300673, 300676], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 23.1/pb
+        [300742, 300742], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 83.984/pb
+        [300777, 300777], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 130.415/pb
+        [300780, 300780], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 79.072/pb
+        [300785, 300785], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 212.774/pb
+        [300806, 300806], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 54.218/pb
+        [300811, 300812], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 159.497/pb
+        [300816, 300817], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v6, 134.15/pb
+        [301046, 301046], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 4.222/pb
+        [301141, 301142], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 97.203/pb
+        [301161, 301161], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 98.077/pb
+        [301165, 301165], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 15.465/pb
+        [301179, 301180], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 16.878/pb
+        [301183, 301183], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 45.299/pb
+        [301281, 301281], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 18.542/pb
+        [301283, 301283], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 120.005/pb
+        [301298, 301298], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 153.993/pb
+        [301323, 301323], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 165.06/pb
+        [301330, 301330], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 64.443/pb
+        [301359, 301359], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 57.278/pb
+        [301384, 301384], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 94.354/pb
+        [301391, 301393], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 147.405/pb
+        [301396, 301399], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 110.63/pb
+        [301417, 301417], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 67.689/pb
+        [301447, 301450], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 188.658/pb
+        [301461, 301461], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 98.122/pb
+        [301472, 301472], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 138.033/pb
+        [301475, 301476], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 109.336/pb
+        [301519, 301519], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 33.367/pb
+        [301524, 301524], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 41.078/pb
+        [301529, 301532], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 131.943/pb
+        [301567, 301567], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 63.339/pb
+        [301627, 301627], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 131.459/pb
+        [301664, 301665], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 138.42/pb
+        [301694, 301694], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 17.576/pb
+        [301912, 301914], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 79.784/pb
+        [301941, 301941], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 74.507/pb
+        [301959, 301960], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 290.104/pb
+        [301970, 301970], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 22.349/pb
+        [301984, 301987], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 292.622/pb
+        [301997, 301998], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 282.538/pb
+        [302019, 302019], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v7, 9.113/pb
+        [302026, 302026], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 4.652/pb
+        [302029, 302029], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 15.282/pb
+        [302031, 302031], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 128.522/pb
+        [302033, 302034], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 5.657/pb
+        [302037, 302038], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 0.069/pb
+        [302040, 302043], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 104.438/pb
+        [302131, 302131], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 111.635/pb
+        [302159, 302159], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 16.077/pb
+        [302163, 302163], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 146.312/pb
+        [302165, 302166], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 8.409/pb
+        [302225, 302225], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 114.788/pb
+        [302228, 302229], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 105.812/pb
+        [302240, 302240], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 138.868/pb
+        [302262, 302263], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 241.353/pb
+        [302277, 302277], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 53.761/pb
+        [302279, 302280], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 18.474/pb
+        [302322, 302322], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 96.87/pb
+        [302328, 302328], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 93.45/pb
+        [302337, 302337], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 20.377/pb
+        [302342, 302344], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 91.05/pb
+        [302350, 302350], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 16.493/pb
+        [302388, 302388], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 126.264/pb
+        [302392, 302393], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 232.234/pb
+        [302448, 302448], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 307.867/pb
+        [302472, 302476], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 292.111/pb
+        [302479, 302479], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 68.381/pb
+        [302484, 302485], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 209.762/pb
+        [302492, 302494], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v8, 93.282/pb
+        [302509, 302509], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 4.987/pb
+        [302513, 302513], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 12.203/pb
+        [302522, 302523], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 11.257/pb
+        [302525, 302526], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 223.119/pb
+        [302548, 302548], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 15.74/pb
+        [302551, 302551], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 0.104/pb
+        [302553, 302555], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 39.038/pb
+        [302563, 302563], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 0.32/pb
+        [302565, 302565], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 0.149/pb
+        [302572, 302573], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 241.684/pb
+        [302596, 302597], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 318.295/pb
+        [302634, 302635], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 300.859/pb
+        [302651, 302651], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 30.035/pb
+        [302654, 302654], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 63.967/pb
+        [302661, 302661], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 9.465/pb
+        [302663, 302663], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 134.254/pb
+        [303825, 303825], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 22.834/pb
+        [303832, 303832], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 321.326/pb
+        [303838, 303838], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 380.035/pb
+        [303885, 303885], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 400.159/pb
+        [303948, 303948], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 351.61/pb
+        [303998, 304000], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 256.409/pb
+        [304062, 304062], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 382.105/pb
+        [304119, 304120], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 93.285/pb
+        [304125, 304125], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 338.101/pb
+        [304144, 304144], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 533.881/pb
+        [304158, 304158], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 370.885/pb
+        [304169, 304170], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 414.145/pb
+        [304199, 304200], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 88.201/pb
+        [304204, 304204], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 153.182/pb
+        [304209, 304209], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 116.174/pb
+        [304291, 304292], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 350.613/pb
+        [304333, 304333], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 366.646/pb
+        [304354, 304354], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 68.255/pb
+        [304366, 304366], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 419.018/pb
+        [304446, 304447], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 385.306/pb
+        [304451, 304451], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 7.416/pb
+        [304505, 304508], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 425.864/pb
+        [304562, 304562], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 221.934/pb
+        [304616, 304616], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 253.369/pb
+        [304625, 304626], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 138.626/pb
+        [304654, 304655], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 403.545/pb
+        [304661, 304663], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 266.757/pb
+        [304671, 304672], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 320.532/pb
+        [304737, 304740], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 474.819/pb
+        [304776, 304778], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 432.15/pb
+        [304797, 304797], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 557.403/pb
+        [305044, 305046], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 378.033/pb
+        [305059, 305059], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 157.786/pb
+        [305062, 305064], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 390.89/pb
+        [305081, 305081], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 315.14/pb
+        [305112, 305114], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 497.055/pb
+        [305178, 305184], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 100.554/pb
+        [305186, 305186], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 122.05/pb
+        [305188, 305188], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 198.33/pb
+        [305202, 305202], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 207.76/pb
+        [305204, 305204], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 254.513/pb
+        [305207, 305208], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 401.157/pb
+        [305234, 305234], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 12.655/pb
+        [305236, 305237], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 344.353/pb
+        [305247, 305248], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 380.308/pb
+        [305252, 305252], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 95.04/pb
+        [305282, 305282], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 44.345/pb
+        [305310, 305314], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 481.671/pb
+        [305336, 305336], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 66.203/pb
+        [305338, 305338], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 33.112/pb
+        [305341, 305341], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 151.78/pb
+        [305349, 305351], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 186.042/pb
+        [305358, 305358], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 49.594/pb
+        [305364, 305366], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 511.673/pb
+        [305376, 305377], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 431.522/pb
+        [305405, 305406], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 475.515/pb
+        [305440, 305441], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 119.869/pb
+        [305516, 305518], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 438.593/pb
+        [305586, 305586], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 171.033/pb
+        [305589, 305590], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 314.815/pb
+        [305636, 305636], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 525.22/pb
+        [305766, 305766], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 263.689/pb
+        [305809, 305809], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 45.952/pb
+        [305814, 305814], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 446.804/pb
+        [305821, 305821], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 240.463/pb
+        [305832, 305832], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 58.021/pb
+        [305840, 305840], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 251.347/pb
+        [305842, 305842], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 114.87/pb
+        [305862, 305862], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 202.189/pb
+        [305898, 305898], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 230.935/pb
+        [305902, 305902], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 154.345/pb
+        [305967, 305967], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v9, 10.508/pb
+        [306029, 306030], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 44.125/pb
+        [306036, 306038], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 56.442/pb
+        [306041, 306042], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 200.189/pb
+        [306048, 306049], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 107.334/pb
+        [306051, 306051], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 70.67/pb
+        [306091, 306092], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 280.74/pb
+        [306095, 306095], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 49.131/pb
+        [306121, 306122], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 69.307/pb
+        [306125, 306126], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 590.489/pb
+        [306134, 306135], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 336.473/pb
+        [306138, 306139], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 312.896/pb
+        [306153, 306155], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 580.683/pb
+        [306169, 306171], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v10, 103.163/pb
+        [306418, 306420], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 73.423/pb
+        [306422, 306423], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 120.463/pb
+        [306432, 306432], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 33.338/pb
+        [306454, 306460], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 635.031/pb
+      ],
+    },
+  ],
+  '2tau' : [ # stored in Tau dataset
+    {
+      'name'        : 'HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg',
+      'unprescaled' : False, # prescaled in runs E, F
+      'runs'        : [
+        [297050, 297050], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v1, 94.725/pb
+        [297056, 297057], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v1, 143.741/pb
+        [297099, 297101], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 241.495/pb
+        [297113, 297114], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 85.001/pb
+        [297175, 297178], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 280.582/pb
+        [297215, 297215], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 12.287/pb
+        [297218, 297219], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 425.447/pb
+        [297224, 297225], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 13.81/pb
+        [297227, 297227], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 15.669/pb
+        [297292, 297293], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 198.677/pb
+        [297296, 297296], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 84.207/pb
+        [297308, 297308], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 6.298/pb
+        [297359, 297359], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 13.795/pb
+        [297411, 297411], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 201.578/pb
+        [297424, 297426], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 97.376/pb
+        [297429, 297435], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 199.191/pb
+        [297467, 297469], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 69.859/pb
+        [297483, 297488], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 471.448/pb
+        [297503, 297505], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v2, 268.446/pb
+        [297557, 297558], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 158.712/pb
+        [297562, 297563], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 106.785/pb
+        [297598, 297599], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 93.85/pb
+        [297603, 297606], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 276.775/pb
+        [297620, 297620], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 82.127/pb
+        [297656, 297656], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 93.083/pb
+        [297665, 297666], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 78.347/pb
+        [297670, 297670], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 2.132/pb
+        [297674, 297675], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 170.78/pb
+        [297722, 297723], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 142.686/pb
+        [298996, 298997], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 26.765/pb
+        [299000, 299000], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 8.038/pb
+        [299042, 299042], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 2.02/pb
+        [299061, 299062], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 123.32/pb
+        [299064, 299065], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 73.04/pb
+        [299067, 299067], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 68.807/pb
+        [299096, 299096], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 24.067/pb
+        [299149, 299149], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 108.249/pb
+        [299178, 299178], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 15.791/pb
+        [299180, 299180], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 15.575/pb
+        [299184, 299185], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 146.717/pb
+        [299327, 299327], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 15.178/pb
+        [299329, 299329], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v3, 37.487/pb
+        [299368, 299370], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 253.498/pb
+        [299380, 299381], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 66.094/pb
+        [299394, 299396], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 61.673/pb
+        [299420, 299420], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 13.23/pb
+        [299443, 299443], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 5.608/pb
+        [299450, 299450], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 12.395/pb
+        [299477, 299481], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 431.547/pb
+        [299593, 299595], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 268.091/pb
+        [299597, 299597], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 85.37/pb
+        [299649, 299649], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v4, 56.768/pb
+        [300087, 300087], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 12.856/pb
+        [300105, 300107], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 34.169/pb
+        [300117, 300117], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 6.067/pb
+        [300122, 300123], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 394.771/pb
+        [300155, 300157], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 461.282/pb
+        [300226, 300226], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 115.963/pb
+        [300233, 300240], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 435.357/pb
+        [300280, 300284], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 311.422/pb
+        [300364, 300375], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 59.002/pb
+        [300389, 300401], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 339.844/pb
+        [300459, 300459], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 81.507/pb
+        [300461, 300464], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 132.112/pb
+        [300466, 300467], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 202.273/pb
+        [300497, 300497], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 40.035/pb
+        [300514, 300517], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 379.864/pb
+        [300558, 300558], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 119.182/pb
+        [300560, 300560], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 140.271/pb
+        [300574, 300576], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 315.299/pb
+        [300631, 300633], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 167.565/pb
+        [300635, 300636], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 312.071/pb
+        [300673, 300676], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 23.1/pb
+        [300742, 300742], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 83.984/pb
+        [300777, 300777], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 130.415/pb
+        [300780, 300780], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 79.072/pb
+        [300785, 300785], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 212.774/pb
+        [300806, 300806], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 54.218/pb
+        [300811, 300812], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 159.497/pb
+        [300816, 300817], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v5, 134.15/pb
+        [301046, 301046], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 4.222/pb
+        [301141, 301142], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 97.203/pb
+        [301161, 301161], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 98.077/pb
+        [301165, 301165], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 15.465/pb
+        [301179, 301180], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 16.878/pb
+        [301183, 301183], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 45.299/pb
+        [301281, 301281], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 18.542/pb
+        [301283, 301283], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 120.005/pb
+        [301298, 301298], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 153.993/pb
+        [301323, 301323], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 165.06/pb
+        [301330, 301330], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 64.443/pb
+        [301359, 301359], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 57.278/pb
+        [301384, 301384], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 94.354/pb
+        [301391, 301393], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 147.405/pb
+        [301396, 301399], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 110.63/pb
+        [301417, 301417], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 67.689/pb
+        [301447, 301450], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 188.658/pb
+        [301461, 301461], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 98.122/pb
+        [301472, 301472], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 138.033/pb
+        [301475, 301476], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 109.336/pb
+        [301519, 301519], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 33.367/pb
+        [301524, 301524], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 41.078/pb
+        [301529, 301532], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 131.943/pb
+        [301567, 301567], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 63.339/pb
+        [301627, 301627], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 131.459/pb
+        [301664, 301665], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 138.42/pb
+        [301694, 301694], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 17.576/pb
+        [301912, 301914], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 79.784/pb
+        [301941, 301941], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 74.507/pb
+        [301959, 301960], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 290.104/pb
+        [301970, 301970], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 22.349/pb
+        [301984, 301987], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 292.622/pb
+        [301997, 301998], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 282.538/pb
+        [302019, 302019], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v6, 9.113/pb
+        [302026, 302026], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 4.652/pb
+        [302029, 302029], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 15.282/pb
+        [302031, 302031], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 128.522/pb
+        [302033, 302034], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 5.657/pb
+        [302037, 302038], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 0.069/pb
+        [302040, 302043], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 104.438/pb
+        [302131, 302131], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 111.635/pb
+        [302159, 302159], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 16.077/pb
+        [302163, 302163], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 146.312/pb
+        [302165, 302166], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 8.409/pb
+        [302225, 302225], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 114.788/pb
+        [302228, 302229], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 105.812/pb
+        [302240, 302240], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 138.868/pb
+        [302262, 302263], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 241.353/pb
+        [302277, 302277], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 53.761/pb
+        [302279, 302280], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 18.474/pb
+        [302322, 302322], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 96.87/pb
+        [302328, 302328], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 93.45/pb
+        [302337, 302337], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 20.377/pb
+        [302342, 302344], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 91.05/pb
+        [302350, 302350], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 16.493/pb
+        [302388, 302388], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 126.264/pb
+        [302392, 302393], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 232.234/pb
+        [302448, 302448], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 307.867/pb
+        [302472, 302476], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 292.111/pb
+        [302479, 302479], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 68.381/pb
+        [302484, 302485], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 209.762/pb
+        [302492, 302494], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v7, 93.282/pb
+        [302509, 302509], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 4.987/pb
+        [302513, 302513], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 12.203/pb
+        [302522, 302523], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 11.257/pb
+        [302525, 302526], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 223.119/pb
+        [302548, 302548], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 15.74/pb
+        [302551, 302551], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 0.104/pb
+        [302553, 302555], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 39.038/pb
+        [302563, 302563], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 0.32/pb
+        [302565, 302565], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 0.149/pb
+        [302572, 302573], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 241.684/pb
+        [302596, 302597], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 318.295/pb
+        [302634, 302635], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 300.859/pb
+        [302651, 302651], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 30.035/pb
+        [302654, 302654], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 63.967/pb
+        [302661, 302661], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 9.465/pb
+        [302663, 302663], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 134.254/pb
+        [303825, 303825], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 22.834/pb
+        [303832, 303832], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 319.146/pb
+        [303838, 303838], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 380.035/pb
+        [303885, 303885], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 400.159/pb
+        [303948, 303948], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 351.61/pb
+        [303998, 304000], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 256.409/pb
+        [304062, 304062], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 382.105/pb
+        [304119, 304120], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 93.285/pb
+        [304125, 304125], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 338.101/pb
+        [304144, 304144], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 515.153/pb
+        [304158, 304158], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 370.885/pb
+        [304169, 304170], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 414.145/pb
+        [304199, 304200], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 88.201/pb
+        [304204, 304204], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 146.532/pb
+        [304209, 304209], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 116.174/pb
+        [304291, 304292], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 327.839/pb
+        [304333, 304333], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 265.074/pb
+        [304366, 304366], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 316.608/pb
+        [304447, 304447], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 297.037/pb
+        [304451, 304451], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 7.416/pb
+        [304507, 304508], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 287.408/pb
+        [304562, 304562], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 154.568/pb
+        [304616, 304616], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 181.339/pb
+        [304625, 304626], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 45.136/pb
+        [304654, 304655], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 309.562/pb
+        [304662, 304663], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 187.704/pb
+        [304671, 304672], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 199.478/pb
+        [304737, 304740], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 337.971/pb
+        [304777, 304778], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 309.59/pb
+        [304797, 304797], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 435.186/pb
+        [305044, 305046], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 361.031/pb
+        [305059, 305059], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 1.621/pb
+        [305062, 305064], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 382.676/pb
+        [305081, 305081], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 310.486/pb
+        [305112, 305114], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 470.526/pb
+        [305180, 305182], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 2.092/pb
+        [305184, 305184], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 0.104/pb
+        [305186, 305186], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 91.525/pb
+        [305188, 305188], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 198.33/pb
+        [305202, 305202], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 51.016/pb
+        [305204, 305204], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 254.513/pb
+        [305207, 305208], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 198.447/pb
+        [305234, 305234], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 8.952/pb
+        [305236, 305237], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 344.353/pb
+        [305247, 305248], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 380.204/pb
+        [305252, 305252], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 95.04/pb
+        [305282, 305282], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 40.353/pb
+        [305310, 305314], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 479.975/pb
+        [305341, 305341], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 67.358/pb
+        [305349, 305351], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 186.042/pb
+        [305365, 305366], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 333.13/pb
+        [305377, 305377], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 316.862/pb
+        [305405, 305406], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 319.891/pb
+        [305516, 305518], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 365.102/pb
+        [305586, 305586], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 11.253/pb
+        [305589, 305590], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 314.526/pb
+        [305636, 305636], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 375.118/pb
+        [305766, 305766], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 76.932/pb
+        [305814, 305814], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 294.313/pb
+        [305821, 305821], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 77.142/pb
+        [305840, 305840], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 251.347/pb
+        [305842, 305842], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 114.87/pb
+        [305862, 305862], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 20.941/pb
+        [305898, 305898], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v8, 40.896/pb
+        [306041, 306042], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 106.725/pb
+        [306048, 306049], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 107.334/pb
+        [306051, 306051], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 70.67/pb
+        [306091, 306092], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 235.841/pb
+        [306095, 306095], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 49.131/pb
+        [306125, 306126], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 479.089/pb
+        [306135, 306135], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 134.485/pb
+        [306138, 306139], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 311.736/pb
+        [306154, 306155], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 431.816/pb
+        [306169, 306171], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v9, 102.476/pb
+        [306422, 306423], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v10, 120.463/pb
+        [306432, 306432], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v10, 33.338/pb
+        [306455, 306460], # HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg_v10, 453.266/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v1, 94.725/pb
+        [297056, 297057], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v1, 143.741/pb
+        [297099, 297101], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 241.495/pb
+        [297113, 297114], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 85.001/pb
+        [297175, 297178], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 280.582/pb
+        [297215, 297215], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 12.287/pb
+        [297218, 297219], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 425.447/pb
+        [297224, 297225], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 13.81/pb
+        [297227, 297227], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 15.669/pb
+        [297292, 297293], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 198.677/pb
+        [297296, 297296], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 84.207/pb
+        [297308, 297308], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 6.298/pb
+        [297359, 297359], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 13.795/pb
+        [297411, 297411], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 201.578/pb
+        [297424, 297426], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 97.376/pb
+        [297429, 297435], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 199.191/pb
+        [297467, 297469], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 69.859/pb
+        [297483, 297488], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 471.448/pb
+        [297503, 297505], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v2, 268.446/pb
+        [297557, 297558], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 158.712/pb
+        [297562, 297563], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 106.785/pb
+        [297598, 297599], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 93.85/pb
+        [297603, 297606], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 276.775/pb
+        [297620, 297620], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 82.127/pb
+        [297656, 297656], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 93.083/pb
+        [297665, 297666], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 78.347/pb
+        [297670, 297670], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 2.132/pb
+        [297674, 297675], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 170.78/pb
+        [297722, 297723], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 142.686/pb
+        [298996, 298997], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 26.765/pb
+        [299000, 299000], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 8.038/pb
+        [299042, 299042], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 2.02/pb
+        [299061, 299062], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 123.32/pb
+        [299064, 299065], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 73.04/pb
+        [299067, 299067], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 68.807/pb
+        [299096, 299096], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 24.067/pb
+        [299149, 299149], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 108.249/pb
+        [299178, 299178], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 15.791/pb
+        [299180, 299180], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 15.575/pb
+        [299184, 299185], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 146.717/pb
+        [299327, 299327], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 15.178/pb
+        [299329, 299329], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v3, 37.487/pb
+        [299368, 299370], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 253.498/pb
+        [299380, 299381], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 66.094/pb
+        [299394, 299396], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 61.673/pb
+        [299420, 299420], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 13.23/pb
+        [299443, 299443], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 5.608/pb
+        [299450, 299450], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 12.395/pb
+        [299477, 299481], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 431.547/pb
+        [299593, 299595], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 268.091/pb
+        [299597, 299597], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 85.37/pb
+        [299649, 299649], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v4, 56.768/pb
+        [300087, 300087], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 12.856/pb
+        [300105, 300107], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 34.169/pb
+        [300117, 300117], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 6.067/pb
+        [300122, 300123], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 394.771/pb
+        [300155, 300157], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 461.282/pb
+        [300226, 300226], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 115.963/pb
+        [300233, 300240], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 435.357/pb
+        [300280, 300284], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 311.422/pb
+        [300364, 300375], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 59.002/pb
+        [300389, 300401], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 339.844/pb
+        [300459, 300459], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 81.507/pb
+        [300461, 300464], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 132.112/pb
+        [300466, 300467], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 202.273/pb
+        [300497, 300497], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 40.035/pb
+        [300514, 300517], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 379.864/pb
+        [300558, 300558], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 119.182/pb
+        [300560, 300560], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 140.271/pb
+        [300574, 300576], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 315.299/pb
+        [300631, 300633], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 167.565/pb
+        [300635, 300636], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 312.071/pb
+        [300673, 300676], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 23.1/pb
+        [300742, 300742], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 83.984/pb
+        [300777, 300777], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 130.415/pb
+        [300780, 300780], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 79.072/pb
+        [300785, 300785], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 212.774/pb
+        [300806, 300806], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 54.218/pb
+        [300811, 300812], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 159.497/pb
+        [300816, 300817], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v5, 134.15/pb
+        [301046, 301046], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 4.222/pb
+        [301141, 301142], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 97.203/pb
+        [301161, 301161], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 98.077/pb
+        [301165, 301165], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 15.465/pb
+        [301179, 301180], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 16.878/pb
+        [301183, 301183], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 45.299/pb
+        [301281, 301281], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 18.542/pb
+        [301283, 301283], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 120.005/pb
+        [301298, 301298], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 153.993/pb
+        [301323, 301323], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 165.06/pb
+        [301330, 301330], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 64.443/pb
+        [301359, 301359], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 57.278/pb
+        [301384, 301384], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 94.354/pb
+        [301391, 301393], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 147.405/pb
+        [301396, 301399], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 110.63/pb
+        [301417, 301417], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 67.689/pb
+        [301447, 301450], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 188.658/pb
+        [301461, 301461], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 98.122/pb
+        [301472, 301472], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 138.033/pb
+        [301475, 301476], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 109.336/pb
+        [301519, 301519], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 33.367/pb
+        [301524, 301524], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 41.078/pb
+        [301529, 301532], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 131.943/pb
+        [301567, 301567], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 63.339/pb
+        [301627, 301627], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 131.459/pb
+        [301664, 301665], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 138.42/pb
+        [301694, 301694], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 17.576/pb
+        [301912, 301914], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 79.784/pb
+        [301941, 301941], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 74.507/pb
+        [301959, 301960], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 290.104/pb
+        [301970, 301970], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 22.349/pb
+        [301984, 301987], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 292.622/pb
+        [301997, 301998], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 282.538/pb
+        [302019, 302019], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v6, 9.113/pb
+        [302026, 302026], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 4.652/pb
+        [302029, 302029], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 15.282/pb
+        [302031, 302031], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 128.522/pb
+        [302033, 302034], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 5.657/pb
+        [302037, 302038], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 0.069/pb
+        [302040, 302043], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 104.438/pb
+        [302131, 302131], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 111.635/pb
+        [302159, 302159], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 16.077/pb
+        [302163, 302163], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 146.312/pb
+        [302165, 302166], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 8.409/pb
+        [302225, 302225], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 114.788/pb
+        [302228, 302229], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 105.812/pb
+        [302240, 302240], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 138.868/pb
+        [302262, 302263], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 241.353/pb
+        [302277, 302277], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 53.761/pb
+        [302279, 302280], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 18.474/pb
+        [302322, 302322], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 96.87/pb
+        [302328, 302328], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 93.45/pb
+        [302337, 302337], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 20.377/pb
+        [302342, 302344], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 91.05/pb
+        [302350, 302350], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 16.493/pb
+        [302388, 302388], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 126.264/pb
+        [302392, 302393], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 232.234/pb
+        [302448, 302448], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 307.867/pb
+        [302472, 302476], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 292.111/pb
+        [302479, 302479], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 68.381/pb
+        [302484, 302485], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 209.762/pb
+        [302492, 302494], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v7, 93.282/pb
+        [302509, 302509], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 4.987/pb
+        [302513, 302513], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 12.203/pb
+        [302522, 302523], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 11.257/pb
+        [302525, 302526], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 223.119/pb
+        [302548, 302548], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 15.74/pb
+        [302551, 302551], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 0.104/pb
+        [302553, 302555], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 39.038/pb
+        [302563, 302563], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 0.32/pb
+        [302565, 302565], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 0.149/pb
+        [302572, 302573], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 241.684/pb
+        [302596, 302597], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 318.295/pb
+        [302634, 302635], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 300.859/pb
+        [302651, 302651], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 30.035/pb
+        [302654, 302654], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 63.967/pb
+        [302661, 302661], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 9.465/pb
+        [302663, 302663], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 134.254/pb
+        [303825, 303825], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 22.834/pb
+        [303832, 303832], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 321.326/pb
+        [303838, 303838], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 380.035/pb
+        [303885, 303885], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 400.159/pb
+        [303948, 303948], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 351.61/pb
+        [303998, 304000], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 256.409/pb
+        [304062, 304062], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 382.105/pb
+        [304119, 304120], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 93.285/pb
+        [304125, 304125], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 338.101/pb
+        [304144, 304144], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 533.881/pb
+        [304158, 304158], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 370.885/pb
+        [304169, 304170], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 414.145/pb
+        [304199, 304200], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 88.201/pb
+        [304204, 304204], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 153.182/pb
+        [304209, 304209], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 116.174/pb
+        [304291, 304292], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 350.613/pb
+        [304333, 304333], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 366.646/pb
+        [304354, 304354], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 68.255/pb
+        [304366, 304366], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 419.018/pb
+        [304446, 304447], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 385.306/pb
+        [304451, 304451], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 7.416/pb
+        [304505, 304508], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 425.864/pb
+        [304562, 304562], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 221.934/pb
+        [304616, 304616], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 253.369/pb
+        [304625, 304626], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 138.626/pb
+        [304654, 304655], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 403.545/pb
+        [304661, 304663], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 266.757/pb
+        [304671, 304672], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 320.532/pb
+        [304737, 304740], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 474.819/pb
+        [304776, 304778], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 432.15/pb
+        [304797, 304797], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 557.403/pb
+        [305044, 305046], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 378.033/pb
+        [305059, 305059], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 157.786/pb
+        [305062, 305064], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 390.89/pb
+        [305081, 305081], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 315.14/pb
+        [305112, 305114], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 497.055/pb
+        [305178, 305184], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 100.554/pb
+        [305186, 305186], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 122.05/pb
+        [305188, 305188], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 198.33/pb
+        [305202, 305202], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 207.76/pb
+        [305204, 305204], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 254.513/pb
+        [305207, 305208], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 401.157/pb
+        [305234, 305234], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 12.655/pb
+        [305236, 305237], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 344.353/pb
+        [305247, 305248], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 380.308/pb
+        [305252, 305252], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 95.04/pb
+        [305282, 305282], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 44.345/pb
+        [305310, 305314], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 481.671/pb
+        [305336, 305336], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 66.203/pb
+        [305338, 305338], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 33.112/pb
+        [305341, 305341], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 151.78/pb
+        [305349, 305351], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 186.042/pb
+        [305358, 305358], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 49.594/pb
+        [305364, 305366], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 511.673/pb
+        [305376, 305377], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 431.522/pb
+        [305405, 305406], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 475.515/pb
+        [305440, 305441], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 119.869/pb
+        [305516, 305518], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 438.593/pb
+        [305586, 305586], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 171.033/pb
+        [305589, 305590], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 314.815/pb
+        [305636, 305636], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 525.22/pb
+        [305766, 305766], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 263.689/pb
+        [305809, 305809], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 45.952/pb
+        [305814, 305814], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 446.804/pb
+        [305821, 305821], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 240.463/pb
+        [305832, 305832], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 58.021/pb
+        [305840, 305840], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 251.347/pb
+        [305842, 305842], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 114.87/pb
+        [305862, 305862], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 202.189/pb
+        [305898, 305898], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 230.935/pb
+        [305902, 305902], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 154.345/pb
+        [305967, 305967], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v8, 10.508/pb
+        [306029, 306030], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 44.125/pb
+        [306036, 306038], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 56.442/pb
+        [306041, 306042], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 200.189/pb
+        [306048, 306049], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 107.334/pb
+        [306051, 306051], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 70.67/pb
+        [306091, 306092], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 280.74/pb
+        [306095, 306095], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 49.131/pb
+        [306121, 306122], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 69.307/pb
+        [306125, 306126], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 590.489/pb
+        [306134, 306135], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 336.473/pb
+        [306138, 306139], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 312.896/pb
+        [306153, 306155], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 580.683/pb
+        [306169, 306171], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v9, 103.163/pb
+        [306418, 306420], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 73.423/pb
+        [306422, 306423], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 120.463/pb
+        [306432, 306432], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 33.338/pb
+        [306454, 306460], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v1, 94.725/pb
+        [297056, 297057], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v1, 143.741/pb
+        [297099, 297101], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 241.495/pb
+        [297113, 297114], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 85.001/pb
+        [297175, 297178], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 280.582/pb
+        [297215, 297215], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 12.287/pb
+        [297218, 297219], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 425.447/pb
+        [297224, 297225], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 13.81/pb
+        [297227, 297227], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 15.669/pb
+        [297292, 297293], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 198.677/pb
+        [297296, 297296], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 84.207/pb
+        [297308, 297308], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 6.298/pb
+        [297359, 297359], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 13.795/pb
+        [297411, 297411], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 201.578/pb
+        [297424, 297426], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 97.376/pb
+        [297429, 297435], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 199.191/pb
+        [297467, 297469], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 69.859/pb
+        [297483, 297488], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 471.448/pb
+        [297503, 297505], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v2, 268.446/pb
+        [297557, 297558], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 158.712/pb
+        [297562, 297563], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 106.785/pb
+        [297598, 297599], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 93.85/pb
+        [297603, 297606], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 276.775/pb
+        [297620, 297620], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 82.127/pb
+        [297656, 297656], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 93.083/pb
+        [297665, 297666], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 78.347/pb
+        [297670, 297670], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 2.132/pb
+        [297674, 297675], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 170.78/pb
+        [297722, 297723], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 142.686/pb
+        [298996, 298997], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 26.765/pb
+        [299000, 299000], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 8.038/pb
+        [299042, 299042], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 2.02/pb
+        [299061, 299062], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 123.32/pb
+        [299064, 299065], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 73.04/pb
+        [299067, 299067], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 68.807/pb
+        [299096, 299096], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 24.067/pb
+        [299149, 299149], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 108.249/pb
+        [299178, 299178], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 15.791/pb
+        [299180, 299180], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 15.575/pb
+        [299184, 299185], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 146.717/pb
+        [299327, 299327], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 15.178/pb
+        [299329, 299329], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v3, 37.487/pb
+        [299368, 299370], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 253.498/pb
+        [299380, 299381], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 66.094/pb
+        [299394, 299396], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 61.673/pb
+        [299420, 299420], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 13.23/pb
+        [299443, 299443], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 5.608/pb
+        [299450, 299450], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 12.395/pb
+        [299477, 299481], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 431.547/pb
+        [299593, 299595], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 268.091/pb
+        [299597, 299597], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 85.37/pb
+        [299649, 299649], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v4, 56.768/pb
+        [300087, 300087], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 12.856/pb
+        [300105, 300107], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 34.169/pb
+        [300117, 300117], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 6.067/pb
+        [300122, 300123], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 394.771/pb
+        [300155, 300157], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 461.282/pb
+        [300226, 300226], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 115.963/pb
+        [300233, 300240], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 435.357/pb
+        [300280, 300284], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 311.422/pb
+        [300364, 300375], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 59.002/pb
+        [300389, 300401], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 339.844/pb
+        [300459, 300459], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 81.507/pb
+        [300461, 300464], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 132.112/pb
+        [300466, 300467], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 202.273/pb
+        [300497, 300497], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 40.035/pb
+        [300514, 300517], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 379.864/pb
+        [300558, 300558], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 119.182/pb
+        [300560, 300560], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 140.271/pb
+        [300574, 300576], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 315.299/pb
+        [300631, 300633], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 167.565/pb
+        [300635, 300636], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 312.071/pb
+        [300673, 300676], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 23.1/pb
+        [300742, 300742], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 83.984/pb
+        [300777, 300777], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 130.415/pb
+        [300780, 300780], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 79.072/pb
+        [300785, 300785], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 212.774/pb
+        [300806, 300806], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 54.218/pb
+        [300811, 300812], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 159.497/pb
+        [300816, 300817], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v5, 134.15/pb
+        [301046, 301046], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 4.222/pb
+        [301141, 301142], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 97.203/pb
+        [301161, 301161], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 98.077/pb
+        [301165, 301165], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 15.465/pb
+        [301179, 301180], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 16.878/pb
+        [301183, 301183], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 45.299/pb
+        [301281, 301281], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 18.542/pb
+        [301283, 301283], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 120.005/pb
+        [301298, 301298], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 153.993/pb
+        [301323, 301323], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 165.06/pb
+        [301330, 301330], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 64.443/pb
+        [301359, 301359], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 57.278/pb
+        [301384, 301384], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 94.354/pb
+        [301391, 301393], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 147.405/pb
+        [301396, 301399], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 110.63/pb
+        [301417, 301417], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 67.689/pb
+        [301447, 301450], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 188.658/pb
+        [301461, 301461], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 98.122/pb
+        [301472, 301472], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 138.033/pb
+        [301475, 301476], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 109.336/pb
+        [301519, 301519], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 33.367/pb
+        [301524, 301524], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 41.078/pb
+        [301529, 301532], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 131.943/pb
+        [301567, 301567], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 63.339/pb
+        [301627, 301627], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 131.459/pb
+        [301664, 301665], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 138.42/pb
+        [301694, 301694], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 17.576/pb
+        [301912, 301914], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 79.784/pb
+        [301941, 301941], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 74.507/pb
+        [301959, 301960], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 290.104/pb
+        [301970, 301970], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 22.349/pb
+        [301984, 301987], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 292.622/pb
+        [301997, 301998], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 282.538/pb
+        [302019, 302019], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v6, 9.113/pb
+        [302026, 302026], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 4.652/pb
+        [302029, 302029], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 15.282/pb
+        [302031, 302031], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 128.522/pb
+        [302033, 302034], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 5.657/pb
+        [302037, 302038], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 0.069/pb
+        [302040, 302043], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 104.438/pb
+        [302131, 302131], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 111.635/pb
+        [302159, 302159], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 16.077/pb
+        [302163, 302163], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 146.312/pb
+        [302165, 302166], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 8.409/pb
+        [302225, 302225], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 114.788/pb
+        [302228, 302229], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 105.812/pb
+        [302240, 302240], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 138.868/pb
+        [302262, 302263], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 241.353/pb
+        [302277, 302277], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 53.761/pb
+        [302279, 302280], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 18.474/pb
+        [302322, 302322], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 96.87/pb
+        [302328, 302328], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 93.45/pb
+        [302337, 302337], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 20.377/pb
+        [302342, 302344], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 91.05/pb
+        [302350, 302350], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 16.493/pb
+        [302388, 302388], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 126.264/pb
+        [302392, 302393], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 232.234/pb
+        [302448, 302448], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 307.867/pb
+        [302472, 302476], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 292.111/pb
+        [302479, 302479], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 68.381/pb
+        [302484, 302485], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 209.762/pb
+        [302492, 302494], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v7, 93.282/pb
+        [302509, 302509], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 4.987/pb
+        [302513, 302513], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 12.203/pb
+        [302522, 302523], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 11.257/pb
+        [302525, 302526], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 223.119/pb
+        [302548, 302548], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 15.74/pb
+        [302551, 302551], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 0.104/pb
+        [302553, 302555], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 39.038/pb
+        [302563, 302563], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 0.32/pb
+        [302565, 302565], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 0.149/pb
+        [302572, 302573], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 241.684/pb
+        [302596, 302597], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 318.295/pb
+        [302634, 302635], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 300.859/pb
+        [302651, 302651], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 30.035/pb
+        [302654, 302654], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 63.967/pb
+        [302661, 302661], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 9.465/pb
+        [302663, 302663], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 134.254/pb
+        [303825, 303825], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 22.834/pb
+        [303832, 303832], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 321.326/pb
+        [303838, 303838], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 380.035/pb
+        [303885, 303885], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 400.159/pb
+        [303948, 303948], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 351.61/pb
+        [303998, 304000], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 256.409/pb
+        [304062, 304062], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 382.105/pb
+        [304119, 304120], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 93.285/pb
+        [304125, 304125], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 338.101/pb
+        [304144, 304144], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 533.881/pb
+        [304158, 304158], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 370.885/pb
+        [304169, 304170], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 414.145/pb
+        [304199, 304200], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 88.201/pb
+        [304204, 304204], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 153.182/pb
+        [304209, 304209], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 116.174/pb
+        [304291, 304292], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 350.613/pb
+        [304333, 304333], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 366.646/pb
+        [304354, 304354], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 68.255/pb
+        [304366, 304366], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 419.018/pb
+        [304446, 304447], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 385.306/pb
+        [304451, 304451], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 7.416/pb
+        [304505, 304508], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 425.864/pb
+        [304562, 304562], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 221.934/pb
+        [304616, 304616], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 253.369/pb
+        [304625, 304626], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 138.626/pb
+        [304654, 304655], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 403.545/pb
+        [304661, 304663], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 266.757/pb
+        [304671, 304672], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 320.532/pb
+        [304737, 304740], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 474.819/pb
+        [304776, 304778], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 432.15/pb
+        [304797, 304797], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 557.403/pb
+        [305044, 305046], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 378.033/pb
+        [305059, 305059], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 157.786/pb
+        [305062, 305064], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 390.89/pb
+        [305081, 305081], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 315.14/pb
+        [305112, 305114], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 497.055/pb
+        [305178, 305184], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 100.554/pb
+        [305186, 305186], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 122.05/pb
+        [305188, 305188], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 198.33/pb
+        [305202, 305202], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 207.76/pb
+        [305204, 305204], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 254.513/pb
+        [305207, 305208], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 401.157/pb
+        [305234, 305234], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 12.655/pb
+        [305236, 305237], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 344.353/pb
+        [305247, 305248], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 380.308/pb
+        [305252, 305252], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 95.04/pb
+        [305282, 305282], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 44.345/pb
+        [305310, 305314], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 481.671/pb
+        [305336, 305336], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 66.203/pb
+        [305338, 305338], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 33.112/pb
+        [305341, 305341], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 151.78/pb
+        [305349, 305351], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 186.042/pb
+        [305358, 305358], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 49.594/pb
+        [305364, 305366], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 511.673/pb
+        [305376, 305377], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 431.522/pb
+        [305405, 305406], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 475.515/pb
+        [305440, 305441], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 119.869/pb
+        [305516, 305518], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 438.593/pb
+        [305586, 305586], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 171.033/pb
+        [305589, 305590], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 314.815/pb
+        [305636, 305636], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 525.22/pb
+        [305766, 305766], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 263.689/pb
+        [305809, 305809], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 45.952/pb
+        [305814, 305814], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 446.804/pb
+        [305821, 305821], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 240.463/pb
+        [305832, 305832], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 58.021/pb
+        [305840, 305840], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 251.347/pb
+        [305842, 305842], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 114.87/pb
+        [305862, 305862], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 202.189/pb
+        [305898, 305898], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 230.935/pb
+        [305902, 305902], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 154.345/pb
+        [305967, 305967], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v8, 10.508/pb
+        [306029, 306030], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 44.125/pb
+        [306036, 306038], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 56.442/pb
+        [306041, 306042], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 200.189/pb
+        [306048, 306049], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 107.334/pb
+        [306051, 306051], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 70.67/pb
+        [306091, 306092], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 280.74/pb
+        [306095, 306095], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 49.131/pb
+        [306121, 306122], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 69.307/pb
+        [306125, 306126], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 590.489/pb
+        [306134, 306135], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 336.473/pb
+        [306138, 306139], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 312.896/pb
+        [306153, 306155], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 580.683/pb
+        [306169, 306171], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v9, 103.163/pb
+        [306418, 306420], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 73.423/pb
+        [306422, 306423], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 120.463/pb
+        [306432, 306432], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 33.338/pb
+        [306454, 306460], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 635.031/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg',
+      'unprescaled' : True,
+      'runs'        : [
+        [297050, 297050], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v1, 94.725/pb
+        [297056, 297057], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v1, 143.741/pb
+        [297099, 297101], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 241.495/pb
+        [297113, 297114], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 85.001/pb
+        [297175, 297178], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 280.582/pb
+        [297215, 297215], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 12.287/pb
+        [297218, 297219], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 425.447/pb
+        [297224, 297225], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 13.81/pb
+        [297227, 297227], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 15.669/pb
+        [297292, 297293], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 198.677/pb
+        [297296, 297296], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 84.207/pb
+        [297308, 297308], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 6.298/pb
+        [297359, 297359], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 13.795/pb
+        [297411, 297411], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 201.578/pb
+        [297424, 297426], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 97.376/pb
+        [297429, 297435], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 199.191/pb
+        [297467, 297469], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 69.859/pb
+        [297483, 297488], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 471.448/pb
+        [297503, 297505], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v2, 268.446/pb
+        [297557, 297558], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 158.712/pb
+        [297562, 297563], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 106.785/pb
+        [297598, 297599], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 93.85/pb
+        [297603, 297606], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 276.775/pb
+        [297620, 297620], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 82.127/pb
+        [297656, 297656], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 93.083/pb
+        [297665, 297666], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 78.347/pb
+        [297670, 297670], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 2.132/pb
+        [297674, 297675], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 170.78/pb
+        [297722, 297723], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 142.686/pb
+        [298996, 298997], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 26.765/pb
+        [299000, 299000], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 8.038/pb
+        [299042, 299042], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 2.02/pb
+        [299061, 299062], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 123.32/pb
+        [299064, 299065], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 73.04/pb
+        [299067, 299067], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 68.807/pb
+        [299096, 299096], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 24.067/pb
+        [299149, 299149], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 108.249/pb
+        [299178, 299178], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 15.791/pb
+        [299180, 299180], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 15.575/pb
+        [299184, 299185], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 146.717/pb
+        [299327, 299327], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 15.178/pb
+        [299329, 299329], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v3, 37.487/pb
+        [299368, 299370], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 253.498/pb
+        [299380, 299381], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 66.094/pb
+        [299394, 299396], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 61.673/pb
+        [299420, 299420], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 13.23/pb
+        [299443, 299443], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 5.608/pb
+        [299450, 299450], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 12.395/pb
+        [299477, 299481], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 431.547/pb
+        [299593, 299595], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 268.091/pb
+        [299597, 299597], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 85.37/pb
+        [299649, 299649], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v4, 56.768/pb
+        [300087, 300087], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 12.856/pb
+        [300105, 300107], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 34.169/pb
+        [300117, 300117], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 6.067/pb
+        [300122, 300123], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 394.771/pb
+        [300155, 300157], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 461.282/pb
+        [300226, 300226], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 115.963/pb
+        [300233, 300240], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 435.357/pb
+        [300280, 300284], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 311.422/pb
+        [300364, 300375], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 59.002/pb
+        [300389, 300401], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 339.844/pb
+        [300459, 300459], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 81.507/pb
+        [300461, 300464], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 132.112/pb
+        [300466, 300467], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 202.273/pb
+        [300497, 300497], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 40.035/pb
+        [300514, 300517], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 379.864/pb
+        [300558, 300558], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 119.182/pb
+        [300560, 300560], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 140.271/pb
+        [300574, 300576], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 315.299/pb
+        [300631, 300633], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 167.565/pb
+        [300635, 300636], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 312.071/pb
+        [300673, 300676], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 23.1/pb
+        [300742, 300742], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 83.984/pb
+        [300777, 300777], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 130.415/pb
+        [300780, 300780], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 79.072/pb
+        [300785, 300785], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 212.774/pb
+        [300806, 300806], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 54.218/pb
+        [300811, 300812], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 159.497/pb
+        [300816, 300817], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v5, 134.15/pb
+        [301046, 301046], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 4.222/pb
+        [301141, 301142], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 97.203/pb
+        [301161, 301161], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 98.077/pb
+        [301165, 301165], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 15.465/pb
+        [301179, 301180], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 16.878/pb
+        [301183, 301183], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 45.299/pb
+        [301281, 301281], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 18.542/pb
+        [301283, 301283], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 120.005/pb
+        [301298, 301298], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 153.993/pb
+        [301323, 301323], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 165.06/pb
+        [301330, 301330], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 64.443/pb
+        [301359, 301359], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 57.278/pb
+        [301384, 301384], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 94.354/pb
+        [301391, 301393], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 147.405/pb
+        [301396, 301399], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 110.63/pb
+        [301417, 301417], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 67.689/pb
+        [301447, 301450], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 188.658/pb
+        [301461, 301461], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 98.122/pb
+        [301472, 301472], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 138.033/pb
+        [301475, 301476], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 109.336/pb
+        [301519, 301519], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 33.367/pb
+        [301524, 301524], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 41.078/pb
+        [301529, 301532], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 131.943/pb
+        [301567, 301567], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 63.339/pb
+        [301627, 301627], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 131.459/pb
+        [301664, 301665], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 138.42/pb
+        [301694, 301694], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 17.576/pb
+        [301912, 301914], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 79.784/pb
+        [301941, 301941], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 74.507/pb
+        [301959, 301960], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 290.104/pb
+        [301970, 301970], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 22.349/pb
+        [301984, 301987], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 292.622/pb
+        [301997, 301998], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 282.538/pb
+        [302019, 302019], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v6, 9.113/pb
+        [302026, 302026], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 4.652/pb
+        [302029, 302029], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 15.282/pb
+        [302031, 302031], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 128.522/pb
+        [302033, 302034], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 5.657/pb
+        [302037, 302038], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 0.069/pb
+        [302040, 302043], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 104.438/pb
+        [302131, 302131], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 111.635/pb
+        [302159, 302159], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 16.077/pb
+        [302163, 302163], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 146.312/pb
+        [302165, 302166], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 8.409/pb
+        [302225, 302225], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 114.788/pb
+        [302228, 302229], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 105.812/pb
+        [302240, 302240], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 138.868/pb
+        [302262, 302263], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 241.353/pb
+        [302277, 302277], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 53.761/pb
+        [302279, 302280], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 18.474/pb
+        [302322, 302322], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 96.87/pb
+        [302328, 302328], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 93.45/pb
+        [302337, 302337], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 20.377/pb
+        [302342, 302344], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 91.05/pb
+        [302350, 302350], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 16.493/pb
+        [302388, 302388], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 126.264/pb
+        [302392, 302393], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 232.234/pb
+        [302448, 302448], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 307.867/pb
+        [302472, 302476], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 292.111/pb
+        [302479, 302479], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 68.381/pb
+        [302484, 302485], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 209.762/pb
+        [302492, 302494], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v7, 93.282/pb
+        [302509, 302509], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 4.987/pb
+        [302513, 302513], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 12.203/pb
+        [302522, 302523], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 11.257/pb
+        [302525, 302526], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 223.119/pb
+        [302548, 302548], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 15.74/pb
+        [302551, 302551], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 0.104/pb
+        [302553, 302555], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 39.038/pb
+        [302563, 302563], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 0.32/pb
+        [302565, 302565], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 0.149/pb
+        [302572, 302573], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 241.684/pb
+        [302596, 302597], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 318.295/pb
+        [302634, 302635], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 300.859/pb
+        [302651, 302651], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 30.035/pb
+        [302654, 302654], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 63.967/pb
+        [302661, 302661], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 9.465/pb
+        [302663, 302663], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 134.254/pb
+        [303825, 303825], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 22.834/pb
+        [303832, 303832], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 321.326/pb
+        [303838, 303838], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 380.035/pb
+        [303885, 303885], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 400.159/pb
+        [303948, 303948], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 351.61/pb
+        [303998, 304000], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 256.409/pb
+        [304062, 304062], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 382.105/pb
+        [304119, 304120], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 93.285/pb
+        [304125, 304125], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 338.101/pb
+        [304144, 304144], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 533.881/pb
+        [304158, 304158], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 370.885/pb
+        [304169, 304170], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 414.145/pb
+        [304199, 304200], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 88.201/pb
+        [304204, 304204], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 153.182/pb
+        [304209, 304209], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 116.174/pb
+        [304291, 304292], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 350.613/pb
+        [304333, 304333], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 366.646/pb
+        [304354, 304354], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 68.255/pb
+        [304366, 304366], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 419.018/pb
+        [304446, 304447], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 385.306/pb
+        [304451, 304451], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 7.416/pb
+        [304505, 304508], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 425.864/pb
+        [304562, 304562], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 221.934/pb
+        [304616, 304616], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 253.369/pb
+        [304625, 304626], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 138.626/pb
+        [304654, 304655], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 403.545/pb
+        [304661, 304663], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 266.757/pb
+        [304671, 304672], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 320.532/pb
+        [304737, 304740], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 474.819/pb
+        [304776, 304778], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 432.15/pb
+        [304797, 304797], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 557.403/pb
+        [305044, 305046], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 378.033/pb
+        [305059, 305059], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 157.786/pb
+        [305062, 305064], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 390.89/pb
+        [305081, 305081], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 315.14/pb
+        [305112, 305114], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 497.055/pb
+        [305178, 305184], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 100.554/pb
+        [305186, 305186], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 122.05/pb
+        [305188, 305188], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 198.33/pb
+        [305202, 305202], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 207.76/pb
+        [305204, 305204], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 254.513/pb
+        [305207, 305208], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 401.157/pb
+        [305234, 305234], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 12.655/pb
+        [305236, 305237], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 344.353/pb
+        [305247, 305248], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 380.308/pb
+        [305252, 305252], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 95.04/pb
+        [305282, 305282], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 44.345/pb
+        [305310, 305314], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 481.671/pb
+        [305336, 305336], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 66.203/pb
+        [305338, 305338], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 33.112/pb
+        [305341, 305341], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 151.78/pb
+        [305349, 305351], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 186.042/pb
+        [305358, 305358], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 49.594/pb
+        [305364, 305366], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 511.673/pb
+        [305376, 305377], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 431.522/pb
+        [305405, 305406], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 475.515/pb
+        [305440, 305441], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 119.869/pb
+        [305516, 305518], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 438.593/pb
+        [305586, 305586], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 171.033/pb
+        [305589, 305590], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 314.815/pb
+        [305636, 305636], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 525.22/pb
+        [305766, 305766], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 263.689/pb
+        [305809, 305809], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 45.952/pb
+        [305814, 305814], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 446.804/pb
+        [305821, 305821], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 240.463/pb
+        [305832, 305832], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 58.021/pb
+        [305840, 305840], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 251.347/pb
+        [305842, 305842], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 114.87/pb
+        [305862, 305862], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 202.189/pb
+        [305898, 305898], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 230.935/pb
+        [305902, 305902], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 154.345/pb
+        [305967, 305967], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v8, 10.508/pb
+        [306029, 306030], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 44.125/pb
+        [306036, 306038], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 56.442/pb
+        [306041, 306042], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 200.189/pb
+        [306048, 306049], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 107.334/pb
+        [306051, 306051], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 70.67/pb
+        [306091, 306092], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 280.74/pb
+        [306095, 306095], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 49.131/pb
+        [306121, 306122], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 69.307/pb
+        [306125, 306126], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 590.489/pb
+        [306134, 306135], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 336.473/pb
+        [306138, 306139], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 312.896/pb
+        [306153, 306155], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 580.683/pb
+        [306169, 306171], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v9, 103.163/pb
+        [306418, 306420], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 73.423/pb
+        [306422, 306423], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 120.463/pb
+        [306432, 306432], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 33.338/pb
+        [306454, 306460], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 635.031/pb
+      ],
+    },
+  ],
+}
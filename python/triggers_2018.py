@@ -0,0 +1,6112 @@
+triggers_analysis = {
+  '3mu' : [
+    {
+      'name'        : 'HLT_TripleMu_12_10_5',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_TripleMu_12_10_5_v9, 7.929/pb
+        [315259, 315259], # HLT_TripleMu_12_10_5_v9, 13.919/pb
+        [315264, 315265], # HLT_TripleMu_12_10_5_v9, 46.158/pb
+        [315267, 315267], # HLT_TripleMu_12_10_5_v9, 37.143/pb
+        [315270, 315270], # HLT_TripleMu_12_10_5_v9, 78.981/pb
+        [315322, 315322], # HLT_TripleMu_12_10_5_v9, 180.063/pb
+        [315339, 315339], # HLT_TripleMu_12_10_5_v9, 93.349/pb
+        [315357, 315357], # HLT_TripleMu_12_10_5_v9, 151.931/pb
+        [315361, 315361], # HLT_TripleMu_12_10_5_v9, 118.532/pb
+        [315363, 315363], # HLT_TripleMu_12_10_5_v9, 14.489/pb
+        [315366, 315366], # HLT_TripleMu_12_10_5_v9, 100.183/pb
+        [315420, 315420], # HLT_TripleMu_12_10_5_v9, 258.566/pb
+        [315488, 315490], # HLT_TripleMu_12_10_5_v9, 296.522/pb
+        [315506, 315506], # HLT_TripleMu_12_10_5_v9, 27.983/pb
+        [315510, 315510], # HLT_TripleMu_12_10_5_v9, 103.172/pb
+        [315512, 315512], # HLT_TripleMu_12_10_5_v9, 236.871/pb
+        [315543, 315543], # HLT_TripleMu_12_10_5_v9, 36.886/pb
+        [315555, 315557], # HLT_TripleMu_12_10_5_v9, 114.498/pb
+        [315640, 315642], # HLT_TripleMu_12_10_5_v9, 43.181/pb
+        [315644, 315648], # HLT_TripleMu_12_10_5_v9, 439.459/pb
+        [315689, 315690], # HLT_TripleMu_12_10_5_v9, 448.961/pb
+        [315702, 315705], # HLT_TripleMu_12_10_5_v9, 328.569/pb
+        [315713, 315713], # HLT_TripleMu_12_10_5_v9, 353.735/pb
+        [315721, 315721], # HLT_TripleMu_12_10_5_v9, 210.579/pb
+        [315741, 315741], # HLT_TripleMu_12_10_5_v9, 23.717/pb
+        [315764, 315764], # HLT_TripleMu_12_10_5_v9, 114.011/pb
+        [315770, 315770], # HLT_TripleMu_12_10_5_v9, 121.796/pb
+        [315784, 315786], # HLT_TripleMu_12_10_5_v9, 179.651/pb
+        [315790, 315790], # HLT_TripleMu_12_10_5_v9, 173.124/pb
+        [315800, 315801], # HLT_TripleMu_12_10_5_v9, 304.75/pb
+        [315840, 315840], # HLT_TripleMu_12_10_5_v9, 354.111/pb
+        [315973, 315974], # HLT_TripleMu_12_10_5_v9, 297.118/pb
+        [316058, 316062], # HLT_TripleMu_12_10_5_v9, 512.949/pb
+        [316082, 316082], # HLT_TripleMu_12_10_5_v9, 141.36/pb
+        [316110, 316111], # HLT_TripleMu_12_10_5_v9, 97.131/pb
+        [316113, 316114], # HLT_TripleMu_12_10_5_v9, 388.486/pb
+        [316153, 316153], # HLT_TripleMu_12_10_5_v9, 256.24/pb
+        [316186, 316187], # HLT_TripleMu_12_10_5_v9, 527.582/pb
+        [316199, 316202], # HLT_TripleMu_12_10_5_v9, 589.387/pb
+        [316216, 316219], # HLT_TripleMu_12_10_5_v9, 551.849/pb
+        [316239, 316241], # HLT_TripleMu_12_10_5_v9, 546.196/pb
+        [316271, 316271], # HLT_TripleMu_12_10_5_v9, 29.698/pb
+        [316361, 316363], # HLT_TripleMu_12_10_5_v10, 84.941/pb
+        [316377, 316380], # HLT_TripleMu_12_10_5_v10, 188.825/pb
+        [316455, 316455], # HLT_TripleMu_12_10_5_v10, 9.607/pb
+        [316457, 316457], # HLT_TripleMu_12_10_5_v10, 326.273/pb
+        [316469, 316470], # HLT_TripleMu_12_10_5_v10, 265.747/pb
+        [316472, 316472], # HLT_TripleMu_12_10_5_v10, 66.237/pb
+        [316505, 316505], # HLT_TripleMu_12_10_5_v10, 401.22/pb
+        [316569, 316569], # HLT_TripleMu_12_10_5_v10, 485.569/pb
+        [316590, 316590], # HLT_TripleMu_12_10_5_v10, 189.247/pb
+        [316613, 316613], # HLT_TripleMu_12_10_5_v10, 31.466/pb
+        [316615, 316615], # HLT_TripleMu_12_10_5_v10, 49.127/pb
+        [316666, 316667], # HLT_TripleMu_12_10_5_v10, 321.521/pb
+        [316700, 316702], # HLT_TripleMu_12_10_5_v10, 353.699/pb
+        [316715, 316723], # HLT_TripleMu_12_10_5_v10, 440.225/pb
+        [316758, 316758], # HLT_TripleMu_12_10_5_v10, 455.683/pb
+        [316766, 316766], # HLT_TripleMu_12_10_5_v10, 561.053/pb
+        [316876, 316877], # HLT_TripleMu_12_10_5_v10, 327.431/pb
+        [316879, 316879], # HLT_TripleMu_12_10_5_v10, 36.513/pb
+        [316928, 316928], # HLT_TripleMu_12_10_5_v10, 44.417/pb
+        [316985, 316985], # HLT_TripleMu_12_10_5_v10, 172.546/pb
+        [316993, 316995], # HLT_TripleMu_12_10_5_v10, 265.445/pb
+        [317080, 317080], # HLT_TripleMu_12_10_5_v10, 7.844/pb
+        [317087, 317087], # HLT_TripleMu_12_10_5_v10, 243.2/pb
+        [317089, 317089], # HLT_TripleMu_12_10_5_v10, 212.905/pb
+        [317182, 317182], # HLT_TripleMu_12_10_5_v10, 406.207/pb
+        [317212, 317213], # HLT_TripleMu_12_10_5_v10, 176.661/pb
+        [317279, 317279], # HLT_TripleMu_12_10_5_v10, 65.892/pb
+        [317291, 317292], # HLT_TripleMu_12_10_5_v10, 359.036/pb
+        [317297, 317297], # HLT_TripleMu_12_10_5_v10, 123.799/pb
+        [317319, 317320], # HLT_TripleMu_12_10_5_v10, 514.282/pb
+        [317338, 317340], # HLT_TripleMu_12_10_5_v10, 219.977/pb
+        [317382, 317383], # HLT_TripleMu_12_10_5_v10, 46.591/pb
+        [317391, 317392], # HLT_TripleMu_12_10_5_v10, 493.374/pb
+        [317435, 317435], # HLT_TripleMu_12_10_5_v10, 360.613/pb
+        [317438, 317438], # HLT_TripleMu_12_10_5_v10, 49.71/pb
+        [317475, 317475], # HLT_TripleMu_12_10_5_v10, 25.761/pb
+        [317478, 317478], # HLT_TripleMu_12_10_5_v10, 7.937/pb
+        [317484, 317484], # HLT_TripleMu_12_10_5_v10, 160.356/pb
+        [317488, 317488], # HLT_TripleMu_12_10_5_v10, 181.128/pb
+        [317527, 317527], # HLT_TripleMu_12_10_5_v10, 452.099/pb
+        [317591, 317591], # HLT_TripleMu_12_10_5_v10, 111.117/pb
+        [317626, 317626], # HLT_TripleMu_12_10_5_v10, 528.94/pb
+        [317640, 317641], # HLT_TripleMu_12_10_5_v10, 529.494/pb
+        [317648, 317650], # HLT_TripleMu_12_10_5_v10, 483.09/pb
+        [317661, 317661], # HLT_TripleMu_12_10_5_v10, 375.651/pb
+        [317663, 317663], # HLT_TripleMu_12_10_5_v10, 153.301/pb
+        [317683, 317683], # HLT_TripleMu_12_10_5_v10, 117.852/pb
+        [317696, 317696], # HLT_TripleMu_12_10_5_v10, 228.787/pb
+        [318733, 318733], # HLT_TripleMu_12_10_5_v10, 2.792/pb
+        [318828, 318828], # HLT_TripleMu_12_10_5_v10, 13.229/pb
+        [318872, 318872], # HLT_TripleMu_12_10_5_v10, 91.855/pb
+        [318874, 318874], # HLT_TripleMu_12_10_5_v10, 99.565/pb
+        [318876, 318877], # HLT_TripleMu_12_10_5_v10, 207.136/pb
+        [319077, 319077], # HLT_TripleMu_12_10_5_v10, 16.372/pb
+        [319337, 319337], # HLT_TripleMu_12_10_5_v10, 232.389/pb
+        [319347, 319349], # HLT_TripleMu_12_10_5_v10, 256.706/pb
+        [319449, 319450], # HLT_TripleMu_12_10_5_v10, 456.219/pb
+        [319456, 319456], # HLT_TripleMu_12_10_5_v10, 52.016/pb
+        [319459, 319459], # HLT_TripleMu_12_10_5_v10, 17.212/pb
+        [319486, 319486], # HLT_TripleMu_12_10_5_v10, 20.315/pb
+        [319503, 319503], # HLT_TripleMu_12_10_5_v10, 90.959/pb
+        [319524, 319524], # HLT_TripleMu_12_10_5_v10, 456.701/pb
+        [319526, 319526], # HLT_TripleMu_12_10_5_v10, 69.66/pb
+        [319528, 319528], # HLT_TripleMu_12_10_5_v10, 58.411/pb
+        [319579, 319579], # HLT_TripleMu_12_10_5_v10, 818.49/pb
+        [319625, 319625], # HLT_TripleMu_12_10_5_v10, 70.596/pb
+        [319639, 319639], # HLT_TripleMu_12_10_5_v10, 409.34/pb
+        [319656, 319659], # HLT_TripleMu_12_10_5_v10, 221.8/pb
+        [319678, 319678], # HLT_TripleMu_12_10_5_v10, 95.425/pb
+        [319687, 319687], # HLT_TripleMu_12_10_5_v10, 16.053/pb
+        [319697, 319698], # HLT_TripleMu_12_10_5_v10, 96.857/pb
+        [319756, 319756], # HLT_TripleMu_12_10_5_v10, 490.205/pb
+        [319840, 319841], # HLT_TripleMu_12_10_5_v10, 69.999/pb
+        [319847, 319849], # HLT_TripleMu_12_10_5_v10, 193.537/pb
+        [319851, 319851], # HLT_TripleMu_12_10_5_v10, 1.137/pb
+        [319853, 319854], # HLT_TripleMu_12_10_5_v10, 124.92/pb
+        [319908, 319910], # HLT_TripleMu_12_10_5_v10, 324.281/pb
+        [319912, 319915], # HLT_TripleMu_12_10_5_v10, 119.686/pb
+        [319941, 319942], # HLT_TripleMu_12_10_5_v10, 111.886/pb
+        [319950, 319950], # HLT_TripleMu_12_10_5_v10, 65.936/pb
+        [319991, 319993], # HLT_TripleMu_12_10_5_v10, 530.374/pb
+        [320002, 320002], # HLT_TripleMu_12_10_5_v10, 50.203/pb
+        [320006, 320006], # HLT_TripleMu_12_10_5_v10, 114.14/pb
+        [320010, 320012], # HLT_TripleMu_12_10_5_v10, 153.875/pb
+        [320023, 320026], # HLT_TripleMu_12_10_5_v10, 305.475/pb
+        [320038, 320040], # HLT_TripleMu_12_10_5_v10, 404.341/pb
+        [320059, 320065], # HLT_TripleMu_12_10_5_v10, 395.979/pb
+        [320673, 320674], # HLT_TripleMu_12_10_5_v10, 98.341/pb
+        [320688, 320688], # HLT_TripleMu_12_10_5_v10, 130.855/pb
+        [320712, 320712], # HLT_TripleMu_12_10_5_v10, 69.58/pb
+        [320757, 320757], # HLT_TripleMu_12_10_5_v10, 116.684/pb
+        [320804, 320804], # HLT_TripleMu_12_10_5_v10, 319.033/pb
+        [320807, 320807], # HLT_TripleMu_12_10_5_v10, 0.348/pb
+        [320809, 320809], # HLT_TripleMu_12_10_5_v10, 106.231/pb
+        [320821, 320824], # HLT_TripleMu_12_10_5_v10, 454.293/pb
+        [320838, 320838], # HLT_TripleMu_12_10_5_v10, 92.366/pb
+        [320840, 320841], # HLT_TripleMu_12_10_5_v10, 191.511/pb
+        [320853, 320859], # HLT_TripleMu_12_10_5_v10, 433.068/pb
+        [320887, 320888], # HLT_TripleMu_12_10_5_v10, 113.862/pb
+        [320916, 320917], # HLT_TripleMu_12_10_5_v10, 484.437/pb
+        [320920, 320920], # HLT_TripleMu_12_10_5_v10, 24.013/pb
+        [320933, 320934], # HLT_TripleMu_12_10_5_v10, 262.426/pb
+        [320936, 320936], # HLT_TripleMu_12_10_5_v10, 78.32/pb
+        [320941, 320941], # HLT_TripleMu_12_10_5_v10, 15.638/pb
+        [320980, 320980], # HLT_TripleMu_12_10_5_v10, 38.408/pb
+        [320995, 320996], # HLT_TripleMu_12_10_5_v10, 74.084/pb
+        [321004, 321007], # HLT_TripleMu_12_10_5_v10, 320.57/pb
+        [321009, 321012], # HLT_TripleMu_12_10_5_v10, 105.863/pb
+        [321051, 321051], # HLT_TripleMu_12_10_5_v10, 311.577/pb
+        [321055, 321055], # HLT_TripleMu_12_10_5_v10, 125.495/pb
+        [321067, 321069], # HLT_TripleMu_12_10_5_v10, 369.401/pb
+        [321119, 321119], # HLT_TripleMu_12_10_5_v10, 58.668/pb
+        [321121, 321122], # HLT_TripleMu_12_10_5_v10, 136.178/pb
+        [321124, 321124], # HLT_TripleMu_12_10_5_v10, 185.308/pb
+        [321126, 321126], # HLT_TripleMu_12_10_5_v10, 78.957/pb
+        [321134, 321134], # HLT_TripleMu_12_10_5_v10, 8.164/pb
+        [321138, 321138], # HLT_TripleMu_12_10_5_v10, 141.977/pb
+        [321140, 321140], # HLT_TripleMu_12_10_5_v10, 116.949/pb
+        [321149, 321149], # HLT_TripleMu_12_10_5_v10, 434.675/pb
+        [321165, 321167], # HLT_TripleMu_12_10_5_v10, 277.898/pb
+        [321177, 321178], # HLT_TripleMu_12_10_5_v10, 174.709/pb
+        [321218, 321219], # HLT_TripleMu_12_10_5_v10, 463.69/pb
+        [321221, 321221], # HLT_TripleMu_12_10_5_v10, 5.906/pb
+        [321230, 321233], # HLT_TripleMu_12_10_5_v10, 275.104/pb
+        [321262, 321262], # HLT_TripleMu_12_10_5_v10, 1.669/pb
+        [321283, 321283], # HLT_TripleMu_12_10_5_v10, 119.781/pb
+        [321294, 321296], # HLT_TripleMu_12_10_5_v10, 233.977/pb
+        [321305, 321305], # HLT_TripleMu_12_10_5_v10, 601.905/pb
+        [321311, 321313], # HLT_TripleMu_12_10_5_v10, 87.325/pb
+        [321393, 321393], # HLT_TripleMu_12_10_5_v10, 49.689/pb
+        [321396, 321397], # HLT_TripleMu_12_10_5_v10, 417.281/pb
+        [321414, 321415], # HLT_TripleMu_12_10_5_v10, 523.015/pb
+        [321431, 321434], # HLT_TripleMu_12_10_5_v10, 296.1/pb
+        [321436, 321436], # HLT_TripleMu_12_10_5_v10, 138.442/pb
+        [321457, 321457], # HLT_TripleMu_12_10_5_v10, 482.762/pb
+        [321461, 321461], # HLT_TripleMu_12_10_5_v10, 21.013/pb
+        [321475, 321475], # HLT_TripleMu_12_10_5_v10, 471.913/pb
+        [321710, 321710], # HLT_TripleMu_12_10_5_v10, 17.235/pb
+        [321712, 321712], # HLT_TripleMu_12_10_5_v10, 84.378/pb
+        [321730, 321730], # HLT_TripleMu_12_10_5_v10, 102.671/pb
+        [321732, 321732], # HLT_TripleMu_12_10_5_v10, 344.692/pb
+        [321735, 321735], # HLT_TripleMu_12_10_5_v10, 23.661/pb
+        [321755, 321755], # HLT_TripleMu_12_10_5_v10, 213.438/pb
+        [321758, 321758], # HLT_TripleMu_12_10_5_v10, 37.518/pb
+        [321760, 321760], # HLT_TripleMu_12_10_5_v10, 146.153/pb
+        [321773, 321778], # HLT_TripleMu_12_10_5_v10, 174.569/pb
+        [321780, 321781], # HLT_TripleMu_12_10_5_v10, 181.684/pb
+        [321813, 321813], # HLT_TripleMu_12_10_5_v10, 120.244/pb
+        [321815, 321815], # HLT_TripleMu_12_10_5_v10, 5.12/pb
+        [321817, 321818], # HLT_TripleMu_12_10_5_v10, 286.489/pb
+        [321820, 321820], # HLT_TripleMu_12_10_5_v10, 32.069/pb
+        [321831, 321834], # HLT_TripleMu_12_10_5_v10, 488.005/pb
+        [321879, 321880], # HLT_TripleMu_12_10_5_v10, 131.546/pb
+        [321887, 321887], # HLT_TripleMu_12_10_5_v10, 276.941/pb
+        [321908, 321909], # HLT_TripleMu_12_10_5_v10, 485.884/pb
+        [321917, 321917], # HLT_TripleMu_12_10_5_v10, 261.22/pb
+        [321919, 321919], # HLT_TripleMu_12_10_5_v10, 1.489/pb
+        [321933, 321933], # HLT_TripleMu_12_10_5_v10, 101.007/pb
+        [321960, 321961], # HLT_TripleMu_12_10_5_v10, 139.431/pb
+        [321973, 321973], # HLT_TripleMu_12_10_5_v10, 358.667/pb
+        [321975, 321975], # HLT_TripleMu_12_10_5_v10, 145.784/pb
+        [321988, 321988], # HLT_TripleMu_12_10_5_v10, 384.022/pb
+        [321990, 321990], # HLT_TripleMu_12_10_5_v10, 81.032/pb
+        [322013, 322014], # HLT_TripleMu_12_10_5_v10, 7.816/pb
+        [322022, 322022], # HLT_TripleMu_12_10_5_v10, 452.969/pb
+        [322040, 322040], # HLT_TripleMu_12_10_5_v10, 13.692/pb
+        [322057, 322057], # HLT_TripleMu_12_10_5_v10, 8.235/pb
+        [322068, 322068], # HLT_TripleMu_12_10_5_v10, 232.599/pb
+        [322079, 322079], # HLT_TripleMu_12_10_5_v10, 140.245/pb
+        [322106, 322106], # HLT_TripleMu_12_10_5_v10, 281.859/pb
+        [322113, 322113], # HLT_TripleMu_12_10_5_v10, 40.79/pb
+        [322118, 322118], # HLT_TripleMu_12_10_5_v10, 268.229/pb
+        [322179, 322179], # HLT_TripleMu_12_10_5_v10, 469.75/pb
+        [322201, 322201], # HLT_TripleMu_12_10_5_v10, 84.335/pb
+        [322204, 322204], # HLT_TripleMu_12_10_5_v10, 311.166/pb
+        [322222, 322222], # HLT_TripleMu_12_10_5_v10, 92.744/pb
+        [322252, 322252], # HLT_TripleMu_12_10_5_v10, 420.358/pb
+        [322317, 322317], # HLT_TripleMu_12_10_5_v10, 19.246/pb
+        [322319, 322319], # HLT_TripleMu_12_10_5_v10, 55.502/pb
+        [322322, 322322], # HLT_TripleMu_12_10_5_v10, 292.464/pb
+        [322324, 322324], # HLT_TripleMu_12_10_5_v10, 69.26/pb
+        [322332, 322332], # HLT_TripleMu_12_10_5_v10, 313.996/pb
+        [322348, 322348], # HLT_TripleMu_12_10_5_v10, 414.112/pb
+        [322355, 322356], # HLT_TripleMu_12_10_5_v10, 268.46/pb
+        [322381, 322381], # HLT_TripleMu_12_10_5_v10, 178.73/pb
+        [322407, 322407], # HLT_TripleMu_12_10_5_v10, 169.958/pb
+        [322430, 322431], # HLT_TripleMu_12_10_5_v10, 370.371/pb
+        [322480, 322480], # HLT_TripleMu_12_10_5_v10, 109.337/pb
+        [322492, 322492], # HLT_TripleMu_12_10_5_v10, 287.515/pb
+        [322510, 322510], # HLT_TripleMu_12_10_5_v10, 2.229/pb
+        [322599, 322599], # HLT_TripleMu_12_10_5_v10, 94.351/pb
+        [322602, 322603], # HLT_TripleMu_12_10_5_v10, 26.803/pb
+        [322605, 322605], # HLT_TripleMu_12_10_5_v10, 89.624/pb
+        [322617, 322617], # HLT_TripleMu_12_10_5_v10, 136.646/pb
+        [322625, 322625], # HLT_TripleMu_12_10_5_v10, 335.273/pb
+        [322633, 322633], # HLT_TripleMu_12_10_5_v10, 50.946/pb
+        [323414, 323414], # HLT_TripleMu_12_10_5_v10, 6.204/pb
+        [323423, 323423], # HLT_TripleMu_12_10_5_v10, 21.037/pb
+        [323470, 323475], # HLT_TripleMu_12_10_5_v10, 321.533/pb
+        [323487, 323488], # HLT_TripleMu_12_10_5_v10, 340.364/pb
+        [323492, 323493], # HLT_TripleMu_12_10_5_v10, 33.198/pb
+        [323495, 323495], # HLT_TripleMu_12_10_5_v10, 32.347/pb
+        [323524, 323526], # HLT_TripleMu_12_10_5_v10, 480.533/pb
+        [323693, 323693], # HLT_TripleMu_12_10_5_v10, 40.083/pb
+        [323696, 323696], # HLT_TripleMu_12_10_5_v10, 88.848/pb
+        [323702, 323702], # HLT_TripleMu_12_10_5_v10, 145.958/pb
+        [323725, 323727], # HLT_TripleMu_12_10_5_v10, 380.043/pb
+        [323755, 323755], # HLT_TripleMu_12_10_5_v10, 296.639/pb
+        [323775, 323775], # HLT_TripleMu_12_10_5_v10, 46.768/pb
+        [323778, 323778], # HLT_TripleMu_12_10_5_v10, 270.936/pb
+        [323790, 323790], # HLT_TripleMu_12_10_5_v10, 276.737/pb
+        [323794, 323794], # HLT_TripleMu_12_10_5_v10, 16.057/pb
+        [323841, 323841], # HLT_TripleMu_12_10_5_v10, 155.038/pb
+        [323857, 323857], # HLT_TripleMu_12_10_5_v10, 95.513/pb
+        [323940, 323940], # HLT_TripleMu_12_10_5_v10, 426.706/pb
+        [323954, 323954], # HLT_TripleMu_12_10_5_v10, 15.141/pb
+        [323976, 323976], # HLT_TripleMu_12_10_5_v10, 14.399/pb
+        [323978, 323978], # HLT_TripleMu_12_10_5_v10, 21.952/pb
+        [323980, 323980], # HLT_TripleMu_12_10_5_v10, 67.732/pb
+        [323983, 323983], # HLT_TripleMu_12_10_5_v10, 56.791/pb
+        [323997, 323997], # HLT_TripleMu_12_10_5_v10, 128.792/pb
+        [324021, 324022], # HLT_TripleMu_12_10_5_v10, 380.271/pb
+        [324077, 324077], # HLT_TripleMu_12_10_5_v10, 242.583/pb
+        [324201, 324202], # HLT_TripleMu_12_10_5_v10, 402.099/pb
+        [324205, 324207], # HLT_TripleMu_12_10_5_v10, 44.541/pb
+        [324209, 324209], # HLT_TripleMu_12_10_5_v10, 16.079/pb
+        [324237, 324237], # HLT_TripleMu_12_10_5_v10, 74.992/pb
+        [324245, 324245], # HLT_TripleMu_12_10_5_v10, 417.199/pb
+        [324293, 324293], # HLT_TripleMu_12_10_5_v10, 513.035/pb
+        [324315, 324315], # HLT_TripleMu_12_10_5_v10, 70.437/pb
+        [324318, 324318], # HLT_TripleMu_12_10_5_v10, 99.84/pb
+        [324420, 324420], # HLT_TripleMu_12_10_5_v10, 199.727/pb
+        [324729, 324729], # HLT_TripleMu_12_10_5_v10, 14.797/pb
+        [324747, 324747], # HLT_TripleMu_12_10_5_v10, 308.246/pb
+        [324764, 324765], # HLT_TripleMu_12_10_5_v10, 117.745/pb
+        [324769, 324769], # HLT_TripleMu_12_10_5_v10, 46.77/pb
+        [324772, 324772], # HLT_TripleMu_12_10_5_v10, 18.783/pb
+        [324785, 324785], # HLT_TripleMu_12_10_5_v10, 185.798/pb
+        [324791, 324791], # HLT_TripleMu_12_10_5_v10, 245.007/pb
+        [324835, 324835], # HLT_TripleMu_12_10_5_v10, 85.856/pb
+        [324840, 324841], # HLT_TripleMu_12_10_5_v10, 328.73/pb
+        [324846, 324846], # HLT_TripleMu_12_10_5_v10, 68.553/pb
+        [324878, 324878], # HLT_TripleMu_12_10_5_v10, 403.017/pb
+        [324897, 324897], # HLT_TripleMu_12_10_5_v10, 50.229/pb
+        [324970, 324970], # HLT_TripleMu_12_10_5_v10, 479.466/pb
+        [324980, 324980], # HLT_TripleMu_12_10_5_v10, 513.295/pb
+        [324997, 325001], # HLT_TripleMu_12_10_5_v10, 370.507/pb
+        [325022, 325022], # HLT_TripleMu_12_10_5_v10, 433.386/pb
+        [325057, 325057], # HLT_TripleMu_12_10_5_v10, 120.048/pb
+        [325097, 325101], # HLT_TripleMu_12_10_5_v10, 351.717/pb
+        [325110, 325110], # HLT_TripleMu_12_10_5_v10, 3.259/pb
+        [325117, 325117], # HLT_TripleMu_12_10_5_v10, 85.217/pb
+        [325159, 325159], # HLT_TripleMu_12_10_5_v10, 61.44/pb
+        [325168, 325170], # HLT_TripleMu_12_10_5_v10, 273.009/pb
+        [325172, 325172], # HLT_TripleMu_12_10_5_v10, 67.636/pb
+      ],
+    },
+  ],
+  '1e2mu' : [
+    {
+      'name'        : 'HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 7.929/pb
+        [315259, 315259], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 13.919/pb
+        [315264, 315265], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 46.158/pb
+        [315267, 315267], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 37.143/pb
+        [315270, 315270], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 78.981/pb
+        [315322, 315322], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 180.063/pb
+        [315339, 315339], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 93.349/pb
+        [315357, 315357], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 151.931/pb
+        [315361, 315361], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 118.532/pb
+        [315363, 315363], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 14.489/pb
+        [315366, 315366], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 100.183/pb
+        [315420, 315420], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 258.566/pb
+        [315488, 315490], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 296.522/pb
+        [315506, 315506], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 27.983/pb
+        [315510, 315510], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 103.172/pb
+        [315512, 315512], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 236.871/pb
+        [315543, 315543], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 36.886/pb
+        [315555, 315557], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 114.498/pb
+        [315640, 315642], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 43.181/pb
+        [315644, 315648], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 439.459/pb
+        [315689, 315690], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 448.961/pb
+        [315702, 315705], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 328.569/pb
+        [315713, 315713], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 353.735/pb
+        [315721, 315721], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 210.579/pb
+        [315741, 315741], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 23.717/pb
+        [315764, 315764], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 114.011/pb
+        [315770, 315770], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 121.796/pb
+        [315784, 315786], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 179.651/pb
+        [315790, 315790], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 173.124/pb
+        [315800, 315801], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 304.75/pb
+        [315840, 315840], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15, 354.111/pb
+        [315973, 315974], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v15/HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 297.118/pb
+        [316058, 316062], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 512.949/pb
+        [316082, 316082], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 141.36/pb
+        [316110, 316111], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 97.131/pb
+        [316113, 316114], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 388.486/pb
+        [316153, 316153], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 256.24/pb
+        [316186, 316187], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 527.582/pb
+        [316199, 316202], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 589.387/pb
+        [316216, 316219], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 551.849/pb
+        [316239, 316241], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 546.196/pb
+        [316271, 316271], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v16, 29.698/pb
+        [316361, 316363], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 84.941/pb
+        [316377, 316380], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 188.825/pb
+        [316455, 316455], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 9.607/pb
+        [316457, 316457], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 326.273/pb
+        [316469, 316470], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 265.747/pb
+        [316472, 316472], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 66.237/pb
+        [316505, 316505], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 401.22/pb
+        [316569, 316569], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 485.569/pb
+        [316590, 316590], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 189.247/pb
+        [316613, 316613], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 31.466/pb
+        [316615, 316615], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 49.127/pb
+        [316666, 316667], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 321.521/pb
+        [316700, 316702], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 353.699/pb
+        [316715, 316723], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 440.225/pb
+        [316758, 316758], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 455.683/pb
+        [316766, 316766], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 561.053/pb
+        [316876, 316877], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 327.431/pb
+        [316879, 316879], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 36.513/pb
+        [316928, 316928], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 44.417/pb
+        [316985, 316985], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 172.546/pb
+        [316993, 316995], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 265.445/pb
+        [317080, 317080], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 7.844/pb
+        [317087, 317087], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 243.2/pb
+        [317089, 317089], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 212.905/pb
+        [317182, 317182], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 406.207/pb
+        [317212, 317213], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 176.661/pb
+        [317279, 317279], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 65.892/pb
+        [317291, 317292], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 359.036/pb
+        [317297, 317297], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 123.799/pb
+        [317319, 317320], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 514.282/pb
+        [317338, 317340], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 219.977/pb
+        [317382, 317383], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 46.591/pb
+        [317391, 317392], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 493.374/pb
+        [317435, 317435], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 360.613/pb
+        [317438, 317438], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 49.71/pb
+        [317475, 317475], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 25.761/pb
+        [317478, 317478], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 7.937/pb
+        [317484, 317484], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 160.356/pb
+        [317488, 317488], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 181.128/pb
+        [317527, 317527], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 452.099/pb
+        [317591, 317591], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 111.117/pb
+        [317626, 317626], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 528.94/pb
+        [317640, 317641], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 529.494/pb
+        [317648, 317650], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 483.09/pb
+        [317661, 317661], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 375.651/pb
+        [317663, 317663], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 153.301/pb
+        [317683, 317683], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 117.852/pb
+        [317696, 317696], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 228.787/pb
+        [318733, 318733], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 2.792/pb
+        [318828, 318828], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 13.229/pb
+        [318872, 318872], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 91.855/pb
+        [318874, 318874], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 99.565/pb
+        [318876, 318877], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 207.136/pb
+        [319077, 319077], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 16.372/pb
+        [319337, 319337], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 232.389/pb
+        [319347, 319349], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 256.706/pb
+        [319449, 319450], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 456.219/pb
+        [319456, 319456], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 52.016/pb
+        [319459, 319459], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 17.212/pb
+        [319486, 319486], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 20.315/pb
+        [319503, 319503], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 90.959/pb
+        [319524, 319524], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 456.701/pb
+        [319526, 319526], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 69.66/pb
+        [319528, 319528], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 58.411/pb
+        [319579, 319579], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 818.49/pb
+        [319625, 319625], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 70.596/pb
+        [319639, 319639], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 409.34/pb
+        [319656, 319659], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 221.8/pb
+        [319678, 319678], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 95.425/pb
+        [319687, 319687], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 16.053/pb
+        [319697, 319698], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 96.857/pb
+        [319756, 319756], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 490.205/pb
+        [319840, 319841], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 69.999/pb
+        [319847, 319849], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 193.537/pb
+        [319851, 319851], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 1.137/pb
+        [319853, 319854], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 124.92/pb
+        [319908, 319910], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 324.281/pb
+        [319912, 319915], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 119.686/pb
+        [319941, 319942], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 111.886/pb
+        [319950, 319950], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 65.936/pb
+        [319991, 319993], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 530.374/pb
+        [320002, 320002], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 50.203/pb
+        [320006, 320006], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 114.14/pb
+        [320010, 320012], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 153.875/pb
+        [320023, 320026], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 305.475/pb
+        [320038, 320040], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 404.341/pb
+        [320059, 320065], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 395.979/pb
+        [320673, 320674], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 98.341/pb
+        [320688, 320688], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 130.855/pb
+        [320712, 320712], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 69.58/pb
+        [320757, 320757], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 116.684/pb
+        [320804, 320804], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 319.033/pb
+        [320807, 320807], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 0.348/pb
+        [320809, 320809], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 106.231/pb
+        [320821, 320824], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 454.293/pb
+        [320838, 320838], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 92.366/pb
+        [320840, 320841], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 191.511/pb
+        [320853, 320859], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 433.068/pb
+        [320887, 320888], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 113.862/pb
+        [320916, 320917], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 484.437/pb
+        [320920, 320920], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 24.013/pb
+        [320933, 320934], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 262.426/pb
+        [320936, 320936], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 78.32/pb
+        [320941, 320941], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 15.638/pb
+        [320980, 320980], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 38.408/pb
+        [320995, 320996], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 74.084/pb
+        [321004, 321007], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 320.57/pb
+        [321009, 321012], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 105.863/pb
+        [321051, 321051], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 311.577/pb
+        [321055, 321055], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 125.495/pb
+        [321067, 321069], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 369.401/pb
+        [321119, 321119], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 58.668/pb
+        [321121, 321122], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 136.178/pb
+        [321124, 321124], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 185.308/pb
+        [321126, 321126], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 78.957/pb
+        [321134, 321134], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 8.164/pb
+        [321138, 321138], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 141.977/pb
+        [321140, 321140], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 116.949/pb
+        [321149, 321149], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 434.675/pb
+        [321165, 321167], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 277.898/pb
+        [321177, 321178], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 174.709/pb
+        [321218, 321219], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 463.69/pb
+        [321221, 321221], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 5.906/pb
+        [321230, 321233], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 275.104/pb
+        [321262, 321262], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 1.669/pb
+        [321283, 321283], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 119.781/pb
+        [321294, 321296], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 233.977/pb
+        [321305, 321305], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 601.905/pb
+        [321311, 321313], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 87.325/pb
+        [321393, 321393], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 49.689/pb
+        [321396, 321397], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 417.281/pb
+        [321414, 321415], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 523.015/pb
+        [321431, 321434], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 296.1/pb
+        [321436, 321436], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 138.442/pb
+        [321457, 321457], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 482.762/pb
+        [321461, 321461], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 21.013/pb
+        [321475, 321475], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 471.913/pb
+        [321710, 321710], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 17.235/pb
+        [321712, 321712], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 84.378/pb
+        [321730, 321730], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 102.671/pb
+        [321732, 321732], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 344.692/pb
+        [321735, 321735], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 23.661/pb
+        [321755, 321755], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 213.438/pb
+        [321758, 321758], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 37.518/pb
+        [321760, 321760], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 146.153/pb
+        [321773, 321778], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 174.569/pb
+        [321780, 321781], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 181.684/pb
+        [321813, 321813], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 120.244/pb
+        [321815, 321815], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 5.12/pb
+        [321817, 321818], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 286.489/pb
+        [321820, 321820], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 32.069/pb
+        [321831, 321834], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 488.005/pb
+        [321879, 321880], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 131.546/pb
+        [321887, 321887], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 276.941/pb
+        [321908, 321909], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 485.884/pb
+        [321917, 321917], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 261.22/pb
+        [321919, 321919], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 1.489/pb
+        [321933, 321933], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 101.007/pb
+        [321960, 321961], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 139.431/pb
+        [321973, 321973], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 358.667/pb
+        [321975, 321975], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 145.784/pb
+        [321988, 321988], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 384.022/pb
+        [321990, 321990], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 81.032/pb
+        [322013, 322014], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 7.816/pb
+        [322022, 322022], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 452.969/pb
+        [322040, 322040], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 13.692/pb
+        [322057, 322057], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 8.235/pb
+        [322068, 322068], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 232.599/pb
+        [322079, 322079], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 140.245/pb
+        [322106, 322106], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 281.859/pb
+        [322113, 322113], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 40.79/pb
+        [322118, 322118], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 268.229/pb
+        [322179, 322179], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 469.75/pb
+        [322201, 322201], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 84.335/pb
+        [322204, 322204], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 311.166/pb
+        [322222, 322222], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 92.744/pb
+        [322252, 322252], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 420.358/pb
+        [322317, 322317], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 19.246/pb
+        [322319, 322319], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 55.502/pb
+        [322322, 322322], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 292.464/pb
+        [322324, 322324], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 69.26/pb
+        [322332, 322332], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 313.996/pb
+        [322348, 322348], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 414.112/pb
+        [322355, 322356], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 268.46/pb
+        [322381, 322381], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 178.73/pb
+        [322407, 322407], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 169.958/pb
+        [322430, 322431], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 370.371/pb
+        [322480, 322480], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 109.337/pb
+        [322492, 322492], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 287.515/pb
+        [322510, 322510], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 2.229/pb
+        [322599, 322599], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 94.351/pb
+        [322602, 322603], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 26.803/pb
+        [322605, 322605], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 89.624/pb
+        [322617, 322617], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 136.646/pb
+        [322625, 322625], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 335.273/pb
+        [322633, 322633], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 50.946/pb
+        [323414, 323414], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 6.204/pb
+        [323423, 323423], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 21.037/pb
+        [323470, 323475], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 321.533/pb
+        [323487, 323488], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 340.364/pb
+        [323492, 323493], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 33.198/pb
+        [323495, 323495], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 32.347/pb
+        [323524, 323526], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 480.533/pb
+        [323693, 323693], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 40.083/pb
+        [323696, 323696], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 88.848/pb
+        [323702, 323702], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 145.958/pb
+        [323725, 323727], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 380.043/pb
+        [323755, 323755], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 296.639/pb
+        [323775, 323775], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 46.768/pb
+        [323778, 323778], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 270.936/pb
+        [323790, 323790], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 276.737/pb
+        [323794, 323794], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 16.057/pb
+        [323841, 323841], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 155.038/pb
+        [323857, 323857], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 95.513/pb
+        [323940, 323940], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 426.706/pb
+        [323954, 323954], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 15.141/pb
+        [323976, 323976], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 14.399/pb
+        [323978, 323978], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 21.952/pb
+        [323980, 323980], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 67.732/pb
+        [323983, 323983], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 56.791/pb
+        [323997, 323997], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 128.792/pb
+        [324021, 324022], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 380.271/pb
+        [324077, 324077], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 242.583/pb
+        [324201, 324202], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 402.099/pb
+        [324205, 324207], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 44.541/pb
+        [324209, 324209], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 16.079/pb
+        [324237, 324237], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 74.992/pb
+        [324245, 324245], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 417.199/pb
+        [324293, 324293], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 513.035/pb
+        [324315, 324315], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 70.437/pb
+        [324318, 324318], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 99.84/pb
+        [324420, 324420], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 199.727/pb
+        [324729, 324729], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 14.797/pb
+        [324747, 324747], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 308.246/pb
+        [324764, 324765], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 117.745/pb
+        [324769, 324769], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 46.77/pb
+        [324772, 324772], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 18.783/pb
+        [324785, 324785], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 185.798/pb
+        [324791, 324791], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 245.007/pb
+        [324835, 324835], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 85.856/pb
+        [324840, 324841], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 328.73/pb
+        [324846, 324846], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 68.553/pb
+        [324878, 324878], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 403.017/pb
+        [324897, 324897], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 50.229/pb
+        [324970, 324970], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 479.466/pb
+        [324980, 324980], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 513.295/pb
+        [324997, 325001], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 370.507/pb
+        [325022, 325022], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 433.386/pb
+        [325057, 325057], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 120.048/pb
+        [325097, 325101], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 351.717/pb
+        [325110, 325110], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 3.259/pb
+        [325117, 325117], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 85.217/pb
+        [325159, 325159], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 61.44/pb
+        [325168, 325170], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 273.009/pb
+        [325172, 325172], # HLT_DiMu9_Ele9_CaloIdL_TrackIdL_DZ_v17, 67.636/pb
+      ],
+    },
+  ],
+  '2e1mu' : [
+    {
+      'name'        : 'HLT_Mu8_DiEle12_CaloIdL_TrackIdL',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 7.929/pb
+        [315259, 315259], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 13.919/pb
+        [315264, 315265], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 46.158/pb
+        [315267, 315267], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 37.143/pb
+        [315270, 315270], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 78.981/pb
+        [315322, 315322], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 180.063/pb
+        [315339, 315339], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 93.349/pb
+        [315357, 315357], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 151.931/pb
+        [315361, 315361], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 118.532/pb
+        [315363, 315363], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 14.489/pb
+        [315366, 315366], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 100.183/pb
+        [315420, 315420], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 258.566/pb
+        [315488, 315490], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 296.522/pb
+        [315506, 315506], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 27.983/pb
+        [315510, 315510], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 103.172/pb
+        [315512, 315512], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 236.871/pb
+        [315543, 315543], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 36.886/pb
+        [315555, 315557], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 114.498/pb
+        [315640, 315642], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 43.181/pb
+        [315644, 315648], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 439.459/pb
+        [315689, 315690], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 448.961/pb
+        [315702, 315705], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 328.569/pb
+        [315713, 315713], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 353.735/pb
+        [315721, 315721], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 210.579/pb
+        [315741, 315741], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 23.717/pb
+        [315764, 315764], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 114.011/pb
+        [315770, 315770], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 121.796/pb
+        [315784, 315786], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 179.651/pb
+        [315790, 315790], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 173.124/pb
+        [315800, 315801], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 304.75/pb
+        [315840, 315840], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16, 354.111/pb
+        [315973, 315974], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v16/HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 297.118/pb
+        [316058, 316062], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 512.949/pb
+        [316082, 316082], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 141.36/pb
+        [316110, 316111], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 97.131/pb
+        [316113, 316114], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 388.486/pb
+        [316153, 316153], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 256.24/pb
+        [316186, 316187], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 527.582/pb
+        [316199, 316202], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 589.387/pb
+        [316216, 316219], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 551.849/pb
+        [316239, 316241], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 546.196/pb
+        [316271, 316271], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v17, 29.698/pb
+        [316361, 316363], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 84.941/pb
+        [316377, 316380], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 188.825/pb
+        [316455, 316455], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 9.607/pb
+        [316457, 316457], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 326.273/pb
+        [316469, 316470], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 265.747/pb
+        [316472, 316472], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 66.237/pb
+        [316505, 316505], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 401.22/pb
+        [316569, 316569], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 485.569/pb
+        [316590, 316590], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 189.247/pb
+        [316613, 316613], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 31.466/pb
+        [316615, 316615], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 49.127/pb
+        [316666, 316667], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 321.521/pb
+        [316700, 316702], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 353.699/pb
+        [316715, 316723], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 440.225/pb
+        [316758, 316758], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 455.683/pb
+        [316766, 316766], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 561.053/pb
+        [316876, 316877], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 327.431/pb
+        [316879, 316879], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 36.513/pb
+        [316928, 316928], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 44.417/pb
+        [316985, 316985], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 172.546/pb
+        [316993, 316995], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 265.445/pb
+        [317080, 317080], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 7.844/pb
+        [317087, 317087], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 243.2/pb
+        [317089, 317089], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 212.905/pb
+        [317182, 317182], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 406.207/pb
+        [317212, 317213], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 176.661/pb
+        [317279, 317279], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 65.892/pb
+        [317291, 317292], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 359.036/pb
+        [317297, 317297], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 123.799/pb
+        [317319, 317320], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 514.282/pb
+        [317338, 317340], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 219.977/pb
+        [317382, 317383], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 46.591/pb
+        [317391, 317392], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 493.374/pb
+        [317435, 317435], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 360.613/pb
+        [317438, 317438], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 49.71/pb
+        [317475, 317475], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 25.761/pb
+        [317478, 317478], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 7.937/pb
+        [317484, 317484], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 160.356/pb
+        [317488, 317488], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 181.128/pb
+        [317527, 317527], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 452.099/pb
+        [317591, 317591], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 111.117/pb
+        [317626, 317626], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 528.94/pb
+        [317640, 317641], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 529.494/pb
+        [317648, 317650], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 483.09/pb
+        [317661, 317661], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 375.651/pb
+        [317663, 317663], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 153.301/pb
+        [317683, 317683], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 117.852/pb
+        [317696, 317696], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 228.787/pb
+        [318733, 318733], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 2.792/pb
+        [318828, 318828], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 13.229/pb
+        [318872, 318872], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 91.855/pb
+        [318874, 318874], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 99.565/pb
+        [318876, 318877], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 207.136/pb
+        [319077, 319077], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 16.372/pb
+        [319337, 319337], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 232.389/pb
+        [319347, 319349], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 256.706/pb
+        [319449, 319450], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 456.219/pb
+        [319456, 319456], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 52.016/pb
+        [319459, 319459], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 17.212/pb
+        [319486, 319486], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 20.315/pb
+        [319503, 319503], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 90.959/pb
+        [319524, 319524], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 456.701/pb
+        [319526, 319526], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 69.66/pb
+        [319528, 319528], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 58.411/pb
+        [319579, 319579], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 818.49/pb
+        [319625, 319625], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 70.596/pb
+        [319639, 319639], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 409.34/pb
+        [319656, 319659], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 221.8/pb
+        [319678, 319678], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 95.425/pb
+        [319687, 319687], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 16.053/pb
+        [319697, 319698], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 96.857/pb
+        [319756, 319756], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 490.205/pb
+        [319840, 319841], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 69.999/pb
+        [319847, 319849], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 193.537/pb
+        [319851, 319851], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 1.137/pb
+        [319853, 319854], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 124.92/pb
+        [319908, 319910], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 324.281/pb
+        [319912, 319915], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 119.686/pb
+        [319941, 319942], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 111.886/pb
+        [319950, 319950], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 65.936/pb
+        [319991, 319993], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 530.374/pb
+        [320002, 320002], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 50.203/pb
+        [320006, 320006], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 114.14/pb
+        [320010, 320012], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 153.875/pb
+        [320023, 320026], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 305.475/pb
+        [320038, 320040], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 404.341/pb
+        [320059, 320065], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 395.979/pb
+        [320673, 320674], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 98.341/pb
+        [320688, 320688], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 130.855/pb
+        [320712, 320712], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 69.58/pb
+        [320757, 320757], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 116.684/pb
+        [320804, 320804], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 319.033/pb
+        [320807, 320807], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 0.348/pb
+        [320809, 320809], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 106.231/pb
+        [320821, 320824], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 454.293/pb
+        [320838, 320838], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 92.366/pb
+        [320840, 320841], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 191.511/pb
+        [320853, 320859], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 433.068/pb
+        [320887, 320888], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 113.862/pb
+        [320916, 320917], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 484.437/pb
+        [320920, 320920], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 24.013/pb
+        [320933, 320934], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 262.426/pb
+        [320936, 320936], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 78.32/pb
+        [320941, 320941], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 15.638/pb
+        [320980, 320980], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 38.408/pb
+        [320995, 320996], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 74.084/pb
+        [321004, 321007], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 320.57/pb
+        [321009, 321012], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 105.863/pb
+        [321051, 321051], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 311.577/pb
+        [321055, 321055], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 125.495/pb
+        [321067, 321069], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 369.401/pb
+        [321119, 321119], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 58.668/pb
+        [321121, 321122], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 136.178/pb
+        [321124, 321124], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 185.308/pb
+        [321126, 321126], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 78.957/pb
+        [321134, 321134], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 8.164/pb
+        [321138, 321138], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 141.977/pb
+        [321140, 321140], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 116.949/pb
+        [321149, 321149], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 434.675/pb
+        [321165, 321167], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 277.898/pb
+        [321177, 321178], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 174.709/pb
+        [321218, 321219], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 463.69/pb
+        [321221, 321221], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 5.906/pb
+        [321230, 321233], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 275.104/pb
+        [321262, 321262], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 1.669/pb
+        [321283, 321283], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 119.781/pb
+        [321294, 321296], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 233.977/pb
+        [321305, 321305], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 601.905/pb
+        [321311, 321313], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 87.325/pb
+        [321393, 321393], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 49.689/pb
+        [321396, 321397], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 417.281/pb
+        [321414, 321415], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 523.015/pb
+        [321431, 321434], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 296.1/pb
+        [321436, 321436], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 138.442/pb
+        [321457, 321457], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 482.762/pb
+        [321461, 321461], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 21.013/pb
+        [321475, 321475], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 471.913/pb
+        [321710, 321710], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 17.235/pb
+        [321712, 321712], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 84.378/pb
+        [321730, 321730], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 102.671/pb
+        [321732, 321732], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 344.692/pb
+        [321735, 321735], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 23.661/pb
+        [321755, 321755], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 213.438/pb
+        [321758, 321758], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 37.518/pb
+        [321760, 321760], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 146.153/pb
+        [321773, 321778], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 174.569/pb
+        [321780, 321781], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 181.684/pb
+        [321813, 321813], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 120.244/pb
+        [321815, 321815], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 5.12/pb
+        [321817, 321818], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 286.489/pb
+        [321820, 321820], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 32.069/pb
+        [321831, 321834], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 488.005/pb
+        [321879, 321880], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 131.546/pb
+        [321887, 321887], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 276.941/pb
+        [321908, 321909], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 485.884/pb
+        [321917, 321917], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 261.22/pb
+        [321919, 321919], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 1.489/pb
+        [321933, 321933], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 101.007/pb
+        [321960, 321961], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 139.431/pb
+        [321973, 321973], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 358.667/pb
+        [321975, 321975], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 145.784/pb
+        [321988, 321988], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 384.022/pb
+        [321990, 321990], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 81.032/pb
+        [322013, 322014], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 7.816/pb
+        [322022, 322022], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 452.969/pb
+        [322040, 322040], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 13.692/pb
+        [322057, 322057], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 8.235/pb
+        [322068, 322068], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 232.599/pb
+        [322079, 322079], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 140.245/pb
+        [322106, 322106], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 281.859/pb
+        [322113, 322113], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 40.79/pb
+        [322118, 322118], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 268.229/pb
+        [322179, 322179], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 469.75/pb
+        [322201, 322201], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 84.335/pb
+        [322204, 322204], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 311.166/pb
+        [322222, 322222], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 92.744/pb
+        [322252, 322252], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 420.358/pb
+        [322317, 322317], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 19.246/pb
+        [322319, 322319], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 55.502/pb
+        [322322, 322322], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 292.464/pb
+        [322324, 322324], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 69.26/pb
+        [322332, 322332], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 313.996/pb
+        [322348, 322348], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 414.112/pb
+        [322355, 322356], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 268.46/pb
+        [322381, 322381], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 178.73/pb
+        [322407, 322407], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 169.958/pb
+        [322430, 322431], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 370.371/pb
+        [322480, 322480], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 109.337/pb
+        [322492, 322492], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 287.515/pb
+        [322510, 322510], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 2.229/pb
+        [322599, 322599], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 94.351/pb
+        [322602, 322603], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 26.803/pb
+        [322605, 322605], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 89.624/pb
+        [322617, 322617], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 136.646/pb
+        [322625, 322625], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 335.273/pb
+        [322633, 322633], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 50.946/pb
+        [323414, 323414], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 6.204/pb
+        [323423, 323423], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 21.037/pb
+        [323470, 323475], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 321.533/pb
+        [323487, 323488], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 340.364/pb
+        [323492, 323493], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 33.198/pb
+        [323495, 323495], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 32.347/pb
+        [323524, 323526], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 480.533/pb
+        [323693, 323693], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 40.083/pb
+        [323696, 323696], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 88.848/pb
+        [323702, 323702], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 145.958/pb
+        [323725, 323727], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 380.043/pb
+        [323755, 323755], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 296.639/pb
+        [323775, 323775], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 46.768/pb
+        [323778, 323778], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 270.936/pb
+        [323790, 323790], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 276.737/pb
+        [323794, 323794], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 16.057/pb
+        [323841, 323841], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 155.038/pb
+        [323857, 323857], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 95.513/pb
+        [323940, 323940], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 426.706/pb
+        [323954, 323954], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 15.141/pb
+        [323976, 323976], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 14.399/pb
+        [323978, 323978], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 21.952/pb
+        [323980, 323980], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 67.732/pb
+        [323983, 323983], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 56.791/pb
+        [323997, 323997], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 128.792/pb
+        [324021, 324022], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 380.271/pb
+        [324077, 324077], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 242.583/pb
+        [324201, 324202], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 402.099/pb
+        [324205, 324207], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 44.541/pb
+        [324209, 324209], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 16.079/pb
+        [324237, 324237], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 74.992/pb
+        [324245, 324245], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 417.199/pb
+        [324293, 324293], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 513.035/pb
+        [324315, 324315], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 70.437/pb
+        [324318, 324318], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 99.84/pb
+        [324420, 324420], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 199.727/pb
+        [324729, 324729], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 14.797/pb
+        [324747, 324747], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 308.246/pb
+        [324764, 324765], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 117.745/pb
+        [324769, 324769], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 46.77/pb
+        [324772, 324772], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 18.783/pb
+        [324785, 324785], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 185.798/pb
+        [324791, 324791], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 245.007/pb
+        [324835, 324835], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 85.856/pb
+        [324840, 324841], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 328.73/pb
+        [324846, 324846], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 68.553/pb
+        [324878, 324878], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 403.017/pb
+        [324897, 324897], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 50.229/pb
+        [324970, 324970], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 479.466/pb
+        [324980, 324980], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 513.295/pb
+        [324997, 325001], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 370.507/pb
+        [325022, 325022], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 433.386/pb
+        [325057, 325057], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 120.048/pb
+        [325097, 325101], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 351.717/pb
+        [325110, 325110], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 3.259/pb
+        [325117, 325117], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 85.217/pb
+        [325159, 325159], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 61.44/pb
+        [325168, 325170], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 273.009/pb
+        [325172, 325172], # HLT_Mu8_DiEle12_CaloIdL_TrackIdL_v18, 67.636/pb
+      ],
+    },
+  ],
+  '3e' : [
+    {
+      'name'        : 'HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL', # enabled mid run A
+      'unprescaled' : True,
+      'runs'        : [
+        [315974, 315974], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 18.532/pb
+        [316058, 316062], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 512.949/pb
+        [316082, 316082], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 141.36/pb
+        [316110, 316111], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 97.131/pb
+        [316113, 316114], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 388.486/pb
+        [316153, 316153], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 256.24/pb
+        [316186, 316187], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 527.582/pb
+        [316199, 316202], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 589.387/pb
+        [316216, 316219], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 551.849/pb
+        [316239, 316241], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 546.196/pb
+        [316271, 316271], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v8, 29.698/pb
+        [316361, 316363], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 84.941/pb
+        [316377, 316380], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 188.825/pb
+        [316455, 316455], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 9.607/pb
+        [316457, 316457], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 326.273/pb
+        [316469, 316470], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 265.747/pb
+        [316472, 316472], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 66.237/pb
+        [316505, 316505], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 401.22/pb
+        [316569, 316569], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 485.569/pb
+        [316590, 316590], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 189.247/pb
+        [316613, 316613], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 31.466/pb
+        [316615, 316615], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 49.127/pb
+        [316666, 316667], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 321.521/pb
+        [316700, 316702], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 353.699/pb
+        [316715, 316723], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 440.225/pb
+        [316758, 316758], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 455.683/pb
+        [316766, 316766], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 561.053/pb
+        [316876, 316877], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 327.431/pb
+        [316879, 316879], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 36.513/pb
+        [316928, 316928], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 44.417/pb
+        [316985, 316985], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 172.546/pb
+        [316993, 316995], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 265.445/pb
+        [317080, 317080], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 7.844/pb
+        [317087, 317087], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 243.2/pb
+        [317089, 317089], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 212.905/pb
+        [317182, 317182], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 406.207/pb
+        [317212, 317213], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 176.661/pb
+        [317279, 317279], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 65.892/pb
+        [317291, 317292], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 359.036/pb
+        [317297, 317297], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 123.799/pb
+        [317319, 317320], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 514.282/pb
+        [317338, 317340], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 219.977/pb
+        [317382, 317383], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 46.591/pb
+        [317391, 317392], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 493.374/pb
+        [317435, 317435], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 360.613/pb
+        [317438, 317438], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 49.71/pb
+        [317475, 317475], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 25.761/pb
+        [317478, 317478], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 7.937/pb
+        [317484, 317484], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 160.356/pb
+        [317488, 317488], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 181.128/pb
+        [317527, 317527], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 452.099/pb
+        [317591, 317591], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 111.117/pb
+        [317626, 317626], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 528.94/pb
+        [317640, 317641], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 529.494/pb
+        [317648, 317650], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 483.09/pb
+        [317661, 317661], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 375.651/pb
+        [317663, 317663], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 153.301/pb
+        [317683, 317683], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 117.852/pb
+        [317696, 317696], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 228.787/pb
+        [318733, 318733], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 2.792/pb
+        [318828, 318828], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 13.229/pb
+        [318872, 318872], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 91.855/pb
+        [318874, 318874], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 99.565/pb
+        [318876, 318877], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 207.136/pb
+        [319077, 319077], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 16.372/pb
+        [319337, 319337], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 232.389/pb
+        [319347, 319349], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 256.706/pb
+        [319449, 319450], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 456.219/pb
+        [319456, 319456], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 52.016/pb
+        [319459, 319459], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 17.212/pb
+        [319486, 319486], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 20.315/pb
+        [319503, 319503], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 90.959/pb
+        [319524, 319524], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 456.701/pb
+        [319526, 319526], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 69.66/pb
+        [319528, 319528], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 58.411/pb
+        [319579, 319579], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 818.49/pb
+        [319625, 319625], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 70.596/pb
+        [319639, 319639], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 409.34/pb
+        [319656, 319659], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 221.8/pb
+        [319678, 319678], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 95.425/pb
+        [319687, 319687], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 16.053/pb
+        [319697, 319698], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 96.857/pb
+        [319756, 319756], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 490.205/pb
+        [319840, 319841], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 69.999/pb
+        [319847, 319849], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 193.537/pb
+        [319851, 319851], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 1.137/pb
+        [319853, 319854], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 124.92/pb
+        [319908, 319910], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 324.281/pb
+        [319912, 319915], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 119.686/pb
+        [319941, 319942], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 111.886/pb
+        [319950, 319950], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 65.936/pb
+        [319991, 319993], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 530.374/pb
+        [320002, 320002], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 50.203/pb
+        [320006, 320006], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 114.14/pb
+        [320010, 320012], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 153.875/pb
+        [320023, 320026], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 305.475/pb
+        [320038, 320040], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 404.341/pb
+        [320059, 320065], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 395.979/pb
+        [320673, 320674], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 98.341/pb
+        [320688, 320688], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 130.855/pb
+        [320712, 320712], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 69.58/pb
+        [320757, 320757], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 116.684/pb
+        [320804, 320804], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 319.033/pb
+        [320807, 320807], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 0.348/pb
+        [320809, 320809], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 106.231/pb
+        [320821, 320824], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 454.293/pb
+        [320838, 320838], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 92.366/pb
+        [320840, 320841], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 191.511/pb
+        [320853, 320859], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 433.068/pb
+        [320887, 320888], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 113.862/pb
+        [320916, 320917], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 484.437/pb
+        [320920, 320920], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 24.013/pb
+        [320933, 320934], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 262.426/pb
+        [320936, 320936], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 78.32/pb
+        [320941, 320941], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 15.638/pb
+        [320980, 320980], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 38.408/pb
+        [320995, 320996], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 74.084/pb
+        [321004, 321007], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 320.57/pb
+        [321009, 321012], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 105.863/pb
+        [321051, 321051], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 311.577/pb
+        [321055, 321055], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 125.495/pb
+        [321067, 321069], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 369.401/pb
+        [321119, 321119], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 58.668/pb
+        [321121, 321122], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 136.178/pb
+        [321124, 321124], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 185.308/pb
+        [321126, 321126], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 78.957/pb
+        [321134, 321134], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 8.164/pb
+        [321138, 321138], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 141.977/pb
+        [321140, 321140], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 116.949/pb
+        [321149, 321149], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 434.675/pb
+        [321165, 321167], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 277.898/pb
+        [321177, 321178], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 174.709/pb
+        [321218, 321219], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 463.69/pb
+        [321221, 321221], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 5.906/pb
+        [321230, 321233], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 275.104/pb
+        [321262, 321262], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 1.669/pb
+        [321283, 321283], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 119.781/pb
+        [321294, 321296], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 233.977/pb
+        [321305, 321305], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 601.905/pb
+        [321311, 321313], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 87.325/pb
+        [321393, 321393], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 49.689/pb
+        [321396, 321397], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 417.281/pb
+        [321414, 321415], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 523.015/pb
+        [321431, 321434], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 296.1/pb
+        [321436, 321436], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 138.442/pb
+        [321457, 321457], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 482.762/pb
+        [321461, 321461], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 21.013/pb
+        [321475, 321475], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 471.913/pb
+        [321710, 321710], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 17.235/pb
+        [321712, 321712], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 84.378/pb
+        [321730, 321730], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 102.671/pb
+        [321732, 321732], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 344.692/pb
+        [321735, 321735], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 23.661/pb
+        [321755, 321755], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 213.438/pb
+        [321758, 321758], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 37.518/pb
+        [321760, 321760], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 146.153/pb
+        [321773, 321778], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 174.569/pb
+        [321780, 321781], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 181.684/pb
+        [321813, 321813], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 120.244/pb
+        [321815, 321815], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 5.12/pb
+        [321817, 321818], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 286.489/pb
+        [321820, 321820], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 32.069/pb
+        [321831, 321834], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 488.005/pb
+        [321879, 321880], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 131.546/pb
+        [321887, 321887], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 276.941/pb
+        [321908, 321909], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 485.884/pb
+        [321917, 321917], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 261.22/pb
+        [321919, 321919], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 1.489/pb
+        [321933, 321933], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 101.007/pb
+        [321960, 321961], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 139.431/pb
+        [321973, 321973], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 358.667/pb
+        [321975, 321975], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 145.784/pb
+        [321988, 321988], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 384.022/pb
+        [321990, 321990], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 81.032/pb
+        [322013, 322014], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 7.816/pb
+        [322022, 322022], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 452.969/pb
+        [322040, 322040], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 13.692/pb
+        [322057, 322057], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 8.235/pb
+        [322068, 322068], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 232.599/pb
+        [322079, 322079], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 140.245/pb
+        [322106, 322106], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 281.859/pb
+        [322113, 322113], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 40.79/pb
+        [322118, 322118], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 268.229/pb
+        [322179, 322179], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 469.75/pb
+        [322201, 322201], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 84.335/pb
+        [322204, 322204], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 311.166/pb
+        [322222, 322222], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 92.744/pb
+        [322252, 322252], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 420.358/pb
+        [322317, 322317], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 19.246/pb
+        [322319, 322319], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 55.502/pb
+        [322322, 322322], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 292.464/pb
+        [322324, 322324], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 69.26/pb
+        [322332, 322332], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 313.996/pb
+        [322348, 322348], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 414.112/pb
+        [322355, 322356], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 268.46/pb
+        [322381, 322381], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 178.73/pb
+        [322407, 322407], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 169.958/pb
+        [322430, 322431], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 370.371/pb
+        [322480, 322480], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 109.337/pb
+        [322492, 322492], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 287.515/pb
+        [322510, 322510], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 2.229/pb
+        [322599, 322599], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 94.351/pb
+        [322602, 322603], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 26.803/pb
+        [322605, 322605], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 89.624/pb
+        [322617, 322617], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 136.646/pb
+        [322625, 322625], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 335.273/pb
+        [322633, 322633], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 50.946/pb
+        [323414, 323414], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 6.204/pb
+        [323423, 323423], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 21.037/pb
+        [323470, 323475], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 321.533/pb
+        [323487, 323488], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 340.364/pb
+        [323492, 323493], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 33.198/pb
+        [323495, 323495], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 32.347/pb
+        [323524, 323526], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 480.533/pb
+        [323693, 323693], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 40.083/pb
+        [323696, 323696], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 88.848/pb
+        [323702, 323702], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 145.958/pb
+        [323725, 323727], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 380.043/pb
+        [323755, 323755], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 296.639/pb
+        [323775, 323775], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 46.768/pb
+        [323778, 323778], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 270.936/pb
+        [323790, 323790], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 276.737/pb
+        [323794, 323794], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 16.057/pb
+        [323841, 323841], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 155.038/pb
+        [323857, 323857], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 95.513/pb
+        [323940, 323940], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 426.706/pb
+        [323954, 323954], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 15.141/pb
+        [323976, 323976], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 14.399/pb
+        [323978, 323978], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 21.952/pb
+        [323980, 323980], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 67.732/pb
+        [323983, 323983], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 56.791/pb
+        [323997, 323997], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 128.792/pb
+        [324021, 324022], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 380.271/pb
+        [324077, 324077], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 242.583/pb
+        [324201, 324202], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 402.099/pb
+        [324205, 324207], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 44.541/pb
+        [324209, 324209], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 16.079/pb
+        [324237, 324237], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 74.992/pb
+        [324245, 324245], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 417.199/pb
+        [324293, 324293], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 513.035/pb
+        [324315, 324315], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 70.437/pb
+        [324318, 324318], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 99.84/pb
+        [324420, 324420], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 199.727/pb
+        [324729, 324729], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 14.797/pb
+        [324747, 324747], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 308.246/pb
+        [324764, 324765], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 117.745/pb
+        [324769, 324769], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 46.77/pb
+        [324772, 324772], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 18.783/pb
+        [324785, 324785], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 185.798/pb
+        [324791, 324791], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 245.007/pb
+        [324835, 324835], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 85.856/pb
+        [324840, 324841], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 328.73/pb
+        [324846, 324846], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 68.553/pb
+        [324878, 324878], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 403.017/pb
+        [324897, 324897], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 50.229/pb
+        [324970, 324970], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 479.466/pb
+        [324980, 324980], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 513.295/pb
+        [324997, 325001], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 370.507/pb
+        [325022, 325022], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 433.386/pb
+        [325057, 325057], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 120.048/pb
+        [325097, 325101], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 351.717/pb
+        [325110, 325110], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 3.259/pb
+        [325117, 325117], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 85.217/pb
+        [325159, 325159], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 61.44/pb
+        [325168, 325170], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 273.009/pb
+        [325172, 325172], # HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL_v9, 67.636/pb
+      ],
+    },
+  ],
+  '2mu' : [
+    {
+      'name'        : 'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 7.929/pb
+        [315259, 315259], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 13.919/pb
+        [315264, 315265], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 46.158/pb
+        [315267, 315267], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 37.143/pb
+        [315270, 315270], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 78.981/pb
+        [315322, 315322], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 180.063/pb
+        [315339, 315339], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 93.349/pb
+        [315357, 315357], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 151.931/pb
+        [315361, 315361], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 118.532/pb
+        [315363, 315363], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 14.489/pb
+        [315366, 315366], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 100.183/pb
+        [315420, 315420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 258.566/pb
+        [315488, 315490], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 296.522/pb
+        [315506, 315506], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 27.983/pb
+        [315510, 315510], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 103.172/pb
+        [315512, 315512], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 236.871/pb
+        [315543, 315543], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 36.886/pb
+        [315555, 315557], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 114.498/pb
+        [315640, 315642], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 43.181/pb
+        [315644, 315648], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 439.459/pb
+        [315689, 315690], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 448.961/pb
+        [315702, 315705], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 328.569/pb
+        [315713, 315713], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 353.735/pb
+        [315721, 315721], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 210.579/pb
+        [315741, 315741], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 23.717/pb
+        [315764, 315764], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 114.011/pb
+        [315770, 315770], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 121.796/pb
+        [315784, 315786], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 179.651/pb
+        [315790, 315790], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 173.124/pb
+        [315800, 315801], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 304.75/pb
+        [315840, 315840], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 354.111/pb
+        [315973, 315974], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 297.118/pb
+        [316058, 316062], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 512.949/pb
+        [316082, 316082], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 141.36/pb
+        [316110, 316111], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 97.131/pb
+        [316113, 316114], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 388.486/pb
+        [316153, 316153], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 256.24/pb
+        [316186, 316187], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 527.582/pb
+        [316199, 316202], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 589.387/pb
+        [316216, 316219], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 551.849/pb
+        [316239, 316241], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 546.196/pb
+        [316271, 316271], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v4, 29.698/pb
+        [316361, 316363], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 84.941/pb
+        [316377, 316380], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 188.825/pb
+        [316455, 316455], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 9.607/pb
+        [316457, 316457], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 326.273/pb
+        [316469, 316470], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 265.747/pb
+        [316472, 316472], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 66.237/pb
+        [316505, 316505], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 401.22/pb
+        [316569, 316569], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 485.569/pb
+        [316590, 316590], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 189.247/pb
+        [316613, 316613], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 31.466/pb
+        [316615, 316615], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 49.127/pb
+        [316666, 316667], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 321.521/pb
+        [316700, 316702], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 353.699/pb
+        [316715, 316723], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 440.225/pb
+        [316758, 316758], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 455.683/pb
+        [316766, 316766], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 561.053/pb
+        [316876, 316877], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 327.431/pb
+        [316879, 316879], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 36.513/pb
+        [316928, 316928], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 44.417/pb
+        [316985, 316985], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 172.546/pb
+        [316993, 316995], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 265.445/pb
+        [317080, 317080], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 7.844/pb
+        [317087, 317087], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 243.2/pb
+        [317089, 317089], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 212.905/pb
+        [317182, 317182], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 406.207/pb
+        [317212, 317213], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 176.661/pb
+        [317279, 317279], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 65.892/pb
+        [317291, 317292], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 359.036/pb
+        [317297, 317297], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 123.799/pb
+        [317319, 317320], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 514.282/pb
+        [317338, 317340], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 219.977/pb
+        [317382, 317383], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 46.591/pb
+        [317391, 317392], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 493.374/pb
+        [317435, 317435], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 360.613/pb
+        [317438, 317438], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 49.71/pb
+        [317475, 317475], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 25.761/pb
+        [317478, 317478], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 7.937/pb
+        [317484, 317484], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 160.356/pb
+        [317488, 317488], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 181.128/pb
+        [317527, 317527], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 452.099/pb
+        [317591, 317591], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 111.117/pb
+        [317626, 317626], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 528.94/pb
+        [317640, 317641], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 529.494/pb
+        [317648, 317650], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 483.09/pb
+        [317661, 317661], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 375.651/pb
+        [317663, 317663], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 153.301/pb
+        [317683, 317683], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 117.852/pb
+        [317696, 317696], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 228.787/pb
+        [318733, 318733], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 2.792/pb
+        [318828, 318828], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 13.229/pb
+        [318872, 318872], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 91.855/pb
+        [318874, 318874], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 99.565/pb
+        [318876, 318877], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 207.136/pb
+        [319077, 319077], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 16.372/pb
+        [319337, 319337], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 232.389/pb
+        [319347, 319349], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 256.706/pb
+        [319449, 319450], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 456.219/pb
+        [319456, 319456], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 52.016/pb
+        [319459, 319459], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 17.212/pb
+        [319486, 319486], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 20.315/pb
+        [319503, 319503], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 90.959/pb
+        [319524, 319524], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 456.701/pb
+        [319526, 319526], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 69.66/pb
+        [319528, 319528], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 58.411/pb
+        [319579, 319579], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 818.49/pb
+        [319625, 319625], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 70.596/pb
+        [319639, 319639], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 409.34/pb
+        [319656, 319659], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 221.8/pb
+        [319678, 319678], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 95.425/pb
+        [319687, 319687], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 16.053/pb
+        [319697, 319698], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 96.857/pb
+        [319756, 319756], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 490.205/pb
+        [319840, 319841], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 69.999/pb
+        [319847, 319849], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 193.537/pb
+        [319851, 319851], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 1.137/pb
+        [319853, 319854], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 124.92/pb
+        [319908, 319910], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 324.281/pb
+        [319912, 319915], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 119.686/pb
+        [319941, 319942], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 111.886/pb
+        [319950, 319950], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 65.936/pb
+        [319991, 319993], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 530.374/pb
+        [320002, 320002], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 50.203/pb
+        [320006, 320006], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 114.14/pb
+        [320010, 320012], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 153.875/pb
+        [320023, 320026], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 305.475/pb
+        [320038, 320040], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 404.341/pb
+        [320059, 320065], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 395.979/pb
+        [320673, 320674], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 98.341/pb
+        [320688, 320688], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 130.855/pb
+        [320712, 320712], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 69.58/pb
+        [320757, 320757], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 116.684/pb
+        [320804, 320804], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 319.033/pb
+        [320807, 320807], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 0.348/pb
+        [320809, 320809], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 106.231/pb
+        [320821, 320824], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 454.293/pb
+        [320838, 320838], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 92.366/pb
+        [320840, 320841], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 191.511/pb
+        [320853, 320859], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 433.068/pb
+        [320887, 320888], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 113.862/pb
+        [320916, 320917], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 484.437/pb
+        [320920, 320920], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 24.013/pb
+        [320933, 320934], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 262.426/pb
+        [320936, 320936], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 78.32/pb
+        [320941, 320941], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 15.638/pb
+        [320980, 320980], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 38.408/pb
+        [320995, 320996], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 74.084/pb
+        [321004, 321007], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 320.57/pb
+        [321009, 321012], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 105.863/pb
+        [321051, 321051], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 311.577/pb
+        [321055, 321055], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 125.495/pb
+        [321067, 321069], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 369.401/pb
+        [321119, 321119], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 58.668/pb
+        [321121, 321122], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 136.178/pb
+        [321124, 321124], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 185.308/pb
+        [321126, 321126], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 78.957/pb
+        [321134, 321134], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 8.164/pb
+        [321138, 321138], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 141.977/pb
+        [321140, 321140], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 116.949/pb
+        [321149, 321149], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 434.675/pb
+        [321165, 321167], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 277.898/pb
+        [321177, 321178], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 174.709/pb
+        [321218, 321219], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 463.69/pb
+        [321221, 321221], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 5.906/pb
+        [321230, 321233], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 275.104/pb
+        [321262, 321262], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 1.669/pb
+        [321283, 321283], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 119.781/pb
+        [321294, 321296], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 233.977/pb
+        [321305, 321305], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 601.905/pb
+        [321311, 321313], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 87.325/pb
+        [321393, 321393], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 49.689/pb
+        [321396, 321397], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 417.281/pb
+        [321414, 321415], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 523.015/pb
+        [321431, 321434], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 296.1/pb
+        [321436, 321436], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 138.442/pb
+        [321457, 321457], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 482.762/pb
+        [321461, 321461], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 21.013/pb
+        [321475, 321475], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 471.913/pb
+        [321710, 321710], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 17.235/pb
+        [321712, 321712], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 84.378/pb
+        [321730, 321730], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 102.671/pb
+        [321732, 321732], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 344.692/pb
+        [321735, 321735], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 23.661/pb
+        [321755, 321755], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 213.438/pb
+        [321758, 321758], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 37.518/pb
+        [321760, 321760], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 146.153/pb
+        [321773, 321778], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 174.569/pb
+        [321780, 321781], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 181.684/pb
+        [321813, 321813], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 120.244/pb
+        [321815, 321815], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 5.12/pb
+        [321817, 321818], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 286.489/pb
+        [321820, 321820], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 32.069/pb
+        [321831, 321834], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 488.005/pb
+        [321879, 321880], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 131.546/pb
+        [321887, 321887], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 276.941/pb
+        [321908, 321909], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 485.884/pb
+        [321917, 321917], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 261.22/pb
+        [321919, 321919], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 1.489/pb
+        [321933, 321933], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 101.007/pb
+        [321960, 321961], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 139.431/pb
+        [321973, 321973], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 358.667/pb
+        [321975, 321975], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 145.784/pb
+        [321988, 321988], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 384.022/pb
+        [321990, 321990], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 81.032/pb
+        [322013, 322014], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 7.816/pb
+        [322022, 322022], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 452.969/pb
+        [322040, 322040], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 13.692/pb
+        [322057, 322057], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 8.235/pb
+        [322068, 322068], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 232.599/pb
+        [322079, 322079], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 140.245/pb
+        [322106, 322106], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 281.859/pb
+        [322113, 322113], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 40.79/pb
+        [322118, 322118], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 268.229/pb
+        [322179, 322179], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 469.75/pb
+        [322201, 322201], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 84.335/pb
+        [322204, 322204], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 311.166/pb
+        [322222, 322222], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 92.744/pb
+        [322252, 322252], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 420.358/pb
+        [322317, 322317], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 19.246/pb
+        [322319, 322319], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 55.502/pb
+        [322322, 322322], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 292.464/pb
+        [322324, 322324], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 69.26/pb
+        [322332, 322332], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 313.996/pb
+        [322348, 322348], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 414.112/pb
+        [322355, 322356], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 268.46/pb
+        [322381, 322381], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 178.73/pb
+        [322407, 322407], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 169.958/pb
+        [322430, 322431], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 370.371/pb
+        [322480, 322480], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 109.337/pb
+        [322492, 322492], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 287.515/pb
+        [322510, 322510], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 2.229/pb
+        [322599, 322599], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 94.351/pb
+        [322602, 322603], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 26.803/pb
+        [322605, 322605], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 89.624/pb
+        [322617, 322617], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 136.646/pb
+        [322625, 322625], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 335.273/pb
+        [322633, 322633], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 50.946/pb
+        [323414, 323414], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 6.204/pb
+        [323423, 323423], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 21.037/pb
+        [323470, 323475], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 321.533/pb
+        [323487, 323488], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 340.364/pb
+        [323492, 323493], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 33.198/pb
+        [323495, 323495], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 32.347/pb
+        [323524, 323526], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 480.533/pb
+        [323693, 323693], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 40.083/pb
+        [323696, 323696], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 88.848/pb
+        [323702, 323702], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 145.958/pb
+        [323725, 323727], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 380.043/pb
+        [323755, 323755], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 296.639/pb
+        [323775, 323775], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 46.768/pb
+        [323778, 323778], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 270.936/pb
+        [323790, 323790], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 276.737/pb
+        [323794, 323794], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 16.057/pb
+        [323841, 323841], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 155.038/pb
+        [323857, 323857], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 95.513/pb
+        [323940, 323940], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 426.706/pb
+        [323954, 323954], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 15.141/pb
+        [323976, 323976], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 14.399/pb
+        [323978, 323978], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 21.952/pb
+        [323980, 323980], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 67.732/pb
+        [323983, 323983], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 56.791/pb
+        [323997, 323997], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 128.792/pb
+        [324021, 324022], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 380.271/pb
+        [324077, 324077], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 242.583/pb
+        [324201, 324202], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 402.099/pb
+        [324205, 324207], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 44.541/pb
+        [324209, 324209], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 16.079/pb
+        [324237, 324237], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 74.992/pb
+        [324245, 324245], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 417.199/pb
+        [324293, 324293], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 513.035/pb
+        [324315, 324315], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 70.437/pb
+        [324318, 324318], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 99.84/pb
+        [324420, 324420], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 199.727/pb
+        [324729, 324729], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 14.797/pb
+        [324747, 324747], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 308.246/pb
+        [324764, 324765], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 117.745/pb
+        [324769, 324769], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 46.77/pb
+        [324772, 324772], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 18.783/pb
+        [324785, 324785], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 185.798/pb
+        [324791, 324791], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 245.007/pb
+        [324835, 324835], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 85.856/pb
+        [324840, 324841], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 328.73/pb
+        [324846, 324846], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 68.553/pb
+        [324878, 324878], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 403.017/pb
+        [324897, 324897], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 50.229/pb
+        [324970, 324970], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 479.466/pb
+        [324980, 324980], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 513.295/pb
+        [324997, 325001], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 370.507/pb
+        [325022, 325022], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 433.386/pb
+        [325057, 325057], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 120.048/pb
+        [325097, 325101], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 351.717/pb
+        [325110, 325110], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 3.259/pb
+        [325117, 325117], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 85.217/pb
+        [325159, 325159], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 61.44/pb
+        [325168, 325170], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 273.009/pb
+        [325172, 325172], # HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8_v5, 67.636/pb
+      ],
+    },
+  ],
+  '1e1mu' : [
+    {
+      'name'        : 'HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 7.929/pb
+        [315259, 315259], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 13.919/pb
+        [315264, 315265], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 46.158/pb
+        [315267, 315267], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 37.143/pb
+        [315270, 315270], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 78.981/pb
+        [315322, 315322], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 180.063/pb
+        [315339, 315339], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 93.349/pb
+        [315357, 315357], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 151.931/pb
+        [315361, 315361], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 118.532/pb
+        [315363, 315363], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 14.489/pb
+        [315366, 315366], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 100.183/pb
+        [315420, 315420], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 258.566/pb
+        [315488, 315490], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 296.522/pb
+        [315506, 315506], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 27.983/pb
+        [315510, 315510], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 103.172/pb
+        [315512, 315512], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 236.871/pb
+        [315543, 315543], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 36.886/pb
+        [315555, 315557], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 114.498/pb
+        [315640, 315642], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 43.181/pb
+        [315644, 315648], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 439.459/pb
+        [315689, 315690], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 448.961/pb
+        [315702, 315705], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 328.569/pb
+        [315713, 315713], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 353.735/pb
+        [315721, 315721], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 210.579/pb
+        [315741, 315741], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 23.717/pb
+        [315764, 315764], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 114.011/pb
+        [315770, 315770], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 121.796/pb
+        [315784, 315786], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 179.651/pb
+        [315790, 315790], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 173.124/pb
+        [315800, 315801], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 304.75/pb
+        [315840, 315840], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11, 354.111/pb
+        [315973, 315974], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v11/HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 297.118/pb
+        [316058, 316062], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 512.949/pb
+        [316082, 316082], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 141.36/pb
+        [316110, 316111], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 97.131/pb
+        [316113, 316114], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 388.486/pb
+        [316153, 316153], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 256.24/pb
+        [316186, 316187], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 527.582/pb
+        [316199, 316202], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 589.387/pb
+        [316216, 316219], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 551.849/pb
+        [316239, 316241], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 546.196/pb
+        [316271, 316271], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v12, 29.698/pb
+        [316361, 316363], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 84.941/pb
+        [316377, 316380], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 188.825/pb
+        [316455, 316455], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 9.607/pb
+        [316457, 316457], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 326.273/pb
+        [316469, 316470], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 265.747/pb
+        [316472, 316472], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 66.237/pb
+        [316505, 316505], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 401.22/pb
+        [316569, 316569], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 485.569/pb
+        [316590, 316590], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 189.247/pb
+        [316613, 316613], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 31.466/pb
+        [316615, 316615], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 49.127/pb
+        [316666, 316667], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 321.521/pb
+        [316700, 316702], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 353.699/pb
+        [316715, 316723], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 440.225/pb
+        [316758, 316758], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 455.683/pb
+        [316766, 316766], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 561.053/pb
+        [316876, 316877], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 327.431/pb
+        [316879, 316879], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 36.513/pb
+        [316928, 316928], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 44.417/pb
+        [316985, 316985], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 172.546/pb
+        [316993, 316995], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 265.445/pb
+        [317080, 317080], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 7.844/pb
+        [317087, 317087], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 243.2/pb
+        [317089, 317089], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 212.905/pb
+        [317182, 317182], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 406.207/pb
+        [317212, 317213], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 176.661/pb
+        [317279, 317279], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 65.892/pb
+        [317291, 317292], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 359.036/pb
+        [317297, 317297], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 123.799/pb
+        [317319, 317320], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 514.282/pb
+        [317338, 317340], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 219.977/pb
+        [317382, 317383], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 46.591/pb
+        [317391, 317392], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 493.374/pb
+        [317435, 317435], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 360.613/pb
+        [317438, 317438], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 49.71/pb
+        [317475, 317475], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 25.761/pb
+        [317478, 317478], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 7.937/pb
+        [317484, 317484], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 160.356/pb
+        [317488, 317488], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 181.128/pb
+        [317527, 317527], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 452.099/pb
+        [317591, 317591], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 111.117/pb
+        [317626, 317626], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 528.94/pb
+        [317640, 317641], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 529.494/pb
+        [317648, 317650], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 483.09/pb
+        [317661, 317661], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 375.651/pb
+        [317663, 317663], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 153.301/pb
+        [317683, 317683], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 117.852/pb
+        [317696, 317696], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 228.787/pb
+        [318733, 318733], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 2.792/pb
+        [318828, 318828], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 13.229/pb
+        [318872, 318872], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 91.855/pb
+        [318874, 318874], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 99.565/pb
+        [318876, 318877], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 207.136/pb
+        [319077, 319077], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 16.372/pb
+        [319337, 319337], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 232.389/pb
+        [319347, 319349], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 256.706/pb
+        [319449, 319450], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 456.219/pb
+        [319456, 319456], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 52.016/pb
+        [319459, 319459], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 17.212/pb
+        [319486, 319486], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 20.315/pb
+        [319503, 319503], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 90.959/pb
+        [319524, 319524], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 456.701/pb
+        [319526, 319526], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 69.66/pb
+        [319528, 319528], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 58.411/pb
+        [319579, 319579], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 818.49/pb
+        [319625, 319625], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 70.596/pb
+        [319639, 319639], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 409.34/pb
+        [319656, 319659], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 221.8/pb
+        [319678, 319678], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 95.425/pb
+        [319687, 319687], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 16.053/pb
+        [319697, 319698], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 96.857/pb
+        [319756, 319756], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 490.205/pb
+        [319840, 319841], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 69.999/pb
+        [319847, 319849], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 193.537/pb
+        [319851, 319851], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 1.137/pb
+        [319853, 319854], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 124.92/pb
+        [319908, 319910], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 324.281/pb
+        [319912, 319915], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 119.686/pb
+        [319941, 319942], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 111.886/pb
+        [319950, 319950], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 65.936/pb
+        [319991, 319993], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 530.374/pb
+        [320002, 320002], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 50.203/pb
+        [320006, 320006], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 114.14/pb
+        [320010, 320012], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 153.875/pb
+        [320023, 320026], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 305.475/pb
+        [320038, 320040], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 404.341/pb
+        [320059, 320065], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 395.979/pb
+        [320673, 320674], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 98.341/pb
+        [320688, 320688], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 130.855/pb
+        [320712, 320712], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 69.58/pb
+        [320757, 320757], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 116.684/pb
+        [320804, 320804], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 319.033/pb
+        [320807, 320807], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 0.348/pb
+        [320809, 320809], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 106.231/pb
+        [320821, 320824], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 454.293/pb
+        [320838, 320838], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 92.366/pb
+        [320840, 320841], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 191.511/pb
+        [320853, 320859], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 433.068/pb
+        [320887, 320888], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 113.862/pb
+        [320916, 320917], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 484.437/pb
+        [320920, 320920], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 24.013/pb
+        [320933, 320934], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 262.426/pb
+        [320936, 320936], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 78.32/pb
+        [320941, 320941], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 15.638/pb
+        [320980, 320980], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 38.408/pb
+        [320995, 320996], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 74.084/pb
+        [321004, 321007], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 320.57/pb
+        [321009, 321012], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 105.863/pb
+        [321051, 321051], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 311.577/pb
+        [321055, 321055], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 125.495/pb
+        [321067, 321069], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 369.401/pb
+        [321119, 321119], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 58.668/pb
+        [321121, 321122], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 136.178/pb
+        [321124, 321124], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 185.308/pb
+        [321126, 321126], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 78.957/pb
+        [321134, 321134], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 8.164/pb
+        [321138, 321138], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 141.977/pb
+        [321140, 321140], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 116.949/pb
+        [321149, 321149], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 434.675/pb
+        [321165, 321167], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 277.898/pb
+        [321177, 321178], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 174.709/pb
+        [321218, 321219], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 463.69/pb
+        [321221, 321221], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 5.906/pb
+        [321230, 321233], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 275.104/pb
+        [321262, 321262], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 1.669/pb
+        [321283, 321283], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 119.781/pb
+        [321294, 321296], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 233.977/pb
+        [321305, 321305], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 601.905/pb
+        [321311, 321313], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 87.325/pb
+        [321393, 321393], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 49.689/pb
+        [321396, 321397], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 417.281/pb
+        [321414, 321415], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 523.015/pb
+        [321431, 321434], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 296.1/pb
+        [321436, 321436], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 138.442/pb
+        [321457, 321457], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 482.762/pb
+        [321461, 321461], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 21.013/pb
+        [321475, 321475], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 471.913/pb
+        [321710, 321710], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 17.235/pb
+        [321712, 321712], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 84.378/pb
+        [321730, 321730], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 102.671/pb
+        [321732, 321732], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 344.692/pb
+        [321735, 321735], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 23.661/pb
+        [321755, 321755], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 213.438/pb
+        [321758, 321758], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 37.518/pb
+        [321760, 321760], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 146.153/pb
+        [321773, 321778], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 174.569/pb
+        [321780, 321781], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 181.684/pb
+        [321813, 321813], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 120.244/pb
+        [321815, 321815], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 5.12/pb
+        [321817, 321818], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 286.489/pb
+        [321820, 321820], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 32.069/pb
+        [321831, 321834], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 488.005/pb
+        [321879, 321880], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 131.546/pb
+        [321887, 321887], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 276.941/pb
+        [321908, 321909], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 485.884/pb
+        [321917, 321917], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 261.22/pb
+        [321919, 321919], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 1.489/pb
+        [321933, 321933], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 101.007/pb
+        [321960, 321961], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 139.431/pb
+        [321973, 321973], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 358.667/pb
+        [321975, 321975], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 145.784/pb
+        [321988, 321988], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 384.022/pb
+        [321990, 321990], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 81.032/pb
+        [322013, 322014], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 7.816/pb
+        [322022, 322022], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 452.969/pb
+        [322040, 322040], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 13.692/pb
+        [322057, 322057], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 8.235/pb
+        [322068, 322068], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 232.599/pb
+        [322079, 322079], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 140.245/pb
+        [322106, 322106], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 281.859/pb
+        [322113, 322113], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 40.79/pb
+        [322118, 322118], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 268.229/pb
+        [322179, 322179], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 469.75/pb
+        [322201, 322201], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 84.335/pb
+        [322204, 322204], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 311.166/pb
+        [322222, 322222], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 92.744/pb
+        [322252, 322252], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 420.358/pb
+        [322317, 322317], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 19.246/pb
+        [322319, 322319], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 55.502/pb
+        [322322, 322322], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 292.464/pb
+        [322324, 322324], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 69.26/pb
+        [322332, 322332], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 313.996/pb
+        [322348, 322348], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 414.112/pb
+        [322355, 322356], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 268.46/pb
+        [322381, 322381], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 178.73/pb
+        [322407, 322407], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 169.958/pb
+        [322430, 322431], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 370.371/pb
+        [322480, 322480], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 109.337/pb
+        [322492, 322492], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 287.515/pb
+        [322510, 322510], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 2.229/pb
+        [322599, 322599], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 94.351/pb
+        [322602, 322603], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 26.803/pb
+        [322605, 322605], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 89.624/pb
+        [322617, 322617], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 136.646/pb
+        [322625, 322625], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 335.273/pb
+        [322633, 322633], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 50.946/pb
+        [323414, 323414], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 6.204/pb
+        [323423, 323423], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 21.037/pb
+        [323470, 323475], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 321.533/pb
+        [323487, 323488], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 340.364/pb
+        [323492, 323493], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 33.198/pb
+        [323495, 323495], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 32.347/pb
+        [323524, 323526], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 480.533/pb
+        [323693, 323693], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 40.083/pb
+        [323696, 323696], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 88.848/pb
+        [323702, 323702], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 145.958/pb
+        [323725, 323727], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 380.043/pb
+        [323755, 323755], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 296.639/pb
+        [323775, 323775], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 46.768/pb
+        [323778, 323778], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 270.936/pb
+        [323790, 323790], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 276.737/pb
+        [323794, 323794], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 16.057/pb
+        [323841, 323841], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 155.038/pb
+        [323857, 323857], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 95.513/pb
+        [323940, 323940], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 426.706/pb
+        [323954, 323954], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 15.141/pb
+        [323976, 323976], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 14.399/pb
+        [323978, 323978], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 21.952/pb
+        [323980, 323980], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 67.732/pb
+        [323983, 323983], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 56.791/pb
+        [323997, 323997], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 128.792/pb
+        [324021, 324022], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 380.271/pb
+        [324077, 324077], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 242.583/pb
+        [324201, 324202], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 402.099/pb
+        [324205, 324207], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 44.541/pb
+        [324209, 324209], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 16.079/pb
+        [324237, 324237], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 74.992/pb
+        [324245, 324245], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 417.199/pb
+        [324293, 324293], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 513.035/pb
+        [324315, 324315], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 70.437/pb
+        [324318, 324318], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 99.84/pb
+        [324420, 324420], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 199.727/pb
+        [324729, 324729], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 14.797/pb
+        [324747, 324747], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 308.246/pb
+        [324764, 324765], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 117.745/pb
+        [324769, 324769], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 46.77/pb
+        [324772, 324772], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 18.783/pb
+        [324785, 324785], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 185.798/pb
+        [324791, 324791], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 245.007/pb
+        [324835, 324835], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 85.856/pb
+        [324840, 324841], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 328.73/pb
+        [324846, 324846], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 68.553/pb
+        [324878, 324878], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 403.017/pb
+        [324897, 324897], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 50.229/pb
+        [324970, 324970], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 479.466/pb
+        [324980, 324980], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 513.295/pb
+        [324997, 325001], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 370.507/pb
+        [325022, 325022], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 433.386/pb
+        [325057, 325057], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 120.048/pb
+        [325097, 325101], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 351.717/pb
+        [325110, 325110], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 3.259/pb
+        [325117, 325117], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 85.217/pb
+        [325159, 325159], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 61.44/pb
+        [325168, 325170], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 273.009/pb
+        [325172, 325172], # HLT_Mu8_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 67.636/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 7.929/pb
+        [315259, 315259], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 13.919/pb
+        [315264, 315265], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 46.158/pb
+        [315267, 315267], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 37.143/pb
+        [315270, 315270], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 78.981/pb
+        [315322, 315322], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 180.063/pb
+        [315339, 315339], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 93.349/pb
+        [315357, 315357], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 151.931/pb
+        [315361, 315361], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 118.532/pb
+        [315363, 315363], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 14.489/pb
+        [315366, 315366], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 100.183/pb
+        [315420, 315420], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 258.566/pb
+        [315488, 315490], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 296.522/pb
+        [315506, 315506], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 27.983/pb
+        [315510, 315510], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 103.172/pb
+        [315512, 315512], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 236.871/pb
+        [315543, 315543], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 36.886/pb
+        [315555, 315557], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 114.498/pb
+        [315640, 315642], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 43.181/pb
+        [315644, 315648], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 439.459/pb
+        [315689, 315690], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 448.961/pb
+        [315702, 315705], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 328.569/pb
+        [315713, 315713], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 353.735/pb
+        [315721, 315721], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 210.579/pb
+        [315741, 315741], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 23.717/pb
+        [315764, 315764], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 114.011/pb
+        [315770, 315770], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 121.796/pb
+        [315784, 315786], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 179.651/pb
+        [315790, 315790], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 173.124/pb
+        [315800, 315801], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 304.75/pb
+        [315840, 315840], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13, 354.111/pb
+        [315973, 315974], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v13/HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 297.118/pb
+        [316058, 316062], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 512.949/pb
+        [316082, 316082], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 141.36/pb
+        [316110, 316111], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 97.131/pb
+        [316113, 316114], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 388.486/pb
+        [316153, 316153], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 256.24/pb
+        [316186, 316187], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 527.582/pb
+        [316199, 316202], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 589.387/pb
+        [316216, 316219], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 551.849/pb
+        [316239, 316241], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 546.196/pb
+        [316271, 316271], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v14, 29.698/pb
+        [316361, 316363], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 84.941/pb
+        [316377, 316380], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 188.825/pb
+        [316455, 316455], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 9.607/pb
+        [316457, 316457], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 326.273/pb
+        [316469, 316470], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 265.747/pb
+        [316472, 316472], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 66.237/pb
+        [316505, 316505], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 401.22/pb
+        [316569, 316569], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 485.569/pb
+        [316590, 316590], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 189.247/pb
+        [316613, 316613], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 31.466/pb
+        [316615, 316615], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 49.127/pb
+        [316666, 316667], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 321.521/pb
+        [316700, 316702], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 353.699/pb
+        [316715, 316723], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 440.225/pb
+        [316758, 316758], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 455.683/pb
+        [316766, 316766], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 561.053/pb
+        [316876, 316877], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 327.431/pb
+        [316879, 316879], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 36.513/pb
+        [316928, 316928], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 44.417/pb
+        [316985, 316985], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 172.546/pb
+        [316993, 316995], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 265.445/pb
+        [317080, 317080], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 7.844/pb
+        [317087, 317087], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 243.2/pb
+        [317089, 317089], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 212.905/pb
+        [317182, 317182], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 406.207/pb
+        [317212, 317213], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 176.661/pb
+        [317279, 317279], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 65.892/pb
+        [317291, 317292], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 359.036/pb
+        [317297, 317297], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 123.799/pb
+        [317319, 317320], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 514.282/pb
+        [317338, 317340], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 219.977/pb
+        [317382, 317383], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 46.591/pb
+        [317391, 317392], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 493.374/pb
+        [317435, 317435], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 360.613/pb
+        [317438, 317438], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 49.71/pb
+        [317475, 317475], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 25.761/pb
+        [317478, 317478], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 7.937/pb
+        [317484, 317484], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 160.356/pb
+        [317488, 317488], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 181.128/pb
+        [317527, 317527], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 452.099/pb
+        [317591, 317591], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 111.117/pb
+        [317626, 317626], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 528.94/pb
+        [317640, 317641], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 529.494/pb
+        [317648, 317650], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 483.09/pb
+        [317661, 317661], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 375.651/pb
+        [317663, 317663], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 153.301/pb
+        [317683, 317683], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 117.852/pb
+        [317696, 317696], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 228.787/pb
+        [318733, 318733], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 2.792/pb
+        [318828, 318828], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 13.229/pb
+        [318872, 318872], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 91.855/pb
+        [318874, 318874], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 99.565/pb
+        [318876, 318877], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 207.136/pb
+        [319077, 319077], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 16.372/pb
+        [319337, 319337], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 232.389/pb
+        [319347, 319349], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 256.706/pb
+        [319449, 319450], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 456.219/pb
+        [319456, 319456], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 52.016/pb
+        [319459, 319459], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 17.212/pb
+        [319486, 319486], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 20.315/pb
+        [319503, 319503], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 90.959/pb
+        [319524, 319524], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 456.701/pb
+        [319526, 319526], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 69.66/pb
+        [319528, 319528], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 58.411/pb
+        [319579, 319579], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 818.49/pb
+        [319625, 319625], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 70.596/pb
+        [319639, 319639], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 409.34/pb
+        [319656, 319659], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 221.8/pb
+        [319678, 319678], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 95.425/pb
+        [319687, 319687], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 16.053/pb
+        [319697, 319698], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 96.857/pb
+        [319756, 319756], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 490.205/pb
+        [319840, 319841], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 69.999/pb
+        [319847, 319849], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 193.537/pb
+        [319851, 319851], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 1.137/pb
+        [319853, 319854], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 124.92/pb
+        [319908, 319910], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 324.281/pb
+        [319912, 319915], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 119.686/pb
+        [319941, 319942], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 111.886/pb
+        [319950, 319950], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 65.936/pb
+        [319991, 319993], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 530.374/pb
+        [320002, 320002], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 50.203/pb
+        [320006, 320006], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 114.14/pb
+        [320010, 320012], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 153.875/pb
+        [320023, 320026], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 305.475/pb
+        [320038, 320040], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 404.341/pb
+        [320059, 320065], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 395.979/pb
+        [320673, 320674], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 98.341/pb
+        [320688, 320688], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 130.855/pb
+        [320712, 320712], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 69.58/pb
+        [320757, 320757], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 116.684/pb
+        [320804, 320804], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 319.033/pb
+        [320807, 320807], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 0.348/pb
+        [320809, 320809], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 106.231/pb
+        [320821, 320824], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 454.293/pb
+        [320838, 320838], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 92.366/pb
+        [320840, 320841], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 191.511/pb
+        [320853, 320859], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 433.068/pb
+        [320887, 320888], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 113.862/pb
+        [320916, 320917], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 484.437/pb
+        [320920, 320920], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 24.013/pb
+        [320933, 320934], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 262.426/pb
+        [320936, 320936], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 78.32/pb
+        [320941, 320941], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 15.638/pb
+        [320980, 320980], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 38.408/pb
+        [320995, 320996], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 74.084/pb
+        [321004, 321007], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 320.57/pb
+        [321009, 321012], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 105.863/pb
+        [321051, 321051], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 311.577/pb
+        [321055, 321055], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 125.495/pb
+        [321067, 321069], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 369.401/pb
+        [321119, 321119], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 58.668/pb
+        [321121, 321122], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 136.178/pb
+        [321124, 321124], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 185.308/pb
+        [321126, 321126], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 78.957/pb
+        [321134, 321134], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 8.164/pb
+        [321138, 321138], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 141.977/pb
+        [321140, 321140], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 116.949/pb
+        [321149, 321149], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 434.675/pb
+        [321165, 321167], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 277.898/pb
+        [321177, 321178], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 174.709/pb
+        [321218, 321219], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 463.69/pb
+        [321221, 321221], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 5.906/pb
+        [321230, 321233], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 275.104/pb
+        [321262, 321262], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 1.669/pb
+        [321283, 321283], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 119.781/pb
+        [321294, 321296], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 233.977/pb
+        [321305, 321305], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 601.905/pb
+        [321311, 321313], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 87.325/pb
+        [321393, 321393], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 49.689/pb
+        [321396, 321397], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 417.281/pb
+        [321414, 321415], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 523.015/pb
+        [321431, 321434], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 296.1/pb
+        [321436, 321436], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 138.442/pb
+        [321457, 321457], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 482.762/pb
+        [321461, 321461], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 21.013/pb
+        [321475, 321475], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 471.913/pb
+        [321710, 321710], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 17.235/pb
+        [321712, 321712], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 84.378/pb
+        [321730, 321730], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 102.671/pb
+        [321732, 321732], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 344.692/pb
+        [321735, 321735], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 23.661/pb
+        [321755, 321755], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 213.438/pb
+        [321758, 321758], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 37.518/pb
+        [321760, 321760], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 146.153/pb
+        [321773, 321778], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 174.569/pb
+        [321780, 321781], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 181.684/pb
+        [321813, 321813], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 120.244/pb
+        [321815, 321815], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 5.12/pb
+        [321817, 321818], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 286.489/pb
+        [321820, 321820], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 32.069/pb
+        [321831, 321834], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 488.005/pb
+        [321879, 321880], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 131.546/pb
+        [321887, 321887], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 276.941/pb
+        [321908, 321909], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 485.884/pb
+        [321917, 321917], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 261.22/pb
+        [321919, 321919], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 1.489/pb
+        [321933, 321933], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 101.007/pb
+        [321960, 321961], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 139.431/pb
+        [321973, 321973], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 358.667/pb
+        [321975, 321975], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 145.784/pb
+        [321988, 321988], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 384.022/pb
+        [321990, 321990], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 81.032/pb
+        [322013, 322014], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 7.816/pb
+        [322022, 322022], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 452.969/pb
+        [322040, 322040], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 13.692/pb
+        [322057, 322057], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 8.235/pb
+        [322068, 322068], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 232.599/pb
+        [322079, 322079], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 140.245/pb
+        [322106, 322106], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 281.859/pb
+        [322113, 322113], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 40.79/pb
+        [322118, 322118], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 268.229/pb
+        [322179, 322179], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 469.75/pb
+        [322201, 322201], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 84.335/pb
+        [322204, 322204], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 311.166/pb
+        [322222, 322222], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 92.744/pb
+        [322252, 322252], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 420.358/pb
+        [322317, 322317], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 19.246/pb
+        [322319, 322319], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 55.502/pb
+        [322322, 322322], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 292.464/pb
+        [322324, 322324], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 69.26/pb
+        [322332, 322332], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 313.996/pb
+        [322348, 322348], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 414.112/pb
+        [322355, 322356], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 268.46/pb
+        [322381, 322381], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 178.73/pb
+        [322407, 322407], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 169.958/pb
+        [322430, 322431], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 370.371/pb
+        [322480, 322480], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 109.337/pb
+        [322492, 322492], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 287.515/pb
+        [322510, 322510], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 2.229/pb
+        [322599, 322599], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 94.351/pb
+        [322602, 322603], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 26.803/pb
+        [322605, 322605], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 89.624/pb
+        [322617, 322617], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 136.646/pb
+        [322625, 322625], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 335.273/pb
+        [322633, 322633], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 50.946/pb
+        [323414, 323414], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 6.204/pb
+        [323423, 323423], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 21.037/pb
+        [323470, 323475], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 321.533/pb
+        [323487, 323488], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 340.364/pb
+        [323492, 323493], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 33.198/pb
+        [323495, 323495], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 32.347/pb
+        [323524, 323526], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 480.533/pb
+        [323693, 323693], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 40.083/pb
+        [323696, 323696], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 88.848/pb
+        [323702, 323702], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 145.958/pb
+        [323725, 323727], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 380.043/pb
+        [323755, 323755], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 296.639/pb
+        [323775, 323775], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 46.768/pb
+        [323778, 323778], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 270.936/pb
+        [323790, 323790], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 276.737/pb
+        [323794, 323794], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 16.057/pb
+        [323841, 323841], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 155.038/pb
+        [323857, 323857], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 95.513/pb
+        [323940, 323940], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 426.706/pb
+        [323954, 323954], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 15.141/pb
+        [323976, 323976], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 14.399/pb
+        [323978, 323978], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 21.952/pb
+        [323980, 323980], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 67.732/pb
+        [323983, 323983], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 56.791/pb
+        [323997, 323997], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 128.792/pb
+        [324021, 324022], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 380.271/pb
+        [324077, 324077], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 242.583/pb
+        [324201, 324202], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 402.099/pb
+        [324205, 324207], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 44.541/pb
+        [324209, 324209], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 16.079/pb
+        [324237, 324237], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 74.992/pb
+        [324245, 324245], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 417.199/pb
+        [324293, 324293], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 513.035/pb
+        [324315, 324315], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 70.437/pb
+        [324318, 324318], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 99.84/pb
+        [324420, 324420], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 199.727/pb
+        [324729, 324729], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 14.797/pb
+        [324747, 324747], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 308.246/pb
+        [324764, 324765], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 117.745/pb
+        [324769, 324769], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 46.77/pb
+        [324772, 324772], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 18.783/pb
+        [324785, 324785], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 185.798/pb
+        [324791, 324791], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 245.007/pb
+        [324835, 324835], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 85.856/pb
+        [324840, 324841], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 328.73/pb
+        [324846, 324846], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 68.553/pb
+        [324878, 324878], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 403.017/pb
+        [324897, 324897], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 50.229/pb
+        [324970, 324970], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 479.466/pb
+        [324980, 324980], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 513.295/pb
+        [324997, 325001], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 370.507/pb
+        [325022, 325022], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 433.386/pb
+        [325057, 325057], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 120.048/pb
+        [325097, 325101], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 351.717/pb
+        [325110, 325110], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 3.259/pb
+        [325117, 325117], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 85.217/pb
+        [325159, 325159], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 61.44/pb
+        [325168, 325170], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 273.009/pb
+        [325172, 325172], # HLT_Mu12_TrkIsoVVL_Ele23_CaloIdL_TrackIdL_IsoVL_DZ_v15, 67.636/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 7.929/pb
+        [315259, 315259], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 13.919/pb
+        [315264, 315265], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 46.158/pb
+        [315267, 315267], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 37.143/pb
+        [315270, 315270], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 78.981/pb
+        [315322, 315322], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 180.063/pb
+        [315339, 315339], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 93.349/pb
+        [315357, 315357], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 151.931/pb
+        [315361, 315361], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 118.532/pb
+        [315363, 315363], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 14.489/pb
+        [315366, 315366], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 100.183/pb
+        [315420, 315420], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 258.566/pb
+        [315488, 315490], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 296.522/pb
+        [315506, 315506], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 27.983/pb
+        [315510, 315510], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 103.172/pb
+        [315512, 315512], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 236.871/pb
+        [315543, 315543], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 36.886/pb
+        [315555, 315557], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 114.498/pb
+        [315640, 315642], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 43.181/pb
+        [315644, 315648], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 439.459/pb
+        [315689, 315690], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 448.961/pb
+        [315702, 315705], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 328.569/pb
+        [315713, 315713], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 353.735/pb
+        [315721, 315721], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 210.579/pb
+        [315741, 315741], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 23.717/pb
+        [315764, 315764], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 114.011/pb
+        [315770, 315770], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 121.796/pb
+        [315784, 315786], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 179.651/pb
+        [315790, 315790], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 173.124/pb
+        [315800, 315801], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 304.75/pb
+        [315840, 315840], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5, 354.111/pb
+        [315973, 315974], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v5/HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 297.118/pb
+        [316058, 316062], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 512.949/pb
+        [316082, 316082], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 141.36/pb
+        [316110, 316111], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 97.131/pb
+        [316113, 316114], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 388.486/pb
+        [316153, 316153], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 256.24/pb
+        [316186, 316187], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 527.582/pb
+        [316199, 316202], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 589.387/pb
+        [316216, 316219], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 551.849/pb
+        [316239, 316241], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 546.196/pb
+        [316271, 316271], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v6, 29.698/pb
+        [316361, 316363], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 84.941/pb
+        [316377, 316380], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 188.825/pb
+        [316455, 316455], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 9.607/pb
+        [316457, 316457], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 326.273/pb
+        [316469, 316470], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 265.747/pb
+        [316472, 316472], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 66.237/pb
+        [316505, 316505], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 401.22/pb
+        [316569, 316569], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 485.569/pb
+        [316590, 316590], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 189.247/pb
+        [316613, 316613], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 31.466/pb
+        [316615, 316615], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 49.127/pb
+        [316666, 316667], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 321.521/pb
+        [316700, 316702], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 353.699/pb
+        [316715, 316723], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 440.225/pb
+        [316758, 316758], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 455.683/pb
+        [316766, 316766], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 561.053/pb
+        [316876, 316877], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 327.431/pb
+        [316879, 316879], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 36.513/pb
+        [316928, 316928], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 44.417/pb
+        [316985, 316985], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 172.546/pb
+        [316993, 316995], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 265.445/pb
+        [317080, 317080], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 7.844/pb
+        [317087, 317087], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 243.2/pb
+        [317089, 317089], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 212.905/pb
+        [317182, 317182], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 406.207/pb
+        [317212, 317213], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 176.661/pb
+        [317279, 317279], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 65.892/pb
+        [317291, 317292], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 359.036/pb
+        [317297, 317297], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 123.799/pb
+        [317319, 317320], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 514.282/pb
+        [317338, 317340], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 219.977/pb
+        [317382, 317383], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 46.591/pb
+        [317391, 317392], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 493.374/pb
+        [317435, 317435], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 360.613/pb
+        [317438, 317438], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 49.71/pb
+        [317475, 317475], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 25.761/pb
+        [317478, 317478], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 7.937/pb
+        [317484, 317484], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 160.356/pb
+        [317488, 317488], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 181.128/pb
+        [317527, 317527], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 452.099/pb
+        [317591, 317591], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 111.117/pb
+        [317626, 317626], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 528.94/pb
+        [317640, 317641], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 529.494/pb
+        [317648, 317650], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 483.09/pb
+        [317661, 317661], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 375.651/pb
+        [317663, 317663], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 153.301/pb
+        [317683, 317683], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 117.852/pb
+        [317696, 317696], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 228.787/pb
+        [318733, 318733], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 2.792/pb
+        [318828, 318828], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 13.229/pb
+        [318872, 318872], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 91.855/pb
+        [318874, 318874], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 99.565/pb
+        [318876, 318877], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 207.136/pb
+        [319077, 319077], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 16.372/pb
+        [319337, 319337], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 232.389/pb
+        [319347, 319349], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 256.706/pb
+        [319449, 319450], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 456.219/pb
+        [319456, 319456], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 52.016/pb
+        [319459, 319459], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 17.212/pb
+        [319486, 319486], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 20.315/pb
+        [319503, 319503], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 90.959/pb
+        [319524, 319524], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 456.701/pb
+        [319526, 319526], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 69.66/pb
+        [319528, 319528], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 58.411/pb
+        [319579, 319579], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 818.49/pb
+        [319625, 319625], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 70.596/pb
+        [319639, 319639], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 409.34/pb
+        [319656, 319659], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 221.8/pb
+        [319678, 319678], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 95.425/pb
+        [319687, 319687], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 16.053/pb
+        [319697, 319698], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 96.857/pb
+        [319756, 319756], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 490.205/pb
+        [319840, 319841], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 69.999/pb
+        [319847, 319849], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 193.537/pb
+        [319851, 319851], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 1.137/pb
+        [319853, 319854], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 124.92/pb
+        [319908, 319910], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 324.281/pb
+        [319912, 319915], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 119.686/pb
+        [319941, 319942], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 111.886/pb
+        [319950, 319950], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 65.936/pb
+        [319991, 319993], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 530.374/pb
+        [320002, 320002], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 50.203/pb
+        [320006, 320006], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 114.14/pb
+        [320010, 320012], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 153.875/pb
+        [320023, 320026], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 305.475/pb
+        [320038, 320040], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 404.341/pb
+        [320059, 320065], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 395.979/pb
+        [320673, 320674], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 98.341/pb
+        [320688, 320688], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 130.855/pb
+        [320712, 320712], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 69.58/pb
+        [320757, 320757], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 116.684/pb
+        [320804, 320804], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 319.033/pb
+        [320807, 320807], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 0.348/pb
+        [320809, 320809], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 106.231/pb
+        [320821, 320824], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 454.293/pb
+        [320838, 320838], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 92.366/pb
+        [320840, 320841], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 191.511/pb
+        [320853, 320859], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 433.068/pb
+        [320887, 320888], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 113.862/pb
+        [320916, 320917], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 484.437/pb
+        [320920, 320920], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 24.013/pb
+        [320933, 320934], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 262.426/pb
+        [320936, 320936], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 78.32/pb
+        [320941, 320941], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 15.638/pb
+        [320980, 320980], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 38.408/pb
+        [320995, 320996], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 74.084/pb
+        [321004, 321007], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 320.57/pb
+        [321009, 321012], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 105.863/pb
+        [321051, 321051], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 311.577/pb
+        [321055, 321055], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 125.495/pb
+        [321067, 321069], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 369.401/pb
+        [321119, 321119], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 58.668/pb
+        [321121, 321122], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 136.178/pb
+        [321124, 321124], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 185.308/pb
+        [321126, 321126], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 78.957/pb
+        [321134, 321134], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 8.164/pb
+        [321138, 321138], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 141.977/pb
+        [321140, 321140], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 116.949/pb
+        [321149, 321149], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 434.675/pb
+        [321165, 321167], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 277.898/pb
+        [321177, 321178], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 174.709/pb
+        [321218, 321219], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 463.69/pb
+        [321221, 321221], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 5.906/pb
+        [321230, 321233], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 275.104/pb
+        [321262, 321262], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 1.669/pb
+        [321283, 321283], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 119.781/pb
+        [321294, 321296], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 233.977/pb
+        [321305, 321305], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 601.905/pb
+        [321311, 321313], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 87.325/pb
+        [321393, 321393], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 49.689/pb
+        [321396, 321397], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 417.281/pb
+        [321414, 321415], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 523.015/pb
+        [321431, 321434], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 296.1/pb
+        [321436, 321436], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 138.442/pb
+        [321457, 321457], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 482.762/pb
+        [321461, 321461], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 21.013/pb
+        [321475, 321475], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 471.913/pb
+        [321710, 321710], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 17.235/pb
+        [321712, 321712], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 84.378/pb
+        [321730, 321730], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 102.671/pb
+        [321732, 321732], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 344.692/pb
+        [321735, 321735], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 23.661/pb
+        [321755, 321755], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 213.438/pb
+        [321758, 321758], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 37.518/pb
+        [321760, 321760], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 146.153/pb
+        [321773, 321778], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 174.569/pb
+        [321780, 321781], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 181.684/pb
+        [321813, 321813], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 120.244/pb
+        [321815, 321815], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 5.12/pb
+        [321817, 321818], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 286.489/pb
+        [321820, 321820], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 32.069/pb
+        [321831, 321834], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 488.005/pb
+        [321879, 321880], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 131.546/pb
+        [321887, 321887], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 276.941/pb
+        [321908, 321909], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 485.884/pb
+        [321917, 321917], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 261.22/pb
+        [321919, 321919], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 1.489/pb
+        [321933, 321933], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 101.007/pb
+        [321960, 321961], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 139.431/pb
+        [321973, 321973], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 358.667/pb
+        [321975, 321975], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 145.784/pb
+        [321988, 321988], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 384.022/pb
+        [321990, 321990], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 81.032/pb
+        [322013, 322014], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 7.816/pb
+        [322022, 322022], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 452.969/pb
+        [322040, 322040], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 13.692/pb
+        [322057, 322057], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 8.235/pb
+        [322068, 322068], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 232.599/pb
+        [322079, 322079], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 140.245/pb
+        [322106, 322106], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 281.859/pb
+        [322113, 322113], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 40.79/pb
+        [322118, 322118], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 268.229/pb
+        [322179, 322179], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 469.75/pb
+        [322201, 322201], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 84.335/pb
+        [322204, 322204], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 311.166/pb
+        [322222, 322222], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 92.744/pb
+        [322252, 322252], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 420.358/pb
+        [322317, 322317], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 19.246/pb
+        [322319, 322319], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 55.502/pb
+        [322322, 322322], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 292.464/pb
+        [322324, 322324], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 69.26/pb
+        [322332, 322332], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 313.996/pb
+        [322348, 322348], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 414.112/pb
+        [322355, 322356], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 268.46/pb
+        [322381, 322381], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 178.73/pb
+        [322407, 322407], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 169.958/pb
+        [322430, 322431], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 370.371/pb
+        [322480, 322480], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 109.337/pb
+        [322492, 322492], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 287.515/pb
+        [322510, 322510], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 2.229/pb
+        [322599, 322599], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 94.351/pb
+        [322602, 322603], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 26.803/pb
+        [322605, 322605], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 89.624/pb
+        [322617, 322617], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 136.646/pb
+        [322625, 322625], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 335.273/pb
+        [322633, 322633], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 50.946/pb
+        [323414, 323414], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 6.204/pb
+        [323423, 323423], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 21.037/pb
+        [323470, 323475], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 321.533/pb
+        [323487, 323488], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 340.364/pb
+        [323492, 323493], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 33.198/pb
+        [323495, 323495], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 32.347/pb
+        [323524, 323526], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 480.533/pb
+        [323693, 323693], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 40.083/pb
+        [323696, 323696], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 88.848/pb
+        [323702, 323702], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 145.958/pb
+        [323725, 323727], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 380.043/pb
+        [323755, 323755], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 296.639/pb
+        [323775, 323775], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 46.768/pb
+        [323778, 323778], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 270.936/pb
+        [323790, 323790], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 276.737/pb
+        [323794, 323794], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 16.057/pb
+        [323841, 323841], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 155.038/pb
+        [323857, 323857], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 95.513/pb
+        [323940, 323940], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 426.706/pb
+        [323954, 323954], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 15.141/pb
+        [323976, 323976], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 14.399/pb
+        [323978, 323978], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 21.952/pb
+        [323980, 323980], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 67.732/pb
+        [323983, 323983], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 56.791/pb
+        [323997, 323997], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 128.792/pb
+        [324021, 324022], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 380.271/pb
+        [324077, 324077], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 242.583/pb
+        [324201, 324202], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 402.099/pb
+        [324205, 324207], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 44.541/pb
+        [324209, 324209], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 16.079/pb
+        [324237, 324237], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 74.992/pb
+        [324245, 324245], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 417.199/pb
+        [324293, 324293], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 513.035/pb
+        [324315, 324315], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 70.437/pb
+        [324318, 324318], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 99.84/pb
+        [324420, 324420], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 199.727/pb
+        [324729, 324729], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 14.797/pb
+        [324747, 324747], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 308.246/pb
+        [324764, 324765], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 117.745/pb
+        [324769, 324769], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 46.77/pb
+        [324772, 324772], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 18.783/pb
+        [324785, 324785], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 185.798/pb
+        [324791, 324791], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 245.007/pb
+        [324835, 324835], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 85.856/pb
+        [324840, 324841], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 328.73/pb
+        [324846, 324846], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 68.553/pb
+        [324878, 324878], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 403.017/pb
+        [324897, 324897], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 50.229/pb
+        [324970, 324970], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 479.466/pb
+        [324980, 324980], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 513.295/pb
+        [324997, 325001], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 370.507/pb
+        [325022, 325022], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 433.386/pb
+        [325057, 325057], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 120.048/pb
+        [325097, 325101], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 351.717/pb
+        [325110, 325110], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 3.259/pb
+        [325117, 325117], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 85.217/pb
+        [325159, 325159], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 61.44/pb
+        [325168, 325170], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 273.009/pb
+        [325172, 325172], # HLT_Mu23_TrkIsoVVL_Ele12_CaloIdL_TrackIdL_IsoVL_v7, 67.636/pb
+      ],
+    },
+  ],
+  '2e' : [
+    {
+      'name'        : 'HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 7.929/pb
+        [315259, 315259], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 13.919/pb
+        [315264, 315265], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 46.158/pb
+        [315267, 315267], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 37.143/pb
+        [315270, 315270], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 78.981/pb
+        [315322, 315322], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 180.063/pb
+        [315339, 315339], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 93.349/pb
+        [315357, 315357], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 151.931/pb
+        [315361, 315361], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 118.532/pb
+        [315363, 315363], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 14.489/pb
+        [315366, 315366], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 100.183/pb
+        [315420, 315420], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 258.566/pb
+        [315488, 315490], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 296.522/pb
+        [315506, 315506], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 27.983/pb
+        [315510, 315510], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 103.172/pb
+        [315512, 315512], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 236.871/pb
+        [315543, 315543], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 36.886/pb
+        [315555, 315557], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 114.498/pb
+        [315640, 315642], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 43.181/pb
+        [315644, 315648], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 439.459/pb
+        [315689, 315690], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 448.961/pb
+        [315702, 315705], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 328.569/pb
+        [315713, 315713], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 353.735/pb
+        [315721, 315721], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 210.579/pb
+        [315741, 315741], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 23.717/pb
+        [315764, 315764], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 114.011/pb
+        [315770, 315770], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 121.796/pb
+        [315784, 315786], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 179.651/pb
+        [315790, 315790], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 173.124/pb
+        [315800, 315801], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 304.75/pb
+        [315840, 315840], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17, 354.111/pb
+        [315973, 315974], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v17/HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 297.118/pb
+        [316058, 316062], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 512.949/pb
+        [316082, 316082], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 141.36/pb
+        [316110, 316111], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 97.131/pb
+        [316113, 316114], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 388.486/pb
+        [316153, 316153], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 256.24/pb
+        [316186, 316187], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 527.582/pb
+        [316199, 316202], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 589.387/pb
+        [316216, 316219], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 551.849/pb
+        [316239, 316241], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 546.196/pb
+        [316271, 316271], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v18, 29.698/pb
+        [316361, 316363], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 84.941/pb
+        [316377, 316380], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 188.825/pb
+        [316455, 316455], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 9.607/pb
+        [316457, 316457], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 326.273/pb
+        [316469, 316470], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 265.747/pb
+        [316472, 316472], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 66.237/pb
+        [316505, 316505], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 401.22/pb
+        [316569, 316569], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 485.569/pb
+        [316590, 316590], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 189.247/pb
+        [316613, 316613], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 31.466/pb
+        [316615, 316615], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 49.127/pb
+        [316666, 316667], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 321.521/pb
+        [316700, 316702], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 353.699/pb
+        [316715, 316723], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 440.225/pb
+        [316758, 316758], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 455.683/pb
+        [316766, 316766], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 561.053/pb
+        [316876, 316877], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 327.431/pb
+        [316879, 316879], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 36.513/pb
+        [316928, 316928], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 44.417/pb
+        [316985, 316985], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 172.546/pb
+        [316993, 316995], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 265.445/pb
+        [317080, 317080], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 7.844/pb
+        [317087, 317087], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 243.2/pb
+        [317089, 317089], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 212.905/pb
+        [317182, 317182], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 406.207/pb
+        [317212, 317213], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 176.661/pb
+        [317279, 317279], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 65.892/pb
+        [317291, 317292], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 359.036/pb
+        [317297, 317297], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 123.799/pb
+        [317319, 317320], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 514.282/pb
+        [317338, 317340], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 219.977/pb
+        [317382, 317383], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 46.591/pb
+        [317391, 317392], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 493.374/pb
+        [317435, 317435], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 360.613/pb
+        [317438, 317438], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 49.71/pb
+        [317475, 317475], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 25.761/pb
+        [317478, 317478], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 7.937/pb
+        [317484, 317484], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 160.356/pb
+        [317488, 317488], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 181.128/pb
+        [317527, 317527], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 452.099/pb
+        [317591, 317591], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 111.117/pb
+        [317626, 317626], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 528.94/pb
+        [317640, 317641], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 529.494/pb
+        [317648, 317650], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 483.09/pb
+        [317661, 317661], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 375.651/pb
+        [317663, 317663], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 153.301/pb
+        [317683, 317683], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 117.852/pb
+        [317696, 317696], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 228.787/pb
+        [318733, 318733], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 2.792/pb
+        [318828, 318828], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 13.229/pb
+        [318872, 318872], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 91.855/pb
+        [318874, 318874], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 99.565/pb
+        [318876, 318877], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 207.136/pb
+        [319077, 319077], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 16.372/pb
+        [319337, 319337], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 232.389/pb
+        [319347, 319349], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 256.706/pb
+        [319449, 319450], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 456.219/pb
+        [319456, 319456], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 52.016/pb
+        [319459, 319459], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 17.212/pb
+        [319486, 319486], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 20.315/pb
+        [319503, 319503], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 90.959/pb
+        [319524, 319524], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 456.701/pb
+        [319526, 319526], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 69.66/pb
+        [319528, 319528], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 58.411/pb
+        [319579, 319579], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 818.49/pb
+        [319625, 319625], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 70.596/pb
+        [319639, 319639], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 409.34/pb
+        [319656, 319659], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 221.8/pb
+        [319678, 319678], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 95.425/pb
+        [319687, 319687], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 16.053/pb
+        [319697, 319698], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 96.857/pb
+        [319756, 319756], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 490.205/pb
+        [319840, 319841], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 69.999/pb
+        [319847, 319849], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 193.537/pb
+        [319851, 319851], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 1.137/pb
+        [319853, 319854], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 124.92/pb
+        [319908, 319910], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 324.281/pb
+        [319912, 319915], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 119.686/pb
+        [319941, 319942], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 111.886/pb
+        [319950, 319950], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 65.936/pb
+        [319991, 319993], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 530.374/pb
+        [320002, 320002], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 50.203/pb
+        [320006, 320006], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 114.14/pb
+        [320010, 320012], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 153.875/pb
+        [320023, 320026], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 305.475/pb
+        [320038, 320040], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 404.341/pb
+        [320059, 320065], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 395.979/pb
+        [320673, 320674], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 98.341/pb
+        [320688, 320688], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 130.855/pb
+        [320712, 320712], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 69.58/pb
+        [320757, 320757], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 116.684/pb
+        [320804, 320804], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 319.033/pb
+        [320807, 320807], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 0.348/pb
+        [320809, 320809], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 106.231/pb
+        [320821, 320824], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 454.293/pb
+        [320838, 320838], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 92.366/pb
+        [320840, 320841], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 191.511/pb
+        [320853, 320859], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 433.068/pb
+        [320887, 320888], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 113.862/pb
+        [320916, 320917], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 484.437/pb
+        [320920, 320920], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 24.013/pb
+        [320933, 320934], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 262.426/pb
+        [320936, 320936], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 78.32/pb
+        [320941, 320941], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 15.638/pb
+        [320980, 320980], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 38.408/pb
+        [320995, 320996], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 74.084/pb
+        [321004, 321007], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 320.57/pb
+        [321009, 321012], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 105.863/pb
+        [321051, 321051], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 311.577/pb
+        [321055, 321055], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 125.495/pb
+        [321067, 321069], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 369.401/pb
+        [321119, 321119], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 58.668/pb
+        [321121, 321122], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 136.178/pb
+        [321124, 321124], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 185.308/pb
+        [321126, 321126], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 78.957/pb
+        [321134, 321134], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 8.164/pb
+        [321138, 321138], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 141.977/pb
+        [321140, 321140], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 116.949/pb
+        [321149, 321149], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 434.675/pb
+        [321165, 321167], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 277.898/pb
+        [321177, 321178], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 174.709/pb
+        [321218, 321219], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 463.69/pb
+        [321221, 321221], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 5.906/pb
+        [321230, 321233], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 275.104/pb
+        [321262, 321262], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 1.669/pb
+        [321283, 321283], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 119.781/pb
+        [321294, 321296], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 233.977/pb
+        [321305, 321305], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 601.905/pb
+        [321311, 321313], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 87.325/pb
+        [321393, 321393], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 49.689/pb
+        [321396, 321397], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 417.281/pb
+        [321414, 321415], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 523.015/pb
+        [321431, 321434], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 296.1/pb
+        [321436, 321436], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 138.442/pb
+        [321457, 321457], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 482.762/pb
+        [321461, 321461], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 21.013/pb
+        [321475, 321475], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 471.913/pb
+        [321710, 321710], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 17.235/pb
+        [321712, 321712], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 84.378/pb
+        [321730, 321730], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 102.671/pb
+        [321732, 321732], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 344.692/pb
+        [321735, 321735], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 23.661/pb
+        [321755, 321755], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 213.438/pb
+        [321758, 321758], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 37.518/pb
+        [321760, 321760], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 146.153/pb
+        [321773, 321778], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 174.569/pb
+        [321780, 321781], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 181.684/pb
+        [321813, 321813], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 120.244/pb
+        [321815, 321815], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 5.12/pb
+        [321817, 321818], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 286.489/pb
+        [321820, 321820], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 32.069/pb
+        [321831, 321834], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 488.005/pb
+        [321879, 321880], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 131.546/pb
+        [321887, 321887], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 276.941/pb
+        [321908, 321909], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 485.884/pb
+        [321917, 321917], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 261.22/pb
+        [321919, 321919], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 1.489/pb
+        [321933, 321933], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 101.007/pb
+        [321960, 321961], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 139.431/pb
+        [321973, 321973], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 358.667/pb
+        [321975, 321975], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 145.784/pb
+        [321988, 321988], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 384.022/pb
+        [321990, 321990], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 81.032/pb
+        [322013, 322014], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 7.816/pb
+        [322022, 322022], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 452.969/pb
+        [322040, 322040], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 13.692/pb
+        [322057, 322057], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 8.235/pb
+        [322068, 322068], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 232.599/pb
+        [322079, 322079], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 140.245/pb
+        [322106, 322106], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 281.859/pb
+        [322113, 322113], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 40.79/pb
+        [322118, 322118], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 268.229/pb
+        [322179, 322179], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 469.75/pb
+        [322201, 322201], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 84.335/pb
+        [322204, 322204], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 311.166/pb
+        [322222, 322222], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 92.744/pb
+        [322252, 322252], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 420.358/pb
+        [322317, 322317], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 19.246/pb
+        [322319, 322319], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 55.502/pb
+        [322322, 322322], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 292.464/pb
+        [322324, 322324], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 69.26/pb
+        [322332, 322332], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 313.996/pb
+        [322348, 322348], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 414.112/pb
+        [322355, 322356], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 268.46/pb
+        [322381, 322381], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 178.73/pb
+        [322407, 322407], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 169.958/pb
+        [322430, 322431], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 370.371/pb
+        [322480, 322480], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 109.337/pb
+        [322492, 322492], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 287.515/pb
+        [322510, 322510], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 2.229/pb
+        [322599, 322599], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 94.351/pb
+        [322602, 322603], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 26.803/pb
+        [322605, 322605], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 89.624/pb
+        [322617, 322617], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 136.646/pb
+        [322625, 322625], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 335.273/pb
+        [322633, 322633], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 50.946/pb
+        [323414, 323414], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 6.204/pb
+        [323423, 323423], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 21.037/pb
+        [323470, 323475], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 321.533/pb
+        [323487, 323488], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 340.364/pb
+        [323492, 323493], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 33.198/pb
+        [323495, 323495], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 32.347/pb
+        [323524, 323526], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 480.533/pb
+        [323693, 323693], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 40.083/pb
+        [323696, 323696], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 88.848/pb
+        [323702, 323702], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 145.958/pb
+        [323725, 323727], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 380.043/pb
+        [323755, 323755], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 296.639/pb
+        [323775, 323775], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 46.768/pb
+        [323778, 323778], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 270.936/pb
+        [323790, 323790], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 276.737/pb
+        [323794, 323794], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 16.057/pb
+        [323841, 323841], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 155.038/pb
+        [323857, 323857], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 95.513/pb
+        [323940, 323940], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 426.706/pb
+        [323954, 323954], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 15.141/pb
+        [323976, 323976], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 14.399/pb
+        [323978, 323978], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 21.952/pb
+        [323980, 323980], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 67.732/pb
+        [323983, 323983], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 56.791/pb
+        [323997, 323997], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 128.792/pb
+        [324021, 324022], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 380.271/pb
+        [324077, 324077], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 242.583/pb
+        [324201, 324202], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 402.099/pb
+        [324205, 324207], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 44.541/pb
+        [324209, 324209], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 16.079/pb
+        [324237, 324237], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 74.992/pb
+        [324245, 324245], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 417.199/pb
+        [324293, 324293], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 513.035/pb
+        [324315, 324315], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 70.437/pb
+        [324318, 324318], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 99.84/pb
+        [324420, 324420], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 199.727/pb
+        [324729, 324729], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 14.797/pb
+        [324747, 324747], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 308.246/pb
+        [324764, 324765], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 117.745/pb
+        [324769, 324769], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 46.77/pb
+        [324772, 324772], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 18.783/pb
+        [324785, 324785], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 185.798/pb
+        [324791, 324791], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 245.007/pb
+        [324835, 324835], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 85.856/pb
+        [324840, 324841], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 328.73/pb
+        [324846, 324846], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 68.553/pb
+        [324878, 324878], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 403.017/pb
+        [324897, 324897], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 50.229/pb
+        [324970, 324970], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 479.466/pb
+        [324980, 324980], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 513.295/pb
+        [324997, 325001], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 370.507/pb
+        [325022, 325022], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 433.386/pb
+        [325057, 325057], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 120.048/pb
+        [325097, 325101], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 351.717/pb
+        [325110, 325110], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 3.259/pb
+        [325117, 325117], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 85.217/pb
+        [325159, 325159], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 61.44/pb
+        [325168, 325170], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 273.009/pb
+        [325172, 325172], # HLT_Ele23_Ele12_CaloIdL_TrackIdL_IsoVL_v19, 67.636/pb
+      ],
+    },
+  ],
+  '1mu' : [
+    {
+      'name'        : 'HLT_IsoMu24',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_IsoMu24_v11, 7.929/pb
+        [315259, 315259], # HLT_IsoMu24_v11, 13.919/pb
+        [315264, 315265], # HLT_IsoMu24_v11, 46.158/pb
+        [315267, 315267], # HLT_IsoMu24_v11, 37.143/pb
+        [315270, 315270], # HLT_IsoMu24_v11, 78.981/pb
+        [315322, 315322], # HLT_IsoMu24_v11, 180.063/pb
+        [315339, 315339], # HLT_IsoMu24_v11, 93.349/pb
+        [315357, 315357], # HLT_IsoMu24_v11, 151.931/pb
+        [315361, 315361], # HLT_IsoMu24_v11, 118.532/pb
+        [315363, 315363], # HLT_IsoMu24_v11, 14.489/pb
+        [315366, 315366], # HLT_IsoMu24_v11, 100.183/pb
+        [315420, 315420], # HLT_IsoMu24_v11, 258.566/pb
+        [315488, 315490], # HLT_IsoMu24_v11, 296.522/pb
+        [315506, 315506], # HLT_IsoMu24_v11, 27.983/pb
+        [315510, 315510], # HLT_IsoMu24_v11, 103.172/pb
+        [315512, 315512], # HLT_IsoMu24_v11, 236.871/pb
+        [315543, 315543], # HLT_IsoMu24_v11, 36.886/pb
+        [315555, 315557], # HLT_IsoMu24_v11, 114.498/pb
+        [315640, 315642], # HLT_IsoMu24_v11, 43.181/pb
+        [315644, 315648], # HLT_IsoMu24_v11, 439.459/pb
+        [315689, 315690], # HLT_IsoMu24_v11, 448.961/pb
+        [315702, 315705], # HLT_IsoMu24_v11, 328.569/pb
+        [315713, 315713], # HLT_IsoMu24_v11, 353.735/pb
+        [315721, 315721], # HLT_IsoMu24_v11, 210.579/pb
+        [315741, 315741], # HLT_IsoMu24_v11, 23.717/pb
+        [315764, 315764], # HLT_IsoMu24_v11, 114.011/pb
+        [315770, 315770], # HLT_IsoMu24_v11, 121.796/pb
+        [315784, 315786], # HLT_IsoMu24_v11, 179.651/pb
+        [315790, 315790], # HLT_IsoMu24_v11, 173.124/pb
+        [315800, 315801], # HLT_IsoMu24_v11, 304.75/pb
+        [315840, 315840], # HLT_IsoMu24_v11, 354.111/pb
+        [315973, 315974], # HLT_IsoMu24_v11/HLT_IsoMu24_v12, 297.118/pb
+        [316058, 316062], # HLT_IsoMu24_v12, 512.949/pb
+        [316082, 316082], # HLT_IsoMu24_v12, 141.36/pb
+        [316110, 316111], # HLT_IsoMu24_v12, 97.131/pb
+        [316113, 316114], # HLT_IsoMu24_v12, 388.486/pb
+        [316153, 316153], # HLT_IsoMu24_v12, 256.24/pb
+        [316186, 316187], # HLT_IsoMu24_v12, 519.417/pb
+        [316199, 316202], # HLT_IsoMu24_v12, 589.387/pb
+        [316216, 316219], # HLT_IsoMu24_v12, 551.849/pb
+        [316239, 316241], # HLT_IsoMu24_v12, 546.196/pb
+        [316271, 316271], # HLT_IsoMu24_v12, 29.698/pb
+        [316361, 316363], # HLT_IsoMu24_v13, 84.941/pb
+        [316377, 316380], # HLT_IsoMu24_v13, 188.825/pb
+        [316455, 316455], # HLT_IsoMu24_v13, 9.607/pb
+        [316457, 316457], # HLT_IsoMu24_v13, 326.273/pb
+        [316469, 316470], # HLT_IsoMu24_v13, 265.747/pb
+        [316472, 316472], # HLT_IsoMu24_v13, 66.237/pb
+        [316505, 316505], # HLT_IsoMu24_v13, 401.22/pb
+        [316569, 316569], # HLT_IsoMu24_v13, 485.569/pb
+        [316590, 316590], # HLT_IsoMu24_v13, 189.247/pb
+        [316613, 316613], # HLT_IsoMu24_v13, 31.466/pb
+        [316615, 316615], # HLT_IsoMu24_v13, 49.127/pb
+        [316666, 316667], # HLT_IsoMu24_v13, 321.521/pb
+        [316700, 316702], # HLT_IsoMu24_v13, 353.699/pb
+        [316715, 316723], # HLT_IsoMu24_v13, 440.225/pb
+        [316758, 316758], # HLT_IsoMu24_v13, 455.683/pb
+        [316766, 316766], # HLT_IsoMu24_v13, 561.053/pb
+        [316876, 316877], # HLT_IsoMu24_v13, 327.431/pb
+        [316879, 316879], # HLT_IsoMu24_v13, 36.513/pb
+        [316928, 316928], # HLT_IsoMu24_v13, 44.417/pb
+        [316985, 316985], # HLT_IsoMu24_v13, 172.546/pb
+        [316993, 316995], # HLT_IsoMu24_v13, 265.445/pb
+        [317080, 317080], # HLT_IsoMu24_v13, 7.844/pb
+        [317087, 317087], # HLT_IsoMu24_v13, 243.2/pb
+        [317089, 317089], # HLT_IsoMu24_v13, 212.905/pb
+        [317182, 317182], # HLT_IsoMu24_v13, 406.207/pb
+        [317212, 317213], # HLT_IsoMu24_v13, 176.661/pb
+        [317279, 317279], # HLT_IsoMu24_v13, 65.892/pb
+        [317291, 317292], # HLT_IsoMu24_v13, 359.036/pb
+        [317297, 317297], # HLT_IsoMu24_v13, 123.799/pb
+        [317319, 317320], # HLT_IsoMu24_v13, 514.282/pb
+        [317338, 317340], # HLT_IsoMu24_v13, 219.977/pb
+        [317382, 317383], # HLT_IsoMu24_v13, 46.591/pb
+        [317391, 317392], # HLT_IsoMu24_v13, 493.374/pb
+        [317435, 317435], # HLT_IsoMu24_v13, 360.613/pb
+        [317438, 317438], # HLT_IsoMu24_v13, 49.71/pb
+        [317475, 317475], # HLT_IsoMu24_v13, 25.761/pb
+        [317478, 317478], # HLT_IsoMu24_v13, 7.937/pb
+        [317484, 317484], # HLT_IsoMu24_v13, 160.356/pb
+        [317488, 317488], # HLT_IsoMu24_v13, 181.128/pb
+        [317527, 317527], # HLT_IsoMu24_v13, 452.099/pb
+        [317591, 317591], # HLT_IsoMu24_v13, 111.117/pb
+        [317626, 317626], # HLT_IsoMu24_v13, 528.94/pb
+        [317640, 317641], # HLT_IsoMu24_v13, 529.494/pb
+        [317648, 317650], # HLT_IsoMu24_v13, 483.09/pb
+        [317661, 317661], # HLT_IsoMu24_v13, 375.651/pb
+        [317663, 317663], # HLT_IsoMu24_v13, 153.301/pb
+        [317683, 317683], # HLT_IsoMu24_v13, 117.852/pb
+        [317696, 317696], # HLT_IsoMu24_v13, 228.787/pb
+        [318733, 318733], # HLT_IsoMu24_v13, 2.792/pb
+        [318828, 318828], # HLT_IsoMu24_v13, 13.229/pb
+        [318872, 318872], # HLT_IsoMu24_v13, 91.855/pb
+        [318874, 318874], # HLT_IsoMu24_v13, 99.565/pb
+        [318876, 318877], # HLT_IsoMu24_v13, 207.136/pb
+        [319077, 319077], # HLT_IsoMu24_v13, 16.372/pb
+        [319337, 319337], # HLT_IsoMu24_v13, 232.389/pb
+        [319347, 319349], # HLT_IsoMu24_v13, 256.706/pb
+        [319449, 319450], # HLT_IsoMu24_v13, 456.219/pb
+        [319456, 319456], # HLT_IsoMu24_v13, 52.016/pb
+        [319459, 319459], # HLT_IsoMu24_v13, 17.212/pb
+        [319486, 319486], # HLT_IsoMu24_v13, 20.315/pb
+        [319503, 319503], # HLT_IsoMu24_v13, 90.959/pb
+        [319524, 319524], # HLT_IsoMu24_v13, 456.701/pb
+        [319526, 319526], # HLT_IsoMu24_v13, 69.66/pb
+        [319528, 319528], # HLT_IsoMu24_v13, 58.411/pb
+        [319579, 319579], # HLT_IsoMu24_v13, 818.49/pb
+        [319625, 319625], # HLT_IsoMu24_v13, 70.596/pb
+        [319639, 319639], # HLT_IsoMu24_v13, 409.34/pb
+        [319656, 319659], # HLT_IsoMu24_v13, 221.8/pb
+        [319678, 319678], # HLT_IsoMu24_v13, 95.425/pb
+        [319687, 319687], # HLT_IsoMu24_v13, 16.053/pb
+        [319697, 319698], # HLT_IsoMu24_v13, 96.857/pb
+        [319756, 319756], # HLT_IsoMu24_v13, 490.205/pb
+        [319840, 319841], # HLT_IsoMu24_v13, 69.999/pb
+        [319847, 319849], # HLT_IsoMu24_v13, 193.537/pb
+        [319851, 319851], # HLT_IsoMu24_v13, 1.137/pb
+        [319853, 319854], # HLT_IsoMu24_v13, 124.92/pb
+        [319908, 319910], # HLT_IsoMu24_v13, 324.281/pb
+        [319912, 319915], # HLT_IsoMu24_v13, 119.686/pb
+        [319941, 319942], # HLT_IsoMu24_v13, 111.886/pb
+        [319950, 319950], # HLT_IsoMu24_v13, 65.936/pb
+        [319991, 319993], # HLT_IsoMu24_v13, 530.374/pb
+        [320002, 320002], # HLT_IsoMu24_v13, 50.203/pb
+        [320006, 320006], # HLT_IsoMu24_v13, 114.14/pb
+        [320010, 320012], # HLT_IsoMu24_v13, 153.875/pb
+        [320023, 320026], # HLT_IsoMu24_v13, 305.475/pb
+        [320038, 320040], # HLT_IsoMu24_v13, 404.341/pb
+        [320059, 320065], # HLT_IsoMu24_v13, 395.979/pb
+        [320673, 320674], # HLT_IsoMu24_v13, 98.341/pb
+        [320688, 320688], # HLT_IsoMu24_v13, 130.855/pb
+        [320712, 320712], # HLT_IsoMu24_v13, 69.58/pb
+        [320757, 320757], # HLT_IsoMu24_v13, 116.684/pb
+        [320804, 320804], # HLT_IsoMu24_v13, 319.033/pb
+        [320807, 320807], # HLT_IsoMu24_v13, 0.348/pb
+        [320809, 320809], # HLT_IsoMu24_v13, 106.231/pb
+        [320821, 320824], # HLT_IsoMu24_v13, 454.293/pb
+        [320838, 320838], # HLT_IsoMu24_v13, 92.366/pb
+        [320840, 320841], # HLT_IsoMu24_v13, 191.511/pb
+        [320853, 320859], # HLT_IsoMu24_v13, 433.068/pb
+        [320887, 320888], # HLT_IsoMu24_v13, 113.862/pb
+        [320916, 320917], # HLT_IsoMu24_v13, 484.437/pb
+        [320920, 320920], # HLT_IsoMu24_v13, 24.013/pb
+        [320933, 320934], # HLT_IsoMu24_v13, 262.426/pb
+        [320936, 320936], # HLT_IsoMu24_v13, 78.32/pb
+        [320941, 320941], # HLT_IsoMu24_v13, 15.638/pb
+        [320980, 320980], # HLT_IsoMu24_v13, 38.408/pb
+        [320995, 320996], # HLT_IsoMu24_v13, 74.084/pb
+        [321004, 321007], # HLT_IsoMu24_v13, 320.57/pb
+        [321009, 321012], # HLT_IsoMu24_v13, 105.863/pb
+        [321051, 321051], # HLT_IsoMu24_v13, 311.577/pb
+        [321055, 321055], # HLT_IsoMu24_v13, 125.495/pb
+        [321067, 321069], # HLT_IsoMu24_v13, 369.401/pb
+        [321119, 321119], # HLT_IsoMu24_v13, 58.668/pb
+        [321121, 321122], # HLT_IsoMu24_v13, 136.178/pb
+        [321124, 321124], # HLT_IsoMu24_v13, 185.308/pb
+        [321126, 321126], # HLT_IsoMu24_v13, 78.957/pb
+        [321134, 321134], # HLT_IsoMu24_v13, 8.164/pb
+        [321138, 321138], # HLT_IsoMu24_v13, 141.977/pb
+        [321140, 321140], # HLT_IsoMu24_v13, 116.949/pb
+        [321149, 321149], # HLT_IsoMu24_v13, 434.675/pb
+        [321165, 321167], # HLT_IsoMu24_v13, 277.898/pb
+        [321177, 321178], # HLT_IsoMu24_v13, 174.709/pb
+        [321218, 321219], # HLT_IsoMu24_v13, 463.69/pb
+        [321221, 321221], # HLT_IsoMu24_v13, 5.906/pb
+        [321230, 321233], # HLT_IsoMu24_v13, 275.104/pb
+        [321262, 321262], # HLT_IsoMu24_v13, 1.669/pb
+        [321283, 321283], # HLT_IsoMu24_v13, 119.781/pb
+        [321294, 321296], # HLT_IsoMu24_v13, 233.977/pb
+        [321305, 321305], # HLT_IsoMu24_v13, 601.905/pb
+        [321311, 321313], # HLT_IsoMu24_v13, 87.325/pb
+        [321393, 321393], # HLT_IsoMu24_v13, 49.689/pb
+        [321396, 321397], # HLT_IsoMu24_v13, 417.281/pb
+        [321414, 321415], # HLT_IsoMu24_v13, 523.015/pb
+        [321431, 321434], # HLT_IsoMu24_v13, 296.1/pb
+        [321436, 321436], # HLT_IsoMu24_v13, 138.442/pb
+        [321457, 321457], # HLT_IsoMu24_v13, 482.762/pb
+        [321461, 321461], # HLT_IsoMu24_v13, 21.013/pb
+        [321475, 321475], # HLT_IsoMu24_v13, 471.913/pb
+        [321710, 321710], # HLT_IsoMu24_v13, 17.235/pb
+        [321712, 321712], # HLT_IsoMu24_v13, 84.378/pb
+        [321730, 321730], # HLT_IsoMu24_v13, 102.671/pb
+        [321732, 321732], # HLT_IsoMu24_v13, 344.692/pb
+        [321735, 321735], # HLT_IsoMu24_v13, 23.661/pb
+        [321755, 321755], # HLT_IsoMu24_v13, 213.438/pb
+        [321758, 321758], # HLT_IsoMu24_v13, 37.518/pb
+        [321760, 321760], # HLT_IsoMu24_v13, 146.153/pb
+        [321773, 321778], # HLT_IsoMu24_v13, 174.569/pb
+        [321780, 321781], # HLT_IsoMu24_v13, 181.684/pb
+        [321813, 321813], # HLT_IsoMu24_v13, 120.244/pb
+        [321815, 321815], # HLT_IsoMu24_v13, 5.12/pb
+        [321817, 321818], # HLT_IsoMu24_v13, 286.489/pb
+        [321820, 321820], # HLT_IsoMu24_v13, 32.069/pb
+        [321831, 321834], # HLT_IsoMu24_v13, 488.005/pb
+        [321879, 321880], # HLT_IsoMu24_v13, 131.546/pb
+        [321887, 321887], # HLT_IsoMu24_v13, 276.941/pb
+        [321908, 321909], # HLT_IsoMu24_v13, 485.884/pb
+        [321917, 321917], # HLT_IsoMu24_v13, 261.22/pb
+        [321919, 321919], # HLT_IsoMu24_v13, 1.489/pb
+        [321933, 321933], # HLT_IsoMu24_v13, 101.007/pb
+        [321960, 321961], # HLT_IsoMu24_v13, 139.431/pb
+        [321973, 321973], # HLT_IsoMu24_v13, 358.667/pb
+        [321975, 321975], # HLT_IsoMu24_v13, 145.784/pb
+        [321988, 321988], # HLT_IsoMu24_v13, 384.022/pb
+        [321990, 321990], # HLT_IsoMu24_v13, 81.032/pb
+        [322013, 322014], # HLT_IsoMu24_v13, 7.816/pb
+        [322022, 322022], # HLT_IsoMu24_v13, 452.969/pb
+        [322040, 322040], # HLT_IsoMu24_v13, 13.692/pb
+        [322057, 322057], # HLT_IsoMu24_v13, 8.235/pb
+        [322068, 322068], # HLT_IsoMu24_v13, 232.599/pb
+        [322079, 322079], # HLT_IsoMu24_v13, 140.245/pb
+        [322106, 322106], # HLT_IsoMu24_v13, 281.859/pb
+        [322113, 322113], # HLT_IsoMu24_v13, 40.79/pb
+        [322118, 322118], # HLT_IsoMu24_v13, 268.229/pb
+        [322179, 322179], # HLT_IsoMu24_v13, 469.75/pb
+        [322201, 322201], # HLT_IsoMu24_v13, 84.335/pb
+        [322204, 322204], # HLT_IsoMu24_v13, 311.166/pb
+        [322222, 322222], # HLT_IsoMu24_v13, 92.744/pb
+        [322252, 322252], # HLT_IsoMu24_v13, 420.358/pb
+        [322317, 322317], # HLT_IsoMu24_v13, 19.246/pb
+        [322319, 322319], # HLT_IsoMu24_v13, 55.502/pb
+        [322322, 322322], # HLT_IsoMu24_v13, 292.464/pb
+        [322324, 322324], # HLT_IsoMu24_v13, 69.26/pb
+        [322332, 322332], # HLT_IsoMu24_v13, 313.996/pb
+        [322348, 322348], # HLT_IsoMu24_v13, 414.112/pb
+        [322355, 322356], # HLT_IsoMu24_v13, 268.46/pb
+        [322381, 322381], # HLT_IsoMu24_v13, 178.73/pb
+        [322407, 322407], # HLT_IsoMu24_v13, 169.958/pb
+        [322430, 322431], # HLT_IsoMu24_v13, 370.371/pb
+        [322480, 322480], # HLT_IsoMu24_v13, 109.337/pb
+        [322492, 322492], # HLT_IsoMu24_v13, 287.515/pb
+        [322510, 322510], # HLT_IsoMu24_v13, 2.229/pb
+        [322599, 322599], # HLT_IsoMu24_v13, 94.351/pb
+        [322602, 322603], # HLT_IsoMu24_v13, 26.803/pb
+        [322605, 322605], # HLT_IsoMu24_v13, 89.624/pb
+        [322617, 322617], # HLT_IsoMu24_v13, 136.646/pb
+        [322625, 322625], # HLT_IsoMu24_v13, 335.273/pb
+        [322633, 322633], # HLT_IsoMu24_v13, 50.946/pb
+        [323414, 323414], # HLT_IsoMu24_v13, 6.204/pb
+        [323423, 323423], # HLT_IsoMu24_v13, 21.037/pb
+        [323470, 323475], # HLT_IsoMu24_v13, 321.533/pb
+        [323487, 323488], # HLT_IsoMu24_v13, 340.364/pb
+        [323492, 323493], # HLT_IsoMu24_v13, 33.198/pb
+        [323495, 323495], # HLT_IsoMu24_v13, 32.347/pb
+        [323524, 323526], # HLT_IsoMu24_v13, 480.533/pb
+        [323693, 323693], # HLT_IsoMu24_v13, 40.083/pb
+        [323696, 323696], # HLT_IsoMu24_v13, 88.848/pb
+        [323702, 323702], # HLT_IsoMu24_v13, 145.958/pb
+        [323725, 323727], # HLT_IsoMu24_v13, 380.043/pb
+        [323755, 323755], # HLT_IsoMu24_v13, 296.639/pb
+        [323775, 323775], # HLT_IsoMu24_v13, 46.768/pb
+        [323778, 323778], # HLT_IsoMu24_v13, 270.936/pb
+        [323790, 323790], # HLT_IsoMu24_v13, 276.737/pb
+        [323794, 323794], # HLT_IsoMu24_v13, 16.057/pb
+        [323841, 323841], # HLT_IsoMu24_v13, 155.038/pb
+        [323857, 323857], # HLT_IsoMu24_v13, 95.513/pb
+        [323940, 323940], # HLT_IsoMu24_v13, 426.706/pb
+        [323954, 323954], # HLT_IsoMu24_v13, 15.141/pb
+        [323976, 323976], # HLT_IsoMu24_v13, 14.399/pb
+        [323978, 323978], # HLT_IsoMu24_v13, 21.952/pb
+        [323980, 323980], # HLT_IsoMu24_v13, 67.732/pb
+        [323983, 323983], # HLT_IsoMu24_v13, 56.791/pb
+        [323997, 323997], # HLT_IsoMu24_v13, 128.792/pb
+        [324021, 324022], # HLT_IsoMu24_v13, 380.271/pb
+        [324077, 324077], # HLT_IsoMu24_v13, 242.583/pb
+        [324201, 324202], # HLT_IsoMu24_v13, 402.099/pb
+        [324205, 324207], # HLT_IsoMu24_v13, 44.541/pb
+        [324209, 324209], # HLT_IsoMu24_v13, 16.079/pb
+        [324237, 324237], # HLT_IsoMu24_v13, 74.992/pb
+        [324245, 324245], # HLT_IsoMu24_v13, 417.199/pb
+        [324293, 324293], # HLT_IsoMu24_v13, 513.035/pb
+        [324315, 324315], # HLT_IsoMu24_v13, 70.437/pb
+        [324318, 324318], # HLT_IsoMu24_v13, 99.84/pb
+        [324420, 324420], # HLT_IsoMu24_v13, 199.727/pb
+        [324729, 324729], # HLT_IsoMu24_v13, 14.797/pb
+        [324747, 324747], # HLT_IsoMu24_v13, 308.246/pb
+        [324764, 324765], # HLT_IsoMu24_v13, 117.745/pb
+        [324769, 324769], # HLT_IsoMu24_v13, 46.77/pb
+        [324772, 324772], # HLT_IsoMu24_v13, 18.783/pb
+        [324785, 324785], # HLT_IsoMu24_v13, 185.798/pb
+        [324791, 324791], # HLT_IsoMu24_v13, 245.007/pb
+        [324835, 324835], # HLT_IsoMu24_v13, 85.856/pb
+        [324840, 324841], # HLT_IsoMu24_v13, 328.73/pb
+        [324846, 324846], # HLT_IsoMu24_v13, 68.553/pb
+        [324878, 324878], # HLT_IsoMu24_v13, 403.017/pb
+        [324897, 324897], # HLT_IsoMu24_v13, 50.229/pb
+        [324970, 324970], # HLT_IsoMu24_v13, 479.466/pb
+        [324980, 324980], # HLT_IsoMu24_v13, 513.295/pb
+        [324997, 325001], # HLT_IsoMu24_v13, 370.507/pb
+        [325022, 325022], # HLT_IsoMu24_v13, 433.386/pb
+        [325057, 325057], # HLT_IsoMu24_v13, 120.048/pb
+        [325097, 325101], # HLT_IsoMu24_v13, 351.717/pb
+        [325110, 325110], # HLT_IsoMu24_v13, 3.259/pb
+        [325117, 325117], # HLT_IsoMu24_v13, 85.217/pb
+        [325159, 325159], # HLT_IsoMu24_v13, 61.44/pb
+        [325168, 325170], # HLT_IsoMu24_v13, 273.009/pb
+        [325172, 325172], # HLT_IsoMu24_v13, 67.636/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoMu27',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_IsoMu27_v14, 7.929/pb
+        [315259, 315259], # HLT_IsoMu27_v14, 13.919/pb
+        [315264, 315265], # HLT_IsoMu27_v14, 46.158/pb
+        [315267, 315267], # HLT_IsoMu27_v14, 37.143/pb
+        [315270, 315270], # HLT_IsoMu27_v14, 78.981/pb
+        [315322, 315322], # HLT_IsoMu27_v14, 180.063/pb
+        [315339, 315339], # HLT_IsoMu27_v14, 93.349/pb
+        [315357, 315357], # HLT_IsoMu27_v14, 151.931/pb
+        [315361, 315361], # HLT_IsoMu27_v14, 118.532/pb
+        [315363, 315363], # HLT_IsoMu27_v14, 14.489/pb
+        [315366, 315366], # HLT_IsoMu27_v14, 100.183/pb
+        [315420, 315420], # HLT_IsoMu27_v14, 258.566/pb
+        [315488, 315490], # HLT_IsoMu27_v14, 296.522/pb
+        [315506, 315506], # HLT_IsoMu27_v14, 27.983/pb
+        [315510, 315510], # HLT_IsoMu27_v14, 103.172/pb
+        [315512, 315512], # HLT_IsoMu27_v14, 236.871/pb
+        [315543, 315543], # HLT_IsoMu27_v14, 36.886/pb
+        [315555, 315557], # HLT_IsoMu27_v14, 114.498/pb
+        [315640, 315642], # HLT_IsoMu27_v14, 43.181/pb
+        [315644, 315648], # HLT_IsoMu27_v14, 439.459/pb
+        [315689, 315690], # HLT_IsoMu27_v14, 448.961/pb
+        [315702, 315705], # HLT_IsoMu27_v14, 328.569/pb
+        [315713, 315713], # HLT_IsoMu27_v14, 353.735/pb
+        [315721, 315721], # HLT_IsoMu27_v14, 210.579/pb
+        [315741, 315741], # HLT_IsoMu27_v14, 23.717/pb
+        [315764, 315764], # HLT_IsoMu27_v14, 114.011/pb
+        [315770, 315770], # HLT_IsoMu27_v14, 121.796/pb
+        [315784, 315786], # HLT_IsoMu27_v14, 179.651/pb
+        [315790, 315790], # HLT_IsoMu27_v14, 173.124/pb
+        [315800, 315801], # HLT_IsoMu27_v14, 304.75/pb
+        [315840, 315840], # HLT_IsoMu27_v14, 354.111/pb
+        [315973, 315974], # HLT_IsoMu27_v14/HLT_IsoMu27_v15, 297.118/pb
+        [316058, 316062], # HLT_IsoMu27_v15, 512.949/pb
+        [316082, 316082], # HLT_IsoMu27_v15, 141.36/pb
+        [316110, 316111], # HLT_IsoMu27_v15, 97.131/pb
+        [316113, 316114], # HLT_IsoMu27_v15, 388.486/pb
+        [316153, 316153], # HLT_IsoMu27_v15, 256.24/pb
+        [316186, 316187], # HLT_IsoMu27_v15, 527.582/pb
+        [316199, 316202], # HLT_IsoMu27_v15, 589.387/pb
+        [316216, 316219], # HLT_IsoMu27_v15, 551.849/pb
+        [316239, 316241], # HLT_IsoMu27_v15, 546.196/pb
+        [316271, 316271], # HLT_IsoMu27_v15, 29.698/pb
+        [316361, 316363], # HLT_IsoMu27_v16, 84.941/pb
+        [316377, 316380], # HLT_IsoMu27_v16, 188.825/pb
+        [316455, 316455], # HLT_IsoMu27_v16, 9.607/pb
+        [316457, 316457], # HLT_IsoMu27_v16, 326.273/pb
+        [316469, 316470], # HLT_IsoMu27_v16, 265.747/pb
+        [316472, 316472], # HLT_IsoMu27_v16, 66.237/pb
+        [316505, 316505], # HLT_IsoMu27_v16, 401.22/pb
+        [316569, 316569], # HLT_IsoMu27_v16, 485.569/pb
+        [316590, 316590], # HLT_IsoMu27_v16, 189.247/pb
+        [316613, 316613], # HLT_IsoMu27_v16, 31.466/pb
+        [316615, 316615], # HLT_IsoMu27_v16, 49.127/pb
+        [316666, 316667], # HLT_IsoMu27_v16, 321.521/pb
+        [316700, 316702], # HLT_IsoMu27_v16, 353.699/pb
+        [316715, 316723], # HLT_IsoMu27_v16, 440.225/pb
+        [316758, 316758], # HLT_IsoMu27_v16, 455.683/pb
+        [316766, 316766], # HLT_IsoMu27_v16, 561.053/pb
+        [316876, 316877], # HLT_IsoMu27_v16, 327.431/pb
+        [316879, 316879], # HLT_IsoMu27_v16, 36.513/pb
+        [316928, 316928], # HLT_IsoMu27_v16, 44.417/pb
+        [316985, 316985], # HLT_IsoMu27_v16, 172.546/pb
+        [316993, 316995], # HLT_IsoMu27_v16, 265.445/pb
+        [317080, 317080], # HLT_IsoMu27_v16, 7.844/pb
+        [317087, 317087], # HLT_IsoMu27_v16, 243.2/pb
+        [317089, 317089], # HLT_IsoMu27_v16, 212.905/pb
+        [317182, 317182], # HLT_IsoMu27_v16, 406.207/pb
+        [317212, 317213], # HLT_IsoMu27_v16, 176.661/pb
+        [317279, 317279], # HLT_IsoMu27_v16, 65.892/pb
+        [317291, 317292], # HLT_IsoMu27_v16, 359.036/pb
+        [317297, 317297], # HLT_IsoMu27_v16, 123.799/pb
+        [317319, 317320], # HLT_IsoMu27_v16, 514.282/pb
+        [317338, 317340], # HLT_IsoMu27_v16, 219.977/pb
+        [317382, 317383], # HLT_IsoMu27_v16, 46.591/pb
+        [317391, 317392], # HLT_IsoMu27_v16, 493.374/pb
+        [317435, 317435], # HLT_IsoMu27_v16, 360.613/pb
+        [317438, 317438], # HLT_IsoMu27_v16, 49.71/pb
+        [317475, 317475], # HLT_IsoMu27_v16, 25.761/pb
+        [317478, 317478], # HLT_IsoMu27_v16, 7.937/pb
+        [317484, 317484], # HLT_IsoMu27_v16, 160.356/pb
+        [317488, 317488], # HLT_IsoMu27_v16, 181.128/pb
+        [317527, 317527], # HLT_IsoMu27_v16, 452.099/pb
+        [317591, 317591], # HLT_IsoMu27_v16, 111.117/pb
+        [317626, 317626], # HLT_IsoMu27_v16, 528.94/pb
+        [317640, 317641], # HLT_IsoMu27_v16, 529.494/pb
+        [317648, 317650], # HLT_IsoMu27_v16, 483.09/pb
+        [317661, 317661], # HLT_IsoMu27_v16, 375.651/pb
+        [317663, 317663], # HLT_IsoMu27_v16, 153.301/pb
+        [317683, 317683], # HLT_IsoMu27_v16, 117.852/pb
+        [317696, 317696], # HLT_IsoMu27_v16, 228.787/pb
+        [318733, 318733], # HLT_IsoMu27_v16, 2.792/pb
+        [318828, 318828], # HLT_IsoMu27_v16, 13.229/pb
+        [318872, 318872], # HLT_IsoMu27_v16, 91.855/pb
+        [318874, 318874], # HLT_IsoMu27_v16, 99.565/pb
+        [318876, 318877], # HLT_IsoMu27_v16, 207.136/pb
+        [319077, 319077], # HLT_IsoMu27_v16, 16.372/pb
+        [319337, 319337], # HLT_IsoMu27_v16, 232.389/pb
+        [319347, 319349], # HLT_IsoMu27_v16, 256.706/pb
+        [319449, 319450], # HLT_IsoMu27_v16, 456.219/pb
+        [319456, 319456], # HLT_IsoMu27_v16, 52.016/pb
+        [319459, 319459], # HLT_IsoMu27_v16, 17.212/pb
+        [319486, 319486], # HLT_IsoMu27_v16, 20.315/pb
+        [319503, 319503], # HLT_IsoMu27_v16, 90.959/pb
+        [319524, 319524], # HLT_IsoMu27_v16, 456.701/pb
+        [319526, 319526], # HLT_IsoMu27_v16, 69.66/pb
+        [319528, 319528], # HLT_IsoMu27_v16, 58.411/pb
+        [319579, 319579], # HLT_IsoMu27_v16, 818.49/pb
+        [319625, 319625], # HLT_IsoMu27_v16, 70.596/pb
+        [319639, 319639], # HLT_IsoMu27_v16, 409.34/pb
+        [319656, 319659], # HLT_IsoMu27_v16, 221.8/pb
+        [319678, 319678], # HLT_IsoMu27_v16, 95.425/pb
+        [319687, 319687], # HLT_IsoMu27_v16, 16.053/pb
+        [319697, 319698], # HLT_IsoMu27_v16, 96.857/pb
+        [319756, 319756], # HLT_IsoMu27_v16, 490.205/pb
+        [319840, 319841], # HLT_IsoMu27_v16, 69.999/pb
+        [319847, 319849], # HLT_IsoMu27_v16, 193.537/pb
+        [319851, 319851], # HLT_IsoMu27_v16, 1.137/pb
+        [319853, 319854], # HLT_IsoMu27_v16, 124.92/pb
+        [319908, 319910], # HLT_IsoMu27_v16, 324.281/pb
+        [319912, 319915], # HLT_IsoMu27_v16, 119.686/pb
+        [319941, 319942], # HLT_IsoMu27_v16, 111.886/pb
+        [319950, 319950], # HLT_IsoMu27_v16, 65.936/pb
+        [319991, 319993], # HLT_IsoMu27_v16, 530.374/pb
+        [320002, 320002], # HLT_IsoMu27_v16, 50.203/pb
+        [320006, 320006], # HLT_IsoMu27_v16, 114.14/pb
+        [320010, 320012], # HLT_IsoMu27_v16, 153.875/pb
+        [320023, 320026], # HLT_IsoMu27_v16, 305.475/pb
+        [320038, 320040], # HLT_IsoMu27_v16, 404.341/pb
+        [320059, 320065], # HLT_IsoMu27_v16, 395.979/pb
+        [320673, 320674], # HLT_IsoMu27_v16, 98.341/pb
+        [320688, 320688], # HLT_IsoMu27_v16, 130.855/pb
+        [320712, 320712], # HLT_IsoMu27_v16, 69.58/pb
+        [320757, 320757], # HLT_IsoMu27_v16, 116.684/pb
+        [320804, 320804], # HLT_IsoMu27_v16, 319.033/pb
+        [320807, 320807], # HLT_IsoMu27_v16, 0.348/pb
+        [320809, 320809], # HLT_IsoMu27_v16, 106.231/pb
+        [320821, 320824], # HLT_IsoMu27_v16, 454.293/pb
+        [320838, 320838], # HLT_IsoMu27_v16, 92.366/pb
+        [320840, 320841], # HLT_IsoMu27_v16, 191.511/pb
+        [320853, 320859], # HLT_IsoMu27_v16, 433.068/pb
+        [320887, 320888], # HLT_IsoMu27_v16, 113.862/pb
+        [320916, 320917], # HLT_IsoMu27_v16, 484.437/pb
+        [320920, 320920], # HLT_IsoMu27_v16, 24.013/pb
+        [320933, 320934], # HLT_IsoMu27_v16, 262.426/pb
+        [320936, 320936], # HLT_IsoMu27_v16, 78.32/pb
+        [320941, 320941], # HLT_IsoMu27_v16, 15.638/pb
+        [320980, 320980], # HLT_IsoMu27_v16, 38.408/pb
+        [320995, 320996], # HLT_IsoMu27_v16, 74.084/pb
+        [321004, 321007], # HLT_IsoMu27_v16, 320.57/pb
+        [321009, 321012], # HLT_IsoMu27_v16, 105.863/pb
+        [321051, 321051], # HLT_IsoMu27_v16, 311.577/pb
+        [321055, 321055], # HLT_IsoMu27_v16, 125.495/pb
+        [321067, 321069], # HLT_IsoMu27_v16, 369.401/pb
+        [321119, 321119], # HLT_IsoMu27_v16, 58.668/pb
+        [321121, 321122], # HLT_IsoMu27_v16, 136.178/pb
+        [321124, 321124], # HLT_IsoMu27_v16, 185.308/pb
+        [321126, 321126], # HLT_IsoMu27_v16, 78.957/pb
+        [321134, 321134], # HLT_IsoMu27_v16, 8.164/pb
+        [321138, 321138], # HLT_IsoMu27_v16, 141.977/pb
+        [321140, 321140], # HLT_IsoMu27_v16, 116.949/pb
+        [321149, 321149], # HLT_IsoMu27_v16, 434.675/pb
+        [321165, 321167], # HLT_IsoMu27_v16, 277.898/pb
+        [321177, 321178], # HLT_IsoMu27_v16, 174.709/pb
+        [321218, 321219], # HLT_IsoMu27_v16, 463.69/pb
+        [321221, 321221], # HLT_IsoMu27_v16, 5.906/pb
+        [321230, 321233], # HLT_IsoMu27_v16, 275.104/pb
+        [321262, 321262], # HLT_IsoMu27_v16, 1.669/pb
+        [321283, 321283], # HLT_IsoMu27_v16, 119.781/pb
+        [321294, 321296], # HLT_IsoMu27_v16, 233.977/pb
+        [321305, 321305], # HLT_IsoMu27_v16, 601.905/pb
+        [321311, 321313], # HLT_IsoMu27_v16, 87.325/pb
+        [321393, 321393], # HLT_IsoMu27_v16, 49.689/pb
+        [321396, 321397], # HLT_IsoMu27_v16, 417.281/pb
+        [321414, 321415], # HLT_IsoMu27_v16, 523.015/pb
+        [321431, 321434], # HLT_IsoMu27_v16, 296.1/pb
+        [321436, 321436], # HLT_IsoMu27_v16, 138.442/pb
+        [321457, 321457], # HLT_IsoMu27_v16, 482.762/pb
+        [321461, 321461], # HLT_IsoMu27_v16, 21.013/pb
+        [321475, 321475], # HLT_IsoMu27_v16, 471.913/pb
+        [321710, 321710], # HLT_IsoMu27_v16, 17.235/pb
+        [321712, 321712], # HLT_IsoMu27_v16, 84.378/pb
+        [321730, 321730], # HLT_IsoMu27_v16, 102.671/pb
+        [321732, 321732], # HLT_IsoMu27_v16, 344.692/pb
+        [321735, 321735], # HLT_IsoMu27_v16, 23.661/pb
+        [321755, 321755], # HLT_IsoMu27_v16, 213.438/pb
+        [321758, 321758], # HLT_IsoMu27_v16, 37.518/pb
+        [321760, 321760], # HLT_IsoMu27_v16, 146.153/pb
+        [321773, 321778], # HLT_IsoMu27_v16, 174.569/pb
+        [321780, 321781], # HLT_IsoMu27_v16, 181.684/pb
+        [321813, 321813], # HLT_IsoMu27_v16, 120.244/pb
+        [321815, 321815], # HLT_IsoMu27_v16, 5.12/pb
+        [321817, 321818], # HLT_IsoMu27_v16, 286.489/pb
+        [321820, 321820], # HLT_IsoMu27_v16, 32.069/pb
+        [321831, 321834], # HLT_IsoMu27_v16, 488.005/pb
+        [321879, 321880], # HLT_IsoMu27_v16, 131.546/pb
+        [321887, 321887], # HLT_IsoMu27_v16, 276.941/pb
+        [321908, 321909], # HLT_IsoMu27_v16, 485.884/pb
+        [321917, 321917], # HLT_IsoMu27_v16, 261.22/pb
+        [321919, 321919], # HLT_IsoMu27_v16, 1.489/pb
+        [321933, 321933], # HLT_IsoMu27_v16, 101.007/pb
+        [321960, 321961], # HLT_IsoMu27_v16, 139.431/pb
+        [321973, 321973], # HLT_IsoMu27_v16, 358.667/pb
+        [321975, 321975], # HLT_IsoMu27_v16, 145.784/pb
+        [321988, 321988], # HLT_IsoMu27_v16, 384.022/pb
+        [321990, 321990], # HLT_IsoMu27_v16, 81.032/pb
+        [322013, 322014], # HLT_IsoMu27_v16, 7.816/pb
+        [322022, 322022], # HLT_IsoMu27_v16, 452.969/pb
+        [322040, 322040], # HLT_IsoMu27_v16, 13.692/pb
+        [322057, 322057], # HLT_IsoMu27_v16, 8.235/pb
+        [322068, 322068], # HLT_IsoMu27_v16, 232.599/pb
+        [322079, 322079], # HLT_IsoMu27_v16, 140.245/pb
+        [322106, 322106], # HLT_IsoMu27_v16, 281.859/pb
+        [322113, 322113], # HLT_IsoMu27_v16, 40.79/pb
+        [322118, 322118], # HLT_IsoMu27_v16, 268.229/pb
+        [322179, 322179], # HLT_IsoMu27_v16, 469.75/pb
+        [322201, 322201], # HLT_IsoMu27_v16, 84.335/pb
+        [322204, 322204], # HLT_IsoMu27_v16, 311.166/pb
+        [322222, 322222], # HLT_IsoMu27_v16, 92.744/pb
+        [322252, 322252], # HLT_IsoMu27_v16, 420.358/pb
+        [322317, 322317], # HLT_IsoMu27_v16, 19.246/pb
+        [322319, 322319], # HLT_IsoMu27_v16, 55.502/pb
+        [322322, 322322], # HLT_IsoMu27_v16, 292.464/pb
+        [322324, 322324], # HLT_IsoMu27_v16, 69.26/pb
+        [322332, 322332], # HLT_IsoMu27_v16, 313.996/pb
+        [322348, 322348], # HLT_IsoMu27_v16, 414.112/pb
+        [322355, 322356], # HLT_IsoMu27_v16, 268.46/pb
+        [322381, 322381], # HLT_IsoMu27_v16, 178.73/pb
+        [322407, 322407], # HLT_IsoMu27_v16, 169.958/pb
+        [322430, 322431], # HLT_IsoMu27_v16, 370.371/pb
+        [322480, 322480], # HLT_IsoMu27_v16, 109.337/pb
+        [322492, 322492], # HLT_IsoMu27_v16, 287.515/pb
+        [322510, 322510], # HLT_IsoMu27_v16, 2.229/pb
+        [322599, 322599], # HLT_IsoMu27_v16, 94.351/pb
+        [322602, 322603], # HLT_IsoMu27_v16, 26.803/pb
+        [322605, 322605], # HLT_IsoMu27_v16, 89.624/pb
+        [322617, 322617], # HLT_IsoMu27_v16, 136.646/pb
+        [322625, 322625], # HLT_IsoMu27_v16, 335.273/pb
+        [322633, 322633], # HLT_IsoMu27_v16, 50.946/pb
+        [323414, 323414], # HLT_IsoMu27_v16, 6.204/pb
+        [323423, 323423], # HLT_IsoMu27_v16, 21.037/pb
+        [323470, 323475], # HLT_IsoMu27_v16, 321.533/pb
+        [323487, 323488], # HLT_IsoMu27_v16, 340.364/pb
+        [323492, 323493], # HLT_IsoMu27_v16, 33.198/pb
+        [323495, 323495], # HLT_IsoMu27_v16, 32.347/pb
+        [323524, 323526], # HLT_IsoMu27_v16, 480.533/pb
+        [323693, 323693], # HLT_IsoMu27_v16, 40.083/pb
+        [323696, 323696], # HLT_IsoMu27_v16, 88.848/pb
+        [323702, 323702], # HLT_IsoMu27_v16, 145.958/pb
+        [323725, 323727], # HLT_IsoMu27_v16, 380.043/pb
+        [323755, 323755], # HLT_IsoMu27_v16, 296.639/pb
+        [323775, 323775], # HLT_IsoMu27_v16, 46.768/pb
+        [323778, 323778], # HLT_IsoMu27_v16, 270.936/pb
+        [323790, 323790], # HLT_IsoMu27_v16, 276.737/pb
+        [323794, 323794], # HLT_IsoMu27_v16, 16.057/pb
+        [323841, 323841], # HLT_IsoMu27_v16, 155.038/pb
+        [323857, 323857], # HLT_IsoMu27_v16, 95.513/pb
+        [323940, 323940], # HLT_IsoMu27_v16, 426.706/pb
+        [323954, 323954], # HLT_IsoMu27_v16, 15.141/pb
+        [323976, 323976], # HLT_IsoMu27_v16, 14.399/pb
+        [323978, 323978], # HLT_IsoMu27_v16, 21.952/pb
+        [323980, 323980], # HLT_IsoMu27_v16, 67.732/pb
+        [323983, 323983], # HLT_IsoMu27_v16, 56.791/pb
+        [323997, 323997], # HLT_IsoMu27_v16, 128.792/pb
+        [324021, 324022], # HLT_IsoMu27_v16, 380.271/pb
+        [324077, 324077], # HLT_IsoMu27_v16, 242.583/pb
+        [324201, 324202], # HLT_IsoMu27_v16, 402.099/pb
+        [324205, 324207], # HLT_IsoMu27_v16, 44.541/pb
+        [324209, 324209], # HLT_IsoMu27_v16, 16.079/pb
+        [324237, 324237], # HLT_IsoMu27_v16, 74.992/pb
+        [324245, 324245], # HLT_IsoMu27_v16, 417.199/pb
+        [324293, 324293], # HLT_IsoMu27_v16, 513.035/pb
+        [324315, 324315], # HLT_IsoMu27_v16, 70.437/pb
+        [324318, 324318], # HLT_IsoMu27_v16, 99.84/pb
+        [324420, 324420], # HLT_IsoMu27_v16, 199.727/pb
+        [324729, 324729], # HLT_IsoMu27_v16, 14.797/pb
+        [324747, 324747], # HLT_IsoMu27_v16, 308.246/pb
+        [324764, 324765], # HLT_IsoMu27_v16, 117.745/pb
+        [324769, 324769], # HLT_IsoMu27_v16, 46.77/pb
+        [324772, 324772], # HLT_IsoMu27_v16, 18.783/pb
+        [324785, 324785], # HLT_IsoMu27_v16, 185.798/pb
+        [324791, 324791], # HLT_IsoMu27_v16, 245.007/pb
+        [324835, 324835], # HLT_IsoMu27_v16, 85.856/pb
+        [324840, 324841], # HLT_IsoMu27_v16, 328.73/pb
+        [324846, 324846], # HLT_IsoMu27_v16, 68.553/pb
+        [324878, 324878], # HLT_IsoMu27_v16, 403.017/pb
+        [324897, 324897], # HLT_IsoMu27_v16, 50.229/pb
+        [324970, 324970], # HLT_IsoMu27_v16, 479.466/pb
+        [324980, 324980], # HLT_IsoMu27_v16, 513.295/pb
+        [324997, 325001], # HLT_IsoMu27_v16, 370.507/pb
+        [325022, 325022], # HLT_IsoMu27_v16, 433.386/pb
+        [325057, 325057], # HLT_IsoMu27_v16, 120.048/pb
+        [325097, 325101], # HLT_IsoMu27_v16, 351.717/pb
+        [325110, 325110], # HLT_IsoMu27_v16, 3.259/pb
+        [325117, 325117], # HLT_IsoMu27_v16, 85.217/pb
+        [325159, 325159], # HLT_IsoMu27_v16, 61.44/pb
+        [325168, 325170], # HLT_IsoMu27_v16, 273.009/pb
+        [325172, 325172], # HLT_IsoMu27_v16, 67.636/pb
+      ],
+    },
+  ],
+  '1mu_noiso' : [
+    {
+      'name'        : 'HLT_Mu50',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Mu50_v12, 7.929/pb
+        [315259, 315259], # HLT_Mu50_v12, 13.919/pb
+        [315264, 315265], # HLT_Mu50_v12, 46.158/pb
+        [315267, 315267], # HLT_Mu50_v12, 37.143/pb
+        [315270, 315270], # HLT_Mu50_v12, 78.981/pb
+        [315322, 315322], # HLT_Mu50_v12, 180.063/pb
+        [315339, 315339], # HLT_Mu50_v12, 93.349/pb
+        [315357, 315357], # HLT_Mu50_v12, 151.931/pb
+        [315361, 315361], # HLT_Mu50_v12, 118.532/pb
+        [315363, 315363], # HLT_Mu50_v12, 14.489/pb
+        [315366, 315366], # HLT_Mu50_v12, 100.183/pb
+        [315420, 315420], # HLT_Mu50_v12, 258.566/pb
+        [315488, 315490], # HLT_Mu50_v12, 296.522/pb
+        [315506, 315506], # HLT_Mu50_v12, 27.983/pb
+        [315510, 315510], # HLT_Mu50_v12, 103.172/pb
+        [315512, 315512], # HLT_Mu50_v12, 236.871/pb
+        [315543, 315543], # HLT_Mu50_v12, 36.886/pb
+        [315555, 315557], # HLT_Mu50_v12, 114.498/pb
+        [315640, 315642], # HLT_Mu50_v12, 43.181/pb
+        [315644, 315648], # HLT_Mu50_v12, 439.459/pb
+        [315689, 315690], # HLT_Mu50_v12, 448.961/pb
+        [315702, 315705], # HLT_Mu50_v12, 328.569/pb
+        [315713, 315713], # HLT_Mu50_v12, 353.735/pb
+        [315721, 315721], # HLT_Mu50_v12, 210.579/pb
+        [315741, 315741], # HLT_Mu50_v12, 23.717/pb
+        [315764, 315764], # HLT_Mu50_v12, 114.011/pb
+        [315770, 315770], # HLT_Mu50_v12, 121.796/pb
+        [315784, 315786], # HLT_Mu50_v12, 179.651/pb
+        [315790, 315790], # HLT_Mu50_v12, 173.124/pb
+        [315800, 315801], # HLT_Mu50_v12, 304.75/pb
+        [315840, 315840], # HLT_Mu50_v12, 354.111/pb
+        [315973, 315974], # HLT_Mu50_v12, 297.118/pb
+        [316058, 316062], # HLT_Mu50_v12, 512.949/pb
+        [316082, 316082], # HLT_Mu50_v12, 141.36/pb
+        [316110, 316111], # HLT_Mu50_v12, 97.131/pb
+        [316113, 316114], # HLT_Mu50_v12, 388.486/pb
+        [316153, 316153], # HLT_Mu50_v12, 256.24/pb
+        [316186, 316187], # HLT_Mu50_v12, 527.582/pb
+        [316199, 316202], # HLT_Mu50_v12, 589.387/pb
+        [316216, 316219], # HLT_Mu50_v12, 551.849/pb
+        [316239, 316241], # HLT_Mu50_v12, 546.196/pb
+        [316271, 316271], # HLT_Mu50_v12, 29.698/pb
+        [316361, 316363], # HLT_Mu50_v13, 84.941/pb
+        [316377, 316380], # HLT_Mu50_v13, 188.825/pb
+        [316455, 316455], # HLT_Mu50_v13, 9.607/pb
+        [316457, 316457], # HLT_Mu50_v13, 326.273/pb
+        [316469, 316470], # HLT_Mu50_v13, 265.747/pb
+        [316472, 316472], # HLT_Mu50_v13, 66.237/pb
+        [316505, 316505], # HLT_Mu50_v13, 401.22/pb
+        [316569, 316569], # HLT_Mu50_v13, 485.569/pb
+        [316590, 316590], # HLT_Mu50_v13, 189.247/pb
+        [316613, 316613], # HLT_Mu50_v13, 31.466/pb
+        [316615, 316615], # HLT_Mu50_v13, 49.127/pb
+        [316666, 316667], # HLT_Mu50_v13, 321.521/pb
+        [316700, 316702], # HLT_Mu50_v13, 353.699/pb
+        [316715, 316723], # HLT_Mu50_v13, 440.225/pb
+        [316758, 316758], # HLT_Mu50_v13, 455.683/pb
+        [316766, 316766], # HLT_Mu50_v13, 561.053/pb
+        [316876, 316877], # HLT_Mu50_v13, 327.431/pb
+        [316879, 316879], # HLT_Mu50_v13, 36.513/pb
+        [316928, 316928], # HLT_Mu50_v13, 44.417/pb
+        [316985, 316985], # HLT_Mu50_v13, 172.546/pb
+        [316993, 316995], # HLT_Mu50_v13, 265.445/pb
+        [317080, 317080], # HLT_Mu50_v13, 7.844/pb
+        [317087, 317087], # HLT_Mu50_v13, 243.2/pb
+        [317089, 317089], # HLT_Mu50_v13, 212.905/pb
+        [317182, 317182], # HLT_Mu50_v13, 406.207/pb
+        [317212, 317213], # HLT_Mu50_v13, 176.661/pb
+        [317279, 317279], # HLT_Mu50_v13, 65.892/pb
+        [317291, 317292], # HLT_Mu50_v13, 359.036/pb
+        [317297, 317297], # HLT_Mu50_v13, 123.799/pb
+        [317319, 317320], # HLT_Mu50_v13, 514.282/pb
+        [317338, 317340], # HLT_Mu50_v13, 219.977/pb
+        [317382, 317383], # HLT_Mu50_v13, 46.591/pb
+        [317391, 317392], # HLT_Mu50_v13, 493.374/pb
+        [317435, 317435], # HLT_Mu50_v13, 360.613/pb
+        [317438, 317438], # HLT_Mu50_v13, 49.71/pb
+        [317475, 317475], # HLT_Mu50_v13, 25.761/pb
+        [317478, 317478], # HLT_Mu50_v13, 7.937/pb
+        [317484, 317484], # HLT_Mu50_v13, 160.356/pb
+        [317488, 317488], # HLT_Mu50_v13, 181.128/pb
+        [317527, 317527], # HLT_Mu50_v13, 452.099/pb
+        [317591, 317591], # HLT_Mu50_v13, 111.117/pb
+        [317626, 317626], # HLT_Mu50_v13, 528.94/pb
+        [317640, 317641], # HLT_Mu50_v13, 529.494/pb
+        [317648, 317650], # HLT_Mu50_v13, 483.09/pb
+        [317661, 317661], # HLT_Mu50_v13, 375.651/pb
+        [317663, 317663], # HLT_Mu50_v13, 153.301/pb
+        [317683, 317683], # HLT_Mu50_v13, 117.852/pb
+        [317696, 317696], # HLT_Mu50_v13, 228.787/pb
+        [318733, 318733], # HLT_Mu50_v13, 2.792/pb
+        [318828, 318828], # HLT_Mu50_v13, 13.229/pb
+        [318872, 318872], # HLT_Mu50_v13, 91.855/pb
+        [318874, 318874], # HLT_Mu50_v13, 99.565/pb
+        [318876, 318877], # HLT_Mu50_v13, 207.136/pb
+        [319077, 319077], # HLT_Mu50_v13, 16.372/pb
+        [319337, 319337], # HLT_Mu50_v13, 232.389/pb
+        [319347, 319349], # HLT_Mu50_v13, 256.706/pb
+        [319449, 319450], # HLT_Mu50_v13, 456.219/pb
+        [319456, 319456], # HLT_Mu50_v13, 52.016/pb
+        [319459, 319459], # HLT_Mu50_v13, 17.212/pb
+        [319486, 319486], # HLT_Mu50_v13, 20.315/pb
+        [319503, 319503], # HLT_Mu50_v13, 90.959/pb
+        [319524, 319524], # HLT_Mu50_v13, 456.701/pb
+        [319526, 319526], # HLT_Mu50_v13, 69.66/pb
+        [319528, 319528], # HLT_Mu50_v13, 58.411/pb
+        [319579, 319579], # HLT_Mu50_v13, 818.49/pb
+        [319625, 319625], # HLT_Mu50_v13, 70.596/pb
+        [319639, 319639], # HLT_Mu50_v13, 409.34/pb
+        [319656, 319659], # HLT_Mu50_v13, 221.8/pb
+        [319678, 319678], # HLT_Mu50_v13, 95.425/pb
+        [319687, 319687], # HLT_Mu50_v13, 16.053/pb
+        [319697, 319698], # HLT_Mu50_v13, 96.857/pb
+        [319756, 319756], # HLT_Mu50_v13, 490.205/pb
+        [319840, 319841], # HLT_Mu50_v13, 69.999/pb
+        [319847, 319849], # HLT_Mu50_v13, 193.537/pb
+        [319851, 319851], # HLT_Mu50_v13, 1.137/pb
+        [319853, 319854], # HLT_Mu50_v13, 124.92/pb
+        [319908, 319910], # HLT_Mu50_v13, 324.281/pb
+        [319912, 319915], # HLT_Mu50_v13, 119.686/pb
+        [319941, 319942], # HLT_Mu50_v13, 111.886/pb
+        [319950, 319950], # HLT_Mu50_v13, 65.936/pb
+        [319991, 319993], # HLT_Mu50_v13, 530.374/pb
+        [320002, 320002], # HLT_Mu50_v13, 50.203/pb
+        [320006, 320006], # HLT_Mu50_v13, 114.14/pb
+        [320010, 320012], # HLT_Mu50_v13, 153.875/pb
+        [320023, 320026], # HLT_Mu50_v13, 305.475/pb
+        [320038, 320040], # HLT_Mu50_v13, 404.341/pb
+        [320059, 320065], # HLT_Mu50_v13, 395.979/pb
+        [320673, 320674], # HLT_Mu50_v13, 98.341/pb
+        [320688, 320688], # HLT_Mu50_v13, 130.855/pb
+        [320712, 320712], # HLT_Mu50_v13, 69.58/pb
+        [320757, 320757], # HLT_Mu50_v13, 116.684/pb
+        [320804, 320804], # HLT_Mu50_v13, 319.033/pb
+        [320807, 320807], # HLT_Mu50_v13, 0.348/pb
+        [320809, 320809], # HLT_Mu50_v13, 106.231/pb
+        [320821, 320824], # HLT_Mu50_v13, 454.293/pb
+        [320838, 320838], # HLT_Mu50_v13, 92.366/pb
+        [320840, 320841], # HLT_Mu50_v13, 191.511/pb
+        [320853, 320859], # HLT_Mu50_v13, 433.068/pb
+        [320887, 320888], # HLT_Mu50_v13, 113.862/pb
+        [320916, 320917], # HLT_Mu50_v13, 484.437/pb
+        [320920, 320920], # HLT_Mu50_v13, 24.013/pb
+        [320933, 320934], # HLT_Mu50_v13, 262.426/pb
+        [320936, 320936], # HLT_Mu50_v13, 78.32/pb
+        [320941, 320941], # HLT_Mu50_v13, 15.638/pb
+        [320980, 320980], # HLT_Mu50_v13, 38.408/pb
+        [320995, 320996], # HLT_Mu50_v13, 74.084/pb
+        [321004, 321007], # HLT_Mu50_v13, 320.57/pb
+        [321009, 321012], # HLT_Mu50_v13, 105.863/pb
+        [321051, 321051], # HLT_Mu50_v13, 311.577/pb
+        [321055, 321055], # HLT_Mu50_v13, 125.495/pb
+        [321067, 321069], # HLT_Mu50_v13, 369.401/pb
+        [321119, 321119], # HLT_Mu50_v13, 58.668/pb
+        [321121, 321122], # HLT_Mu50_v13, 136.178/pb
+        [321124, 321124], # HLT_Mu50_v13, 185.308/pb
+        [321126, 321126], # HLT_Mu50_v13, 78.957/pb
+        [321134, 321134], # HLT_Mu50_v13, 8.164/pb
+        [321138, 321138], # HLT_Mu50_v13, 141.977/pb
+        [321140, 321140], # HLT_Mu50_v13, 116.949/pb
+        [321149, 321149], # HLT_Mu50_v13, 434.675/pb
+        [321165, 321167], # HLT_Mu50_v13, 277.898/pb
+        [321177, 321178], # HLT_Mu50_v13, 174.709/pb
+        [321218, 321219], # HLT_Mu50_v13, 463.69/pb
+        [321221, 321221], # HLT_Mu50_v13, 5.906/pb
+        [321230, 321233], # HLT_Mu50_v13, 275.104/pb
+        [321262, 321262], # HLT_Mu50_v13, 1.669/pb
+        [321283, 321283], # HLT_Mu50_v13, 119.781/pb
+        [321294, 321296], # HLT_Mu50_v13, 233.977/pb
+        [321305, 321305], # HLT_Mu50_v13, 601.905/pb
+        [321311, 321313], # HLT_Mu50_v13, 87.325/pb
+        [321393, 321393], # HLT_Mu50_v13, 49.689/pb
+        [321396, 321397], # HLT_Mu50_v13, 417.281/pb
+        [321414, 321415], # HLT_Mu50_v13, 523.015/pb
+        [321431, 321434], # HLT_Mu50_v13, 296.1/pb
+        [321436, 321436], # HLT_Mu50_v13, 138.442/pb
+        [321457, 321457], # HLT_Mu50_v13, 482.762/pb
+        [321461, 321461], # HLT_Mu50_v13, 21.013/pb
+        [321475, 321475], # HLT_Mu50_v13, 471.913/pb
+        [321710, 321710], # HLT_Mu50_v13, 17.235/pb
+        [321712, 321712], # HLT_Mu50_v13, 84.378/pb
+        [321730, 321730], # HLT_Mu50_v13, 102.671/pb
+        [321732, 321732], # HLT_Mu50_v13, 344.692/pb
+        [321735, 321735], # HLT_Mu50_v13, 23.661/pb
+        [321755, 321755], # HLT_Mu50_v13, 213.438/pb
+        [321758, 321758], # HLT_Mu50_v13, 37.518/pb
+        [321760, 321760], # HLT_Mu50_v13, 146.153/pb
+        [321773, 321778], # HLT_Mu50_v13, 174.569/pb
+        [321780, 321781], # HLT_Mu50_v13, 181.684/pb
+        [321813, 321813], # HLT_Mu50_v13, 120.244/pb
+        [321815, 321815], # HLT_Mu50_v13, 5.12/pb
+        [321817, 321818], # HLT_Mu50_v13, 286.489/pb
+        [321820, 321820], # HLT_Mu50_v13, 32.069/pb
+        [321831, 321834], # HLT_Mu50_v13, 488.005/pb
+        [321879, 321880], # HLT_Mu50_v13, 131.546/pb
+        [321887, 321887], # HLT_Mu50_v13, 276.941/pb
+        [321908, 321909], # HLT_Mu50_v13, 485.884/pb
+        [321917, 321917], # HLT_Mu50_v13, 261.22/pb
+        [321919, 321919], # HLT_Mu50_v13, 1.489/pb
+        [321933, 321933], # HLT_Mu50_v13, 101.007/pb
+        [321960, 321961], # HLT_Mu50_v13, 139.431/pb
+        [321973, 321973], # HLT_Mu50_v13, 358.667/pb
+        [321975, 321975], # HLT_Mu50_v13, 145.784/pb
+        [321988, 321988], # HLT_Mu50_v13, 384.022/pb
+        [321990, 321990], # HLT_Mu50_v13, 81.032/pb
+        [322013, 322014], # HLT_Mu50_v13, 7.816/pb
+        [322022, 322022], # HLT_Mu50_v13, 452.969/pb
+        [322040, 322040], # HLT_Mu50_v13, 13.692/pb
+        [322057, 322057], # HLT_Mu50_v13, 8.235/pb
+        [322068, 322068], # HLT_Mu50_v13, 232.599/pb
+        [322079, 322079], # HLT_Mu50_v13, 140.245/pb
+        [322106, 322106], # HLT_Mu50_v13, 281.859/pb
+        [322113, 322113], # HLT_Mu50_v13, 40.79/pb
+        [322118, 322118], # HLT_Mu50_v13, 268.229/pb
+        [322179, 322179], # HLT_Mu50_v13, 469.75/pb
+        [322201, 322201], # HLT_Mu50_v13, 84.335/pb
+        [322204, 322204], # HLT_Mu50_v13, 311.166/pb
+        [322222, 322222], # HLT_Mu50_v13, 92.744/pb
+        [322252, 322252], # HLT_Mu50_v13, 420.358/pb
+        [322317, 322317], # HLT_Mu50_v13, 19.246/pb
+        [322319, 322319], # HLT_Mu50_v13, 55.502/pb
+        [322322, 322322], # HLT_Mu50_v13, 292.464/pb
+        [322324, 322324], # HLT_Mu50_v13, 69.26/pb
+        [322332, 322332], # HLT_Mu50_v13, 313.996/pb
+        [322348, 322348], # HLT_Mu50_v13, 414.112/pb
+        [322355, 322356], # HLT_Mu50_v13, 268.46/pb
+        [322381, 322381], # HLT_Mu50_v13, 178.73/pb
+        [322407, 322407], # HLT_Mu50_v13, 169.958/pb
+        [322430, 322431], # HLT_Mu50_v13, 370.371/pb
+        [322480, 322480], # HLT_Mu50_v13, 109.337/pb
+        [322492, 322492], # HLT_Mu50_v13, 287.515/pb
+        [322510, 322510], # HLT_Mu50_v13, 2.229/pb
+        [322599, 322599], # HLT_Mu50_v13, 94.351/pb
+        [322602, 322603], # HLT_Mu50_v13, 26.803/pb
+        [322605, 322605], # HLT_Mu50_v13, 89.624/pb
+        [322617, 322617], # HLT_Mu50_v13, 136.646/pb
+        [322625, 322625], # HLT_Mu50_v13, 335.273/pb
+        [322633, 322633], # HLT_Mu50_v13, 50.946/pb
+        [323414, 323414], # HLT_Mu50_v13, 6.204/pb
+        [323423, 323423], # HLT_Mu50_v13, 21.037/pb
+        [323470, 323475], # HLT_Mu50_v13, 321.533/pb
+        [323487, 323488], # HLT_Mu50_v13, 340.364/pb
+        [323492, 323493], # HLT_Mu50_v13, 33.198/pb
+        [323495, 323495], # HLT_Mu50_v13, 32.347/pb
+        [323524, 323526], # HLT_Mu50_v13, 480.533/pb
+        [323693, 323693], # HLT_Mu50_v13, 40.083/pb
+        [323696, 323696], # HLT_Mu50_v13, 88.848/pb
+        [323702, 323702], # HLT_Mu50_v13, 145.958/pb
+        [323725, 323727], # HLT_Mu50_v13, 380.043/pb
+        [323755, 323755], # HLT_Mu50_v13, 296.639/pb
+        [323775, 323775], # HLT_Mu50_v13, 46.768/pb
+        [323778, 323778], # HLT_Mu50_v13, 270.936/pb
+        [323790, 323790], # HLT_Mu50_v13, 276.737/pb
+        [323794, 323794], # HLT_Mu50_v13, 16.057/pb
+        [323841, 323841], # HLT_Mu50_v13, 155.038/pb
+        [323857, 323857], # HLT_Mu50_v13, 95.513/pb
+        [323940, 323940], # HLT_Mu50_v13, 426.706/pb
+        [323954, 323954], # HLT_Mu50_v13, 15.141/pb
+        [323976, 323976], # HLT_Mu50_v13, 14.399/pb
+        [323978, 323978], # HLT_Mu50_v13, 21.952/pb
+        [323980, 323980], # HLT_Mu50_v13, 67.732/pb
+        [323983, 323983], # HLT_Mu50_v13, 56.791/pb
+        [323997, 323997], # HLT_Mu50_v13, 128.792/pb
+        [324021, 324022], # HLT_Mu50_v13, 380.271/pb
+        [324077, 324077], # HLT_Mu50_v13, 242.583/pb
+        [324201, 324202], # HLT_Mu50_v13, 402.099/pb
+        [324205, 324207], # HLT_Mu50_v13, 44.541/pb
+        [324209, 324209], # HLT_Mu50_v13, 16.079/pb
+        [324237, 324237], # HLT_Mu50_v13, 74.992/pb
+        [324245, 324245], # HLT_Mu50_v13, 417.199/pb
+        [324293, 324293], # HLT_Mu50_v13, 513.035/pb
+        [324315, 324315], # HLT_Mu50_v13, 70.437/pb
+        [324318, 324318], # HLT_Mu50_v13, 99.84/pb
+        [324420, 324420], # HLT_Mu50_v13, 199.727/pb
+        [324729, 324729], # HLT_Mu50_v13, 14.797/pb
+        [324747, 324747], # HLT_Mu50_v13, 308.246/pb
+        [324764, 324765], # HLT_Mu50_v13, 117.745/pb
+        [324769, 324769], # HLT_Mu50_v13, 46.77/pb
+        [324772, 324772], # HLT_Mu50_v13, 18.783/pb
+        [324785, 324785], # HLT_Mu50_v13, 185.798/pb
+        [324791, 324791], # HLT_Mu50_v13, 245.007/pb
+        [324835, 324835], # HLT_Mu50_v13, 85.856/pb
+        [324840, 324841], # HLT_Mu50_v13, 328.73/pb
+        [324846, 324846], # HLT_Mu50_v13, 68.553/pb
+        [324878, 324878], # HLT_Mu50_v13, 403.017/pb
+        [324897, 324897], # HLT_Mu50_v13, 50.229/pb
+        [324970, 324970], # HLT_Mu50_v13, 479.466/pb
+        [324980, 324980], # HLT_Mu50_v13, 513.295/pb
+        [324997, 325001], # HLT_Mu50_v13, 370.507/pb
+        [325022, 325022], # HLT_Mu50_v13, 433.386/pb
+        [325057, 325057], # HLT_Mu50_v13, 120.048/pb
+        [325097, 325101], # HLT_Mu50_v13, 351.717/pb
+        [325110, 325110], # HLT_Mu50_v13, 3.259/pb
+        [325117, 325117], # HLT_Mu50_v13, 85.217/pb
+        [325159, 325159], # HLT_Mu50_v13, 61.44/pb
+        [325168, 325170], # HLT_Mu50_v13, 273.009/pb
+        [325172, 325172], # HLT_Mu50_v13, 67.636/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_OldMu100',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_OldMu100_v3, 7.929/pb
+        [315259, 315259], # HLT_OldMu100_v3, 13.919/pb
+        [315264, 315265], # HLT_OldMu100_v3, 46.158/pb
+        [315267, 315267], # HLT_OldMu100_v3, 37.143/pb
+        [315270, 315270], # HLT_OldMu100_v3, 78.981/pb
+        [315322, 315322], # HLT_OldMu100_v3, 180.063/pb
+        [315339, 315339], # HLT_OldMu100_v3, 93.349/pb
+        [315357, 315357], # HLT_OldMu100_v3, 151.931/pb
+        [315361, 315361], # HLT_OldMu100_v3, 118.532/pb
+        [315363, 315363], # HLT_OldMu100_v3, 14.489/pb
+        [315366, 315366], # HLT_OldMu100_v3, 100.183/pb
+        [315420, 315420], # HLT_OldMu100_v3, 258.566/pb
+        [315488, 315490], # HLT_OldMu100_v3, 296.522/pb
+        [315506, 315506], # HLT_OldMu100_v3, 27.983/pb
+        [315510, 315510], # HLT_OldMu100_v3, 103.172/pb
+        [315512, 315512], # HLT_OldMu100_v3, 236.871/pb
+        [315543, 315543], # HLT_OldMu100_v3, 36.886/pb
+        [315555, 315557], # HLT_OldMu100_v3, 114.498/pb
+        [315640, 315642], # HLT_OldMu100_v3, 43.181/pb
+        [315644, 315648], # HLT_OldMu100_v3, 439.459/pb
+        [315689, 315690], # HLT_OldMu100_v3, 448.961/pb
+        [315702, 315705], # HLT_OldMu100_v3, 328.569/pb
+        [315713, 315713], # HLT_OldMu100_v3, 353.735/pb
+        [315721, 315721], # HLT_OldMu100_v3, 210.579/pb
+        [315741, 315741], # HLT_OldMu100_v3, 23.717/pb
+        [315764, 315764], # HLT_OldMu100_v3, 114.011/pb
+        [315770, 315770], # HLT_OldMu100_v3, 121.796/pb
+        [315784, 315786], # HLT_OldMu100_v3, 179.651/pb
+        [315790, 315790], # HLT_OldMu100_v3, 173.124/pb
+        [315800, 315801], # HLT_OldMu100_v3, 304.75/pb
+        [315840, 315840], # HLT_OldMu100_v3, 354.111/pb
+        [315973, 315974], # HLT_OldMu100_v3, 297.118/pb
+        [316058, 316062], # HLT_OldMu100_v3, 512.949/pb
+        [316082, 316082], # HLT_OldMu100_v3, 141.36/pb
+        [316110, 316111], # HLT_OldMu100_v3, 97.131/pb
+        [316113, 316114], # HLT_OldMu100_v3, 388.486/pb
+        [316153, 316153], # HLT_OldMu100_v3, 256.24/pb
+        [316186, 316187], # HLT_OldMu100_v3, 527.582/pb
+        [316199, 316202], # HLT_OldMu100_v3, 589.387/pb
+        [316216, 316219], # HLT_OldMu100_v3, 551.849/pb
+        [316239, 316241], # HLT_OldMu100_v3, 546.196/pb
+        [316271, 316271], # HLT_OldMu100_v3, 29.698/pb
+        [316361, 316363], # HLT_OldMu100_v3, 84.941/pb
+        [316377, 316380], # HLT_OldMu100_v3, 188.825/pb
+        [316455, 316455], # HLT_OldMu100_v3, 9.607/pb
+        [316457, 316457], # HLT_OldMu100_v3, 326.273/pb
+        [316469, 316470], # HLT_OldMu100_v3, 265.747/pb
+        [316472, 316472], # HLT_OldMu100_v3, 66.237/pb
+        [316505, 316505], # HLT_OldMu100_v3, 401.22/pb
+        [316569, 316569], # HLT_OldMu100_v3, 485.569/pb
+        [316590, 316590], # HLT_OldMu100_v3, 189.247/pb
+        [316613, 316613], # HLT_OldMu100_v3, 31.466/pb
+        [316615, 316615], # HLT_OldMu100_v3, 49.127/pb
+        [316666, 316667], # HLT_OldMu100_v3, 321.521/pb
+        [316700, 316702], # HLT_OldMu100_v3, 353.699/pb
+        [316715, 316723], # HLT_OldMu100_v3, 440.225/pb
+        [316758, 316758], # HLT_OldMu100_v3, 455.683/pb
+        [316766, 316766], # HLT_OldMu100_v3, 561.053/pb
+        [316876, 316877], # HLT_OldMu100_v3, 327.431/pb
+        [316879, 316879], # HLT_OldMu100_v3, 36.513/pb
+        [316928, 316928], # HLT_OldMu100_v3, 44.417/pb
+        [316985, 316985], # HLT_OldMu100_v3, 172.546/pb
+        [316993, 316995], # HLT_OldMu100_v3, 265.445/pb
+        [317080, 317080], # HLT_OldMu100_v3, 7.844/pb
+        [317087, 317087], # HLT_OldMu100_v3, 243.2/pb
+        [317089, 317089], # HLT_OldMu100_v3, 212.905/pb
+        [317182, 317182], # HLT_OldMu100_v3, 406.207/pb
+        [317212, 317213], # HLT_OldMu100_v3, 176.661/pb
+        [317279, 317279], # HLT_OldMu100_v3, 65.892/pb
+        [317291, 317292], # HLT_OldMu100_v3, 359.036/pb
+        [317297, 317297], # HLT_OldMu100_v3, 123.799/pb
+        [317319, 317320], # HLT_OldMu100_v3, 514.282/pb
+        [317338, 317340], # HLT_OldMu100_v3, 219.977/pb
+        [317382, 317383], # HLT_OldMu100_v3, 46.591/pb
+        [317391, 317392], # HLT_OldMu100_v3, 493.374/pb
+        [317435, 317435], # HLT_OldMu100_v3, 360.613/pb
+        [317438, 317438], # HLT_OldMu100_v3, 49.71/pb
+        [317475, 317475], # HLT_OldMu100_v3, 25.761/pb
+        [317478, 317478], # HLT_OldMu100_v3, 7.937/pb
+        [317484, 317484], # HLT_OldMu100_v3, 160.356/pb
+        [317488, 317488], # HLT_OldMu100_v3, 181.128/pb
+        [317527, 317527], # HLT_OldMu100_v3, 452.099/pb
+        [317591, 317591], # HLT_OldMu100_v3, 111.117/pb
+        [317626, 317626], # HLT_OldMu100_v3, 528.94/pb
+        [317640, 317641], # HLT_OldMu100_v3, 529.494/pb
+        [317648, 317650], # HLT_OldMu100_v3, 483.09/pb
+        [317661, 317661], # HLT_OldMu100_v3, 375.651/pb
+        [317663, 317663], # HLT_OldMu100_v3, 153.301/pb
+        [317683, 317683], # HLT_OldMu100_v3, 117.852/pb
+        [317696, 317696], # HLT_OldMu100_v3, 228.787/pb
+        [318733, 318733], # HLT_OldMu100_v3, 2.792/pb
+        [318828, 318828], # HLT_OldMu100_v3, 13.229/pb
+        [318872, 318872], # HLT_OldMu100_v3, 91.855/pb
+        [318874, 318874], # HLT_OldMu100_v3, 99.565/pb
+        [318876, 318877], # HLT_OldMu100_v3, 207.136/pb
+        [319077, 319077], # HLT_OldMu100_v3, 16.372/pb
+        [319337, 319337], # HLT_OldMu100_v3, 232.389/pb
+        [319347, 319349], # HLT_OldMu100_v3, 256.706/pb
+        [319449, 319450], # HLT_OldMu100_v3, 456.219/pb
+        [319456, 319456], # HLT_OldMu100_v3, 52.016/pb
+        [319459, 319459], # HLT_OldMu100_v3, 17.212/pb
+        [319486, 319486], # HLT_OldMu100_v3, 20.315/pb
+        [319503, 319503], # HLT_OldMu100_v3, 90.959/pb
+        [319524, 319524], # HLT_OldMu100_v3, 456.701/pb
+        [319526, 319526], # HLT_OldMu100_v3, 69.66/pb
+        [319528, 319528], # HLT_OldMu100_v3, 58.411/pb
+        [319579, 319579], # HLT_OldMu100_v3, 818.49/pb
+        [319625, 319625], # HLT_OldMu100_v3, 70.596/pb
+        [319639, 319639], # HLT_OldMu100_v3, 409.34/pb
+        [319656, 319659], # HLT_OldMu100_v3, 221.8/pb
+        [319678, 319678], # HLT_OldMu100_v3, 95.425/pb
+        [319687, 319687], # HLT_OldMu100_v3, 16.053/pb
+        [319697, 319698], # HLT_OldMu100_v3, 96.857/pb
+        [319756, 319756], # HLT_OldMu100_v3, 490.205/pb
+        [319840, 319841], # HLT_OldMu100_v3, 69.999/pb
+        [319847, 319849], # HLT_OldMu100_v3, 193.537/pb
+        [319851, 319851], # HLT_OldMu100_v3, 1.137/pb
+        [319853, 319854], # HLT_OldMu100_v3, 124.92/pb
+        [319908, 319910], # HLT_OldMu100_v3, 324.281/pb
+        [319912, 319915], # HLT_OldMu100_v3, 119.686/pb
+        [319941, 319942], # HLT_OldMu100_v3, 111.886/pb
+        [319950, 319950], # HLT_OldMu100_v3, 65.936/pb
+        [319991, 319993], # HLT_OldMu100_v3, 530.374/pb
+        [320002, 320002], # HLT_OldMu100_v3, 50.203/pb
+        [320006, 320006], # HLT_OldMu100_v3, 114.14/pb
+        [320010, 320012], # HLT_OldMu100_v3, 153.875/pb
+        [320023, 320026], # HLT_OldMu100_v3, 305.475/pb
+        [320038, 320040], # HLT_OldMu100_v3, 404.341/pb
+        [320059, 320065], # HLT_OldMu100_v3, 395.979/pb
+        [320673, 320674], # HLT_OldMu100_v3, 98.341/pb
+        [320688, 320688], # HLT_OldMu100_v3, 130.855/pb
+        [320712, 320712], # HLT_OldMu100_v3, 69.58/pb
+        [320757, 320757], # HLT_OldMu100_v3, 116.684/pb
+        [320804, 320804], # HLT_OldMu100_v3, 319.033/pb
+        [320807, 320807], # HLT_OldMu100_v3, 0.348/pb
+        [320809, 320809], # HLT_OldMu100_v3, 106.231/pb
+        [320821, 320824], # HLT_OldMu100_v3, 454.293/pb
+        [320838, 320838], # HLT_OldMu100_v3, 92.366/pb
+        [320840, 320841], # HLT_OldMu100_v3, 191.511/pb
+        [320853, 320859], # HLT_OldMu100_v3, 433.068/pb
+        [320887, 320888], # HLT_OldMu100_v3, 113.862/pb
+        [320916, 320917], # HLT_OldMu100_v3, 484.437/pb
+        [320920, 320920], # HLT_OldMu100_v3, 24.013/pb
+        [320933, 320934], # HLT_OldMu100_v3, 262.426/pb
+        [320936, 320936], # HLT_OldMu100_v3, 78.32/pb
+        [320941, 320941], # HLT_OldMu100_v3, 15.638/pb
+        [320980, 320980], # HLT_OldMu100_v3, 38.408/pb
+        [320995, 320996], # HLT_OldMu100_v3, 74.084/pb
+        [321004, 321007], # HLT_OldMu100_v3, 320.57/pb
+        [321009, 321012], # HLT_OldMu100_v3, 105.863/pb
+        [321051, 321051], # HLT_OldMu100_v3, 311.577/pb
+        [321055, 321055], # HLT_OldMu100_v3, 125.495/pb
+        [321067, 321069], # HLT_OldMu100_v3, 369.401/pb
+        [321119, 321119], # HLT_OldMu100_v3, 58.668/pb
+        [321121, 321122], # HLT_OldMu100_v3, 136.178/pb
+        [321124, 321124], # HLT_OldMu100_v3, 185.308/pb
+        [321126, 321126], # HLT_OldMu100_v3, 78.957/pb
+        [321134, 321134], # HLT_OldMu100_v3, 8.164/pb
+        [321138, 321138], # HLT_OldMu100_v3, 141.977/pb
+        [321140, 321140], # HLT_OldMu100_v3, 116.949/pb
+        [321149, 321149], # HLT_OldMu100_v3, 434.675/pb
+        [321165, 321167], # HLT_OldMu100_v3, 277.898/pb
+        [321177, 321178], # HLT_OldMu100_v3, 174.709/pb
+        [321218, 321219], # HLT_OldMu100_v3, 463.69/pb
+        [321221, 321221], # HLT_OldMu100_v3, 5.906/pb
+        [321230, 321233], # HLT_OldMu100_v3, 275.104/pb
+        [321262, 321262], # HLT_OldMu100_v3, 1.669/pb
+        [321283, 321283], # HLT_OldMu100_v3, 119.781/pb
+        [321294, 321296], # HLT_OldMu100_v3, 233.977/pb
+        [321305, 321305], # HLT_OldMu100_v3, 601.905/pb
+        [321311, 321313], # HLT_OldMu100_v3, 87.325/pb
+        [321393, 321393], # HLT_OldMu100_v3, 49.689/pb
+        [321396, 321397], # HLT_OldMu100_v3, 417.281/pb
+        [321414, 321415], # HLT_OldMu100_v3, 523.015/pb
+        [321431, 321434], # HLT_OldMu100_v3, 296.1/pb
+        [321436, 321436], # HLT_OldMu100_v3, 138.442/pb
+        [321457, 321457], # HLT_OldMu100_v3, 482.762/pb
+        [321461, 321461], # HLT_OldMu100_v3, 21.013/pb
+        [321475, 321475], # HLT_OldMu100_v3, 471.913/pb
+        [321710, 321710], # HLT_OldMu100_v3, 17.235/pb
+        [321712, 321712], # HLT_OldMu100_v3, 84.378/pb
+        [321730, 321730], # HLT_OldMu100_v3, 102.671/pb
+        [321732, 321732], # HLT_OldMu100_v3, 344.692/pb
+        [321735, 321735], # HLT_OldMu100_v3, 23.661/pb
+        [321755, 321755], # HLT_OldMu100_v3, 213.438/pb
+        [321758, 321758], # HLT_OldMu100_v3, 37.518/pb
+        [321760, 321760], # HLT_OldMu100_v3, 146.153/pb
+        [321773, 321778], # HLT_OldMu100_v3, 174.569/pb
+        [321780, 321781], # HLT_OldMu100_v3, 181.684/pb
+        [321813, 321813], # HLT_OldMu100_v3, 120.244/pb
+        [321815, 321815], # HLT_OldMu100_v3, 5.12/pb
+        [321817, 321818], # HLT_OldMu100_v3, 286.489/pb
+        [321820, 321820], # HLT_OldMu100_v3, 32.069/pb
+        [321831, 321834], # HLT_OldMu100_v3, 488.005/pb
+        [321879, 321880], # HLT_OldMu100_v3, 131.546/pb
+        [321887, 321887], # HLT_OldMu100_v3, 276.941/pb
+        [321908, 321909], # HLT_OldMu100_v3, 485.884/pb
+        [321917, 321917], # HLT_OldMu100_v3, 261.22/pb
+        [321919, 321919], # HLT_OldMu100_v3, 1.489/pb
+        [321933, 321933], # HLT_OldMu100_v3, 101.007/pb
+        [321960, 321961], # HLT_OldMu100_v3, 139.431/pb
+        [321973, 321973], # HLT_OldMu100_v3, 358.667/pb
+        [321975, 321975], # HLT_OldMu100_v3, 145.784/pb
+        [321988, 321988], # HLT_OldMu100_v3, 384.022/pb
+        [321990, 321990], # HLT_OldMu100_v3, 81.032/pb
+        [322013, 322014], # HLT_OldMu100_v3, 7.816/pb
+        [322022, 322022], # HLT_OldMu100_v3, 452.969/pb
+        [322040, 322040], # HLT_OldMu100_v3, 13.692/pb
+        [322057, 322057], # HLT_OldMu100_v3, 8.235/pb
+        [322068, 322068], # HLT_OldMu100_v3, 232.599/pb
+        [322079, 322079], # HLT_OldMu100_v3, 140.245/pb
+        [322106, 322106], # HLT_OldMu100_v3, 281.859/pb
+        [322113, 322113], # HLT_OldMu100_v3, 40.79/pb
+        [322118, 322118], # HLT_OldMu100_v3, 268.229/pb
+        [322179, 322179], # HLT_OldMu100_v3, 469.75/pb
+        [322201, 322201], # HLT_OldMu100_v3, 84.335/pb
+        [322204, 322204], # HLT_OldMu100_v3, 311.166/pb
+        [322222, 322222], # HLT_OldMu100_v3, 92.744/pb
+        [322252, 322252], # HLT_OldMu100_v3, 420.358/pb
+        [322317, 322317], # HLT_OldMu100_v3, 19.246/pb
+        [322319, 322319], # HLT_OldMu100_v3, 55.502/pb
+        [322322, 322322], # HLT_OldMu100_v3, 292.464/pb
+        [322324, 322324], # HLT_OldMu100_v3, 69.26/pb
+        [322332, 322332], # HLT_OldMu100_v3, 313.996/pb
+        [322348, 322348], # HLT_OldMu100_v3, 414.112/pb
+        [322355, 322356], # HLT_OldMu100_v3, 268.46/pb
+        [322381, 322381], # HLT_OldMu100_v3, 178.73/pb
+        [322407, 322407], # HLT_OldMu100_v3, 169.958/pb
+        [322430, 322431], # HLT_OldMu100_v3, 370.371/pb
+        [322480, 322480], # HLT_OldMu100_v3, 109.337/pb
+        [322492, 322492], # HLT_OldMu100_v3, 287.515/pb
+        [322510, 322510], # HLT_OldMu100_v3, 2.229/pb
+        [322599, 322599], # HLT_OldMu100_v3, 94.351/pb
+        [322602, 322603], # HLT_OldMu100_v3, 26.803/pb
+        [322605, 322605], # HLT_OldMu100_v3, 89.624/pb
+        [322617, 322617], # HLT_OldMu100_v3, 136.646/pb
+        [322625, 322625], # HLT_OldMu100_v3, 335.273/pb
+        [322633, 322633], # HLT_OldMu100_v3, 50.946/pb
+        [323414, 323414], # HLT_OldMu100_v3, 6.204/pb
+        [323423, 323423], # HLT_OldMu100_v3, 21.037/pb
+        [323470, 323475], # HLT_OldMu100_v3, 321.533/pb
+        [323487, 323488], # HLT_OldMu100_v3, 340.364/pb
+        [323492, 323493], # HLT_OldMu100_v3, 33.198/pb
+        [323495, 323495], # HLT_OldMu100_v3, 32.347/pb
+        [323524, 323526], # HLT_OldMu100_v3, 480.533/pb
+        [323693, 323693], # HLT_OldMu100_v3, 40.083/pb
+        [323696, 323696], # HLT_OldMu100_v3, 88.848/pb
+        [323702, 323702], # HLT_OldMu100_v3, 145.958/pb
+        [323725, 323727], # HLT_OldMu100_v3, 380.043/pb
+        [323755, 323755], # HLT_OldMu100_v3, 296.639/pb
+        [323775, 323775], # HLT_OldMu100_v3, 46.768/pb
+        [323778, 323778], # HLT_OldMu100_v3, 270.936/pb
+        [323790, 323790], # HLT_OldMu100_v3, 276.737/pb
+        [323794, 323794], # HLT_OldMu100_v3, 16.057/pb
+        [323841, 323841], # HLT_OldMu100_v3, 155.038/pb
+        [323857, 323857], # HLT_OldMu100_v3, 95.513/pb
+        [323940, 323940], # HLT_OldMu100_v3, 426.706/pb
+        [323954, 323954], # HLT_OldMu100_v3, 15.141/pb
+        [323976, 323976], # HLT_OldMu100_v3, 14.399/pb
+        [323978, 323978], # HLT_OldMu100_v3, 21.952/pb
+        [323980, 323980], # HLT_OldMu100_v3, 67.732/pb
+        [323983, 323983], # HLT_OldMu100_v3, 56.791/pb
+        [323997, 323997], # HLT_OldMu100_v3, 128.792/pb
+        [324021, 324022], # HLT_OldMu100_v3, 380.271/pb
+        [324077, 324077], # HLT_OldMu100_v3, 242.583/pb
+        [324201, 324202], # HLT_OldMu100_v3, 402.099/pb
+        [324205, 324207], # HLT_OldMu100_v3, 44.541/pb
+        [324209, 324209], # HLT_OldMu100_v3, 16.079/pb
+        [324237, 324237], # HLT_OldMu100_v3, 74.992/pb
+        [324245, 324245], # HLT_OldMu100_v3, 417.199/pb
+        [324293, 324293], # HLT_OldMu100_v3, 513.035/pb
+        [324315, 324315], # HLT_OldMu100_v3, 70.437/pb
+        [324318, 324318], # HLT_OldMu100_v3, 99.84/pb
+        [324420, 324420], # HLT_OldMu100_v3, 199.727/pb
+        [324729, 324729], # HLT_OldMu100_v3, 14.797/pb
+        [324747, 324747], # HLT_OldMu100_v3, 308.246/pb
+        [324764, 324765], # HLT_OldMu100_v3, 117.745/pb
+        [324769, 324769], # HLT_OldMu100_v3, 46.77/pb
+        [324772, 324772], # HLT_OldMu100_v3, 18.783/pb
+        [324785, 324785], # HLT_OldMu100_v3, 185.798/pb
+        [324791, 324791], # HLT_OldMu100_v3, 245.007/pb
+        [324835, 324835], # HLT_OldMu100_v3, 85.856/pb
+        [324840, 324841], # HLT_OldMu100_v3, 328.73/pb
+        [324846, 324846], # HLT_OldMu100_v3, 68.553/pb
+        [324878, 324878], # HLT_OldMu100_v3, 403.017/pb
+        [324897, 324897], # HLT_OldMu100_v3, 50.229/pb
+        [324970, 324970], # HLT_OldMu100_v3, 479.466/pb
+        [324980, 324980], # HLT_OldMu100_v3, 513.295/pb
+        [324997, 325001], # HLT_OldMu100_v3, 370.507/pb
+        [325022, 325022], # HLT_OldMu100_v3, 433.386/pb
+        [325057, 325057], # HLT_OldMu100_v3, 120.048/pb
+        [325097, 325101], # HLT_OldMu100_v3, 351.717/pb
+        [325110, 325110], # HLT_OldMu100_v3, 3.259/pb
+        [325117, 325117], # HLT_OldMu100_v3, 85.217/pb
+        [325159, 325159], # HLT_OldMu100_v3, 61.44/pb
+        [325168, 325170], # HLT_OldMu100_v3, 273.009/pb
+        [325172, 325172], # HLT_OldMu100_v3, 67.636/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_TkMu100',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_TkMu100_v2, 7.929/pb
+        [315259, 315259], # HLT_TkMu100_v2, 13.919/pb
+        [315264, 315265], # HLT_TkMu100_v2, 46.158/pb
+        [315267, 315267], # HLT_TkMu100_v2, 37.143/pb
+        [315270, 315270], # HLT_TkMu100_v2, 78.981/pb
+        [315322, 315322], # HLT_TkMu100_v2, 180.063/pb
+        [315339, 315339], # HLT_TkMu100_v2, 93.349/pb
+        [315357, 315357], # HLT_TkMu100_v2, 151.931/pb
+        [315361, 315361], # HLT_TkMu100_v2, 118.532/pb
+        [315363, 315363], # HLT_TkMu100_v2, 14.489/pb
+        [315366, 315366], # HLT_TkMu100_v2, 100.183/pb
+        [315420, 315420], # HLT_TkMu100_v2, 258.566/pb
+        [315488, 315490], # HLT_TkMu100_v2, 296.522/pb
+        [315506, 315506], # HLT_TkMu100_v2, 27.983/pb
+        [315510, 315510], # HLT_TkMu100_v2, 103.172/pb
+        [315512, 315512], # HLT_TkMu100_v2, 236.871/pb
+        [315543, 315543], # HLT_TkMu100_v2, 36.886/pb
+        [315555, 315557], # HLT_TkMu100_v2, 114.498/pb
+        [315640, 315642], # HLT_TkMu100_v2, 43.181/pb
+        [315644, 315648], # HLT_TkMu100_v2, 439.459/pb
+        [315689, 315690], # HLT_TkMu100_v2, 448.961/pb
+        [315702, 315705], # HLT_TkMu100_v2, 328.569/pb
+        [315713, 315713], # HLT_TkMu100_v2, 353.735/pb
+        [315721, 315721], # HLT_TkMu100_v2, 210.579/pb
+        [315741, 315741], # HLT_TkMu100_v2, 23.717/pb
+        [315764, 315764], # HLT_TkMu100_v2, 114.011/pb
+        [315770, 315770], # HLT_TkMu100_v2, 121.796/pb
+        [315784, 315786], # HLT_TkMu100_v2, 179.651/pb
+        [315790, 315790], # HLT_TkMu100_v2, 173.124/pb
+        [315800, 315801], # HLT_TkMu100_v2, 304.75/pb
+        [315840, 315840], # HLT_TkMu100_v2, 354.111/pb
+        [315973, 315974], # HLT_TkMu100_v2, 297.118/pb
+        [316058, 316062], # HLT_TkMu100_v2, 512.949/pb
+        [316082, 316082], # HLT_TkMu100_v2, 141.36/pb
+        [316110, 316111], # HLT_TkMu100_v2, 97.131/pb
+        [316113, 316114], # HLT_TkMu100_v2, 388.486/pb
+        [316153, 316153], # HLT_TkMu100_v2, 256.24/pb
+        [316186, 316187], # HLT_TkMu100_v2, 527.582/pb
+        [316199, 316202], # HLT_TkMu100_v2, 589.387/pb
+        [316216, 316219], # HLT_TkMu100_v2, 551.849/pb
+        [316239, 316241], # HLT_TkMu100_v2, 546.196/pb
+        [316271, 316271], # HLT_TkMu100_v2, 29.698/pb
+        [316361, 316363], # HLT_TkMu100_v2, 84.941/pb
+        [316377, 316380], # HLT_TkMu100_v2, 188.825/pb
+        [316455, 316455], # HLT_TkMu100_v2, 9.607/pb
+        [316457, 316457], # HLT_TkMu100_v2, 326.273/pb
+        [316469, 316470], # HLT_TkMu100_v2, 265.747/pb
+        [316472, 316472], # HLT_TkMu100_v2, 66.237/pb
+        [316505, 316505], # HLT_TkMu100_v2, 401.22/pb
+        [316569, 316569], # HLT_TkMu100_v2, 485.569/pb
+        [316590, 316590], # HLT_TkMu100_v2, 189.247/pb
+        [316613, 316613], # HLT_TkMu100_v2, 31.466/pb
+        [316615, 316615], # HLT_TkMu100_v2, 49.127/pb
+        [316666, 316667], # HLT_TkMu100_v2, 321.521/pb
+        [316700, 316702], # HLT_TkMu100_v2, 353.699/pb
+        [316715, 316723], # HLT_TkMu100_v2, 440.225/pb
+        [316758, 316758], # HLT_TkMu100_v2, 455.683/pb
+        [316766, 316766], # HLT_TkMu100_v2, 561.053/pb
+        [316876, 316877], # HLT_TkMu100_v2, 327.431/pb
+        [316879, 316879], # HLT_TkMu100_v2, 36.513/pb
+        [316928, 316928], # HLT_TkMu100_v2, 44.417/pb
+        [316985, 316985], # HLT_TkMu100_v2, 172.546/pb
+        [316993, 316995], # HLT_TkMu100_v2, 265.445/pb
+        [317080, 317080], # HLT_TkMu100_v2, 7.844/pb
+        [317087, 317087], # HLT_TkMu100_v2, 243.2/pb
+        [317089, 317089], # HLT_TkMu100_v2, 212.905/pb
+        [317182, 317182], # HLT_TkMu100_v2, 406.207/pb
+        [317212, 317213], # HLT_TkMu100_v2, 176.661/pb
+        [317279, 317279], # HLT_TkMu100_v2, 65.892/pb
+        [317291, 317292], # HLT_TkMu100_v2, 359.036/pb
+        [317297, 317297], # HLT_TkMu100_v2, 123.799/pb
+        [317319, 317320], # HLT_TkMu100_v2, 514.282/pb
+        [317338, 317340], # HLT_TkMu100_v2, 219.977/pb
+        [317382, 317383], # HLT_TkMu100_v2, 46.591/pb
+        [317391, 317392], # HLT_TkMu100_v2, 493.374/pb
+        [317435, 317435], # HLT_TkMu100_v2, 360.613/pb
+        [317438, 317438], # HLT_TkMu100_v2, 49.71/pb
+        [317475, 317475], # HLT_TkMu100_v2, 25.761/pb
+        [317478, 317478], # HLT_TkMu100_v2, 7.937/pb
+        [317484, 317484], # HLT_TkMu100_v2, 160.356/pb
+        [317488, 317488], # HLT_TkMu100_v2, 181.128/pb
+        [317527, 317527], # HLT_TkMu100_v2, 452.099/pb
+        [317591, 317591], # HLT_TkMu100_v2, 111.117/pb
+        [317626, 317626], # HLT_TkMu100_v2, 528.94/pb
+        [317640, 317641], # HLT_TkMu100_v2, 529.494/pb
+        [317648, 317650], # HLT_TkMu100_v2, 483.09/pb
+        [317661, 317661], # HLT_TkMu100_v2, 375.651/pb
+        [317663, 317663], # HLT_TkMu100_v2, 153.301/pb
+        [317683, 317683], # HLT_TkMu100_v2, 117.852/pb
+        [317696, 317696], # HLT_TkMu100_v2, 228.787/pb
+        [318733, 318733], # HLT_TkMu100_v2, 2.792/pb
+        [318828, 318828], # HLT_TkMu100_v2, 13.229/pb
+        [318872, 318872], # HLT_TkMu100_v2, 91.855/pb
+        [318874, 318874], # HLT_TkMu100_v2, 99.565/pb
+        [318876, 318877], # HLT_TkMu100_v2, 207.136/pb
+        [319077, 319077], # HLT_TkMu100_v2, 16.372/pb
+        [319337, 319337], # HLT_TkMu100_v2, 232.389/pb
+        [319347, 319349], # HLT_TkMu100_v2, 256.706/pb
+        [319449, 319450], # HLT_TkMu100_v2, 456.219/pb
+        [319456, 319456], # HLT_TkMu100_v2, 52.016/pb
+        [319459, 319459], # HLT_TkMu100_v2, 17.212/pb
+        [319486, 319486], # HLT_TkMu100_v2, 20.315/pb
+        [319503, 319503], # HLT_TkMu100_v2, 90.959/pb
+        [319524, 319524], # HLT_TkMu100_v2, 456.701/pb
+        [319526, 319526], # HLT_TkMu100_v2, 69.66/pb
+        [319528, 319528], # HLT_TkMu100_v2, 58.411/pb
+        [319579, 319579], # HLT_TkMu100_v2, 818.49/pb
+        [319625, 319625], # HLT_TkMu100_v2, 70.596/pb
+        [319639, 319639], # HLT_TkMu100_v2, 409.34/pb
+        [319656, 319659], # HLT_TkMu100_v2, 221.8/pb
+        [319678, 319678], # HLT_TkMu100_v2, 95.425/pb
+        [319687, 319687], # HLT_TkMu100_v2, 16.053/pb
+        [319697, 319698], # HLT_TkMu100_v2, 96.857/pb
+        [319756, 319756], # HLT_TkMu100_v2, 490.205/pb
+        [319840, 319841], # HLT_TkMu100_v2, 69.999/pb
+        [319847, 319849], # HLT_TkMu100_v2, 193.537/pb
+        [319851, 319851], # HLT_TkMu100_v2, 1.137/pb
+        [319853, 319854], # HLT_TkMu100_v2, 124.92/pb
+        [319908, 319910], # HLT_TkMu100_v2, 324.281/pb
+        [319912, 319915], # HLT_TkMu100_v2, 119.686/pb
+        [319941, 319942], # HLT_TkMu100_v2, 111.886/pb
+        [319950, 319950], # HLT_TkMu100_v2, 65.936/pb
+        [319991, 319993], # HLT_TkMu100_v2, 530.374/pb
+        [320002, 320002], # HLT_TkMu100_v2, 50.203/pb
+        [320006, 320006], # HLT_TkMu100_v2, 114.14/pb
+        [320010, 320012], # HLT_TkMu100_v2, 153.875/pb
+        [320023, 320026], # HLT_TkMu100_v2, 305.475/pb
+        [320038, 320040], # HLT_TkMu100_v2, 404.341/pb
+        [320059, 320065], # HLT_TkMu100_v2, 395.979/pb
+        [320673, 320674], # HLT_TkMu100_v2, 98.341/pb
+        [320688, 320688], # HLT_TkMu100_v2, 130.855/pb
+        [320712, 320712], # HLT_TkMu100_v2, 69.58/pb
+        [320757, 320757], # HLT_TkMu100_v2, 116.684/pb
+        [320804, 320804], # HLT_TkMu100_v2, 319.033/pb
+        [320807, 320807], # HLT_TkMu100_v2, 0.348/pb
+        [320809, 320809], # HLT_TkMu100_v2, 106.231/pb
+        [320821, 320824], # HLT_TkMu100_v2, 454.293/pb
+        [320838, 320838], # HLT_TkMu100_v2, 92.366/pb
+        [320840, 320841], # HLT_TkMu100_v2, 191.511/pb
+        [320853, 320859], # HLT_TkMu100_v2, 433.068/pb
+        [320887, 320888], # HLT_TkMu100_v2, 113.862/pb
+        [320916, 320917], # HLT_TkMu100_v2, 484.437/pb
+        [320920, 320920], # HLT_TkMu100_v2, 24.013/pb
+        [320933, 320934], # HLT_TkMu100_v2, 262.426/pb
+        [320936, 320936], # HLT_TkMu100_v2, 78.32/pb
+        [320941, 320941], # HLT_TkMu100_v2, 15.638/pb
+        [320980, 320980], # HLT_TkMu100_v2, 38.408/pb
+        [320995, 320996], # HLT_TkMu100_v2, 74.084/pb
+        [321004, 321007], # HLT_TkMu100_v2, 320.57/pb
+        [321009, 321012], # HLT_TkMu100_v2, 105.863/pb
+        [321051, 321051], # HLT_TkMu100_v2, 311.577/pb
+        [321055, 321055], # HLT_TkMu100_v2, 125.495/pb
+        [321067, 321069], # HLT_TkMu100_v2, 369.401/pb
+        [321119, 321119], # HLT_TkMu100_v2, 58.668/pb
+        [321121, 321122], # HLT_TkMu100_v2, 136.178/pb
+        [321124, 321124], # HLT_TkMu100_v2, 185.308/pb
+        [321126, 321126], # HLT_TkMu100_v2, 78.957/pb
+        [321134, 321134], # HLT_TkMu100_v2, 8.164/pb
+        [321138, 321138], # HLT_TkMu100_v2, 141.977/pb
+        [321140, 321140], # HLT_TkMu100_v2, 116.949/pb
+        [321149, 321149], # HLT_TkMu100_v2, 434.675/pb
+        [321165, 321167], # HLT_TkMu100_v2, 277.898/pb
+        [321177, 321178], # HLT_TkMu100_v2, 174.709/pb
+        [321218, 321219], # HLT_TkMu100_v2, 463.69/pb
+        [321221, 321221], # HLT_TkMu100_v2, 5.906/pb
+        [321230, 321233], # HLT_TkMu100_v2, 275.104/pb
+        [321262, 321262], # HLT_TkMu100_v2, 1.669/pb
+        [321283, 321283], # HLT_TkMu100_v2, 119.781/pb
+        [321294, 321296], # HLT_TkMu100_v2, 233.977/pb
+        [321305, 321305], # HLT_TkMu100_v2, 601.905/pb
+        [321311, 321313], # HLT_TkMu100_v2, 87.325/pb
+        [321393, 321393], # HLT_TkMu100_v2, 49.689/pb
+        [321396, 321397], # HLT_TkMu100_v2, 417.281/pb
+        [321414, 321415], # HLT_TkMu100_v2, 523.015/pb
+        [321431, 321434], # HLT_TkMu100_v2, 296.1/pb
+        [321436, 321436], # HLT_TkMu100_v2, 138.442/pb
+        [321457, 321457], # HLT_TkMu100_v2, 482.762/pb
+        [321461, 321461], # HLT_TkMu100_v2, 21.013/pb
+        [321475, 321475], # HLT_TkMu100_v2, 471.913/pb
+        [321710, 321710], # HLT_TkMu100_v2, 17.235/pb
+        [321712, 321712], # HLT_TkMu100_v2, 84.378/pb
+        [321730, 321730], # HLT_TkMu100_v2, 102.671/pb
+        [321732, 321732], # HLT_TkMu100_v2, 344.692/pb
+        [321735, 321735], # HLT_TkMu100_v2, 23.661/pb
+        [321755, 321755], # HLT_TkMu100_v2, 213.438/pb
+        [321758, 321758], # HLT_TkMu100_v2, 37.518/pb
+        [321760, 321760], # HLT_TkMu100_v2, 146.153/pb
+        [321773, 321778], # HLT_TkMu100_v2, 174.569/pb
+        [321780, 321781], # HLT_TkMu100_v2, 181.684/pb
+        [321813, 321813], # HLT_TkMu100_v2, 120.244/pb
+        [321815, 321815], # HLT_TkMu100_v2, 5.12/pb
+        [321817, 321818], # HLT_TkMu100_v2, 286.489/pb
+        [321820, 321820], # HLT_TkMu100_v2, 32.069/pb
+        [321831, 321834], # HLT_TkMu100_v2, 488.005/pb
+        [321879, 321880], # HLT_TkMu100_v2, 131.546/pb
+        [321887, 321887], # HLT_TkMu100_v2, 276.941/pb
+        [321908, 321909], # HLT_TkMu100_v2, 485.884/pb
+        [321917, 321917], # HLT_TkMu100_v2, 261.22/pb
+        [321919, 321919], # HLT_TkMu100_v2, 1.489/pb
+        [321933, 321933], # HLT_TkMu100_v2, 101.007/pb
+        [321960, 321961], # HLT_TkMu100_v2, 139.431/pb
+        [321973, 321973], # HLT_TkMu100_v2, 358.667/pb
+        [321975, 321975], # HLT_TkMu100_v2, 145.784/pb
+        [321988, 321988], # HLT_TkMu100_v2, 384.022/pb
+        [321990, 321990], # HLT_TkMu100_v2, 81.032/pb
+        [322013, 322014], # HLT_TkMu100_v2, 7.816/pb
+        [322022, 322022], # HLT_TkMu100_v2, 452.969/pb
+        [322040, 322040], # HLT_TkMu100_v2, 13.692/pb
+        [322057, 322057], # HLT_TkMu100_v2, 8.235/pb
+        [322068, 322068], # HLT_TkMu100_v2, 232.599/pb
+        [322079, 322079], # HLT_TkMu100_v2, 140.245/pb
+        [322106, 322106], # HLT_TkMu100_v2, 281.859/pb
+        [322113, 322113], # HLT_TkMu100_v2, 40.79/pb
+        [322118, 322118], # HLT_TkMu100_v2, 268.229/pb
+        [322179, 322179], # HLT_TkMu100_v2, 469.75/pb
+        [322201, 322201], # HLT_TkMu100_v2, 84.335/pb
+        [322204, 322204], # HLT_TkMu100_v2, 311.166/pb
+        [322222, 322222], # HLT_TkMu100_v2, 92.744/pb
+        [322252, 322252], # HLT_TkMu100_v2, 420.358/pb
+        [322317, 322317], # HLT_TkMu100_v2, 19.246/pb
+        [322319, 322319], # HLT_TkMu100_v2, 55.502/pb
+        [322322, 322322], # HLT_TkMu100_v2, 292.464/pb
+        [322324, 322324], # HLT_TkMu100_v2, 69.26/pb
+        [322332, 322332], # HLT_TkMu100_v2, 313.996/pb
+        [322348, 322348], # HLT_TkMu100_v2, 414.112/pb
+        [322355, 322356], # HLT_TkMu100_v2, 268.46/pb
+        [322381, 322381], # HLT_TkMu100_v2, 178.73/pb
+        [322407, 322407], # HLT_TkMu100_v2, 169.958/pb
+        [322430, 322431], # HLT_TkMu100_v2, 370.371/pb
+        [322480, 322480], # HLT_TkMu100_v2, 109.337/pb
+        [322492, 322492], # HLT_TkMu100_v2, 287.515/pb
+        [322510, 322510], # HLT_TkMu100_v2, 2.229/pb
+        [322599, 322599], # HLT_TkMu100_v2, 94.351/pb
+        [322602, 322603], # HLT_TkMu100_v2, 26.803/pb
+        [322605, 322605], # HLT_TkMu100_v2, 89.624/pb
+        [322617, 322617], # HLT_TkMu100_v2, 136.646/pb
+        [322625, 322625], # HLT_TkMu100_v2, 335.273/pb
+        [322633, 322633], # HLT_TkMu100_v2, 50.946/pb
+        [323414, 323414], # HLT_TkMu100_v2, 6.204/pb
+        [323423, 323423], # HLT_TkMu100_v2, 21.037/pb
+        [323470, 323475], # HLT_TkMu100_v2, 321.533/pb
+        [323487, 323488], # HLT_TkMu100_v2, 340.364/pb
+        [323492, 323493], # HLT_TkMu100_v2, 33.198/pb
+        [323495, 323495], # HLT_TkMu100_v2, 32.347/pb
+        [323524, 323526], # HLT_TkMu100_v2, 480.533/pb
+        [323693, 323693], # HLT_TkMu100_v2, 40.083/pb
+        [323696, 323696], # HLT_TkMu100_v2, 88.848/pb
+        [323702, 323702], # HLT_TkMu100_v2, 145.958/pb
+        [323725, 323727], # HLT_TkMu100_v2, 380.043/pb
+        [323755, 323755], # HLT_TkMu100_v2, 296.639/pb
+        [323775, 323775], # HLT_TkMu100_v2, 46.768/pb
+        [323778, 323778], # HLT_TkMu100_v2, 270.936/pb
+        [323790, 323790], # HLT_TkMu100_v2, 276.737/pb
+        [323794, 323794], # HLT_TkMu100_v2, 16.057/pb
+        [323841, 323841], # HLT_TkMu100_v2, 155.038/pb
+        [323857, 323857], # HLT_TkMu100_v2, 95.513/pb
+        [323940, 323940], # HLT_TkMu100_v2, 426.706/pb
+        [323954, 323954], # HLT_TkMu100_v2, 15.141/pb
+        [323976, 323976], # HLT_TkMu100_v2, 14.399/pb
+        [323978, 323978], # HLT_TkMu100_v2, 21.952/pb
+        [323980, 323980], # HLT_TkMu100_v2, 67.732/pb
+        [323983, 323983], # HLT_TkMu100_v2, 56.791/pb
+        [323997, 323997], # HLT_TkMu100_v2, 128.792/pb
+        [324021, 324022], # HLT_TkMu100_v2, 380.271/pb
+        [324077, 324077], # HLT_TkMu100_v2, 242.583/pb
+        [324201, 324202], # HLT_TkMu100_v2, 402.099/pb
+        [324205, 324207], # HLT_TkMu100_v2, 44.541/pb
+        [324209, 324209], # HLT_TkMu100_v2, 16.079/pb
+        [324237, 324237], # HLT_TkMu100_v2, 74.992/pb
+        [324245, 324245], # HLT_TkMu100_v2, 417.199/pb
+        [324293, 324293], # HLT_TkMu100_v2, 513.035/pb
+        [324315, 324315], # HLT_TkMu100_v2, 70.437/pb
+        [324318, 324318], # HLT_TkMu100_v2, 99.84/pb
+        [324420, 324420], # HLT_TkMu100_v2, 199.727/pb
+        [324729, 324729], # HLT_TkMu100_v2, 14.797/pb
+        [324747, 324747], # HLT_TkMu100_v2, 308.246/pb
+        [324764, 324765], # HLT_TkMu100_v2, 117.745/pb
+        [324769, 324769], # HLT_TkMu100_v2, 46.77/pb
+        [324772, 324772], # HLT_TkMu100_v2, 18.783/pb
+        [324785, 324785], # HLT_TkMu100_v2, 185.798/pb
+        [324791, 324791], # HLT_TkMu100_v2, 245.007/pb
+        [324835, 324835], # HLT_TkMu100_v2, 85.856/pb
+        [324840, 324841], # HLT_TkMu100_v2, 328.73/pb
+        [324846, 324846], # HLT_TkMu100_v2, 68.553/pb
+        [324878, 324878], # HLT_TkMu100_v2, 403.017/pb
+        [324897, 324897], # HLT_TkMu100_v2, 50.229/pb
+        [324970, 324970], # HLT_TkMu100_v2, 479.466/pb
+        [324980, 324980], # HLT_TkMu100_v2, 513.295/pb
+        [324997, 325001], # HLT_TkMu100_v2, 370.507/pb
+        [325022, 325022], # HLT_TkMu100_v2, 433.386/pb
+        [325057, 325057], # HLT_TkMu100_v2, 120.048/pb
+        [325097, 325101], # HLT_TkMu100_v2, 351.717/pb
+        [325110, 325110], # HLT_TkMu100_v2, 3.259/pb
+        [325117, 325117], # HLT_TkMu100_v2, 85.217/pb
+        [325159, 325159], # HLT_TkMu100_v2, 61.44/pb
+        [325168, 325170], # HLT_TkMu100_v2, 273.009/pb
+        [325172, 325172], # HLT_TkMu100_v2, 67.636/pb
+      ],
+    },
+  ],
+  '1e' : [
+    {
+      'name'        : 'HLT_Ele32_WPTight_Gsf',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Ele32_WPTight_Gsf_v13, 7.929/pb
+        [315259, 315259], # HLT_Ele32_WPTight_Gsf_v13, 13.919/pb
+        [315264, 315265], # HLT_Ele32_WPTight_Gsf_v13, 46.158/pb
+        [315267, 315267], # HLT_Ele32_WPTight_Gsf_v13, 37.143/pb
+        [315270, 315270], # HLT_Ele32_WPTight_Gsf_v13, 78.981/pb
+        [315322, 315322], # HLT_Ele32_WPTight_Gsf_v13, 180.063/pb
+        [315339, 315339], # HLT_Ele32_WPTight_Gsf_v13, 93.349/pb
+        [315357, 315357], # HLT_Ele32_WPTight_Gsf_v13, 151.931/pb
+        [315361, 315361], # HLT_Ele32_WPTight_Gsf_v13, 118.532/pb
+        [315363, 315363], # HLT_Ele32_WPTight_Gsf_v13, 14.489/pb
+        [315366, 315366], # HLT_Ele32_WPTight_Gsf_v13, 100.183/pb
+        [315420, 315420], # HLT_Ele32_WPTight_Gsf_v13, 258.566/pb
+        [315488, 315490], # HLT_Ele32_WPTight_Gsf_v13, 296.522/pb
+        [315506, 315506], # HLT_Ele32_WPTight_Gsf_v13, 27.983/pb
+        [315510, 315510], # HLT_Ele32_WPTight_Gsf_v13, 103.172/pb
+        [315512, 315512], # HLT_Ele32_WPTight_Gsf_v13, 236.871/pb
+        [315543, 315543], # HLT_Ele32_WPTight_Gsf_v13, 36.886/pb
+        [315555, 315557], # HLT_Ele32_WPTight_Gsf_v13, 114.498/pb
+        [315640, 315642], # HLT_Ele32_WPTight_Gsf_v13, 43.181/pb
+        [315644, 315648], # HLT_Ele32_WPTight_Gsf_v13, 439.459/pb
+        [315689, 315690], # HLT_Ele32_WPTight_Gsf_v13, 448.961/pb
+        [315702, 315705], # HLT_Ele32_WPTight_Gsf_v13, 328.569/pb
+        [315713, 315713], # HLT_Ele32_WPTight_Gsf_v13, 353.735/pb
+        [315721, 315721], # HLT_Ele32_WPTight_Gsf_v13, 210.579/pb
+        [315741, 315741], # HLT_Ele32_WPTight_Gsf_v13, 23.717/pb
+        [315764, 315764], # HLT_Ele32_WPTight_Gsf_v13, 114.011/pb
+        [315770, 315770], # HLT_Ele32_WPTight_Gsf_v13, 121.796/pb
+        [315784, 315786], # HLT_Ele32_WPTight_Gsf_v13, 179.651/pb
+        [315790, 315790], # HLT_Ele32_WPTight_Gsf_v13, 173.124/pb
+        [315800, 315801], # HLT_Ele32_WPTight_Gsf_v13, 304.75/pb
+        [315840, 315840], # HLT_Ele32_WPTight_Gsf_v13, 354.111/pb
+        [315973, 315974], # HLT_Ele32_WPTight_Gsf_v13/HLT_Ele32_WPTight_Gsf_v14, 297.118/pb
+        [316058, 316062], # HLT_Ele32_WPTight_Gsf_v14, 512.949/pb
+        [316082, 316082], # HLT_Ele32_WPTight_Gsf_v14, 141.36/pb
+        [316110, 316111], # HLT_Ele32_WPTight_Gsf_v14, 97.131/pb
+        [316113, 316114], # HLT_Ele32_WPTight_Gsf_v14, 388.486/pb
+        [316153, 316153], # HLT_Ele32_WPTight_Gsf_v14, 256.24/pb
+        [316186, 316187], # HLT_Ele32_WPTight_Gsf_v14, 527.582/pb
+        [316199, 316202], # HLT_Ele32_WPTight_Gsf_v14, 589.387/pb
+        [316216, 316219], # HLT_Ele32_WPTight_Gsf_v14, 551.849/pb
+        [316239, 316241], # HLT_Ele32_WPTight_Gsf_v14, 546.196/pb
+        [316271, 316271], # HLT_Ele32_WPTight_Gsf_v14, 29.698/pb
+        [316361, 316363], # HLT_Ele32_WPTight_Gsf_v15, 84.941/pb
+        [316377, 316380], # HLT_Ele32_WPTight_Gsf_v15, 188.825/pb
+        [316455, 316455], # HLT_Ele32_WPTight_Gsf_v15, 9.607/pb
+        [316457, 316457], # HLT_Ele32_WPTight_Gsf_v15, 326.273/pb
+        [316469, 316470], # HLT_Ele32_WPTight_Gsf_v15, 265.747/pb
+        [316472, 316472], # HLT_Ele32_WPTight_Gsf_v15, 66.237/pb
+        [316505, 316505], # HLT_Ele32_WPTight_Gsf_v15, 401.22/pb
+        [316569, 316569], # HLT_Ele32_WPTight_Gsf_v15, 485.569/pb
+        [316590, 316590], # HLT_Ele32_WPTight_Gsf_v15, 189.247/pb
+        [316613, 316613], # HLT_Ele32_WPTight_Gsf_v15, 31.466/pb
+        [316615, 316615], # HLT_Ele32_WPTight_Gsf_v15, 49.127/pb
+        [316666, 316667], # HLT_Ele32_WPTight_Gsf_v15, 321.521/pb
+        [316700, 316702], # HLT_Ele32_WPTight_Gsf_v15, 353.699/pb
+        [316715, 316723], # HLT_Ele32_WPTight_Gsf_v15, 440.225/pb
+        [316758, 316758], # HLT_Ele32_WPTight_Gsf_v15, 455.683/pb
+        [316766, 316766], # HLT_Ele32_WPTight_Gsf_v15, 561.053/pb
+        [316876, 316877], # HLT_Ele32_WPTight_Gsf_v15, 327.431/pb
+        [316879, 316879], # HLT_Ele32_WPTight_Gsf_v15, 36.513/pb
+        [316928, 316928], # HLT_Ele32_WPTight_Gsf_v15, 44.417/pb
+        [316985, 316985], # HLT_Ele32_WPTight_Gsf_v15, 172.546/pb
+        [316993, 316995], # HLT_Ele32_WPTight_Gsf_v15, 265.445/pb
+        [317080, 317080], # HLT_Ele32_WPTight_Gsf_v15, 7.844/pb
+        [317087, 317087], # HLT_Ele32_WPTight_Gsf_v15, 243.2/pb
+        [317089, 317089], # HLT_Ele32_WPTight_Gsf_v15, 212.905/pb
+        [317182, 317182], # HLT_Ele32_WPTight_Gsf_v15, 406.207/pb
+        [317212, 317213], # HLT_Ele32_WPTight_Gsf_v15, 176.661/pb
+        [317279, 317279], # HLT_Ele32_WPTight_Gsf_v15, 65.892/pb
+        [317291, 317292], # HLT_Ele32_WPTight_Gsf_v15, 359.036/pb
+        [317297, 317297], # HLT_Ele32_WPTight_Gsf_v15, 123.799/pb
+        [317319, 317320], # HLT_Ele32_WPTight_Gsf_v15, 514.282/pb
+        [317338, 317340], # HLT_Ele32_WPTight_Gsf_v15, 219.977/pb
+        [317382, 317383], # HLT_Ele32_WPTight_Gsf_v15, 46.591/pb
+        [317391, 317392], # HLT_Ele32_WPTight_Gsf_v15, 493.374/pb
+        [317435, 317435], # HLT_Ele32_WPTight_Gsf_v15, 360.613/pb
+        [317438, 317438], # HLT_Ele32_WPTight_Gsf_v15, 49.71/pb
+        [317475, 317475], # HLT_Ele32_WPTight_Gsf_v15, 25.761/pb
+        [317478, 317478], # HLT_Ele32_WPTight_Gsf_v15, 7.937/pb
+        [317484, 317484], # HLT_Ele32_WPTight_Gsf_v15, 160.356/pb
+        [317488, 317488], # HLT_Ele32_WPTight_Gsf_v15, 181.128/pb
+        [317527, 317527], # HLT_Ele32_WPTight_Gsf_v15, 452.099/pb
+        [317591, 317591], # HLT_Ele32_WPTight_Gsf_v15, 111.117/pb
+        [317626, 317626], # HLT_Ele32_WPTight_Gsf_v15, 528.94/pb
+        [317640, 317641], # HLT_Ele32_WPTight_Gsf_v15, 529.494/pb
+        [317648, 317650], # HLT_Ele32_WPTight_Gsf_v15, 483.09/pb
+        [317661, 317661], # HLT_Ele32_WPTight_Gsf_v15, 375.651/pb
+        [317663, 317663], # HLT_Ele32_WPTight_Gsf_v15, 153.301/pb
+        [317683, 317683], # HLT_Ele32_WPTight_Gsf_v15, 117.852/pb
+        [317696, 317696], # HLT_Ele32_WPTight_Gsf_v15, 228.787/pb
+        [318733, 318733], # HLT_Ele32_WPTight_Gsf_v15, 2.792/pb
+        [318828, 318828], # HLT_Ele32_WPTight_Gsf_v15, 13.229/pb
+        [318872, 318872], # HLT_Ele32_WPTight_Gsf_v15, 91.855/pb
+        [318874, 318874], # HLT_Ele32_WPTight_Gsf_v15, 99.565/pb
+        [318876, 318877], # HLT_Ele32_WPTight_Gsf_v15, 207.136/pb
+        [319077, 319077], # HLT_Ele32_WPTight_Gsf_v15, 16.372/pb
+        [319337, 319337], # HLT_Ele32_WPTight_Gsf_v15, 232.389/pb
+        [319347, 319349], # HLT_Ele32_WPTight_Gsf_v15, 256.706/pb
+        [319449, 319450], # HLT_Ele32_WPTight_Gsf_v15, 456.219/pb
+        [319456, 319456], # HLT_Ele32_WPTight_Gsf_v15, 52.016/pb
+        [319459, 319459], # HLT_Ele32_WPTight_Gsf_v15, 17.212/pb
+        [319486, 319486], # HLT_Ele32_WPTight_Gsf_v15, 20.315/pb
+        [319503, 319503], # HLT_Ele32_WPTight_Gsf_v15, 90.959/pb
+        [319524, 319524], # HLT_Ele32_WPTight_Gsf_v15, 456.701/pb
+        [319526, 319526], # HLT_Ele32_WPTight_Gsf_v15, 69.66/pb
+        [319528, 319528], # HLT_Ele32_WPTight_Gsf_v15, 58.411/pb
+        [319579, 319579], # HLT_Ele32_WPTight_Gsf_v15, 818.49/pb
+        [319625, 319625], # HLT_Ele32_WPTight_Gsf_v15, 70.596/pb
+        [319639, 319639], # HLT_Ele32_WPTight_Gsf_v15, 409.34/pb
+        [319656, 319659], # HLT_Ele32_WPTight_Gsf_v15, 221.8/pb
+        [319678, 319678], # HLT_Ele32_WPTight_Gsf_v15, 95.425/pb
+        [319687, 319687], # HLT_Ele32_WPTight_Gsf_v15, 16.053/pb
+        [319697, 319698], # HLT_Ele32_WPTight_Gsf_v15, 96.857/pb
+        [319756, 319756], # HLT_Ele32_WPTight_Gsf_v15, 490.205/pb
+        [319840, 319841], # HLT_Ele32_WPTight_Gsf_v15, 69.999/pb
+        [319847, 319849], # HLT_Ele32_WPTight_Gsf_v15, 193.537/pb
+        [319851, 319851], # HLT_Ele32_WPTight_Gsf_v15, 1.137/pb
+        [319853, 319854], # HLT_Ele32_WPTight_Gsf_v15, 124.92/pb
+        [319908, 319910], # HLT_Ele32_WPTight_Gsf_v15, 324.281/pb
+        [319912, 319915], # HLT_Ele32_WPTight_Gsf_v15, 119.686/pb
+        [319941, 319942], # HLT_Ele32_WPTight_Gsf_v15, 111.886/pb
+        [319950, 319950], # HLT_Ele32_WPTight_Gsf_v15, 65.936/pb
+        [319991, 319993], # HLT_Ele32_WPTight_Gsf_v15, 530.374/pb
+        [320002, 320002], # HLT_Ele32_WPTight_Gsf_v15, 50.203/pb
+        [320006, 320006], # HLT_Ele32_WPTight_Gsf_v15, 114.14/pb
+        [320010, 320012], # HLT_Ele32_WPTight_Gsf_v15, 153.875/pb
+        [320023, 320026], # HLT_Ele32_WPTight_Gsf_v15, 305.475/pb
+        [320038, 320040], # HLT_Ele32_WPTight_Gsf_v15, 404.341/pb
+        [320059, 320065], # HLT_Ele32_WPTight_Gsf_v15, 395.979/pb
+        [320673, 320674], # HLT_Ele32_WPTight_Gsf_v15, 98.341/pb
+        [320688, 320688], # HLT_Ele32_WPTight_Gsf_v15, 130.855/pb
+        [320712, 320712], # HLT_Ele32_WPTight_Gsf_v15, 69.58/pb
+        [320757, 320757], # HLT_Ele32_WPTight_Gsf_v15, 116.684/pb
+        [320804, 320804], # HLT_Ele32_WPTight_Gsf_v15, 319.033/pb
+        [320807, 320807], # HLT_Ele32_WPTight_Gsf_v15, 0.348/pb
+        [320809, 320809], # HLT_Ele32_WPTight_Gsf_v15, 106.231/pb
+        [320821, 320824], # HLT_Ele32_WPTight_Gsf_v15, 454.293/pb
+        [320838, 320838], # HLT_Ele32_WPTight_Gsf_v15, 92.366/pb
+        [320840, 320841], # HLT_Ele32_WPTight_Gsf_v15, 191.511/pb
+        [320853, 320859], # HLT_Ele32_WPTight_Gsf_v15, 433.068/pb
+        [320887, 320888], # HLT_Ele32_WPTight_Gsf_v15, 113.862/pb
+        [320916, 320917], # HLT_Ele32_WPTight_Gsf_v15, 484.437/pb
+        [320920, 320920], # HLT_Ele32_WPTight_Gsf_v15, 24.013/pb
+        [320933, 320934], # HLT_Ele32_WPTight_Gsf_v15, 262.426/pb
+        [320936, 320936], # HLT_Ele32_WPTight_Gsf_v15, 78.32/pb
+        [320941, 320941], # HLT_Ele32_WPTight_Gsf_v15, 15.638/pb
+        [320980, 320980], # HLT_Ele32_WPTight_Gsf_v15, 38.408/pb
+        [320995, 320996], # HLT_Ele32_WPTight_Gsf_v15, 74.084/pb
+        [321004, 321007], # HLT_Ele32_WPTight_Gsf_v15, 320.57/pb
+        [321009, 321012], # HLT_Ele32_WPTight_Gsf_v15, 105.863/pb
+        [321051, 321051], # HLT_Ele32_WPTight_Gsf_v15, 311.577/pb
+        [321055, 321055], # HLT_Ele32_WPTight_Gsf_v15, 125.495/pb
+        [321067, 321069], # HLT_Ele32_WPTight_Gsf_v15, 369.401/pb
+        [321119, 321119], # HLT_Ele32_WPTight_Gsf_v15, 58.668/pb
+        [321121, 321122], # HLT_Ele32_WPTight_Gsf_v15, 136.178/pb
+        [321124, 321124], # HLT_Ele32_WPTight_Gsf_v15, 185.308/pb
+        [321126, 321126], # HLT_Ele32_WPTight_Gsf_v15, 78.957/pb
+        [321134, 321134], # HLT_Ele32_WPTight_Gsf_v15, 8.164/pb
+        [321138, 321138], # HLT_Ele32_WPTight_Gsf_v15, 141.977/pb
+        [321140, 321140], # HLT_Ele32_WPTight_Gsf_v15, 116.949/pb
+        [321149, 321149], # HLT_Ele32_WPTight_Gsf_v15, 434.675/pb
+        [321165, 321167], # HLT_Ele32_WPTight_Gsf_v15, 277.898/pb
+        [321177, 321178], # HLT_Ele32_WPTight_Gsf_v15, 174.709/pb
+        [321218, 321219], # HLT_Ele32_WPTight_Gsf_v15, 463.69/pb
+        [321221, 321221], # HLT_Ele32_WPTight_Gsf_v15, 5.906/pb
+        [321230, 321233], # HLT_Ele32_WPTight_Gsf_v15, 275.104/pb
+        [321262, 321262], # HLT_Ele32_WPTight_Gsf_v15, 1.669/pb
+        [321283, 321283], # HLT_Ele32_WPTight_Gsf_v15, 119.781/pb
+        [321294, 321296], # HLT_Ele32_WPTight_Gsf_v15, 233.977/pb
+        [321305, 321305], # HLT_Ele32_WPTight_Gsf_v15, 601.905/pb
+        [321311, 321313], # HLT_Ele32_WPTight_Gsf_v15, 87.325/pb
+        [321393, 321393], # HLT_Ele32_WPTight_Gsf_v15, 49.689/pb
+        [321396, 321397], # HLT_Ele32_WPTight_Gsf_v15, 417.281/pb
+        [321414, 321415], # HLT_Ele32_WPTight_Gsf_v15, 523.015/pb
+        [321431, 321434], # HLT_Ele32_WPTight_Gsf_v15, 296.1/pb
+        [321436, 321436], # HLT_Ele32_WPTight_Gsf_v15, 138.442/pb
+        [321457, 321457], # HLT_Ele32_WPTight_Gsf_v15, 482.762/pb
+        [321461, 321461], # HLT_Ele32_WPTight_Gsf_v15, 21.013/pb
+        [321475, 321475], # HLT_Ele32_WPTight_Gsf_v15, 471.913/pb
+        [321710, 321710], # HLT_Ele32_WPTight_Gsf_v15, 17.235/pb
+        [321712, 321712], # HLT_Ele32_WPTight_Gsf_v15, 84.378/pb
+        [321730, 321730], # HLT_Ele32_WPTight_Gsf_v15, 102.671/pb
+        [321732, 321732], # HLT_Ele32_WPTight_Gsf_v15, 344.692/pb
+        [321735, 321735], # HLT_Ele32_WPTight_Gsf_v15, 23.661/pb
+        [321755, 321755], # HLT_Ele32_WPTight_Gsf_v15, 213.438/pb
+        [321758, 321758], # HLT_Ele32_WPTight_Gsf_v15, 37.518/pb
+        [321760, 321760], # HLT_Ele32_WPTight_Gsf_v15, 146.153/pb
+        [321773, 321778], # HLT_Ele32_WPTight_Gsf_v15, 174.569/pb
+        [321780, 321781], # HLT_Ele32_WPTight_Gsf_v15, 181.684/pb
+        [321813, 321813], # HLT_Ele32_WPTight_Gsf_v15, 120.244/pb
+        [321815, 321815], # HLT_Ele32_WPTight_Gsf_v15, 5.12/pb
+        [321817, 321818], # HLT_Ele32_WPTight_Gsf_v15, 286.489/pb
+        [321820, 321820], # HLT_Ele32_WPTight_Gsf_v15, 32.069/pb
+        [321831, 321834], # HLT_Ele32_WPTight_Gsf_v15, 488.005/pb
+        [321879, 321880], # HLT_Ele32_WPTight_Gsf_v15, 131.546/pb
+        [321887, 321887], # HLT_Ele32_WPTight_Gsf_v15, 276.941/pb
+        [321908, 321909], # HLT_Ele32_WPTight_Gsf_v15, 485.884/pb
+        [321917, 321917], # HLT_Ele32_WPTight_Gsf_v15, 261.22/pb
+        [321919, 321919], # HLT_Ele32_WPTight_Gsf_v15, 1.489/pb
+        [321933, 321933], # HLT_Ele32_WPTight_Gsf_v15, 101.007/pb
+        [321960, 321961], # HLT_Ele32_WPTight_Gsf_v15, 139.431/pb
+        [321973, 321973], # HLT_Ele32_WPTight_Gsf_v15, 358.667/pb
+        [321975, 321975], # HLT_Ele32_WPTight_Gsf_v15, 145.784/pb
+        [321988, 321988], # HLT_Ele32_WPTight_Gsf_v15, 384.022/pb
+        [321990, 321990], # HLT_Ele32_WPTight_Gsf_v15, 81.032/pb
+        [322013, 322014], # HLT_Ele32_WPTight_Gsf_v15, 7.816/pb
+        [322022, 322022], # HLT_Ele32_WPTight_Gsf_v15, 452.969/pb
+        [322040, 322040], # HLT_Ele32_WPTight_Gsf_v15, 13.692/pb
+        [322057, 322057], # HLT_Ele32_WPTight_Gsf_v15, 8.235/pb
+        [322068, 322068], # HLT_Ele32_WPTight_Gsf_v15, 232.599/pb
+        [322079, 322079], # HLT_Ele32_WPTight_Gsf_v15, 140.245/pb
+        [322106, 322106], # HLT_Ele32_WPTight_Gsf_v15, 281.859/pb
+        [322113, 322113], # HLT_Ele32_WPTight_Gsf_v15, 40.79/pb
+        [322118, 322118], # HLT_Ele32_WPTight_Gsf_v15, 268.229/pb
+        [322179, 322179], # HLT_Ele32_WPTight_Gsf_v15, 469.75/pb
+        [322201, 322201], # HLT_Ele32_WPTight_Gsf_v15, 84.335/pb
+        [322204, 322204], # HLT_Ele32_WPTight_Gsf_v15, 311.166/pb
+        [322222, 322222], # HLT_Ele32_WPTight_Gsf_v15, 92.744/pb
+        [322252, 322252], # HLT_Ele32_WPTight_Gsf_v15, 420.358/pb
+        [322317, 322317], # HLT_Ele32_WPTight_Gsf_v15, 19.246/pb
+        [322319, 322319], # HLT_Ele32_WPTight_Gsf_v15, 55.502/pb
+        [322322, 322322], # HLT_Ele32_WPTight_Gsf_v15, 292.464/pb
+        [322324, 322324], # HLT_Ele32_WPTight_Gsf_v15, 69.26/pb
+        [322332, 322332], # HLT_Ele32_WPTight_Gsf_v15, 313.996/pb
+        [322348, 322348], # HLT_Ele32_WPTight_Gsf_v15, 414.112/pb
+        [322355, 322356], # HLT_Ele32_WPTight_Gsf_v15, 268.46/pb
+        [322381, 322381], # HLT_Ele32_WPTight_Gsf_v15, 178.73/pb
+        [322407, 322407], # HLT_Ele32_WPTight_Gsf_v15, 169.958/pb
+        [322430, 322431], # HLT_Ele32_WPTight_Gsf_v15, 370.371/pb
+        [322480, 322480], # HLT_Ele32_WPTight_Gsf_v15, 109.337/pb
+        [322492, 322492], # HLT_Ele32_WPTight_Gsf_v15, 287.515/pb
+        [322510, 322510], # HLT_Ele32_WPTight_Gsf_v15, 2.229/pb
+        [322599, 322599], # HLT_Ele32_WPTight_Gsf_v15, 94.351/pb
+        [322602, 322603], # HLT_Ele32_WPTight_Gsf_v15, 26.803/pb
+        [322605, 322605], # HLT_Ele32_WPTight_Gsf_v15, 89.624/pb
+        [322617, 322617], # HLT_Ele32_WPTight_Gsf_v15, 136.646/pb
+        [322625, 322625], # HLT_Ele32_WPTight_Gsf_v15, 335.273/pb
+        [322633, 322633], # HLT_Ele32_WPTight_Gsf_v15, 50.946/pb
+        [323414, 323414], # HLT_Ele32_WPTight_Gsf_v15, 6.204/pb
+        [323423, 323423], # HLT_Ele32_WPTight_Gsf_v15, 21.037/pb
+        [323470, 323475], # HLT_Ele32_WPTight_Gsf_v15, 321.533/pb
+        [323487, 323488], # HLT_Ele32_WPTight_Gsf_v15, 340.364/pb
+        [323492, 323493], # HLT_Ele32_WPTight_Gsf_v15, 33.198/pb
+        [323495, 323495], # HLT_Ele32_WPTight_Gsf_v15, 32.347/pb
+        [323524, 323526], # HLT_Ele32_WPTight_Gsf_v15, 480.533/pb
+        [323693, 323693], # HLT_Ele32_WPTight_Gsf_v15, 40.083/pb
+        [323696, 323696], # HLT_Ele32_WPTight_Gsf_v15, 88.848/pb
+        [323702, 323702], # HLT_Ele32_WPTight_Gsf_v15, 145.958/pb
+        [323725, 323727], # HLT_Ele32_WPTight_Gsf_v15, 380.043/pb
+        [323755, 323755], # HLT_Ele32_WPTight_Gsf_v15, 296.639/pb
+        [323775, 323775], # HLT_Ele32_WPTight_Gsf_v15, 46.768/pb
+        [323778, 323778], # HLT_Ele32_WPTight_Gsf_v15, 270.936/pb
+        [323790, 323790], # HLT_Ele32_WPTight_Gsf_v15, 276.737/pb
+        [323794, 323794], # HLT_Ele32_WPTight_Gsf_v15, 16.057/pb
+        [323841, 323841], # HLT_Ele32_WPTight_Gsf_v15, 155.038/pb
+        [323857, 323857], # HLT_Ele32_WPTight_Gsf_v15, 95.513/pb
+        [323940, 323940], # HLT_Ele32_WPTight_Gsf_v15, 426.706/pb
+        [323954, 323954], # HLT_Ele32_WPTight_Gsf_v15, 15.141/pb
+        [323976, 323976], # HLT_Ele32_WPTight_Gsf_v15, 14.399/pb
+        [323978, 323978], # HLT_Ele32_WPTight_Gsf_v15, 21.952/pb
+        [323980, 323980], # HLT_Ele32_WPTight_Gsf_v15, 67.732/pb
+        [323983, 323983], # HLT_Ele32_WPTight_Gsf_v15, 56.791/pb
+        [323997, 323997], # HLT_Ele32_WPTight_Gsf_v15, 128.792/pb
+        [324021, 324022], # HLT_Ele32_WPTight_Gsf_v15, 380.271/pb
+        [324077, 324077], # HLT_Ele32_WPTight_Gsf_v15, 242.583/pb
+        [324201, 324202], # HLT_Ele32_WPTight_Gsf_v15, 402.099/pb
+        [324205, 324207], # HLT_Ele32_WPTight_Gsf_v15, 44.541/pb
+        [324209, 324209], # HLT_Ele32_WPTight_Gsf_v15, 16.079/pb
+        [324237, 324237], # HLT_Ele32_WPTight_Gsf_v15, 74.992/pb
+        [324245, 324245], # HLT_Ele32_WPTight_Gsf_v15, 417.199/pb
+        [324293, 324293], # HLT_Ele32_WPTight_Gsf_v15, 513.035/pb
+        [324315, 324315], # HLT_Ele32_WPTight_Gsf_v15, 70.437/pb
+        [324318, 324318], # HLT_Ele32_WPTight_Gsf_v15, 99.84/pb
+        [324420, 324420], # HLT_Ele32_WPTight_Gsf_v15, 199.727/pb
+        [324729, 324729], # HLT_Ele32_WPTight_Gsf_v15, 14.797/pb
+        [324747, 324747], # HLT_Ele32_WPTight_Gsf_v15, 308.246/pb
+        [324764, 324765], # HLT_Ele32_WPTight_Gsf_v15, 117.745/pb
+        [324769, 324769], # HLT_Ele32_WPTight_Gsf_v15, 46.77/pb
+        [324772, 324772], # HLT_Ele32_WPTight_Gsf_v15, 18.783/pb
+        [324785, 324785], # HLT_Ele32_WPTight_Gsf_v15, 185.798/pb
+        [324791, 324791], # HLT_Ele32_WPTight_Gsf_v15, 245.007/pb
+        [324835, 324835], # HLT_Ele32_WPTight_Gsf_v15, 85.856/pb
+        [324840, 324841], # HLT_Ele32_WPTight_Gsf_v15, 328.73/pb
+        [324846, 324846], # HLT_Ele32_WPTight_Gsf_v15, 68.553/pb
+        [324878, 324878], # HLT_Ele32_WPTight_Gsf_v15, 403.017/pb
+        [324897, 324897], # HLT_Ele32_WPTight_Gsf_v15, 50.229/pb
+        [324970, 324970], # HLT_Ele32_WPTight_Gsf_v15, 479.466/pb
+        [324980, 324980], # HLT_Ele32_WPTight_Gsf_v15, 513.295/pb
+        [324997, 325001], # HLT_Ele32_WPTight_Gsf_v15, 370.507/pb
+        [325022, 325022], # HLT_Ele32_WPTight_Gsf_v15, 433.386/pb
+        [325057, 325057], # HLT_Ele32_WPTight_Gsf_v15, 120.048/pb
+        [325097, 325101], # HLT_Ele32_WPTight_Gsf_v15, 351.717/pb
+        [325110, 325110], # HLT_Ele32_WPTight_Gsf_v15, 3.259/pb
+        [325117, 325117], # HLT_Ele32_WPTight_Gsf_v15, 85.217/pb
+        [325159, 325159], # HLT_Ele32_WPTight_Gsf_v15, 61.44/pb
+        [325168, 325170], # HLT_Ele32_WPTight_Gsf_v15, 273.009/pb
+        [325172, 325172], # HLT_Ele32_WPTight_Gsf_v15, 67.636/pb
+      ],
+    },
+  ],
+  '1e_noiso' : [
+    {
+      'name'        : 'HLT_Ele115_CaloIdVT_GsfTrkIdT',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 7.929/pb
+        [315259, 315259], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 13.919/pb
+        [315264, 315265], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 46.158/pb
+        [315267, 315267], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 37.143/pb
+        [315270, 315270], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 78.981/pb
+        [315322, 315322], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 180.063/pb
+        [315339, 315339], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 93.349/pb
+        [315357, 315357], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 151.931/pb
+        [315361, 315361], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 118.532/pb
+        [315363, 315363], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 14.489/pb
+        [315366, 315366], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 100.183/pb
+        [315420, 315420], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 258.566/pb
+        [315488, 315490], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 296.522/pb
+        [315506, 315506], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 27.983/pb
+        [315510, 315510], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 103.172/pb
+        [315512, 315512], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 236.871/pb
+        [315543, 315543], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 36.886/pb
+        [315555, 315557], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 114.498/pb
+        [315640, 315642], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 43.181/pb
+        [315644, 315648], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 439.459/pb
+        [315689, 315690], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 448.961/pb
+        [315702, 315705], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 328.569/pb
+        [315713, 315713], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 353.735/pb
+        [315721, 315721], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 210.579/pb
+        [315741, 315741], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 23.717/pb
+        [315764, 315764], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 114.011/pb
+        [315770, 315770], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 121.796/pb
+        [315784, 315786], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 179.651/pb
+        [315790, 315790], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 173.124/pb
+        [315800, 315801], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 304.75/pb
+        [315840, 315840], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12, 354.111/pb
+        [315973, 315974], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v12/HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 297.118/pb
+        [316058, 316062], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 512.949/pb
+        [316082, 316082], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 141.36/pb
+        [316110, 316111], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 97.131/pb
+        [316113, 316114], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 388.486/pb
+        [316153, 316153], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 256.24/pb
+        [316186, 316187], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 527.582/pb
+        [316199, 316202], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 589.387/pb
+        [316216, 316219], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 551.849/pb
+        [316239, 316241], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 546.196/pb
+        [316271, 316271], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v13, 29.698/pb
+        [316361, 316363], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 84.941/pb
+        [316377, 316380], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 188.825/pb
+        [316455, 316455], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 9.607/pb
+        [316457, 316457], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 326.273/pb
+        [316469, 316470], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 265.747/pb
+        [316472, 316472], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 66.237/pb
+        [316505, 316505], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 401.22/pb
+        [316569, 316569], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 485.569/pb
+        [316590, 316590], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 189.247/pb
+        [316613, 316613], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 31.466/pb
+        [316615, 316615], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 49.127/pb
+        [316666, 316667], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 321.521/pb
+        [316700, 316702], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 353.699/pb
+        [316715, 316723], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 440.225/pb
+        [316758, 316758], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 455.683/pb
+        [316766, 316766], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 561.053/pb
+        [316876, 316877], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 327.431/pb
+        [316879, 316879], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 36.513/pb
+        [316928, 316928], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 44.417/pb
+        [316985, 316985], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 172.546/pb
+        [316993, 316995], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 265.445/pb
+        [317080, 317080], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 7.844/pb
+        [317087, 317087], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 243.2/pb
+        [317089, 317089], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 212.905/pb
+        [317182, 317182], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 406.207/pb
+        [317212, 317213], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 176.661/pb
+        [317279, 317279], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 65.892/pb
+        [317291, 317292], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 359.036/pb
+        [317297, 317297], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 123.799/pb
+        [317319, 317320], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 514.282/pb
+        [317338, 317340], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 219.977/pb
+        [317382, 317383], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 46.591/pb
+        [317391, 317392], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 493.374/pb
+        [317435, 317435], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 360.613/pb
+        [317438, 317438], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 49.71/pb
+        [317475, 317475], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 25.761/pb
+        [317478, 317478], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 7.937/pb
+        [317484, 317484], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 160.356/pb
+        [317488, 317488], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 181.128/pb
+        [317527, 317527], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 452.099/pb
+        [317591, 317591], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 111.117/pb
+        [317626, 317626], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 528.94/pb
+        [317640, 317641], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 529.494/pb
+        [317648, 317650], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 483.09/pb
+        [317661, 317661], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 375.651/pb
+        [317663, 317663], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 153.301/pb
+        [317683, 317683], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 117.852/pb
+        [317696, 317696], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 228.787/pb
+        [318733, 318733], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 2.792/pb
+        [318828, 318828], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 13.229/pb
+        [318872, 318872], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 91.855/pb
+        [318874, 318874], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 99.565/pb
+        [318876, 318877], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 207.136/pb
+        [319077, 319077], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 16.372/pb
+        [319337, 319337], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 232.389/pb
+        [319347, 319349], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 256.706/pb
+        [319449, 319450], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 456.219/pb
+        [319456, 319456], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 52.016/pb
+        [319459, 319459], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 17.212/pb
+        [319486, 319486], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 20.315/pb
+        [319503, 319503], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 90.959/pb
+        [319524, 319524], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 456.701/pb
+        [319526, 319526], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 69.66/pb
+        [319528, 319528], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 58.411/pb
+        [319579, 319579], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 818.49/pb
+        [319625, 319625], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 70.596/pb
+        [319639, 319639], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 409.34/pb
+        [319656, 319659], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 221.8/pb
+        [319678, 319678], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 95.425/pb
+        [319687, 319687], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 16.053/pb
+        [319697, 319698], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 96.857/pb
+        [319756, 319756], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 490.205/pb
+        [319840, 319841], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 69.999/pb
+        [319847, 319849], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 193.537/pb
+        [319851, 319851], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 1.137/pb
+        [319853, 319854], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 124.92/pb
+        [319908, 319910], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 324.281/pb
+        [319912, 319915], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 119.686/pb
+        [319941, 319942], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 111.886/pb
+        [319950, 319950], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 65.936/pb
+        [319991, 319993], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 530.374/pb
+        [320002, 320002], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 50.203/pb
+        [320006, 320006], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 114.14/pb
+        [320010, 320012], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 153.875/pb
+        [320023, 320026], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 305.475/pb
+        [320038, 320040], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 404.341/pb
+        [320059, 320065], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 395.979/pb
+        [320673, 320674], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 98.341/pb
+        [320688, 320688], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 130.855/pb
+        [320712, 320712], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 69.58/pb
+        [320757, 320757], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 116.684/pb
+        [320804, 320804], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 319.033/pb
+        [320807, 320807], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 0.348/pb
+        [320809, 320809], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 106.231/pb
+        [320821, 320824], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 454.293/pb
+        [320838, 320838], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 92.366/pb
+        [320840, 320841], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 191.511/pb
+        [320853, 320859], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 433.068/pb
+        [320887, 320888], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 113.862/pb
+        [320916, 320917], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 484.437/pb
+        [320920, 320920], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 24.013/pb
+        [320933, 320934], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 262.426/pb
+        [320936, 320936], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 78.32/pb
+        [320941, 320941], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 15.638/pb
+        [320980, 320980], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 38.408/pb
+        [320995, 320996], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 74.084/pb
+        [321004, 321007], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 320.57/pb
+        [321009, 321012], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 105.863/pb
+        [321051, 321051], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 311.577/pb
+        [321055, 321055], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 125.495/pb
+        [321067, 321069], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 369.401/pb
+        [321119, 321119], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 58.668/pb
+        [321121, 321122], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 136.178/pb
+        [321124, 321124], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 185.308/pb
+        [321126, 321126], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 78.957/pb
+        [321134, 321134], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 8.164/pb
+        [321138, 321138], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 141.977/pb
+        [321140, 321140], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 116.949/pb
+        [321149, 321149], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 434.675/pb
+        [321165, 321167], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 277.898/pb
+        [321177, 321178], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 174.709/pb
+        [321218, 321219], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 463.69/pb
+        [321221, 321221], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 5.906/pb
+        [321230, 321233], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 275.104/pb
+        [321262, 321262], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 1.669/pb
+        [321283, 321283], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 119.781/pb
+        [321294, 321296], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 233.977/pb
+        [321305, 321305], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 601.905/pb
+        [321311, 321313], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 87.325/pb
+        [321393, 321393], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 49.689/pb
+        [321396, 321397], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 417.281/pb
+        [321414, 321415], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 523.015/pb
+        [321431, 321434], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 296.1/pb
+        [321436, 321436], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 138.442/pb
+        [321457, 321457], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 482.762/pb
+        [321461, 321461], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 21.013/pb
+        [321475, 321475], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 471.913/pb
+        [321710, 321710], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 17.235/pb
+        [321712, 321712], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 84.378/pb
+        [321730, 321730], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 102.671/pb
+        [321732, 321732], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 344.692/pb
+        [321735, 321735], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 23.661/pb
+        [321755, 321755], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 213.438/pb
+        [321758, 321758], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 37.518/pb
+        [321760, 321760], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 146.153/pb
+        [321773, 321778], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 174.569/pb
+        [321780, 321781], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 181.684/pb
+        [321813, 321813], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 120.244/pb
+        [321815, 321815], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 5.12/pb
+        [321817, 321818], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 286.489/pb
+        [321820, 321820], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 32.069/pb
+        [321831, 321834], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 488.005/pb
+        [321879, 321880], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 131.546/pb
+        [321887, 321887], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 276.941/pb
+        [321908, 321909], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 485.884/pb
+        [321917, 321917], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 261.22/pb
+        [321919, 321919], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 1.489/pb
+        [321933, 321933], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 101.007/pb
+        [321960, 321961], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 139.431/pb
+        [321973, 321973], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 358.667/pb
+        [321975, 321975], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 145.784/pb
+        [321988, 321988], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 384.022/pb
+        [321990, 321990], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 81.032/pb
+        [322013, 322014], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 7.816/pb
+        [322022, 322022], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 452.969/pb
+        [322040, 322040], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 13.692/pb
+        [322057, 322057], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 8.235/pb
+        [322068, 322068], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 232.599/pb
+        [322079, 322079], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 140.245/pb
+        [322106, 322106], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 281.859/pb
+        [322113, 322113], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 40.79/pb
+        [322118, 322118], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 268.229/pb
+        [322179, 322179], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 469.75/pb
+        [322201, 322201], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 84.335/pb
+        [322204, 322204], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 311.166/pb
+        [322222, 322222], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 92.744/pb
+        [322252, 322252], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 420.358/pb
+        [322317, 322317], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 19.246/pb
+        [322319, 322319], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 55.502/pb
+        [322322, 322322], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 292.464/pb
+        [322324, 322324], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 69.26/pb
+        [322332, 322332], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 313.996/pb
+        [322348, 322348], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 414.112/pb
+        [322355, 322356], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 268.46/pb
+        [322381, 322381], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 178.73/pb
+        [322407, 322407], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 169.958/pb
+        [322430, 322431], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 370.371/pb
+        [322480, 322480], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 109.337/pb
+        [322492, 322492], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 287.515/pb
+        [322510, 322510], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 2.229/pb
+        [322599, 322599], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 94.351/pb
+        [322602, 322603], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 26.803/pb
+        [322605, 322605], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 89.624/pb
+        [322617, 322617], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 136.646/pb
+        [322625, 322625], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 335.273/pb
+        [322633, 322633], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 50.946/pb
+        [323414, 323414], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 6.204/pb
+        [323423, 323423], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 21.037/pb
+        [323470, 323475], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 321.533/pb
+        [323487, 323488], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 340.364/pb
+        [323492, 323493], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 33.198/pb
+        [323495, 323495], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 32.347/pb
+        [323524, 323526], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 480.533/pb
+        [323693, 323693], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 40.083/pb
+        [323696, 323696], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 88.848/pb
+        [323702, 323702], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 145.958/pb
+        [323725, 323727], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 380.043/pb
+        [323755, 323755], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 296.639/pb
+        [323775, 323775], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 46.768/pb
+        [323778, 323778], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 270.936/pb
+        [323790, 323790], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 276.737/pb
+        [323794, 323794], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 16.057/pb
+        [323841, 323841], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 155.038/pb
+        [323857, 323857], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 95.513/pb
+        [323940, 323940], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 426.706/pb
+        [323954, 323954], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 15.141/pb
+        [323976, 323976], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 14.399/pb
+        [323978, 323978], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 21.952/pb
+        [323980, 323980], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 67.732/pb
+        [323983, 323983], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 56.791/pb
+        [323997, 323997], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 128.792/pb
+        [324021, 324022], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 380.271/pb
+        [324077, 324077], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 242.583/pb
+        [324201, 324202], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 402.099/pb
+        [324205, 324207], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 44.541/pb
+        [324209, 324209], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 16.079/pb
+        [324237, 324237], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 74.992/pb
+        [324245, 324245], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 417.199/pb
+        [324293, 324293], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 513.035/pb
+        [324315, 324315], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 70.437/pb
+        [324318, 324318], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 99.84/pb
+        [324420, 324420], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 199.727/pb
+        [324729, 324729], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 14.797/pb
+        [324747, 324747], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 308.246/pb
+        [324764, 324765], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 117.745/pb
+        [324769, 324769], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 46.77/pb
+        [324772, 324772], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 18.783/pb
+        [324785, 324785], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 185.798/pb
+        [324791, 324791], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 245.007/pb
+        [324835, 324835], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 85.856/pb
+        [324840, 324841], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 328.73/pb
+        [324846, 324846], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 68.553/pb
+        [324878, 324878], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 403.017/pb
+        [324897, 324897], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 50.229/pb
+        [324970, 324970], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 479.466/pb
+        [324980, 324980], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 513.295/pb
+        [324997, 325001], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 370.507/pb
+        [325022, 325022], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 433.386/pb
+        [325057, 325057], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 120.048/pb
+        [325097, 325101], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 351.717/pb
+        [325110, 325110], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 3.259/pb
+        [325117, 325117], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 85.217/pb
+        [325159, 325159], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 61.44/pb
+        [325168, 325170], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 273.009/pb
+        [325172, 325172], # HLT_Ele115_CaloIdVT_GsfTrkIdT_v14, 67.636/pb
+      ],
+    },
+  ],
+  # CV: tau trigger paths taken from slide 12 of presentation given by Hale Sert at HTT workshop in April 2019
+  #    (https://indico.cern.ch/event/803335/contributions/3359970/attachments/1829789/2996369/TriggerStatus_HTTworkshop_hsert.pdf)
+  '1mu1tau' : [ # stored in SingleMuon dataset
+    {
+      'name'        : 'HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1', # missing in C, D (effectively prescaled by 3.4); not in MC
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 7.929/pb
+        [315259, 315259], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 13.919/pb
+        [315264, 315265], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 46.158/pb
+        [315267, 315267], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 37.143/pb
+        [315270, 315270], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 78.981/pb
+        [315322, 315322], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 180.063/pb
+        [315339, 315339], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 93.349/pb
+        [315357, 315357], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 151.931/pb
+        [315361, 315361], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 118.532/pb
+        [315363, 315363], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 14.489/pb
+        [315366, 315366], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 100.183/pb
+        [315420, 315420], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 258.566/pb
+        [315488, 315490], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 296.522/pb
+        [315506, 315506], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 27.983/pb
+        [315510, 315510], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 103.172/pb
+        [315512, 315512], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 236.871/pb
+        [315543, 315543], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 36.886/pb
+        [315555, 315557], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 114.498/pb
+        [315640, 315642], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 43.181/pb
+        [315644, 315648], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 439.459/pb
+        [315689, 315690], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 448.961/pb
+        [315702, 315705], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 328.569/pb
+        [315713, 315713], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 353.735/pb
+        [315721, 315721], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 210.579/pb
+        [315741, 315741], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 23.717/pb
+        [315764, 315764], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 114.011/pb
+        [315770, 315770], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 121.796/pb
+        [315784, 315786], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 179.651/pb
+        [315790, 315790], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 173.124/pb
+        [315800, 315801], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 304.75/pb
+        [315840, 315840], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10, 354.111/pb
+        [315973, 315974], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v10/HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 297.118/pb
+        [316058, 316062], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 512.949/pb
+        [316082, 316082], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 141.36/pb
+        [316110, 316111], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 97.131/pb
+        [316113, 316114], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 388.486/pb
+        [316153, 316153], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 256.24/pb
+        [316186, 316187], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 527.582/pb
+        [316199, 316202], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 589.387/pb
+        [316216, 316219], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 551.849/pb
+        [316239, 316241], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 546.196/pb
+        [316271, 316271], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v11, 29.698/pb
+        [316361, 316363], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 84.941/pb
+        [316377, 316380], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 188.825/pb
+        [316455, 316455], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 9.607/pb
+        [316457, 316457], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 326.273/pb
+        [316469, 316470], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 265.747/pb
+        [316472, 316472], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 66.237/pb
+        [316505, 316505], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 401.22/pb
+        [316569, 316569], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 485.569/pb
+        [316590, 316590], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 189.247/pb
+        [316613, 316613], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 31.466/pb
+        [316615, 316615], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 49.127/pb
+        [316666, 316667], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 321.521/pb
+        [316700, 316702], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 353.699/pb
+        [316715, 316723], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 440.225/pb
+        [316758, 316758], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 455.683/pb
+        [316766, 316766], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 561.053/pb
+        [316876, 316877], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 327.431/pb
+        [316879, 316879], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 36.513/pb
+        [316928, 316928], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 44.417/pb
+        [316985, 316985], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 172.546/pb
+        [316993, 316995], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 265.445/pb
+        [317080, 317080], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 7.844/pb
+        [317087, 317087], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 243.2/pb
+        [317089, 317089], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 212.905/pb
+        [317182, 317182], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 406.207/pb
+        [317212, 317213], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 176.661/pb
+        [317279, 317279], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 65.892/pb
+        [317291, 317292], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 359.036/pb
+        [317297, 317297], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 123.799/pb
+        [317319, 317320], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 514.282/pb
+        [317338, 317340], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 219.977/pb
+        [317382, 317383], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 46.591/pb
+        [317391, 317392], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 493.374/pb
+        [317435, 317435], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 360.613/pb
+        [317438, 317438], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 49.71/pb
+        [317475, 317475], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 25.761/pb
+        [317478, 317478], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 7.937/pb
+        [317484, 317484], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 160.356/pb
+        [317488, 317488], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1_v12, 181.128/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 7.929/pb
+        [315259, 315259], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 13.919/pb
+        [315264, 315265], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 46.158/pb
+        [315267, 315267], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 37.143/pb
+        [315270, 315270], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 78.981/pb
+        [315322, 315322], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 180.063/pb
+        [315339, 315339], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 93.349/pb
+        [315357, 315357], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 151.931/pb
+        [315361, 315361], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 118.532/pb
+        [315363, 315363], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 14.489/pb
+        [315366, 315366], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 100.183/pb
+        [315420, 315420], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 258.566/pb
+        [315488, 315490], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 296.522/pb
+        [315506, 315506], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 27.983/pb
+        [315510, 315510], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 103.172/pb
+        [315512, 315512], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 236.871/pb
+        [315543, 315543], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 36.886/pb
+        [315555, 315557], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 114.498/pb
+        [315640, 315642], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 43.181/pb
+        [315644, 315648], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 439.459/pb
+        [315689, 315690], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 448.961/pb
+        [315702, 315705], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 328.569/pb
+        [315713, 315713], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 353.735/pb
+        [315721, 315721], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 210.579/pb
+        [315741, 315741], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 23.717/pb
+        [315764, 315764], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 114.011/pb
+        [315770, 315770], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 121.796/pb
+        [315784, 315786], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 179.651/pb
+        [315790, 315790], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 173.124/pb
+        [315800, 315801], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 304.75/pb
+        [315840, 315840], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1, 354.111/pb
+        [315973, 315974], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v1/HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 297.118/pb
+        [316058, 316062], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 512.949/pb
+        [316082, 316082], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 141.36/pb
+        [316110, 316111], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 97.131/pb
+        [316113, 316114], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 388.486/pb
+        [316153, 316153], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 256.24/pb
+        [316186, 316187], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 527.582/pb
+        [316199, 316202], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 589.387/pb
+        [316216, 316219], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 551.849/pb
+        [316239, 316241], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 546.196/pb
+        [316271, 316271], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v2, 29.698/pb
+        [316361, 316363], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 84.941/pb
+        [316377, 316380], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 188.825/pb
+        [316455, 316455], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 9.607/pb
+        [316457, 316457], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 326.273/pb
+        [316469, 316470], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 265.747/pb
+        [316472, 316472], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 66.237/pb
+        [316505, 316505], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 401.22/pb
+        [316569, 316569], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 485.569/pb
+        [316590, 316590], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 189.247/pb
+        [316613, 316613], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 31.466/pb
+        [316615, 316615], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 49.127/pb
+        [316666, 316667], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 321.521/pb
+        [316700, 316702], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 353.699/pb
+        [316715, 316723], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 440.225/pb
+        [316758, 316758], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 455.683/pb
+        [316766, 316766], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 561.053/pb
+        [316876, 316877], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 327.431/pb
+        [316879, 316879], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 36.513/pb
+        [316928, 316928], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 44.417/pb
+        [316985, 316985], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 172.546/pb
+        [316993, 316995], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 265.445/pb
+        [317080, 317080], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 7.844/pb
+        [317087, 317087], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 243.2/pb
+        [317089, 317089], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 212.905/pb
+        [317182, 317182], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 406.207/pb
+        [317212, 317213], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 176.661/pb
+        [317279, 317279], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 65.892/pb
+        [317291, 317292], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 359.036/pb
+        [317297, 317297], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 123.799/pb
+        [317319, 317320], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 514.282/pb
+        [317338, 317340], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 219.977/pb
+        [317382, 317383], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 46.591/pb
+        [317391, 317392], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 493.374/pb
+        [317435, 317435], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 360.613/pb
+        [317438, 317438], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 49.71/pb
+        [317475, 317475], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 25.761/pb
+        [317478, 317478], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 7.937/pb
+        [317484, 317484], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 160.356/pb
+        [317488, 317488], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v3, 181.128/pb
+        [317527, 317527], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 452.099/pb
+        [317591, 317591], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 111.117/pb
+        [317626, 317626], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 528.94/pb
+        [317640, 317641], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 529.494/pb
+        [317648, 317650], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 483.09/pb
+        [317661, 317661], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 375.651/pb
+        [317663, 317663], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 153.301/pb
+        [317683, 317683], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 117.852/pb
+        [317696, 317696], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 228.787/pb
+        [318733, 318733], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 2.792/pb
+        [318828, 318828], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 13.229/pb
+        [318872, 318872], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 91.855/pb
+        [318874, 318874], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 99.565/pb
+        [318876, 318877], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 207.136/pb
+        [319077, 319077], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 16.372/pb
+        [319337, 319337], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 232.389/pb
+        [319347, 319349], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 256.706/pb
+        [319449, 319450], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 456.219/pb
+        [319456, 319456], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 52.016/pb
+        [319459, 319459], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 17.212/pb
+        [319486, 319486], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 20.315/pb
+        [319503, 319503], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 90.959/pb
+        [319524, 319524], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 456.701/pb
+        [319526, 319526], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 69.66/pb
+        [319528, 319528], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 58.411/pb
+        [319579, 319579], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 818.49/pb
+        [319625, 319625], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 70.596/pb
+        [319639, 319639], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 409.34/pb
+        [319656, 319659], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 221.8/pb
+        [319678, 319678], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 95.425/pb
+        [319687, 319687], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 16.053/pb
+        [319697, 319698], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 96.857/pb
+        [319756, 319756], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 490.205/pb
+        [319840, 319841], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 69.999/pb
+        [319847, 319849], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 193.537/pb
+        [319851, 319851], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 1.137/pb
+        [319853, 319854], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 124.92/pb
+        [319908, 319910], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 324.281/pb
+        [319912, 319915], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 119.686/pb
+        [319941, 319942], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 111.886/pb
+        [319950, 319950], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 65.936/pb
+        [319991, 319993], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 530.374/pb
+        [320002, 320002], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 50.203/pb
+        [320006, 320006], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 114.14/pb
+        [320010, 320012], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 153.875/pb
+        [320023, 320026], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 305.475/pb
+        [320038, 320040], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 404.341/pb
+        [320059, 320065], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 395.979/pb
+        [320673, 320674], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 98.341/pb
+        [320688, 320688], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 130.855/pb
+        [320712, 320712], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 69.58/pb
+        [320757, 320757], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 116.684/pb
+        [320804, 320804], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 319.033/pb
+        [320807, 320807], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 0.348/pb
+        [320809, 320809], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 106.231/pb
+        [320821, 320824], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 454.293/pb
+        [320838, 320838], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 92.366/pb
+        [320840, 320841], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 191.511/pb
+        [320853, 320859], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 433.068/pb
+        [320887, 320888], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 113.862/pb
+        [320916, 320917], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 484.437/pb
+        [320920, 320920], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 24.013/pb
+        [320933, 320934], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 262.426/pb
+        [320936, 320936], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 78.32/pb
+        [320941, 320941], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 15.638/pb
+        [320980, 320980], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 38.408/pb
+        [320995, 320996], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 74.084/pb
+        [321004, 321007], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 320.57/pb
+        [321009, 321012], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 105.863/pb
+        [321051, 321051], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 311.577/pb
+        [321055, 321055], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 125.495/pb
+        [321067, 321069], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 369.401/pb
+        [321119, 321119], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 58.668/pb
+        [321121, 321122], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 136.178/pb
+        [321124, 321124], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 185.308/pb
+        [321126, 321126], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 78.957/pb
+        [321134, 321134], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 8.164/pb
+        [321138, 321138], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 141.977/pb
+        [321140, 321140], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 116.949/pb
+        [321149, 321149], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 434.675/pb
+        [321165, 321167], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 277.898/pb
+        [321177, 321178], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 174.709/pb
+        [321218, 321219], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 463.69/pb
+        [321221, 321221], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 5.906/pb
+        [321230, 321233], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 275.104/pb
+        [321262, 321262], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 1.669/pb
+        [321283, 321283], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 119.781/pb
+        [321294, 321296], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 233.977/pb
+        [321305, 321305], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 601.905/pb
+        [321311, 321313], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 87.325/pb
+        [321393, 321393], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 49.689/pb
+        [321396, 321397], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 417.281/pb
+        [321414, 321415], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 523.015/pb
+        [321431, 321434], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 296.1/pb
+        [321436, 321436], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 138.442/pb
+        [321457, 321457], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 482.762/pb
+        [321461, 321461], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 21.013/pb
+        [321475, 321475], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 471.913/pb
+        [321710, 321710], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 17.235/pb
+        [321712, 321712], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 84.378/pb
+        [321730, 321730], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 102.671/pb
+        [321732, 321732], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 344.692/pb
+        [321735, 321735], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 23.661/pb
+        [321755, 321755], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 213.438/pb
+        [321758, 321758], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 37.518/pb
+        [321760, 321760], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 146.153/pb
+        [321773, 321778], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 174.569/pb
+        [321780, 321781], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 181.684/pb
+        [321813, 321813], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 120.244/pb
+        [321815, 321815], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 5.12/pb
+        [321817, 321818], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 286.489/pb
+        [321820, 321820], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 32.069/pb
+        [321831, 321834], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 488.005/pb
+        [321879, 321880], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 131.546/pb
+        [321887, 321887], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 276.941/pb
+        [321908, 321909], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 485.884/pb
+        [321917, 321917], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 261.22/pb
+        [321919, 321919], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 1.489/pb
+        [321933, 321933], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 101.007/pb
+        [321960, 321961], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 139.431/pb
+        [321973, 321973], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 358.667/pb
+        [321975, 321975], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 145.784/pb
+        [321988, 321988], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 384.022/pb
+        [321990, 321990], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 81.032/pb
+        [322013, 322014], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 7.816/pb
+        [322022, 322022], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 452.969/pb
+        [322040, 322040], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 13.692/pb
+        [322057, 322057], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 8.235/pb
+        [322068, 322068], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 232.599/pb
+        [322079, 322079], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 140.245/pb
+        [322106, 322106], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 281.859/pb
+        [322113, 322113], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 40.79/pb
+        [322118, 322118], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 268.229/pb
+        [322179, 322179], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 469.75/pb
+        [322201, 322201], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 84.335/pb
+        [322204, 322204], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 311.166/pb
+        [322222, 322222], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 92.744/pb
+        [322252, 322252], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 420.358/pb
+        [322317, 322317], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 19.246/pb
+        [322319, 322319], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 55.502/pb
+        [322322, 322322], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 292.464/pb
+        [322324, 322324], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 69.26/pb
+        [322332, 322332], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 313.996/pb
+        [322348, 322348], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 414.112/pb
+        [322355, 322356], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 268.46/pb
+        [322381, 322381], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 178.73/pb
+        [322407, 322407], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 169.958/pb
+        [322430, 322431], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 370.371/pb
+        [322480, 322480], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 109.337/pb
+        [322492, 322492], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 287.515/pb
+        [322510, 322510], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 2.229/pb
+        [322599, 322599], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 94.351/pb
+        [322602, 322603], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 26.803/pb
+        [322605, 322605], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 89.624/pb
+        [322617, 322617], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 136.646/pb
+        [322625, 322625], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 335.273/pb
+        [322633, 322633], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 50.946/pb
+        [323414, 323414], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 6.204/pb
+        [323423, 323423], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 21.037/pb
+        [323470, 323475], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 321.533/pb
+        [323487, 323488], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 340.364/pb
+        [323492, 323493], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 33.198/pb
+        [323495, 323495], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 32.347/pb
+        [323524, 323526], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 480.533/pb
+        [323693, 323693], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 40.083/pb
+        [323696, 323696], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 88.848/pb
+        [323702, 323702], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 145.958/pb
+        [323725, 323727], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 380.043/pb
+        [323755, 323755], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 296.639/pb
+        [323775, 323775], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 46.768/pb
+        [323778, 323778], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 270.936/pb
+        [323790, 323790], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 276.737/pb
+        [323794, 323794], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 16.057/pb
+        [323841, 323841], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 155.038/pb
+        [323857, 323857], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 95.513/pb
+        [323940, 323940], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 426.706/pb
+        [323954, 323954], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 15.141/pb
+        [323976, 323976], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 14.399/pb
+        [323978, 323978], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 21.952/pb
+        [323980, 323980], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 67.732/pb
+        [323983, 323983], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 56.791/pb
+        [323997, 323997], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 128.792/pb
+        [324021, 324022], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 380.271/pb
+        [324077, 324077], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 242.583/pb
+        [324201, 324202], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 402.099/pb
+        [324205, 324207], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 44.541/pb
+        [324209, 324209], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 16.079/pb
+        [324237, 324237], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 74.992/pb
+        [324245, 324245], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 417.199/pb
+        [324293, 324293], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 513.035/pb
+        [324315, 324315], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 70.437/pb
+        [324318, 324318], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 99.84/pb
+        [324420, 324420], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 199.727/pb
+        [324729, 324729], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 14.797/pb
+        [324747, 324747], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 308.246/pb
+        [324764, 324765], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 117.745/pb
+        [324769, 324769], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 46.77/pb
+        [324772, 324772], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 18.783/pb
+        [324785, 324785], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 185.798/pb
+        [324791, 324791], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 245.007/pb
+        [324835, 324835], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 85.856/pb
+        [324840, 324841], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 328.73/pb
+        [324846, 324846], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 68.553/pb
+        [324878, 324878], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 403.017/pb
+        [324897, 324897], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 50.229/pb
+        [324970, 324970], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 479.466/pb
+        [324980, 324980], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 513.295/pb
+        [324997, 325001], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 370.507/pb
+        [325022, 325022], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 433.386/pb
+        [325057, 325057], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 120.048/pb
+        [325097, 325101], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 351.717/pb
+        [325110, 325110], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 3.259/pb
+        [325117, 325117], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 85.217/pb
+        [325159, 325159], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 61.44/pb
+        [325168, 325170], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 273.009/pb
+        [325172, 325172], # HLT_IsoMu20_eta2p1_LooseChargedIsoPFTauHPS27_eta2p1_CrossL1_v4, 67.636/pb
+      ],
+    },
+  ],
+  '1e1tau' : [ # stored in SingleElectron dataset?
+    {
+      'name'        : 'HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1', # missing in C, D (effectively prescaled by 3.4); not in MC
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 7.929/pb
+        [315259, 315259], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 13.919/pb
+        [315264, 315265], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 46.158/pb
+        [315267, 315267], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 37.143/pb
+        [315270, 315270], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 78.981/pb
+        [315322, 315322], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 180.063/pb
+        [315339, 315339], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 93.349/pb
+        [315357, 315357], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 151.931/pb
+        [315361, 315361], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 118.532/pb
+        [315363, 315363], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 14.489/pb
+        [315366, 315366], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 100.183/pb
+        [315420, 315420], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 258.566/pb
+        [315488, 315490], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 296.522/pb
+        [315506, 315506], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 27.983/pb
+        [315510, 315510], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 103.172/pb
+        [315512, 315512], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 236.871/pb
+        [315543, 315543], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 36.886/pb
+        [315555, 315557], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 114.498/pb
+        [315640, 315642], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 43.181/pb
+        [315644, 315648], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 439.459/pb
+        [315689, 315690], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 448.961/pb
+        [315702, 315705], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 328.569/pb
+        [315713, 315713], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 353.735/pb
+        [315721, 315721], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 210.579/pb
+        [315741, 315741], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 23.717/pb
+        [315764, 315764], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 114.011/pb
+        [315770, 315770], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 121.796/pb
+        [315784, 315786], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 179.651/pb
+        [315790, 315790], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 173.124/pb
+        [315800, 315801], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 304.75/pb
+        [315840, 315840], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11, 354.111/pb
+        [315973, 315974], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v11/HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 297.118/pb
+        [316058, 316062], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 512.949/pb
+        [316082, 316082], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 141.36/pb
+        [316110, 316111], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 97.131/pb
+        [316113, 316114], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 388.486/pb
+        [316153, 316153], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 256.24/pb
+        [316186, 316187], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 527.582/pb
+        [316199, 316202], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 589.387/pb
+        [316216, 316219], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 551.849/pb
+        [316239, 316241], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 546.196/pb
+        [316271, 316271], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v12, 29.698/pb
+        [316361, 316363], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 84.941/pb
+        [316377, 316380], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 188.825/pb
+        [316455, 316455], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 9.607/pb
+        [316457, 316457], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 326.273/pb
+        [316469, 316470], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 265.747/pb
+        [316472, 316472], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 66.237/pb
+        [316505, 316505], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 401.22/pb
+        [316569, 316569], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 485.569/pb
+        [316590, 316590], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 189.247/pb
+        [316613, 316613], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 31.466/pb
+        [316615, 316615], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 49.127/pb
+        [316666, 316667], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 321.521/pb
+        [316700, 316702], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 353.699/pb
+        [316715, 316723], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 440.225/pb
+        [316758, 316758], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 455.683/pb
+        [316766, 316766], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 561.053/pb
+        [316876, 316877], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 327.431/pb
+        [316879, 316879], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 36.513/pb
+        [316928, 316928], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 44.417/pb
+        [316985, 316985], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 172.546/pb
+        [316993, 316995], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 265.445/pb
+        [317080, 317080], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 7.844/pb
+        [317087, 317087], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 243.2/pb
+        [317089, 317089], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 212.905/pb
+        [317182, 317182], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 406.207/pb
+        [317212, 317213], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 176.661/pb
+        [317279, 317279], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 65.892/pb
+        [317291, 317292], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 359.036/pb
+        [317297, 317297], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 123.799/pb
+        [317319, 317320], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 514.282/pb
+        [317338, 317340], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 219.977/pb
+        [317382, 317383], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 46.591/pb
+        [317391, 317392], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 493.374/pb
+        [317435, 317435], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 360.613/pb
+        [317438, 317438], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 49.71/pb
+        [317475, 317475], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 25.761/pb
+        [317478, 317478], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 7.937/pb
+        [317484, 317484], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 160.356/pb
+        [317488, 317488], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTau30_eta2p1_CrossL1_v13, 181.128/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1',
+      'unprescaled' : True, # missing in run A
+      'runs'        : [
+        [317527, 317527], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 452.099/pb
+        [317591, 317591], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 111.117/pb
+        [317626, 317626], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 528.94/pb
+        [317640, 317641], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 529.494/pb
+        [317648, 317650], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 483.09/pb
+        [317661, 317661], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 375.651/pb
+        [317663, 317663], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 153.301/pb
+        [317683, 317683], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 117.852/pb
+        [317696, 317696], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 228.787/pb
+        [318733, 318733], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 2.792/pb
+        [318828, 318828], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 13.229/pb
+        [318872, 318872], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 91.855/pb
+        [318874, 318874], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 99.565/pb
+        [318876, 318877], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 207.136/pb
+        [319077, 319077], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 16.372/pb
+        [319337, 319337], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 232.389/pb
+        [319347, 319349], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 256.706/pb
+        [319449, 319450], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 456.219/pb
+        [319456, 319456], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 52.016/pb
+        [319459, 319459], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 17.212/pb
+        [319486, 319486], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 20.315/pb
+        [319503, 319503], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 90.959/pb
+        [319524, 319524], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 456.701/pb
+        [319526, 319526], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 69.66/pb
+        [319528, 319528], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 58.411/pb
+        [319579, 319579], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 818.49/pb
+        [319625, 319625], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 70.596/pb
+        [319639, 319639], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 409.34/pb
+        [319656, 319659], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 221.8/pb
+        [319678, 319678], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 95.425/pb
+        [319687, 319687], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 16.053/pb
+        [319697, 319698], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 96.857/pb
+        [319756, 319756], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 490.205/pb
+        [319840, 319841], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 69.999/pb
+        [319847, 319849], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 193.537/pb
+        [319851, 319851], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 1.137/pb
+        [319853, 319854], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 124.92/pb
+        [319908, 319910], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 324.281/pb
+        [319912, 319915], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 119.686/pb
+        [319941, 319942], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 111.886/pb
+        [319950, 319950], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 65.936/pb
+        [319991, 319993], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 530.374/pb
+        [320002, 320002], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 50.203/pb
+        [320006, 320006], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 114.14/pb
+        [320010, 320012], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 153.875/pb
+        [320023, 320026], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 305.475/pb
+        [320038, 320040], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 404.341/pb
+        [320059, 320065], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 395.979/pb
+        [320673, 320674], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 98.341/pb
+        [320688, 320688], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 130.855/pb
+        [320712, 320712], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 69.58/pb
+        [320757, 320757], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 116.684/pb
+        [320804, 320804], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 319.033/pb
+        [320807, 320807], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 0.348/pb
+        [320809, 320809], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 106.231/pb
+        [320821, 320824], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 454.293/pb
+        [320838, 320838], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 92.366/pb
+        [320840, 320841], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 191.511/pb
+        [320853, 320859], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 433.068/pb
+        [320887, 320888], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 113.862/pb
+        [320916, 320917], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 484.437/pb
+        [320920, 320920], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 24.013/pb
+        [320933, 320934], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 262.426/pb
+        [320936, 320936], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 78.32/pb
+        [320941, 320941], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 15.638/pb
+        [320980, 320980], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 38.408/pb
+        [320995, 320996], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 74.084/pb
+        [321004, 321007], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 320.57/pb
+        [321009, 321012], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 105.863/pb
+        [321051, 321051], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 311.577/pb
+        [321055, 321055], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 125.495/pb
+        [321067, 321069], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 369.401/pb
+        [321119, 321119], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 58.668/pb
+        [321121, 321122], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 136.178/pb
+        [321124, 321124], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 185.308/pb
+        [321126, 321126], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 78.957/pb
+        [321134, 321134], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 8.164/pb
+        [321138, 321138], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 141.977/pb
+        [321140, 321140], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 116.949/pb
+        [321149, 321149], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 434.675/pb
+        [321165, 321167], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 277.898/pb
+        [321177, 321178], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 174.709/pb
+        [321218, 321219], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 463.69/pb
+        [321221, 321221], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 5.906/pb
+        [321230, 321233], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 275.104/pb
+        [321262, 321262], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 1.669/pb
+        [321283, 321283], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 119.781/pb
+        [321294, 321296], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 233.977/pb
+        [321305, 321305], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 601.905/pb
+        [321311, 321313], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 87.325/pb
+        [321393, 321393], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 49.689/pb
+        [321396, 321397], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 417.281/pb
+        [321414, 321415], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 523.015/pb
+        [321431, 321434], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 296.1/pb
+        [321436, 321436], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 138.442/pb
+        [321457, 321457], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 482.762/pb
+        [321461, 321461], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 21.013/pb
+        [321475, 321475], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 471.913/pb
+        [321710, 321710], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 17.235/pb
+        [321712, 321712], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 84.378/pb
+        [321730, 321730], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 102.671/pb
+        [321732, 321732], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 344.692/pb
+        [321735, 321735], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 23.661/pb
+        [321755, 321755], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 213.438/pb
+        [321758, 321758], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 37.518/pb
+        [321760, 321760], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 146.153/pb
+        [321773, 321778], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 174.569/pb
+        [321780, 321781], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 181.684/pb
+        [321813, 321813], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 120.244/pb
+        [321815, 321815], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 5.12/pb
+        [321817, 321818], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 286.489/pb
+        [321820, 321820], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 32.069/pb
+        [321831, 321834], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 488.005/pb
+        [321879, 321880], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 131.546/pb
+        [321887, 321887], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 276.941/pb
+        [321908, 321909], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 485.884/pb
+        [321917, 321917], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 261.22/pb
+        [321919, 321919], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 1.489/pb
+        [321933, 321933], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 101.007/pb
+        [321960, 321961], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 139.431/pb
+        [321973, 321973], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 358.667/pb
+        [321975, 321975], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 145.784/pb
+        [321988, 321988], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 384.022/pb
+        [321990, 321990], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 81.032/pb
+        [322013, 322014], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 7.816/pb
+        [322022, 322022], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 452.969/pb
+        [322040, 322040], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 13.692/pb
+        [322057, 322057], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 8.235/pb
+        [322068, 322068], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 232.599/pb
+        [322079, 322079], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 140.245/pb
+        [322106, 322106], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 281.859/pb
+        [322113, 322113], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 40.79/pb
+        [322118, 322118], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 268.229/pb
+        [322179, 322179], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 469.75/pb
+        [322201, 322201], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 84.335/pb
+        [322204, 322204], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 311.166/pb
+        [322222, 322222], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 92.744/pb
+        [322252, 322252], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 420.358/pb
+        [322317, 322317], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 19.246/pb
+        [322319, 322319], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 55.502/pb
+        [322322, 322322], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 292.464/pb
+        [322324, 322324], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 69.26/pb
+        [322332, 322332], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 313.996/pb
+        [322348, 322348], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 414.112/pb
+        [322355, 322356], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 268.46/pb
+        [322381, 322381], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 178.73/pb
+        [322407, 322407], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 169.958/pb
+        [322430, 322431], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 370.371/pb
+        [322480, 322480], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 109.337/pb
+        [322492, 322492], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 287.515/pb
+        [322510, 322510], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 2.229/pb
+        [322599, 322599], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 94.351/pb
+        [322602, 322603], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 26.803/pb
+        [322605, 322605], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 89.624/pb
+        [322617, 322617], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 136.646/pb
+        [322625, 322625], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 335.273/pb
+        [322633, 322633], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 50.946/pb
+        [323414, 323414], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 6.204/pb
+        [323423, 323423], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 21.037/pb
+        [323470, 323475], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 321.533/pb
+        [323487, 323488], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 340.364/pb
+        [323492, 323493], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 33.198/pb
+        [323495, 323495], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 32.347/pb
+        [323524, 323526], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 480.533/pb
+        [323693, 323693], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 40.083/pb
+        [323696, 323696], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 88.848/pb
+        [323702, 323702], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 145.958/pb
+        [323725, 323727], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 380.043/pb
+        [323755, 323755], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 296.639/pb
+        [323775, 323775], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 46.768/pb
+        [323778, 323778], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 270.936/pb
+        [323790, 323790], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 276.737/pb
+        [323794, 323794], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 16.057/pb
+        [323841, 323841], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 155.038/pb
+        [323857, 323857], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 95.513/pb
+        [323940, 323940], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 426.706/pb
+        [323954, 323954], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 15.141/pb
+        [323976, 323976], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 14.399/pb
+        [323978, 323978], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 21.952/pb
+        [323980, 323980], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 67.732/pb
+        [323983, 323983], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 56.791/pb
+        [323997, 323997], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 128.792/pb
+        [324021, 324022], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 380.271/pb
+        [324077, 324077], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 242.583/pb
+        [324201, 324202], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 402.099/pb
+        [324205, 324207], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 44.541/pb
+        [324209, 324209], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 16.079/pb
+        [324237, 324237], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 74.992/pb
+        [324245, 324245], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 417.199/pb
+        [324293, 324293], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 513.035/pb
+        [324315, 324315], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 70.437/pb
+        [324318, 324318], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 99.84/pb
+        [324420, 324420], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 199.727/pb
+        [324729, 324729], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 14.797/pb
+        [324747, 324747], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 308.246/pb
+        [324764, 324765], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 117.745/pb
+        [324769, 324769], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 46.77/pb
+        [324772, 324772], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 18.783/pb
+        [324785, 324785], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 185.798/pb
+        [324791, 324791], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 245.007/pb
+        [324835, 324835], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 85.856/pb
+        [324840, 324841], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 328.73/pb
+        [324846, 324846], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 68.553/pb
+        [324878, 324878], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 403.017/pb
+        [324897, 324897], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 50.229/pb
+        [324970, 324970], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 479.466/pb
+        [324980, 324980], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 513.295/pb
+        [324997, 325001], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 370.507/pb
+        [325022, 325022], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 433.386/pb
+        [325057, 325057], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 120.048/pb
+        [325097, 325101], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 351.717/pb
+        [325110, 325110], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 3.259/pb
+        [325117, 325117], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 85.217/pb
+        [325159, 325159], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 61.44/pb
+        [325168, 325170], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 273.009/pb
+        [325172, 325172], # HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1_v1, 67.636/pb
+      ],
+    },
+  ],
+  '2tau' : [ # stored in Tau dataset
+    {
+      'name'        : 'HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg', # missing in C, D (effectively prescaled by 3.4); not in MC
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 7.929/pb
+        [315259, 315259], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 13.919/pb
+        [315264, 315265], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 46.158/pb
+        [315267, 315267], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 37.143/pb
+        [315270, 315270], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 78.981/pb
+        [315322, 315322], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 180.063/pb
+        [315339, 315339], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 93.349/pb
+        [315357, 315357], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 151.931/pb
+        [315361, 315361], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 118.532/pb
+        [315363, 315363], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 14.489/pb
+        [315366, 315366], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 100.183/pb
+        [315420, 315420], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 258.566/pb
+        [315488, 315490], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 296.522/pb
+        [315506, 315506], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 27.983/pb
+        [315510, 315510], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 103.172/pb
+        [315512, 315512], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 236.871/pb
+        [315543, 315543], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 36.886/pb
+        [315555, 315557], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 114.498/pb
+        [315640, 315642], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 43.181/pb
+        [315644, 315648], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 439.459/pb
+        [315689, 315690], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 448.961/pb
+        [315702, 315705], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 328.569/pb
+        [315713, 315713], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 353.735/pb
+        [315721, 315721], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 210.579/pb
+        [315741, 315741], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 23.717/pb
+        [315764, 315764], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 114.011/pb
+        [315770, 315770], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 121.796/pb
+        [315784, 315786], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 179.651/pb
+        [315790, 315790], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 173.124/pb
+        [315800, 315801], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 304.75/pb
+        [315840, 315840], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10, 354.111/pb
+        [315973, 315974], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v10/HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 297.118/pb
+        [316058, 316062], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 512.949/pb
+        [316082, 316082], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 141.36/pb
+        [316110, 316111], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 97.131/pb
+        [316113, 316114], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 388.486/pb
+        [316153, 316153], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 256.24/pb
+        [316186, 316187], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 527.582/pb
+        [316199, 316202], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 589.387/pb
+        [316216, 316219], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 551.849/pb
+        [316239, 316241], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 546.196/pb
+        [316271, 316271], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v11, 29.698/pb
+        [316361, 316363], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 84.941/pb
+        [316377, 316380], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 188.825/pb
+        [316455, 316455], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 9.607/pb
+        [316457, 316457], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 326.273/pb
+        [316469, 316470], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 265.747/pb
+        [316472, 316472], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 66.237/pb
+        [316505, 316505], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 401.22/pb
+        [316569, 316569], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 485.569/pb
+        [316590, 316590], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 189.247/pb
+        [316613, 316613], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 31.466/pb
+        [316615, 316615], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 49.127/pb
+        [316666, 316667], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 321.521/pb
+        [316700, 316702], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 353.699/pb
+        [316715, 316723], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 440.225/pb
+        [316758, 316758], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 455.683/pb
+        [316766, 316766], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 561.053/pb
+        [316876, 316877], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 327.431/pb
+        [316879, 316879], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 36.513/pb
+        [316928, 316928], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 44.417/pb
+        [316985, 316985], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 172.546/pb
+        [316993, 316995], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 265.445/pb
+        [317080, 317080], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 7.844/pb
+        [317087, 317087], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 243.2/pb
+        [317089, 317089], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 212.905/pb
+        [317182, 317182], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 406.207/pb
+        [317212, 317213], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 176.661/pb
+        [317279, 317279], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 65.892/pb
+        [317291, 317292], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 359.036/pb
+        [317297, 317297], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 123.799/pb
+        [317319, 317320], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 514.282/pb
+        [317338, 317340], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 219.977/pb
+        [317382, 317383], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 46.591/pb
+        [317391, 317392], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 493.374/pb
+        [317435, 317435], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 360.613/pb
+        [317438, 317438], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 49.71/pb
+        [317475, 317475], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 25.761/pb
+        [317478, 317478], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 7.937/pb
+        [317484, 317484], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 160.356/pb
+        [317488, 317488], # HLT_DoubleTightChargedIsoPFTau35_Trk1_TightID_eta2p1_Reg_v12, 181.128/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg', # missing in C, D (effectively prescaled by 3.4); not in MC
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 7.929/pb
+        [315259, 315259], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 13.919/pb
+        [315264, 315265], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 46.158/pb
+        [315267, 315267], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 37.143/pb
+        [315270, 315270], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 78.981/pb
+        [315322, 315322], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 180.063/pb
+        [315339, 315339], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 93.349/pb
+        [315357, 315357], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 151.931/pb
+        [315361, 315361], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 118.532/pb
+        [315363, 315363], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 14.489/pb
+        [315366, 315366], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 100.183/pb
+        [315420, 315420], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 258.566/pb
+        [315488, 315490], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 296.522/pb
+        [315506, 315506], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 27.983/pb
+        [315510, 315510], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 103.172/pb
+        [315512, 315512], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 236.871/pb
+        [315543, 315543], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 36.886/pb
+        [315555, 315557], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 114.498/pb
+        [315640, 315642], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 43.181/pb
+        [315644, 315648], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 439.459/pb
+        [315689, 315690], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 448.961/pb
+        [315702, 315705], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 328.569/pb
+        [315713, 315713], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 353.735/pb
+        [315721, 315721], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 210.579/pb
+        [315741, 315741], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 23.717/pb
+        [315764, 315764], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 114.011/pb
+        [315770, 315770], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 121.796/pb
+        [315784, 315786], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 179.651/pb
+        [315790, 315790], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 173.124/pb
+        [315800, 315801], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 304.75/pb
+        [315840, 315840], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10, 354.111/pb
+        [315973, 315974], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v10/HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 297.118/pb
+        [316058, 316062], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 512.949/pb
+        [316082, 316082], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 141.36/pb
+        [316110, 316111], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 97.131/pb
+        [316113, 316114], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 388.486/pb
+        [316153, 316153], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 256.24/pb
+        [316186, 316187], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 527.582/pb
+        [316199, 316202], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 589.387/pb
+        [316216, 316219], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 551.849/pb
+        [316239, 316241], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 546.196/pb
+        [316271, 316271], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v11, 29.698/pb
+        [316361, 316363], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 84.941/pb
+        [316377, 316380], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 188.825/pb
+        [316455, 316455], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 9.607/pb
+        [316457, 316457], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 326.273/pb
+        [316469, 316470], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 265.747/pb
+        [316472, 316472], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 66.237/pb
+        [316505, 316505], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 401.22/pb
+        [316569, 316569], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 485.569/pb
+        [316590, 316590], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 189.247/pb
+        [316613, 316613], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 31.466/pb
+        [316615, 316615], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 49.127/pb
+        [316666, 316667], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 321.521/pb
+        [316700, 316702], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 353.699/pb
+        [316715, 316723], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 440.225/pb
+        [316758, 316758], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 455.683/pb
+        [316766, 316766], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 561.053/pb
+        [316876, 316877], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 327.431/pb
+        [316879, 316879], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 36.513/pb
+        [316928, 316928], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 44.417/pb
+        [316985, 316985], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 172.546/pb
+        [316993, 316995], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 265.445/pb
+        [317080, 317080], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 7.844/pb
+        [317087, 317087], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 243.2/pb
+        [317089, 317089], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 212.905/pb
+        [317182, 317182], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 406.207/pb
+        [317212, 317213], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 176.661/pb
+        [317279, 317279], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 65.892/pb
+        [317291, 317292], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 359.036/pb
+        [317297, 317297], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 123.799/pb
+        [317319, 317320], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 514.282/pb
+        [317338, 317340], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 219.977/pb
+        [317382, 317383], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 46.591/pb
+        [317391, 317392], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 493.374/pb
+        [317435, 317435], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 360.613/pb
+        [317438, 317438], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 49.71/pb
+        [317475, 317475], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 25.761/pb
+        [317478, 317478], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 7.937/pb
+        [317484, 317484], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 160.356/pb
+        [317488, 317488], # HLT_DoubleMediumChargedIsoPFTau40_Trk1_TightID_eta2p1_Reg_v12, 181.128/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg', # missing in C, D (effectively prescaled by 3.4); not in MC
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 7.929/pb
+        [315259, 315259], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 13.919/pb
+        [315264, 315265], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 46.158/pb
+        [315267, 315267], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 37.143/pb
+        [315270, 315270], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 78.981/pb
+        [315322, 315322], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 180.063/pb
+        [315339, 315339], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 93.349/pb
+        [315357, 315357], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 151.931/pb
+        [315361, 315361], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 118.532/pb
+        [315363, 315363], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 14.489/pb
+        [315366, 315366], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 100.183/pb
+        [315420, 315420], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 258.566/pb
+        [315488, 315490], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 296.522/pb
+        [315506, 315506], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 27.983/pb
+        [315510, 315510], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 103.172/pb
+        [315512, 315512], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 236.871/pb
+        [315543, 315543], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 36.886/pb
+        [315555, 315557], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 114.498/pb
+        [315640, 315642], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 43.181/pb
+        [315644, 315648], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 439.459/pb
+        [315689, 315690], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 448.961/pb
+        [315702, 315705], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 328.569/pb
+        [315713, 315713], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 353.735/pb
+        [315721, 315721], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 210.579/pb
+        [315741, 315741], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 23.717/pb
+        [315764, 315764], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 114.011/pb
+        [315770, 315770], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 121.796/pb
+        [315784, 315786], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 179.651/pb
+        [315790, 315790], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 173.124/pb
+        [315800, 315801], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 304.75/pb
+        [315840, 315840], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10, 354.111/pb
+        [315973, 315974], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v10/HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 297.118/pb
+        [316058, 316062], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 512.949/pb
+        [316082, 316082], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 141.36/pb
+        [316110, 316111], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 97.131/pb
+        [316113, 316114], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 388.486/pb
+        [316153, 316153], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 256.24/pb
+        [316186, 316187], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 527.582/pb
+        [316199, 316202], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 589.387/pb
+        [316216, 316219], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 551.849/pb
+        [316239, 316241], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 546.196/pb
+        [316271, 316271], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v11, 29.698/pb
+        [316361, 316363], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 84.941/pb
+        [316377, 316380], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 188.825/pb
+        [316455, 316455], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 9.607/pb
+        [316457, 316457], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 326.273/pb
+        [316469, 316470], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 265.747/pb
+        [316472, 316472], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 66.237/pb
+        [316505, 316505], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 401.22/pb
+        [316569, 316569], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 485.569/pb
+        [316590, 316590], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 189.247/pb
+        [316613, 316613], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 31.466/pb
+        [316615, 316615], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 49.127/pb
+        [316666, 316667], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 321.521/pb
+        [316700, 316702], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 353.699/pb
+        [316715, 316723], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 440.225/pb
+        [316758, 316758], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 455.683/pb
+        [316766, 316766], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 561.053/pb
+        [316876, 316877], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 327.431/pb
+        [316879, 316879], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 36.513/pb
+        [316928, 316928], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 44.417/pb
+        [316985, 316985], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 172.546/pb
+        [316993, 316995], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 265.445/pb
+        [317080, 317080], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 7.844/pb
+        [317087, 317087], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 243.2/pb
+        [317089, 317089], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 212.905/pb
+        [317182, 317182], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 406.207/pb
+        [317212, 317213], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 176.661/pb
+        [317279, 317279], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 65.892/pb
+        [317291, 317292], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 359.036/pb
+        [317297, 317297], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 123.799/pb
+        [317319, 317320], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 514.282/pb
+        [317338, 317340], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 219.977/pb
+        [317382, 317383], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 46.591/pb
+        [317391, 317392], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 493.374/pb
+        [317435, 317435], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 360.613/pb
+        [317438, 317438], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 49.71/pb
+        [317475, 317475], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 25.761/pb
+        [317478, 317478], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 7.937/pb
+        [317484, 317484], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 160.356/pb
+        [317488, 317488], # HLT_DoubleTightChargedIsoPFTau40_Trk1_eta2p1_Reg_v12, 181.128/pb
+      ],
+    },
+    {
+      'name'        : 'HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg',
+      'unprescaled' : True,
+      'runs'        : [
+        [315257, 315257], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 7.929/pb
+        [315259, 315259], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 13.919/pb
+        [315264, 315265], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 46.158/pb
+        [315267, 315267], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 37.143/pb
+        [315270, 315270], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 78.981/pb
+        [315322, 315322], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 180.063/pb
+        [315339, 315339], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 93.349/pb
+        [315357, 315357], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 151.931/pb
+        [315361, 315361], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 118.532/pb
+        [315363, 315363], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 14.489/pb
+        [315366, 315366], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 100.183/pb
+        [315420, 315420], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 258.566/pb
+        [315488, 315490], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 296.522/pb
+        [315506, 315506], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 27.983/pb
+        [315510, 315510], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 103.172/pb
+        [315512, 315512], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 236.871/pb
+        [315543, 315543], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 36.886/pb
+        [315555, 315557], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 114.498/pb
+        [315640, 315642], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 43.181/pb
+        [315644, 315648], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 439.459/pb
+        [315689, 315690], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 448.961/pb
+        [315702, 315705], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 328.569/pb
+        [315713, 315713], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 353.735/pb
+        [315721, 315721], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 210.579/pb
+        [315741, 315741], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 23.717/pb
+        [315764, 315764], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 114.011/pb
+        [315770, 315770], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 121.796/pb
+        [315784, 315786], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 179.651/pb
+        [315790, 315790], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 173.124/pb
+        [315800, 315801], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 304.75/pb
+        [315840, 315840], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1, 354.111/pb
+        [315973, 315974], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v1/HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 297.118/pb
+        [316058, 316062], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 512.949/pb
+        [316082, 316082], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 141.36/pb
+        [316110, 316111], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 97.131/pb
+        [316113, 316114], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 388.486/pb
+        [316153, 316153], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 256.24/pb
+        [316186, 316187], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 527.582/pb
+        [316199, 316202], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 589.387/pb
+        [316216, 316219], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 551.849/pb
+        [316239, 316241], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 546.196/pb
+        [316271, 316271], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v2, 29.698/pb
+        [316361, 316363], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 84.941/pb
+        [316377, 316380], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 188.825/pb
+        [316455, 316455], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 9.607/pb
+        [316457, 316457], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 326.273/pb
+        [316469, 316470], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 265.747/pb
+        [316472, 316472], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 66.237/pb
+        [316505, 316505], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 401.22/pb
+        [316569, 316569], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 485.569/pb
+        [316590, 316590], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 189.247/pb
+        [316613, 316613], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 31.466/pb
+        [316615, 316615], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 49.127/pb
+        [316666, 316667], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 321.521/pb
+        [316700, 316702], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 353.699/pb
+        [316715, 316723], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 440.225/pb
+        [316758, 316758], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 455.683/pb
+        [316766, 316766], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 561.053/pb
+        [316876, 316877], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 327.431/pb
+        [316879, 316879], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 36.513/pb
+        [316928, 316928], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 44.417/pb
+        [316985, 316985], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 172.546/pb
+        [316993, 316995], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 265.445/pb
+        [317080, 317080], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 7.844/pb
+        [317087, 317087], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 243.2/pb
+        [317089, 317089], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 212.905/pb
+        [317182, 317182], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 406.207/pb
+        [317212, 317213], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 176.661/pb
+        [317279, 317279], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 65.892/pb
+        [317291, 317292], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 359.036/pb
+        [317297, 317297], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 123.799/pb
+        [317319, 317320], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 514.282/pb
+        [317338, 317340], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 219.977/pb
+        [317382, 317383], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 46.591/pb
+        [317391, 317392], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 493.374/pb
+        [317435, 317435], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 360.613/pb
+        [317438, 317438], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 49.71/pb
+        [317475, 317475], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 25.761/pb
+        [317478, 317478], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 7.937/pb
+        [317484, 317484], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 160.356/pb
+        [317488, 317488], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v3, 181.128/pb
+        [317527, 317527], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 452.099/pb
+        [317591, 317591], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 111.117/pb
+        [317626, 317626], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 528.94/pb
+        [317640, 317641], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 529.494/pb
+        [317648, 317650], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 483.09/pb
+        [317661, 317661], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 375.651/pb
+        [317663, 317663], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 153.301/pb
+        [317683, 317683], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 117.852/pb
+        [317696, 317696], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 228.787/pb
+        [318733, 318733], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 2.792/pb
+        [318828, 318828], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 13.229/pb
+        [318872, 318872], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 91.855/pb
+        [318874, 318874], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 99.565/pb
+        [318876, 318877], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 207.136/pb
+        [319077, 319077], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 16.372/pb
+        [319337, 319337], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 232.389/pb
+        [319347, 319349], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 256.706/pb
+        [319449, 319450], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 456.219/pb
+        [319456, 319456], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 52.016/pb
+        [319459, 319459], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 17.212/pb
+        [319486, 319486], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 20.315/pb
+        [319503, 319503], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 90.959/pb
+        [319524, 319524], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 456.701/pb
+        [319526, 319526], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 69.66/pb
+        [319528, 319528], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 58.411/pb
+        [319579, 319579], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 818.49/pb
+        [319625, 319625], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 70.596/pb
+        [319639, 319639], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 409.34/pb
+        [319656, 319659], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 221.8/pb
+        [319678, 319678], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 95.425/pb
+        [319687, 319687], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 16.053/pb
+        [319697, 319698], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 96.857/pb
+        [319756, 319756], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 490.205/pb
+        [319840, 319841], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 69.999/pb
+        [319847, 319849], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 193.537/pb
+        [319851, 319851], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 1.137/pb
+        [319853, 319854], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 124.92/pb
+        [319908, 319910], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 324.281/pb
+        [319912, 319915], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 119.686/pb
+        [319941, 319942], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 111.886/pb
+        [319950, 319950], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 65.936/pb
+        [319991, 319993], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 530.374/pb
+        [320002, 320002], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 50.203/pb
+        [320006, 320006], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 114.14/pb
+        [320010, 320012], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 153.875/pb
+        [320023, 320026], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 305.475/pb
+        [320038, 320040], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 404.341/pb
+        [320059, 320065], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 395.979/pb
+        [320673, 320674], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 98.341/pb
+        [320688, 320688], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 130.855/pb
+        [320712, 320712], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 69.58/pb
+        [320757, 320757], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 116.684/pb
+        [320804, 320804], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 319.033/pb
+        [320807, 320807], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 0.348/pb
+        [320809, 320809], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 106.231/pb
+        [320821, 320824], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 454.293/pb
+        [320838, 320838], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 92.366/pb
+        [320840, 320841], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 191.511/pb
+        [320853, 320859], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 433.068/pb
+        [320887, 320888], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 113.862/pb
+        [320916, 320917], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 484.437/pb
+        [320920, 320920], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 24.013/pb
+        [320933, 320934], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 262.426/pb
+        [320936, 320936], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 78.32/pb
+        [320941, 320941], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 15.638/pb
+        [320980, 320980], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 38.408/pb
+        [320995, 320996], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 74.084/pb
+        [321004, 321007], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 320.57/pb
+        [321009, 321012], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 105.863/pb
+        [321051, 321051], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 311.577/pb
+        [321055, 321055], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 125.495/pb
+        [321067, 321069], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 369.401/pb
+        [321119, 321119], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 58.668/pb
+        [321121, 321122], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 136.178/pb
+        [321124, 321124], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 185.308/pb
+        [321126, 321126], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 78.957/pb
+        [321134, 321134], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 8.164/pb
+        [321138, 321138], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 141.977/pb
+        [321140, 321140], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 116.949/pb
+        [321149, 321149], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 434.675/pb
+        [321165, 321167], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 277.898/pb
+        [321177, 321178], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 174.709/pb
+        [321218, 321219], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 463.69/pb
+        [321221, 321221], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 5.906/pb
+        [321230, 321233], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 275.104/pb
+        [321262, 321262], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 1.669/pb
+        [321283, 321283], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 119.781/pb
+        [321294, 321296], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 233.977/pb
+        [321305, 321305], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 601.905/pb
+        [321311, 321313], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 87.325/pb
+        [321393, 321393], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 49.689/pb
+        [321396, 321397], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 417.281/pb
+        [321414, 321415], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 523.015/pb
+        [321431, 321434], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 296.1/pb
+        [321436, 321436], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 138.442/pb
+        [321457, 321457], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 482.762/pb
+        [321461, 321461], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 21.013/pb
+        [321475, 321475], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 471.913/pb
+        [321710, 321710], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 17.235/pb
+        [321712, 321712], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 84.378/pb
+        [321730, 321730], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 102.671/pb
+        [321732, 321732], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 344.692/pb
+        [321735, 321735], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 23.661/pb
+        [321755, 321755], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 213.438/pb
+        [321758, 321758], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 37.518/pb
+        [321760, 321760], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 146.153/pb
+        [321773, 321778], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 174.569/pb
+        [321780, 321781], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 181.684/pb
+        [321813, 321813], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 120.244/pb
+        [321815, 321815], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 5.12/pb
+        [321817, 321818], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 286.489/pb
+        [321820, 321820], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 32.069/pb
+        [321831, 321834], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 488.005/pb
+        [321879, 321880], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 131.546/pb
+        [321887, 321887], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 276.941/pb
+        [321908, 321909], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 485.884/pb
+        [321917, 321917], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 261.22/pb
+        [321919, 321919], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 1.489/pb
+        [321933, 321933], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 101.007/pb
+        [321960, 321961], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 139.431/pb
+        [321973, 321973], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 358.667/pb
+        [321975, 321975], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 145.784/pb
+        [321988, 321988], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 384.022/pb
+        [321990, 321990], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 81.032/pb
+        [322013, 322014], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 7.816/pb
+        [322022, 322022], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 452.969/pb
+        [322040, 322040], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 13.692/pb
+        [322057, 322057], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 8.235/pb
+        [322068, 322068], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 232.599/pb
+        [322079, 322079], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 140.245/pb
+        [322106, 322106], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 281.859/pb
+        [322113, 322113], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 40.79/pb
+        [322118, 322118], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 268.229/pb
+        [322179, 322179], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 469.75/pb
+        [322201, 322201], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 84.335/pb
+        [322204, 322204], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 311.166/pb
+        [322222, 322222], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 92.744/pb
+        [322252, 322252], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 420.358/pb
+        [322317, 322317], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 19.246/pb
+        [322319, 322319], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 55.502/pb
+        [322322, 322322], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 292.464/pb
+        [322324, 322324], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 69.26/pb
+        [322332, 322332], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 313.996/pb
+        [322348, 322348], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 414.112/pb
+        [322355, 322356], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 268.46/pb
+        [322381, 322381], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 178.73/pb
+        [322407, 322407], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 169.958/pb
+        [322430, 322431], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 370.371/pb
+        [322480, 322480], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 109.337/pb
+        [322492, 322492], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 287.515/pb
+        [322510, 322510], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 2.229/pb
+        [322599, 322599], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 94.351/pb
+        [322602, 322603], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 26.803/pb
+        [322605, 322605], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 89.624/pb
+        [322617, 322617], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 136.646/pb
+        [322625, 322625], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 335.273/pb
+        [322633, 322633], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 50.946/pb
+        [323414, 323414], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 6.204/pb
+        [323423, 323423], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 21.037/pb
+        [323470, 323475], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 321.533/pb
+        [323487, 323488], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 340.364/pb
+        [323492, 323493], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 33.198/pb
+        [323495, 323495], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 32.347/pb
+        [323524, 323526], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 480.533/pb
+        [323693, 323693], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 40.083/pb
+        [323696, 323696], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 88.848/pb
+        [323702, 323702], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 145.958/pb
+        [323725, 323727], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 380.043/pb
+        [323755, 323755], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 296.639/pb
+        [323775, 323775], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 46.768/pb
+        [323778, 323778], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 270.936/pb
+        [323790, 323790], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 276.737/pb
+        [323794, 323794], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 16.057/pb
+        [323841, 323841], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 155.038/pb
+        [323857, 323857], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 95.513/pb
+        [323940, 323940], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 426.706/pb
+        [323954, 323954], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 15.141/pb
+        [323976, 323976], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 14.399/pb
+        [323978, 323978], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 21.952/pb
+        [323980, 323980], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 67.732/pb
+        [323983, 323983], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 56.791/pb
+        [323997, 323997], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 128.792/pb
+        [324021, 324022], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 380.271/pb
+        [324077, 324077], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 242.583/pb
+        [324201, 324202], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 402.099/pb
+        [324205, 324207], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 44.541/pb
+        [324209, 324209], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 16.079/pb
+        [324237, 324237], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 74.992/pb
+        [324245, 324245], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 417.199/pb
+        [324293, 324293], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 513.035/pb
+        [324315, 324315], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 70.437/pb
+        [324318, 324318], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 99.84/pb
+        [324420, 324420], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 199.727/pb
+        [324729, 324729], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 14.797/pb
+        [324747, 324747], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 308.246/pb
+        [324764, 324765], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 117.745/pb
+        [324769, 324769], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 46.77/pb
+        [324772, 324772], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 18.783/pb
+        [324785, 324785], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 185.798/pb
+        [324791, 324791], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 245.007/pb
+        [324835, 324835], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 85.856/pb
+        [324840, 324841], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 328.73/pb
+        [324846, 324846], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 68.553/pb
+        [324878, 324878], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 403.017/pb
+        [324897, 324897], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 50.229/pb
+        [324970, 324970], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 479.466/pb
+        [324980, 324980], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 513.295/pb
+        [324997, 325001], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 370.507/pb
+        [325022, 325022], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 433.386/pb
+        [325057, 325057], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 120.048/pb
+        [325097, 325101], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 351.717/pb
+        [325110, 325110], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 3.259/pb
+        [325117, 325117], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 85.217/pb
+        [325159, 325159], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 61.44/pb
+        [325168, 325170], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 273.009/pb
+        [325172, 325172], # HLT_DoubleMediumChargedIsoPFTauHPS35_Trk1_eta2p1_Reg_v4, 67.636/pb
+      ],
+    },
+  ],
+}
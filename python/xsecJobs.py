@@ -0,0 +1,242 @@
+from tthAnalysis.NanoAOD.processUtils import kill_process_tree
+
+import collections
+import csv
+import json
+import logging
+import math
+import os
+import subprocess
+import threading
+import time
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue
+
+RESULT_FIELDS = [
+  'sample_name', 'dbs_key', 'nof_files', 'nof_chunks', 'nof_failed_chunks', 'chunk_returncodes', 'expected_xs', 'xs',
+  'xs_err', 'xs_units', 'status', 'returncode', 'time',
+]
+
+# same format as the final result printed by GenXSecAnalyzer, so that the combined result is parsed by parse_xs()
+XS_SUMMARY_LINE = 'After filter: final cross section = {:.6e} +- {:.6e} {}\n'
+# marks the chunks that failed, in both modes, so that the sample is not skipped when rerun
+FAILED_CHUNK_LINE = 'Failed chunk: {} (exit code {})\n'
+
+def parse_xs(cmsrun_logfile):
+  """Returns the cross section, its uncertainty and its units from the log of GenXSecAnalyzer, or None if not found
+  """
+  xs_actual = -1.
+  xs_err_actual = -1.
+  xs_units = ''
+  with open(cmsrun_logfile, 'r') as f:
+    for line in f:
+      if line.startswith('After filter: final cross section'):
+        line_stripped = line.rstrip('\n')
+        line_split = line_stripped.split()
+        if len(line_split) != 10:
+          logging.error('Unexpected line: %s' % line_stripped)
+          continue
+        try:
+          xs_actual = float(line_split[6])
+          xs_err_actual = float(line_split[8])
+          xs_units = line_split[9]
+        except:
+          logging.error('Unable to parse line: %s' % line_stripped)
+  if xs_actual > 0. and xs_err_actual > 0.:
+    return xs_actual, xs_err_actual, xs_units
+  return None
+
+def combine_xs(xs_results):
+  """Combines the cross sections measured on independent chunks of a sample, weighting them by their inverse variance
+  """
+  xs_units = set(xs_unit for _, _, xs_unit in xs_results)
+  if len(xs_units) != 1:
+    raise RuntimeError('Cannot combine cross sections in different units: %s' % ', '.join(sorted(xs_units)))
+  weights = [ 1. / xs_err ** 2 for _, xs_err, _ in xs_results ]
+  xs = sum(weight * xs for weight, ( xs, _, _ ) in zip(weights, xs_results)) / sum(weights)
+  return xs, 1. / math.sqrt(sum(weights)), xs_units.pop()
+
+def has_failed_chunks(cmsrun_logfile):
+  if not os.path.isfile(cmsrun_logfile):
+    return False
+  with open(cmsrun_logfile, 'r') as f:
+    return any(line.startswith(FAILED_CHUNK_LINE.split(':')[0]) for line in f)
+
+def print_xs(sample_name, sample_entry):
+  cmsrun_logfile = sample_entry['logfile']
+  if not os.path.isfile(cmsrun_logfile):
+    logging.warning('Could not find {}'.format(cmsrun_logfile))
+    return False
+  xs_result = parse_xs(cmsrun_logfile)
+  if xs_result:
+    sample_entry['xs'], sample_entry['xs_err'], sample_entry['xs_units'] = xs_result
+    logging.warning(
+      'Expected xs of {:.6f} pb in sample {}, and measured {:.6f} +/- {:.6f} {}'.format(
+        sample_entry['expected_xs'], sample_name, *xs_result
+      )
+    )
+    return True
+  else:
+    logging.error('Unable to parse file %s for cross sections' % cmsrun_logfile)
+    return False
+
+class JobPipeline(object):
+  """Runs the xsecAnalyzer jobs in a fixed number of threads while the jobs are still being submitted
+
+  The jobs are passed to the threads through a bounded queue, so that the submission blocks if all threads are
+  busy and the queue is full. The log of each job is parsed as soon as the job finishes, and a summary of all jobs
+  is logged after every change in their state.
+  """
+
+  def __init__(self, nof_threads, nof_samples, target_uncertainty = 0.):
+    self.jobs = queue.Queue(maxsize = 2 * nof_threads)
+    self.nof_samples = nof_samples
+    self.target_uncertainty = target_uncertainty
+    self.counts = collections.Counter()
+    self.lock = threading.Lock()
+    self.processes = {}
+    self.stopped = threading.Event()
+    self.workers = [ threading.Thread(target = self.work) for _ in range(nof_threads) ]
+    for worker in self.workers:
+      worker.daemon = True
+      worker.start()
+
+  def update(self, status_from, status_to):
+    with self.lock:
+      if status_from:
+        self.counts[status_from] -= 1
+      self.counts[status_to] += 1
+      summary = self.summary()
+    logging.info(summary)
+
+  def summary(self):
+    return 'Listed {}/{} samples: {} queued, {} running, {} done, {} partial, {} failed, {} skipped'.format(
+      sum(self.counts.values()), self.nof_samples, self.counts['queued'], self.counts['running'],
+      self.counts['done'], self.counts['partial'], self.counts['failed'], self.counts['skipped']
+    )
+
+  def submit(self, sample_name, sample_entry):
+    self.update('', 'queued')
+    self.jobs.put((sample_name, sample_entry))
+
+  def work(self):
+    while True:
+      job = self.jobs.get()
+      try:
+        if job is None:
+          return
+        if not self.stopped.is_set():
+          self.run(*job)
+      finally:
+        self.jobs.task_done()
+
+  def run_chunk(self, sample_name, cmd, logfile_name):
+    with open(logfile_name, 'w') as logfile:
+      process = subprocess.Popen(cmd, stdout = logfile, stderr = subprocess.STDOUT)
+      with self.lock:
+        self.processes[sample_name] = process
+      returncode = process.wait()
+      with self.lock:
+        del self.processes[sample_name]
+    if returncode != 0:
+      logging.error('cmsRun exited with code {} for sample {}, see {}'.format(returncode, sample_name, logfile_name))
+    return returncode
+
+  def run(self, sample_name, sample_entry):
+    """Runs the chunks of the sample one after another until the combined cross section is precise enough"""
+    self.update('queued', 'running')
+    logging.info('Running cmsRun for {}'.format(sample_name))
+    t_start = time.time()
+    xs_results = []
+    xs_combined = None
+    sample_entry['returncode'] = 0
+    sample_entry['nof_chunks'] = 0
+    sample_entry['nof_failed_chunks'] = 0
+    sample_entry['chunk_returncodes'] = []
+    failed_chunks = []
+    for cmd, logfile_name in sample_entry['chunks']:
+      if self.stopped.is_set():
+        break
+      returncode = self.run_chunk(sample_name, cmd, logfile_name)
+      sample_entry['nof_chunks'] += 1
+      sample_entry['chunk_returncodes'].append(returncode)
+      if returncode != 0:
+        sample_entry['returncode'] = returncode
+        sample_entry['nof_failed_chunks'] += 1
+        failed_chunks.append(sample_entry['nof_chunks'] - 1)
+        continue
+      xs_result = parse_xs(logfile_name)
+      if not xs_result:
+        logging.error('Unable to parse file %s for cross sections' % logfile_name)
+        sample_entry['nof_failed_chunks'] += 1
+        failed_chunks.append(sample_entry['nof_chunks'] - 1)
+        continue
+      xs_results.append(xs_result)
+      xs_combined = combine_xs(xs_results)
+      xs_rel_err = xs_combined[1] / xs_combined[0]
+      if self.target_uncertainty > 0.:
+        logging.info('Measured {:.6f} +/- {:.6f} {} ({:.2f}%) in sample {} after {}/{} chunks'.format(
+          xs_combined[0], xs_combined[1], xs_combined[2], 100. * xs_rel_err, sample_name, sample_entry['nof_chunks'],
+          len(sample_entry['chunks'])
+        ))
+        if xs_rel_err < self.target_uncertainty:
+          break
+    sample_entry['time'] = time.time() - t_start
+    if self.target_uncertainty > 0.:
+      # the combined result of the chunks is stored in the same format as the output of a single job
+      with open(sample_entry['logfile'], 'w') as logfile:
+        for xs_result in xs_results:
+          logfile.write('Chunk: ' + XS_SUMMARY_LINE.format(*xs_result))
+        for chunk_idx in failed_chunks:
+          logfile.write(FAILED_CHUNK_LINE.format(chunk_idx, sample_entry['chunk_returncodes'][chunk_idx]))
+        if xs_combined:
+          logfile.write(XS_SUMMARY_LINE.format(*xs_combined))
+    elif failed_chunks:
+      # the log of the single job may still contain a cross section, which must not be reused when rerun
+      with open(sample_entry['logfile'], 'a') as logfile:
+        logfile.write(FAILED_CHUNK_LINE.format(0, sample_entry['chunk_returncodes'][0]))
+    # a cross section that has been combined from only some of the chunks is not a clean measurement
+    has_xs = print_xs(sample_name, sample_entry)
+    if not has_xs:
+      sample_entry['status'] = 'failed'
+    elif sample_entry['nof_failed_chunks'] or sample_entry['returncode'] != 0:
+      logging.error('{}/{} chunk(s) of sample {} failed'.format(
+        sample_entry['nof_failed_chunks'], sample_entry['nof_chunks'], sample_name
+      ))
+      sample_entry['status'] = 'partial' if self.target_uncertainty > 0. else 'failed'
+    else:
+      sample_entry['status'] = 'done'
+    self.update('running', sample_entry['status'])
+
+  def close(self):
+    """Waits until all submitted jobs have finished"""
+    for _ in self.workers:
+      self.jobs.put(None)
+    for worker in self.workers:
+      while worker.is_alive():
+        worker.join(1)
+
+  def kill(self):
+    self.stopped.set()
+    with self.lock:
+      processes = list(self.processes.values())
+    for process in processes:
+      kill_process_tree(process.pid)
+
+def write_results(results_fn, samples):
+  results = [
+    collections.OrderedDict(
+      [ ( 'sample_name', sample_name ) ] + [ ( field, sample_entry.get(field) ) for field in RESULT_FIELDS[1:] ]
+    ) for sample_name, sample_entry in samples.items()
+  ]
+  with open(results_fn, 'w') as results_file:
+    if results_fn.endswith('.csv'):
+      writer = csv.DictWriter(results_file, fieldnames = RESULT_FIELDS)
+      writer.writeheader()
+      writer.writerows(results)
+    else:
+      json.dump(results, results_file, indent = 2)
+  logging.info('Wrote file {}'.format(results_fn))
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+
+# Replays the dataset catalog in test/datasets/txt through the dataset tools with the fake dasgoclient, and reports
+# the number of DAS queries, the wall time and the DAS cache hit ratio of each tool. Every tool runs twice: first
+# with an empty DAS cache, then with the cache filled by the first run. The responses have to be recorded once with
+# a valid grid proxy, after which the benchmark runs offline. Example usage:
+#
+# benchmark_das_tools.py -f fixtures.sqlite -R                  # record the responses of the real dasgoclient
+# benchmark_das_tools.py -f fixtures.sqlite -l 0.2 -o bench.json # replay them with 200 ms latency per query
+
+from tthAnalysis.NanoAOD.dasReplay import read_log, FixtureStore, LATENCY_RECORDED, DASGOCLIENT_NAME, \
+                                          REPLAY_FIXTURES_ENV, REPLAY_MODE_ENV, REPLAY_LATENCY_ENV, REPLAY_LOG_ENV
+from tthAnalysis.NanoAOD.dasQuery import DASGOCLIENT_ENV
+from tthAnalysis.NanoAOD.cacheUtils import CACHE_DIR_ENV
+
+import argparse
+import collections
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+logging.basicConfig(
+  stream = sys.stdout,
+  level  = logging.INFO,
+  format = '%(asctime)s - %(levelname)s: %(message)s'
+)
+
+TOOLS = [ 'find_nano_datasets', 'findParentDatasets', 'dump_xs', 'count_lumis', 'parse_lumiblock_errors' ]
+PASSES = [ 'cold', 'warm' ]
+
+# the proxy is checked by the tools before they query DAS
+FAKE_PROXY = '#!/bin/sh\necho 999999\n'
+
+class SmartFormatter(argparse.HelpFormatter):
+  def _split_lines(self, text, width):
+    if text.startswith('R|'):
+      return text[2:].splitlines()
+    return argparse.HelpFormatter._split_lines(self, text, width)
+
+def get_default_catalog():
+  return os.path.join(os.environ.get('CMSSW_BASE', ''), 'src', 'tthAnalysis', 'NanoAOD', 'test', 'datasets', 'txt')
+
+def find_tool(name):
+  # the scripts are installed next to each other
+  sibling = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+  return sibling if os.path.isfile(sibling) else name
+
+def read_catalog(catalog_dir, max_datasets):
+  """Returns the lines of the MINIAOD(SIM) datasets of each catalog file"""
+  if not os.path.isdir(catalog_dir):
+    raise ValueError("No such directory: %s" % catalog_dir)
+  catalog = collections.OrderedDict()
+  nof_datasets = 0
+  for catalog_fn in sorted(os.listdir(catalog_dir)):
+    if not catalog_fn.endswith('.txt'):
+      continue
+    lines = []
+    with open(os.path.join(catalog_dir, catalog_fn), 'r') as catalog_file:
+      for line in catalog_file:
+        line_split = line.split()
+        if not line_split or not line_split[0].startswith('/') or not line_split[0].endswith(('/MINIAOD', '/MINIAODSIM')):
+          continue
+        if max_datasets > 0 and nof_datasets >= max_datasets:
+          break
+        lines.append(line)
+        nof_datasets += 1
+    if lines:
+      catalog[catalog_fn] = lines
+  return catalog
+
+def prepare_work_dir(work_dir, catalog, replay):
+  """Writes the inputs of the tools and the fake executables into the work directory"""
+  input_dir = os.path.join(work_dir, 'inputs')
+  bin_dir = os.path.join(work_dir, 'bin')
+  for dir_name in [ input_dir, bin_dir ]:
+    if not os.path.isdir(dir_name):
+      os.makedirs(dir_name)
+
+  input_fns = []
+  miniaodsim_lines = collections.OrderedDict()
+  for catalog_fn, lines in catalog.items():
+    input_fn = os.path.join(input_dir, catalog_fn)
+    with open(input_fn, 'w') as input_file:
+      input_file.write(''.join(lines))
+    input_fns.append(input_fn)
+    for line in lines:
+      dataset = line.split()[0]
+      if dataset.endswith('/MINIAODSIM'):
+        miniaodsim_lines.setdefault(dataset, line)
+  miniaodsim_fn = os.path.join(input_dir, 'miniaodsim.txt')
+  with open(miniaodsim_fn, 'w') as miniaodsim_file:
+    miniaodsim_file.write(''.join(miniaodsim_lines.values()))
+
+  dasgoclient = os.path.join(bin_dir, DASGOCLIENT_NAME)
+  if os.path.lexists(dasgoclient):
+    os.remove(dasgoclient)
+  os.symlink(os.path.abspath(find_tool('fake_dasgoclient.py')), dasgoclient)
+  if replay:
+    proxy_fn = os.path.join(bin_dir, 'voms-proxy-info')
+    with open(proxy_fn, 'w') as proxy_file:
+      proxy_file.write(FAKE_PROXY)
+    os.chmod(proxy_fn, 0o755)
+  return input_fns, list(miniaodsim_lines.keys()), miniaodsim_fn, bin_dir
+
+def get_commands(tool, work_dir, input_fns, miniaodsims, miniaodsim_fn):
+  """Returns the commands of the tool, as a list of ( command, header written to the log before the command )"""
+  if tool == 'find_nano_datasets':
+    return [ ( [ find_tool('find_nano_datasets.py'), '-i' ] + input_fns, '' ) ]
+  if tool == 'findParentDatasets':
+    return [ ( [ find_tool('findParentDatasets.py'), '-i', miniaodsim_fn ], '' ) ]
+  if tool == 'dump_xs':
+    return [ (
+      [ find_tool('dump_xs.py'), '-i', miniaodsim_fn, '-o', os.path.join(work_dir, 'dump_xs'), '-g', 'auto', '-s' ],
+      ''
+    ) ]
+  if tool == 'count_lumis':
+    # same as count_lumis_datasets.sh
+    return [
+      ( [ find_tool('count_lumis.sh'), '-d', dataset, '-v' ], 'Checking {} ...\n'.format(dataset) )
+      for dataset in miniaodsims
+    ]
+  if tool == 'parse_lumiblock_errors':
+    return [ ( [ find_tool('parse_lumiblock_errors.py'), '-i', os.path.join(work_dir, 'count_lumis_cold.log') ], '' ) ]
+  raise ValueError("Invalid tool: %s" % tool)
+
+def run_tool(tool, commands, env, log_fn):
+  replay_log_fn = env[REPLAY_LOG_ENV]
+  if os.path.isfile(replay_log_fn):
+    os.remove(replay_log_fn)
+  nof_failures = 0
+  t_start = time.time()
+  with open(log_fn, 'w') as log_file:
+    for cmd, header in commands:
+      log_file.write(header)
+      log_file.flush()
+      if subprocess.call(cmd, stdout = log_file, stderr = subprocess.STDOUT, env = env) != 0:
+        nof_failures += 1
+  wall_time = time.time() - t_start
+  if nof_failures:
+    logging.warning("{} out of {} command(s) of {} failed, see {}".format(nof_failures, len(commands), tool, log_fn))
+  stats = read_log(replay_log_fn)
+  return collections.OrderedDict([
+    ( 'queries',   stats['hit'] + stats['miss'] + stats['record'] ),
+    ( 'unique',    stats['unique']                                ),
+    ( 'misses',    stats['miss']                                  ),
+    ( 'recorded',  stats['record']                                ),
+    ( 'wall_time', wall_time                                      ),
+    ( 'failures',  nof_failures                                   ),
+  ])
+
+def get_hit_ratio(result_cold, result_warm):
+  """Fraction of the DAS queries of the first run that were answered from the DAS cache in the second run"""
+  if not result_cold['queries']:
+    return None
+  return max(1. - float(result_warm['queries']) / result_cold['queries'], 0.)
+
+def print_results(results):
+  print('{:<24} {:<5} {:>8} {:>8} {:>8} {:>12} {:>10}'.format(
+    'tool', 'pass', 'queries', 'unique', 'misses', 'wall time', 'cache hits'
+  ))
+  for tool, tool_results in results.items():
+    for pass_name, result in tool_results.items():
+      hit_ratio = result.get('cache_hit_ratio')
+      print('{:<24} {:<5} {:>8} {:>8} {:>8} {:>10.2f} s {:>10}'.format(
+        tool, pass_name, result['queries'], result['unique'], result['misses'], result['wall_time'],
+        '{:.1f}%'.format(100. * hit_ratio) if hit_ratio is not None else '-'
+      ))
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+    formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
+  )
+  parser.add_argument('-f', '--fixtures', dest = 'fixtures', metavar = 'file', required = True, type = str,
+                      help = 'R|SQLite database of the recorded DAS responses')
+  parser.add_argument('-R', '--record', dest = 'record', action = 'store_true', default = False,
+                      help = 'R|Record the responses that are missing from the database with the real dasgoclient')
+  parser.add_argument('-l', '--latency', dest = 'latency', metavar = 'seconds', required = False, type = str,
+                      default = '0',
+                      help = 'R|Delay of each replayed response in seconds, or \'%s\'' % LATENCY_RECORDED)
+  parser.add_argument('-c', '--catalog', dest = 'catalog', metavar = 'path', required = False, type = str,
+                      default = get_default_catalog(),
+                      help = 'R|Directory of the dataset lists')
+  parser.add_argument('-n', '--max-datasets', dest = 'max_datasets', metavar = 'int', required = False, type = int,
+                      default = 0,
+                      help = 'R|Maximum number of datasets to consider (default: all)')
+  parser.add_argument('-t', '--tools', dest = 'tools', metavar = 'name', required = False, type = str, nargs = '+',
+                      choices = TOOLS, default = TOOLS,
+                      help = 'R|Tools to benchmark (choices: %s)' % ', '.join(TOOLS))
+  parser.add_argument('-w', '--work-dir', dest = 'work_dir', metavar = 'path', required = False, type = str,
+                      default = '',
+                      help = 'R|Directory of the inputs, outputs and logs (default: temporary directory)')
+  parser.add_argument('-o', '--output', dest = 'output', metavar = 'file', required = False, type = str, default = '',
+                      help = 'R|Output JSON file of the results')
+  args = parser.parse_args()
+
+  if 'parse_lumiblock_errors' in args.tools and 'count_lumis' not in args.tools:
+    raise ValueError("Benchmarking parse_lumiblock_errors requires the output of count_lumis")
+
+  catalog = read_catalog(args.catalog, args.max_datasets)
+  logging.info("Found {} dataset(s) in {} file(s) of {}".format(
+    sum(map(len, catalog.values())), len(catalog), args.catalog
+  ))
+
+  work_dir = os.path.abspath(args.work_dir) if args.work_dir else tempfile.mkdtemp(prefix = 'benchmark_das_')
+  input_fns, miniaodsims, miniaodsim_fn, bin_dir = prepare_work_dir(work_dir, catalog, not args.record)
+  logging.info("Using work directory: {}".format(work_dir))
+
+  fixtures_fn = os.path.abspath(args.fixtures)
+  if not args.record and not os.path.isfile(fixtures_fn):
+    raise ValueError("No such file: %s" % fixtures_fn)
+
+  env = dict(os.environ)
+  env.update({
+    'PATH'              : os.pathsep.join([ bin_dir, env.get('PATH', '') ]),
+    DASGOCLIENT_ENV     : os.path.join(bin_dir, DASGOCLIENT_NAME),
+    REPLAY_FIXTURES_ENV : fixtures_fn,
+    REPLAY_MODE_ENV     : 'record' if args.record else 'replay',
+    REPLAY_LATENCY_ENV  : args.latency,
+    REPLAY_LOG_ENV      : os.path.join(work_dir, 'queries.log'),
+  })
+
+  results = collections.OrderedDict()
+  for tool in [ tool for tool in TOOLS if tool in args.tools ]:
+    results[tool] = collections.OrderedDict()
+    cache_dir = os.path.join(work_dir, 'cache_{}'.format(tool))
+    if os.path.isdir(cache_dir):
+      shutil.rmtree(cache_dir)
+    env[CACHE_DIR_ENV] = cache_dir
+    commands = get_commands(tool, work_dir, input_fns, miniaodsims, miniaodsim_fn)
+    for pass_name in PASSES:
+      logging.info("Running {} ({} pass)".format(tool, pass_name))
+      log_fn = os.path.join(work_dir, '{}_{}.log'.format(tool, pass_name))
+      results[tool][pass_name] = run_tool(tool, commands, env, log_fn)
+    results[tool]['warm']['cache_hit_ratio'] = get_hit_ratio(results[tool]['cold'], results[tool]['warm'])
+
+  store = FixtureStore(fixtures_fn)
+  logging.info("The fixture database contains {} response(s)".format(len(store)))
+  store.close()
+
+  print_results(results)
+  if args.output:
+    with open(args.output, 'w') as output_file:
+      json.dump(results, output_file, indent = 2)
+    logging.info("Wrote file: {}".format(args.output))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# Compares the NanoAOD candidate search of find_nano_datasets.py against a linear scan over all NanoAOD datasets,
+# using a synthetic list of datasets. Example usage:
+#
+# benchmark_nano_matching.py -n 50000 -m 800
+
+from tthAnalysis.NanoAOD.nanoMatching import NanoAODIndex, get_nanoaod_pattern
+
+import argparse
+import logging
+import random
+import sys
+import time
+
+logging.basicConfig(
+  stream = sys.stdout,
+  level  = logging.INFO,
+  format = '%(asctime)s - %(levelname)s: %(message)s'
+)
+
+DATA_STR = 'Nano25Oct2019'
+MC_STR = 'NanoAODv6'
+
+MC_CAMPAIGNS = [
+  ( 'RunIISummer16MiniAODv3', '94X_mcRun2_asymptotic_v3' ),
+  ( 'RunIIFall17MiniAODv2',   'PU2017_12Apr2018_94X_mc2017_realistic_v14' ),
+  ( 'RunIIAutumn18MiniAOD',   '102X_upgrade2018_realistic_v15' ),
+]
+MC_NANO_VERSIONS = [ 'NanoAODv4', 'NanoAODv5', 'NanoAODv6', 'NanoAODv7' ]
+DATA_ERAS = [ 'Run2016B', 'Run2016C', 'Run2017B', 'Run2017C', 'Run2018A', 'Run2018B' ]
+DATA_NANO_VERSIONS = [ 'Nano1June2019', 'Nano25Oct2019', 'Nano02Apr2020' ]
+
+class SmartFormatter(argparse.HelpFormatter):
+  def _split_lines(self, text, width):
+    if text.startswith('R|'):
+      return text[2:].splitlines()
+    return argparse.HelpFormatter._split_lines(self, text, width)
+
+def generate_datasets(nof_nanoaods, nof_miniaods, rng):
+  dbs_nano = {}
+  miniaods = []
+  primary_idx = 0
+  while len(dbs_nano) < nof_nanoaods:
+    is_data = rng.random() < 0.1
+    primary_dataset = 'Primary{}_TuneCP5_13TeV-madgraph'.format(primary_idx) if not is_data else \
+                      'DataStream{}'.format(primary_idx)
+    primary_idx += 1
+    if is_data:
+      era = rng.choice(DATA_ERAS)
+      for nano_version in DATA_NANO_VERSIONS:
+        dbs_nano['/{}/{}-{}-v1/NANOAOD'.format(primary_dataset, era, nano_version)] = 'VALID'
+      miniaods.append('/{}/{}-17Jul2018-v1/MINIAOD'.format(primary_dataset, era))
+    else:
+      campaign, conditions = rng.choice(MC_CAMPAIGNS)
+      for nano_version in MC_NANO_VERSIONS:
+        nano_campaign = campaign.replace('MiniAODv3', nano_version).replace('MiniAODv2', nano_version) \
+                                .replace('MiniAOD', nano_version)
+        dbs_nano['/{}/{}-Nano25Oct2019_{}-v1/NANOAODSIM'.format(primary_dataset, nano_campaign, conditions)] = 'VALID'
+      miniaods.append('/{}/{}-{}-v1/MINIAODSIM'.format(primary_dataset, campaign, conditions))
+  return dbs_nano, rng.sample(miniaods, min(nof_miniaods, len(miniaods)))
+
+def find_candidates_linear(miniaods, dbs_nano):
+  result = {}
+  for miniaod in miniaods:
+    _, nanoaod_re = get_nanoaod_pattern(miniaod, DATA_STR, MC_STR)
+    result[miniaod] = [ nanoaod for nanoaod in dbs_nano if nanoaod_re.match(nanoaod) ]
+  return result
+
+def find_candidates_indexed(miniaods, dbs_nano):
+  nanoaod_index = NanoAODIndex(dbs_nano)
+  return { miniaod : nanoaod_index.find_candidates(miniaod, DATA_STR, MC_STR) for miniaod in miniaods }
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+    formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
+  )
+  parser.add_argument('-n', '--nanoaods', dest = 'nanoaods', metavar = 'int', required = False, type = int,
+                      default = 50000,
+                      help = 'R|Number of synthetic NanoAOD datasets')
+  parser.add_argument('-m', '--miniaods', dest = 'miniaods', metavar = 'int', required = False, type = int,
+                      default = 800,
+                      help = 'R|Number of MINIAOD(SIM) datasets to match')
+  parser.add_argument('-s', '--seed', dest = 'seed', metavar = 'int', required = False, type = int, default = 12345,
+                      help = 'R|Seed of the synthetic datasets')
+  args = parser.parse_args()
+
+  dbs_nano, miniaods = generate_datasets(args.nanoaods, args.miniaods, random.Random(args.seed))
+  logging.info('Matching {} MINIAOD(SIM) datasets against {} NanoAOD datasets'.format(len(miniaods), len(dbs_nano)))
+
+  timings = {}
+  results = {}
+  for label, func in [ ( 'linear scan', find_candidates_linear ), ( 'indexed', find_candidates_indexed ) ]:
+    t_start = time.time()
+    results[label] = func(miniaods, dbs_nano)
+    timings[label] = time.time() - t_start
+    logging.info('{:<11}: {:.3f} s'.format(label, timings[label]))
+
+  if results['linear scan'] != results['indexed']:
+    raise RuntimeError("The indexed search found different candidates than the linear scan")
+  logging.info('Speedup: {:.1f}x'.format(timings['linear scan'] / timings['indexed']))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+# Measures the wall time and the peak memory usage of building and querying the trigger tables
+#
+# Each measurement runs in a fresh python interpreter, so that the module cache of the previous measurement does
+# not affect the next one. Example usage:
+#
+# benchmark_triggers.py -e 2017 2018 -n 10
+# benchmark_triggers.py -e 2018 -r runs_2018.txt
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+
+logging.basicConfig(
+  stream = sys.stdout,
+  level  = logging.INFO,
+  format = '%(asctime)s - %(levelname)s: %(message)s'
+)
+
+ERAS = [ '2016', '2017', '2018' ]
+RUN_RANGES = {
+  '2016' : [ 273150, 284044 ],
+  '2017' : [ 297047, 306462 ],
+  '2018' : [ 315257, 325175 ],
+}
+
+# the peak RSS covers the whole interpreter, including the setup; ru_maxrss is in kB on Linux
+TIMER_TEMPLATE = '''
+import json
+import resource
+import time
+{setup}
+t_start = time.time()
+{stmt}
+t_end = time.time()
+print(json.dumps({{ 'time' : t_end - t_start, 'rss' : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss }}))
+'''
+
+SETUP_TRIGGERS = 'from tthAnalysis.NanoAOD.triggers import Triggers'
+SETUP_TRIGGERS_OBJ = SETUP_TRIGGERS + '\ntriggers = Triggers("{era}")'
+SETUP_RUNS_SYNTHETIC = '''
+import random
+random.seed({seed})
+runs = [ random.randint({run_min}, {run_max}) for _ in range({nof_runs}) ]
+'''
+SETUP_RUNS_RECORDED = '''
+with open({runs_file!r}, 'r') as runs_file:
+  runs = [ int(line) for line in runs_file if line.strip() ]
+'''
+# triggers_flat is the union of the flat sets of the analysis and the fake-rate tables, as built by Triggers
+STMT_TRIGGERS_FLAT = 'triggers.build_flat_sets()'
+STMT_MEMBERSHIP = '''
+for run in runs:
+  triggers.active_paths(run)
+'''
+
+class SmartFormatter(argparse.HelpFormatter):
+  def _split_lines(self, text, width):
+    if text.startswith('R|'):
+      return text[2:].splitlines()
+    return argparse.HelpFormatter._split_lines(self, text, width)
+
+def get_benchmarks(eras, runs_file, nof_runs, seed):
+  benchmarks = [
+    ( 'import triggers', '', 'import tthAnalysis.NanoAOD.triggers' ),
+    ( 'import LeptonFakeRate_trigger_cfi', '', 'import tthAnalysis.NanoAOD.LeptonFakeRate_trigger_cfi' ),
+  ]
+  for era in eras:
+    if runs_file:
+      setup_runs = SETUP_RUNS_RECORDED.format(runs_file = runs_file)
+      runs_label = os.path.basename(runs_file)
+    else:
+      setup_runs = SETUP_RUNS_SYNTHETIC.format(
+        seed = seed, run_min = RUN_RANGES[era][0], run_max = RUN_RANGES[era][1], nof_runs = nof_runs,
+      )
+      runs_label = '{} random runs'.format(nof_runs)
+    benchmarks.extend([
+      (
+        'Triggers({})'.format(era),
+        SETUP_TRIGGERS,
+        'Triggers("{}")'.format(era),
+      ),
+      (
+        'Triggers({}).triggers_flat'.format(era),
+        SETUP_TRIGGERS_OBJ.format(era = era),
+        STMT_TRIGGERS_FLAT,
+      ),
+      (
+        'Triggers({}).active_paths() over {}'.format(era, runs_label),
+        SETUP_TRIGGERS_OBJ.format(era = era) + setup_runs,
+        STMT_MEMBERSHIP,
+      ),
+      (
+        'leptonFR_triggers[{}]'.format(era),
+        'from tthAnalysis.NanoAOD.LeptonFakeRate_trigger_cfi import leptonFR_triggers',
+        'leptonFR_triggers["{}"]'.format(era),
+      ),
+    ])
+  return benchmarks
+
+def measure(setup, stmt, python, env):
+  cmd = subprocess.Popen(
+    [ python, '-c', TIMER_TEMPLATE.format(setup = setup, stmt = stmt) ],
+    stdout = subprocess.PIPE, stderr = subprocess.PIPE, env = env,
+  )
+  stdout, stderr = cmd.communicate()
+  if cmd.returncode != 0:
+    raise RuntimeError("Caught an error while timing '%s': %s" % (stmt.strip(), stderr))
+  result = json.loads(stdout.decode().strip().split('\n')[-1])
+  return result['time'], result['rss'] / 1024.
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+    formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
+  )
+  parser.add_argument('-e', '--era', dest = 'era', metavar = 'era', required = False, type = str, nargs = '+',
+                      choices = ERAS, default = ERAS,
+                      help = 'R|Eras to benchmark')
+  parser.add_argument('-n', '--repeat', dest = 'repeat', metavar = 'int', required = False, type = int, default = 5,
+                      help = 'R|Number of times each measurement is repeated')
+  parser.add_argument('-r', '--runs', dest = 'runs', metavar = 'file', required = False, type = str, default = '',
+                      help = 'R|File of recorded run numbers (one per line) used in the membership queries')
+  parser.add_argument('-N', '--nof-runs', dest = 'nof_runs', metavar = 'int', required = False, type = int,
+                      default = 10000,
+                      help = 'R|Number of synthetic run numbers used in the membership queries')
+  parser.add_argument('-s', '--seed', dest = 'seed', metavar = 'int', required = False, type = int, default = 12345,
+                      help = 'R|Seed of the synthetic run numbers')
+  parser.add_argument('-C', '--no-cache', dest = 'no_cache', action = 'store_true', default = False,
+                      help = 'R|Disable the cache of the parsed trigger tables')
+  parser.add_argument('-p', '--python', dest = 'python', metavar = 'path', required = False, type = str,
+                      default = sys.executable,
+                      help = 'R|Python interpreter used in the measurements')
+  args = parser.parse_args()
+
+  if args.repeat < 1:
+    raise ValueError("Invalid number of repetitions: %d" % args.repeat)
+  if args.runs and not os.path.isfile(args.runs):
+    raise ValueError("No such file: %s" % args.runs)
+
+  env = os.environ.copy()
+  if args.no_cache:
+    env['TTH_NANOAOD_CACHE_DIR'] = ''
+
+  benchmarks = get_benchmarks(args.era, os.path.abspath(args.runs) if args.runs else '', args.nof_runs, args.seed)
+  max_width = max(len(label) for label, _, _ in benchmarks)
+  for label, setup, stmt in benchmarks:
+    measurements = [ measure(setup, stmt, args.python, env) for _ in range(args.repeat) ]
+    timings = [ timing for timing, _ in measurements ]
+    logging.info('{}: min {:.2f} ms, mean {:.2f} ms, peak RSS {:.1f} MB'.format(
+      label.ljust(max_width), min(timings) * 1e3, sum(timings) / len(timings) * 1e3,
+      max(rss for _, rss in measurements),
+    ))
@@ -1,15 +1,18 @@
 #!/usr/bin/env python
 
+from tthAnalysis.NanoAOD.dasQuery import DASQueryEngine
+from tthAnalysis.NanoAOD.dasCache import get_das_cache
+from tthAnalysis.NanoAOD.xsecJobs import JobPipeline, has_failed_chunks, print_xs, write_results
+
 import argparse
+import json
 import sys
 import logging
 import os
 import re
 import subprocess
 import jinja2
-import multiprocessing
-import signal
-import psutil
+import multiprocessing.pool
 
 xsecAnalyzer_template = """
 inputFiles = [{% for file_name in file_names %}
@@ -38,17 +41,6 @@ process.schedule = cms.Schedule(process.p)
 
 MAX_NAME_LEN = os.pathconf('/', 'PC_NAME_MAX')
 
-parent_id = os.getpid()
-def handle_worker():
-  def sig_int(signal_num, frame):
-    parent = psutil.Process(parent_id)
-    for child in parent.children():
-      if child.pid != os.getpid():
-        child.kill()
-    parent.kill()
-    psutil.Process(os.getpid()).kill()
-  signal.signal(signal.SIGINT, sig_int)
-
 def run_cmd(command):
   """Runs given commands and logs stdout and stderr to files
   """
@@ -58,39 +50,6 @@ def run_cmd(command):
   stderr = stderr.rstrip('\n')
   return stdout, stderr
 
-def print_xs(cmsrun_logfile):
-  if not os.path.isfile(cmsrun_logfile):
-    logging.warning('Could not find {}'.format(cmsrun_logfile))
-    return False
-  xs_actual = -1.
-  xs_err_actual = -1.
-  xs_units = ''
-  with open(cmsrun_logfile, 'r') as f:
-    for line in f:
-      if line.startswith('After filter: final cross section'):
-        line_stripped = line.rstrip('\n')
-        line_split = line_stripped.split()
-        if len(line_split) != 10:
-          logging.error('Unexpected line: %s' % line_stripped)
-          continue
-        try:
-          xs_actual = float(line_split[6])
-          xs_err_actual = float(line_split[8])
-          xs_units = line_split[9]
-        except:
-          logging.error('Unable to parse line: %s' % line_stripped)
-  if xs_actual > 0. and xs_err_actual > 0.:
-    expected_xs = sample_entry['expected_xs']
-    logging.warning(
-      'Expected xs of {:.6f} pb in sample {}, and measured {:.6f} +/- {:.6f} {}'.format(
-        expected_xs, sample_name, xs_actual, xs_err_actual, xs_units
-      )
-    )
-    return True
-  else:
-    logging.error('Unable to parse file %s for cross sections' % cmsrun_logfile)
-    return False
-
 class SmartFormatter(argparse.HelpFormatter):
   def _split_lines(self, text, width):
     if text.startswith('R|'):
@@ -122,6 +81,24 @@ parser.add_argument('-t', '--threads', dest = 'threads', metavar = 'int', requir
                     help = 'R|Size of the thread pool')
 parser.add_argument('-s', '--skip-jobs', dest = 'skip_jobs', action = 'store_true', default = False,
                     help = 'R|Do not run xsecAnalyzer')
+parser.add_argument('-u', '--target-uncertainty', dest = 'target_uncertainty', metavar = 'float', required = False,
+                    type = float, default = 0.,
+                    help = 'R|Adaptive mode: run the sample in chunks of files and stop as soon as the relative '
+                           'uncertainty\nof the combined cross section drops below this value, e.g. 0.01')
+parser.add_argument('-c', '--chunk-files', dest = 'chunk_files', metavar = 'int', required = False, type = int,
+                    default = 1,
+                    help = 'R|Number of files per chunk in the adaptive mode')
+parser.add_argument('-R', '--results', dest = 'results', metavar = 'file', required = False, type = str, default = '',
+                    help = 'R|Output file of the cross sections, in CSV format if the file name ends with .csv, '
+                           'otherwise in JSON format (default: results.json in the output directory)')
+parser.add_argument('-J', '--das-workers', dest = 'das_workers', metavar = 'int', required = False, type = int,
+                    default = 8,
+                    help = 'R|Maximum number of concurrent DAS queries')
+parser.add_argument('-x', '--dasgoclient', dest = 'dasgoclient', metavar = 'path', required = False, type = str,
+                    default = '',
+                    help = 'R|Path to dasgoclient executable (default: $DASGOCLIENT or dasgoclient)')
+parser.add_argument('-r', '--refresh', dest = 'refresh', action = 'store_true', default = False,
+                    help = 'R|Ignore the cached DAS responses and query DAS again')
 parser.add_argument('-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
                     help = 'R|Enable verbose printout')
 args = parser.parse_args()
@@ -136,6 +113,10 @@ if not os.path.isfile(args.input):
   raise ValueError('No such file: %s' % args.input)
 
 assert(0 < args.threads < 17)
+if args.target_uncertainty < 0. or args.chunk_files < 1:
+  raise ValueError('Invalid target uncertainty or number of files per chunk: %f, %d' % (
+    args.target_uncertainty, args.chunk_files
+  ))
 
 sample_name_regex = re.compile(args.filter)
 
@@ -174,13 +155,25 @@ if timeleft < min_hours * 3600:
     )
   )
 
-dasgo_query = "dasgoclient -query='file dataset=%s'"
-for sample_name, sample_entry in samples.items():
-  dasgo_query_sample = dasgo_query % sample_entry['dbs_key']
-  dasgo_out, dasgo_err = run_cmd(dasgo_query_sample)
-  if dasgo_err and not dasgo_err.startswith('Picked up _JAVA_OPTIONS:'):
-    raise RuntimeError("Could not execute '%s' because: %s" % (dasgo_query_sample, dasgo_err))
-  sample_files = dasgo_out.split('\n')
+das = DASQueryEngine(
+  executable = args.dasgoclient, nof_workers = args.das_workers, cache = get_das_cache(args.refresh)
+)
+def parse_files(lines):
+  return [ line for line in lines if line ]
+
+dasgo_query = "file dataset=%s"
+
+def list_sample(sample):
+  sample_name, sample_entry = sample
+  try:
+    # the file lists are parsed as they are read from dasgoclient
+    return sample_name, das.query_parsed(
+      dasgo_query % sample_entry['dbs_key'], parse_files, serialize = json.dumps, deserialize = json.loads
+    ), ''
+  except RuntimeError as err:
+    return sample_name, [], str(err)
+
+def prepare_job(sample_name, sample_entry, sample_files):
   if not sample_files:
     raise RuntimeError('Found no files for sample %s' % sample_name)
   logging.debug('Found {} files for sample {}'.format(len(sample_files), sample_name))
@@ -194,37 +187,68 @@ for sample_name, sample_entry in samples.items():
   sample_output_dir = os.path.join(args.output, sample_name)
   if not os.path.isdir(sample_output_dir):
     os.makedirs(sample_output_dir)
-  cmsrun_logfile = os.path.join(sample_output_dir, 'out.log')
-  cmsrun_script = os.path.join(sample_output_dir, 'xsecAnalyzer.py')
-  cmsrun_contents = jinja2.Template(xsecAnalyzer_template).render(
-    file_names = sample_files,
-    global_tag = args.global_tag,
-    max_events = args.max_events,
-  )
-  with open(cmsrun_script, 'w') as f:
-    f.write(cmsrun_contents)
-  sample_entry['cmd'] = 'cmsRun %s &> %s' % (cmsrun_script, cmsrun_logfile)
-  sample_entry['logfile'] = cmsrun_logfile
-  logging.info('Wrote file {}'.format(cmsrun_script))
-
-if not args.skip_jobs:
-  xs_pool = multiprocessing.Pool(args.threads, handle_worker)
-
-  for sample_name, sample_entry in samples.items():
-    if print_xs(sample_entry['logfile']) and not args.force:
-      continue
-    logging.info('Running cmsRun for {}'.format(sample_name))
+  if args.target_uncertainty > 0.:
+    # each chunk of files is processed by a separate job, so that the sample can be stopped after any chunk
+    file_chunks = [ sample_files[idx:idx + args.chunk_files] for idx in range(0, len(sample_files), args.chunk_files) ]
+    chunk_suffixes = [ '_{}'.format(chunk_idx) for chunk_idx in range(len(file_chunks)) ]
+  else:
+    file_chunks = [ sample_files ]
+    chunk_suffixes = [ '' ]
+  sample_entry['chunks'] = []
+  for chunk_suffix, chunk_files in zip(chunk_suffixes, file_chunks):
+    cmsrun_script = os.path.join(sample_output_dir, 'xsecAnalyzer{}.py'.format(chunk_suffix))
+    cmsrun_logfile = os.path.join(sample_output_dir, 'out{}.log'.format(chunk_suffix))
+    cmsrun_contents = jinja2.Template(xsecAnalyzer_template).render(
+      file_names = chunk_files,
+      global_tag = args.global_tag,
+      max_events = args.max_events,
+    )
+    with open(cmsrun_script, 'w') as f:
+      f.write(cmsrun_contents)
+    sample_entry['chunks'].append(([ 'cmsRun', cmsrun_script ], cmsrun_logfile))
+  sample_entry['nof_files'] = len(sample_files)
+  sample_entry['logfile'] = os.path.join(sample_output_dir, 'out.log')
+  if len(file_chunks) > 1:
+    logging.info('Wrote {} files in {}'.format(len(file_chunks), sample_output_dir))
+  else:
+    logging.info('Wrote file {}'.format(cmsrun_script))
+
+# each job is submitted as soon as the file list of its sample arrives, while the other samples are still listed
+results_fn = args.results or os.path.join(args.output, 'results.json')
+pipeline = JobPipeline(args.threads, len(samples), args.target_uncertainty)
+listing_pool = multiprocessing.pool.ThreadPool(max(min(args.das_workers, len(samples)), 1))
+try:
+  for sample_name, sample_files, listing_err in listing_pool.imap_unordered(list_sample, list(samples.items())):
+    sample_entry = samples[sample_name]
     try:
-      xs_pool.apply_async(
-        run_cmd,
-        args = (sample_entry['cmd'],)
-      )
-    except KeyboardInterrupt:
-      xs_pool.terminate()
-      sys.exit(1)
-
-  xs_pool.close()
-  xs_pool.join()
-
-for sample_name, sample_entry in samples.items():
-  print_xs(sample_entry['logfile'])
+      if listing_err:
+        raise RuntimeError(listing_err)
+      prepare_job(sample_name, sample_entry, sample_files)
+    except RuntimeError as err:
+      logging.error(str(err))
+      sample_entry['status'] = 'failed'
+      pipeline.update('', 'failed')
+      continue
+    if args.skip_jobs:
+      # only the samples with a usable cross section in their log count as skipped
+      has_xs = not has_failed_chunks(sample_entry['logfile']) and print_xs(sample_name, sample_entry)
+      sample_entry['status'] = 'skipped' if has_xs else 'failed'
+      pipeline.update('', sample_entry['status'])
+      continue
+    # the job is not rerun if it already produced a cross section
+    if not args.force and os.path.isfile(sample_entry['logfile']) and \
+       not has_failed_chunks(sample_entry['logfile']) and print_xs(sample_name, sample_entry):
+      sample_entry['status'] = 'skipped'
+      pipeline.update('', 'skipped')
+      continue
+    pipeline.submit(sample_name, sample_entry)
+  pipeline.close()
+except KeyboardInterrupt:
+  pipeline.kill()
+  listing_pool.terminate()
+  write_results(results_fn, samples)
+  sys.exit(1)
+listing_pool.close()
+listing_pool.join()
+
+write_results(results_fn, samples)
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+
+# Stand-in for dasgoclient that serves recorded responses, so that the dataset tools can be run and benchmarked
+# without a grid proxy. It is configured with the following environment variables:
+#
+# DAS_REPLAY_FIXTURES  SQLite database of the recorded responses (required)
+# DAS_REPLAY_MODE      replay (default): serve the recorded responses, and an empty response to unknown queries
+#                      record: serve the recorded responses, and record the unknown queries with the real dasgoclient
+# DAS_REPLAY_LATENCY   delay of each replayed response in seconds, or 'recorded' to use the recorded wall time
+# DAS_REPLAY_CLIENT    path to the real dasgoclient (default: the first dasgoclient in $PATH other than this one)
+# DAS_REPLAY_LOG       file where each query is logged together with whether it was a hit, a miss or recorded
+#
+# The tools call dasgoclient by name, so the script has to be linked as dasgoclient into a directory that is
+# prepended to $PATH, e.g.:
+#
+# mkdir -p fake_bin && ln -s $(which fake_dasgoclient.py) fake_bin/dasgoclient
+# DAS_REPLAY_FIXTURES=fixtures.sqlite PATH=$PWD/fake_bin:$PATH findParentDatasets.py -i datasets.txt
+
+from tthAnalysis.NanoAOD.dasReplay import main
+
+import os
+import sys
+
+if __name__ == '__main__':
+  sys.exit(main(sys.argv[1:], os.path.abspath(sys.argv[0])))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+# Stand-in for sbatch, sacct and squeue that runs the jobs as local background processes, so that the job
+# submission and tracking can be tested without a cluster. The command is chosen by the name under which the script
+# is called, or by its first argument, e.g.:
+#
+# mkdir -p fake_bin && for cmd in sbatch sacct squeue; do ln -s $(which fake_slurm.py) fake_bin/$cmd; done
+# PATH=$PWD/fake_bin:$PATH track_slurm_jobs.py -j jobs.json -d jobs.sqlite
+# fake_slurm.py sacct --jobs=1,2
+#
+# The state of the jobs is kept in $FAKE_SLURM_DIR (default: /tmp/fake_slurm_$USER). Failures of the cluster can be
+# simulated with $FAKE_SLURM_SBATCH_FAILURES, the number of sbatch calls that fail before the submissions succeed,
+# and with $FAKE_SLURM_SACCT_HIDDEN=1, which hides all jobs from sacct as if the accounting had lost them.
+
+import fcntl
+import getpass
+import os
+import subprocess
+import sys
+import time
+
+FAKE_SLURM_DIR_ENV = 'FAKE_SLURM_DIR'
+SBATCH_FAILURES_ENV = 'FAKE_SLURM_SBATCH_FAILURES'
+SACCT_HIDDEN_ENV = 'FAKE_SLURM_SACCT_HIDDEN'
+COMMANDS = [ 'sbatch', 'sacct', 'squeue' ]
+
+JOB_TEMPLATE = 'date +%s > "$1/start"; "$0" > "$2" 2>&1; echo $? > "$1/exit"; date +%s > "$1/end"'
+
+def get_state_dir():
+  state_dir = os.environ.get(FAKE_SLURM_DIR_ENV, '') or '/tmp/fake_slurm_{}'.format(getpass.getuser())
+  if not os.path.isdir(state_dir):
+    os.makedirs(state_dir)
+  return state_dir
+
+def read_file(path):
+  if not os.path.isfile(path):
+    return ''
+  with open(path, 'r') as f:
+    return f.read().strip()
+
+def get_option(argv, long_name, short_name = ''):
+  for idx, arg in enumerate(argv):
+    if arg.startswith(long_name + '='):
+      return arg.split('=', 1)[1]
+    if arg in [ long_name, short_name ] and idx + 1 < len(argv):
+      return argv[idx + 1]
+  return ''
+
+def increment_counter(state_dir, name):
+  with open(os.path.join(state_dir, 'counter.lock'), 'a+') as lock_file:
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+    counter_fn = os.path.join(state_dir, name)
+    value = int(read_file(counter_fn) or 0) + 1
+    with open(counter_fn, 'w') as counter_file:
+      counter_file.write(str(value))
+  return value
+
+def next_job_id(state_dir):
+  return str(increment_counter(state_dir, 'counter'))
+
+def get_job_state(job_dir):
+  """Returns the state, the exit code and the elapsed time of a job"""
+  exit_code = read_file(os.path.join(job_dir, 'exit'))
+  start = read_file(os.path.join(job_dir, 'start'))
+  if not start:
+    return 'PENDING', 0, 0
+  end = read_file(os.path.join(job_dir, 'end')) if exit_code else ''
+  elapsed = int(end or time.time()) - int(start)
+  if not exit_code:
+    return 'RUNNING', 0, elapsed
+  return 'COMPLETED' if exit_code == '0' else 'FAILED', int(exit_code), elapsed
+
+def get_job_ids(state_dir, argv):
+  job_ids = get_option(argv, '--jobs', '-j') or get_option(argv, '--job')
+  if job_ids:
+    return [ job_id for job_id in job_ids.split(',') if job_id ]
+  return sorted((job_id for job_id in os.listdir(state_dir) if job_id.isdigit()), key = int)
+
+def sbatch(state_dir, argv):
+  positional = [ arg for idx, arg in enumerate(argv) if not arg.startswith('-') and not (
+    idx > 0 and argv[idx - 1] in [ '-o', '--output', '-p', '--partition', '-J', '--job-name' ]
+  ) ]
+  if not positional:
+    sys.stderr.write('sbatch: error: missing the job script\n')
+    return 1
+  script = os.path.abspath(positional[0])
+  if increment_counter(state_dir, 'sbatch_calls') <= int(os.environ.get(SBATCH_FAILURES_ENV, '') or 0):
+    sys.stderr.write('sbatch: error: Batch job submission failed: Socket timed out on send/recv operation\n')
+    return 1
+  job_id = next_job_id(state_dir)
+  job_dir = os.path.join(state_dir, job_id)
+  os.makedirs(job_dir)
+  output = get_option(argv, '--output', '-o') or 'slurm-{}.out'.format(job_id)
+  env = dict(os.environ, SLURM_JOBID = job_id, SLURM_JOB_ID = job_id)
+  with open(os.devnull, 'r+') as devnull:
+    subprocess.Popen(
+      [ '/bin/sh', '-c', JOB_TEMPLATE, script, job_dir, os.path.abspath(output) ],
+      stdin = devnull, stdout = devnull, stderr = devnull, env = env, preexec_fn = os.setsid,
+    )
+  print('Submitted batch job {}'.format(job_id))
+  return 0
+
+def sacct(state_dir, argv):
+  if os.environ.get(SACCT_HIDDEN_ENV, '') == '1':
+    return 0
+  for job_id in get_job_ids(state_dir, argv):
+    job_dir = os.path.join(state_dir, job_id)
+    if not os.path.isdir(job_dir):
+      continue
+    state, exit_code, elapsed = get_job_state(job_dir)
+    elapsed_str = '{:02d}:{:02d}:{:02d}'.format(elapsed // 3600, elapsed % 3600 // 60, elapsed % 60)
+    print('{}|{}|{}:0|{}|'.format(job_id, state, exit_code, elapsed_str))
+    if state not in [ 'PENDING' ]:
+      print('{}.batch|{}|{}:0|{}|0K'.format(job_id, state, exit_code, elapsed_str))
+  return 0
+
+def squeue(state_dir, argv):
+  if '-h' not in argv and '--noheader' not in argv:
+    print('JOBID ST')
+  for job_id in get_job_ids(state_dir, argv):
+    job_dir = os.path.join(state_dir, job_id)
+    if not os.path.isdir(job_dir):
+      continue
+    state, _, _ = get_job_state(job_dir)
+    if state in [ 'PENDING', 'RUNNING' ]:
+      print('{} {}'.format(job_id, 'PD' if state == 'PENDING' else 'R'))
+  return 0
+
+if __name__ == '__main__':
+  command = os.path.basename(sys.argv[0])
+  argv = sys.argv[1:]
+  if command not in COMMANDS:
+    if not argv or argv[0] not in COMMANDS:
+      sys.stderr.write('Usage: {} {{{}}} [options]\n'.format(sys.argv[0], ','.join(COMMANDS)))
+      sys.exit(2)
+    command = argv.pop(0)
+  sys.exit({ 'sbatch' : sbatch, 'sacct' : sacct, 'squeue' : squeue }[command](get_state_dir(), argv))
@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 
+from tthAnalysis.NanoAOD.dasQuery import DASQueryEngine
+from tthAnalysis.NanoAOD.processUtils import run_command
+from tthAnalysis.NanoAOD.dasCache import get_das_cache
+from tthAnalysis.NanoAOD.dasLineage import DatasetLineage
+
 import argparse
 import logging
-import subprocess
 import time
 import sys
 import os
@@ -21,46 +25,32 @@ class SmartFormatter(argparse.HelpFormatter):
     return argparse.HelpFormatter._split_lines(self, text, width)
 
 def run_cmd(cmd_str):
-  cmd = subprocess.Popen(cmd_str, stdout = subprocess.PIPE, stderr = subprocess.PIPE, shell = True)
-  stdout, stderr = cmd.communicate()
+  stdout, stderr, _, _ = run_command(cmd_str.split(), timeout = 60)
   if stderr and not stderr.startswith("Picked up _JAVA_OPTIONS"):
     raise RuntimeError("Caught an error while executing '%s': %s" % (cmd_str, stderr))
-  return stdout.rstrip('\n')
-
-def get_dataset_info(dataset, info):
-  return run_cmd(
-    "dasgoclient -query='dataset={dataset} | grep dataset.{key}' -unique | grep -v '^\\['".format(
-      dataset = dataset,
-      key     = info,
-    )
-  )
-
-def get_date(dataset):
-  date_str = get_dataset_info(dataset, 'last_modification_date')
-  try:
-    date_int = int(date_str)
-  except ValueError:
-    logging.warning("Could not get proper date for {dataset}, got '{response}' instead".format(
-      dataset  = dataset,
-      response = date_str,
-    ))
-    date_int = 0
-  return date_int
-
-def get_nevents(dataset):
-  nevent_str = get_dataset_info(dataset, 'nevents')
-  try:
-    nevent_int = int(nevent_str)
-  except ValueError:
-    logging.warning("Could not get proper event count for {dataset}, got '{response}' instead".format(
-      dataset  = dataset,
-      response = nevent_str,
-    ))
-    nevent_int = -1
-  return nevent_int
-
-def get_parent(dataset):
-  return run_cmd("dasgoclient -query='parent dataset={dataset}'".format(dataset = dataset))
+  return stdout
+
+def get_date(metadata):
+  if metadata.last_modification_date is None:
+    logging.warning("Could not get proper date for {dataset}".format(dataset = metadata.name))
+    return 0
+  return metadata.last_modification_date
+
+def get_nevents(metadata):
+  if metadata.nevents is None:
+    logging.warning("Could not get proper event count for {dataset}".format(dataset = metadata.name))
+    return -1
+  return metadata.nevents
+
+def get_miniaod_entry(metadata):
+  miniaod_date = get_date(metadata)
+  return {
+    'name'     : metadata.name,
+    'nevent'   : get_nevents(metadata),
+    'date'     : miniaod_date,
+    'date_str' : time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(miniaod_date)),
+    'comment'  : '',
+  }
 
 def miniaod_str(miniaod_cands, add_comment = True):
   miniaod_latest_count = 0
@@ -105,6 +95,26 @@ parser.add_argument(
   '-i', '--input', dest = 'input', metavar = 'file', required = True, type = str,
   help = 'R|Input text file containing list of MINIAODSIM files',
 )
+parser.add_argument(
+  '-d', '--depth', dest = 'depth', metavar = 'int', required = False, type = int, default = 2,
+  help = 'R|Number of generations of parent datasets to look up (at least 2: AODSIM and GENSIM)',
+)
+parser.add_argument(
+  '-o', '--output', dest = 'output', metavar = 'file', required = False, type = str, default = '',
+  help = 'R|Output JSON file containing the lineage of the MINIAODSIM datasets',
+)
+parser.add_argument(
+  '-J', '--das-workers', dest = 'das_workers', metavar = 'int', required = False, type = int, default = 8,
+  help = 'R|Maximum number of concurrent DAS queries',
+)
+parser.add_argument(
+  '-x', '--dasgoclient', dest = 'dasgoclient', metavar = 'path', required = False, type = str, default = '',
+  help = 'R|Path to dasgoclient executable (default: $DASGOCLIENT or dasgoclient)',
+)
+parser.add_argument(
+  '-r', '--refresh', dest = 'refresh', action = 'store_true', default = False,
+  help = 'R|Ignore the cached DAS responses and query DAS again',
+)
 parser.add_argument(
   '-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
   help = 'R|Enable verbose printout',
@@ -114,9 +124,15 @@ args = parser.parse_args()
 if args.verbose:
   logging.getLogger().setLevel(logging.DEBUG)
 
+das = DASQueryEngine(
+  executable = args.dasgoclient, nof_workers = args.das_workers, cache = get_das_cache(args.refresh)
+)
+
 input_fn = args.input
 if not os.path.isfile(input_fn):
   raise ValueError("No such file: %s" % input_fn)
+if args.depth < 2:
+  raise ValueError("Invalid depth: %d" % args.depth)
 
 time_left_str = run_cmd('voms-proxy-info --actimeleft')
 try:
@@ -129,7 +145,7 @@ if int(time_left / 3600) == 0:
 miniaod_re = re.compile(r'^\/.*\/.*\/MINIAODSIM$')
 
 input_miniaods = []
-with open(input_fn, 'read') as input_f:
+with open(input_fn, 'r') as input_f:
   for line in input_f:
     # first column, require to be matched to MINIAODSIM regex
     line_split = line.rstrip('\n').split()
@@ -150,19 +166,17 @@ gensim_parents = {}
 aod_missing = []
 gensim_missing = []
 
-for miniaod_cand in input_miniaods:
-  logging.debug("Fetching information about {dataset} ...".format(dataset = miniaod_cand))
-  miniaod_date = get_date(miniaod_cand)
-  miniaod_nevents = get_nevents(miniaod_cand)
-  miniaod_entry = {
-    'name'     : miniaod_cand,
-    'nevent'   : miniaod_nevents,
-    'date'     : miniaod_date,
-    'date_str' : time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(miniaod_date)),
-    'comment'  : '',
-  }
+# crawl the parents of all datasets in the same generation at once, visiting each shared parent only once
+lineage = DatasetLineage(das).crawl(input_miniaods, args.depth)
+if args.output:
+  lineage.dump(args.output, input_miniaods, args.depth)
+  logging.info("Wrote file: {}".format(args.output))
 
-  aod_parent = get_parent(miniaod_cand)
+# duplicate input datasets are kept, so that they are reported as sharing the same parents
+for miniaod_cand in input_miniaods:
+  miniaod_entry = get_miniaod_entry(lineage.metadata[miniaod_cand])
+  aod_parent = lineage.get_parent(miniaod_cand)
+  gensim_parent = lineage.get_parent(aod_parent) if aod_parent else ''
   if not aod_parent:
     logging.warning("Could not find AOD parent for {miniaod}".format(miniaod = miniaod_cand))
     aod_missing.append(miniaod_entry)
@@ -171,7 +185,6 @@ for miniaod_cand in input_miniaods:
     aod_parents[aod_parent] = []
   aod_parents[aod_parent].append(miniaod_entry)
 
-  gensim_parent = get_parent(aod_parent)
   if not gensim_parent:
     logging.warning(
       "Could not find GENSIM parent for {aod} (which is a parent of {miniaod})".format(
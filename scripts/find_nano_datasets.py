@@ -1,19 +1,20 @@
 #!/usr/bin/env python
 
-from FWCore.PythonUtilities.LumiList import LumiList
+from tthAnalysis.NanoAOD.dasQuery import DASQueryEngine
+from tthAnalysis.NanoAOD.processUtils import run_command
+from tthAnalysis.NanoAOD.dasCache import get_das_cache
+from tthAnalysis.NanoAOD.lumiMask import LumiMask, parse_lumi_list
+from tthAnalysis.NanoAOD.goldenJson import load_golden_json
+from tthAnalysis.NanoAOD.dasMetadata import fetch_metadata
+from tthAnalysis.NanoAOD.nanoMatching import NanoAODIndex, is_up_to_date, load_state, save_state
 
 import argparse
 import logging
 import sys
 import os
-import re
-import subprocess
 import datetime
-import ast
-import psutil
-import signal
-import shlex
 import collections
+import json
 
 logging.basicConfig(
   stream = sys.stdout,
@@ -34,59 +35,12 @@ MINIAOD_RUNLUMI_EXCEPTIONS = [
   '/Tau/Run2018D-PromptReco-v2/MINIAOD', # 11 files corrupted
 ]
 
-def load_golden_jsons(golden_json_path):
-  if not os.path.isfile(golden_json_path):
-    raise RuntimeError("No such file: %s" % golden_json_path)
-  lumi_obj = LumiList(golden_json_path)
-  lumis = lumi_obj.getLumis()
-  runlumi_dict = {}
-  for run, lumi in lumis:
-    if run not in runlumi_dict:
-      runlumi_dict[run] = []
-    assert(lumi not in runlumi_dict[run])
-    runlumi_dict[run].append(lumi)
-  return runlumi_dict
-
 class SmartFormatter(argparse.HelpFormatter):
   def _split_lines(self, text, width):
     if text.startswith('R|'):
       return text[2:].splitlines()
     return argparse.HelpFormatter._split_lines(self, text, width)
 
-class Alarm(Exception):
-  pass
-
-def alarm_handler(signum, frame):
-  raise Alarm
-
-class Command(object):
-  def __init__(self, cmd):
-    self.cmd = cmd
-    self.process = None
-    self.out = None
-    self.err = None
-    self.success = False
-
-  def run(self, max_tries = 20, timeout = 5):
-    ntries = 0
-    while not self.success:
-      if ntries > max_tries:
-        break
-      ntries += 1
-      signal.signal(signal.SIGALRM, alarm_handler)
-      signal.alarm(timeout)
-      self.process = subprocess.Popen(shlex.split(self.cmd), stdout = subprocess.PIPE, stderr = subprocess.PIPE)
-      try:
-        self.out, self.err = self.process.communicate()
-        signal.alarm(0)
-      except Alarm:
-        parent = psutil.Process(self.process.pid)
-        for child in parent.children(recursive = True):
-          child.kill()
-        parent.kill()
-      else:
-        self.success = True
-
 def get_docstring():
   execution_datetime = '{date:%Y-%m-%d %H:%M:%S}'.format(date = datetime.datetime.now())
   execution_command = ' '.join([os.path.basename(__file__)] + sys.argv[1:])
@@ -108,17 +62,9 @@ def parse_input(fn):
     logging.info('Found {} dataset(s) in file {}'.format(len(list(filter(lambda line: len(line) > 1, lines))), fn))
     return lines
 
-def run_query(query_str, return_err = False):
-  cmd = Command(query_str)
-  cmd.run()
-  if return_err:
-    return cmd.out.rstrip('\n'), cmd.err.rstrip('\n')
-  else:
-    return cmd.out.rstrip('\n')
-
 def check_proxy():
   proxy_query = 'voms-proxy-info -timeleft'
-  proxy_out = run_query(proxy_query)
+  proxy_out, _, _, _ = run_command(proxy_query.split(), timeout = 60)
   if not proxy_out:
     logging.error('Got no output from command: {}'.format(proxy_query))
     return False
@@ -137,9 +83,9 @@ def check_proxy():
 def get_nanoaod(id_str, is_data):
   if not id_str:
     raise ValueError("Cannot use empty ID string")
-  query_str = "dasgoclient -query='dataset dataset=/*/*{}*/NANOAOD{} status=* | " \
-              "grep dataset.name | grep dataset.dataset_access_type'".format(id_str, '' if is_data else 'SIM')
-  query_out = run_query(query_str)
+  query_str = "dataset dataset=/*/*{}*/NANOAOD{} status=* | " \
+              "grep dataset.name | grep dataset.dataset_access_type".format(id_str, '' if is_data else 'SIM')
+  query_out = das.query(query_str)
   if not query_out:
     raise RuntimeError("No output returned by command: %s" % query_str)
   result = {}
@@ -187,13 +133,15 @@ def merge_dicts(dict_first, dict_second):
   dict_result.update(dict_second)
   return dict_result
 
+def get_parent_query(dbs_name):
+  return "parent dataset={}".format(dbs_name)
+
 def resolve_candidate(nanoaod_cands):
   if not nanoaod_cands:
     return ''
   nanoaod_parents = {}
-  for nanoaod in nanoaod_cands:
-    query_str = "dasgoclient -query='parent dataset={}'".format(nanoaod)
-    query_out = run_query(query_str)
+  for nanoaod, query_out in zip(nanoaod_cands, das.query_many(map(get_parent_query, nanoaod_cands))):
+    query_str = get_parent_query(nanoaod)
     if not query_out:
       raise RuntimeError("Unable to find parent for: %s" % nanoaod)
     query_out_split = query_out.split('\n')
@@ -206,43 +154,40 @@ def resolve_candidate(nanoaod_cands):
     nanoaod_parents[nanoaod_parent] = nanoaod
   return nanoaod_parents
 
-def get_size(dbs_name):
-  query_str = "dasgoclient -query='dataset dataset={} | grep dataset.nevents'".format(dbs_name)
-  query_out = run_query(query_str)
+def get_size(dbs_name, dbs_status = None):
+  if dbs_name in dataset_metadata and dataset_metadata[dbs_name].nevents is not None:
+    return dataset_metadata[dbs_name].nevents
+  query_str = "dataset dataset={} | grep dataset.nevents".format(dbs_name)
+  query_out = das.query(query_str, status = dbs_status)
   nevents_str = list(filter(lambda line: not line.startswith('['), query_out.split('\n')))
   if len(nevents_str) != 1:
     raise RuntimeError("Got invalid output from command %s: %s" % (query_str, query_out))
   return int(nevents_str[0])
 
-def get_runlumi(dbs_name):
-  query_str = "dasgoclient -query='run,lumi dataset={}'".format(dbs_name)
-  query_out = run_query(query_str)
-  runlumis = {}
-  for line in query_out.split('\n'):
-    line_split = line.split()
-    if len(line_split) != 2:
-      raise RuntimeError("Unexpected line from command %s: %s" % (query_str, line))
-    run = int(line_split[0])
-    lumis = set(ast.literal_eval(line_split[1]))
-    assert(run not in runlumis)
-    runlumis[run] = lumis
-  return runlumis
-
-def convert_to_ranges(lumilist):
-  lumilist = sorted(set(lumilist))
-  lumi_min = min(lumilist)
-  lumi_max = max(lumilist)
-  if lumi_max in [ lumi_min, lumi_min + 1 ]:
-    return [ [ lumi_min, lumi_max ] ]
-  lumi_ranges = []
-  lumi_first = lumi_min
-  lumi_last = lumi_min
-  for lumi in lumilist[1:]:
-    if lumi != (lumi_last + 1) or lumi == lumi_max:
-      lumi_ranges.append([ lumi_first, lumi_last ])
-      lumi_first = lumi
-    lumi_last = lumi
-  return str(lumi_ranges).replace(' ', '')
+def get_runlumi(dbs_name, dbs_status = None):
+  query_str = "run,lumi dataset={}".format(dbs_name)
+  def parse_runlumis(lines):
+    # the lines are parsed as they are read from dasgoclient
+    runlumis = {}
+    for line in lines:
+      line_split = line.split()
+      if len(line_split) != 2:
+        raise RuntimeError("Unexpected line from command %s: %s" % (query_str, line))
+      run = int(line_split[0])
+      assert(run not in runlumis)
+      runlumis[run] = parse_lumi_list(line_split[1])
+    if not runlumis:
+      raise RuntimeError("No output returned by command: %s" % query_str)
+    return LumiMask(runlumis)
+  # the lumi ranges are cached instead of the full list of lumis
+  return das.query_parsed(
+    query_str, parse_runlumis, status = dbs_status,
+    serialize   = lambda lumi_mask: json.dumps(lumi_mask.to_compact_list()),
+    deserialize = lambda lumi_mask_str: LumiMask.from_compact_list(json.loads(lumi_mask_str)),
+  )
+
+def convert_to_ranges(lumi_ranges):
+  return str(lumi_ranges.to_list()).replace(' ', '')
 
 def runlumi_match(miniaod, nanoaod, nanoaod_status, golden_json):
   if miniaod.endswith('SIM'):
@@ -255,7 +200,7 @@ def runlumi_match(miniaod, nanoaod, nanoaod_status, golden_json):
     return True
 
   miniaod_size = get_size(miniaod)
-  nanoaod_size = get_size(nanoaod)
+  nanoaod_size = get_size(nanoaod, nanoaod_status)
   if nanoaod_size > miniaod_size:
     RuntimeError(
       "Dataset %s has more events (%d) than dataset %s (%s)" % \
@@ -270,14 +215,14 @@ def runlumi_match(miniaod, nanoaod, nanoaod_status, golden_json):
     retval = True
 
     runlumi_miniaod = get_runlumi(miniaod)
-    runlumi_nanoaod = get_runlumi(nanoaod)
-    run_missing_miniaod = set(runlumi_nanoaod.keys()) - set(runlumi_miniaod.keys())
+    runlumi_nanoaod = get_runlumi(nanoaod, nanoaod_status)
+    run_missing_miniaod = set(runlumi_nanoaod.runs()) - set(runlumi_miniaod.runs())
     if run_missing_miniaod:
       raise RuntimeError(
         "Found %d run numbers that are present in %s but not in %s: %s" % \
         (len(run_missing_miniaod), nanoaod, miniaod, ', '.join(map(str, list(run_missing_miniaod))))
       )
-    run_missing_nanoaod = sorted(list(set(runlumi_miniaod.keys()) - set(runlumi_nanoaod.keys())))
+    run_missing_nanoaod = sorted(list(set(runlumi_miniaod.runs()) - set(runlumi_nanoaod.runs())))
     if run_missing_nanoaod:
       logging.error(
         "Found {} run numbers that are present in {} but not in {}: {}".format(
@@ -306,21 +251,21 @@ def runlumi_match(miniaod, nanoaod, nanoaod_status, golden_json):
         continue
       lumis_miniaod = runlumi_miniaod[run]
       lumis_nanoaod = runlumi_nanoaod[run]
-      lumis_missing_miniaod = sorted(list(lumis_nanoaod - lumis_miniaod))
+      lumis_missing_miniaod = lumis_nanoaod - lumis_miniaod
       if lumis_missing_miniaod:
         raise RuntimeError(
           "Found lumis at run %d that are present in %s but not in %s: %s" % \
           (run, nanoaod, miniaod, convert_to_ranges(lumis_missing_miniaod))
         )
-      lumis_missing_nanoaod = sorted(list(lumis_miniaod - lumis_nanoaod))
+      lumis_missing_nanoaod = lumis_miniaod - lumis_nanoaod
       if lumis_missing_nanoaod:
         logging.error(
           "Found lumis at run {} that are present in {} but not in {}: {}".format(
             run, miniaod, nanoaod, convert_to_ranges(lumis_missing_nanoaod)
           )
         )
-      lumis_missing_nanoaod_golden = [ lumi for lumi in lumis_missing_nanoaod if lumi in golden_json[run] ]
-      lumis_missing_nanoaod_not_golden = [ lumi for lumi in lumis_missing_nanoaod if lumi not in golden_json[run] ]
+      lumis_missing_nanoaod_golden = lumis_missing_nanoaod & golden_json[run]
+      lumis_missing_nanoaod_not_golden = lumis_missing_nanoaod - golden_json[run]
       if lumis_missing_nanoaod_golden:
         logging.error(
           "The following lumis at run {} in golden JSON but not in {}: {}".format(
@@ -344,39 +289,51 @@ def runlumi_match(miniaod, nanoaod, nanoaod_status, golden_json):
     logging.info("Number of events in {} match to the number of events in {}: {}".format(miniaod, nanoaod, miniaod_size))
   return True
 
-def find_matching_nano(miniaods, dbs_nano, data_str, mc_str):
-  result = {}
+def find_matching_nano(miniaods, dbs_nano, data_str, mc_str, state):
+  nanoaod_index = NanoAODIndex(dbs_nano)
+  nanoaod_cands_all = collections.OrderedDict()
   for miniaod in miniaods:
-    miniaod_split = miniaod.split('/')
-    assert(len(miniaod_split) == 4)
-    miniaod_lead = miniaod_split[1]
-    miniaod_sublead = miniaod_split[2]
-    miniaod_tier = miniaod_split[3]
-    if miniaod_tier == 'MINIAOD':
-      assert(miniaod_sublead.startswith('Run201'))
-      miniaod_sublead_split = miniaod_sublead.split('-')
-      assert(len(miniaod_sublead_split) > 1)
-      nanoaod_sublead = '{}.*-{}'.format(miniaod_sublead_split[0], data_str)
-    elif miniaod_tier == 'MINIAODSIM':
-      assert(miniaod_sublead.startswith('RunII'))
-      miniaod_sublead_split = miniaod_sublead.split('-')
-      assert (len(miniaod_sublead_split) > 1)
-      nanoaod_sublead = re.sub('MiniAOD(v\d)?', mc_str, miniaod_sublead_split[0])
-    else:
-      raise RuntimeError('Unexpected tier %s found in DBS name %s' % (miniaod_tier, miniaod))
-    nanoaod_re_str = '/{}/{}.*/{}'.format(miniaod_lead, nanoaod_sublead, miniaod_tier.replace('MINI', 'NANO'))
-    nanoaod_re = re.compile(nanoaod_re_str)
-    nanoaod_cands = []
-    for nanoaod in dbs_nano:
-      if nanoaod_re.match(nanoaod):
-        nanoaod_cands.append(nanoaod)
+    nanoaod_cands_all[miniaod] = nanoaod_index.find_candidates(miniaod, data_str, mc_str)
+  up_to_date = set(
+    miniaod for miniaod, nanoaod_cands in nanoaod_cands_all.items()
+    if is_up_to_date(state.get(miniaod), nanoaod_cands, dbs_nano)
+  )
+  if up_to_date:
+    logging.info('Skipping {} dataset(s) that have not changed since the previous run'.format(len(up_to_date)))
+
+  # query the parents of all candidates concurrently; resolve_candidate() then reads the memoized results
+  das.map(
+    lambda nanoaod: das.query(get_parent_query(nanoaod), status = dbs_nano[nanoaod]),
+    set(
+      nanoaod for miniaod, nanoaod_cands in nanoaod_cands_all.items() if miniaod not in up_to_date
+      for nanoaod in nanoaod_cands
+    )
+  )
+  result = {}
+  for miniaod, nanoaod_cands in nanoaod_cands_all.items():
+    if miniaod in up_to_date:
+      result[miniaod] = state[miniaod]['parents']
+      continue
     nanoaod_parents = resolve_candidate(nanoaod_cands)
+    state[miniaod] = { 'candidates' : nanoaod_cands, 'parents' : nanoaod_parents or {} }
     if miniaod not in nanoaod_parents:
       logging.error('No candidates found for: {}'.format(miniaod))
     else:
       logging.debug('Found candidate for {}: {}'.format(miniaod, nanoaod_parents[miniaod]))
     result[miniaod] = nanoaod_parents
-  return result
+  return result, up_to_date
+
+def write_output(output_fn, content, docstring):
+  # the docstring records when the file was generated, so it is left out of the comparison
+  if os.path.isfile(output_fn):
+    with open(output_fn, 'r') as f:
+      content_prev = f.read()
+    if content_prev.startswith(content) and content_prev[len(content):].startswith('\n# file generated at'):
+      return False
+  with open(output_fn, 'w') as f:
+    f.write(content)
+    f.write('\n{}\n'.format(docstring))
+  return True
 
 parser = argparse.ArgumentParser(
   formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
@@ -405,6 +362,22 @@ parser.add_argument(
   '-m', '--mc', dest = 'mc', metavar = 'str', required = False, type = str, default = 'NanoAODv6',
   help = 'R|Identifier in DBS names of MC NanoAOD',
 )
+parser.add_argument(
+  '-J', '--das-workers', dest = 'das_workers', metavar = 'int', required = False, type = int, default = 8,
+  help = 'R|Maximum number of concurrent DAS queries',
+)
+parser.add_argument(
+  '-x', '--dasgoclient', dest = 'dasgoclient', metavar = 'path', required = False, type = str, default = '',
+  help = 'R|Path to dasgoclient executable (default: $DASGOCLIENT or dasgoclient)',
+)
+parser.add_argument(
+  '-r', '--refresh', dest = 'refresh', action = 'store_true', default = False,
+  help = 'R|Ignore the cached DAS responses and query DAS again',
+)
+parser.add_argument(
+  '-s', '--state', dest = 'state', metavar = 'file', required = False, type = str, default = '',
+  help = 'R|State file of the incremental mode: check only the datasets that changed since the previous run',
+)
 parser.add_argument(
   '-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
   help = 'R|Enable verbose printout',
@@ -419,6 +392,12 @@ if args.verbose:
 if not args.prefix:
   raise ValueError("Cannot use empty prefix in the output file names")
 
+state = load_state(args.state)
+dataset_metadata = {}
+das = DASQueryEngine(
+  executable = args.dasgoclient, nof_workers = args.das_workers, cache = get_das_cache(args.refresh)
+)
+
 data = collections.OrderedDict()
 for input_file in args.input:
   if not os.path.isfile(input_file):
@@ -436,45 +415,74 @@ logging.info('Considering {} dataset(s) in total'.format(len(dbs_nano)))
 json_base_path = os.path.join(os.environ['CMSSW_BASE'], 'src', 'tthAnalysis', 'NanoAOD', 'data')
 golden_jsons = {}
 for era in GOLDEN_JSONS:
-  golden_jsons['Run{}'.format(era)] = load_golden_jsons(os.path.join(json_base_path, GOLDEN_JSONS[era]))
+  golden_jsons['Run{}'.format(era)] = load_golden_json(os.path.join(json_base_path, GOLDEN_JSONS[era]))
 
 for input_file in data:
   miniaods = list(map(lambda line_out: line_out[1], filter(lambda line_in: len(line_in) > 1, data[input_file])))
-  nanoaod_parents = find_matching_nano(miniaods, dbs_nano, args.data, args.mc)
+  nanoaod_parents, up_to_date = find_matching_nano(miniaods, dbs_nano, args.data, args.mc, state)
   nanoaods = { miniaod : (nanoaod_parents[miniaod][miniaod] if miniaod in nanoaod_parents[miniaod] else '') for miniaod in miniaods }
   max_width_nanoaod = max(map(len, nanoaods.values())) + 1
   output_fn_base = '{}_{}'.format(args.prefix, os.path.basename(input_file))
   output_fn = os.path.join(os.path.dirname(input_file), output_fn_base)
-  with open(output_fn, 'w') as f:
-    unmatched_miniaods = []
-    for line in data[input_file]:
-      if len(line) == 1:
-        f.write('{}\n'.format(line[0]))
-      elif len(line) == 2:
-        miniaod = line[1]
-        nanoaod_cand = nanoaods[miniaod]
-        if nanoaod_cand and not nanoaod_cand.endswith('SIM'):
-          golden_json_eras = [ era for era in golden_jsons if era in nanoaod_cand ]
-          if len(golden_json_eras) != 1:
-            raise RuntimeError("Unable to find golden JSON for %s" % nanoaod_cand)
-          golden_json_era = golden_json_eras[0]
-          logging.info("Golden JSON era for dataset {}: {}".format(nanoaod_cand, golden_json_era))
-          golden_json = golden_jsons[golden_json_era]
-        else:
-          golden_json = {}
-        if nanoaod_cand and runlumi_match(miniaod, nanoaod_cand, dbs_nano[nanoaod_cand], golden_json):
-          line_remaining = line[0].replace(miniaod, '').lstrip()
-          f.write('{}{}\n'.format(nanoaod_cand.ljust(max_width_nanoaod), line_remaining))
-        else:
-          unmatched_miniaods.append(line[1])
+
+  runlumi_checks = collections.OrderedDict()
+  for miniaod in miniaods:
+    nanoaod_cand = nanoaods[miniaod]
+    if not nanoaod_cand or miniaod in up_to_date:
+      continue
+    if not nanoaod_cand.endswith('SIM'):
+      golden_json_eras = [ era for era in golden_jsons if era in nanoaod_cand ]
+      if len(golden_json_eras) != 1:
+        raise RuntimeError("Unable to find golden JSON for %s" % nanoaod_cand)
+      golden_json_era = golden_json_eras[0]
+      logging.info("Golden JSON era for dataset {}: {}".format(nanoaod_cand, golden_json_era))
+      golden_json = golden_jsons[golden_json_era]
+    else:
+      golden_json = LumiMask()
+    runlumi_checks[miniaod] = (miniaod, nanoaod_cand, dbs_nano[nanoaod_cand], golden_json)
+  # retrieve the number of events in all data datasets that are compared in bulk
+  dataset_metadata.update(fetch_metadata(das, [
+    dataset for miniaod, nanoaod_cand, nanoaod_status, _ in runlumi_checks.values()
+    if not miniaod.endswith('SIM') and nanoaod_status != 'PRODUCTION' for dataset in [ miniaod, nanoaod_cand ]
+  ]))
+  runlumi_matches = dict(zip(
+    runlumi_checks.keys(), das.map(lambda runlumi_check: runlumi_match(*runlumi_check), runlumi_checks.values())
+  ))
+  for miniaod in miniaods:
+    if miniaod in up_to_date:
+      runlumi_matches[miniaod] = True
+      continue
+    state[miniaod].update({
+      'nanoaod' : nanoaods[miniaod],
+      'status'  : dbs_nano.get(nanoaods[miniaod], ''),
+      'match'   : runlumi_matches.get(miniaod, False),
+    })
+  if args.state:
+    save_state(args.state, state)
+
+  output_lines = []
+  unmatched_miniaods = []
+  for line in data[input_file]:
+    if len(line) == 1:
+      output_lines.append('{}\n'.format(line[0]))
+    elif len(line) == 2:
+      miniaod = line[1]
+      nanoaod_cand = nanoaods[miniaod]
+      if nanoaod_cand and runlumi_matches[miniaod]:
+        line_remaining = line[0].replace(miniaod, '').lstrip()
+        output_lines.append('{}{}\n'.format(nanoaod_cand.ljust(max_width_nanoaod), line_remaining))
       else:
-        assert(False)
-    if unmatched_miniaods:
-      f.write('\n# Unable to find matching NANOAOD datasets for the following MINIAOD datasets:\n')
-      for miniaod in unmatched_miniaods:
-        f.write('# {}\n'.format(miniaod))
-        if nanoaod_parents[miniaod]:
-          for miniaod_cand, nanoaod_cand in nanoaod_parents[miniaod].items():
-            f.write('#   {} -> {}\n'.format(miniaod_cand, nanoaod_cand))
-    f.write('\n{}\n'.format(docstring))
-  logging.info('Wrote file: {}'.format(output_fn))
+        unmatched_miniaods.append(line[1])
+    else:
+      assert(False)
+  if unmatched_miniaods:
+    output_lines.append('\n# Unable to find matching NANOAOD datasets for the following MINIAOD datasets:\n')
+    for miniaod in unmatched_miniaods:
+      output_lines.append('# {}\n'.format(miniaod))
+      if nanoaod_parents[miniaod]:
+        for miniaod_cand, nanoaod_cand in nanoaod_parents[miniaod].items():
+          output_lines.append('#   {} -> {}\n'.format(miniaod_cand, nanoaod_cand))
+  if write_output(output_fn, ''.join(output_lines), docstring):
+    logging.info('Wrote file: {}'.format(output_fn))
+  else:
+    logging.info('File {} is up to date'.format(output_fn))
@@ -78,6 +78,7 @@ export NTHREADS=1
 GENERATE_CFGS_ONLY=false
 DRYRUN=""
 UNIQUE_EVENTS="True"
+PRUNE_HLT_FILTER="False"
 export DATASET_FILE=""
 export JOB_TYPE=""
 export PUBLISH=0
@@ -95,14 +96,14 @@ show_help() {
   THIS_SCRIPT=$0;
   echo -ne "Usage: $(basename $THIS_SCRIPT) -e <era>  -j <type> [-d] [-g] [-u] [-f <dataset file>] [-v version] [-w whitelist = ''] " 1>&2;
   echo -ne "[-n <job events = $NOF_EVENTS>] [-N <cfg events = $NOF_CMSDRIVER_EVENTS>] [-r <frequency = $REPORT_FREQUENCY>] " 1>&2;
-  echo -ne "[-t <threads = $NTHREADS>] [ -p <publish: 0|1 = $PUBLISH> ] [ -s <label> = '' ] [ -F <trigger filter: 0|1 = $HLT_FILTER> ]" 1>&2;
+  echo -ne "[-t <threads = $NTHREADS>] [ -p <publish: 0|1 = $PUBLISH> ] [ -s <label> = '' ] [ -F <trigger filter: 0|1 = $HLT_FILTER> ] [-P] " 1>&2;
   echo     "[-x <file listing datasets to exclude> = '' ]" 1>&2;
   echo "Available eras: $ERA_KEY_2016_v2, $ERA_KEY_2016_v3, $ERA_KEY_2017_v1, $ERA_KEY_2017_v2, $ERA_KEY_2018, $ERA_KEY_2018_PROMPT" 1>&2;
   echo "Available job types: $TYPE_DATA, $TYPE_MC, $TYPE_FAST, $TYPE_SYNC"
   exit 0;
 }
 
-while getopts "h?dguf:j:e:v:w:n:N:r:t:p:s:F:x:c:" opt; do
+while getopts "h?dguPf:j:e:v:w:n:N:r:t:p:s:F:x:c:" opt; do
   case "${opt}" in
   h|\?) show_help
         ;;
@@ -116,6 +117,8 @@ while getopts "h?dguf:j:e:v:w:n:N:r:t:p:s:F:x:c:" opt; do
      ;;
   u) UNIQUE_EVENTS="False";
      ;;
+  P) PRUNE_HLT_FILTER="True";
+     ;;
   e) export ERA=${OPTARG}
      ;;
   v) export NANOAOD_VER=${OPTARG}
@@ -171,6 +174,11 @@ if [[ $HLT_FILTER != "0" ]] && [[ $HLT_FILTER != "1" ]]; then
   exit 1;
 fi
 
+if [[ $PRUNE_HLT_FILTER == "True" ]] && [[ $HLT_FILTER != "1" ]]; then
+  echo "Option -P requires the HLT filter to be enabled with -F 1";
+  exit 1;
+fi
+
 if ! [[ $NOF_EVENTS =~ ^[0-9]+$ ]] || [[ $NOF_EVENTS == "0" ]]; then
   echo "Option -n not a valid number: $NOF_EVENTS";
   exit 1;
@@ -415,7 +423,7 @@ generate_cfgs() {
   NANOAOD_GIT_STATUS=$(git -C $BASE_DIR log -n1 --format="%D %H %cd")
   export CUSTOMISE_COMMANDS="process.source.fileNames = cms.untracked.vstring($INPUT_FILE)\\n\
 #process.source.eventsToProcess = cms.untracked.VEventRange()\\n\
-from tthAnalysis.NanoAOD.addVariables import addVariables; addVariables(process, is_mc = $PY_IS_MC, year = '$YEAR', reportEvery = $REPORT_FREQUENCY, hlt_filter = '$HLT_FILTER_ARG', checkUniqueness = $UNIQUE_EVENTS)\\n\
+from tthAnalysis.NanoAOD.addVariables import addVariables; addVariables(process, is_mc = $PY_IS_MC, year = '$YEAR', reportEvery = $REPORT_FREQUENCY, hlt_filter = '$HLT_FILTER_ARG', checkUniqueness = $UNIQUE_EVENTS, pruneHltFilter = $PRUNE_HLT_FILTER)\\n\
 from tthAnalysis.NanoAOD.debug import debug; debug(process, dump = False, dumpFile = 'nano.dump', tracer = False, memcheck = False, timing = False)\\n\
 print('CMSSW_VERSION: $CMSSW_VERSION')\\n\
 print('CMSSW repo: $CMSSW_GIT_STATUS')\\n\
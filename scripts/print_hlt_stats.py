@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 
+from tthAnalysis.NanoAOD.triggerCache import load_tables
+
 import jinja2
 import re
 import argparse
 import os.path
+import glob
+import logging
+import sys
+import multiprocessing
 
 class SmartFormatter(argparse.HelpFormatter):
   def _split_lines(self, text, width):
@@ -15,7 +21,6 @@ HLT_SUFFIX = re.compile('.*_v\d+$')
 HLT_DICT = """
           {
             'name'        : '{{hlt_path}}',
-            'int_lumi'    : {{int_lumi}},
             'unprescaled' : {{unprescaled}},
             'runs'        : [{% for run in runs %}
               {{run[0]}}, # {{run[1]}}, {{run[2]}}/pb
@@ -29,6 +34,44 @@ HLT_VSTRING = """
         {%- endfor %}
         ),
 """
+TRIGGERS_ANALYSIS = """triggers_analysis = {
+{%- for trigger_type, hlt_paths in triggers %}
+  '{{trigger_type}}' : [
+  {%- for hlt_path in hlt_paths %}
+    {
+      'name'        : '{{hlt_path.title}}',
+      'unprescaled' : {{hlt_path.unprescaled}},
+      'runs'        : [{% for run in hlt_path.runs %}
+        {{run[0]}}, # {{run[1]}}, {{run[2]}}/pb
+      {%- endfor %}
+      ],
+    },
+  {%- endfor %}
+  ],
+{%- endfor %}
+}
+"""
+RUN_RANGES_BLOCKS = """{% for hlt_path in hlt_paths %}
+      # {{hlt_path.title}}
+      run_ranges = cms.vstring(*({% for run in hlt_path.runs %}
+        '{{run[0][0]}}-{{run[0][1]}}', # {{run[1]}}, {{run[2]}}/pb
+      {%- endfor %}
+      )),
+{% endfor %}"""
+# the paths that are missing from the table are printed as comments, so that the output is still a valid table
+UNKNOWN_PATHS = """
+# HLT paths that are not in the analysis triggers of era {{era}}:
+{%- for hlt_path in hlt_paths %}
+#   {
+#     'name'        : '{{hlt_path.title}}',
+#     'unprescaled' : {{hlt_path.unprescaled}},
+#     'runs'        : [{% for run in hlt_path.runs %}
+#       {{run[0]}}, # {{run[1]}}, {{run[2]}}/pb
+{%- endfor %}
+#     ],
+#   },
+{%- endfor %}
+"""
 INT_LUMIS = {
   2016 : 35.9,
   2017 : 41.5,
@@ -99,46 +142,136 @@ def get_era(runs):
       return era
   raise RuntimeError("Unable to determine the era for the run ranges!")
 
-def get_run_assoc(results, run_ranges):
+def index_results(results):
+  results_by_run = {}
+  for result in results:
+    assert(result['run'] not in results_by_run)
+    results_by_run[result['run']] = (result['name'], result['recorded'])
+  return results_by_run
+
+def get_run_assoc(results_by_run, run_ranges):
   run_assoc = []
   for run_range in run_ranges:
     names = []
     recorded = 0.
     for run in range(run_range[0], run_range[1] + 1):
-      run_stats = [ (result['name'], result['recorded']) for result in results if result['run'] == run ]
-      assert(len(run_stats) == 1)
-      run_stats = run_stats[0]
+      run_stats = results_by_run[run]
       if run_stats[0] not in names:
         names.append(run_stats[0])
       recorded += run_stats[1]
     run_assoc.append(( run_range, '/'.join(names), round(recorded, 3) ))
   return run_assoc
 
+def get_path_stats(results):
+  assert(results)
+  assert(all(results[0]['title'] == result['title'] for result in results[1:]))
+  recorded_sum = sum(result['recorded'] for result in results) / 1000.
+  runs = sorted(result['run'] for result in results)
+  era = get_era(runs)
+  return {
+    'title'       : results[0]['title'],
+    'era'         : era,
+    'unprescaled' : INT_LUMIS[era] <= recorded_sum,
+    'runs'        : get_run_assoc(index_results(results), get_run_ranges(runs)),
+  }
+
+def group_results(results_per_file):
+  # a single output of brilcalc may contain the results of multiple paths
+  results_by_title = {}
+  for results in results_per_file:
+    for result in results:
+      if result['title'] not in results_by_title:
+        results_by_title[result['title']] = []
+      results_by_title[result['title']].append(result)
+  return [ results_by_title[title] for title in sorted(results_by_title) ]
+
+def get_trigger_types(era):
+  trigger_types = []
+  hlt_paths = {}
+  for trigger_type, triggers in load_tables(str(era))['analysis'].items():
+    trigger_types.append(trigger_type)
+    for trigger_idx, trigger in enumerate(triggers):
+      hlt_paths[trigger['name']] = (trigger_type, trigger_idx)
+  return trigger_types, hlt_paths
+
+def group_by_trigger_type(path_stats, era):
+  """Returns the paths grouped by their trigger type in the existing table, and the paths that are not in the table"""
+  trigger_types, hlt_paths = get_trigger_types(era)
+  triggers = { trigger_type : [] for trigger_type in trigger_types }
+  unknown_paths = []
+  for path_stat in path_stats:
+    if path_stat['title'] in hlt_paths:
+      triggers[hlt_paths[path_stat['title']][0]].append(path_stat)
+    else:
+      logging.warning("HLT path {} is not in the analysis triggers of era {}".format(path_stat['title'], era))
+      unknown_paths.append(path_stat)
+  # preserve the order of the paths in the existing table
+  for trigger_type in trigger_types:
+    triggers[trigger_type].sort(key = lambda path_stat: hlt_paths[path_stat['title']][1])
+  triggers_grouped = [
+    ( trigger_type, triggers[trigger_type] ) for trigger_type in trigger_types if triggers[trigger_type]
+  ]
+  return triggers_grouped, unknown_paths
+
+def run_batch(input_dir, vstring, nof_jobs):
+  input_file_names = sorted(glob.glob(os.path.join(input_dir, '*.csv')))
+  if not input_file_names:
+    raise RuntimeError("No brilcalc outputs found in directory: %s" % input_dir)
+  pool = multiprocessing.Pool(nof_jobs)
+  try:
+    results_per_file = pool.map(read_results, input_file_names)
+    path_stats = pool.map(get_path_stats, group_results(results_per_file))
+  finally:
+    pool.close()
+    pool.join()
+  eras = set(path_stat['era'] for path_stat in path_stats)
+  if len(eras) != 1:
+    raise RuntimeError("The brilcalc outputs span multiple eras: %s" % ', '.join(map(str, sorted(eras))))
+  era = eras.pop()
+  logging.info("Found {} HLT paths in {} files for era {}".format(len(path_stats), len(input_file_names), era))
+  if vstring:
+    return jinja2.Template(RUN_RANGES_BLOCKS).render(hlt_paths = path_stats)
+  triggers, unknown_paths = group_by_trigger_type(path_stats, era)
+  output = jinja2.Template(TRIGGERS_ANALYSIS).render(triggers = triggers)
+  if unknown_paths:
+    output += jinja2.Template(UNKNOWN_PATHS).render(era = era, hlt_paths = unknown_paths)
+  return output
+
 if __name__ == '__main__':
   parser = argparse.ArgumentParser(
     formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
   )
-  parser.add_argument('-i', '--input', dest = 'input', metavar = 'file', required = True, type = str, default = '',
+  input_group = parser.add_mutually_exclusive_group(required = True)
+  input_group.add_argument('-i', '--input', dest = 'input', metavar = 'file', type = str, default = '',
     help = 'R|Output of brilcalc'
   )
+  input_group.add_argument('-d', '--input-dir', dest = 'input_dir', metavar = 'directory', type = str, default = '',
+    help = 'R|Directory of brilcalc outputs (*.csv) covering all HLT paths of an era'
+  )
   parser.add_argument(
     '-v', '--vstring', dest = 'vstring', action = 'store_true', default = False,
     help = 'R|Fill vstring template',
   )
+  parser.add_argument('-j', '--jobs', dest = 'jobs', metavar = 'number', required = False, type = int,
+    default = multiprocessing.cpu_count(),
+    help = 'R|Number of parallel processes in the batch mode',
+  )
   args = parser.parse_args()
-  results = read_results(args.input)
 
-  if results:
-    assert(all(results[0]['title'] == result['title'] for result in results[1:]))
-  recorded_sum = sum(result['recorded'] for result in results) / 1000.
-  runs = sorted(result['run'] for result in results)
-  run_ranges = get_run_ranges(runs)
-  era = get_era(runs)
-  run_assoc = get_run_assoc(results, run_ranges)
+  logging.basicConfig(
+    stream = sys.stderr,
+    level  = logging.INFO,
+    format = '%(asctime)s - %(levelname)s: %(message)s',
+  )
+
+  if args.input_dir:
+    print(run_batch(args.input_dir, args.vstring, args.jobs))
+    sys.exit(0)
+
+  path_stats = get_path_stats(read_results(args.input))
   dict_str = jinja2.Template(HLT_VSTRING if args.vstring else HLT_DICT).render(
-    hlt_path    = results[0]['title'],
-    int_lumi    = round(recorded_sum, 3),
-    unprescaled = INT_LUMIS[era] <= recorded_sum,
-    runs        = run_assoc,
+    hlt_path    = path_stats['title'],
+    unprescaled = path_stats['unprescaled'],
+    runs        = path_stats['runs'],
   )
   print(dict_str)
@@ -1,8 +1,25 @@
 #!/usr/bin/env python
 
 # Runs nanoAOD Ntuple production with SLURM instead of CRAB
+#
+# By default, every input file is processed in a separate job. With -b or -e, the input files are packed into jobs
+# of up to the given size or number of events, e.g.
+#
+# runLocally_nanoAOD.py -i files.txt -n SampleName -c nano_cfg.py -b 5G
+#
+# The numbers of events are read from the second column of the input file list, which can be obtained with
+#
+# dasgoclient -query="file dataset=/A/B/MINIAODSIM | grep file.name, file.nevents"
+#
+# The assignment of the input files to the jobs is kept in cfg/packing.json, so that the jobs and their outputs stay
+# the same when the script is rerun; the new input files are packed into new jobs.
+#
+# With -B local, the jobs are run on the current machine instead of SLURM; see run_local_jobs.py.
 
 from tthAnalysis.HiggsToTauTau.hdfs import hdfs
+from tthAnalysis.NanoAOD.fileListing import FileLister, list_local_directory, get_listing_cache
+from tthAnalysis.NanoAOD.jobPacking import JobPlan
+from tthAnalysis.NanoAOD.processUtils import parse_memory
 
 import logging
 import sys
@@ -12,6 +29,8 @@ import jinja2
 import shutil
 import stat
 import getpass
+import json
+import collections
 
 makefile_template = '''.DEFAULT_GOAL := all
 SHELL := /bin/bash
@@ -58,7 +77,7 @@ else
   st_cmd="stat --printf='%s'"
 fi
 
-JOB_DIR="{{ job_dir }}/$SLURM_JOBID"
+JOB_DIR="{{ job_dir }}/${SLURM_JOBID:-local_$$}"
 echo "Creating directory and going to: $JOB_DIR"
 mkdir -p $JOB_DIR
 cd $JOB_DIR
@@ -119,45 +138,34 @@ exit $EXIT_CODE
 
 '''
 
+# the jobs whose output files already exist are not submitted; see track_slurm_jobs.py and run_local_jobs.py
 shell_wrapper_template ='''#!/bin/bash
-
-OUTPUT_FILES=()
-{% for entry in file_map.values() %}
-OUTPUT_FILES+=('{{ entry['output_file'] }}')
-{%- endfor %}
-
-JOB_IDS=()
-
-{% for entry in file_map.values() %}
-if [ ! -f {{ entry['output_file'] }} ]; then
-  SBATCH_OUT=`sbatch --mem=1800M --partition=small --output={{ entry['logfile'] }} {{ entry['shell_script'] }}`
-  SBATCH_JOBID=`echo "$SBATCH_OUT" | awk '{print $4}'`
-  JOB_IDS+=("$SBATCH_JOBID")
-  echo "Submitted job $SBATCH_JOBID"
-fi
-{% endfor %}
-
-JOB_IDS_CAT=`IFS=, ; echo "${JOB_IDS[*]}"`
-
-while true; do
-  STILL_ALIVE=`squeue --job "$JOB_IDS_CAT" -h | wc -l`
-  if [ "$STILL_ALIVE" != "0" ]; then
-    echo "$STILL_ALIVE jobs still left ..."
-    sleep 60;
-  else
-    break;
-  fi
-done
+{% if backend == 'local' %}
+run_local_jobs.py -j {{ job_list }} -d {{ job_db }} -r {{ max_resubmits }} -n {{ nof_cores }} -M {{ mem }}
+{%- else %}
+track_slurm_jobs.py -j {{ job_list }} -d {{ job_db }} -r {{ max_resubmits }} -p small -M {{ mem }}
+{%- endif %}
 
 '''
 
 nano_cfg_additions = '''
-process.source.fileNames  = cms.untracked.vstring('file://{{ input_filename }}')
+process.source.fileNames  = cms.untracked.vstring({% for input_filename in input_filenames %}
+  'file://{{ input_filename }}',
+{%- endfor %}
+)
 process.source.skipEvents = cms.untracked.uint32({{ skip_events }})
 process.maxEvents.input   = cms.untracked.int32({{ max_events }})
 
 '''
 
+def list_directory(path):
+  """Lists the directories on HDFS through its API, since stat'ing every file on the FUSE mount is slow"""
+  if not path.startswith('/hdfs/'):
+    return list_local_directory(path)
+  return {
+    os.path.basename(entry.name) : entry.size for entry in hdfs.listdir(path, return_objs = True) if entry.isfile()
+  }
+
 if __name__ == '__main__':
   logging.basicConfig(
     stream = sys.stdout,
@@ -185,11 +193,33 @@ if __name__ == '__main__':
                       default = os.path.join('/home', getpass.getuser(), 'nanoProduction'),
                       help = 'R|Directory containing config and log files for the SLURM jobs')
   parser.add_argument('-m', '--max-events', dest = 'max_events', metavar = 'number', required = False, type = int, default = -1,
-                      help = 'R|Maximum number of events to be processed in the file')
+                      help = 'R|Maximum number of events to be processed in each job')
   parser.add_argument('-S', '--skip-events', dest = 'skip_events', metavar = 'number', required = False, type = int, default = 0,
-                      help = 'R|Number of events to be skipped in the file')
+                      help = 'R|Number of events to be skipped in each job')
+  packing_group = parser.add_mutually_exclusive_group()
+  packing_group.add_argument('-b', '--bytes-per-job', dest = 'bytes_per_job', metavar = 'size', required = False,
+                             type = str, default = '',
+                             help = 'R|Pack the input files into jobs of up to this total size (e.g. 5G)')
+  packing_group.add_argument('-e', '--events-per-job', dest = 'events_per_job', metavar = 'number', required = False,
+                             type = int, default = 0,
+                             help = 'R|Pack the input files into jobs of up to this number of events\n'
+                                    '(requires the number of events in the second column of the input file list)')
   parser.add_argument('-c', '--config', dest = 'config', metavar = 'file', required = True, type = str,
                       help = 'R|NanoAOD config file')
+  parser.add_argument('-r', '--max-resubmits', dest = 'max_resubmits', metavar = 'number', required = False, type = int,
+                      default = 2,
+                      help = 'R|Maximum number of times a failed job is resubmitted')
+  parser.add_argument('-B', '--backend', dest = 'backend', metavar = 'name', required = False, type = str,
+                      choices = [ 'slurm', 'local' ], default = 'slurm',
+                      help = 'R|Run the jobs with SLURM or on the current machine (choices: %(choices)s)')
+  parser.add_argument('-j', '--jobs', dest = 'jobs', metavar = 'number', required = False, type = int, default = 0,
+                      help = 'R|Maximum number of parallel jobs with the local backend (default: number of cores)')
+  parser.add_argument('-M', '--mem', dest = 'mem', metavar = 'size', required = False, type = str, default = '1800M',
+                      help = 'R|Memory needed per job, e.g. 1800M or 2G; with the local backend, it also limits the\n'
+                             'number of parallel jobs')
+  parser.add_argument('-t', '--threads', dest = 'threads', metavar = 'number', required = False, type = int,
+                      default = 8,
+                      help = 'R|Number of threads that list the directories of the input files')
   parser.add_argument('-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
                       help = 'R|Enable verbose printout')
   args = parser.parse_args()
@@ -202,6 +232,12 @@ if __name__ == '__main__':
   skip_events = args.skip_events
   nano_cfg    = args.config
 
+  bytes_per_job = parse_memory(args.bytes_per_job) if args.bytes_per_job else 0
+  if args.bytes_per_job and bytes_per_job <= 0 or args.events_per_job < 0:
+    raise ValueError("Invalid job size: %s" % (args.bytes_per_job or args.events_per_job))
+  if not parse_memory(args.mem) > 0:
+    raise ValueError("Invalid memory per job: %s" % args.mem)
+
   logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.INFO)
 
   script_dir = os.path.join(script_dir, sample_name)
@@ -213,27 +249,37 @@ if __name__ == '__main__':
     raise ValueError("No such file: %s" % infile)
 
   # check if the input is valid
-  input_files = []
+  candidate_files = collections.OrderedDict() # the input files are required to be unique
   if infile.lower().endswith('.root'):
-    input_files.append(infile)
+    candidate_files[os.path.abspath(infile)] = None
   else:
     with open(infile, 'r') as f:
       for line in f:
-        line_stripped = line.rstrip('\n')
-        if not line_stripped:
+        line_split = line.split()
+        if not line_split:
           # empty line
           continue
+        line_stripped = line_split[0]
         if not line_stripped.endswith('.root'):
           logging.warning('File %s does not appear to be a ROOT file' % line_stripped)
           continue
         line_path = '/hdfs%s' % line_stripped if line_stripped.startswith(('/local', '/cms')) else line_stripped
-        if not hdfs.isfile(line_path):
-          logging.error('File %s does not exist, skipping' % line_path)
-          continue
-        if line_path not in input_files:
-          # require the input files to be unique
-          input_files.append(line_path)
-        logging.debug('Preparing job for file: %s' % line_path)
+        if line_path not in candidate_files:
+          candidate_files[line_path] = int(line_split[1]) if len(line_split) > 1 else None
+
+  # check the existence and the sizes of the input files with a single listing per directory
+  file_lister = FileLister(list_directory, args.threads, get_listing_cache())
+  file_sizes = file_lister.get_sizes(candidate_files)
+  input_files = []
+  for candidate_file in candidate_files:
+    if candidate_file not in file_sizes:
+      logging.error('File %s does not exist, skipping' % candidate_file)
+      continue
+    input_files.append(candidate_file)
+    logging.debug('Preparing job for file: %s' % candidate_file)
+  nof_events = {
+    input_file : candidate_files[input_file] for input_file in input_files if candidate_files[input_file] is not None
+  }
 
   # check if the script directory exists, and if not, create it
   if not os.path.isdir(script_dir):
@@ -254,14 +300,36 @@ if __name__ == '__main__':
   # set the path to the Makefile and the sbatchManager script
   makefile_path = os.path.join(script_dir, 'Makefile_nanoAOD')
 
-  # map the input files to an output file, build the cfg files
-  file_map = {}
-  for input_file in input_files:
-    idx = len(file_map) + 1 # so that the tree indices start from 1 instead of 0
+  # assign the input files to jobs; the jobs from the previous runs are kept as they are
+  if args.events_per_job:
+    missing_events = [ input_file for input_file in input_files if input_file not in nof_events ]
+    if missing_events:
+      raise ValueError(
+        "Number of events missing for %d input file(s), e.g. %s" % (len(missing_events), missing_events[0])
+      )
+    get_weight = nof_events.get
+    capacity   = args.events_per_job
+  elif bytes_per_job:
+    get_weight = file_sizes.get
+    capacity   = bytes_per_job
+  else:
+    get_weight = lambda input_file: 1
+    capacity   = None
+  job_plan = JobPlan(os.path.join(cfg_dir, 'packing.json'))
+  new_jobs = job_plan.update(input_files, get_weight, capacity, {
+    'bytes_per_job'  : bytes_per_job,
+    'events_per_job' : args.events_per_job,
+  })
+  job_plan.save()
+  logging.info('Packed %d input files into %d jobs (%d new)' % (len(input_files), len(job_plan.jobs), len(new_jobs)))
+
+  # map the jobs to an output file, build the cfg files
+  file_map = collections.OrderedDict()
+  for idx, job_files in job_plan.jobs.items():
     output_file = os.path.join(
       outdir, sample_name, '%04d' % (idx // 1000), 'tree_%d.root' % idx,
     )
-    logging.debug('Mapping input file %s to output file %s' % (input_file, output_file))
+    logging.debug('Mapping input file(s) %s to output file %s' % (', '.join(job_files), output_file))
 
     # copy nano_cfg.py to the cfg folder and rename it according to the idx value
     cfg_file = os.path.join(cfg_dir, 'cfg_%d.py' % idx)
@@ -270,9 +338,9 @@ if __name__ == '__main__':
     # append a line to the cfg file saying that we want to process current input file
     with open(cfg_file, 'a') as f:
       f.write(jinja2.Template(nano_cfg_additions).render(
-        input_filename = input_file,
-        max_events     = max_events,
-        skip_events    = skip_events,
+        input_filenames = job_files,
+        max_events      = max_events,
+        skip_events     = skip_events,
       ))
     logging.debug('Built config file: %s' % cfg_file)
 
@@ -291,17 +359,41 @@ if __name__ == '__main__':
     os.chmod(shell_file, st.st_mode | stat.S_IEXEC)
     logging.debug('Built shell script: %s' % shell_file)
 
-    file_map[input_file] = {
+    file_map[idx] = {
       'output_file'  : output_file,
       'logfile'      : os.path.join(log_dir, 'wrapper_%d.log' % idx),
       'shell_script' : shell_file,
+      'cmsrun_log'   : os.path.join(log_dir, 'executable_%d.log' % idx),
+      'nof_files'    : len(job_files),
+      'nevents'      : sum(nof_events[input_file] for input_file in job_files) \
+                       if all(input_file in nof_events for input_file in job_files) else None,
     }
 
+  # list the jobs for the job tracker
+  job_list = os.path.join(cfg_dir, 'jobs.json')
+  with open(job_list, 'w') as f:
+    json.dump({
+      os.path.splitext(os.path.basename(entry['output_file']))[0] : {
+        'script'      : entry['shell_script'],
+        'logfile'     : entry['logfile'],
+        'output_file' : entry['output_file'],
+        'cmsrun_log'  : entry['cmsrun_log'],
+        'nof_files'   : entry['nof_files'],
+        'nevents'     : entry['nevents'],
+      } for entry in file_map.values()
+    }, f, indent = 2)
+  logging.debug('Built job list: %s' % job_list)
+
   # now add wrapper to the shell script that keeps the makefile ,,alive''
   shell_wrapper = os.path.join(cfg_dir, 'job_wrapper.sh')
   with open(shell_wrapper, 'w') as f:
     shell_wrapper_contents = jinja2.Template(shell_wrapper_template).render(
-      file_map = file_map,
+      job_list      = job_list,
+      job_db        = os.path.join(script_dir, 'jobs.sqlite'),
+      max_resubmits = args.max_resubmits,
+      backend       = args.backend,
+      nof_cores     = args.jobs,
+      mem           = args.mem,
     )
     f.write(shell_wrapper_contents)
   # add executable rights
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+# Runs the jobs of runLocally_nanoAOD.py on the current machine instead of SLURM, and prints the throughput at the
+# end. The jobs are read from the same JSON file as track_slurm_jobs.py, which may also list the cmsRun log file,
+# the number of input files and the number of input events of each job, e.g.:
+#
+# { "tree_1" : { "script" : "cfg/job_1.sh", "logfile" : "log/wrapper_1.log", "output_file" : "out/tree_1.root",
+#                "cmsrun_log" : "log/executable_1.log", "nof_files" : 3, "nevents" : 12000 } }
+#
+# The number of parallel jobs is limited by the number of cores and by the memory budget. Example usage:
+#
+# run_local_jobs.py -j jobs.json -d jobs.sqlite -M 1800M -m 16G
+
+from tthAnalysis.NanoAOD.localRunner import STATE_FAILED, LocalRunner, get_nof_workers, get_physical_memory, summarize
+from tthAnalysis.NanoAOD.processUtils import parse_memory
+from tthAnalysis.NanoAOD.slurmTracker import JobDB
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+logging.basicConfig(
+  stream = sys.stdout,
+  level  = logging.INFO,
+  format = '%(asctime)s - %(levelname)s: %(message)s'
+)
+
+class SmartFormatter(argparse.HelpFormatter):
+  def _split_lines(self, text, width):
+    if text.startswith('R|'):
+      return text[2:].splitlines()
+    return argparse.HelpFormatter._split_lines(self, text, width)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+    formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
+  )
+  parser.add_argument('-j', '--jobs', dest = 'jobs', metavar = 'file', required = True, type = str,
+                      help = 'R|JSON file of the jobs')
+  parser.add_argument('-d', '--db', dest = 'db', metavar = 'file', required = True, type = str,
+                      help = 'R|SQLite database of the job states')
+  parser.add_argument('-r', '--max-retries', dest = 'max_retries', metavar = 'int', required = False, type = int,
+                      default = 2,
+                      help = 'R|Maximum number of times a failed job is rerun')
+  parser.add_argument('-n', '--nof-cores', dest = 'nof_cores', metavar = 'int', required = False, type = int,
+                      default = 0,
+                      help = 'R|Maximum number of parallel jobs (default: number of cores)')
+  parser.add_argument('-M', '--mem', dest = 'mem', metavar = 'size', required = False, type = str, default = '1800M',
+                      help = 'R|Memory needed per job')
+  parser.add_argument('-m', '--memory-budget', dest = 'memory_budget', metavar = 'size', required = False, type = str,
+                      default = '',
+                      help = 'R|Total memory available to the jobs (default: physical memory)')
+  parser.add_argument('-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
+                      help = 'R|Enable verbose printout')
+  args = parser.parse_args()
+
+  if args.verbose:
+    logging.getLogger().setLevel(logging.DEBUG)
+
+  if not os.path.isfile(args.jobs):
+    raise ValueError("No such file: %s" % args.jobs)
+  with open(args.jobs, 'r') as jobs_file:
+    jobs = json.load(jobs_file)
+
+  memory_budget = parse_memory(args.memory_budget) if args.memory_budget else get_physical_memory()
+  nof_workers = get_nof_workers(args.nof_cores, memory_budget, parse_memory(args.mem))
+  logging.debug('Running up to {} jobs in parallel with a memory budget of {:.1f} GB'.format(
+    nof_workers, memory_budget / 1024. ** 3
+  ))
+
+  db = JobDB(args.db)
+  for job_name, job in jobs.items():
+    db.add(job_name, job['script'], job['logfile'], job.get('output_file', ''))
+
+  runner = LocalRunner(db, nof_workers, max_retries = args.max_retries, job_info = jobs)
+  t_start = time.time()
+  interrupted = False
+  try:
+    runner.run()
+  except KeyboardInterrupt:
+    # the running jobs have been killed; the jobs that finished are still summarized
+    interrupted = True
+  wall_time = time.time() - t_start
+  db.close()
+  for line in summarize(runner.results, wall_time):
+    logging.info(line)
+  if interrupted:
+    sys.exit(1)
+  nof_failed = len([ result for result in runner.results if result.state == STATE_FAILED ])
+  if nof_failed:
+    logging.error('{} job(s) failed, see {}'.format(nof_failed, args.db))
+    sys.exit(1)
+  logging.info('All jobs finished')
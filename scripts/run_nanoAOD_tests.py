@@ -7,9 +7,11 @@ import json
 import argparse
 
 
-def fill_template(params, output_dir, nthreads, nevents, verbose):
+def fill_template(params, output_dir, nthreads, nevents, hlt_filter, prune_hlt_filter, verbose):
   print('Generating cfg file for {} ...'.format(params['name']))
   params['is_mc'] = (params['type'] != 'data')
+  params['hlt_filter'] = hlt_filter
+  params['prune_hlt_filter'] = prune_hlt_filter
 
   if params['is_mc']:
     params['tier'] = 'NANOAODSIM'
@@ -24,10 +26,14 @@ def fill_template(params, output_dir, nthreads, nevents, verbose):
   params['py_out'] = base_fn.format(ext = 'py')
   params['log'] = base_fn.format(ext = 'log')
 
+  # the HLT paths can be pruned only if the lumi mask is part of the configuration
+  params['lumi_opt'] = '--lumiToProcess {} '.format(params['lumi_mask']) if 'lumi_mask' in params else ''
+
   template = "cmsDriver.py {name} -s NANO --{type} --eventcontent {tier} --datatier {tier} --conditions {cond} " \
              "--nThreads {nthreads} --era {era} --processName=NANO -n {nevents} --fileout {fileout} --python_filename {py_out} " \
-             "--filein {file} --no_exec --customise_commands=\"process.MessageLogger.cerr.FwkReport.reportEvery = 1\\n" \
-             "from tthAnalysis.NanoAOD.addVariables import addVariables; addVariables(process, {is_mc}, '{year}')\\n\""
+             "--filein {file} {lumi_opt}--no_exec --customise_commands=\"process.MessageLogger.cerr.FwkReport.reportEvery = 1\\n" \
+             "from tthAnalysis.NanoAOD.addVariables import addVariables; addVariables(process, is_mc = {is_mc}, " \
+             "year = '{year}', reportEvery = 1, hlt_filter = '{hlt_filter}', pruneHltFilter = {prune_hlt_filter})\\n\""
   template_filled = template.format(**params)
   if verbose:
     print(template_filled)
@@ -67,6 +73,16 @@ parser.add_argument(
   '-t', '--threads', dest = 'threads', metavar = 'int', required = False, type = int, default = 1,
   help = 'R|Number of threads per test',
 )
+parser.add_argument(
+  '-F', '--hlt-filter', dest = 'hlt_filter', metavar = 'option', required = False, type = str, default = '',
+  choices = [ '', 'all', 'QCD' ],
+  help = 'R|Filter the events by the OR of the HLT paths (choices: %(choices)s)',
+)
+parser.add_argument(
+  '-P', '--prune-hlt-filter', dest = 'prune_hlt_filter', action = 'store_true', default = False,
+  help = 'R|Drop the HLT paths that are not active in the runs of the lumi mask (requires -F and "lumi_mask" in the '
+         'test case)',
+)
 parser.add_argument(
   '-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
   help = 'R|Enable verbose printout',
@@ -77,8 +93,13 @@ input_json = args.input
 output_dir = args.output
 nevents = args.nevents
 nthreads = args.threads
+hlt_filter = args.hlt_filter
+prune_hlt_filter = args.prune_hlt_filter
 verbose = args.verbose
 
+if prune_hlt_filter and not hlt_filter:
+  raise ValueError('Option -P requires the HLT filter to be enabled with -F')
+
 with open(input_json, 'r') as testCases:
   params_list = json.load(testCases)
 
@@ -92,7 +113,7 @@ if not os.path.isdir(output_dir):
 
 cmds = []
 for params in params_list:
-  cmds.append(fill_template(params, output_dir, nthreads, nevents, verbose))
+  cmds.append(fill_template(params, output_dir, nthreads, nevents, hlt_filter, prune_hlt_filter, verbose))
 
 sh_file = os.path.join(output_dir, 'run_all.sh')
 with open(sh_file, 'w') as f:
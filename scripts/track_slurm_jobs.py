@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+# Submits SLURM jobs and tracks them until all of them have finished, resubmitting the failed ones. The jobs are
+# read from a JSON file that maps the job names to their shell scripts, log files and output files, e.g.:
+#
+# { "tree_1" : { "script" : "cfg/job_1.sh", "logfile" : "log/wrapper_1.log", "output_file" : "out/tree_1.root" } }
+#
+# The state of the jobs is kept in an SQLite database, so that an interrupted invocation can be resumed without
+# resubmitting the jobs that are still running. Example usage:
+#
+# track_slurm_jobs.py -j jobs.json -d jobs.sqlite -r 2 -p small -M 1800M
+
+from tthAnalysis.NanoAOD.slurmTracker import JobDB, SlurmTracker
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+logging.basicConfig(
+  stream = sys.stdout,
+  level  = logging.INFO,
+  format = '%(asctime)s - %(levelname)s: %(message)s'
+)
+
+class SmartFormatter(argparse.HelpFormatter):
+  def _split_lines(self, text, width):
+    if text.startswith('R|'):
+      return text[2:].splitlines()
+    return argparse.HelpFormatter._split_lines(self, text, width)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+    formatter_class = lambda prog: SmartFormatter(prog, max_help_position = 40),
+  )
+  parser.add_argument('-j', '--jobs', dest = 'jobs', metavar = 'file', required = True, type = str,
+                      help = 'R|JSON file of the jobs')
+  parser.add_argument('-d', '--db', dest = 'db', metavar = 'file', required = True, type = str,
+                      help = 'R|SQLite database of the job states')
+  parser.add_argument('-r', '--max-resubmits', dest = 'max_resubmits', metavar = 'int', required = False, type = int,
+                      default = 2,
+                      help = 'R|Maximum number of times a failed job is resubmitted')
+  parser.add_argument('-p', '--partition', dest = 'partition', metavar = 'name', required = False, type = str,
+                      default = 'small',
+                      help = 'R|SLURM partition')
+  parser.add_argument('-M', '--mem', dest = 'mem', metavar = 'size', required = False, type = str, default = '1800M',
+                      help = 'R|Memory requested per job')
+  parser.add_argument('-t', '--poll-interval', dest = 'poll_interval', metavar = 'seconds', required = False,
+                      type = float, default = 5.,
+                      help = 'R|Minimum interval between the sacct queries')
+  parser.add_argument('-T', '--max-poll-interval', dest = 'max_poll_interval', metavar = 'seconds', required = False,
+                      type = float, default = 60.,
+                      help = 'R|Maximum interval between the sacct queries')
+  parser.add_argument('-b', '--sbatch', dest = 'sbatch', metavar = 'path', required = False, type = str,
+                      default = 'sbatch',
+                      help = 'R|Path to the sbatch executable')
+  parser.add_argument('-a', '--sacct', dest = 'sacct', metavar = 'path', required = False, type = str,
+                      default = 'sacct',
+                      help = 'R|Path to the sacct executable')
+  parser.add_argument('-q', '--squeue', dest = 'squeue', metavar = 'path', required = False, type = str,
+                      default = 'squeue',
+                      help = 'R|Path to the squeue executable')
+  parser.add_argument('-s', '--submit-tries', dest = 'submit_tries', metavar = 'int', required = False, type = int,
+                      default = 3,
+                      help = 'R|Number of times a failed sbatch call is tried before the job is given up')
+  parser.add_argument('-l', '--lost-timeout', dest = 'lost_timeout', metavar = 'seconds', required = False,
+                      type = float, default = 600.,
+                      help = 'R|Time after which a job that is neither in sacct nor in squeue is considered lost')
+  parser.add_argument('-v', '--verbose', dest = 'verbose', action = 'store_true', default = False,
+                      help = 'R|Enable verbose printout')
+  args = parser.parse_args()
+
+  if args.verbose:
+    logging.getLogger().setLevel(logging.DEBUG)
+
+  if not os.path.isfile(args.jobs):
+    raise ValueError("No such file: %s" % args.jobs)
+  with open(args.jobs, 'r') as jobs_file:
+    jobs = json.load(jobs_file)
+
+  db = JobDB(args.db)
+  for job_name, job in jobs.items():
+    db.add(job_name, job['script'], job['logfile'], job.get('output_file', ''))
+
+  tracker = SlurmTracker(
+    db,
+    sbatch_args     = [ '--mem={}'.format(args.mem), '--partition={}'.format(args.partition) ],
+    max_resubmits   = args.max_resubmits,
+    poll_min        = args.poll_interval,
+    poll_max        = args.max_poll_interval,
+    sbatch          = args.sbatch,
+    sacct           = args.sacct,
+    squeue          = args.squeue,
+    submit_tries    = args.submit_tries,
+    missing_timeout = args.lost_timeout,
+    names           = list(jobs),
+  )
+  nof_failed = tracker.run()
+  db.close()
+  if nof_failed:
+    logging.error('{} job(s) failed, see {}'.format(nof_failed, args.db))
+    sys.exit(1)
+  logging.info('All jobs finished')
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+# Tests of the parent graph crawler against scripts/fake_dasgoclient.py, which replays recorded responses; run with:
+# python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.dasLineage import DatasetLineage, parse_parents
+from tthAnalysis.NanoAOD.dasMetadata import METADATA_OPTIONS, get_group_query, get_parent_query
+from tthAnalysis.NanoAOD.dasQuery import DASQueryEngine
+from tthAnalysis.NanoAOD.dasReplay import Fixture, FixtureStore
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+FAKE_DASGOCLIENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'fake_dasgoclient.py')
+REPLAY_ENV = [ 'DAS_REPLAY_FIXTURES', 'DAS_REPLAY_MODE', 'DAS_REPLAY_LATENCY', 'DAS_REPLAY_LOG' ]
+
+PRIMARY_DATASET = 'TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8'
+MINIAOD = '/{}/RunIIAutumn18MiniAOD-102X_v15-v1/MINIAODSIM'.format(PRIMARY_DATASET)
+MINIAOD_EXT = '/{}/RunIIAutumn18MiniAOD-102X_v15_ext1-v2/MINIAODSIM'.format(PRIMARY_DATASET)
+# both MINIAODSIM datasets are derived from the same AODSIM dataset
+AOD = '/{}/RunIIAutumn18DRPremix-102X_v15-v1/AODSIM'.format(PRIMARY_DATASET)
+GENSIM = '/{}/RunIIFall18GS-102X_v11-v1/GEN-SIM'.format(PRIMARY_DATASET)
+
+def read_queries(log_fn):
+  """Returns the queries that reached the fake client, in the order of their arrival"""
+  if not os.path.isfile(log_fn):
+    return []
+  with open(log_fn, 'r') as log_file:
+    return [ line.rstrip('\n').partition('\t')[2] for line in log_file ]
+
+class DatasetLineageTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.environ = { key : os.environ.get(key) for key in REPLAY_ENV }
+    self.log_fn = os.path.join(self.tmp_dir, 'queries.log')
+    fixtures_fn = os.path.join(self.tmp_dir, 'fixtures.sqlite')
+    os.environ['DAS_REPLAY_FIXTURES'] = fixtures_fn
+    os.environ['DAS_REPLAY_MODE'] = 'replay'
+    os.environ['DAS_REPLAY_LATENCY'] = 'recorded'
+    os.environ['DAS_REPLAY_LOG'] = self.log_fn
+
+    store = FixtureStore(fixtures_fn)
+    store.put(get_group_query(PRIMARY_DATASET, 'MINIAODSIM'), Fixture('\n'.join([
+      '{} 101550000 1550000000 VALID'.format(MINIAOD),
+      '{} 99000000 1560000000 VALID'.format(MINIAOD_EXT),
+    ]), '', 0, 0.), METADATA_OPTIONS)
+    store.put(get_parent_query(MINIAOD), Fixture(AOD, '', 0, 0.))
+    store.put(get_parent_query(MINIAOD_EXT), Fixture(AOD, '', 0, 0.))
+    store.put(get_parent_query(AOD), Fixture(GENSIM, '', 0, 0.))
+    store.put(get_parent_query(GENSIM), Fixture('', '', 0, 0.))
+    store.close()
+
+    self.client = os.path.join(self.tmp_dir, 'dasgoclient')
+    os.symlink(os.path.abspath(FAKE_DASGOCLIENT), self.client)
+    self.das = DASQueryEngine(executable = self.client, timeout = 10, backoff = 0.01, max_backoff = 0.05)
+
+  def tearDown(self):
+    for key, value in self.environ.items():
+      if value is None:
+        os.environ.pop(key, None)
+      else:
+        os.environ[key] = value
+    shutil.rmtree(self.tmp_dir)
+
+  def test_parse_parents(self):
+    self.assertEqual(parse_parents('[{{"dataset": ...}}]\n{}\n\n'.format(AOD)), [ AOD ])
+    self.assertEqual(parse_parents(''), [])
+
+  def test_crawl(self):
+    lineage = DatasetLineage(self.das).crawl([ MINIAOD, MINIAOD_EXT, MINIAOD ], 2)
+    self.assertEqual(lineage.get_ancestors(MINIAOD, 2), [ [ AOD ], [ GENSIM ] ])
+    self.assertEqual(lineage.get_ancestors(MINIAOD_EXT, 2), [ [ AOD ], [ GENSIM ] ])
+    self.assertEqual(lineage.get_parent(lineage.get_parent(MINIAOD)), GENSIM)
+    self.assertEqual(list(lineage.metadata), [ MINIAOD, MINIAOD_EXT ])
+    self.assertEqual(lineage.metadata[MINIAOD].nevents, 101550000)
+    # the shared parent is queried once, and neither the metadata of the parents nor the parents of the last
+    # generation are queried
+    self.assertEqual(sorted(read_queries(self.log_fn)), sorted([
+      '{} -unique'.format(get_group_query(PRIMARY_DATASET, 'MINIAODSIM')),
+      get_parent_query(MINIAOD),
+      get_parent_query(MINIAOD_EXT),
+      get_parent_query(AOD),
+    ]))
+
+  def test_crawl_deeper(self):
+    lineage = DatasetLineage(self.das).crawl([ MINIAOD ], 1)
+    self.assertEqual(lineage.get_ancestors(MINIAOD, 2), [ [ AOD ] ])
+    self.assertEqual(len(read_queries(self.log_fn)), 2)
+    lineage.crawl([ MINIAOD ], 3)
+    self.assertEqual(lineage.get_ancestors(MINIAOD, 3), [ [ AOD ], [ GENSIM ] ])
+    self.assertEqual(read_queries(self.log_fn)[2:], [ get_parent_query(AOD), get_parent_query(GENSIM) ])
+
+  def test_dump(self):
+    output_fn = os.path.join(self.tmp_dir, 'lineage', 'lineage.json')
+    DatasetLineage(self.das).crawl([ MINIAOD, MINIAOD_EXT ], 2).dump(output_fn, [ MINIAOD, MINIAOD_EXT ], 2)
+    with open(output_fn, 'r') as output_file:
+      lineage_dict = json.load(output_file)
+    self.assertEqual(lineage_dict['depth'], 2)
+    self.assertEqual(sorted(lineage_dict['datasets']), sorted([ MINIAOD, MINIAOD_EXT ]))
+    self.assertEqual(lineage_dict['datasets'][MINIAOD_EXT], {
+      'nevents' : 99000000, 'last_modification_date' : 1560000000, 'status' : 'VALID', 'parents' : [ AOD ],
+    })
+    self.assertEqual(lineage_dict['lineage'][MINIAOD], [ [ AOD ], [ GENSIM ] ])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Tests of the dataset metadata queries against scripts/fake_dasgoclient.py, which replays recorded responses; run with:
+# python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.dasMetadata import METADATA_GREP, METADATA_OPTIONS, fetch_metadata, get_dataset_query, \
+                                            get_group_query, get_parent_query, parse_metadata, split_dataset
+from tthAnalysis.NanoAOD.dasQuery import DASQueryEngine
+from tthAnalysis.NanoAOD.dasReplay import Fixture, FixtureStore
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+FAKE_DASGOCLIENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'fake_dasgoclient.py')
+REPLAY_ENV = [ 'DAS_REPLAY_FIXTURES', 'DAS_REPLAY_MODE', 'DAS_REPLAY_LATENCY', 'DAS_REPLAY_LOG' ]
+
+PRIMARY_DATASET = 'TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8'
+DATASET_VALID = '/{}/RunIIAutumn18MiniAOD-102X_v15-v1/MINIAODSIM'.format(PRIMARY_DATASET)
+DATASET_EXT = '/{}/RunIIAutumn18MiniAOD-102X_v15_ext1-v2/MINIAODSIM'.format(PRIMARY_DATASET)
+# not returned by the wildcard query, so that its metadata has to be queried separately
+DATASET_HIDDEN = '/{}/RunIIAutumn18MiniAOD-102X_v15-v3/MINIAODSIM'.format(PRIMARY_DATASET)
+DATASET_UNKNOWN = '/{}/RunIIAutumn18MiniAOD-102X_v15-v4/MINIAODSIM'.format(PRIMARY_DATASET)
+DATASET_OTHER = '/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIIAutumn18MiniAOD-102X_v15-v1/MINIAODSIM'
+PARENT = '/{}/RunIIAutumn18DRPremix-102X_v15-v1/AODSIM'.format(PRIMARY_DATASET)
+
+GROUP_OUT = '\n'.join([
+  '[{"dataset": ...}]',
+  '{} 101550000 1550000000 VALID'.format(DATASET_VALID),
+  '{} 99000000 1560000000 PRODUCTION'.format(DATASET_EXT),
+  'unexpected line',
+])
+
+def read_queries(log_fn):
+  """Returns the queries that reached the fake client, in the order of their arrival"""
+  with open(log_fn, 'r') as log_file:
+    return [ line.rstrip('\n').partition('\t')[2] for line in log_file ]
+
+class LogCapture(logging.Handler):
+  """Collects the messages of the root logger"""
+
+  def __init__(self):
+    logging.Handler.__init__(self)
+    self.messages = []
+
+  def emit(self, record):
+    self.messages.append(record.getMessage())
+
+  def __enter__(self):
+    logging.getLogger().addHandler(self)
+    return self
+
+  def __exit__(self, *args):
+    logging.getLogger().removeHandler(self)
+
+class ParseMetadataTest(unittest.TestCase):
+
+  def test_parse_metadata(self):
+    self.assertEqual(parse_metadata(GROUP_OUT), {
+      DATASET_VALID : ( 101550000, 1550000000, 'VALID' ),
+      DATASET_EXT   : ( 99000000, 1560000000, 'PRODUCTION' ),
+    })
+    self.assertEqual(parse_metadata('{} null null INVALID'.format(DATASET_VALID)), {
+      DATASET_VALID : ( None, None, 'INVALID' ),
+    })
+    self.assertEqual(parse_metadata(''), {})
+
+  def test_split_dataset(self):
+    self.assertEqual(
+      split_dataset(DATASET_VALID), ( PRIMARY_DATASET, 'RunIIAutumn18MiniAOD-102X_v15-v1', 'MINIAODSIM' )
+    )
+    self.assertRaises(ValueError, split_dataset, 'TTToSemiLeptonic/A/MINIAODSIM')
+    self.assertRaises(ValueError, split_dataset, '/TTToSemiLeptonic/A')
+
+class FetchMetadataTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.environ = { key : os.environ.get(key) for key in REPLAY_ENV }
+    self.log_fn = os.path.join(self.tmp_dir, 'queries.log')
+    fixtures_fn = os.path.join(self.tmp_dir, 'fixtures.sqlite')
+    os.environ['DAS_REPLAY_FIXTURES'] = fixtures_fn
+    os.environ['DAS_REPLAY_MODE'] = 'replay'
+    os.environ['DAS_REPLAY_LATENCY'] = 'recorded'
+    os.environ['DAS_REPLAY_LOG'] = self.log_fn
+
+    store = FixtureStore(fixtures_fn)
+    store.put(get_group_query(PRIMARY_DATASET, 'MINIAODSIM'), Fixture(GROUP_OUT, '', 0, 0.), METADATA_OPTIONS)
+    store.put(get_dataset_query(DATASET_HIDDEN), Fixture(
+      '{} 5000 1570000000 VALID'.format(DATASET_HIDDEN), '', 0, 0.
+    ), METADATA_OPTIONS)
+    store.put(get_group_query('TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8', 'MINIAODSIM'), Fixture(
+      '{} 64310000 1550000000 VALID'.format(DATASET_OTHER), '', 0, 0.
+    ), METADATA_OPTIONS)
+    store.put(get_parent_query(DATASET_VALID), Fixture(PARENT, '', 0, 0.))
+    store.close()
+
+    self.client = os.path.join(self.tmp_dir, 'dasgoclient')
+    os.symlink(os.path.abspath(FAKE_DASGOCLIENT), self.client)
+    self.das = DASQueryEngine(executable = self.client, timeout = 10, backoff = 0.01, max_backoff = 0.05)
+
+  def tearDown(self):
+    for key, value in self.environ.items():
+      if value is None:
+        os.environ.pop(key, None)
+      else:
+        os.environ[key] = value
+    shutil.rmtree(self.tmp_dir)
+
+  def test_group_query(self):
+    metadata = fetch_metadata(self.das, [ DATASET_EXT, DATASET_OTHER, DATASET_VALID, DATASET_EXT ])
+    self.assertEqual(list(metadata), [ DATASET_EXT, DATASET_OTHER, DATASET_VALID ])
+    self.assertEqual(metadata[DATASET_VALID].nevents, 101550000)
+    self.assertEqual(metadata[DATASET_VALID].last_modification_date, 1550000000)
+    self.assertEqual(metadata[DATASET_EXT].status, 'PRODUCTION')
+    self.assertEqual(metadata[DATASET_OTHER].nevents, 64310000)
+    self.assertEqual(metadata[DATASET_VALID].parent, '')
+    # one wildcard query per primary dataset and data tier, and no queries per dataset
+    self.assertEqual(sorted(read_queries(self.log_fn)), sorted([
+      'dataset dataset=/{}/*/MINIAODSIM status=* | grep {} -unique'.format(primary_dataset, METADATA_GREP)
+      for primary_dataset in [ PRIMARY_DATASET, 'TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8' ]
+    ]))
+
+  def test_fallback(self):
+    logger = logging.getLogger()
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    try:
+      with LogCapture() as log_capture:
+        metadata = fetch_metadata(self.das, [ DATASET_VALID, DATASET_HIDDEN, DATASET_UNKNOWN ])
+    finally:
+      logger.setLevel(level)
+    self.assertEqual(metadata[DATASET_VALID].nevents, 101550000)
+    self.assertEqual(metadata[DATASET_HIDDEN].nevents, 5000)
+    self.assertEqual(metadata[DATASET_HIDDEN].status, 'VALID')
+    # the fields of the datasets that DAS does not know at all are left empty
+    self.assertEqual(metadata[DATASET_UNKNOWN][1:4], ( None, None, None ))
+    queries = read_queries(self.log_fn)
+    self.assertEqual(len(queries), 3)
+    self.assertIn('dataset dataset={} status=* | grep {} -unique'.format(DATASET_HIDDEN, METADATA_GREP), queries)
+    self.assertIn('dataset dataset={} status=* | grep {} -unique'.format(DATASET_UNKNOWN, METADATA_GREP), queries)
+    self.assertTrue(any('2/3 dataset(s)' in message for message in log_capture.messages))
+
+  def test_parents(self):
+    metadata = fetch_metadata(self.das, [ DATASET_VALID ], parents = True)
+    self.assertEqual(metadata[DATASET_VALID].parent, PARENT)
+    self.assertIn(get_parent_query(DATASET_VALID), read_queries(self.log_fn))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+# Tests of the DAS query engine against scripts/fake_dasgoclient.py, which replays recorded responses; run with:
+# python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.dasCache import DASCache
+from tthAnalysis.NanoAOD.dasQuery import DASQueryEngine
+from tthAnalysis.NanoAOD.dasReplay import Fixture, FixtureStore, read_log
+from tthAnalysis.NanoAOD.lumiMask import LumiMask, parse_lumi_list
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+
+FAKE_DASGOCLIENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'fake_dasgoclient.py')
+REPLAY_ENV = [ 'DAS_REPLAY_FIXTURES', 'DAS_REPLAY_MODE', 'DAS_REPLAY_LATENCY', 'DAS_REPLAY_LOG' ]
+
+# hangs in the first nof_hangs calls, then passes the query on to the fake dasgoclient
+FLAKY_TEMPLATE = '''#!/bin/sh
+call=$(( $(cat "{counter}" 2>/dev/null || echo 0) + 1 ))
+echo $call > "{counter}"
+[ $call -gt {nof_hangs} ] || sleep 30
+exec "{client}" "$@"
+'''
+
+DATASET = '/TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8/RunIIAutumn18MiniAOD-102X_v15-v1/MINIAODSIM'
+PARENT = '/TTToSemiLeptonic_TuneCP5_13TeV-powheg-pythia8/RunIIAutumn18DRPremix-102X_v15-v1/AODSIM'
+DATASET_DATA = '/SingleMuon/Run2018A-17Sep2018-v2/MINIAOD'
+
+def parse_runlumis(lines):
+  """Parses the output of a run,lumi query as find_nano_datasets.py does"""
+  return LumiMask({ int(line.split()[0]) : parse_lumi_list(line.split()[1]) for line in lines if line })
+
+class DASQueryEngineTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.environ = { key : os.environ.get(key) for key in REPLAY_ENV }
+    self.log_fn = os.path.join(self.tmp_dir, 'queries.log')
+    fixtures_fn = os.path.join(self.tmp_dir, 'fixtures.sqlite')
+    os.environ['DAS_REPLAY_FIXTURES'] = fixtures_fn
+    os.environ['DAS_REPLAY_MODE'] = 'replay'
+    os.environ['DAS_REPLAY_LATENCY'] = 'recorded'
+    os.environ['DAS_REPLAY_LOG'] = self.log_fn
+
+    store = FixtureStore(fixtures_fn)
+    store.put('parent dataset={}'.format(DATASET), Fixture(PARENT, '', 0, 0.))
+    store.put('file dataset={}'.format(DATASET), Fixture('\n'.join(
+      '/store/mc/f{}.root'.format(idx) for idx in range(5)
+    ), '', 0, 0.))
+    store.put('run,lumi dataset={}'.format(DATASET_DATA), Fixture('\n'.join([
+      '315257 [{}]'.format(','.join(map(str, range(1, 89)))),
+      '315259 [7,1,2,3,172,9,8]',
+    ]), '', 0, 0.))
+    store.put('dataset dataset=/Slow/*/*', Fixture('/Slow/A/MINIAODSIM', '', 0, 30.))
+    store.put('dataset dataset=/Broken/*/*', Fixture('', 'DAS error', 1, 0.))
+    store.close()
+
+    self.client = os.path.join(self.tmp_dir, 'dasgoclient')
+    os.symlink(os.path.abspath(FAKE_DASGOCLIENT), self.client)
+
+  def tearDown(self):
+    for key, value in self.environ.items():
+      if value is None:
+        os.environ.pop(key, None)
+      else:
+        os.environ[key] = value
+    shutil.rmtree(self.tmp_dir)
+
+  def get_engine(self, **kwargs):
+    kwargs.setdefault('executable', self.client)
+    kwargs.setdefault('timeout', 10)
+    return DASQueryEngine(backoff = 0.01, max_backoff = 0.05, **kwargs)
+
+  def test_query(self):
+    das = self.get_engine()
+    self.assertEqual(das.query('parent dataset={}'.format(DATASET)), PARENT)
+    # unknown queries get an empty response, as in DAS
+    self.assertEqual(das.query('parent dataset=/Unknown/A/MINIAODSIM'), '')
+    stats = read_log(self.log_fn)
+    self.assertEqual(stats['hit'], 1)
+    self.assertEqual(stats['miss'], 1)
+
+  def test_memoized(self):
+    das = self.get_engine()
+    queries = [ 'parent dataset={}'.format(DATASET) ] * 4 + [ 'file dataset={}'.format(DATASET) ]
+    outs = das.query_many(queries)
+    self.assertEqual(outs[:4], [ PARENT ] * 4)
+    self.assertEqual(len(outs[4].split('\n')), 5)
+    self.assertEqual(read_log(self.log_fn)['hit'], 2)
+
+  def test_timeout(self):
+    das = self.get_engine(timeout = 0.5, max_tries = 2)
+    t_start = time.time()
+    self.assertRaises(RuntimeError, das.query, 'dataset dataset=/Slow/*/*')
+    # the hanging clients are killed instead of waited for
+    self.assertLess(time.time() - t_start, 10.)
+
+  def test_failure(self):
+    das = self.get_engine(max_tries = 3)
+    self.assertRaises(RuntimeError, das.query, 'dataset dataset=/Broken/*/*')
+    self.assertEqual(read_log(self.log_fn)['hit'], 3)
+
+  def test_retry_after_timeout(self):
+    flaky_client = os.path.join(self.tmp_dir, 'flaky_dasgoclient')
+    counter = os.path.join(self.tmp_dir, 'calls')
+    with open(flaky_client, 'w') as flaky_file:
+      flaky_file.write(FLAKY_TEMPLATE.format(counter = counter, nof_hangs = 2, client = self.client))
+    os.chmod(flaky_client, os.stat(flaky_client).st_mode | stat.S_IEXEC)
+    das = self.get_engine(executable = flaky_client, timeout = 0.5, max_tries = 3)
+    self.assertEqual(das.query('parent dataset={}'.format(DATASET)), PARENT)
+    with open(counter, 'r') as counter_file:
+      self.assertEqual(int(counter_file.read()), 3)
+    self.assertEqual(read_log(self.log_fn)['hit'], 1)
+
+  def test_cache(self):
+    cache = DASCache(os.path.join(self.tmp_dir, 'das.sqlite'))
+    self.assertEqual(self.get_engine(cache = cache).query('parent dataset={}'.format(DATASET)), PARENT)
+    # a new engine, e.g. in the next invocation of a script, is served from the cache
+    self.assertEqual(self.get_engine(cache = cache).query('parent dataset={}'.format(DATASET)), PARENT)
+    self.assertEqual(read_log(self.log_fn)['hit'], 1)
+    cache.close()
+
+  def test_query_parsed(self):
+    cache = DASCache(os.path.join(self.tmp_dir, 'das.sqlite'))
+    query = 'file dataset={}'.format(DATASET)
+    parse = lambda lines: sorted(line for line in lines if line.endswith('.root'))
+    for _ in range(2):
+      files = self.get_engine(cache = cache).query_parsed(
+        query, parse, serialize = json.dumps, deserialize = json.loads
+      )
+      self.assertEqual(files, [ '/store/mc/f{}.root'.format(idx) for idx in range(5) ])
+    self.assertEqual(read_log(self.log_fn)['hit'], 1)
+    # the parsed result does not take the place of the raw output
+    self.assertIsNone(cache.get(query))
+    cache.close()
+
+  def test_query_parsed_lumis(self):
+    cache = DASCache(os.path.join(self.tmp_dir, 'das.sqlite'))
+    query = 'run,lumi dataset={}'.format(DATASET_DATA)
+    for _ in range(2):
+      # only the lumi ranges are cached, not the full list of lumis
+      lumi_mask = self.get_engine(cache = cache).query_parsed(
+        query, parse_runlumis,
+        serialize   = lambda lumi_mask: json.dumps(lumi_mask.to_compact_list()),
+        deserialize = lambda lumi_mask_str: LumiMask.from_compact_list(json.loads(lumi_mask_str)),
+      )
+      self.assertEqual(lumi_mask.to_compact_list(), {
+        '315257' : [ [ 1, 88 ] ], '315259' : [ [ 1, 3 ], [ 7, 9 ], [ 172, 172 ] ],
+      })
+    self.assertEqual(read_log(self.log_fn)['hit'], 1)
+    cache.close()
+
+  def test_query_parsed_not_memoized(self):
+    das = self.get_engine()
+    query = 'file dataset={}'.format(DATASET)
+    # without a cache the parsed results are not kept, so that each call runs the query again
+    self.assertEqual(das.query_parsed(query, lambda lines: sum(1 for _ in lines)), 5)
+    self.assertEqual(das.query_parsed(query, lambda lines: next(lines)), '/store/mc/f0.root')
+    self.assertEqual(read_log(self.log_fn)['hit'], 2)
+
+  def test_query_parsed_failure(self):
+    das = self.get_engine(max_tries = 2)
+    self.assertRaises(RuntimeError, das.query_parsed, 'dataset dataset=/Broken/*/*', list)
+    self.assertEqual(read_log(self.log_fn)['hit'], 2)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# Unit tests of the directory listings; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.fileListing import FileLister, ListingCache, list_local_directory
+
+import collections
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+class CountingLister(object):
+
+  def __init__(self):
+    self.calls = collections.Counter()
+    self.lock = threading.Lock()
+
+  def __call__(self, path):
+    with self.lock:
+      self.calls[path] += 1
+    return list_local_directory(path)
+
+class FileListingTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.dirs = []
+    for dir_idx in range(3):
+      dir_path = os.path.join(self.tmp_dir, 'dir_{}'.format(dir_idx))
+      os.makedirs(dir_path)
+      for file_idx in range(2):
+        self.write_file(os.path.join(dir_path, 'tree_{}.root'.format(file_idx)), 100 * (file_idx + 1))
+      self.dirs.append(dir_path)
+    os.makedirs(os.path.join(self.dirs[0], 'subdir'))
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def write_file(self, path, size):
+    with open(path, 'w') as output:
+      output.write('x' * size)
+
+  def set_mtime(self, path, mtime):
+    # the timestamps of the file systems may be too coarse to see two changes within the same test
+    os.utime(path, (mtime, mtime))
+
+  def test_list_local_directory(self):
+    self.assertEqual(list_local_directory(self.dirs[0]), { 'tree_0.root' : 100, 'tree_1.root' : 200 })
+
+  def test_get_sizes(self):
+    lister = CountingLister()
+    file_paths = [
+      os.path.join(self.dirs[1], 'tree_1.root'),
+      os.path.join(self.dirs[0], 'tree_0.root'),
+      os.path.join(self.dirs[0], 'missing.root'),
+      os.path.join(self.tmp_dir, 'missing_dir', 'tree_0.root'),
+      os.path.join(self.dirs[0], 'subdir'),
+      os.path.join(self.dirs[1], 'tree_1.root'),
+    ]
+    sizes = FileLister(lister, nof_workers = 4).get_sizes(file_paths)
+    self.assertEqual(list(sizes.items()), [
+      ( os.path.join(self.dirs[1], 'tree_1.root'), 200 ),
+      ( os.path.join(self.dirs[0], 'tree_0.root'), 100 ),
+    ])
+    # every directory is listed once, and the missing directory is not listed at all
+    self.assertEqual(dict(lister.calls), { self.dirs[0] : 1, self.dirs[1] : 1 })
+
+  def test_listing_error(self):
+    def list_directory(path):
+      raise IOError('permission denied')
+    file_path = os.path.join(self.dirs[0], 'tree_0.root')
+    self.assertEqual(list(FileLister(list_directory).get_sizes([ file_path ]).items()), [])
+
+  def test_cache(self):
+    cache = ListingCache(os.path.join(self.tmp_dir, 'cache', 'listings.sqlite'))
+    file_paths = [ os.path.join(dir_path, 'tree_0.root') for dir_path in self.dirs ]
+    for dir_path in self.dirs:
+      self.set_mtime(dir_path, 1000000000)
+
+    lister = CountingLister()
+    FileLister(lister, cache = cache).get_sizes(file_paths)
+    self.assertEqual(sum(lister.calls.values()), 3)
+
+    # a new lister, e.g. in the next invocation of a script, is served from the cache
+    lister = CountingLister()
+    sizes = FileLister(lister, cache = cache).get_sizes(file_paths)
+    self.assertEqual(sum(lister.calls.values()), 0)
+    self.assertEqual(list(sizes.values()), [ 100 ] * 3)
+    cache.close()
+
+  def test_cache_invalidation(self):
+    cache = ListingCache(os.path.join(self.tmp_dir, 'listings.sqlite'))
+    self.set_mtime(self.dirs[0], 1000000000)
+    new_file = os.path.join(self.dirs[0], 'tree_2.root')
+    lister = CountingLister()
+    self.assertEqual(list(FileLister(lister, cache = cache).get_sizes([ new_file ]).items()), [])
+
+    # adding a file changes the modification time of the directory, so that the listing is fetched again
+    self.write_file(new_file, 300)
+    self.set_mtime(self.dirs[0], 1000000001)
+    lister = CountingLister()
+    self.assertEqual(list(FileLister(lister, cache = cache).get_sizes([ new_file ]).values()), [ 300 ])
+    self.assertEqual(lister.calls[self.dirs[0]], 1)
+
+    # the mtime is compared for equality, so that restoring an older directory does not revive a newer listing
+    os.remove(new_file)
+    self.set_mtime(self.dirs[0], 999999999)
+    lister = CountingLister()
+    self.assertEqual(list(FileLister(lister, cache = cache).get_sizes([ new_file ]).items()), [])
+    self.assertEqual(lister.calls[self.dirs[0]], 1)
+    cache.close()
+
+  def test_cache_get_put(self):
+    cache = ListingCache(os.path.join(self.tmp_dir, 'listings.sqlite'))
+    self.assertIsNone(cache.get('/some/dir', 1.5))
+    cache.put('/some/dir', 1.5, { 'a.root' : 1 })
+    self.assertEqual(cache.get('/some/dir', 1.5), { 'a.root' : 1 })
+    self.assertIsNone(cache.get('/some/dir', 2.5))
+    cache.close()
+
+if __name__ == '__main__':
+  unittest.main()
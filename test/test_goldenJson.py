@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Unit tests of the golden JSON lookups and their cache; run with:
+# python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.cacheUtils import CACHE_DIR_ENV
+from tthAnalysis.NanoAOD import goldenJson
+from tthAnalysis.NanoAOD.goldenJson import GoldenJSON, load_golden_json
+
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+COMPACT_LIST = { '273158' : [ [ 1, 5 ], [ 7, 7 ] ], '273302' : [ [ 1, 459 ] ], '1' : [ [ 10, 20 ] ] }
+
+# run, lumi and whether it is certified, around the boundaries of the ranges
+LUMIS = [
+  ( 1, 9, False ), ( 1, 10, True ), ( 1, 20, True ), ( 1, 21, False ),
+  ( 273158, 0, False ), ( 273158, 1, True ), ( 273158, 5, True ), ( 273158, 6, False ), ( 273158, 7, True ),
+  ( 273158, 8, False ), ( 273200, 1, False ), ( 273302, 459, True ), ( 273302, 460, False ), ( 300000, 1, False ),
+]
+
+class GoldenJSONTest(unittest.TestCase):
+
+  def setUp(self):
+    self.golden_json = GoldenJSON(COMPACT_LIST)
+
+  def test_contains(self):
+    for run, lumi, is_certified in LUMIS:
+      self.assertEqual(self.golden_json.contains(run, lumi), is_certified, '{}:{}'.format(run, lumi))
+    self.assertEqual(self.golden_json.runs(), [ 1, 273158, 273302 ])
+    self.assertIn(273158, self.golden_json)
+    self.assertNotIn(273200, self.golden_json)
+    self.assertEqual(len(self.golden_json), 3)
+
+  def test_mask(self):
+    runs = [ run for run, _, _ in LUMIS ]
+    lumis = [ lumi for _, lumi, _ in LUMIS ]
+    expected = [ is_certified for _, _, is_certified in LUMIS ]
+    self.assertEqual(list(self.golden_json.mask(runs, lumis)), expected)
+    # the same result without NumPy
+    np = goldenJson.np
+    goldenJson.np = None
+    try:
+      self.assertEqual(GoldenJSON(COMPACT_LIST).mask(runs, lumis), expected)
+    finally:
+      goldenJson.np = np
+
+  def test_pickle(self):
+    self.golden_json.mask([ 1 ], [ 10 ])
+    golden_json = pickle.loads(pickle.dumps(self.golden_json, protocol = 2))
+    self.assertEqual(golden_json.starts, self.golden_json.starts)
+    self.assertEqual(list(golden_json.mask([ 1, 1 ], [ 10, 21 ])), [ True, False ])
+
+class LoadGoldenJSONTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.environ = os.environ.get(CACHE_DIR_ENV)
+    self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+    os.environ[CACHE_DIR_ENV] = self.cache_dir
+    self.path = os.path.join(self.tmp_dir, 'Cert_JSON.txt')
+    self.write_json(COMPACT_LIST)
+
+  def tearDown(self):
+    goldenJson._golden_jsons.pop(os.path.abspath(self.path), None)
+    if self.environ is None:
+      os.environ.pop(CACHE_DIR_ENV, None)
+    else:
+      os.environ[CACHE_DIR_ENV] = self.environ
+    shutil.rmtree(self.tmp_dir)
+
+  def write_json(self, compact_list):
+    with open(self.path, 'w') as json_file:
+      json.dump(compact_list, json_file)
+
+  def load(self):
+    # a new invocation of a script starts with an empty in-memory cache
+    goldenJson._golden_jsons.pop(os.path.abspath(self.path), None)
+    return load_golden_json(self.path)
+
+  def test_cache(self):
+    golden_json = load_golden_json(self.path)
+    self.assertIs(load_golden_json(self.path), golden_json)
+    self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+    self.assertEqual(self.load().starts, golden_json.starts)
+    self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+  def test_cache_invalidation(self):
+    self.assertTrue(self.load().contains(1, 10))
+    # the cache file is keyed by the content of the golden JSON, so that a new version is parsed again
+    self.write_json({ '2' : [ [ 1, 1 ] ] })
+    golden_json = self.load()
+    self.assertFalse(golden_json.contains(1, 10))
+    self.assertTrue(golden_json.contains(2, 1))
+    self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+  def test_missing(self):
+    self.assertRaises(RuntimeError, load_golden_json, os.path.join(self.tmp_dir, 'missing.txt'))
+
+if __name__ == '__main__':
+  unittest.main()
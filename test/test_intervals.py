@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+# Unit tests of IntervalSet; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+
+import random
+import unittest
+
+def to_values(interval_set):
+  return set(interval_set.expand())
+
+def random_interval_set(rng, nof_ranges, value_max):
+  ranges = []
+  for _ in range(nof_ranges):
+    range_min = rng.randint(0, value_max)
+    ranges.append((range_min, min(range_min + rng.randint(0, 5), value_max)))
+  return IntervalSet(ranges)
+
+class IntervalSetTest(unittest.TestCase):
+
+  def test_merge(self):
+    # overlapping and adjacent ranges are merged, disjoint ranges are not
+    interval_set = IntervalSet([ (5, 7), (1, 2), (3, 3), (6, 9), (11, 11) ])
+    self.assertEqual(interval_set.to_list(), [ [ 1, 3 ], [ 5, 9 ], [ 11, 11 ] ])
+    self.assertEqual(interval_set.size(), 9)
+
+  def test_contains(self):
+    interval_set = IntervalSet([ (1, 3), (10, 10) ])
+    for value in [ 1, 2, 3, 10 ]:
+      self.assertIn(value, interval_set)
+    for value in [ 0, 4, 9, 11 ]:
+      self.assertNotIn(value, interval_set)
+    self.assertNotIn(1, IntervalSet())
+
+  def test_from_values(self):
+    self.assertEqual(IntervalSet.from_values([ 3, 1, 2, 2, 7, 9, 8 ]).to_list(), [ [ 1, 3 ], [ 7, 9 ] ])
+    self.assertEqual(IntervalSet.from_values([ 4 ]).to_list(), [ [ 4, 4 ] ])
+    self.assertEqual(IntervalSet.from_values([]), IntervalSet())
+
+  def test_from_strings(self):
+    self.assertEqual(IntervalSet.from_strings([ '5-8', '1-2' ]).to_list(), [ [ 1, 2 ], [ 5, 8 ] ])
+
+  def test_union(self):
+    lhs = IntervalSet([ (1, 3), (10, 12) ])
+    rhs = IntervalSet([ (4, 5), (11, 20) ])
+    self.assertEqual((lhs | rhs).to_list(), [ [ 1, 5 ], [ 10, 20 ] ])
+    self.assertEqual(lhs | IntervalSet(), lhs)
+    self.assertEqual(IntervalSet() | IntervalSet(), IntervalSet())
+
+  def test_intersection(self):
+    lhs = IntervalSet([ (1, 5), (10, 20) ])
+    rhs = IntervalSet([ (5, 10), (15, 15), (21, 30) ])
+    self.assertEqual((lhs & rhs).to_list(), [ [ 5, 5 ], [ 10, 10 ], [ 15, 15 ] ])
+    self.assertEqual(lhs & IntervalSet(), IntervalSet())
+    # ranges that only touch each other do not intersect
+    self.assertFalse(IntervalSet([ (1, 4) ]) & IntervalSet([ (5, 8) ]))
+
+  def test_difference(self):
+    lhs = IntervalSet([ (1, 10), (20, 30) ])
+    rhs = IntervalSet([ (0, 1), (4, 5), (10, 22), (30, 40) ])
+    self.assertEqual((lhs - rhs).to_list(), [ [ 2, 3 ], [ 6, 9 ], [ 23, 29 ] ])
+    self.assertEqual(lhs - IntervalSet(), lhs)
+    self.assertEqual(IntervalSet() - lhs, IntervalSet())
+    self.assertEqual(lhs - IntervalSet([ (0, 100) ]), IntervalSet())
+    self.assertEqual(lhs - lhs, IntervalSet())
+
+  def test_intersects(self):
+    interval_set = IntervalSet([ (1, 3), (10, 12) ])
+    self.assertTrue(interval_set.intersects(IntervalSet([ (3, 5) ])))
+    self.assertTrue(interval_set.intersects(IntervalSet([ (0, 0), (12, 12) ])))
+    self.assertFalse(interval_set.intersects(IntervalSet([ (4, 9), (13, 20) ])))
+    self.assertFalse(interval_set.intersects(IntervalSet()))
+
+  def test_against_sets(self):
+    rng = random.Random(12345)
+    for _ in range(200):
+      lhs = random_interval_set(rng, rng.randint(0, 8), 60)
+      rhs = random_interval_set(rng, rng.randint(0, 8), 60)
+      self.assertEqual(to_values(lhs | rhs), to_values(lhs) | to_values(rhs))
+      self.assertEqual(to_values(lhs & rhs), to_values(lhs) & to_values(rhs))
+      self.assertEqual(to_values(lhs - rhs), to_values(lhs) - to_values(rhs))
+      self.assertEqual(lhs.intersects(rhs), bool(to_values(lhs) & to_values(rhs)))
+      # the results are normalized, so that equal sets of values compare equal
+      self.assertEqual(lhs | rhs, IntervalSet.from_values(to_values(lhs) | to_values(rhs)))
+
+if __name__ == '__main__':
+  unittest.main()
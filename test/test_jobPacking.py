@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+# Unit tests of the job packing; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.jobPacking import JobPlan, pack_files
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+class PackFilesTest(unittest.TestCase):
+
+  def test_no_capacity(self):
+    weights = [ ( 'a', 5 ), ( 'b', 1 ) ]
+    self.assertEqual(pack_files(weights), [ [ 'a' ], [ 'b' ] ])
+    self.assertEqual(pack_files(weights, 0), [ [ 'a' ], [ 'b' ] ])
+
+  def test_first_fit_decreasing(self):
+    weights = [ ( 'a', 2 ), ( 'b', 5 ), ( 'c', 4 ), ( 'd', 7 ), ( 'e', 1 ), ( 'f', 3 ) ]
+    # d(7) + f(3), b(5) + c(4) + e(1), a(2); the jobs are ordered by their first file in the input
+    self.assertEqual(pack_files(weights, 10), [ [ 'a' ], [ 'b', 'c', 'e' ], [ 'd', 'f' ] ])
+
+  def test_oversized_file(self):
+    weights = [ ( 'a', 3 ), ( 'b', 25 ), ( 'c', 4 ) ]
+    self.assertEqual(pack_files(weights, 10), [ [ 'a', 'c' ], [ 'b' ] ])
+
+  def test_capacity_respected(self):
+    rng = random.Random(12345)
+    weights = [ ( 'file_{}'.format(idx), rng.randint(1, 10) ) for idx in range(200) ]
+    weight_map = dict(weights)
+    jobs = pack_files(weights, 20)
+    self.assertEqual(sorted(name for job in jobs for name in job), sorted(weight_map))
+    for job in jobs:
+      self.assertLessEqual(sum(weight_map[name] for name in job), 20)
+
+  def test_deterministic(self):
+    # the ties between files of equal weight are broken by the input order, not by the file names
+    weights = [ ( 'z', 4 ), ( 'y', 4 ), ( 'x', 4 ), ( 'w', 4 ), ( 'v', 4 ) ]
+    jobs = pack_files(weights, 8)
+    self.assertEqual(jobs, [ [ 'z', 'y' ], [ 'x', 'w' ], [ 'v' ] ])
+    for _ in range(10):
+      self.assertEqual(pack_files(list(weights), 8), jobs)
+
+class JobPlanTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.manifest_fn = os.path.join(self.tmp_dir, 'packing.json')
+    self.weights = { 'a' : 6, 'b' : 4, 'c' : 5, 'd' : 5, 'e' : 3 }
+    self.settings = { 'bytes_per_job' : 10 }
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def test_rerun_keeps_jobs(self):
+    plan = JobPlan(self.manifest_fn)
+    new_jobs = plan.update([ 'a', 'b', 'c' ], self.weights.get, 10, self.settings)
+    self.assertEqual(new_jobs, [ 1, 2 ])
+    plan.save()
+    jobs_before = dict(plan.jobs)
+
+    # the same input does not create new jobs and does not query the weights
+    plan = JobPlan(self.manifest_fn)
+    self.assertEqual(dict(plan.jobs), jobs_before)
+    self.assertEqual(plan.update([ 'a', 'b', 'c' ], lambda name: self.fail(name), 10, self.settings), [])
+
+    # the new files are packed into new jobs, even if they would fit into an existing one
+    new_jobs = plan.update([ 'a', 'b', 'c', 'd', 'e' ], self.weights.get, 10, self.settings)
+    self.assertEqual(new_jobs, [ 3 ])
+    self.assertEqual(plan.jobs[3], [ 'd', 'e' ])
+    for job_idx, job_files in jobs_before.items():
+      self.assertEqual(plan.jobs[job_idx], job_files)
+    plan.save()
+    self.assertEqual(dict(JobPlan(self.manifest_fn).jobs), dict(plan.jobs))
+
+  def test_removed_files_stay(self):
+    plan = JobPlan(self.manifest_fn)
+    plan.update([ 'a', 'b' ], self.weights.get, 10, self.settings)
+    plan.save()
+    plan = JobPlan(self.manifest_fn)
+    self.assertEqual(plan.update([ 'b' ], self.weights.get, 10, self.settings), [])
+    self.assertEqual(dict(plan.jobs), { 1 : [ 'a', 'b' ] })
+
+  def test_settings_kept(self):
+    plan = JobPlan(self.manifest_fn)
+    plan.update([ 'a' ], self.weights.get, 10, self.settings)
+    plan.save()
+    plan = JobPlan(self.manifest_fn)
+    plan.update([ 'a', 'b' ], self.weights.get, None, { 'bytes_per_job' : None })
+    self.assertEqual(plan.settings, self.settings)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+# Unit tests of the lepton fake rate trigger tables; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.eraTables import ERAS, LazyEraDict
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.leptonFRTriggers import LEPTONFR_TABLES, get_leptonFR_triggers
+
+import unittest
+
+# the literal tables of the lepton fake rate triggers
+SOURCE_TABLES = {
+  'leptonFR'        : LazyEraDict('tthAnalysis.NanoAOD.LeptonFakeRate_trigger_{}_cfi', 'leptonFR_triggers'),
+  'leptonFR_bbWWSL' : LazyEraDict('tthAnalysis.NanoAOD.LeptonFakeRate_bbWWSL_trigger_{}_cfi', 'leptonFR_triggers'),
+}
+FIELDS = [ 'path', 'cone_minPt', 'cone_maxPt', 'minRecoPt', 'jet_minPt', 'average_prescale', 'trigger_type' ]
+
+class LeptonFRTriggersTest(unittest.TestCase):
+
+  def test_source_tables(self):
+    for era in ERAS:
+      for table_name in LEPTONFR_TABLES:
+        source_table = SOURCE_TABLES[table_name][era]
+        table = get_leptonFR_triggers(era, table_name)
+        self.assertEqual(sorted(table), sorted(source_table))
+        for lepton in source_table:
+          self.assertEqual(len(table[lepton]), len(source_table[lepton]))
+          for hlt, source_hlt in zip(table[lepton], source_table[lepton]):
+            for field in FIELDS:
+              self.assertEqual(getattr(hlt, field), getattr(source_hlt, field).value(), field)
+            self.assertEqual(hlt.runs, IntervalSet.from_strings(source_hlt.run_ranges))
+
+  def test_memoized(self):
+    self.assertIs(get_leptonFR_triggers('2017'), get_leptonFR_triggers('2017', 'leptonFR'))
+    self.assertIsNot(get_leptonFR_triggers('2017'), get_leptonFR_triggers('2017', 'leptonFR_bbWWSL'))
+
+  def test_invalid(self):
+    self.assertRaises(ValueError, get_leptonFR_triggers, '2017', 'leptonFR_unknown')
+    self.assertRaises(ValueError, get_leptonFR_triggers, '2015')
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+# Tests of the local execution backend with shell scripts standing in for the cmsRun jobs; run with:
+# python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.localRunner import STATE_COMPLETED, STATE_FAILED, LocalRunner, get_nof_workers, \
+                                            parse_nof_events, summarize
+from tthAnalysis.NanoAOD.slurmTracker import OUTPUT_MIN_SIZE, STATE_SKIPPED, JobDB, check_output
+
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import unittest
+
+# fails in the first nof_failures attempts, then writes the cmsRun summary and an output file of the given size
+JOB_TEMPLATE = '''#!/bin/sh
+attempt=$(( $(cat "{counter}" 2>/dev/null || echo 0) + 1 ))
+echo $attempt > "{counter}"
+echo "running attempt $attempt"
+sleep {duration}
+[ $attempt -gt {nof_failures} ] || exit 3
+echo "TrigReport Events total = {nevents} passed = {nevents} failed = 0" > "{cmsrun_log}"
+head -c {output_size} /dev/zero > "{output_file}"
+'''
+
+class HelpersTest(unittest.TestCase):
+
+  def test_get_nof_workers(self):
+    self.assertEqual(get_nof_workers(8), 8)
+    self.assertEqual(get_nof_workers(8, 4 * 1024 ** 3, 1024 ** 3), 4)
+    self.assertEqual(get_nof_workers(2, 4 * 1024 ** 3, 1024 ** 3), 2)
+    # at least one job runs, even if it does not fit into the memory budget
+    self.assertEqual(get_nof_workers(8, 1024 ** 2, 1024 ** 3), 1)
+
+  def test_parse_nof_events(self):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+      log_fn = os.path.join(tmp_dir, 'cmsRun.log')
+      with open(log_fn, 'w') as log_file:
+        log_file.write('Begin processing the 1st record\nTrigReport Events total = 1234 passed = 1200 failed = 34\n')
+      self.assertEqual(parse_nof_events(log_fn), 1234)
+      self.assertIsNone(parse_nof_events(os.path.join(tmp_dir, 'missing.log')))
+      self.assertIsNone(parse_nof_events(''))
+    finally:
+      shutil.rmtree(tmp_dir)
+
+  def test_summarize(self):
+    lines = summarize([], 10.)
+    self.assertEqual(lines[0], 'Finished 0 job(s) in 10.0s: 0 completed, 0 failed')
+
+class LocalRunnerTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.db = JobDB(os.path.join(self.tmp_dir, 'jobs.sqlite'))
+    self.job_info = {}
+
+  def tearDown(self):
+    self.db.close()
+    shutil.rmtree(self.tmp_dir)
+
+  def add_job(self, name, nof_failures = 0, duration = 0, output_size = 2 * OUTPUT_MIN_SIZE, nevents = 100):
+    paths = {
+      key : os.path.join(self.tmp_dir, '{}.{}'.format(name, key)) for key in [ 'sh', 'log', 'cmsrun', 'root', 'count' ]
+    }
+    with open(paths['sh'], 'w') as script_file:
+      script_file.write(JOB_TEMPLATE.format(
+        counter = paths['count'], duration = duration, nof_failures = nof_failures, nevents = nevents,
+        cmsrun_log = paths['cmsrun'], output_size = output_size, output_file = paths['root'],
+      ))
+    os.chmod(paths['sh'], os.stat(paths['sh']).st_mode | stat.S_IEXEC)
+    self.db.add(name, paths['sh'], paths['log'], paths['root'])
+    self.job_info[name] = { 'cmsrun_log' : paths['cmsrun'], 'nof_files' : 2 }
+    return paths
+
+  def get_runner(self, nof_workers = 2, max_retries = 1):
+    return LocalRunner(self.db, nof_workers, max_retries = max_retries, job_info = self.job_info)
+
+  def get_results(self, runner):
+    return { result.name : result for result in runner.run() }
+
+  def test_success(self):
+    paths = self.add_job('job_1', nevents = 123)
+    results = self.get_results(self.get_runner())
+    self.assertEqual(results['job_1'].state, STATE_COMPLETED)
+    self.assertEqual(results['job_1'].nof_events, 123)
+    self.assertEqual(results['job_1'].nof_files, 2)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, STATE_COMPLETED)
+    self.assertEqual(job.exit_code, 0)
+    self.assertEqual(check_output(paths['root']), '')
+
+  def test_retry_keeps_logs(self):
+    paths = self.add_job('job_1', nof_failures = 1)
+    results = self.get_results(self.get_runner(max_retries = 1))
+    self.assertEqual(results['job_1'].state, STATE_COMPLETED)
+    self.assertEqual(self.db.get('job_1').attempts, 2)
+    with open(paths['log'], 'r') as log_file:
+      log = log_file.read()
+    self.assertIn('=== Attempt 1 of job job_1', log)
+    self.assertIn('running attempt 1', log)
+    self.assertIn('=== Attempt 2 of job job_1', log)
+    self.assertIn('running attempt 2', log)
+
+  def test_failure(self):
+    self.add_job('job_1', nof_failures = 5)
+    self.add_job('job_2')
+    runner = self.get_runner(max_retries = 2)
+    results = self.get_results(runner)
+    self.assertEqual(results['job_1'].state, STATE_FAILED)
+    self.assertEqual(results['job_1'].error, 'exit code 3')
+    self.assertEqual(self.db.get('job_1').attempts, 3)
+    self.assertEqual(self.db.get('job_1').exit_code, 3)
+    self.assertEqual(results['job_2'].state, STATE_COMPLETED)
+    self.assertTrue(summarize(runner.results, 1.)[0].endswith('1 completed, 1 failed'))
+
+  def test_broken_output(self):
+    self.add_job('job_1', output_size = 10)
+    results = self.get_results(self.get_runner(max_retries = 0))
+    self.assertEqual(results['job_1'].state, STATE_FAILED)
+    self.assertIn('is broken', results['job_1'].error)
+
+  def test_skip_existing_output(self):
+    self.add_job('job_1')
+    self.get_runner().run()
+    # a rerun, e.g. after an interruption, does not run the jobs whose output exists
+    self.add_job('job_2')
+    results = self.get_results(self.get_runner())
+    self.assertEqual(list(results), [ 'job_2' ])
+    self.assertEqual(self.db.get('job_1').state, STATE_COMPLETED)
+    self.assertEqual(self.db.get('job_1').attempts, 1)
+
+    self.db.set_state('job_2', 'NEW')
+    self.assertEqual(self.get_results(self.get_runner()), {})
+    self.assertEqual(self.db.get('job_2').state, STATE_SKIPPED)
+
+  def test_stale_jobs(self):
+    # the jobs that are no longer in the job list, e.g. after the files were packed differently, are not run
+    self.add_job('job_1')
+    paths = self.add_job('job_2')
+    del self.job_info['job_2']
+    results = self.get_results(self.get_runner())
+    self.assertEqual(list(results), [ 'job_1' ])
+    self.assertEqual(self.db.get('job_2').state, 'NEW')
+    self.assertFalse(os.path.exists(paths['root']))
+
+  def test_parallel(self):
+    for job_idx in range(4):
+      self.add_job('job_{}'.format(job_idx), duration = 1)
+    t_start = time.time()
+    results = self.get_results(self.get_runner(nof_workers = 4))
+    self.assertLess(time.time() - t_start, 3.5)
+    self.assertEqual([ result.state for result in results.values() ], [ STATE_COMPLETED ] * 4)
+
+  def test_kill(self):
+    self.add_job('job_1', duration = 30)
+    runner = self.get_runner(max_retries = 2)
+    timer = threading.Timer(1., runner.kill)
+    timer.start()
+    t_start = time.time()
+    try:
+      results = self.get_results(runner)
+    finally:
+      timer.cancel()
+    # the killed job is not retried
+    self.assertLess(time.time() - t_start, 10.)
+    self.assertEqual(results['job_1'].state, STATE_FAILED)
+    self.assertEqual(results['job_1'].error, 'killed')
+    self.assertEqual(self.db.get('job_1').attempts, 1)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+# Unit tests of LumiMask; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.lumiMask import LumiMask, parse_lumi_list
+
+import unittest
+
+class LumiMaskTest(unittest.TestCase):
+
+  def test_parse_lumi_list(self):
+    self.assertEqual(parse_lumi_list('[1,2,3,7, 8]').to_list(), [ [ 1, 3 ], [ 7, 8 ] ])
+    self.assertEqual(parse_lumi_list('[]'), IntervalSet())
+    self.assertRaises(ValueError, parse_lumi_list, '1,2,3')
+    # the lumis need not be sorted or unique
+    self.assertEqual(parse_lumi_list(' [9,1,2,2,8,3] ').to_list(), [ [ 1, 3 ], [ 8, 9 ] ])
+    self.assertEqual(parse_lumi_list('[5]').to_list(), [ [ 5, 5 ] ])
+    self.assertEqual(parse_lumi_list('[{}]'.format(','.join(map(str, range(1, 2001))))).to_list(), [ [ 1, 2000 ] ])
+    self.assertRaises(ValueError, parse_lumi_list, '[1,a]')
+
+  def test_compact_list(self):
+    compact_list = { '273158' : [ [ 1, 5 ], [ 7, 7 ] ], '273302' : [ [ 1, 459 ] ] }
+    lumi_mask = LumiMask.from_compact_list(compact_list)
+    self.assertEqual(lumi_mask.runs(), [ 273158, 273302 ])
+    self.assertEqual(lumi_mask.to_compact_list(), compact_list)
+    self.assertEqual(lumi_mask.size(), 465)
+    self.assertTrue(lumi_mask.contains(273158, 7))
+    self.assertFalse(lumi_mask.contains(273158, 6))
+    self.assertFalse(lumi_mask.contains(1, 1))
+
+  def test_empty_runs(self):
+    # runs without lumi sections are dropped, so they do not affect the comparisons
+    lumi_mask = LumiMask.from_lumis({ 1 : [ 1, 2 ], 2 : [] })
+    self.assertEqual(lumi_mask.runs(), [ 1 ])
+    self.assertEqual(lumi_mask, LumiMask.from_lumis({ 1 : [ 2, 1 ] }))
+    self.assertFalse(LumiMask())
+
+  def test_set_operations(self):
+    lhs = LumiMask.from_lumis({ 1 : [ 1, 2, 3 ], 2 : [ 5, 6 ], 3 : [ 1 ] })
+    rhs = LumiMask.from_lumis({ 1 : [ 3, 4 ], 2 : [ 5, 6 ], 4 : [ 1 ] })
+    self.assertEqual((lhs | rhs).to_compact_list(), {
+      '1' : [ [ 1, 4 ] ], '2' : [ [ 5, 6 ] ], '3' : [ [ 1, 1 ] ], '4' : [ [ 1, 1 ] ],
+    })
+    # the runs whose lumis do not overlap disappear from the result
+    self.assertEqual((lhs & rhs).to_compact_list(), { '1' : [ [ 3, 3 ] ], '2' : [ [ 5, 6 ] ] })
+    self.assertEqual((lhs - rhs).to_compact_list(), { '1' : [ [ 1, 2 ] ], '3' : [ [ 1, 1 ] ] })
+    self.assertEqual(lhs - lhs, LumiMask())
+    self.assertEqual(lhs & LumiMask(), LumiMask())
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+# Unit tests of the NanoAOD candidate search; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.nanoMatching import NanoAODIndex, get_nanoaod_pattern, is_up_to_date, load_state, save_state
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datasets', 'txt')
+DATASET_RE = re.compile(r'/[^\s/]+/[^\s/]+/(MINI|NANO)AOD(SIM)?\b')
+
+# the data and MC strings of find_nano_datasets.py, followed by some that are regexes themselves
+MATCH_STRS = [
+  ( 'Nano25Oct2019', 'NanoAODv6' ),
+  ( 'Nano1June2019', 'NanoAODv5' ),
+  ( 'Nano(25Oct|1June)2019', 'NanoAODv[56]' ),
+  ( 'Nano.*', 'Nano.*' ),
+]
+
+def find_candidates_baseline(miniaod, dbs_nano, data_str, mc_str):
+  """The linear scan of find_nano_datasets.py from before the NanoAOD datasets were indexed"""
+  miniaod_split = miniaod.split('/')
+  assert(len(miniaod_split) == 4)
+  miniaod_lead = miniaod_split[1]
+  miniaod_sublead = miniaod_split[2]
+  miniaod_tier = miniaod_split[3]
+  if miniaod_tier == 'MINIAOD':
+    miniaod_sublead_split = miniaod_sublead.split('-')
+    nanoaod_sublead = '{}.*-{}'.format(miniaod_sublead_split[0], data_str)
+  else:
+    miniaod_sublead_split = miniaod_sublead.split('-')
+    nanoaod_sublead = re.sub(r'MiniAOD(v\d)?', mc_str, miniaod_sublead_split[0])
+  nanoaod_re = re.compile('/{}/{}.*/{}'.format(miniaod_lead, nanoaod_sublead, miniaod_tier.replace('MINI', 'NANO')))
+  return [ nanoaod for nanoaod in dbs_nano if nanoaod_re.match(nanoaod) ]
+
+def read_datasets():
+  """Returns the MINIAOD(SIM) datasets of the central campaigns and the NanoAOD datasets in test/datasets/txt"""
+  miniaods = set()
+  nanoaods = set()
+  for dataset_fn in sorted(os.listdir(DATASET_DIR)):
+    with open(os.path.join(DATASET_DIR, dataset_fn), 'r') as dataset_file:
+      for line in dataset_file:
+        for dataset_match in DATASET_RE.finditer(line):
+          dataset = dataset_match.group(0)
+          if dataset_match.group(1) == 'NANO':
+            nanoaods.add(dataset)
+          elif dataset.split('/')[2].startswith('Run201' if dataset.endswith('/MINIAOD') else 'RunII'):
+            miniaods.add(dataset)
+  return sorted(miniaods), sorted(nanoaods)
+
+class NanoAODIndexTest(unittest.TestCase):
+
+  def test_pattern(self):
+    primary_dataset, nanoaod_re = get_nanoaod_pattern(
+      '/SingleMuon/Run2017B-31Mar2018-v1/MINIAOD', 'Nano25Oct2019', 'NanoAODv6'
+    )
+    self.assertEqual(primary_dataset, 'SingleMuon')
+    self.assertTrue(nanoaod_re.match('/SingleMuon/Run2017B-Nano25Oct2019-v1/NANOAOD'))
+    self.assertFalse(nanoaod_re.match('/SingleMuon/Run2017C-Nano25Oct2019-v1/NANOAOD'))
+    self.assertRaises(RuntimeError, get_nanoaod_pattern, '/SingleMuon/Run2017B-v1/RAW', 'Nano25Oct2019', 'NanoAODv6')
+
+  def test_baseline(self):
+    miniaods, dbs_nano = read_datasets()
+    self.assertTrue(miniaods)
+    self.assertTrue(dbs_nano)
+    nanoaod_index = NanoAODIndex(dbs_nano)
+    nof_matches = 0
+    for data_str, mc_str in MATCH_STRS:
+      for miniaod in miniaods:
+        candidates = nanoaod_index.find_candidates(miniaod, data_str, mc_str)
+        self.assertEqual(candidates, find_candidates_baseline(miniaod, dbs_nano, data_str, mc_str), miniaod)
+        nof_matches += len(candidates)
+    self.assertGreater(nof_matches, 0)
+
+  def test_regex_semantics(self):
+    miniaods = [
+      '/SingleMuon/Run2017B-31Mar2018-v1/MINIAOD',
+      '/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIIFall17MiniAODv2-PU2017_12Apr2018_94X_v14-v1/MINIAODSIM',
+      '/Tau+Jet/RunIIFall17MiniAODv2-PU2017_12Apr2018_94X_v14-v1/MINIAODSIM',
+    ]
+    dbs_nano = [
+      '/SingleMuon/Run2017B-Nano25Oct2019-v1/NANOAOD',
+      # a data tier that the regex matches as a prefix
+      '/SingleMuon/Run2017B-Nano25Oct2019-v1/NANOAODSIM',
+      '/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIIFall17NanoAODv5-PU2017_12Apr2018_Nano1June2019_v14-v1/NANOAODSIM',
+      '/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIIFall17NanoAODv6-PU2017_12Apr2018_Nano25Oct2019_v14-v1/NANOAODSIM',
+      '/TTTo2L2Nu_TuneCP5_13TeV-powheg-pythia8/RunIIFall17NanoAODv7-PU2017_12Apr2018_Nano02Apr2020_v14-v1/NANOAODSIM',
+      # the primary dataset name of the MINIAODSIM is a regex that does not match itself, but matches this one
+      '/TauuJet/RunIIFall17NanoAODv6-PU2017_12Apr2018_Nano25Oct2019_v14-v1/NANOAODSIM',
+      '/Tau+Jet/RunIIFall17NanoAODv6-PU2017_12Apr2018_Nano25Oct2019_v14-v1/NANOAODSIM',
+    ]
+    nanoaod_index = NanoAODIndex(dbs_nano)
+    for data_str, mc_str in MATCH_STRS:
+      for miniaod in miniaods:
+        self.assertEqual(
+          nanoaod_index.find_candidates(miniaod, data_str, mc_str),
+          find_candidates_baseline(miniaod, dbs_nano, data_str, mc_str),
+        )
+    self.assertEqual(nanoaod_index.find_candidates(miniaods[0], 'Nano25Oct2019', 'NanoAODv6'), dbs_nano[:2])
+    self.assertEqual(nanoaod_index.find_candidates(miniaods[1], 'Nano25Oct2019', 'NanoAODv[56]'), dbs_nano[2:4])
+    self.assertEqual(nanoaod_index.find_candidates(miniaods[2], 'Nano25Oct2019', 'NanoAODv6'), dbs_nano[5:6])
+
+class StateTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.nanoaod = '/SingleMuon/Run2017B-Nano25Oct2019-v1/NANOAOD'
+    self.entry = {
+      'candidates' : [ self.nanoaod ],
+      'parents'    : { '/SingleMuon/Run2017B-31Mar2018-v1/MINIAOD' : self.nanoaod },
+      'nanoaod'    : self.nanoaod,
+      'status'     : 'VALID',
+      'match'      : True,
+    }
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def test_save_load(self):
+    state_fn = os.path.join(self.tmp_dir, 'state.json')
+    self.assertEqual(load_state(state_fn), {})
+    self.assertEqual(load_state(''), {})
+    state = { '/SingleMuon/Run2017B-31Mar2018-v1/MINIAOD' : self.entry }
+    save_state(state_fn, state)
+    self.assertEqual(load_state(state_fn), state)
+    self.assertEqual(os.listdir(self.tmp_dir), [ 'state.json' ])
+
+  def test_is_up_to_date(self):
+    dbs_nano = { self.nanoaod : 'VALID' }
+    self.assertTrue(is_up_to_date(self.entry, [ self.nanoaod ], dbs_nano))
+    self.assertFalse(is_up_to_date(None, [ self.nanoaod ], dbs_nano))
+    self.assertFalse(is_up_to_date({}, [ self.nanoaod ], dbs_nano))
+    # a new candidate appeared
+    self.assertFalse(is_up_to_date(self.entry, [ self.nanoaod, self.nanoaod.replace('v1', 'v2') ], dbs_nano))
+    # the NanoAOD changed its status or disappeared from DBS
+    self.assertFalse(is_up_to_date(self.entry, [ self.nanoaod ], { self.nanoaod : 'PRODUCTION' }))
+    self.assertFalse(is_up_to_date(self.entry, [ self.nanoaod ], {}))
+    # the previous check failed
+    self.entry['match'] = False
+    self.assertFalse(is_up_to_date(self.entry, [ self.nanoaod ], dbs_nano))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+# Unit tests of the subprocess helpers; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.processUtils import run_command, run_command_stream
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+class RunCommandTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def test_run_command(self):
+    self.assertEqual(run_command([ 'sh', '-c', 'echo out; echo err >&2; exit 3' ], 10), ( 'out', 'err', 3, False ))
+
+  def test_timeout(self):
+    t_start = time.time()
+    _, _, _, timed_out = run_command([ 'sh', '-c', 'sleep 30' ], 0.5)
+    self.assertTrue(timed_out)
+    self.assertLess(time.time() - t_start, 10.)
+
+  def test_stream(self):
+    # the command waits for the parser to see its first line, which only works if the lines are read as they come
+    flag_fn = os.path.join(self.tmp_dir, 'flag')
+    cmd = [ 'sh', '-c', 'echo first; while [ ! -f {} ]; do sleep 0.05; done; echo second'.format(flag_fn) ]
+    def parse(lines):
+      result = []
+      for line in lines:
+        result.append(line)
+        open(flag_fn, 'w').close()
+      return result
+    self.assertEqual(run_command_stream(cmd, 10, parse), ( [ 'first', 'second' ], '', 0, False ))
+
+  def test_stream_partial(self):
+    # neither the lines that the parser does not read nor a large stderr block the command
+    cmd = [ 'sh', '-c', 'seq 1 100000; head -c 1000000 /dev/zero | tr "\\0" x >&2; exit 2' ]
+    result, err, returncode, timed_out = run_command_stream(cmd, 10, lambda lines: next(lines))
+    self.assertEqual(( result, len(err), returncode, timed_out ), ( '1', 1000000, 2, False ))
+
+  def test_stream_error(self):
+    def parse(lines):
+      for line in lines:
+        raise ValueError("Unexpected line: %s" % line)
+    t_start = time.time()
+    self.assertRaises(ValueError, run_command_stream, [ 'sh', '-c', 'echo first; sleep 30' ], 10, parse)
+    # the command is killed instead of waited for
+    self.assertLess(time.time() - t_start, 10.)
+
+  def test_stream_timeout(self):
+    # the output of the truncated command is discarded
+    result = run_command_stream([ 'sh', '-c', 'echo first; sleep 30' ], 0.5, list)
+    self.assertIsNone(result[0])
+    self.assertTrue(result[3])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+# Tests of the SLURM job tracker against scripts/fake_slurm.py, which runs the jobs as local background processes;
+# run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.processUtils import parse_memory
+from tthAnalysis.NanoAOD.slurmTracker import OUTPUT_MIN_SIZE, JobDB, SlurmTracker, STATE_GAVE_UP, STATE_SKIPPED, \
+                                             parse_elapsed, parse_sacct
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+FAKE_SLURM = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'fake_slurm.py')
+FAKE_SLURM_ENV = [ 'FAKE_SLURM_DIR', 'FAKE_SLURM_SBATCH_FAILURES', 'FAKE_SLURM_SACCT_HIDDEN' ]
+
+# fails in the first nof_failures attempts, then writes the output file
+JOB_TEMPLATE = '''#!/bin/sh
+attempt=$(( $(cat "{counter}" 2>/dev/null || echo 0) + 1 ))
+echo $attempt > "{counter}"
+[ $attempt -gt {nof_failures} ] || exit 1
+head -c {output_size} /dev/zero > "{output_file}"
+'''
+
+class ParseTest(unittest.TestCase):
+
+  def test_parse_elapsed(self):
+    self.assertEqual(parse_elapsed('1-02:03:04'), 93784.)
+    self.assertEqual(parse_elapsed('03:04.5'), 184.5)
+    self.assertIsNone(parse_elapsed(''))
+
+  def test_parse_memory(self):
+    self.assertEqual(parse_memory('1234K'), 1234 * 1024)
+    self.assertEqual(parse_memory('1.5G'), int(1.5 * 1024 ** 3))
+    self.assertEqual(parse_memory('100'), 100)
+    self.assertIsNone(parse_memory(''))
+
+  def test_parse_sacct(self):
+    sacct_out = '\n'.join([
+      '11|COMPLETED|0:0|00:01:00|',
+      '11.batch|COMPLETED|0:0|00:01:00|2000K',
+      '11.extern|COMPLETED|0:0|00:01:00|1000K',
+      '12|CANCELLED by 1234|0:15|00:00:10|',
+      '13|PENDING|0:0|00:00:00|',
+    ])
+    self.assertEqual(parse_sacct(sacct_out), {
+      '11' : ( 'COMPLETED', 0, 60., 2000 * 1024 ),
+      '12' : ( 'CANCELLED', 0, 10., None ),
+      '13' : ( 'PENDING', 0, 0., None ),
+    })
+
+class SlurmTrackerTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.environ = { key : os.environ.get(key) for key in FAKE_SLURM_ENV }
+    os.environ['FAKE_SLURM_DIR'] = os.path.join(self.tmp_dir, 'slurm')
+    bin_dir = os.path.join(self.tmp_dir, 'bin')
+    os.makedirs(bin_dir)
+    self.commands = {}
+    for command in [ 'sbatch', 'sacct', 'squeue' ]:
+      self.commands[command] = os.path.join(bin_dir, command)
+      os.symlink(os.path.abspath(FAKE_SLURM), self.commands[command])
+    self.db = JobDB(os.path.join(self.tmp_dir, 'jobs.sqlite'))
+
+  def tearDown(self):
+    self.db.close()
+    for key, value in self.environ.items():
+      if value is None:
+        os.environ.pop(key, None)
+      else:
+        os.environ[key] = value
+    shutil.rmtree(self.tmp_dir)
+
+  def add_job(self, name, nof_failures = 0):
+    script = os.path.join(self.tmp_dir, '{}.sh'.format(name))
+    output_file = os.path.join(self.tmp_dir, '{}.root'.format(name))
+    with open(script, 'w') as script_file:
+      script_file.write(JOB_TEMPLATE.format(
+        counter = os.path.join(self.tmp_dir, '{}.attempts'.format(name)),
+        nof_failures = nof_failures,
+        output_size = 2 * OUTPUT_MIN_SIZE,
+        output_file = output_file,
+      ))
+    os.chmod(script, os.stat(script).st_mode | stat.S_IEXEC)
+    self.db.add(name, script, os.path.join(self.tmp_dir, '{}.log'.format(name)), output_file)
+    return output_file
+
+  def get_tracker(self, **kwargs):
+    return SlurmTracker(
+      self.db, poll_min = 0.05, poll_max = 0.2, sbatch = self.commands['sbatch'], sacct = self.commands['sacct'],
+      squeue = self.commands['squeue'], **kwargs
+    )
+
+  def test_success(self):
+    output_file = self.add_job('job_1')
+    self.assertEqual(self.get_tracker().run(), 0)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, 'COMPLETED')
+    self.assertEqual(job.attempts, 1)
+    self.assertTrue(os.path.isfile(output_file))
+
+  def test_resubmit(self):
+    self.add_job('job_1', nof_failures = 2)
+    self.assertEqual(self.get_tracker(max_resubmits = 2).run(), 0)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, 'COMPLETED')
+    self.assertEqual(job.attempts, 3)
+
+  def test_give_up(self):
+    self.add_job('job_1', nof_failures = 5)
+    self.add_job('job_2')
+    self.assertEqual(self.get_tracker(max_resubmits = 1).run(), 1)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, STATE_GAVE_UP)
+    self.assertEqual(job.attempts, 2)
+    self.assertEqual(job.exit_code, 1)
+    self.assertEqual(self.db.get('job_2').state, 'COMPLETED')
+
+  def test_skip_existing_output(self):
+    output_file = self.add_job('job_1')
+    with open(output_file, 'w') as output:
+      output.write('x' * OUTPUT_MIN_SIZE)
+    self.assertEqual(self.get_tracker().run(), 0)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, STATE_SKIPPED)
+    self.assertEqual(job.attempts, 0)
+
+  def test_broken_output_rerun(self):
+    # a truncated output file does not count as done, as in the local backend
+    output_file = self.add_job('job_1')
+    with open(output_file, 'w') as output:
+      output.write('tree')
+    self.assertEqual(self.get_tracker().run(), 0)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, 'COMPLETED')
+    self.assertEqual(job.attempts, 1)
+    self.assertEqual(os.path.getsize(output_file), 2 * OUTPUT_MIN_SIZE)
+
+  def test_stale_jobs(self):
+    # the jobs that are no longer in the job list, e.g. after the files were packed differently, are not submitted
+    self.add_job('job_1')
+    self.add_job('job_2', nof_failures = 5)
+    self.assertEqual(self.get_tracker(names = [ 'job_1' ]).run(), 0)
+    self.assertEqual(self.db.get('job_1').state, 'COMPLETED')
+    self.assertEqual(self.db.get('job_2').state, 'NEW')
+    self.assertEqual(self.db.get('job_2').attempts, 0)
+
+  def test_sbatch_retry(self):
+    os.environ['FAKE_SLURM_SBATCH_FAILURES'] = '2'
+    self.add_job('job_1')
+    self.assertEqual(self.get_tracker(submit_tries = 3).run(), 0)
+    self.assertEqual(self.db.get('job_1').state, 'COMPLETED')
+
+  def test_sbatch_give_up(self):
+    os.environ['FAKE_SLURM_SBATCH_FAILURES'] = '10'
+    self.add_job('job_1')
+    self.assertEqual(self.get_tracker(submit_tries = 2).run(), 1)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, STATE_GAVE_UP)
+    self.assertEqual(job.attempts, 0)
+
+  def test_lost(self):
+    # the job finishes, but sacct never reports it, so the tracker has to fall back to squeue
+    os.environ['FAKE_SLURM_SACCT_HIDDEN'] = '1'
+    self.add_job('job_1')
+    self.assertEqual(self.get_tracker(max_resubmits = 0, missing_timeout = 0.).run(), 1)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, STATE_GAVE_UP)
+    self.assertEqual(job.attempts, 1)
+
+  def test_lost_resubmit(self):
+    # a lost job is resubmitted like a failed one
+    os.environ['FAKE_SLURM_SACCT_HIDDEN'] = '1'
+    self.add_job('job_1')
+    self.assertEqual(self.get_tracker(max_resubmits = 1, missing_timeout = 0.).run(), 1)
+    job = self.db.get('job_1')
+    self.assertEqual(job.state, STATE_GAVE_UP)
+    self.assertEqual(job.attempts, 2)
+
+  def test_missing_within_timeout(self):
+    # the jobs that sacct does not report yet are left alone until the timeout
+    os.environ['FAKE_SLURM_SACCT_HIDDEN'] = '1'
+    self.add_job('job_1')
+    tracker = self.get_tracker(missing_timeout = 3600.)
+    self.assertTrue(tracker.submit(self.db.get('job_1')))
+    self.assertFalse(tracker.update(tracker.get_active()))
+    self.assertEqual(self.db.get('job_1').state, 'SUBMITTED')
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Unit tests of the trigger table cache; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.cacheUtils import CACHE_DIR_ENV
+from tthAnalysis.NanoAOD.eraTables import ERAS, LazyEraDict
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.triggers import Triggers
+from tthAnalysis.NanoAOD import triggerCache
+
+import os
+import shutil
+import tempfile
+import unittest
+
+ERA = '2017'
+
+def get_baseline(era):
+  """Returns the flat set, the lepton fake rate paths and the run ranges of the HLT paths, as they were built from
+  the literal tables before the tables were cached
+  """
+  triggers_analysis = LazyEraDict('tthAnalysis.NanoAOD.triggers_{}', 'triggers_analysis')[era]
+  leptonFR_tables = [
+    LazyEraDict('tthAnalysis.NanoAOD.LeptonFakeRate_trigger_{}_cfi', 'leptonFR_triggers')[era],
+    LazyEraDict('tthAnalysis.NanoAOD.LeptonFakeRate_bbWWSL_trigger_{}_cfi', 'leptonFR_triggers')[era],
+  ]
+  triggers_leptonFR = {}
+  for trigger_type in [ '1e', '1mu', '2e', '2mu' ]:
+    triggers_leptonFR[trigger_type] = {
+      hlt.path.value() for hlt in leptonFR_tables[0][trigger_type[1:]] if hlt.trigger_type.value() == trigger_type
+    }
+  triggers_flat = { trigger['name'] for triggers in triggers_analysis.values() for trigger in triggers }
+  for leptonFR_table in leptonFR_tables:
+    for trigger_type in [ '1e', '1mu', '2e', '2mu' ]:
+      triggers_flat.update(
+        hlt.path.value() for hlt in leptonFR_table[trigger_type[1:]] if hlt.trigger_type.value() == trigger_type
+      )
+
+  run_ranges = {}
+  for triggers in triggers_analysis.values():
+    for trigger in triggers:
+      run_ranges[trigger['name']] = IntervalSet(trigger['runs'])
+  leptonFR_run_ranges = {}
+  for leptonFR_table in leptonFR_tables:
+    for lepton in leptonFR_table:
+      for hlt in leptonFR_table[lepton]:
+        if hlt.path.value() not in run_ranges:
+          leptonFR_run_ranges.setdefault(hlt.path.value(), []).extend(IntervalSet.from_strings(hlt.run_ranges))
+  for trigger_name, trigger_run_ranges in leptonFR_run_ranges.items():
+    run_ranges[trigger_name] = IntervalSet(trigger_run_ranges)
+  return triggers_flat, triggers_leptonFR, run_ranges
+
+class TriggersTest(unittest.TestCase):
+
+  def test_baseline(self):
+    for era in ERAS:
+      triggers = Triggers(era)
+      triggers_flat, triggers_leptonFR, run_ranges = get_baseline(era)
+      self.assertEqual(triggers.triggers_flat, triggers_flat)
+      self.assertEqual(triggers.triggers_leptonFR, triggers_leptonFR)
+      self.assertEqual(sorted(triggers.run_ranges), sorted(run_ranges))
+      for trigger_name in run_ranges:
+        self.assertEqual(triggers.run_ranges[trigger_name], run_ranges[trigger_name], trigger_name)
+
+class TriggerCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.environ = os.environ.get(CACHE_DIR_ENV)
+    self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+    os.environ[CACHE_DIR_ENV] = self.cache_dir
+
+    # the tables are read from copies of their sources, so that the sources can be edited
+    self.source_dir = os.path.join(self.tmp_dir, 'sources')
+    os.makedirs(self.source_dir)
+    self.get_source_path = triggerCache.get_source_path
+    for _, module_template in triggerCache.TABLE_MODULES:
+      shutil.copy(self.get_source_path(module_template.format(ERA)), self.source_dir)
+    triggerCache.get_source_path = lambda module_name: os.path.join(
+      self.source_dir, os.path.basename(self.get_source_path(module_name))
+    )
+
+    self.build_tables = triggerCache.build_tables
+    self.nof_builds = 0
+    def build_tables(era):
+      self.nof_builds += 1
+      return self.build_tables(era)
+    triggerCache.build_tables = build_tables
+    self.tables = dict(triggerCache._tables)
+    triggerCache._tables.clear()
+
+  def tearDown(self):
+    triggerCache.get_source_path = self.get_source_path
+    triggerCache.build_tables = self.build_tables
+    triggerCache._tables.clear()
+    triggerCache._tables.update(self.tables)
+    if self.environ is None:
+      os.environ.pop(CACHE_DIR_ENV, None)
+    else:
+      os.environ[CACHE_DIR_ENV] = self.environ
+    shutil.rmtree(self.tmp_dir)
+
+  def load_tables(self):
+    # a new invocation of a script starts with an empty in-memory cache
+    triggerCache._tables.clear()
+    return triggerCache.load_tables(ERA)
+
+  def get_cache_files(self):
+    return sorted(os.listdir(self.cache_dir)) if os.path.isdir(self.cache_dir) else []
+
+  def test_cache_hit(self):
+    tables = self.load_tables()
+    self.assertEqual(self.nof_builds, 1)
+    self.assertEqual(len(self.get_cache_files()), 1)
+    self.assertEqual(self.load_tables(), tables)
+    self.assertEqual(self.nof_builds, 1)
+    # the tables are built only once per process
+    self.assertIs(triggerCache.load_tables(ERA), triggerCache.load_tables(ERA))
+
+  def test_source_change(self):
+    tables = self.load_tables()
+    cache_files = self.get_cache_files()
+    source_path = triggerCache.get_source_path(triggerCache.TABLE_MODULES[0][1].format(ERA))
+    with open(source_path, 'a') as source_file:
+      source_file.write('# edited\n')
+    self.assertEqual(self.load_tables(), tables)
+    self.assertEqual(self.nof_builds, 2)
+    self.assertEqual(len(self.get_cache_files()), 2)
+    self.assertNotEqual(self.get_cache_files(), cache_files)
+
+  def test_broken_cache(self):
+    tables = self.load_tables()
+    for cache_file in self.get_cache_files():
+      with open(os.path.join(self.cache_dir, cache_file), 'w') as cache:
+        cache.write('truncated')
+    self.assertEqual(self.load_tables(), tables)
+    self.assertEqual(self.nof_builds, 2)
+    self.assertEqual(self.load_tables(), tables)
+    self.assertEqual(self.nof_builds, 2)
+
+  def test_cache_disabled(self):
+    os.environ[CACHE_DIR_ENV] = ''
+    self.load_tables()
+    self.load_tables()
+    self.assertEqual(self.nof_builds, 2)
+    self.assertEqual(self.get_cache_files(), [])
+
+  def test_invalid_era(self):
+    self.assertRaises(ValueError, triggerCache.load_tables, '2015')
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+# Unit tests of the luminosities of the HLT paths; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.eraTables import ERAS
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.triggerLumi import PathLumi, TriggerLumis
+from tthAnalysis.NanoAOD.triggers import Triggers
+
+import unittest
+
+# the integrated luminosities (in 1/fb) that were written in the analysis tables before they were derived from the
+# luminosities of the run ranges
+BASELINE_INT_LUMIS = {
+  '2016' : {
+    'HLT_TripleMu_12_10_5'                         : 35.918,
+    'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL'             : 27.655,
+    'HLT_IsoMu22_eta2p1'                           : 33.182,
+    'HLT_Ele27_eta2p1_WPLoose_Gsf'                 : 27.304,
+    'HLT_Ele24_eta2p1_WPLoose_Gsf_LooseIsoPFTau20' : 17.144,
+  },
+  '2017' : {
+    'HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL'             : 35.998,
+    'HLT_Mu17_TrkIsoVVL_Mu8_TrkIsoVVL_DZ_Mass3p8'       : 36.733,
+    'HLT_IsoMu24'                                       : 38.046,
+    'HLT_Ele32_WPTight_Gsf'                             : 27.122,
+    'HLT_DoubleMediumChargedIsoPFTau35_Trk1_eta2p1_Reg' : 36.003,
+  },
+  '2018' : {
+    'HLT_TripleMu_12_10_5'                                                  : 59.736,
+    'HLT_Ele16_Ele12_Ele8_CaloIdL_TrackIdL'                                 : 54.445,
+    'HLT_IsoMu24'                                                           : 59.728,
+    'HLT_IsoMu20_eta2p1_LooseChargedIsoPFTau27_eta2p1_CrossL1'              : 17.683,
+    'HLT_Ele24_eta2p1_WPTight_Gsf_LooseChargedIsoPFTauHPS30_eta2p1_CrossL1' : 42.053,
+  },
+}
+
+class PathLumiTest(unittest.TestCase):
+
+  def setUp(self):
+    # the run ranges need not be sorted
+    self.lumi = PathLumi([ ( 20, 29 ), ( 1, 9 ), ( 40, 40 ) ], [ 2., 1., 4. ])
+
+  def test_total(self):
+    self.assertEqual(self.lumi.total(), 7.)
+    self.assertEqual(PathLumi([], []).total(), 0.)
+
+  def test_between(self):
+    self.assertEqual(self.lumi.between(1, 40), 7.)
+    self.assertEqual(self.lumi.between(9, 20), 3.)
+    self.assertEqual(self.lumi.between(10, 19), 0.)
+    self.assertEqual(self.lumi.between(40, 40), 4.)
+    self.assertEqual(self.lumi.between(41, 100), 0.)
+    # a run range that overlaps only partially is counted in full
+    self.assertEqual(self.lumi.between(25, 25), 2.)
+
+  def test_for_runs(self):
+    self.assertEqual(self.lumi.for_runs([ 5, 6, 40 ]), 5.)
+    self.assertEqual(self.lumi.for_runs(IntervalSet([ ( 5, 6 ), ( 8, 25 ) ])), 3.)
+    # the run ranges that overlap with several intervals are counted once
+    self.assertEqual(self.lumi.for_runs(IntervalSet([ ( 21, 22 ), ( 25, 26 ), ( 28, 40 ) ])), 6.)
+    self.assertEqual(self.lumi.for_runs([]), 0.)
+
+class TriggerLumisTest(unittest.TestCase):
+
+  def test_int_lumi(self):
+    for era in ERAS:
+      int_lumis = {
+        trigger['name'] : trigger['int_lumi']
+        for triggers in Triggers(era).triggers_analysis.values() for trigger in triggers
+      }
+      for trigger_name, int_lumi in BASELINE_INT_LUMIS[era].items():
+        self.assertEqual(int_lumis[trigger_name], int_lumi, trigger_name)
+
+  def test_total(self):
+    for era in ERAS:
+      trigger_lumis = TriggerLumis(era)
+      for trigger_name, int_lumi in BASELINE_INT_LUMIS[era].items():
+        self.assertAlmostEqual(trigger_lumis.total(trigger_name) / 1000., int_lumi, places = 3)
+
+  def test_paths(self):
+    trigger_lumis = TriggerLumis('2017')
+    # the lepton fake rate paths have their luminosities in the comments of their tables, too
+    self.assertIn('HLT_Mu3_PFJet40', trigger_lumis)
+    self.assertGreater(trigger_lumis.total('HLT_Mu3_PFJet40'), 0.)
+    self.assertNotIn('HLT_Unknown', trigger_lumis)
+    self.assertRaises(ValueError, trigger_lumis.total, 'HLT_Unknown')
+    path_lumi = trigger_lumis['HLT_IsoMu24']
+    run_min, run_max = path_lumi.starts[0], path_lumi.ends[-1]
+    self.assertAlmostEqual(trigger_lumis.between('HLT_IsoMu24', run_min, run_max), path_lumi.total())
+    self.assertEqual(trigger_lumis.between('HLT_IsoMu24', 0, run_min - 1), 0.)
+    self.assertAlmostEqual(trigger_lumis.for_runs('HLT_IsoMu24', [ run_min ]), path_lumi.cumulative[1])
+
+if __name__ == '__main__':
+  unittest.main()
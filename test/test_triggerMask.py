@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+# Unit tests of the run-to-trigger bitmasks; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.eraTables import ERAS
+from tthAnalysis.NanoAOD.intervals import IntervalSet
+from tthAnalysis.NanoAOD.triggerMask import WORD_SIZE, TriggerRunMask
+from tthAnalysis.NanoAOD.triggers import Triggers
+
+import unittest
+
+class FakeTriggers(object):
+
+  def __init__(self, run_ranges, unprescaled):
+    self.run_ranges = { path : IntervalSet(path_ranges) for path, path_ranges in run_ranges.items() }
+    self.triggers_flat = set(run_ranges)
+    self.triggers_unprescaled_flat = set(unprescaled)
+
+def get_boundary_runs(run_ranges):
+  """Returns the first and the last run of every range, and the runs right outside of them"""
+  runs = set()
+  for run_range in run_ranges.values():
+    for run_min, run_max in run_range:
+      runs.update([ run_min - 1, run_min, run_max, run_max + 1 ])
+  return sorted(runs)
+
+class TriggerRunMaskTest(unittest.TestCase):
+
+  def test_small(self):
+    triggers = FakeTriggers({
+      'HLT_A' : [ ( 10, 20 ), ( 30, 30 ) ],
+      'HLT_B' : [ ( 15, 30 ) ],
+      'HLT_C' : [],
+    }, [ 'HLT_B' ])
+    mask = TriggerRunMask(triggers)
+    runs = [ 9, 10, 14, 15, 20, 21, 29, 30, 31 ]
+    masks = mask.annotate(runs)
+    self.assertEqual(mask.passes(masks, 'HLT_A').tolist(), [ False, True, True, True, True, False, False, True, False ])
+    self.assertEqual(mask.passes(masks, 'HLT_B').tolist(), [ False, False, False, True, True, True, True, True, False ])
+    self.assertEqual(mask.passes(masks, 'HLT_C').tolist(), [ False ] * len(runs))
+    self.assertEqual([ mask.decode(run_mask) for run_mask in masks ], [
+      [], [ 'HLT_A' ], [ 'HLT_A' ], [ 'HLT_A', 'HLT_B' ], [ 'HLT_A', 'HLT_B' ], [ 'HLT_B' ], [ 'HLT_B' ],
+      [ 'HLT_A', 'HLT_B' ], [],
+    ])
+    unprescaled_masks = mask.annotate(runs, unprescaled = True)
+    self.assertEqual(mask.passes(unprescaled_masks, 'HLT_A').tolist(), [ False ] * len(runs))
+    self.assertEqual(mask.passes(unprescaled_masks, 'HLT_B').tolist(), mask.passes(masks, 'HLT_B').tolist())
+
+  def test_multiple_words(self):
+    nof_paths = 2 * WORD_SIZE + 3
+    triggers = FakeTriggers({
+      'HLT_{:03d}'.format(path_idx) : [ ( 100 + path_idx, 100 + 2 * path_idx ) ] for path_idx in range(nof_paths)
+    }, [])
+    mask = TriggerRunMask(triggers)
+    self.assertEqual(mask.nof_words, 3)
+    runs = list(range(90, 100 + 2 * nof_paths + 2))
+    masks = mask.annotate(runs)
+    for run, run_mask in zip(runs, masks):
+      self.assertEqual(mask.decode(run_mask), sorted(
+        path for path in triggers.run_ranges if run in triggers.run_ranges[path]
+      ))
+
+  def test_invalid_paths(self):
+    triggers = FakeTriggers({ 'HLT_A' : [ ( 1, 2 ) ] }, [])
+    self.assertRaises(ValueError, TriggerRunMask, triggers, [ 'HLT_A', 'HLT_B' ])
+    mask = TriggerRunMask(triggers)
+    self.assertRaises(ValueError, mask.passes, mask.annotate([ 1 ]), 'HLT_B')
+    empty_mask = TriggerRunMask(triggers, [])
+    self.assertEqual(empty_mask.decode(empty_mask.annotate([ 1 ])[0]), [])
+
+  def test_boundaries(self):
+    # the bitmasks agree with the run ranges of the trigger tables at the first and the last run of every range
+    for era in ERAS:
+      triggers = Triggers(era)
+      mask = TriggerRunMask(triggers)
+      runs = get_boundary_runs(triggers.run_ranges)
+      masks = mask.annotate(runs)
+      unprescaled_masks = mask.annotate(runs, unprescaled = True)
+      for run, run_mask in zip(runs, masks):
+        self.assertEqual(set(mask.decode(run_mask)), triggers.active_paths(run), '{} {}'.format(era, run))
+      for path in sorted(triggers.triggers_flat):
+        is_active = [ triggers.is_active(path, run) for run in runs ]
+        self.assertEqual(mask.passes(masks, path).tolist(), is_active, path)
+        is_unprescaled = is_active if path in triggers.triggers_unprescaled_flat else [ False ] * len(runs)
+        self.assertEqual(mask.passes(unprescaled_masks, path).tolist(), is_unprescaled, path)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+# Unit tests of the cross section jobs of dump_xs.py; run with: python -m unittest discover -s test -p 'test_*.py'
+
+from tthAnalysis.NanoAOD.xsecJobs import FAILED_CHUNK_LINE, XS_SUMMARY_LINE, JobPipeline, combine_xs, \
+                                         has_failed_chunks, parse_xs, write_results
+
+import csv
+import json
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+def get_chunk(xs_result = None, returncode = 0):
+  """Returns a command that prints the output of GenXSecAnalyzer and exits with the given code"""
+  lines = [ 'Begin processing the 1st record' ]
+  if xs_result:
+    lines.append(XS_SUMMARY_LINE.format(*xs_result).rstrip('\n'))
+  return [ 'sh', '-c', 'printf "%s\\n" "$@"; exit {}'.format(returncode), 'sh' ] + lines
+
+class XsecTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def write_log(self, lines):
+    logfile_name = os.path.join(self.tmp_dir, 'out.log')
+    with open(logfile_name, 'w') as logfile:
+      logfile.write('\n'.join(lines) + '\n')
+    return logfile_name
+
+  def test_parse_xs(self):
+    logfile_name = self.write_log([
+      'Before matching: total cross section = 8.314e+02 +- 1.2e+00 pb',
+      'After filter: final cross section = 8.300000e+02 +- 2.000000e+00 pb',
+      'After filter: final cross section = unknown',
+    ])
+    self.assertEqual(parse_xs(logfile_name), ( 830., 2., 'pb' ))
+    self.assertIsNone(parse_xs(self.write_log([ 'After filter: final cross section = 0 +- 0 pb' ])))
+    self.assertIsNone(parse_xs(self.write_log([ 'Begin processing the 1st record' ])))
+
+  def test_combine_xs(self):
+    self.assertEqual(combine_xs([ ( 10., 1., 'pb' ) ]), ( 10., 1., 'pb' ))
+    # the more precise measurement weighs four times as much
+    xs, xs_err, xs_units = combine_xs([ ( 10., 2., 'pb' ), ( 15., 1., 'pb' ) ])
+    self.assertAlmostEqual(xs, 14.)
+    self.assertAlmostEqual(xs_err, 2. / math.sqrt(5.))
+    self.assertEqual(xs_units, 'pb')
+    self.assertRaises(RuntimeError, combine_xs, [ ( 10., 1., 'pb' ), ( 10., 1., 'fb' ) ])
+
+  def test_failed_chunks(self):
+    self.assertFalse(has_failed_chunks(os.path.join(self.tmp_dir, 'missing.log')))
+    self.assertFalse(has_failed_chunks(self.write_log([ XS_SUMMARY_LINE.format(1., 1., 'pb') ])))
+    self.assertTrue(has_failed_chunks(self.write_log([ FAILED_CHUNK_LINE.format(0, 1) ])))
+
+  def test_write_results(self):
+    samples = { 'sample' : { 'dbs_key' : '/A/B/MINIAODSIM', 'xs' : 1.5, 'status' : 'done' } }
+    json_fn = os.path.join(self.tmp_dir, 'results.json')
+    write_results(json_fn, samples)
+    with open(json_fn, 'r') as json_file:
+      results = json.load(json_file)
+    self.assertEqual(results[0]['sample_name'], 'sample')
+    self.assertEqual(results[0]['xs'], 1.5)
+    self.assertIsNone(results[0]['xs_err'])
+    csv_fn = os.path.join(self.tmp_dir, 'results.csv')
+    write_results(csv_fn, samples)
+    with open(csv_fn, 'r') as csv_file:
+      rows = list(csv.DictReader(csv_file))
+    self.assertEqual(len(rows), 1)
+    self.assertEqual(( rows[0]['dbs_key'], rows[0]['status'] ), ( '/A/B/MINIAODSIM', 'done' ))
+
+class JobPipelineTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def get_sample(self, sample_name, chunks):
+    sample_dir = os.path.join(self.tmp_dir, sample_name)
+    os.makedirs(sample_dir)
+    suffixes = [ '_{}'.format(chunk_idx) for chunk_idx in range(len(chunks)) ] if len(chunks) > 1 else [ '' ]
+    return {
+      'expected_xs' : 10.,
+      'logfile'     : os.path.join(sample_dir, 'out.log'),
+      'chunks'      : [ ( cmd, os.path.join(sample_dir, 'out{}.log'.format(suffix)) )
+                        for cmd, suffix in zip(chunks, suffixes) ],
+    }
+
+  def run_pipeline(self, samples, target_uncertainty = 0.):
+    pipeline = JobPipeline(2, len(samples), target_uncertainty)
+    for sample_name, sample_entry in samples.items():
+      pipeline.submit(sample_name, sample_entry)
+    pipeline.close()
+    return pipeline
+
+  def test_single_job(self):
+    samples = {
+      'done'    : self.get_sample('done', [ get_chunk(( 10., 1., 'pb' )) ]),
+      # the job prints a cross section before it crashes
+      'crashed' : self.get_sample('crashed', [ get_chunk(( 10., 1., 'pb' ), 3) ]),
+      'no_xs'   : self.get_sample('no_xs', [ get_chunk() ]),
+    }
+    pipeline = self.run_pipeline(samples)
+    self.assertEqual(samples['done']['status'], 'done')
+    self.assertEqual(( samples['done']['xs'], samples['done']['xs_err'] ), ( 10., 1. ))
+    self.assertFalse(has_failed_chunks(samples['done']['logfile']))
+    self.assertEqual(samples['crashed']['status'], 'failed')
+    self.assertEqual(samples['crashed']['returncode'], 3)
+    # the sample is not skipped when rerun
+    self.assertTrue(has_failed_chunks(samples['crashed']['logfile']))
+    self.assertEqual(samples['no_xs']['status'], 'failed')
+    self.assertEqual(
+      pipeline.summary(), 'Listed 3/3 samples: 0 queued, 0 running, 1 done, 0 partial, 2 failed, 0 skipped'
+    )
+
+  def test_adaptive(self):
+    samples = {
+      # the relative uncertainty drops below 8% after the second chunk
+      'done'    : self.get_sample('done', [ get_chunk(( 10., 1., 'pb' )) ] * 2 + [ get_chunk(returncode = 1) ]),
+      'partial' : self.get_sample('partial', [ get_chunk(( 10., 1., 'pb' )), get_chunk(returncode = 2) ]),
+      'failed'  : self.get_sample('failed', [ get_chunk(returncode = 1), get_chunk() ]),
+    }
+    pipeline = self.run_pipeline(samples, 0.08)
+    self.assertEqual(samples['done']['status'], 'done')
+    self.assertEqual(samples['done']['nof_chunks'], 2)
+    self.assertEqual(parse_xs(samples['done']['logfile']), ( 10., float('{:.6e}'.format(1. / math.sqrt(2.))), 'pb' ))
+    self.assertEqual(samples['partial']['status'], 'partial')
+    self.assertEqual(samples['partial']['chunk_returncodes'], [ 0, 2 ])
+    self.assertTrue(has_failed_chunks(samples['partial']['logfile']))
+    self.assertEqual(samples['failed']['status'], 'failed')
+    self.assertEqual(samples['failed']['nof_failed_chunks'], 2)
+    self.assertEqual(
+      pipeline.summary(), 'Listed 3/3 samples: 0 queued, 0 running, 1 done, 1 partial, 1 failed, 0 skipped'
+    )
+
+if __name__ == '__main__':
+  unittest.main()